@@ -9,8 +9,10 @@ OrcaLab 资产同步服务
 """
 
 import json
+import os
 import sys
 import threading
+from contextlib import asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from numpy import int64
 import requests
@@ -18,16 +20,105 @@ import aiohttp
 import asyncio
 import pathlib
 import shutil
-from typing import List, Dict, Optional, Callable, Tuple
+from typing import List, Dict, Optional, Callable, Set, Tuple
 import time
 import logging
 
-from orcalab.project_util import calculate_file_sha256
+from orcalab.project_util import (
+    DOWNLOAD_CHUNK_SIZE,
+    calculate_files_sha256_parallel,
+    record_file_sha256,
+    save_content_hash_store,
+)
 from orcalab.config_service import ConfigService
+from orcalab.download_scheduler import DownloadScheduler, create_pooled_session
+from orcalab.resumable_download import DownloadCancelled, ResumableDownloader, discard_partial_download
 from orcalab.exception import TokenExpiredException, ConnectionFailedException
 
 logger = logging.getLogger(__name__)
 
+# 增量元数据同步状态：远端列表的 ETag / Last-Modified 与每个包的版本
+METADATA_SYNC_STATE_FILE_NAME = ".metadata_sync_state.json"
+METADATA_SYNC_STATE_VERSION = 1
+
+
+# 后台同步时引擎已挂载的 pak 不能被替换或删除：新文件暂存为 <name>.pak.pending，
+# 待删除的文件名记入清单，下次启动、引擎挂载之前由 apply_pending_pak_changes 应用
+PENDING_PAK_SUFFIX = ".pending"
+PENDING_PAK_DELETIONS_FILE_NAME = ".pending_pak_deletions.json"
+
+
+def _write_json_atomic(path: pathlib.Path, data) -> None:
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+
+def _move_to_downloaded_folder(pak_file: pathlib.Path, downloaded_packages_folder: pathlib.Path) -> None:
+    """保留一份副本到已下载目录（重新订阅时直接复制），再从缓存目录删除"""
+    shutil.copy2(pak_file, downloaded_packages_folder / pak_file.name)
+    pak_file.unlink()
+
+
+def _load_pending_deletions(cache_folder: pathlib.Path) -> Set[str]:
+    try:
+        data = json.loads((cache_folder / PENDING_PAK_DELETIONS_FILE_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return set()
+    return {name for name in data if isinstance(name, str)} if isinstance(data, list) else set()
+
+
+def apply_pending_pak_changes(cache_folder: pathlib.Path, downloaded_packages_folder: pathlib.Path) -> None:
+    """
+    应用上次后台同步推迟的 pak 替换与删除。
+
+    必须在引擎挂载缓存目录之前调用。
+    """
+    from orcalab.content_hash_store import get_content_hash_store
+
+    if not cache_folder.exists():
+        return
+    store = get_content_hash_store()
+    replaced = 0
+    for pending_path in cache_folder.glob(f"*.pak{PENDING_PAK_SUFFIX}"):
+        pak_path = pending_path.with_name(pending_path.name.removesuffix(PENDING_PAK_SUFFIX))
+        try:
+            digest = store.get(pending_path)
+            os.replace(pending_path, pak_path)
+        except OSError as e:
+            logger.error("替换资产包失败 %s: %s", pak_path.name, e)
+            continue
+        store.invalidate(pending_path)
+        if digest is not None:
+            record_file_sha256(pak_path, digest)
+        else:
+            store.invalidate(pak_path)
+        replaced += 1
+
+    deletions = _load_pending_deletions(cache_folder)
+    remaining = set()
+    if deletions:
+        downloaded_packages_folder.mkdir(parents=True, exist_ok=True)
+    for file_name in deletions:
+        pak_file = cache_folder / file_name
+        if not pak_file.exists():
+            continue
+        try:
+            _move_to_downloaded_folder(pak_file, downloaded_packages_folder)
+        except OSError as e:
+            logger.error("删除资产包失败 %s: %s", file_name, e)
+            remaining.add(file_name)
+    if remaining:
+        _write_json_atomic(cache_folder / PENDING_PAK_DELETIONS_FILE_NAME, sorted(remaining))
+    else:
+        (cache_folder / PENDING_PAK_DELETIONS_FILE_NAME).unlink(missing_ok=True)
+
+    if replaced or deletions:
+        save_content_hash_store()
+        logger.info("已应用推迟的资产包变更: 替换 %d 个, 删除 %d 个", replaced, len(deletions) - len(remaining))
+
+
 class AssetSyncCallbacks:
     """资产同步回调接口"""
     
@@ -78,7 +169,23 @@ class AssetSyncCallbacks:
     def on_download_complete(self, asset_id: str, success: bool, error: str = ""):
         """下载完成"""
         pass
+
+    def on_verify_start(self, asset_id: str):
+        """开始校验本地文件哈希"""
+        pass
+
+    def on_verify_progress(self, asset_id: str, progress: int64, speed: float):
+        """
+        本地文件校验进度
+        progress: 0-100
+        speed: MB/s
+        """
+        pass
     
+    def on_package_ready(self, file_name: str, file_path: str):
+        """资产包已写入缓存目录（新下载或从下载目录恢复），可以立即挂载"""
+        pass
+
     def on_delete(self, file_name: str):
         """删除文件"""
         pass
@@ -102,7 +209,9 @@ class AssetSyncService:
 
     def __init__(self, username: str, access_token: str, base_url: str, cache_folder: pathlib.Path, downloaded_packages_folder: pathlib.Path,
                  config_paks: List[str], pak_urls: List[str] = [], timeout: int = 10, callbacks: Optional[AssetSyncCallbacks] = None,
-                 verbose: bool = False, cancel_event: Optional[threading.Event] = None):
+                 verbose: bool = False, cancel_event: Optional[threading.Event] = None, hash_concurrency: int = 4,
+                 download_segments: int = 1, max_concurrent_downloads: int = 8, max_connections_per_host: int = 4,
+                 mounted_pak_names: Optional[Set[str]] = None):
         """
         初始化资产同步服务
         
@@ -117,6 +226,11 @@ class AssetSyncService:
             callbacks: 回调接口
             verbose: 是否输出详细日志
             cancel_event: 同步取消事件
+            hash_concurrency: 本地文件并发校验数上限
+            download_segments: 大文件分段并发下载的段数（1 表示不分段）
+            max_concurrent_downloads: 全局并发请求数上限
+            max_connections_per_host: 单个主机并发请求数上限
+            mounted_pak_names: 引擎已挂载的 pak 文件名，对它们的替换与删除推迟到下次启动
         """
         self.username = username
         self.access_token = access_token
@@ -134,6 +248,12 @@ class AssetSyncService:
         self.verbose = verbose
         self._cancel_event = cancel_event
         self._callback_lock = threading.Lock()  # 保护回调函数的线程安全
+        self.hash_concurrency = max(1, hash_concurrency)
+        self.download_segments = max(1, download_segments)
+        self.scheduler = DownloadScheduler(max_concurrent_downloads, max_connections_per_host)
+        # sync_packages 期间共享的连接池会话
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.mounted_pak_names = set(mounted_pak_names or ())
 
         # 提取配置paks的文件名（用于后续比对）
         self.config_pak_names = set()
@@ -159,6 +279,15 @@ class AssetSyncService:
     def _cancelled(self) -> bool:
         return self._cancel_event is not None and self._cancel_event.is_set()
 
+    @asynccontextmanager
+    async def _session_scope(self):
+        """同步期间复用共享会话；单独调用（如测试）时临时创建会话"""
+        if self._session is not None and not self._session.closed:
+            yield self._session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
     def log(self, message: str):
         """简化日志输出"""
         if self.verbose:
@@ -240,6 +369,8 @@ class AssetSyncService:
             (需要下载的列表, 需要删除的列表)
         """
         missing_packages = []
+        # (pkg, 状态所属 asset_id, 待校验文件, 校验通过后复制到的路径, 云端 sha256)
+        verify_jobs: List[Tuple[Dict, str, pathlib.Path, Optional[pathlib.Path], str]] = []
 
         required_pkg_ids = set()
         self.base_pkg_map = {}
@@ -340,30 +471,16 @@ class AssetSyncService:
             cloud_file_sha256 = download_info.get("sha256")
             if local_path.exists():
                 if cloud_file_sha256:
-                    local_file_sha256 = calculate_file_sha256(local_path)
-                    if local_file_sha256.lower() == cloud_file_sha256:
-                        self.callbacks.on_set_status(pkg_id, 'ok')
-                        logger.info("%s %s 已最新", file_name, pkg_name)
-                    else:
-                        self.callbacks.on_set_status(pkg_id, 'download')
-                        missing_packages.append(pkg)
-                        logger.info("%s %s hash 不匹配，需重新下载", file_name, pkg_name)
+                    verify_jobs.append((pkg, pkg_id, local_path, None, cloud_file_sha256))
                 else:
                     self.callbacks.on_set_status(pkg_id, 'ok')
                     logger.info("%s %s 已最新", file_name, pkg_name)
             elif downloaded_path.exists():
                 if cloud_file_sha256:
-                    local_file_sha256 = calculate_file_sha256(downloaded_path)
-                    if local_file_sha256.lower() == cloud_file_sha256:
-                        shutil.copy2(downloaded_path, local_path)
-                        self.callbacks.on_set_status(pkg_id, 'ok')
-                        logger.info("%s %s 已最新", file_name, pkg_name)
-                    else:
-                        self.callbacks.on_set_status(pkg_id, 'download')
-                        missing_packages.append(pkg)
-                        logger.info("%s %s hash 不匹配，需重新下载", file_name, pkg_name)
+                    verify_jobs.append((pkg, pkg_id, downloaded_path, local_path, cloud_file_sha256))
                 else:
                     shutil.copy2(downloaded_path, local_path)
+                    self.callbacks.on_package_ready(file_name, str(local_path))
                     self.callbacks.on_set_status(pkg_id, 'ok')
                     logger.info("%s %s 已最新", file_name, pkg_name)
             else:
@@ -371,6 +488,27 @@ class AssetSyncService:
                 missing_packages.append(pkg)
                 logger.info("%s %s 需要下载", file_name, pkg_name)
 
+        # 需要计算哈希的文件统一放到线程池并发校验，避免阻塞事件循环
+        if verify_jobs:
+            digests = await self._verify_local_files(verify_jobs)
+            for pkg, pkg_id, verify_path, copy_to, cloud_file_sha256 in verify_jobs:
+                file_name = pkg.get('fileName') or pkg.get('file_name', f"{pkg['id']}.pak")
+                pkg_name = pkg['name']
+                local_file_sha256 = digests.get(verify_path)
+                if local_file_sha256 is None and self._cancelled():
+                    continue
+                if local_file_sha256 is not None and local_file_sha256.lower() == cloud_file_sha256:
+                    if copy_to is not None:
+                        shutil.copy2(verify_path, copy_to)
+                        record_file_sha256(copy_to, local_file_sha256)
+                        self.callbacks.on_package_ready(file_name, str(copy_to))
+                    self.callbacks.on_set_status(pkg_id, 'ok')
+                    logger.info("%s %s 已最新", file_name, pkg_name)
+                else:
+                    self.callbacks.on_set_status(pkg_id, 'download')
+                    missing_packages.append(pkg)
+                    logger.info("%s %s hash 不匹配，需重新下载", file_name, pkg_name)
+
         for pkg in incompatible_packages:
             file_name = pkg.get('fileName') or pkg.get('file_name', f"{pkg['id']}.pak")
             pkg_id = pkg['id']
@@ -396,8 +534,54 @@ class AssetSyncService:
                 self.callbacks.on_delete(file_name)
                 self.log(f"✗ {file_name} 待删除")
 
+        save_content_hash_store()
         return missing_packages, to_delete
 
+    async def _verify_local_files(
+        self, verify_jobs: List[Tuple[Dict, str, pathlib.Path, Optional[pathlib.Path], str]]
+    ) -> Dict[pathlib.Path, str]:
+        """在线程池中并发计算待校验文件的哈希，并按文件回报校验进度"""
+        path_to_asset = {verify_path: pkg_id for _, pkg_id, verify_path, _, _ in verify_jobs}
+        start_times: Dict[pathlib.Path, float] = {}
+        last_report: Dict[pathlib.Path, int] = {}
+
+        def on_progress(file_path: pathlib.Path, done: int, total: int):
+            asset_id = path_to_asset.get(file_path)
+            if asset_id is None:
+                return
+            progress = int(done * 100 / total) if total > 0 else 100
+            with self._callback_lock:
+                now = time.monotonic()
+                start = start_times.get(file_path)
+                if start is None:
+                    start = start_times[file_path] = now
+                    self.callbacks.on_verify_start(asset_id)
+                if last_report.get(file_path) == progress:
+                    return
+                last_report[file_path] = progress
+                elapsed = now - start
+                speed = done / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+                self.callbacks.on_verify_progress(asset_id, progress, speed)
+
+        total_bytes = sum(path.stat().st_size for path in path_to_asset)
+        _start = time.monotonic()
+        digests = await asyncio.to_thread(
+            calculate_files_sha256_parallel,
+            list(path_to_asset),
+            self.hash_concurrency,
+            on_progress,
+            self._cancelled,
+        )
+        elapsed = time.monotonic() - _start
+        logger.debug(
+            "校验 %d 个本地文件 (%.1f MB) 耗时 %.3f 秒, 并发 %d",
+            len(path_to_asset),
+            total_bytes / (1024 * 1024),
+            elapsed,
+            self.hash_concurrency,
+        )
+        return digests
+
     async def get_download_url(self, package_id: str) -> Optional[Dict]:
         """获取资产包的下载链接"""
         if sys.platform == "win32":
@@ -409,7 +593,7 @@ class AssetSyncService:
         try:
             url = f"{self.base_url}/orcalab/package/{package_id}/download_url/{params}"
             _start = time.monotonic()
-            async with aiohttp.ClientSession() as session:
+            async with self._session_scope() as session, self.scheduler.slot(url):
                 async with session.get(url, headers=self.get_headers(), timeout=self.aiohttp_timeout) as response:
                     elapsed = time.monotonic() - _start
                     logger.debug("HTTP GET %s 耗时: %.3f 秒 (状态码: %s)", url, elapsed, response.status)
@@ -450,6 +634,81 @@ class AssetSyncService:
             logger.debug(f"❌ 获取资产元数据失败: {e}")
             return None
 
+    def _load_metadata_sync_state(self) -> Dict:
+        state_path = self.cache_folder / METADATA_SYNC_STATE_FILE_NAME
+        try:
+            state = json.loads(state_path.read_text(encoding='utf-8'))
+            if isinstance(state, dict) and state.get('version') == METADATA_SYNC_STATE_VERSION:
+                state.setdefault('listings', {})
+                state.setdefault('packages', {})
+                return state
+        except (OSError, ValueError):
+            pass
+        return {'version': METADATA_SYNC_STATE_VERSION, 'listings': {}, 'packages': {}}
+
+    def _save_metadata_sync_state(self, state: Dict) -> None:
+        try:
+            _write_json_atomic(self.cache_folder / METADATA_SYNC_STATE_FILE_NAME, state)
+        except OSError as e:
+            logger.debug("保存元数据同步状态失败: %s", e)
+
+    def _package_version(self, pkg: Dict) -> str:
+        """包的版本标识：优先使用云端文件 sha256，其次是更新时间"""
+        download_info = getattr(self, 'download_info_cache', {}).get(pkg['id']) or {}
+        version = download_info.get('sha256') or pkg.get('sha256') or pkg.get('updatedAt') or pkg.get('updated_at')
+        return str(version) if version else ""
+
+    def _fetch_metadata_listing(self, is_published: bool, state: Dict) -> Optional[List[Dict]]:
+        """
+        条件请求远端元数据列表。
+
+        带上次的 ETag / Last-Modified 发起请求，服务器返回 304 时直接使用本地缓存的列表。
+        失败时返回 None。
+        """
+        key = 'published' if is_published else 'unpublished'
+        url = f"{self.base_url}/meta/?isPublished={'true' if is_published else 'false'}"
+        cache_path = self.cache_folder / f".metadata_listing_{key}.json"
+        listing_state = state['listings'].get(key, {})
+
+        headers = self.get_headers()
+        if cache_path.exists():
+            if listing_state.get('etag'):
+                headers['If-None-Match'] = listing_state['etag']
+            if listing_state.get('last_modified'):
+                headers['If-Modified-Since'] = listing_state['last_modified']
+
+        _start = time.monotonic()
+        response = requests.get(url, headers=headers, timeout=self.timeout)
+        elapsed = time.monotonic() - _start
+        logger.debug("HTTP GET %s 耗时: %.3f 秒 (状态码: %s)", url, elapsed, response.status_code)
+        self._raise_if_token_expired(response.status_code)
+
+        if response.status_code == 304:
+            try:
+                return json.loads(cache_path.read_bytes())
+            except (OSError, ValueError):
+                # 本地缓存丢失或损坏，去掉条件头重新获取
+                state['listings'].pop(key, None)
+                cache_path.unlink(missing_ok=True)
+                return self._fetch_metadata_listing(is_published, state)
+
+        if response.status_code != 200:
+            logger.debug(f"❌ 获取metadata失败: HTTP {response.status_code}")
+            return None
+
+        listing = response.json()
+        etag = response.headers.get('ETag', '')
+        last_modified = response.headers.get('Last-Modified', '')
+        if etag or last_modified:
+            try:
+                cache_path.write_bytes(response.content)
+                state['listings'][key] = {'etag': etag, 'last_modified': last_modified}
+            except OSError as e:
+                logger.debug("缓存元数据列表失败: %s", e)
+        else:
+            state['listings'].pop(key, None)
+        return listing
+
     def check_metadata(self, packages: List[Dict], to_delete: List[str], to_missing: List[Dict]):
         metadata_path = self.cache_folder / "metadata.json"
         if not metadata_path.exists():
@@ -464,12 +723,18 @@ class AssetSyncService:
                 continue
         else:
             metadata = {}
+        metadata_changed = False
+
+        sync_state = self._load_metadata_sync_state()
+        known_versions: Dict[str, str] = sync_state['packages']
+        current_versions = {package['id']: self._package_version(package) for package in packages}
 
         # 清理已删除的元数据
         for to_delete_pak in to_delete:
             pak_id = to_delete_pak.removesuffix('.pak')
             if pak_id in metadata.keys():
                 del metadata[pak_id]
+                metadata_changed = True
 
         to_update_metadata = set()
         package_ids = [package['id'] for package in packages]
@@ -477,6 +742,10 @@ class AssetSyncService:
         for pkg_id in package_ids:
             if pkg_id not in metadata:
                 to_update_metadata.add(pkg_id)
+            elif known_versions.get(pkg_id) and current_versions[pkg_id] != known_versions[pkg_id]:
+                # 包版本变化，仅重新获取该包的元数据
+                if current_versions[pkg_id]:
+                    to_update_metadata.add(pkg_id)
 
         missing_pak_ids = [
             to_missing_pak['id'] for to_missing_pak in to_missing
@@ -484,13 +753,22 @@ class AssetSyncService:
 
         for missing_pak_id in missing_pak_ids:
             to_update_metadata.add(missing_pak_id)
-            if missing_pak_id in metadata.keys():
-                del metadata[missing_pak_id]
+
+        # 记录待更新包中已有的子资产，未变化的子资产直接复用图片信息
+        previous_children: Dict[str, Dict] = {}
+        for pkg_id in to_update_metadata:
+            if pkg_id in metadata:
+                for child in metadata[pkg_id].get('children', []):
+                    if isinstance(child, dict) and 'id' in child:
+                        previous_children[child['id']] = child
+                del metadata[pkg_id]
+                metadata_changed = True
 
         keys = list(metadata.keys())
         for key in keys:
             if key not in package_ids and key not in to_update_metadata:
                 del metadata[key]
+                metadata_changed = True
 
         to_update_metadata_json = {}
         for package_id in to_update_metadata:
@@ -504,25 +782,12 @@ class AssetSyncService:
             self.callbacks.on_metadata_sync('fetching', 0, 0)
 
             try:
-                _start = time.monotonic()
-                response = requests.get(f"{self.base_url}/meta/?isPublished=true", headers=self.get_headers(), timeout=self.timeout)
-                elapsed = time.monotonic() - _start
-                logger.debug("HTTP GET %s/meta/?isPublished=true 耗时: %.3f 秒 (状态码: %s)", self.base_url, elapsed, response.status_code)
-                self._raise_if_token_expired(response.status_code)
-                if response.status_code != 200:
-                    logger.debug(f"❌ 获取metadata失败: HTTP {response.status_code}")
+                remote_metadata_published = self._fetch_metadata_listing(True, sync_state)
+                if remote_metadata_published is None:
                     return
-                remote_metadata_published = response.json()
-
-                _start = time.monotonic()
-                response = requests.get(f"{self.base_url}/meta/?isPublished=false", headers=self.get_headers(), timeout=self.timeout)
-                elapsed = time.monotonic() - _start
-                logger.debug("HTTP GET %s/meta/?isPublished=false 耗时: %.3f 秒 (状态码: %s)", self.base_url, elapsed, response.status_code)
-                self._raise_if_token_expired(response.status_code)
-                if response.status_code != 200:
-                    logger.debug(f"❌ 获取metadata失败: HTTP {response.status_code}")
+                remote_metadata_unpublished = self._fetch_metadata_listing(False, sync_state)
+                if remote_metadata_unpublished is None:
                     return
-                remote_metadata_unpublished = response.json()
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
                 logger.debug(f"❌ 连接资产库失败: {e}")
                 self.callbacks.on_metadata_sync('failed', 0, 0)
@@ -559,7 +824,16 @@ class AssetSyncService:
                         metadata[sub_metadata['parentPackageId']] = {}
                         metadata[sub_metadata['parentPackageId']]['children'] = []
                     metadata[sub_metadata['parentPackageId']]['children'].append(sub_metadata)
-                    assets_need_images.append((sub_metadata['id'], sub_metadata))
+                    previous = previous_children.get(sub_metadata['id'])
+                    if (
+                        previous is not None
+                        and 'pictures' in previous
+                        and sub_metadata.get('updatedAt') is not None
+                        and previous.get('updatedAt') == sub_metadata.get('updatedAt')
+                    ):
+                        sub_metadata['pictures'] = previous['pictures']
+                    else:
+                        assets_need_images.append((sub_metadata['id'], sub_metadata))
 
             # 并发获取 image_url
             total_images = len(assets_need_images)
@@ -583,9 +857,14 @@ class AssetSyncService:
                         self.callbacks.on_metadata_sync('scanning', completed_images, total_images)
 
             self.callbacks.on_metadata_sync('complete', len(to_update_metadata), len(to_update_metadata))
+            metadata_changed = True
+            logger.debug("元数据增量同步: 更新 %d 个包, 获取 %d 个图片信息", len(to_update_metadata), total_images)
+
+        if metadata_changed:
+            _write_json_atomic(metadata_path, metadata)
 
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        sync_state['packages'] = {pkg_id: version for pkg_id, version in current_versions.items() if version}
+        self._save_metadata_sync_state(sync_state)
 
     async def _download_package_group(self, group_id: str, packages: List[Dict]) -> Tuple[int, int]:
         """
@@ -654,7 +933,7 @@ class AssetSyncService:
 
             success = await self._download_package_with_group_progress(
                 group_id, file_name, download_url, cloud_file_sha256,
-                total_group_size, downloaded_group_size, start_time
+                total_group_size, downloaded_group_size, start_time, size
             )
 
             if success:
@@ -667,7 +946,7 @@ class AssetSyncService:
                 # 失败后重试一次
                 retry_success = await self._download_package_with_group_progress(
                     group_id, file_name, download_url, cloud_file_sha256,
-                    total_group_size, downloaded_group_size, start_time
+                    total_group_size, downloaded_group_size, start_time, size
                 )
                 if retry_success:
                     success_count += 1
@@ -695,18 +974,16 @@ class AssetSyncService:
             local_path = self.cache_folder / file_name
             temp_path = self.cache_folder / f"{file_name}.tmp"
             try:
-                async with aiohttp.ClientSession() as session:
+                async with self._session_scope() as session, self.scheduler.slot(download_url):
                     async with session.get(download_url, timeout=self.aiohttp_timeout) as response:
                         if response.status != 200:
                             logger.debug("❌ JSON文件下载失败: %s HTTP %s", file_name, response.status)
                             continue
                         with open(temp_path, 'wb') as f:
-                            async for chunk in response.content.iter_chunked(8192):
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
                                 if chunk:
                                     f.write(chunk)
-                if local_path.exists():
-                    local_path.unlink()
-                temp_path.rename(local_path)
+                os.replace(temp_path, local_path)
                 logger.debug("✓ JSON文件 %s 下载完成", file_name)
             except Exception as e:
                 logger.debug("❌ JSON文件下载失败: %s - %s", file_name, e)
@@ -715,7 +992,7 @@ class AssetSyncService:
 
     async def _download_package_with_group_progress(self, group_id: str, file_name: str, download_url: str, 
                                            cloud_file_sha256: str | None, total_group_size: int, downloaded_group_size: int, 
-                                           group_start_time: float) -> bool:
+                                           group_start_time: float, file_size: int = 0) -> bool:
         """
         下载单个包并更新组进度
         
@@ -727,6 +1004,7 @@ class AssetSyncService:
             total_group_size: 组总大小
             downloaded_group_size: 组已下载大小
             group_start_time: 组开始下载时间
+            file_size: 文件大小，用作调度优先级（大文件优先）
             
         Returns:
             是否下载成功
@@ -740,53 +1018,55 @@ class AssetSyncService:
                 self.callbacks.on_set_name_size(group_id, file_name, float(total_group_size))
                 self.callbacks.on_download_start(group_id)
 
-            # 异步流式下载
-            _start = time.monotonic()
-            async with aiohttp.ClientSession() as session:
-                async with session.get(download_url, timeout=self.aiohttp_timeout) as response:
-                    elapsed = time.monotonic() - _start
-                    logger.debug("HTTP GET %s 首包耗时: %.3f 秒 (状态码: %s)", download_url, elapsed, response.status)
+            last_update_time = 0.0
+            downloader: Optional[ResumableDownloader] = None
+
+            def on_progress(current_downloaded: int, _total: int):
+                # 更新组进度（每0.1秒更新一次）
+                nonlocal last_update_time
+                current_time = time.time()
+                if total_group_size > 0 and current_time - last_update_time >= 0.1:
+                    total_downloaded = downloaded_group_size + current_downloaded
+                    progress = int64((total_downloaded / total_group_size) * 100)
+                    elapsed = current_time - group_start_time
+                    # 续传时已在磁盘上的字节不计入速度
+                    transferred = total_downloaded - (downloader.resumed_bytes if downloader is not None else 0)
+                    speed = (transferred / (1024 * 1024)) / elapsed if elapsed > 0 else 0
+                    with self._callback_lock:
+                        self.callbacks.on_download_progress(group_id, progress, speed)
+                    last_update_time = current_time
 
-                    if response.status != 200:
-                        logger.debug(f"❌ 下载失败: HTTP {response.status}")
-                        with self._callback_lock:
-                            self.callbacks.on_download_complete(group_id, False, f"HTTP {response.status}")
-                        return False
-
-                    current_downloaded = 0
-                    last_update_time = time.time()
-
-                    with open(temp_path, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            if self._cancelled():
-                                logger.debug(f"下载已取消: {file_name}")
-                                if temp_path.exists():
-                                    temp_path.unlink()
-                                with self._callback_lock:
-                                    self.callbacks.on_download_complete(group_id, False, "已取消")
-                                return False
-                            if chunk:
-                                f.write(chunk)
-                                current_downloaded += len(chunk)
-
-                                # 更新组进度（每0.1秒更新一次）
-                                current_time = time.time()
-                                if total_group_size > 0 and current_time - last_update_time >= 0.1:
-                                    total_downloaded = downloaded_group_size + current_downloaded
-                                    progress = int64((total_downloaded / total_group_size) * 100)
-                                    elapsed = current_time - group_start_time
-                                    speed = (total_downloaded / (1024 * 1024)) / elapsed if elapsed > 0 else 0
-                                    with self._callback_lock:
-                                        self.callbacks.on_download_progress(group_id, progress, speed)
-                                    last_update_time = current_time
+            # 可续传流式下载：中断后保留临时文件与续传状态，重试时从断点继续
+            _start = time.monotonic()
+            async with self._session_scope() as session, self.scheduler.slot(download_url, priority=file_size):
+                downloader = ResumableDownloader(
+                    session,
+                    download_url,
+                    temp_path,
+                    timeout=self.aiohttp_timeout,
+                    segments=self.download_segments,
+                    on_progress=on_progress,
+                    cancelled=self._cancelled,
+                )
+                try:
+                    local_file_sha256 = await downloader.download()
+                except DownloadCancelled:
+                    self.log(f"下载已取消: {file_name}")
+                    with self._callback_lock:
+                        self.callbacks.on_download_complete(group_id, False, "已取消")
+                    return False
+                except aiohttp.ClientResponseError as e:
+                    logger.debug(f"❌ 下载失败: HTTP {e.status}")
+                    with self._callback_lock:
+                        self.callbacks.on_download_complete(group_id, False, f"HTTP {e.status}")
+                    return False
+                resumed_bytes = downloader.resumed_bytes
+                current_downloaded = downloader.state.downloaded
 
-            if self._cancelled():
-                self.log(f"下载已取消: {file_name}")
-                if temp_path.exists():
-                    temp_path.unlink()
-                with self._callback_lock:
-                    self.callbacks.on_download_complete(group_id, False, "已取消")
-                return False
+            logger.debug(
+                "下载 %s 耗时: %.3f 秒 (%d 字节, 续传 %d 字节)",
+                file_name, time.monotonic() - _start, current_downloaded, resumed_bytes,
+            )
 
             # 最终组进度更新
             if total_group_size > 0:
@@ -796,36 +1076,48 @@ class AssetSyncService:
                     self.callbacks.on_download_progress(group_id, progress, 0)
 
             # 文件完整性验证
-            local_file_sha256 = calculate_file_sha256(temp_path)
             if cloud_file_sha256:
-                if local_file_sha256.lower() != cloud_file_sha256:
+                if local_file_sha256 != cloud_file_sha256.lower():
+                    discard_partial_download(temp_path)
                     with self._callback_lock:
                         self.callbacks.on_download_complete(group_id, False, "incomplete")
                     return False
 
-            # 重命名
-            if local_path.exists():
-                local_path.unlink()
-            temp_path.rename(local_path)
+            if file_name in self.mounted_pak_names:
+                pending_path = local_path.with_name(local_path.name + PENDING_PAK_SUFFIX)
+                os.replace(temp_path, pending_path)
+                record_file_sha256(pending_path, local_file_sha256)
+                logger.info("%s 已被引擎挂载，新版本将在下次启动时替换", file_name)
+                return True
+
+            # 原子替换
+            os.replace(temp_path, local_path)
+            record_file_sha256(local_path, local_file_sha256)
+            with self._callback_lock:
+                self.callbacks.on_package_ready(file_name, str(local_path))
 
             logger.debug(f"✓ {file_name} 下载完成")
             return True
 
         except Exception as e:
+            # 保留临时文件与续传状态，重试或下次同步时从断点继续
             logger.debug(f"❌ 下载失败: {e}")
-            if 'temp_path' in locals() and temp_path.exists():
-                temp_path.unlink()
             with self._callback_lock:
                 self.callbacks.on_download_complete(group_id, False, str(e))
             return False
 
     def clean_unsubscribed_packages(self, to_delete: List[str]):
-        """删除不需要的pak文件"""
+        """删除不需要的pak文件；引擎已挂载的文件记入清单，下次启动时删除"""
+        deferred = [file_name for file_name in to_delete if file_name in self.mounted_pak_names]
+        if deferred:
+            pending = _load_pending_deletions(self.cache_folder) | set(deferred)
+            _write_json_atomic(self.cache_folder / PENDING_PAK_DELETIONS_FILE_NAME, sorted(pending))
+            logger.info("%d 个资产包已被引擎挂载，将在下次启动时删除", len(deferred))
         for file_name in to_delete:
+            if file_name in self.mounted_pak_names:
+                continue
             try:
-                pak_file = self.cache_folder / file_name
-                shutil.copy2(pak_file, self.downloaded_packages_folder / file_name)
-                pak_file.unlink()
+                _move_to_downloaded_folder(self.cache_folder / file_name, self.downloaded_packages_folder)
                 logger.debug(f"✓ 已删除 {file_name}")
             except Exception as e:
                 logger.debug(f"✗ 删除失败 {file_name}: {e}")
@@ -840,6 +1132,24 @@ class AssetSyncService:
         Returns:
             同步是否成功，如果返回 'TOKEN_EXPIRED' 表示 token 过期
         """
+        # 整个同步过程共享一个连接池，下载链接查询、pak 与 JSON 下载复用 keep-alive 连接
+        self._session, stats = create_pooled_session(
+            self.aiohttp_timeout, self.scheduler.max_concurrent, self.scheduler.max_per_host
+        )
+        _start = time.monotonic()
+        try:
+            return await self._sync_packages(init_paks)
+        finally:
+            await self._session.close()
+            self._session = None
+            logger.debug(
+                "资产同步耗时: %.3f 秒, HTTP 连接新建 %d 次, 复用 %d 次",
+                time.monotonic() - _start,
+                stats.created,
+                stats.reused,
+            )
+
+    async def _sync_packages(self, init_paks: bool) -> bool:
         self.callbacks.on_start()
 
         # 根据版本号获取对应的资产ID
@@ -873,8 +1183,9 @@ class AssetSyncService:
 
         # 如果 init_paks=true，清除既不在手工列表、订阅列表也不在pak_urls列表中的包
         if init_paks:
-            # 合并手工pak、订阅pak和pak_urls的文件名（要保留的文件）
+            # 合并手工pak、订阅pak和pak_urls的文件名（要保留的文件）；已挂载的包留给清理步骤推迟删除
             keep_file_names = subscribed_file_names | self.config_pak_names | self.pak_url_names
+            keep_file_names |= self.mounted_pak_names
 
             from orcalab.project_util import move_packages_to_downloaded_folder
             if keep_file_names:
@@ -916,6 +1227,13 @@ class AssetSyncService:
                 base_package_groups[group_id] = []
             base_package_groups[group_id].append(pkg)
 
+        # 大的组先提交，配合调度器的大小优先级尽早占满带宽
+        base_package_groups = dict(sorted(
+            base_package_groups.items(),
+            key=lambda item: sum(pkg.get('size') or 0 for pkg in item[1]),
+            reverse=True,
+        ))
+
         # 并发下载每组包（每组内按顺序下载：先全量包，后增量包）
         if base_package_groups:
             # 创建异步任务列表
@@ -958,6 +1276,7 @@ class AssetSyncService:
 
         # 4. 清理不需要的文件
         self.clean_unsubscribed_packages(to_delete)
+        save_content_hash_store()
 
         # 5. 完成
         message = f"下载: {success_count} 成功, {fail_count} 失败; 删除: {len(to_delete)} 个"
@@ -968,7 +1287,7 @@ class AssetSyncService:
 
 
 def sync_assets(config_service: ConfigService, callbacks: Optional[AssetSyncCallbacks] = None, verbose: bool = False,
-                cancel_event: Optional[threading.Event] = None) -> bool:
+                cancel_event: Optional[threading.Event] = None, defer_mounted_paks: bool = False) -> bool:
     """
     资产同步入口函数
     
@@ -977,6 +1296,8 @@ def sync_assets(config_service: ConfigService, callbacks: Optional[AssetSyncCall
         callbacks: 回调接口
         verbose: 是否输出详细日志
         cancel_event: 若设置 is_set()，同步逻辑将尽快中止
+        defer_mounted_paks: 引擎已挂载缓存目录（后台同步）时为 True，缓存目录中现有 pak 的
+            替换与删除推迟到下次启动
     
     Returns:
         同步是否成功
@@ -1005,7 +1326,12 @@ def sync_assets(config_service: ConfigService, callbacks: Optional[AssetSyncCall
     config_paks = config_service.paks()
     pak_urls = config_service.pak_urls()
     timeout = config_service.datalink_timeout()
+    hash_concurrency = config_service.datalink_hash_concurrency()
+    download_segments = config_service.datalink_download_segments()
+    max_concurrent_downloads = config_service.datalink_max_concurrent_downloads()
+    max_connections_per_host = config_service.datalink_max_connections_per_host()
     init_paks = config_service.init_paks()
+    mounted_pak_names = {p.name for p in cache_folder.glob("*.pak")} if defer_mounted_paks else None
     
     # 创建同步服务并执行同步
     sync_service = AssetSyncService(
@@ -1020,6 +1346,11 @@ def sync_assets(config_service: ConfigService, callbacks: Optional[AssetSyncCall
         callbacks=callbacks,
         verbose=verbose,
         cancel_event=cancel_event,
+        hash_concurrency=hash_concurrency,
+        download_segments=download_segments,
+        max_concurrent_downloads=max_concurrent_downloads,
+        max_connections_per_host=max_connections_per_host,
+        mounted_pak_names=mounted_pak_names,
     )
     
     # 运行异步同步方法
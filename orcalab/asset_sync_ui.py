@@ -47,6 +47,12 @@ class SyncCallbacksImpl(AssetSyncCallbacks):
     def on_download_progress(self, asset_id: str, progress: int64, speed: float):
         self.window.set_asset_progress(asset_id, progress, speed)
     
+    def on_verify_start(self, asset_id: str):
+        self.window.set_asset_status(asset_id, 'verifying')
+
+    def on_verify_progress(self, asset_id: str, progress: int64, speed: float):
+        self.window.set_asset_progress(asset_id, progress, speed)
+
     def on_download_complete(self, asset_id: str, success: bool, error: str = ""):
         logger.debug("on_download_complete: asset_id=%s, success=%s, error=%s", asset_id, success, error)
         if success:
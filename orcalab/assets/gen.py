@@ -5,4 +5,4 @@ import subprocess
 # https://github.com/microsoft/fluentui-system-icons
 if __name__ == "__main__":
     cwd = os.path.dirname(__file__)
-    subprocess.run(["pyside6-rcc", "assets.qrc", "-o", "rc_assets.py"], cwd=cwd)
+    subprocess.run(["pyside6-rcc", "--binary", "assets.qrc", "-o", "assets.rcc"], cwd=cwd)
@@ -1,16554 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.9.2
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x02v\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M14 3H6\
-C4.89543 3 4 3.8\
-9543 4 5V14C4 15\
-.1046 4.89543 16\
- 6 16H14C15.1046\
- 16 16 15.1046 1\
-6 14V5C16 3.8954\
-3 15.1046 3 14 3\
-Z\x22 fill=\x22#212121\
-\x22 opacity=\x220.3\x22/\
->\x0d\x0a<path d=\x22M12 \
-5.5H5C4.17157 5.\
-5 3.5 6.17157 3.\
-5 7V15C3.5 15.82\
-84 4.17157 16.5 \
-5 16.5H12C12.828\
-4 16.5 13.5 15.8\
-284 13.5 15V7C13\
-.5 6.17157 12.82\
-84 5.5 12 5.5Z\x22 \
-fill=\x22#212121\x22 o\
-pacity=\x220.6\x22/>\x0d\x0a\
-<path d=\x22M15 7.5\
-H8C7.17157 7.5 6\
-.5 8.17157 6.5 9\
-V17C6.5 17.8284 \
-7.17157 18.5 8 1\
-8.5H15C15.8284 1\
-8.5 16.5 17.8284\
- 16.5 17V9C16.5 \
-8.17157 15.8284 \
-7.5 15 7.5Z\x22 fil\
-l=\x22#212121\x22/>\x0d\x0a<\
-/svg>\
-\x00\x00\x9eM\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22?>\x0d\x0a<svg vers\
-ion=\x221.1\x22 xmlns=\
-\x22http://www.w3.o\
-rg/2000/svg\x22 wid\
-th=\x22591\x22 height=\
-\x22591\x22>\x0d\x0a<path d=\
-\x22M0 0 C2.2421379\
- 0.05983142 4.48\
-432663 0.1177885\
-7 6.7265625 0.17\
-382812 C30.12770\
-735 0.81520735 3\
-0.12770735 0.815\
-20735 32.125 2.8\
-125 C33.7656333 \
-3.11323315 35.41\
-300254 3.3774597\
-1 37.0625 3.625 \
-C41.85387011 4.4\
-6364393 46.01979\
-615 5.77232547 5\
-0.4765625 7.6914\
-0625 C53.4065405\
- 8.93167717 56.3\
-8117548 9.986027\
-99 59.375 11.062\
-5 C66.75827883 1\
-3.86972997 73.38\
-590036 17.740750\
-14 80.125 21.812\
-5 C80.125 22.472\
-5 80.125 23.1325\
- 80.125 23.8125 \
-C81.445 24.1425 \
-82.765 24.4725 8\
-4.125 24.8125 C8\
-4.125 25.4725 84\
-.125 26.1325 84.\
-125 26.8125 C84.\
-846875 26.915625\
- 85.56875 27.018\
-75 86.3125 27.12\
-5 C89.40246686 2\
-7.88032523 91.52\
-058686 29.003879\
-76 94.125 30.812\
-5 C94.455 31.472\
-5 94.785 32.1325\
- 95.125 32.8125 \
-C96.115 33.1425 \
-97.105 33.4725 9\
-8.125 33.8125 C9\
-8.125 34.4725 98\
-.125 35.1325 98.\
-125 35.8125 C99.\
-115 36.1425 100.\
-105 36.4725 101.\
-125 36.8125 C101\
-.125 37.4725 101\
-.125 38.1325 101\
-.125 38.8125 C10\
-2.115 39.1425 10\
-3.105 39.4725 10\
-4.125 39.8125 C1\
-04.125 40.4725 1\
-04.125 41.1325 1\
-04.125 41.8125 C\
-105.115 41.8125 \
-106.105 41.8125 \
-107.125 41.8125 \
-C107.125 42.4725\
- 107.125 43.1325\
- 107.125 43.8125\
- C107.7025 44.08\
-0625 108.28 44.3\
-4875 108.875 44.\
-625 C111.1805004\
-3 45.84179189 11\
-3.14556192 47.11\
-583879 115.125 4\
-8.8125 C115.125 \
-49.4725 115.125 \
-50.1325 115.125 \
-50.8125 C116.115\
- 51.1425 117.105\
- 51.4725 118.125\
- 51.8125 C118.12\
-5 52.4725 118.12\
-5 53.1325 118.12\
-5 53.8125 C118.7\
-85 53.8125 119.4\
-45 53.8125 120.1\
-25 53.8125 C121.\
-48676922 55.4560\
-1457 122.8146206\
-6 57.12772656 12\
-4.125 58.8125 C1\
-25.3625 60.01906\
-25 125.3625 60.0\
-190625 126.625 6\
-1.25 C129.125 63\
-.8125 129.125 63\
-.8125 131.125 66\
-.875 C132.991076\
-9 69.92788892 13\
-2.9910769 69.927\
-88892 135.875 72\
- C136.6175 72.59\
-8125 137.36 73.1\
-9625 138.125 73.\
-8125 C138.125 74\
-.8025 138.125 75\
-.7925 138.125 76\
-.8125 C138.785 7\
-6.8125 139.445 7\
-6.8125 140.125 7\
-6.8125 C144.125 \
-82.22426471 144.\
-125 82.22426471 \
-144.125 84.8125 \
-C144.785 84.8125\
- 145.445 84.8125\
- 146.125 84.8125\
- C148.94266739 8\
-9.58345076 148.6\
-6168499 94.42161\
-943 148.125 99.8\
-125 C146.75 102.\
-8125 146.75 102.\
-8125 145.125 104\
-.8125 C144.465 1\
-05.8025 143.805 \
-106.7925 143.125\
- 107.8125 C142.4\
-65 107.8125 141.\
-805 107.8125 141\
-.125 107.8125 C1\
-41.125 108.8025 \
-141.125 109.7925\
- 141.125 110.812\
-5 C139.4853279 1\
-12.17889342 137.\
-81389872 113.507\
-4419 136.125 114\
-.8125 C135.04218\
-75 116.17375 135\
-.0421875 116.173\
-75 133.9375 117.\
-5625 C133.339375\
- 118.305 132.741\
-25 119.0475 132.\
-125 119.8125 C13\
-1.465 119.8125 1\
-30.805 119.8125 \
-130.125 119.8125\
- C129.8775 120.3\
-69375 129.63 120\
-.92625 129.375 1\
-21.5 C127.886294\
-71 124.25410479 \
-126.24090028 126\
-.50424514 124.12\
-5 128.8125 C123.\
-135 128.8125 122\
-.145 128.8125 12\
-1.125 128.8125 C\
-120.795 129.8025\
- 120.465 130.792\
-5 120.125 131.81\
-25 C119.465 131.\
-8125 118.805 131\
-.8125 118.125 13\
-1.8125 C117.795 \
-132.8025 117.465\
- 133.7925 117.12\
-5 134.8125 C116.\
-465 134.8125 115\
-.805 134.8125 11\
-5.125 134.8125 C\
-114.795 135.8025\
- 114.465 136.792\
-5 114.125 137.81\
-25 C113.465 137.\
-8125 112.805 137\
-.8125 112.125 13\
-7.8125 C112.125 \
-138.4725 112.125\
- 139.1325 112.12\
-5 139.8125 C107.\
-77205882 143.812\
-5 107.77205882 1\
-43.8125 104.125 \
-143.8125 C103.87\
-75 144.39 103.63\
- 144.9675 103.37\
-5 145.5625 C101.\
-93106301 148.161\
-58658 100.389780\
-13 149.89086838 \
-98.125 151.8125 \
-C97.135 151.8125\
- 96.145 151.8125\
- 95.125 151.8125\
- C95.125 152.472\
-5 95.125 153.132\
-5 95.125 153.812\
-5 C93.33463542 1\
-54.7890625 91.54\
-427083 155.76562\
-5 89.75390625 15\
-6.7421875 C87.95\
-881685 157.72660\
-024 87.95881685 \
-157.72660024 87.\
-125 159.8125 C80\
-.77205882 163.81\
-25 80.77205882 1\
-63.8125 77.125 1\
-63.8125 C77.125 \
-164.4725 77.125 \
-165.1325 77.125 \
-165.8125 C75.732\
-8125 166.2146875\
- 75.7328125 166.\
-2146875 74.3125 \
-166.625 C71.1658\
-5375 167.5350139\
-5 71.16585375 16\
-7.53501395 69.56\
-25 169.4375 C68.\
-125 170.8125 68.\
-125 170.8125 65.\
-4375 171 C64.674\
-375 170.938125 6\
-3.91125 170.8762\
-5 63.125 170.812\
-5 C62.795 171.80\
-25 62.465 172.79\
-25 62.125 173.81\
-25 C57.59503975 \
-176.91718007 52.\
-37432803 178.419\
-82113 47.125 179\
-.8125 C46.795 18\
-0.1425 46.465 18\
-0.4725 46.125 18\
-0.8125 C43.45441\
-149 180.95365161\
- 40.80067762 180\
-.85497107 38.125\
- 180.8125 C37.79\
-5 181.8025 37.46\
-5 182.7925 37.12\
-5 183.8125 C33.1\
-65 183.8125 29.2\
-05 183.8125 25.1\
-25 183.8125 C24.\
-795 184.8025 24.\
-465 185.7925 24.\
-125 186.8125 C9.\
-935 186.8125 -4.\
-255 186.8125 -18\
-.875 186.8125 C-\
-19.205 185.8225 \
--19.535 184.8325\
- -19.875 183.812\
-5 C-24.165 183.8\
-125 -28.455 183.\
-8125 -32.875 183\
-.8125 C-32.875 1\
-82.8225 -32.875 \
-181.8325 -32.875\
- 180.8125 C-33.4\
-4347656 180.8473\
-0469 -34.0119531\
-2 180.88210938 -\
-34.59765625 180.\
-91796875 C-35.36\
-980469 180.94503\
-906 -36.14195312\
- 180.97210938 -3\
-6.9375 181 C-37.\
-69160156 181.034\
-80469 -38.445703\
-12 181.06960938 \
--39.22265625 181\
-.10546875 C-42.7\
-7472745 180.7131\
-1921 -45.6876997\
-3 179.33225883 -\
-48.875 177.8125 \
-C-49.54893799 17\
-7.49949951 -50.2\
-2287598 177.1864\
-9902 -50.9172363\
-3 176.86401367 C\
--53.03890437 175\
-.86773719 -55.14\
-508115 174.84363\
-888 -57.25 173.8\
-125 C-57.9731640\
-6 173.46960938 -\
-58.69632812 173.\
-12671875 -59.441\
-40625 172.773437\
-5 C-61.29251436 \
-171.86351194 -63\
-.08925532 170.84\
-48186 -64.875 16\
-9.8125 C-65.205 \
-168.8225 -65.535\
- 167.8325 -65.87\
-5 166.8125 C-68.\
-185 166.4825 -70\
-.495 166.1525 -7\
-2.875 165.8125 C\
--72.875 165.1525\
- -72.875 164.492\
-5 -72.875 163.81\
-25 C-74.525 163.\
-4825 -76.175 163\
-.1525 -77.875 16\
-2.8125 C-77.875 \
-162.1525 -77.875\
- 161.4925 -77.87\
-5 160.8125 C-78.\
-61363281 160.536\
-64063 -79.352265\
-63 160.26078125 \
--80.11328125 159\
-.9765625 C-88.05\
-156249 156.63058\
-257 -95.59538265\
- 150.63327266 -1\
-01.875 144.8125 \
-C-101.875 144.15\
-25 -101.875 143.\
-4925 -101.875 14\
-2.8125 C-102.865\
- 142.4825 -103.8\
-55 142.1525 -104\
-.875 141.8125 C-\
-104.875 141.1525\
- -104.875 140.49\
-25 -104.875 139.\
-8125 C-105.865 1\
-39.8125 -106.855\
- 139.8125 -107.8\
-75 139.8125 C-10\
-9.5625 138.4375 \
--109.5625 138.43\
-75 -110.875 136.\
-8125 C-110.875 1\
-36.1525 -110.875\
- 135.4925 -110.8\
-75 134.8125 C-11\
-1.76493652 134.4\
-093457 -111.7649\
-3652 134.4093457\
- -112.67285156 1\
-33.99804688 C-11\
-4.88040033 132.8\
-0959268 -116.340\
-42882 131.605076\
-11 -118.109375 1\
-29.84375 C-118.6\
-8300781 129.2726\
-9531 -119.256640\
-62 128.70164063 \
--119.84765625 12\
-8.11328125 C-120\
-.43417969 127.51\
-902344 -121.0207\
-0313 126.9247656\
-3 -121.625 126.3\
-125 C-122.226992\
-19 125.71824219 \
--122.82898438 12\
-5.12398438 -123.\
-44921875 124.511\
-71875 C-124.0176\
-9531 123.9406640\
-6 -124.58617187 \
-123.36960937 -12\
-5.171875 122.781\
-25 C-125.9506298\
-8 121.99911133 -\
-125.95062988 121\
-.99911133 -126.7\
-4511719 121.2011\
-7188 C-127.875 1\
-19.8125 -127.875\
- 119.8125 -127.8\
-75 117.8125 C-12\
-8.535 117.8125 -\
-129.195 117.8125\
- -129.875 117.81\
-25 C-131.5 116.5\
- -131.5 116.5 -1\
-32.875 114.8125 \
-C-132.875 113.82\
-25 -132.875 112.\
-8325 -132.875 11\
-1.8125 C-133.865\
- 111.4825 -134.8\
-55 111.1525 -135\
-.875 110.8125 C-\
-135.875 110.1525\
- -135.875 109.49\
-25 -135.875 108.\
-8125 C-136.865 1\
-08.4825 -137.855\
- 108.1525 -138.8\
-75 107.8125 C-14\
-2.19513181 104.1\
-2077192 -145.227\
-81362 99.8740802\
-2 -145.625 94.81\
-25 C-145.2382071\
- 89.76383484 -14\
-2.17365447 85.50\
-425838 -138.875 \
-81.8125 C-138.21\
-5 81.8125 -137.5\
-55 81.8125 -136.\
-875 81.8125 C-13\
-6.215 80.1625 -1\
-35.555 78.5125 -\
-134.875 76.8125 \
-C-134.215 76.812\
-5 -133.555 76.81\
-25 -132.875 76.8\
-125 C-132.875 75\
-.8225 -132.875 7\
-4.8325 -132.875 \
-73.8125 C-132.21\
-5 73.8125 -131.5\
-55 73.8125 -130.\
-875 73.8125 C-13\
-0.545 72.4925 -1\
-30.215 71.1725 -\
-129.875 69.8125 \
-C-129.215 69.812\
-5 -128.555 69.81\
-25 -127.875 69.8\
-125 C-127.38 68.\
-3275 -127.38 68.\
-3275 -126.875 66\
-.8125 C-126.215 \
-66.8125 -125.555\
- 66.8125 -124.87\
-5 66.8125 C-124.\
-58625 66.214375 \
--124.2975 65.616\
-25 -124 65 C-122\
-.875 62.8125 -12\
-2.875 62.8125 -1\
-20.875 59.8125 C\
--120.215 59.8125\
- -119.555 59.812\
-5 -118.875 59.81\
-25 C-118.6365234\
-4 59.24660156 -1\
-18.39804688 58.6\
-8070313 -118.152\
-34375 58.0976562\
-5 C-116.6027243 \
-55.32540127 -114\
-.71464175 53.459\
-83707 -112.4375 \
-51.25 C-111.6550\
-3906 50.48558594\
- -110.87257812 4\
-9.72117188 -110.\
-06640625 48.9335\
-9375 C-109.34324\
-219 48.23363281 \
--108.62007812 47\
-.53367188 -107.8\
-75 46.8125 C-107\
-.34777344 46.225\
-97656 -106.82054\
-687 45.63945312 \
--106.27734375 45\
-.03515625 C-104.\
-875 43.8125 -104\
-.875 43.8125 -10\
-1.875 43.8125 C-\
-101.545 42.8225 \
--101.215 41.8325\
- -100.875 40.812\
-5 C-100.215 40.8\
-125 -99.555 40.8\
-125 -98.875 40.8\
-125 C-98.545 39.\
-8225 -98.215 38.\
-8325 -97.875 37.\
-8125 C-96.132812\
-5 36.2421875 -96\
-.1328125 36.2421\
-875 -94 34.6875 \
-C-93.30132812 34\
-.16929687 -92.60\
-265625 33.651093\
-75 -91.8828125 3\
-3.1171875 C-89.8\
-75 31.8125 -89.8\
-75 31.8125 -86.8\
-75 30.8125 C-86.\
-50448832 29.4890\
-1597 -86.1766262\
-8 28.15336184 -8\
-5.875 26.8125 C-\
-81.29385588 19.6\
-30159 -74.776647\
-72 16.10059353 -\
-67.3125 12.4375 \
-C-66.29736328 11\
-.91800781 -65.28\
-222656 11.398515\
-63 -64.23632812 \
-10.86328125 C-57\
-.67640554 7.5468\
-9975 -51.7575886\
-4 4.70672435 -44\
-.3125 4.4375 C-3\
-9.9393583 4.1650\
-0729 -36.5729300\
-8 3.39209399 -32\
-.52734375 1.7617\
-1875 C-21.995912\
-55 -1.58792919 -\
-10.90724233 -0.3\
-8146678 0 0 Z M-\
-22.375 65.5 C-22\
-.87 66.263125 -2\
-3.365 67.02625 -\
-23.875 67.8125 C\
--24.4525 68.3487\
-5 -25.03 68.885 \
--25.625 69.4375 \
-C-27.2113364 70.\
-87276027 -27.211\
-3364 70.87276027\
- -26.875 73.8125\
- C-27.535 73.812\
-5 -28.195 73.812\
-5 -28.875 73.812\
-5 C-32.77786746 \
-81.78085441 -33.\
-3305944 90.93156\
-401 -31.1953125 \
-99.55859375 C-30\
-.34729153 101.93\
-205159 -30.34729\
-153 101.93205159\
- -28.875 104.812\
-5 C-28.215 104.8\
-125 -27.555 104.\
-8125 -26.875 104\
-.8125 C-26.7925 \
-105.38742188 -26\
-.71 105.96234375\
- -26.625 106.554\
-6875 C-25.650308\
-29 109.48891568 \
--24.11760874 110\
-.83104965 -21.87\
-5 112.9375 C-17.\
-95974576 116.643\
-00847 -17.959745\
-76 116.64300847 \
--16.875 118.8125\
- C-6.94242717 12\
-3.64019238 5.104\
-93008 124.006933\
-25 15.4375 120.4\
-375 C18.31091271\
- 119.37672695 20\
-.15117737 118.18\
-108715 22.125 11\
-5.8125 C22.125 1\
-15.1525 22.125 1\
-14.4925 22.125 1\
-13.8125 C23.445 \
-113.1525 24.765 \
-112.4925 26.125 \
-111.8125 C26.125\
- 111.1525 26.125\
- 110.4925 26.125\
- 109.8125 C26.78\
-5 109.8125 27.44\
-5 109.8125 28.12\
-5 109.8125 C28.4\
-1375 109.173125 \
-28.7025 108.5337\
-5 29 107.875 C30\
-.125 105.8125 30\
-.125 105.8125 32\
-.125 104.8125 C3\
-2.59023063 102.9\
-1716658 32.59023\
-063 102.91716658\
- 32.75 100.75 C3\
-2.935625 98.8009\
-375 32.935625 98\
-.8009375 33.125 \
-96.8125 C33.785 \
-96.8125 34.445 9\
-6.8125 35.125 96\
-.8125 C35.125 91\
-.8625 35.125 86.\
-9125 35.125 81.8\
-125 C34.465 81.8\
-125 33.805 81.81\
-25 33.125 81.812\
-5 C33.021875 80.\
-554375 32.91875 \
-79.29625 32.8125\
- 78 C32.42913853\
- 74.7325411 32.4\
-2913853 74.73254\
-11 30.6875 72 C3\
-0.171875 71.6081\
-25 29.65625 71.2\
-1625 29.125 70.8\
-125 C28.465 69.8\
-225 27.805 68.83\
-25 27.125 67.812\
-5 C26.465 67.812\
-5 25.805 67.8125\
- 25.125 67.8125 \
-C25.125 66.8225 \
-25.125 65.8325 2\
-5.125 64.8125 C2\
-4.135 64.8125 23\
-.145 64.8125 22.\
-125 64.8125 C22.\
-125 63.8225 22.1\
-25 62.8325 22.12\
-5 61.8125 C21.13\
-5 61.8125 20.145\
- 61.8125 19.125 \
-61.8125 C19.125 \
-61.1525 19.125 6\
-0.4925 19.125 59\
-.8125 C13.029555\
-66 57.17606214 7\
-.93808134 56.231\
-63782 1.3125 56.\
-25 C-0.00427734 \
-56.25253784 -0.0\
-0427734 56.25253\
-784 -1.34765625 \
-56.25512695 C-10\
-.08930478 56.496\
-7831 -16.3621731\
-8 59.03621117 -2\
-2.375 65.5 Z \x22 f\
-ill=\x22#000000\x22 tr\
-ansform=\x22transla\
-te(292.875,103.1\
-875)\x22/>\x0d\x0a<path d\
-=\x22M0 0 C2.179476\
-52 2.17947652 1.\
-45337729 7.55891\
-199 1.60546875 1\
-0.62890625 C1.49\
-70552 14.1094427\
-7 1.4970552 14.1\
-0944277 3 17 C3.\
-28221172 19.5802\
-2142 3.44820197 \
-22.16030185 3.62\
-109375 24.75 C3.\
-74613281 25.4925\
- 3.87117188 26.2\
-35 4 27 C4.66 27\
-.33 5.32 27.66 6\
- 28 C6 29.65 6 3\
-1.3 6 33 C7.485 \
-33.495 7.485 33.\
-495 9 34 C9 35.6\
-5 9 37.3 9 39 C9\
-.99 39 10.98 39 \
-12 39 C12 40.32 \
-12 41.64 12 43 C\
-12.99 43 13.98 4\
-3 15 43 C15.2436\
-0427 45.92325122\
- 15.19608294 47.\
-62847443 13.8125\
- 50.25 C11.58960\
-307 52.39624531 \
-9.99650825 52.52\
-686712 7 53 C6.5\
-05 53.99 6.505 5\
-3.99 6 55 C4.35 \
-55 2.7 55 1 55 C\
-0.67 55.99 0.34 \
-56.98 0 58 C-0.6\
-6 58 -1.32 58 -2\
- 58 C-2.33 58.99\
- -2.66 59.98 -3 \
-61 C-4.65 61 -6.\
-3 61 -8 61 C-8 6\
-1.99 -8 62.98 -8\
- 64 C-8.99 64 -9\
-.98 64 -11 64 C-\
-11 64.99 -11 65.\
-98 -11 67 C-11.9\
-9 67 -12.98 67 -\
-14 67 C-14 67.99\
- -14 68.98 -14 7\
-0 C-15.98 70 -17\
-.96 70 -20 70 C-\
-20 70.99 -20 71.\
-98 -20 73 C-20.9\
-9 73 -21.98 73 -\
-23 73 C-23 73.99\
- -23 74.98 -23 7\
-6 C-23.61875 76.\
-45375 -24.2375 7\
-6.9075 -24.875 7\
-7.375 C-27.42770\
-09 79.32706539 -\
-28.02345207 80.9\
-8897721 -29 84 C\
--29.66 84 -30.32\
- 84 -31 84 C-31.\
-495 85.485 -31.4\
-95 85.485 -32 87\
- C-32.66 87 -33.\
-32 87 -34 87 C-3\
-4 88.65 -34 90.3\
- -34 92 C-34.99 \
-92.33 -35.98 92.\
-66 -37 93 C-37 9\
-3.99 -37 94.98 -\
-37 96 C-37.99 96\
- -38.98 96 -40 9\
-6 C-40 98.64 -40\
- 101.28 -40 104 \
-C-40.99 104.495 \
--40.99 104.495 -\
-42 105 C-42.4695\
-4261 108.0458126\
-9 -42.46954261 1\
-08.04581269 -42.\
-625 111.5625 C-4\
-2.69976562 112.7\
-6003906 -42.7745\
-3125 113.9575781\
-2 -42.8515625 11\
-5.19140625 C-42.\
-90054688 116.118\
-24219 -42.949531\
-25 117.04507813 \
--43 118 C-42.01 \
-118 -41.02 118 -\
-40 118 C-40 120.\
-97 -40 123.94 -4\
-0 127 C-39.01 12\
-7 -38.02 127 -37\
- 127 C-37 128.65\
- -37 130.3 -37 1\
-32 C-36.01 132.3\
-3 -35.02 132.66 \
--34 133 C-33.627\
-8958 134.3230371\
-7 -33.29369827 1\
-35.65737935 -33 \
-137 C-32.34 137.\
-33 -31.68 137.66\
- -31 138 C-31 13\
-8.99 -31 139.98 \
--31 141 C-30.01 \
-141.33 -29.02 14\
-1.66 -28 142 C-2\
-8 142.66 -28 143\
-.32 -28 144 C-27\
-.34 144 -26.68 1\
-44 -26 144 C-24.\
-375 145.3125 -24\
-.375 145.3125 -2\
-3 147 C-23 147.9\
-9 -23 148.98 -23\
- 150 C-22.01 150\
- -21.02 150 -20 \
-150 C-20 150.99 \
--20 151.98 -20 1\
-53 C-19.01 153 -\
-18.02 153 -17 15\
-3 C-17 153.99 -1\
-7 154.98 -17 156\
- C-16.01 156 -15\
-.02 156 -14 156 \
-C-14 156.66 -14 \
-157.32 -14 158 C\
--13.319375 158.2\
-475 -12.63875 15\
-8.495 -11.9375 1\
-58.75 C-2.648648\
-65 162.7027027 -\
-2.64864865 162.7\
-027027 -1 166 C1\
-.02463255 166.65\
-213292 1.0246325\
-5 166.65213292 3\
- 167 C3 167.99 3\
- 168.98 3 170 C4\
-.98 170 6.96 170\
- 9 170 C9 170.99\
- 9 171.98 9 173 \
-C9.99 173 10.98 \
-173 12 173 C12 1\
-73.99 12 174.98 \
-12 176 C13.98 17\
-6 15.96 176 18 1\
-76 C18 176.99 18\
- 177.98 18 179 C\
-19.98 179 21.96 \
-179 24 179 C24.3\
-3 179.66 24.66 1\
-80.32 25 181 C27\
-.32156597 181.40\
-729228 29.656878\
-7 181.74438677 3\
-2 182 C32 182.66\
- 32 183.32 32 18\
-4 C32.72316406 1\
-83.96261719 33.4\
-4632812 183.9252\
-3438 34.19140625\
- 183.88671875 C3\
-7.20064779 184.0\
-0809289 39.17487\
-371 184.64722161\
- 41.9375 185.812\
-5 C42.79988281 1\
-86.17472656 43.6\
-6226563 186.5369\
-5312 44.55078125\
- 186.91015625 C4\
-7.42101269 188.1\
-8734058 50.22023\
-44 189.53696547 \
-53 191 C53 191.6\
-6 53 192.32 53 1\
-93 C56.63 193 60\
-.26 193 64 193 C\
-64 193.99 64 194\
-.98 64 196 C66.9\
-7 196 69.94 196 \
-73 196 C73.33 19\
-6.66 73.66 197.3\
-2 74 198 C76.355\
-99235 198.467517\
-88 76.35599235 1\
-98.46751788 79.0\
-625 198.625 C79.\
-98160156 198.699\
-76562 80.9007031\
-3 198.77453125 8\
-1.84765625 198.8\
-515625 C82.91306\
-641 198.92503906\
- 82.91306641 198\
-.92503906 84 199\
- C84 199.99 84 2\
-00.98 84 202 C84\
-.85464844 201.98\
-839844 85.709296\
-88 201.97679687 \
-86.58984375 201.\
-96484375 C87.694\
-57031 201.955820\
-31 88.79929688 2\
-01.94679688 89.9\
-375 201.9375 C91\
-.03964844 201.92\
-589844 92.141796\
-88 201.91429687 \
-93.27734375 201.\
-90234375 C96 202\
- 96 202 97 203 C\
-97.33 202.01 97.\
-66 201.02 98 200\
- C97.01 199.67 9\
-6.02 199.34 95 1\
-99 C95 197.35 95\
- 195.7 95 194 C9\
-4.01 194 93.02 1\
-94 92 194 C92 19\
-2.02 92 190.04 9\
-2 188 C91.01 187\
-.67 90.02 187.34\
- 89 187 C89 183.\
-7 89 180.4 89 17\
-7 C89.99 176.67 \
-90.98 176.34 92 \
-176 C92 173.03 9\
-2 170.06 92 167 \
-C92.99 167 93.98\
- 167 95 167 C94.\
-92652344 166.243\
-32031 94.8530468\
-7 165.48664063 9\
-4.77734375 164.7\
-0703125 C95 162 \
-95 162 96.378906\
-25 160.19921875 \
-C102.90449056 15\
-5.68150653 109.1\
-109302 155.45012\
-651 116.8125 155\
-.4375 C117.82707\
-275 155.43516357\
- 118.84164551 15\
-5.43282715 119.8\
-8696289 155.4304\
-1992 C129.191839\
-72 155.6379149 1\
-29.19183972 155.\
-6379149 133 159 \
-C133 159.66 133 \
-160.32 133 161 C\
-133.99 161 134.9\
-8 161 136 161 C1\
-36 161.99 136 16\
-2.98 136 164 C13\
-6.99 164 137.98 \
-164 139 164 C139\
-.103125 164.7837\
-5 139.20625 165.\
-5675 139.3125 16\
-6.375 C139.77595\
-022 169.33045181\
- 139.77595022 16\
-9.33045181 143 1\
-71 C143.1875 173\
-.625 143.1875 17\
-3.625 143 176 C1\
-43.99 176 144.98\
- 176 146 176 C14\
-6 176.99 146 177\
-.98 146 179 C146\
-.99 179.33 147.9\
-8 179.66 149 180\
- C149.12375 180.\
-5775 149.2475 18\
-1.155 149.375 18\
-1.75 C149.881112\
-75 184.30311236 \
-149.88111275 184\
-.30311236 152.56\
-25 186.5 C155 18\
-9 155 189 155 19\
-3 C155.66 193 15\
-6.32 193 157 193\
- C159.29013653 1\
-96.4352048 159.1\
-7842973 197.9853\
-31 159 202 C159.\
-99 202 160.98 20\
-2 162 202 C162 2\
-03.98 162 205.96\
- 162 208 C163.32\
- 208 164.64 208 \
-166 208 C166 208\
-.99 166 209.98 1\
-66 211 C166.99 2\
-11.33 167.98 211\
-.66 169 212 C169\
- 213.32 169 214.\
-64 169 216 C169.\
-99 216.33 170.98\
- 216.66 172 217 \
-C172 217.66 172 \
-218.32 172 219 C\
-172.99 219.33 17\
-3.98 219.66 175 \
-220 C175 221.65 \
-175 223.3 175 22\
-5 C175.99 225.33\
- 176.98 225.66 1\
-78 226 C178 233.\
-26 178 240.52 17\
-8 248 C177.01 24\
-8.33 176.02 248.\
-66 175 249 C175 \
-250.65 175 252.3\
- 175 254 C174.01\
- 254.33 173.02 2\
-54.66 172 255 C1\
-71.67 255.99 171\
-.34 256.98 171 2\
-58 C166.10204082\
- 262.89795918 16\
-6.10204082 262.8\
-9795918 161.625 \
-263.3125 C160.75\
-875 263.209375 1\
-59.8925 263.1062\
-5 159 263 C158.6\
-7 264.65 158.34 \
-266.3 158 268 C1\
-57.01 268.33 156\
-.02 268.66 155 2\
-69 C154.67 269.9\
-9 154.34 270.98 \
-154 272 C153.34 \
-272 152.68 272 1\
-52 272 C151.67 2\
-72.99 151.34 273\
-.98 151 275 C149\
-.35 275 147.7 27\
-5 146 275 C146 2\
-75.99 146 276.98\
- 146 278 C145.01\
- 278 144.02 278 \
-143 278 C142.67 \
-278.99 142.34 27\
-9.98 142 281 C14\
-1.01 281 140.02 \
-281 139 281 C139\
- 281.99 139 282.\
-98 139 284 C138.\
-01 284 137.02 28\
-4 136 284 C136 2\
-84.99 136 285.98\
- 136 287 C133.69\
- 287.66 131.38 2\
-88.32 129 289 C1\
-29 289.99 129 29\
-0.98 129 292 C12\
-8.01 292 127.02 \
-292 126 292 C125\
-.67 292.99 125.3\
-4 293.98 125 295\
- C124.34 295 123\
-.68 295 123 295 \
-C122.67 295.99 1\
-22.34 296.98 122\
- 298 C121.195625\
- 298.12375 120.3\
-9125 298.2475 11\
-9.5625 298.375 C\
-118.2940625 298.\
-684375 118.29406\
-25 298.684375 11\
-7 299 C116.67 29\
-9.66 116.34 300.\
-32 116 301 C111.\
-12328151 302.625\
-57283 106.106185\
-97 302.18452437 \
-101 302.1875 C99\
-.89398438 302.19\
-974609 98.787968\
-75 302.21199219 \
-97.6484375 302.2\
-2460938 C96.5888\
-2812 302.2265429\
-7 95.52921875 30\
-2.22847656 94.43\
-75 302.23046875 \
-C93.46683594 302\
-.23457764 92.496\
-17187 302.238686\
-52 91.49609375 3\
-02.24291992 C89 \
-302 89 302 86 30\
-0 C86 299.34 86 \
-298.68 86 298 C8\
-5.01 298 84.02 2\
-98 83 298 C83 29\
-7.01 83 296.02 8\
-3 295 C82.01 294\
-.67 81.02 294.34\
- 80 294 C77.7908\
-6 290.68629 77.7\
-7518447 289.6553\
-979 77.875 285.8\
-125 C77.89304688\
- 284.91144531 77\
-.91109375 284.01\
-039063 77.929687\
-5 283.08203125 C\
-77.95289063 282.\
-39496094 77.9760\
-9375 281.7078906\
-3 78 281 C77.01 \
-280.67 76.02 280\
-.34 75 280 C75 2\
-78.35 75 276.7 7\
-5 275 C75.99 274\
-.67 76.98 274.34\
- 78 274 C77.9381\
-25 272.741875 77\
-.87625 271.48375\
- 77.8125 270.187\
-5 C77.80558899 2\
-66.28277965 77.8\
-0558899 266.2827\
-7965 79.375 264 \
-C81 263 81 263 8\
-3 263 C83.33 261\
-.02 83.66 259.04\
- 84 257 C85.65 2\
-57 87.3 257 89 2\
-57 C89 256.34 89\
- 255.68 89 255 C\
-86.69 255 84.38 \
-255 82 255 C81.6\
-7 254.01 81.34 2\
-53.02 81 252 C77\
-.37 252 73.74 25\
-2 70 252 C69.67 \
-251.01 69.34 250\
-.02 69 249 C65.3\
-7 249 61.74 249 \
-58 249 C57.67 24\
-8.34 57.34 247.6\
-8 57 247 C54.644\
-00765 246.532482\
-12 54.64400765 2\
-46.53248212 51.9\
-375 246.375 C51.\
-01839844 246.300\
-23438 50.0992968\
-7 246.22546875 4\
-9.15234375 246.1\
-484375 C48.08693\
-359 246.07496094\
- 48.08693359 246\
-.07496094 47 246\
- C46.67 245.01 4\
-6.34 244.02 46 2\
-43 C43.36 243 40\
-.72 243 38 243 C\
-37.67 242.01 37.\
-34 241.02 37 240\
- C34.36 240 31.7\
-2 240 29 240 C29\
- 239.01 29 238.0\
-2 29 237 C27.02 \
-237 25.04 237 23\
- 237 C23 236.34 \
-23 235.68 23 235\
- C21.88625 235.0\
-20625 20.7725 23\
-5.04125 19.625 2\
-35.0625 C16 235 \
-16 235 14 234 C1\
-4 233.34 14 232.\
-68 14 232 C12.88\
-625 232.04125 11\
-.7725 232.0825 1\
-0.625 232.125 C7\
- 232 7 232 5 230\
- C3.35008418 229\
-.29289322 1.6843\
-7744 228.6205601\
-1 0 228 C0 227.3\
-4 0 226.68 0 226\
- C-1.65 226 -3.3\
- 226 -5 226 C-5.\
-33 225.01 -5.66 \
-224.02 -6 223 C-\
-7.65 223 -9.3 22\
-3 -11 223 C-11.3\
-3 222.01 -11.66 \
-221.02 -12 220 C\
--13.65 220 -15.3\
- 220 -17 220 C-1\
-7.33 219.01 -17.\
-66 218.02 -18 21\
-7 C-18.763125 21\
-7.061875 -19.526\
-25 217.12375 -20\
-.3125 217.1875 C\
--23 217 -23 217 \
--24.8125 215.687\
-5 C-26 214 -26 2\
-14 -26 211 C-27.\
-98 211 -29.96 21\
-1 -32 211 C-32 2\
-10.34 -32 209.68\
- -32 209 C-32.99\
- 208.67 -33.98 2\
-08.34 -35 208 C-\
-35 207.34 -35 20\
-6.68 -35 206 C-3\
-6.98 205.67 -38.\
-96 205.34 -41 20\
-5 C-41 204.34 -4\
-1 203.68 -41 203\
- C-41.99 202.67 \
--42.98 202.34 -4\
-4 202 C-44 201.3\
-4 -44 200.68 -44\
- 200 C-44.99 200\
- -45.98 200 -47 \
-200 C-47 199.01 \
--47 198.02 -47 1\
-97 C-48.65 197 -\
-50.3 197 -52 197\
- C-52 196.01 -52\
- 195.02 -52 194 \
-C-52.99 194 -53.\
-98 194 -55 194 C\
--55 193.01 -55 1\
-92.02 -55 191 C-\
-55.99 191 -56.98\
- 191 -58 191 C-5\
-8 190.01 -58 189\
-.02 -58 188 C-58\
-.99 188 -59.98 1\
-88 -61 188 C-61 \
-187.01 -61 186.0\
-2 -61 185 C-61.9\
-9 185 -62.98 185\
- -64 185 C-64 18\
-4.01 -64 183.02 \
--64 182 C-64.618\
-75 181.690625 -6\
-5.2375 181.38125\
- -65.875 181.062\
-5 C-67.25 180.37\
-5 -68.625 179.68\
-75 -70 179 C-70 \
-177.35 -70 175.7\
- -70 174 C-70.99\
- 174 -71.98 174 \
--73 174 C-73 173\
-.01 -73 172.02 -\
-73 171 C-73.66 1\
-71 -74.32 171 -7\
-5 171 C-76.625 1\
-69.875 -76.625 1\
-69.875 -78 168 C\
--78.1875 164.812\
-5 -78.1875 164.8\
-125 -78 162 C-78\
-.99 162 -79.98 1\
-62 -81 162 C-81.\
-185625 160.79343\
-75 -81.185625 16\
-0.7934375 -81.37\
-5 159.5625 C-81.\
-58125 158.716875\
- -81.7875 157.87\
-125 -82 157 C-82\
-.66 156.67 -83.3\
-2 156.34 -84 156\
- C-84 154.35 -84\
- 152.7 -84 151 C\
--84.99 151 -85.9\
-8 151 -87 151 C-\
-87 149.02 -87 14\
-7.04 -87 145 C-8\
-7.99 144.67 -88.\
-98 144.34 -90 14\
-4 C-90.89783896 \
-137.86848211 -91\
-.14656131 131.91\
-865638 -91.13281\
-25 125.7265625 C\
--91.13376923 124\
-.76277679 -91.13\
-472595 123.79899\
-109 -91.13571167\
- 122.80599976 C-\
-91.13638889 120.\
-77724136 -91.134\
-56674 118.748480\
-74 -91.13037109 \
-116.71972656 C-9\
-1.12502816 113.6\
-4122564 -91.1303\
-2571 110.5628713\
-7 -91.13671875 1\
-07.484375 C-91.1\
-3605766 105.5026\
-0385 -91.1347758\
-6 103.52083279 -\
-91.1328125 101.5\
-390625 C-91.1348\
-3673 100.6314517\
-2 -91.13686096 9\
-9.72384094 -91.1\
-3894653 98.78872\
-681 C-91.0932486\
-1 86.11288295 -9\
-1.09324861 86.11\
-288295 -90 81 C-\
-89.01 80.505 -89\
-.01 80.505 -88 8\
-0 C-87.34444881 \
-77.47266765 -87.\
-34444881 77.4726\
-6765 -87 75 C-86\
-.01 75 -85.02 75\
- -84 75 C-84 73.\
-02 -84 71.04 -84\
- 69 C-83.01 69 -\
-82.02 69 -81 69 \
-C-81 67.02 -81 6\
-5.04 -81 63 C-79\
-.515 62.505 -79.\
-515 62.505 -78 6\
-2 C-77.87625 61.\
-236875 -77.7525 \
-60.47375 -77.625\
- 59.6875 C-77 57\
- -77 57 -75 54 C\
--74.34 54 -73.68\
- 54 -73 54 C-73 \
-53.34 -73 52.68 \
--73 52 C-72.01 5\
-2 -71.02 52 -70 \
-52 C-70 50.02 -7\
-0 48.04 -70 46 C\
--69.01 46 -68.02\
- 46 -67 46 C-67 \
-45.01 -67 44.02 \
--67 43 C-66.01 4\
-3 -65.02 43 -64 \
-43 C-64 42.01 -6\
-4 41.02 -64 40 C\
--62.125 37.8125 \
--62.125 37.8125 \
--60 36 C-59.34 3\
-6 -58.68 36 -58 \
-36 C-57.67 35.01\
- -57.34 34.02 -5\
-7 33 C-53.244137\
-57 29.47229743 -\
-49.29540989 26.3\
-3096312 -44 26 C\
--44 25.01 -44 24\
-.02 -44 23 C-43.\
-01 23 -42.02 23 \
--41 23 C-41 22.0\
-1 -41 21.02 -41 \
-20 C-39.02 20 -3\
-7.04 20 -35 20 C\
--34.67 18.68 -34\
-.34 17.36 -34 16\
- C-33.34 16 -32.\
-68 16 -32 16 C-3\
-2 15.34 -32 14.6\
-8 -32 14 C-30.02\
- 13.67 -28.04 13\
-.34 -26 13 C-25.\
-67 12.01 -25.34 \
-11.02 -25 10 C-2\
-4.34 10 -23.68 1\
-0 -23 10 C-23 9.\
-34 -23 8.68 -23 \
-8 C-20.29810266 \
-6.65206012 -17.5\
-8972669 5.321643\
-26 -14.875 4 C-1\
-3.73417969 3.427\
-65625 -13.734179\
-69 3.42765625 -1\
-2.5703125 2.8437\
-5 C-8.23347738 0\
-.75010546 -4.935\
-19955 -0.6149781\
-4 0 0 Z \x22 fill=\x22\
-#000000\x22 transfo\
-rm=\x22translate(97\
-,202)\x22/>\x0d\x0a<path \
-d=\x22M0 0 C4.96223\
-797 0.05003937 7\
-.88316089 0.4343\
-4468 12.01171875\
- 3.3984375 C13.4\
-3918671 4.147053\
-22 14.87750506 4\
-.87522675 16.324\
-21875 5.5859375 \
-C17.37029297 6.1\
-0220703 17.37029\
-297 6.10220703 1\
-8.4375 6.6289062\
-5 C18.95699219 6\
-.88285156 19.476\
-48438 7.13679687\
- 20.01171875 7.3\
-984375 C20.01171\
-875 8.0584375 20\
-.01171875 8.7184\
-375 20.01171875 \
-9.3984375 C21.00\
-171875 9.7284375\
- 21.99171875 10.\
-0584375 23.01171\
-875 10.3984375 C\
-23.01171875 11.0\
-584375 23.011718\
-75 11.7184375 23\
-.01171875 12.398\
-4375 C24.9917187\
-5 12.7284375 26.\
-97171875 13.0584\
-375 29.01171875 \
-13.3984375 C29.0\
-1171875 14.05843\
-75 29.01171875 1\
-4.7184375 29.011\
-71875 15.3984375\
- C30.00171875 15\
-.7284375 30.9917\
-1875 16.0584375 \
-32.01171875 16.3\
-984375 C32.01171\
-875 17.3884375 3\
-2.01171875 18.37\
-84375 32.0117187\
-5 19.3984375 C33\
-.99171875 19.398\
-4375 35.97171875\
- 19.3984375 38.0\
-1171875 19.39843\
-75 C38.01171875 \
-20.3884375 38.01\
-171875 21.378437\
-5 38.01171875 22\
-.3984375 C39.001\
-71875 22.3984375\
- 39.99171875 22.\
-3984375 41.01171\
-875 22.3984375 C\
-41.01171875 23.3\
-884375 41.011718\
-75 24.3784375 41\
-.01171875 25.398\
-4375 C41.5634375\
- 25.49253906 42.\
-11515625 25.5866\
-4063 42.68359375\
- 25.68359375 C45\
-.6357744 26.5900\
-519 47.73893219 \
-28.06187268 50.2\
-6171875 29.83593\
-75 C51.15375 30.\
-45339844 52.0457\
-8125 31.07085937\
- 52.96484375 31.\
-70703125 C53.978\
-04688 32.5442773\
-4 53.97804688 32\
-.54427734 55.011\
-71875 33.3984375\
- C55.01171875 34\
-.0584375 55.0117\
-1875 34.7184375 \
-55.01171875 35.3\
-984375 C56.00171\
-875 35.7284375 5\
-6.99171875 36.05\
-84375 58.0117187\
-5 36.3984375 C59\
-.69921875 37.773\
-4375 59.69921875\
- 37.7734375 61.0\
-1171875 39.39843\
-75 C61.01171875 \
-40.3884375 61.01\
-171875 41.378437\
-5 61.01171875 42\
-.3984375 C62.001\
-71875 42.3984375\
- 62.99171875 42.\
-3984375 64.01171\
-875 42.3984375 C\
-64.01171875 43.3\
-884375 64.011718\
-75 44.3784375 64\
-.01171875 45.398\
-4375 C65.0017187\
-5 45.3984375 65.\
-99171875 45.3984\
-375 67.01171875 \
-45.3984375 C67.0\
-1171875 47.37843\
-75 67.01171875 4\
-9.3584375 67.011\
-71875 51.3984375\
- C68.00171875 51\
-.3984375 68.9917\
-1875 51.3984375 \
-70.01171875 51.3\
-984375 C70.01171\
-875 52.0584375 7\
-0.01171875 52.71\
-84375 70.0117187\
-5 53.3984375 C71\
-.00171875 53.728\
-4375 71.99171875\
- 54.0584375 73.0\
-1171875 54.39843\
-75 C75.01171875 \
-57.3984375 75.01\
-171875 57.398437\
-5 75.01171875 61\
-.3984375 C76.001\
-71875 61.7284375\
- 76.99171875 62.\
-0584375 78.01171\
-875 62.3984375 C\
-78.01171875 64.3\
-784375 78.011718\
-75 66.3584375 78\
-.01171875 68.398\
-4375 C79.0017187\
-5 68.3984375 79.\
-99171875 68.3984\
-375 81.01171875 \
-68.3984375 C81.0\
-1171875 70.37843\
-75 81.01171875 7\
-2.3584375 81.011\
-71875 74.3984375\
- C82.00171875 74\
-.3984375 82.9917\
-1875 74.3984375 \
-84.01171875 74.3\
-984375 C84.01171\
-875 76.0484375 8\
-4.01171875 77.69\
-84375 84.0117187\
-5 79.3984375 C85\
-.00171875 79.728\
-4375 85.99171875\
- 80.0584375 87.0\
-1171875 80.39843\
-75 C88.22778282 \
-89.9607454 88.16\
-43865 99.5209651\
- 88.14208984 109\
-.14111328 C88.13\
-673069 111.89230\
-866 88.14206106 \
-114.64334083 88.\
-1484375 117.3945\
-3125 C88.1513922\
-4 126.10746219 8\
-8.11300402 134.7\
-3867272 87.01171\
-875 143.3984375 \
-C86.02171875 143\
-.7284375 85.0317\
-1875 144.0584375\
- 84.01171875 144\
-.3984375 C84.011\
-71875 146.378437\
-5 84.01171875 14\
-8.3584375 84.011\
-71875 150.398437\
-5 C83.02171875 1\
-50.3984375 82.03\
-171875 150.39843\
-75 81.01171875 1\
-50.3984375 C81.0\
-1171875 152.0484\
-375 81.01171875 \
-153.6984375 81.0\
-1171875 155.3984\
-375 C80.35171875\
- 155.7284375 79.\
-69171875 156.058\
-4375 79.01171875\
- 156.3984375 C78\
-.35616756 158.92\
-576985 78.356167\
-56 158.92576985 \
-78.01171875 161.\
-3984375 C77.0217\
-1875 161.3984375\
- 76.03171875 161\
-.3984375 75.0117\
-1875 161.3984375\
- C75.01171875 16\
-2.3884375 75.011\
-71875 163.378437\
-5 75.01171875 16\
-4.3984375 C74.35\
-171875 164.39843\
-75 73.69171875 1\
-64.3984375 73.01\
-171875 164.39843\
-75 C73.01171875 \
-166.0484375 73.0\
-1171875 167.6984\
-375 73.01171875 \
-169.3984375 C72.\
-02171875 169.728\
-4375 71.03171875\
- 170.0584375 70.\
-01171875 170.398\
-4375 C70.0117187\
-5 171.3884375 70\
-.01171875 172.37\
-84375 70.0117187\
-5 173.3984375 C6\
-9.02171875 173.3\
-984375 68.031718\
-75 173.3984375 6\
-7.01171875 173.3\
-984375 C67.01171\
-875 174.3884375 \
-67.01171875 175.\
-3784375 67.01171\
-875 176.3984375 \
-C66.02171875 176\
-.3984375 65.0317\
-1875 176.3984375\
- 64.01171875 176\
-.3984375 C64.011\
-71875 177.388437\
-5 64.01171875 17\
-8.3784375 64.011\
-71875 179.398437\
-5 C63.02171875 1\
-79.3984375 62.03\
-171875 179.39843\
-75 61.01171875 1\
-79.3984375 C60.6\
-8171875 180.3884\
-375 60.35171875 \
-181.3784375 60.0\
-1171875 182.3984\
-375 C59.35171875\
- 182.3984375 58.\
-69171875 182.398\
-4375 58.01171875\
- 182.3984375 C58\
-.01171875 183.05\
-84375 58.0117187\
-5 183.7184375 58\
-.01171875 184.39\
-84375 C57.021718\
-75 184.3984375 5\
-6.03171875 184.3\
-984375 55.011718\
-75 184.3984375 C\
-55.01171875 185.\
-3884375 55.01171\
-875 186.3784375 \
-55.01171875 187.\
-3984375 C54.0217\
-1875 187.3984375\
- 53.03171875 187\
-.3984375 52.0117\
-1875 187.3984375\
- C52.01171875 18\
-8.3884375 52.011\
-71875 189.378437\
-5 52.01171875 19\
-0.3984375 C51.02\
-171875 190.39843\
-75 50.03171875 1\
-90.3984375 49.01\
-171875 190.39843\
-75 C49.01171875 \
-191.3884375 49.0\
-1171875 192.3784\
-375 49.01171875 \
-193.3984375 C48.\
-35171875 193.398\
-4375 47.69171875\
- 193.3984375 47.\
-01171875 193.398\
-4375 C46.6817187\
-5 194.3884375 46\
-.35171875 195.37\
-84375 46.0117187\
-5 196.3984375 C4\
-5.35171875 196.3\
-984375 44.691718\
-75 196.3984375 4\
-4.01171875 196.3\
-984375 C43.68171\
-875 197.3884375 \
-43.35171875 198.\
-3784375 43.01171\
-875 199.3984375 \
-C42.35171875 199\
-.3984375 41.6917\
-1875 199.3984375\
- 41.01171875 199\
-.3984375 C40.681\
-71875 200.388437\
-5 40.35171875 20\
-1.3784375 40.011\
-71875 202.398437\
-5 C38.36171875 2\
-02.3984375 36.71\
-171875 202.39843\
-75 35.01171875 2\
-02.3984375 C35.0\
-1171875 203.3884\
-375 35.01171875 \
-204.3784375 35.0\
-1171875 205.3984\
-375 C34.02171875\
- 205.3984375 33.\
-03171875 205.398\
-4375 32.01171875\
- 205.3984375 C31\
-.68171875 206.38\
-84375 31.3517187\
-5 207.3784375 31\
-.01171875 208.39\
-84375 C29.361718\
-75 208.3984375 2\
-7.71171875 208.3\
-984375 26.011718\
-75 208.3984375 C\
-26.01171875 209.\
-0584375 26.01171\
-875 209.7184375 \
-26.01171875 210.\
-3984375 C25.0217\
-1875 210.3984375\
- 24.03171875 210\
-.3984375 23.0117\
-1875 210.3984375\
- C23.01171875 21\
-1.3884375 23.011\
-71875 212.378437\
-5 23.01171875 21\
-3.3984375 C21.36\
-171875 213.39843\
-75 19.71171875 2\
-13.3984375 18.01\
-171875 213.39843\
-75 C17.68171875 \
-214.3884375 17.3\
-5171875 215.3784\
-375 17.01171875 \
-216.3984375 C15.\
-36171875 216.398\
-4375 13.71171875\
- 216.3984375 12.\
-01171875 216.398\
-4375 C12.0117187\
-5 217.3884375 12\
-.01171875 218.37\
-84375 12.0117187\
-5 219.3984375 C1\
-0.03171875 219.3\
-984375 8.0517187\
-5 219.3984375 6.\
-01171875 219.398\
-4375 C6.01171875\
- 220.3884375 6.0\
-1171875 221.3784\
-375 6.01171875 2\
-22.3984375 C4.03\
-171875 222.39843\
-75 2.05171875 22\
-2.3984375 0.0117\
-1875 222.3984375\
- C0.01171875 223\
-.3884375 0.01171\
-875 224.3784375 \
-0.01171875 225.3\
-984375 C-1.63828\
-125 225.3984375 \
--3.28828125 225.\
-3984375 -4.98828\
-125 225.3984375 \
-C-5.31828125 226\
-.3884375 -5.6482\
-8125 227.3784375\
- -5.98828125 228\
-.3984375 C-7.638\
-28125 228.398437\
-5 -9.28828125 22\
-8.3984375 -10.98\
-828125 228.39843\
-75 C-11.31828125\
- 229.3884375 -11\
-.64828125 230.37\
-84375 -11.988281\
-25 231.3984375 C\
--13.63828125 231\
-.3984375 -15.288\
-28125 231.398437\
-5 -16.98828125 2\
-31.3984375 C-16.\
-98828125 232.058\
-4375 -16.9882812\
-5 232.7184375 -1\
-6.98828125 233.3\
-984375 C-19.9449\
-2644 234.8767601\
- -22.73057862 23\
-4.45876533 -25.9\
-8828125 234.3984\
-375 C-25.9882812\
-5 235.0584375 -2\
-5.98828125 235.7\
-184375 -25.98828\
-125 236.3984375 \
-C-28.62828125 23\
-6.3984375 -31.26\
-828125 236.39843\
-75 -33.98828125 \
-236.3984375 C-33\
-.98828125 237.38\
-84375 -33.988281\
-25 238.3784375 -\
-33.98828125 239.\
-3984375 C-36.958\
-28125 239.398437\
-5 -39.92828125 2\
-39.3984375 -42.9\
-8828125 239.3984\
-375 C-42.9882812\
-5 240.3884375 -4\
-2.98828125 241.3\
-784375 -42.98828\
-125 242.3984375 \
-C-45.95828125 24\
-2.3984375 -48.92\
-828125 242.39843\
-75 -51.98828125 \
-242.3984375 C-51\
-.98828125 243.38\
-84375 -51.988281\
-25 244.3784375 -\
-51.98828125 245.\
-3984375 C-55.064\
-45312 245.691406\
-25 -55.06445312 \
-245.69140625 -58\
-.140625 245.9843\
-75 C-58.75035156\
- 246.12101563 -5\
-9.36007812 246.2\
-5765625 -59.9882\
-8125 246.3984375\
- C-60.31828125 2\
-47.0584375 -60.6\
-4828125 247.7184\
-375 -60.98828125\
- 248.3984375 C-6\
-4.61828125 248.3\
-984375 -68.24828\
-125 248.3984375 \
--71.98828125 248\
-.3984375 C-71.98\
-828125 249.38843\
-75 -71.98828125 \
-250.3784375 -71.\
-98828125 251.398\
-4375 C-76.608281\
-25 251.3984375 -\
-81.22828125 251.\
-3984375 -85.9882\
-8125 251.3984375\
- C-86.31828125 2\
-52.3884375 -86.6\
-4828125 253.3784\
-375 -86.98828125\
- 254.3984375 C-9\
-1.60828125 254.3\
-984375 -96.22828\
-125 254.3984375 \
--100.98828125 25\
-4.3984375 C-101.\
-31828125 255.388\
-4375 -101.648281\
-25 256.3784375 -\
-101.98828125 257\
-.3984375 C-107.2\
-6828125 257.3984\
-375 -112.5482812\
-5 257.3984375 -1\
-17.98828125 257.\
-3984375 C-117.98\
-828125 258.05843\
-75 -117.98828125\
- 258.7184375 -11\
-7.98828125 259.3\
-984375 C-120.281\
-19949 260.544896\
-62 -121.75278484\
- 260.58047176 -1\
-24.3046875 260.6\
-796875 C-125.150\
-95703 260.717070\
-31 -125.99722656\
- 260.75445312 -1\
-26.86914062 260.\
-79296875 C-128.6\
-6080127 260.8634\
-3465 -130.452467\
-97 260.93374648 \
--132.24414062 26\
-1.00390625 C-133\
-.08912109 261.04\
-128906 -133.9341\
-0156 261.0786718\
-7 -134.8046875 2\
-61.1171875 C-135\
-.58271729 261.14\
-748047 -136.3607\
-4707 261.1777734\
-4 -137.16235352 \
-261.20898438 C-1\
-39.00638208 261.\
-20641986 -139.00\
-638208 261.20641\
-986 -139.9882812\
-5 262.3984375 C-\
-141.3681316 262.\
-50680512 -142.75\
-340514 262.54744\
-062 -144.1374511\
-7 262.55957031 C\
--145.01894333 26\
-2.56917786 -145.\
-90043549 262.578\
-7854 -146.808639\
-53 262.58868408 \
-C-147.76897598 2\
-62.59293396 -148\
-.72931244 262.59\
-718384 -149.7187\
-5 262.6015625 C-\
-150.70192703 262\
-.60726257 -151.6\
-8510406 262.6129\
-6265 -152.698074\
-34 262.61883545 \
-C-154.78544025 2\
-62.62830416 -156\
-.87282123 262.63\
-482682 -158.9602\
-0508 262.6386718\
-8 C-162.14496299\
- 262.64834391 -1\
-65.32906654 262.\
-67933587 -168.51\
-367188 262.71093\
-75 C-170.5403607\
-5 262.71747065 -\
-172.56705424 262\
-.72271989 -174.5\
-9375 262.7265625\
- C-176.01907295 \
-262.7450827 -176\
-.01907295 262.74\
-50827 -177.47319\
-031 262.76397705\
- C-182.76112767 \
-262.74629015 -18\
-6.3776514 262.30\
-073488 -190.9882\
-8125 259.3984375\
- C-190.98828125 \
-258.7384375 -190\
-.98828125 258.07\
-84375 -190.98828\
-125 257.3984375 \
-C-191.97828125 2\
-57.3984375 -192.\
-96828125 257.398\
-4375 -193.988281\
-25 257.3984375 C\
--194.31828125 25\
-5.4184375 -194.6\
-4828125 253.4384\
-375 -194.9882812\
-5 251.3984375 C-\
-195.97828125 251\
-.0684375 -196.96\
-828125 250.73843\
-75 -197.98828125\
- 250.3984375 C-1\
-97.98828125 242.\
-1484375 -197.988\
-28125 233.898437\
-5 -197.98828125 \
-225.3984375 C-19\
-6.99828125 225.0\
-684375 -196.0082\
-8125 224.7384375\
- -194.98828125 2\
-24.3984375 C-194\
-.98828125 223.40\
-84375 -194.98828\
-125 222.4184375 \
--194.98828125 22\
-1.3984375 C-193.\
-99828125 221.398\
-4375 -193.008281\
-25 221.3984375 -\
-191.98828125 221\
-.3984375 C-191.6\
-5828125 220.4084\
-375 -191.3282812\
-5 219.4184375 -1\
-90.98828125 218.\
-3984375 C-189.99\
-828125 218.39843\
-75 -189.00828125\
- 218.3984375 -18\
-7.98828125 218.3\
-984375 C-187.988\
-28125 217.408437\
-5 -187.98828125 \
-216.4184375 -187\
-.98828125 215.39\
-84375 C-181.1421\
-2506 212.4940076\
- -174.80195976 2\
-11.10475823 -167\
-.42578125 210.83\
-59375 C-161.7096\
-3397 210.6083401\
-9 -161.70963397 \
-210.60834019 -15\
-6.0390625 209.90\
-234375 C-151.147\
-17884 209.094337\
-36 -146.21770307\
- 209.00436217 -1\
-41.26953125 208.\
-79296875 C-136.9\
-9286574 208.7006\
-037 -136.9928657\
-4 208.7006037 -1\
-32.98828125 207.\
-3984375 C-130.10\
-457792 207.32648\
-881 -127.2458846\
-1 207.30552042 -\
-124.36328125 207\
-.3359375 C-123.1\
-6058594 207.3427\
-0508 -123.160585\
-94 207.34270508 \
--121.93359375 20\
-7.34960938 C-119\
-.95179119 207.36\
-140582 -117.9700\
-2692 207.3793414\
-5 -115.98828125 \
-207.3984375 C-11\
-5.98828125 206.4\
-084375 -115.9882\
-8125 205.4184375\
- -115.98828125 2\
-04.3984375 C-114\
-.84488281 204.34\
-945312 -113.7014\
-8438 204.3004687\
-5 -112.5234375 2\
-04.25 C-111.0325\
-2652 204.1749856\
-1 -109.54164233 \
-204.09943722 -10\
-8.05078125 204.0\
-234375 C-106.918\
-66211 203.977031\
-25 -106.91866211\
- 203.97703125 -1\
-05.76367188 203.\
-9296875 C-103.83\
-32073 203.825806\
- -101.90886044 2\
-03.61948136 -99.\
-98828125 203.398\
-4375 C-99.658281\
-25 202.7384375 -\
-99.32828125 202.\
-0784375 -98.9882\
-8125 201.3984375\
- C-95.02828125 2\
-01.3984375 -91.0\
-6828125 201.3984\
-375 -86.98828125\
- 201.3984375 C-8\
-6.98828125 200.4\
-084375 -86.98828\
-125 199.4184375 \
--86.98828125 198\
-.3984375 C-83.35\
-828125 198.39843\
-75 -79.72828125 \
-198.3984375 -75.\
-98828125 198.398\
-4375 C-75.988281\
-25 197.4084375 -\
-75.98828125 196.\
-4184375 -75.9882\
-8125 195.3984375\
- C-73.01828125 1\
-95.3984375 -70.0\
-4828125 195.3984\
-375 -66.98828125\
- 195.3984375 C-6\
-6.98828125 194.4\
-084375 -66.98828\
-125 193.4184375 \
--66.98828125 192\
-.3984375 C-64.01\
-828125 192.39843\
-75 -61.04828125 \
-192.3984375 -57.\
-98828125 192.398\
-4375 C-57.988281\
-25 191.4084375 -\
-57.98828125 190.\
-4184375 -57.9882\
-8125 189.3984375\
- C-56.31765625 1\
-89.2128125 -56.3\
-1765625 189.2128\
-125 -54.61328125\
- 189.0234375 C-5\
-0.95724448 188.7\
-518562 -50.95724\
-448 188.7518562 \
--48.98828125 186\
-.3984375 C-47.19\
-789657 185.78763\
-334 -45.38029824\
- 185.25450571 -4\
-3.55078125 184.7\
-734375 C-42.5826\
-9531 184.5130468\
-7 -41.61460937 1\
-84.25265625 -40.\
-6171875 183.9843\
-75 C-37.98828125\
- 183.3984375 -37\
-.98828125 183.39\
-84375 -34.988281\
-25 183.3984375 C\
--34.98828125 182\
-.7384375 -34.988\
-28125 182.078437\
-5 -34.98828125 1\
-81.3984375 C-34.\
-18390625 181.274\
-6875 -33.3795312\
-5 181.1509375 -3\
-2.55078125 181.0\
-234375 C-31.7051\
-5625 180.8171875\
- -30.85953125 18\
-0.6109375 -29.98\
-828125 180.39843\
-75 C-29.65828125\
- 179.7384375 -29\
-.32828125 179.07\
-84375 -28.988281\
-25 178.3984375 C\
--27.33828125 178\
-.3984375 -25.688\
-28125 178.398437\
-5 -23.98828125 1\
-78.3984375 C-23.\
-98828125 177.408\
-4375 -23.9882812\
-5 176.4184375 -2\
-3.98828125 175.3\
-984375 C-21.0182\
-8125 175.3984375\
- -18.04828125 17\
-5.3984375 -14.98\
-828125 175.39843\
-75 C-14.98828125\
- 174.4084375 -14\
-.98828125 173.41\
-84375 -14.988281\
-25 172.3984375 C\
--13.99828125 172\
-.3984375 -13.008\
-28125 172.398437\
-5 -11.98828125 1\
-72.3984375 C-11.\
-98828125 171.408\
-4375 -11.9882812\
-5 170.4184375 -1\
-1.98828125 169.3\
-984375 C-10.0082\
-8125 169.3984375\
- -8.02828125 169\
-.3984375 -5.9882\
-8125 169.3984375\
- C-5.98828125 16\
-8.4084375 -5.988\
-28125 167.418437\
-5 -5.98828125 16\
-6.3984375 C-5.43\
-140625 166.33656\
-25 -4.87453125 1\
-66.2746875 -4.30\
-078125 166.21093\
-75 C-1.05989345 \
-165.07224719 0.6\
-4295905 162.8295\
-3298 3.01171875 \
-160.3984375 C3.6\
-7171875 160.3984\
-375 4.33171875 1\
-60.3984375 5.011\
-71875 160.398437\
-5 C5.01171875 15\
-9.7384375 5.0117\
-1875 159.0784375\
- 5.01171875 158.\
-3984375 C10.6367\
-1875 155.3984375\
- 10.63671875 155\
-.3984375 14.0117\
-1875 155.3984375\
- C14.01171875 15\
-4.4084375 14.011\
-71875 153.418437\
-5 14.01171875 15\
-2.3984375 C15.00\
-171875 152.39843\
-75 15.99171875 1\
-52.3984375 17.01\
-171875 152.39843\
-75 C17.01171875 \
-151.4084375 17.0\
-1171875 150.4184\
-375 17.01171875 \
-149.3984375 C18.\
-00171875 149.398\
-4375 18.99171875\
- 149.3984375 20.\
-01171875 149.398\
-4375 C20.0117187\
-5 148.4084375 20\
-.01171875 147.41\
-84375 20.0117187\
-5 146.3984375 C2\
-1.38671875 144.7\
-109375 21.386718\
-75 144.7109375 2\
-3.01171875 143.3\
-984375 C23.67171\
-875 143.3984375 \
-24.33171875 143.\
-3984375 25.01171\
-875 143.3984375 \
-C25.34171875 142\
-.4084375 25.6717\
-1875 141.4184375\
- 26.01171875 140\
-.3984375 C26.671\
-71875 140.398437\
-5 27.33171875 14\
-0.3984375 28.011\
-71875 140.398437\
-5 C28.34171875 1\
-39.0784375 28.67\
-171875 137.75843\
-75 29.01171875 1\
-36.3984375 C29.6\
-7171875 136.3984\
-375 30.33171875 \
-136.3984375 31.0\
-1171875 136.3984\
-375 C31.34171875\
- 134.7484375 31.\
-67171875 133.098\
-4375 32.01171875\
- 131.3984375 C32\
-.67171875 131.39\
-84375 33.3317187\
-5 131.3984375 34\
-.01171875 131.39\
-84375 C34.011718\
-75 129.7484375 3\
-4.01171875 128.0\
-984375 34.011718\
-75 126.3984375 C\
-35.00171875 126.\
-3984375 35.99171\
-875 126.3984375 \
-37.01171875 126.\
-3984375 C37.0117\
-1875 124.4184375\
- 37.01171875 122\
-.4384375 37.0117\
-1875 120.3984375\
- C38.00171875 12\
-0.3984375 38.991\
-71875 120.398437\
-5 40.01171875 12\
-0.3984375 C40.01\
-171875 115.77843\
-75 40.01171875 1\
-11.1584375 40.01\
-171875 106.39843\
-75 C39.02171875 \
-106.0684375 38.0\
-3171875 105.7384\
-375 37.01171875 \
-105.3984375 C37.\
-01171875 103.088\
-4375 37.01171875\
- 100.7784375 37.\
-01171875 98.3984\
-375 C36.02171875\
- 98.0684375 35.0\
-3171875 97.73843\
-75 34.01171875 9\
-7.3984375 C34.01\
-171875 95.748437\
-5 34.01171875 94\
-.0984375 34.0117\
-1875 92.3984375 \
-C33.02171875 92.\
-0684375 32.03171\
-875 91.7384375 3\
-1.01171875 91.39\
-84375 C31.011718\
-75 89.7484375 31\
-.01171875 88.098\
-4375 31.01171875\
- 86.3984375 C30.\
-02171875 86.3984\
-375 29.03171875 \
-86.3984375 28.01\
-171875 86.398437\
-5 C28.01171875 8\
-5.4084375 28.011\
-71875 84.4184375\
- 28.01171875 83.\
-3984375 C27.0217\
-1875 83.0684375 \
-26.03171875 82.7\
-384375 25.011718\
-75 82.3984375 C2\
-5.01171875 81.73\
-84375 25.0117187\
-5 81.0784375 25.\
-01171875 80.3984\
-375 C24.35171875\
- 80.3984375 23.6\
-9171875 80.39843\
-75 23.01171875 8\
-0.3984375 C23.01\
-171875 79.408437\
-5 23.01171875 78\
-.4184375 23.0117\
-1875 77.3984375 \
-C22.02171875 77.\
-3984375 21.03171\
-875 77.3984375 2\
-0.01171875 77.39\
-84375 C18.324218\
-75 76.0234375 18\
-.32421875 76.023\
-4375 17.01171875\
- 74.3984375 C17.\
-01171875 73.7384\
-375 17.01171875 \
-73.0784375 17.01\
-171875 72.398437\
-5 C16.02171875 7\
-2.0684375 15.031\
-71875 71.7384375\
- 14.01171875 71.\
-3984375 C14.0117\
-1875 70.7384375 \
-14.01171875 70.0\
-784375 14.011718\
-75 69.3984375 C1\
-3.02171875 69.06\
-84375 12.0317187\
-5 68.7384375 11.\
-01171875 68.3984\
-375 C11.01171875\
- 67.7384375 11.0\
-1171875 67.07843\
-75 11.01171875 6\
-6.3984375 C10.02\
-171875 66.398437\
-5 9.03171875 66.\
-3984375 8.011718\
-75 66.3984375 C8\
-.01171875 65.408\
-4375 8.01171875 \
-64.4184375 8.011\
-71875 63.3984375\
- C6.36171875 63.\
-3984375 4.711718\
-75 63.3984375 3.\
-01171875 63.3984\
-375 C2.68171875 \
-62.4084375 2.351\
-71875 61.4184375\
- 2.01171875 60.3\
-984375 C1.021718\
-75 60.0684375 0.\
-03171875 59.7384\
-375 -0.98828125 \
-59.3984375 C-0.9\
-8828125 58.73843\
-75 -0.98828125 5\
-8.0784375 -0.988\
-28125 57.3984375\
- C-2.63828125 57\
-.3984375 -4.2882\
-8125 57.3984375 \
--5.98828125 57.3\
-984375 C-5.98828\
-125 56.4084375 -\
-5.98828125 55.41\
-84375 -5.9882812\
-5 54.3984375 C-6\
-.97828125 54.398\
-4375 -7.96828125\
- 54.3984375 -8.9\
-8828125 54.39843\
-75 C-9.31828125 \
-53.7384375 -9.64\
-828125 53.078437\
-5 -9.98828125 52\
-.3984375 C-11.63\
-828125 51.738437\
-5 -13.28828125 5\
-1.0784375 -14.98\
-828125 50.398437\
-5 C-14.98828125 \
-46.7684375 -14.9\
-8828125 43.13843\
-75 -14.98828125 \
-39.3984375 C-13.\
-99828125 39.3984\
-375 -13.00828125\
- 39.3984375 -11.\
-98828125 39.3984\
-375 C-11.6582812\
-5 38.0784375 -11\
-.32828125 36.758\
-4375 -10.9882812\
-5 35.3984375 C-1\
-0.32828125 35.39\
-84375 -9.6682812\
-5 35.3984375 -8.\
-98828125 35.3984\
-375 C-8.98828125\
- 34.4084375 -8.9\
-8828125 33.41843\
-75 -8.98828125 3\
-2.3984375 C-7.99\
-828125 32.398437\
-5 -7.00828125 32\
-.3984375 -5.9882\
-8125 32.3984375 \
-C-5.98828125 30.\
-0884375 -5.98828\
-125 27.7784375 -\
-5.98828125 25.39\
-84375 C-5.328281\
-25 25.3984375 -4\
-.66828125 25.398\
-4375 -3.98828125\
- 25.3984375 C-3.\
-99875488 24.7477\
-0264 -4.00922852\
- 24.09696777 -4.\
-02001953 23.4265\
-1367 C-4.0615796\
- 20.4796942 -4.0\
-8760733 17.53293\
-639 -4.11328125 \
-14.5859375 C-4.1\
-3003906 13.56177\
-734 -4.14679688 \
-12.53761719 -4.1\
-640625 11.482421\
-88 C-4.17050781 \
-10.49951172 -4.1\
-7695313 9.516601\
-56 -4.18359375 8\
-.50390625 C-4.19\
-406738 7.5979370\
-1 -4.20454102 6.\
-69196777 -4.2153\
-3203 5.75854492 \
-C-3.91758119 2.6\
-6353702 -3.25235\
-59 0.65174912 0 \
-0 Z \x22 fill=\x22#000\
-000\x22 transform=\x22\
-translate(496.98\
-828125,202.60156\
-25)\x22/>\x0d\x0a<path d=\
-\x22M0 0 C1.32 0 2.\
-64 0 4 0 C4 4.95\
- 4 9.9 4 15 C3.3\
-4 15 2.68 15 2 1\
-5 C1.46467177 13\
-.44240657 0.9473\
-4622 11.87861955\
- 0.4375 10.3125 \
-C0.14746094 9.44\
-238281 -0.142578\
-12 8.57226562 -0\
-.44140625 7.6757\
-8125 C-1.0514196\
-1 4.75368926 -0.\
-77703633 2.85599\
-447 0 0 Z \x22 fill\
-=\x22#000000\x22 trans\
-form=\x22translate(\
-157,85)\x22/>\x0d\x0a<pat\
-h d=\x22\x22 fill=\x22#00\
-0000\x22 transform=\
-\x22translate(0,0)\x22\
-/>\x0d\x0a</svg>\x0d\x0a\
-\x00\x00\xbf\x0a\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22?>\x0d\x0a<svg vers\
-ion=\x221.1\x22 xmlns=\
-\x22http://www.w3.o\
-rg/2000/svg\x22 wid\
-th=\x22591\x22 height=\
-\x22591\x22>\x0d\x0a<path d=\
-\x22M0 0 C1.262108 \
--0.00642769 1.26\
-2108 -0.00642769\
- 2.54971313 -0.0\
-1298523 C4.32984\
-523 -0.01871247 \
-6.11000072 -0.01\
-924066 7.8901367\
-2 -0.01489258 C1\
-0.55869825 -0.01\
-176892 13.226109\
-5 -0.03508389 15\
-.89453125 -0.060\
-54688 C29.904702\
-21 -0.11325712 4\
-3.20240919 0.781\
-07365 55.9492187\
-5 7.1640625 C58.\
-62899456 8.50165\
-214 61.36753847 \
-9.42108155 64.22\
-65625 10.3007812\
-5 C65.2165625 10\
-.79578125 65.216\
-5625 10.79578125\
- 66.2265625 11.3\
-0078125 C66.2265\
-625 11.96078125 \
-66.2265625 12.62\
-078125 66.226562\
-5 13.30078125 C6\
-7.33644531 13.48\
-447266 67.336445\
-31 13.48447266 6\
-8.46875 13.67187\
-5 C76.15623674 1\
-5.42497042 82.64\
-22365 20.9110341\
- 88.84375 25.531\
-25 C90.6023458 2\
-6.8372236 92.403\
-96849 28.0857185\
-7 94.2265625 29.\
-30078125 C94.226\
-5625 29.96078125\
- 94.2265625 30.6\
-2078125 94.22656\
-25 31.30078125 C\
-94.80921875 31.5\
-6632812 95.39187\
-5 31.831875 95.9\
-921875 32.105468\
-75 C102.82833599\
- 35.76256917 109\
-.19042448 42.474\
-39817 114.226562\
-5 48.30078125 C1\
-14.2265625 48.96\
-078125 114.22656\
-25 49.62078125 1\
-14.2265625 50.30\
-078125 C114.8865\
-625 50.30078125 \
-115.5465625 50.3\
-0078125 116.2265\
-625 50.30078125 \
-C116.2265625 50.\
-96078125 116.226\
-5625 51.62078125\
- 116.2265625 52.\
-30078125 C116.88\
-65625 52.3007812\
-5 117.5465625 52\
-.30078125 118.22\
-65625 52.3007812\
-5 C119.2165625 5\
-4.77578125 119.2\
-165625 54.775781\
-25 120.2265625 5\
-7.30078125 C120.\
-8865625 57.30078\
-125 121.5465625 \
-57.30078125 122.\
-2265625 57.30078\
-125 C123.2165625\
- 59.77578125 123\
-.2165625 59.7757\
-8125 124.2265625\
- 62.30078125 C12\
-4.8865625 62.300\
-78125 125.546562\
-5 62.30078125 12\
-6.2265625 62.300\
-78125 C128.22656\
-25 65.30078125 1\
-28.2265625 65.30\
-078125 128.22656\
-25 68.30078125 C\
-128.8865625 68.3\
-0078125 129.5465\
-625 68.30078125 \
-130.2265625 68.3\
-0078125 C131.696\
-17716 71.2400105\
-8 131.43576112 7\
-3.90487097 131.4\
-765625 77.175781\
-25 C131.51523437\
- 79.02816406 131\
-.51523437 79.028\
-16406 131.554687\
-5 80.91796875 C1\
-31.21198738 84.4\
-5104375 130.7531\
-9677 85.86000348\
- 128.2265625 88.\
-30078125 C127.56\
-65625 88.3007812\
-5 126.9065625 88\
-.30078125 126.22\
-65625 88.3007812\
-5 C126.2265625 8\
-9.29078125 126.2\
-265625 90.280781\
-25 126.2265625 9\
-1.30078125 C125.\
-5665625 91.30078\
-125 124.9065625 \
-91.30078125 124.\
-2265625 91.30078\
-125 C124.2265625\
- 91.96078125 124\
-.2265625 92.6207\
-8125 124.2265625\
- 93.30078125 C12\
-3.5665625 93.300\
-78125 122.906562\
-5 93.30078125 12\
-2.2265625 93.300\
-78125 C121.85531\
-25 94.14382813 1\
-21.8553125 94.14\
-382813 121.47656\
-25 95.00390625 C\
-120.01381383 97.\
-69170694 118.258\
-51377 99.7648360\
-7 116.2265625 10\
-2.05078125 C115.\
-5253125 102.85 1\
-14.8240625 103.6\
-4921875 114.1015\
-625 104.47265625\
- C112.2265625 10\
-6.30078125 112.2\
-265625 106.30078\
-125 110.2265625 \
-106.30078125 C11\
-0.2265625 106.96\
-078125 110.22656\
-25 107.62078125 \
-110.2265625 108.\
-30078125 C109.56\
-65625 108.300781\
-25 108.9065625 1\
-08.30078125 108.\
-2265625 108.3007\
-8125 C108.226562\
-5 108.96078125 1\
-08.2265625 109.6\
-2078125 108.2265\
-625 110.30078125\
- C106.82493481 1\
-11.5355485 105.4\
-1444207 112.7622\
-6813 103.953125 \
-113.92578125 C10\
-2.25354354 115.2\
-7929409 100.6179\
-5822 116.6901992\
-5 98.9765625 118\
-.11328125 C96.22\
-65625 120.300781\
-25 96.2265625 12\
-0.30078125 94.22\
-65625 120.300781\
-25 C94.2265625 1\
-20.96078125 94.2\
-265625 121.62078\
-125 94.2265625 1\
-22.30078125 C93.\
-5665625 122.3007\
-8125 92.9065625 \
-122.30078125 92.\
-2265625 122.3007\
-8125 C92.2265625\
- 122.96078125 92\
-.2265625 123.620\
-78125 92.2265625\
- 124.30078125 C8\
-9.2265625 126.30\
-078125 89.226562\
-5 126.30078125 8\
-6.2265625 126.30\
-078125 C86.22656\
-25 126.96078125 \
-86.2265625 127.6\
-2078125 86.22656\
-25 128.30078125 \
-C80.32621659 132\
-.86410296 74.144\
-52808 136.562419\
-88 67.2265625 13\
-9.30078125 C66.5\
-871875 139.79578\
-125 65.9478125 1\
-40.29078125 65.2\
-890625 140.80078\
-125 C62.67480532\
- 142.7020592 59.\
-97400187 143.603\
-14911 56.9335937\
-5 144.65234375 C\
-55.22142289 145.\
-16927941 55.2214\
-2289 145.1692794\
-1 54.2265625 146\
-.30078125 C52.56\
-039135 146.34141\
-957 50.89268155 \
-146.34350225 49.\
-2265625 146.3007\
-8125 C49.2265625\
- 146.96078125 49\
-.2265625 147.620\
-78125 49.2265625\
- 148.30078125 C3\
-8.2919022 150.79\
-873276 27.913432\
-82 151.72786592 \
-16.70581055 151.\
-58203125 C14.266\
-60937 151.550490\
-92 11.82805835 1\
-51.54099968 9.38\
-867188 151.53515\
-625 C-10.6641742\
-6 151.43709895 -\
-10.66417426 151.\
-43709895 -18.75 \
-148.11328125 C-2\
-0.85743582 147.2\
-6705219 -22.9790\
-1013 146.5956395\
-2 -25.1484375 14\
-5.92578125 C-30.\
-21742865 144.247\
-89219 -35.286744\
-88 142.22069232 \
--39.7734375 139.\
-30078125 C-40.10\
-34375 138.310781\
-25 -40.4334375 1\
-37.32078125 -40.\
-7734375 136.3007\
-8125 C-41.472109\
-38 136.20667969 \
--42.17078125 136\
-.11257813 -42.89\
-0625 136.015625 \
-C-46.33759823 13\
-5.16088774 -48.8\
-602101 133.69459\
-375 -51.8984375 \
-131.86328125 C-5\
-2.93226563 131.2\
-4582031 -53.9660\
-9375 130.6283593\
-8 -55.03125 129.\
-9921875 C-56.967\
-92646 128.797627\
-8 -58.88014575 1\
-27.56297575 -60.\
-7734375 126.3007\
-8125 C-60.773437\
-5 125.64078125 -\
-60.7734375 124.9\
-8078125 -60.7734\
-375 124.30078125\
- C-61.34578125 1\
-24.03265625 -61.\
-918125 123.76453\
-125 -62.5078125 \
-123.48828125 C-6\
-4.85228384 122.2\
-5945489 -66.8974\
-8688 120.8755594\
-9 -69.0234375 11\
-9.30078125 C-69.\
-72984375 118.785\
-15625 -70.43625 \
-118.26953125 -71\
-.1640625 117.738\
-28125 C-71.69515\
-625 117.26390625\
- -72.22625 116.7\
-8953125 -72.7734\
-375 116.30078125\
- C-72.7734375 11\
-5.64078125 -72.7\
-734375 114.98078\
-125 -72.7734375 \
-114.30078125 C-7\
-3.4334375 114.30\
-078125 -74.09343\
-75 114.30078125 \
--74.7734375 114.\
-30078125 C-74.77\
-34375 113.640781\
-25 -74.7734375 1\
-12.98078125 -74.\
-7734375 112.3007\
-8125 C-75.392187\
-5 111.99140625 -\
-76.0109375 111.6\
-8203125 -76.6484\
-375 111.36328125\
- C-78.0234375 11\
-0.67578125 -79.3\
-984375 109.98828\
-125 -80.7734375 \
-109.30078125 C-8\
-0.7734375 108.64\
-078125 -80.77343\
-75 107.98078125 \
--80.7734375 107.\
-30078125 C-81.43\
-34375 107.300781\
-25 -82.0934375 1\
-07.30078125 -82.\
-7734375 107.3007\
-8125 C-82.773437\
-5 106.64078125 -\
-82.7734375 105.9\
-8078125 -82.7734\
-375 105.30078125\
- C-83.4334375 10\
-5.30078125 -84.0\
-934375 105.30078\
-125 -84.7734375 \
-105.30078125 C-8\
-4.7734375 104.64\
-078125 -84.77343\
-75 103.98078125 \
--84.7734375 103.\
-30078125 C-85.43\
-34375 103.300781\
-25 -86.0934375 1\
-03.30078125 -86.\
-7734375 103.3007\
-8125 C-86.773437\
-5 102.64078125 -\
-86.7734375 101.9\
-8078125 -86.7734\
-375 101.30078125\
- C-87.4334375 10\
-1.30078125 -88.0\
-934375 101.30078\
-125 -88.7734375 \
-101.30078125 C-9\
-2.7734375 96.830\
-19301 -92.773437\
-5 96.83019301 -9\
-2.7734375 94.300\
-78125 C-93.43343\
-75 94.30078125 -\
-94.0934375 94.30\
-078125 -94.77343\
-75 94.30078125 C\
--99.05108788 90.\
-30882232 -103.22\
-122249 86.048050\
-91 -104.3984375 \
-80.19140625 C-10\
-4.3984375 76.614\
-11881 -104.38883\
-45 73.53157524 -\
-102.7734375 70.3\
-0078125 C-102.11\
-34375 70.3007812\
-5 -101.4534375 7\
-0.30078125 -100.\
-7734375 70.30078\
-125 C-100.629062\
-5 69.68203125 -1\
-00.4846875 69.06\
-328125 -100.3359\
-375 68.42578125 \
-C-99.7734375 66.\
-30078125 -99.773\
-4375 66.30078125\
- -98.7734375 64.\
-30078125 C-98.11\
-34375 64.3007812\
-5 -97.4534375 64\
-.30078125 -96.77\
-34375 64.3007812\
-5 C-96.7734375 6\
-3.64078125 -96.7\
-734375 62.980781\
-25 -96.7734375 6\
-2.30078125 C-96.\
-1134375 62.30078\
-125 -95.4534375 \
-62.30078125 -94.\
-7734375 62.30078\
-125 C-94.7734375\
- 61.31078125 -94\
-.7734375 60.3207\
-8125 -94.7734375\
- 59.30078125 C-9\
-4.1134375 59.300\
-78125 -93.453437\
-5 59.30078125 -9\
-2.7734375 59.300\
-78125 C-92.11343\
-75 57.65078125 -\
-91.4534375 56.00\
-078125 -90.77343\
-75 54.30078125 C\
--90.1134375 54.3\
-0078125 -89.4534\
-375 54.30078125 \
--88.7734375 54.3\
-0078125 C-88.525\
-9375 53.74390625\
- -88.2784375 53.\
-18703125 -88.023\
-4375 52.61328125\
- C-86.54418932 4\
-9.87667212 -84.8\
-3876311 47.62427\
-256 -82.7734375 \
-45.30078125 C-82\
-.1134375 45.3007\
-8125 -81.4534375\
- 45.30078125 -80\
-.7734375 45.3007\
-8125 C-80.773437\
-5 44.64078125 -8\
-0.7734375 43.980\
-78125 -80.773437\
-5 43.30078125 C-\
-80.1134375 43.30\
-078125 -79.45343\
-75 43.30078125 -\
-78.7734375 43.30\
-078125 C-78.1134\
-375 41.98078125 \
--77.4534375 40.6\
-6078125 -76.7734\
-375 39.30078125 \
-C-76.1134375 39.\
-30078125 -75.453\
-4375 39.30078125\
- -74.7734375 39.\
-30078125 C-74.77\
-34375 38.6407812\
-5 -74.7734375 37\
-.98078125 -74.77\
-34375 37.3007812\
-5 C-74.1134375 3\
-7.30078125 -73.4\
-534375 37.300781\
-25 -72.7734375 3\
-7.30078125 C-72.\
-7734375 36.64078\
-125 -72.7734375 \
-35.98078125 -72.\
-7734375 35.30078\
-125 C-71.3476562\
-5 33.79296875 -7\
-1.34765625 33.79\
-296875 -69.46093\
-75 32.17578125 C\
--68.84605469 31.\
-63695312 -68.231\
-17188 31.098125 \
--67.59765625 30.\
-54296875 C-65.77\
-34375 29.3007812\
-5 -65.7734375 29\
-.30078125 -62.77\
-34375 29.3007812\
-5 C-62.7734375 2\
-8.64078125 -62.7\
-734375 27.980781\
-25 -62.7734375 2\
-7.30078125 C-61.\
-34875613 26.1135\
-4678 -59.9190511\
-4 24.93182091 -5\
-8.46459961 23.78\
-125 C-56.7502639\
-4 22.28049476 -5\
-5.47717637 20.72\
-797214 -54.08984\
-375 18.92578125 \
-C-50.71869288 14\
-.93327074 -46.97\
-195582 12.787844\
-71 -42.3359375 1\
-0.48828125 C-41.\
-61083984 10.1073\
-6328 -40.8857421\
-9 9.72644531 -40\
-.13867188 9.3339\
-8438 C-32.906564\
-8 5.62371201 -25\
-.73986472 4.0409\
-1246 -17.7382812\
-5 2.86328125 C-1\
-4.77998734 2.393\
-86843 -14.779987\
-34 2.39386843 -1\
-2.13647461 1.284\
-42383 C-7.995311\
-99 0.07319013 -4\
-.28932603 -0.004\
-92488 0 0 Z M5.2\
-265625 47.300781\
-25 C5.2265625 47\
-.96078125 5.2265\
-625 48.62078125 \
-5.2265625 49.300\
-78125 C3.9065625\
- 49.30078125 2.5\
-865625 49.300781\
-25 1.2265625 49.\
-30078125 C1.2265\
-625 49.96078125 \
-1.2265625 50.620\
-78125 1.2265625 \
-51.30078125 C0.6\
-078125 51.445156\
-25 -0.0109375 51\
-.58953125 -0.648\
-4375 51.73828125\
- C-2.80602072 52\
-.2323035 -2.8060\
-2072 52.2323035 \
--4.7734375 53.30\
-078125 C-4.77343\
-75 53.96078125 -\
-4.7734375 54.620\
-78125 -4.7734375\
- 55.30078125 C-5\
-.4334375 55.3007\
-8125 -6.0934375 \
-55.30078125 -6.7\
-734375 55.300781\
-25 C-7.4334375 5\
-7.28078125 -8.09\
-34375 59.2607812\
-5 -8.7734375 61.\
-30078125 C-9.433\
-4375 61.30078125\
- -10.0934375 61.\
-30078125 -10.773\
-4375 61.30078125\
- C-10.7734375 63\
-.28078125 -10.77\
-34375 65.2607812\
-5 -10.7734375 67\
-.30078125 C-11.4\
-334375 67.300781\
-25 -12.0934375 6\
-7.30078125 -12.7\
-734375 67.300781\
-25 C-12.7734375 \
-70.93078125 -12.\
-7734375 74.56078\
-125 -12.7734375 \
-78.30078125 C-12\
-.1134375 78.3007\
-8125 -11.4534375\
- 78.30078125 -10\
-.7734375 78.3007\
-8125 C-10.773437\
-5 80.28078125 -1\
-0.7734375 82.260\
-78125 -10.773437\
-5 84.30078125 C-\
-10.1134375 84.30\
-078125 -9.453437\
-5 84.30078125 -8\
-.7734375 84.3007\
-8125 C-8.7734375\
- 85.62078125 -8.\
-7734375 86.94078\
-125 -8.7734375 8\
-8.30078125 C-8.1\
-134375 88.300781\
-25 -7.4534375 88\
-.30078125 -6.773\
-4375 88.30078125\
- C-6.7734375 88.\
-96078125 -6.7734\
-375 89.62078125 \
--6.7734375 90.30\
-078125 C-6.11343\
-75 90.30078125 -\
-5.4534375 90.300\
-78125 -4.7734375\
- 90.30078125 C-4\
-.7734375 90.9607\
-8125 -4.7734375 \
-91.62078125 -4.7\
-734375 92.300781\
-25 C-4.1134375 9\
-2.30078125 -3.45\
-34375 92.3007812\
-5 -2.7734375 92.\
-30078125 C-2.773\
-4375 92.96078125\
- -2.7734375 93.6\
-2078125 -2.77343\
-75 94.30078125 C\
--2.1134375 94.30\
-078125 -1.453437\
-5 94.30078125 -0\
-.7734375 94.3007\
-8125 C-0.7734375\
- 94.96078125 -0.\
-7734375 95.62078\
-125 -0.7734375 9\
-6.30078125 C1.20\
-65625 96.3007812\
-5 3.1865625 96.3\
-0078125 5.226562\
-5 96.30078125 C5\
-.2265625 96.9607\
-8125 5.2265625 9\
-7.62078125 5.226\
-5625 98.30078125\
- C6.3403125 98.4\
-4515625 7.454062\
-5 98.58953125 8.\
-6015625 98.73828\
-125 C12.2265625 \
-99.30078125 12.2\
-265625 99.300781\
-25 14.2265625 10\
-0.30078125 C16.3\
-9377183 99.77845\
-783 18.53809595 \
-99.1590154 20.66\
-40625 98.4882812\
-5 C22.39462891 9\
-7.95267578 22.39\
-462891 97.952675\
-78 24.16015625 9\
-7.40625 C27.3398\
-502 96.39833013 \
-27.3398502 96.39\
-833013 30.226562\
-5 94.30078125 C3\
-0.2265625 93.640\
-78125 30.2265625\
- 92.98078125 30.\
-2265625 92.30078\
-125 C30.8865625 \
-92.30078125 31.5\
-465625 92.300781\
-25 32.2265625 92\
-.30078125 C32.22\
-65625 91.6407812\
-5 32.2265625 90.\
-98078125 32.2265\
-625 90.30078125 \
-C32.8865625 90.3\
-0078125 33.54656\
-25 90.30078125 3\
-4.2265625 90.300\
-78125 C36.503912\
-6 87.48568132 36\
-.5039126 87.4856\
-8132 36.2265625 \
-84.30078125 C36.\
-8865625 84.30078\
-125 37.5465625 8\
-4.30078125 38.22\
-65625 84.3007812\
-5 C40.66720837 7\
-8.65678767 40.41\
-945349 73.323266\
-47 40.2265625 67\
-.30078125 C39.56\
-65625 67.3007812\
-5 38.9065625 67.\
-30078125 38.2265\
-625 67.30078125 \
-C38.2265625 65.3\
-2078125 38.22656\
-25 63.34078125 3\
-8.2265625 61.300\
-78125 C37.566562\
-5 61.30078125 36\
-.9065625 61.3007\
-8125 36.2265625 \
-61.30078125 C36.\
-0821875 60.68203\
-125 35.9378125 6\
-0.06328125 35.78\
-90625 59.4257812\
-5 C35.29504025 5\
-7.26819803 35.29\
-504025 57.268198\
-03 34.2265625 55\
-.30078125 C33.56\
-65625 55.3007812\
-5 32.9065625 55.\
-30078125 32.2265\
-625 55.30078125 \
-C32.2265625 54.6\
-4078125 32.22656\
-25 53.98078125 3\
-2.2265625 53.300\
-78125 C31.566562\
-5 53.30078125 30\
-.9065625 53.3007\
-8125 30.2265625 \
-53.30078125 C30.\
-2265625 52.64078\
-125 30.2265625 5\
-1.98078125 30.22\
-65625 51.3007812\
-5 C28.9065625 51\
-.30078125 27.586\
-5625 51.30078125\
- 26.2265625 51.3\
-0078125 C26.2265\
-625 50.64078125 \
-26.2265625 49.98\
-078125 26.226562\
-5 49.30078125 C2\
-4.9065625 49.300\
-78125 23.5865625\
- 49.30078125 22.\
-2265625 49.30078\
-125 C22.2265625 \
-48.64078125 22.2\
-265625 47.980781\
-25 22.2265625 47\
-.30078125 C16.61\
-65625 47.3007812\
-5 11.0065625 47.\
-30078125 5.22656\
-25 47.30078125 Z\
- \x22 fill=\x22#000000\
-\x22 transform=\x22tra\
-nslate(282.77343\
-75,225.69921875)\
-\x22/>\x0d\x0a<path d=\x22M0\
- 0 C0.89847656 0\
-.00257813 1.7969\
-5313 0.00515625 \
-2.72265625 0.007\
-8125 C3.61855469\
- 0.00523437 4.51\
-445313 0.0026562\
-5 5.4375 0 C7.78\
-515625 0.1328125\
- 7.78515625 0.13\
-28125 9.78515625\
- 1.1328125 C9.78\
-515625 1.7928125\
- 9.78515625 2.45\
-28125 9.78515625\
- 3.1328125 C10.4\
-4515625 3.132812\
-5 11.10515625 3.\
-1328125 11.78515\
-625 3.1328125 C1\
-1.78515625 3.792\
-8125 11.78515625\
- 4.4528125 11.78\
-515625 5.1328125\
- C12.44515625 5.\
-1328125 13.10515\
-625 5.1328125 13\
-.78515625 5.1328\
-125 C13.78515625\
- 5.7928125 13.78\
-515625 6.4528125\
- 13.78515625 7.1\
-328125 C14.44515\
-625 7.1328125 15\
-.10515625 7.1328\
-125 15.78515625 \
-7.1328125 C15.78\
-515625 7.7928125\
- 15.78515625 8.4\
-528125 15.785156\
-25 9.1328125 C16\
-.44515625 9.1328\
-125 17.10515625 \
-9.1328125 17.785\
-15625 9.1328125 \
-C17.78515625 9.7\
-928125 17.785156\
-25 10.4528125 17\
-.78515625 11.132\
-8125 C18.4451562\
-5 11.1328125 19.\
-10515625 11.1328\
-125 19.78515625 \
-11.1328125 C19.7\
-8515625 12.12281\
-25 19.78515625 1\
-3.1128125 19.785\
-15625 14.1328125\
- C21.10515625 14\
-.4628125 22.4251\
-5625 14.7928125 \
-23.78515625 15.1\
-328125 C23.78515\
-625 15.7928125 2\
-3.78515625 16.45\
-28125 23.7851562\
-5 17.1328125 C24\
-.44515625 17.132\
-8125 25.10515625\
- 17.1328125 25.7\
-8515625 17.13281\
-25 C25.78515625 \
-17.7928125 25.78\
-515625 18.452812\
-5 25.78515625 19\
-.1328125 C26.445\
-15625 19.1328125\
- 27.10515625 19.\
-1328125 27.78515\
-625 19.1328125 C\
-27.78515625 19.7\
-928125 27.785156\
-25 20.4528125 27\
-.78515625 21.132\
-8125 C28.4451562\
-5 21.1328125 29.\
-10515625 21.1328\
-125 29.78515625 \
-21.1328125 C29.7\
-8515625 21.79281\
-25 29.78515625 2\
-2.4528125 29.785\
-15625 23.1328125\
- C30.44515625 23\
-.1328125 31.1051\
-5625 23.1328125 \
-31.78515625 23.1\
-328125 C31.78515\
-625 23.7928125 3\
-1.78515625 24.45\
-28125 31.7851562\
-5 25.1328125 C32\
-.44515625 25.132\
-8125 33.10515625\
- 25.1328125 33.7\
-8515625 25.13281\
-25 C34.96463359 \
-29.26098318 34.7\
-0135056 31.31166\
-255 32.78515625 \
-35.1328125 C30.5\
-078125 37.808593\
-75 30.5078125 37\
-.80859375 27.847\
-65625 40.4453125\
- C26.97238281 41\
-.32832031 26.097\
-10938 42.2113281\
-3 25.1953125 43.\
-12109375 C22.785\
-15625 45.1328125\
- 22.78515625 45.\
-1328125 19.78515\
-625 45.1328125 C\
-19.78515625 45.7\
-928125 19.785156\
-25 46.4528125 19\
-.78515625 47.132\
-8125 C19.1251562\
-5 47.1328125 18.\
-46515625 47.1328\
-125 17.78515625 \
-47.1328125 C17.7\
-2328125 47.68968\
-75 17.66140625 4\
-8.2465625 17.597\
-65625 48.8203125\
- C16.4567748 52.\
-06743663 14.2355\
-5903 53.77620504\
- 11.78515625 56.\
-1328125 C12.6760\
-7468 56.12170944\
- 13.5669931 56.1\
-1060638 14.48490\
-906 56.09916687 \
-C22.88618557 55.\
-99892895 31.2872\
-609 55.92282935 \
-39.68899822 55.8\
-7375164 C44.0083\
-3865 55.84767168\
- 48.32718447 55.\
-8123038 52.64624\
-023 55.75561523 \
-C56.81543135 55.\
-70123693 60.9841\
-4713 55.67137991\
- 65.15366554 55.\
-65842628 C66.743\
-31965 55.6491967\
-1 68.33294811 55\
-.63117293 69.922\
-39952 55.6041622\
-2 C72.1515535 55\
-.56779155 74.378\
-75073 55.5628700\
-5 76.6081543 55.\
-56518555 C77.876\
-1235 55.55408249\
- 79.14409271 55.\
-54297943 80.4504\
-8523 55.53153992\
- C84.71321318 56\
-.3001499 86.1781\
-3744 57.73163732\
- 88.78515625 61.\
-1328125 C89.4066\
-1621 63.23245239\
- 89.40661621 63.\
-23245239 89.4003\
-9062 65.32470703\
- C89.41434875 66\
-.51086105 89.414\
-34875 66.5108610\
-5 89.42858887 67\
-.72097778 C89.40\
-399597 68.980578\
-16 89.40399597 6\
-8.98057816 89.37\
-890625 70.265625\
- C89.37894653 71\
-.13927704 89.378\
-98682 72.0129290\
-8 89.37902832 72\
-.91305542 C89.37\
-368121 74.753796\
-61 89.35613302 7\
-6.59453785 89.32\
-714844 78.435058\
-59 C89.28518932 \
-81.2555896 89.28\
-608997 84.073739\
-89 89.29296875 8\
-6.89453125 C89.2\
-8247937 88.68491\
-245 89.26954262 \
-90.47528135 89.2\
-5390625 92.26562\
-5 C89.25370483 9\
-3.10940704 89.25\
-350342 93.953189\
-09 89.2532959 94\
-.82254028 C89.13\
-668142 100.57170\
-773 89.13668142 \
-100.57170773 87.\
-70475769 102.857\
-34558 C84.740189\
-05 104.82713429 \
-82.17875763 104.\
-49135376 78.6516\
-1133 104.4733886\
-7 C77.56830788 1\
-04.47404579 77.5\
-6830788 104.4740\
-4579 76.46311951\
- 104.47471619 C7\
-4.0767002 104.47\
-262664 71.690984\
-02 104.44928863 \
-69.3046875 104.4\
-2578125 C67.6498\
-8082 104.4201858\
-6 65.99506917 10\
-4.4159155 64.340\
-25574 104.412918\
-09 C59.98522211 \
-104.40146474 55.\
-63048874 104.371\
-99348 51.2755737\
-3 104.33880615 C\
-46.8315436 104.3\
-0811576 42.38746\
-494 104.29441497\
- 37.94335938 104\
-.27929688 C29.22\
-382056 104.24712\
-412 20.50452576 \
-104.19592202 11.\
-78515625 104.132\
-8125 C11.7851562\
-5 104.7928125 11\
-.78515625 105.45\
-28125 11.7851562\
-5 106.1328125 C1\
-2.44515625 106.1\
-328125 13.105156\
-25 106.1328125 1\
-3.78515625 106.1\
-328125 C13.78515\
-625 106.7928125 \
-13.78515625 107.\
-4528125 13.78515\
-625 108.1328125 \
-C14.44515625 108\
-.1328125 15.1051\
-5625 108.1328125\
- 15.78515625 108\
-.1328125 C17.785\
-15625 111.132812\
-5 17.78515625 11\
-1.1328125 17.785\
-15625 114.132812\
-5 C18.44515625 1\
-14.1328125 19.10\
-515625 114.13281\
-25 19.78515625 1\
-14.1328125 C19.7\
-8515625 114.7928\
-125 19.78515625 \
-115.4528125 19.7\
-8515625 116.1328\
-125 C20.65140625\
- 116.5040625 20.\
-65140625 116.504\
-0625 21.53515625\
- 116.8828125 C24\
-.11455604 118.31\
-581238 25.846372\
-17 119.91705926 \
-27.78515625 122.\
-1328125 C27.7851\
-5625 122.7928125\
- 27.78515625 123\
-.4528125 27.7851\
-5625 124.1328125\
- C28.44515625 12\
-4.1328125 29.105\
-15625 124.132812\
-5 29.78515625 12\
-4.1328125 C29.78\
-515625 124.79281\
-25 29.78515625 1\
-25.4528125 29.78\
-515625 126.13281\
-25 C30.42453125 \
-126.3596875 31.0\
-6390625 126.5865\
-625 31.72265625 \
-126.8203125 C33.\
-78515625 128.132\
-8125 33.78515625\
- 128.1328125 34.\
-59765625 130.507\
-8125 C34.7777126\
-4 133.02860201 3\
-4.57836878 134.7\
-531749 33.785156\
-25 137.1328125 C\
-33.12515625 137.\
-1328125 32.46515\
-625 137.1328125 \
-31.78515625 137.\
-1328125 C31.7851\
-5625 137.7928125\
- 31.78515625 138\
-.4528125 31.7851\
-5625 139.1328125\
- C31.12515625 13\
-9.1328125 30.465\
-15625 139.132812\
-5 29.78515625 13\
-9.1328125 C29.78\
-515625 139.79281\
-25 29.78515625 1\
-40.4528125 29.78\
-515625 141.13281\
-25 C29.12515625 \
-141.1328125 28.4\
-6515625 141.1328\
-125 27.78515625 \
-141.1328125 C27.\
-78515625 141.792\
-8125 27.78515625\
- 142.4528125 27.\
-78515625 143.132\
-8125 C27.1251562\
-5 143.1328125 26\
-.46515625 143.13\
-28125 25.7851562\
-5 143.1328125 C2\
-5.78515625 143.7\
-928125 25.785156\
-25 144.4528125 2\
-5.78515625 145.1\
-328125 C25.12515\
-625 145.1328125 \
-24.46515625 145.\
-1328125 23.78515\
-625 145.1328125 \
-C23.78515625 145\
-.7928125 23.7851\
-5625 146.4528125\
- 23.78515625 147\
-.1328125 C22.465\
-15625 147.462812\
-5 21.14515625 14\
-7.7928125 19.785\
-15625 148.132812\
-5 C19.78515625 1\
-48.7928125 19.78\
-515625 149.45281\
-25 19.78515625 1\
-50.1328125 C19.1\
-2515625 150.1328\
-125 18.46515625 \
-150.1328125 17.7\
-8515625 150.1328\
-125 C17.45515625\
- 151.1228125 17.\
-12515625 152.112\
-8125 16.78515625\
- 153.1328125 C14\
-.80558683 154.82\
-369472 12.805704\
-29 156.49111722 \
-10.78515625 158.\
-1328125 C10.4551\
-5625 158.7928125\
- 10.12515625 159\
-.4528125 9.78515\
-625 160.1328125 \
-C9.12515625 160.\
-1328125 8.465156\
-25 160.1328125 7\
-.78515625 160.13\
-28125 C7.7851562\
-5 160.7928125 7.\
-78515625 161.452\
-8125 7.78515625 \
-162.1328125 C4.6\
-5157108 162.6444\
-1824 1.9054005 1\
-62.78657796 -1.2\
-1484375 162.1328\
-125 C-5.31338929\
- 158.90923736 -8\
-.02768982 154.82\
-409918 -10.21484\
-375 150.1328125 \
-C-10.87484375 15\
-0.1328125 -11.53\
-484375 150.13281\
-25 -12.21484375 \
-150.1328125 C-12\
-.21484375 149.47\
-28125 -12.214843\
-75 148.8128125 -\
-12.21484375 148.\
-1328125 C-12.771\
-71875 147.905937\
-5 -13.32859375 1\
-47.6790625 -13.9\
-0234375 147.4453\
-125 C-18.6980383\
- 144.72343181 -2\
-2.07654638 140.2\
-1110313 -25.5898\
-4375 136.0390625\
- C-26.7582721 13\
-4.66840616 -27.9\
-4855145 133.3162\
-6684 -29.1523437\
-5 131.9765625 C-\
-29.79171875 131.\
-265 -30.43109375\
- 130.5534375 -31\
-.08984375 129.82\
-03125 C-31.68539\
-062 129.16417969\
- -32.2809375 128\
-.50804687 -32.89\
-453125 127.83203\
-125 C-34.2148437\
-5 126.1328125 -3\
-4.21484375 126.1\
-328125 -34.21484\
-375 124.1328125 \
-C-35.53484375 12\
-3.8028125 -36.85\
-484375 123.47281\
-25 -38.21484375 \
-123.1328125 C-38\
-.21484375 122.47\
-28125 -38.214843\
-75 121.8128125 -\
-38.21484375 121.\
-1328125 C-38.874\
-84375 121.132812\
-5 -39.53484375 1\
-21.1328125 -40.2\
-1484375 121.1328\
-125 C-41.8007812\
-5 119.55859375 -\
-41.80078125 119.\
-55859375 -43.589\
-84375 117.445312\
-5 C-44.52570312 \
-116.34896484 -44\
-.52570312 116.34\
-896484 -45.48046\
-875 115.23046875\
- C-46.79660131 1\
-13.63865978 -48.\
-07693291 112.017\
-1677 -49.3398437\
-5 110.3828125 C-\
-51.20775087 107.\
-98677977 -51.207\
-75087 107.986779\
-77 -53.96484375 \
-105.9453125 C-54\
-.70734375 105.34\
-71875 -55.449843\
-75 104.7490625 -\
-56.21484375 104.\
-1328125 C-56.214\
-84375 103.472812\
-5 -56.21484375 1\
-02.8128125 -56.2\
-1484375 102.1328\
-125 C-56.7987890\
-6 101.88402344 -\
-57.38273437 101.\
-63523437 -57.984\
-375 101.37890625\
- C-60.52800659 9\
-9.95785813 -62.0\
-0892073 98.40088\
-335 -63.90234375\
- 96.1953125 C-64\
-.50433594 95.505\
-66406 -65.106328\
-13 94.81601562 -\
-65.7265625 94.10\
-546875 C-67.2148\
-4375 92.1328125 \
--67.21484375 92.\
-1328125 -68.2148\
-4375 89.1328125 \
-C-69.53131494 88\
-.43343718 -70.86\
-506526 87.765521\
-17 -72.21484375 \
-87.1328125 C-74.\
-19644486 83.1696\
-1028 -73.7723138\
-8 78.44108713 -7\
-3.21484375 74.13\
-28125 C-71.83460\
-931 71.41869477 \
--70.55000904 70.\
-18998192 -68.214\
-84375 68.1328125\
- C-67.55484375 6\
-8.1328125 -66.89\
-484375 68.132812\
-5 -66.21484375 6\
-8.1328125 C-66.2\
-1484375 67.47281\
-25 -66.21484375 \
-66.8128125 -66.2\
-1484375 66.13281\
-25 C-65.55484375\
- 66.1328125 -64.\
-89484375 66.1328\
-125 -64.21484375\
- 66.1328125 C-63\
-.96734375 65.514\
-0625 -63.7198437\
-5 64.8953125 -63\
-.46484375 64.257\
-8125 C-61.977440\
-06 61.72922623 -\
-60.77806366 61.4\
-1442246 -58.2148\
-4375 60.1328125 \
-C-57.51333223 58\
-.8174784 -56.849\
-5845 57.48163658\
- -56.21484375 56\
-.1328125 C-54.21\
-484375 53.882812\
-5 -54.21484375 5\
-3.8828125 -52.21\
-484375 52.132812\
-5 C-51.55484375 \
-52.1328125 -50.8\
-9484375 52.13281\
-25 -50.21484375 \
-52.1328125 C-49.\
-95445313 51.545 \
--49.6940625 50.9\
-571875 -49.42578\
-125 50.3515625 C\
--48.14014892 47.\
-99595229 -46.769\
-29631 46.4864350\
-5 -44.83984375 4\
-4.6328125 C-43.9\
-0591797 43.72595\
-703 -43.90591797\
- 43.72595703 -42\
-.953125 42.80078\
-125 C-42.3794921\
-9 42.25035156 -4\
-1.80585937 41.69\
-992187 -41.21484\
-375 41.1328125 C\
--40.49296875 40.\
-4109375 -39.7710\
-9375 39.6890625 \
--39.02734375 38.\
-9453125 C-37.787\
-71665 37.7056854\
- -36.53712334 36\
-.47695404 -35.27\
-734375 35.257812\
-5 C-33.5891834 3\
-3.51849578 -32.1\
-0065982 31.77022\
-495 -30.58984375\
- 29.8828125 C-29\
-.80609375 28.975\
-3125 -29.0223437\
-5 28.0678125 -28\
-.21484375 27.132\
-8125 C-27.554843\
-75 27.1328125 -2\
-6.89484375 27.13\
-28125 -26.214843\
-75 27.1328125 C-\
-26.21484375 26.4\
-728125 -26.21484\
-375 25.8128125 -\
-26.21484375 25.1\
-328125 C-25.5548\
-4375 25.1328125 \
--24.89484375 25.\
-1328125 -24.2148\
-4375 25.1328125 \
-C-24.12203125 24\
-.2665625 -24.122\
-03125 24.2665625\
- -24.02734375 23\
-.3828125 C-22.89\
-613585 20.250236\
-79 -20.83536574 \
-19.09820399 -18.\
-21484375 17.1328\
-125 C-17.8848437\
-5 16.4728125 -17\
-.55484375 15.812\
-8125 -17.2148437\
-5 15.1328125 C-1\
-6.55484375 15.13\
-28125 -15.894843\
-75 15.1328125 -1\
-5.21484375 15.13\
-28125 C-15.21484\
-375 14.4728125 -\
-15.21484375 13.8\
-128125 -15.21484\
-375 13.1328125 C\
--13.56481547 11.\
-77894314 -11.897\
-40505 10.4460310\
-8 -10.21484375 9\
-.1328125 C-9.884\
-84375 8.4728125 \
--9.55484375 7.81\
-28125 -9.2148437\
-5 7.1328125 C-8.\
-55484375 7.13281\
-25 -7.89484375 7\
-.1328125 -7.2148\
-4375 7.1328125 C\
--7.21484375 6.47\
-28125 -7.2148437\
-5 5.8128125 -7.2\
-1484375 5.132812\
-5 C-6.55484375 5\
-.1328125 -5.8948\
-4375 5.1328125 -\
-5.21484375 5.132\
-8125 C-4.7507812\
-5 4.17375 -4.750\
-78125 4.17375 -4\
-.27734375 3.1953\
-125 C-2.71514706\
- 0.16281305 -2.7\
-1514706 0.162813\
-05 0 0 Z \x22 fill=\
-\x22#000000\x22 transf\
-orm=\x22translate(7\
-3.21484375,217.8\
-671875)\x22/>\x0d\x0a<pat\
-h d=\x22M0 0 C4.351\
-73406 1.39374106\
- 6.93539732 4.95\
-922847 9.2929687\
-5 8.734375 C9.29\
-296875 9.394375 \
-9.29296875 10.05\
-4375 9.29296875 \
-10.734375 C9.952\
-96875 10.734375 \
-10.61296875 10.7\
-34375 11.2929687\
-5 10.734375 C11.\
-29296875 11.3943\
-75 11.29296875 1\
-2.054375 11.2929\
-6875 12.734375 C\
-11.95296875 12.7\
-34375 12.6129687\
-5 12.734375 13.2\
-9296875 12.73437\
-5 C15.00527123 1\
-4.35412059 16.66\
-460137 16.030269\
-6 18.29296875 17\
-.734375 C19.0973\
-4375 18.4975 19.\
-90171875 19.2606\
-25 20.73046875 2\
-0.046875 C29.292\
-96875 29.0270579\
-3 29.29296875 29\
-.02705793 29.292\
-96875 32.734375 \
-C30.22109375 33.\
-105625 30.221093\
-75 33.105625 31.\
-16796875 33.4843\
-75 C33.69655502 \
-34.97177869 34.0\
-1135879 36.17115\
-509 35.29296875 \
-38.734375 C37.24\
-317958 39.959654\
-48 37.24317958 3\
-9.95965448 39.29\
-296875 40.734375\
- C39.95296875 41\
-.064375 40.61296\
-875 41.394375 41\
-.29296875 41.734\
-375 C41.29296875\
- 42.394375 41.29\
-296875 43.054375\
- 41.29296875 43.\
-734375 C41.95296\
-875 43.734375 42\
-.61296875 43.734\
-375 43.29296875 \
-43.734375 C44.29\
-296875 45.401041\
-67 45.29296875 4\
-7.06770833 46.29\
-296875 48.734375\
- C48.77550293 51\
-.41819574 51.318\
-70139 53.755073 \
-54.16796875 56.0\
-46875 C57.386820\
-72 58.66687079 6\
-0.00404164 61.70\
-561974 62.679687\
-5 64.8671875 C64\
-.25063037 66.748\
-07585 64.2506303\
-7 66.74807585 66\
- 68.3515625 C67.\
-29296875 69.7343\
-75 67.29296875 6\
-9.734375 67.2929\
-6875 71.734375 C\
-67.89109375 71.9\
-81875 68.4892187\
-5 72.229375 69.1\
-0546875 72.48437\
-5 C71.68432776 7\
-3.95800872 72.72\
-474296 75.218224\
-43 74.29296875 7\
-7.734375 C74.832\
-03125 80.25 74.8\
-3203125 80.25 74\
-.91796875 82.984\
-375 C74.97210937\
- 83.87640625 75.\
-02625 84.7684375\
- 75.08203125 85.\
-6875 C73.8362129\
-2 90.49808564 70\
-.71956333 93.238\
-74515 67.2929687\
-5 96.734375 C66.\
-8413739 97.19652\
-405 66.38977905 \
-97.6586731 65.92\
-449951 98.134826\
-66 C62.20565854 \
-101.93087647 58.\
-43995737 105.678\
-75919 54.6679687\
-5 109.421875 C53\
-.53752494 110.54\
-728957 52.407315\
-03 111.67293912 \
-51.27734375 112.\
-79882812 C49.201\
-14637 114.866932\
-47 47.12360285 1\
-16.93366292 45.0\
-4443359 118.9987\
-793 C44.1364502 \
-119.90152588 43.\
-2284668 120.8042\
-7246 42.29296875\
- 121.734375 C41.\
-39529785 122.618\
-43018 40.4976269\
-5 123.50248535 3\
-9.57275391 124.4\
-1333008 C37.2097\
-4191 126.7300186\
-6 37.20974191 12\
-6.73001866 35.10\
-546875 129.54687\
-5 C34.50734375 1\
-30.26875 33.9092\
-1875 130.990625 \
-33.29296875 131.\
-734375 C32.63296\
-875 131.734375 3\
-1.97296875 131.7\
-34375 31.2929687\
-5 131.734375 C31\
-.29296875 132.39\
-4375 31.29296875\
- 133.054375 31.2\
-9296875 133.7343\
-75 C30.63296875 \
-133.734375 29.97\
-296875 133.73437\
-5 29.29296875 13\
-3.734375 C29.292\
-96875 134.394375\
- 29.29296875 135\
-.054375 29.29296\
-875 135.734375 C\
-28.63296875 135.\
-734375 27.972968\
-75 135.734375 27\
-.29296875 135.73\
-4375 C27.2929687\
-5 136.394375 27.\
-29296875 137.054\
-375 27.29296875 \
-137.734375 C26.6\
-3296875 137.7343\
-75 25.97296875 1\
-37.734375 25.292\
-96875 137.734375\
- C24.96296875 13\
-9.054375 24.6329\
-6875 140.374375 \
-24.29296875 141.\
-734375 C23.63296\
-875 141.734375 2\
-2.97296875 141.7\
-34375 22.2929687\
-5 141.734375 C22\
-.29296875 142.39\
-4375 22.29296875\
- 143.054375 22.2\
-9296875 143.7343\
-75 C19.72094831 \
-146.53333842 16.\
-98197345 149.022\
-39774 14.0429687\
-5 151.421875 C11\
-.27554681 153.43\
-86072 11.2755468\
-1 153.4386072 10\
-.29296875 155.73\
-4375 C9.63296875\
- 155.734375 8.97\
-296875 155.73437\
-5 8.29296875 155\
-.734375 C8.29296\
-875 156.394375 8\
-.29296875 157.05\
-4375 8.29296875 \
-157.734375 C7.63\
-296875 157.73437\
-5 6.97296875 157\
-.734375 6.292968\
-75 157.734375 C6\
-.29296875 158.39\
-4375 6.29296875 \
-159.054375 6.292\
-96875 159.734375\
- C5.63296875 159\
-.734375 4.972968\
-75 159.734375 4.\
-29296875 159.734\
-375 C3.96296875 \
-160.724375 3.632\
-96875 161.714375\
- 3.29296875 162.\
-734375 C1.668059\
-21 162.76135689 \
-0.04302242 162.7\
-8076257 -1.58203\
-125 162.796875 C\
--2.93941406 162.\
-81427734 -2.9394\
-1406 162.8142773\
-4 -4.32421875 16\
-2.83203125 C-6.7\
-0703125 162.7343\
-75 -6.70703125 1\
-62.734375 -8.707\
-03125 161.734375\
- C-8.70703125 16\
-1.074375 -8.7070\
-3125 160.414375 \
--8.70703125 159.\
-734375 C-9.36703\
-125 159.734375 -\
-10.02703125 159.\
-734375 -10.70703\
-125 159.734375 C\
--10.70703125 159\
-.074375 -10.7070\
-3125 158.414375 \
--10.70703125 157\
-.734375 C-11.367\
-03125 157.734375\
- -12.02703125 15\
-7.734375 -12.707\
-03125 157.734375\
- C-12.70703125 1\
-57.074375 -12.70\
-703125 156.41437\
-5 -12.70703125 1\
-55.734375 C-13.3\
-6703125 155.7343\
-75 -14.02703125 \
-155.734375 -14.7\
-0703125 155.7343\
-75 C-14.70703125\
- 155.074375 -14.\
-70703125 154.414\
-375 -14.70703125\
- 153.734375 C-15\
-.36703125 153.73\
-4375 -16.0270312\
-5 153.734375 -16\
-.70703125 153.73\
-4375 C-16.707031\
-25 153.074375 -1\
-6.70703125 152.4\
-14375 -16.707031\
-25 151.734375 C-\
-17.36703125 151.\
-734375 -18.02703\
-125 151.734375 -\
-18.70703125 151.\
-734375 C-20.8320\
-3125 149.859375 \
--20.83203125 149\
-.859375 -22.7070\
-3125 147.734375 \
-C-22.70703125 14\
-7.074375 -22.707\
-03125 146.414375\
- -22.70703125 14\
-5.734375 C-23.36\
-703125 145.73437\
-5 -24.02703125 1\
-45.734375 -24.70\
-703125 145.73437\
-5 C-24.70703125 \
-145.074375 -24.7\
-0703125 144.4143\
-75 -24.70703125 \
-143.734375 C-25.\
-36703125 143.734\
-375 -26.02703125\
- 143.734375 -26.\
-70703125 143.734\
-375 C-26.7070312\
-5 143.074375 -26\
-.70703125 142.41\
-4375 -26.7070312\
-5 141.734375 C-2\
-7.36703125 141.7\
-34375 -28.027031\
-25 141.734375 -2\
-8.70703125 141.7\
-34375 C-28.70703\
-125 141.074375 -\
-28.70703125 140.\
-414375 -28.70703\
-125 139.734375 C\
--29.36703125 139\
-.734375 -30.0270\
-3125 139.734375 \
--30.70703125 139\
-.734375 C-30.707\
-03125 139.074375\
- -30.70703125 13\
-8.414375 -30.707\
-03125 137.734375\
- C-31.36703125 1\
-37.734375 -32.02\
-703125 137.73437\
-5 -32.70703125 1\
-37.734375 C-33.8\
-8650859 133.6062\
-0432 -33.6232255\
-6 131.55552495 -\
-31.70703125 127.\
-734375 C-29.4296\
-875 125.05859375\
- -29.4296875 125\
-.05859375 -26.76\
-953125 122.42187\
-5 C-25.45662109 \
-121.09736328 -25\
-.45662109 121.09\
-736328 -24.11718\
-75 119.74609375 \
-C-21.70703125 11\
-7.734375 -21.707\
-03125 117.734375\
- -18.70703125 11\
-7.734375 C-18.48\
-015625 117.19812\
-5 -18.25328125 1\
-16.661875 -18.01\
-953125 116.10937\
-5 C-16.27662998 \
-112.95555366 -14\
-.03815821 110.48\
-352311 -11.70703\
-125 107.734375 C\
--12.5854216 107.\
-73294998 -13.463\
-81195 107.731524\
-96 -14.36882019 \
-107.73005676 C-2\
-2.65271734 107.7\
-1221659 -30.9360\
-8081 107.6705731\
-8 -39.21972179 1\
-07.60228443 C-43\
-.47833974 107.56\
-80143 -47.736598\
-96 107.54290448 \
--51.99536133 107\
-.53881836 C-56.1\
-0650234 107.5345\
-3534 -60.2168341\
-3 107.50607356 -\
-64.32772255 107.\
-46094322 C-65.89\
-492387 107.44796\
-811 -67.46222204\
- 107.44366063 -6\
-9.02947044 107.4\
-4822121 C-71.227\
-80763 107.453127\
-7 -73.42378002 1\
-07.42703966 -75.\
-62182617 107.393\
-79883 C-76.87203\
-049 107.38713699\
- -78.1222348 107\
-.38047516 -79.41\
-03241 107.373611\
-45 C-83.62482506\
- 106.55641341 -8\
-5.11416019 105.1\
-0073303 -87.7070\
-3125 101.734375 \
-C-88.32849121 99\
-.63473511 -88.32\
-849121 99.634735\
-11 -88.32226562 \
-97.54248047 C-88\
-.33157104 96.751\
-71112 -88.340876\
-46 95.96094177 -\
-88.35046387 95.1\
-4620972 C-88.334\
-0686 94.30647614\
- -88.31767334 93\
-.46674255 -88.30\
-078125 92.601562\
-5 C-88.30082153 \
-91.72791046 -88.\
-30086182 90.8542\
-5842 -88.3009033\
-2 89.95413208 C-\
-88.29555621 88.1\
-1339089 -88.2780\
-0802 86.27264965\
- -88.24902344 84\
-.43212891 C-88.2\
-0706432 81.61159\
-79 -88.20796497 \
-78.79344761 -88.\
-21484375 75.9726\
-5625 C-88.204354\
-37 74.18227505 -\
-88.19141762 72.3\
-9190615 -88.1757\
-8125 70.6015625 \
-C-88.17547913 69\
-.33588943 -88.17\
-547913 69.335889\
-43 -88.1751709 6\
-8.04464722 C-88.\
-05855642 62.2954\
-7977 -88.0585564\
-2 62.29547977 -8\
-6.62663269 60.00\
-984192 C-83.6620\
-6405 58.04005321\
- -81.10063263 58\
-.37583374 -77.57\
-348633 58.393798\
-83 C-76.85128403\
- 58.39336075 -76\
-.12908173 58.392\
-92267 -75.384994\
-51 58.39247131 C\
--72.9985752 58.3\
-9456086 -70.6128\
-5902 58.41789887\
- -68.2265625 58.\
-44140625 C-66.57\
-175582 58.447001\
-64 -64.91694417 \
-58.451272 -63.26\
-213074 58.454269\
-41 C-58.90709711\
- 58.46572276 -54\
-.55236374 58.495\
-19402 -50.197448\
-73 58.52838135 C\
--45.7534186 58.5\
-5907174 -41.3093\
-3994 58.57277253\
- -36.86523438 58\
-.58789062 C-28.1\
-4569556 58.62006\
-338 -19.42640076\
- 58.67126548 -10\
-.70703125 58.734\
-375 C-10.7070312\
-5 58.074375 -10.\
-70703125 57.4143\
-75 -10.70703125 \
-56.734375 C-11.3\
-6703125 56.73437\
-5 -12.02703125 5\
-6.734375 -12.707\
-03125 56.734375 \
-C-12.70703125 56\
-.074375 -12.7070\
-3125 55.414375 -\
-12.70703125 54.7\
-34375 C-13.36703\
-125 54.734375 -1\
-4.02703125 54.73\
-4375 -14.7070312\
-5 54.734375 C-16\
-.70703125 51.734\
-375 -16.70703125\
- 51.734375 -16.7\
-0703125 48.73437\
-5 C-17.36703125 \
-48.734375 -18.02\
-703125 48.734375\
- -18.70703125 48\
-.734375 C-18.707\
-03125 48.074375 \
--18.70703125 47.\
-414375 -18.70703\
-125 46.734375 C-\
-20.68703125 46.2\
-39375 -20.687031\
-25 46.239375 -22\
-.70703125 45.734\
-375 C-22.7070312\
-5 44.744375 -22.\
-70703125 43.7543\
-75 -22.70703125 \
-42.734375 C-23.3\
-6703125 42.73437\
-5 -24.02703125 4\
-2.734375 -24.707\
-03125 42.734375 \
-C-24.70703125 42\
-.074375 -24.7070\
-3125 41.414375 -\
-24.70703125 40.7\
-34375 C-26.02703\
-125 40.074375 -2\
-7.34703125 39.41\
-4375 -28.7070312\
-5 38.734375 C-28\
-.70703125 38.074\
-375 -28.70703125\
- 37.414375 -28.7\
-0703125 36.73437\
-5 C-29.34640625 \
-36.5075 -29.9857\
-8125 36.280625 -\
-30.64453125 36.0\
-46875 C-32.70703\
-125 34.734375 -3\
-2.70703125 34.73\
-4375 -33.6445312\
-5 32.484375 C-33\
-.72595476 28.901\
-74054 -32.485195\
-12 26.79281685 -\
-30.70703125 23.7\
-34375 C-30.04703\
-125 23.734375 -2\
-9.38703125 23.73\
-4375 -28.7070312\
-5 23.734375 C-28\
-.70703125 23.074\
-375 -28.70703125\
- 22.414375 -28.7\
-0703125 21.73437\
-5 C-27.02734375 \
-20.0078125 -27.0\
-2734375 20.00781\
-25 -24.83203125 \
-18.109375 C-24.1\
-1273438 17.47773\
-438 -23.3934375 \
-16.84609375 -22.\
-65234375 16.1953\
-125 C-20.7070312\
-5 14.734375 -20.\
-70703125 14.7343\
-75 -18.70703125 \
-14.734375 C-18.7\
-0703125 14.07437\
-5 -18.70703125 1\
-3.414375 -18.707\
-03125 12.734375 \
-C-18.04703125 12\
-.734375 -17.3870\
-3125 12.734375 -\
-16.70703125 12.7\
-34375 C-16.70703\
-125 12.074375 -1\
-6.70703125 11.41\
-4375 -16.7070312\
-5 10.734375 C-15\
-.38703125 10.734\
-375 -14.06703125\
- 10.734375 -12.7\
-0703125 10.73437\
-5 C-12.64515625 \
-10.198125 -12.58\
-328125 9.661875 \
--12.51953125 9.1\
-09375 C-10.28385\
-834 2.57433112 -\
-6.86821007 -0.41\
-416342 0 0 Z \x22 f\
-ill=\x22#000000\x22 tr\
-ansform=\x22transla\
-te(516.70703125,\
-222.265625)\x22/>\x0d\x0a\
-<path d=\x22M0 0 C2\
-.24940295 -0.081\
-19503 4.49964871\
- -0.13927819 6.7\
-5 -0.1875 C8.002\
-96875 -0.2223046\
-9 9.2559375 -0.2\
-5710937 10.54687\
-5 -0.29296875 C1\
-4.1381757 0.0117\
-2305 15.533239 0\
-.42734269 18 3 C\
-18 3.66 18 4.32 \
-18 5 C18.66 5 19\
-.32 5 20 5 C20 5\
-.66 20 6.32 20 7\
- C20.66 7 21.32 \
-7 22 7 C22 7.66 \
-22 8.32 22 9 C22\
-.66 9 23.32 9 24\
- 9 C24 9.66 24 1\
-0.32 24 11 C24.6\
-6 11 25.32 11 26\
- 11 C26 11.66 26\
- 12.32 26 13 C26\
-.66 13 27.32 13 \
-28 13 C28 13.66 \
-28 14.32 28 15 C\
-28.66 15 29.32 1\
-5 30 15 C30 15.6\
-6 30 16.32 30 17\
- C30.66 17 31.32\
- 17 32 17 C32 17\
-.66 32 18.32 32 \
-19 C32.639375 19\
-.2475 33.27875 1\
-9.495 33.9375 19\
-.75 C34.618125 2\
-0.1625 35.29875 \
-20.575 36 21 C36\
-.2165625 21.99 3\
-6.2165625 21.99 \
-36.4375 23 C36.6\
-23125 23.66 36.8\
-0875 24.32 37 25\
- C38.65697379 25\
-.69040574 40.325\
-5761 26.3530635 \
-42 27 C45.788263\
-02 30.38949849 4\
-8.97888504 34.29\
-17491 52.2851562\
-5 38.140625 C54.\
-09118439 40.1972\
-6499 54.09118439\
- 40.19726499 56.\
-9375 42.3125 C57\
-.618125 42.86937\
-5 58.29875 43.42\
-625 59 44 C59 44\
-.99 59 45.98 59 \
-47 C59.54011719 \
-47.06058594 60.0\
-8023438 47.12117\
-188 60.63671875 \
-47.18359375 C64.\
-0259064 48.35440\
-403 66.25798402 \
-50.64001699 68.8\
-125 53.0625 C69.\
-34439941 53.5576\
-6113 69.87629883\
- 54.05282227 70.\
-42431641 54.5629\
-8828 C74.0170832\
-7 57.95001644 77\
-.31961989 61.490\
-96464 80.4648437\
-5 65.30078125 C8\
-2.00337706 67.00\
-373796 83.577657\
-89 68.22910971 8\
-5.4375 69.5625 C\
-88 72 88 72 88.6\
-875 75.4375 C87.\
-79335174 80.0708\
-1371 86.35074799\
- 81.72903173 83 \
-85 C82.34 85 81.\
-68 85 81 85 C81 \
-85.66 81 86.32 8\
-1 87 C80.34 87 7\
-9.68 87 79 87 C7\
-9 87.66 79 88.32\
- 79 89 C78.34 89\
- 77.68 89 77 89 \
-C77 89.66 77 90.\
-32 77 91 C76.34 \
-91 75.68 91 75 9\
-1 C75 91.66 75 9\
-2.32 75 93 C74.3\
-4 93 73.68 93 73\
- 93 C73 93.66 73\
- 94.32 73 95 C72\
-.34 95 71.68 95 \
-71 95 C70.938125\
- 95.61875 70.876\
-25 96.2375 70.81\
-25 96.875 C70.54\
-4375 97.57625 70\
-.27625 98.2775 7\
-0 99 C68.3392715\
-1 99.68132451 66\
-.672233 100.3474\
-2127 65 101 C63.\
-90833725 102.933\
-30603 63.9083372\
-5 102.93330603 6\
-3 105 C61.25 106\
-.8125 61.25 106.\
-8125 59 108 C55.\
-75 107.6875 55.7\
-5 107.6875 53 10\
-7 C53 106.34 53 \
-105.68 53 105 C5\
-2.34 105 51.68 1\
-05 51 105 C51 10\
-4.34 51 103.68 5\
-1 103 C50.34 103\
- 49.68 103 49 10\
-3 C46.875 101.12\
-5 46.875 101.125\
- 45 99 C45 98.34\
- 45 97.68 45 97 \
-C44.34 97 43.68 \
-97 43 97 C43 96.\
-34 43 95.68 43 9\
-5 C42.34 95 41.6\
-8 95 41 95 C41 9\
-4.34 41 93.68 41\
- 93 C40.34 93 39\
-.68 93 39 93 C39\
- 92.34 39 91.68 \
-39 91 C38.34 91 \
-37.68 91 37 91 C\
-37 90.34 37 89.6\
-8 37 89 C36.34 8\
-9 35.68 89 35 89\
- C35 88.34 35 87\
-.68 35 87 C34.34\
- 87 33.68 87 33 \
-87 C33 86.34 33 \
-85.68 33 85 C32.\
-34 85 31.68 85 3\
-1 85 C31.0099927\
-5 86.34303947 31\
-.00999275 86.343\
-03947 31.0201873\
-8 87.71321106 C3\
-1.080259 96.1445\
-9849 31.12595428\
- 104.57591421 31\
-.15543652 113.00\
-746632 C31.17110\
-311 117.34239125\
- 31.19235934 121\
-.6771396 31.2263\
-1836 126.0119628\
-9 C31.25887664 1\
-30.19408088 31.2\
-7684553 134.3760\
-2885 31.28463173\
- 138.55826378 C3\
-1.29018162 140.1\
-5510422 31.30101\
-906 141.75193519\
- 31.31719017 143\
-.34870338 C31.33\
-891808 145.58269\
-094 31.34196896 \
-147.81597288 31.\
-34057617 150.050\
-04883 C31.350568\
-92 151.95866447 \
-31.35056892 151.\
-95866447 31.3607\
-6355 153.9058380\
-1 C31 157 31 157\
- 29.75144958 158\
-.91209412 C27.55\
-584531 160.27588\
-49 26.21526812 1\
-60.36862471 23.6\
-3623047 160.3564\
-4531 C22.3200422\
-7 160.36094696 2\
-2.32004227 160.3\
-6094696 20.97726\
-44 160.36553955 \
-C20.03343903 160\
-.35319275 19.089\
-61365 160.340845\
-95 18.1171875 16\
-0.328125 C16.662\
-17331 160.325315\
-25 16.66217331 1\
-60.32531525 15.1\
-7776489 160.3224\
-4873 C13.1284033\
-2 160.31572701 1\
-1.07905461 160.3\
-0181016 9.029785\
-16 160.28125 C5.\
-88041364 160.250\
-05363 2.73154205\
- 160.24027572 -0\
-.41796875 160.23\
-4375 C-2.4062561\
-5 160.22520694 -\
-4.39453843 160.2\
-148318 -6.382812\
-5 160.203125 C-7\
-.33068634 160.19\
-887512 -8.278560\
-18 160.19462524 \
--9.25515747 160.\
-19024658 C-10.12\
-631195 160.18063\
-904 -10.99746643\
- 160.17103149 -1\
-1.89501953 160.1\
-6113281 C-13.050\
-5986 160.1508908\
-1 -13.0505986 16\
-0.15089081 -14.2\
-2952271 160.1404\
-4189 C-16 160 -1\
-6 160 -17 159 C-\
-17.1241622 156.7\
-3079775 -17.1780\
-3748 154.4577355\
- -17.20532227 15\
-2.18530273 C-17.\
-21522186 151.473\
-14606 -17.225121\
-46 150.76098938 \
--17.23532104 150\
-.0272522 C-17.26\
-702212 147.66273\
-372 -17.29172724\
- 145.29819511 -1\
-7.31640625 142.9\
-3359375 C-17.336\
-96836 141.298339\
-48 -17.35796463 \
-139.66309062 -17\
-.37937927 138.02\
-784729 C-17.4346\
-7672 133.7157121\
-4 -17.48405201 1\
-29.40352842 -17.\
-53222656 125.091\
-30859 C-17.58238\
-572 120.69429176\
- -17.63810087 11\
-6.2973458 -17.69\
-335938 111.90039\
-062 C-17.8010347\
-3 103.26698693 -\
-17.90245871 94.6\
-335241 -18 86 C-\
-18.5775 86.495 -\
-19.155 86.99 -19\
-.75 87.5 C-22 89\
- -22 89 -26 89 C\
--26.66 90.32 -27\
-.32 91.64 -28 93\
- C-28.66 93 -29.\
-32 93 -30 93 C-3\
-0 93.99 -30 94.9\
-8 -30 96 C-30.66\
- 96 -31.32 96 -3\
-2 96 C-32 96.99 \
--32 97.98 -32 99\
- C-32.66 99 -33.\
-32 99 -34 99 C-3\
-4 99.66 -34 100.\
-32 -34 101 C-37.\
-61742323 104.625\
-46195 -41.093837\
-14 107.89210399 \
--46.3125 108.187\
-5 C-49.30232945 \
-106.86641257 -50\
-.98093493 105.56\
-265951 -53 103 C\
--53 102.34 -53 1\
-01.68 -53 101 C-\
-53.66 101 -54.32\
- 101 -55 101 C-5\
-5 100.34 -55 99.\
-68 -55 99 C-56.3\
-2 98.34 -57.64 9\
-7.68 -59 97 C-59\
- 96.34 -59 95.68\
- -59 95 C-59.66 \
-95 -60.32 95 -61\
- 95 C-61 94.34 -\
-61 93.68 -61 93 \
-C-61.66 93 -62.3\
-2 93 -63 93 C-63\
- 92.34 -63 91.68\
- -63 91 C-63.99 \
-90.67 -64.98 90.\
-34 -66 90 C-66 8\
-9.01 -66 88.02 -\
-66 87 C-66.66 87\
- -67.32 87 -68 8\
-7 C-68 86.34 -68\
- 85.68 -68 85 C-\
-68.66 85 -69.32 \
-85 -70 85 C-70 8\
-4.34 -70 83.68 -\
-70 83 C-70.66 83\
- -71.32 83 -72 8\
-3 C-74.1875 80.8\
-125 -74.1875 80.\
-8125 -76 78 C-75\
-.76361483 73.497\
-62286 -73.950149\
-7 71.4561127 -70\
-.81640625 68.355\
-46875 C-69.97142\
-578 67.51435547 \
--69.12644531 66.\
-67324219 -68.255\
-85938 65.8066406\
-2 C-66.92264648 \
-64.51016602 -66.\
-92264648 64.5101\
-6602 -65.5625 63\
-.1875 C-64.67755\
-859 62.30384766 \
--63.79261719 61.\
-42019531 -62.880\
-85938 60.5097656\
-2 C-56.28061052 \
-54 -56.28061052 \
-54 -54 54 C-53.5\
-978125 53.102812\
-5 -53.5978125 53\
-.1028125 -53.187\
-5 52.1875 C-51.9\
-9012525 49.98180\
-967 -50.95521016\
- 48.56416813 -49\
- 47 C-48.01 47 -\
-47.02 47 -46 47 \
-C-45.773125 46.4\
-43125 -45.54625 \
-45.88625 -45.312\
-5 45.3125 C-43.6\
-3281165 42.35304\
-91 -41.45866715 \
-40.33873216 -39 \
-38 C-38.443125 3\
-7.401875 -37.886\
-25 36.80375 -37.\
-3125 36.1875 C-3\
-6 35 -36 35 -34 \
-35 C-34 34.34 -3\
-4 33.68 -34 33 C\
--32.35546875 31.\
-30859375 -32.355\
-46875 31.3085937\
-5 -30.1875 29.43\
-75 C-29.47980469\
- 28.81746094 -28\
-.77210938 28.197\
-42188 -28.042968\
-75 27.55859375 C\
--26 26 -26 26 -2\
-3 25 C-22.773125\
- 24.29875 -22.54\
-625 23.5975 -22.\
-3125 22.875 C-20\
-.33209734 18.536\
-97512 -16.831993\
-86 15.77021223 -\
-13 13 C-12.34 13\
- -11.68 13 -11 1\
-3 C-11 12.34 -11\
- 11.68 -11 11 C-\
-10.34 11 -9.68 1\
-1 -9 11 C-9 10.3\
-4 -9 9.68 -9 9 C\
--8.34 9 -7.68 9 \
--7 9 C-7 8.34 -7\
- 7.68 -7 7 C-6.3\
-4 7 -5.68 7 -5 7\
- C-5 6.34 -5 5.6\
-8 -5 5 C-4.34 5 \
--3.68 5 -3 5 C-3\
- 4.34 -3 3.68 -3\
- 3 C-2.34 3 -1.6\
-8 3 -1 3 C-0.67 \
-2.01 -0.34 1.02 \
-0 0 Z \x22 fill=\x22#0\
-00000\x22 transform\
-=\x22translate(296,\
-19)\x22/>\x0d\x0a<path d=\
-\x22M0 0 C0.8574380\
-5 -0.0030011 1.7\
-148761 -0.006002\
-2 2.59829712 -0.\
-00909424 C3.5202\
-4872 0.00325256 \
-4.44220032 0.015\
-59937 5.39208984\
- 0.02832031 C6.3\
-3990326 0.030193\
-48 7.28771667 0.\
-03206665 8.26425\
-171 0.03399658 C\
-10.26653565 0.04\
-07178 12.2688064\
-5 0.05463367 14.\
-27099609 0.07519\
-531 C17.34794205\
- 0.10639375 20.4\
-243763 0.1161698\
-6 23.50146484 0.\
-12207031 C25.444\
-17947 0.13123831\
- 27.38688886 0.1\
-4161343 29.32958\
-984 0.15332031 C\
-30.71858994 0.15\
-969513 30.718589\
-94 0.15969513 32\
-.13565063 0.1661\
-9873 C32.9867843\
-6 0.17580627 33.\
-83791809 0.18541\
-382 34.71484375 \
-0.1953125 C35.46\
-74649 0.2021405 \
-36.22008606 0.20\
-896851 36.995513\
-92 0.21600342 C3\
-8.72802734 0.356\
-44531 38.7280273\
-4 0.35644531 39.\
-72802734 1.35644\
-531 C39.8224607 \
-3.65698367 39.84\
-544863 5.9604670\
-4 39.84155273 8.\
-26293945 C39.841\
-69876 8.9848497 \
-39.84184479 9.70\
-675995 39.841995\
-24 10.45054626 C\
-39.84129603 12.8\
-4759479 39.83350\
-33 15.24456654 3\
-9.82568359 17.64\
-160156 C39.82381\
-944 19.2992702 3\
-9.82239553 20.95\
-693938 39.821395\
-87 22.61460876 C\
-39.81757047 26.9\
-8598745 39.80774\
- 31.35733312 39.\
-79669189 35.7286\
-9873 C39.7864782\
-6 40.18598992 39\
-.78189836 44.643\
-28643 39.7768554\
-7 49.10058594 C3\
-9.76611774 57.85\
-255425 39.749041\
-06 66.60449568 3\
-9.72802734 75.35\
-644531 C40.38802\
-734 75.35644531 \
-41.04802734 75.3\
-5644531 41.72802\
-734 75.35644531 \
-C41.72802734 74.\
-69644531 41.7280\
-2734 74.03644531\
- 41.72802734 73.\
-35644531 C42.388\
-02734 73.3564453\
-1 43.04802734 73\
-.35644531 43.728\
-02734 73.3564453\
-1 C43.72802734 7\
-2.69644531 43.72\
-802734 72.036445\
-31 43.72802734 7\
-1.35644531 C45.0\
-4802734 71.35644\
-531 46.36802734 \
-71.35644531 47.7\
-2802734 71.35644\
-531 C47.72802734\
- 70.69644531 47.\
-72802734 70.0364\
-4531 47.72802734\
- 69.35644531 C48\
-.38802734 69.356\
-44531 49.0480273\
-4 69.35644531 49\
-.72802734 69.356\
-44531 C49.728027\
-34 68.69644531 4\
-9.72802734 68.03\
-644531 49.728027\
-34 67.35644531 C\
-51.60302734 65.2\
-3144531 51.60302\
-734 65.23144531 \
-53.72802734 63.3\
-5644531 C54.3880\
-2734 63.35644531\
- 55.04802734 63.\
-35644531 55.7280\
-2734 63.35644531\
- C55.72802734 62\
-.69644531 55.728\
-02734 62.0364453\
-1 55.72802734 61\
-.35644531 C56.38\
-802734 61.356445\
-31 57.04802734 6\
-1.35644531 57.72\
-802734 61.356445\
-31 C57.72802734 \
-60.69644531 57.7\
-2802734 60.03644\
-531 57.72802734 \
-59.35644531 C58.\
-38802734 59.3564\
-4531 59.04802734\
- 59.35644531 59.\
-72802734 59.3564\
-4531 C59.7280273\
-4 58.69644531 59\
-.72802734 58.036\
-44531 59.7280273\
-4 57.35644531 C6\
-0.38802734 57.35\
-644531 61.048027\
-34 57.35644531 6\
-1.72802734 57.35\
-644531 C61.72802\
-734 56.69644531 \
-61.72802734 56.0\
-3644531 61.72802\
-734 55.35644531 \
-C62.38802734 55.\
-35644531 63.0480\
-2734 55.35644531\
- 63.72802734 55.\
-35644531 C63.728\
-02734 54.6964453\
-1 63.72802734 54\
-.03644531 63.728\
-02734 53.3564453\
-1 C67.12645725 5\
-2.50683784 69.42\
-30545 52.1249345\
-2 72.72802734 53\
-.35644531 C74.57\
-958984 55.063476\
-56 74.57958984 5\
-5.06347656 76.35\
-302734 57.168945\
-31 C77.23861328 \
-58.19955078 77.2\
-3861328 58.19955\
-078 78.14208984 \
-59.25097656 C79.\
-62713313 61.2224\
-9954 80.7104194 \
-63.11468524 81.7\
-2802734 65.35644\
-531 C82.38802734\
- 65.35644531 83.\
-04802734 65.3564\
-4531 83.72802734\
- 65.35644531 C83\
-.72802734 66.016\
-44531 83.7280273\
-4 66.67644531 83\
-.72802734 67.356\
-44531 C84.388027\
-34 67.35644531 8\
-5.04802734 67.35\
-644531 85.728027\
-34 67.35644531 C\
-85.72802734 68.0\
-1644531 85.72802\
-734 68.67644531 \
-85.72802734 69.3\
-5644531 C86.3209\
-9609 69.61554688\
- 86.91396484 69.\
-87464844 87.5249\
-0234 70.14160156\
- C89.88660875 71\
-.44389002 91.236\
-8918 72.74943009\
- 92.97802734 74.\
-79394531 C93.759\
-19922 75.6891992\
-2 93.75919922 75\
-.68919922 94.556\
-15234 76.6025390\
-6 C95.72802734 7\
-8.35644531 95.72\
-802734 78.356445\
-31 95.72802734 8\
-1.35644531 C96.3\
-8802734 81.35644\
-531 97.04802734 \
-81.35644531 97.7\
-2802734 81.35644\
-531 C97.72802734\
- 83.66644531 97.\
-72802734 85.9764\
-4531 97.72802734\
- 88.35644531 C97\
-.10927734 88.603\
-94531 96.4905273\
-4 88.85144531 95\
-.85302734 89.106\
-44531 C93.610638\
-9 90.1660729 93.\
-6106389 90.16607\
-29 92.79052734 9\
-2.23144531 C91.3\
-5477792 95.10294\
-416 89.2381833 9\
-6.37167083 86.72\
-802734 98.356445\
-31 C85.53773978 \
-99.80409235 84.3\
-4847354 101.2527\
-0969 83.17724609\
- 102.71582031 C8\
-0.89265231 105.3\
-021529 78.264703\
-57 107.46166501 \
-75.64208984 109.\
-69628906 C74.070\
-21978 111.059645\
-75 72.57433916 1\
-12.51013349 71.1\
-0302734 113.9814\
-4531 C68.4521436\
-8 116.63232898 6\
-5.60713433 118.9\
-5718949 62.72802\
-734 121.35644531\
- C60.26664983 12\
-3.75129911 57.87\
-422036 126.20541\
-315 55.48583984 \
-128.67285156 C54\
-.67888672 129.49\
-65625 53.8719335\
-9 130.32027344 5\
-3.04052734 131.1\
-6894531 C52.2735\
-3516 131.9591406\
-3 51.50654297 13\
-2.74933594 50.71\
-630859 133.56347\
-656 C48.72802734\
- 135.35644531 48\
-.72802734 135.35\
-644531 46.728027\
-34 135.35644531 \
-C46.48052734 135\
-.97519531 46.233\
-02734 136.593945\
-31 45.97802734 1\
-37.23144531 C44.\
-52174095 139.707\
-13218 43.3499022\
-8 140.30769534 4\
-0.72802734 141.3\
-5644531 C40.7280\
-2734 142.0164453\
-1 40.72802734 14\
-2.67644531 40.72\
-802734 143.35644\
-531 C40.06802734\
- 143.35644531 39\
-.40802734 143.35\
-644531 38.728027\
-34 143.35644531 \
-C38.72802734 144\
-.01644531 38.728\
-02734 144.676445\
-31 38.72802734 1\
-45.35644531 C38.\
-06802734 145.356\
-44531 37.4080273\
-4 145.35644531 3\
-6.72802734 145.3\
-5644531 C36.7280\
-2734 146.0164453\
-1 36.72802734 14\
-6.67644531 36.72\
-802734 147.35644\
-531 C36.06802734\
- 147.35644531 35\
-.40802734 147.35\
-644531 34.728027\
-34 147.35644531 \
-C34.72802734 148\
-.01644531 34.728\
-02734 148.676445\
-31 34.72802734 1\
-49.35644531 C32.\
-85302734 151.481\
-44531 32.8530273\
-4 151.48144531 3\
-0.72802734 153.3\
-5644531 C30.0680\
-2734 153.3564453\
-1 29.40802734 15\
-3.35644531 28.72\
-802734 153.35644\
-531 C28.72802734\
- 154.01644531 28\
-.72802734 154.67\
-644531 28.728027\
-34 155.35644531 \
-C25.82871013 158\
-.93795481 24.036\
-79659 160.128153\
-42 19.45849609 1\
-60.92675781 C10.\
-38680397 161.371\
-16446 10.3868039\
-7 161.37116446 6\
-.26318359 158.84\
-863281 C4.475391\
-73 157.10105713 \
-3.01654017 155.4\
-9750798 1.728027\
-34 153.35644531 \
-C1.72802734 152.\
-69644531 1.72802\
-734 152.03644531\
- 1.72802734 151.\
-35644531 C1.1389\
-2578 151.0947656\
-3 0.54982422 150\
-.83308594 -0.057\
-12891 150.563476\
-56 C-2.389827 14\
-9.29221781 -3.87\
-551634 147.95414\
- -5.70947266 146\
-.04394531 C-6.60\
-666016 145.11582\
-031 -6.60666016 \
-145.11582031 -7.\
-52197266 144.168\
-94531 C-8.099472\
-66 143.57082031 \
--8.67697266 142.\
-97269531 -9.2719\
-7266 142.3564453\
-1 C-10.24989123 \
-141.41764348 -11\
-.22888594 140.47\
-99599 -12.209472\
-66 139.54394531 \
-C-14.27197266 13\
-7.35644531 -14.2\
-7197266 137.3564\
-4531 -14.2719726\
-6 135.35644531 C\
--14.86107422 135\
-.09476563 -15.45\
-017578 134.83308\
-594 -16.05712891\
- 134.56347656 C-\
-18.389827 133.29\
-221781 -19.87551\
-634 131.95414 -2\
-1.70947266 130.0\
-4394531 C-22.315\
-33203 129.421328\
-12 -22.92119141 \
-128.79871094 -23\
-.54541016 128.15\
-722656 C-24.1151\
-7578 127.5629687\
-5 -24.68494141 1\
-26.96871094 -25.\
-27197266 126.356\
-44531 C-27.86113\
-65 123.70413113 \
--30.4229455 121.\
-23063461 -33.271\
-97266 118.856445\
-31 C-36.11198963\
- 116.4897645 -38\
-.66037936 113.96\
-803861 -41.27197\
-266 111.35644531\
- C-42.03509766 1\
-10.79957031 -42.\
-79822266 110.242\
-69531 -43.584472\
-66 109.66894531 \
-C-44.14134766 10\
-9.23582031 -44.6\
-9822266 108.8026\
-9531 -45.2719726\
-6 108.35644531 C\
--45.27197266 107\
-.69644531 -45.27\
-197266 107.03644\
-531 -45.27197266\
- 106.35644531 C-\
-45.89072266 106.\
-10894531 -46.509\
-47266 105.861445\
-31 -47.14697266 \
-105.60644531 C-4\
-9.62265952 104.1\
-5015892 -50.2232\
-2268 102.9783202\
-5 -51.27197266 1\
-00.35644531 C-51\
-.93197266 100.35\
-644531 -52.59197\
-266 100.35644531\
- -53.27197266 10\
-0.35644531 C-55.\
-39697266 98.4814\
-4531 -55.3969726\
-6 98.48144531 -5\
-7.27197266 96.35\
-644531 C-57.2719\
-7266 95.69644531\
- -57.27197266 95\
-.03644531 -57.27\
-197266 94.356445\
-31 C-57.93197266\
- 94.35644531 -58\
-.59197266 94.356\
-44531 -59.271972\
-66 94.35644531 C\
--59.27197266 93.\
-69644531 -59.271\
-97266 93.0364453\
-1 -59.27197266 9\
-2.35644531 C-59.\
-93197266 92.3564\
-4531 -60.5919726\
-6 92.35644531 -6\
-1.27197266 92.35\
-644531 C-61.2719\
-7266 91.69644531\
- -61.27197266 91\
-.03644531 -61.27\
-197266 90.356445\
-31 C-62.26197266\
- 90.02644531 -63\
-.25197266 89.696\
-44531 -64.271972\
-66 89.35644531 C\
--64.55768694 80.\
-78501674 -64.557\
-68694 80.7850167\
-4 -62.27197266 7\
-7.35644531 C-61.\
-61197266 77.3564\
-4531 -60.9519726\
-6 77.35644531 -6\
-0.27197266 77.35\
-644531 C-60.2719\
-7266 76.69644531\
- -60.27197266 76\
-.03644531 -60.27\
-197266 75.356445\
-31 C-59.61197266\
- 75.35644531 -58\
-.95197266 75.356\
-44531 -58.271972\
-66 75.35644531 C\
--58.27197266 74.\
-69644531 -58.271\
-97266 74.0364453\
-1 -58.27197266 7\
-3.35644531 C-57.\
-61197266 73.3564\
-4531 -56.9519726\
-6 73.35644531 -5\
-6.27197266 73.35\
-644531 C-56.2719\
-7266 72.69644531\
- -56.27197266 72\
-.03644531 -56.27\
-197266 71.356445\
-31 C-55.61197266\
- 71.35644531 -54\
-.95197266 71.356\
-44531 -54.271972\
-66 71.35644531 C\
--54.27197266 70.\
-69644531 -54.271\
-97266 70.0364453\
-1 -54.27197266 6\
-9.35644531 C-53.\
-59134766 68.8201\
-9531 -52.9107226\
-6 68.28394531 -5\
-2.20947266 67.73\
-144531 C-48.4098\
-5157 64.65941124\
- -45.44541302 61\
-.05373109 -42.27\
-197266 57.356445\
-31 C-37.98684529\
- 52.58158911 -37\
-.98684529 52.581\
-58911 -34.271972\
-66 52.35644531 C\
--30.2958967 53.4\
-498662 -27.92163\
-516 55.21610457 \
--25.27197266 58.\
-35644531 C-25.27\
-197266 59.016445\
-31 -25.27197266 \
-59.67644531 -25.\
-27197266 60.3564\
-4531 C-24.343847\
-66 60.69675781 -\
-24.34384766 60.6\
-9675781 -23.3969\
-7266 61.04394531\
- C-21.27197266 6\
-2.35644531 -21.2\
-7197266 62.35644\
-531 -20.27197266\
- 64.91894531 C-1\
-9.94197266 65.72\
-332031 -19.61197\
-266 66.52769531 \
--19.27197266 67.\
-35644531 C-17.33\
-578841 68.028011\
-48 -17.33578841 \
-68.02801148 -15.\
-27197266 68.3564\
-4531 C-13.521972\
-66 69.79394531 -\
-13.52197266 69.7\
-9394531 -12.2719\
-7266 71.35644531\
- C-12.27197266 7\
-2.01644531 -12.2\
-7197266 72.67644\
-531 -12.27197266\
- 73.35644531 C-1\
-0.62197266 74.01\
-644531 -8.971972\
-66 74.67644531 -\
-7.27197266 75.35\
-644531 C-7.27863\
-449 74.46108566 \
--7.28529633 73.5\
-6572601 -7.29216\
-003 72.64323425 \
-C-7.35223165 64.\
-21184682 -7.3979\
-2694 55.7805311 \
--7.42740917 47.3\
-48979 C-7.443075\
-77 43.01405406 -\
-7.46433199 38.67\
-930572 -7.498291\
-02 34.34448242 C\
--7.5308493 30.16\
-236443 -7.548818\
-18 25.98041646 -\
-7.55660439 21.79\
-818153 C-7.56215\
-427 20.2013411 -\
-7.57299172 18.60\
-451013 -7.589162\
-83 17.00774193 C\
--7.61089074 14.7\
-7375438 -7.61394\
-161 12.54047243 \
--7.61254883 10.3\
-0639648 C-7.6192\
-1066 9.03398605 \
--7.6258725 7.761\
-57562 -7.6327362\
-1 6.4506073 C-7.\
-27197266 3.35644\
-531 -7.27197266 \
-3.35644531 -6.01\
-768494 1.4443512\
- C-3.84961481 0.\
-09323723 -2.5482\
-8469 -0.01231762\
- 0 0 Z \x22 fill=\x22#\
-000000\x22 transfor\
-m=\x22translate(281\
-.27197265625,417\
-.6435546875)\x22/>\x0d\
-\x0a</svg>\x0d\x0a\
-\x00\x00\x01\x0e\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M3 10C3\
- 9.72386 3.22386\
- 9.5 3.5 9.5H16.\
-5C16.7761 9.5 17\
- 9.72386 17 10C1\
-7 10.2761 16.776\
-1 10.5 16.5 10.5\
-H3.5C3.22386 10.\
-5 3 10.2761 3 10\
-Z\x22 fill=\x22#212121\
-\x22/>\x0d\x0a</svg>\x0d\x0a\
-\x00\x00\x02\xdd\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M3.2590\
-9 11.6021C3.9425\
-4 8.32689 6.7943\
-7 6 10 6C13.2057\
- 6 16.0574 8.326\
-88 16.7409 11.60\
-21C16.7974 11.87\
-25 17.0622 12.04\
-59 17.3325 11.98\
-95C17.6029 11.93\
-3 17.7763 11.668\
-2 17.7199 11.397\
-9C16.9425 7.6731\
-2 13.6934 5 10 5\
-C6.3066 5 3.0574\
-2 7.67311 2.2801\
-7 11.3979C2.2237\
-7 11.6682 2.3971\
-8 11.933 2.6675 \
-11.9895C2.93782 \
-12.0459 3.20268 \
-11.8725 3.25909 \
-11.6021ZM10 8C8.\
-067 8 6.5 9.567 \
-6.5 11.5C6.5 13.\
-433 8.067 15 10 \
-15C11.933 15 13.\
-5 13.433 13.5 11\
-.5C13.5 9.567 11\
-.933 8 10 8ZM7.5\
- 11.5C7.5 10.119\
-3 8.61929 9 10 9\
-C11.3807 9 12.5 \
-10.1193 12.5 11.\
-5C12.5 12.8807 1\
-1.3807 14 10 14C\
-8.61929 14 7.5 1\
-2.8807 7.5 11.5Z\
-\x22 fill=\x22#212121\x22\
-/>\x0d\x0a</svg>\x0d\x0a\
-\x00\x00\x02a\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M10 13C\
-10.5523 13 11 12\
-.5523 11 12C11 1\
-1.4477 10.5523 1\
-1 10 11C9.44771 \
-11 9 11.4477 9 1\
-2C9 12.5523 9.44\
-771 13 10 13ZM6 \
-6H7V5C7 3.34315 \
-8.34315 2 10 2C1\
-1.6569 2 13 3.34\
-315 13 5V6H14C15\
-.6569 6 17 7.343\
-15 17 9V15C17 16\
-.6569 15.6569 18\
- 14 18H6C4.34315\
- 18 3 16.6569 3 \
-15V9C3 7.34315 4\
-.34315 6 6 6ZM10\
- 3C8.89543 3 8 3\
-.89543 8 5V6H12V\
-5C12 3.89543 11.\
-1046 3 10 3ZM16 \
-9C16 7.89543 15.\
-1046 7 14 7H6C4.\
-89543 7 4 7.8954\
-3 4 9V15C4 16.10\
-46 4.89543 17 6 \
-17H14C15.1046 17\
- 16 16.1046 16 1\
-5V9Z\x22 fill=\x22#212\
-121\x22/>\x0d\x0a</svg>\x0d\x0a\
-\
-\x00\x00\x01<\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M17.222\
-1 8.68458C18.258\
-6 9.25438 18.258\
-6 10.7437 17.222\
-1 11.3135L7.2225\
-9 16.8105C6.2229\
-2 17.36 5 16.636\
-7 5 15.496L5 4.5\
-0214C5 3.36137 6\
-.22292 2.63812 7\
-.22259 3.18766L1\
-7.2221 8.68458Z\x22\
- fill=\x22#3fc663\x22/\
->\x0d\x0a</svg>\x0d\x0a\
-\x00\x00\x04\x01\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M9 2.5C\
-9 2.22386 8.7761\
-4 2 8.5 2C8.2238\
-6 2 8 2.22386 8 \
-2.5V6.52468C5.63\
-789 6.75931 3.75\
-943 8.63783 3.52\
-49 11H8.00021L8 \
-6.52468C8.16438 \
-6.50837 8.33132 \
-6.5 8.5 6.5C8.66\
-875 6.5 8.83555 \
-6.50836 9 6.5246\
-9V2.5ZM2.5 11L3.\
-5249 11C3.50857 \
-11.1644 3.5 11.3\
-313 3.5 11.5C3.5\
- 11.6687 3.50836\
- 11.8355 3.52469\
- 12H2.5C2.22386 \
-12 2 11.7761 2 1\
-1.5C2 11.2239 2.\
-22386 11 2.5 11Z\
-M8 17.5V16.4753C\
-8.16445 16.4916 \
-8.33125 16.5 8.5\
- 16.5C8.66875 16\
-.5 8.83555 16.49\
-16 9 16.4753V17.\
-5C9 17.7761 8.77\
-614 18 8.5 18C8.\
-22386 18 8 17.77\
-61 8 17.5ZM13.47\
-55 12H17.5C17.77\
-61 12 18 11.7761\
- 18 11.5C18 11.2\
-239 17.7761 11 1\
-7.5 11H13.4753C1\
-3.4916 11.1645 1\
-3.5 11.3313 13.5\
- 11.5C13.5 11.66\
-87 13.4918 11.83\
-56 13.4755 12L9.\
-00021 12L9 16.47\
-53C11.3622 16.24\
-08 13.241 14.362\
-2 13.4755 12ZM8 \
-16.4753C5.63779 \
-16.2408 3.75922 \
-14.3622 3.52469 \
-12L8.00021 12L8 \
-16.4753ZM9.00021\
- 11L13.4753 11C1\
-3.2408 8.63779 1\
-1.3622 6.75922 9\
- 6.52469L9.00021\
- 11Z\x22 fill=\x22#212\
-121\x22/>\x0d\x0a</svg>\x0d\x0a\
-\
-\x00\x00\x02|\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 width=\x2224\
-\x22 height=\x2224\x22 vi\
-ewBox=\x220 0 24 24\
-\x22 fill=\x22none\x22 st\
-roke=\x22currentCol\
-or\x22 stroke-width\
-=\x222\x22 stroke-line\
-cap=\x22round\x22 stro\
-ke-linejoin=\x22rou\
-nd\x22 class=\x22icon \
-icon-tabler icon\
-s-tabler-outline\
- icon-tabler-aff\
-iliate\x22><path st\
-roke=\x22none\x22 d=\x22M\
-0 0h24v24H0z\x22 fi\
-ll=\x22none\x22 /><pat\
-h d=\x22M5.931 6.93\
-6l1.275 4.249m5.\
-607 5.609l4.251 \
-1.275\x22 /><path d\
-=\x22M11.683 12.317\
-l5.759 -5.759\x22 /\
-><path d=\x22M4 5.5\
-a1.5 1.5 0 1 0 3\
- 0a1.5 1.5 0 1 0\
- -3 0\x22 /><path d\
-=\x22M17 5.5a1.5 1.\
-5 0 1 0 3 0a1.5 \
-1.5 0 1 0 -3 0\x22 \
-/><path d=\x22M17 1\
-8.5a1.5 1.5 0 1 \
-0 3 0a1.5 1.5 0 \
-1 0 -3 0\x22 /><pat\
-h d=\x22M4 15.5a4.5\
- 4.5 0 1 0 9 0a4\
-.5 4.5 0 1 0 -9 \
-0\x22 /></svg>\
-\x00\x00\x03~\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M3 5.5C\
-3.55228 5.5 4 5.\
-05228 4 4.5C4 3.\
-94772 3.55228 3.\
-5 3 3.5C2.44772 \
-3.5 2 3.94772 2 \
-4.5C2 5.05228 2.\
-44772 5.5 3 5.5Z\
-M6 4.5C6 4.22386\
- 6.22386 4 6.5 4\
-H17.5C17.7761 4 \
-18 4.22386 18 4.\
-5C18 4.77614 17.\
-7761 5 17.5 5H6.\
-5C6.22386 5 6 4.\
-77614 6 4.5ZM6 9\
-.5C6 9.22386 6.2\
-2386 9 6.5 9H17.\
-5C17.7761 9 18 9\
-.22386 18 9.5C18\
- 9.77614 17.7761\
- 10 17.5 10H6.5C\
-6.22386 10 6 9.7\
-7614 6 9.5ZM10.5\
- 14C10.2239 14 1\
-0 14.2239 10 14.\
-5C10 14.7761 10.\
-2239 15 10.5 15H\
-17.5C17.7761 15 \
-18 14.7761 18 14\
-.5C18 14.2239 17\
-.7761 14 17.5 14\
-H10.5ZM8 14.5C8 \
-15.0523 7.55228 \
-15.5 7 15.5C6.44\
-772 15.5 6 15.05\
-23 6 14.5C6 13.9\
-477 6.44772 13.5\
- 7 13.5C7.55228 \
-13.5 8 13.9477 8\
- 14.5ZM3 10.5C3.\
-55228 10.5 4 10.\
-0523 4 9.5C4 8.9\
-4772 3.55228 8.5\
- 3 8.5C2.44772 8\
-.5 2 8.94772 2 9\
-.5C2 10.0523 2.4\
-4772 10.5 3 10.5\
-Z\x22 fill=\x22#212121\
-\x22/>\x0d\x0a</svg>\x0d\x0a\
-\x00\x00\x02\x19\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M10 1C1\
-2.2091 1 14 2.79\
-086 14 5V7.0498C\
-15.1411 7.28142 \
-16 8.29051 16 9.\
-5V15.5C16 16.880\
-7 14.8807 18 13.\
-5 18H6.5C5.11929\
- 18 4 16.8807 4 \
-15.5V9.5C4 8.290\
-51 4.85886 7.281\
-42 6 7.0498V5C6 \
-2.79086 7.79086 \
-1 10 1ZM10 11.5C\
-9.44772 11.5 9 1\
-1.9477 9 12.5C9 \
-13.0523 9.44772 \
-13.5 10 13.5C10.\
-5523 13.5 11 13.\
-0523 11 12.5C11 \
-11.9477 10.5523 \
-11.5 10 11.5ZM10\
- 2C8.34315 2 7 3\
-.34315 7 5V7H13V\
-5C13 3.34315 11.\
-6569 2 10 2Z\x22 fi\
-ll=\x22#212121\x22/>\x0d\x0a\
-</svg>\x0d\x0a\
-\x00\x00\x01u\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M5 2C3.\
-89543 2 3 2.8954\
-3 3 4V16C3 17.10\
-46 3.89543 18 5 \
-18H7C8.10457 18 \
-9 17.1046 9 16V4\
-C9 2.89543 8.104\
-57 2 7 2H5ZM13 2\
-C11.8954 2 11 2.\
-89543 11 4V16C11\
- 17.1046 11.8954\
- 18 13 18H15C16.\
-1046 18 17 17.10\
-46 17 16V4C17 2.\
-89543 16.1046 2 \
-15 2H13Z\x22 fill=\x22\
-#212121\x22/>\x0d\x0a</sv\
-g>\x0d\x0a\
-\x00\x00\x01\xc2\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M12.268\
-6 15.794C11.9687\
- 16.0797 11.494 \
-16.0681 11.2083 \
-15.7682L6.20694 \
-10.5178C5.93102 \
-10.2281 5.93102 \
-9.77284 6.20694 \
-9.48318L11.2083 \
-4.23271C11.494 3\
-.93279 11.9687 3\
-.92125 12.2686 4\
-.20694C12.5685 4\
-.49264 12.5801 4\
-.96737 12.2944 5\
-.26729L7.7858 10\
-.0005L12.2944 14\
-.7336C12.5801 15\
-.0336 12.5685 15\
-.5083 12.2686 15\
-.794Z\x22 fill=\x22#21\
-2121\x22/>\x0d\x0a</svg>\x0d\
-\x0a\
-\x00\x00\x02\xfc\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M10 3C6\
-.13401 3 3 6.134\
-01 3 10C3 13.606\
-1 5.72677 16.575\
-3 9.23091 16.958\
-2L9.05716 17.653\
-2C9.03314 17.749\
-3 9.01684 17.844\
-8 9.00774 17.939\
-1C5.05768 17.450\
-4 2 14.0823 2 10\
-C2 5.58172 5.581\
-72 2 10 2C14.120\
-6 2 17.5136 5.11\
-536 17.9521 9.11\
-922C17.6198 9.02\
-044 17.2732 8.98\
-304 16.9301 9.00\
-703C16.4479 5.61\
-131 13.5289 3 10\
- 3ZM10.9798 15.3\
-772L15.8092 10.5\
-478C16.5395 9.81\
-741 17.7237 9.81\
-741 18.454 10.54\
-78C19.1843 11.27\
-81 19.1843 12.46\
-22 18.454 13.192\
-6L13.6246 18.022\
-C13.343 18.3036 \
-12.9902 18.5033 \
-12.6039 18.5999L\
-11.106 18.9744C1\
-0.4546 19.1372 9\
-.86451 18.5472 1\
-0.0274 17.8958L1\
-0.4018 16.3979C1\
-0.4984 16.0116 1\
-0.6982 15.6588 1\
-0.9798 15.3772Z\x22\
- fill=\x22#212121\x22/\
->\x0d\x0a</svg>\x0d\x0a\
-\x00\x00\x037\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M13.969\
-5 3.1977C13.9895\
- 3.29534 14 3.39\
-645 14 3.5V16.5C\
-14 17.3284 13.32\
-84 18 12.5 18H7.\
-5C6.72335 18 6.0\
-8456 17.4097 6.0\
-0774 16.6534C6.0\
-0262 16.6029 6 1\
-6.5518 6 16.5V3.\
-5C6 2.72335 6.59\
-025 2.08456 7.34\
-663 2.00774C7.39\
-706 2.00262 7.44\
-822 2 7.5 2H12.5\
-C13.2249 2 13.82\
-97 2.51417 13.96\
-95 3.1977ZM7 14.\
-5L7 15.5H8.5C8.7\
-7614 15.5 9 15.2\
-761 9 15C9 14.72\
-39 8.77614 14.5 \
-8.5 14.5H7ZM7 4.\
-5L7 5.5H8.5C8.77\
-614 5.5 9 5.2761\
-4 9 5C9 4.72386 \
-8.77614 4.5 8.5 \
-4.5H7ZM7 7V8H9.5\
-C9.77614 8 10 7.\
-77614 10 7.5C10 \
-7.22386 9.77614 \
-7 9.5 7H7ZM7 9.5\
-V10.5H8.5C8.7761\
-4 10.5 9 10.2761\
- 9 10C9 9.72386 \
-8.77614 9.5 8.5 \
-9.5H7ZM7 12.0038\
-V13.0038H9.5C9.7\
-7614 13.0038 10 \
-12.78 10 12.5038\
-C10 12.2277 9.77\
-614 12.0038 9.5 \
-12.0038H7Z\x22 fill\
-=\x22#212121\x22/>\x0d\x0a</\
-svg>\x0d\x0a\
-\x00\x00\x0em\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M14.877\
-7 0.282251L15.22\
-6 1.35305C15.334\
-3 1.67859 15.517\
-1 1.97441 15.759\
-9 2.21699C16.002\
-6 2.45957 16.298\
-7 2.64223 16.624\
-5 2.75044L17.696\
-1 3.09845L17.717\
-5 3.10381C17.800\
-1 3.13292 17.871\
-6 3.18692 17.922\
-2 3.25836C17.972\
-8 3.3298 18 3.41\
-516 18 3.50268C1\
-8 3.5902 17.9728\
- 3.67556 17.9222\
- 3.747C17.8716 3\
-.81844 17.8001 3\
-.87244 17.7175 3\
-.90155L16.6459 4\
-.24956C16.3201 4\
-.35778 16.0241 4\
-.54044 15.7813 4\
-.78302C15.5385 5\
-.0256 15.3558 5.\
-32141 15.2475 5.\
-64696L14.8992 6.\
-71775C14.87 6.80\
-029 14.816 6.871\
-75 14.7445 6.922\
-31C14.673 6.9728\
-6 14.5876 7.0000\
-1 14.5 7.00001C1\
-4.4124 7.00001 1\
-4.327 6.97286 14\
-.2555 6.92231C14\
-.2484 6.91732 14\
-.2416 6.91213 14\
-.2349 6.90675C14\
-.1736 6.85755 14\
-.1271 6.79215 14\
-.1008 6.71775L13\
-.7525 5.64696C13\
-.7338 5.59014 13\
-.7128 5.53422 13\
-.6897 5.47932C13\
-.5796 5.21872 13\
-.4202 4.98116 13\
-.2197 4.77999C13\
-.1815 4.74173 13\
-.1421 4.70496 13\
-.1014 4.66973C12\
-.883 4.48064 12.\
-6292 4.33588 12.\
-3541 4.24421L11.\
-2825 3.8962C11.1\
-999 3.86708 11.1\
-284 3.81308 11.0\
-778 3.74164C11.0\
-272 3.6702 11 3.\
-58484 11 3.49733\
-C11 3.40981 11.0\
-272 3.32445 11.0\
-778 3.25301C11.1\
-284 3.18157 11.1\
-999 3.12757 11.2\
-825 3.09845L12.3\
-541 2.75044C12.6\
-759 2.63941 12.9\
-677 2.45549 13.2\
-066 2.21307C13.4\
-454 1.97065 13.6\
-25 1.67631 13.73\
-11 1.35305L14.07\
-94 0.282251C14.1\
-085 0.19972 14.1\
-626 0.128252 14.\
-2341 0.0776997C1\
-4.3056 0.0271473\
- 14.391 0 14.478\
-6 0C14.5662 0 14\
-.6516 0.0271473 \
-14.7231 0.077699\
-7C14.7946 0.1282\
-52 14.8486 0.199\
-72 14.8777 0.282\
-251ZM19.7829 8.2\
-1319L19.0175 7.9\
-6461C18.7848 7.8\
-8731 18.5733 7.7\
-5684 18.3999 7.5\
-8357C18.2265 7.4\
-103 18.0959 7.19\
-9 18.0186 6.9664\
-7L17.7698 6.2016\
-1C17.749 6.14266\
- 17.7104 6.09161\
- 17.6593 6.05551\
-C17.6083 6.0194 \
-17.5473 6.00001 \
-17.4847 6.00001C\
-17.4221 6.00001 \
-17.3611 6.0194 1\
-7.31 6.05551C17.\
-259 6.09161 17.2\
-204 6.14266 17.1\
-996 6.20161L16.9\
-508 6.96647C16.8\
-75 7.19737 16.74\
-67 7.40762 16.57\
-61 7.58077C16.40\
-55 7.75392 16.19\
-71 7.8853 15.967\
-2 7.96461L15.201\
-8 8.21319C15.142\
-8 8.23398 15.091\
-7 8.27255 15.055\
-5 8.32358C15.019\
-4 8.37461 15 8.4\
-3558 15 8.4981C1\
-5 8.56061 15.019\
-4 8.62158 15.055\
-5 8.67261C15.091\
-7 8.72364 15.142\
-8 8.76221 15.201\
-8 8.78301L15.967\
-2 9.03158C16.200\
-3 9.10926 16.412\
- 9.24032 16.5855\
- 9.41428C16.7589\
- 9.58824 16.8893\
- 9.80031 16.9661\
- 10.0335L17.2149\
- 10.7984C17.2357\
- 10.8574 17.2743\
- 10.9084 17.3254\
- 10.9445C17.3764\
- 10.9806 17.4374\
- 11 17.5 11C17.5\
-626 11 17.6236 1\
-0.9806 17.6746 1\
-0.9445C17.7257 1\
-0.9084 17.7643 1\
-0.8574 17.7851 1\
-0.7984L18.0339 1\
-0.0335C18.1113 9\
-.80101 18.2418 9\
-.58972 18.4152 9\
-.41645C18.5886 9\
-.24317 18.8001 9\
-.11271 19.0328 9\
-.03541L19.7982 8\
-.78683C19.8572 8\
-.76603 19.9083 8\
-.72746 19.9445 8\
-.67643C19.9806 8\
-.62541 20 8.5644\
-3 20 8.50192C20 \
-8.43941 19.9806 \
-8.37844 19.9445 \
-8.32741C19.9083 \
-8.27638 19.8572 \
-8.23781 19.7982 \
-8.21701L19.7829 \
-8.21319ZM17.5018\
- 12C17.2396 11.9\
-99 16.9871 11.92\
-27 16.7717 11.78\
-01C15.9842 14.78\
-39 13.2509 17 10\
- 17C8.7837 17 7.\
-61362 16.6898 6.\
-57701 16.1075L6.\
-4903 16.0691L6.3\
-9873 16.0479C6.3\
-3662 16.0396 6.2\
-7294 16.0429 6.2\
-1104 16.0583L3.1\
-87 16.812L3.9427\
-4 13.7912L3.9569\
-2 13.6973C3.9621\
- 13.603 3.94046 \
-13.5084 3.89352 \
-13.4249C3.31054 \
-12.3878 3 11.217\
- 3 10C3 6.13401 \
-6.13401 3 10 3C1\
-0.0293 3 10.0586\
- 3.00018 10.0878\
- 3.00054C10.1304\
- 2.88577 10.1881\
- 2.77667 10.2602\
- 2.67477C10.4304\
- 2.43437 10.6706\
- 2.25408 10.9509\
- 2.15392L11.1669\
- 2.08449C10.786 \
-2.02883 10.3964 \
-2 10 2C5.58172 2\
- 2 5.58172 2 10L\
-2.00738 10.3463L\
-2.03275 10.7283C\
-2.12433 11.7422 \
-2.4066 12.7186 2\
-.86169 13.6153L2\
-.925 13.735L2.01\
-493 17.3787L2.00\
-114 17.4624L2.00\
-131 17.5438C2.02\
-622 17.8369 2.31\
-127 18.0625 2.62\
-109 17.9851L6.26\
-6 17.075L6.38669\
- 17.1393C7.49591\
- 17.7018 8.72679\
- 18 10 18C13.733\
-9 18 16.8704 15.\
-4419 17.7524 11.\
-9826C17.6705 11.\
-9946 17.5866 11.\
-9998 17.5018 12Z\
-\x22 fill=\x22#212121\x22\
-/>\x0d\x0a</svg>\x0d\x0a\
-\x00\x00\x02\xb1\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M6 3C4.\
-34315 3 3 4.3431\
-5 3 6V14C3 15.65\
-69 4.34315 17 6 \
-17H14C15.6569 17\
- 17 15.6569 17 1\
-4V6C17 4.34315 1\
-5.6569 3 14 3H6Z\
-M4 6C4 4.89543 4\
-.89543 4 6 4H14C\
-15.1046 4 16 4.8\
-9543 16 6V14C16 \
-15.1046 15.1046 \
-16 14 16H6C4.895\
-43 16 4 15.1046 \
-4 14V6ZM13.8536 \
-7.85355C14.0488 \
-7.65829 14.0488 \
-7.34171 13.8536 \
-7.14645C13.6583 \
-6.95118 13.3417 \
-6.95118 13.1464 \
-7.14645L8.5 11.7\
-929L6.85355 10.1\
-464C6.65829 9.95\
-118 6.34171 9.95\
-118 6.14645 10.1\
-464C5.95118 10.3\
-417 5.95118 10.6\
-583 6.14645 10.8\
-536L8.14645 12.8\
-536C8.34171 13.0\
-488 8.65829 13.0\
-488 8.85355 12.8\
-536L13.8536 7.85\
-355Z\x22 fill=\x22#212\
-121\x22/>\x0d\x0a</svg>\x0d\x0a\
-\
-\x00\x00\x01\xce\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 width=\x2224\
-\x22 height=\x2224\x22 vi\
-ewBox=\x220 0 24 24\
-\x22 fill=\x22none\x22 st\
-roke=\x22currentCol\
-or\x22 stroke-width\
-=\x222\x22 stroke-line\
-cap=\x22round\x22 stro\
-ke-linejoin=\x22rou\
-nd\x22 class=\x22icon \
-icon-tabler icon\
-s-tabler-outline\
- icon-tabler-cat\
-egory-2\x22><path s\
-troke=\x22none\x22 d=\x22\
-M0 0h24v24H0z\x22 f\
-ill=\x22none\x22 /><pa\
-th d=\x22M14 4h6v6h\
--6l0 -6\x22 /><path\
- d=\x22M4 14h6v6h-6\
-l0 -6\x22 /><path d\
-=\x22M14 17a3 3 0 1\
- 0 6 0a3 3 0 1 0\
- -6 0\x22 /><path d\
-=\x22M4 7a3 3 0 1 0\
- 6 0a3 3 0 1 0 -\
-6 0\x22 /></svg>\
-\x00\x00\x01\xc4\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M4.2069\
-4 12.2667C3.9212\
-5 11.9667 3.9327\
-9 11.492 4.23271\
- 11.2063L9.48318\
- 6.20499C9.77285\
- 5.92907 10.2281\
- 5.92907 10.5178\
- 6.20499L15.7682\
- 11.2063C16.0681\
- 11.492 16.0797 \
-11.9667 15.794 1\
-2.2667C15.5083 1\
-2.5666 15.0336 1\
-2.5781 14.7336 1\
-2.2924L10.0005 7\
-.78385L5.26729 1\
-2.2924C4.96737 1\
-2.5781 4.49264 1\
-2.5666 4.20694 1\
-2.2667Z\x22 fill=\x22#\
-212121\x22/>\x0d\x0a</svg\
->\x0d\x0a\
-\x00\x00\x01\xa0\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22?>\x0d\x0a<svg vers\
-ion=\x221.1\x22 xmlns=\
-\x22http://www.w3.o\
-rg/2000/svg\x22 wid\
-th=\x22591\x22 height=\
-\x22591\x22>\x0d\x0a<path d=\
-\x22M-75 75 L250 75\
-\x22 stroke=\x22#CCCCC\
-C\x22 stroke-width=\
-\x2248\x22 transform=\x22\
-translate(295,29\
-5)\x22/>\x0d\x0a<path d=\x22\
-M-75 75 L-75 -25\
-0\x22 stroke=\x22#CCCC\
-CC\x22 stroke-width\
-=\x2248\x22 transform=\
-\x22translate(295,2\
-95)\x22/>\x0d\x0a<path d=\
-\x22M-75 75 L-200 2\
-00\x22 stroke=\x22#CCC\
-CCC\x22 stroke-widt\
-h=\x2248\x22 transform\
-=\x22translate(295,\
-295)\x22/>\x0d\x0a</svg>\
-\x00\x00\x08\x05\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M3 5C3 \
-3.89543 3.89543 \
-3 5 3H15C16.1046\
- 3 17 3.89543 17\
- 5V15C17 16.1046\
- 16.1046 17 15 1\
-7H5C3.89543 17 3\
- 16.1046 3 15V5Z\
-M6.30861 6.03794\
-C6.25051 6.06198\
- 6.19602 6.09744\
- 6.14857 6.14433\
-L6.14433 6.14857\
-C6.09744 6.19602\
- 6.06198 6.25051\
- 6.03794 6.30861\
-C6.01349 6.36756\
- 6 6.43221 6 6.5\
-V8.5C6 8.77614 6\
-.22386 9 6.5 9C6\
-.77614 9 7 8.776\
-14 7 8.5V7.70711\
-L8.14645 8.85355\
-C8.34171 9.04882\
- 8.65829 9.04882\
- 8.85355 8.85355\
-C9.04882 8.65829\
- 9.04882 8.34171\
- 8.85355 8.14645\
-L7.70711 7H8.5C8\
-.77614 7 9 6.776\
-14 9 6.5C9 6.223\
-86 8.77614 6 8.5\
- 6H6.50009C6.432\
-29 6 6.36756 6.0\
-1349 6.30861 6.0\
-3794ZM6 11.5V13.\
-5C6 13.5678 6.01\
-349 13.6324 6.03\
-794 13.6914C6.06\
-198 13.7495 6.09\
-744 13.804 6.144\
-33 13.8514L6.148\
-57 13.8557C6.238\
-22 13.9443 6.361\
-2 13.9992 6.497 \
-14L6.5 14H8.5C8.\
-77614 14 9 13.77\
-61 9 13.5C9 13.2\
-239 8.77614 13 8\
-.5 13H7.70711L8.\
-85355 11.8536C9.\
-04882 11.6583 9.\
-04882 11.3417 8.\
-85355 11.1464C8.\
-65829 10.9512 8.\
-34171 10.9512 8.\
-14645 11.1464L7 \
-12.2929V11.5C7 1\
-1.2239 6.77614 1\
-1 6.5 11C6.22386\
- 11 6 11.2239 6 \
-11.5ZM13.8514 6.\
-14433C13.804 6.0\
-9744 13.7495 6.0\
-6198 13.6914 6.0\
-3794C13.6324 6.0\
-1349 13.5678 6 1\
-3.5 6H11.5C11.22\
-39 6 11 6.22386 \
-11 6.5C11 6.7761\
-4 11.2239 7 11.5\
- 7H12.2929L11.14\
-64 8.14645C10.95\
-12 8.34171 10.95\
-12 8.65829 11.14\
-64 8.85355C11.34\
-17 9.04882 11.65\
-83 9.04882 11.85\
-36 8.85355L13 7.\
-70711V8.5C13 8.7\
-7614 13.2239 9 1\
-3.5 9C13.7761 9 \
-14 8.77614 14 8.\
-5V6.5C14 6.43221\
- 13.9865 6.36756\
- 13.9621 6.30861\
-C13.938 6.25051 \
-13.9026 6.19602 \
-13.8557 6.14857L\
-13.8514 6.14433Z\
-M13.6914 13.9621\
-C13.7495 13.938 \
-13.804 13.9026 1\
-3.8514 13.8557L1\
-3.8557 13.8514C1\
-3.9026 13.804 13\
-.938 13.7495 13.\
-9621 13.6914C13.\
-9865 13.6324 14 \
-13.5678 14 13.5V\
-11.5C14 11.2239 \
-13.7761 11 13.5 \
-11C13.2239 11 13\
- 11.2239 13 11.5\
-V12.2929L11.8536\
- 11.1464C11.6583\
- 10.9512 11.3417\
- 10.9512 11.1464\
- 11.1464C10.9512\
- 11.3417 10.9512\
- 11.6583 11.1464\
- 11.8536L12.2929\
- 13H11.5C11.2239\
- 13 11 13.2239 1\
-1 13.5C11 13.776\
-1 11.2239 14 11.\
-5 14H13.4999C13.\
-5677 14 13.6324 \
-13.9865 13.6914 \
-13.9621Z\x22 fill=\x22\
-#212121\x22/>\x0d\x0a</sv\
-g>\x0d\x0a\
-\x00\x00\x80\x8c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02O\x00\x00\x02O\x08\x06\x00\x00\x00e\xc70n\
-\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
-\x00\x00\x0aIiCCPsRGB IEC\
-61966-2.1\x00\x00H\x89\x9dSw\
-X\x93\xf7\x16>\xdf\xf7e\x0fVB\xd8\xf0\xb1\x97l\
-\x81\x00\x22#\xac\x08\xc8\x10Y\xa2\x10\x92\x00a\x84\x10\
-\x12@\xc5\x85\x88\x0aV\x14\x15\x11\x9cHU\xc4\x82\xd5\
-\x0aH\x9d\x88\xe2\xa0(\xb8gA\x8a\x88Z\x8bU\x5c\
-8\xee\x1f\xdc\xa7\xb5}z\xef\xed\xed\xfb\xd7\xfb\xbc\xe7\
-\x9c\xe7\xfc\xcey\xcf\x0f\x80\x11\x12&\x91\xe6\xa2j\x00\
-9R\x85<:\xd8\x1f\x8fOH\xc4\xc9\xbd\x80\x02\x15\
-H\xe0\x04 \x10\xe6\xcb\xc2g\x05\xc5\x00\x00\xf0\x03y\
-x~t\xb0?\xfc\x01\xafo\x00\x02\x00p\xd5.$\
-\x12\xc7\xe1\xff\x83\xbaP&W\x00 \x91\x00\xe0\x22\x12\
-\xe7\x0b\x01\x90R\x00\xc8.T\xc8\x14\x00\xc8\x18\x00\xb0\
-S\xb3d\x0a\x00\x94\x00\x00ly|B\x22\x00\xaa\x0d\
-\x00\xec\xf4I>\x05\x00\xd8\xa9\x93\xdc\x17\x00\xd8\xa2\x1c\
-\xa9\x08\x00\x8d\x01\x00\x99(G$\x02@\xbb\x00`U\
-\x81R,\x02\xc0\xc2\x00\xa0\xac@\x22.\x04\xc0\xae\x01\
-\x80Y\xb62G\x02\x80\xbd\x05\x00v\x8eX\x90\x0f@\
-`\x00\x80\x99B,\xcc\x00 8\x02\x00C\x1e\x13\xcd\
-\x03 L\x03\xa00\xd2\xbf\xe0\xa9_p\x85\xb8H\x01\
-\x00\xc0\xcb\x95\xcd\x97K\xd23\x14\xb8\x95\xd0\x1aw\xf2\
-\xf0\xe0\xe2!\xe2\xc2l\xb1Ba\x17)\x10f\x09\xe4\
-\x22\x9c\x97\x9b#\x13H\xe7\x03L\xce\x0c\x00\x00\x1a\xf9\
-\xd1\xc1\xfe8?\x90\xe7\xe6\xe4\xe1\xe6f\xe7l\xef\xf4\
-\xc5\xa2\xfek\xf0o\x22>!\xf1\xdf\xfe\xbc\x8c\x02\x04\
-\x00\x10N\xcf\xef\xda_\xe5\xe5\xd6\x03p\xc7\x01\xb0u\
-\xbfk\xa9[\x00\xdaV\x00h\xdf\xf9]3\xdb\x09\xa0\
-Z\x0a\xd0z\xf9\x8by8\xfc@\x1e\x9e\xa1P\xc8<\
-\x1d\x1c\x0a\x0b\x0b\xed%b\xa1\xbd0\xe3\x8b>\xff3\
-\xe1o\xe0\x8b~\xf6\xfc@\x1e\xfe\xdbz\xf0\x00q\x9a\
-@\x99\xad\xc0\xa3\x83\xfdqanv\xaeR\x8e\xe7\xcb\
-\x04B1n\xf7\xe7#\xfe\xc7\x85\x7f\xfd\x8e)\xd1\xe2\
-4\xb1\x5c,\x15\x8a\xf1X\x89\xb8P\x22M\xc7y\xb9\
-R\x91D!\xc9\x95\xe2\x12\xe9\x7f2\xf1\x1f\x96\xfd\x09\
-\x93w\x0d\x00\xac\x86O\xc0N\xb6\x07\xb5\xcbl\xc0~\
-\xee\x01\x02\x8b\x0eX\xd2v\x00@~\xf3-\x8c\x1a\x0b\
-\x91\x00\x10g42y\xf7\x00\x00\x93\xbf\xf9\x8f@+\
-\x01\x00\xcd\x97\xa4\xe3\x00\x00\xbc\xe8\x18\x5c\xa8\x94\x17L\
-\xc6\x08\x00\x00D\xa0\x81*\xb0A\x07\x0c\xc1\x14\xac\xc0\
-\x0e\x9c\xc1\x1d\xbc\xc0\x17\x02a\x06D@\x0c$\xc0<\
-\x10B\x06\xe4\x80\x1c\x0a\xa1\x18\x96A\x19T\xc0:\xd8\
-\x04\xb5\xb0\x03\x1a\xa0\x11\x9a\xe1\x10\xb4\xc118\x0d\xe7\
-\xe0\x12\x5c\x81\xebp\x17\x06`\x18\x9e\xc2\x18\xbc\x86\x09\
-\x04A\xc8\x08\x13a!:\x88\x11b\x8e\xd8\x22\xce\x08\
-\x17\x99\x8e\x04\x22aH4\x92\x80\xa4 \xe9\x88\x14Q\
-\x22\xc5\xc8r\xa4\x02\xa9Bj\x91]H#\xf2-r\
-\x149\x8d\x5c@\xfa\x90\xdb\xc8 2\x8a\xfc\x8a\xbcG\
-1\x94\x81\xb2Q\x03\xd4\x02u@\xb9\xa8\x1f\x1a\x8a\xc6\
-\xa0s\xd1t4\x0f]\x80\x96\xa2k\xd1\x1a\xb4\x1e=\
-\x80\xb6\xa2\xa7\xd1K\xe8ut\x00}\x8a\x8ec\x80\xd1\
-1\x0ef\x8c\xd9a\x5c\x8c\x87E`\x89X\x1a&\xc7\
-\x16c\xe5X5V\x8f5c\x1dX7v\x15\x1b\xc0\
-\x9ea\xef\x08$\x02\x8b\x80\x13\xec\x08^\x84\x10\xc2l\
-\x82\x90\x90GXLXC\xa8%\xec#\xb4\x12\xba\x08\
-W\x09\x83\x841\xc2'\x22\x93\xa8O\xb4%z\x12\xf9\
-\xc4xb:\xb1\x90XF\xac&\xee!\x1e!\x9e%\
-^'\x0e\x13_\x93H$\x0e\xc9\x92\xe4N\x0a!%\
-\x902I\x0bIkH\xdbH-\xa4S\xa4>\xd2\x10\
-i\x9cL&\xeb\x90m\xc9\xde\xe4\x08\xb2\x80\xac \x97\
-\x91\xb7\x90\x0f\x90O\x92\xfb\xc9\xc3\xe4\xb7\x14:\xc5\x88\
-\xe2L\x09\xa2$R\xa4\x94\x12J5e?\xe5\x04\xa5\
-\x9f2B\x99\xa0\xaaQ\xcd\xa9\x9e\xd4\x08\xaa\x88:\x9f\
-ZIm\xa0vP/S\x87\xa9\x134u\x9a%\xcd\
-\x9b\x16C\xcb\xa4-\xa3\xd5\xd0\x9aigi\xf7h/\
-\xe9t\xba\x09\xdd\x83\x1eE\x97\xd0\x97\xd2k\xe8\x07\xe9\
-\xe7\xe9\x83\xf4w\x0c\x0d\x86\x0d\x83\xc7Hb(\x19k\
-\x19{\x19\xa7\x18\xb7\x19/\x99L\xa6\x05\xd3\x97\x99\xc8\
-T0\xd72\x1b\x99g\x98\x0f\x98oUX*\xf6*\
-|\x15\x91\xca\x12\x95:\x95V\x95~\x95\xe7\xaaTU\
-sU?\xd5y\xaa\x0bT\xabU\x0f\xab^V}\xa6\
-FU\xb3P\xe3\xa9\x09\xd4\x16\xab\xd5\xa9\x1dU\xbb\xa9\
-6\xae\xceRwR\x8fP\xcfQ_\xa3\xbe_\xfd\x82\
-\xfac\x0d\xb2\x86\x85F\xa0\x86H\xa3Tc\xb7\xc6\x19\
-\x8d!\x16\xc62e\xf1XB\xd6rV\x03\xeb,k\
-\x98Mb[\xb2\xf9\xecLv\x05\xfb\x1bv/{L\
-SCs\xaaf\xacf\x91f\x9d\xe6q\xcd\x01\x0e\xc6\
-\xb1\xe0\xf09\xd9\x9cJ\xce!\xce\x0d\xce{-\x03-\
-?-\xb1\xd6j\xadf\xad~\xad7\xdaz\xda\xbe\xda\
-b\xedr\xed\x16\xed\xeb\xda\xefup\x9d@\x9d,\x9d\
-\xf5:m:\xf7u\x09\xba6\xbaQ\xba\x85\xba\xdbu\
-\xcf\xea>\xd3c\xeby\xe9\x09\xf5\xca\xf5\x0e\xe9\xdd\xd1\
-G\xf5m\xf4\xa3\xf5\x17\xea\xef\xd6\xef\xd1\x1f704\
-\x086\x90\x19l18c\xf0\xcc\x90c\xe8k\x98i\
-\xb8\xd1\xf0\x84\xe1\xa8\x11\xcbh\xba\x91\xc4h\xa3\xd1I\
-\xa3'\xb8&\xee\x87g\xe35x\x17>f\xaco\x1c\
-b\xac4\xdee\xdck<abi2\xdb\xa4\xc4\xa4\
-\xc5\xe4\xbe)\xcd\x94k\x9af\xba\xd1\xb4\xd3t\xcc\xcc\
-\xc8,\xdc\xac\xd8\xac\xc9\xec\x8e9\xd5\x9ck\x9ea\xbe\
-\xd9\xbc\xdb\xfc\x8d\x85\xa5E\x9c\xc5J\x8b6\x8b\xc7\x96\
-\xda\x96|\xcb\x05\x96M\x96\xf7\xac\x98V>VyV\
-\xf5V\xd7\xacI\xd6\x5c\xeb,\xebm\xd6WlP\x1b\
-W\x9b\x0c\x9b:\x9b\xcb\xb6\xa8\xad\x9b\xad\xc4v\x9bm\
-\xdf\x14\xe2\x14\x8f)\xd2)\xf5Sn\xda1\xec\xfc\xec\
-\x0a\xec\x9a\xec\x06\xed9\xf6a\xf6%\xf6m\xf6\xcf\x1d\
-\xcc\x1c\x12\x1d\xd6;t;|rtu\xccvlp\
-\xbc\xeb\xa4\xe14\xc3\xa9\xc4\xa9\xc3\xe9Wg\x1bg\xa1\
-s\x9d\xf35\x17\xa6K\x90\xcb\x12\x97v\x97\x17Sm\
-\xa7\x8a\xa7n\x9fz\xcb\x95\xe5\x1a\xee\xba\xd2\xb5\xd3\xf5\
-\xa3\x9b\xbb\x9b\xdc\xad\xd9m\xd4\xdd\xcc=\xc5}\xab\xfb\
-M.\x9b\x1b\xc9]\xc3=\xefA\xf4\xf0\xf7X\xe2q\
-\xcc\xe3\x9d\xa7\x9b\xa7\xc2\xf3\x90\xe7/^v^Y^\
-\xfb\xbd\x1eO\xb3\x9c&\x9e\xd60m\xc8\xdb\xc4[\xe0\
-\xbd\xcb{`:>=e\xfa\xce\xe9\x03>\xc6>\x02\
-\x9fz\x9f\x87\xbe\xa6\xbe\x22\xdf=\xbe#~\xd6~\x99\
-~\x07\xfc\x9e\xfb;\xfa\xcb\xfd\x8f\xf8\xbf\xe1y\xf2\x16\
-\xf1N\x05`\x01\xc1\x01\xe5\x01\xbd\x81\x1a\x81\xb3\x03k\
-\x03\x1f\x04\x99\x04\xa5\x075\x05\x8d\x05\xbb\x06/\x0c>\
-\x15B\x0c\x09\x0dY\x1fr\x93o\xc0\x17\xf2\x1b\xf9c\
-3\xdcg,\x9a\xd1\x15\xca\x08\x9d\x15Z\x1b\xfa0\xcc\
-&L\x1e\xd6\x11\x8e\x86\xcf\x08\xdf\x10~o\xa6\xf9L\
-\xe9\xcc\xb6\x08\x88\xe0Gl\x88\xb8\x1fi\x19\x99\x17\xf9\
-}\x14)*2\xaa.\xeaQ\xb4Stqt\xf7,\
-\xd6\xac\xe4Y\xfbg\xbd\x8e\xf1\x8f\xa9\x8c\xb9;\xdbj\
-\xb6rvg\xacjlRlc\xec\x9b\xb8\x80\xb8\xaa\
-\xb8\x81x\x87\xf8E\xf1\x97\x12t\x13$\x09\xed\x89\xe4\
-\xc4\xd8\xc4=\x89\xe3s\x02\xe7l\x9a3\x9c\xe4\x9aT\
-\x96tc\xae\xe5\xdc\xa2\xb9\x17\xe6\xe9\xce\xcb\x9ew<\
-Y5Y\x90|8\x85\x98\x12\x97\xb2?\xe5\x83 B\
-P/\x18O\xe5\xa7nM\x1d\x13\xf2\x84\x9b\x85OE\
-\xbe\xa2\x8d\xa2Q\xb1\xb7\xb8J<\x92\xe6\x9dV\x95\xf6\
-8\xdd;}C\xfah\x86OFu\xc63\x09OR\
-+y\x91\x19\x92\xb9#\xf3MVD\xd6\xde\xac\xcf\xd9\
-q\xd9-9\x94\x9c\x94\x9c\xa3R\x0di\x96\xb4+\xd7\
-0\xb7(\xb7Of++\x93\x0d\xe4y\xe6m\xca\x1b\
-\x93\x87\xca\xf7\xe4#\xf9s\xf3\xdb\x15l\x85L\xd1\xa3\
-\xb4R\xaeP\x0e\x16L/\xa8+x[\x18[x\xb8\
-H\xbdHZ\xd43\xdff\xfe\xea\xf9#\x0b\x82\x16|\
-\xbd\x90\xb0P\xb8\xb0\xb3\xd8\xb8xY\xf1\xe0\x22\xbfE\
-\xbb\x16#\x8bS\x17w.1]R\xbadxi\xf0\
-\xd2}\xcbh\xcb\xb2\x96\xfdP\xe2XRU\xf2jy\
-\xdc\xf2\x8eR\x83\xd2\xa5\xa5C+\x82W4\x95\xa9\x94\
-\xc9\xcbn\xae\xf4Z\xb9c\x15a\x95dU\xefj\x97\
-\xd5[V\x7f*\x17\x95_\xacp\xac\xa8\xae\xf8\xb0F\
-\xb8\xe6\xe2WN_\xd5|\xf5ym\xda\xda\xdeJ\xb7\
-\xca\xed\xebH\xeb\xa4\xebn\xac\xf7Y\xbf\xafJ\xbdj\
-A\xd5\xd0\x86\xf0\x0d\xad\x1b\xf1\x8d\xe5\x1b_mJ\xde\
-t\xa1zj\xf5\x8e\xcd\xb4\xcd\xca\xcd\x035a5\xed\
-[\xcc\xb6\xac\xdb\xf2\xa16\xa3\xf6z\x9d\x7f]\xcbV\
-\xfd\xad\xab\xb7\xbe\xd9&\xda\xd6\xbf\xddw{\xf3\x0e\x83\
-\x1d\x15;\xde\xef\x94\xec\xbc\xb5+xWk\xbdE}\
-\xf5n\xd2\xee\x82\xdd\x8f\x1ab\x1b\xba\xbf\xe6~\xdd\xb8\
-GwO\xc5\x9e\x8f{\xa5{\x07\xf6E\xef\xebjt\
-ol\xdc\xaf\xbf\xbf\xb2\x09mR6\x8d\x1eH:p\
-\xe5\x9b\x80o\xda\x9b\xed\x9aw\xb5pZ*\x0e\xc2A\
-\xe5\xc1'\xdf\xa6|{\xe3P\xe8\xa1\xce\xc3\xdc\xc3\xcd\
-\xdf\x99\x7f\xb7\xf5\x08\xebHy+\xd2:\xbfu\xac-\
-\xa3m\xa0=\xa1\xbd\xef\xe8\x8c\xa3\x9d\x1d^\x1dG\xbe\
-\xb7\xff~\xef1\xe3cu\xc75\x8fW\x9e\xa0\x9d(\
-=\xf1\xf9\xe4\x82\x93\xe3\xa7d\xa7\x9e\x9dN?=\xd4\
-\x99\xdcy\xf7L\xfc\x99k]Q]\xbdgC\xcf\x9e\
-?\x17t\xeeL\xb7_\xf7\xc9\xf3\xde\xe7\x8f]\xf0\xbc\
-p\xf4\x22\xf7b\xdb%\xb7K\xad=\xae=G~p\
-\xfd\xe1H\xaf[o\xebe\xf7\xcb\xedW<\xaet\xf4\
-M\xeb;\xd1\xef\xd3\x7f\xfaj\xc0\xd5s\xd7\xf8\xd7.\
-]\x9fy\xbd\xef\xc6\xec\x1b\xb7n&\xdd\x1c\xb8%\xba\
-\xf5\xf8v\xf6\xed\x17w\x0a\xeeL\xdc]z\x8fx\xaf\
-\xfc\xbe\xda\xfd\xea\x07\xfa\x0f\xea\x7f\xb4\xfe\xb1e\xc0m\
-\xe0\xf8`\xc0`\xcf\xc3Y\x0f\xef\x0e\x09\x87\x9e\xfe\x94\
-\xff\xd3\x87\xe1\xd2G\xccG\xd5#F#\x8d\x8f\x9d\x1f\
-\x1f\x1b\x0d\x1a\xbd\xf2d\xce\x93\xe1\xa7\xb2\xa7\x13\xcf\xca\
-~V\xffy\xebs\xab\xe7\xdf\xfd\xe2\xfbK\xcfX\xfc\
-\xd8\xf0\x0b\xf9\x8b\xcf\xbf\xaey\xa9\xf3r\xef\xab\xa9\xaf\
-:\xc7#\xc7\x1f\xbc\xcey=\xf1\xa6\xfc\xad\xce\xdb}\
-\xef\xb8\xef\xba\xdf\xc7\xbd\x1f\x99(\xfc@\xfeP\xf3\xd1\
-\xfac\xc7\xa7\xd0O\xf7>\xe7|\xfe\xfc/\xf7\x84\xf3\
-\xfb-G8\xcf\x00\x00\x00 cHRM\x00\x00z\
-&\x00\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u\
-0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ\
-<\x00\x00\x00\x09pHYs\x00\x00.#\x00\x00.\
-#\x01x\xa5?v\x00\x00u\xadIDATx\x9c\
-\xed\xddY\x90\x5cg\x9a\xde\xf7\x7f\xd6^\x85\xad\xb0\x03\
-$H,\x5c@\x82\x04\x01\xee\xecnvO\xcfL\xcf\
-\xd2\xa3\x91<R\x8cdIV\xc8\x92#\xbc\x84#t\
-!_8|\xe5{\x87\xaf\xec\x08\x87#d\x85\x15\x8e\
-\x90\xace$k\x9b\xd1\x8cf\xed\xe9\x85\xdd\x5cA\x10\
-\x5cA\x02 \xf6}\xaf}\xc9\xf4\xc5s^}\xa7\xd0\
-X\xea\x14r9'\xf3\xf9ET\x00(\x82@\xa22\
-\xeb\x9c'\xdf\xef\xfd\xde\xaf\xd6h40333\xb3\
-\xe5\xe9\xeb\xf4\x030333\xab\x12\x87'333\
-\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx2333+\
-\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'333\xb3\x02\x1c\
-\x9e\xcc\xcc\xcc\xcc\x0apx2333+\xc0\xe1\xc9\
-\xcc\xcc\xcc\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\
-\xcc\xcc\x0apx2333+\xc0\xe1\xc9\xcc\xcc\xcc\
-\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0a\
-\x18\xe8\xf4\x03\xe8v\xb5Z\xad\xd3\x0f\xc1\xac\x9b\xd4\x80\
-A\xe0)\xe0\x15\xe0i\xe0\x02p\x14\xf8:\xfb\xf9-\
-\xa0\xd1\xa1\xc7WI\x8d\x86\xbf\x5cfE8<\x99Y\
-\xd9\xd5\xb2\x8f~`\x18X\x0bl\x016\x01\xe3\xc0|\
-\xf6\xf3[\xc0T\xf6\xeb9`\x11\x87(3k\x01\x87\
-'3+\xbb\xa86\x8d\x01\x9b\x81\xdd\xc0>\xe0Y`\
-\x07\xb0\x11\x18A\xc1j\x00\x85\xac+\xc04\x0aPf\
-fM\xe5\xf0dfeVC\xd7\xa91T]\xda\x0b\
-\xbc\x0e\xec\x07\xf6\x00\x1bPHz\x14X\x0f\x8c\xa2\xf0\
-\xb4\x00\xd4\x81\xd9\xecGW\xa0\xcc\xaci\x1c\x9e\xcc\xac\
-\xac\xfa\xd05j-\xb0\x1d\xf57\xed\x07\x0e\x00O\xa0\
-\xa5\xbb1`\x0d\xaaL\xd5Q\xd8\x1aBU\xa8S\xc0\
-E\xe06Z\xca33k\x0a\x87'3+\xa3\x08N\
-\xabQHz\x0ax\x19\x85\xa7\xa7\xd0\xf2\xdd\xaa\xec\xf7\
-\x0cf\xffO\x9dT\xa5\x1a\xcd~\x04-\xddM\xe0\x0a\
-\x94\x995\x89\xc3\x93\x99\x95M\x1f\x0aD\xab\xd0r\xdc\
-S\xc0\x0b\xa4\xe0\xb4%\xfbo\x83\xa8\xd2\xd4@ai\
-\x03Z\xb2\x1b\xcc~\xec#\xf5<]D\x0d\xe5n\x22\
-7\xb3\x87\xe6\xf0dfe\x12\xc1i\x0d\xaa.=\x8b\
-\x96\xe9\x9e\x03\x9e\x04\xb6\xa2\x8a\xd2\x00\x0aN\x90v\xe2\
-\x8d\x92v\xe6\xc5\x7fkd\xff\xad\x1f-\xddE\x13\xb9\
-\x03\x94\x99\xad\x98\xc3\x93\x99\x95E~\xa9n\x1bj\x08\
-?\x08\xbc\x88\x82ST\x9c\xfaH\xe1(\xe4\x1b\xcb\xe3\
-\xcf\x89\x10\x15\x15\xa8\x09\xe0:\x1ag\xb0\x80\x03\x94\x99\
-\xad\x90\xc3\x93\x99\x95A\x84\x9f\xd5h\xfc\xc0K\xa8\xc7\
-i/\xb0\x13\xed\xb4\x1b\xe1\xee\xc1)\xffg\xf4\xa1\x86\
-\xf15\xa8J\x95\xefs\xaa\x01_\x01gP\x13\xb9\xc3\
-\x93\x99\xad\x88\xc3\x93\x99uRT\x87\x06\xd0\xa8\x81G\
-\xd1\x0c\xa7W\xd1\x04\xf1mh\x10\xe6\x08Zz{\xd0\
-\xc8\xfe\xf8\xb3\xfa\x80u\xf7\xf8=\x0b\xd9\x8f1P\xd3\
-\xcc\xac\x10\x87'3\xeb\xa4\xfcr\xdbnTqz\x09\
-\xf58\xedB\x95\xa8!\x14\x9c\x8a\xfc\x99\xfd(pE\
-Cy\x03\x05\xaaz\xf6{\x06\x80s\xc0\x0d\x5c\x812\
-\xb3\x82\x1c\x9e\xcc\xacS\xa29<\x8e[\xd9\x0f\xbc\x89\
-\xc2S~\x14\xc1J\x0f0\x8f\xbe\xa7qRH\xcb7\
-\x90/\xa2c\x5cfq\x13\xb9\x99\x15\xe0\xf0df\x9d\
-\x90\x1f\x80\xb9\x13\x05\xa7\xd7\xd0H\x82]h\xc8\xe5\xc3\
-\x8a\xc04\xca\xd2\xe5\xbc\xa8d-f\x1f\x97Q3\xf9\
-\xc2\xdd\xff\x183\xb3\xa5\x1c\x9e\xcc\xac\xdd\xf2Ku[\
-\xd1\x8e\xba\xdfDc\x09\xb6\x91\x86^6K,\xe1\x0d\
-d?\xae\xcd\xfe\xee\x98\x05u\x04\xf5>\xb9\xfadf\
-\xcb\xe2\xf0df\xed\x12\xbb\xe1b\xa0\xe5c(0\xbd\
-\x9e\xfd\xb8\x9d4j\xa0\xd9\x7fo\x04\xa5\x18\xa0\xb9\x80\
-\x96\xec@}P\x83\xc0\x05T\x81r\x13\xb9\x99\xdd\x97\
-\xc3\x93\x99\xb5C\x04\xa7a\x14\x9c\x9e@\xbdM\xaf\xa2\
-\xddu\xdbH\xd5\xa0V\xfd\xfd\xb1So\x14U\xbc\xe2\
-\x1c\xbc8\xd6\xa5\x86\xc6\x18D\x05\xcaU(3\xbb+\
-\x87'3k\xb5\xfc\xee\xb7q4\xf0\xf2\x00\xaa8\xbd\
-\x04<\x82BL\xb3+N\xf7\xd2\x8fv\xf1\xc5\xb9x\
-\xf3\xd9c\x5cD\x15\xa9\x8b\xc0$^\xc63\xb3{p\
-x2\xb3V\xab\xa1j\xcfF\xe0q\xe0\x0d4\x00\xf3\
-YT\x01\x1a\xed\xc0\xe3\x890\xb7\x11x\x86T\x95\x8a\
-\xa5\xbd\xd3h\x0e\x94\x03\x94\x99\xfd\x1c\x87'3k\xa5\
-~TU\x1a'\xed\xaa\xfb\x06\xaa<m\xa1\xf9\xcd\xe1\
-E\xf4\xa1q\x08\x8fe\x8f#*_u\x14\x9c\x1a\xf8\
-,<3\xbb\x0b\x87'3k\x95\x1a\xeac\xda\x00<\
-\x8d&\x86\xbf\x02<\x85\xa6\x89\x0f\xf1\xe0\x89\xe1\xad\x14\
-}PC\xd9\xe3y\x824L\x13t\x94\xcbY\xe0\x16\
-\x0aPff\x80\xc3\x93\x995_,\x8b\x0d\xa23\xe9\
-v\xb1\xb4\xc7i\x9c4{\xa9\x0cbYq\x1b\xa9a\
-\xbd\xce\xd2YP\xd3\xf80a3\xcb8<\x99Y\xb3\
-\xf5\xa30\xb2\x165\x87\xbfH\xeaqz\x94\xa5;\xdf\
-\xca\x22F\x18\xf4\x93\x0e\x13n\x90\x96\xec.\xe2\x0a\x94\
-\x99e\x1c\x9e\xcc\xacY\x22\x14\xc58\x82\x1d\xa8\xd2\xf4\
-\x1d\xd4\x94\xbd\x89\xf6\xed\xa8[\x89\x18\xa5\xb0\x15\x85\xa9\
-\xf8\xf7\xf4\xa1\x005\x9b}D\xb82\xb3\x1e\xe5\xf0d\
-f\xcd\xd2\x8f\xc2\xc7&\xd4?\xf4\x02\xe9\x90\xdfG\xa8\
-\xc6\xf5f\x00X\x83v\xe2-\x90\x82\xd2|\xf6\xeb\xab\
-h\x8c\x81\x07i\x9a\xf5\xb0*\x5c\xcc\xcc\xac\x1a\x06Q\
-?\xd3\x1e\xd4\xdf\xf4\xdd\xec\xe7\x1bIC(\xab \x8e\
-\x8f\xd9\x92\xfd|0\xf7\xb9OQ\x13\xb9\xc3\x93Y\x0f\
-sx2\xb3\x87\x11\xe1b\x14\x85\x8d\xddh\x1c\xc1\x8b\
-\xa8\xe2\xb4\x1eU\xa3\xaa\x12\x9cB\x0d\x8d1\xa8\xa1\xca\
-S\xfe(\x97\x1ap\x1eU\xa0|\x98\xb0Y\x0frx\
-2\xb3\x87\xd1\x8f\xc6\x11<\x82F\x10\xbc\x84\x96\xeb\xf6\
-\xa2\x8aS\x15\x83\x13\xa4\x1d\x83c\xc0f\xd2\x11.\x0d\
-\xd29y\xa7Q\x80\xaaw\xe81\x9aY\x878<\x99\
-\xd9J\x0d\x90\xc2\xc5\xd3(8}\x13\xed\xaa\xdb@u\
-\x83S^\x1f:\xcae\x08U\xd7\xa2Q|\x11\x0d\xd2\
-\xac\xa3&r\x0f\xd24\xeb!\x0eOf\xb6\x12}h\
-\x14\xc1v\x14\x9c\xde@\x15\xa7'\xd0R\xddH\xe7\x1e\
-ZS\xe5\x8frY\x8fF/D\xa5\xa9\x01|\x09\x9c\
-\x03&\xf0\x18\x03\xb3\x9e\xe1\xf0dfE\xc4\xd6\xfd!\
-\x96V\x9c^\xcf~>\x8e*N\xdd&\x06i\xee \
-\xcd\x84\x02}-fQ\xef\xd3\x0c\x0ePf=\xc1\xe1\
-\xc9\xcc\x8a\xe8G\x15\xa7M\xa8!\xfc\x15\xe0 \x9a\x22\
-\xbe\x81\xce\x1f\xb9\xd2J1\xfc3F1DP\xaa\xa3\
-\xc0x\x01\xb8\x89{\xa0\xcc\xba\x9e\xc3\x93\x99-G\x1f\
-\xba^\xacBS\xc2\x9f@S\xc3_E\xcd\xe1\x1bH\
-[\xfa\xbbY\x0d-\xe1\xc5 \xcd\x18\xa0\x19?_\xc0\
-\x87\x09\x9bu=\x87'3[\x8ea\xb4$\xb7\x0dM\
-\x0b\x7f\x0e\x8d#x\x86t\xe4J\xaf\x18D\xd5\xb7h\
- \xaf\x93BT\x1d\x1d\xe5r\x1b\xcf\x822\xebZ\x0e\
-Of\xb6\x1c\xe3h\x17\xddA\xe0yRhZOo\
-\x05\xa7\x10C3c\xf92\xce\xf2[\x07\x1c\x02\x8e\xe1\
-\x83\x84\xcd\xba\x96\xc3\x93\x99\xddK,Q\xc5\x01\xbf\x07\
-I\x8d\xe1;\xd1\x12^/_C\xfa\xd0\xd7`\x08}\
-\x1d\xe2c\x0e\x05\xa7\xf3\xa8\x025w\xaf?\xc0\xcc\xaa\
-\xa9\x97/|fv\x7f\xfd,\xad8\xbd\x82\xaa,[\
-\xd1\xf9o\xbe~\xa4\x81\x99\x1bP\x95i\x00\xf5;\x0d\
-\x02G\x80\x13\xc0\xb5\x8e=:3k\x09_\xfc\xcc\xec\
-N}\xa8\xc7i\x1d:\x9b\xee%\xd4\xdf\xb4\x0fm\xd5\
-\x1f%m\xd5\xb7T\xa1\xdbD\x0aO}\xa8\xffi>\
-\xfb1\x8er\xf12\x9eY\x17px2\xb3;\x0d\xa2\
- \xf0$\x1a|\xf92\xa9\xc7i5\x0eNw\x93\x1f\
-\xa4\xb9\x07\x85\xa7\x18e0\x80z\xa0<H\xd3\xacK\
-8<\x99Y^\x1fi\x18\xe4k\xd9\xc7\xf3h\x97\xdd\
-*\x1c\x9c\xee\xa7\x8f4\xc6`\x04\x85\xd0\xe1\xec\xf3\xd7\
-\xd00\xcd:\xae>\x99U\x9e\xc3\x93\x99A:\x86d\
-\x17:\xe07*NO\xa2\x03~GQ\x08\xb0\xfb\x8b\
-]x\xab\xd0a\xc9\xf9\xe9\xe3G\x81S\xc0\x8d\xecs\
-fVQ\x0eOf\x167\xfcQ\xd4\x1c\xfe-\xe0\x00\
-Z~\xda\x9a}~\x80\xde\x1cI\xb0\x125\xb4\x03o\
-#\x0a\xa4\x03\xa4\x9dy\x0b(PM\xe1%<\xb3\xca\
-rx2\xb3\x11\xb4,\xf7\x18\xa99|/\xba\xf9\x8f\
-\xe1\x8a\xd3J\xc4Q.\xf1\xb5\x8b3\x01\xfbP\xdf\xd8\
-It\x9c\x8b\x97\xf1\xcc*\xc8\xe1\xc9\xacw\xc5\xcd|\
-\x03\xaa4\xbdF\xaa8m \xf5\xeb\xd8\xca\xd4P\xdf\
-\xd3:\xb4\x1c:\x0clA\x8d\xf7o\xa1\x19P\xd3x\
-\x17\x9eY\xe58<\x99\xf5\xaeaT\x05\xd9\x89\xaaM\
-\xbf\x88\x1a\xc5\xa3\xc7\xc9\x1e^?Z\xae[\x85v\xe2\
-=\x96\xfd8\x09\x9c\x06.\xe1A\x9af\x95\xe3\xf0d\
-\xd6\xbb\xb6\xa1J\xd3\xcbh\xb9\xee14M|\xb0\x93\
-\x0f\xaa\x8bE#\xf9\xe3\xc0w\xb2\x9f\xbf\x05|\x08\x5c\
-\xc6\xd5'\xb3\xcapx2\xeb-\xfd\xa8\xe2\xb4\x06\xf5\
-5\xbd\x06\xbc\x0a\xecF\x15\xa7\x01<\x8e\xa0U\xe2k\
-\xbf\x19Mj_\x83*N\x93h\x89\xef&\xda\x95g\
-f%\xe7\xf0d\xd6[\x06\xd1\x0e\xba}\xe8\xb8\x95\x17\
-\xd1h\x82\xf5\xe8\xc6\xee\x1du\xad\x13\xe3 \xc6P\xef\
-\xd30\x1a[\xd0\xc8>\xf7)p\xb6S\x0f\xce\xcc\x96\
-\xcf\xe1\xc9\xac\xfb\xf5\xa1\x9b\xf6 \xaa.=\x8d\x96\x8d\
-^\xc8~\xbe\x09\x07\xa7v\x8a\xe3o\xc6\x81\xfd\xa8\xbf\
-l\x08U\x9d&HM\xe4\xf5\x0e=>3{\x00\x87\
-'\xb3\xee\xd6\x87B\xd3j\xb4\x5c\xf4\x04\xaa6\xbd\x8c\
-\x96\xea\xb6\xa0\xaa\x87\x83S\xfb\xc4\x5c\xad>\xd4w6\
-\x80\x96\xef\xa6\xb2\xcf\x1d\x05\xae\xe2&r\xb3\xd2rx\
-2\xeb^5\xd2\xa1\xb5[H\xe3\x08^@\xfdN\xe3\
-\xa8\xea\xe1\xe0\xd4\x19Q\x81\xda\x88\x9e\x93U\xd9\xcfg\
-P\x1f\x94\xc3\x93YI9<\x99u\xa7X\xa6[\x85\
-F\x11<\x8d*N\xcf\xa3\x8a\xd38\x0aU\x9e\xe3\xd4\
-Y\x11\xa06\xa0e\xba9\xb4\xf3n5p\x1c\xb8\x82\
-\xc2\x94gA\x99\x95\x88\xc3\x93Yw\x8a\xc6\xe4Mh\
-g\xd7\xcb(8\xedA\xcbw#\xd9\xefq\xd5\xa9\xb3\
-\xa2\x89|\x14=W\xf1\xb9M\xc0O\x81\xc3h\x09o\
-\x11\x87'\xb3\xd2px2\xeb.\xd1\x1c\xbe\x06\xf5\xd3\
-\xecA\xcbu\x07\xb3\x9f\xc7\x91+V\x1e\xf9]x\xdb\
-Q\xd5i\x18U\xa1\xa6Q\x05\xea\x02:\x13\xcf!\xca\
-\xac\x04\x1c\x9e\xcc\xbaG\x1cH;\x8a\x06^\xeeG\xc1\
-i\x7f\xf6\xebux\x00f\x99E#\xf9*\xf4|\xbd\
-\x8e\x9e\xcbw\x81\xf7P\x05j\x1a\x98\xef\xd4\x0343\
-qx2\xeb\x0eq\xf0\xec\x18\xea\x9f\xd9\x8dz\x9c\xde\
-@G\xaelBKu^\xa6+\xaf\xa8@\x8d\x90*\
-P\xebQ\xb5\xe9\x12\xaa8\xe5\x97\xf0\x5c\x812\xeb\x10\
-\x87'\xb3\xea\x8bq\x04\xa3\xe8\x00\xdag\xd1\xee\xad\xe7\
-Xz\xe4\x8a\x83S5\xc4\x81\xc2\xab\x81GP\x08n\
-\x00\x87\x80#\xc0\x19\xb4\x84\xe7&r\xb3\x0eqx2\
-\xab\xae\xfc(\x82uhr\xf8\xf3hr\xf8>\x14\xa4\
-6\xa2\x1b\xb1\x8f\x5c\xa9\x968\xcae=\x1a+\xb1\x9a\
-4\x0fj\x1e\xb8\x86\x0e\x14v\x0f\x94Y\x078<\x99\
-UWT(\xc6Q3\xf8A\x14\x9e\xa2\xe2\xb4\x01U\
-\xa3\xacz\xf2\xbb\xf0b\x90\xe9$\xaa8\xf5\x01\x9f\xa3\
-\xca\x93\xc7\x18\x98u\x80\xc3\x93Y5EpZ\x83\x82\
-\xd2k\xc0od?_\x8fn\xb6C\x1d{t\xd6,\
-5T\x81\xeaC\xb3\xba\x86\xd0s^G\xcd\xe3\xd7H\
-\xc7\xb98@\x99\xb5\x89\xc3\x93Y\xf5D\x8f\xd3zT\
-qz\x11x\x15\xed\xaa[O\xfa\xbev\x8fS\xf5E\
-\x05\xaa\x0fU\xa0\xa2w\xed&Z\xb2\xfb\x0a\x8d1\x98\
-\xc4\x01\xca\xacm\x1c\x9e\xcc\xaa%?\x13\xe8Q\xe0\xdb\
-\xc0\x9b\xa8\xc7i-\xfa\x9evh\xea>Q\x81\x1aG\
-\x81\xb9Nz\xbe\x17\xb2\x0f\xf7?\x99\xb5\x89\xc3\x93Y\
-5\xc4\x0c\xa0Qt\x03\xdd\x89\xfa\x9b^E=N\xdb\
-\xd1\x92\x8e\x83S\xf7\xeaC\x9b\x036\x00O\xa2\xe7\xfa\
-6\x0aL\x83\xc0Y\xbc\x84g\xd6\x16\x0eOf\xd5P\
-C\xd5\xa6\xcd\xa8\xf2\xf0\x06\xf0\x12\x1aK\xb0\x05\xddT\
-\xad\xbb\xc5,\xaf\x08Pq\x16\xde\x08\x0aO3h\x0e\
-\xd4\x14\x0aPf\xd6\x22\x0eOf\xe5\x167\xccAt\
-\xc3\xdc\x85z\x9c~\x11M\x0f_\x83\xc7\x10\xf4\x92\xfc\
-.\xbc\xad(8\x8d\xa2\xb0t5\xfb=\xb1|W\xc7\
-\x15(\xb3\x96px2+\xb7>t\x5c\xc7\x06\xd22\
-\xdd\xcb(D\xc5\xec\x1f\xeb=\x11\xa8\xd7\xa0\x09\xf2\xf9\
-A\x9a\x87\x80\x8bh\xac\x81\x8fr1k\x01_x\xcd\
-\xca)\x06`\x0e\xb1\xb4\xe2\xf4m4=|\x15\xfe\xfe\
-\xedu\xb1\x84\xb7\x05\xbdN\xd6g?^G\xa1\xe9:\
-i\xf9\xce\x15(\xb3&\xf2\xc5\xd7\xac\x9c\xa29|#\
-\xdaI\xf72\x9a\x1c\xbe\x1b\xdd$\xdd\x18n\xf9\x09\xf3\
-\xeb\xd1r\xde\x0d4\xb6`\x0d\xf0\x05p\x12\x05)7\
-\x91\x9b5\x91\xc3\x93Y\xb9\xe4\x0f\xf8\x8d\xe6\xf0W\x81\
-\xef\xa0\xe0\xb4\x11\x07'[\xaa\x0fU\x9c\xd6\x02O\xa1\
-\x91\x06\xab\xb3\xff6\x85fBy\x0e\x94Y\x139<\
-\x99\x95G4\x03\x8f\xa0\xe0\xf4\x14j\x0a\x7f\x894\x00\
-\xd3\xcd\xe1v\xa7\x18c\xd1\x8fFV\xacE!i\x02\
-\xed\xc0;\x8e\x06iN\xe1YPfM\xe1\xf0dV\
-\x1e\xd1\xe3\xb4\x11\x05\xa77\xb3\x8f\xdd\xa8\x92\xd0\xd7\xb9\
-\x87f\x15\x10\xaf\x9f\x1a\xaaX6P\xbf\xdc\x9f\xa2\xa5\
-\xbbE\xd4D\xee1\x06f\x0f\xc9\xe1\xc9\xac\xf3\xf2\x03\
-07\x01{Q\xb5\xe9`\xf6\xf38r\xc5\xcbu\xf6\
- \xb1\x84\xb7\x89\x14\xa6\xae\xa3\xe0t\x1c\xb8\x8c\x06k\
-\xce\xa2Q\x06\x00\xd4j~i\x99\x15\xe1\xf0d\xd6y\
-\xb1kj3\x9a\x1c\xfd&\x0aO{\xd14q\x1f\xf0\
-k\xcb\x15M\xe4\xc3\xa8\x82\xd9\x87\x06\xaa\xaeF!\xfc\
-S\xe0\x0c:Px\x1e/\xe1\x99\xad\x88\xc3\x93Y\xe7\
-De`\x15\xdan\xbe\x07\xf58\xbd\x8a&\x87oB\
-\xb3|\xba\xc1\x22\xa9a9\xfas\xcaT\xeeX$-\
-m\xf5\xa3\xaf{\x1f\xe5z\x8cED\xef\xdc\x06\xf4Z\
-\x1a%U/\xfbP\xd5\xe96\x9aP\xbe\xd8\xa1\xc7h\
-VY\x0eOf\x9d\x117\xb1\xb5\xc0#\xc0\xd3h\x99\
-\xee\x00\xeaw\xdaHw\x1c\xb9\xd2\xc8>fP\xc3\xf2\
-\x1c\xb0\x0e\xdd\xcc\xcb\xd4\xfc>\x87\x96\xb7\xa6\xd0\xd7}\
-#\xaa\xdeT5<\xc5\xe6\x83\xa8@\x81\xc2k,\x11\
-\xcf\xa3&\xf2\x1b\xe8\xb9q\x05\xca\xac\x00\x87'\xb3\xce\
-\xe9G7\xb6'P\xb5\xe9M4\xd3)\xaa\x04\xdd\xa0\
-\x8en\xd4\x13\xe8\xf8\x90\x19\xf4o\x1b\xa2\x5c\xe1i\x1a\
-\xb8\x04\x5cA\x81v\x844\xc5\xbb\xca\x8d\xfa\xb1$\xbc\
-\x09}\xdd\xc7\xd0\xd7=\x06iN\xa3\xfe'\x87'\xb3\
-\x02\xba\xe5\x02mVEqc[\x87\xfaQ\xd6\x91v\
-\xd5U\xb5\xe2\x91\xb7\x80\xfakN\x92\x9a\x96GQ\x1f\
-\xd7\xda\xce=\xac\xbb\x9aA\x95\x98\xaf\xd0u\xf1*\xf0\
-\x18\xaa\x0a\xae\xa3\x5cA\xaf\x88\xe8\x81\x1aD_\xf3\x0d\
-\xe8\xb56\x827!\x98\xad\x98\xc3\x93YgE\x7fM\
-\xdc\x9c\x17I7\xb4\xaa\xde\xd8\xea(8M\xa30\xf2\
-\x0e\x0aO\xe3\xe8\x1c\xb6\xc7)_\x9f\xcd,\xaa:}\
-\x85\x1e\xf7Y\xe0\xb9\xec\xbf\x0d\x92\x96\x19\xab\xfa\x9c\xf4\
-\xa1\xc7?\x90\xfd\xbc\x91\xfb0\xb3\x82\x1c\x9e\xcc:\xa7\
-\x8e\x96\xb3.\xa1\x0a\xcdv\xd2!\xc0\xb1\xbcRE\xb3\
-hK\xfcitH\xed\x07\xd9\xe7v\xa1\x7f[\x19w\
-y-\xa0~\xa7+\xe8P\xddsh*\xf7t\xf6\xf9\
-\x9dh\x89\xb5\xaa\xd7\xccxNN\x00_g?\x9f\xc0\
-3\x9f\xccV\xa4\xaa\x17\x02\xb3\xaak\xa0\xea\xcb%R\
-OM\xec\x82\xda\x0blE\x01\xaa*\xfd6Q\xc5X\
-D\xdb\xe0?\x03~\x06\x1c\x06\x8e\x91\x0e\xb0-[h\
-\xca\xab\xa3\x90q\x95\x14\xa4\xce\xa3\xe7\xe8M\xf4o\x18\
-\xa3Z\xcb]\xf1\x9c\xdc@c\x0a\xdeA\x81\xf6\x04\xfa\
-w\xba\xdf\xc9l\x05\x1c\x9e\xcc:g\x11-gM\xa3\
-jL\x04\xa5\x11R\xa3\xf2\x08\xe5\x0fPuR\xf0\x98\
-@=N\x1f\x01?B7\xe9\xeb(\x0c\xceu\xea\x01\
-\x16\xb0\x88\xb6\xf0_@Kw\xe7\xd0\xbfi\x1dZv\
-\xdc\x8e\x0e\xdd\xad\xc2\x08\x89\x06z]\xddD\xcf\xc9a\
-\x14h?C\xff\xbe9r\x832\xcdl\xf9\x1c\x9e\xcc\
-:o\x01U9>E7\xb4\x1a\x0aT{Q\xd3\xf2\
-p\xe7\x1e\xda\x03Eec\x0aUi>G\xc1\xe9C\
-\x14\x9c\xaa:\x8c\xb1\x81\x9e\x97\x9b\xa8\x0f\xea\x8fQ\xf5\
-\xe6M47i\xe3=\xff\xcf\xf2X\x04n\x01\xefe\
-\x1f\x1f\xa0)\xe3\xd7\xf1!\xc1f\x0f\xc5\xe1\xc9\xac\xf3\
-\x16Qu\xe3\x5c\xf6\xf3atc\x8b\xa366P\xbe\
-\xb9H\xb0t\x0c\xc1E\xe0(\xf0.i\xa9\xee2\xda\
-\xc5V\xf6\xca\xd9\xbdD\x1f\xd4\x05\xd2\xb9pc\xa8\xea\
-TG\xd5\xa8\xb2N\x7f\x9fF\xc1\xf5\x14\x0aN\xef\x00\
-_\xa2\xe7i\x12\x1f\x10l\xf6P\x1c\x9e\xcc:/\xaa\
-\x1c\x93\xe8\xe6\xf6Y\xf6\xb9\x18\xa4\xb9\x07x\x94r-\
-\xe1\xc5\x92\xd0\x04\x0a\x17\x9f\x00GPp\xfa\x12\xf5\x09\
-M\xa1\x9btY\x03\xc6\x83\xc4\xf32A\xda\x1d\xb8:\
-\xfb\xdc,\xf0<Z\xca+\xcbs\x12\x1a\xa4J\xe6a\
-Tq:\x8a\x9e\x93I\xdc$n\xf6\xd0\x1c\x9e\xcc\xca\
-\xa3\x8e\x02\xc7)R/J,\x8b\xc5Q\x1b#t\xbe\
-\x02U'U\xcb.\xa2e\xad\xf7\xd1r\xdd1Rp\
-\xea\x86~\x9a\xf8\xfaO\xa3\x7f\xeb\xfb\xd9\xcf\xebhn\
-R\x0d\xed\x90\x1c\xa4\xf3M\xe4\x0d\x14\xea\xa6\xd1\xf2\xdc\
-\xdb\xa8\xc7\xe98z\xecS88\x995\x85\xc3\x93Y\
-y\xe4+\x1d\xe7I\xf3x\xe2\x0c\xbc\xdd\xe8\xf0\xe05\
-t\xeeF\x1d\x15\xa7i\xb4\xcc\xf8\x05\xf01\xaa:E\
-p\xea\xb6\xeaF\xbe2x\x0e}\xedc\xe7\xdd$:\
-Ng=\x9do\x22_D!\xe9\x04Z\xaa\xfb\x10U\
-1\xaf\xb3\xb4zff\x0f\xc9\xe1\xc9\xac\x9c\xa6\xd0\xec\
-\xa7\xa8r\xd4Ph\x19 \xf5?\xb5{\xb9(\xdf\x1c\
-~\x95\xa5=N_\xa1\x1e\xa7i\xba\xf7&\x1d;\x0a\
-/\xa2\xa5\xb0[\xd9\xc7(\xeaS[E\xaa\x0a\xb63\
-\xdc6HU\xcbc\xc0\x9f\xa2\xe0\x14\xcb\xa7\xf3tG\
-\x15\xd0\xac4\x1c\x9e\xcc\xca)*\x1d\x0d\xb4\xcd|5\
-i\x12y\x1d\xed\xf6\x8a\xa3\x5c\xda!\xdf\x1c\xfe%\xea\
-\xa79\x92\xfd\x183\x83\xa2\xc7\xa9[\x1b\x91\xf3\xe1\xf1\
-\x12\xfa\x9a\xacB\xcf\xc3m49}3\x0aR\xed\x9c\
-\x05\x15\xe7\xf2}\x8d\xc2\xec!R\x98\x8dC\x7f\xbb\xf5\
-91\xeb\x08\x87'\xb3r\x8a\x1b\xf5\x0c\xba\x09~E\
-\xea\xabYDc\x0c\x06\xd1\x8d:\xce/k\xe5c\x99\
-#-'\xbe\x0f\xfc\x00\x85\xa6\xcbh\x0b\xff\x0c\xdd\x1d\
-\x9cB,\xe1E\x80\xfa\x14\x85\xa8\x1b\xc0\xcb(\xcc\xae\
-'M\x88o\xe5\xf3\x12\xbdg\xd7\xd0\xf2i\x0c%\x8d\
-\x8aST-\xcd\xac\xc9\x1c\x9e\xcc\xca\xad\x8e\x96\x86\xce\
-\x92\x96\x84\xea\xa8\x07j\x00\xdd\xa8Gi\xdd\xf7r\xdc\
-\xa0o\xa2e\xc4\x98R\xfd6\xda\xd1\xb5@\x0aM\xdd\
-\x1e\x9cB>@\x9d\xc9~\x8c\xf9\x5c\x03\xa87m\x0b\
-\xad\x0dP\x11h\xaf\xa1`\xfd!\xa99\xfc<\x0eN\
-f-\xe5\xf0dVn\xd1gs\x93\xd4\xac\xbc\x88n\
-\xca\xf3\xa8Yy\x1b\xad\xf9^\x8e\xa5\xbai\xb4\x03\xf0\
-g\xc0O\xd0X\x82\xab\xd9\xe7{U\xbe\xcf\xa8\x81\xaa\
-=5T\x81\x9bE\x15\xa8\xcd\xb4&\xd8FU\xf2:\
-i\x14\xc1\xfb\xd9c\xb8J\xaa\x02\x9aY\x8b8<\x99\
-\x95[\xecn\x8b\x9ba\x1dU=j\xd9\xcf\xc7P\xcf\
-MT\xa2\x9aQ\xe5\x88`0\x87zy.\xa1\xc0\xf4\
-\x16\xf0\xe7\xe8\xa6=\xdf\x84\xbf\xa7\xea\xf2=P\xe7P\
-h\x9aD;\xf1F\xd1s\xb1\x89tFa\xb3\x9e\x9b\
-9T\x8d<\x89B\xd3\xcf\xd0\xb2\xdd\xf9\xec1\xb8\xe2\
-d\xd6b\x0eOf\xe5\x17a&*P\xb1<4\x84\
-\xaa\x1b\xebP\xff\xd3Z\x9a\xb3LTGU\xa5\xab\xa8\
-\xaf\xe9P\xf6\xf1\x09\xea\xed\x99\xa3w\x96\xe8\x1e$\x9e\
-\x9b\x19\x14*O\xa2e\xcdy\x14\xa4\xf6\xa1\xf3\xf0b\
-\xc0\xe9\xc3>7\x0b\xe8y9\x82\x9e\x938r\xe5\x0a\
-\xe9\xac:?7f-\xe6\xf0dV\x0d\xd1g3\xcd\
-\xd2\xd9O[Ph\x1a@\xc1)\x96\x89V\xba\x0b/\
-\xfe\x8e+\xe8\xa6|\x18U\x9b>G[\xf4\x1d\x9c~\
-^\xbe\x07\xea2K\xcf(\x1cB\xcf\xcb&\xd2\x88\x89\
-\x95\x04\xa8\xa88\xdd$\xed\xaa\xf3\x91+f\x1d\xe2\xf0\
-dV\x1d\xd1\x83\xd4@\x8d\xc2\x83h\x08b\x1c\x7f2\
-\x88n\xd21\xd6\xa0\xe8M:*NW\xd0\xbc\xa0\xf7\
-\xb3\x8f\x8f\xd1\xb2\xd4\xcc\xc3=\xfc\xae\x96\x1f\xa4y\x1e\
-}-cd\xc1\x22\xf0\x1c\x1a/\xb1\xd2\x00UG\xcf\
-\xf9\xd7h\x92\xfba\xf4\xdc_\xa6\xfb\x86\x92\x9a\x95\x9e\
-\xc3\x93Y\xb5\xe4\x8f\x0b\xb9\x8c\x96\xd2fQ\xa8\x1a&\
-5\x93\xf7\xb1\xfc\x9bt\xec\x94\x9bG7\xe8\x13\xa4q\
-\x04\x9f\xa2e\x22\xf78=X~y\xf5\x0a\xe9\xb9\x99\
-B\xa1\x09R\x05j\xb9Kx\xf9\x91\x15'\xd1\xe4\xf0\
-\xf7Hg\xd5u\xf3PR\xb3\xd2rx2\xab\x9e\xe8\
-k\x99D\x87\xf2\x82\xbe\x97G\xd0\xcd\xba\x06lE\x8d\
-\xca\xc3\xcb\xfc\xf3\xa6Qs\xf8Q\xb4\xed\xfd}\xd4\x84\
-|\x16\xf7\xd1\x14\x91_\xc2\xbb\x80\xbev}hiu\
-\x16\xed\x8e\xdc\xca\xf2w\xe1E\xa0=\x8f*N\xd1{\
-v\x81\xb4Tgfm\xe6\xf0dVM\xf9\x0a\xd4\x15\
-\x14z\xe6\xb2_\xc7\xf7\xf5\x16\xb4\xa4w\xaf\x0aG\x04\
-\xa2\xa8\x94\x9cE}4?E=NW\xf0\xcdy\xa5\
-\xa2Z\x14\xc7\xd8,\xa2p\x0az~6\xa2\xe9\xe4\xf7\
-\x1ap\x1aU\xacI\xb4\x84\x1a\xcd\xe1GP\x05j\x02\
-\xef\xaa3\xeb\x18\x87'\xb3\xea\xcaW\xa0\xa2\x99{\x08\
-U\xa0\xe2<\xbcU\xa4\x06\xf2;o\xd2\x0b\xd9\xffs\
-\x19U\x99>A7\xe9\xcfQ\x90\xf2R\xdd\xca\xe5\xc7\
-\x18\x5cF_\xe7\x01T\x0d\x04x\x02x\x94{\x8f\x98\
-\x98A\xcd\xe1\xa7Q\xc5\xe9]\xf4\x1c\x9d\xc9>\xef\xe6\
-p\xb3\x0erx2\xab\xb6\xe8U\x8a\xa6\xe1\xaf\xb2\xcf\
-\xd7\xd1\xd2\xd0z\x14\xa0FH\x13\xca\xe3\xa6;\x8d\xb6\
-\xd7\x1fG}4?EU\x8eK\xb89\xbc\x19\xf2K\
-x\xf3\xe8\xb9\x19@\x95\xbe\x05\xf4\xfc\xac#-\xe1\xd5\
-H\x15\xa7\x1b\xe8\xb98\x82\x96P\x8f\xa0\xa5\xba\x9b8\
-\xd4\x9au\x9c\xc3\x93Y\xf5\xc5.\xbcE\xb4+n\x1a\
-\xdd\x88\xc7\x81\x0dh\x02\xf9\x06\xd29x1h3\xbf\
-{\xeb]\x14\x9e\xe2Fo\xcd\x11\x01j\x11\xf5-\xcd\
-d\x1f\x83(8\xed@\xb3\xba\xa2\x22\xb5\x88\x82\xf0\x19\
-\xf4\xbc\xbcM:|y\x0a\xef\xaa3+\x05\x87'\xb3\
-\xee\x90?.d\x11U9\xc6\xd0r\xd1\xcb\xe8 \xe1\
-\x0d\xa8\xfa\x14\xf3\x82\x8e\xa2\x1e\xa7\xf7\xd1R],\x07\
-Ys\xc5n\xc68o\xee8\xaa\x04.\xa0\xe7f\x1f\
-\x0a\xb8}\xa8/\xeaK\x14\x9c\xdeCK\xa9gI\x95\
-E/\xd5\x99\x95\x80\xc3\x93Y\xf7\x88*G\x1dU9\
-\x1a\xe8f\x1c\xd3\xc8c\x9c\xc1$\xba!\x1fF\xd5\xa6\
-\xc3h\x99\xc8\x0d\xc8\xad\x15\xe1\xe7\x12\xe9\xb9\xe9C\xcf\
-I\x1dU\xa3\xae\xb2\xb49\xfck\xd4\x1c\xee\xe0dV\
-\x22\x0eOf\xdd%\x9a\xc8'P\x80Z@\xcbCs\
-\xc0n`\x0d:\x17\xedsts>\x8a\x1a\x9ac\xf8\
-\xa6\xb5\xce\x9dM\xe4\xf3h\x84\xc1\x22\x0a\xb3\xabP\xf5\
-\xef\x03\xb4Tw\x06\x05,?7f%\xe3\xf0d\xd6\
-}\xf2\xd3\xae\x1bh\x09\xe8\x06\xda\xb9\xb5\x1e\xdd\xa0?\
-B7\xe7K\xf8\xe6\xdcN\xf9&\xf2E4%\xfc\x16\
-Z\xca[\x8b\xfa\xa1\x8e\x90v\xd5\xb9\xe2dVB\x0e\
-Of\xdd)\x9a\xc8o\xa3\xb9@7Q\xb5c\x1cU\
-\xa5\xbe@7m7\x87\xb7_\xbe\x89\xfc,zn\xce\
-\xa1\xaa\xe0\x22\x0a\xb97Q\xb5\xd0\xccJ\xc8\xe1\xc9\xac\
-{E\x13y\x1c\xe11\x85z\x9f\x16H}4\xd6\x19\
-QM\x9aa\xe9\xb0\xd3\x98\xdb\xe5\xe7\xc6\xac\xc4\x1c\x9e\
-\xcc\xba[\xbe\xca\x11G\xb7D\xef\x8d\x97\x83:+\x9e\
-\x87:\xaa2\xc5\xa0\xcc:n\xde7+5\x87'\xb3\
-\xee\x17[\xe5}C.\x9fxn\xcc\xacB\xfa:\xfd\
-\x00\xcc\xcc\xcc\xcc\xaa\xc4\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'\
-333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx23\
-33+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'333\
-\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx2333+\
-\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'333\xb3\x02\x1c\
-\x9e\xcc\xcc\xcc\xcc\x0apx2333+\xc0\xe1\xc9\
-\xcc\xcc\xcc\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\
-\xcc\xcc\x0apx2333+\xc0\xe1\xc9\xcc\xcc\xcc\
-\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0a\
-px2333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87\
-'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx2\
-333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'33\
-3\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx2333\
-+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'333\xb3\x02\
-\x1c\x9e\xcc\xcc\xcc\xcc\x0apx2333+\xc0\xe1\
-\xc9\xcc\xcc\xcc\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\
-\xcc\xcc\xcc\x0apx2333+\xc0\xe1\xc9\xcc\xcc\
-\xcc\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\
-\x0apx2333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\
-\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx\
-2333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'3\
-33\xb3\x02\x06:\xfd\x00\xcc\xac'\xd4\x81\x05`\x06\
-\x98\x00n\x02\x8b\x1d}DK\xdd\x02\xa6\x80Y\xf48\
-\x1b\x9d}8fVf\x0eOf\xd6j\x0d\x14Jn\
-\x00g\x81U\xc05`\xb4\x83\x8f\xe9N\xa7\x81/\x81\
-\x8b(\xdc9@\x99\xd9=9<\x99Y\xab\xd5Q\xc5\
-\xe92p\x0c\x85\xa8\xd5\xc0`\x07\x1f\xd3\x9d.\xa3\xf0\
-t\x0a=\xbeE\x1c\x9e\xcc\xec\x1e\x1c\x9e\xcc\xac\xd5\x1a\
-\xc04\x0a(\x0b\xc0%`\x88r\xf5\x5cN\xb0\xb4\xea\
-dfvO\xb5F\xc3o\xaeZ\xa9V\xabu\xfa!\
-\x98uZ\x0d\xbdQ\x1bF\xa1i\x00\x05\xa72}s\
-\xcc\xa3\x807C\xb9z\xb1\xcc\xac\x84\x1c\x9eZ\xcc\xe1\
-\xc9\xcc\xcc\xac\xbb\x94\xa9lnfffVz\x0eO\
-ffff\x058<\x99\x99\x99\x99\x15\xe0\xf0df\
-ffV\x80\xc3\x93\x99\x99\x99Y\x01\x0eOfff\
-f\x058<\x99\x99\x99\x99\x15\xe0\xf0dfffV\
-\x80\xc3\x93\x99\x99\x99Y\x01\x0eOffff\x058\
-<\x99\x99\x99\x99\x15\xe0\xf0dfffV\x80\xc3\x93\
-\x99\x99\x99Y\x01\x0eOffff\x058<\x99\x99\
-\x99\x99\x15\xe0\xf0dfffV\x80\xc3\x93\x99\x99\x99\
-Y\x01\x0eOffff\x058<\x99\x99\x99\x99\x15\
-\xe0\xf0dfffV\x80\xc3\x93\x99\x99\x99Y\x01\x0e\
-Offff\x058<\x99\x99\x99\x99\x15\xe0\xf0d\
-fffV\x80\xc3\x93\x99\x99\x99Y\x01\x0eOff\
-ff\x058<\x99\x99\x99\x99\x15\xe0\xf0dfff\
-V\x80\xc3\x93\x99\x99\x99Y\x01\x0eOffff\x05\
-8<\x99\x99\x99\x99\x150\xd0\xe9\x07`f\xb6\x0c}\
-\xe8z\xb5\x0ex\x0cx\x1c\xd8\x01l\x06\x06\x81\x11`\
-\x01\x98\x00nf\x1fW\x80c\xc0\xd9\xec\xf3\x8d\xec\xc3\
-\xcc\xec\xa18<\x99Y\xd9\x8d\x03O\x01\xaf\x01/\x00\
-[\xb2\x8f\xcd(L\xd5\xb2\x8f\x060\x0fL\x03\x93(\
-@\x9d\x02>\x07>\x02>\x00.f\xbf\xc7\xccl\xc5\
-j\x8d\x86\xdf\x88\xb5R\xadV\xeb\xf4C0\xab\xa2>\
-`5\xf0\xcb\xc0+\xc0\xd3\xc0.`\x1b0\x0a\x0cg\
-\x1f\x83w\xfc\x7f\x0d`\x11U\xa1\xe6Q\x88\xba\x0a\x9c\
-\x06>\x05\xde\x02>D\xd5\xa8\x99\xd6\xfe\x13\xcc\xac[\
-9<\xb5\x98\xc3\x93\xd9\xb2\xd5P\x18\xda\x80*M\xaf\
-\x02\xdf\x03\x9e\x056\xa2\xa5\xb9;\xc3\xd2\x83D\x98\x9a\
-\x01\xae\xa1\x00\xf5.\xf0\x1e\xf0\x09p\x0e\x98\x05\xea\x0f\
-\xff\xf0\xcd\xacW8<\xb5\x98\xc3\x93\xd9\x03\xf5\x01C\
-\xc0Z`;p\x00\xf85\xe0\xfb\xd9\xe7\xfa\x9b\xfc\xf7\
-]BKx\x7f\x06\xfc\x148\x8e\x96\xf8fP\xc5\xca\
-\xcc\xec\xbe\x1c\x9eZ\xcc\xe1\xc9\xec\x9ej\xa8\xefr\x0c\
--\xc7\xbd\x0a\xfc\x0a\xf0m`w\x8b\xff\xee\x05\xe0:\
-p\x04\xf8\x97\xc0!\x14\xa2\xae\xa2j\x95+Qfv\
-O\x0eO-\xe6\xf0dvW\x03\xc0z`\x0f\x0aM\
-/\xa3\x86\xf0GQ\x98*\xba<WT\x04\xa4\x19T\
-\x89\xfa\x0c\xf8\x09\xea\x89:\x8e\x96\xf3\x5c\x852\xb3\xbb\
-\xf2\x9d\xfd\xc1\xfa\xd0\x85|\x98\xf4\xf5Z\x00\xe6\xf0\xae\
-\x1d\xb3\x22jh\x09n\x13\xf0\x1c\xb0\x1f8\x98}l\
-F}M\xc3\x1dx\x5c\x0b\xc0m\xd4D~\x14\xf5B\
-EO\xd4y`\xaa\x03\x8f\xc9\xccJ\xcc\xe1\xe9\xc1\x06\
-\x81U\xc0\x1at\xe1o\xa0\x06\xd3\xdbh'\x8f\x99=\
-\xd8\x10j\x04\x7f\x1ax\x09x\x11\xd8\x0b\xecDc\x07\
-\xca0\xb07B\xd4y\xe0\x0b\xd4\x17\xf5\x01\xf01\x1a\
-y`f\x068<\xddO\xbcK^\x85.\xee\x8f\xa2\
-\x1b\x00\xa8\xb9\xf4,*\xf7/\xa2\xf2\xbf\xd7?\xcd\xee\
-n\x03\xf0\x04\x0aMod\x1f\xdb\xd0\xf7V\xab\x97\xe7\
-V\xa2\x8efE]\x00\x0e\x03?BKz\xa7\xd1\x8e\
-\xbd\xb9\xce=43+\x03\x87\xa7{\x1bD\xbd\x17[\
-\x80'\xd12\xc3j\xf4\x0e\xf9\x02j4\xfd\x1cU\x9f\
-fQ\x8823]W\xfa\xd0\x9b\x8f\x11\xe0\x17\x81\xbf\
-\x0d\xfc\x06\xeau\xea\xa7\x1a\xd7\x9e\xe8\x8b\xba\x0d|\x09\
-\xfc\x03\xe0OQ?\xd4<~\xd3d\xd6\xb3\x9a\xbd\x05\
-\xb8[\xd4Pp\xdaLz\xc7\xfc&\x9an\xfc\x0c\x9a\
-x<\x03\xdcB\x17\xd19\x1c\x9e\xcc@\xdf;#\xc0\
-#\xe8{\xe6\x7f\x06\xfeK\xd4\xd74\x8aBU\x15\x82\
-\x13\xa4\x108\x84\xfa\xb4\xbe\x89\xfa\xb4FI\xa3\x0d\x16\
-q\x802\xeb9\x0eOK\xc5R\xdd \x0aNO\xa3\
-\x8b\xfe\x01Ty\xdaNjj\x8d\x0bk4\x8f/\xe0\
-w\xa2\xd6\xdbV\xa1\xdds\xbf\x04\xfc\xe7\xc0_A\xd3\
-\xc1\xb7\xa1@\x15\xc7\xa8TM\x8cT\x88%\xfc\xdd\xe8\
-\xdf9\x8e\xbe\xf7g\xd1\xf7\xbf\xbf\xf7\xcdz\x84\xc3S\
-\x92\x7f\x97\xb9\x16] _F\x17\xffg\xd0;\xe9\xd5\
-\xe8&0\x82.\xa4k\xd1\xbb\xcfit\x01\x9d\xc7\x15\
-(\xeb-qX\xefS\xe8\xfb\xe5\xfbhy\xee\xdb\xe8\
-\xcd\xc7j\xba\xe7:SCU\xa7\xcd\xe8P\xe2\xc7H\
-o\xa6\x06H\x9bI<#\xca\xaa(\xee\x81\xf979\
-U|\xb3\xd3\x16\xddrQk\x86~\x14\x9c\xd6\xa1\x1d\
-@\xfbI\x07\x91\xee@\xbb\xed\x06s\xbfoM\xf6{\
-\xe7I\xd5\xa7\x19R/\x84Y7\xab\xa17\x10\x8f\x91\
-B\xd3\xaf\xa2!\x97\xfb\xd1\x0c\xa7\xaa\xf46\x15\xd5\x8f\
-\xbe\xffw\xa07Y1fa\x04}\xff\xc7\x9b(W\
-\xa2\xac*\xfa\xd0\xebw5z\x83\x10\xf7\xba\x06~\x1d\
-\xdf\x95\xc3\x93\xd4\xd0\xbb\xc7q\x14\x9c\xbe\x81\x82\xd3s\
-h\x97]\x04\xa7H\xe5}\xe8\x9d\xe6 z\xc1\x8d\xa2\
-\x17\xd8\x14K\x03\x94_t\xd6mbi{\x1c}\x7f\
-|\x1f\xf8\x9b\xa8\xda\xf4\x02\xdaY\xd7+\xd7\x95>T\
-}\xde\x85\xc6.\xecF_\x97yT\x81\xf2F\x12\xab\
-\x82\x1a\xa9\xafoW\xf6\xe3:tO\x8c\xc2\x80\xefe\
-w\xe8\x95\x8b\xdc\xfd\xc4\x10\xcc\xf5\xe8]\xf4s\xc0w\
-\xd1\x1c\x9a\xc7\xd0\xc5q\x88\x9f\x7f\x07\x1d}\x10\xe3(\
-\xad\x83\xc2\xd3,\xe9\x8c,\x07(\xeb6\xd1\x0f\xf8\xf7\
-\x81\xff\x1a\xf8u\xb4<\x17s\xd0zQ?\xba\x06l\
-C\xd7\x8fWPo\xd4e43\xca\xac\xac\xa2\x10\xb0\
-\x16\xf5\xf1\x1d\x00\x1e'-GO\xa3\x1d\xe5^M\xb9\
-C\xaf^\xecBT\x9c\xd6\x90Nq\x7f\x03x\x1e5\
-\x87\xaf&U\x9c\xee\xf5\xff\xf7\xa3\x17\xdf\x10\xaa@\xf5\
-\xa3\x10\xe5\xf2\xbdu\x8b>\xf4=\xb2\x1fU\x99\xfeG\
-\xe0\x17P\xa5e\x1dz\xed\x97a\xc8e\xa7D5:\
-\xc6\x9b\xc4\x5c\xab\x83(X\xf6\xa1\x10\xe5\xeb\x80\x95\xcd\
-(\x0a\xfaO\xa0\x82\xc1\xab\xd9\xcf\xb7\xa3e\xf9i`\
-\x824\xcf\xd0!*\xd3\xab\xe1)\xdf\x1c\xbe\x11\xf5.\
-\xbc\x88\x96\xeb^D\xcd\xe1k\xd1\xc5\xf0A;\x84\xf2\
-\xc34\xd7\xa2 5M\xda\x85\xe3\x92\xa7UQ\x1fz\
-c\xb1\x11\xd8\x07\xfc2\xf0[hy\xeeuTq\x8d\
-\xd0\xd4\x8d}M+\x91\xbf\xae\x8c\xa3%\xff\x9d\xd9\x8f\
-[\xd1\x8d\x0aT\x95\xf6\xd1N\xd6I\x11\xf67\x91*\
-N/\xa3\xfb\xdf.\xf4z\x1d#U\x9e\xf2\xc5\x00\xa3\
-w\xc3S\xbe\xe9\xfbI\xf4\x0e\xf1U\xd4\xb3\xb1\x1bU\
-\x9c\x8a\xdc\x18b\x18\xe0h\xf6\xff\xe5\x8fq\x89%<\
-oe\xb6*\xe8#\xbd\x1b}\x1a\x05\xa5\xef\x03\x7f\x09\
-\xed\xa0{\xbcs\x0f\xadr\xf2\x87\x1f\xefC7\xaax\
-\x83\x157!_\x17\xac\xdd\xf2o\x8cv\xa3\xfb\xde\xcb\
-h\xc5e\x0fZ\x96\x8f\x9e\xa7\xa86\xe5\x8b\x01^M\
-\xa17\xc3S,\xd5\xadE\xa5\xc97\xd0\x5c\x9a\x17H\
-\x15\xa7\x01V\xb6\x0c\x117\x9eM\xd9\x9f1G\x9a@\
->\x8b_pV^\xf9\xde\xbf'\xd0@\xc8\xdf\x02\xfe\
-2\xf0=\xf4nt\xa4C\x8f\xad\xcaj\xa4\xaf\xeb^\
-\xe0Yt\x9d\x89\x1dMS\xb8?\xd2\xda'\x9a\xc3\xd7\
-\xa17G\x07P\xe1\xe0 \xa9\xc77\xbf\xab|u\xf6\
-\xb99\xf4Z\x8dU\x95\x9e\x7f\xbd\xf6Zx\x8a\x01\x98\
-\x1bQ\xc2~\x01\xbd\xb3~\x09-\xddE\xc5i\xa5\xcb\
-\x10\x91\xe8\xe3\x18\x97\x1az\x81\xcd\xa1\x17]\x1d\xa7v\
-+\x9f>T\xa2\x7f\x12\xf8\xcf\x80\xdfF\xc1\xe9\xbb\xe8\
-\x0dF\x0c\x85\xb5\x87\xd3\x8fnZ{\xd0\xcdj\x1fi\
-\xd0\xe6mT\xa56k\x95\x18G\xb0\x1eU\x90_\xca\
->^ \x0d}\x1d`i\x0f\xdf\xda\xecc\x91\xb4\x8b\
-t\x1a\x07\xfe\x9e\x0aO\xd1\x8b\xb0\x06\xbdP^C7\
-\x87}(8\xc5!\xa5\x0f{\x93\x88\x1e\xa9\xf8\xbbV\
-\xa3\x17\xdd\x04i\xddx\xe1!\xff\x0e\xb3fY\x87\x1a\
-\xc1\xff2\xf0_\xa0\xde\xa6\xfd(4U\xed8\x95\xb2\
-\xbb\xb3\xb1|3Z6y\x06\xf5\x98,\xa0\x1dzn\
-\xca\xb5V\x88q\x04O\xa1\xf0\x1e\x9b\xa3\x1e#\x8d\xe3\
-\xc9\x7f\xafG?o?\xba\x16\x8ce\x9f\xbb\x8d\x02\x7f\
-O\x1fK\xd6\x0b\xe1)^\x00\xb1\xc6\x1b\xcdq\xaf\xa1\
-\xd4\xbd\x9d\xe57\x87\x17\xf9;\xe3\x02\x19K\x1dQu\
-\x8a\x17]\x1c:j\xd6)\x07P\x85\xe9\xaf\xa1\xc3{\
-\xf3\x9b%\x86:\xf7\xb0\xba^\x5c\x93F\xd0\xbb\xfd\xed\
-\xa8\x12\xf0\x04\xba>\xddF\xcb\xfds\x1dz|\xd6\x1d\
-\xf2\xc7\x8d\xc5.\xd0\xdd\xa4\xe6\xf0\xfd\xe8u7N\xaa\
-8\xdd\xeb\xcf\x18\xcb>\xfaI\xc7\x91\xe5\xcfv\xec\xb9\
-{Y/\x84\xa7\x08N\xeb\xd0\x0b\xe75\xb4\xc6\xfb<\
-z\xe1\xe4\xc7\x114\xf3\x1dv\xcc\xcf\x88\x11\x06\xab\xd0\
-\x0b-\x8erY\xa0\x87S\xbb\xb5]\x04\xfa\xf8>\xf8\
-\x06\xaa6\xfdU\xe0;(4\x8dq\xef\x8b\xa8\xb5F\
-\xbc\xab\xdf\x8azP\xf6\xb3t\xf4C\x03U\xab{v\
-y\xc4V,\xee}q&\xe3.\xf4\xfaz\x19-\xd5\
-=F\xda5{\xbf\xef\xf9X\xb5\x89\x8f8\xa72\xfa\
-y{r\xf7h\xb7\x87\xa7\xe8A\x1aGKs\xfb\xd1\
-\x8e\xa1\x83,m\x8ek\xd5\x8c\x9a|s\xde8\x0aK\
-\xd1<\x1e\xe9\xdd\xe3\xef\xad\xd5b\x88\xe3#\xe8\xb5\xff\
-W\x80\xff\x09U\x9b\xb6\xe1\xa5\xb92\x88\xa1\xbbkP\
-\x1ff\xf4\xa0@\xea\x97\xec\xe9\x1e\x13[\xb6X\x1e\x8e\
-\x19\x86\x1bQ?\xe3~T]>\x98\xfdz5\xc5\xde\
-,\xc5\xb1D\x9b\xb3??N\xd4\x88\xf3]{J7\
-\x87\xa7\xd8U\x17[\x85\xdf@\x17\xa5\xe7\xd1M\xe4n\
-k\xbc\xadx\x0c\xf9\x0a\xd4\x10i)o\x91\xb4\x8c\x17\
-\xcdwf\xcd\xd6\x87.\x9eo\x00\x7f\x1d\xf8\xbb\xe8\x0c\
-\xba\x0d\xe8ui\xe5SC\xa1\xf6y4\xb1|M\xf6\
-\xf9i\xd2R\x89\xd9\xbdD\xc5i-\xaah\xeeB\xaf\
-\xa5\x03\xa4\x1e\xdf\xf5\x14\xaf2G\xbf^\x0c\x83\x8e\x0a\
-i\xec*o\xd0C\x1b\xa2\xba1<\xe5\x07\xd5m@\
-Ks\x07\x807\xb3\x1f\xef<\xab\xae]\x8f)?H\
-s\x14\x85\xa5X7\xf6\xec\x0ck\xb6Qt\xd1\xfce\
-\xe07\xd1\xf2\x5c\xcci\x1a\xa3\xb7'\x82WA~\xd8\
-\xe6n4\xe2`\x1bz^\x17\xd1\xbb~\x87(\xcb\x8b\
-\x9e\xdd\xd8\xf1\xbd\x19]\x03\x9eE\xf7\xbe\xe8q\x8aq\
-<\x0f\xf3w\x8cd\x7f\xfe\x08\xba\x87\xdd&\xed\xc6\xeb\
-\x89\xd7e7\x86\xa7|\xb9\xf2i\xd4\x14\x1e\xcdq\x8f\
-\xf1\xe0#WZ\xf9\xb8\x06\xb3\xc76LJ\xed\xf3w\
-|\xb8\x02e\x0fc\x00] \xbf\x01\xfc\x05\xe0/f\
-?\x7f\x06]\xec\x1ef\x14\x87\xb5W\x04\xa8\xa8 <\
-\x8a\xaa\x06qtT,\x99x\xf7\xae\xc5\x1b\xf4\x08\xdc\
-[Q\xe8\xde\x87\x82\xd3\xd3\xe8\xb53\xce\xc3\xaf\xb8\xc4\
-\x12\xf3\xaa\xec\xef\x8c\x82E\x1c\xe5\x12=z]]\x0c\
-\xe8\xa6\xf0tg\xc5\xe9Q\xd2Yu/\xa0\x17N\xb3\
-w\xd5\xad\xf41F\xb8\x8bS\xab\x17H\xd3\xc8]\x81\
-\xb2\x95\x88\xa3\x16^\x03~\x05\x1d\xa3\x12\xc3_\xb7\x91\
-\x9a<\xadZ\xf2;\xf3\xe2\xba\xb6\x13]\xcf\xe2\x5c\xc1\
-yT\x89\xf2\x1b\xaf\xde\x94\xdfQ\x1e\xc3\x9fc\x04\xc6\
-\x0b\xa8p\xf0\x08\xe9\xf5\xd2\x8c\xeb@\x1fi'_\xac\
-\xa8\xdc\x06n\x90\xaaO]\xfdz\xec\xa6\xf0\x14O\xe4\
-8\xeaqz\x1e\xf58\x1d$\x1d\xb9\xd2\x8a]uE\
-E\xc0[E\x1a>\x18;jb\xda\xb0\x03\x94-G\
-\xec\xa0[\x8b^\xe3\xdf\x06\xfe{Tm:\x88v\xd8\
-\xb4\xba\xaf\xcf\xda'\x86\x1c\xe6\xb7\x9c\xef\xca>?I\
-:F\xc3\xd7\x8e\xde\x11o\xc8c\xec\xc5\xa3h\xe4\xc5\
-3\xa8\xea\xf4,\x9a\xeb\x94/\x1c4STF\xc7Q\
-\xd5)v\xe0\xc5H\x1e\xe8\xd2\xd7c7\x85\xa7h\xc6\
-~\x14\xf57}\x8f\xa5\xcd\xe1+=r\xa5\x15\xf2\x83\
-4\xd7\xa2\xc7\xdd`\xe9\xce\x05\x9fye\xf7\x13\xc1i\
-+\xf0k\xc0\xff\x00\xfc}t\xe1\x8c\xd7\xbbCSw\
-\x8ae\x93\xd5h\xd7\xd47Q\xc5q\x14\xf8\x12O\x7f\
-\xee%\xf9\x1d\xe5;\x81W\xb2\x8f\x03\xe88\xa0\xb8\xff\
-\xc5\xf2Z\xb3\xdd9\xf8u\x1dz\xdd\xddB\x95\xa8\xae\
--\x04tSx\x8a\xd3\xa1_DKu/\xa1\x1bK\
-\xbb\x9b\xc3\x97+.\x80#,}|w\xee\xc0\xeb\x89\
-\xe6;[\xb6~\x14\xb8\xf7\xa2\xa3T\xfe\x1bt\x9c\xca\
->\xd2\x04`\x87\xa6\xde\x90\x7f\x13\xb6\x09\xbd\x06^C\
-\xcb\xb4\xa0J\xb6+Q\xdd\xe9\xce\xe5\xdc\xc7\xd1\xce\xcc\
-\xd8Q\xfe$z\x1d\xb4\xe3\x8dT<\x965\xe8\xdaT\
-'\x8d1\xc8o\x86\xea\xaa\xd7a7\x84\xa7\xbe\xecc\
-\x0fj\x8c\xfd6z\x11=F:r\xa5l\xc1)\xe4\
-'\xc0\x8e\xa0\xc7\x1bg\xe1\xe5O\xb16\x03\xbd\x8ew\
-\xa0c\x85\xfe*\xf0}\xb4\x19b\x07\xaa:Xo\x8a\
-V\x80u\xa8\xd2\xf0\x18ig\xde4\xeaC\xe9\xea\xfe\
-\x93\x1e\x93\xef\xef\x8dQ</\xa0\x82Al\x8c\xda@\
-{\x87\xdeF%<?H\xb3\x9f\xd4\x03\xd5u\x83^\
-\xab\x1e\x9e\xa2t\xbd\x1d\xbdp\xbe\x83\x9a\xc4\xefL\xdc\
-e~'\x1e\x01j\x94t\xa0p\xf4@E\x80r\x09\
-\xde \x8d\x1e\xf8m\xb4,\xfd\x04\xe95c\x96\xdfB\
-\xfe(\xeay\x1b\x06\xae\xa0~\x14\xef\xca\xab\xbe|\xc5\
-)\x0e\xf8\x8d\xa9\xe1\xfb\xd1\xd2\xddz:s.e<\
-\xb6\xd5\xa4q\x08WQ\x80\xcf\x9f\xe9\xda\x15\xf7\xb2\xaa\
-\x86\xa7H\xdec\xe8\xc5\xf2F\xf6\xf1\x22\xba\xc1\x94\xa5\
-9|\xb9b\x90f\x8c0\x88s\xc5\xe2\x04\xeb\xfc4\
-r\xebM#\xa8\x11\xfco\xa17\x09\x1bph\xb2\xbb\
-\xeb#\xbd\xa9\xdc\x81\xae!\xc7P\x1f\x8aU[\xdc'\
-\xe2\x98\xa5\xe7\xd0}\xef\xf9\xec\xd7\xebIU\x9fN\xdc\
-\xfb\xa2y=\x7f\x84\xcb\x1cZ\xc2\x8b]x]\xd1\x8a\
-R\xd5\xf0\x14\xdb27\xa1]E\x7f\x095\xc9\xed\xa4\
-\xba\xcd\xb2\xf9A\x9akP\xb5i\x02]\xf0n\xa1\x17\
-\x9fK\xef\xbdk\x0f\xeao\xfa\x15\xbcDg\xcb\x13\xbb\
-\x8fw\x00\x7f\x02\x9c\xeb\xe8\xa3\xb1\x87\x95\xdfd\xf4\x08\
-\xaa6\xc5(\x9e]\xe8$\x81\xfc\xb9\x88\x9d\xd4 5\
-\xb3\x83\x9a\xc7o\x91\xe6\x19V^U\x8fgXE\xda\
-\xaa\xfb\x1aj\x9e\xdd\x96}\xbe*\xd5\xa6\xfb\x89\xbe\xa7\
-\xc9\xec\xc3U\xa7\xdeVC\xbd|{HUI\xb3\xe5\
-\x18B\xcd\xc3\xcf\x01_\xa3%<\xab\x96\xfc\x1c\xa7-\
-\xa4\x89\xf3/\xa2\x91\x04\x8f\xd0\xfasZ\x8b\x8as\x1a\
-w\xa1\xe6\xf1\xe9\xecs\xc7\xd0\xeb0\x96\xf1*[\x10\
-\xa8Zx\xeaC\xef\xba\xb7\xa3\xe0\xf4]\xd2\x00\xccX\
-\xaa\xabbp\x8a\x9d\x08\xf3(\xa1_\x01.\x02\x97\x81\
-\xeb\xa8\xdc\xe9\xf0\xd4\xdb\xa2\x8f\xa1\x8a\xafo\xeb\x9c\x1a\
-z\xdd<\x89*\xf5\x0eO\xd5\x92?r%\x96\xea^\
-\xcd>\xf6\xa0\xa2\xc1\xda\xec\xbf\x97%8Aj\xab\xd9\
-\x8a\xeek\xd1\x8f\xd7O\x1ac0E\x85\x1b\xc9\xab\x14\
-\x9eb-u\x0fj\x8c{\x9d4$.N\x87.\xd3\
-\x8b\xa7\x88\x18nw\x1b\xa5\xf2O\x81\xcf\x81\xb3\xa4R\
-ge\x13\xba5\xc50\xd5]f\xb7\xce[\x83\xae\x9f\
-V\x1d\xf9#W6\xa1\xe0\xf4\x02\xaa8\xed\xcf>\x17\
-;\xca\xcb\xf6\xa6*f?\xf5\xa3\x80\xd7\xcf\xd2C\x84\
-\xcf\x00\x17H\xb3\xa0*w\x7f\xabJx\x8a\xdd\x05\x9b\
-P\xe2\xfe&K+N\xdd\x12\x9c\xce\x01\x87\x81\xb7Q\
-\x80:KZ\xb6\xb3\xde\xd6\xb5\xc3\xe6\xac-b\xe6\x93\
-UG~\x04\xc5\x1e\xd4\xa2\x12Ku[H\xa3\x08\xca\
-z\xef\xcb\xf7\xf1\xd6\xd0\xbdn\x01\x85\xaa\x0f\xd1\xf5,\
-fBU\xee\xb5Y\x85\xf0\x14\xe5\xbf\xed\xa8\xf4\xfcZ\
-\xf6\x11\xa7\xc3\x0fv\xee\xa1=\xb4:\xaa*\xddBA\
-\xe9\x0b\xe0P\xf6q\x0a\x05*\x0f\xb93PE\xd2\xbb\
-\xa5l%\x1a\xa4q\x05V\x1d1\xc2f\x13:b\xe5\
-5Tq\xdaJ\xb5\xfa{\x87\xd0}z \xfb\x18G\
-o\x06\xe3(\x97\x18\x0c])U\x09Oq\xe4\xca\x9b\
-\xa8\xf11\x06\xc0Uy\x19\xa3\x81R\xf8$p\x1a\xf8\
-\x00U\x9c>A\x15(7\x8a[h\xa0\xd7\x85\xfbU\
-\xac\xa8yt}\xf9\x0c\xcd\xdc\xb1\xea\x18D\xbd\x8e;\
-Q{\xcav\x14<F\xa8Np\x82\xa5}[\x1b\xd1\
-\xbf\xeb&\xba\xae\x0d\x02\x1f\xa1BA\xa5\x94=<\xad\
-B\xf3l\x9eFC0_C)\xbclg\xd5\x15\x91\
-o\x0e\xbf\x81\xd6~?A\xd5\xa6\xc3\xa8\x02u\x13%\
-\xf1\xca\xad\x03[\xcb\x9c\x04\xfe\x884\x10\xd6l9&\
-\x80\x7f\x05|\x85\xc6\x9dXu\xc4V\xff5\xa8=e\
-\x98j\x8e\xe1\x09\xb1\x03o\x04\xdd\xd3k\xa8@p\x03\
-U\xd5\xa3\x81\xbc\x12\xf7\xbd\xb2Vnb\x08\xe6\xa3h\
-K\xe6\xcb\xd9\xc7\xb3\x94\xff\xc8\x95\x07\x89\xe04\x81n\
-\x88\x1f\x00\xef\x01G\x80\x1388\xd9\xddE_\xdc\x00\
-\x0aPkH\xef\xe8\xaaz1\xb5\xd6\xa8\xa3\xa0t\x1a\
-\xf83\xe0\xff\x01\x8e\xa3%\x12\xab\x8e\x01\xd2Q'\xeb\
-\xd1r]\xec\xac\xabb\x88\x8a\x1e\xa8X\xbe\x8bM0\
-183?H\xb3\xf4\xca\x18\x9ebw\xc1jt\xd0\
-\xe5\xeb\xe8\x9d\xf6\x93\xa8I.\xba\xf6\xab\xe8\xce\xe6\xf0\
-\x8f\x81\x9f\xa0\xaa\xd3I\x94\xc0+\xbbu\xd3Z\xee\x1a\
-\x0a\xd7\x8b\xe8\x0dD\x1d}?\xc4\x87\xf5\xb6h\xbe\xbd\
-\x8cv\xeb\xfe1\xf0O\xd0\x9b3W\x9d\xaa'zb\
-\xa7P\xd8X\x87\xfa|\x87Y:\x9a\xa0\xaa!j\x18\
-\xb5\xdf\x8c\xa2{~\xa5\xaaOe\xbc\xe0\x8e\xa2\x9e\xa6\
-\xbdhj\xf8+\xa4\xdd\x05\xd1\xb5_E\xf1\x8dp\x13\
-\x05\xa5\x0f\xd1E\xed0j\x0e\xbfIE^4\xd61\
-\x0d4\xff+\xaa\x95s(D\x8dR\xbd>\x08k\x9e\
-\x06\x0a\xd4S\xa4\xd0\xf4\x8f\x81\xdfA\xbbv+\xf1N\
-\xde~N\x0cK\x8e\xe0\x9b\xaf\xd8\xe4w\xdaU\xb1\x98\
-\x10E\x92\x11Rx\x8a3\xf0f\xa9\xc0\x89\x1ae\x0a\
-Oq\xbe\xdbF\x14\x96\xdeD\xc1\xe9y\xb4|\xb7\x8a\
-r=\xde\x22\xa29|\x02U\x9c\x8e\x00?\x00\xdeG\
-\xa5u/\xd5\xd9r\xc5\x05\xf5*\xba1~\x89\xe6\xa5\
-,\xa0f\xd2\xb2\x0d\xcb\xb3\xd6\xbb\x82\xde\x8c\xfd>\x0a\
-M\xff\x16]cn\xe1kJ7h\xa0@q\x15\x85\
-\x8aAT\x85\xcaW\xa0\xaa\xf8\xa6)_\x81\x1a#M\
-I\x9fD\xd5\xd3R\xef\xc0+S\x18\x89q\x04\xcf\xa0\
-e\xba\xd7\xd1\xa9\xf1\xdbI\xb3\x9c\xaa\xf8\x02\x89\xa5\xba\
-[h4\xfda\x14\x9a>B\xc1\xe96\xae8Y1\
-\x11\xc6\xa7\xd0\x8d\xf3$j\x08\xbe\x80\x82x\xbc\x9b+\
-\xfb\x86\x10[\xb9:p\x09x\x17\xf8\x03\x14\x98~\x1f\
-\xed\xaa\xbbH\x05\xde\xb9[!\x0b\xa82\xb3H\xea\x09\
-\x8e\x9e\xa8X\xb6\xaf\xda\x9b\xa6;\xff\x1dQ=_ \
-\x8d\xe8)mQ\xa1\xd3\xe1)\xbex\x83hYn\x1f\
-j\x0c\x7f\x09\xcd\xb3\xd8Bu\x83S\xec\xaa\x8b\xe0t\
-\x8e4\x8e\xc0Ku\xd6\x0c\x0dt\x93\xbc\x8e\x82\xd3)\
-\xd2|\xb0E\xf4\x8e\xae\xcaK\xdd\xf6\xf3\x1a\xe8\xf9\xfd\
-\x14\x85\xa5\xdfGU\xecCh\x16\xd8\x14\xbe\x9et\xa3\
-\x180\x19=P\x13\xe8\xbe\xb9\x0a\x85\x8e!\xaay\x9f\
-\xcc\x07\xa8aR\x88\x1aF\xff\xd6\xab\x94\xb4\x02\xd5\xe9\
-\xf0\x14G\xaelB\x0d\xe1\xb1\xabn\x1f\x1a\x82Y\xd5\
-\xe0\x04K{\x9cN\xa3\x8b\xdd;(@\x1d\xc3Ku\
-\xd6<Q\xd6\xbf\x82\xc2\xd3IT}\x98B\x17\xa3\xb2\
-\x1e\xe1`\xc5L\xa2]s?\x01~\x17\xf8\x97\xa8\xf2\
-t\x0a\x0f\xc0\xec\x05\xf1f\xfc6zC>\x80\xee\x9f\
-\x116\xaa\xba\x84\x17\x01*\xfe\x0dk\xd05k\x0e\xbd\
-1\x5c\xc8>J\xd5\xbb\xd7\xc9\xf0T#\x9d\xd9\xf3<\
-:v%\x9a\xc3\xb7S\xad\x09\xaaw\xca\x1f\xf2{\x06\
-5\xf7\xfe\x04\xf5!D\x8f\x93w\xd5Y+\xcc\xa3~\
-\x81\x8f\xd0\x8d\xf5<z#\x12Ce=\xde\xa0:\xa2\
-z\x1dK6\x9f\x02\xff\x17\xf0\xbf\xa0\x11\x04\x97\xf0\xf2\
-\x5c\xaf\x89\xcd\x01\xb1\xb4\x15\xcd\xe4\xf9\xc6\xeb*\xde7\
-\xe3\x9a\x14+Q#\xa4\xe5\xbc\x06\xa9\xdaV\x1a\x9d\x0a\
-O1mt\x03\x9a\x9c\xfa\x06\x0aN\xfbPs\xf8Z\
-\xaa\xf9\x02\x08\x0d\x14\x90\xce\xa2\x01\x98?EU\xa7|\
-s\xb8\x83\x93\xb5\xda\x0cZ\xca\xf9)p\x14\xbd\xeeb\
-\xd8^\x04)+\xa7;7\x06\xfc\x03\xe0\xff@Kt\
-1\x9d\xd9z\xd7<\xaa\xca\x5c\xcf~\xbd:\xfb\xc8\xef\
-\xc2\xab\xe2\xf7w\x9c\xe77\x8a\xfe=\xebI\xdf\x07\xd7\
-\xb2\xdfS\x8a\xd7~\xa7\xc2\xd3 \xb0\x19-\xd5\x1d@\
-\x93\xc3\xf7\xa1\x11\x05U^\xaa\x0b\x8b\xe8\xa6\xf5\x1e\xf0\
-\x16\xaa8Ei\xdd=N\xd6.q\x03\xbe\x81\x82\xfc\
-\xd7\xa4M\x0a\x90\xce\x9c\xaaZ\xa3i\xb7\x9bE\xd7\x8b\
-\x9f\x01\xff\x0e\xed\xa0\xfb!\x1a\xa2;IIn\x1e\xd6\
-QQ\x81\x8a\x8f\xb9\xec\xc7Q\xf4==H5\xdf \
-E\xf5)\xdf\x07\x95_\xb6\x9bCU\xd8\x8e\x7f\x0f\xb4\
-;<E\x8f\xd3:\xb4\x93\xee\x05\xd4\x1c\xfe<\xb0\x83\
-\xea\x07\xa7\x98\xb5r\x095\x85\xbf\x85\x02T4\x87/\
-\xe0\xe0d\xed\x17c2.\xa3\x10u\x065\x98\xdfB\
-\xaf\xd9!\xf4\x8e\xd5:\xa7\x8e\x82\xd1Y\x14\x9a\xfe\x08\
-\xf8CTi:\x8c\xdey\xcfw\xea\xc1Yi-\xa2\
-0\x11\x87\xc8\xaf\x22\x0d\x9f\xacr\x859\xc6\x18\x8c\xe4\
-~^C\xdf#\x13\xa4\xfe\xa7\x8e\x85\xa8v\x86\xa7\x1a\
-J\xc3\x9b\x80\xdd(8\xbd\x9c\xfd\xf8\x18\x9aQS\xf5\
-\xa6\xd6Yt\xf1\x8b]un\x0e\xb7\xb2\xc8W\xa1N\
-\xa3*\xd4YT\x0a\x9f#\x0d\xe0s%\xaa\xbdb*\
-\xf8Y\xd4\xa7\xf6#\xe0\xdf\x00\x7f\x8av\xd0\x9dE\xe1\
-\xd7\xecn\xe2(\x9e)\xf4}\x1c\xf7\xd9h\xba\x8e\xef\
-\xe7\xaa\xddW#0\x0d\x92*P\x83\xa4#\x5c\xe6\xb3\
-\x8f\x8e5\x91\xb7+<\xc5\x17b5\xaa8\x1dDK\
-u/\xa2\xa5\xbb8\xe8\xb7jOp\x88\xa6\xcek\xe8\
-\x02\xf8\x1fPx:\x8e\x9b\xc3\xad\x5c\xe2\xb5z\x13U\
-D\x8f\xa2\x19Q\x17YzTBU\xdf\xb1VE,\
-\xbb\xdc@\xb3\x99\xfe\x00\xf8\xa7\xc0\xef\xa1j\xf5%J\
-\xbaE\xdbJ)?H\xb3\x8eVw\xc6I\xa1\xa3\xca\
-\x9bD\xfaI\xd7\xa6\x08S\xd3\xa8\x02\xd5\xb1\xef\x91v\
-\x85\xa7Q\xd4\xe3\xb4\x1b\x05\xa6W\x80\xe7P\xc5i=\
-\xd5\xbfPO\xa2\x1b\xd1!Rs\xf8I<\xc7\xc9\xca\
-\xad\x81.B\x17\xd0\xc6\x86\xb7\xd0\xebv\x1d\xda\xb8\xd1\
-\xe9Q&\xddl\x0e]3\xfe1\xf0\x7f\xa2\xde\xa6\xa3\
-\xe8\x0dX\xa9\xb6d[%\xc40\xe6\x1b\xd9\xafcf\
-R\x8c*\x89\xeaS\xd5\xee\xb35R\xe5)\xe6Y\x0d\
-\x92\x8ep\x99\xa3C\x1b\xb0Z}q\x8c\xe6\xaf\x0d\xc0\
-\x1eR\xc5\xe9%\xb4}:\xc6\xb1W\xed\x09\x0d\x0d\xd2\
-\xa4\xdf\xf7\xd1\x99Ro\xa3%\x91[x\xa9\xce\x96'\
-\x7f\x81\x18#\xf5+\xc4\xf7F+_CQ\x01\x99!\
-U\xa3\x8e\xa0\x1d^Sh\x13G4pV\xf5\xfb\xb4\
-\x0c\xee\xacN\xff\x0e\xf0\xbf\x02\x7f\x8e\x96\xf6o\xd1\x9e\
-7Zq\xa6\xd8(K+\x8d}\xb8:^uq?\
-\x8a\xca\xf2\x04zn\xb7\x90*6U\x5c\x92\x8f\x1c\x11\
-=PQ\x81\xea#\x05\xc6\xb6\x07\xa8V\x1e\xdfP#\
-5\x87\xefA\xbdM\xaf\x00\xcf\xa2\xe6\xf0\xb5-\xfe\xfb\
-[-\xd6\x9ac\x1c\xc1;\xe8|\xa9\xe3\xa4\xe6=\x07\
-'{\x90a\xd4\x07\xf88\x1a\xdb\x11\x1b'\xea\xa8\x04\
-\x7f\x12\xbd\xa6\xce\x93\x8e\xf2i\xb6\x98'4\x83&\xe1\
-_E;\xbb>E\xaf\xed\x17\x80\xa7\x81G\xb2\xc7V\
-\xc5\x0bp\xa7\xc4r\xcaE\xf4<\x1eB\xbd\x90GP\
-\x88j\x97!\xf4&v;\xaa\xf8\xefDU\xffA\xf4\
-\xba:\x89*__g\xbfv\x9fUu\xddDK\xf1\
-\xb1\xfbn-j\x8fy$\xfbyU\x8fr\x19BK\
-\x915R\xbf\xd3\x0c\xba^\xc5,\xa8E\xda\x14\xa2Z\
-Uy\x8a\xa6\xb5\x0d\xe8I\x8b\xe0t\x10}\xe3\xae\xa3\
-\xda\x15\xa7:\xba ^C\xcbt?F\x17\xc4\x13(\
-\x05\xbb\xc7\xc9\x1e$.\x06{\x81\xef\x00\xbf\x9e}|\
-\x0f\xf86\x1a\x1a\xfb,\x0aT\xdb\xb3\xdf[G\x17\x87\
-\xf8\xb1U\x16IU\xa88+-n\xa8\xf1\xa6\xa8\xea\
-K\xed\xed0\x89\x96D?G\x15\xa6\xdfG\x93\xc1\x7f\
-\x86v<\xb6Z\xcc\xd3\xdb\x86zM\xbf\x81^_\xbf\
-\x9a}\xfcB\xf6\xb9\xfd\xe8u\xb6\x91\xb4\xebo\x1a\xbf\
-\xf9\xab\xaaX\xc2\x9bC\xf7\xa9\xdb,m\x22\x8f\xb3\xf0\
-\xaa&\xdfD\x1e\xe7\xe0\xcd\x916dE#ye\xc3\
-S\x0c\xb9Z\x8b\xdeM\x1fD\xbb\xea\x0e\xa2w\xaf\xe3\
-T\xbf9|\x06\x1d\x85q\x0cm)~\x0b\x9dn\x7f\
-\x03\x07'[\x9e!\xf4\xfd\xf1\xdb\xc0\xdf@7\xb3\xa7\
-Q5`\x0c]\xe4\xb6d\x9f{\x19\xbdk\x1c!-\
-\xff\xcc\xa2\x8bd+_k\x8b\xe8\xc2{\x1c\xbd\x93=\
-\x8d\x96\x02V\x93.\xc0\x0eQK\xc5\xae\xc6I\x14\x9a\
-~\x80\xfa\x99\xfe5:e\xe0<\xad\x1f9\x10\xcb\xc0\
-k\xd0k\xec\x97\x81_\x03\xfe\x0a\x0a\xe8\xfbQ\x0f\xea\
-jT\x99\x18\xcf~\xdfs\xe8\x0d\xef\x0d\xd4\x8a0\xd9\
-\xe2\xc7i\xad5\x87\xde\xe0\x9fA\xd7\x93M\xa8p\x11\
-\xe7\xe0A\xf5\xbew#@\xc5rs\x8cj\x88\x06\xf2\
-v\x5c\x17\x81\xd6\x84\xa7!\xf4\x0e\xe6)\xd4\x1c\xfe\x06\
-\x9a\xe3\xf4\x18i\xa9\xaejOX\xde\x02z1\xfe\x14\
-\xf58\x1db\xe9\x1c'\x07'{\x90>\x14\x8c\xfe;\
-\x14\x9e\x9eA\x17\x83\xbb}_D\x15\xf71\x14\xa4\x9e\
-@7\xb8y\xda\x17\xd6\xeb\xa8'\xe7$\xf01\xf0\x05\
-\x0aR#\xd9c\x19n\xf1\xdf_%\xb3\xe8\xeb\xf3\xbb\
-\xc0?C\xa1\xe9-\xf4f\xab]KaC\xa8\xe1\xff\
-\xdb\xc0\xdf\x06\xfe:\xf0&\x0aH17\xe7N1\x83\
-/~O\xbc9\xf4\xf5\xac\xba\xa2\x07j\x11\x85\xa7\xd8\
-E\x1b\x87\xefV\xb5\x971z\xa0\xf2A\xaa\x9f4L\
-3\x8e\xaei\xa9f\x86\xa7\xa88\xadG%\xe0\x83\xa4\
-\x8a\xd3.\xbac\x8e\xd3\x0cik\xf1\x0f\xd0,\x96\xd3\
-\xb8\xe2d\xc5l\x01~\x09\xf8oQ\xef\xc9\xbd\x82S\
-\x88\x8b\xc4\x18i\xd7\xea3\xd9\xcf'H\xc1\xbd\x95\xa2\
-\xb1|\x0a-E\x1dC=2\xe7\xb3\xff\xbe\x99\xde\xae\
-B\xcd\xa1e\xfb\xdf\x05\xfeo\xf4\xc6\xeac\xb4\xe49\
-K{\xae\x0d\x03\xa8g\xee\xfb\xc0\xdf\x04~\x0b\xb5K\
-lg\xe9\xd9\x86\xf7\x12A}=\xba\xd6\xc5\xee?\xab\
-\xbe\x1a\xbaF\xf4\xa1\x8ac\x142\xaa\xd8\xff\x14\x06H\
-\x15\xb5\x01\xf4}6\x8b\xaeQQ5m\xd9\xf7]\xb3\
-\xc2S|\xd3m!5\x87\xbf\x8a\xca\xc3\xd1\xe34D\
-\xb5/\xacut\xd38\x8a\xfa\x9b\xdeE\x0d\xb5>r\
-\xc5\x8az\x06\xf8[\xc0\xb7\xb8w%\xe0nb\xb7\xc9\
-:tC\xdc\x99}l\xcd\xfe\x8c\xf3\xf7\xfe_\x9b&\
-6J\xdcB\xc1\xe0kT\x91\xba\x9e=\xae8[\xab\
-\xca\xdf\xebE4\xd0\xd7 \xe64\xfd\x01\xday{\x8e\
-\xf64^\xc7\xf6\xf3m\xc0\xaf\x00\x7f\x07\x85\xa7\xd7P\
-\x95r\x9cboZk\xa4\xe7\xf0&\x9a9e\xd5\x15\
-\xcf{,\xf7\xd7Yz\xfcI\x1c\xe3R\xc5\x0aT\x1c\
-\x22\x1co>c7\xe1\x02\xe9\xc0\xec\x96\xad\x065c\
-\xb7[\xbe\xc7)&\x87\xbf\x98\xfd\xb8\x93t\xe4JU\
-\xc5\x8bn\x0e-\xd7\x1dA;\x90.\x91\x1ah\x07q\
-\xd5i9bWW\xdbvD\x94P\x1f\xea_z\x93\
-\x95\xbd\xa1\xe8C\xcbdq\xb0\xf6S\xa8\xc2\xfb\x1cz\
-\xf3r\x1a\xdd\xb8cTF\xab\xbe\xce\x0b\xa4\x83IO\
-\xa0\xfe\x9eK\xa4\xc1\xb7\x8f\xa0w\x85U\xdd\x1e}/\
-q=\x98A\xff\xf6\xafP\x03\xf8\xef\xa37USm\
-z\x1c\xf1:\xd8\x8a\xde\xa0\x1e\x04~\x13\xf8.z]\
-=\x8c~t-\xff&:\x90\xd8o\x0c\xab+\x96\xee\
-b\xf3B\x8c\xa4\x88\x0d\x01\xb1\x04\x16\x8d\xe4U\x13U\
-\xf9\x18\xa9\x12\xd7\xd4ET\x1d\x8f\x9e\xa8\xb8\xf74\xcd\
-\xc3\x86\x9a\xd8\xcd\xb1\x01\xad\xb1?\x87.\x9e\xfbQp\
-\xdaH\xf5\xd2\xec\x9d\xe2\x5c\xb0\xeb\xa8\xb7\xe9\x04z\x11\
-\xce\xa3`h\xcb\x97?J\xa0W\x07\x01\xe6\x97\xde\x9a\
-\xf5\xe7\xedG!\xea{h\x03\xc3\x9f\xa2\x80\x1f\xbb\xe4\
-Z\x1dV\xa7\xd0\xf9k'Q_\xd6/\xa0e\xc9\xa7\
-\xd05 \x7f\xd2{\x95\xc5\xd6\xe8+\xe8\xdf\xfa\x11\xf0\
-/\xd0\xbf\xfdV\x9b\x1eC\xec\xd2\x5c\x8b\x96\xe8~\x01\
-U\x9c^A\xe1\xb9YV\xa1\x1b\xd2\x18\xba\xfeYu\
-\xc5&\xa7\xe8\x07\x8a\xa3M\xe2\xf8\x96A\xd29xU\
-\xd4\x87\xaa\xde\x11\x00\xe7r\x1fq\xafi\xfaQ.\x0f\
-\x1b\x9e\x22\xb1\xee\x02\x0e\x00\xaf\xa3\x8a\xd3\xe3(XT\
-=8\x81\x9e\x80h\x9e<\x89fJ,\xa2\x8b\xd7H\
-\x07\x1fW\x15E\xb5\x22\x969{\xb1\xfa\x14o*\x9a\
-m\x04-\xd3<\x8a\xb6\x9f\xff\x04\xf834\xb4\xf5\x02\
-\xed\x09\xab7Q\xf5\xe5kT\x8d\xf9\x16\xaa^<G\
-\xea\xbb\xa9\xaa:\xfa\xf7}\x02\xfc\x10}m\xdfG\xe1\
-\xb4\x9d\x95\x99\x11Ti\xfa\x16\xda9\xf7:\x0a9\x0f\
-[m\xba\xd3(\x0ac;\xd1\xbf\xd9\xaa/\xceQ\xbc\
-\x98\xfdz\x80t\xae\xe58\xd5\xdf\xf8\xd1\x87\xfa\x9f\xf6\
-\xa3\xd7\xef\x1c\xa9\xc2v\x93\x92\x84\xa7\x1azp\xeb\xd1\
-7\xd7\x01\xb4t\xb0\x97\xa5\x83\xb8\xbaA\xbc\xd3[\x8d\
-nL\x0d\xf4o\xec\xe5\xa5\xa7\x95\x9aE\xcbJ_\xa0\
-@z\x1b\xbd#\xea%\xe3\xe8\x0dG+\xf4\xa1\xef\xcb\
-\xbd\xa8\xbau\x00\x85\xa7?C\xd5\x91K\xb4v\x9b|\
-~\x8a\xf6a\xb4\xcc\xfd\x1e\xe9\x10\xf0\x97P\xbfW\x95\
-\xcc\xa3\xd7\xea\x17hV\xd3\x07\xa8\xef\xf1\x1c\xaa\xc8\xb4\
-#8\xc5l\xad\xc7\xd1\xd7\xf1;\xa8\xa7\xb4\xd5\xa74\
-\xc4M\xd5\xbaC\x1d\xbd\x9e#\xf0G\x9f\xd0\xda\xec#\
-\xfa\x93\xab\xda\xb3\x18\xc5\x9cG\xd1\xf7\xc4%\x14\x16\xfb\
-\xd0\xaa\xd1U\x9a\xf8\xc6\xfda\xc2\xd38K\x9b\xc3\x0f\
-\xa2w@U\x9f\x1c~\xa7\x98j\xda\x8f*\x06O\xd3\
-\xa1\xb3t\xba\xc0$\xda\xa98\x84n@\xa7\xe9\xbd\xf0\
-\x14\x0d\x9a\xad\x12\x0d\xbf#\xe8u\xbb\x0d-\x11\xfe\x0c\
-UJ\x8e\xd2\xfa\x10\xb5\x80.\xd0\x93(H\x9dB\xd5\
-\x8bChtI\x9ck\xd9\xaa\x10\xd9\x0c\xf3\xa8b\xf7\
-1\x0aL\x9f\xa2\x13\x04.\x92\x8eRi\xb5\xb8\x19\xec\
-@\x0d\xe0\xcf\xa3\xeb\xed3\xa8*4Lkor\xd1\
-\xcfi\xdd#\x02\xd4$\xda`\x12g\xc5-\x92Zn\
-\xd6P\xdd\xe2G\x8c.\xd8\x8c\xfe=q\x14Q\xf4A\
-\xdd\xa0I\xf7\xef\xa2!'\x1a\xb2V\xa3\x8a\xd3\xf3\xd9\
-\x03|\x0e-\xddEoC7\xe9'Mf\xddB\xef\
-.75\xc3m\xf4\xb5;\x83\xde\xcd_\xea\xec\xc3\xe9\
-j\xb1%\xf9\x09R\x8f\xd5s\xa8\x12\xf4\x01\x0a\x05\x93\
-\xb4\xaer\x12\x1b\x03\xe2\x8c\xads\xa8z\xf3\x11z\xb3\
-\xf5\x0a\xba~\xec\xa0\x5c\xcb\xdf1X\xf03\xf4uz\
-\x1bm\x12\xb9\x84.\xbc\xedZ\xa2\x1bB\x013\x0eR\
-\xff\x06\xba\xe6n\xa2\xdc\xa1\xd3\xca/*\xc4\xb7\xd1\xb5\
-8N\xcc\x00\x15?\x1eE\xf7\xbc\xaa.\xe3E\x05~\
-O\xf6c\x1c\x91TG\xad77i\xc20\xcd\x22A\
-'\xde\x85l$\xed\xaa\xcb_\x00\xbbu\x8brl\x05\
-\xaez\xb3k\x19,\xa0\x1beT_\xba\xed\xb5RF\
-}\xa8\x02u\x10-\xe7}\x03\x0dx\xfd\x7f\xd1\xe4\xf0\
-\xcb\xa4\x10\xd5\xaa7\x05\x8b(@M\xa2\x8b\xf5;\xe8\
-\xba\x11\xc7\xd1<\x8e6\x9dDSy\xbb_\x17\xf9w\
-\xe3gQ\xc0\xfcwh\x1cI\xec\xaam\xc7\x1b\xa68\
-\xfct=\x0aN\xbf\x8cf5\xbdH:\x08\xd5\xdf3\
-\xd6\x0cu\xd2\xf0\xdb\xf8\xf9\x08\x0a\xed\xfb\xd1\x8e\xd9\xcd\
-T\xf3\xbe\x97_\x8e\xac\xa1k\xcd\x02\xa9\x8az\x1a\xf5\
-\xde\xce\xd0\x86\xf0\x14\xe1a\x14m\x8d\xdd\x8f\xde=\xbe\
-\x84\xd2\xdd\x18\xd5\xfc\x22\x9b\xf5\x8aX\x02\xda\x8b\xaaQ\
-\xdfG\xbb\xf2\xfe9:\x9bq\x92\xd6\x0fs\x8cw\xbc\
-7PC\xfb!\xe0w\xb2\xc7\xf2_\xa1kK\x9c\x98\
-\xde.\xb1\x03\xf4t\xf6\x98\xfe-\x1at\xd9\xf4\xad\xcd\
-\x0f\x10\xa3\x076\x00\x7f\x17\x0d\xb9\x8c\xfe0\x07&k\
-\x959\xd2R\xd6<\xaa\xbaN\xa1\xca\xd3\xa6\xce=\xac\
-\xa6Y\x85\xbe\x8f\xd6\xa37\x91\x93\xa4s\xf0\xe6x\x88\
-J\xf2r\xc3\xd3\x08\xfaB\xeeB)\xee\x0d\x96\xae\xbb\
-;8\x99UG\xf4\xef\xfd\x1a\x0aS\x87P\x80\x8a\xb3\
-\xd7\xa6h\xfd\xf2T\xcc\x9a9\x8a\xaa_\xef\xa0\xaa\xd8\
-7\xd1\x9b\xb3-\xb4v\xb0\xee<z\xf7\x19Co\xff\
-\x04\xf55]\xa1\xbd\xbb\xe7b\x9b\xf5.\xd4\xd7\xf4\x1b\
-\xa8\xaa\xbf\x0d\x87\xa6\x22\xc6HgB\x8eR\xdd%\xa7\
-N\x88J\xcd:\x14\x9a\xa2\x22u\x1d-\xfd\xb7\xba\xb7\
-\xae\x95\xf2'\x9f<\x81\x8e,\x8a\xd7\xca\x09R\x05\xaa\
-\xf0\xf7\xfc\x83\xc2SL!]\x87J\xeb\xfbQ\xb5\xe9\
-\x00iW]\xb7\xf58\x99u\xbb\xb8Xn@7\x9b\
-\xadh&\xd3\xb3h\x97\xdc\xc7\xa4\xde\x80V\xaa\xa3\x00\
-5\x93\xfd]gQ\xaf\xd1\x8b\xa4e\xc6\x1d4\x7f\xc4\
-\xc1Y\x14\x9a\x8e\xa0\x9e\xa6\xcf\xd1\x85\xf4&\xed\x0bN\
-\xfd\xe8k\xff$i\xb7\xf2K\xe89\xa8r\xc3n'\
-\xd4H=\xa9[\xd1\x1b\xfd\xf1N>\xa0\x0a\x8a\xb6\x9c\
-\x91\xecc\x12\xedN\x8b\xb3\xf0\xaa\x1a\x9e@9f\x0c\
-e\x98U\xd9G\x1c\xe0\xbdHj /Ti\xbe_\
-\xf0\x89\xc4\xb61\xfbK\x9fE\x0d\xa7O\xa3\x86\xb2u\
-x'\x86Y\xd5\x0d\xa37B\x1bQP9\x80*1\
-\xef\xa0\xe6\xee\xb3\xb4~wi\x03]\xac\xbfD\xbb\xd9\
-\x8ef\x7f\xf7\xc1\xec\xe3\x19\x1e~N\xd4\x1c\xea_:\
-\x87v\x1d\xbe\x87\xc2\xd31Z0\x03\xe6>\x06P8\
-z\x14U\xf1\xe3\xfc\xcf\xbd\xa8\xda\xe4k\xea\xca\x8c\xa2\
-\xd7\xf0.Ta\xd8\xde\xd1GS]Q\x09\xed\x969\
-\x8d!_Y\x9bA=\x98\x0b(\x1cFOf\x84\xa9\
-e\xff\x81w\x13\xc1i\x1d\xeaiz\x0e}\xa3\xc7\x1c\
-\xa78\x91\xd9\xcc\xaa/\xe6\x08\xedA\x8d\xca\xfbP\x95\
-\xf9\x07\xd9\xc7\x19\xd2\x0e\x95V\x86\xa8:\xea\xbf\xb8\x85\
-\x9a\xd9?@\xc1\xe9\xbbhIo\x07\xaav\xc7d\xe4\
-\x07]\xdcc\x97\xcdM\xd2\xcc\xa9w\xd0\xc8\x81\xe3\xd9\
-\xdf\xd5Nc(4=\x83zF\x7f\x95\xd4,\xefe\
-\xa6\x95\x8b\xaa\xc9j\x14\x9a\x9eEo\xf2me\x86\xd1\
-ku\x94\x07\x1fZ^55T\x9d|\x19]\xf3\x86\
-Q\x88:\x87\xfa\xbd\x96\xddD~\xb7\xf0\x14\x8d\x8b\xe3\
-((=\x83\x82\xd33\xa4\xe9\xc8\xees2\xebN\x83\
-(@mEU\xa8o\xa1\x9dgo\xa1yM\xed\x98\
-\xcb\x15\x93\x90c\xaa\xff\xbb(\xd8\xbd\x82\x8e#y%\
-{|\xf7ZN\x88\x8b\xdf\x5c\xf6g\xfc\x09\xf0\xefQ\
-\xa5)\xce\xfckg_Sl\xb8y\x065\x82\xff\x0a\
-\x0aM\xe3m|\x0c\xddn\x90t\xf4Q\xbc\xe17\xbb\
-S\x0de\x98\xb5(lG\xefc\x1c\xbd\x14\xc7\xb8<\
-0@\xdd-<\xf5\xa3o\xea'\xd1;\xd0\x17P\xc5\
-\xe91\xf4\x0ei\x0co37\xebv\x83h\x19\xe9\x97\
-\xd0\x8d\xe8\x10\xf0\x1f\xb2\x8f\xeb\xb4o\xde\xd9\x22zG\
-8\x81\x0e\xe1\xfd\xf7\xd9\xe3z\x04Uqv\xa0e\x9a\
-\x1a\x0a\x5cW\xd1p\xcb\xf3\xa8\x97\xe9&\x9ags\x0b\
-]\x1c\xdby2@\x9c\xc4\xf0$\xf0w\xd0d\xf0\xc7\
-\xd1\xd2\x81\x97\xe7\xcc:\xa7\x1f\xe5\x99\x03\xa4^\xaf8\
-\xf3o\x9ae\x0c\xc1\xcd\x87\xa7\x98L<\x8e*L\xcf\
-\xa2\xd2\xfd\xd3\xe8\x02\x95?\xe0\xd3\xc1\xc9\xac\xbb\xc5R\
-H\x1c\xb89\x8e\xde@\xbd\x82\x9a\xca\x7f\x8aBJ\xf4\
-\x0a\xb4J\x8c7X@\xe1\xe8J\xf6\xf7\x1e\xcd\x1e\xd7\
-\x9a\xec\xb1\xd5\xd0\x05o\x06\xf5OM\xa0\xd0\xb5\xd0\xc2\
-\xc7v/\xfd\xa4M6\xaf\xa2J\xd3khI\xa9\xd9\
-g\xd0\x99Yq5Ty\xda\x85rM\xbc\xc9ZD\
-\xd7\x97\xfc\xfc\xab\xbb\x8a\xf0T#\x0dg\xdbM\x0aN\
-\xcf\x92\x82\xd3j\xd2\xa063\xeb\x1d\x03h'\xd3\x06\
-\xf4f\xea\x15T\x8d\xfe\x88\xb4S\xed\x06\xed\xabF\xcd\
-f\x1f\xd7\xdb\xf0w-W\x9c\x81\xb9\x0eU\xc6^@\
-\xbb\xe7^G\x0d\xe1c\x1d{dfv\xa7xs\x18\
-\x13\x03\x0e\xa2\xe04\x8cz-c\x16\xd4=w\xe1\x0d\
-\xe4\xfe\x90QT\x0a\x7f\x16\x95\xb2\xf6\xa2 5\xce\xf2\
-\x1b4\xcd\xac{\x0d\xa0m\xe0\x9b\xd0\xf5\xe1S4\x1b\
-\xea'\xa8\x9f(\x06\xecu\xa2\xda\xd3I\x03\xa4\x83\xc3\
-\x9fC\xa3\x16\xbe\x85\xda\x1e6v\xf0q\x99\xd9\xfd\xc5\
-f\x99\xbd(\xe7\x8c\xa0e\xbb)\xd2\xf5l\x9e\xbb\x04\
-\xa8\x01\x96\xbe[\xda\x8b\xbe\xe1\x9fD\x15\xa7q\xbcT\
-gf?o\x03\xda\x01\xf7\x14\xaaD\xfd!j*\xff\
-\x9c\xf6\xf6DuR4\x82oDo8\x7f\x11\x1d\xa9\
-\xb2\x0f\xbd\x19u\x95\xde\xac\xdc\xf23\xef\x06Q\xc5i\
-\x02\xad\xc4}\x8cv\xe1\xdd\xe6.G4\x0d\xa02\xd5\
-&\xd2\x90\xbcg\xd0n\x85M\xe8\xdd\x94\x9b\xc3\xcd\xec\
-nbR\xf9\xab\xa8\xbf\xe7\x1bh\x14\xc0\x8fP\x83\xf9\
-d\xe7\x1eZ\xcb\x0d\xa2\x0b\xee\x8b\xc0_B\xcbt;\
-\xf0\xa9\x0bfU\x15\x9b;\xc6\xd0n\xde8\xba)\x0e\
-\x11^2\x03j\x00\x95\x9ac\xcam\xf48\xad\xcf\xfe\
- \x07'3\xbb\x9f\x18\xfa8B\xda\xa5{\x00\x05\xa8\
-?A\xf3\x94Z\xd9P\xde\x09[P\xb5\xed7H\x95\
-\xfa\xf5(4y\x17\x9dY5\xf5\xa3k\xd9\x0et\xcd\
-:M\xea\x83:\x87*R\x8bdM\xe4\x03\xa8\xca\xb4\
-\x17\xbdsz\x02]\x18V\xe1\xa5:3[\x9eh\x96\
-\xde\x84\xaa1\xdbI\x93\x9e\xdfA\xbb\xf3\xce\xa1^\x82\
-*\x06\xa9|s\xe9s\xa8\x11\xfc\xcd\xecc=\xbeV\
-\x9au\x83\xd887\x86\xaea\xafe\xbf\xeeC\xd7\xad\
-\x05t\x0dk\x00\x8d\x01t\x81{2\xfb\xf1\x11\xd2\xae\
-:_\x0c\xcc\xac\x88\xb8\xf8lD\xa1\xe29\x140\xfe\
-\x00M\xf7>\x81\x06mN\xa3\x0bQ;\x07U\xaeD\
-\x84\xc2\xb5\xa8'\xf4\x00\xf0\x17\xd0Eu\x07\x1e;`\
-\xd6\x8d\xe2\x88\x9agPP\x9aB\xbb\x89\x17\xd0\x1c\xb9\
-i`!\xc2\xd3\xa3\xa8\xe4>\x82\x0f\xa44\xb3\x87\xd7\
-\x87\xde\x88\xbd\x8a\x96\xb6\xbe\x02~\x08\xfc.:\xc3\xee\
-2\xba(\x955@\xf5\xa1\xeb\xe1#\xa8*\xff\x1d\xe0\
-\xaf\xa2\x09\xd6^\x9a3\xeb^Qi\xce\x9fA9\x87\
-\x96\xef>C\xb3\xe6\xa6\x06HS5\xe3\x9d`\xb7\xef\
-\x901\xb3\xf6\x1a%\x1d\xee\xfb*\x1a\xb0\xf9c\xd4T\
-~\x86eL\xf3m\xa3\xb8pnA\xcbs\xdfE\xd5\
-\xb3\xa7H\x1bh\xcc\xac{E\x05}\x14]\x07\x16\xd1\
-\x9b\xa9E\xb4\x09\xa6N\xb6l\xf76\xea(\xdfD\xda\
-\xb27\x82\x97\xed\xcc\xac9\xe2\xbc\xcc\x8d\xa8\x9fr+\
-\xda\x9c\xf2\x0e\x0aQ\xef\xa1\x09\xbf\x9d\xaeB\x8d\xa0\x80\
-w\x10\x0d\xb7\xdc\x8fB\xd3#\xe8q\x9bY\xef\xe8C\
-\x01j\x13*.\xcd\xa0k\xd4*\xe0\xcb\x014\xdc\xae\
-/\xfb\x0d\xa0\xcaS\x9c\xf2}\xb7\xb3\xef\xcc\xccV\xa2\
-\x1f]xv\xa2k\xcc\xa3h\xc3\xca\x13h\xaa\xefq\
-RoA\xbb\xed$M\x04\x7f6\xfb\xc8o\x9e1\xb3\
-\xde\x13\xbb\x89k(8\x0d\xa0\xeb\xd8\xe2\x00:\xc7e\
-,\xfb\x0d\xf9w~\xeb\xd1\x85\xc3\x15(3k\xa6h\
-\xc8\xdc\x87\xce\xcb{\x01\x0d\xd8\xfc\x09\xda\x99w\x12\x0d\
-\xa6ku\x0bAT\xc4\xf6\x00\xdfC\xa3\x07^E\xef\
-6\x87\xf1\xb5\xcf\xac\xd7\xc5n\xbb\x18\xdb4\x80\x96\xef\
-\x16\x06P\xe7\xf8\x19\xd2\x04\xcd\xa1\xec#\x06h\xc6\xff\
-lf\xd6L\xfdh\xa3\xca8\xda\x99\xf7\x8b\xc0\xef\x01\
-\xff\x1ax\x1f\x95\xc9[\x15\xa0\xa2!t'\xf0\xf7\xd0\
-\xe1\xbd\x8f\xe0k\x9d\x99-\x15=P\xf9\x0aT\xdf\x00\
-\x0aM\x13\xc0E\xe0\x0b\x14\x9c\xe6I\x87\xe2\xad%\x0d\
-\xcc43k\x85~\xb4|\xf7[\xa4c\xa1\xde\xa25\
-;\xf2\x06Ph\xfae\xe0o\xa0\xca\xd7Z\x1c\x9c\xcc\
-\xec\xee\xfaHo\xb8\xb6\x03\xf5\x01ta\x8a\xf1\xe3\xc7\
-\xb3\x9f\xcf\xa0\x845\x9a\xfb\x9f\xfap\x19\xdb\xccZ'\
-N<\xf8U\xd4T>\x84\x02\xd4\xb5&\xff=\xfb\x80\
-\xbf\x98}\xecC\xed\x09\x0eNfv?\xb1l\xb7\x1a\
-\xd86\x80\xaaK\x8b\xd9\x8fq\xa0\xe7\x00\xday2\x98\
-}\xbe\x1f\xf5(\x0c\xe0\x8b\x8c\x99\xb5\xce0Z>\x1b\
-C\xcd\xe3s\xc0\xbb\xe8\xda\xf4\xb0j\xe8:\xf6=t\
-\x1e\xdd~\xf4\x06\xd1\xccl\xb9\x06\x80\xe1\xfc.\x92:\
-Z\xae\xbb\x8dz\xa0\xfaI\xe7\xba\x8c\x91\x12\x97\xc3\x93\
-\x99\xb5R4\x94\xff*\x1aH7\x81v\xe3\xcd<\xc4\
-\x9f\xd9\x8f\xae_\xdf\x01~\x1d-\xd5\x8d<\xdc\xc34\
-\xb3\x1e\xd3 \x1b[p\xe7\x16\xdc\x05\xb2Nr\xf4\x8e\
-o\x16m)^K:\xf4\xd2\xd3u\xcd\xac\xd5\xfa\xd1\
-4\xef\xef\xa3i\xe4\x97\xd0\x94\xf2\x95\x1aEKt\x7f\
-\x0f\xed\xa8sp2\xb3\x22\xea(\x1bM\x02W\xef5\
-\xbf$\x9a\xc8\xcf\xa1!\x9aq(\xde(z\xf7ff\
-\xd6\x0e\xbb\xd1\x12\xdb5\x1e.<m\x04~\x1b\x1d\xb5\
-\xb0\xa6\x09\x8f\xcb\xcczG\x1d\xe5\xa0\xc8E_\xde-\
-<5\xb2\xdf8\x83\xfa\x0c\x8ef\x9f_C:A|\
-\x1dj\xe6\xf4\x12\x9e\x99\xb5\xd2 \xea\x81z\x06\xcd\x84\
-:K\xf1\xddwk\xb3\xff\xff\x9bxW\x9d\x99-_\
-#\xfb\x98G;\x7f\xaf\x01_\x03\x9f\xde\xab\xf2\x14\x01\
-j6\xfb\xcd'P\xdfS-\xfb\x03^D\xef\xe4|\
-\xaa\xb8\x99\xb5\xdaZ`\x17\xb0\x178O\xf1\xf0\xb4\x19\
-5\x87\xef\xc4\xd7,3[\xbe\xe8\x05\x9fD\xfd\x97'\
-\xd1H\xa7\xcf\xeew\xec@\x04\xa89\xe0*\xf0\x09\x1a\
-\xa89K*{\xaf\xc7\x15(3k\xad8sn/\
-\x1a]\x10\xbb\x83\x97c\x00U\xae\x9eG\xf3\xa3|\xad\
-2\xb3\x07\xc9W\x9c&P\x06\x8a\xe0\xf49\xf0\xd5\x83\
-\xcel\x8a1\x06S\xa8\xe7i\x01\x95\xd1\xd7f\x9f\x8b\
-\x93\xd2\xfdn\xce\xccZe\x00U\xba\xf7\xa0\x96\x81\xe8\
-\xc1\x5c\x8e1\xd2\x19z\x1eK`f\xcb\x11\xc1i\x12\
-\x05\xa73\xa8\x85\xe9\xe3\xec\xc7\xd3\xcb=\xf02\x96\xf0\
-\xaef\xff\xf3M\xb4\x9c7H\xaa>\x99\x99\xb5B\x1f\
-\xe9(\x95\xed\xe8\xfaS$<\xadC\x830\xcd\xcc\x1e\
-$\xc6\x11L\xb1t\xa9\xeeC\xe0#\xd4wys\xb9\
-\xe1)JXshp]\x1d\xbd\x13\xdc\x8c\x02\xd4\x9e\
-\xdc\xcf=\x85\xdc\xcc\x9a\xad\x1f-\xdf\x8dPl\xe9m\
-\x88t\xd0\xaf\x99\xd9\xbdD\xabR4\x87_F\xc1\xe9\
-s\xd4\xb6\xf4\x05p\x1a\xbdy\x9b[nx\x0a\xb1\x0b\
-\xaf\x0e\x1cC\x17\xb2\xc5\xec\xd7\xab\xd0\x18\x838}\xb8\
-\x9b4r?\xb6\xfa\xa4\xf7n\x16\xaf\x15\x7f\x0d\xad\xa8\
-A\xd2!\xc2E\xae[\xc3\xe8\xda\xe4%;3\xbb\x9f\
-;\x97\xea\x228}\x84\xc2\xd3\x7f\x0aNdg\xdb\x15\
-\xfd\xc3\x17\xd1\x12\xdeE\xd2;\xc01\x14\x9c\x1eE\x17\
-\xb7n\x1a@\x17It.\xf7\xb1\xd8\xd1GT]\x13\
-h\xb9w\x1a}M\x9b}\xe0\xabu\xaf\x01\x96\xbeA\
-[\xae\xe1\xec\xff\xe9\xa6k\x92\x995_\x14\x87\xae\x02\
-\xa7Pp\xfa\x18\xf8\x0cM\x1c\xb8A\xee\xbeU4<\
-\xe5\xff\x92)\x14\xa0\xfaQi|\x0ex\x195\x91o\
-\xa1{\x0e\x12\x8e\x89\xa2\xd7\xd1\x17\xf5\x06\xba\xf9\xbbz\
-R\xdc4J\xf3WI\x9b\x10\xccZi\x10\x05'\xf7\
-e\x9a\xd9\xbdD\x9f\xd3-\xd4\x1c\x1e\x15\xa7/P\x90\
-\xba\x81\x8aF\xff\xc9J\xc3\x13\xd9\x1f\x14\xc7\xb8\xccd\
-\x7f\xe9 j\xce\x5c\x8d\xca\xe4\x0f\xf3\xe7\x97E\x04\xc5\
-k\xe8\xc6\x1f_\xc8\x05\x5c9)j\x1e\x05\xa7\x8b\xe8\
-\x0c\xc5\xf9\xce>\x1c33\xebq\xb1\xa26\x8d\xfa\x9c\
-\xbeB\xc1\xe9Ct\xcf\xbf\xc5]\xeeU\x0f\x1bn\xf2\
-\x834\x8f\xa3\xa3\x5c\x16\xd1\xba\xe0\xb3\xa4\x0aT\x95\x0d\
-\xa0\x9d>\x8b(\x91^C\xfd^7PE\xca\x96/\
-\x82\xe8m\xf4\x82\x9c\xbd\xffo733k\x99\xa88\
-]F\x85\x91O\xd0!\xe4\x9f\xa0\x81\xbc\x13(8\xfd\
-\xdcJ\xd3\xc3\x86\xa7\xf8\x8bo\xa3p1@:\x5cx\
-\x04U\xa2Vg?V5D\xf5\xa3\x9e\xae~\x14\xa2\
-\x06P\xa5\xedb\xf6\xb1\x88{\xa0\x96+\x12\xfeB\xee\
-\xc3\xcc\xcc\xac\xdd\xe2\xa0\xdf\x09Ta\xfa\x18\x05\xa7\xc3\
-\xa8@2\x81V\xd6\xee\xda\xa2\xd3\x8ce\xb5\x98B^\
-G\xf3\x0f\x1a((\x0dg\x0f\xecI\xaa}\x94K\x0d\
-}\x9d\xfa\x80m\xc0S(,\xdeD\x07\x04N\xa20\
-\xe5\x00effV~1z\xe9:\xaa0}\x02\x1c\
-\x02\x8e\xa0\xb3\xeb\xae\xf2\x80\xdd\xf5\xcd\xecIZDI\
-\xed|\xf6\xeb\x1825@\xea\x85\x1a\xa0\x9aM\xe45\
-\x14\x9e\x1eC\x15\xb5U\xa4%\xa8sh)o\x06\x8f\
-203\xeb\x84\xa8j\xc7\xceh\xb7\x04\xac\x5c\xdc\xef\
-\xf2?v\x93\x18Ip\x13\x05\xa5O\x80\xf7P\x9f\xd3\
-\xc9\xec\xf3\x0f\xecgnfx\x8a$w\x93\xf4\x22\x06\
-\x1d\xe5\xd2\x00v\x03\x9bP\x90\xaa\xa2\x1a\x0a\x80\xa3\xe8\
-\xdf\x13k\xa1G\xb2\xff~\x0d}\xc3\xba\x02ef\xd6\
->q\xef\x89Q(\x17\x80\x0d\x1d}D\xd56\x84V\
-\x8eb(m\xb7\x0d\xbf\x8e\xd7\xcay\xb4\xab\xee=\xb4\
-T\xf7%\xaaD-k#X+v\xc3\xdd9\xc6\x00\
-\x14\xa8\xe6Q\xc5\xa6\x9f\xea\xf6?\x81\xbef[\x81\xd7\
-H\xcb\x911\x99\xf4\x1a\x1e\x02if\xd6n\xd7\xd0.\
-\xa9\xd8\xb0\xf4ig\x1fNe\xf5\xa1\xfb\xdav4\xb7\
-q;\x0a\xa2Ef\xab\x95Y\x1d\x05\xa4\x13\xa8\xc7\xe9\
-\xfd\xec\xe3\x1c\xca-\xcb\xbew\xb7*<\xc5\x94\xce\x0b\
-\xb9\xbfgM\xf6\xb1\x03\x0d\xd2\xacj\x9a\xedC!\xf0\
-Q\xf4o\xb8\x84\x96\xec\xe2\xbfE\x05\xca!\xca\xcc\xac\
-\xf5\x1a\xe8~3Oj\x00>\xd1\xd1GT=5T\
-\x08\x18C\xabD\xc3(Du\xcbJJ\xf4fGs\
-\xf8\x11\xd4\xe3\xf41z\xadLr\x9f\xe6\xf0\xbbi\xd5\
-\x1c\xa6\xd8\x85\x17\xa5\xb1\x98\xf2;\x84^\xe0O\xa1\xe5\
-\xbc\xaa\x1e\xe5\xd2\x8f\x96\xef6\xa1\x91\x0c\x0b\xe8\xdf\x11\
-\xe5>/\xe1\x99\x99\xb5O\xec\xf2\xbeB:\x01\xc3\x1e\
-,\xee\xbf\x83\xc0zTi\xeaC\xf7\xebq\xb4lW\
-\xc5{t^\xf48\xdd@\xe3\x08\x8e\xa0]u\x1f\xa3\
-\x9e\xa7h5*T\xech\xe5\x10\xcbx\xc0\xb7\xd0.\
-\xbc\xd8m\x17\xc7,@\x0aTU\xd4\x87^X\xbbI\
-\xc1)*NQ:v\x05\xca\xcc\xac=\xf2\x87\xd7\xdf\
-\xee\xecC\xa9\x8cZ\xf6\xb1\x0a-\xcfmB\xabC\x8f\
-\xa3 U\xf5\xf0\x14\xe3\x08br\xf8a\xd28\x82\x13\
-\xac08A\xeb'\x80\xc7\x0e\x88\xdb\xe8\x81Cj\x18\
-\x7f\x0e\x05\x8f\xcdT\xf3\xc9\x89\x11\x06k\x80GH%\
-\xbf\xe1\xec\xbf\xc5@M\x1f\xe5bf\xd6\x1e\x9e\xbbW\
-L?iG\xfcVt_~\x1a\x8d\xe5YE\xb5\xfb\
-\x93A\x05\x9c\xeb\xa4\x01\x98\xefe?\x9e\xcc>?\xb7\
-\xd2?\xb8]\xc7\xa7\xcc\x92\xca\xa9\x90\x0e\xd7\x1bFk\
-\xac#Ts\x09\xaf\x86\xfe\x0d\xd1P\x17;\x13\xa2\xe2\
-4\x97\xfb\xb9\x99\x99YY\xd4\xd0\xfdj\x0d\xaa2=\
-\x0b\xbc\x8e\x8a\x1a\xeb\xa9\xde\xfd8/\x0a7\x13(8\
-\x1d&5\x87\x9f%\x1d\xb1\xb6b\xed\x0aO\x11$\xa2\
-\x02\x15OZ\x1f\x0aR;Q\x00\xa9\xdaYxQ\xf2\
-\x1cFc\x0c\x1a(,E\xbf\xd3\x04Mx\x92\xcc\xcc\
-\xcc\x9a$\xee[\x83h\xe5\xe7\x09\xe0\x00\xf0\x12\xba\x17\
-\xafG\xed4U\x0dO\xb1|{\x8d\x9f\xefq\x8a\xe0\
-\x14\x83\xbdW\xac\x9da%z\xa0\xae\xa3`\xd1Gj\
-,\x1f\x22\x0d\x9f\xac\xe2P\xae\x98\xa8\xbe\x0e\xbd\xf8\xfa\
-\xd1\xb6\xc7K\xa8\xe2v\x83\x82\x9d\xfcfffM\x16\
-\x83/\x87\xd0\xa6\xad]h\xec\xce\x9b\xc0^Rp\xaa\
-\xear]\xec\xf6\xbf\x8dz\x9a\xe2\xac\xba\xc3\xa4\xe6\xf0\
-\x87\x0eN\xd0\xfeJO\xcc\x80\x9a#\x05\xa4~t\x80\
-\xf0\x9a\xecs\xa3\x1dx\x5c\x0f\xabF\xda\x81\x17/\xcc\
-\x1b(8M\xa3sr.\xa0\xa0\xe8\x00eff\xed\
-\x96\x0fN\xeb\xd0\xf2\xdc\x01\x14\x9e^FU\xa8\xaa\x9e\
-\x02\x02K\x07u\xc7\x91+\x1f\xa0\xc9\xe1\xc7\xd1\x91+\
-+j\x0e\xbf\x9bN\x85\x94:i\xdb\xe0\x10j\xb8\x8e\
-\xaa\xd3\x16\xaa\xd9\xff\x04iV\xc6\x1a\x94\xe2\xfb\xd1v\
-\xcf?E\xdd\xfe\x13x\xf7\x9d\x99\x99\xb5_,\xd5\xad\
-E+$\xdf\x05^EM\xe2\xeb\xa9\xee\xe9\x1f\xa1\x8e\
-\x82\xd3q4$\xf5]\x14\x9cN\xa3\xfboS\xdbg\
-:\x19\x9efHk\x92\x1f\x91\x9e\xb8\x06\xda.Y\xc5\
-N\xffH\xf6\xc3(\x04\x0e\xa0\x00u\x0bU\xdcN\x92\
-\xaaQfff\xed\x10\xf7\xa5\xf5h\x0c\xc1\x01\xe0[\
-\xc0\x0b\xe8^U\xe5\xe0\x94?\x9e\xe74K\xcf\xaa;\
-F\x1aG\xd0T\x9d\x5c\x1e\x8b\xe6\xea\xab\xe8\x1f\x19;\
-\xf0\xe2c\x07\xa9\xa9\xbcJ\xf2M\xe4\x1b\x80=\xe8\xdf\
-\xb9\x0a\xf8\x09Z{=\x8f\x0f\x1163\xb3\xd6\x8b\x15\
-\x91q4\x86\xe0u\xb4T\xb7\x97t\xc4X\x15Wz\
-B\x1c\x8d\x16\x93\xc3\xdf\x03>D\x9b\xd3n\x93\xce\xd9\
-m\xaaN\xf7\x16\xd5\xd1X\xf4\xd3(HDX\x8ay\
-Iq\x10o\xa7\x1f\xe7J\xf4\xa3\x7f\xc3&`\x1f\xfa\
-wL\xa1\x7f\xef\x02i\x88\xa6\x03\x94\x99\x995[\xac\
-\x84\x0c\xa0\x90\xb4\x0b8\x08|\x13\xed\xac\x1b'\xcd%\
-\xac\xa2\xd8\xc5?IZ\xc1:\x84\x02\xd4q\xd2\x91=\
--\xd1\xe9P\x12\xbb\xed\x16PC\xf5\x00iB\xf70\
-\xf0\x18\x1a\xdcU\xd5%\xbch\x22\x8fA\xa0/\xa2\xe5\
-\xca>\xe03\xb4\x84\xd7\xb4\x06633\xb3L4\x87\
-\xafFG\xa2\xbd\x88\xaaN\xfb\xd0\xd9\xacU\x0dMa\
-\x0e\xed\xde?K:\xe47\x06`^\xa3\xc5\xf3\x15;\
-\x1d\x9e\xf2&PZ\x9cF\x81b$\xfbq\x14\x05\xa9\
-\x01\xaa\x19\xa0b\xady\x03j\xcc\x8b\xcf\xddFA*\
-*Q\x0eP\xbd\xc1\xcb\xb5V%~\xadVS\x1fi\
-\x00\xe66\xe0\x15\xe0\x97\xd0=h#\xd5\x0eN\x0d\x14\
-\x8c\xa2\xc7\xe9C\xd2\x00\xcch\x0eo\xf9\xeb\xb6L\xe1\
-i\x11\x85\x89+\xc0\xd1\xecs\x0b(<\xf5\xa3\x1d\x02\
-c\x9dyh\x0f%\x1f\xa06\xa3w\x00\xf3(5\xaf\
-\x06\xbed\xe9\xf4u\xebn\xb7\xf0\x86\x01\xab\x86E\xf4\
-z\xb5j\xe9G\xc1i\x03Z\xaa\xdb\x87\x96\xeb\xe2\xd8\
-\x95*7\x87C\x9a\xe3t\x06\xad\xe0D\xc5\xe9\x0c\xda\
-\xc5?O\x8f\x85'\xd0?x\x8a\x94\x1eGHC\xbb\
-v\x90\x86wESvU\xdcy\x0e^,\xe9\x8d\xa0\
-':N|n\xcb\x93n\x1d5\x81\xde$\x98\x95\xdd\
-\x1c\xe9LR\xab\x86\xfc\xb8\x9c\x1dh\xa9\xee[\xe8\xe8\
-\x958\xc5\xa3J\xf7\xce\xbc8re\x0a8\x07|\x81\
-6`}\x882\xc3M\xdax\x0f-[x\x82t\xac\
-\xc94\xf09\xaa\xce,\xa0/\xca \xaa>\x0d\xa3\xf0\
-Q%\xf9s\x84@!\xb0\x8e\xfe\x9d\x03h\xc9\xf2\x22\
-\x0fqP\xa1U\xc2U\xf4\xfa6+\xbb\x05\xd4Sb\
-\xe5wgs\xf8\xe3h\x89\xeeE`?\x1aG0F\
-\xb5\x83ST\x9c\xce\xa39N\x87P\xc5\xe9\x14z\x9d\
-\xb6\xb5\xf8P\xc6\xf0\x14=!u\x94&\x17P\xd2\x04\
--\xe1mE\xd5\xa8\xd8%P\xa5\x17CT\xa0Vg\
-?\x8ff\xf1\x11\xf4\xc2\x9f&\x0d\xf3\xf2a\xc2\xdd\xe9\
-\x06\xfaF\xbf\x81v\x93V\xe9\xf5k\xbdc\x06\x9f\xcb\
-Y%\xd1\x1c\xbe\x0a\x05\xa7\x97\xb2\x8f}h\xb5c\x0c\
-\xbdy\xaf\xe2\xf5&6\x96M\xa0\xe6\xf0/H\xe3\x08\
-\x8e\xd1\xa1\xe3\xcf\xca\x18\x9e\xf2\xae\x92\xc2\xc4\x18\x0aO\
-\xcf\xa2\xaa\xd3:\xf4b\xa8Z\x05*\xfa\x9f\xa2\x01>\
-\xc63\xcc\xa0T}\x1a\x9f\x85\xd7\xcd\xea\xe8u\xfd\x09\
-\xf0\x06\xd5{\xfdZo\xb8\x88v0Y\xb9E\x01!\
-\xce\xaa\xdb\x8e\xee\x91\xaf\xa1>\xa7G\xd0jG?\xd5\
-\xdbp\x15\xa2\x80r\x19\xf5C\x7f\x88\x8e]\x89\x1d\xeb\
-\x1d\xd9pU\xf6\xf0\x14\x89\xf3\x02\xf06z\xc7>\x99\
-\xfd\xb7\x9dhNEUo>}(\x10n\x01\x9eA\
-\xff\xd61\xf4\xef\xfc\x18m\xb5l\xfaTT+\x85\x9b\
-\xc0Wh\xdb\xb0Y\x19\x9dE\x8d\xb8Vn\x11\x9c\xe2\
-\xac\xbaWQhz\x165\x87\xaf\xa6\xda}NuT\
-@\x89\x1e\xa7\x9f\xa2\xf0t\x1c]G;\xb6S\xbd\xec\
-\xe1\x09\xf4\xc5\xbb\x8dND\x9eD/\x92\xa1\xec\xf3;\
-\xa9\xee)\xd0\xf9&\xf2\xed\xd9\xe7\x06\xd0\xae\xbb\x19\xf4\
-\xef\xbd\x81wfu\xa3s\xc0\x0f\x80_G\xfd\x09U\
-\xf8>\xb4\xdeq\x13\xf5\x948<\x95W\xfe$\x8bq\
-4\x13\xf1y\xe0\x1b\xe8\xcdxT\x9c\xaa\xbcT7\x8f\
-\xee\x87\xe7Q\xff\xf3\x87\xa8\xcf\xe93\xf4\x1a\xed\xe8\xea\
-LU.\xda\xb1\xdeYG_\xbcERcu\x0d\xbd\
-x\xaa\x18\xa0b\xe7`\xbe\x89|6\xfb\xdc(z\xc1\
-\xcc\xe2\xfe\xa7ns\x03M\xc3=\x82\xca\xebk;\xfa\
-h\xcc\x96:\x81^\x9fg;\xfd@\xec\x9e\xf2G\xae\
-<\x81\xce\xa8{\x09U\x9c\x228U\xf1\x9e\x18bL\
-\xc6e\x14\xe4\xa3\xc7\xe98Z\x95\xe9\xf8\xce\xf4\xaa\x84\
-'\xd0\x17j\x1a5\x88Ep\x8a3yj\xe8\x064\
-D\xf5\x96\xf1\xf2\xbb\xf0\xfaQP\x1a$\x0d\x01\x8b\x9d\
-\x87\x1e\xa4\xd9=fQ\xf5\xe9-\xe0ITZ\xaf\xea\
-E\xce\xba\xcb\x0c)\xd8\xbb\xea]>\xb1\xab.\x96\xea\
-v\xa0\xe0\xf4\x06\xaa<\xe5\x83SU+Nq\xee\xed\
-%T@\xf8\x00\x85\xa7\xcfI=\xd0\x1d\xbf\x17V-\
-<-\xa2r\x1d\xa4q\x05\xf3\xd9\x8f\x8f\xa0%\xbc\x11\
-\xaa\xf7\xa2\x89o\x86>46\xbf\x81\xd2\xf5e\xd2\xd6\
-\xcc\xdb\xb8\x07\xaa\x9bL\xa2\xf5\xfbo\xa3\xa5\xbb5\xf7\
-\xff\xedf-WGG[\xbc\x8fz\xf2\x5c\xf1.\x9f\
-|p\xdaM\x1aG\xf0|\xf6\xebUT\xbb\xc7)\xbf\
-\xb3.^\x8b\x1f\xa2a\xd2\x17(Ah\x0aU\x0aO\
-y\x93\xe8\x8b\x19U\x99U\xd9\xe7\x07I;\xf0\xaa\xf6\
-\xe2\x89\xc1\x99\xab\xd18\x86\xdd\xe8\xc5r\x1d\xfd;\xa7\
-px\xea\x16\x0d\xf4\x1a\xfe1\xdaV\xbc\x0a5zV\
-\xed5k\xdd#\x86\x0f\xfeS\xe0\x8fPe\xd4\xca\xe5\
-\xcea\xcb\xaf\xa0\x1e\xa7g\xd1\x9b\xee1\xaay\xef\xcb\
-[@\xf7\xf4+\xa8\xd2\xf4c\xd2R]i\x82\x13T\
-7<-\xa2\x9b\xcfE\x14\xa26\xb2\xb4\x94\xb7\x0a\xf5\
-\x0cU\xf1E\x14\x15\xb6Y\xf4o\x9c\xa2$eJk\
-\xaa:zn\x7f\x826>\xac\x06\xf6R\xbdeg\xab\
-\xbe:\xba9\xfd\x18\xf8\x11\x0aN\xae:\x95K?\xaa\
-8\xc5\x00\xcc}\xa8\xe2\x14\xc1\xa9\xca\xcd\xe1\xa0\xd7\xdb\
-\x02\x1a\xe3r\x0a\xed8\xff\x10\xf5\xdf]\xa1\x84\xc3\xa3\
-\xab\x1a\x9e\xee\x1c\xd3~(\xfb\xdc@\xf6\xb15\xf7\xf3\
-\xaa\x0c\xd2\x8c\x17\xcf$z\x01]@\xff\xb6K(\x89\
-\xfbb\xd6}\xeahW\xe5\x1f\xa3w\x8dC\xc0\x1e\xdc\
-\xffd\xed3\x8f\xde\x84\xbe\x03\xfc\x13\xd4\x9c;y\xdf\
-\xff\xc3\xda-\x96\xea\xd6\xa27Z/\xa2\xaa\xd3sT\
-\xbf\xc7\x09t\x1d\x9cG\xaf\xbb\xd3h\x5c\xcfO\xd0k\
-\xf1\x1a*$\x94\xaexP\xd5\xf0\x14\x16\xd1\xce\xa5c\
-\xe8\xdf\x12/\xa0y\xd2\xb4\xd5*4\x91\xe7_<g\
-\xd0<\x8b\xcf\xd1\x8d\xf52j\xe2,\xdd\x8b\xc7\x9ab\
-\x12\x9d\xcf4\x80^\xa7\xdfAK\xb6n\x22\xb7V\x9b\
-AK\x22?C\x01\xfeOqoe\x99Ds\xf8 \
-\xea\xe7}\x0c\x05\xa6\x97\xd1\xce\xbamtGp\x9aC\
-\x8d\xe0\xa7\xd1f\x85\xb7\xb3\x8f\xcb\x9448A\xf5\xc3\
-S\x1d}qo\xa0\xe62H;\xd3\x86P\x05j\x9c\
-r7\x91Gp\x9a@U\xa6#\xe8]\xe0\x11\xf4b\
-\x9a\xa0\x04\xdb2\xad\xa5\xae\xa1\x8b\xc5U\x14\x9c\xff:\
-Z\xc2\x8b\x99ff\xcd\x12U\xfbi\xb4$\xf2\xef\x80\
-\xdf#\xcd\xce\xb1\xf2\xc8\xef\xc4\xde\x89B\xd3\x8b\xa4#\
-WV\x93N\xa8\xa8\xa2\xb8\xf7\xc5\xc9\x1ao\x01\xef\xa2\
-\x00\x15+.\xa5U\xf5\xf0\x14\x17\x82E\xd2\x17{\x0a\
-\xed\xc4\x1b\xcd>\xdf\xc7\xd2cP\xca$\xe6U\xddF\
-\xa5\xf3\xe3h[\xe6\xbb\xa8\xeat\x13W\x9dz\xc5m\
-t\xd1\xf8\x12-\xd7\xfe\x06\xf0\x0b\xc0S\x9d|P\xd6\
-u\x16QH\x7f\x0b\xf8\xffP\x9f\xd3i\xdc\x16PF\
-\xfd\xe8\x8d\xffz4\xd2\xe4u\xe0\x00\x0aNk\xa9\xf6\
-\x91+\xf9]uq\xd0\xef\x9f\xa1\x16\x9c\x8b\xa8(R\
-jU\x0fO\x90\x82E\x94\xf7\xce\xa1e\x90h\xb8\x8e\
-\x12\xf4:\xd2a\xc2e\xd0@\xc1\xe8:\xaa\x9a}\x86\
-n\x9e\x1f\xa3\xa5\xbb[\xf8|\xbb^\x12\x17\x93I\xd4\
-\xb4{\x1c]L\xbe\x0d\xfc&\xaa\xa2\x0ev\xec\xd1Y\
-\xd5\xd5\xd1M\xe9]\xe0?\xa2\xa5\xba\xb3\xa8j\xefe\
-\xbar\xeaG\xad'\x9bQ`z\x045\x8c\xaf\xa2\xda\
-\xc1\x09\xd2R\xdd14\xc3\xe9\x1dTu\xbfJE\x06\
-CwCx\x0a\xb1C\xed:\xba\xf1L\xa3\x7f\xdf`\
-\xee\xc72\xac\x0dG\xb5l\x0e-\xd7\x9cD\x87\xc4~\
-\x88B\xdf\x19\xf4o\x98\xc5\x17\xb5^\x14\x07\x07\xdfB\
-\xef\xc8\xbeB\x81\xfa7\xd00\xbc\xcd\x94\xb3\x8aj\xe5\
-\x13\xcb\x223(,\xfd\x10-\x0f\x1fE\x1bR\xbc\x8b\
-\xb7\xdcb\xc5d\x0cU\xa0\xf2c\x08:}\x1f[\x89\
-\x18\x80YG\xa1\xfd\x0c*\x18\xfc\x08\xcds\xbaB\x85\
-6GuSx\x8aP2C\xda\xda8Jj$\xdf\
-\x80J\x9d\x9d\xbe\xe9\xd4\xd1c\xbc\x81\x96\xe6>\xca>\
->A=\x08\xb7pp\xeau\x0d\xf4\xfa\xbd\x84^\xcb\
-\x9f\xa1*\xc1/\xa1\xb2\xfdc\xe8@\xe9\xb8\xa0\x9a\xe5\
-\xd5\xd1M\xe82zg\xff\x19\xaab\xbe\x83nXV\
-\x0d\xd1L\x1d\xfd\xb0\xa7P\x9fS?\xba\x9fU\xed\xfe\
-\x1d\xe7\xd5\xcd\xa1\x02\xc7a\x14\xe6\x8f\xa0\x22B\x9d\x8a\
-\x04'\xa8\xde\x17\x7f9\xf2M\xe4\xc7\xb2\xcf\x8d\xa1\x86\
-\xbbq:7\x815Rw\x04\xa7S\xa43{>C\
-\x17\xb58\xec\xb02/ k\xb98\x18\xfb\xdf\xa0\x80\
-\xfd:\xf0M\xb4\xdb&^\xd3eZ\x8e\xb6\xce\x89\xa5\
-\xdf\x1b\xe8f\xf4\x1e\xf0\x87\xc0\x1f\xe0\xde\xc9*\x9aG\
-\xf7\x84\x93\xa4\xdd\xb8\x0b\xa4\xb3OG\xa9\xceP\xcc\x08\
-N\x13\xe8\xf5\xf9\x01\x0a\xf4G\xd0r\xf2B\xc7\x1e\xd9\
-\x0aucx\x8a\x0bH\x1d\xbdk\xefCi}\x13z\
-\xf2\x9eF\xa9\xbd\xdd\xbb\x98\xa2\xe2\x14C\xc0\x8e\xa0\xe4\
-\xfdY\xf6\xeb\x1bTd\xad\xd7:\xe6+\xb4\xdc\xf2>\
-\xdau\xf3=\xe0[(D\x0dw\xf0qY9,\xa2\
-\x1b\xd1\x9f\xa3)\xe1?E\xd5\xec\xf9N>([\xb1\
-\x98e\x18\x03\x22#\xfc\x0e\xa2\xaas\x8c*(\xfbq\
-,u\xf4o\xb9\x8d\x8a\x04'Px\xfa\x00\x05\xc3J\
-\x86\xfan\x0cO!\x96>\xae\xa1\x0a\xcf<\x0a(\xb1\
-\x8c\xb7\x96\xf6\xfc\xfbc\x8d\xf7\xce\xe0\xf46?_q\
-\xaa\xe4\x8b\xc8\xda&\x8eu\xf9\x1a\xbd\xae\xbfB\xbd,\
-/\xe7>\xac\xf7\xcc\x92\xb6z\xbf\x85\xfa'O\xa2\xeb\
-]\xe5\xde\xd1\xdb\x12\xf93]O\xa0\x90\x14\xf7\xb6\x17\
-\x81'Pq\xa0\xcc\xe1)\x8e\x5c9\x8f\xaa\xa1?D\
-\xf7\xe4\x1bT\xb8X\xd0\xed\xe1)\xe6\x99\x5cFO\xd2\
-\x00\xdau7\x8f\xb6~n\xa3\xb5=#q:\xf4\xcd\
-\xec1\x9c!5\x00\x7f\x8e.x\xb1\xab\xae\x8e\xc3\x93\
-=X\xf4\xb3\xcc\xa2\x12\xf8\x05\xf4zz\x1b\x9ds\xf5\
-\x22\x1ao\xb0\xb6S\x0f\xd0\xda\x22n\xa0\xa7\xd1\x0d\xe9\
--\xd4;\x19\xe7\x80U\xa6\xf1\xd6\x1e(\xde|_#\
-\xed\xb2k\x906\x8e\xc4\xf1,e\xaa>G\x9b\xca\x22\
-\xda\x00u\x0e\x05\xa6\x0fP\xe5\xfc*\xaa\xaaUV7\
-\x87'HKxS\xe8\x05x\x14\xbd\xf8\xe2\xd7ki\
-\xdd\xbaq\x1c\xb7r\x0b\xbd\x0b\xfc\x12\x05\xa7c\xd9G\
-T\x9cb\xa9\xce\xc1\xc9\x8a\xa8\xa3*\xd44\xe9\x8c\xc7\
-\x8f\x80\xd7\x807Q\x88z\x9c\xea\x9e\xf1hw\xd7@\
-\xcf\xf9%\xf4|\xbf\x87\x96\xe7>&-\xfd\xfbZ\xd2\
-}b3\xd4\xd5\xdc\xaf\x07\xb2\x1f\xe7\x81]\x94k\x17\
-n\xf48M\xa3\x80\xff!\x0aN\x1f\xa1\xcd/\xb3T\
-|9\xb9\xdb\xc3\x13,\xad@\x9d#\x1d\xb4\xbb\x1a\xed\
-X\x8a)\xe4\xcd\xfcZ\xc4\xbb\xc2\xdb\xd9\xdf\xf99z\
-\xd1\x1cEA\xea\x22iW]$t\xb3\x95\x88\x0d\x12\
-\x97Q\x8f\xdf\x11tC\xfd5\xd4\x13\xf54iRy\
-\x1f\x0eRU\xb5\x88\xae[1\x8a\xe5gh\x13\xc1G\
-x2x\xaf\x88\x0dG\x97I}P\xf3\xe8\xfbz\x98\
-4\x1c\xba\xd3M\xe4\xf9S3.\xa3\xf9M?C\xe1\
-\xe9\x1cz\xd3W\xf9\x82A/ms\x8e\xde\xa3|`\
-\x89c\x5c6\xd0\xdc\x92g\x03\x95X\xbfF\xa5\xca#\
-\xd9\x8f\xf9\xe04\x8f\xcb\xea\xd6|\x8b\xe8\x9d\xdd;h\
-Zo\x1f\x1a\xac7J\xb9\xde\x99\x16\x15'\xae\xff\x18\
-\xf5~,\xf7\xe8\x86\xedh\xbc\xc3\x0bh\xd7m\x155\
-\xd0\x8d\xe8\x1c\xf0\xfb\xc0\xff\x0e\xfc\x03\xd4?Y\xfaI\
-\xcc\xd6Tq\x1f[@\x01*ze\xfbP\x01`\x8c\
-\xce~\x9fGp\xba\x85^\x9f\xef\xa1\xc1\xac\x87\xd1\xfd\
-\xafk\x86?\xf7B\xe5)o\x11=\xb9\x97P\x99{\
-\x0e\x05\xc8uh\xdd8N\xb6_\xa9x\xe1L\xa1e\
-\xb9\xcfPp\xfa\x0c]\xf0\xaf\xa2\x8b`W\xbcx\xac\
-\xd4\xe6\xd0\xeb\xee\x7fC\xef\xfa~\x095\x94\xefD\xc7\
-=\xf4\xd2\x1b\xa7\xaa\xaa\xa3\xeb\xc51\xd4\xd3\xf4Ct\
-\x13:\xdb\xc9\x07e\x1d\x17+\x1bWH\xf3\x00\x17\xb2\
-\x8fQ\x14\x9cb\x0ay;+P\xf9#W.\xa0\xeb\
-\xcf\x0fP\xe1 \xfa{+\xbdT\x97\xd7k\xe1)*\
-N\x93\xe8]\xdc\x22z\x91\xd5\xd0;\xd3'\xd02\xde\
-JEY\xfd\x0cz\xc1Dc\xf8)\xf4B\x8fm\xa7\
-\xae8Y\xab\xd5\xd1\xeb\xed\x14i\xc9\xfaC\xf4:?\
-\x00<\x8f^\xfbU\xadDu\xbb\x9b,=\xeb\xf2\x10\
-\xaad_\xa7\x8bn@\xb6\x22\xd1\x8aRG\xaf\x93S\
-\xa4&\xf2\x06\xf0,\xb0\x1bU\x9c\xdb5\x92'\x02\xdd\
--\xf4:\xfd\x04\xbdfcGy\xd7\xad\xb6\xf4Zx\
-\x0aQV\x5cD\x95\xa1\xb9\xecs\x03h~F,q\
-,7\xb5\xe7K\x95\xa7\xb3?\xf3\x13\x14\x9cN\xa2u\
-\xdf\x09\xba\xec\xc5c\x95\x10g\x9a\xdd&\x0df\xfd\x04\
-\xed\xcc{\x0a\xd8\x83.\xb2\xd6y\xb1\xab\xea,\x0a\xba\
-o\xa3\x9dI_\xa2j\xb9\x8fS\xb1\xbc\xd8\xcd}\x95\
-\xf4\xda\x99@\xf7!\xd0=l\x1d\xad\x9f\x03\x15\xcb\x88\
-\xd1\xe3\xfb1\xaav\x1fA\xf7\xc3\xae\x1c\xfe\xdc\xab\xe1\
-i1\xf7q\x12\xbd\xe8\x06I\x93\x9aw\xa1\xa5\x8d\xe5\
-~}b\x86\xd4itsz\x1f5\x87\x9fF/\xec\
-I\xba\xf0\xc5c\x95\x12U\xa8(\xa7\xbf\x8b\xa6\x94\xff\
-b\xf6\xe3&\xb4\xfb\xd4\x0d\xe5\xed\x177\xbe\xcb((\
-\xbd\x03\xfc\x09\x0a\xb9\xd7I\xcd\xc1fw\x8aA\x9a\xb1\
-\xb3\xed\x16z=E\xef\xd3\xe3\xe8\xcdQ\xab\x96\xf0\xf2\
-\xad*\xa7\xd1\xb5\xe5\x03\x14\xfe\x8f\xd1\xc5E\x83^\x0d\
-Oa\x11\xbd\xd8\x16\xd0\x8b+\xce\x11\x1aB/\xbe\xe5\
-\xbc\xe0\x1a\xa4\x1e\xa7\xc3\xa8A\xee=\x94\xc0o\x93\xce\
-\xa9\xeb\xba\x17\x8fUN\xbcS\xbd\x84n\xd4\x1f\x00\xff\
-\x11\xf8\x0e\xf0\xd7\x80\xef\x92\xde@8D\xb5^\xbe\x8d\
-\xe0\x0bt\x8c\xca?\xa4b\x07\xa4Z\xc7\xe5{\x8d\x16\
-Q\xe8&\xfb\xf5k\xe8\xcdQ\xab\xce\xc1\x8cQ@\x17\
-Q\xd1\xe0g\xd9\xdf\x7f\x86.\x0eN\xe0\xf0\x94?o\
-\xe7<),\xadCA*\xce\x0e\xbb\xdb\xbaq\xfc\xbf\
-7HS\xc3\xdfG/\x9c\xd3\xd9\xe7\xe7\xf1(\x02+\
-\xa7\xb8\xe0\x9e\x01\xfe=\xda\xf2\xfe}\xe0\xd7\x81\xbd\xe8\
-u?\xd8\xa9\x07\xd7\x03\x16\xd1u\xe7$\xfa\xfa\xff\x11\
-z\xd7~\x1d\xbf\xd9\xb2\xe2\xe2\x10\xe1\xf8\x9e\x8e\x95\x95\
-!t?\xdbF\x1aY\xd2\x8c7Fq\xe4\xcaM\xb4\
-\xcc\xfc\x15\xba\xff}@\x0aN]\xbd1\xaa\xd7\xc3\x13\
-\xa4\xe6\xbb\xdb\xe8EPG!j\x22\xfb\xf9\xd3\xe8\xeb\
-\xd4w\xc7\xff\x13\x89\xfb\x04Z\xe3}\x1f\x95*\xbf\xa6\
-\x0b\x9b\xe3\xac+\xe5\x8f0\x9aD\x17\xc2C\xc0\x1b\xa8\
-'j\x1f\xb0\x99\xf2\x9f\x9dU%s( \x1dC\xbb\
-\xe7\xdeAK\xfdg\xd15\xc7l\xa5\xe2^\x96/\x06\
-\xc4 \xcd\x97\x80g\xd0\xf2\xfc\xc3~/G\xe1 \x8e\
-\x05z\x1f\xad\xb6|LZq\x89\xc2A\xd7rx\x92\
-\xb8\x89\xdc$\x05\x9e\x06i\xe0\xd8\xe3h\x16T\x94=\
-\xe3\xc8\x958\x1a\xe3P\xf6\xe3\x09t#Z\xc0\xc1\xc9\
-\xaa#\x86\xef\xc5\xe4\xfb\x13\xe8\x9d\xe47\xd0Ew\x07\
-\xea\x01\x1c\xc6\xbb\xf3V\xaa\x8e\xfa\x1f\xbfFU\xbe\x9f\
-\xa1\xc9\xe0\xc7\xd0\xd7\xde\xacY\xe6I\xc5\x00\xd0\xeb\xab\
-FZ\x92_\x83\x96\xf1\x8a\xca\xcfG\xbc\x81\x96\xff?\
-E\xfd\x93o\xa3V\x80\xae\x99\xe3\xf4 \x0eOI4\
-\xbe\xc5\xc9\xcf\xfdh\xd9\x22\x12\xf6~\x14\xa6\x1a\xa4C\
-\x1a\xbf@\xa9\xfb\x08\xba(\xc6\xae\x02\xb3\xaa\x9aE\xcb\
-G1\x19\xff\x0b\x14\xa0\x9eei\xf3\xa9-\xcf\x22\xaa\
-\xea]@\xa1\xe9m\x14\x9a\x8e\x90vE\x995S,\
-\xe1\xc5\xebk\x8e\xd4\xc3;G:\xd7\xb5h\x05**\
-N\xd1\x1c\xfe\x11Z\xa6\xfb\x18\xb5\xae\xcc\xd0C\x1b\xa3\
-\x1c\x9e\x96\x8a\x17\xdd\x0dR5j\x06\xbd\xe8\xb6\xa35\
-\xe3\x06Kw,}\x80\xe6\xb1\xdc\xc0'\x98[\xf7\xb8\
-\x89^\xdb_\x02?\x02^A\xc7\xbd|\x87\xd4\x0f\xe5\
-\xa5\xbc{\x8b%\x94k\xe8\xdd\xf9\xef\x02?A\x15\xbd\
-\xe8k2k\xa5y\xf4}\x1c\x95\xa7I\xf4\xe6h\x15\
-Z\xbe\x8bC\x86\x97#\x7f\xcc\xd9U\xf4\xc6\xeaO\xd0\
-\x9b\x80\x0b\xa46\x97\x9e\x08N\xe0\xf0t7\xf1\x22\x89\
-\x1d\x04#h\x0b\xf7j\xd2d\xe6\xb3\xa8\xe2t\x08U\
-\xa9n\xe3\x19,\xd6}b7\xea\xa7\xe8u\xfe.\xf0\
-{hW\xdeo\xe2\xf9P\xf7s\x0b\xed\xbe\xfd\x83\xec\
-\xe3\x02\xe9 p\x07'k\x87Xbk\xa0%\xb6\x01\
-\xb4z2\x82^\x87\xbbQ;\xca\x83\x06i\xc6\xaa\xcc\
-\x0d\xd2\xac\xb8\xf7\xd08\x9e\x0b\xe8\xfe\xb7H\x8f\xdd\xff\
-\x1c\x9e\xee-z\xa0\xce\xa2\x17[\x8d\xb4\xf3\xee\x22J\
-\xdcGQ\x12\xef\x895^\xeb9\xf1F\x22\xca\xf11\
-\x04\xef\x10:.\xe4;h+\xf4\x1e|\xe8p\x9c9\
-6\x89\x961\xfe5\xaa\xdc\x9d@\xcd\xbb\xb1\x81\xc4\xd7\
-\x09k\xa7;7DA\x1ak\xd0G\xda\x8dw\xaf\xef\
-\xdf\x08`\x93\xe8u|\x04\x1d\xb9\x12'g\xc4\xa8\x9f\
-\x9e{];<\xdd[\xa4\xed\x18\x7f?\x8f\xaaO\x83\
-\xb9\xcf\xdd\xc0\xa3\x08\xac\xfb\xe5\xab\xb1S\xe8\xdd\xe6Y\
-\xb4\xa4w\x14x\x13x\x0e]\x84[5O&\x1eG\
-\x19\xbf\xd7\xe6\xd0R\xc61T\x91~\x1b\x1d`|\x01\
-\x1f\xa5b\x9d\x17-(\x11\xa0\xe2\xfby-\xba\xcf\xed\
-\xe2\xeeG\xb9\xe4\xfb\x80\xbfFcx>@\x01\xea,\
-=\xbe\xab\xdc\xe1\xe9\xfe\xf2\xe3\xef\xa7I#\x0bb6\
-TO\xbeh\xcc\xd0 \xc7\x1f\xa1~\xbf\xcf\x81_C\
-[\xa1\x1fCK\x01q@i\xb3D?b\xd1\x86\xd4\
-\x98G\xd3\xec\xef\xd5xG~\x8btn\xe0\x0f\x80?\
-C\xb3\x9b|m\xb02\xc9\x0f\xd2<\x9f\xfdz\x884\
-\x9d|\x08\xad\xac\xf4\xe5~\x7f\xdc\xe7\xa2\xda\xfc.\xaa\
-\xaa\x9e'\x8d#\xe8\xd9\xd7\xb9\xc3\xd3\x83\xc5n\x99\xa9\
-;>_\xc6w\xc0f\xed\xb4\x80\x82\xc2E\xb4\xf3\xe6\
-[\xc07\x81\x17\xd1R\xdej\x9a\xb7\x9c\x17\xef\x80\xa3\
-\xbfb\xb9\xe6\xd0\xf7o3\xc7\x01,\x92\xdeT\xbd\x8f\
-\x1a\xc1\xff\x0c\xbd3\xf7\xd8\x01+\xab:z\xdd.\x90\
-\xde\x88\xcc\xa37:\xe3\xe8{5\xbeg\xe3\xbew\x09\
-\xbdA:\x84\xfa\x9c\xbeF\x81\xaa'\x97\xea\xf2\xbc\xe5\
-\xd8\xcc\x1eVL\x1a>\x89v\xa1\x9eB\x17\xe9uh\
-\xa6L3\xae3\xb7\xb2?\xfb\x0fQ\xd5k\xb9\xcba\
-\x83hN\xd5>\xb4=\xfba-\xa0w\xe2o\x01\xff\
-\x02\xf8'\xa8\xe2t\x0a\x8f)\xb1\xea\x88J\xd4\x02\x0a\
-\xfc3(4m \xed\xcc\x8b\x8a\xea\xbbh\xa9\xee\x14\
-\xfa>\xef\xf9\xe0\x04\xae<\x99\xd9\xc3\x8b\x12\xff5T\
-\xa1\xbd\x86\xfa\x7f\xde\x06^E\x15\xa9\x9d<xW\xcf\
-\xfd\xcc\xa0\x0a\xd7\x05\x8a\x85\x94\x9b\xe8\x9d\xf3\x97hV\
-\xd5J\x8f\xa7XD\xa1\xed\x1d\x14\x9c\xdeG\xff\xc6K\
-hI\xdf;\xe8\xac*\xf2K\xcegI\x95\xd4\x1a\xea\
-\x83ZE::\xe80\xaa:\x9dD\xdfK=\xbdT\
-\x97\xe7\xca\x93\x995K\xbeO\xe2\x0az\xa7z\x02\xbd\
-\x83\xbd\x86\xde\xd9nY\xc1\x9f;\x89\xde\xf9\xfe\x1bt\
-1/\xd2\x84\xbd\x98\xfd\xbdk\x81\x03\x14\xef\xc5\x9aC\
-\x81\xedm\xe0\x9f\x01\xbf\x8f\x9a\xc1?G\xff\xc6Y\xfc\
-.\xdc\xaa'v\x87.\xa0\xd7\xf0,\xa9?\xf0\x1c\xfa\
-\xbe\xfd\x1c-\xc7\x7f\x85\xbe\x7fg\xf0\x9b\x84\xff\xc4\xe1\
-\xc9\xcc\x9a-\xbf\xbb\xe74\xba\x08\x1f\xcf~\x1d\xc7B\
-\xf4\xb3\xbc!}\xf3hG\xdf\x7f@\xdb\xffoR,\
-\xac\xc4\xa6\x8fET\xfd\xdaB\x1a=r\xbf\xffg\x1e\
-\x85\xa3\x8f\x81?\xce\xfe\xee\x7f\x86\x96\x0e\xaf\xe2\xd0d\
-\xdd!\xaaP\xb3(\x1c\xdd@oz\x8e\xa3\x00u\x02\
-UWg\xf0\x10\xe8%\x1c\x9e\xcc\xac\x95\xe2\xdc\xbc3\
-\xa8\x7f\xe2}\xd29[\xc3\xa4C\x87\xef<x;\xb6\
-I_@\xd3\xb9\xff\x15Zz[\x898\xaa\xe2:\xf0\
-\x04\xea\xc3\x8a\x96\x85Z\xf6\x91\xff;c\xa6\xcd\x9f\x03\
-\xff\x10\xf8G\xd9c\xf7<7\xeb61\xb6 \x9a\xc8\
-o\xa13\xea.e\x1fW\xd1\xf7\x83+Nwpx\
-2\xb3v\x89j\xce{(\x08M\xa2\x1e\xa4>\xd4g\
-\xd1\x87\x02\xccL\xf6\xfb>\x03\xfe)\x0aN\x1f\xf3p\
-\xbd\x16s\xa8o\xe3J\xf6\xeb\x01t\xfd\x8b*T\xf4\
-l}\x89\xce\x9e\xfbG\xc0?G\xfd\x1e\x93\x0f\xf1\xf7\
-\x9aUAT\xa0\xa6I\xbbZ\xe38\x17\xf78\xddE\
-/O\x046\xb3\xce\x88\x1e\xa4\xddh6\xd4\x1et\xf0\
-v?\xbax\xdfD}\x17\x1f\xa1\x83\x89\xcf\xd3\x9c\x00\
-SC\xbb\x89v\x03{\xb3\x8f\x9d(HM\xa1\xea\xd8\
-Q\x14\xa0\xce\xa0%\x0c/\xcfY\xcfh4\xfcR_\
-.\x87'333sx*\xa0\x99\x13\x80\xcd\xcc\xcc\
-\xcc\xba\x9e\xc3\x93\x99\x99\x99Y\x01\x0eOffff\
-\x058<\x99\x99\x99\x99\x15\xe0\xf0dfffV\x80\
-\xc3\x93\x99\x99\x99Y\x01\x0eOffff\x058<\
-\x99\x99\x99\x99\x15\xe0\xf0dfffV\x80\xc3\x93\x99\
-\x99\x99Y\x01\x0eOffff\x058<\x99\x99\x99\
-\x99\x15\xe0\xf0dfffV\x80\xc3\x93\x99\x99\x99Y\
-\x01\x0eOffff\x058<\x99\x99\x99\x99\x15\xe0\
-\xf0dfffV\x80\xc3\x93\x99\x99\x99Y\x01\x0eO\
-ffff\x058<\x99\x99\x99\x99\x15\xe0\xf0df\
-ffV\x80\xc3\x93\x99\x99\x99Y\x01\x0eOfff\
-f\x058<\x99\x99\x99\x99\x15\xe0\xf0dfffV\
-\x80\xc3\x93\x99\x99\x99Y\x01\x0eOffff\x058\
-<\x99\x99\x99\x99\x15\xe0\xf0dfffV\x80\xc3\x93\
-\x99\x99\x99Y\x01\x0eOffff\x05\x0ct\xfa\x01\
-\x98YW\xaa\xa1\xeb\xcb\x10\xe5{\x93\xd6\x00\xea\xc0\x22\
-\xb0\x90\xfdhf\xb6l\x0eOf\xd6l5`\x10X\
-\x07l\x06\x86)O\x80j\x00\xf3\xc0\x0c0\x09\xdc\x04\
-\xa6Q\x9823[\x16\x87'3k\xb6\x1a\xaa8m\
-\x04\x9e\x02\xd6P\x8ekM#\xfb\x98\x02n\x00WH\
-A\xca\xccl\xd9\xcapA3\xb3\xee1\x08\x8c\x01[\
-\x80}\xc0\x1b\xc0\xa6\xec\xf3\x9d\x16\xcbu\x17\x81\xafQ\
-5\xec:\x0aR^\xba3\xb3esx2\xb3f\x89\
->\xa7\xd5\xc0v\xe0i\xe05`\x1b\xaaD\x95\xc1\x22\
-\xf0U\xf6\xf3\xeb\xc0\x08z\xdcff\xcb\xe6\xf0df\
-\xcd\xd4\x87z\x9c\xd6\xa0~\xa7\xc7\x80G\xb3\xcf\x95\xc1\
-\x02Z\xb6;\x83*d\xbe\x06\x9aYaei\xe24\
-333\xab\x04\x87'333\xb3\x02\x1c\x9e\xcc\xcc\
-\xcc\xcc\x0apx2333+\xc0\xe1\xc9\xcc\xcc\xcc\
-\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0a\
-px2333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87\
-'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx2\
-333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'33\
-3\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx2333\
-+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'333\xb3\x02\
-\x1c\x9e\xcc\xcc\xcc\xcc\x0apx2333+\xc0\xe1\
-\xc9\xcc\xcc\xcc\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\
-\xcc\xcc\xcc\x0apx2333+\xc0\xe1\xc9\xcc\xcc\
-\xcc\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\
-\x0apx2333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\
-\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx\
-2333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'3\
-33\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx233\
-3+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'333\xb3\
-\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0apx2333+\xc0\
-\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'333\xb3\x02\x1c\x9e\
-\xcc\xcc\xcc\xcc\x0apx2333+\xc0\xe1\xc9\xcc\
-\xcc\xcc\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\
-\xcc\x0apx2333+`\xa0\xd3\x0f\xc0\xcc\x9a\
-\xaa\x06\x0c\x02C\xe8\xcd\xd1\x22\xb0\x90}\xd4\x81F\xe7\
-\x1e\x9a\xa1\xe7e\x04=G\x0b\xc0,\xe9\xb9\xa9w\xf0\
-q\x99Y\x01\x0eOf\xdd\xa5\x0fX\x05\xacG7\xe9\
-\x19\xe0\x160\x05\xcc\xa1\x1b\xb5uF\x1f\xb0\x1a\xd8\x02\
-\x8c\xa3\xe7\xe420\x81\x9e\xa7\x06\x0e\xb7f\x95\xe0\xf0\
-d\xd6\x1dj\xe8\xfby\x14\xd8\x06<\x8en\xd0\x13\xc0\
-%\xe0\x22p\x1d\x98F\xd5(\xdf\xa4\xdb\xa7\x86*N\
-k\x80\x1d\xc0\x13\xc0V\xe0&p\x0a8\x0f\x5cA\xcf\
-\x95\x9f\x1b\xb3\x0apx2\xab\xbe\x08NQ\xd5x\x1a\
-x\x0e\x85\xa8)\xe0\x0c\xf09p\x0c\x05\xa9Y|\x93\
-n\x97xn\xc6\xd1\xf3\xf2l\xf6\xe3V\x14\x96N\x00\
-\x9f\x01_\x02\xe7P\xb8]\xc0\xcf\x8dY\xa99<\x99\
-U[\x8dT\xd9\xd8\x00<\x09\xbc\x08\xbc\x02\xecF7\
-\xe2\x93\xa8\x225\x87\x96\x87n\xe0\xfe\xa7v\xa8\xa1\xa5\
-\xbaQ\xe0\x11\xe0\x0d\xf4\xbc<\x89\x9e\xab\xd9\xec\xe7k\
-\xd0\xf34\x89Bm\xf4?\xf9\xf91+)\x87'\xb3\
-j\x8b\x8a\xd3V\xe0)\xe0e\xe0 ii\xa8\x8e\x9a\
-\x93'\xb2\x9f\x0f\x03GQ\xaf\xcd\x1c\xae@\xb5\xd2\x10\
-\xb0\x09\xd8\x03\xecG\xa1v/\xb0\x1d\x18C_\xfbA\
-T\x1d\x9c\xcf~\xfe9p\x01W\xa0\xccJ\xcd\xe1\xc9\
-\xac\x9a\xa2\xaa\xb1\x0a-\xcf=\x85n\xce\xaf\xa3\xe0\xb4\
-\x05\xdd\xa0\x1b\xd9\xef}\x9e\xb4\x0b/B\xd3\x0dT\x89\
-r\x80j\xaeX\xaa[\x87\xaa\x7f\xaf\xa3P\xfb,\xaa\
-@\xadA\xcfE<7{\x81~\x14l\xe7\xb3\x8f\xab\
-8@\x99\x95\x96\xc3\x93Y\xf5\xc4\xcd9\x1f\x9c\x0e\xa2\
-\xf0\xf44\x0aN\xa3\xa49n\xabQ\xa3r\x1f\xaa>\
-Me??A\xbaI;@5G\x8c\x8a\xd8\x84\x82\
-\xd3A\xb4T\xf7<\xaa\x04\xaeA\x016\x8c\xa1JT\
-?\xfa\xfa\xdf@\xe1\xa9\x0f5\x91O\xe1\x00eV:\
-\x0eOf\xd5RC7\xda\xd8U\xf74\xf0\x12\xbaA\
-\xef\x056g\xff\xad?\xf7\xff\xe4\x83\xd6b\xf6\xb9\xd1\
-\xec\xcfj\x90\x02\x94\xfbl\x1eN\xbeq?\x9e\x97\x97\
-\x80gP\xc5i\x0c\x05\xabZ\xee\xff\x89\xe7r#\x0a\
-[\xb7IU\xc5\x06zN\x1cn\xcdJ\xc6\xe1\xc9\xac\
-:\x228\x8d\xa1\x86\xe3=\xc0\x0b\xe8\x06\xbd\x1f\xdd\xa0\
-\xfbYzs\x06\xdd\x88\x07\x81\xb5\xa4 5\x84\x1a\x94\
-c\x09o1\xfb\xb9\x03\xd4\xcaD\xc5i-\xaa$\xbd\
-\x80\x1a\xc4\x9f\xcf~\xbd\x96\xd4\xdc\x7f\xe7\xff\x17\x81k\
-\x1b\xfa\xfa\xd7P3y\xec\x8a\xbc\x82wH\x9a\x95\x8a\
-\xc3\x93Yu\xc4\x90\xc5\xed\xa8\xaf\xe9u\xb4,\xf44\
-\x1a\x8ay\xb7\xe0\x14\xf2\x15\xab\x8dh\xa9o\x0e\x05\xa9\
-1\xe0\x134\x07*n\xd2VL?z\x0e\x9e%\xed\
-v\xbc\xdb\x12\xea\xdd\xe4C\xf1V\xb4l\xb7\x80\xc2\xd8\
-\x08j\x22\xbf\x86+Pf\xa5\xe1\xf0dV\x0dqs\
-\xdd\x82\xb6\xb7\x1f@7\xe9g\xd0\x0dw\x84{\x07\xa7\
-\xd0\x87\xbe\xe7\xa3\xcf&\x96\x87\x16\xd0\x8d\xf9\x14Z\xc2\
-s\x13\xf9\xf2\xd5P\xa3\xf7:T\x09<\x08|\x13\x85\
-\xd3GQ\x8f\xd3r\xae\xb31nb\x1di\xd2x,\
-\xab\xce\xa2\xe7\xff*\xee\x812+\x05\x87'\xb3\xf2\xeb\
-C\xe1h=\xb0\x13\x05\xa7W\xd1\x0dz+\xaa\x1e=\
-(8\xe5\xff\xacAT\xc1z\x04\x85\xa4\xf9\xec\xbf\x0d\
-\x93z\xa0\xe2\xcc5\xbb\xbf\x1ai\xbe\xd6\x01\xb4\xabn\
-\x1f\x0a\xb9\xb1\xabn9\xcfMT\x9f\xfaP\x80\x82\xd4\
-\xf3TG\xc1\xaa\x86FLx\x17\x9eY\x879<\x99\
-\x95WT\x86\x06Ppz\x1c\xdd\x98_D\x15\x8e8\
-\xbfn\xb9\xc1)\xff\xe7F\xef\xd3#\xd9\xdf1F\xea\
-\xb5i\x90\x8erq\x0f\xd4\xdd\xe5\xabx\xbb\x81\xd7P\
-\xa0\x8d\xe6\xf0Q\x96\x1f\x9c\xf2\xf2\x15\xa8\xf8{\xe2\xcf\
-\x99%\xf5\xa5y\x90\xa6Y\x079<\x99\x95WT\x9c\
-\xd6\xa2%\xa1\x03\xa89|/j.^\xc9\xcd9\xff\
-g\xd7\xb2?\xbb\x9f4\xacq.\xfb\xf9q\xd2Q.\
-\xbeI\xff\xbc\x18\x80\xf9\x04\xaa6\xbd\x82\x8e\xc4\xd9\x8e\
-*N\xf1\xf5]\x89>T\x05\x1c\xcf~]C\x87;\
-G\xdfS,\xeb\xb9\x89\xdc\xacC\x1c\x9e\xcc\xca)_\
-\x81x\x14U\x9b\xbeM\xbaA\x0f\xb0\xf2\x9bs\xfe\xef\
-\xc8\xf7R\x1d@\x15\x93\x11\xd2\x16\xf9\xb8I\xfb\x06-\
-Q\x0d\x5c\x8d\x96\xea\xbe\x8f\xben{P\x98Z\xc5\xc3\
-\x05\xa7\xfc\xdf3\x80\xc2m\x03U\xb7\xae\x90\x9a\xc6c\
-I5\xfa\xd3\xcc\xac\x8d\x1c\x9e\xcc\xca\xa7\x1f\x05\x98\x8d\
-\xc0.4\x86 *N\x8f\x90n\xd0\xcdpg\x139\
-\xe8\x06=\x87n\xe0\xc7q\x13y\xde0\x0a\x9aO\xa1\
-j\xd3K\xa8\xfa\xb4\x11\x05\xcff\x84\xda\xd0\x87\x02\xf4\
-\x1a\x14\xa0o\xb3\xb4\x0f\xed\x22p\x13=7\xee\x812\
-k#\x87'\xb3\xf2\x88\x9b\xee0jB\xde\x85*N\
-\xdfb\xe9\xa0\xc5\xfe\xbb\xfd\xcf\x0f!\x02T\x0c\xd2\x8c\
-\x09\xd7#\xd9\x7fo\xa0%\xa3\xb8I\xf7\x92xN\xfa\
-\xb2\x8fq\xd4w\xf6M\xb4\x5c\xf7$)8\xddoT\
-\xc4J\xff\xeeX\xc2\xdb\x96{\x1c\xb1\x0b/~\x8c\x8f\
-^{n\xcc:\xc6\xe1\xc9\xac\x1c\xe2F9H\xdaU\
-\xf7<\xbaA\xbfL\x1aG\xd0\xac\x8a\xd3\x9d\xe2\xef^\
-\x83\x1a\xd3\x87\xb3\x8f\xd9\xec\xb1\x9d \xed\xf4\xea\xa5\x1e\
-\xa8\xa8\xfe\x8c\xa0\xa5\xba]\xe8\xf9\xf8\x06\x0aQ\xe3\xe8\
-\xeb\xd4\x8c\xa5\xba\xbb\x89\xa5\xd5u\xa4\x1e\xb7|\xb3x\
-\x9d\xb4\x8c\xe7\xf0d\xd6&\x0eOf\xe5\x10\x15\x868\
-L\xf6U\xd2\x99hq\xe4J\xab\x82S\xc8\xef\xc2\xdb\
-J\x9a\x9a=\x8e\xc2C\x035\x91\xcfd\xbf\xbf\xdb\x03\
-TT\xdf\xc6\xd1\xd7\xe3i\xd4sv\x10\xf58\xadG\
-\xc1\xaaU\xc1)\xe4\x07\x9cnEa)\x96\x07\xeb(\
-\xe0N\xe1\xde4\xb3\xb6qx2\xeb\xac\xfc\xd2\xcc8\
-\xaa\xfa<\x8f\xb6\xbe\xbf\x8cz]\x86i\xed\xcd\xf9\xce\
-\xc7\x13\x15\xa8\x11\x14\xdc\xd6\xa0\xa5\xbchV\xbeB\xf7\
-\x1f\xe5\x12;\x10\xd7\x01\x8f\xa1~\xb3\xd7Qs\xf8\xe3\
-\xa4\x8a\xd3\xdd\x8e\x5ci\xe5c\x8a#vFP\xa5i\
-\x0e\x1d\xb33\x81\x9e\xa3n\x7f^\xccJ\xc1\xe1\xc9\xac\
-\xb3j\xa4\xe6\xf0\x9d\xa8\xda\xf42:\xe6#*N\xed\
-\xba9\xe7\x1fS?)@\xecB\xe7\xb4\xc5\x19l\x87\
-Xz\x94K\xb7\xdd\xa8\xf3\x15\xa7]\xa8a\xff\x00\xaa\
-:=\x8e*N\xb1T\xd7N\xf9\xdd\x91\x9bP%,\
-\x96\xf0\x22\xf4^ \x85\x5c3k\x11\x87'\xb3\xce\xc8\
-W\x9c\xf2\xbb\xea\xbe\x91\xfdXtrx+\x1e\x1f\xe8\
-f\xbd\x09\x1dt\x1b\x039o\x01'\xd1.\xbcn:\
-o\xed\xce\xbe\xb3\xc7Hg\xd5\x1d@\x0d\xfb1\x98\xb4\
-\xdd\xc1)\xff\x18\xfb\xd1kcG\xf68\x1a\xb9\xff\xb6\
-\x80*\x83\xde\x1di\xd6B\x0eOf\x9d\x11\xc1i=\
-\x0aNq\xb4\xc7\xf3\xa8\xba\xd1\x89\x8a\xd3\xdd\xd4P\xa5\
-c\x18\xdd\xb4gQ`\x1a\x03\xbe@\xdb\xe5\xbb\xe5(\
-\x97\xa88E\xd3\xfcs\xe8y\xd9\x87\xfa\xd0V\x93\xbe\
-\x0e\x9d\x14U\xa6u\xa4\xbe\xa70\x87\x1e\xdfe\xb4\x9c\
-\xe7\x0a\x94Y\x0b8<\x99\xb5_T7\xd6\xa1\x9b\xf4\
-A\xe0\xcd\xec\xc7-\xb4\xb7\xc7i\xb9b\x9b\xfe~\x14\
-\xf8V\xa1\x1e\x9bY\xb4\x84W\xe5\x9bt\xf4-\xe5\x87\
-\x92>\x8fz\x9c\x9eE\x15\xa8\xb5\xe89\xebT\xc5\xe9\
-n\x22\xd8\xee@\xd7\xf2\xc1\xec\xf3\x83(P\xcd\xa3\x0a\
-\x94\xabOfM\xe6\xf0d\xd6^\x03\xa4]u{\xd0\
-rX\x1c&\xfb8\xe5\xbbA\x87\xe8\xcd\xda\x8a*3\
-7Pe\xa3\x0f\xf8\x0a8\x8fn\xd6e\x0b}\xcb\xd1\
-\x87*}\xb1|\xfa\x1cZ\xaa\x8b\x1e\xa7u\xa4]u\
-e3@:\x0e\xa6N\x1a\x96\x19\xd5\xa8+\xe8y\xaa\
-\xdf\xf5\xff6\xb3\x15qx2k\x9f\xfcr\xcb\xe3(\
-4\xbd\x89\xaa\x1b\x8fP\xde\xe0\x14\xf2\xa3\x0c\xf6\xa1@\
-\xb1\x16=\xe6\xdb\xa40U%\xf1\x9c\xacB\x0d\xfb/\
-\x01\xbf\x80\x86_nEKue\x0dN\xb0t\x8cA\
-\x1c\xdb\xd3\x97\xfb\xf8\x02U\x07\xe7q\x05\xca\xaci\x1c\
-\x9e\xcc\xda\xa3\x9f\xa5\xcd\xe11\x00\xf3y\xd2\xe4\xf0\xb2\
-\xde\xa0\xf3\xe2f\xbd\x95\xb4<4\x89n\xce\xe7I\xfd\
-P\x9d\xee\x0bZ\x8e\x08\x1d\x1b\xd1\xd2WT\x01_@\
-\xcb\xa7#4\x7fjx\xabD\x05j\x10\xf5=\xe5+\
-P\x0b\xa8R8Ew\xf4\xa6\x99u\x9c\xc3\x93Y{\
-\x0c\x91\xb6\xbe\xbf\x88\xb6\xfe\xefC\xd5\x82UT#l\
-\x84\x1a\xe9\x08\x99\xa7\xd0\x0dy\x1d\xf01p\x16\xdd\xbc\
-\x87(w\xe8\x88\x86\xfd\x0d\xa8\xbat\x904\x94t\x0b\
-\xcd=?\xb0\x1d\xa2*\x18g\x146HKy\x0d\xe0\
-\x18j\xee\x9f\xc4\x15(\xb3\x87\xe6\xf0d\xd6\x1e\x11\x9e\
-\x1eG;\xb8^C7\xb9N\xcc\x0bj\x96!T5\
-[K\x1a\x1c\xf9\x09\xbaI\x0f\x93\xa6`\x97-DE\
-\xc3\xfej\xd4\x1c>\x8a\x9a\xc3_\xcd~]\xf6\xe5\xd3\
-\xfb\x89\xc6\xfe!\xf4\xf5\x9fE\x81\xe9\x16\xa9\xfa\xe4\xf0\
-d\xf6\x90\x1c\x9e\xcc\xda#f\x08\xc52P\xd9\x02\xc5\
-JD\xb5c5:\xb8\xf6\x05\xb4tt\x06\xdd\xb4\xcb\
-\xb8s\xb0\x86\xc2\xd2&T5{\x12\x85\xbf\xbdh\xf9\
-\xae\xec\x15\xb3\xe5\x88\xe1\xa6q\x16\xde\x22\xa9\x02\xe5\xe0\
-d\xd6\x04\x0eOf\xed\xd1@7\xb1Y\xd4\x5c}\x1d\
-\x85\x8e\xa8\x82\xb4\xfa|\xb4V\x89\x00\xb5\x06\x85\x91\xf5\
-(4]G\x01\xa5\x8c\xe1i\x8c\xd4\x0c\xbe\x1eUj\
-\xd6f\x9f/\xd3c]\x89x\x9d\xcd\xa0\xd7\xd9MT\
-u\x9a\xc1;\xee\xcc\x9a\xc6\xe1\xc9\xac=\xe6\xd1\xcd\xec\
-\x02\xda\xda\xbf\x0e\xf5\x0a\xc5V\xf82\x0c_\x5c\xa9\x08\
-P\xebH\xf3\x866\xa00\xd2\xc9i\xdcw\x13\xe1i\
-3z\x8c\xe3(DU\xa51\xfcA\xeah<\xc1)\
-\xe0\xd3\xec\xe3\x14Z\xb2\x9b\xeb\xdc\xc32\xeb.\x0eO\
-f\xed1\x87n`\xa7P\x98XD\xe1)\x8e\xd7X\
-G\x9a*^\xc5\x9bx<\xeeX\x12[C\x9aiU\
-\xb6\x7f\xcf(\x0aK\x0dRh-\xdbc,\xaa\x81^\
-O\xd3\xe8\xe8\x9c\xf7\x80\x0f\x80\xcf\xd1k\xee&z\x0d\
-z\xd9\xce\xac\x09\x1c\x9e\xcc\xdac\x814\xacp\x01\xdd\
-\xc8b\xdb\xff\x22\xaa@\xe5\xa7DW\xf5f\x1e=P\
-\xab;\xfd@\xee!&\x89\x0fu\xfa\x814\xd9\x02Z\
-\x9e\xbb\x80\x9a\xf6\xdfC\x078\x9fA\xc1\xc9\xe7\xdc\x99\
-5\x91\xc3\x93Y\xfb4Ph\x8a\xe3L\xe2\xe7\xd7\xd1\
-\xcdo\x884\xab\xa7\xaa\xe1\xc9\xda\xaf\x81v\xd1\x1d\x07\
-~\x8a*N\x1f\xa3\xb9[q\xbe\x9d\x83\x93Y\x139\
-<\x99\xb5\xd7\x22ZZ\x89\xea\xd34\xaa>\x8d\xa0\xef\
-\xc7\xc7P\x13s\x8c0p\x88\xb2\xfb\x99E\x15\xa7\xd3\
-\xc0a\xe0\x1d\xb4T\x17\x15'O\x167k\x01\x87'\
-\xb3\xf6\x8a\xddP\x0dt\xd3k\x90\x96\x90f\xb2\xff\xd6\
-\x8f\x1a\x99\x07\xa9n\x13\xb9\xb5\xc7\x04\xf0%Z\xa2{\
-\x1f5\x88\x9f#\x05'\xef\xb03k\x01\x87'\xb3\xce\
-\x88\xde\xa7\xdb\xa8\xa17*Qc\xe8\xfbr\x11\x05\xa8\
-*7\x91[k4P0\x9aD\xcd\xe1\x87\x81\xb7\xd1\
-R\xddi\x14\xa8\xe6pp2k\x19\x87'\xb3\xce\xa9\
-\xa3\x9b\xe0\xad\xec\xd7\xb1[m\x0e-\xc7<\x81*O\
-\xdd0\xb8\xd1\x9ag\x11\x85\xee/Qpz\x0fU\x9c\
-Ng\x9f\xf7\xae:\xb3\x16sx2\xeb\xac\xa8\x22\xc4\
-2K\x0c\xd0\xecC\xcd\xe3\xab(\xef1'\xd6\x19\x0b\
-\xc0U\xe0]\xe0\xc7hw\xdd9\x14\xc2c\x92\xb8\xd9\
-\x035\x1a~\xa9\xac\x94\xc3\x93Y\xe7E\x1f\xd44p\
-\x0d8\x81\xaa\x09\xa00\xf5\x14i\x90\xa6\x9b\xc8{\xd7\
-<z}|\x8d\x96\xe8>@\x07\xfe^F\xbb\xed\x1c\
-\x9c\xcc\xdad\xc0\xc9\xd3\xac\xf5j\xb5\x07\xe6\x9d\xe8\x81\
-\x9aDU\x04P\x98\x8a>\xa8\x08Me\x1c:i\xad\
-\xd5@\xaf\x8f)\xd4\x1f\xf7.\xf03\xb4Tw\x16U\
-\x9c\xbc\xab\xce\xac\x8d\x5cy2+\x8fz\xf6q\x13\x05\
-\xa9:\xeawZ\x8bn\x8e\x8f\x93\xc6\x18x\x17^o\
-\x88\xc9\xe1\xd7Ps\xf8!T\x95\xfc\x08\xcdqrp\
-2\xeb\x00\x87'\xb3\xf2\x89%\xbcK\xa8\x9fe\x11\xed\
-\xa0ZDU\xa7q4\x17\xca}P\xdd-\x82\xd3\x04\
-\xf0\x19\x1a\x80y\x085\x8a\xc7\x00\xcc\x05\x1c\x9c\xcc\xda\
-\xce\xe1\xc9\xac|\xeah\xb7\xdd54\xfb\xe9:\x0aI\
-\xabH\xe7\xb2\x0d\x90\xbe\x7f\x1d\xa0\xba\xd3<\x0aN\xe7\
-\xd1\xae\xba\x1f\xa2^\xa7\xab\xe8u\xe1\xd0d\xd6!\x0e\
-Of\xe5\x15!\xea\x06\x9a\x1a\xdd\x8f\xaa\x0d/\x01\xcf\
-\xa0\xf3\xe3\xdc\x03\xd5\x9d\xea(4\x7f\x8a\xfa\x9b\xdeC\
-\x1b\x09b\x99\xce\xcc:\xc8\xe1\xc9\xac\xbc\xf2\xc3\x10O\
-\xa3e\xbb\xe8\x83\x1a\x06\x1e%-\xe1y\x17^\xb5E\
-S\xf8\x02\x0a\xcc\x13(,}\x00\xfc\x08\xf8\x0a\xed\xaa\
-\x9b\xc6g\xd5\x99u\x9c\xc3\x93Yy5H\x01\xea\x06\
-\xba\xb9\xf6\xa3c[\x16\x81\x83\xc0n`\x03\x0aTn\
-\x22\xaf\xae84\xfa6p\x11\x8d#\xf8\x14\x1d\xb9\xf2\
-\x05\x0eNf\xa5\xe2\xf0dV~\xd18\x9c?\xcae\
-\x02U\x9b\xe2\xfc\xbb\x98\x03\xe5&\xf2\xea\xa9\xa3\xe0t\
-\x0b\x8d\xa9\xf8\x1c-\xd3\x1dA\xd5'\x07'\xb3\x92q\
-x2\xab\x86\xb8\xc1\xdeD7\xd1E4\xc2\xa0\x0fU\
-\xa6\xf6\x00\x1b\xd1\xf7\xb4\x97\xf0\xaa#\xdf\xd7v\x16U\
-\x9b>\x02>DKu\xd1\x1c\xbe\xd8\x99\x87gfw\
-\xe3\xf0dV\x1d\xf9\xad\xebgQ#\xf1-t\xf3\x1d\
-A;\xf1V\xa1\xf0d\xd5\x10c(\xce\xa3\x8a\xd3[\
-\xa8\xe2t\x1a5\x8c\xcf\xe0\x03~\xcdJ\xc7\xe1\xc9\xac\
-Z\xf2\x93\xc8\xcf\xa3\xef\xe1Uh\xc9n\x0e\xd8\x89\x9b\
-\xc8\xab`\x91TI<\x85\x82\xd3\xe1\xec\xc7;\x83\x93\
-\x97\xea\xccJ\xc6\xe1\xc9\xacz\x22@M\xa0\x1e\x99>\
-T}\x9aB\xfdO\xf11\x84\xc3S\x19\xe5{\xd8\xce\
-\x91\x1a\xc3\x8f\xa0F\xf1k\xe8\xf9t\x8f\x93YI9\
-<\x99US\xf4@]G7\xdaIR\x1f\x14\xe8\xa6\
-\xbb\x1e\x05(/\xe3\x95G\x1d\xf5\xa8\xddF\x95\xc3/\
-Q\x8f\xd3a\xe0(\xaaD\xcd\xe2\xd0dVj\x0eO\
-f\xd5\x16\x0d\xc7W\xd0\xf4\xe99\xb4\xd5\xfdu`\x1f\
-\xe9,<\x07\xa8\xcek\xb0\xb49\xfcc4\xc7)\x0e\
-\xf8\x8d\xe3V\xcc\xac\xe4\x1c\x9e\xcc\xaa-*P\xd1\x07\
-u\x11mk\x1f\x01\xd6\xa0\xd04NZ\xc2\xf32^\
-g\xc4Rk\x8c#\xf8\x82t\xc8o\xf48M\x93f\
-{\x99Y\x899<\x99U_\x834\xbe\xa0\x0e\x1c\x03\
-\xc6\xd0\xf2\xd0+\xa8\x025\x8e*P\x1e\xa4\xd9~\xf9\
-1\x13\xc7\xd1\x12\xdd\xfb\xe8\xb0\xdf\xd3\xa8\x125\x8bw\
-\xd5\x99U\x86\xc3\x93YwY\x04.d?\xce\xa0J\
-\xd3\x08\xf08\x9aD>\x8aw\xe1\xb5K\x1c\xb9\x12\x13\
-\xe2O\xa1\xa6\xf0wPx:\x87\x9a\xfc\xe7\xf0\x1c'\
-\xb3Jqx2\xeb.u\xb4\x0bo.\xfb\xf9(\xfa\
->\x9f\x05\x9e\x026\xe3\xa3\x5c\xda%\x8e\x5c\xb9\x89*\
-L\x1f\xa2e\xba\x8f\xd0\xe4\xf0\xdb\x1d{df\xf6P\
-\x1c\x9e\xcc\xba\xd3\x02:\xd6\xe3]\xd2\x8e\xbc!T\x85\
-Z\x87\xabO\xad\x16g\x12\xc68\x82O\x80?G\xc1\
-\xe9,\xeao2\xb3\x8arx2\xebNut\x83\xbe\
-\x88\x96\x84\xd6\xa3\xe0\xb4\x80*P\x1bIc\x0c\x1c\xa2\
-\x9a+\x7f\xe4J,\xd5\xbd\x8f\x02\xd4i\x14\xa8\xdc\x14\
-nVa\x0eOf\xdd+\xaa\x1f\xd7\xd1\xce\xae)\xb4\
-\xa4\x17\x15\xa88X\xd8\xe1\xa9y\xa2y\xff6\xaa0\
-\x1dF\x15\xa7\xc3h\xae\xd3\x14n\x0c7\xab<\x87'\
-\xb3\xee\x16\xb3\x85\xce\xa1\x9b\xfa\x00Z\xb6\x9b\x07\x1eA\
-M\xe4q\xbc\x8bgA=\x9c8re\x02\xed\xaa\xfb\
-\x8449\xfc8\xfa\x9a\xbb1\xdc\xac\x0b8<\x99u\
-\xbfXF\xba\x8a\xceN\xab\xa1\xe5\xbc\xfdh\x09\xefQ\
-\xb4\x8c\xe7*\xd4\xca\xc58\x82\x1b\xa8\xc2t\x08\xed\xaa\
-;\x82\x82\xab{\x9c\xcc\xba\x88\xc3\x93Y\xef\x98Bg\
-\xa7]BKJ\x13\xa8\x07\xaa\x1f\xed\xca[\x9d\xfd\xdc\
-\x01\xaa\x98\xfc\x91+\x17\xd0\x00\xccw\x80\xb7\x80\x93\xd9\
-\x7f3\xb3.\xe2\xf0d\xd6;\xa2\x1fg\x1aUC\x0e\
-\xa1\xf0\x14s\x86v\x90\x86i:@-O\x03\x85\xd0\
-+h\xfc\xc0\xc7\xa8\xbf\xe9\xe3\xecs\xf3\xb8\xc7\xc9\xac\
-\xeb8<\x99\xf5\x96\x06\x0aL\xd7\xd0\x99j\xb3\xd9\xe7\
-c\xc9n\x007\x92/G\x1c\xa3\xb2\x80\x1a\xf2cr\
-\xf8\xdb\xa8\xcf\xe9*n\x0e7\xebZ\x0eOf\xbd'\
-\x867\xde@[\xe9\xa3Y|1\xfbo;PS\xf9\
-\x08\x0eP\xf7\x12\x15\xbc\xeb\xc0QT\xc5;\x84\x02\xe9\
-9\x14J=\x8e\xc0\xacK9<\x99\xf5\xae\x06:\xa8\
-\xf68i\x229(\x18<\x8e\x9a\xc8\xa3\x12e\x12G\
-\xae\xcc\xa0!\xa4\xc7\x80\x0f\xd00\xd2OP#\xbe{\
-\x9c\xcc\xba\x9c\xc3\x93Y\xefj\xa0\xea\xc9\x1cZb\x1a\
-@\xcbu}\xa8q|\x10X\x93\xfb\x9c\xa5\xe1\xa3W\
-P\xf3\xfdG\xe8\xd8\x95OPs\xb8w\xd5\x99\xf5\x00\
-\x87'3\x8b@p\x0c\xf5\xf0\xcc\xa2\xeaS\x0d\xd8I\
-:\xce\xc5\x144\xaf\x00_\xa2e\xba\x1fg?\xbf\x80\
-+Nf=\xc3\xe1\xc9\xcc\xf2\x93\xc8\xeb\xa8\xd24\x98\
-\xfb|\xec\xc2\x1b\xa57\x0f\x14\x8e\xaf\xc3-\xb4,\x17\
-\x030\x0f\xa3\xb9Y\x17P\xf8\xf4\x00L\xb3\x1e\xe1\xf0\
-df\x90\x86<\xdeB[\xee\xebh\x0b\xfe\x140\x09\
-<\x09lA\x01\xaa\xd7\xd4\xd1\xd7\xe1\x18j\x08\xff\x14\
-\x85\xa6c(LM\xe1\xe0d\xd6S\x1c\x9e\xcc,o\
-\x1em\xb3\x8f>\xa8\x85\xecs\xd1\x07\xb5\x91\xde9\xca\
-%*N\xb7\xd1\xd4\xf0#\xa81\xfcS\xb4K\xf1\x0a\
-K\x1b\xed\xcd\xacG8<\x99Y^\x1c\xe5\x12\x81\xa0\
-\x86BD\xfc\xb8\x07\xd8\x86\x0e\x17\xee\xf6\x00\xb5\x88\xc6\
-9\x9c@\x95\xa68\xa7\xee\x14\x9a\x93\xe5\xe6p\xb3\x1e\
-\xe5\xf0dfw\xb3\x80\x82\xc34\xa9\x81\xbc\x81\x02\xd3\
-Z\xba\x7f\x90f,c^D;\xea~\x8a\xa6\x86\x9f\
-@K\x9b\x0b\x9d{hf\xd6i\x0eOfv7q\
-\x94K\xcc3:Jj\x16\xef\x03\x1e\x036\x03ct\
-_\x05j\x11-\xc9\x9dB\x81)?\xfcr\x02-\xe5\
-y\x00\xa6Y\x0fsx2\xb3{\x89\x00u\x1b\xcd0\
-Z -\xe1\xcd\xa3\xeb\xc7\x00\xdd\xb3\x84WG\xff\xde\
-)\x14\x9c\x0e\xa1\x01\x98GP\xc5i\x02U\xa3\x1c\x9c\
-\xccz\x9c\xc3\x93\x99=H\x1c\xe5R'\x85\xa48\x07\
-\x0f`=\xb0\x8a\xea/\xe1\xcd\xa1q\x0dg\xd0\xe0\xcb\
-\xf7\xd0H\x82\xafQ\x8fS,]\x9aY\x8fsx2\
-\xb3\x07\x89\x0a\xd4\x14p\x964\x0c\xb2\x9e\xfd\xfc)\xb4\
-\x03\xaf\x9fjV\xa0\xe2\xdfw\x03-O\xbe\x8d\xfa\x9c\
-\xbe@Ku7qp2\xb3\x1c\x87'3[\xaeY\
-4\xc6\xe0\x16\x0aI\xb5\xec\xc7\x11TyZE5\xc7\
-\x18,\xa0\x7f\xd3\x19\xd4\xe3\xf4\x13\xd2\xf0\xcbI<\xc3\
-\xc9\xcc\xee\xe0\xf0dfE4P\xd8\xb8\x80*Mq\
-P\xee\x02\x1ac\xb0\x05\x85\xa9\xaa\xa8\xa3\xe0t\x04\x8d\
-\x22x\x1f\xf8\x0a5\x8c\xcf\xe0\x19Nfv\x17\x0eO\
-fVD\x84\xa5\x9b\xa4`\xd1\x9f\xfbo5\xd2 \xcd\
-2\x1f\xe5\xd2 \xf5r\x9dD\x8d\xe1\xef\x00\x9f\xa1\x81\
-\x98\x93\xa4\x06y3\xb3%\x1c\x9e\xcc\xac\xa8\x08\x1e\xb7\
-P\x0fT\x1f\x0a\x1aQ\x89ZD\x15\xa8\xb1N=\xc0\
-eX@\x01\xf0stF\xdd\xfb\xd9\xcf\xcf\xa2]u\
-\x0eNfvO\x0eOf\xb6R\x11@\xeah\x89\xab\
-?\xfby\x0d\x8d/\xe8G\x834\xcb\xd4\x03\x95?r\
-\xe54\xaa6\xfd\x0c5\x8a\x9f\xcf>\xef\xe0df\xf7\
-\xe5\xf0df+\x15\x15\xa8\xd8\x8d6Bj\x22\xef\xcf\
->\xb7\x89r5\x917P?\xd3q\xd4\xe7\xf4\x01\x1a\
-\x80y\x894\x00\xd3\xcc\xec\xbe\x1c\x9e\xcc\xeca-\xa2\
-\x1e\xa1\xafQ\xd5f\x914pr\x08\x18\xa7\xf3\x15\xa8\
-XN\x9cE\x03/\x7f\x82\x0e\xf9\xfd\x025\xbf\xc7!\
-\xc8ff\x0f\xe4\xf0df\x0f+v\xe0\xddBs\x91\
-\x06I\xcd\xe2\x03\xc0\xe3\xa8\x89\xbcSG\xb9D\x85\xec\
-\x0aZ\xaa{\x1fM\x0f\xff\x0cU\x9c\xdc\x1cnf\x85\
-8<\x99Y3D\x80\x8a^\xa2\xa8>\xf5\xa1\xe0\x02\
-\x0aU\xed\xae@\xc5\x18\x85\x9bh\x04\xc1\xdbhz\xf8\
-\xe7\xa8\xc7)*N\x0eNf\xb6l\x0eOf\xd6L\
-s\xe8(\x939R\xf3x\x03\x85\xa6!`\x1d\xea\x8d\
-jG\x80j\xa0e\xbakh\x1c\xc1!\xb4\x5c\xf7\x15\
-\x0aN7\xb3\xdf\xe3\xe0df\x858<\x99Y3E\
-\x05j\x12\x05\x94F\xeec\x11x\x02\xd8\x8eBU\xab\
-\xcf\xc2k\xa0\x89\xe8\x1f\xa1\x1du\x1f\xa1\x8a\xd3\x15T\
-q\xf2\x00L3[\x11\x87'3k\x85\x05t\xc8\xee\
-4K\x83R?\xda}\xb7\x9a\xd4\x1b\xd5Gs\x83T\
-~\x17\xe0Wh\x1c\xc1\x9f\xa3\x1dv\xd7Q5\xcaG\
-\xae\x98\xd9\x8a9<\x99Y+D\x05j\x0a\xedf\x1b\
- \x05\x96\x05\xe0\x11`\x03\x0aQ\xcd\x9eF>\x8f\x96\
-\xea>@;\xea\xdeE;\x01\xaf\xa1\xe0T\xc7Ku\
-f\xf6\x10\x1c\x9e\xcc\xac\x95\x1a\xa49P\xf3($-\
-\xa0\x99J;\x81\xad\xc0Z\xd2,\xa8\x95V\xa0\xea\xd9\
-\xc7,:r\xe58\xf0\x16\x0aN_\xe1\xe0dfM\
-\xe4\xf0df\xad\x14M\xdb\x0b(\xb8\x0cf?\x8f\x1d\
-n\xf9%\xbd\x95\x06\xa8\xa8rM\xa3\xd1\x03\xc7P\x7f\
-\xd3\xfbh\x8e\xd3eRp23{h\x0eOf\xd6\
-\x0eu\xd2 \xcd)\x96V\x7f\x220\xd5P\x80*\x12\
-\x9e\xe2\xa0\xe2)\xd4\x08\xfe)\xf0CTq:E\xda\
-\xf9\xe7j\x93\x995\x8d\xc3\x93\x99\xb5C\x9c)w\x0b\
-\x85\x9d1\xd2A\xc25\xd2r\xda\x1a4\xd2`9\xd7\
-\xa6\x05TQ\x9aB\xb3\xa5\x8e\xa1\x19N\x87\xd0Yu\
-\x13\xe8\xcc=7\x87\x9bYS9<\x99Y\xbb\xc4\xb8\
-\x82I\xd2 \xcd\x05Ty\x8a\x99P\xa0\x00\x95\xafF\
-\xdd\xed\xcf\x89\x1du\xd7\x81\x8b(0}\x08|\x82\xaa\
-[7QX\xf3R\x9d\x995\x9d\xc3\x93\x99\xb5S\xf4\
-'\xc5\x80\xca\x1a\xba\x0eEx\x8a\xc6\xef\xbe\xec\xf3\xfd\
-\xfc|\x80\x8a3\xeab\xf8\xe5QRx:\x99\xfd\xd9\
-\xb1T\xe7\xe5:3k:\x87'3k\xb7\xa8\x1a\xdd\
-Fg\xe1\x81\x02Q\x1f)\xf0\xf4\x03\xab\xd04\xf2\xfe\
-\xdc\xff\xd7@Kq\xd7QP:\x82\x1a\xc3\x8f\x92z\
-\x9c\x5cq2\xb3\x96rx2\xb3N\x89\xa3\x5c\xa6Q\
-5*?\xebi\x00\xd8\x84\x02\xd5p\xf6\xb9|\xd5\xea\
-,\xdaI\xf7!\x1a\x82y9\xfb\xfc,\xae6\x99Y\
-\x8b9<\x99Y\xa7D\x0f\xd44\xea[\xfa\x0c\x05\xaa\
-\xa9\xec\xe3I\xe0q4\x07j\x00\x05\xa7\x1b\xc0\x09T\
-q:\x8cv\xd7]\xc8~\x7f\x9c\xa7gf\xd6R\x0e\
-Of\xd6I\x11\xa0n\xa1F\xef\x99\xecc:\xfb|\
-\x0d\x0d\xd2\x1c\xce>\x7f\x1a\xf8\x18M\x0f\xff\x188\x93\
-\xfd\xbf1G\xca\xcc\xac\xe5\x1c\x9e\xcc\xac\xd3\xa2\x07j\
-!\xf7\xeb\x18\xac9\x85\xaaO\xab\xb3\x9f\x1fA\xa1\xe9\
-s\x14\xa4bW\x9d\x9b\xc3\xcd\xacm\x1c\x9e\xcc\xac\x0c\
-\xf2c\x0c\xce\xa3\xca\xd3<\x9a\xd5t\x0d\x9d\x83w\x0b\
-\xf8\x09\xf0%\xeaq\x9a\xc0Kuf\xd6\x01\x0eOf\
-V&Q\x81\x9a#\x8d*\x18@Kv7\xd09u\
-_\xa3p\xe5J\x93\x99uD\xad\xd1\xf0\xf5\xc7\xcc\xcc\
-\xccl\xb9\xfa:\xfd\x00\xcc\xcc\xcc\xcc\xaa\xc4\xe1\xc9\xcc\
-\xcc\xcc\xac\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\
-\xcc\x0apx2333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\
-\x00\x87'333\xb3\x02\x1c\x9e\xcc\xcc\xcc\xcc\x0ap\
-x2333+\xc0\xe1\xc9\xcc\xcc\xcc\xac\x00\x87'\
-333\xb3\x02\xfe\x7f\xcd\x94\xebr\xe2x3<\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x01\xc5\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M15.794\
- 7.73271C16.0797\
- 8.03263 16.0681\
- 8.50737 15.7682\
- 8.79306L10.5178\
- 13.7944C10.2281\
- 14.0703 9.77285\
- 14.0703 9.48318\
- 13.7944L4.23271\
- 8.79306C3.93279\
- 8.50737 3.92125\
- 8.03263 4.20694\
- 7.73271C4.49264\
- 7.43279 4.96737\
- 7.42125 5.26729\
- 7.70694L10.0005\
- 12.2155L14.7336\
- 7.70694C15.0336\
- 7.42125 15.5083\
- 7.43279 15.794 \
-7.73271Z\x22 fill=\x22\
-#212121\x22/>\x0d\x0a</sv\
-g>\x0d\x0a\
-\x00\x00\x06\xb8\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M10.530\
-3 2.21967C10.237\
-4 1.92678 9.7625\
-6 1.92678 9.4696\
-7 2.21967L7.2196\
-7 4.46967C6.9267\
-8 4.76256 6.9267\
-8 5.23744 7.2196\
-7 5.53033C7.5125\
-6 5.82322 7.9874\
-4 5.82322 8.2803\
-3 5.53033L9.25 4\
-.56066V7.25C9.25\
- 7.66421 9.58579\
- 8 10 8C10.4142 \
-8 10.75 7.66421 \
-10.75 7.25V4.560\
-66L11.7197 5.530\
-33C12.0126 5.823\
-22 12.4874 5.823\
-22 12.7803 5.530\
-33C13.0732 5.237\
-44 13.0732 4.762\
-56 12.7803 4.469\
-67L10.5303 2.219\
-67ZM2.21967 9.46\
-967C1.92678 9.76\
-256 1.92678 10.2\
-374 2.21967 10.5\
-303L4.46967 12.7\
-803C4.76256 13.0\
-732 5.23744 13.0\
-732 5.53033 12.7\
-803C5.82322 12.4\
-874 5.82322 12.0\
-126 5.53033 11.7\
-197L4.56066 10.7\
-5H7.25C7.66421 1\
-0.75 8 10.4142 8\
- 10C8 9.58579 7.\
-66421 9.25 7.25 \
-9.25H4.56066L5.5\
-3033 8.28033C5.8\
-2322 7.98744 5.8\
-2322 7.51256 5.5\
-3033 7.21967C5.2\
-3744 6.92678 4.7\
-6256 6.92678 4.4\
-6967 7.21967L2.2\
-1967 9.46967ZM10\
-.5303 17.7803L12\
-.7803 15.5303C13\
-.0732 15.2374 13\
-.0732 14.7626 12\
-.7803 14.4697C12\
-.4874 14.1768 12\
-.0126 14.1768 11\
-.7197 14.4697L10\
-.75 15.4393V12.7\
-5C10.75 12.3358 \
-10.4142 12 10 12\
-C9.58579 12 9.25\
- 12.3358 9.25 12\
-.75V15.4393L8.28\
-033 14.4697C7.98\
-744 14.1768 7.51\
-256 14.1768 7.21\
-967 14.4697C6.92\
-678 14.7626 6.92\
-678 15.2374 7.21\
-967 15.5303L9.46\
-967 17.7803C9.76\
-256 18.0732 10.2\
-374 18.0732 10.5\
-303 17.7803ZM15.\
-5303 7.21967L17.\
-7803 9.46967C18.\
-0732 9.76256 18.\
-0732 10.2374 17.\
-7803 10.5303L15.\
-5303 12.7803C15.\
-2374 13.0732 14.\
-7626 13.0732 14.\
-4697 12.7803C14.\
-1768 12.4874 14.\
-1768 12.0126 14.\
-4697 11.7197L15.\
-4393 10.75H12.75\
-C12.3358 10.75 1\
-2 10.4142 12 10C\
-12 9.58579 12.33\
-58 9.25 12.75 9.\
-25H15.4393L14.46\
-97 8.28033C14.17\
-68 7.98744 14.17\
-68 7.51256 14.46\
-97 7.21967C14.76\
-26 6.92678 15.23\
-74 6.92678 15.53\
-03 7.21967Z\x22 fil\
-l=\x22#212121\x22/>\x0d\x0a<\
-/svg>\x0d\x0a\
-\x00\x00\x0aF\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M8.5333\
- 2.62683C9.46393\
- 2.19731 10.5361\
- 2.19731 11.4667\
- 2.62683L16.1286\
- 4.77847C16.6598\
- 5.02365 17 5.55\
-533 17 6.14041V8\
-.00061H16.0002C1\
-5.1717 8.00061 1\
-4.5002 8.67218 1\
-4.5002 9.50061C1\
-4.5002 10.0297 1\
-4.7741 10.4949 1\
-5.1879 10.7619C1\
-3.9251 11.4936 1\
-2.1031 12.0006 9\
-.9992 12.0006C7.\
-89585 12.0006 6.\
-0742 11.4938 4.8\
-1139 10.7624C5.2\
-2567 10.4955 5.5\
- 10.0301 5.5 9.5\
-0061C5.5 8.67218\
- 4.82843 8.00061\
- 4 8.00061H3V6.1\
-4041C3 5.55533 3\
-.34019 5.02365 3\
-.87141 4.77847L8\
-.5333 2.62683ZM6\
-.69684 6.54104C6\
-.44303 6.43227 6\
-.14909 6.54984 6\
-.04031 6.80366C5\
-.93153 7.05747 6\
-.04911 7.35141 6\
-.30292 7.46019L9\
-.49988 8.83031V1\
-0.5006C9.49988 1\
-0.7768 9.72374 1\
-1.0006 9.99988 1\
-1.0006C10.276 11\
-.0006 10.4999 10\
-.7768 10.4999 10\
-.5006V8.83031L13\
-.6968 7.46019C13\
-.9507 7.35141 14\
-.0682 7.05747 13\
-.9595 6.80366C13\
-.8507 6.54984 13\
-.5567 6.43227 13\
-.3029 6.54104L9.\
-99988 7.95663L6.\
-69684 6.54104ZM1\
-5.5002 9.50061C1\
-5.5002 9.22447 1\
-5.724 9.00061 16\
-.0002 9.00061H18\
-.5002C18.6328 9.\
-00061 18.7599 9.\
-05329 18.8537 9.\
-14706C18.9475 9.\
-24083 19.0002 9.\
-368 19.0002 9.50\
-061V12.0006C19.0\
-002 12.2767 18.7\
-763 12.5006 18.5\
-002 12.5006C18.2\
-24 12.5006 18.00\
-02 12.2767 18.00\
-02 12.0006V11.02\
-17C17.7185 11.35\
-49 17.3827 11.66\
-82 17 11.9573C16\
-.8002 12.1082 16\
-.5876 12.2526 16\
-.3632 12.3897C14\
-.7345 13.385 12.\
-4846 14.0006 9.9\
-992 14.0006C7.51\
-384 14.0006 5.26\
-386 13.385 3.635\
-24 12.3897C3.411\
-42 12.253 3.1993\
-5 12.109 3 11.95\
-85C2.61739 11.66\
-96 2.2817 11.356\
-6 2 11.0238V12.0\
-006C2 12.2767 1.\
-77614 12.5006 1.\
-5 12.5006C1.2238\
-6 12.5006 1 12.2\
-767 1 12.0006V9.\
-50061C1 9.368 1.\
-05268 9.24083 1.\
-14645 9.14706C1.\
-24021 9.05329 1.\
-36739 9.00061 1.\
-5 9.00061H4C4.27\
-614 9.00061 4.5 \
-9.22447 4.5 9.50\
-061C4.5 9.77675 \
-4.27614 10.0006 \
-4 10.0006H2.4805\
-4C2.62181 10.216\
-6 2.79473 10.429\
-7 3 10.6375C3.12\
-152 10.7606 3.25\
-437 10.8818 3.39\
-872 11.0006C3.60\
-933 11.174 3.844\
-39 11.3424 4.104\
-36 11.5042C4.121\
-69 11.515 4.1391\
-3 11.5257 4.1566\
-9 11.5364C4.5679\
-4 11.7878 5.0289\
- 12.0145 5.5316 \
-12.2103C6.7982 1\
-2.7036 8.32982 1\
-3.0006 9.9992 13\
-.0006C11.6694 13\
-.0006 13.2017 12\
-.7033 14.4687 12\
-.2095C14.9706 12\
-.0139 15.431 11.\
-7875 15.8417 11.\
-5364C16.1226 11.\
-3648 16.375 11.1\
-856 16.5997 11.0\
-006C16.7447 10.8\
-813 16.878 10.75\
-95 17 10.6359C17\
-.2046 10.4286 17\
-.377 10.216 17.5\
-179 10.0006H16.0\
-002C15.724 10.00\
-06 15.5002 9.776\
-75 15.5002 9.500\
-61ZM9.9992 15.00\
-06C7.33525 15.00\
-06 4.83727 14.33\
-22 3 13.173V13.8\
-607C3 14.4458 3.\
-34019 14.9775 3.\
-87141 15.2227L8.\
-5333 17.3743C9.4\
-6393 17.8038 10.\
-5361 17.8038 11.\
-4667 17.3743L16.\
-1286 15.2227C16.\
-6598 14.9775 17 \
-14.4458 17 13.86\
-07V13.172C15.162\
-6 14.3318 12.663\
-9 15.0006 9.9992\
- 15.0006Z\x22 fill=\
-\x22#212121\x22/>\x0d\x0a</s\
-vg>\x0d\x0a\
-\x00\x00\x04\xea\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M10.000\
-2 6.00003C7.7910\
-4 6.00003 6.0001\
-8 7.79089 6.0001\
-8 10C6.00018 12.\
-2092 7.79104 14 \
-10.0002 14C12.20\
-93 14 14.0002 12\
-.2092 14.0002 10\
-C14.0002 7.79089\
- 12.2093 6.00003\
- 10.0002 6.00003\
-ZM7.00018 10C7.0\
-0018 8.34318 8.3\
-4333 7.00003 10.\
-0002 7.00003C11.\
-657 7.00003 13.0\
-002 8.34318 13.0\
-002 10C13.0002 1\
-1.6569 11.657 13\
- 10.0002 13C8.34\
-333 13 7.00018 1\
-1.6569 7.00018 1\
-0ZM8.12412 2C7.5\
-5707 2 7.03849 2\
-.31977 6.78386 2\
-.82643L6.19437 3\
-.9994H4.50488C3.\
-12417 3.9994 2.0\
-0488 5.11868 2.0\
-0488 6.4994V14.5\
-C2.00488 15.8807\
- 3.12417 17 4.50\
-488 17H15.5049C1\
-6.8856 17 18.004\
-9 15.8807 18.004\
-9 14.5V6.4994C18\
-.0049 5.11869 16\
-.8856 3.9994 15.\
-5049 3.9994H13.8\
-149L13.23 2.8293\
-C12.976 2.32106 \
-12.4565 2 11.888\
-3 2H8.12412ZM7.6\
-7736 3.27548C7.7\
-6224 3.10659 7.9\
-351 3 8.12412 3H\
-11.8883C12.0777 \
-3 12.2509 3.1070\
-2 12.3356 3.2764\
-3L13.0587 4.7229\
-6C13.1433 4.8923\
-8 13.3165 4.9994\
- 13.5059 4.9994H\
-15.5049C16.3333 \
-4.9994 17.0049 5\
-.67097 17.0049 6\
-.4994V14.5C17.00\
-49 15.3284 16.33\
-33 16 15.5049 16\
-H4.50488C3.67646\
- 16 3.00488 15.3\
-284 3.00488 14.5\
-V6.4994C3.00488 \
-5.67097 3.67646 \
-4.9994 4.50488 4\
-.9994H6.50268C6.\
-69169 4.9994 6.8\
-6455 4.89281 6.9\
-4943 4.72392L7.6\
-7736 3.27548Z\x22 f\
-ill=\x22#212121\x22/>\x0d\
-\x0a</svg>\x0d\x0a\
-\x00\x00\x01\xc9\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M10 2.2\
-5C10.4142 2.25 1\
-0.75 2.58579 10.\
-75 3V9.25H17C17.\
-4142 9.25 17.75 \
-9.58579 17.75 10\
-C17.75 10.4142 1\
-7.4142 10.75 17 \
-10.75H10.75V17C1\
-0.75 17.4142 10.\
-4142 17.75 10 17\
-.75C9.58579 17.7\
-5 9.25 17.4142 9\
-.25 17V10.75H3C2\
-.58579 10.75 2.2\
-5 10.4142 2.25 1\
-0C2.25 9.58579 2\
-.58579 9.25 3 9.\
-25H9.25V3C9.25 2\
-.58579 9.58579 2\
-.25 10 2.25Z\x22 fi\
-ll=\x22#212121\x22/>\x0d\x0a\
-</svg>\x0d\x0a\
-\x00\x00\x03\xde\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M11.299\
-9 2.4808C10.4654\
- 2.14702 9.53457\
- 2.14702 8.70013\
- 2.4808L2.94291 \
-4.78369C2.37343 \
-5.01148 2 5.5630\
-5 2 6.1764V13.82\
-23C2 14.4357 2.3\
-7343 14.9873 2.9\
-4291 15.2151L8.7\
-0013 17.5179C9.5\
-3457 17.8517 10.\
-4654 17.8517 11.\
-2999 17.5179L17.\
-0571 15.2151C17.\
-6266 14.9873 18 \
-14.4357 18 13.82\
-23V6.1764C18 5.5\
-6305 17.6266 5.0\
-1148 17.0571 4.7\
-8369L11.2999 2.4\
-808ZM9.07152 3.4\
-0928C9.66755 3.1\
-7087 10.3324 3.1\
-7087 10.9285 3.4\
-0928L16.1538 5.4\
-9941L13.8751 6.4\
-1088L7.72133 3.9\
-4935L9.07152 3.4\
-0928ZM6.37504 4.\
-48787L12.5289 6.\
-94939L10.0001 7.\
-96088L3.84633 5.\
-49935L6.37504 4.\
-48787ZM10.5001 8\
-.83791L17 6.2379\
-7V13.8223C17 14.\
-0268 16.8755 14.\
-2106 16.6857 14.\
-2866L10.9285 16.\
-5895C10.7889 16.\
-6453 10.6455 16.\
-6881 10.5001 16.\
-7177V8.83791ZM9.\
-50015 8.83791V16\
-.7178C9.35467 16\
-.6881 9.21121 16\
-.6453 9.07152 16\
-.5895L3.3143 14.\
-2866C3.12448 14.\
-2106 3 14.0268 3\
- 13.8223V6.23785\
-L9.50015 8.83791\
-Z\x22 fill=\x22#212121\
-\x22/>\x0d\x0a</svg>\x0d\x0a\
-\x00\x00\x04\x17\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M5.6464\
-5 9.14645C5.8417\
-1 8.95118 6.1582\
-9 8.95118 6.3535\
-5 9.14645L8.3535\
-5 11.1464C8.4473\
-2 11.2402 8.5 11\
-.3674 8.5 11.5C8\
-.5 11.6326 8.447\
-32 11.7598 8.353\
-55 11.8536L6.353\
-55 13.8536C6.158\
-29 14.0488 5.841\
-71 14.0488 5.646\
-45 13.8536C5.451\
-18 13.6583 5.451\
-18 13.3417 5.646\
-45 13.1464L7.292\
-89 11.5L5.64645 \
-9.85355C5.45118 \
-9.65829 5.45118 \
-9.34171 5.64645 \
-9.14645ZM14.5 13\
-H9.5C9.22386 13 \
-9 13.2239 9 13.5\
-C9 13.7761 9.223\
-86 14 9.5 14H14.\
-5C14.7761 14 15 \
-13.7761 15 13.5C\
-15 13.2239 14.77\
-61 13 14.5 13ZM2\
-.99609 5.5C2.996\
-09 4.11929 4.115\
-38 3 5.49609 3H1\
-4.4961C15.8768 3\
- 16.9961 4.11929\
- 16.9961 5.5V6H1\
-6.999V7H16.9961V\
-14.5C16.9961 15.\
-8807 15.8768 17 \
-14.4961 17H5.496\
-09C4.11538 17 2.\
-99609 15.8807 2.\
-99609 14.5V5.5ZM\
-15.9961 6V5.5C15\
-.9961 4.67157 15\
-.3245 4 14.4961 \
-4H5.49609C4.6676\
-7 4 3.99609 4.67\
-157 3.99609 5.5V\
-6H15.9961ZM3.996\
-09 7V14.5C3.9960\
-9 15.3284 4.6676\
-7 16 5.49609 16H\
-14.4961C15.3245 \
-16 15.9961 15.32\
-84 15.9961 14.5V\
-7H3.99609Z\x22 fill\
-=\x22#212121\x22/>\x0d\x0a</\
-svg>\x0d\x0a\
-\x00\x00\x02y\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 width=\x2224\
-\x22 height=\x2224\x22 vi\
-ewBox=\x220 0 24 24\
-\x22 fill=\x22none\x22 st\
-roke=\x22currentCol\
-or\x22 stroke-width\
-=\x222\x22 stroke-line\
-cap=\x22round\x22 stro\
-ke-linejoin=\x22rou\
-nd\x22 class=\x22icon \
-icon-tabler icon\
-s-tabler-outline\
- icon-tabler-top\
-ology-star-2\x22><p\
-ath stroke=\x22none\
-\x22 d=\x22M0 0h24v24H\
-0z\x22 fill=\x22none\x22 \
-/><path d=\x22M14 2\
-0a2 2 0 1 0 -4 0\
-a2 2 0 0 0 4 0\x22 \
-/><path d=\x22M14 4\
-a2 2 0 1 0 -4 0a\
-2 2 0 0 0 4 0\x22 /\
-><path d=\x22M6 12a\
-2 2 0 1 0 -4 0a2\
- 2 0 0 0 4 0\x22 />\
-<path d=\x22M22 12a\
-2 2 0 1 0 -4 0a2\
- 2 0 0 0 4 0\x22 />\
-<path d=\x22M14 12a\
-2 2 0 1 0 -4 0a2\
- 2 0 0 0 4 0\x22 />\
-<path d=\x22M6 12h4\
-\x22 /><path d=\x22M14\
- 12h4\x22 /><path d\
-=\x22M12 6v4\x22 /><pa\
-th d=\x22M12 14v4\x22 \
-/></svg>\
-\x00\x00\x01\xc6\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M7.7327\
-1 4.20694C8.0326\
-3 3.92125 8.5073\
-7 3.93279 8.7930\
-6 4.23271L13.794\
-4 9.48318C14.070\
-3 9.77285 14.070\
-3 10.2281 13.794\
-4 10.5178L8.7930\
-6 15.7682C8.5073\
-7 16.0681 8.0326\
-3 16.0797 7.7327\
-1 15.794C7.43279\
- 15.5083 7.42125\
- 15.0336 7.70694\
- 14.7336L12.2155\
- 10.0005L7.70694\
- 5.26729C7.42125\
- 4.96737 7.43279\
- 4.49264 7.73271\
- 4.20694Z\x22 fill=\
-\x22#212121\x22/>\x0d\x0a</s\
-vg>\x0d\x0a\
-\x00\x00\x04\xa2\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M2.8535\
-5 2.14645C2.6582\
-9 1.95118 2.3417\
-1 1.95118 2.1464\
-5 2.14645C1.9511\
-8 2.34171 1.9511\
-8 2.65829 2.1464\
-5 2.85355L5.6453\
- 6.35239C3.97044\
- 7.49179 2.7234 \
-9.27384 2.28017 \
-11.3979C2.22377 \
-11.6682 2.39718 \
-11.9331 2.6675 1\
-1.9895C2.93782 1\
-2.0459 3.20268 1\
-1.8725 3.25909 1\
-1.6021C3.6629 9.\
-66699 4.82367 8.\
-06291 6.36714 7.\
-07422L7.95336 8.\
-66045C7.07297 9.\
-29611 6.5 10.331\
-1 6.5 11.5C6.5 1\
-3.433 8.067 15 1\
-0 15C11.1689 15 \
-12.2039 14.427 1\
-2.8396 13.5466L1\
-7.1464 17.8536C1\
-7.3417 18.0488 1\
-7.6583 18.0488 1\
-7.8536 17.8536C1\
-8.0488 17.6583 1\
-8.0488 17.3417 1\
-7.8536 17.1464L2\
-.85355 2.14645ZM\
-12.1194 12.8265C\
-11.6773 13.5314 \
-10.8934 14 10 14\
-C8.61929 14 7.5 \
-12.8807 7.5 11.5\
-C7.5 10.6066 7.9\
-6863 9.82265 8.6\
-7348 9.38057L12.\
-1194 12.8265ZM10\
-.1235 8.00214L13\
-.4979 11.3765C13\
-.4342 9.54169 11\
-.9583 8.06576 10\
-.1235 8.00214ZM1\
-0 6C9.43016 6 8.\
-87149 6.07353 8.\
-33419 6.21285L7.\
-53113 5.40979C8.\
-31349 5.14331 9.\
-14485 5 10 5C13.\
-6934 5 16.9425 7\
-.67312 17.7199 1\
-1.3979C17.7763 1\
-1.6682 17.6029 1\
-1.933 17.3325 11\
-.9895C17.0622 12\
-.0459 16.7974 11\
-.8725 16.7409 11\
-.6021C16.0574 8.\
-32688 13.2057 6 \
-10 6Z\x22 fill=\x22#21\
-2121\x22/>\x0d\x0a</svg>\x0d\
-\x0a\
-\x00\x00\x02\x97\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M10 13C\
-10.5523 13 11 12\
-.5523 11 12C11 1\
-1.4477 10.5523 1\
-1 10 11C9.44771 \
-11 9 11.4477 9 1\
-2C9 12.5523 9.44\
-771 13 10 13ZM15\
- 2C13.8954 2 13 \
-2.89543 13 4V6H1\
-4C15.6569 6 17 7\
-.34315 17 9V15C1\
-7 16.6569 15.656\
-9 18 14 18H6C4.3\
-4315 18 3 16.656\
-9 3 15V9C3 7.343\
-15 4.34315 6 6 6\
-H12V4C12 2.34315\
- 13.3431 1 15 1C\
-16.6569 1 18 2.3\
-4315 18 4V4.5C18\
- 4.77614 17.7761\
- 5 17.5 5C17.223\
-9 5 17 4.77614 1\
-7 4.5V4C17 2.895\
-43 16.1046 2 15 \
-2ZM14 7H6C4.8954\
-3 7 4 7.89543 4 \
-9V15C4 16.1046 4\
-.89543 17 6 17H1\
-4C15.1046 17 16 \
-16.1046 16 15V9C\
-16 7.89543 15.10\
-46 7 14 7Z\x22 fill\
-=\x22#212121\x22/>\x0d\x0a</\
-svg>\x0d\x0a\
-\x00\x00\xc4n\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xd0\x00\x00\x00\xd0\x08\x06\x00\x00\x00v\xa4\xeft\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00 \x00IDATx\x9c\xec\
-\xbdY\x97$\xc9q\xa5\xf9\x89\xa8\xda\xe2[\x84GD\
-\xeeK\xedY(\x16\x00\xb2\x89\x999g\xfe\xff/\xe8\
-3\xf30\xcd&A\x90@\xadYY\xb9\xc5\xe2\xeef\
-\xaa\x22\xf3\xa0j\xee\x9e\x09\x9c\x99\xee&j\x03S\xf3\
-X\xfa\xbe\x84\x9b^\x15\x91+WD\xe1\xddx7\xde\
-\x8dw\xe3\xddx7\xde\x8dw\xe3\xddx7\xde\x8dw\
-\xe3\xddx7\xde\x8dw\xe3\xddx7\xde\x8dw\xe3\xdd\
-x7\xde\x8dw\xe3\xdd\xf8[\x1c\xf2S\x7f\x81\xbf\x81\
-!\x7f\xe9\xfa\x02\xb8\x07b@8z\x82\x02-x\x02\
-\xfe\xdb\x9b\xef\xe3o]\xbe\x1b\xbf\x80\xf1\x0e@\xffc\
-C\x8e.\x05\x90\x06d\x09a\x01\xf1\x0cm\x1abl\
-\x09\xb1\x03\xed\x88\xb2 h$\xc6\x80h\x8f\x10P\x5c\
-\x04S\xf5\xec\xe6\xc9\xccv\x98%,\xef0\xcb`\x89\
-l[r\xbe\x22\xa7\x01\xd2\x0d\xdb\xbc\x81\xfc}\x01\xd5\
-\xdb\x00{\x07\xb4\x9f\xc1x\x07\xa0\xff\xef!=\xe8\x0a\
-B\x0f\xcd\x09\xda-\x08\xcd\x0a\xe2\x02m\xe7\x12\xe6K\
-m\xe6\xab\xd0/g\xa1[\xb6\xda\xcc\x1a\x09]Gh\
-\x1a\x97\xc6]; *(\xa2n\x22$\xc5G\xdc\xcd\
-\xcdL\x18MdH\xe2\xdb\xd1\xd9\x8d\xd8v\x87o\x93\
-s\xe3\xc8\xc6l\xdc%c\xb8Iiw\x9d\xc7\xf1U\
-\x1e\xd2%7\xe3\x15i\xdc\xb0\x1d\xbf\x84\x0c\xd8\xd1\xf7\
-}\x07\xaa\x1fy\xbc\x03\xd0\x9f\x0f\xe9A\xef@<\x87\
-\xae\x83n\x8e\xcc\x16\x84\xd5\x8a\xb8^J\x5c\x9d\x84\xb0\
-<\x0d\xed\xc9Y\xecN\xd7\xb1_\xad\xc2l\xd5k\xb7\
-\x0c\xc4\x85\xb8\xce\xd5u\xe6n}6o\x13\x84\x0c\x92\
-\x04\x92\xc0(0\x82\x1b\xb8\x09\xd9T\x06\x13\xb9\xcc.\
-\x97\x09\xae\x07\xf7\x9b\xd1|\x93\xdcw)\xe7\xdd\xe8\xb6\
-\xdb\x99]m\xc8\xaf7\x96_\x8f\x9a/M\xfc\xd2\x91\
-\xab\xe4q\xb3\x1d/\xc7W\xbeKO\xc7M~\xce8\
->\xe5z\x02\xd5\xb1\xd5z7~\xa0\xf1\x0e@e\xc8\
-\x1c\xf4\x1e\x84ShZ\x98\xcd\x91\x93%z\xb6D\xd6\
-\xa7\x22\xeb3\xe2\xf9Z\xbb\xf3\x93\xd0\xddZ\xb5\xdd\xc5\
-Y7\xbb8\xef\xe7\xebUhg\xad7\x9dg\xed\xc6\
-\x916\x8d\xde\x0d\xc9\xba\xc1s\x1c,\xeb\xd6]v \
-\x030P\x00d\x08\x86\x90E=\x09\xd9\xd0\xad#\xdb\
-\x8c\xec\xb2\xcbhN6\x09\xd9!!\xb2\xb3\xc0kW\
-\x9e!\xf2\x94 /\xdd\xfdr\xf4|\xb53\xbb\xbcL\
-7\x97\x97l\xaf.\xf3x\xb9\xc1/G\xfcJ\x9d\xed\
-(\xbb\xf1\xdb\xcd\xcb\xfc\xdf\xb94\xde\x01\xea\x07\x1b\xf1\
-\xa7\xfe\x02?\xf1P@[h\xce`v\x8e\x9c\xde&\
-\x5c\x9c\xa3\xb7N\x90\xdb\x0b\xe4\xeeR\xb8u\xa2rk\
-\xad\xe1\xfc\xacmW\xeb\xd9j\xbd\x9e-\xd6'\xfd|\
-\xb5\x08\xed,&\x09\xdbm\xd2\xeba\xd4\xdd\xd6\xb8\x1e\
-M\xafS\xd2\x1b\x8c\x8d\x19\x1b\x9c\xad\xc3\x0eeD0\
-\x02B@D1\x89$U\x10]\x22\xc1\xcb\xd7\x09.\
-\xa2 \x11\x155qRp\xdf\x08\xf9R\xe1\x95\x88o\
-\xdc}\xd7\x8a\xedf\xc1\xafV\xcd\xec\x99E\xf9\xd6\xa3\
-|\x9f\x95\xe7C\xb6\x97\xd7\xc3\xe6\xd5\xf7\xe3\xe5\xa5\xa8\
-^\x8d\xa6W\xdf\xb1\xb9\xbeb\xd8qp\xf9\xfe\x12\x90\
-\xe4\xad\xe3\x7fd\xbc\xfd>\xce\x7f2\xa0\xfeg\xb4@\
-\xd2UK\xb3\x84\xf9\x0aY\xceEON\x84['\xf0\
-\xf0\xc4\xc3{k\x97\xfbk\xb8X\x8a\x9c-\x83\xacW\
-M\x5c\x9f\xcff\xcb\xb3\xe5I{\xb28mW\xdd\xa2\
-m=\xc6\xbc\xcdzs\xb9\xe3\xc5\xd5N^\xed\x8cW\
-\xa3pe\xc85\xce5\xb0\x13%\x89\x924b\xda@\
-\xe8\xd0\xd0\x11\xb4E\xa5E4\xe2!\x82\x06D\xa6C\
-)\xbc\x9d\x82\x81\x80\x8be\x97\x9cM<e,\x99\xa5\
-\xd1\xdc\xb3\x89\xe4\xad(/\x09\xfa\x8c\xe8\xaf]\xfd\xda\
-\xb0\xeb\x8c\xbd\xdai~\xba\xf1\xf4\xf4F\x86o\xaf|\
-\xfb\xdd\x8d\xdd\xbc\xf8n\xf3\xf2\xf2\xbb\xab\xe7W\xdf\xf3\
-r\xfb-\xa4\xe9\xf7\x98\x81\xde\x094g3\xe9\xee\x9e\
-v\xfd\x9d\xe5\xac9\x9f\xcf\xc2z\xd6\xc7Y\xdb\x84\xbe\
-\x89\xd2\x84 \xe2\x08f\xa4\x94|\x1c\x92m6\xa3\xbd\
-\xbc\xdc\xa5/\xae\x86\xf4\xf4\xe6z\xf8~\xd8\xed\x9en\
-\xd8~]\x8c\xed\x7f\x0a\xab\xf7\x9f\x09@\xb2\x84x\x06\
-\xdd),W\x22gs\x91\xdb\x0b\xe7\xde\x1c\xb9\xbf\x10\
-\x1e\xcc\xe0\xfe\xcc\xe5\xee\xc2\xfd|\x05'\x0b\x0d\xb3\xd3\
-\xbe\xeb\xcf\x97\x8b\xee\xd6z\x1d\xcfO\xd6\xa1\x0f\xbd\x90\
-UwWI^\xbd\xd8\xf0\xfar\x94\xcb\x1d\x5c\x99r\
-\xe9\x81\x8d\x06\xd9\xaa\xb2\xd3\x88\xc5\xc65vH\xec\x91\
-\xd8\xa3\xed\x0cmfhl\x11m@\x03.\x01De\
-\x02\x10\x12(\xb0Q\xc4\x05A\x5c\x11\xd4\xc1=\xe3y\
-\xf4<\x0c\x9e\xd3\xce-\x0f\xe6i\x1cs\x1a\x07\xf34\
-\xba\x8fI\xc9)\xa8l4\xf0\x5c\x02OM\xd2\xb3Q\
-\xb7\xdf\x0d\xb2\xf9f\xebW_\xe4|\xf3t\xebW\xcf\
-_n_\xdd\x0c\xb6\xb1~\xae\xe1\xf6\xf9\xbc??\x9b\
-/\x17\xcbx~:\x8fg'}\xb3\x9a7\xcd\xbc\x0f\
-\xb1oBh\x9b\xa0\xaa\x10\x0a\x802y\xcc\x9eFK\
-\xbbm\xde]_\x0f\xd7\xcf\xb7vu9\xec^_\xe6\
-\xf4\xf2\xf5u\xfa\xfe\x9bWW/\xbfzus\xf3\xe5\
-\xd5v\xf3\x12\x86/\x0aX\xff&\xc1\xf4\x9f\xc1\x85\xd3\
-9\x84\x0b\xe8\xd6\xc8\xea\x04\xb98\x81\xfbK\xe7\xc1\x0c\
-\x1ev\xf0\xb0\xc1\x1f\xb6\xeew\xa2\xb3VX:\xcc\x5c\
-\xa4m\xa2\xc6\x93\xc5Bo\x9d\x9f\xebz\xbd\xd6\xd9l\
-!\xb2\x85\xedu\x92W\xaf\x07^\xbc\x1e\xb9\xde\xa9l\
-\xaca+-)\xb6\xd044mKh{\xb4\xeb\x88\
-M\x8f\xc6\x0e\x0b-\x1eZL\x1b\xb2\x06\x0c\x01\x14G\
-\xc5\x10\x1c\xc5]1\x07s\xc1\x1d0G\x1cQ\x17T\
-\x14D!D\x91Y\x8f\x0a\xae\xe2A\xcdc\x93Sg\
-y\xf4<n=\xa7\xad\xe7q\xc8y\x1c\xee\xe8n\xf7\
-X\xf1\xebE\x94\x97\x17M\xf3m\xdb\xcc\xbe\x0c\xbd|\
-?\xb6\xbc\x18n\x87\x1b\xed=/N\x9a\xb8>\xeb\x17\
-gg\xf3\xd3\xe5\xb2\xbdXtz\xde\xa9\xae\xa3\xca,\
-\xa0\xbd\x8aD\xc5\x153\xd9\x1f\xc9=\x8f\x96\xd3`\x9b\
-q\x97/w\xa3\xbf\xda\x8d\xe9\xf5\xf5\x90^\xbc\xba\x1a\
-\x9e~;\xef\xbf\xfev9|\xf7\xcdf\xf8\xee\xe9f\
-\xfb\xfc\xdf\xae/_\x7fq3n\xffP,\xd3\xdf\x14\
-\x90\xfe\x96\x01$g\x10oA?\x13Y.T/V\
-\xc6\xbd\x95\xeb\xa3\x05\xf6\xfe\x0c{\xdc8\x0f\x14\xee\xaa\
-p\x1e\x9d\xa5\xe2\x1d\x103\xa8\x89h\xdb\xb5\xb2Z-\
-e}\xb6f\xb9\x5cI\x13Z\x86\x9b\x91\xcd\xf5V.\
-\xafF6;e\xb0\x9e\xa43h{\x9a~F\xecg\
-H\xdf#m\x8b6\xadH\xd3\xb8k$I \xb9\x90\
-\x08\x92M0w\xb2\x19\xd9\x8c!\x1b);Cv\x86\
-\x9cI\xc9\xc8\xe6X6\xdcpq\x8a\x0d\x12\x10\x11B\
-\x10ib\xa4\x89\x91\xb6i\xa4\x09!4]\xef\xcd\xac\
-\xa7\xc5\x90\x94\x1a\xb6\xd7\x9d_\xbf\x5c\xc8v\xc8\xcd\xb0\
-\xbb\xdb\xe7\x9b\x07K\xdb}\xb4hm\xd3\x9f7\xdb\xee\
-\xce<-\xce{\x9f\x9ft\xa1[\xc6\xb6\x9f\x85\xbem\
-t\x16\xc5\xe7\xc1|\xa6H\x83{\x14w\xc5M0\x11\
-\xcf@FDqS\xb1,$W6\xde\xe4M\x1at\
-\xbb\x0b\xe1f+\xdd\xf3\xc7M\xf3\xcd\xab%_?\xbd\
-\xd9~\xf9\xd5\xe5\xd5\x1f\x1f7\xfa\xf5Wa\xf7\xf4\xfd\
-\xcb\xcb\xef\xff\x04\xbb\xdf\xc3\xc8\x9b\xf4\xfb/v\xfc\xad\
-\x02H\xd7\xd0>\x149\xb9%rg\x05\x0f[x\xdc\
-\xe1\xef\xf5\xd8\xa3\x1e\x7f\x10\xe1\x9e\xe0\xe7\x0eKs\xba\
-$\x12\xd5\xd1\x12\xbe\x03\x08\x1a\x82\xb4\xb3\x19\xb3\xe5R\
-\xba\xf9\x1cK\x90\xd2\x8e\xdd61\xeeD\xb2\xb7X\x98\
-A\xbf\xa4Y,\xe9\x16Kd6w\x9a\x16\x1a\x85\x10\
-\xc8*\x92\x00\x1c,C\xae`\xd9\x8d\xc66%6\xc3\
-(\xdb1\xb1\x1d3\xdb\x94\xd9\xe5L2\xf3l\x8eg\
-\xc3\xcdq\xc7p\x5c\xb0,b\xa2\x82\xaa\xaahP\x0d\
-Qib\xa0m\x1aY\xc4\x86e\xdb\xb0j\xa3\xac\xda\
-\xec\xcb(\xda\xcd5v\xa3\xb5}\xd8\xcd\xd7+\xbbu\
-v\xa7\xcd\xab\xf7f\xcc\xef\xcd\xe9Ozi\xba(\xda\
-\xa8h@D\x003\x95lJ\x89w\x04\xcb\xe2n`\
-\x0e)\x8bK\xe5\x10=\xbbF\x5c\x909\x9e\xcd\x83\xdb\
-,x\xb2\xc8&\xb5\xe1\xc3\x0b\xfc\xf9\x854\xcf\xee\xe9\
-\xec\xcb\x0f\x1a\xfd\xe3W\xed\xf6\xf7K\xcf\xff\xbc\x1cv\
-O\x97C~\xf1\x15l\xbe+\xa4\xc6/\xda\x1a\xfd\xad\
-\x01H\x16\x10\xef\xc2\xfc\x16r\xfb\x0cy\xbc\x12\xf9h\
-\xee\xfeqt\x7f/\xe2\xf7#v+\xc2Z`e\xd0\
-\x1bD\x07\xc1]\xb4(\x0c(\xde\x933\xa4\xcc\x90\x93\
-dU\xc2\xac\xc7\xb7\x09C\x18\x0d\xc9(\xc4\x19\xb1_\
-\x11V+\xe4\xe4\x04\x9d\xcf\xa1\xeb\xc4B \xab\x93U\
-\x00\xc7\xccH\xd9\xd8eg\x93\xe1fH\xdcl\x12W\
-\xdb\x81\xeb\xdd\xc8vL\xecrf\xccN\xf6\x1a}{\
-\x9dW\xee\xee8\x8e\xbb\x90\x5c=;n\x80+T\xa6\
-\x9bD\xc4\x98\x89s\x1a\x83\xd8,\xfaj\xd9r\xb6\x8e\
-\xdc\xbd@V\x8b \xfdr)\xcb\xf3\x10\x17\xb7f\xcc\
-n\xcf\x88\xcbV$Fp\x17\x90\xf2\x96\x80\x88;b\
-\xe0\x86\x9b\x8b\x98\x81\x19\x88S\x08\xf8b\x86\x14\x13\xd4\
-\x04\x1d\x15\x1c\x1c\x0f&-9\xf7M\xca\xcb(v\xd1\
-\x06\x1e\xaf\x9a\xf8\xf1E\xc7\xd3\x8b\xa5\xfe\xdb\x89\xe9\xe3\
-'\xc3\xf0O\xff|\xbd\xfd\xc3\xff\xb5\xb9\xfe6\xa4t\
-\xf9\x0dl\xf9\x05[\xa3\xbf\x19\x00\x9d\xd78\xe7\x14]\
-\x9fKxp\x8a\x7f\xdc\xc3\x93\xce\xed\xa3\xc6y\xac\xf8\
-}u_\x0b\xcc\x05Z\x87h5\xc9\xe9uz\x94\xe9\
-^\xc8\xe4-\xce\xeba'O_\xbdb\xfe\xfc9\xcd\
-lF\xdf\xce\x90Y+\xde6x\x17\x88aF\xbb:\
-\x81\x93\x13|\xb9\xc0\xfb\x16o\x22\xa6\x8a{\xc6\x001\
-\xc7\x13\xe4\xec\xecr\xe2j\x18y\xb5\x19\xb8\xbc\x19\xb9\
-\xde\x1a\xdb\xd1I\xee\x98\x95\xf8\xc7]\xf0\xe9\x9b\x08\xa0\
-.\x22\xe6\x90E<\x041\x5c\x11Q\xcfD\x8c\x96D\
-'\x033\x1dYif\xdd8\xb7{\xe5\xd1I\xcb\xfd\
-\xdb\x1dw\xeeu\x9c\xden\xe9\xce\x17\xd2,\x02\xda\x07\
-$\x16u\x9e\x8fY\xdc\xbc\xcc\x7f+\xdf\x15\x07)h\
-\x12q\x03\xf7r\xd4\xc7\xb0JpH\xfd\xa1b\xc4)\
-\xbf\x9eH\x16\x91\x1c\xf0\xa41\x8f\x8df\xe6\xad\xe8\xaa\
-G\xcf\x97\x12o_\xf4\xb3;\xef\x85\xe6\xc1\x03i\xee\
-\xdd\xd7\xe6_?\xdcm\xbf\xf8o\xdb\xab\xef\xbe\x86\xab\
-?\x1e\x98\xbb_\xd4\xf8[\x00\x90\xdc\x81\xe6\x03ty\
-[\xf4\xd6R\xf4\xfd\x95\xf3\xa4\x17\xf98\xb8\x7f$.\
-\x8f\xc4\xfd6p\x02t\x14\xe0\xa8\x17\xa1\xa7\x94\xf5\xb4\
-\x00\x08\x0et\x91\xba\xa39\xc1\xcb\x97\x8c ;3\xee\
-\xdd\xbe\x876\x81x:\xa7\xc5I:GWsX\xce\
-\xc8\xf3\x0e\xeb\x1a<*\x88\xa0\x19\x82;\x96\xca<\xc3\
-\xaa\xeb6\x187\xbb\xcc\xd5\x90\xd8\x8c\xc6h\xe0(H\
-\xc0U\x01E\x8a3\x85\x16\xe2\x18\x15\x93@\xf6`I\
-\x9a\x9c\xa4\xb1\x91\xd6\x92\xf4$Va`\x15w\xac{\
-\xe3|&rk\xd9rq\xab\xe7\xf6\xbd\x19\xa7\xb7;\
-\xe6g\x81f\x19\xd0^@\x5cH\x19v\x19\xcbP\x8c\
-Y5y\x15 *\x85H\x07G\xc4q\xa9>\xd6\x04\
-\xa4\x09`\xe6B\x01\xbc\xa3\x81\x92\xde\x12\x88\x826\x82\
-t\x12\xdcs\x88\x89\x18\x07o;\xc9\xfd\xccm1w\
-_\x9d\xc6x\xebV?{pO\xe3\xef\xd7\x22\x7f\xf8\
-\xa7\xdd\xf6\xcb\x85\x8d\xdf\x7f\x0b7\xcf\x0f\xa7\xe0\x171\
-~\xd1\x00Z\x80\xde\x85\xfe\x9e\xe8\xd9}\x8d\xf7/\xd0\
-\x8f\xe6.\xbf\xea\xc4>\x0a\xee\x8f\xc4y\xe8\xc8\xad\x0c\
-s\x87\xc6\x90`\x85\x04:\x06\x0f\x19HGVh\xca\
-6f3\xc6a\xc7\xf0\xfc9\xd7\xbb\x81\xe7\xaf\xaf\xb9\
-sz\x87\xd8/\xe8\xb5#1\x83Y\x87\xcfZ\xb4k\
-Hm$\x07Ap\x82\x06\xa8\xf1\x8eP\xe6\xae\x9b\x93\
-\x921\xa6\xcc\x983\xc9\x8d\x8c\x94\xd9\xa2\x8a\xa8\xa2!\
-\xa2\x12\x09@\x14%\x88H#F\xebY\xdb\xbcc!\
-\xc6\xdc2\x0bF\x96a\xe4l\x96X/\x9c\xf3\x93 \
-\xe7\xeb\x8e\xb3\xf3\xb9,\xce\xe6\xf4\xa7-\xcd\x5c\xd1\xc6\
-a4|\x97\xc02\x9e\xbd\x92\x01\x93\xe5\xf1\x9a\xcb\x10\
-D\x04Q\xd9'7\x5c\xd9\xa7U\x1d\x8e\x96\x19\xca\xb7\
-.|\x9a`Z\x00(\xe0*H#E\x86\x9e\x05i\
-\x11\x19]t4\xd5!EI\xd6\x05\xf7u+\xdc\x99\
-\xc7\xe6\xfe\xbc_\xdd>%\xfe\xf7\x8b\xbc\xfb\xb7?\x0c\
-\xc3\xd7\x7f\x22\xbd\xfeS!\x19~\x11 \xfa\xc5\x02\xe8\
-\x02\xc2m\x98\xdd\x15\xbds_\x9a\x8f.<<Y\xc1\
-\xa7\xad\xfb\x93\x00\x0f\x04\xce\x04]g\x98'\x08\x86K\
-\xc6\xc50\x0c'\x81$\x8c\x91=\x80\xc8\xf5\xbd\x07\xca\
-\x19\x1cqF3v\xc3\x8e\xcba\xe4\xe5\xcd\x86\x17\xaf\
-\xafY/oq\xb2\xb8\xc3l~B\xe8\x15k\x03\xd6\
-\x06B\x13\xc9\x0a\xd9\x9d\x1c2#BR)\xee\x8e\x1b\
-\x9e3n\x09\xf7\x8cx!\xaf\xc5\xbcxEL\x0c\x86\
-\xd2\x86@\x8f\xd2!\xd2\xe1>\xc3d\x96\x133\xddq\
-\xc25'\xf1\x9au\xbb\xe3l\x99\xb98oX\x9fu\
-\xb2\x5cG\xe6'\x0d\xed\xa2\x93\xd0FD\x0c\xdf$\xec\
-2A2\xc8\x86[.\xd4\xf8q\xfa\xaf2{\xa2\x02\
-\xaa\xa0R\x0e(\x97B\xf9\xfe\xd5\x1a\x89\xd4\xbfg\xf2\
-2]\xaa\x05S0\xc1EpE\x88 \xad\x14\x10e\
-P#X6\x0df\xb1\xcd\xe3l\xe5v\x1a].z\
-\x8d\xe7\xab~q\xb6\xce\xcd\xc9\x8a\x9b~6l\xff\xfd\
-\x92\xf4\xe2\xe5/\xc4\x12\xfd\x22\x01t\x06\xe1\x1e,\xde\
-\x93p\xef\xae\xb4\x9f]\x10>_\xba?i\xdd>\x16\
-\xfc\x91#g\x22\xa1\xab\x9c@t\x5cJ nx\x99\
-Zd\x8cTC\xe2\x843R\xce\x98Q\xe6\xc6\x0e\xd8\
-9\xecp\xb6@\x8f\xb1\xddn\xb8\x1a\xbe\xe1\xe4\xf5\x15\
-g\xab\x1b\xceNw,\x96[f'w\xe8\xba3\xba\
-\x10p-t\xf5\xc6\x05B&\x07\x08Z\x82r1C\
-\xcdi\xdci\xbd\x90\x0bjB\xc20\xcfD\x19\xe9\x02\
-,\xd5X\x22,,3\xb3Q\x96\xbe\xf5\x13\xd9\xc8\xaa\
-\xd9q\xde\x8f\x9c/2g'\xca\xc9i\xc3j\xdd\xd0\
--\x03\xb1\x13\x91`\x98\x0d\xd8\xe5\x0e\x86\x8c\x8f\x19F\
-\x03\x93\x9a\x94\xd5\x0a\x80jeT\xf0*z(*\x22\
-\xc3C\x05\xd2\x04\x94\xe2\xd7\xedo\xefc\x9fiL>\
-^\x96}\x8cT\x5c\xd2\xf2<i\x042Bv\x97\xe4\
-\x22&Q\xb3\xcc\x9bqhC\xca\xf3\xd6l\xd5\x8a\xac\
-\xbb\xa6=;\x11NV\x22\xdd\x8b\xdd\xe5?\xff\x1e\x9e\
-\xbf\xfa\x05\x80\xe8\x17\x05\xa0\xbb \x17\xd0\xdc\x22\xacn\
-K|xK\xf5\xf3\xb5\x87\xbf?u\xf9\xa4u\x1e\x83\
-\xdc7\xe4\xdc\x90\x0eTm\xbfv\x16\xabc\x88d\x8c\
-\x8c\x1f\xdc4\xa8\x16\xc9\x19\x8f\xee\x17\x8a%\x1a(`\
-\x9a!\xec\x80\xc12\xc3\xf6\x9a\xab\xdd\x97<{\xf9\x92\
-\x93\xf97\xac\xcf\xees\xb2\xbe\xcd\xe2\xe4\x9c\xd9|I\
-l\x17\xb4\xb1#\xa0\x84\x10 d\x86 l\x15v\x92\
-\xc96\x22yG\x93\x13\xa9\x92\x06\x9a\x85\x16e\xe1\xc2\
-I\x12N\x15N$\xb3\x94\xcci3p6\x1b8]\
-\xc1z\x1d89\xed\x98/\x95\xa6\x15D\x1c\xc6,\xbe\
-M\xa4\x94\xc8cFRF\xb2\xa1\x93\x9b%\x01$\x22\
-L\x96\xc6!H\x99\xe0\xb5\xe2\xcf\xb5\x848\xe2\xb2\xb7\
-<\xe5(\x16F\xfe\xac\x22\xaa\xdc\xf4\xe9\xbf\xbdpG\
-\xc0\xb4X\xb9\xe9y! \xb1A[!\x98\x16>$\
-iC\x1a\x96\x9aSsj6\xd3 '\x0bm\xce\x96\
--KQm\xeel\xae\xfe\xf9\x0f\xe4\x17\xffTX\xba\
-\xc99\xf8\xd9\x8d_\x0c\x80\xee\x81>\x84\xd9C\xc2\xf9\
-m\x9a\xf7\xce$|\xbep\xfd/\x9d\xf3\xa4s\xb9\x1f\
-\x91s\xd0\x95A\x9f\x11M.r\xb06\x07\xab\x93\x11\
-2V\x09Ya\xba\xbf\x80\xc9I\x1cDb\x93+7\
-\xdd7\x22{\xd7.\xf9\x88\xa5K\xecj\xc7v\xfb\x9a\
-\x97\xcf\xbe`1?\xe5tu\xce\xf2\xe4\x9c8?!\
-4=\x9d\x04<9\x9e\x06\x82o\xe9\xd8\xb0\x92\x0d\x1b\
-\xd91\x84\x84\x95\xf5\x9aV\x84\xb9\x08\x0b\x81\x135N\
-\x1b8ia\xd5)\xab\x99\xc8b\xa6\xf43\xa7\x99e\
-\x22\x19\xdd@\xbe\xf1be\xcc\xf0\x94\xb1\xcapO^\
-\x98\xe8\xc15s\x01W\x87\xe0\xc5\x02U=@q\xc1\
-\x0e\xa8\xd8\x97\xd0\x16\xb2\xad.AGq\xd1>\x0e:\
-0\x85{\xe0\xed\xdf\x93j\xf5|o\x89<\x22\xd2\x08\
-j \xc9a\x04K\x047\xe9\xbb\x94.H\xd6G\x98\
-w\xda\xcc\x9a.\xf63\xa7_\x0d\xdb\xdf\xcfl\xf7\xed\
-\xb7p\xf5\xf5\xcf\x14D\xbf\x08\x00\xcd \x9c\xc1\xfc\xa1\
-\xe8\xbdG\xd2||\xee\xf1\xf3\x95\xebo;\xe7\xef@\
-\xee+\xb2\x12\xb4\x17$J\x915W\xe7\xc3\xa5X\x1e\
-*x\x0aHJ*\xd0\xea\xc2Y\x1e/\xb1\x91b\xf5\
-ye\x9aH}L0\xb4\x82O\x0aa%\x0e$\xc8\
-\x19\xcf#6n\xb0\xe1\x9a|\xfd\x92\xed\xf3o\xe8\xda\
-\x9e&\xb6\x84\xd8\x22\xa1\xa5w%$g\x953I\x13\
-\xb9\xcb\xb8\x95O\x8f\x08\xbd\x083U\xe6\x11\xe6\xd1\x98\
-\xb5\xd07F\x1b\x9d(B\x18!Z)z(\xeeg\
-\xc9\x0c\x95H\xbf\xccq\xf5\xeaf\xa9@\xd0BL\x84\
-P\xdc\xb2 {Gvb\xc8\xcb\x8fT&\xbeL\x16\
-D\xcb/7\xe1\xc3\xe5(\x0e\x9a>\x88\xfa\x1c\x04\xc4\
-+x\xfc\x10\x0fA\xa5\xbe\xcb\xa7\xb8j\x01e\x045\
-\x87\xd6\xc4;\x87\xec\x88\x11\x82\xb9\xb6\xa3\xc7\xe0\x1e\xa3\
-H\x1b\x826\xb1]\x86\xdeC;\x1bU\xfe\x1f\xdb|\
-\xf55\x5c\xf13t\xe7~\xf6\x00:\x85x\xa1:\xbf\
-/z\xef\x81\x87\xbf\xbb+\xf1\xb7\x0b\xd7\xdf\xf4\xc8\x93\
-\x88>td\x05\xa1q\x82:*\xc5\xcbwq\xac\x82\
-fr\xd9\xb4\xc6<\x93CW\x5c'\xab\xd6\xe7\x18D\
-^A\xe5U\xa3\x06\x8a\x10\xf6\xb7\xcb$,\xcb\xed\xf4\
-:\xf7\xb1\xac\xaci o.\x19EiTi\xb4\xa1\
-\x09\x0dQ#\x0dJ\x8f\x10\xbc\xb0\xbeS(\x11\x81\x16\
-\xa1u\xa1\xc9B\x0b4\xee\xe8X\x12\x98\x09H^j\
-\x89T\xbd\x06\xfd\x8aj\x80\x18\x90\xca\xe0\x11\x8a\x5cN\
-\xaa\x96\xce\xa3\x949\xac\x14\xa0@\x9d\xe8\x85\x82\x14\xa7\
-\xfe\x1d\xec-\xc5\xa1 A\x0e\xf7\x1fs\x0e\xfb\xebS\
-\xd6\xac\x8e\x0a\xa2\x03\x80x\xc3\xb5s)\xa0\x96\x18J\
-\xc5U+\x90D4\x09\xa1\x9c\x18\xd1q\x5c*\x1e\x14\
-\x09*Q\xa5\x99\xab\x229\xa54\xbc\xc8\xe3\xf0/\xc5\
-\x9b\xfeY\x8d\x9f5\x80f\x10N\xd1\xf9#\x9a\xfb\xef\
-I\xf3w\xf7\xd0\x7f\x5c9\xbfi\x91O\xa2\xcb\xfdH\
-X9!\xba\x045\x0f\x93\xc8\xa4Z\x9d\xbc\x8fq\xf2\
-\xdeM\x93\x92\xd3\xaf'\x7f\xcf\xc2\xc2\x11`l\xff\x9c\
-r\x04\x9cH&\x22(\x8a2R\xce\xa4\xb8U\x8bU\
-\xad\x9b\x1b\x99T\xefq\xda\xac$vd\x94(J,\
-I\x1d\xa4T\x04!\xa2LL\xb1!\x8c\x0e&\xc5\xca\
-\x0dT\xab\xa2\x82\x16\xb3BP\x08!\x10\xa3\x12\x82\x16\
-\xba\xd8\xa5&4\xa7\xef\xef\x84=V\x0e\xba\xcdB;\
-\xcb!\x016=\x22\xc5R\xf8\x1b\xe0)\xf7{\x0d\x06\
-\xe5\x08@o\x8e7\x0d\x82W\xc0\xec\xbd\xbc7\x0a\x1a\
-\xca\xdf\xe0\x0a\x12\x0a\xd5\xad\xad\x962\xdd\xe4H6R\
-\xca\xc1\xcdfm\xb2\xbb'Jx\x14\xa2\xe7v6l\
-\xc5n\xbe\xca/\xae\xff\x05\xbe\xe7g\xe6\xca\x85\xff\xff\
-\xa7\xfc4\xe3\x1c\xc2{\xe8\xe2ci\x1e|\xa2\xdd\xaf\
-\xdf\xf7\xf6w\x17\x1e\x7f\xdb\xa2\x1fG\xe4^ \x9eD\
-\x9aF$\xa8\x13\xc5\x09\x95$\x90\x1a\xafL\xc4\x80T\
-b`\x8ayt\x7f\xbd\xdc>\xbe\xae\xd5]\x0bL>\
-G\x09\xed[\x94\xae\x10\xcb\xf4(=\xca\x0c\xa5\xc7i\
-q\x1a\x9c\x88\x11\xea{\x1c\xf2K{\xf1K\x15\xb4e\
-w\xb2[\xc9\x01\xd9AP\x9a\xb2a\xe6\xe4\xc28\xd7\
-C1W\xccC\xb5|\xb5\xdc\xc1\xab\xa9\xa9\xd6\xd1\x9d\
-r\xbb\xa2\xb1\xe4r\xaaU\xd2\x02\xd4\xc3u9b\xe2\
-\xa4\x9a\xac\xe9:\x15\xb5\xc7f\xe7\x88\xf4>\x02\x98\x1c\
-\x83mR*\x14)E\x89}\x9c\x83z\x01)V\xcf\
-|\x1f+\xf9\x94\x5c\x9a\x92\xb8\xe6\xb8;n.\xee\x1e\
-\x05\xef\x1a\xb4k5J\x0cq@\xf5\xeau\xda^\x02\
-\xe9\xfag\xa4X\xf8Y\x02\xe86\x84G\xc4\xc5G\xd2\
-\xdd\xff0t\xbf~O\xda\xdf\xdd\xb1\xf0\x0f\x0b\xd7\x8f\
-\x1b\xc2\x9d@\x5c\xa9\xc4F%*D1T\x0c\xdd\x83\
-\xa7\x00\x88}\x8e\xc7\xf6\xee\x9b\xd4K\xad\xcf\x13\xd2\xfe\
-1%\xd7IjD\x9c\x08\x154\x81\xae\x82\xa6GY\
-\xa0\xcc\xeb\xb1@\x98\x033\xa0\xdb\x83\xc9h*\x98\x1a\
-2\x01#\xec?;\x1d}\x87}i7Z\x9f?}\
-v\x83K\x83I\x83\xd3\x146^\x1aD\x22H\xac`\
-\xaa\x16r?G\xe5@\x1aH\xe9\x00Tk\x1e\x8a\x8b\
-'\x135\xadG\xb7\xb5R\xd6{\xb6\xe0\x00\xb8\xfa\xfe\
-2Y\x8f\xbd\x0b\xc8Q\xcc\xe4oZ\xad\xe3Xj\x0f\
-\x8ej\xf1&\xc9\xd0\xf4\x12\x97\x09o\x13\x80\x8ar\xa8\
-\xd6rDw\x0d\xeemt\x9aV\x03mhv\xa3q\
-5\x9am\x12\x96\xae~& \xfa9\xbap\xba\xa6\xe9\
-?\xd2\xee\xce\xfb\xda~zW\xe2\xdf\x9f\x19\xbf\x99;\
-\x1f7\xe8m',2\xa1\xcd\x04\x85\xca\xb49\x95M\
-\x9b\x92\xa2\xd3\xf5)\xf8\x9f\xdc\xb8\xc3sr\x8d\x87\xca\
-u\xab\x8e\xdb\xc1\x95+QJ\xacG[\x0e)\x16\xa8\
-\xdc\x8e\xe0My\x8d\x18\x99\x91\xc4\x800\xe2>\xe2\x8c\
-\xd5\x95+N^\xaeP\x8a@s\xf4\xfd\x1a(t\xb7\
-(\x09%z$K\xc0$\x12\xa4\x80\xcc\xa5\x9a\x96\xaa\
-\x1c8\xb8\x99\xc5\xc1t\x91\xb2\xba[\x09\xe2\xbd\x1a\x96\
-\x89e\xdb\xeb\xeb\xfc`UJ\x5c7\x91\x10\x93\xfe\xee\
-\xc0\xa0A\xf9u\xa9\x8f\xee\x87\xbfuyt]\xa6\x1f\
-p\xba\xcf\xabH\xd5\xa6\xeb\x8eY%e\x84\x1a\x13E\
-\x88\x867\x0e\xa3\x8bD\xf7`\x22\x9aS\xc0\xf2\xac\xc3\
-\xee\xae\xb3\xfc\xea\xfd\xd0\xbe\xfa]{\xfajc\xb6\xbb\
-\xb21}\x037\xfc\x0c@\xf4\xb3\x02\xd0-\x905\xb4\
-\x1fI<\xff@f\x1f=\x90\xf0\x9b\x95\xcb\xe7\x9d\xfb\
-G\x0aw\x1b\xc2\xdci\x1a\x08\xea\xaej\xf5\xd4N\xcc\
-\xd9d}\x8e-\xcd\x01$\x13E\xed\xf59~\xf4\x1a\
-\xdd\xbb[e.\x14\xd2\x00\x1aJH\xdf\x22t\x158\
-}\xbd^t\x02*\xb1\xbaC\x19\xa4\x82\xc7G\x92\xef\
-P\xaf\xf6\xc6G`\xc0\xa4\xa6j\x8b\x9a\xba\x92\x15B\
-\x10%\xa2\x04\x14\x93\x80KD\xb4\xa9\x0cX\x89\x99J\
-.\xb3\xf2\x86\x9eq+t\x88K\x11\xf7\xe5:Q\xbd\
-0\xd5\xd5U*\x00)\x96J\xaa36\xdd\xff&\xa0\
-\xe4\xd8\xc2L`\x9a\xfe;\x02\xcb\xde=\xe3\xc0?\x94\
-\x1b\x13\xc0y\xc3\xb5s\xe3\xe8\xf3\xb4\xb8i^I\x1a\
-\x114\x08\xc4\x80\xc7\x887\x06\xc9E\x12Nv\x5c,\
-\x80/\x1b\xfc\xc1\x1a\xf9\xec\xe38{\xf1]\xbb{y\
-9\xe6\xab\x97y3|Q2\x0d?\xe9\xf89\x01H\
-\x16\x10\xdf#.?\xd0\xee\xf1cm\x7f\xbdv~\x1d\
-\x8d\x8fq\xee\x82.\x85\x18\x84\xa8R\xacO=O^\
-\xdd\xa07\x01\x91\xf6\x80\x91\xa3\xeb\xd3\xed\x09d\x87\xfb\
-m\xcf\xcaMtT\xe1\xc6\xca\xd1\xe1t\xb8\xb7\x88\xf4\
-\x04\xe9\x09\xf4\xa8\xceQZB\x88%\xc0\x17#xF\
-},4\x80\x95\xc3l\x8b\xf9\x0e\xd8\x1e9\x93\xb9~\
-{\xa9VO\xf1\xda\x13A%\x925\x22*\x98(\x13\
-\xdd\x9e\xc5@\x12o\xd0b\x13\xf35\xc5\x11\xb9zd\
-{y\xc11XJ\xd5\xeb\x1eH\xc7\xefs\xf4vp\
-\x80\x90\xfc\xd9\x835v\xa1\xc43\xf5j!,\x1c\xdc\
-\xe4\x08@\xe5vyL\xc1\xadXC\x9f\xce\x5c5!\
-\x1a\xf0\xe0Xt,RB\xcf\xec\x989Irc\xce\
-i\x9b\xed\xfd;!\xbe\xfe\xb4]={I~\xf1M\
-\xde\x5c\x7fq\x10\x8f\xfcd\xe3g\x03\xa0\x0fA?\xa1\
-[<\xd1\xe5\xc3\xf7\xc2\xec7\x17\x1e~;3\x7f\x82\
-s\xdf\xd0\x95\x10c)\xcb?N\x93\x17\x22y\xca\xd5\
-\x14\x10\x1d_N\x16G\x8e\x80sl\xa1|\x0f\x1e\xab\
-q\xc5A\xd7\xd2\xd4\xa3;:\xdaz\xd9#:Gu\
-\x86hG\x88\x1d1\x04\xa2H\x8d\x9e2\xca\x88\xe6\xa2\
-8\x90\xbc\xc5\xed\x06\xb7\x0d\xe6C9H\xe4I\x07\xb1\
-_\xf5\x0b5\x1dTKI\x84\x1e\x05\xf85\x980&\
-\xe2\xacFAn\x87\xd8\xa3$\xa80/b\x03\xa7\xc6\
-:o\x00\xe6\xe0\xae\xed\x87\xfb\xde\xd2\xc9\x11s\xb7w\
-\x1b\xdfr\xe1\xde \x15`\xff\xfd'\xc1\xf6\x9eX\xf0\
-\xe3\xfb\x0e\x9f)\xee`\x86\x9821\x819(9\x06\
-\xac1\xc8\x11\xcdN\xce.\xee*x\xee\x83\xfb\xad%\
-\xf6\xc9\x83\xa6\xf9\xfe\xe3v\xf6\xcdw\xbe|\xfe\xef\xbb\
-\xab\xcd\xb7?1\xb5\xfd\xb3\x00\xd0\x07\x10~\xa5\xfd\xfc\
-Wau\xff}\x9d\xff\xe6\x96\xeb\xff67\xff\xac1\
-y(\xe8\xa9\x13\x1a+\xe9D)\xaa\x92\x92\x9d\x99\x96\
-\x9f\x83$\x07\xfe<\xce\x91\xa3\x98\x88=\xb0\xf2\xdem\
-\x9b\xe2\x9eI\x14V\xe2\x9f\xb2\x0cN *,[a\
-\xdbZ\xbc\x82I\xb4\xa34\x0d\xe9\xd0\xd8\x16\x8aY \
-\xe2\xc5\x81\xcc\x89\x90\x07B\xda\xa2y\x8e\xe6\x0d\x927\
-\x88\xec\xc0v\xc0P!\x5c\xf3IRA\x5cA\xe3\x22\
-LB\x01\x97\x02\xf2P\xea\xa9\xf7\xa4\xc0$\x000\x04\
-=\x06\xca\x91\xf6\xe6/Z\x9c#u\xc1a\xf8[7\
-}oa\xfe|L\x99\xd6\xbf\xf0\x90S-M}\x8f\
-=\xf3\xa6\xd5\x83\xad\xe0\xf1\x12\xb0\x15\xeb[2@\xd6\
-\x84\x12\xe7\xe5\x82\xc4\x90E\xc4%\xe0\xbe\x08\xee\xf7O\
-\x9dO\x1f\x87\xfe\x8f\xcf\xba\xe5\xd7\xff\xf7n\xf7\xf2[\
-\xc6\x9f\xb4<\xfc\xe7\x00 \xb9\xdd.\xba\x8f\xc3\xf2\xce\
-G\xcc>\xbb\xe3\xf1w\xb3d\x9f\x87,\x8f\x03z\xaa\
-h\xeb\xc4\x90\x08d\x82\xbc\xdd-\xe9\x90\x10=\x06\xc9\
-1P\x0e\xb7\x8d\x03\xa8&\x0a\xfb\xf0\xcb+\xbe\xb7>\
-\x93\x1fQ.\xfd\x88\xd6\xc6\x1b\x90\x08\x1a!D$4\
-Hh\xd0\xd8\x94R\x04UT*\x87\x95G$\x15\xf6\
-L5\x10$\xa0\x12\x90\x1cQ\x09\xa8)\x22\xc3\xc4\xa7\
-\x15\xa7t\x8a{*\x06J-\xaa\xd7\xef9\x91\xe4\x87\
-\x12\x84c{q\x00\xcf\x9bV\xc7+\xe361k\xe5\
-9\x1c\x004Y\x8c\xb7\x02\x9eI\xf2\xe3G@)q\
-\xd11\x19q\xfc\x1e\x07\x0b\xe45\x1e\xf27\xac\xd0D\
-wOn\xde$\xc0+\xee\xab\x89\xe3\xeaXp,Z\
-m\xeb%\x04W\xc1-dX\xf4\xf0\xf0\x82\xf0\xe9#\
-\x9d\xfd\xe9\xb3n\xf5\xf4\xcb\xdd\xf3\x9bgE/\xf7\x17\
-a\xfeC\x8f\x9f\x1c@\x9f\xb2\x88\x1f\x86\x93\xb3\xf7\xbb\
-\xc5\xc7w\x92\xfe\xc3\xc9\xe0\xbfQ\x93\xf7@\xd7J\xe8\
-\x84\xa0N\x10\xadR\x1aG1&5\xc11\x80\xa6\x84\
-\xa8\xbf\x01\xa0)\xee9\x00\xe6\xcd\x83\xa3\xf7\xd8\x03\xa8\
-\xe6Z&\xe0\xc8\xfe8\xe4^L\xea{\xecs(S\
-\xee%\x16\x09\x0d~P3c\xe0\x194#\x96Q\xa9\
-\x87\x1eg\x8bl?\xf7\xa7\xd7\x95f\x22\x95pp\xe7\
-8\xbb\x84dTJi\xe0\x94\xbe\x99\xae\x88\x1c\xa8l\
-\xa3\xf2m\xd5nKUV\x97\xe8\xeb\xc8\xad:&\x0e\
-\xa6ko1n\x82\x1c\xb0\x03\x07\x0a}\x02\xcc\xb1\xbb\
-\xe6\x07p\xef\xad\x989\xee\x86Od\x02\x93\x22\xe4\xe0\
-F\x9b\x84\xca\xd0\x01QqW\x91\x90\xbdD\x80\xd6\x04\
-\x93\xb3\xa5\xf0\xfe\xdd\xd0?\xf9\xa4\xf7\xaf\xfe\xeb\xee\xf9\
-\xcbg\x07\xc9\xe2\x8f>~R\x00\x9d\x82>\xe9\xbb\xf9\
-\xa7\xfd\xfc\xe1\xbd8\xfb\xfc$\xdb\xaf\xdb<~`\x1e\
-\xce\xa4\x80'\xd4\xb8g\x7f\x82\x0fI\xca\x09Ho%\
-,\xeb\x1a}\x0c\xa67A\xa3o\xdc\xde\xaf\xc8\xc7\xab\
-\xf7^\xe3_@S\xfe\xc9\xde\x19b_\x1ca\x98{\
-9\xcc11L\x0c\x95i\xd5\xb6:a\x8cc\xea\x19\
-\xb7}=P\x19e\x9a\x1d\xc2~\xab\xae\xcf4\xc9\x8a\
-\xbe\x02?\x06\x90\xe1z\x88\xdc&\x97\xcc\xa5P\xc4\xaa\
-\xe0{Ui=\xb4Z#\xad\xd6\x85\x03`\x8e\x1d\xbe\
-\xe3Q\xf4\xa0\xc7\xf7\xbde\x95\xa6\x0b;\x06\x0f{`\
-\x1c\x15\xb2V\xa0i\xfdM\x1c\xab\xcf7/\x1e\x84I\
-e\xe7T\x8b~\xcfC)\x02$\x8bK\x22\xe7\xac\xe2\
-\xccZ\x97{'\xaa\x1f\xde\x0b\xf2\xc7\x07q\xfe\xf5w\
-\xe9\xe6\xf2\xf9O\xd4\xa0\xe4\xa7\x04\x90\xdc\x81\xe6\xa3\xd9\
-\xfc\xd6g\xcb\xb3\xcf\xcew|\xde\xd9\xf0\xa1[\xbeP\
-B\xa7\x04\x15\xa6\xfei\xc7\xbe\xc6\xb4\xa6\xfb\x11%=\
-i\xdc\xe4p\xe28\x96\xe3\xb0\xb7R%s2\x81h\
-\xffU\x98\xa6\xae\xf8\xe4\xee(\xc1\x85c\xce\xaa\xb6\xaa\
-)\x9f\xee\xa5@\xcdm\xc4r\x99\xb4\x86\x91<\xe1\xb9\
-|s\xf2\x08yW\x89\x84rh\xde\xe2\xb6\xc5}\x87\
-\xfb@I\xe5:*\xf5\x80\xda\x93\xa0\xd0\xdd\xe5\xafH\
-\x88\xe6\xc3\xfd\x13\x80\xa6\xaf\xafR\xe41%\xaf\x5c\x84\
-\xa3*E\x1b\x17d\xdf\xe8\x14\xf5\x9a9\x93=\x80\xa6\
-\xbf\xfe\x8d\xe1\xc7\x0f\x1c\xc79o\x01iz`\xbf\x0e\
-LVK\x0e\xb7\xf7\xef9\xe9\x0b\x0f\x1e\xa3\xf9\x94\x0c\
-\x9e\x1e\xabVS&W6\x17Q,\xd5\x1b\xf0,\x90\
-\x1bu\xd6\xbd\xeb\xe3[\xa1\xfd\xf0\xc9\xfc\xec\xdf\xbfx\
-=<}N\x9ar\xe7?\xea\xf8\xc9\x00\xf4!m\xf8\
-\xdfW\xe7\xeb\xcf\x16\xb7\x9f<\x8e\xab\xdf67\xdb'\
-yLw\x12\xcd\xdc\x89U\x01\xa6\xd3OY\x7f\xf8\x89\
-q+\x96e\xdc\x03\x88\xca\xa2\x1dGG\xbc\x01\x9c\xe9\
-\x04Y=&\xcbsX\xb2\x0ah\x0eJ\xb5\xb8\xb7<\
-\xbaw\xde\x0a9\x80'\xb0\xa1\x9c\xec\xec\x98\x97\x1a\x9f\
-\x1c\xc2\xfe\x93\xc5\x0d\xb3\x11\xb5\x1dn;<\x0f\x054\
-\xb6\xc3m\x0b> ^\xba\xe9D)\xf3\xbe$U\x8d\
-`o\xea\x22\x84\xb2{\xd0!S\xe9\xd5X\x16\xd0h\
-,\xd5\xb0\xdaDB\x13\xd0&\x10\xa2\xa2\xe1\xe8P\xdd\
-+\x15\x8e\x01\xb4/\xae\xdb\x8f\xe3\xf8\x12\xfe\x1c4o\
-[\x14\xe7\xf8\x87w?\x06\xcf\x14\xffx\xb12>y\
-r\xd3\xc2V\x08\x86\xe2ET\x8fB\xa8\x00\x9a\xd4\xe4\
-\xd3\xa2\x11\xca\xef\xeeA\x05\x9bw\x99\xbbgA>\xfc\
-h\xb6\xfe\xd7\xffz\xf5\xfc\xdf\xce,]\xbd\xf8\x09\x0a\
-\xf0~\x12\x00}\xca,|\xd2-\x96\xbf9\xb9\xf3\xf8\
-\xc9\xe2\xe2\xefOn\xfc3\x1b\xe5\xbd1\xc73!6\
-&\xaa^\xeby\x0e\xaf:(\x9f\xdf\xeae\xf0\x96\xdb\
-&\xc7Q\xc5\x91\x15\x9a,\xd0\x01<P\xc4\x9cE3\
-Y\x96i\x11\xa9)\xcdP\x22/\x97\xba\xfe\x15\xf8\x05\
-\x19Qw\xc4& \xed@#.\x81\x5c=%s\xc7\
-=\x81\x8d\x88\xef\x086\x12|$\xf8@` 2\x12\
-Itj\xb4\x22\x95_\xf4rx&x\x22X\xde\x7f\
-\xa6Jq\xe1D\xfd\xa0w\x0b\x8a6J\xec\x22\xb1i\
-\x08]C\xe8\x0a\x80BS\xc4\xa6\x07\x00\x09\x12\xde\xaa\
-F=\xbe\xceDXL\xf4\x84\xff\x05\xb3T\xcf\xc2\x11\
-h&\xb0\xec\x09\x83Iq\xc0D\x1e\xc8\x91L\xae\xb4\
-\xecr?z\xcc\x04\xabI`\xf3\x83K\xee\xeaE\xee\
-\xb7w\x9a'%\x85\x8b\x15J\xb2\x8d\xeeg'&\x0f\
-\xef\xb5\xfd\xa3{M\x7f\xb6\xd9\xa5o_0\xfe\xe8d\
-\xc2\x8f\x0e\xa03\xd0\xc7\x8b\xbe\xfb\xcd\xe9\xc5\xed''\
-\xe7\x9f\xdd\xd7\xf9oB\xba\xfe`Hr\xe64\x9d \
-\x9a\x8a\xa2Z2\x07\x1bQ\xa3\x87\xb7\xac\xca\xa1\xf4\xe0\
-p\xe8\xd1\xe3\x93\x9bvp\xd1\xe0\x10\xcd\x84:K\xc2\
-\x14`\xef-\x8e\xd6\xe8\xa7\xd8@\xf5\xa2fS\xbc\xaa\
-\xdbF\xd4\x07\xa2\x07\x82\x85\xc2\xbc!5Z\x03\xf1\x8c\
-0\xa2\x96\x0a`<\xd1bD2\xadf:\xc9t\xea\
-t\x0aQ\xa6\xcf\xc8`\xb9\xa8\x17\xac\x90\x0d\xfbHB\
-\xab\xc5\x91\x02\x86\x10\x03\xb1\x894]$\xb6\x0d\xb1-\
-\x00\xd26\x10\xdaPA\x03\x1a\x02:Y\x1d=\x12\x90\
-N\xc1\x16\x07\x00\x15,L\x808\xd8\xf0\xe9n\x99\x0c\
-\xcd\xdb\x16\x079\xdc\x9e\xbeq\x05\xc9A_*{\x10\
-\x15\xd0xM\xb0J\xe9\x83W\xdd9\xf3}\x94\x08\xea\
-\xb8k}o)F]\x83S<\xdc\xa0\xee\xf3\xd6\xb9\
-}\xe2\xf1\xd1\xa3\xfe\xe4\xd6\x96<\xffb7^\xbf\xf8\
-\x91)\xed\x1f\x1d@w\xdb6\xbc\xb7\x5c\x9e|v~\
-\xfb\xfd\xf7\xbb\xd3\xdf,\xae\xfd\x93!\xf9mu\x9d\x07\
-B\x80\xa2=t\xa6\xca\x9b\x89\xa4\xe6-`\xe8\xe1\xc7\
-\xde\x83k\xb20\xd3\x01\x07\xf0LY\x12\xdd\xb3R\xe5\
-Q)\xee\xcd\xf4\xa8\xb3\xe7\xde\x14+\xd6\xa6~\xb2\x02\
-\x8d\x97\xc7\xa4:y\x11\xa11j\x02\xd5\x0e\xc5\x0f^\
-\xacL+V\x00#\xd0\xa9\xd0\x05\xa1\x0b\xd0)\xa8\x18\
-f\x19\xcb\x89\x9c+p<\x13=C\xfd\x5c\xad\x15\xa5\
-\x12\x8bei\xda\x86\xd8E\x9a\xae\xa1i#\xb1k\xd0\
-\x18\x89mD\x9a\x806\x82F-e\x10\x7f\xc1e\x9b\
-\x88\x06t\x7f\xf3\xe8\x8a\xbc\xb9~\x1f\xf9\xc2\xc7n\xdb\
-\xdb\xf1\xcf!\xce\xe4()<\xc59\x95d\xf1be\
-&\xe5H\xc9\xa5J\xb5>\x93{w\xf8W)\xc8\x0a\
-x/ \x0a\x22.\x82\x93\xd5\xcdZuNg\xa6\xf7\
-\x1f\xf5\xa7\x0f\x9e\xa5\xe1\xf7\xfd\xee\xf5+~d7\xee\
-G\x05\xd0-\x90OV\xa7\xfd\x93\xd3\x8b\xbb\x8f\xe7\xa7\
-\xbf\xba\xa3\xfdg2\x5c\xdd\xd3,K%DWQ\xc7\
-Q\xa7\xc0\xa8\x9e\x008^\xf4\x0eEm~|\x86\x8f\
-\x80\xc2\x1e@\xc7\x05q%\xaa\x8aSN\xa4\x97\xba:\
-6\x00\x00 \x00IDATN\xaa\xb0?@\xbcX\
-\x1b\xad\x97b\xd3;\x08\xd3j<\x91\xdb\x93Z.\x02\
-\x8d[\x89e\x98\xf4\xd4\x99F2\x9d\xc2\x22\xc0,(\
-]TZ\xd5\xd2\x8a\xc02\xc9Fr\x1a\x19\xf3\x88\xe5\
-R\x96\xadT-\xb6CSc\x9c\x10\x03\xda\x06b\xdf\
-\xd2v\x1d\xed\xac\xa5\xe9\x8a\xc5\x89\xb5\x13\x90\x86\x12\xf7\
-H\xa3%=5\xc5;\xf5=\x8e\xc7\x1b\xfc\x00\xd3\x84\
-?\x1a\xc2^L\xca\x9e?8&\x0b\xa62@?\xbc\
-\xf8-\x1d\xdd\xa4\xb2\xde\x03\xc7\xd8[\x1a\xb7\x02\x9c\xc2\
-\x5c\xca\xde\xad\x9b^S\x84\xaf~\xf8.\xa5\xa9^!\
-w\xbc\x9eW\x0f\xe2d\xc5l\xd6\x1bw\xee\xb5\xab\xc7\
-kyuq\x02O\xbf\x86\x0d\x7f\xab\x00z\xd0\xb6\xf1\
-\xc9\xe9\xf9\xc9\xe7\xb7\xee~\xf0\xa0\x99\xff\xdd|c\xef\
-\x0d\xe6\xa7A\xb4\x09\x82\xba\x96\x9fNK?\xe8}\xa4\
-\xe2G\xa7\xfdpMj\x90}\xf0\x95\xa5R\xcf\xd4\x0d\
-\xacBM\xd0\xa9D\xa2j\x91\xf6\x87\xb8_\x95'\xe0\
-L\xd6C=#9AN\xc51?j?5\x9d\x93\
-c\xc1Oy\x9d\xd3b4j\xb4\xea\xb4\x0a\xadN\xd6\
-\xa6X\x9aF\x1d\x95\x8cyb\xc8\x894\x0e\xe5\xc8#\
-V{\xea*\x054\xad(\x12\x94\x18#\xda44]\
-K?\xeb\xe8\xe6-\xdd\xac\xa3\xe9[b\x17\x09m$\
-4\x85@\xa0\x92\x09\x12\x84\x10K\x11\x1eG\x16\x87\xe9\
-\xdb\xd7?c/\x08u\x7fKzS\x16\xa2?/\xdf\
-f\xff&\xc2[\xe0\xdaOU\xe1\xf8\xe61(&\x8b\
-\xb3Wc\xd7#O\xd7\xf7 \x9a\xdc\xc1\xc9<N\xf1\
-Z\xe9\xb0_\x96\xd7P\xb6f\x06\xc1\xa5\xedMNO\
-5<8\x8d\xcd\xad[a6\xff\xa7\xbcy\xcd\x8f\xe8\
-\xc6\xfd\x98\x00\x92\x0fn\xdf\xed>\xbe\xb8{\xef\xbd\xd5\
-\xd9\xa7\xe79>\xe1\xf5\xf5\x9d\x80\xcc\x1a\xd1P*\x22\
-3\xd9\x0b\x9d;i\xbe\xeaK\xa70\xf2(F)\xae\
-T\x82}\xe4\xb2OzJ$\x86\x92\xfdo4\x14\xb5\
-@\x0c%\xf0\x0eeuV\xf1C\x91\xb6g\xa2\xa5\x02\
-\xdc\xbd\x0f?\xe5]j?5?$,'\x986B\
-u\xcd\xa0\x0bJ\x1b\x9d&\x96\xfb\xa3\x08\xe2\x99l\x99\
-aL\x8c\xb9\x80'\xe7r_yo\xaaU+\xcf\x0f\
-\xa1\xb4\xdd\xd5\xb6\xa5\xe9:\xba\xbe\xa7\x9fu\xf4\x8b\x9e\
-n\xde\xd2\xf6\x0d\xb1\x8d\xc46\xa0\x8d\x12\xa2\x16\xeaZ\
-\x0bu-\xa1\x94|\xa3\x7f\x81X\xab\x97o\x94=\xb8\
-\xef\xebw\xfc\xa8 \xce\xb5\xd6\x01\xa9\x94\xbf\xdb\xa1f\
-d\x8f\x0c\xcf1\x93v\xe4\xe21\xb1nG\xa1\x91O\
-\xf7\x95\xfb\xb3\x81\xe5\xa3\xf8\xa7\x02iRr\x0bG\xb1\
-O\x8d\xfd\x0ax\xbc(\xd1ej&\x9cCt\x16s\
-\xf3{\xa7\xd2\xdf;\x0b\xcb\xd3>o\x9eo\x7fD7\
-\xeeG\x03\xd0\x07\x10>Y\xdf:\xf9\xe8\xe2\xceGg\
-\xb1\xff\xac\x1b\xd3\xfb\xa3\xf9\xa9\xa84QT\x11\x17\x13\
--\xe0\x99\xda-\x1d\xc5)x\xd8O\xe0)\x229\x14\
-\xc6E\xb2\x07r-\x05PihC@B@\xb4L\
-\xcaB\xebJ\xe9)\xa0\xb5EH\xadA.\xea\x80\xa9\
-\x8eu\xc4d\xc4%\xe1z\x90\x9aN\xee\x8aV9k\
-D\xe8D\xe9\x82\xd0\x86be\x82\x16Bv\xc8\x99m\
-\xce\xa4\x9c\x19s\x22\x99\x91k\xf2p\xb2h\xc7\xed\xd8\
-PEC 4\x81\xd864}W\x8eYG\xb3\xe8\
-\x89\x8b\x9e0k\xd0\xbe!ta\xcf\xb4is\x00\x90\
-\x04),\x9d\xf8\xbes\x8eL.\x96\x81X\x15\x9d\xd6\
-<\xecqJ\xa9<.5\x1f\xf0&I0\xd5\xf1 \
-\xfe\x96\xf59\x02\xceD\x10\x1c\x03\xe2\x08\x18\xd9\x9dl\
-N2\xca\x0e\x15{\x0b$d+5C\xf9\xe83\xa7\
-xt\xf2@\x8e]Q\xa7\xbc\x16\x15\x11G\xd5}\xde\
-e\xee\xaee\xf6\xf8B\xe7wo\x11\x9f~A\xfa\xd1\
-Za\xfdX\x00\x92\xcf\xef\xdem?Z\xaf\xef?>\
-9\xfd\xd5r\xc7'\xc1v\x17\xa6\xd2yT%x\xa1\
-\xfd\xad,\xef\x8e\x95}\x07T\x18\x0d\x06\x84\x01aC\
-\xa9\xa2\xda\xa0l$\xb0#0\x8a\x92\xa5!I\xd9*\
-1\x86H\x1b\x02!Db\x14bTb\xa3E\xcb\x1d\
- \x04C\xb5\x0a}\xbcV\x08e\x85\x5c=\xb7\xe4\xe4\
-TzZ\x9bQ[E9\x9e\x0a\x00\x90)][\xc8\
-\x8c\x91\xb2e\xc9\x90\xa7\xf7,\xb5:\xa5<\xbb\x94o\
-OK\xe1d5#\xd5\xe2P\x18\xc0\x18\x956\x06\xfa\
-&\xd26\x81\xa6\x11B+\xb5-$x\xf4\xa2Rn\
-\x1ci\x05\xe9\x15m\x15m\x8a%*\x1dx*U\xb6\
-/\x09\x85\xc9\x5cHv0\xad\xedv\x9d}k\xdf\x83\
-\xac\xa3\xae\xf4@\x96\x83[7\x01L\xac\xc8\xeb&\x0d\
-\x1b\xbc\xb9\xbe\x0bL\xc2S\xabI\xd1\xc9\xa0\xbd\x01(\
-/\x1f\x9b\x0d\xb2\xcb\xbet\xfd\x98\xad+o'{o\
-\xe3M\x109\xee\x01\x9bV\x1esu\xb7\xae\xc9rq\
-&\xb3\xf7o\x87\xf9\xa3\x87t_^\x93\xae^\xfcH\
-\xb1\xd0\x8f\x02\xa0\x05\xe8\x93{\xf7\x96\xef_\xac?<\
-m\xc3\xa7\xcd0>P\xcf\x8b&\x8aJ\x10R)\xa6\
-\xc1\xbdh\xccF7\xb6*\xdc\x98p\x8dr\xed\xca5\
-\xca%p#\xc2\x96\xc0\xa8-\x1ez4\xb6\xc4\xb6\xa5\
-m[\xba\xae\xa5\xef\x1af]\xa4o\x02m\x80\xbeu\
-\xba\xd6i\x1a\xa1\xed\x94\xb6\x85\x18\x1d\x0dU\xbf\xe0\x09\
-K\x03i\xd8\xfa0\xec\xd8\x0d[v\xbb\x1d\xc3\xb0c\
-\x18\x066\xbb\xadl6[v\xdb\x81q7b)\x97\
-}{\xdcJ\x9f\x03s\xd4\x8a5\x9bd\xfa\xd3y\x13\
-\x8a\xa5\x9a\xc8\x86}\xb2tj\x10\x22R\x92\xa8Qi\
-\xa2\xd0F\xa1\x8b\xd0\xa9\xd7B\xf5\x0c>\xeekj\x8c\
-\xda\xfcC\x81\xd8@[\x00E\xac~\xe5\xbe\xf4ar\
-\xe0l\x9f\x9f\x11\x93\xa2p\xde'\xd1d\xda\x1d\xa5\xb8\
-|G\x1d%%s\xf0\xc9&\xba\xbb>F\x8dM]\
-\x8a{G\xbdt\xfcM\xd0L\x09R\xe7\x0dW\xad\x00\
-\xc8I\xb9X\xa0dG\xf1\xd2D^\x08{\xd2G\xeb\
-GL\xa4\x9c\xab\x94\xfev\x0a&&\xee\x1e\xa3\xe9\xc9\
-\xa9\xf4\x8f\xef0\xfb\xe8>\xcb//\xf1\xd7p3\xfe\
-\x18\x89\xd5\x1f\x1c@\x0fAN\xe7\xa1}xky\xf1\
-\xe0\xd6\xc9\xa7MJ\xef\x0b\xc3ZC\x8e\xda\xb8x#\
-\xa4\x06\xd2(l\x1d\xae\x5cy\x99\x84W\x06/My\
-\xe9e\xef\xd1\x1b\x22[Q\x92\x04\x5c[$v\x84\xd0\
-\xd7\x12\x82\xd2S@\x1c\xa2%r\xcadq\x929\xa3\
-%4e<:\xa4\xb2\x9d\x8d\xb6\x10[\xa5\xeb\xd4c\
-\x14B\xd7 \xab\x80\xe9\x1cW/$C\x80\xec\x99\xed\
-\xb8c\xb3\xdd\xb0\xdd\xee\xb8\xb9\xda0^\xee\x18\xae7\
-\xbe\xdb\xdc0nn\x186[\xf2\xd6\xc4FG\xb2 \
-\x12\x80\x02\xa6\xa9>\xa8\x91Z\x10!\xb5!\xa8R\xe3\
-\xb0Jb\x04\x08Ah\x82\xd3\xaa\xd1\x88\x11I\xa8\xd5\
-F\x87\x19<\x19$+M\x1a\xb3\x95\x9er\xde`\xc2\
-\xbea\x08*\x07!6\x94+\x93\xfayJ\xe6\x1fe\
-\xa1%W\x8a8\xd5pcrz\x8a)9b\xab\xa7\
-`\x9eCBhOU\x1f\xd1\xd4LFM\x8e\xac\x90\
-T\xd0\x14o\x22\x99\x93M\xcb\xe5\xe4\xceq\xc8\x19\x01\
-\xb5\x0dq\x8d7\xe5\xa0\x04\xd9cA\xc0\x05q\x09\xee\
-\xb8\xaa\xe9l\xa1\xcd\xc33\xeb\xff\xee1'\xcfG\xc2\
-\x8d\x11F\xe3\xf2\xd5\xab\x1f\xb8Q\xfd\x0f\x0e\xa0Gw\
-O\xc3\x07g\xcb\xd5\xc5\xba{o}*\x1f\x84W\xdb\
-[\x12\xc6^\x1b4%a\x17\x5c.\x15\xbe\xc7x\x96\
-\x8d\xefF\xe7\xd9(\xbc2\xe5\xb5\x07\xae\x08lh\xc8\
-D \x10\x88\xe5p\x85<\x92\xc6-\xbb<r\xe3\x09\
-e\xa4a$J\x22\xcaXhe\xa9\x9d<14d\
-\xa2\x96@\xbfkC\xb1TmC\xd7\xb7\xb4\xf3\x96v\
-\x16ig-\xf3U\xc7b\xd5\xd3\xcfZ\xceVs\xee\
-\xdc:!\xc4P\x5c\xb8\xd1|\xdc\x0el6\xd7\x5c_\
-]\xb2\xb9\xbab{u\xc3p\xb5%]o\xc9\x9b\x1d\
-\xb6\x19\xf0]\xc6SF-\x97\x16#R]\xb8\xe3\xbc\
-\x8cTR$@P'\x06#*\x84\xb2}\xd7\xbe\x05\
-\x95fJ\x8f\xb8P\x04\xa4&\x11\xd3\x04\xf5\x10\x8a\x8c\
-\x07=RYL\x17\xa5Q\x5cuy\x04\x9f\xdc\xb1\xaa\
-\x8c\x99\x98\xae=\xe1\xe6^j\xc2\x91C\x80s\x94\xf6\
-\x01\xf6\xcd\x16\x91\x83\x8e\xed\x98\xab,\xaeZ\xb1.\x93\
-\xcb6\xe6r$\xe3\x0d\xebS\x00T\x05J\xc7Ew\
-\x154\xeaJ\x90IdU\xbf\x8bN\xb5PEj\x8b\
-K\x13L\xcf\xe7\xd6\xfc\xea\x0e\xf3!k0\x17\xf1y\
-\x96\x7f\xfb\x8a\xd7\xcf\xbf9\xec\xcd\xfaW\x1f?(\x80\
-\x1e\x82\xdc?\x99\xb7\xbf\xfd\xe0\xfe\xadG\xe7\xf3'\xf3\
-\xb8}\x10tX\xbax\xd8\xb8\xc8\xe5\x90\xe5\xbbM\xe2\
-\x9bM\xe2\xeb\x8d\xf1t\x0b\xcf\xb3re\x91\x81\x86\xa1\
-\x02\xc7\x08\x04\x8a\xacF\xcd\x8b4&\xef\x08\xa4J5\
-\x17:A\x19+\xb50R\xca\xe8\x8c)\x0d[\xb5\xd3\
-d1\x928\x83\x16w0\x08\x84\xa0\xc4*y\x09\x01\
-B\x84\xaeS\xfaY\xc3b\xd9\xf9b5c\xb1\x9c3\
-_\xcd\x98/{\xbaEG\x7fv\xca\xad\xbb\xa7h#\
-x\xce\x0c\xbb-\xbb\xcb+v\xaf/\xd9\xbe\xbab|\
-\xb5c\xbc\xbe!o\xb7\xb0\x1b`LHJH\x9e\xda\
->M\xca\xeeB;\x87)\x94\x09N\x98\x80\x04\x84#\
-\x00\x89f\x8c\xb1d\x9ad*\xee\xcb\xa85`\x86x\
-!N\x8a\x99\xab\x91\x84T\xebT\xa7\x8fR\xac\xce\xb4\
-#]\xb1\x96\x1cb\x1e\x9f\xd0R\xef\x98d;\x15\x90\
-\xc5u;\x16\xecRrm\x13\x89\xb0\x07M\x89qR\
-.\xee\xda\x98a\xc8\x90\xb2\x90ri\xdf5\x01\xa8|\
-\x92\xef\xc1?\x91\x15\xea\xa0\xb5\xb1J\xa8\x04\x13\xf57\
-+\xcar\xc7\xdd\xc5A\x0d\xe6Jx\xb0\x90\xd6o\x8b\
-\x08B\x98\x896\x9d\xc7\x7f\x11\x86\xef\xbf\xe6\xea\x07\x01\
-\xd1\x0f\x0a\xa0\xfbs\xf4\xc1\x22\xce>\xbdw\xf6\xe0\xbd\
-\x8b\xd5\xaf\xda!\xdd\xcdc\x9e_m,\xbcx\x95\xe5\
-\xeb\xef\x07\xfe\xf4r\xe4\xabk\x97\xef\xc7\x96\x9b\xdc\xb1\
-\xf3\xb6N\x8e\x83\x1e\xa0s\xa9\x89J\xf6\xb2\x9a\xe8\x89\
-\xc8\xc8A\x97P\x04\x98rt\xc0$\xd0\x99NL\x05\
-\xa1;\xc1\x84\xa3fN5\xdc\xaeM\x12%\x93\x04\xb6\
-q\xc3u\xa34m\xa4i\x03m\x17\xe9\x16\x91\xc5\xc9\
-\x8c\xd5\xd9\x82\x93\xf39\xcb\x8b\x05\xb3U\xe7\xddb.\
-\xab\xd39\xce\x05\x9e\x12\xb6\x1d\x186\x1b\x86\xabk\xc6\
-\xd7W\x8c\x97\xd7\xe4\xab-\xf9f\x87\xef\xc6\xb2kB\
-\x9eJ\xb2K\x09\x84R\xc04Y$\xd5bA\x0b\xb9\
-g\xf8\x980W\xb2\x8c E\x7f\x0e\x13/l\xa8\x97\
-\xb8H=Tj[\xab\x19\xaby\x15\xad\x09\x01\xaf\x95\
-P\xc5\xdb\xdc\xebS\xdf\x94KSP\xa3G\xad\xb3j\
-L\xe4{wM\x0e\xaa\x82#\xd6\xcd+\xbb\x962\xa4\
-l\x0cG\x00\xca\x93\x15\xb2C\xff\xbb\xc9\xdd\x9bL\xa1\
-L\x8dT(\x80/\x9d\x89\xeaN\xe5\xce> *\x1b\
-\xae\x98\x8b\xbb\x98H\x03q\xd5z|\xbcti\x806\
-\x0a!x\x10\xe5\x9a\x13\xae\xbe\xff\xa7\x1f\xa0\xfc\xfb\x07\
-\x05\xd0\xbd\xf3\x93\xf0\xe0dqrg\xd6?<o\xfb\
-\x0f\xb6\xcf.\xcf\xbf\xffn\xec\xbe\xfcj\xa3\x7f|:\
-\xf0\xf5k\xe7\xfb\x9dr\x99:\x06\xe68s\x90\xa6\xe4\
-P\xa0\xcaj\x9c\x86DC\xa2tD+`\x89\xf5\xbe\
-\x83<4W\xfdA\x99\x05\xd3R\xf3fm\xe6T\xdd\
-3As\xca\x1e)\x01\x91P\xdd\x04\x9f\x8a[\x06\x87\
-\xd1I7F\x22\xb1\x91\x91\xa0\xc6ew\xe5\xafg/\
-y\xb1h\xe9\x97\x91\xf9\xbacq1\xf3\xf9\xad%\x8b\
-\x8b\x05\xb3\xd3\x99\xc4\x8b\x05\x8459%\xf28\x927\
-[l\xb3%_m\xcaq\xbd\xc1nv\xe4\xed\x96\xb4\
-\xdbaiDr\x15!I\xfd~R\xc0$\xa1P\xef\
-S>\xac\xe4m\x12\x9e\x14\x1b&K&\x87\x0d\xb1\xdc\
-\xebNy~\xe4\x9e\x1d\xdc\x9e\xbd\x8b\xa70!W&\
-\x9fQ\xfd\xd0\xa5t_XT\x11td\x85\xbc\xd2\xe5\
-\xa5\xbe\xe7\x90\xfb1wr\x16r\xb54c\x92j\x81\
-\x9c\xb1\xc6<\xc9\xa4\xc6BR\xdb\x5c\x1d\x5c@|\x02\
-P\xc9\xefM\xdb\x16\xb9\x09\xe1XU!\x8ak\xc0E\
-E\xcc\xea\x99\x8cQ%.;\x97G\x0aM\x10)\xa6\
-\xdd\xdc\x83\x9f\xda\xf7\xbcz\xf6\xec\xaf\x5cx\xf7C\x02\
-H\xceN\xd6\xed\xd9|yK\xc6\xfc\xfe\xebg\xd7w\
-\xfe\xf0\xcf/W\xff\xfe\xc5M\xfb\xc5\xb3$\xdf]\x07\
-nR\x0f\xd2#2\xa3\xa5\x03o\x09\x04\x9a\xaa\x0a(\
-\xfb\x80fZFZR\xa9\xb1\x99\x92\x9fL\xad\x08'\
-\xe5\xdb\xb4\xa9\xc0\xb4v\x15\xbbr(E(?~\xf1\
-\xa7k\xea\xb5\xbaQ\xa5\xde\xf5\xf0Jw\x9f\xa0t\xf4\
-\xe7\x14\x1b\xa5\xd9\x087.~\xe3\xbey>\xb0\x91k\
-.[\xa7[F\xfa\x93\x96\xf9\xbag~>gyk\
-N\xbf^\xd0\xad\x17\xb4'K\xe2\xd9\x1a\xb9e\xb8%\
-l\xdc\x917\x1b\xf2\xf5\x0d\xf9f\xc3\xb8\xb9\xc1v\xd5\
-2\x0d\x09\xc6\x11\x99f\x1b\x93\xa0\xb4\xe8\xda\xf4H\xef\
-V\xfe\xc4J\xb3\x99\x95\xe5\xdd\x0e4\xb4{i\x12R\
-\xe8\xf7#\xf7\xe7\x88\x048T\xb2\xb2\x07\x95kM\xb6\
-\xbe\xfd\xd819q4\xac\xea\xd9|\x22\x06\xf2\xc1u\
-+.[\x89{&\xab\x93\xccI\xc7:8\x0e\xc6o\
-\xfa\xa9\xcby\xa9\x18\xaf\xad\x87\xb3\x1f\xce,HU\xe6\
-\x97s\xd8\xa0\x88\x04\x8d\xd2\x88\xa2\xf3(r?H\xe5\
-F\x05F7[3\xa4gl^\xf2W\x04\xd1\x0f\x05\
- \xf9\xb8i\x1a\xbb\xcc\xeb\x9b\x17\xf6\xe8O\xbb\xd7\xef\
-}q\xf3\xea\xfc\x0f\x7f\x18\xfb\xef^\x12\xae\x87N\x8c\
-%\x8d\xcc\x89\x12\x09\x12k\x16:\x13\xc8\xb4\xf5\xb2X\
-\x9aL[R\xa5{\xb0\xc0A\x1eZ\xb6\xe6\xf4J\x17\
-\x1f\x8a\x15\x98V1)\x00\xd9\xe7\x16\xaa\xc4'\x88\xd6\
-^h\xd3#\xd3\x0aO9\x81\x93&\xab\xae\x88\xd49\
-x\xf8\x0eE\xa9\xe0$\xd8%lH\xdc\xbc\x18\xd8\xfe\
-i'\xaf\xdbW\xccW-\xb3\xd39\xb3\x8b\x05\xfd\xc5\
-\x82\xd9\xd9\x8c\xe6\xb4!\x9e\xb4\xc4y\xa4\x99\xadh\xe7\
-\x0b\xf0\x84\xe7\x84\x0f\x03>\x0c\xe4\xdd\x80m\xb70\x8c\
-\xd80N\x11w\xe5\xa2'\x06\x8fR(\x17k\x97\xd1\
-\x18KB\xb5\xee\xc80\x1dS\xf96S\x17R\x0a\x0d\
-<M\x7f\xa1\xfa^{\x09aa\xeb\xa6]R\x8f;\
-%\xca\xdem\xaa\xec\x1b\x13\xfd,\x07j\xba\xbamC\
-.\xeb\xc0\x90`L\x07\x02a\xb4R\xd2\x90\xec\x88`\
-\xf0\x83\xf7\xb8G\x90\x1cp.\x95@\xc8^\x9a\xf2\x8b\
-\x08\x81R2?u\x9c-\xb9_)y@m\xc8\x22\
-\x12\xd0^=\xdcs\x0f\x86(\xa6\xee\x1bK\xa6\x84\x7f\
-\xf9\x86\xab\x97\xaf\xffJ\xec\xdc\x0f\x02\xa0\xfb\x10/L\
-\xd7\xc3\x8b\xf4\xc17\xc3\xe6\xc9\xa5\xf8\xa3\xe1\x9a\xd3\x9b\
-\xcd\xb2\xcd\xb9\x97\x96N\x84\x9eHS\x99\xa6C\x15O\
- \xd3\xe2{\xc0\x1c\x9a\xe5z-8\x9b\xe8_\xa9`\
-\x80F\xb5P\xc6*\x95&.\x05dAC\x0d\xd0\x95\
-P\x1d4\xadmmu\x8a\x80\xf6%\xc8\x1c\x5c\x95\xe9\
-\xa4ZM\xa2\xfa\xe1R\xcd\x10w\xcc\xb2\xd8\xbert\
-j\x98X6\xb6\x92Mf\x1c\x8c\xfcb\xc7\xe6\xcb\x1d\
-\xcd\xec%\xdd2\xd2\xad[\xda\x8b\x8ev=\xa3;\xed\
-hW-q\xd1\xa0m\x87\x84\x16\x99\x1b:/\xdb\xa5\
-\xec\x97\xf2\x5c,\x8b[!L\xdckw\x87Z\xa2\xbd\
-\xf7\xd1\xb4\x02(j\xd9\xd0J\x15$\xec\x1b\x8a\x94>\
-\x08\x00\xba\x0f\x89\xc0\xf6n\xdb[\xbe\xee\xa1\xbcA\x84\
-\xd2q|\x02\xce\xa4k;\xb2.\x06\xa3\x09cr\x86\
-,\xec\xd2\x04 gL\xe5y\xa3\x95X\xc8(;M\
-$\xaf\x0a\x85\xc3O~\x98\xce\xd5\x02\x99Rb\xd6z\
-\xces\x8da\x0d-\x8b\x98\xd4]7J}\x91d\x82\
-\xa3\xa1\x0a\xcf]\xd4\x9aYK\xba\xb7D\xdc\xc4\xd9a\
-6\x94:\xf2\x7fu\xae_\x5c\xfe\x15\xd8\xb9\xbf6\x80\
-\xe4\x02\xe2\x1d\xfa\x93\xb5-\xdf\x8f\xdb\xc5\xaf\xaf\x87\xf8\
-y&>\x96\xdc\xce\xd5\xe6!\xd2\x89H,\x5c\xbfg\
-J\x95\xbeQ:\xb5Y\xdd\xba}j E\x81\x9a(\
-\xadh)>\xd3\xda\xc93*!\x06\x9a 41\xd2\
-h \x06%\x86Pw0\x88\xe5Rka\xdc~\xd6\
-\xd4\x99\xe2\x87Ut\x92\xa2LL\xd2\x9b\xf2\x94\x92,\
-\xf5l\x98YU\x19X\x05\xd7Q\x10\xef\x07\x9dJ\x99\
-\xecE\xca\xa0\xbb\x04C&]\x19\xf9\xf9\x0d7_\xde\
-\xb8\xce^\xd3\xacZ\xfauO\x7f1\xa3]\xf54\xab\
-\x8e\xb8\x88h\xd7\xa0m\x03\xd1\x90\xa6\x9a\xc2\xba=X\
-1\xd3S\xc6\x93=\x1b\xf6\xc6\xca\xbd\xa7\xae+\xa8\xf6\
-MD\xe4@\x0c\xec%\xd8z\xf4^\xfe\xa6\x8b\xb6w\
-\xd9\xa6\xe0G\x8f~\x97)\x86\xa9\xe4\xc0\x11X\x86\xe4\
-\xd4?\x991\x0bc\xf6=\xc0\x92\x1f\xacNr'\xfb\
-\xc4\x90\xca[\xb3X*\xd9Q\x0e\x93\xa9/\x85\xee#\
-\xdd\xc9\x0bH\x12\x18=\x81CB\xc4DK\xefH\x00\
-\x91\xa0\xa6\x8b\xc6\xfd\xfe\x1c\xb7\x0b\xb5\xed\xd6\xf3uv\
-\xc6-9_\xb2}\xc9\x7f\xb0\x0c\xfc\xaf\x09 \xb9\x0f\
-\xf1\x1e\xcd\xc9\xb9,>8\xe3\xec\x1fV\xf9\xe4\x1f\xda\
-<\xffTi\xefDi\xdb(m!\x8e\x1djW7\
-)\xba\xb0\xa9\x05\xbb\xd5V\x86R\x80\xa3\xca<\x04f\
-Md\x16#M\x05Hl\x02M\xdb\xd0\xb6\x91&\x06\
-\xda\xd0\x10biHX\x02P\xdd\xe7Y\x04\x01\xabM\
-?\xean\x08\x96\xa7]\x11\xea\xed*\xbb9L\xc6\xc3\
-j\xbbo3\xd5LQ\xb7\xd4\x05\xbb\x06\xbb.\x936\
-\xa5P\xc9\x93\xd0k\xda\x13\xd5\x0d\xb1\x04y\xf4\xbc\x1b\
-\xc9\xdb\x91\xf1ufx\x96\xd9v7\xc4\xf9\x96f\x1e\
-\xe9\xcfz\xbauO\xbbni\xd6-a\x11\x08}@\
-[qi\x04\x895\x00P\xdb\x93\x03\xe0G\xc1\x830\
-\x09\xdc\xf6\x8d\x13\xf7\xfb\x8e\x1f\x5cS\xdf+\xb0\xf7T\
-Zq\xdb\xde\xdaan\x0a\x99\x0a\xf0t\xff\xba\xecR\
-c\x1c\xf6\x80\xd9\x8e0\x8eV]7/\x80\xaa\xc4A\
-\xda\x03\x06R\xad\xfb\x99\xc0S\xd4D\x87\x9e\x15\xf5K\
-\xef\xad\x9d!\xa8+\xeaZ$<^\x8bH\xa4\x00\xc8\
-1\x06\x94d\x82\x98\x16=$\xa1\xa4zK\x93|Q\
-\xd3\x10\x8dyg\xdc[;\xbf\xca\xea\xcf\x06\xe3\xf2\xc6\
-\xd3\xe6\x0a\x1b\x9e3\x5c\xb2_E\xfe\xe7\xc7_\x0d@\
-\x0f*xn\xb3|\xff\x9c\xd3\x7f<e\xfd\xbb\x95\x9f\
-|\xde\xd0?\x12\x89+q\x0d\xb1Z\x9bz\xa2e\xda\
-\x97\xa0\xc1\xca\xa6R@\xa7\xca\x5c\x03}lXt\x0d\
-\xf3\xb6a\xd6\x97\xa3i\x03\xb1\x8d\x85V\x8e\x0dmh\
-\x0bh\x10\xcc\x8d\x9cs\xd9B~\x18\x19\xc6\x81a\x18\
-\x18RbL\x894m-\x9f39[]\x09\xcbF\
-\xbf\x936\xeb\xb0\x12\xcad\xa4\xf6+\xb9\x8a\xd4\xcc\xb8\
-\xd7\xee\xa1\x91\x18\x9ab\xe1\xbc4 \x09T\xcbH,\
-.f\x9d\x94\x01\xbcP\xe7\x05\x5cn\x99\x9c\x13\xb6\x1b\
-\xc8\x9b\x1d\xf9\xf9\xc8\xee\xe95\xda_\x13\x16\xea\xcd*\
-\xd2\x9cV\x0bu:\xa79\xed%\xac\x1a\xd7^\xd1V\
- \x96\x80\xa0\xf4?\xf1\xc9\xdf\x02\xa6\x0e@uJ\x1e\
-\xc9\xa4\xf7\xbb)\x98\x1d\x81\xa7^f\xc1\xebn\xdab\
-\xbeW*x.\xec\x17\xe6E\x13\x98\x8abd\x18K\
-jk\x18\x9d\xdd\x08\x9b\xc1\x8b\x05\x9a\xac\xce\x948\xad\
-DAQ\x10\xfd\xa5\xe6\xff\x1c\xe2\x977$H\x93\x12\
-ar\xd7\xa6\x1a\xe1\x88\xca\xd4\x02\xd9q1\x92)c\
-.\xee\xba\xbb\xd5\xad`\x5c\x90R\xc6\xae\x1a\xd0\xac\xb1\
-\x85\xa5:\x0f\x0c>\xdb\x88\xbf\xbc\xf6\xf1\xd5s\xc6\xcb\
-\xe7\x0c[\xfe\x03\xf4\xf6_\x05@\xf7\xa1y\xc4\xec\xf4\
-\x81\x9c~x.\xa7\xbf[\xb1\xfe?:_~\xda3\
-{\x14\x89k\x5c\xa2\xe1\x12\xab\xa59\xde\xd0\xa3\x91\xda\
-,W\x95>\x04\x16M\xcb\xaa\xef\x99\xf5\x1d\xb3Y\xc7\
-l\xd6\xd2\xcd\x22m\x17i\xfa\x86\x10\xab{\x91\xc0\x06\
-c;\x0cl\xb7[\xb6\xbb\x1d\xdb\xdd\xc0v\x18\x18\x86\
-\xc4n\xd8\xb1\x1bG\xb6id\xd8\x83\xa6Z\x1c\x0a?\
-7)W\x0e\xfb\xfa\x1ce\xd3\x99ZW\xc1\xa1x\xaf\
-\x0aIE\xca\x89\xd1\x88h)\xe9.\xfa\xb6@\x94R\
-B\xd1j$\xa2\xb4R,d\xa7\xb1\xb8\xa11\xd0J\
-,\xbd\xb5-\xd3\xd4D\xb0\xd9\x88m\x07\xc6\x9b\x91\xe1\
-Yri3\xdby\xa6[f\x9a\xd3\x1da\xddH\xbb\
-j\x89\xcb\x86\xb0\x0c\xe8<\x10f\xc52\xca\xbe}\x95\
-\xf9$v\xdd\x9b\x96R\xbdv(\xc56\xa9\xcak/\
-Mn\x92@\x02I\x02c\x0d\xe7\xea\xa5g\xb0\xe4X\
-2lt\xd2\x08\xe3\xae\x80g7R\x804R]6\
-e4#Y(L\xdbdy\x8e\xc0\x92\xc5\x99\xe4x\
-\x87f0\x154\xfb\x0dY\xcb8(\xb2\xe5\x00\x9e}\
-\xaf\x8a\x0a \x8c\xe4Z\x5cAW\xdcc\x917\x19\x94\
-~y\x82\x84 %\xee\x95\x88\xcb\xe9,\xfb\x87\xe7\xa4\
-\x97\x1b\xe6/^1\xbc\xbad\xb8~\xcaf\xfa:\xff\
-\xd3\xe3?\x0a \xb9\x0b\xf1\x11\xf3\xf5C9\xff\xe8\x9e\
-\x9c\xfd\xe3ZN\xfe\xcf\xc6\xe7\x9f\xbb\xb7\xf7#z\x1a\
-\xb1\xae4*:4\xc9\x88\x98DqZ)\xd5\x9a\xb3\
-\x10Y4\x0d\xf3\xbec9\xefY\xaezf\xf3\x19]\
-_\xaa/c\x13K\xbb6\xcb\x8c\xe3\xc0n\xbbes\
-\xb5\xe3\xe6j\xc7\xf5f\xcb\xcdf\xcbfW\x003V\
-\x97\xcc\xaa\xd8\xb3\x08\x8f\x0f\xd3\x7f\x22\x86\x0f\x8d\x15\xa5\
-\x82i\x02P\xd9\x06\xe50\x05\x0f=\xe0\xf6j\x06\xb7\
-\xbd,\x7fJgZY\xf7\x0a\xfd\x8a\xd0\x10\x89\xa2\xb4\
-\x12\xbd\x09\x054=\x81\x996>\x0b\x0d}h\xe85\
-\xd2\x87\xc8<\xb4\xb4\xcd\x9c\xd6\xe7\x1e\x0dB\x09\xbc\xf0\
-+aw\xed\xec\xbe7\xb4\x1d\x88\xf3L\x5c\x8e\x12\x96\
-\x81\xb0\x0c\xc4E \xcc\x02\xb1SB\x17\x5c:\x0a\xa0\
-\xc2\x11\xa8*\x9f\xe5UU \xd5\xe2\x90\xa5\xa8\xb4\x93\
-\x94pm\xf4\xba\xa9R\xb9\xed\xc9\x8b:}4,\x09\
-y\x84\x94\x84\xb1\x02g\x1c'\x82\x80\x9a\xcf\x11\xa6\x86\
-\x89\x93\xa0\xa1\x18/;\xb2<o\x0a\xc0\xa7\xfc\x0f\x94\
-D\xe9\xb1\xfbV\xa7\x17R\x1d\xfc\x02\x9eRD\xef(\
-A\x1c'\x15\xd7\x10)\xf2&\x14\xf3\x12\xab\x96\xde\xdb\
-\xb5\xb80\x04\x5c\x83\xb8\xd0\xc5\xc1n/\xc8\x9f\x9c\xfb\
-\xf0\xf2\x1e\xb3\x17/|\xf7\xfa\x15\xb6\xdd\xb1\xdb\xf0\xbf\
-\x00\xa2\xff\x10\x80nC\xb8\xcf\xec\xf4\xbe\xac\xdf\xbf#\
-g\xbf=\xe3\xf4ws_|\xee\x16\xde7d\xa9X\
-\xa3XP\xb2(\xb9\xb6)sZq\xfa\xa0\xccB`\
-\xd15,\xfb\x8e\xe5l\xc6r1g\xb6\xec\xe8\x16-\
-m\xd7\x12b\x04\x9cqL\x0c7;6W7\xdc\x5c\
-\xddps\xbd\xe1\xe6f\xcbf\x18\x19R.G\xce\x05\
-<L-\x0c9:\x0e\x0d\x14\xad\x06\xa1U\x1dW\xef\
-;\xee\x5cz\xfc\xcf\xeb\xaa\x99\xf7\xb7G\x12\x89\xb2\xc9\
-\xaf\xb9\xbf\x01\xa0)8/ R\xa4\xca\x225\x17\xc6\
-0\x22\xde\x12\xac\x95\xe0\xad\x04\xef$\xfaL\x1a[\x84\
-\xde\xe6\xa1\xf3\x854\xcc\xa5e\x1e[\xef\xb4\xa1\x95\xa6\
-\x90#.\xaa\xa3h\xbeBl\x83\xf0\xc2T\x1a\x13i\
-F\x09m\x96\xa6\x0f\xd2\xcc\x0c\x9d)\xdaCh\x15\x8d\
-\x8e\x160\xb9(%\xa1\x08\x142\xc0\xab\x05\xf2\xbdB\
-\xdbF\xc7\xf7\x96\xc7\x0bh\x92\x93\x93`IK\x8a\xa9\
-\xbah)\x95\xca\xd2\x89\xbd\xa8\x14Ce\xc2\x0f\x8ep\
-I\xb6\x96\xacl\x09\xbb\xe4\xd0\xd5\x97\xa9\x8f\xdfq\xef\
-\x8a#2ar\xe9DA\x22&\x11\x95H\xd0XS\
-\xde\x86\xc9\xc0\xe8uS5\x0d\x98\x07R6\xb2e\xd4\
-\x12j\xc5Uw\xdd\x97\xf1kp\x9f\xb7\xe4\xfb\x0b\xc6\
-O\xcemxvGf\xcf^\xcb\xf8\xeay\xdeM;\
-\xdf\xfdO\xb1r\xff\xcb\x00\xba\x80p\x9f\xf9\xe2\xbe\xac\
-\x1f\xdc\xd5\xf5\xe7g,~;\xfb\x7f\xc9{\xd3&I\
-\x8e\xe4J\xf0\xa9\x9a\x99\x1fqdfeU\xe1\xee\x8b\
-\xdd\xe4\x08\x97C\x91Y\xd9\xff/\xb2_\xf7\xcb\xae\xc8\
-\x08\xc9!\xfb\xe06\x1a@\xa3\x0b\x85\xac\xca#.w\
-7S\xdd\x0f\xaa\xe6\x1e\x89*\xa0\x01\xce\x92CT\x1b\
-$\x90\x99\x11\x99Y\x91\xee\xf6LU\x9f\xaa>\xd5\xf6\
-oX\xe2\xc7\x02\xbap\xf0\xb0\xbbj\x14 \xd6\xbd\x19\
-\x08]\x8c\xd8\xa4\x88u\xd7`\xbbj\xb1\xd9\xac\xb0\xda\
-\xac\xd0\xaf:4]\x03N\x0cQ\xc58\x8d8\xeeO\
-x\xb8\xdbaw\xb7\xc7p\x180\x0c\x13\xf2\x941\x16\
-\xc1 \xd9\x92r\xaa\x98\xf4\xac\x0ax>u\xeb\xcd\x0a\
-\xa8\xcd\xd8uTb\xa5-0\x13\xe8p\xf0U\x85\xd3\
-j\xbd\xea\x0cT\x03Q\x9d\x80Z\xe6\xef?w\xf1\x00\
-\xf26\xb6\xb2\xb8\x80u$\x0e,\xd4\xa5\x12@9\x80\
-\xa7\x04\x1a\x1b\x84\xb1\xa58t\xd4\xe4\x8e\x1aYQ+\
-\xab\xd0\xca*\xb4\xba\x8a-\xfa\xd0\xd0*t\xdc\xc7\x14\
-\x13\xc5\x90\x10S\x94\x10bF\xe2A\x93\x10\x9a\x12\x11\
-\x87\x80\xc0I\x89\xa2\x12G\xe5\x90\x08\x9c\x04\xbe\xdf4\
-D\x226\xe1\x07k\x07\xa8W\xc7\xdb\xe75\xe3\x0cT\
-\xe4\xb9Y5\xd1H\x01\xaaD\x15\xe9\xd2T\x18\x18\x88\
-\xd5\xe2\xa8<\xaaH(\xba\x80J<\xe6\x9a\xeb\xe9\xe6\
-\x7f\x9e\x81:\xa1\xc1\xd7\xa3\xc9\x11D\x00U\xa1\x7f\x9b\
-\xceG\x94P8X\xb7/1F(&(\xda`\xfe\
-\xcd\x94\x0b\x8a\x04\x04\x15\x04\xff\xdbXA\x1c\x18L\x0d\
-\xa8HJ\x92/;\xcd?\xdd\x22\xbfz\xa6\xf9\xc5=\
-M/3\xca~\x8fC\x9dv\xf3\xbd\xd7\xbf\x09@\x97\
-\x00_\xa3\xe9\xde\xa3\xcd\xb3\x0f\xf8\xeaW\xcfx\xfbw\
-ki\xfe&(}\xac\x90\x0b\x06%@8B(\xf9\
-9\x1f)\xa0\x0f\x8aM\x13\xb1\xe9\x1a\x5c\xf4\x1d.6\
--6\x9b\x1e\xfd\xa6G\xb3j\x11\x9a\x04\x800\x1e'\
-\xec\xeew\xb8\xbf\xdba\xffp\xc0\xf10`8M\xc8\
-\xd9g\x88\xaa\xcd\x1a\x9d\x9c\xc91?\xbbV\xbf\xd5c\
-\xe4<\x12\xe03\x10\x99X\xbc\x11\xe6\x8b~tAv\
-K\xa3nal`p\xf11$\xe5\x91C7\xdfa\
-\xd4\xaa\x17\xcc\xfd\x9f\x06^\xa3J\xb4f\x8aD\xcdq\
-\x1a\x01\x8c\x04=\x11\xca\x8eA\x0f\x01r\xcb\x9a\xefH\
-\x87}@\x1c\x22\xe2\x14s\x1c[\x0ac\xcb\x8dv!\
-a\x15\xbb\xb0\x8e\xab\xb4\x8a}\xb3N\xeb~\xcd}\xbf\
-\x0a\xedz\x15\x9bm\x0a\xf12j\xd8p\xa15\x0b\xb5\
-<\x22\x11Ib.\x01\x94\x19\x98\x8883S\xd1\xc0\
-\x0a\x0abc\xb1\x83\xb97T\x99Jg\xe6\xe6\xc2R\
-T\xd0\xd4/\xce\x13\xd3\xea}B\x16\xc8K\xb1\x98\x12\
-\x9e/\x13\xb5\xc4v\x01 \xa4`Y\x94\xf8\xa0X\xd8\
-K]<\x83\xca\x80\x9e\x938sB\x98\x22\x94#\x84\
-\x13\x88\x13\x98\x831\x82PLR0\x12a\x0a\x09D\
-\x01e\xca\xc8\xa52\x87\x05$\xf6\xefG%\x22\x0e\xe0\
-\xd4QP\xe9\x12\xca\xb3\xae\xe4_^J\xfe\xeaZ\xa6\
-/v\xa1\xbc\xbe-\x87\xd3\x11?L\x22\xf8\xdf\x02 \
-\xba@\x1f?\xc0\xf6\xe2C\x5c\xfd\xfcC\xda\xfe\xdd\x85\
-\xf4\xff\x85\x95\x7f*\xaa\xd7\x8a\xdc\x12x\xae\x15n`\
-%\x19Md\x5c\xb4\x01\x97\xeb\x16\x17\x9b\x1e\x17\x9b\x0e\
-\x9bM\x87\xf5\xbaGl\x1a(1\x8e\xc7\x11\xfb\xfb#\
-v\xaf\xf6x\xb8\xdfa\x7f8b\x9c\xca<\x160+\
-!\xab \x8b\x0f\xe9\x9dOy\xdb\xb4U9\xe1\x5c\x8d\
-\xd4\xac\x92\x89M\x01\x09u\xfe\xa9\x09\x99{\xccC\xc5\
-UN\x0b\xb2N(\x98\x1c4\x06\xa3s\xa7\xb0\x02\xa6\
-\x02\xc9\xdc\x97\x85\xf6v\x89\xe1\xda\xde\xafV7\xa9\x03\
-\x01G\x80\x1e@x(\xa4w\x0a\xbc\x12\xd5\x17\x02}\
-!\xd0\x97\xa2z#\xc0\xa1\x80\x86\x02\x1d\xa0:\xa0P\
-A\x01\xc2\x18\xb9E\x97V\xbcj\xae\xe2E\x7f\x117\
-\xab\xab\xb8\xd9^6\x9b'\x17\xed\xfaz\xd3n.\xbb\
-\xd8=\xe9\xc3\xea\xbaoV\xd7ml\xae\x22\xf1\x05\xa9\
-\xae\xa0\xa5\x85\x9c\xa2\x96#c:\xc2\xc6\xaa\x1cA4\
-R\x08\x05\xccRe\xb3\x8d\x1cqm\xbb9\xa9\x84E\
-dd6\x1cT\xaf7\xac\xff\x89`\xf5z\xa26\xad\
-\xd6iqf\x98,\x98KdZc\x9cgik[\
-)\x9f\xe5\xe4\xb0\x10\x8aD5\x8e\xb36}p\x028\
-A\x9d\xcb-R\x90U\xace\x9e\x08S\xea\xc1\x1a \
-\xe3\x08L\xae\xb7\xad\x0cv\xeb\x09\x05\xc0L15P\
-(\x93\x96U\xa3\xe5\xc3K-\x7f\xfd>M\xbf\xdf\xe9\
-\xf0\xa7[\xf4wG\x1c\x07\xfc\x80X\xe8\x07\x03\xe89\
-\xda\xf0\x1e\xaf/>\xe4\xab\x9f>\xa7\x8b\xbf\xdfJ\xfb\
-\xf7I\xc2_)\xf0\x9e\x02k\x86\x84\x00\xa5\x16L=\
-\xc8\xd4i\x12a\xbdjp\xb5nq\xb1\xed\xb1\xdd\xae\
-\xb0^\xb7h\xbb\x06\x81\x03\xc6!c\xf7p\xc2\xdd\xed\
-\x0e\xf7\xb7{\x1cw\xa3\xe5i\x94!j\x1d\xaaS\x9d\
-f-e\xde\xd2\x8b,\x07\x1e\x01G\xbd\x10H\xce*\
-\xe6\xc4G\x95\xc8\xdc\x1d\x84\xd9\x19\x9b\xb4`\xc2\x84\x09\
-#*\x94\x1e\x03\xa7\xae\xc7e\xfc5\xc9\xe8\xce\xcd\xb9\
-%r\x9e\x0b#\x01;\x22\xdc\x81\xf4F\xa1/3\xeb\
-\x8b\x0cy1B\xbf\x1cU^\x0c:\xde\x8c\x90\xbbI\
-\x8f\xb7{\xe4\xd3\x04\x99&hn\x11\x85}L\x96m\
-\xa7\xc8*\x08\xabq\x13\xd3\xd84=\xad\xdauX\xad\
-\x9e\xf0f}\x91\xae\xfa'\xdd\xf5\xe5\xf3\xf5\xfb\xcf\x9f\
-m\xdf\xfb\xe0*u\x1f\xae\xd2\xc5'm\xb3\xfe\xa8\xe1\
-\xf8\x9c\xa5\x5cq9\xf5\x9c\x0f\x01yG:>\x00\xf9\
-\x1e\x9aw\x80\x0e\xa8\xd5\xecD\x05\xc4\xc5#\xc3\xda\xb7\
-\x84\xb9\x1a\xa8b\xea<\xbe\xccJ\xc8\xe4\xd6\x9f\x01\x15\
-^\xd8h\x06fq\xc4\xd9}\xb3\xf9F\x026\x82\xf0\
-\xac\xfcw\x9e\x04\x09\xc2L,\xba\xf5\xa9\x002\x15X\
-o\x87(\x059O(\xb1CIk@\x034\x1c\xcd\
-/P\x9bp\x0eg\x1e\xeb\x84>\x84\x08B \x12\xc4\
-Ft\xbbQ\xf9IF\xfe\xeb;\x1d\xfep\xa7\xd3\xcb\
-\x079\xee\x0f?`\x5c\xca\x0f\x02\xd0\x87\x00\x7f\x88n\
-\xfd\x09\xb6\x1f\xbd\xc7\xab\xbf\xbb@\xfb\xdf\x82\xd2\xafT\
-\xf5}\x056\xe45\xc0u\xa2h\x1f\x02\xd6M\xc0f\
-\x95\xb0\xbd\xe8\xf0\xe4r\x85\xed\xbaG\xd7wH)A\
-\x8a\xe2\xee\xee\x84\xfb\xbb=\xee\xef\xf6\xd8\x1f\x06L\xa3\
-8\xf3\x1aL\x94\xc3\xadM\x96:\x08\xb86'Tk\
-\xb00j6\xc6$\xf8\xe3\x91\xcc\xe1\x19a\xe0\xf1\x0d\
-UK3b\xd2\x11\x19\x83\x83\xa7rD\xdf\xbc~\x15\
-\xa8\xa8\xa0\x99\x1d\x8f3\xa2B\x01*\x0c\x1d\x05\xd8\x83\
-\xf4N\x08_\x0b\xe3\xcb\x02\xf9,\x93|~B\xfe|\
-_\xa6?\xed\x90_f\x91\xfb\x8c\xf14\x00\xc3\x11\xbb\
-\xe9\x05\xf6\xb5\x05\xf9m\x89\xbd\xea\x05QB\xa2\x0b\xbd\
-\x0e\x9b|\x15\xae\xd0\xc5U^\xc5M\xbe\xe8\xae\xc6\x97\
-\xdb\xeb\xc3\xf3\xcb\xcb\xd5\xfbO\xaf/>\xf9\xe4\xc9\xf6\
-\xfd_n\xda\x8b_\xadB\xff\xf3UZ\x7f\xd0\xd1\x93\
-\x8bV\xc76\xe6=c\xbcE\x19o\xa1\xd3=i9\
-\x01j\x0f\xd5\x11$\xc5Z\x1e\xdc\x93\x9aAt\x06$\
-\x80|\xc4\xcb\xc2r\xaa\xc7\xa1\xa52p\xe2\x87\x1a\xd5\
-\x8a\x02\xf2v\x8c\x85\xc4)\xba\x8c\xb0\x04\xaau\xab\xfb\
-\x9e@\xccPN@\xb0\xf9K\xca\xc1\x0e6\x11L\xd9\
-X\xd7B\x09\x9az\x14a\x146W.\xcc\xf3d\x0d\
-\xd4\x22\x0cR\x86PB\x88\x0d\x822'E+*O\
-{\x94_^\xe9\xf4\xdbkL\x9f\x7f%\xab\xd7\x07\x1c\
-\x86\xb7l\x80\xb7\xae\x1f\x02 \xdab\x93\x9e\xf3\xf6\xfa\
-\x83\xb0\xfd\xe5\x13\xf4\x7f\xdfK\xf8[(>R\xc8\x16\
-@\x0aP\x8e \xf4 Z\x07\xc2E\x1bq\xb1nq\
-y\xd9\xe1\xe2r\x8d\x8b\x8b\x1emc\x13\xae\xc7c\xc1\
-\xfd\xdd\x01\xaf^=`\xbf?a\x9c\x8a\xf7\x8a\xb0Q\
-\x93U\x02J\x0d8\xc4\x96\x0d\x10\x8fB-\x19o\xe5\
-!\x02\xc6\x84\x80\x09\xc1k\xb6k\x8cc\x15t\xf6\xb5\
-\xd9,\xa1\x8c\x02\x1b\x02\x9cqBq\xab#s\xc6\xa2\
-\xc2\xe1<\xa0]\x02\xdb\xda\xf6\xe5b\x8b\x0a,mg\
-\xd6\xd4\x8d\x11\xe0{\x90\xbe(D_\x0c\x5c>;\xd1\
-\xf4\xe9I\xc6\xffw\xc0\xf8\xd9Q\xa7\x97\xafe\xba\xfb\
-\x0a\xbb\xc3\x11\xc7Z\xd0x\x8e\xd8?w\xe3h\xc2\x84\
-\x1b\xbc\x98n\xf0\x02\x9f:\x8d\xd8\x0c\x9b\xf0d\xf8\xe0\
-\xd5\xb3\x87g\xcde\xf3\xd1\xfaz\xf8\xea\x0f\x1f\x9d~\
-\xf1\x87\xf7\xb6\x9f|~\xdd?\xff\xdb\xcbt\xf17\x1b\
-\x8e?[\x87\xfe\xf9*\xb5}\xd3\xac9\xc8%\xd3t\
-\xab\x98\xee\xa1\xf9\x81\xb4\xec!\xf9\x00)#\xa4\xe4\xa5\
-\xadC\xad\xfe\x0f\xb4\x147\x9ck).o\xdc\x01E\
-\xe6nOT\xe7\xd5\x92\x7f\x0c\xc8T;\xb7\xd8\xa6\x91\
-k\xb5@\xf3\x9f\x87z\xd0Y\x19_u\xe1\xe2<{\
-Iu\xc4T\x0a\x86\x9c1*CC\x07m\xd7\x90\xac\
-(\xdc\x808\x81|\x1e+\xb4Z\xc1\x00Q\x8b\xca\x99\
-#\x18\x89\xa2R\x10)\x9b\xa6\xe4\x8f\xb6<\xfd\xe2J\
-\xc7\xdf=\xc1\xf1\x8b\xafq\xb8\xc3\xf7\xacN\xf8\xde\x00\
-\xba\x04\xe8\x0a\xfd\xea96\x1f\x5c\xa3\xff\xd5V\xda\xbf\
-N\x85>\x9aT.\x14\x92\xd89\x92\x0e\xc0:\x10.\
-\xbb\x88\xabM\x87'W+\x5c]m\xb0\xbeX\xa1i\
-\x12$+v\xf7'\xdc\xbe\xda\xe3\xee\xf5\x11\xc7SF\
-v\x93\x9e\xb5`,\xa6\xa1&*\x00\x11\x02Go\x83\
-^(g\xf1:\xac:F=\xabI\xb6\x8f\x88\xc8g\
-\x96G\xbd\x0d\xdcn\xec\xe4\x84\xc0\x84\xac'd\x1cQ\
-0@f\xab\xf3\xe6\xc1Og\xff\x7f\xfc\xacY\x1e\xab\
-\x09\x86Wl!+\xf4\xa8Do\x9a\xb4\xfd\x00\x00 \
-\x00IDATw\x02}1\x91\xfc\xf6H\xf9\xd7;\
-\x8c\xff\xfaZ\x0e\x9f>\x94\xc3\x97\x0f8\xbc:`\xbf\
-\x7f\xb0\x8cK\xfd\xc7~\x10m\xfa\x96\xefW\x00\x18\xb1\
-+/\xf0\xdb\xe9\x05~{\xc2\xb8\xdd_\xbc\xf8\xf9\xdd\
-_\xdd\xff\x97\x9b\x9f_\xff\xdd\xcb\x0f\xb7\xbfx\xf1\xde\
-\xea\x83\xaf\xae\xda\xab\xfbul\xffv\x9d\xd2\xfb\xeb\xd4\
-\xaeW\x89\xa9\x8d\x81B\x93@%\xc1\xc4)\x22d<\
-\xa2L\xa3\x09\x18:\x7f]\x1dfE\xdd\x98T/\xc3\
-|]\xeaS\xc5\x013)ar\x00M\x14\xbc\xa6\xde\
--\x10\xfb0-\xe59\x17\x04\xf8\x95\xc4\xb9\xeb\xe8\xd3\
-\x009@\x99!\x0ch\x990\xe6\x09C\x9e\x909\x81\
-\xd2\x06\xd2n\xa0\x94QB\x0b\xa2\x06\xa4\xd9\xeb\x1f+\
-\x93Wg]$('B\x80\x06b\x8aE\x9af\x9a\
-\x9emt\xfa\xf9\x13\x1a?y\xca\xfb\xdf\xfeF\xf0\x12\
-\xdf\x93\x8d\x0b\x7f\xfe[l\xbd\x87\x94~\xc2\xdb\xf7\x7f\
-\xcaO\xfe\xfe)V\xff\xc7J\xc2\xdfB\xf5C\x816\
-\x04\x0d\x11D-\x88\xd6!\xe0\xb2M\xb8\xde\xf6x\xf6\
-d\x83\xa7\xd7\x17\xb8\xb8\xdc\xa0\xed:L\x93\xe2\xd5\xd7\
-;\xbc|q\x87\xdb\x9b#N'\x02\xd0A5`,\
-\x821g\x141&,\xc4`\x12OMB\x13\x93M\
- \x08\x09\x1c\xcc\x17\x16$L\x1a1j\xc4\x88\x06#\
-ZL\xfe(\xa6\x15j\x17\x8c\x08B\x19\x99&d\x1c\
-1\xe1\x80\x8c\x13d\x06O\xc6BA?^\xf4\xc6W\
-3\x97\x04\xcf\x94\xab\x85\xc5\x94\x15\xbaS\xc2WB\xfa\
-\xfb\x81\xe5\x9fw4\xfe?\xaf\xe5\xf8\xdf\xbf\x96\xc3\xff\
-\xf8Ro\xfe\xf09\xee\xbe\xdec\xda\x8f\xff\xfe\x93\xa5\
-\x15\x18e\xc0W\xd3>\xbf8\xed\x86\xdb\xdd!\x1f\xef\
-&\x94{\x09\xf1TbL\x13\xb0\x1a \xfd\xa4\x88j\
-Sd\x8cU\x0bK\xc3\x8d%B\xab\xcb\xebA\x1d|\
-\xcay\xcd\xbdx\x12sr\xf7y\x82I\x90M\x08\x18\
-\xc1\x18a\xa0\xc9\x88\xc8j-\x90:\x938\x8b\x10\xb2\
-Z\xd7 P\xe7\xd0\xd6\x98'$(7Pn\x00N\
-\xa6\xf3\x07\x02d\xc4q\xff\x1a\x87\xfd=F\x04\xf0\xf6\
-C\xac\xae>\x82\x08!\x1f\x0e\xd0\xc1\xa7\xa1\xb3ZR\
-9\x98\xb8&b\x03\x8a\x1d(u\x08\xb1\x05\x87D\xa4\
-\x80\xe4\xcc(e*(7GL/^\xc8\xee\xd5\x88\
-|\xfc>\x17\xfb\xfbZ \xbe\xc2\xba\xbf\xa6\xf5G[\
-j~\xd5(\xffBU\x9f\x0a\xa4\x0d\xde\xa2\xd2\x00\xb4\
-\x0a\x8cm\x13\xf1d\xdb\xe3\xe9\x93\x0d\xae\xaf/\xb1\xd9\
-n\x10b\xc2\xf1\x90\xf1\xf5\xcb\x1d\xbe\xfe\xfa\x01\x87\xdd\
-\x04-FIf!L9c\x92\x02%BL\x0d\x9a\
-`Zi\xc1\xe7\xdax\x03\x0cr!\x88'\xfd&(\
-N\x02\x9c\x14\x18LJ\x04\x19i\xae\xd6\xb5}^\xa0\
-4B\xf4\x84\xa2'\x14\x1cQp\x82\xce\xc3}\x05\xf4\
-\x06l\xde\xdc\x8f\x04:;ggv\xad\xfed&\xd2\
-\x07\x85~YX~wD\xf9\x97\x9d\x8e\xffr\x83\xfd\
-\xbf\xdc\xe8\xf1\x8b\x1b\x8c\xaf\xefp8\xe0\x07\xd2\xa3\xff\
-?,}\xc0\xcd\xf40\xfe\xf7\x87\xafn_N7\xa7\
-\xaf\x0e\xbbr\xdc\xfd\xac\xf9\xaf\xc3\x18\x9f\xe4Sie\
-\x90\xf8\x93\xb1\xf0j\x13\x02\xaf\xa8A\xd2\x16\x912(\
-:\xbf\xa9\x9e\x06 K\xa2\xd6,\xff2^\xd3\x1b\xe9\
-\xbc,J\xdd\x9d.\x14P\x94\xcfJ\x84\xfds\xf2\x9e\
-bb\x88z\xf9\x14\x05\x0f\xac\xec>\x8b\x7fT2\xf7\
-\x0d\xfe:\xb1\xab\x93\xea\x84R\x14C\x9ep*\x05%\
-\xac\xd0\xb4\x97\x90\xd8\xa3L\x80\x84\x16\x14Z\x14\x9c\xc0\
-A\xa0AL\xe4\x22&Ph\xa1\xb1\x85\xc4\x16\x92\x1a\
-\x8f\xc2\x88\xc24\xa6X\xc6\xebN\x87O.x\xf5\x93\
-\xf7y\xfb\xe9\x83\xcc\x8dw\xdfy\xcf\xfe,\x80\xde\x07\
-h\x8b\xd8|\x14\xfa'O\xb9\xffY\x87\xf0\x0b\x12\xfd\
-\xa0\xa8l\x15\x12\x12\x88#\x88zfl\x9b\x84'\x9b\
-\x15\xae\xaf.\xf0\xe4\xfa\x12\xab\xed\x05\xc0\x11\xf7\x0f\x13\
-^\xdd<\xe0\xe5\xcd\x01\xa7\x13\x00m\xa1\xcc\xde\xb58\
-AI\xc1MDJ\x8c\x98\x02B \x84\xc0\x08\x0e\x1e\
-!B.\x16\x1b\x0dYq\xc8\x05\xfb\xac8\x08\xbb\x8b\
-\xd0\xcc\xee\x81\xc2\x94g\x00\x81\xd0\x04\xd1#\x0a\xf6\x10\
-\x0c\x0e\x1cw\xd9H\xb1\xb8h\xd5\xa1?g\xd7\xec\xe3\
-\xdb\xe0U\xeb\xb6\xc5\x5c\xb1{!\xf9|\xe2\xf2\x9b#\
-\xf2?\xdd\xc9\xf0O\xafd\xf7\xbb[\x1c\xfft\x87\xd3\
-\xdd\xddB\x8b\xfeG\x82\xe7l\xed\xcb\xae\xbc8~\xb1\
-\x8f9\xa2\x9d(\xc6,O\xff\xaa\xe4\xf6z*\xdcK\
-\xc9\xe9gY\xb4\x1f\x89C\x87D\x8d&DM\x002\
-\x84\xd55\xdd,\xf8\x17)\x10*\x8f&.\x14\xc1Y\
-\xaf\xb0\x93\x08\x8f\xea\xeb\xd9]jK\xa7\x03\xc1\x00D\
-\xf6\xb5V\xd5<\xaa\xc0Y\xe8>%S\x96E\xad\xb2\
-g\x81\x96\x82)g\x0c\xe3\x88A\x0a\xb8\xed\x90\xfaK\
- t\xa6R\x14Z vP\x1a\xa0\xd1\x92\xc6\x9a\x12\
-8u\xa0\xd4\x03i\x05iz\x94\xd4\x10\x114pD\
-\xc89\xf0x\x5c\xa7rz\x7fC\xab\x8f?\x8c\x97\xcf\
-\xff0\xde\xbe\x181\xee\xf0g(\xed?\x0b\xa0\x15\x10\
-\x9e\xa3Y=\xa3\xee\xa3k\xee~\x99\x84~\xa2\x90\xa7\
-\x80vd\xd6\x07-\x136)\xe2j\xd5\xe1\xfar\x83\
-'W\x17\xe87[\x08E<\xec2n^\xee\xf0\xfa\
-\xe6\x84\xd3d\x81\x9cB\x9d\x8e\xce\xa0\x08\xc4\x14\x11\x22\
-#$\xf2\xb6\x04\x9bqCd\xe5\xef%\x9b\xb59L\
-\xc0nT\xec'\xe0P\x08\xc3\x1c\xef\xa4\xb9\xaa\x80\xce\
-\xc0S\xf4\x84\xa2\xc7\xd9]\x9b+\xb0\xa8Z\x92\xc7Q\
-\xce\xd2\xc8]\x9f\x91\xb3W\xe6\xfc\x8f\xe7\xe3\x91\x01}\
-\xc8$_LT~\xbd\xa7\xf1\x1f\xeeu\xf8\xc7\x97r\
-\xf8\xcdK\xdc~y\xc0\xe1\xb0\xb3\xc4\xe9\x7f\x88\xc4\xec\
-w\xaf\x07y\xc0?\x8f_\xee\xe56\xdd\xb4\xcaII\
-.Gh\xfb\x8c\x15\xebT\x0a}4)\xfa\x11\x01\xad\
-Fn4\x825\x81\xbc\x08\xb5N\x94\xab\xd3\xfd*\xc1\
-/\xaaV>\xa7\xcb\x803\x03\x90Q\xc8K\x0f\xb1\x03\
-\x88-\x161\xe0D(\xd9`2\x03\x90\x0d\x04\xa0G\
-\x94\x9f\xc5>\xc4\xec\xb9\xaa\x02-\xb0\xc2\xe1iBV\
-B\x8a\x1d\xda\xd5%(4F4\x04w\xd3\xf8\x04\x0d\
-\x02\x8d\x00R\x03nV\xa0v\x0d\xb4\x1bh\xdbCb\
-\x820QH\x0d\xb8\x14\xf0\xe1\xa1\x8b\xd3\xfeY/\xdd\
-\xc7W\xbc\xfa`\x8b\xe6\xb3\x09\xe3\xf1\xfe\x7f\x12@\xd4\
-b\x13\x9f\xd2\xf6\xf2\x1a\xab\x9fm\x91~\xce\xa2\xef\x89\
-\x965\x011\x82\x11\x89\xa9\x8f\x01\x17\xab\x16O\xb6k\
-<\xb9\xbc\xc0z{\x01P\x83\xfb\x87\x09/\xbf\xde\xe3\
-\xf6\xd5\x84<D\x08\x05K\x80\xaaINQ$\xc4\x14\
-\xd04\x11\xd1'\x0d\x04\xbf`\x0a\x03\xcf\x94\x05\xc7,\
-\xd8\x8d\x82\x87\x11\xd8O\x84\xa3$\x9c\x941a\x19E\
-_\xc1c9\x9a\xd1\xc1c,[\x0d;\x14g\xa1\x87\
-~\xc3\xb6\xd0\x9b\x9f\x9e\xdb\x9f\xc7\xf5\x07\x10\x02N\x85\
-\xe8U\x86\xfc\xeb\x1e\xf9\x1f^\xcb\xf0\x0f7\xba\xff\xcd\
-\x97\xb8\xff\xe3k\x1c\xea\xc9\xf5\xef\x19\xeb\xfc\xd0\xa57\
-\xf8u\xa6#\xdf\xc9\xab\xe9\xf7\x85'V*\x0d\x9a\xf7\
-\xd7\xb9\xa4T\x84\xde\x9f\x94\xbaN\x03\xb5\x88\x145\x9a\
-\xe2\xaa\xd4\x12\x9d%\xd7V\xb0\xd4\x01f\x05&,B\
-\xf1\xd6\x16\xe9y8\xa9\x15 \xd5\xea\x98r\x85j\xb0\
-\xb8\x07\xc1@\x02\xb34\x5c\xdd9/\x82%^\x00T\
-\xc3\xb4\x22\x82\xd3\xe9\x84q\x9aP\x88\xd1\xa4\x0e\xdd\xfa\
-\xd2\xc46)Z\x8c\x9c\x1a\x9046\x1e2\x06P\xd3\
-\x82\xba5\xb8\xdd\x00\xed\x06\xd2t\xa6\xec\xca\x00\xb4\x05\
-K\xa1xxHa\xb8\xbb\x8a\xb9\xf9p%\xe9\xa3\xa7\
-\xdc?\xd9I\xbe\xb9\xc7\xe9;[\xbf\xbf\x13@?\x03\
-\xe8\x19\xb7\xed\x07\xf1\xe2\xf9SZ\xfdu\x12\xfe\xe9$\
-\xe5ZU\x1aKi1\xf5\x1c\xb0m\x1b\x5c\xad{\x5c\
-]\xad\xb1\xbd\xd8\x80\xb9\xc5\xdd}\xc1\x8b\xafNx}\
-\x971\xe5\x06\x08\xd69(*\x96\xcf\x0a\x111\x02\xa9\
-\xf5\xeeQ\xef %6\x13^\x8a`\xc8\x82\xe3\xa8\xd8\
-\x0d\x8a\x87\x13\xf00\x12N\x851j\xc4\x84\x04\xa1\x88\
-*Z\x85\xb9\x08\xa7Z\x9d\x03\x14'\x0bm\xc9\xe9\xd8\
-9\x9bw\xd6\x89Y\xaf\x8e\xea\xe3\xaf\xbf\xb1h\xa6\xad\
-U\x01\xca zP\xd2/N\x90\x7f\xbe\x95\xe1\x1f^\
-\xe8\xfe\xd7_\xe3\xe1\x8f\xaf\xb1\xaf\xe0\xf9_\xe4\xb2}\
-\xe7\xd2\xaf\x87\x7f\xce\xf9\xb5\xdcMr\xfaT0\xb4r\
-\xa1\xdb\x0b<\xdb\x96\xdcvS\xa18i\xe4\x91\x92\xb5\
-\x9e\xe8RU@\xfeQ\x94\xac\x87\xca\xcb\xa9\xb2\xc2J\
-\xaa`\xba\x05Y\x9d\xa2\xae\x89Lo\x80\x13\x04\xe8\x19\
-\xa0\x00\xa3\xa5\xc9\xdd7&K\x82\x18\xa1\xc0.\xa2\x12\
-\xc0\xd5\x85\x83\x002\xa1L\x13\xc6\xe1\x88\xa9LPJ\
-\xa0\xb4E\xe86\x98\xb2%\x178\xd802\x92\xc6\xe6\
-%\xa5\x08n{P\xbfv\x0b\xb4FH-8\x1a\xbb\
-\x0b-\xc4\x04\x84\xd3>\xf0\xe1\xd5\x96\x87W\xef\xb7\xa5\
-\xf9\xe4\x19o\x9e\xaa\xe03X\xd0\xf1\xadV\xe8;\x01\
-t\x8d\x8e\x9fP\xd3_\x85\xfe\x83K\xee\x7fI'|\
-(\x8a-L\x8d\xd6\x5c\xb7\x98p\xd5\xaf\xf0d\xbb\xc5\
-f\xbd\x05q\x8b\x87\x07\xc1W_\x0dx\xfdZ1\x94\
-\x16\x1a#\xb2L\xc8*\xd6\xba\x1f#B\x04\xac\xe0\x91\
-\xc1\xd19~\xe2\xb9]\xf84\x02\xc7A\xb0\x1f\x14\xbb\
-\x01\xd8\x8d\x8cC\x09\x185Y\xe2\x8c\xa2\x9dX0o\
-Jd2\xb2\x00\x07\x08\x0e\x10\x9c\x00\x8c\x00\x95\xa5F\
-\xc0\xffo_-UlKm\xc1c\x10-\xf6\xa7\x82\
-\x87@\xa0\xa2\xa4;!|9\xb0\xfc\xf3\xbdN\xff\xf8\
-J\x0e\xbf\xf9#\x1e\xbe\xdca\xf7\x9f\x19<u\xe9\xed\
-\xf4\xebI\x1e\x86;A\xf9\x94$ny\xdb>\x93B\
-OJI\xab\xa2\x9c&\x0a\x1a\x10\x91T(\x08|\xf0\
-Xm\xd0\x13\x14\xb1b\xdf\xa2&\x9f\x9c\xab\xcb\xa6\x96\
-\xeb)\x0e\x22\xa9\xd9\x7f'vT\x8c\x14\xa0\xfaQ\x03\
-H\xd9\xaa]]\xbf\x81\x88\x9d\x85#h\x08\x00\x07\xb0\
-\xeb9\xc8Tp\x1a\xf6\x18\xa7#D\x15\xd4\xf4\x88\xfd\
-%44\x90\xc9Xg\x0el\x93\xfa\xa4\x01\xa7\x06\xb1\
-M\x08}\x0f\xea6@\xb7\x065\x1d8&\x84\x10\xad\
-\xd5A\x0b\xc0@\xdc\x5cq\xbc\xbf\xe8\xe2\xbe\x7f\xd6L\
-\xdd\xc7\x97t\xf9\xfc\x16y\x0d\xe0;\xe3\xa0\xef\x04P\
-\x87>l\xd1o\xd7\xd4}\xd8Q\xf3\xf1\x09\xd3\x13\x00\
-m\x00q\x22\xa2U\x88\xb8\xe8z<\xd9l\xb1Y]\
-!\xd0\x06\x0f\x0f\x8c\x977\x03^\xdf)Fi!\xcc\
-\xc8\x22\x98\xc4\x1a\xd1\x8cRtr%X\xd0h\xecL\
-\x98U]\x86\xac8\x0c\x8a\xc3\x00\xecG\xc2q\x0a8\
-J\xc0\xe4\x890\xa0\x96\xb4\xc3\xac\xce\x0c\x9e#\x04'\
-h\x8dw\x1e\x11\x05\x8f!\xf1\xe6\x0e\xa7G\xaf|3\
-:\xf2\xdf!\x02\x0c\x02\xdcL\xa4\xbf\xdd\xd1\xf4\x8f7\
-r\xf8\xed\x1d\x8e/v\xd8\xed\xf1\x9f\x1f<u\xe9\xfd\
-p\x1ce\xfa\xf4\xd5*\x5c\xffn\x95\x9e>G\x0c\x1f\
-(V\x97E\xa9\x9b\x04m\x02\xd3\xe4\xed\xd4\xa4\xc1Z\
-\xd3\xeb\x948oJ\xb4\xaak\x86\xeaRY\x905\xcc\
-1\x90`\x01\x10\x94 \xb4\x00\xa6>\x7f>\x07]g\
-\x05!\x8f\xae}\xa3X\xf1iA\xce#v\xbb[L\
-e\x84p@\xea7\xe8\xb7\x17\xfe^\xec\x08df;\
-\xa0\xd1!4\x84\xd0\xb5\x08]\x8f\xd0\xf5@\xd7\x81b\
-\x0b\xf6\xd9Q\xcc\x80O3F\xec\xd7h\xd6\x17!\xdd\
-o6\xe1\xd8>_Q\xff< ]t\xe8^\x9f\xbe\
-\xc3\x8d\xfbV\x00=\x03h\xcb]\xfb4l\xae\xd7\xd4\
-|\x1c\x0a\xbd\xa7\xa2+\x06\x85\x04\xa6\x9e\x19\x17M\x8b\
-\xeb\xcd\x06\x17\xab\x0b\xa4\xb0\xc2\xf1\x18q\xf3\xba\xe0\xf5\
-\x1dc\xd4\x0e\x85\x19\xa3fLZ\xa0\xcc\x88\x5ceg\
-\x01\xe5Z\x0a\xc2(\x12\xa0jB|\xe3\xa48M\x8a\
-\xc3\x08\x1cF\xc6)\x13N.\xf5+\xec\xf3>\xe6\x1e\
-\x13\xeb\xe4,:@pr\xf0x\xcc\xf3M=\x80\xb9\
-\xf8\xe6\xbc\x92\xeb<D\xa1\x99XX\xfaR\xcfm\x97\
-\x02\x86\xca]!\xfd\xe3\x89\xca\xef^\xeb\xf0\xbb\xaf\xe4\
-\xf0\xe2\x16\xa7=\xfe\x17\x8cX\xff\x9f[_\xc9N\xc6\
-\xe3\x9fvO\xbe\xba\xe8\x9f\xffK\xbaZ},\xc4\xcf\
-\xb2\xc6\xcd$x\x9a\x94cT\x06)\x13\x89\xb5TW\
-+T\xab\xb4\x15FE.r\x97FOW0\xe97\
--\x90.\x03^H\x83\x81\xd1%.=\x11e\x8aI\
-\xb3\x1b\x17faG-\x05\xc3\xe9\x80\xc3\xfe\xde&\xfb\
-Q@\xe86\xe8\xd7\x17F\xad\x17\x8b\xbel,fB\
-\x0c\x8c\xd0\x06p\xd7\x22t+p\xdb\x01\xa9\x05\xc5f\
-\xee\x22f\x22s\x0d\x19\xa0\xae\xa7\xb4\xbe\xa0\xd8n\x9b\
-H\xfd\xa6\xd7\xe3e\x8ffs\x89>\x9ep\x9a7\xc0\
-7\xd7w\x00h\xc5\xdb\xd0\xf6W\xb1{\xbe\xd2\xf0\x11\
-e\xb9\x22\x95&A\xb9c\xa2uL\xb8\xecz<\xd9\
-l\xd05+\x8cS\xc4\xeb{\xc1\xab{\xe0T\xd6\xc8\
-!a\xd0\x8cA\x0b\x84\x08\x1c\xa2'5-\xcb\x9c\xc9\
-|f\x08\x9b\x92\xa5(\xa6I1\xf8\xe3\x98\x09\xa7\x12\
-0h\xc4H\x09B\x0d@\xd6\x99h\xea9\x19E3\
-DG\x14\x1d\x00\x0c\x00YJ\x0f\x10\x97x&\xbfy\
-\x82Zc\x8cG\x00\xaaKP]\xba\xc7\x19\x1f{\xcd\
-\xb8(\x12\x00\x83\x12n2\xe9\xef\xf74\xfd\xee\xa6<\
-|\xfe5\x8e\xaf\x07\xecG\xfc\xe7\x22\x0c\xbe\xcfR\xe0\
-\xb6\xdc\xed\x7f\xbf{\xb9z\xff\xf3~\xf5\xf4\x9f\x90\x9a\
-\x0f\x14\xeb\xa7\xb9\x84UV^\xb3\xc6\xc0j\xed\x00\xb3\
-\xf2\x95\xa3\xa6\xe6\x89,t\xfcF\xa3\x22\x198\x04f\
-Q\xea0NUw=\xd4\xdd7\xd8\xe73x\xbc\xf3\
-T\xbc\x0f\xc8,\x15\x01\x9a\x91\x87\x13\x0e\xbb;\x8c\xd3\
-\xc9\x92\xed\xa9Ah\xd6h\xbb5\xa6R e\x04K\
-6\x9b\xe7C\x97C\x97@]\x0bn;P\xd3\x19\xb9\
-\x10\xac\x0d\x9fx\x19:\x0d\x02\xb8i\x11\xfb5\xa7v\
-\x93\x12\xad6\x9d\xec\x9fl\xa8\xdd\x5ci\xdf\xbc\xc0\xeb\
-oM\x16~+\x80V\xa0\xb0fZmBx\xda\x09\
-\x9e\x952\xf6\x84\x12\x13\x81V!b\xdb\xb6\xb8\xdcl\
-\xb1\xea7\xc8\xda\xe0\xf6A\xf0\xfa\x81p*=r\xec\
-q\x12\xc1I3\x0a\x91M\xb6b\xb76d;\x8dd\
-)6\x9cE(\xb2k\x8be\xc2P\x18#\x22&n\
-\x1c<\xc9l\x84*Hd\x06\x8f\xa8M\x95\x03Y5\
-\xb1\xeds\xb80\x22-\xe4\x81\x0f-~\x0c\xa0s\x07\
-O\xb1\x14\x88\xd6l\x90\xc2\x0a\xf2E\xd5\x06\x83\xec\x0b\
-\xd1\x17\x03\xe4w\xf7r\xfa\xd7\xaf\xe5\xee\xab\x01\x0f5\
-I\xfac\x5c\xba\xc7g\xd3\xab\xe1\x83\xd7\xab\xdd\xb3\x7f\
-m\xb6\xdb\x0f\x19\xed\x87\xa2\xfc\xacdt\xac\xc4\xa6\x8a\
-\x13\x88\xc5\xac\x8f\x95\xcc.\x07\xf2Y!\xadY\x99\x9a\
-\x0cu\x0a{\xb1@\x95<0pA\x03X\xed{\xc8\
-\xadP!s\xe3\x18l\x9b\xdc\xd5wP\x0a\x86\xe3\x1e\
-\xbb\xfb[\x942\xd9H\x97\xd0 \xa6\x158$St\
--#X\xb35\xf9\x85\x88\xd0\xb0\xf5\x975\x1d(\xb5\
-\xa0\x94\x8c\x91\x0b\xd5\xfa\xb0\xb74\x89\xb9\x8e)!\xf4\
-+J\xdd&5q\xb5i\xa6\xf6\xd9\x8a\x9a\xf5J\xbd\
-I\xed[\xd6\xb7\x02h\x83\x10\xd6\xca\x9b\x9e\xe8:B\
-\xaf&\x99R\x00\xa8\x03c\x1b\x1b\x5c\xae\xb6\xd8\xac/\
-\xa1\xd4\xe3\xee\xc0x\xb5\x07\xf6\xb9\xc1\x14V8i\xc4\
-Q\x06d\x22(\x9bI.T\xb92/\xf0+N\x85\
-\xaa\xe9\xac\x9br?\x9b\xaa\x8b\x02\x99\x82\x95~P\x03\
-\xe2\x06V\xbei\xe0\x11d\xa8\xd6\xc6\xea\xec\xa0\xf16\
-::\xab\xa7\xf2\x7f\xd1\x14F\xe7=\x03<\x02J\xad\
-\xf0^\x5c\xba\xfaU\xad\x11v\xc7\xa5(a71>\
-?j\xf9\xd7\xbbr\xfa\xe2+<\xdc\xe3\xc7\x0b\x9e\xba\
-\xf4\xf5\xfd\x17\xa7u|\xefO\xdb\xe6\xfd_\xa7\xd8\x7f\
-\x0c\x84O\x8a\xd0%\xa9\x06\x16\x04\x9b\x8a\xe1\x0d\xea\xea\
-\xb2a\x15@tf\xb7\xa9\xd6\xc8\xfb\xe1E\xd5=\xab\
-`\xaa \xaa\xcf\xd9\xe7\x5ck\x02\xea\xf7PUA\x22\
-\xa3\xd1\xa7\x13\x86\xfd\x03\x8e\x87\x9di\xf31#5k\
-4\xcd\x0a\x9a\x0bt\xca\xe02X-\x0a\xabU\xb1\xa4\
-\x00n\x12(EP\x0aF{E\x9eY\xf2\xb9\xa8\x1c\
-\xb0\xcf\x02\x83S\x8b\xd4\xae\xb9\x8d\xfdz\xd4\xf8\xacC\
-\xba\x88\xe0\xd6\xdf\xf4[k\xe3\xbe\x0d@\xf4\x84\xb7\xf1\
-\x82V\x17Q\xf9=\xa8^\x0b$E\x04Zq\x83\xcb\
-f\x85m\x7f\x81\x107\xd8\x9d\x12nv\x01\xbb\xdc`\
-\x0a=F$\x1c\xcb\x84\x09j\xc8f\xab$0\xb5\x01\
-s\x01\xac\xe4\xc3\x00\x94\xc5\x85\xc7\xc55\x93\xd5\xdc;\
-\xa1\x04\xa5\x04P\xe3\xa6\x1c\x80f\xcb\x84S\xb69\xa6\
-\x9a\xe1\xe3\xd4\xec\xa6\xf8\xf7=\x96\xa6 <N\x88\xd6\
-8\xa8\x16\xd0?\xe6\xe6\xe8\x0c`:O\x93\x22\x05\xd1\
- \xac7C(\x9f\xed5\x7fq[\x0e\xaf\xf1\xef<\
-\xbc\xe9?j\x9d\xf0\xc7r\x7f\xfc\xe0\xe1\xf6\xe1\xf3\xcf\
-W\x9b\xedob\xe8~EH\x1f\xb1JK\xa2L\xaa\
-d46\x5cO\xfcl^*\xd5\xab\xeb\xd9i\xefV\
-\xa5\xf9eO\x1d\xd4\xa1DgV\x093p\xaa\xabm\
-\x16L\xc9\x0a\x80\xad\xb3j\xc2p\xd8\xe1\xb8\xbb\x83\xe6\
-\xc9\x81\x1a\xd1\xb6k4\xa1\xc5t<B\x87\x11AN\
-6\x84 T\x00\xb1iBD\xf2ZR\x13\xc3'r\
-\x1d \xd5\xf9\xa3\x0b\xe3\x818P\x08\x0d\xa7\xd0\xb6\x91\
-\xc2UG\xf1\xaaAX\xf5\xd2Go\xb4{c\xbd\x15\
-@\x1f\x02\xb4\x8dm\xbb\x0d\xab'\xac\xfc,\x17\xb9(\
-\xa0\x90(\xd0:\xb4\xd86kti\x8d\xa14\xb8?\
-$\xec\xcb\x1a\x03\xf7\xc8\x888\x95\x8c\x11p?\x96\x8d\
-\xe7\xf7Rx\x81\xe9\xb0)j\xdf|U\xad\xf4\x01\xb4\
- \x14\xb6L6(\x81(\x81\xc8\x92\xa4\xf3HE\xf5\
-\x06k\xca\x00-d\x81\xb1;\xd1oL\x85\x85\xcew\
-rq;|\xaa\xc0\xec\xde\xd5\xf8G\xceN\xd6\xba%\
-\x0c<D( \xdee\x92\xcf\x8f\x94\x7f\x7f\x87\xd3\x8b\
-\x1b\x1c\x0f\xf8\xf1\xc5=\xdf\xb6\xf4\xfex3\xde5/\
-__\xaf>\xfe\xac\xe5\xed\xa7\x01\x9b_\x15\xd1\x0di\
-\x89\xa4\x85\x8c\x85\x03HLu|\x96\xde\xa7\xc5\x99#\
-\xf6k&\x82:Y\x1b\xc0<\xae\xc4z}\xd8+\x0e\
-\xce\xc8\x85\xb9~\xd1\xcbyPUP3\xf2p\xc4q\
-\x7f\x87\xe1\xb03}n%\x80\x03R\xec\x10\x941\xed\
-\x0f@\x1e\x108#F5u\xdaH\xe0\xe8\xeaDA\
-]\xd7\xdb\x0fL%0\xc4;c\x17\xa9\x19\xa9\x15*\
-!R\x08)1x\xd3p\xbaj\xb4\xdd\xf4\xe8\xd3\x11\
-\xc7\xb7\x12\x09o\x05P\x87&Dn\xfa\x96\xdbK\x12\
-\xba,\x92[\x00\xdcR\xa2u\xb3\xa2U\xda\x80\xd1c\
-?\xb68\xe45J|\x82\x22\x09C1\xd2\xa0\x90]\
-,\xe2\x1a\x04\xda\x99\x9e\x91\x97\x11\x18\xfe1+f\xf0\
-\x08\xd5\x13\xc8\x93l\x9e(\xb5q\x86\x02\xd5\x02\xf1\x87\
-\xfa\xa9ag\x5c\xa8\x9b\xdd>\xd6\xb4\x8d\x93\x09\x8f\xe3\
-\x1a\xefm\x81\x9dF:'U\xcfm\x96\x03\xca|p\
-U\xc8\xa4\xa4w\x13\xebgG\x1d\xfe\xf8\xba\xdc\xdd\xee\
-\x8d8\xf8\xd1[\x9f\xbaN\xf8\xb4d\xfd\xc9\xee8\xbe\
-~\xd1\xe1\xf2\xd3\x96\xba/I\xe9=\xa8\xf4$\xc2\x22\
-B6\xcbH\xd5\xee\xae\x9e\xb9\xc6\xe4a&Y\xfb6\
-\xd7X\xc9\xc4GlY+\x8au\xb9.`\xa9\xc5\xa2\
-\xcag@\x02Y\xbe)\x8f\x98vw8\xee\xefP\xf2\
-\xc9\xef##\x84\x16\x89\x22h\xb2\xf9\xb6\x81\x04\xa1\xf1\
-)\x80\xc1r\x8c\x14\xb1\x80\x07\xc5bb?\x04\x8c\x06\
-\x06\x16\xcf\xdek\xce\xa5\xb8p&\x85\x80\xd07\xd4<\
-I\xd4l\x92\x95K\xbcu\xbd\xed\x05\x8a\xe8\xb8A\xd3\
-\xb4\x14W\x01\xd2\x17\xd5\x10\x89\xa8K\x11\xab\xaeGJ\
-=\xc6\xd2`WzL\xf1)\x0ao1M\x05C\x16\
-\x9b\xd8\xc3KE\xed<\xb6Oun\xa56EP\xd7\
-\x07\xd3\x85\xce6\xa5\x8b3\xc1Br\x0a\x13\xa6\xe6\xa9\
-\x9a\xa1\xba\xc8\xf1\x91\xd3\xd9\xf0\x83\xc9G<\x18\xd8\xe6\
-q\x1e\xe72 \xcbG\xdb\x0cK\xed\x9b\xcc\xbf\xeb\x9c\
-\x89s\xed&\xe2IX\xee\x06._\xeee\xbc\xb9\xc9\
-\xf7G\xbc;\xd6\xa7.\xe5\xd3i<\xd2\x9fnW\x9b\
-'\x7fl\xd2\xc5K \xec\xa1\xfaD\x15j\x93\x8e\xcf\
-\xd4\x1e\xf0\x8dB[%w\x83\x5c}\x98\xdd]\x17/\
-\x98\xacB\xfes\x9c\xc4\x8f\x80\xa4N \x98\x95\xb0\xc3\
-\xb2\x8cG\x1c\x1fn1\x1e\x1f@\xc8\xde!\x1b\xd0\xc6\
-\x0eQ\x01\x0c\x07P)H\x91\x10\xd5'n\x04\x05\x05\
-\xb5A\x15\xb0T\x07)\xc1\xa4\x85*\x13Kg\x0c\xa2\
-E\xc1\xaa\x13\xa8x\xf7RPf\xf0\xaaE\xf3\xac\xa3\
-\xb8\x89&\x9a\xfb\xfd-\xd0\x0aL+\xa2\xd8171\
-kR\x01\x07bZ7-\xda\xa6\x83\x84\x16G\xe9p\
-\xc0\x06\xa5\xbb\xc6\x98\x03F\x9c\xac\xa5\xba\x9e*l\xe5\
-\x87U\xd0\xcf\xb36^\xd9;k|\xfa\xb0&\xaeG\
-\x06(\x98\xf6\x979\x0a\x0a\x11\x9bHP\x1fDF\x98\
-\x025\xc7\x00\xd4|\x8f\xc2Z\x91\xe1Vg\xe1\x89P\
-\xf9\xd7z\xb7\xdd\xff\xad?.s\xaf\xbf\xb9\x83s\x16\
-H\x9dy?\x15\xa2\xd7\x03\xe7\xaf\x862\xdd\xdec\x18\
-\xbf\xdf\x9e\xfcq\xad\x97\xe3\xad(\xbd<\xae\xdb\x8fo\
-W\xf1x\x1b\xb4;\x91R\xd1y\x0e}md\x10\x05\
-f\xc9\x91\xf9J\x13\x9c\xecd\xd8\xd4\x8d\xf9r\xdb5\
-\xadc'\x17%\x9eo|]1\x86\x02-\x03\xa6\xc3\
-\x0e\xa7\xfd=\xcaxB\x84U>\x10\x07\xb4\xb1\x05\x8b\
-@O\x07DR\xd3LG\x04s\x02\xfb02F\x99\
-\xa5\x95]?xv2\x16\xa1\xfd\xfa\x92B$\x03\xf9\
-\x04\xc8D\x800\x11\xf5\x0d\xd23\x9f\xa1\x11\x97\x9f~\
-\xbc\xde\x0a\xa05\x22\xb5\xe0\xa6\x01\xba\xa8hT\x99\x9b\
-\x98\xb0iW\x88\xa9\xc7\x80\x0e\x07\xde\xa04Oq\xa4\
-\x0e\xc7\x5c0\x82Q\xd8\xda\xa8]<\x0c@\xb6\xa4[\
-\x9db\xe0\xf2\xad5\x06Q\x0f.\x89j\xd7a\x9c\xcb\
-\xd7-\xddP<^\x12\x88\xf7\xe8\x03fyTkb\
-\x8e\xe6\x07a\xb9\xadP\x1b\x01b0.\xcb{\x80;\
-\x13\xb4\x00\xd0\xc0\xf3\xcdnT;-a\xfdc\xfb\xa2\
-\xfa\xf5I\xa6\xafG\xd5\x03~tI\xd3\xef\xb7vx\
-\xa5+\xb9\x1a\xc7r\xba\x9d\xca\xe9\x06\x1a\x8f,\x5c\xb4\
-\xe8,\xd0\xb5h\xb6\x1aH\xe6C\x8c*\xb1\xc0 \x15\
-\x88Z\xeeH\xfd\xe0\x0a\xb4\xdc\x1a+\xb6~\xbc\x1f\xd5\
-\xdd\x08;(3\xcap\xc4\xf1\xee5\xf2p0w\x0e\
-\x8a\xa2\x82@\x0d\x12\x02(g@'\xab\xe2\xd7`e\
-\xc5\x1c\x10\xeaXL\x18\xcf\x07\x11\x80\xb2\xed'G4\
-y\xf8\x00'E\x0a\x14Z20\x9d\xa0y\x04Y}\
-\x5c\x1b\x88\xaf\x12\xc5\xcd\x06]\xfa\xb6k\xf6V\x00m\
-C\xc3\x1ds\xcb\xa4k\x06u\x11\x81\xd7\xa1C\x9fV\
-P\xeeq\xa2\x0d\x8e\xe9\x1ac\xf3\x04\x87\xa9\xc1\xa0\x83\
-\xf5\xbas\x848+\xa6l\xc7\x89h\x81\xfas5\x06\
-\x5c\xc4R\x8cqY\xfa\xdd\xa3g\x9e\x0d<V\xa2\xe1\
-\x0d\x5c\xbe\xdf\xebP,hp\xbfM`)\x9az\xaa\
-\x9c\xb3>\x16\xdb\x90\x12\x88\x9d\xad\xf3p\xa7R\xdcu\
-\x030-\xea\xa2\xf6\x1a\x03\x10\x05\xa1\x08\xe9n\x82\xbc\
-<\x94\xf1\xfe!\x8f\xefT\xec\xf3x\xbd\xd2I?\x1c\
-\x07\x19\xef\xc6|z\x19\xa4{P\xe1I\xad\x8f\xbb\xde\
-5\x07\x13\xe6\xab\xb0\x84A\xc6\x0f\x1b\xd1\xedG\xfc\x19\
-9\x17\xcc\xef~T\x08o\xb3Q\x1dlZ\x80\x92Q\
-\xca\x09\xb2\xbb\xc7\xf0p\x07\x9dF0\x5cN\x19\x84\x8e\
-\x13\xb8(\xa8\x8c6C6D\xab\xc7\x0f\x82\x18\x04\x81\
-\x05L\xc5\xffM\x05ImE\xd7\xf9\x90T\x05Hd\
-\x8e\x81H\x15\xc8\x052\x0e\xd0<\x00R\x88\x89B\xa4\
-\xb0j\xb9\xd9ny\xddyr\xeb\x8d\x94\xc5\x1b\x00\xfa\
-\x04\xc0udn\x19\x9d\xaa\xac\x15\xe8#\x05\xeeS\x8f\
-\x18;d\xea1\x84K\x8c\xe9\x1a\x07Z\xe1\xa40r\
-\x80\x22\x943T\x93\xefN\xd7/`2\x85\x7f\xc0\x04\
-\x22\xb0\xe4\x0ej\xbd\xd3#\xf08\xe3f'\x91\xccg\
-\x1e\xd5\xba\xa53\xa1\xbf\x0a\x16\xeb\xd0\xf1\xa3M]\x11\
-N\xeb\x98\x0f\x0b\x5ck8S\xdf[5\xe9\x0b\xf9`\
-\xec\xcc\xac2G\xb5f\xabd\x05v\x85\xf5\xe64\x8d\
-\xbb=\xc6w\xd2\xfa\xf8\xd2\x92\xa9\x0c\xc3\xe14\xf1\xe9\
-uK\xf95i8Bq\xb9\xc8\x89\x0a\xaaP}\x0d\
-\xc0\x1f9\xc6\xe2\xb1\xe9,H\xa2\xb3C\xa2\xb3\x1b\xbd\
-D\xf0t\xfe\xd3*@\x19\x90\x8f\x0f\x18\xef_A\xc7\
-#\x82\xd8\x01l\x1e\x88\xa9cc\xccP\x16P\xb2\xdf\
-\x1bB@\x08\x02\x0e6\xc9\x1c\x1e\x0fk\xe1\xd9uW\
-gp\xad\x8a\x05\xb3\x92\xaa\xbd\x15\x03\x90\x0e'\xc8x\
- \x95\x0c\x06q\xe2\xd8\xb6\x92\xb6\xeb\xd0\xacW\x82x\
-x\xcb,\xa17\x00t\x0d`\x13\x9a\x10\x98;\x81l\
-\x04\xe8b\x88\xdc6\x1d\xc0\x1d\x06Zal.15\
-\x97\x18J\x8bB\x19\x12\xa2\xe7d\xd2\xd9\x5c\x19\xfb\x1f\
-\xa9w\x16\xfa\xb3\xeaA;\x5c4\x8f\xd8j\x9et.\
-\xdb\xd0z,\xf9I\xa5\x0e\x1e^~\xf1ly\xcc\xad\
- a\x07\x8c\xcd\xe40]\xb0\xb3\xd7Q\xfc\x0e\x8a\x1b\
-\x9c\xc5\x07&\xb7:^0\x7fv{\xe7\xf2\x1e!\xd2\
-\xa32\xdd\x0e2\x1d\x0e&\xff\xfa\xae\x02\x08\x82\xa3\x8e\
-\xf9n\xcc\xf9\xf0\xa0\xb1\xdc\x91\xd2\x09\x02!\xad\xd5o\
-2g\x08\xcecL\x9d\xa3\x22\x00\x22>\x80X\xbcf\
-n\x11A>;\xf6\xdd\x95\xf3\xb1\x9c*\xd02A\xa6\
-=\xa6\xfd\x1d\x86\x87[D\x19\x11\xdc\xfa\x90*\x12\x07\
-\x04U\x90\x8cX\xa6d\xb8\x0exT\x1f\xc4\x5c\xea[\
-\xb0\x03R}d\x80\xaa\xb1\xb8\x226m\xd0\xef\xbb\x17\
-\x98\x03\xb9\x80\xc6\x13t\x1a\x80\x9c\xc1`\x22\xe2\xd8R\
-\x5cu\x14W+4\xe9`\xa3P\x1e\xdd\xfb7\x004\
-\x00\x14C\x0a\x91c\x8f\xa2+\x00M\x88\x81c2\xeb\
-3\xa6\x0b\x1d\x9a\x0b\x8ciEY\x83\xed\xeb\x90\x01X\
-\x07#*\xbb\xe1\x1b]5\xcc\xd4\xf2\xbc\xf7\x01\xc0\xc7\
-0V\xf9VA\xdd\xef\xce\xa4\xd5)OL\x983\xd4\
- \xff\x9d\xec\xb2E\xce\xc8Y]\x90\xb9\x10u\xc4\xb4\
-\x16\xf7\xc5Ku\xd20\x97\xf3\x9c\xf9\x10U\xe2\xbc\x0a\
-\xf3\xd6\x09\x0b\xd5QT\x9b\x94s*\x90\xdd\x80|<\
-\xe2\xf8c\xa9\xb8\xfe7\xad\x1dH/\xf21\xe7\xe9t\
-P\x9e\xf6*\x18HH\xd4\xcc\x0e\xe9\xf9\x05\xfc\xe6U\
-0\xe9Q\x18!P\xecP\xf4\x01\xc8*\x02\x91b\xcc\
-\xaa\xab\x9f\x1a!D`\xb5^\x1f)'L\x87\x07\x8c\
-\xfb[\x94\xe9\x80\xa8.c\xa2&\x8b\x99\x08 \x99\xcc\
-\xaaE\x80) \x045\xda:(@\xc5cg]2\
-\x19\xd5\x93\xd1\xf3\xe9\x825'\xe4 r\x00\xe98@\
-\xa7\x09\xeaS\xbf#Bl\xb9\xed{\xee\xfa\x06}\xb4\
-\x06\xe3\xc7\xeb\x0d\x00\x15\x00\x0dGN\x14Z\x067\x91\
-\x11\xdb\x90(\xc5\x0e\x99W\x98\xda+\x0c\xed\x16'\x8a\
-\xc6\xb8E\xff5\xe4\xc8\x9e-7\x99J\xa5'\xa8\xb0\
-x\x5cv\xa1\x19s\xaf\xbb\xe5\x10<8\x9ds4\xce\
-C\x04\x8bg\xaa\x90n\x05\x0fT\x8ceq\x8a\x9b*\
-M:[\x1e\x00\xb0\xd9\x9aR-\xd6\xccD.\x00Z\
-vB\x95\xaa5\x89\xda:hW\xec\x0f\xc8\xae_\xf2\
-\x9d\xcdU\xef\xc6Z\xa9\x08\x8aJ\x19Q\xf2\x80\x82\xac\
-B\x1e\x7f/\xee\x96}\xa8\xd7\xf3\xcc5\x06\x9b\x91\xa2\
-\xe2\x0f\x81\x92\xc5M\x22b4\xb3\xff\x0e\x9a\x0f/g\
-\xdd\x86=\xc6\xfd\x1d\xf2a\x07\x86\xfd\xbc\x88\xb9]\x89\
-\x08IL>\xd3\xc6\xc1\x12b \xc4\xa0\x08l\x92\xc2\
-3\xe3VO\xf1\xca\x1c\xaa\xfd\x1e\x15#\x93,\xaf\xa8\
-\xbe\xd5\xdc:M\x052N\x90\x9c\xa1E@`\x0a\x94\
-RK\xcd\xaa\xe3\xb6K\xe0\xb7\xf2\x05o<i\x8dr\
-\x11\x11\x91\x83\xc6\xd0\x12\xf1*\xb5\x1cBK'^c\
-J\x97\x18\xd3\x1a\xa3\x06H\xac\xe9\xb4\x00a\x9b\xb4\xad\
-\xc5U(\x85\xbd\xbb\xd0\xadO=\x9d\xdcl\xd7\xc4\xb3\
-\x99Y\xb5\x0b\xad\x0b\xc8\x98\x01ct\x82\x09C\xf8\xa1\
-'u\xc2Z\xedO\x81'\x1d\xd4\xc9\x84:\xf2\xbd\x82\
-K\xcbbu\x14\x16\x0b\xcf4w\xdd\x10\x15\xb8N\xae\
-\xfa\xc9\xa8\xa40=K\x14&\xcakt\xe7zn\xef\
-\xe8z\x09\xa0W\xa0\xd8\xf8\xf0B\xc5\xc2\x9e\x0a\x16_\
-\xd5\x13\xab\xd7\x91\xe0\x8c*\x00\xf6Y(,\xcb\x81v\
-\xd6\xf1[c\xa9\x1a\x7f\x88\x8e\x90\xe9\x88\xe9\xf8\x80\xe9\
-\xf0`\x95\x05\xe4\x16KM\xed\x22*\x10\xd4\x0a\x869\
-\x10B\x08\xa8%n\x81\xc4\xe6\xed\xaa\xce#6I\xd5\
-\xa6M\x88\xed\x0b-\x05\x22\xf9\x0c@\x0e\x22\xcb\x0d\xdb\
-\x0c\xdc)\x1b\x80T\xc1\xc4\x94(\xa5\x16i\xdd\x22\xae\
-\xc2\x0f\x00\x90\x06o\xa3\x8a`t!Q\x1b;\x02w\
-\xc8q\x8d\x9c\xd6(\xb13\x95G\x11@\x83\xa9\xe0\x08\
-\xec\xe4ag\xbd$\xd8\xe6\xad\xd5\x02\x04(\x8b\xb7\xbb\
-+\xe6\xe9\xd0P\xcb\x00\xaby_\x22jy\x04g\xd2\
-t>P\x0c`V=\xa0\x0e\x16\xa06k\x19\xa0\xdc\
-\x02\xd1\x02 \xf1\x02H5]&(\x07\xd4\xd3\xf4Q\
-\x8a\x95d\xa6\x12\x96\x9bL \x22%\xa2B\xc0\xd4\x22\
-\xbd\xd3\xee\x9b\xad/!\xb8\x02t\x14\xc8\xe4\xc1\x0c\x9d\
-\xa5z\x94f\x17\xbd^\x8a%\xe1c\x1fD|O\x14\
-(\x17\x00\xd1c\xa1\xfa\x9f\xcc\xb1\xbb\x96\x0c\x95\x01\xd3\
-i\x8f\xf1\xf0\x00\x19\x8fHj\x15\x04\xd5E\x0f \x04\
-R\x17K,\xe6\xba1#0\x8cu\x83\x03Hjr\
-\xdc\xe3\x05\x11\x07\x8eY\x1f)e\xde\x07\xf5 \xae\x09\
-U)\x8a\x92MHRU\x89\x999FNQ\xe2&\
-\x22\xac\x12\xda\x9a3\xf9\xee\x18\xc8\xae\x87 \x90Jb\
-\xa0\xe5\x86\x12\xf7\x98\xd0\x227[\x94\xb8\x82r\xb2\xc4\
-t\xa8Ta\x9ce\x07\xc8'\x95A\xbc\xee\xa0^\x0c\
-\x82m\xec\xd9\x02\xd5R\x1c\xfb\x1ea3\xd5&\xf6o\
-\xd9\xea*[\x08\xcf\xeb\xd8\x89\xe1,]\xbd_\xde\xe0\
-5W\x16T\x00\x09Aan\x9e\xd6\xd6\x06`\xb6D\
-\xf3\x01X\xaf\x08{\xa1d\x0d\x82 \x80\xb29\xa2D\
-\x19\x84)\x22\xbc\xe3\xe0\xa9K\x14\x9a\x15\x92\x15`\xb5\
-\xfbi{g.\xb6\xfd\x96+a\xd7\xd9\xe3\x1ev6\
-\x15U\xd94\xf8\xe7\xde\x90\xa7\x0a\x95\x11:\x1d\x91\x0f\
-\x0f(\xa7=\xb8d\xf3\xee\xd5\x88\x87\xe0\x9dF\x96\x8c\
-\xb7\xa6\xb9\xaa\x05Y=\x18+\x94(\xd6\xeeH\xc0<\
-\x14\xb9T\xb7\xad@\x8a\xb8\xca\xea\xe2\xea\xe9\x99`\x8a\
-d1\xa1z\xb1C\x9f\x03#D\x8e\x9cy\x154\xf6\
-\x1d\x9a\xefg\x81\x00\xa0PQ\x90H`\xd6\x14\x1b\x0a\
-\xb1\xa3\x1c:h\xb7\x82\xa6\x06\xca\xc1v\xa3\x15\x1c@\
-\x03\xd9\x86\x1563\xa2\x0c\x16\xe7\xb5ji\x0c)\x0a\
-\x89W\xea\xea\x19x\x0a\x84\xab\xf5\xb0\x0d\x5cg0\xf3\
-9\x9b\xe6n\x80\xb2\xf9\xb4\x06$\xf8\x855\xe0\xda\x7f\
-Na\x97J\x87{{\x83\xb3\xdc\x95\x0c\x12\xd0\xfc\x9a\
-\xa0\x9c\xc5a\xbe\x85\xe0\xc7\x0dA\x89B!\xa0\x84\xbf\
-\x18\x00\x99\xab,4\x01\x85\x9d\xe5d?!\x17\xe6\xf2\
-|\xcdA9\xc1\xbd\x90\xe2\xee\xb3\xdd\x8fz_\xea\xa3\
-\xa6*J9\xa2\x9c\x1e0\x1dw\xd0i\xb4\x86\x07\xb2\
-\xe4{\x80%EI+\x8b\xe7\xa3X\xd8Ku\xbc\x22\
-O\xb4\x98*y-Zv\x80H9K\x87\x14q@\
-9\xd1%j \x9f\x01TPr\xb1\xe9vD\x88!\
-!\x85\x148s\xc7\xc2]\x83Z\xd8\xf9x\xbd\x15@\
-\x19E\xc1,\x89\x1b\x0d\xa1\x01b\x0bi:h\xdbA\
-b\xb0\xd0\xc3-D\x08\x1e\x0a\xfa\x09\xae\xae\xe0R\xad\
-\xc2B\x0e\x9b\xfbU\xdb\x1a\xf5\xcc\x07Vf\x9b\xed\xe2\
-te}\x97\xe6\xed9E=s\xf86\xfdZ\xb98\
-\x00\xdc]s\x10Re\xea\x083\xc8\xec\xa29;\xe7\
-\x1d\xadFm\x8a)\xc78\xadI~\xac\x9e\xfb\xf6j\
-})\xde\xd8\xfc\xc6\xf5{\x87\x97BT\x94\xb5\xa8j\
-e)=\xf0\xae\x19}\xff>\xc3\xd2Y#\xfc\x5c\xa0\
-\xbb<\x96f\xbc\x9a\xdc\x14\x88\x9c\xa0\xe3\x0e\xd3\xe9\x1e\
-y<!\x08\x99\xac\x19\xce@\xe7\xe3\x88\xab\xe5\x09\xde\
-+\xc4>\xa3\x08\x15\x08\x0e\xa0Y\x10_\xe0\x16\xa68\
-\x03\xe8n\xdb9\x80T} \x98Y'+\x1b\x03\x08\
-\x11M\xec\x109\x11+%RM\xe9[d\xb0\xdf\x00\
-P\x04\x00%%\x0e%r\xa7\x1c[S=I\x1dJ\
-l\x90\x03\xcfm\xd9\xb6]\xc3\x129h\xdd\xb0\xd6\xe9\
-a\xd4\xf2Y\xd8P\xd97\xaa\xfc\xbbY\x08f\x1f\x86\
-\xa4\xc1\xef\x80W\xed\xce\xaeB\xb56\xe2\xa0\xf0::\
--\xe6.\xaa\xb8\xff[0'W\x9d\xb8PQ\xab\xb5\
-\x13S\xf0\xb1\x9b\xc3~\x03\x8dR%g\xf7\xce}y\
-\xf5\xb4\xaa\x92<\xaa\xb8\xfb\xcbY~\xadf\xce\xe4,\
-\xceQ|\xe39\x8fg\xe6\x03\xe8\xfc\xe0\xacn\x9f\x15\
-\xa2\xd6\x07t\x84\xe4\x07\xe4\xe1\x0ey\xbc\x07\xab\x22R\
-B@\x00\xa4*)\xf9\xc8p\xd4\xd2\x1c\x9b\x84\x1e\xea\
-\xde8\xf36\x04\xf0= 3@\xf4\x8cB\xd7\x99\x9d\
-\xabo\xb6~\xd4\x99b\xb7\xd8\x9a\x11\xb9E\x1b{S\
-hP\x170\xfd\xbe\x002QWUa\x96\x90\x1a\xe1\
-\xd0Bc\xa3%\xb5\xc8!\xa2\xb0UY\xb3\x02\x04v\
-\x05|\xbf\xe0\x8a3z\x90\xe6\xf8\x85*\xadL\xe4~\
-\xab\x9f\x08\xc4\x90\x226\xba\xc4\x05&f \xb2\x9d(\
-4\xbb\x0a\xb4\x5c\x10\xa5\xd9\x05\xab\xa0\x22\xae\xb1\xcd7\
-\x00D~JUC\xd7\xdd\x19\x00\x00 \x00IDA\
-T\xf2b\xde\x00fq\xa8\x06\xb7B\xce\x1a-\xc4\xb6\
-ytrvD<\xaaH}g\x97B\xc8\x0e\xa3\xac\
-F\x81\xb2>>>\xf4\xec\xff\xe7\xb1d-\x0f\x9d\x07\
-\xdb\x1bU=\x03\xc7]-\x14H\xd9\xa3\x8c\xf7\xc8\xc3\
-=d:\xa1\xd5\x84D\x04\xf6\x84'\xcdCQ&K\
-\xb4\xc2\xa9k\x06\xa2\xa78\xcc\x9a\x89\x0dJ\x9e-\xa3\
-x>\xb1Z#q&\xee\xec/\x98\x0f\xe3sW\xce\
-ciD\xc4\xd0\xa2M=\xb8\x8c`QbU\xe2e\
-\xe4\xf9\xa3\xf5\x06\x80^\x00\xd8\xa9\xaap\xc8!%a\
-nDB\x03I\x0d4D\xa7*\xc9\x7f\x9de\x82\xed\
-\x1d\xf1\xec.\xcd\x7f\xcb\xd9\x15\xae#\x04\x89ji\x8e\
-\x02\xc5~\x86\x05\x00\xd72w\xf8\xef*\xf3\x09a\xcc\
-\x0a\xec\xb9\xe0nb\x8dm\xc4\xea\xe7\x0d\x5cd\x14\xaa\
-\xc7<\xd5R\xd6Pj\x01\x90\xda\xdf!\xa64#N\
-4\x91\xd0|:\x19\x16\x9d\x88\x00#\xcci\xf6w\x7f\
-\xd9\x86-T\x01T\x99IZ\x1c\xb9G\xd7\xa2\xda\x19\
-\xa8\xbb\xbc\x95H8\x8b{H\x05$&\xfc\xab2\xa0\
-\x8c\x0f\xc8\xa3\xb1nA\x04\x91\x1bg\xda\x0a\xcc\xead\
-\x07\x91O\xb8%\x1b?\x19\xa8\xb6d\xfb|o-6\
-}\xd6\x0f\xbbjX\xaaey\x9c\x17t'|>\xe4\
-\xb1X#\x00\xf0\xa6\xcc\x14[\xb4\xb1\xa12\x9e\x80\x92\
-\xc1(\xd4\xb0\x8f\xaa\xf8\xc6z\x03@\x9f\x03x(E\
-\xb3\x22S\x8c\x999\x8a\xc6\xa4\x88\xae\x8aCg\x13\xd3\
-\xeb\xc1\x0e\xef\xe5\xd4\x9a\xfd\xacIM\x9a\xdf4\xcf/\
-\x99\xf5\x99S/L\x90\xe0?Su\xc1<\x0a\x99O\
-\x11Xq\xa2\x19#\x86\xa8\x18K\xe3L\x8fi\x95\x95\
-*\xac\xe3\x89<\x98p^=\x8d  \xb8\x10\xa3\x7f\
-\xcd\xa4P\x17\x09\x9cyZ\xf7\xa1+\x89 \x1a\x10\xcc\
-\x98\x93\xd42\x96w|\x19\xb9eJ\xaf\xb3\xcf\x8d\xa5\
-j\x0d\xcb\xd5\xf2\xaf\xfc5\xf2\xf1#\xf3(\xb4\xea\x02\
-\x16@\xb3\xcb\x04O(\xd3\x1eex\x80\x8c{\xa0d\
-D\x8a\x880\xe2\x01:\x810\x02>6\xc04M\xe1\
-\xf1\x8f\xed=f\x05\xd7\xb2\x1dUh\xa1951\x1f\
-\x903(\xce\xda\xcf\xe7wO\x95\x90\x7f\x9c\x00&F\
-\xe4\x06]\xdb#\xc5\x88)O\x04\xc9\x14 \xc4\xdf\x17\
-@\x00p\x92\xacJ\xc8\xc4a\xa2\x10\xc4\x8a\x8d\x92\x02\
-Lu\xcc9\xc8\xa9H\xf7ug\xa2xv\xdb0[\
-\x0e\x22\x9eO\x0d\x10Y\xc7\xaa\xda-\xaa\x96\x09\x81\xcf\
-\xcc\xb0_\x0c\xab\x87G-\x91\xaf\xc9<V\x03\x91\x11\
-\x09l\xd4d\xad\xe0\xa9Yp\xf66\x0aO\xe0*\xc4\
-I\x02k\xe6R\x0aNe\xab\xc7\x95vu\xc8O\xa5\
-\x02s\x11\x84\x18\x01U\x9a\xe9\x9d\xf7\xde\xceV\x0d\xe0\
-\x19\x15R\xd5I[\xf2l\xe7\x00zL\x1c\xccU\x06\
-\xd5\x0aI\x81\xca\x04){\xb3<\xd3\x01(\x19A\x19\
-\x91\x92\xed\x03\x99\x00\x0c\x0e\xa0\xec\xbf\xd5\x00`\x16\xa8\
-JQ\x09j\x1b~%\xfe\x1em\xee\xca\xa6>\xc2\xcd\
-7\xcf\xbe\x9a\xd2\xa9\xf4\xac)\xdd6M\x87\xae\xed\x11\
-\x98!\xd3\x08\x94\x09\xec\x02\x05o\xbbJo\x05\xd0(\
-\x22\xc24R\x0cGp\x18\xc0A\x88\x83\xe3\xd4\xf8{\
-\xb0\xc70\xea \xf0\x9f\xd5\xb3\xf7^\x1f\x0c3\xbf\xf3\
-\xf7@g*\xd2\x0e\x0b\x8f\x97\xbc\x13k\xf9\x1d\x16\xd4\
-\xd9\xc7Z\xfbfq\x96\xcc\x14\xb5\xb3\x16N\xb5Z\xa2\
-\xcc\x5c/\x1b\xefM\x96\x91&5\xf1\x1e\xd2\xd9\xb3\x00\
-Y\xac%B\x96\xf8s7\xcen\x8a\x8fi\x87\x22 \
-\x10\xeb_\x8e\x0b'P\x12\xf5\x13~\xb1B\xf3\xebg\
-\xf6\xfa\xecQ\xbf^\x22\xa2\xca\x8aY\x0d\x9a\x022!\
-\x97\x07\x94\xe9\x01(\xa3\xf7\xf1\xb4\x88\x88\xee\x1cfT\
-\x00\xd1<\xe9\x89\x5c\x82\xaa*\xf5\xd4\x5c\x8f,\x15\xf6\
-3\x08\x96w`oT\xfd\xe9o\xbfu\xe6(Yw\
-l\x08-\xdav\x85\xb6mAS\x86\x96\x11\xa4\xf6>\
-\x02\x80\xe7\xb0:\x8d\xf3\xf5V\x00\x1d\xa6IG\x91Q\
-\x03\xed\xc1\xe1@!\x88)\xe4Wn\xca6/\xb1\x22\
-\x90:8\x16k\xe4Fr>\x97\xb8V\xdez\xf2,\
-\xa8\xc5\xa5\x14\xfc\x8c\xa9}>^\xbfT\xaf\x8bOD\
-\xf5\x9b\xe1\x96\xa32'\xa8\xa3\x06+\x80\xfckO\xe4\
-\xd6\x04\x9a\xe7C\xadC\xd6\xdb\x86\xea\xb85c\xe9\x9c\
-/\x22\xaf\x9ap\xeb\x18<\xf6\xb1\x8b\x14)\x0a\xff\xc5\
-\x00\xa8\xa0\xa0\xa8M\xef\x9b[\xb1\xb1\xd0\xd4\xa8\x85\x89\
-\x0e,\x9a\xed\x04P\xf5$\xec^\x1a\x00U|\xdey\
->\xa1\x94=\xa4\x0c\x08\xaa`4\x88\x14\xc1`\x90\x8c\
-\x80\xbbnF\x1e\xd4\xe1(\xe4\xb45\x83\x99\x5cM\xd4\
-\xf6\x92\xb76?\xc61\xd1\xec\xc9\x93{I\x0b~\xbe\
-A\x84\x90\xc7m \x10'\xa4f\x85\xb6\xdb \x86\x04\
-=\x1e\xa12\xc1\xfd%/-{s\xbd\x15@C\x19\
-\xa5@F%\xda+\xf3Q\x99\xc5\xac\x8c\xce\xacJ5\
-\xa1\xc1\x89\x01\xc0\xc0U)K@\xc0N\x01\x9bZ\x8b\
-\xfd\xbcH\x05Q\xf5\xd6j\x9f\x96\xfb\xae\xec\xa1\xe0\x1b\
-VX\x01\x0d3\xb3RoW-S\xaf\xa3\xcc-\x99\
-[\xcc\xf8\xccq\xac\xfdcs\x88U\xcbA]\xfc\xa4\
-\x90\x03\x8f\xbc\x97D\x18\x8a2'\xea\x22\x98\x922\xf5\
-\xdfq\x92\xbdC\x8b\x14\x05J\x85\x94\x8a\x1d\x5c\x0b\xb7\
-rv4\x02\xf6L\x95\x12\xab\x93N\x8b\xbbm\xd6Z\
-b\xa7a6\x01\xcc|\x80\xc8`\x95.\x08H\x88\x88\
-\x08\xbeo&\xd8\x90\xc8:U\xd5*\xa2\x8d\xbe\xf6\xf8\
-\x07\xee\xd1(L\xa7\xce\xff\x9b\xb5\xb4QC\x1a#\xb9\
-\xceK\xb5\xceQ&\x849\xeeU\xafZ\x0e\xd4\xa2\xed\
-7h\xdb\x15X\x19e\x18\x00\x19\x89\xd4\xca\xcf\x94\xdf\
-\xb4>\xc0\xdb\x01\xa4\x82,\x140h\xa0\x832\x0d`\
-\x16heg\x0c VL\xc0`r\xd0P\x8d\x83\xfc\
-2{\xc9\xbau+T\x12\xc09\x1c\x07\x0cW\xdfO\
-\x16\x13\xacn.\x0d0\x8f\x0c\xb2\xbf\xb9%&\xaaZ\
-\xee*4\xb3-\x96[b\xb3,b\x1f\xe7S\x8a-\
-<\xb2\xd6b\x05\xbc\xf05\x14\xf2.\x0ar\xb7\xcf(\
-M\xa1\x02\x85RTF\x0a\x01}\xc7\x8a\xd3\xf7\xd8\x82\
-?\xf2e\x0e\xaf\x90\x92\x90j&\xcc)\xe6\x0a >\
-\xfb^\xcc\x87\x99}fL\x1a\xa1xLc3hE\
-Fh9\xbak\xc6\x88h\x90(\x19y\xe03\xbc-\
-\xee)g`\xc4\x9c45\x12\x8af\x9bWoa\xcd\
-\xa7\xba\xc9A\x8d\xbf\x97\xb6q\x7f\x91\xce\x13\xbd\x98\xa5\
-\xb6\x08@\xe0\x88\x98z\xf4\xdd\x1amj\xa0\xc7\x01y\
-8\x9a\xfbF\x001\x9d\x1d\xe9\x8f\xd7\xdb]8\x1c\xa5\
-\x04\x19\x84\xb0G\xe4#3\x84P\xcc\xa2\x90\xb8\x1bg\
-\x7f`X\xf8@\xcb\xab\xf8\xe7L^f\xce\x04f\xef\
-\xcf\x10\xd8QF\xee\xbe\xcdq\xdc\xe3\x02\xce\xf9\xf3\xa5\
-j\xd1\x9eQ\xf5\x93f\xa9\xc5\xb2\xe7\xfcr\xd7\xaa\x05\
-\x11X\x15\xbc3\x83\xa5\x9eR\x98\xd5\x94\x0c\xdd\xd9\x80\
-F\x06 \xad\x00*\x0a\xb8<\x97@\x10$P@ \
-\xb4\xc0_\x02\x80\xec\x18+\xa4\x9a-\xc30\xef\x9e\xba\
-\xad\x15KD\x0bX\x8d\x9a'\xc1\xbd5\x91\xe6Bb\
-\x81h\x86\xbaK\xc8\xd5\xf6P\x83D\x01\xc1\x93\xaa\x0b\
-qPEc\xec\x16\x19\xf3f\x8fs\x17\xee\x0c\x09\x06\
-Z\xaa\x0dv\x1e\x0bU:\xbdv\xa4\xa2\xd6^\x9ey\
->\xb0\xb9D!v\xe8\xba-\xfa\xb6G$\x82\xe6\x01\
-\x92G\x97\xb8b\x80\x83\xe6\xa5\x9d\xf6\xd1z+\x80\x1e\
-0\xa8\x12\xc6\x09\xb2\xd3\xa0\x87\x18`\x83\xe8\xa9\xc0\xe4\
-\xc3C\xbd\xc8\x08\xea\x018\xea\xd6\x17?-\x8c\xbb\xb7\
-\x18\xc9\xfeb\xa95p\xd5\xe0\xb0\x9fh~/\xea\xad\
-\x99\xbf:{\xbb\xf5\xa2\x99\x0f^O;\x9ei\xee\xa5\
-\x91\xce\x18\x1f\x09\x0e\x08/\x84\xd4`@\xa2\xc2\x96\xcc\
-\xcbd\xf5r\x92!\xd9\xdd\xbc*\x80\xe2\xe2\x0d\x8cB\
-B\x91\x92\xc4\xd0\xe4\x18\x9a\xbf\x10\x1a\x1b\x00T\x85l\
-\x8ae\xb5:V\x9dQ?_r\x06\x8f\xf7\x95Q\xd1\
-^\xd5\xa1\x00P\x1c<\xc5\xefX@\xa2\x88D\xd1\xe8\
-i\xb5\xd9\xde6\xdf\xbb\x02\xc8\xee\xae\xd5\xc59\x88\x88\
-<\x07\xb40\xbe\xd5\x99$\xb6\xf8\x88\xd8\xf3\x93n%\
-\xc9\xc1\xa60M\x0d\xae\xe2\x8a\xcc\x08\xc2`J n\
-\xd04\x1b\xac\xfb-\xda\xd4\x00\xe3\x802\x9d\x10PL\
-\xcb7\x04\x10G\x15;K\xdeX\xdf\x02 \xe8\x08L\
-'\x1d\x0f\x85\xf4\xd8\x04*\x81|l,-\xba\x01\x98\
-/\xa3`\xc6\x81\x03&\xb0.'\x07\xd5Z3\xaf\x94\
-fw\xfb\xce\xaa\x0c\x96;Po\x87[\xa3J]\xd7\
-\x1b[\xbf\xb7\x16\xa9\x9e\xc5B5\xe9Z\xeb\xe5\xe6\x06\
-;!\xa3\xc9\x8b=\xa8\x18\xa0\xccM_\xc0UK\xdd\
-\xe1\x82\x8b.mN\x8d\xc4\xd0j\x13'i\x17>\xf7\
-\xdd]T/\x94\xa2\xcc\xf4\xdb\x02\x1c\xf2CNAg\
-\xae\xdc\xe2X\x19S\xb3\xe4e,!j\xf70\x22\x12\
-\x1b\x80\xc0`-\xe0G\xe0)38\x02\x08\x91M\xeb\
-\xed|\x00J=\x9c\xc9];\xaan\x1dY.\x92\x9c\
-p\x98\xddL2b\x83\x9c`\xb0\xb7\xc50\xe5\xdb\x16\
-!\xae\xd0\xf5\xd5\xfa\x00\xd3x\x02M'\xa4@\x18@\
-\x00E\x08'\x95\xd9\xe7y\xbc\xde\x0a\xa0\xd7\x80\xeee\
-\xca\x07\x99\x0e\x1ap\x0c\x09\x12\x8b \xb2 W\x00\xb9\
-\x13\xca\xd5\xb2\xc0\xbc\xab\x1a\xcf\xc5\x00OzU\xea[\
-\xbc\x1a\xfb,Vz\x03?\xe4\x00:w\xe5\x16\xc7\xa1\
-\xee\xdd\xf3\xcf\x01\xb74X\xc4.\xe6\x9f\x98c\xa3\xba\
-'\xfc\xb9BPs\xb9\xa1\x85M|\x22g#\x0f\x8a\
-8\x80\x04\xae\x8b\xca\xa3\xa6\xd0pJ;\xd6o\xd5\x07\
-{\x97V\x84P\xa4)\x80&\x16UZb\x9c:&\
-\xa6\xbaE\xcb\xbd\x5c,\x82\xe7\xfb<VVO\x060\
-\x18\x91\x02\x1aNH\xc4`)vLc\x00\xcf\x00r\
-\xd6\x0d\x16\xefDr\x00\xb1\xe7\x81\xb0$T\x99\x97\x87\
-\xe5\x19M\x22\x80y\x91\x0e\x9e\x0fb\xaa\x9e\x8e\xbb\x9e\
-\x1a\xc0\xdc\x22\x84\x15\x9a\xb4E\xdfm\xd0\xa5\x06:\x1e\
-\x90\xa7\x13X&\x8f\xc3\x83\xd7OD9J\xf9\xfe\x16\
-\x08\x00N\xf9\x90\x8f\xe5t(\x5c\xf6`\x99\xa2\x16M\
-\xac\xc8g\xd6D\xc9X9\xae!\xc6\xd9#\x92\xb5\xdc\
-\xf2\x99*\x8a\x89\x1e\xaa\x99Z\x9c\x19\xa0y\xd3\x9f\xfd\
-\xb1\xfe\xb9\x1d\x1c\xb5\x0ez\x09Y\xe1?2\x8b\x7f8\
-\xa5}~RZLT\xac:X\x8a\x01E\xdc\x12e\
-\x00\x99\xbc\xf1\x92\x81l \xd2\xe2\xcd`Z\xa0\xde\xc1\
-\xbfB\x13\xba\xd44\x85\x06\x1b\x13\xf1\x0e\xb7u\xaf\xb0\
-B\xcf\x89\x99$\x01\x12\xd5\x02H\x7f\xd5\xc0s~\x14\
-\xd3\xfcq\xe6E\xe7{\xb5\x00\x8c\x10\x10\xd1R\x83\xc6\
-\x85A\xcc2Y\xce\x871\xcd\xae[\xa5\xad\x03\x18\x81\
-\xc8\xf6\x11\xb17\xd01\xa2\xb7r\x13[\x19\x19\xf1\xdb\
-\xc0CsK~\x15\xa6Y|\xa6\x80\xc0\x09!\xf6\x88\
-i\x8d\xb6]\xa1\xeb:4A1\x1c\x06P\x19\x10\xd4\
-Z\x1b\xa0A\x94B.H\xd31\xcb[\x9b)\xbf\x0d\
-@z?\x1c\xe4$\xe31\xb3>(\xeb\x81E%\xb2\
-r\x04H\xbc%{\x19+R/\xaf\xf9\xa0\xf6G\x02\
-\x91+\xb9V\x01\xe4\x80\xa8\x94\xe8#\x00\xd9m\xd03\
-\xaf`N\xff\x9e!\xe6QJx~\xb1\xfa\xe8\xe7\xbf\
-p.\x80\xf3\xf2\x1c\xf6\xbcAp\xb0\x10\xa8\x04 O\
-\xd0\x9cM\x18%\xb8\x05b\xef\x1dAA\x00q!I\
-\xbd\xb6m\xd0\xd0l\x01~\xf8\x96\x8b\xf6.\xacK4\
-\xd4S\xc3D\xd4\xa8\xe4N\x9d\x14\xa5\xf9\x1a?v\x1c\
-\x16_\xa1\xfe_\xb0\xb8xp\x9b\x12\x11\xa9AK-\
-\xa22 \x19\xea\xd6gI\x9a\xfa\xfe\x019m\xcd\x88\
-\xec\x8f\xc0\xa6>\x1a\x18!0Bp\xb2\xc0A\xc3\x14\
-\x1c<\xc1\x997Z\xb46`u\x11\xf6\xee\x02\x88\x13\
-\x027\x88\xcd\x0aM\xb7B\xd7\xad\xd06\x0d\xc2\xb4\x87\
-\x8e{\x04\x99@\xac\xd8\x0f\xa3\x0a\x82\x08\xc2P\x90\x86\
-\xa1\xd0[\x0f\xcdo\xb5@_\x1f\x8f\xba\xcfy\x10\xd2\
-\x07\x90\xee\x09\x22\xac\xa2\xcc\xaa<W\xea\xe8\x1c\xf7\xcc\
-\x16\x88\xad^)\xfa\xc7\x99\x8f\xf7\x10\xe5\x9b\x00z\x0c\
-i:?\xd2\x1e\x83\xa5>\xed\xcf\xab\xff\xbbK0[\
-\xc1\xeam\x0b\x84\xf9\xb5Z\xc9P\x93{T\x18\xc8\x01\
-T& 3t\xaa\x16\xa8@\xb3\x0f\xe9\xb2\x96t*\
-`.\xacM'\xed*\x85\xd4vX\xf1\x03\x0e\xefj\
-\x1cD\x02bVJ\x80\xacD\xcb\x86A]\xa5I\xcf\
-\x1d\xe8\xf3\x83\xcb\x96\x02p\xd1\xff\x19<V\x04\x15(\
-\x22q\x8bD\x09$VL\x0a\x0c@\x1d\xc7\x89Z\xc5\
-M^q\x00w\xdb\x0c,&\x1e\xc2\x881\x98W\xc3\
-\xe4rh\xd5\x8d[,\xcf\x0c\x9e\xd9}1`\xaa\xeb\
-\x0f2\xb7\x08\xa9G\xd3\xac\xd1v=\xda\xaeCb`\
-:\x9c\x80|B\x84UMLS\x018M\x8ax\xc8\
-\x08\xa7\x11\xe5\x07Y \xbc\x1aN\xb2\xcf\xd3((;\
-P\xde\x05\x9eJ\xa0)YO\xbam\x5c\xc5R\x02c\
-\x7fH%\x0ft\x06\x91%{-\x13\x1dI-\x89\x05\
-\xf5\xbc\xe7\xe2\x98\xcdP\xe1\xea\xbe-\xd6\xe6\x1cD5\
-\xf6\xd2\xfa\xc5|\xadh\xf9\xf1\x0a\xa0\xf9\x07\xcd\x1f\x07\
-tv\xe1X\xd8\x18\xb9\xcc\x90\x89\x81)\x80\xa6\x0c\x9a\
-\x0a\x84-{\xae\x12\x94\x958\x91\xf4\x9d4\xdb\x8b\xae\
-\xef\x9eu\x17\xe1\xe5\xe9\xf0]\x9b\xf0G\xbd28\x0a\
-\xc2\x1a\xc0\x95\xa0\x5c\x16\xd0\x8aA\x91P\x95\xf3l\xd5\
-\xedn\x97x\xa9@Y\xacO\xf0\xb8'\xa1\xe5\x16-\
-G\x13I\x94\xd1\xdd\xb6l\xa4\x14\xbeayP\x8bF\
-\xcd]Kn\x85\xcc\x02\x99\x98H\x8d{\xc8\x81DT\
--N\xa5\xae\xdd\x9ey\xeaB\xc9\x04n84\xe0\xd0\
-Y\xc5A\xb3B\xd7\xf4hc\x84\xe6\x13\xf2\xe1\x1e\xd1\
-\x13\xf4\xe3\xa4\xaa\xd2\x8ar;e\xe8n\x84\x1e\x06\x0c\
-?\xcc\x02MS\x91\xa1\x8c\xe3X\x86\xbd\xd2\xb4kb\
-\xceB\xa3F\xce(\x9e%>+\xb8\xb6\xb2\x1e6\xb7\
-\xcd\x1e\x82\x10\xdcZ\x88\xd5\xa1\xd5\xf91$:\xf7\xef\
-\xcc.\x81\xb3$T+d\x09~a\xde\x04\xd0yp\
-\x08:3\xd7T\xad\x10\xe6\xe7P\xddMw#!\xa6\
-\xb3c\x00\x0a\xa0\x1c )\x00\xd3\x840\x05\xf0\x98!\
-\x891\x15\x01\x8aP\x10D\x81\xacV\xd2^=[_\
-n>:=\x8d\xff\xe3\xf4\xa7\x1f\xba/\x7f\x14k\x8d\
-5\xb7\xdc\xb4\x91\xf8\x8a\x14\xcf\x14r\xa9(\x9d \xb0\
-\xc52e&\xb2\xed\xc1\xf3\xc1U)\x03\x00V\xbd\x8e\
-\x88\x84\x06-u\xe8\xb8E\x03\x80\xe4\x84\xca\xb6\x05\xd4\
-A\x90\x8c:z\x98\xe7\x98' \x85\xfa`4\x91\x91\
-\x22#\x86\x80\x10\x96Xg\xd6\x15\xf4\xf7\x82:w\xc8\
-\x15nk\xe9\x892\x03!\x82c\x83\x90:4M\x8f\
-\xb6\xe9\xd05\x0d\x12\x15\x9c\x8e;\xd0pB\xc3\x8cA\
-X\x0f'\x85\xd0J\x85\x9ai\xc4\xb0;i\xd9\x8f\x18\
-\xdfP%\x05\xbe\x03@{\xect/\x87\xf18\x1e\x1e\
-\x8a\x0c\xf7)I\x16\x9a$r\x0e\xd9\xabmk\x9f\x95\
-\xfaF\xaf\xe5\xe6!\xa8=\xaa\x05\x9a/\xf8\x12d\xce\
-\x89P<&\xceh\x06\xc5c@<^\xd5Z\xe9\xd9\
-\xe9\xe3?_c(^z\x81\xbc\xfb\x0a\xd5\x02\xcdc\
-\xdb\x8b\x00\x92\x11\xa6\x00\xcd\x01a\xcc\x881C\xf2\x04\
-L\x05\x94\x85H8\xb1b\xb3\x95\xfe\xd9\x07\x97O/\
-\xef\xc7]\xc2\xabG\xbe\xcb;\xb3\xd6\x88\xd4\x135\x81\
-\xf4\x82\x15OIu\x0dh\xb2\x00\xb2^t\x03R\x8d\
-xj\xdc\xa9\xa4\x9e\xe23;\x12\xd0\x22Q\x8f6\xf4\
-h\x10\xc02y\xce\xc7\xc4f\xceG\x0b\xd7\xf8'\x92\
-MrO\xc1*?\x9a\x18\x90\x22#E\x03St\xeb\
-\xc3\xa1\xc6;f\x85\x00#\x9aj\x96\x9c\xd8\xeb&}\
-X\x17\x85\x08\x8a\x09\xdctHM\x8f\xa6\xe9\xd0\xc6\x84\
-\xc4\x00\x0d\x03\xf2\xc3\x9d7\xf3\x05\x8c#p\x1a\xa1\xe0\
-Nsh\xc6\x01\xd3\xc3It7\xbdE\xd6\x17\xf8\x0e\
-\x00}\x89\x83\xde\x96\xc3\xb8\x1bw\xb7YN7M\x94\
-Ad\xda4\x5c4\xb3`R\xb1\xbd\xee\x1b\xd4\xb2\xc0\
-\xd6\xf0\x14\x99\x10\x82\xcd\x16&,L\xc8\xe3\x84\xdbB\
-W?\x02\x10\x9fU\xdc\xd6\x9f{\xe4\x8aa\xbeu\xcb\
-\xcf\x98\xcb\xe7\x09\x01{\xde\x13k\xe4\xb4 q\xbd\xf9\
-f\xf6X\x05\xac\x05*\x01(\x01\x98\x22B\x93\x11\xc7\
-\x0c\x19#0e\xf0T(\x94\x18\xa2\xd0\xe6BV\xef\
-\xff\xe4\xfa\xfd\xe7\xb7\xd3\xc3\x0a\x9f\xe2\x16\x8f\x0b\xe8\xdf\
-\x89\xd5\xa0\xe5\xa8M\xc3\xa0\x0bV\xbd$h\xeb\x193\
-\xa2Y\xb3U\xfd\xca[)\xd5\xb9\xde5Q@\xd0\x04\
-FB\xa4\x0e-\xf7h4!h\x01${\x12\xfe\xd1\
-L\xba\x19D\x91\x18\x89\x03\xe2\x99\xc5I1\xd8\xe7!\
-\xd8\xd8\xc6\xe0\x15\xd95\xe6a\x9e\xab\xad\x99\xdf\x04P\
-\x81\x0d.\x08\xb1AL\x1d\xb8\xe9\x10\x9b\x0eM\xd3 \
-1\x83}\x80\x17\x8eGtm\xa3\xc7\xc3\x84\xe3IQ\
-\xb4U\xe5\xb6\x8c\x9c\x8e\x07\xe8\xfdA\xf2\xc3\x11\xd3[\
-\x87\x0a|+\x80\xee\x00\x1dd\x18\xee\xc7\x87WE\xa7\
-\x17)\xca\xbeL\xf9\xb2\xe1\x12\xa7($b$e\xfd\
-\x83,\x0e\xb2\xfcO\x8a@\x8c\x96\x07\x02Y\x01\xe9\xf9\
-\xf2\x22\xd8\xd9k\x06j\xab\xb7\xce\xb9\xa47\x5c\xb5\xfa\
-9\xce>'r\x02\x83\xac\x0d\x82\xbd\x85\x9b\xc9\x07\x9f\
-U\x001\xaa\x90\x101\xcd\xa4B@\x84\xf5\xd4\x17 \
-O\x08SF\x183x\x8c\xe0)\x83\x87\x8c\x903\xc7\
-B\xfd\xa5\xca\xf3\x8f\xd3{\x1f\xfdq\xff\xf5\xe5OV\
-O_~v\xb8y\xd74\xb2\x89\x10B\xa3\xa9\x0f\xca\
-\x97\x0c\x5c8\x80\x98f-\xb0s\xf2\xa6~]/\x81\
-[\xf6\x19<-\x1a\x8f{X|\x82\xb6[\xae\xc7\xe0\
-\x01\x12[\xd2\xb4\x02\xa6I\xf6\xb9\x11\x07\xce\xbe9\x8d\
-m\xfb\x83\x17\x10\x91\xed\x1d\xa2\xb0$\x22\xc9\x1a\x10\x02\
-Ehh\xc0\xb1Chz\xc4\xa6GjZ\x03\xa4\x0a\
-\xcaa\x87iw\x87U\x8a\x08\x9cp\xb3?\xe1p\x04\
-@+\x95\xd8M\xc7\x80\xfb\x83\xca\xd7{\x1d\xefNx\
-\xfd\xc3,\x10\x00=\x8d\x87\xe9v\xdc\xdd\x0f\xc8/\x94\
-\xca\xab\xc8\xe5Y\x13J;\x05h!\x22\xd5\xe0\x9b\xdd\
-s;\xd5us\xc5H\xb6B^K\x9a8\xed6\x83\
-g\xce\xd9\xc0-\x86\x01bn}\xf8\xb3\x00r+t\
-\x96\xa2\xf6n\x06\x8b\xc9\x02lFf\xb5D6\xb2l\
-\x89\xabj\x97;\x8c\x99C\x0e\xe0\x9c\x81\xa9\x80\xa7\x0c\
-\x1a&p\xcc\x88\xe3D\xc8\xdcl\x14O\xae\xcb\xf4\xd1\
-\xf5f\xfb\xc1\xff\xfe\xf1\xaf\xbe\xfc\xec77o\x08\x8d\
-\xff\x98\xd7%\xba\x10 kR}\x1a\x80\xf7\x08\xb8\x22\
-\xa0\xc7,\xa6q\x06\xa0y9\xb5\x8a\x00BB@\x8f\
-\x86V\xe8\xb8C\x1f\x22\xa2L\x082!hF<\xab\
-2X\x86\xde[yN\xc3fq\x9a\xc8\x8f\xdc\xb6\x18\
-M@1\xc6\x9a\xe7\xc1\x5c\xb2c\xc0\xf1|\x8f{.\
-\xcb\xa4\xbb\xe0\xb1P\x02b\x07\x8a\x1d8\xb5\x88\xa9\xb1\
-8J\x05r: \xef\x1f\x10E\xb0Y\xafq{\x7f\
-\xc2~/\x98\xc6F)\xaeEbs\x1c\xd2\xf8\xd51\
-\x97\x17\xf7e\xff\x80o\xc9\xfd}\x17\x80\xf0z7\xc9\
-\xdd\xc5t<I\xfez@~\x91X~\x12(\xaf\x1a\
-*,\xc1f\x9b\x02p\x17Ig\xadbk\xb95\x17\
-\x0e@\xf5\xd7j\x1d\xa97\xc4\xd5\xd7<>\xe1jM\
-\xb4r\x03~\x8b*\x80\xde\xdc\xab\x04\x18\xf0\x82\x99r\
-\xady'\xabB\xf4ie\xe6\xda\xb1\xf5\x05\xcf\x0f\x0e\
-n\xf5\xea\x06\x10\x01\x97h*\xd8S\x067\x11\x9c&\
-\xd0\x10\xc0#\x87Th\xb3.\xf9\x93\x0f\xae\xdf\xff\xd9\
-\xffv\xfa\xe5\x1f\xfe\xcf\xdf\xfc_\xf7\xf7\xc6\xc5\xbe\x0b\
-\x8b\x22\xba&Q\xfb\x84\xc1\x9f\x90\xf2'\x00\x9e\x00\xba\
-\x024,\xd9\x1f]|k\xadQ\x10\x83\x90\x90\xd0\xa3\
-\xa55V\xdcc\x15\x1a$-\x08ep\xf0\xe8\x22\x90\
-\x88\xc5\xf2D\x22$&\xb4\x81\xd1\x04F\x0a4\x03)\
-\xb9\xcb6[\x9e\xf3\xdc\x0fU\x8f\x85*\xed\xeaq\xb0\
-O\xf8\xae\xc3\xdab\x0b\x8e-\xb8i\xc11!\x04F\
-C\x00\x8d\x03\xa6\x87{P\xceX\xaf\xb6*\xca\xb8}\
-=\xe0td\x10u\x00\xf7R\x22\x1f\xa7vxq\xd2\
-\xf1\xe6v\xfc\xf6\xc3\xf2;\x01t\x7f\xdc\xcbq:\x9e\
-\x0e\xd3\xe1\xe6P\x8e\x7f\xbc\x8c\xeb\x03#_%LQ\
-C\xa7D&\x88[\xab\x9c}R\x89\xb9oqiB\
-RW\xbf\xe1*{unT\x1e\x81\xc7\xee\x8d\x01\xc8\
-\x9d\x83oTd\xfbo\xb4\x1f\x9dc\x1e\x81\x9e\x9dJ\
-\x95\x154\xcb\x88\x19@\xea\xc02py\x00Z-\xa8\
-\xc2\x9a\xb4\x8a\x01\x88\xdah\x8fS \x0c!\x84)\xac\
-W\x99>\xfc\x90?\xfc\xc5\xcf\x8e\xaf\x7f\xf3\xab\xf5'\
-_\xfd\xdf\xfb\xcf\xdf\x09\xad\xec\x16mh\xd0\xac\x13\xe2\
-{\x11\xe1\xa7\x04\xfe\xc9\xffG\xdd\x9b5\xb9r\x1c\xe9\
-\x82\x9f{D\xe4\x02\xa0\x96\xb3\x93M\x8a\x92\xa8\xa5\xd5\
-R\xf7\xbd=c\xd3c\xf7\x9a\xcd\xeb<\xcd\xdf\x9c\xa7\
-1\x9b\xff0/\xd7\xba\xd5W\xad\xa5I\x91<$\xcf\
-\xbe\xd6\x0eTa\xc9%\x22|\x1e<\x223\xeb\x88-\
-Q\xcb!\xd5y,\x0fPY\x00\x0aH\xc4\x97\xee\xfe\
-\xb9\xfb\xe7\x00\xdd\x12\xb5@V&.\x1c D\x92[\
-\xab\xb51\xc1\xa2BI5f\xa6\xc6\x9cKT\x008\
-\xb4\xb0\xd2\xc1N\x08\x83\xccD(a\xa0\x96\xa7\xb4\x06\
-\xa5e\x14\xce(Y\x90\xdd7\x9b]6\xd2\xc4\xa9I\
-\xb1M\xae2\xa0\xf1\xfb\x03H\xbf`\x1e\x01D\xa6\x04\
-\xbb\x12\xec\x8ady\x9c\x02\xd6\xf7\xf0\x9b5L\xdf\xa1\
-p%\xac\xadpr\xba\xc2\xea\xca\xa3\x0b\x05`\xe6\x02\
-W\xf5\xc1\x85\xcb\xadi\x8f\xd6\xdc\x9c_\xe1\xeaO\x03\
-\xd0)V\xb2\x0e\xdb\xee\xa2Y]\x5c\xf6W/\x0f\xea\
-\x1bk\x83\xce\x83\xfa\x02&\x00\xac]\x1c\x92i\xe4\xb4\
-P\xd9\x02I\xc0G-O\xe6\xac$\xb5\xab\x0f\xa2.\
-#{6\x9c\xdd\xc99\xc94w\xfa\xe2~\xe7\xfde\
-b`\xf2\xcdL\xe8>m\xa9\x10\x8a\xc9\xd4\xeb\xd53\
-5\xb6&\xf7\x8e\x87\xfb<\xfa\x96\x80\xb7\xe0\xe0A\xa5\
-\x01\x0a&4\x96\xb9\xb5e\xdd\xdb\xdb\xb7\x8b\xf0\xdd\xf7\
-vw?\xf8\xc7\x0f\x7f\xfa\xec\x97\x1f=_\xe3\xabf\
-^\xfc\xe7\xda\xa8F]\xccP\x1d\x16b\xdfg\xf0\xf7\
-\x01zO\xc0\x87\x80\x94I\xd7*;\xc7@\x22\xae\x95\
-\xc06`\x14(\xa8\xc2\xccT\x98\x19\x87R\x04\xc6\xf7\
-\xb01\xe7yd\xf2\x15\xd3\xd0\xa2\xe0\x98PX\x8b\xca\
-\x1a\x94.\x01(\x81\xc7\x18\x8d\x7f\xd8$\x00\xa5\x92\x1d\
-\xcaW\xe4\x09K\x8d\xccd\xb1\x02G\xd8\x01\xa6\x00\xd9\
-\x02\xc6\x95`\xe7PX\x8b\x92\x18&x\x84\xcd\x1a\xb2\
-\xdd\xa0\xb6\x0e\x85\xabeu\xd5\xe1\xe8d\x8d]\xe7\x10\
-x&\xec\xea\x00W\xec\xbcm\x8fV\xfe\xea\xd9E\xb8\
-\xbcXa\xf5\x1fN%\xfc\xbd\x00z\x01\xc8\xaa\xeb\xfc\
-\xab\xe5\xe9\xe5\xfb7\xee\xbcz\xcf\xfa\x95\x8d]G\xdc\
-\xd7d\x82\x00\x8e \xc99$J\xfd?\xaaVjt\
-zyj\xa9\xcd\x9a\x07\xd9\x85{\xe3\x1b\x1c\xa8f\xb5\
-\x06\x98\xbc[}\xecWY\xa1\xcc\xac\x019\xd7\xa3\x8a\
-'\x8c\xcc\x91\xe7\x8eR \x0eD\xc3h\xf1\x00\xe48\
-)\xe5\x16\xb2\xdfHQ@bA\xbd\x05\xa9+Gd\
-\xad5\x9d9\x5c\xf4\xfe;\xef\xde\xbe\xf7\x83\xff\xf2w\
-?{\xf47\xf7\xff\xf9\xf4ew\xe5\xf1\x9f\xdb\x0aq\
-\x01\xaeJr\xb7\x0d\xecwX\xf8;\x04\xba\x05`.\
- \x9b\x12\x15\xd7\xce\xbe\xda\x1f\x0bF\x01G5ff\
-\x8e\xb9+QD\x80C\x07\x13\xb3\xdbF\xd7\xae\x8fZ\
-\xd4\xa3\x8c[a\x0cJcP:\xdd\x8b\x89\xe5a\xd6\
-\x9c\x0f\xe7\xd8'[\x9b\x0c\xa0\xe4\xe3g\xb7-Ow\
-\x17c\xf4\xcam\x0b\x90-a\x9c\x83u\x0e\x05\x11\x5c\
-\x88\xc0\xb6A{y\x89\xca\x1a\xcc\xeb\x1a\xdbm\xc4\xd1\
-\xf1\x05\xd6\x9b\x88\xc8s\xc0\xccD\x5c\xd5\xa3\xb0K_\
-\xf4O\xcf\x97\xcb\xe7\xa7\xbb\xe3\xd5\x1a\xaf\xbe\x92@\x00\
-\xfe\x00\x80\x00\xe0\xe4j\x1d\x1f\xe0d\xfb\xa3\xbb\x1f\x1c\
-\x83\xfc\x19\xdb\xae\x89\xb4\xddc\xaaMa\x0bH4\xa9\
-T\x02\xea\xa7\x9a\x1c\xd4\xa9\xf4P\x1eKBi\xd2I\
-\x8c\xd7\xeb\xa9&\xf9\xae\xe1\xc4h\xd2\x13\x13\x17\xee\xab\
-6\x19\x17\xfc\xb5J\xf3T\xff\x06\x19\x05\x1d\x87#H\
-\xcb!\xc5]\x89\xc1#f\x90\xcd.BzOb\xc0\
-\x85Q\x00\x15\x0e(<cgfe'\xef\xdc\xb4w\
-~\xf8\xc3\xf6\xfb\x8f\xfe\xe9{?}\xf1\xff}\xfe\xf3\
-\xddJs\x04\xff\x19\x09\x05\xdeG]-\xe0nY\xd0\
-\x07\x0c\xfa.\x01\xef\x00\xd8\x07\xc4\xe5\xa2\x98\xa9\xd2\x05\
-\xe5\xda6\x94\xa8i\x81=\xbb\x8f=;\x87\x8b\x11\xc6\
-\xb7\x0a\xa0\xa1\xa7'\xefjy\x1c\x18\x8e5\xc6\xa9\x9c\
-\xd1\xbd0(\x9c\x02G\xad\x8fR\xd26WZg&\
-5\xc5=\xc9yW\xaf\x8d\x90\xbe3\xa3\x9a\x85\xa6\x00\
-l\x01X\x07[(x\x1c3\xac\x8f\xc0\xa6\x81_]\
-\xa2\x22\xc6b>G\xd3\x07\xbc>]\xe2b\xd9\x004\
-\x03\xd9\x19L1\x8bR\x16\xbb\xae\x8c'+\xda=^\
-\xfa\xe5\xf1ys\xb4\xc3\xef\xb9@\xfeA\x00]4\xeb\
-\xf8\xc4Ss\xb1]\x9fw\xbe9*\xcbb\xc3\xdc\xdc\
-\x12j\xe0\xcc\x02\xc26\xb9qH\xc5}\xd9\xa2\xa8\xd4\
-\x14\xc9X\x00O\x92+\x10dX\xcc\x03\x80r\x5c\x9a\
-]7\xc9\xd6+\x1d\x9a,\xcf\x91\xfa\x9e@q\x02>\
-=\xb9\x02\xe4v\xf3I\x0c\xac\x22\xa5\x89\x0f\x1a\x02\xe1\
-\xc4\xfcM\x88\x06\x1e@$\xe0\x22@\x0aO\xe2\xd8q\
-\xcb\x873\x87\xef\xbe\x1f\xbf\xf3\x93\xff\xeb\xbf\xff\x9f\xcf\
-\x8f\xce_]>8}\xba:\xf9\x0f\x12m\x7f\xc5\x1b\
-\xcf0\xab\xf6y\xefv\xc5\xb3\xef\xdbh~DB\xdf\
-\x05\xf86\x81j$Gi\x0cW\xd5d\x93\x940T\
-\xa16{8\xb0\x07\xd8338/@\xdf\x82c\x0f\
-\x0b\xedX\xce5\x0a\x94R\xab\x0e@\xc9P\xf0\x14\x0a\
-\x9c\xca)x\x0agR\xcd\xdb\x98\xeb\x19\x1a\xe4\x98\x86\
-\x10ap\xef\x81D$d\x92\xdd\x80R\xa5\x01\xdb\x12\
-\xc6\x14Z\xc5@\x04\x13\x02\xe2v\x07\xbf\xde\xc2\x01X\
-\xec\x1d\xa0\xf5\x01G\xa7\x978\xb9\xd8R/\x15\xc8.\
-\xc0\xc5\x22rU\xfbX\xf1\xea\x92\xaf\x9e=\xdb<\x7f\
-t\x1e\x97g+\x1c\xb5\xf8=\x17\xc7\xaf\xd4\xfb\x9dn\
-\xfb\xe8\xd0\xc5\x8e~p\xf7\xdd\xfa\xbd\x1b\xb7\xde_\xd4\
-\xb3\x0f\x8c)n19gm\xc50N)bC\x83\
-\x052\x0e0\x96\xc0\xc9\x8d\x1b\xd6vfORb\x93\
-\xd5\xf2j\x0cb(\xc5%\x98\x80j\xa4\xb4\xe9\x1a\xc9\
- #I0\xec\xd3\xc7\xa9+\xc94\xea\xce\x11\x8f\xef\
-!U\xbd\x0e\xa4\x03\xe7Dk\xa6\xbd\x935bc`\
-\xac\x01YK\xe4\x8c*$;&\xb2$\xd6\xd9PW\
-\xe56\xc6\xb8\xecc\xdc>\xbc8\xfa\xcf\xe4\xcaQ\x81\
-\xc2\xcei~\xb0\xe0\xf9\xf7*\xaa~\xe6\xc4\xfd\xd4\x08\
-\xff\x80\xc0\xf7\x00\x9a\x09\x88\xe3pf\x19\x80%F\x89\
-\x82\xe7\x98\x17\x07\xd8/\xf61w\x15\x8a\x18A\xdd\x16\
-&\xf6\xb0\x08\x83\xeb6\xd0\xd4`8b\x94\x86Q;\
-FUX\xd4i\xaf\x0au\xdf\xdc4\xef\x93A\x94\x98\
-\xb7!\x0d\x91\xac\xcd0\x17\x95\x18llb\xad\x0a\xb0\
--`m\x81\xd2\x96\x98\xd9\x02\x95\x10\x5c\x10\xc8v\x07\
-\xbfk`\xc0\x98/\xf6!089\xbd\xc4\xe9\xd9\x16\
-\xdb\xd6 \xf2\x1e\xa8\xd8\x13S\xefES\x97\x9bP\xc6\
-\xa7g8\xff\xb7_\x9d\xfc\xcf_\xbc\xec\x9f<;\x89\
-\x9f\xef\xf0{\x00\xf4\x07-\xd0\x03@\x0e\xd0\xfa\xd3f\
-\xbd<\xdb\xac\x9e\xdf;\xb8}\x5cP\xfc\x1e\xa3\xaf\x09\
-\x8d8[\x10RR+\x22\x01\x86S\xbc\x91\x981!\
-\x95\x94\x1a\xa8\x83dN\x86\x05\x9d\xa9l\x00\x802b\
-\x92[\xd8\xb3jh\x8a\x85\xb2E\x11 \xd5\xb8e\xc5\
-\x90I\x01)e\x1b\xa3\xc7\x95k\xd0Z\xb8\xd4\xa6\xaf\
-2\xbe\x04 \x92\xde\xcf\x9d\x19\x0c\x00)\xf7n\xa0W\
-7K\x803`kX\xbcu\xa6\xe2\xc3\xba\xe0\xef\xdc\
-\xb3\xf1\xef\xfe\xfb?\xfd\x1fg}QtK\xc1\xf3_\
-<\xfa\xf75\xfe\x13\xf4\x0a\xcd1\xe7\x1a\xf5l\x8e\xd9\
-\x9d\x12\xe5\x87&\x9a\x1fS4\xdf\x05\xf8\xb6\x00\xb3\x98\
-\xa2E\x9d\x8b\x9d\xf5s\x0a83\xc7\xdc)xjX\
-\xb0\xf7\x08m\x83B:X\x12\x9d\x22\x97,N\xae0\
-pD(\x8dAm\x19UA\xa8\x9cE\x99\xdc\xb62\
-\xd7\xb8\x0dy\x1eNm\xd9yM`\xdc\x01\x00\x89i\
-%\x86\x0eIu0\xd6\x82l\x01\xb6\x0e\xd6XT\xc6\
-\xa0\x04\xc1\xf4\x01\xa1i!m\x83\x82\x0d\xca\xf9\x02\xa0\
-\x02\xa7GK\x9c\x9d5h\x1b\x0b\xe2\x19`\xf6\x84\xaa\
-=\x98\xba\xf6Rb\xd5\xf0\xf6\xe9\x85?\xfd\xf2\xd1\xf6\
-\xd3\x17\xa7x\xf1{\xdd7\xe0k\x00\x08\x00V@x\
-\xb5\xbeX\xbf^/\x9f\xff@\xfc\xf39\x87\x1f\x1b\xea\
-\x0f ;c\xb8\x94h\x0d\x11'9\x08\x12\xc0\xe8N\
-V\xaf\xfe*t(\xa3jo>\x1dC\x11hn\xbe\
-\x02\xb2n1qz\xeby\xe1#\xc9\x10\xa5\xe0(+\
-\x01\xe9\x96s\x14\x13K\x97\x83\xcc\xdc\xfa\x9d\xe7\x16\x89\
-\xa8\xfeA\xce\xee\x0e_R\x1c\x035\xd6\xdc\x90\x10\x10\
--\xa5\x9c\x82!vV \xceHeg\x5c\xbbw\x0e\
-\x16\xe5\xdf\xfdpQ4kK\xcd\xd6\x19\x7f\x15\xdb\x97\
-\xf7\x9f\xdc\xdf\xe2\xaf\x18Ds\xcc\xcd\x02\x8bY\xcd\xf5\
-\xbd\x8a\xcb\x1f;\xb1\x7f\xcfb~\x0c\xd0\x07\x11\xb8\x01\
-(\x17\x10\x13Q`P\xc0R\x85\xca\xce\xb1_\xdc\xc0\
-\xa2\xd8\x83\x0d\x04\xea:\xa0o\x86\x98g\xd0,\x90\xd1\
-\xfa\x14\xc4\xa8\x0cc\xe6\x92\xdb\xe6(\x81gR\xae3\
-\xb0m\x93y\xb9\x93\x0b!\x80\xe4\xffgw[\xeb\xe0\
-\xd4\xf3)\xc0\xc6\xc1Z\x07c5\xde1\x12\xc1]\x8b\
-\xb0k\xe1\x9b\x1ee\xe9P\xce\x16\x08p8>\xbd\xc4\
-\xeb\x93+l\x1a\x03O\x15`\xf7\xc4\x14\x0b1\xb3\xb9\
-p\xe9v]\xd1\xbe\xbc\xf2W\x9f?\xdd|\xf9\xe0\x15\
-\xbe8kq\xf9\x07c\xdb\xaf\x05 \x00\xf2l\xf9\xba\
-y\xbd]\xbe\xbe\xeawO\xf6\xea\xc5\x913\xfd;\xa0\
-]\xc1(\xc9\x1a\x87hT\xdd+\xcfb\xd2\xb3\x98*\
-\x0fr\xc9\xcdt\xbd\xa7mp\xbb\x80\x11\x1c\xd9\xf2$\
-\xca\x8eb\x0eaGi\xac\x9c\x1f\x9arv\x83\x9b\x87\
-\x5c#\x9c\xca\xdb\x13xT\x84$\xd5\xbfQ\x04\x91\xd5\
-\xbc\x0f\x85\x04~\x1ej\x83U\x95\xc4j\x85\xb1\x05\x8c\
-\xb1 c\x88\xd9\xb2\x14\x5c\xc4\x99\xbb\xe1B\xf5\xe1\xed\
-\x1bs\xfa\xaf7\x16\x22\xfb3\x1c5\xabx\xff\xc9\xfd\
-W\x00\xb6\xf8\xebt\xe7\x8cE1\x9b\xf1\xde\xbb3v\
-?\xb3\xe0\xff\xcd\x08\xfdW\x06\xff\x00\xe0;\xd9\xfa\xc4\
-\xc4\x9b1JX\x9ec\xaf<\xc4au\x80\x8ajP\
-\x17 \xed\x0e\xec{X\xf1p\xe9\x91:m\x1b\xb0 \
-80\x0a\x22\x05O\xc1\x98\x17\x8c\xbaT\xba\xdaY\x86\
-s\xb9`T\xdd\xb5k$\x120\xa4\x1c\x80\x14\x0b'\
-\x97\x83\x18I\xe2\xca\x00\xac\x00r\xc6\xa10I\xe1'\
-\x02}\xb3C\xb3i@\x01\xa8g\x0b\x94\xb3=t\x1e\
-8;]\xe1\xf8\xf8\x12\xdb\x86\xe1\xcd\x1c\xde\xcc\x80b\
-\x01[/\xe0\xea\xb2\x8f6\x5cli\xfb\xf0\xc8\xbf\xfa\
-\xec\x93\xf3_?oq\xb9\xc3\xd7\xb8\x10~]\x00\xe1\
-\xc9\xd5\x85?\xd9]]\x9cn\x97On,\x16\xcf\xeb\
-\xb2\xf8>\xa3\x9d\x13\xed\x0cS\xa1T\xb0I\x12Q\xc9\
-\xc2RR\xc2\xd3\x19\xc0\x04\x15D\xc4p\xa6\x06\x97\x8e\
-\xc6*\x85l\x14$&\xf0\xe5\xe9\xdd\xd9o\xcb\xb3$\
-1j\xc5\xe4\xb5J\x94-\x13&@\xca$*i/\
-\x10\x92^*\x05\x10e\xd9Z\x03\x12\x86\x88Nl@\
-L\xb5H\xd1\x02\xc1\x82\x82\x03\xd9T\xe0\xa7\xad\xb6\x0c\
-\xc3%\xa8\xb8\xe9\xb8\xc0\xdd\xfd\x8a\xffq\xe6\xb8\xbe\xb9\
-W\xff\xe0G\x1f~\xf4\x7f\xff\xbf\xff\xcf\x93\xa7O\xcf\
-\xd6\xc0Yn\xc2\xfa\xb6\x19:r\x98\xbb}s\xb0w\
-`\xe7\xef\xcdc\xf5\x13\x0b\xfe_8\xca?\x92\xd0\x0f\
-!|\x07\xe0*\xa5\xc2\x89@d\xa8\xc0\xcc\xedc\xaf\
-8\xc0\xbe\xdd\xc7\x0c%\xd0z\xf8\xdd\x066\xf6( \
-( I7\x82`\x84`\x01\x14\x00*f\xd4\xd6`\
-\xe6\x12\x80J\x05P\xe1\xec\xd8\x1cg\x18\xc6`\x90\xa1\
-\xd2w\x09\xa4/y \x9a2\x8b\xabe^Y#A\
-\x93\x8dl\x1c\x0a\xb6(\x84\x80\xce#4=B\xdb\x83\
-\xc1\xa8\xf7\xf6P\xcc\xf7\xb0\xd9z\x9c\x9e^\xe1\xfct\
-\x8d]c\x00\xbb\x07\xb1s\x88\xab\x85\xab:\xbay\xe5\
-MA\x97\x1d\xad\x1f\x9f\xed^\x7f\xfa\xe0\xf2\xf3\x87O\
-\x9a\xfb\x17\xf8\x9a^\xc4\xd7\x06\xd03 \x1e\xad\xd7\xeb\
-\xd7\xcb\xb3\xe7\x7fs\xf3\xf6\xd3}\x9a\x9f;6\xb7A\
--\x11v\xccl\x89\xacA`\xa3R\xdc\x964(O\
-e<\x1c\xc7\x931\x00\x07z\xc2\x06\x96-\xc79\x82\
-\xa4\x9c\x1f\xd3\xad\x06E\x82\xd1\x1a\xe5\xe7a\x0a d\
-\xf6-\x1d\x1f|\x81\x98\x9e\x92\x7ffP\xd6|\x8e\x84\
-<Vy\x00PHm\xdf6e\x84\x8dM\x002\x10\
-kH\x9c\x05\x9ca\xb2\x5c\x00|\xc32\xe3\xee\xcd\xdb\
-\xa6\x9eU\x87\xf7\xee\xde\xb9\xfb_\xfe\xfe\x1f\x7f\xf3\xf0\
-\xe1\xe3\xc7\xbf\xf9\xd5\xaf\xcf\x7f\xf9\xcb\x9fo\xbfx\xfd\
-\xc5\xb4b\xe1\x1b\x06\xd3\xdc\xcc\xb0(\x0f\xa8>\x9c\xf3\
-\xe2\x83\x19\x8a\x9fX\xe1\xbf\xa7(?\x83\xc8\x0f!t\
-'\x82\xeb\xac8`\xa9\x803%J;\xc3\xc2\xeda\
-nj\xd8@\x08\xed\x16\xec=\x8a\xe8\xe1\x10QB\xc1\
-b\xeel\x0eB\x00\x00 \x00IDAT\xf5,\xa2\
- \xa0bBm\x08\xb55\x98;\x8b\xba`\xd4\x85A\
-]0\xca\xc2\xc0\x19\xabU\xfa\x94\xeb\xda0\xd6<N\
-\xe2]\x19(\xd7\x9c\xf5V\x1bg\xc8\xc0\x1a\x07c\x0a\
-0+t\xd9\x07D\xdf!\xf4\x1e1\x12\xac+Q\xd4\
-{`Wa\xb5jq|\xba\xc6\xf2\xb2E\xd7[\x09\
-f\x86h\xe7@\xb1\x80\xabgbfE0\x15m\xbc\
-i\x9e]\xb4\xc7\x1f\xbf\xd8<\xfc\xec\xcb\xb3O^\xad\
-q\xbe\xfd\xba\xdf\xd3\x1fd\xe1\xa6\xdb-\xe3\xe8\xee\xc1\
-\xbe{\xef\xd6\xad\x1b\xf3\xb2|\xcf2\xbf\x036\x16\xcc\
-l\xac\x85q\x86\xc8\xa6\xa0\xdbj\x1f#\xe5\x81.\x03\
-\x13&C\xeek0\xc9\x93\x0a\xec\x5c\xec\xa9\x00\xc9\x16\
-+\x0e\xc7\xb25\xca`\x992oS\x9dn\xa2\xf48\
-J\x93\x02\xd2\xc8@N\xf7\x19i\x88\x93x\xb0\x8c\xb7\
-,\x1eF\xbc\x0e\xbb\x8d\x1e\x14<8\xf4\xa0\xe0A\xbe\
-C\x0c=(t\xc4\xde\x03>P\xf4\xdeH\x0c\x8e!\
-\xb3\xd2\xda\xc3\x83\xbd\xfd\xdb\xf7n\xdf\xb9y\xb8\xbf7\
-\xff\xf0{\xdf\x9d\xfd\xd3?\xfd\xef\xee\xbf\xfd\xaf\xff\xcd\
-\xecW\xfb.4\xc1\xf8+O-\xda\xc9e\x17\x84\xb7\
-\xb3Q\x85\xca\xde\xe0\xfd\xf9Mwxwa\xf7>\x9c\
-K\xfd\xd3\x22\x16\xff\xc0\x81\x7fF\xc2\x1f\x0a\xcc]\xc0\
-\xd4\x803\x96J\xae\xcc\x1cs\xbbG{\xee\x10\x07\xee\
-\x00\xa5\x14\xe0N\xc0\x9d'\x13z\xb8\x18\x14<\x04\x94\
-\x00J\x10*\x22\xcc\x0ca\xe1\x18\x07\x85\xc1aeq\
-XY\xec\xa5}^XT\x85U\xb6\xcd\xb0V^g\
-\xc5\xa6\xfc=\x02\xea\xaa\xa7J\x10\x92\x5cZE\x0a\x1a\
-6\xea\xaa\xd9Bw\xb60B \x1f ]\x07\xdfu\
-`2(\xab\x05\x5c\xb9@\x88\x0e\xcbU\x83\x93\x935\
-.\xd7A\x9a\xe0\xe0\xb9Fps\xa0\xdc\x83\xad\xf7\xa4\
-\x5c\xcc\x83\xa9\xb9\x09\xb6yu\x19\xcf~\xf3`\xf5\xc9\
-\xcf??\xff\xcd'\x9f\xad~\xfdj\x87\xf5\xd7\x96\xcf\
-\xfc\xda\x16\x08\x00\xee\xafO\xfb\x7f\xd8./\xce\xd7\xcb\
-'7\xea\xd9\xe3\xc2\xda\xbf5\xd2\x15$\xd6@\x1a\x22\
-\x140\xc6)\xddh\x08b)Y\xe3Qr7_i\
-2\x08\x08\x18\xaa\x14\xae\xedon9\x0e\x9a\x10\x0e\x83\
-X\xab\xe4Q\x1a\xdag\xa2O\x8f\xbf\x93?B\xfe[\
-\x03\xc132q`%;\x88\x19\x1cR\xc1=\x1b\xed\
-fdmn\x8a\xcc\x10\xcb 6`c!\xd6Rd\
-bq\xb6\x22g\x0d;S\x15\xd6\xec\xb31w?\xbc\
-\xf7\xee\xf7?\xb8s\xf7\xf9f\xb3y\xf4\xfc\xc5\xcd\xa7\
-\x07\xecN\xff\xf1G\x7fw\xb1\xde\xad/\x9b]\xbbY\
-.\xcf\xdb\xd7'/\xfc\xd9\xf24<zx\x12.p\
-\xf1U\xee\xde\x9fb\xad\x08\x00\xd5\xa8\xdd!\xdf\x9c\xef\
-\xd9\xfd\xbb5\xd7\x1f:)\x7fb\xa2\xfb!G\xfa!\
-D\xbe\x17\x81;\x04\xaaAd\x0c9\xaaLM\x0b\xb7\
-\x87\x99\x99\xc1E\x07j\x19\x14\x03L\x08\xe4\xc4\xa3 \
-m\xc9\xb7 \x14\x04\x94D(\x89P\x1b\x8dq\xe6N\
-og\xd6\xa0v\x06Ej\x88\xcbMp\xaaq\x90\xf4\
-\xdc\x80\x9c\xe8KU\xf9\x18\xd4O\xf3\xf7B\x00\x98\x19\
-\x86-L&\x0a\x8c\xd5\xab\x8d\x0f\x08\xc1#\x06A$\
-BQVp\xe5\x1cB%\xb6\xbb\x88\x8b\xd5\x15V\xab\
-\x06MG\xe8\xa5D4%BQ\x02\xe5B\x8aj\x1f\
-E9\x0fTr\xdb\xd9\xdd\xd9\xd6_~\xf9|\xf9\xf0\
-\x97\x9f\x9f~\xfa\xe9\x17\x97\xbf}u\x86W\xbf\x97\xb6\
-~s\xfb\xa3\x00\xf4b\xb7\x8b\xc7g\xcb\xf5\xd3\xa3\xa3\
-g\xb7\xe6\xfb\xf7\xf7\xe6\xf3\x9f!6\x0b\x8e\xe4b0\
-d\xc4\x81\xc9eU\x11\x88M\xac\x9c\xd006d\xa8\
-K\x94\x89Xb\xba\xda\xe8\xa0\x85\x5c\x8d\x9dJ\x18\xf3\
-\xd8\x11JsP\x13`\xf2T\x06\x9a\x00(kw\x8f\
-\xae]:\x0f\xd9G\x18cS f\x9a\x1b\x00\xa7\xf7\
-\x10F\xb1\x0a\x02\xe7Tw*R\xcc\xc5\xaa\xfa3\xb1\
-\xd6+\x19\x22\x821\xa2\xbe\x05\x1ba.\x8d5{\xf3\
-\xca\xde#k\x7f\xb0_\x94\x7f{\xf3\xfd\xef\xbc\xfe\xc9\
-;\xef\x9dz\xc2\xf9\xd9jy\xfc\xfc\xe5\x8b\xd3/\x1f\
-}q1\xaf\xdcU]\xd8\xf5\x8c\xecz\xbd\xa9\xb7\x9b\
-\x96:j\xbb@\xdb\x93\xe0\x80x\x0e\xc8\xcb?.\x86\
-\xa2\x02\x85\xd9\xc3\xac\x98q}ca\x0f\xdf)1\xfb\
-\xbe\x0b\xeeoMp?\xe2h\xbeC\xe0\xf7\x09t\xdb\
-\x80f\xcc\xce8Srej\x14\x5c\xa2@\x01\xd7\x1b\
-\x9db\xe1=\xac\x089\x00\x051JD\xbd%QW\
-\x8d\x95a\x9b;\x83\xbd\x921+\x0cf\x85A\xe5\x18\
-\xa5\x19\xa5\xa8\x88T\x9e\x92(O\x94\x8b\x03\xbb\x8a8\
-\xa9\xcaO\x173f\x15\x121\xe4`\xb9\x841\x0el\
-4F\x85\x0f\x08\xd1#D\x00la\xca\x0au5\x03\
-\xbb\x0a\xbb]\xc4j\xb5\xc1r\xd5c\xbd\x03\xba\xdeB\
-l-\xd1\xd5\x10W\x82g3q\xb3}\xa9\xaa\x85\x18\
-k\xba\x8e\xb6\xe7k\x7f\xf1\xf9\xb3\xf5\xc3\x9f\xff\xfa\xe5\
-\xbf\xfe\xf2\xe1\xd5g\x8f^\xb7\xcfWP\x95\x93\xaf\xbd\
-\xfdQ\x00\x02 g\xaf^v\x8fg\xfb'\xef\xdd\xb9\
-\xf7\xe9\xe1\xfe\xfe\xc7\xfb\xa5\xdcq\x91*\x09\xc6\xc4P\
-\x10\xc5\x12\xc4\x06d\x8d\xbe:\x91~x\xc9\x84\x00T\
-\x7fZ\xc6\xa9s\x94\x0e\x0d\x97\xa0kzW\xd9m\xcb\
-\xae[L\x93\xce\xf2\xe8s\x01Q@\x1e>8-\xdf\
-\x19\xe2$\x99\xbe\x96\xbe\xbe\x8e\x98\xcc\x7f/\x13\x10Z\
-\xb3\xa7/AC\x1e+\xc7R\x82T=O\x09P\xcc\
-I\xb9\x9fIRw\x17\x11\x9b\xc8pbME\xc6.\
-\x8c\xb57K\xe7\xbe\xcb\xae\xdc\xc0\x98\xed\xe1|vy\
-\xf7o\xdeY\xfe\xed\xcd\xf9\xc5\xee\x1f~r\xe1\xa3_\
-R\xe8.\xfa\xa6Yn6\x9b\xf5ju\xd1\x9e\x9d\x9f\
-5\xe7\x17\x17\xcd\xe5\xe5e{\xb1\xbe\xf2\xab\xf5U\xbc\
-\xbc\xda\xc4\xab\xf5\xda_n\xb7~\xdb\xf7\xd1{/\xf9\
-\x9bN5\x1f\xa6\x80\xb3\x05U\xceq]\x15R\xdd\xb5\
-\xc1|h\x84\x7fl\xc4\xfd\x80\xc4\xbdO\xb0w\x0c\xd9\
-\x1b\x86L\xed\xd8\x19\xc7%\x95\x5c\xa3@\xa1\xd4\xb4\x17\
-p\x0c`\x11\x18\x08\x0ah\xf5@I\x84\x8a\x0df$\
-XX`n\x193g1s\x16\xb53\x9a u\xac\
-5m\xcc\xb0<\xcelP\xa0 M\xdf\x08\x88\xc3\xc0\
-_\xe8\x1a\xc8\x145\x93&\xae\xd9\xc0\xb0\x05S\x01\xc3\
-\xca\xf1I\x904n\x05\x801\xb0e\x0dS\xcc@\xb6\
-B\x08\x84\xcb\xb3\x16\x97\xab\x16\x97W\x01\xbb\xde\xa0\xa7\
-\x1a\xd1\xcd\x10]\x0dTs\x98z\x06\xb3\x98\xa3\x9c\xcd\
-\xc5\xb1i\xfb\xb09\xbd\xea\xce\xee\xbf\xd8<\xf8\x97\x8f\
-N\xff\xe7?\xff\xdb\xf2\x7f|~\xe1O\xce\xafp\xf5\
-G\x97d\xfd\xb1\x00\xc2\xcb\xe6\x22<\xbd<]\xdf=\
-z\xf9doQ\xffjv\xe7\x9d\xefY\xf1\x0bH\xe7\
-\x10\x9aB\xc2\x16\x88i\x18\x05\x1b\xcd\x22'\x8d\xea\x90\
-\xc61\x22\xe5xhp\xb3$\x91\x0dJ\x18P\xbc>\
-\x98b\xb0\x1c\xac\xe3\xd2\xc7\xbe\xa1\xe43\x0f\xf1R\x1e\
-\xaf\x82\x84H\xe4\xafQ\xaf|\x19\x9c\x94\xc9\x88\xfc\x80\
-8\xbc\xa6\x92x\xd92%\x17op*\x12\x15\x9f\xa8\
-\xf9\xe9\x99&5\xa2DZ]\xc2\x02\x14 2\x02.\
-\x84y\x11\xc9\xf40\x1cj\xe6P1\xba{\x86\x1a\xcc\
-\xca\xadp\xb9\x89\xa1\xd8t\x85\xb9j\x0a\xda\xeeJ\xea\
-v\xfbU\xd3\xbd{{\xeb}\xd7\xb4]\xd74}\xdb\
-5\xbd\xef|\xd7\xb7!\x84\xb6\xef}h\xbb.6m\
-+\x9b\xcdV\xd6\xeb\x1d]nv\xe6j\xd7\x17\xed.\
-V]+\xb3\xae\xe1\x9bm\x1b\xdf\x13\x91\xf7\x09\xfc.\
-\xa8\xb8\x01\x14s\x83\xa2\xb4d\xb9@\xa1\x0a\xd5\xde\x82\
-\xa3\xc0\x8a\xc0\x09\xe0R\xf8\xeaX]\xb4\x92\x81\xca\x02\
-sC\xd8s\x8c\xbd\x82\xb0pF\xc1\x93:H-\x93\
-*\xe8\x10\xb4\xfa:\xa5#$\x06\xc4 I\xe1H\x07\
-\xa4Q\xc8\x8c)\x0f\x17#\x15\x081\xea\xa2\xb1\xd5D\
-)x\x94?c\x80\xac\x85\xb1Zi\x0d.\xd0\x07\x83\
-\xdd\xaa\xc5\xe6\xb2\xc3f\x1d\xd1\xf5\x0e\x1es\xc0\xd6\x80\
-\xa9 e\x05\xae\xe7\xb0\xf3\x03\xf0|.\xa6*\x22\x19\
-j\xfav}|\xd9\x1e\xdf?Z?\xfa\xd7\x07\x17\x9f\
-\xfc\xf3o\x8f~}\xff\xdc\x1f_\xfc)\xe0\x01\xfe\x04\
-\x00}\x0c\xc8\xec\xf2\xb2-_>>\xb9s\xf3\xe0\xfe\
-\xbd\xbd\xc3OlE\xb7\x8c\xe1\x1a\xc1\x19\x04g\x11\xac\
-\x88$1Vv\xc8C)\xd2,E\xbd\xf2p\x8a\x80\
-r\xc0\x98s>Y\xfe7D\xc4\x04\x0a\x05I\x9a\x0b\
-$\xe3\xb1l\x9d\x86c\xf9\xf1\x00\xae\x09>J\xb2b\
-SK4X*e\xfbRy\xc2\x18\xd1\x13F\x0b5\
-9D1k\xcfL\x5cE\x89\x13\xe6h\x10\xe5\x16\x02\
-l\xba\x98\xbb\xc1\xdd\xcf\x02\x03D\x81\x18\x9e\x88\xbc \
-\xf6&\x86\xbeB\x08\x071\x04\xe1\x18\xa4\xb6A`\xfa\
-\x10\xcb6\xca\xbc\x11\x916\x84\xd8\x07\x89>\x84 \xbd\
-\x0f\xb1\xeb|\xdc5\xad\x02i\xd7b\xddz\xbb\xde\xf6\
-\xe5v\xe3\xe7\x9bM\x9co\xafx\xafi\xdc^\xdf\x95\
-\xb3\xae+\xca\xde[\x1b\x83a\x0aL\x14\x99(\x08X\
-\x02\x1cH{s\x88P\x1a\xa6\xca2*\xa3\xf1Me\
-\x09\xa5%\xcc\x1ccQ\x18\xcc\x0b\xfd]i\x08.Y\
-\x1a\x16\xb5\xfc\x14cR\x80\x8dI\xe3?\xa6yP\x18\
-\xb4\xcb\x09\x94\xfa|\x0c\x06e\x1d\xc3`\xab\xf5l\xca\
-mg\x0d7\x03JU\xd6\xc2\x06\x01\x8c\xbe'\xecv\
--\xd6\xbb-v\x8d\xa0\xef,B\x98!\xf0\x1cQ\xe9\
-iPY\x89\x9b\xd7p{s\x98z!l]\x08\xb1\
-\xdfm\x9a\xe5\xd1r\xf3\xfa\x93\xe3\xf5\xa3_<\xbe\xbc\
-\xff\x8b\x07\xe7\x1f}\xfa\xa8\xfd\xec\xf4\x0aW\xffa\xbb\
-\xc2\x1f\xda\xfeh\x00\x01\xc0\xd9\xea(|\xc2\xdd\xfa{\
-w\xdfy\xfa\xde\xde\xcd\x7f\xafn\xdd\xfa\x1bk\xf8F\
-\xf4MezM/\x8b7\x90\x22ks9\xbd\xd2D\
-\x1a\x00$\xc9e\x1b\xac\xc8P\xbf\x93\x872\xe9(\x15\
-\x09*^A\x14T\x14q\x02*\x84\xf4<\x8e\xe0\x98\
-Fj\x0c\xae^\x06\x8aL\x00\xa7\x0b^':\xc4\xf1\
-1\x10\xfd\xbb\xc3\xf30<v\xfc=\x92;\x92\x08\x8b\
-\xdc;\x04I.i\x18\x05\xee\xf5=P\x1eX\x8c(\
-F\xc7\xa9\x8feI\x22q\xc8\x0a\x93\x88\xe4Q\xc7\x94\
-/\xdf\xc9\xc8\x89\xce\x0e\x09D\xe4\xa3H\xd4PQ\xa9\
-\xc7X\xb0\x84b&1\xd6\x12\x04\xd2\x03\xd4\x07\xb2}\
-'\xaek\xc94[\xb2\xdb\x0d\x9b\xf5\x9ax\xbd\x16\xde\
-\xee\x84vM\xa4\xbe\x05\x85.B\xbc\x80#\xe0\x22\xa3\
-$\x83\x92\x0dU\xc6\xa0\xb2Zz3\xb3\xa9\xd5\xc0\x12\
-\x0aC(\x1d\xc1\xb1\xa4\xe9rA\xcfE\x9ed\x16\x02\
-$\x04\x05M\x88Ck\x150\x8d\x1dS.\xc7\x18\xb0\
-Ij\xa2I@\x9dM\xca\xb1\x19\xcd\xf1\x10;0\xe9\
-\x8c\xba\x10\x05m\x13\xb1\xdb\xf5\xd8\xed\x04]o\xd0\x06\
-\x83^\x0a\x04S#\xb8\x05\xa2Y@\xca9\xa8\x9a\xa3\
-\x9c\xcf\xe0\x16\x15La!,1\xf6\x9b]\xbb\xbex\
-u\xb2|\xfc\xdb\xe7\x9bG\xff\xf2t\xf3\xe5/\x1f\xae\
-?\xfd\xe2\xcb\xd5\xc7\xc7\x7f\x0ex\x80?\x11@\x0f\x00\
-\xb9\xb8\xb8\xe8?x\xfc\xe0\xec\xbd\xf9\xdeg7\xe7\xf5\
-\x07\xce\x99{\xa67\xfb\xc6\x1a\xc7=\x13\xf5\x04\xf1D\
-p\xea\xd3\xa8i\xc6\xc8\xbe\xa4\xd8CR\xdcBI\x8f\
-\x1ai\x8e\x8b\xf6\xba\x06\xe49\x9d\xf9\xfeh\x89\xf2\x22\
-N\xf44\xa5\xa1N\xd3\xb8iX\xcc\x93D\xec\x00\xc0\
-\xb1H\x7fZ\xb0\x7fm\x977~'#\x81!i\xac\
-\xa4\xea\xdc\xe9{\xcf\xb1Y~m\x89\x11$\x91 Q\
-]\xc6\x98b4ui(O\xe5\xa3\x5c^$2\xc4\
-u\x10\x91I\xcd\xb8:\x96\x92{C\x95\xf7\xb7\xcc\x92\
-z\xd51\xb4\x03k\x92\x91df\x10+K\xfd\x81E\
-\xe7\x0d\xda\xde\xa2\xf7\x8c\xde\x13\xf5\x9e\xe1{\x81o=\
-\xa4\x8d@+\xaal\x1c\x08VX\xdb\x0e\xa0\x16\xc6\x22\
-\x15\xe5BS\x04\x19(\x12\x82\xbae\xf9\xc2\x10\xa7\xf2\
-\xcdf\x14sa\x05\x0b\xac\xd1\x22\xdd,\xc3\x9b,\x10\
-\x19\x93X\xdb\xc4x\x92A\x14\x86\x0f@\xd3F\xb4m\
-\x8b\xa6\xf5\xe8z x\x07\xefKD\xcc\x00\xa3Z\x07\
-\xb05P\xcc\x81r\x01[\xcf\xc5\xd53\x94U\x096\
-\x80\xef\xb7\xb1]\x9f\xb7W\xab\xa3\xe3\xd3\x8b'\x9f>\
-Z\xde\xff\x97\xfb\xdd\xc3\x9f?j\x1f?x\xd8~~\
-v\x84\xcd\xef\xad\xb4\xfe:\xdb\x9f\x04 \x008\x07\xe2\
-\xaf\x9e~\xb1{\xff\xc6\xe1\xb3;7o\xfc\xbb)\xdd\
-=\xe3\xdcM\xdb75\xb74cG&\xf6\x0c\x14\x0c\
-v\xda\xe4\xc6\x9c*\xdad\x8c72#G\x14\x13U\
-=\xbal2\xb8d\xe98\x8dn\xda\xd0\xef\x93]\x07\
-J\xe31\xb2U\xa0L2L\xc12\x12\x11#\xc0F\
-\x97n,\x13\x8a\xbf{;\x01S\xa6\xe5\x91\xf5\xc6\xa3\
-j\xf8\x0fs%\x07\xcb\x93\xdeC\xbeRC\xb4t(\
-\xa6X.\xbb\xb4Q4\x98\xce\xe0\xd2\xdbt-\x88D\
-\x22\x229\x81\x9c\x1e\x9f\xc9,\x9dB\x90\x89\x8e\xdcK\
-B\xea\x06\x11\xc3\xb1CA\x0e{\xa6\x04L\x09*\x1d\
-0/ \xa4\xcd\xd61X\xc4,\xae\xdf\x13\xd0\x03\xd2\
-\x0b\xa4\x0f\x9ag\x09*w\x9c\xdd\xb2|\xba\xf4\xaf\xa4\
-4bn\xa3\xa7\xa4\xd7\x96\xda\xab\xc9\x18\x90\x99\xde\xea\
-\xb3r\x8c\x83\xac\xdd&@\xf0\x82>D\xf4>\xa0\xef\
-\x02\xba>\xa2\xf7\x84\xce\x03}t\x08T\x82\xed\x02\xb0\
-s\xb0\x99\x81l\x0d.j\xb8\xb2F\xacf@Y\xc1\
-\x94\x05\x0c\x03\xe4wh//\xb0\xbex\x19\xb7W/\
-6W\xdb\x97/\x8e\xb7O>\xbe\xbf\xfc\xf8\xd7\xf7\xf1\
-\xe2\xcbg8??\xfe\x0b\x80\x07\xf83\x00\x04\x00\x9f\
-\x03\xe1\xd7\xaf\x8f\x967\x0e\x9e~^\xccg\xb7la\
-oXCs\xd3\xe1]\xd7\xa2\x22KF\xcb\xff\x19\xc4\
-\x82H&\x05\x01\xb8\xd6\xe6\x9d\x8c\xce@]\x0f@\xba\
-V\xdb\xa3\x7f3\xf7\xee(\x93\x96\x00\x04\x0f\x9d\x1a\x9c\
-\x16\xf1\x00\x9aq\x1f\x5c\xc4\x0c\x1c\x99\x00H\xde8&\
-\xe1+\x8eO@\x98\xacO\x1a\x837\x02g\x00\xd1\xe4\
-\x18\x92k\x19\xd3\x85!\xa8e\xc2\x1b\x00\xd2\xeas\x05\
-\x18EuO%\xbd\x8e\x04!\x04\x8d\xe1\xd48\xcb\x18\
-\x9cK\xf2xE\xd4\x09\x8c\xf1:\xd3\xa5\x856H=\
-#\x1a[8\x0b\xb8\x02\xecJ\xc0U`W\x83L\x01\
-\x81\x03\xc8\xaa.\x99\xcb\xb5\x83:&S\x02\xe9\x802\
-\xcf@0:\xa4,\x10(\x00\x9c\x5cs\xa2d\x0d\xb3\
-*\x0e\xe5^\x9edK\x87\x8f\xcd:\x19=\x12B\xd4\
-\xe9\x80>\x08|`\xf4^\xd0{B\x14\x0b1%l\
-Y\x82m\x81hJ\x88\xad\x81\x0c\x1eW\xc2\xb8\x02\xe2\
-\x0aDc\xe0%H\xbf;C\xb7=Gwy\x84\xee\
-\xf2H\x9a\xf5\xeb\x10\xc3\xd96\x9a\xd5\xc9\xce\x9d<}\
-\x82G\xcf_b\xb5:F\xf3g\xb9m\xd3\xed\xcf\x02\
-\x10\x00ytt\xd6\xdd=8::\xb8y\xe3\xb7\xa5\
-\xb3\x87%pPH(\x0c\x87\xdbDR\xc1\xc0 \x95\
-\xa9\x93\xd5$k\xca\x08$Q\xbeD!\xe75\x9a\xaa\
-\xb9\x85&q\x0c\xb4\xb2\x1b!\xd3\xcd\x02\x98\xbc\x90\xd5\
-\xed#h\x8c\x04\x9e\x00(\xea|\x1aBr\xad(\x8e\
-\x16j\x00\xc5h-\x06`L\x8e\xd3\x14DH\x93\x07\
-&\x16\x87D\xc68 [\x9a\x104\x9f\x95\xe7\xb8f\
-`I\xd4\xcf\x90\xc7Hf\xb7'\xddG\xd0\xb6\x0f\xf1\
-\x11\xf0\xfas\x0c\x11\xe8\x03$O\xd1\x0bB\x88Qb\
-P\x10\xc5\x98\x03\xf5\x88\x18\x03b\xf4\x03\x80r\x0c\x02\
-\x10\x0d5eH\x1d\x9eF\x83v\xb1\x05\xe0R'\xa7\
-)\xb5\x15\xdaV0e\x0dSV\xfa\x9d\x99\x02\xc4\x0e\
-\xb0V\xad\x88\xb0.\x1d\xb1`10b\xf5X\x1a\xf2\
-<\xc8&\xe6c\x00DT\x1fP\xc1\xce\x88B\x88\x91\
-\x10\x22CD]Ok\x0d\xb8\xd2\xe6\x09P\x09\xe1\x02\
-b\x0bD\xe7\x10\x8dE\xb4\x85\x1ec\x03\x81 \xc4\x0e\
-\xbe]K\xdfm\xd1n\x97h\xd7\xc7\xf0\xeb#\x84\xcd\
-\x91\x18\xbf\x92=n\x82\xaf\xba\xed\xcemNW\xfd\xf1\
-\xeb\xe78;\x7f\x05\xdfa\xca0\xfd\x99\xdb\x9f\x0b \
-<\xc4&\xccW'\xeb\xc5\x8b\xc5\xd3\xbd\xc2\xce\x17L\
-\x873\xda\xdb\xa3\xd8\x17V\xa2%\x12\xe2T\xe4L\x98\
-A\x12\x88\xc0<\x10\x08cI\x02\x90\xb3\xab\x9cS\xa2\
-)\xf39\xad9\x1c\xe2\x11\x93-L\x18o\xa7\xc0\xa0\
-\x08\x88\xbf\xe6\x0a\x0a\xf2\x94\xf1\xa9E\x9aZ\x94\x89\x0b\
-6\xdc\x1f\xad\x15\xa5Xgt\xd7F\xb7l\xbaS\x06\
-\xb0\x84\x11\xe8A\x06\xe0 \x8c \x82\x8f\x90\x90\x80\xe4\
-\x05\xd2+\x80\xc4G\xc4>B\xfa\xa8\xf7\x83\xdeJ\x88\
-\xa4\x8f\x8f\x08A \x12%\xc6\x88\x90\xfe\x9e\x88P\x9e\
-\x88\x81\xc9'G\x06T\xb2\x0a\x91\x08B\x8c\xc8\xb9\xb6\
-*\x8f\xffp`[&+U\x80\x9d\xea\xaa\x91+A\
-\xa6\x06\xbb\x1a\xd6\xd5\xb0\xb6\x82\xb8\x19\xa2\x9d\x81\xb8\xd0\
-\xd7\x10\x03\x90\x03\x90(iQe\x04\xad\x01Ny\x1f\
-1@d\xc4h b\x91J\xf7\xd5\xa5$F$\x86\
-\xc0\xa5\x9f\x0d<\xeb\x10\x03\x81\x87\x8f\x1d\xfa\xb6G\xd3\
-m\xb1\xdb^\xa2[/\xe1\xb7g\x90\xdd\x19\xb8[\x8a\
-\xf3+T\xb2\x91\xd2vb\x1d\xbam\x11/\x02\xad_\
-\x9dvg\xaf\x8f\xe1\xaf\xf0G&J\xff\xd0\xf6g\x03\
-\x08\x00>:z\xeek\xc8r\x9f\xe4\xcb9\xf3lf\
-\xcc\xe1\x9d\xb2\x98\x971\x14F\xfa}G\x9e\x84#\xc0\
-B\xc4\x95*\xa7$_]\xd3,\x11`\x9dt'\x92\
-\xe2\x01\xe4\x9a8\xbd?l\x94\x16\xe1\xd0\xe73u\xd5\
-R\xfc \x01:\x8d\x22*{\x97]\xb2\xa9k7\x8d\
-ybv\xff\xae\x03hd\xd1&1\x90Lc\x9d0\
-\x82!]\xf5\x07p\x0dqR\x02THAK\x88\xc9\
-\xdb\x8c*\xac\x17Dc\x8c^_g\x00L\x1f\x11\xfb\
-\x00\xf1\x92\xf6\x88\xe8\x03\xa2OeQ!]\xd1\x83@\
-\xbd\xba\x14\x9b\xa5\xa2[}\xb7\x03%1!\xf7\x93E\
-\xa0\x91\xf8\xd7\xb3\xc0\x9a\xc8\xca\xfd60\x03)Al\
-@\xc6);f\x1c\xd8\x140\xb6\x841\xa5&4\x8b\
-=\xd8b\x06\xe3j\x90)U\xcc\xd0\xd5 S\x81M\
-\x09f\xa7\xb1\x11\xe9\x80?\xad\xf7\xa5T\xdb\xab\x7f]\
- \x88\x12\x11$\xc2GA\x8c-|\x14\xf41\xa2\xf5\
-\x1dv}\x83\xa6\xdb\xa1\xf7\x0d\xda\xdd\x06M{\x09\xdf\
-^\x82\xbb\x0d\x8a\xfe\x0aU\xdc\xa0\xa2F*\xeeP\xbb\
- E\x81\x10K\xdem\x9c\x1c\xefB\xf3\xe2\xd9\xe6\xe4\
-t\xa7:~\x7f\x11\xd7-o\x7f\x11\x00\x01\x90\x07G\
-/:\xd7u\xa7\x16\xf4qil]\xdc\xb9S\xef\x8b\
-/\x9ctNb?/b`#\x22\x90\x05\xa1\xae\x07\
-j[0\x0a\x1c\x0e!O\xfe\x88C\xf5t\xda\xd2\xc5\
-S\x80d!\xd2'H\xcdq\x92\x16\xb9\xd2\xd9\x13\xab\
-\x84iL\x13\x07\x1a;\x1f\x93\x18\xd4%\x9b\xc4*\x83\
-\x05\x8ao\xc6B\xe1:\x88bL\x00\x92\xcc\xae%\x80\
-gPE\x8d{\x024\xb6\xf1Pk\xe3E\x81\xd4\xeb\
-\xfd\xd8+\xad\x1c\xf3\xfd\x09\x80\xd4r)\xa5/A&\
-a\x97\xe4\xd0\x08\x22\x99Za\x08\xe2\x1bvy\xa0M\
-\x92\xb3K\x88B\xc8\xce\xaf\xe4\x93\x0bUz\xa3\x14\xa0\
-R\xc8\x17\x22\x82\xae=u\x118\x91\x15*\xa7k\x01\
-\xaeA\xb6P+d\x0a\x88-\x01[C\xb8\x048\xb9\
-\x7fTh|E\xe3 \x93\xdc=$I\xab4\x82\xe0\
-E\xd0\xa7\x04l\x88\x11>Ft\xb1C\xef[\xf8\xbe\
-\x85\x84\x16\xd17\x90\xb0\x85\x95\x065<*\xf4X\x98\
- \x95\x09(MDi!l)t\x0e\x9b\x96\xc2\xeb\
-U\xec_\xbd\xe87W\xf8\x0b\xbany\xfbK\x01\x08\
-g@\xfc\xec\xe2\xa4\xed>n\x8eK\xc8\xaf\xe7\x96g\
-\xef\xdf\xd8/\xf6\xa2\xb5\xd2\xfb\x0f\xa8\xf33\xf2\x81\xd8\
-\xb7\xa0\xb8\x00f3D\xe7 \x99\xce\x8c\x18\x94+A\
-9_2\x8d\x83\x80AI'\xbb#\x02\xcd\xc5\x22_\
-\xc8\xd2\x22\x1e\xae\xb9\xf1\xda\xd2\x19,\xd0$\xd6Q*\
-6\xe5\x98$\x0c\xaf\x91-\x14\xc5)\x88\xd4\x15\x93l\
-yr^h\x0a\xa0\x90-\x124\xd0\x8e\x94\x8e%C\
-\x18\xa0\xf1L\xbaE\xaf\x0c\x94x \xa6[\xf1\x84\xd8\
-\x13$\x98\xd1\xf2\x01\x90<;)\xc5\x8aBQ\xadL\
-\x22\x10\x82\x10\x82H\x8e\x08\x87\x04\x80O\xbce&\xfa\
-\xfbT\x8b~\xdd\x02\x8d~\xf4\x1b\xdet\xdah\xf8?\
-\xe7\xd5Dt\xd2\x5c\x0c;H\x9f\xc1\xab\xcd`\x02\xdd\
-\x07\xf7\x8c,\x02\x5cz}\xa3\x16I\x95\xb1\xa1\xdd\xbf\
-\xda\x90\xe9!\xf0\xf93\xca`\x9b\x00\x09`\x09\xb0\x88\
-p\x08\xb0\xe8Q\xc2\xa3b\xc1\x0c\x82\x8a\x05\xa5\x118\
-K\xb0\x96\x04\x8e\xfb\xe0xu\x15\xfa\x17/\x9b\xcd\xf1\
-9\xf0G\x15\x89~\xdd\xed/\x06 @ATo\xaf\
-\xda\xfb/\x1e\xbd>\x9c\x17\xbf\x12\xfe\xb0|o\xb1\xe7\
-\x0c\x9b\xc2u\x9b\xf7|\x08\x85\xf5-\xb3o\x88\xc2\x1e\
-hVC\x8aB\x95$5H\xd2Z\x18\x89\x90\xc4\xb0\
-\xc9\xf0\x15\xeb\xcf\xb9+\x958\xa6\x18H\x17\xb2\xf0X\
-\xce\xa3\xa3\xea#@\xba\xd8)\xbb^\x93\x98\x86& \
-\xd2\x1c\xce\x1b\xc1~\xa6\xa13\xa36X\xa4\x1c\xd3\xe4\
-\xe3\xea\x8e\xd1@\x02\xc8h\xf4\x02t\xb0q\xa0\xe1g\
-\x09\x828\x01\x90x \x06\xad\xf7\x92H\x89\x00\xa0\x14\
-\x8f\x88\xaeb\x89\x10\x13\xc7N\xdd\x88\x01\xd41D\xf8\
- \xe8C@\x17\x04\xbd\x08<bn\xd6@\x0fNY\
-4\xd5\xca\xf1\xe0\x01@\xf2; \xca+lt\xab0\
-\xd9\xc7\xf2\xaa1\x9e\xcc\xc3\xd3\xf2\xd5L\xcb\xa6(\xd9\
-2\x93\x5cB%\x0a\xe2\xd0=4\x8c\x12F\x12\xf9\x1d\
-\x18\xbb\x08B\x96\xab0`\xb0\xe4GF\x18\x04\xad\xcf\
-\x83\xa0\x22AI\x22\x05\x13J\x02\x9c\x01\xac!8C\
-b,K(l\xdb::Z\xf6\xfe\xc5\x93\xf5\xe5\xd9\
-\xd1[\x12\xc0\xfc\x8b\x02\x08\x00\x9e\x03\xf1\x93\x17/v\
-\xb6\xa8\x9e\xb1+K\xba\xf7nU,\xf6\x16\x05\x9b\x19\
-\xd6\xeb\x1b\x88]i|K\xdc\xb7\xa0\xfd\x05x>\x03\
-\xcaB}\xec\xdc$\x04\x00\xd0a\xbfB)\x8e\xe1\x14\
-KpZ\xc8\xf96\xef\x09p:\xa40\x01a\x98\xe1\
-:\xb1>\x08C\xfe\x08\x03!\xf0F\xfc3\xa5\xa3\x07\
-\x7f)\xddb\xb46\x94\x00\x94\xc9\x01\x1a|&-\x0b\
-@\x94\xc1}S\xc2\x00\x130%Z7\xa6\xa6\xbe\xbc\
-\x08\xd9\x0c\xf2Z\xe35?\xc57\xc8\xaf\x93\xf2@Q\
-\x10|@\x0b\x8f&\x064\x88h \xe8!\xe8\x81\x04\
-\x16\x03\x1d,\xa2jm!\xdd\xcf\x00\x9ad\xc5 \xa4\
-qH\x82\x06|\x1a\xd98X\x81a\x84#\xd2qe\
-9\x05\xb9\x8a\x03\xd7\xec\x19\xe7\x7f9\xb6J:\xa5c\
-\x17P\xbee\xe4Im\xda\xee\xc0*\xdb\x98\x92\xbai\
-$u\xb2W\x84\x92\x18%\x01\x05\xa5\x99B\x84<\xb9\
-\x9b\xd8\x00\xe4H\x82\xe3\xed\x9a\xfc\x8b\xf3\xd8\x1e=i\
-\xae\xde\x9a\xd8\xcb_\x1c@\x00\xf0\x11\x106\xa7\xc7\xeb\
-\xce\x98'\xe4}U\xbc\xfb\xdeA}p\xe3\xf6\xcc\x07\
-\x87\xf5\xd6\xc0{+}\xcf\xdc\xb6\xe0\xb6\x05\x165P\
-*\xeb\x033\x9d$\xaf_m\xfe\xf2\xa6n\x99Pv\
-B\xc2\x00\x8c)P\xb2\x87?Z\x8d\xf4\xf3\x00\x8e\xd1\
-\xe2\xd0\xc4\xf2h\x0c\xe3'\x16&-\xfc)\xeb\x16e\
-L\x84f\x81\x92(\x83\x85Av\xd9\xa6\xf9\x9c\x84\x0f\
-\x89Y\x1f<\xb3\x8c\xbapED\x95R\xb3\xe4V^\
-8\xa4g \xebE(\xd7!\x08A\xd0\x85\x88]\x0c\
-\xd8\xa2\xc5F<\xb6\x22h\x00t\x10\xf4\x83\x052\xf0\
-I\xa1Z\xc1\x92e\xde\xc7\xe6\x8f\xec$\x8aD\x04\xc4\
-\xe1_\x87\x88\x88\x90\x00\xa4\xb1\x90:X\x82\x11*\xba\
-\xc9\x00\x9c\xd1\xe5T\xbb\x97\xe4\xc3D\x811}T\x86\
-\x5c\xfe\xc7 8\xb1(`t(W\x1a\x13\xa9\xd2\x9d\
-\xe3\xe8.\x05\x8c\xea0\x00\xea\xb50\x131\x93\x90%\
-\x88c\xdfX\xacN\xfd\xee\xf9\xa9\xdf\x9d\xbc\xc6\xee\xad\
-\xb8o\xc0[\x02\x10\x00<\xbc\xba\x0a\xe4\xfd\xa5\xe9\xdb\
-G\xe4\xfd\xc2F\xba\xf7\xe3\x1b\x877\xd8\x87:l:\
-#m\x10l[\xa2\xa6\x01\xedf\xc0^\x0d\xaak\xc0\
-\x95\x80\xb10\xac\xbdD1\xe7p\xd2\xa2\xcfe3\xba\
-\xf8\xb3/\xa4\xf1K\xde\xc7\xdfOw\x19_#\x8cq\
-\x8f\xd2\xcb\xd7I\x01\xf1!\xc9_\xc5k@\x91L\x0a\
-d\x02#\xbbR^\xd4\x8aL]\xb7\x0c\x9e\x09\x1f\x01\
-\x99\xbaL4\x5c\x80e\x88\xe5hd\xc0\x92\x1338\
-P\x19\xab\x1e\xf0\x88hE\xb0\x0d\x01\xeb\xd8\xe1*\x08\
-\xb6\xd1`#\xea\xe8\xf7i\xd7\xf8'[\x1f}M\xb9\
-&\xf5\xae\x0b3;hjOF\x08\xe5{\x0a\x1eF\
-\xae\x0f\x19-\xd2\x187\x0d\xf6\x87\x04Y~i\xea\xd8\
-iQ\xd2\xc8\x0e\xe6-\xcfY\xd5\xa1\x90\xfa<G\x0a\
-\xa7\xa1|Q\xcf\xcc`\xd1\xf2\xc5E\x12\x0d\x9fG\xde\
-\xb3!\x90\xb518\xd3l\x18'\xaf\xd6\xeb'\xaf\x9b\
-\xf5\xe9\xe5[`\xdf\xf2\xf6\xd6\x00\x04@\xcew\xbb\xfe\
-\xcb\xe3\xe3\x0bn\xfd\x97\xf3h\x7f\xf1^\xb5\xf7\xfd\xc3\
-\xb28D\xf0El;\xa2\xb6#\xb4\x0dx\xbb\x05\xed\
-j`1\x03\xcdjPQ\x81l\x122LBn\x92\
-\x03\xf6!!\xa9\x8b_2\x902\x110\x01\x86\x847\
-\xc13\xc6=4<7?/[\x9f\x04\x22\xc9\x1e`\
-&\x15d\x02\x0a\x05\xd0\xa0'\x17\xde\x00O\xaa^\x93\
-\xc9\xd3\x04\xa4VG\xa0\xf9\x17N\xa0\xca=G\xe9\x1a\
-\xabn\xac\xd5\xc5*\xea\xce\x06\x00!\x12B\x10\x04\x16\
-t\x14\xb1\x93\x88M\xf0\xb8\xea\x05W\x81\xb0\x8d\x01[\
-\xa8\x05R\xeb\x03\xf4\x90\x89\xab\x96\x013\x8e\xf5\xd5\x89\
-\xd8)\xf6\x84V\x82\xb0dnNw\xb5@YT,\
-1}\x92\xac\xe2@\x92'I3(K\xaa\xa7-\x8e\
-\xae\xe1\xc4U\xc4\xf0\x8c\xfcnT/[\x05\x18-\x0a\
-r(\xa0-\xdb#\xd4\xf3\xc8\xe2\x04 I\xd63W\
--\x11\xa5\x22n\x82X\xee[\xcb\xcb\xa5\xf1\x8f^\xb6\
-\x9bg_\xae\x97\x97\xcb\xb7(3\xf66\x01\x84\x0b \
->\xdf\xed:\xf2\xe7g?\xdd_~\xfez\x7f\xf9y\
-}\xf7\xee\xf7fEq@$\x16}+\xd1\xefH\xda\
-\x06\xdcl\x81\xed\x06\xb4\x98\x81\xea\x1a\x5c\x16\x80\xb3\xaa\
-\xb5=m]M\x97sI\x05\x8c\x94-H\xda%\x04\
-\xa5_\x07\xc0\xbc\x01\x9e(\x098\x09,\x89\x92\xce\xd6\
-E\x06\xea\x1a\xe9\xb9\x18\xac\xcf\xb5\xf2\x1b\xc9.Z\x02\
-\xda\xe0%*x\xb4\x94M\x06\xf0\xe4\xa5&\xa9\xacE\
-xR\xbf6\xc4\x07\x9a\xd0T\x06\x8b\x87r\xb8 \xea\
-8\x85\x08\xf4\x88h\x11\xd1H\xc0.\x12v\x22\xd8\x89\
-\xc1\x0e\x01\x0d\x04-\x22z\x08<\x00?,\xf1\xdc\xcf\
-\x94\xda\xa93`RQ''\xf9X%\xc0\x19!\xc5\
-5\x94\x8avE\x22\xa2\x04D(\xeb!\xd4\x03i\xde\
-\xe9u\xceSO\x91\x1a\xe0\xfc\x99\xb3\xab8P\x0c\xc9\
-\xe2\xa8<\xbd\x03\xa1\x00\xa3\x82AI\x0e%1\xac\x10\
-\xac(?\xe7\xa0j?\x16:>T\xbb[#8\xc5\
-=:\xd0\x9a\xd3XQ\x0e\xc1\xd0\xae!yu\xe4\xbb\
-/\x8ebwt\xbf\xdf\xbe\xd5Aho\x15@\x00\xf0\
-\x1a\x08\xb6\xefw\xe7\xa7\x17\xc7\xaf\xaa\xd7\x8foqy\
-R\xdc\xdc\xff\x9b\xba\xaaJ\xc0\x92\xf4[\x89\xbe\xa5\xd0\
-\xf7\xa0\xa6\x01v;\xd0\xac\x02\xeaRAT8\x1d\xfb\
-=L^\x06\xc6\x9cQ\x02\x83\xf7\xea\xdb\x04?\x82\xc8\
-{\xb5*!Y\xab!/\xa3@\xa3\xc1:)\x90\xc6\
-\x02\xd1l6\x90\x00\x87\x11|\xd9\xeaL\xe2\x91!<\
-Kq\xcd\x00.\x19\x9e\x82\xa1y\x9d\x08\xc2Z_6\
-\x06\xd0\xea\xb2e\xd7J\xdb\x87\xd4\x02ILQ\x9e\x88\
-&\x18I\xd0\x93Z\xa0\x8e\x02:0:\x10<\x07\xf8\
-\x10\xd0#\xa0G\x84O\xb79\xbc\xcf\xefbl<T\
-W1\xa6\xf8\x8b\xb2\x06\x1bED\xf1\xc9\x8d\xeb\x11\xd0\
-!J\x0f\xc9;z\xc4\xd8\xa78(\x13\x0c\xfa\xaa\xfa\
-\xd3\x98[\xc2\xc4\xea\x8d\xae\xde\xf8\x89\x1d\x08%8\x81\
-\x87Q\x90\xc6=F\x08\x14%ssY\xa5O\x9fG\
-\x03Q\x9ef\xf1B{\x92\x0c\xc1X\x16\xb2\xec\xa3\xa5\
-\xe5\x86\xe2\x93\xc7W\xab\x07\xa7}\x7f\xf1\xf2-\x0b\xff\
-\xbfu\x00\x01\x90\x00\xef\xd7\x9b\xd5\xfa\xec\xf8\xe8\xf5\xd2\
-\x14G\x0b\x1f\xd7\xd5\x9d[\x0b[\xefQdG\xd2\xaf\
- ~\x07\xf4\x0d\xa8k!\xbb\x1dbU\x00U\x09*\
-K\xa0\xb4\x80KU\xbeC\x8bu\xba\xae\xc5\xd1\x9dS\
-\xf0x\x90\xf7\x90\xe0\xaf\x93\x05A-\xc8\x90\x1c\x0c#\
-\xa10Z\x17\x8c\x00\x02\x80\xc1\xca\x89Z\x19\xa4_\xe5\
-~\xa6\xf4\xf8\x18S\x0c4\xfd\xd0\xc9P\x8d\x91v\xbe\
-\x00$7-e\xfcs\x12\x11\xb0\x101\x09@F\x13\
-\xa3\x864\xbf\x13\x05\x9e\x22z\x8a\xe8\x18\xe8(\xa2'\
-\x03\xcf\x06\xc1\x18\xc4\xe0\x11\xa8OW}\x9f\x80#\xc9\
-\x85\x1b\xe9\xe7a\x19\xa7\xcf'Y\xd6\x98\x94$\x88\xf0\
-\x90di\x22zDt\xc3U\x82d\xda*2\xbeb\
-\xce\xb4\x8d\x9dZSw1sq\xd9\xfa\xa9\xbb\xa6T\
-4P%\xcbS\x10\xa9\xde\xdb\xd8\xb81\xe1\xe8\x12\x7f\
-G\x03\xad2\xa8\xa0\xba\xa4\xbb I\x03S,v\xad\
-\xc1\xf1\x92\xfa\x87\x9f,\x8f\x9e\x1e5W\x1b\xbcE\xf7\
-\x0d\xf8f\x00\x84\x1d\x10O\xfb\xa6;\xbfZ]\xac\xb9\
-:\xd9trY{\xbem\xdf\x9f\x19.\xe6\xea-\xf7\
-B\xdco\x01\xdf\x03M\x8fX4\x90\xb2\x00\x95\x05\xb8\
-rj\x89\x5cj\xba\xca\xa3\x1a)\x07\xf8\x13v-x\
-\x8d}\x82\xc6E\xb9\x12Z\x12\x80\xd4\xfa\xc4\xd1\x85\xcb\
-V\x07\x19@\x18}\x91\x895\xc1\xd4\xbaD\x8c\xccZ\
-z\xfa\xd8\x07\x97\xaf\xe6\xfa\xdf@\xd9\x0e%\xfc\x9aD\
-\x1cj\xcf\xc0\x88\xa4+@\xc4\xa6|\x89\x19\xf0\x1cR\
-\xbc\x11$\x22\x18-\x1c\x8d\xc6\xe8}\xcb\x90@\x89G\
-Q\x0az\xe8\x82\xc0\xb8\xd4\xe3\xb5#\x00\x10\x94\xae\x96\
-L\x15x\x04t\xc9\xf1\xcbP\x18k\x08\xf3BN2\
-\xb3\x13.\xf4\xcdf\xfa\xaf\x06\x8f\xc1\x98\x15R\xcb\x03\
-T T\xa4\x16\xc8\x11Ot\xd0\xc7t\xee\xa0\xce\x93\
-\xa4\xce\xa6r\xd9\x039N$d\x08\xc1r\x1f-\xaf\
-\xd6\x14\x9f\xbf\xf6\xcd\xc3O7'\xc7/C\xd7\x22S\
-\x82oi\xfbF\x00\xb4\x04\xe4ul\xfa\xab\xd0\xac\xfa\
-\xed\xf6\xbc\xedO\xd7\xdb^\xbcueQ\xbew\x8f\xb8\
-\x98\xa9+\xd1\x09\xd0E\xa0k\x81&\x006\x00\xae\x83\
-\x94V\xadPatwYXLY\x1b\xc8\xd8\x5c7\
-\xe4s\x82\x06%\x92\x99\xbb\x09hDd\x04\xd1\x10\x9c\
-\xc8X\x11~m\x1f\xa2\xe2\x91y\xbb\x06\xac\xff\xe0>\
-\x80\x89\xc83 :~p\x00S\xda\x87\xb8'Y\xa3\
-\x18\x93Dr*\xcd\x09\x92\x9c%!DV\xd5\xd7\xc8\
-\x92\x86I\x91V\xae\x1b\x81p\x18\xe2\xaf\xbc\x8d\x91\x8f\
-\xbc\xf1/\xe7o<\x04\x1d\x22Z\x08Z \xd5,\xb8\
-\x0c\x83\xe1}\xd2p=I\x15HCU\x83\x90\xce\xce\
-\xcc\xae\x5c&\xa4s\xe0o\x13pr\xbc\xa3\x00\xd2\x5c\
-N\x01\x82\x9d\xc8\x5c]\xf7\xb3\xa6e\x5c\xf9\x93\x8c\xbf\
-\xd2I\x83*\x97\xc5\x86c0\xdc\xb6\x96O\xce\xd1>\
-\xfe\xfc\xea\xe2\xe9Q\xe8._\xfd\x85\x0bG\xbfj\xfb\
-F\x00\x04@.\xd1\xf7;\x09\x97\x8do\xcf;/W\
-m\x90~k\x0b1UE\xe6\xe6\x1e\xc8\xd4:\x0f\xcd\
-\x0b\xa4\x13H\xf4@\x1f\x816\x82\x9a\x1e(\x18R\x10\
-P\xb0\xbas6\xf7\xcfc\xbc4\xe5\xbcO\xee\xe9\x19\
-\xe8\xef\xec\xe6\xc9\xb0\xcb\xc0\xaeat\xdb$\xb3jH\
-\xc7iB$$\xcb\x22\x18X\xb8lqF\xba5\x13\
-\x08\xe9\xf8\x10\xe7\xa4\x0ac\xc9W\xe8\x91\xfa\x1dr2\
-C\x16~\xbc\xa2+\x80\x08^\xc3wx1\x039\xe0\
-!\xf0d\xa0\x11K\xae\xacV\x92B\x15\x8ft\xcf\xf4\
-\xf2\xa8\xe40\xa5\xa15\xd5j\x13o\xa7\x84\xb7\xa4\x91\
-\x8a\xaaA\x90k\xec<dHyi2\x96\x07\xd0g\
-\xcb\x94\x1d5\x05\x0e\xa5\xce\xd6\xf1~\x91\x8f\x91\x02\xc7\
-\x02I8$\xbf\xb7)1\x9e\xa1\x98\xedY\xfa\xa7\xd3\
-\x19D\x1b\xf6X\x8caaC\xa17tu\xc5\xf2\xe2\
-\x95\xef\x1e\x7f|~zt\x014x\xcb\xd6\x07\xf8\xe6\
-\x00\x84c ,c\xb8Z\xfa\xee\xe8.\xd1\xa9\xdfm\
-w\xdd\xd1\xf1\xa2\x99-xF\x06\xbc_\x03T\x01\xd6\
-'+\xd1\x02\xa1\x07\xf9\xa0U\xcb\xbd\x075\xa2\xb21\
-\x8e\x93F\xb5Z\x22\xe2<\x02P0\xd6\xd1\xa9F\x01\
-%\x1fk\xacW\x03r\x1f\xce\xb5\x98'\x01\x89\x04\xc9\
-kV0M\xa4\xb8!\xa9\x8cF&4\xf5\x00\x22\xa4\
-\xc7 \x7fk#x\x04ZF\x03b\xa5\xa6\x13\x89\x90\
-\x013\xdc\x17\x1a\xf1K\xdal\x16D\xd0\x0b\xa3\x17A\
-\x17\x05]\x04z\x01\xba\x18\xd1\xfa\x88.D\xf4! \
-\xc4\x80\x98[.RT\x95\xe3\x8e\x01\x8c\x13h\xe6,\
-\x91\x85\x87\x83\xa0 \xa3\x1a\x04\xa44{O\x8c\x18\x05\
-}\xcc\xae\xa4~\x86\x0cx\x82Z\x1e\x1a(\xd21^\
-q0\xc9\xdaL\x01\xa4{\x1e\x7fB\xd0\xf8.5\x81\
-\xa5W\x18\x0b|\xc6b\x9f)p\xd2\x9e\xba[\xc90\
-`)\x8a\xe3\xa6\xb3||\x11\xfd\x93\xe7\xed\xf6\xc9\x93\
-\xed\xeab\xa3\xd6\xe7\xad\x91\x07y\xfb&\x01\x14\x8fC\
-\xbb9\xa5\xe6\xe8}c^\xed\x07\xac\xdc\xfa\xf2f\xf3\
-\xf2%\xdb\xa2\xe4\x92n\x83\xe6\x8e\xc0\x0e\xb0%\x86\xcc\
-~\x84\xba_}Z\xcdFTw\xdb\x92\xf6\xd9\x1b\x06\
-\x8c\x81\x18\xc2\xe0!A\x19\xa5\xb1\xef\x07oX\x1b\x0c\
-3\x88\xb2K\x96\x05O&\xb5\x9b\xd7~VJl/\
-\x11\x00\x00 \x00IDAT\xf0\xd0\xd0\xa8v\x8dq\
-C^\xb6S7$\x0b\xd7\xd2@]\x8f1\x11\xa5+\
-{f\xac$a{,\x0c\xd5\x861\xbdv\xf8\x00\xf4\
-\x01\xe8=\xd0\xf5\x11m\x1b\xd1\xb5\x1e]\xd7\xa1\xef;\
-\xf8\xd0\x22\xc6\x1e\x10\x0f#Z\xf5&JE\xe8k\xa6\
-\xff\xc3\xe0\xb6\xf5\xc9\xf2\x048\xd6\x05o\xd8\x222\xd0\
-B\xd0DA\x13\x04\x9dh.*\x83&sbc8\
-?\xbaU4\x01\x87\x83I\xd6&\xcdDM\xee\x1cg\
-\xb6\x0f\x1a\xdbQ\xce \xe3w\x0bW\x07\x00Q\x22\x10\
-4\xdf#\xc3\x0c!&\x90a\x89\x96C\xb0|\xb5f\
-z~\xe4\xdb\x07\x0f\xd6\x97\xcf_\xa2\xbd\xc2[&\x0f\
-\xf2\xf6\x8d\x01\x08\x80\x1c\xc7\xa6{\x1d\xdd\xe9\x8a\xcbg\
-\x87\xc0q\xe5\xc3{\xfd\xc5\xa9i\x8a\x92\x8da\xb8\xbb\
-\x07J\xcfH\xae\xd2\x95!\xf0\x97\x08\xa4\x95\xae\xab\xdf\
-\x02\xaa\x84\x91\xac\x91!\x05Q\xea\xcf\x1f\x87\x13\xca`\
-\x1d\xd2\x8f\xc8\x02\x1e\xd3\x9c\xce\xb0\xe7c@\x02\x0e\x8d\
-\xc4Ar\xf3F\x8b4\xbd\xc4\x8d>\xbb\xa4\x9f\xf3\xa4\
-\xd0\x91|\xcdn\xdc\xa8`\x97\xc1\x92[\x10R\xae6\
-\xb1o\x84\x10\xb4\xdd\xb9\xef\x05]\x1b\xd0\xb6\x01m\xeb\
-\xd1v=\xfa\xaeC\xec:P\xd4\xc1\xbe\xda<8\xd6\
-\xa6\x8dTs\xe6\xe5\xd4\xf9#t\xb0\x14\xd5\x98[\x0b\
-\x81\xa0\x13A\x13#\xd6\x22\xd8EB'Z\xbe\xf9&\
-p\x90\x0akrV\x87&\x00\x18c\x1d~\x03<j\
-E\xc6\x02\x8e\xeb\x99\xa1\x91\x18\x18\x99\xb7D\x10h\xee\
-G\x198\xe14\xf6~\x18\xc6eX\x82\xb3mc\xf9\
-\xe4\x1c\xfe\xe1\xd3f\xf3\xe8\xb7\x97'\xa7\xc7\xea\xbe\xbd\
-u\xeb\x03|\xc3\x00:A\xe8O$^\x5cHxv\
-\x07x\xba\x0f\xfa\xa1t\x9b\xa2?;6\x9d3d8\
-\xc2\xdc\x98i/W\xa0\xb4x\x09\x88\x0c\x04\x1e\x13+\
-$\xea\xc7\x98\x14L[I\x0154A\xc9\x98\x0c\xa7\
-\x957\x169\xae\xbbm\xc0\x04@_\x01(\x01\xf2,\
-\xd5\xebn\x9b\x8c\xc7\x86\x1f\xa7\x00\xca\xe0I\x9f!'\
-Pq\xdd\x18\x0e\xa5\x9b\x094Q$\xf5\xf9\x08|$\
-x/\xe8\xfb\x88\xae\x0bh\xdb\x1em\xeb\xd1u\x01\xbe\
-\xeb\x10\xfb\x0e\x88\x1d\x8ch\xd5\x9b\x1d@\xa2\xb6M&\
-\x1dAI\x1d\x0b\x84\x08\xc3\xa2\xe2\x1b\xc4\xf0\x12\xb1\x8b\
-\x82\xb5\x00\x1b!\xec`\xd1g\x973M\xff\xc9\xf0\x18\
-\x13\xb2S\x9e\xed:\x80r\xc5@\x06WN\x22_'\
-\xf9\xa7\xa0\xa1\x01LC\xd6\x88\xf4\xb5\xcd\x00\xa2\x81,\
-\x18G>\x1a\x92h\xd8\x07k./\x0d\x9e<m7\
-\x9f?\xde.\x9f~\xd9.W\xf8\x86\xac\x0f\xf0\xcd\x02\
-\x08\xc7@8\x97\xb0\xbe\x08\xed\x8b-\x17\x0f#\xdb\x9f\
-P\xe8\xe7\xb2\xbb\xb2\xfe\xd4p\xcf\x02\x8a7\xc1\xb32\
-\xcd\x0c\xd2\x8a\x83\xe8eLZ\xa6\x15,\xd9\x9dc\x01\
-\xbc\x8a\xd9\xa7T5T&V\xa9n\x99\x5c\xe2$\x7f\
-\xfdc\xd4\x0f`\xb4L\xd7\xf6\xc9os\x01Dr\x0e\
-\xa7\xcf\xd2m\xc0\x22\x0d8\x92\xc9\x1f\xce\xd8D\x8es\
-R\xe0\xac\xb7\x111\x92\x82FT\xe3 D\xa0\xef\x05\
->\x8a\x02\xa8\xf5\xe8:\x8f\xae\xed\xe0;\x8f\xe8\x03(\
-x\x98\xd0Ak\x134\xc9\x99k\xb0\xa7\x96'\xc7<\
-L\x11&\xcd\x82\x8d \xf4B\xd8\xc5\x80M$l\x84\
-\xd0\xc0\xa0KE\xa7\xb9\xde,'x\xaf\xf7\x0aMs\
-4\xd9\xf5\xd2\x85N\x13\xdd\x05M\xaeb\x00\x0f\x0fg\
-NFp$\xf0(\xf0dH\x9a\x1a\xe2\xb1\xe0\x88(\
-\xb9n\xe9oP\x02\x92\xe5(\x96v;\xc4\xe3\xd3\xde\
-\x7f\xf1ps\xf1\xf0\xf3\xab\xe3\x93o\xd2\xfa\x00\xdf0\
-\x80V\x80\x9c\xc7\xa6=\x02N? z\xb8#~X\
-P|\xc7\xc5\xb6\x92\xcd\xa5\xf1\xa7:i\xd5\xee\xef\x81\
-\x0b\x9b,\x88\xe6q\xe2\xb4\x1aZtn\x90\xa8#\x0d\
-2\xa2d\x82\x9e}\x10\x03\xc1b\x18\x8f\x0e\xca\xad\xe3\
-\xe3\x02\xcf7\x1a/e\x0bC\x13\x0b\x93\x0e\xe5\xbcJ\
-J\xdef\x0ce\xc0L<7\x0c\xaf\x9a&@dw\
--\xd7\xc1\xe9\xeb\xa9\x0b9\x90\x0e1\xf7\x01\x11B\x8c\
-\x9a\xe3\xf5\x02\xdf\x0bz\x1f\xe1\xfb\x00\xdfy\x84\xae\x87\
-t\x1d\xc8{\xd8\x98\xc6\xb0\xa0\xc3X\x7f\xa0{\x06\x10\
-\x10@\x14Uv\xd7hEt\x04\xa1\x13\xa0\x8d\xc0&\
-\x08\xb6\xc2\xd8\xc1\xa2\x85\x85\xce\xd7\xce\x0eW&9\xb4\
-\x00\x95\x06\x08\x5c?o\xe9#$\xf7l\xb46\x99\xc4\
-\xe4\xc9\xe3y<c0\xf9\xa2\x02 ;\xb0\xf9/$\
-G\x02L\x9cI\x03I\xd2\xd9:XZ/\x8e\xc2\x86\
-\xbb\x9e\xe9\xe2R\xfc\xc3'\x9b\xe5\xe7/\xaf\x96/\x9e\
-\xb7\x97\xdf\xf8\x8c\xdao\x14@\x00\xe45\x82\x7f*\xdd\
-\xe5\xfb\xe2\x9e\xdd\x84yP\x12~\x5cD\xbfO\xbeu\
-q\xbd\xa6\x16D\xd1{\xd8\xba\x02\x17N\xdd2\xcab\
-\x19\xa9v-\x9f\xf6\xf4Mj\xef\x5cL\x05V\xa4!\
-T\xfa\x069i/\x0f\xfd\xf7\xd3l\x5cZ\x06C\x7f\
-\xfe`i&ox\xfa\xc3\xf4\xb9\x82\x01\x98\x83e\x1b\
-\xfe\xe3\xc9\xf3hp\x01E&\xa1Y\xb2\xa6\xb9\x87(\
-\x8b\x8aD/\x08}D\xe8\x05\xd2{H\x17\x80\xbe\x07\
-\xf7\x1d\xac\xd7XG\x06\xc0t\xf0\xe8\xd1O@\x84\xd4\
-\xe6\xe1L\x1a\xe0k\xb4\xee\xae\x89\x84m\x17\xb1\x0e\x84\
-\xb50v\xa2\x16\xa7C\x99\xda\x1dlr\xdbr%8\
-\x90\xeb\xd8\xe8\x1adp\xed\xbe\x5cs[G\x0b\xad\x96\
-g$\xed#Fvm\x0a\x9e\x91\xc7\xd1s;\xce\x89\
-J\xf48\x90\xa6\xadS\x1e\xca%\xcc\x14\x02\xd1fK\
-\xf1\xf9Ql>\xfd\xf4\xea\xec\xc1\xd3fsz\xfe\x16\
-\xab\xae\xff\xa3\xed\x9b\x06\x10^\x03\xe1\xb5\x84\xcd\xb3\xd0\
-\xbd\xbe\xc5\xf6\xe1\x0d.\x9e\xd7$w\x8c\xf8*\xf6\x0d\
-\xc7\x0d\x10\x11)\xb6-lU\x81\x0a\x83h\x08\xc2\x93\
-\xea_R\xd5\xec\x0c \x16`\x1803\xb4\x1f$\x17\
-.\x13\x0a\xb9\x92&\x83(\xb5G\x0fm\x059\xa4\xb9\
-f}\xbe\xe2\x03$\x10e\xe8\xe5\x05\x94LY\xaa+\
-\xe3\x01\xab\x02\xa5\x85\x15<\xc9\x19\x1a\x08\x0b\xed\x03\x0c\
-\xb9\x87\xc8\x8f\x82\x22\xe8\x03\xd0\x05P\xef\xc1}\x07\x17\
-:\xb0t\xc8,ZD\x87\x80\x0e\xd7\xba\x7f\xd8\xc3\x1a\
-\x81\xb3\x0e\xb3\xaa\x82\xb3\x0em\x88X\xb5\x1dV]\xc0\
-U0\xd8F\x83-\x1c\xba\xd4\x18\xedQ\xa0O\x0a8\
-\xd3\x1c\xd5\xf8\xa1\xae\x83\x87&\xc7\xa7nk\x06\x09\x86\
-\xb3*\x83\xdb\xa6\xf7\xc7g\x8e\x00\x22\xc4\xdc\xb2\x02L\
-\xdc\xed|\xa1R\xa70]\x17a\x88\xc4\x18\x8ab\xa8\
-i\x8d\x1c\x9fI\xff\xc5\x97\xed\xe5'\x9f\xed\x96\xcf?\
-\xf3\xcd\xfa\xfc\x1bH\x9c\xbe\xb9}\xe3\x00Z\x01\xf1\x02\
-\xb1y \xdd\xd9-\x14\x8f\xdfE\xf9\xe5\x82\xf0\x1d\x13\
-\xb1\xcf\xe2\x1d\xfa\x96\xc2Z\x04]O\xd2\xf6\xa0*\x97\
-\xf0\xb0\x82\x88E\xdd7\x82\xaa\xf6k\xb04\xb8U\x83\
-f\xb5\x88\xd6\xce\x19\x19\x167\xd2sTW!}\xf1\
-i\x95K\x0a\x84F\xfd\xb4q\xcb\xed\x06\x13\xde`\x04\
-\x0c\xb2(J\xfa\x9d\xe4\xab\xe6\xe8\xb6qz\x92\x08T\
-\xe8^\x00\x11\x19\xa4\x16(h\x8d\x1e\x05m\xd7\xa0\x18\
-`\x86>\xa7\x1e\x16\x1d@=:j\xe1\xd1\xc1K\x07\
-\xad\x1c\xe8@\xe8\xb4e\x8e\x05e\xc9\xd8_\xcc\xb0\xb7\
-\xd8\x87\x88\xc3r\xb3\xc3U\xdb\xe3\xa2\x0d\xb8\xf4\x8c-\
-\x1cZR\x8b\x13\xe0\x10\xc5 \xc2%\xeb\x93\xeb\xf2\xf2\
-\x87\x1b>=F\xea \x03\x80\xde8:\xfe.B\xae\
-\xc5F\x93(px\xcc\x18M\xe5+\x14\x8f\x92\xfc\xfa\
-\x1dI\xa6\xf7\x99(O2\x14\xabL\x5c\xef\x19\xe7\x97\
-\x14\x1e>\xf3\xdb\x8f\x7f\xb5z\xf9\xc5\x17\xfd\xd5\xc9k\
-\xf4\xdf\xb8\xf5\x01\xbe\x05\x00\x01\xc0+ \x10\xfc\xe6^\
-\xec\x9e\x7f@\xe5\xfd\x9bT~\xe8\x087\x0b\x91\xd2\x05\
-_p\x04Q\x88\x88!\x80\xfaB\xe5h\x0b\x87h\x00\
-\x18\x86$\x8b\x94/\x98b\xc6\xab\xdb\xf4\x14\x0e\xadb\
-\x06c\x80;,\xf47A\xf4f><}\xfd9~\
-J\xff\xc7kf)-\x85\x8c\xaf8Yzr\xfdQ\
-zHR\x8c%\xa9~N\x0d\xa7\x19\x12R\xda \xc8\
-\x895\x8b\x1c \xecA\xa6\x07q\x87\x22v\xd8\x85\x1d\
-$\xee\x10\xa4\x05\xa1\x87!\x0f\xeb\x18\x8b\xfd9\x0e\x0f\
-\xf70\xabk\xf8\x8epv\xb1\xc3\xd9\xba\xc1y\x1b\xb1\
-\x89\x05zT\x08(R\xa1N\x0a\xd7\x93\x8e[\xee\xbc\
-\x19\x04/\xd3\xe2\xcd\x09\xe1\xe9\x19\xa0\xdf\xf9\xff\xba\x9d\
-\xbana\xf2W\xa4g:\xfb\x10<\x9e\xa5\xe1\x0ce\
-\xa0\x8d\x89\xd4\x94\x17\xcf>/C,s/\xcc\x17;\
-\x96G\xc7\xbe\xfd\xcd\xe7\xcd\xc5G\x1fmO\x9e\xbf\x00\
-6\xf8\x16\xac\x0f\xf0-\x01\xe8\xb5\x9e\xdb\xee\x99tg\
-/c\xf7\xc5{\x5c|X\x13\xdf\xab\x81}'\xb0,\
-\xc1 @e R\xa1\xa8\xc4\x08\xb1\x9c\x07\xfdj\x9c\
-\x93\xe8\xeaknF\xb2\x0c,\x00\xc7\xe4\xe6E$\x17\
-o\xb4\x22\x03N\x86<L\x0eN&\xee\x8a\x96\x8d@\
-\xe4:\x1a\xa6\x80\x12\xc20]/\xfb,\xc3\xa0\x89\xec\
-\xe0\xd1\xf8\xbb\xc8\xc0\xe0\xf5\xe78\x8dE\xe7\xb3R\x80\
-5Z\x11\x9ds6\x11\x1e\x81;\xc4\xd0@b\x83\x02\
-;\x08\x1a\x80;D\x0b\x14{3\xcco\x1c`q\xb0\
-\x0fC\x06\x9bu\x83\xe3\xb3+\x9c\xadzl\xbcE'\
-5\x02\x8a\xe4\xaaY\xf4bS\xd1N\x9e\x18k\xd2\xed\
-\xb4 4\xb9W\xc9\x19\xbbni\xae[#`B?\
-cd\xd82\x08\xa7gt\xea\x08\x0e\x5c&\xd1\x90r\
-N\xaf#Fta\xa69\xd5\xa2;\x05\x18\xbejX\
-\x1e\x9f\x86\xfe7O\xbb\xcb\xdf|zy\xf4\xe85\xf0\
-GO\x95\xfbKn\xdf\x0a\x80\x00\x8d\x85\x9e\xc2o_\
-\xa0{\xfe\x01\xc2g\xfb\xc6\xbc\xbf\x88\xb8\x8d\x80\x12\x90\
-\x92$2bP\x89\xb7>}\x151\xcb<\x09\xc6\x12\
-\x12\xed\xb1\xc9\xb5lY\xb4\x8f\xb3e\x00\x06\xc6+\x07\
-&2\x09{r$4\x05\xe0\xb0D\x06\xd6n\xb4!\
-4 h\xe2\xd3\xa7xf\xbc\xf4\xea\xdf\x96IRv\
-\xa4\x15\xa6J\x04\x0aZ\xa1\x08C\x1e\x91\x02\xc0\x01B\
-\x1e\xc2\xdaR\xe0\xa5C\x1bv\xf0\xb2C\x90\x06\xa0\x0e\
-E\x09\x14\xb3\x19\xdc\xe1\x02\xf3\xdb7P\xcef\xe8\xdb\
-\x80\xe5\xd9\x1aG\xa7\x1b\x9c]y\xecB\x89\x16%Z\
-\xaa\xd0\xc0\xa1\x11\xc6\x0e\x8cn\x10\x14\x19Ks\xb2\xe4\
-\xd54\xc1\xab\xd6\xe2:p0|\x82\xe9\xe7\x7f\xc3j\
-L\xec\xad\xfev|\x95\x88,G\x9f\xab\xf4h\xacq\
- \x81I\xbd\xa6\xb9\x17\xc8\x12II\x90\x92(\x18\xa2\
-m\xc7\xf4\xeaL\xfaO\x1e\xf5\x97\xbf\xb9\xbf\xbb\xf8\xe2\
-\xcb~u\xba~\xcb\xfd>\x7fh\xfb\xd6\x00\x04@\xce\
-\x80\xeey\xec\xcf\x9eS\xf3\xe0\x96\xb1\xef\xcf`\xeeq\
-\x8c\x8bR\xe8&\x03\x96E\x98b$\xf1\x01\x03\xb7C\
-H\xa2\xa6\x99\x0c\x18\xbf\x0c\xd5J\x1b\xdd\x8f\xe1\xcb\xcc\
-J\x8dD\xd7AD\x99LK\xc1\x7f2d\x038s\
-|4\xbce\xc2\xb555\x1e\x1d\x81\x97p!!\xdf\
-\x012h\x14\xb81\xb1L\x9a\xcbb\x06\x84\x02\x90\xc0\
-\x03\xf6\x10\xf2\x88\xd2\xa2\xa7\x0eQ\x1a@v\x88\xd2@\
-\xac\x87\xa9\x18\xc5\xfe\x1c\xb3\xdb\x87\xa8n\x1cBl\x89\
-\xab\xf35\xce\x8e\xafpq\xbe\xc3r\xcbX\xfb9\xb6\
-Tb\x07\x87F\x1c:\x184 \xa8\xd37\xa9\x8a\x18\
-\x80\x84t;\x8dVF\xd0O\xd5\xf9\xf2\xb5b\xea\xea\
-\x8e\x15\x7f\xd3|\x0f\xb2]\x87A&\xaa1y\xc5\xd1\
-M3D\xb0\x021\x94\x94\xe4(5\xdd\x11\xc41E\
-\xc3\xd4x\x83\x93%\xfa\xfb\x8f\xfd\xf67\x9f\xed\x96\x9f\
-}\xda^\xbc\xfc\x02\xd8b\xe4.\xbe\x95\xed\xdb\x04\x10\
-\x9e\x01\xe1\x09\xba\xcdm\xb4/\x0e\xa5\xb8_P\xf9\xae\
-1|\x8bB\xac\x9d`\x06\x11\xe2Tx\xc61\xa4\x16\
-jR]\x02N\xfe\xfb\xe0y%\xda3\xc7E4u\
-\xcb\xf8\x9a\x93>tR\xa7\x95O<\x01\x10F\x8c\xe4\
-R\xad\xe1\xe7\xaf\x00\xcfp=\x9e\x9a;\x91\x1cQ\xeb\
-\xfd\x9c\xaf\xca\xa6\x8a1\xc8\xfe\x92\x08\x88\x03\x88\x93|\
-\x17\x02B\xe8\xd0\xc9\x0e\x12\x1aHh@\xd4\xc3\x94\x02\
-\xaaK\xd4\xef\x1cb~\xef\x16\xdcl\x8ev\xe3q\xf2\
-\xe2\x1cg\xc7\x1b,/;\x5c\xb6\x06\x9bX`\x8b\x12\
-\x97b\xb1\x06\xa1\x1dTx\xd4eS\xcb\x9cD9\xf0\
-Fe\x04\xa6\xab1\xdb\xc9\xac\x85\xa0\x8f\x09i\xf1O\
-\x85A\xc6\xc4\xc2\x08\x10 \xcfI\xcd`\x19\x9c\xb6\xe1\
-\xab`h(\x9b;O\xb3\xdb\xe6\x00q:Z*\x82\
-\xd0\xb6F\xce\xd6\x1c\xbfx\x22\xbb_\xfevw\xfe\xd1\
-o\x9b\xf3\xc7\x8f\xc2\xfa\x12\xdfp\xce\xe7\xab\xb6o\x15\
-@\x00\xf0\x0c\xe8\x0fBw~C\x9a\x073kn\xcd\
-\x8c\xbbS\x08\x1fR\x84#\xc9\xads\x1a\xbch\xac\x11\
-\xc6\x06\xb7i\xd8\x9a\xa9\xea\x5c\x0b\x97(\xec\xdc\xd22\
-=>6\xe4M\x10\xf3Fl\x03\x5c\xf3\xdcp\x0d]\
-\xd7\x8eO\x0ef_1\xc56\x94kYY\x866\x0a\
-\xa6\xd4\xe5\xcaZ\x1d\xce\x88 \x9fF\xb4D\xb5<\xd1\
-\xef\xe0\xbb\x0d|h\x109\xc0\xd5\x16\xd5\xadC\xb8w\
-n\xa0\xbc}\x80\x08\xc2\xfat\x8d\xd3\xc7\xe78y\xb5\
-\xc1\xb25XE\x8bK)\xb0\x86C\x03\x87\x1d\x0c\x1a\
-0B\x92\xe0\xb5dP\x80a\xc9\xc0\x12'K!\x03\
-\xdeE$\xf5\x1e\x8dE\xeb\xaa\xce5\xea\xc6\x85d\xe9\
-\xfd\x00\x13\x19\x007\x02\xef\xba\xf2\xdb\xd4r\xe9\x99\xca\
-\xbf\x9b\xc4N\xa2_\xb4\x15\xa0\x10\xa0\x14\xa0 \x081\
-|\xcb\xb2\xdcPx\xf0R\x9a\x7f\xfbUs\xf6\x8b\xcf\
-v'_~\x1e\xae\xce\x93P\xe2\xb7\xe6\xba\xe5\xed[\
-\x07\xd0\x0b@\x0e\xd0ooK\xf3\xe2 \x98\x8f\xf7\x98\
-\x0ekS\x1c\xb2\xc0Y\xe0&DJ\xad\x10\xd3\x06h\
-! $U\x9b$\xa1\x96\x5c0\x00\x94\xea\xdfr\xc3\
-'\x03dH%\x99\x8d\x22D\x95~\x14@\x83\xd5@\
-\xf2\xee\xae\xa1\x03\xd7\xef\xcb\xc8\xb6}\x15\x80\xa6\xd8\xd1\
-;\xbaS\xca\xf5\x0c\x03\x1eX\x86\xa6?\x96\x08\xceE\
-\xa0\xde#\xfa\x16\xa1\xdd\xa2\xef\xb6\xf0\xd2\x023\x83r\
-o\x1f\xee\xe6>\x8a\xdb\x87\xe0\xf9\x0c\x9bm\x8b\xe5\xd1\
-\x12\xe7\xcf\x97X\x9e\xb4X6\x06\xe7(q!\x16\x97\
-b\xd1$J\x9a\xd8\xa12\x0e\xc6886(\xd9\xa2\
- \x8b\x82\xb3\xaeZ\xfa\x1cQ\x10%\xa8\x0e\xb5D\xf8\
-\xa0z\xd4>bP:\xede,\x14\xcaO\xcbe:\
-\xa3-\x9a\xbay\xd7O\x10a\xb4g\xda\xd6\xad\xc3Q\
-\x0c$M\xbf\x8b\xc9\x02\x91\x0c\xbf#\xf1\x9ei\xb9a\
-\xff\xe0ul~y\xbf\xbd\xf8\xd7\x7f\xdb\xbc\xba\x7f\x82\
-\xdd\xd9_\x0bx\x80\xbf\x02\x00\x01\x90c\xa0\x7f\x22~\
-\xb5\x08\xbb\xc73\xf0lf\xcc\x81%S9\x011\xe4\
-\x86 \x96 fC\x06\x06\x09-\xb9\xa4\x9d\x19<v\
-Hg\xa7:\x81\x88\x12\x80\xb4~J\x08\xa9Z[\xad\
-\xcf\x08\xa0\xeb.\xdc5 \x0c\xa6ir\x7fR\xfa\x93\
-\x97\xcb@&\x00\xa3\xd3#HU\x12\xaa\xab\x10\x93\x82\
-\xaa\xaa\xa1zP\xf0@l!\xbeC\xe8:\xf8\xae\x85\
-\x97\x06\xbe\xf4\xe0\xc3\x0a\xc5\x8d}\x147n\xc0\xccg\
-\xf0\x01X\x1d_\xe2\xfc\xf5\x0ag\xa7[\x5c\x5c\x06,\
-\xfb\x02\xe7bq\x05\x87-\x0ax\xe3Pp\x01gK\
-\x94\xaeDi\x0b\x94\xc6\xa14\x16%[8\xb6\xa95\
- \x8e\x03\xc8%\xeaT\x84\x18\x92<p\xba\xf5\x11]\
-\x1f\xd0\xf8\x80&F4\x11hs\x228Y\x8f\x90\x08\
-\x82\x98*\xc9\x7f\x97\x9f\x1bc#\x05KLR\xbd$\
-Y\x87\xc8JL\xfdH$\x05\x898 2\xc1\x0b\xd3\
-j\xc3\xe1\xcbci~\xf1\xb8\xbf\xfa\xf9\xfd\xe6\xf4\xd3\
-G\xd8\x9d\x9c|\x0b\xd5\x06\xbfo\xfbk\x00\x10N\x01\
-y\x01\xdf\x95\x90\xf3J\xe4\xc1<\xe2\xa0\xe4\xc5\xbe!\
-\xb8Z\xc42\xc4\x18\x81u\x22\xd9\x1b#N\x0a7\x9c\
-\x8bHs\xe4iI\xa5\x96-\x0f\x05\xa5\x94\x01E\x18\
-+U\x06\x0f.]\x1f\x09\x1a\xa7\xa4\xf7t-\xdc\x99\
-zh\xd3X\xe9\xcd\xa2\xd4\xa9K\xa7\x83\xbaU\x90\x84\
-U\x16\x8b\xa2\xaa\x01\x11<$\xf6@l\x11\xfb\x1dB\
-\xdf\xc2\x87\x0e\xc1E\x84\x85\x05/\xe6(n\x1e\xc0\xce\
-\xf6 \xe4\xd0\xac;\x5c\x9e\x5c\xe1\xfc\xf5\x15\x96K\x8f\
-\xf3\x0dp\xd6\x17\xb8\x88\x06Wd\x11M\x85\xc2\xce\xb0\
-\xef*T\xaeJ\xe0qp&Y\x1cV\xdd\x01\x83\xd4\
-\x0e\x90|c\xa21\xb4\x8f1\xa2\x0b\x1e\xbd\xf7\xe8C\
-D\xdby4\xa6\xc7\xd6\x13\x5c\xefa|\x04G\xe8\xe7\
-\x81\xa0\x1bb\x1eu\xe4FN\x94\x86\xdblyR|\
-#V~\x97\x8d,\x00Q\x8d\x84(\x05!\x1aF'\
-L\xab-\xcb\xc3\xd7\xb1\xf9\xc5\x93\xb0\xfe\xf9g\xdd\xf2\
-\xb7_\xc4\xd5\xeb\xbf6\xf0\x00\x7f%\x00\x02\x80G@\
-\x0c\x08m\x88\xbb\x13\x0b\xbe_\x9a\xe2\xd0\xb0\x9b\xdf\x84\
-\xccJ\x91\xaa\x10\xcc$\x06\x12\x09\xcc`X\x12\x8a$\
-\xa0\xd4\xe0\x19\x13m\x03\xa7\x16\x87\xacVh\xabK7\
-\x92\x0b\xea\xca\xd15 L\xdd\xb2\x91/\x02\xdeD\x13\
-\x91 &\x0d\xb5lq\xde\xe4\x15\xc6\x09x\x82A\x08\
-2\x13\x06Q\xb5\xd4\x10zHl\x11\xfb-\xbc\xdf!\
-\x9a\x88\xb8\xc7\xe0\xf9\x1c\xf6\xc6\x02\xe6p\x0f\xecJt\
-\x9b\x80\xcd\xc9\x15\x96\xafVX\x9dl\xb1\xbc\x14,\x1b\
-\x83\x0b\xef\xb0\x94\x02[.\xc1\xae\xc6\xbc\x9ccV\xd6\
-\x98\xb9\x12\x05\x1b\xcd\xde\x03\x83\x06x\x0c@'jx\
-\xb5\xb8\xd4\x80\x0d\xc3\x10\xc3\x1a\x86a\xbd\xb2T\x11\xf0\
-\x81\xe0}Dk\x19;Gp]j\x00\x86\x87\xe9u\
-Tf\x16\x94\xcf\x0a\xa69\xfd\x9a\xe3\xd1\xa9\xa7;\xe4\
-v\xa0e\x8d&\xd1\x17\x16@\x01\xa0\x82H\x0dAA\
-10I\x1fX\x96-\xe3\xd1\x91\xf4\xbf\xf8\xd2\xaf\xff\
-\xe5s\xbf\xfc\xe8#\xbfz\xf9\xe8-MW\xf8s\xb7\
-\xbf\x1a\x00\x01\xc0S \xec\x80\xad\x8d\xfd\x8bJ6\xbf\
--\xcdl\x8f\x8c\xd9\xbfI\xb4\xe7$\xda(\xde\xfaH\
- !b0[\x18\x10\x09\x85\xe4\xa6e\x07\x1a.\xdd\
-\x1a\x9a\x90\x07H\xb4\xcf\x84T\x00\xa0\xee\x1b&\xe6c\
-\xf2\x1d];\x9e~\xc3\x89\x06\xd7g\x22g;\x06\xa7\
-O\xb2r\xa9\xa4\x09\x10I!(\xf4\x80\xef\x11\xa5G\
-\x0c-\xa2o\xb5\x9e\xad\xf2\xa0y\x05wx\x00s\xb8\
-\x0f3\x9bC\xc4bw\xba\xc6\xea\xd9\x05V//q\
-q\xd6\xe0|-Xv\x16\xab\xc8\xd8Q\x05)\xf7\xb0\
-\xa8\xf6P\x965,k~l\xd75\xb8\x0a\x1e!z\
-\xc4,.\x99\x98\xbf\xecJ9bT\xce\xa1\xb2\x0eu\
-\xe90\xaf*\xcc\xca\x12\xce\x1a\xd5kaF4\x84\xc2\
-\x02\xd6F8c\xe1H]\xad\xac\x0a\x1b%\xe6Z\x09\
-\xe4v\xc1)\x077\xb6\xe0\x0d\xc0\x19\x00c@(!\
-\x98\x012\x070\x83\x88\xfb\xff\xdb;\xb3\x1e\xb9\x92#\
-K\x7f\xe6\xee\xf7\xdeX2\x99\xdc\xc4\x92J\xea\xea\xe9\
-\xc6\xf4\x00\xf3\xff\x7fC?t\x03\x83~\x10T\xd3\x10\
-\xaaT,\xaeE\xe6\x12\xfb\xdd\xdc\xdd\xac\x1f\xfcFd\
-\x92U\x9aEP\xb7\xc8\xaa<@\x12\x11H0AF\
-\xc6\x0937\xb7s\x8e\xa8\x89\xb31;\xdbt.\xff\
-\xe9\xad\x0d\xff\xeb\xeb\xb8\xfb\xe7o\xf3\xfe\xf7\xdf\xe8\xfe\
-\xeds\xc6\xbf\xf9\xb8\xfa\xcf\xe1\x93\x22\x10\xc0%\xa4\xef\
-\x18w\xe7f\xdf\x9f\xa9\xce\x9d\x9b\xcd\xc5\xd5Mp\x9e\
-`\xf6\xd0i\x9cK\x22\x84\xe4,\x04/\xce\x82\x99\x14\
-\xcd\xaf\x1d\xab\xcdQ\xf2}\xf2\x86\x9d\x884=?\x91\
-\xe8\xeeY\xf7\xe3R\x02?\x22\xd0\xe9\xf9\xc7\xb3\x06\xe0\
-\xf4\xfb=n6LC\x02RQ\x80Z\xee\xc9:\x12\
-mD]B\x16\xe0\x9b\x86\xf0\xe0\x02wq\x8e?{\
-\x00R3\xeeF\xda\xb7\xd7l^\xac\xd9\xbc=\xb0Y\
-GV-\xdc\xc4\x9a\x83T\x8c\xd5\x1c\xad\x16XU\x91\
-\x5cf\x1c\x0f\xe5\xcc\x12\x13C\x8a\x8c9\xa1S\xf8\xb1\
-PF\xe7GW\x06\x8fQ!\xcc\x5c`\xe6\x03M\x15\
-X65\x17\xf39\x0f\x96\x0b\x96\xb3\x19\xc1\x07\xfc\xf1\
-u\x92i\xe3M\x1d$GNE\xc7\xd8\x9b\x12\xac\xec\
-0|h5\x7f\xe7e\xe2\x968\xd5\xf4\xd5\x00\x15\xca\
-\x8c\x92\xe93\x17\xb3Z\xc8\xea\xb4\xef<7\xbd\xe8w\
-W\xd6\xff\xdb\xff\xce\x9b\x7f\xf9\xd7x\xfd\xfb\x97\x0co\
-o\xca\x9a\xce\xdf|\x5c\xfd\xe7\xf0\xc9\x11\x08`\x03\xf1\
-{\xe2ji|\xab\x99\x10E\xc8\xce\xa5/\x90\xff>\
-\xcb\xf6,\x8c\xf9\xcc\xbb\x14\xd4\x07\xe7\xaa,.;+\
-\x9b:\x22v\x1c\xcdMg\x1f9U\xa1I\xe60M\
-\xe3\xb8[\x85>.>\x1f\x1f\x84N\xe7%&\xf3t\
-C> \xd0\x9d\xb6\x0d\x9bFn\x93?\x9d\x8d\x98\x8e\
-d\x1b\x89.\x92\x16 \xf5\x1c\xbf\x98\x13\xce\x97\xc8\xd9\
-\x12\x5cE:$\xba\xcb5\x87\x97k6/7\xac\xaf\
-F6\x07\xc7z\xf4\xacS\xc5\xde\xd5DW\x91B\xc5\
-H\xa2\x1fw\xf4Y\x19\xa2\x96\xa4k\x9b\xd6s\xecv\
-\xd5\xf3\xa8\xec\x09\x1cEkE1\x14U\xe9\xad\xc8#\
-\x0eC\xc7\xa1;p\x18\x16<>?\xe3|\xb9\xa4\xae\
-\xaai;@\xa9\xa7\xfe+\x05h\x82Pe%H\x09\
-\xbb\xba\xdd[(/\x92L\xe3\x97;U\xc7*Jb\
-jU\x1e\xdb\x0cc\x8eZ\x83j\x10F\x9c\xec\x07\xaf\
-\xef\xd6.?\xbf\xd2\xf1\xf7\xaf\xd2\xfe\xdf\xfe\x987_\
-O\xe4\xf9d+\xcf\x11\x9f$\x81\xaeJ\x91\x18\xd4\xf2\
-U\xaf\x83\xb4\x19:0u\xcd\xf0\xc4|:\xcb\xfcF\
-\xc6t.~\x08\x12\x9c\xf3\x95\x88$\x90|\xab\xdf\xb6\
-\xa3\xa0\xfe\xce\x80A\x8e\xcd\xf8\xdd\xb6\x0e~L\xa0\xe3\
-\x83;\x15\xe8\xb8\xad-\x13\x81\xee\x0ek\x8f\xe4\xb1S\
-\xeej\xd9\xa2\xc62*\xa9\xf8\xb6U\x01BCX4\
-\xf8\xe5\x82\xb0(\xb1\x88i\x80\xe1\xfa\xc0\xfe\xf5\x9a\xdd\
-\xcb\x1bvo\xf7l\xd7\x89\xeb\xces\x9d<k\x0d\x1c\
-\xa8\x19\x5cU\xc4\x0b\xe3\xc0\xa0\xb9\x04iY\x09\xae*\
-\xf1\xf4U1h\xe4(\xa9.\xfby~\x22t1Q\
-,F\x8a\x09e\xb4\xb2\x83\x9d\xb2\x12m \xea\xd4\xfa\
-Y\xe6\xc1\xd9\x92\xda\xfb\xe9sF\xcb\xd0\xc1M\xb9K\
-\x93m\xbdL\xa6-G\xe3\xc5I\x8fj2\x9do\xee\
-T\x1d\xab\x81\x1a,\x88Y\xc9\xf6\xb6\xec\x85\xde\x84U\
-\xeb\xec\xd5J\xd2\x1f_\xe9\xf0\xef/R\xfb\xf5\x8b\xbc\
-\xfd\xe6\x15\x87\xbb\xe4\xf9\xe4\xce=w\xf1I\x12\x08\x8a\
-\xfc{\x87v{\x1b.\xb7Y\xd9\x9b\xa8z\x17\xff\xd1\
-\xbb\xf4\x0c\xcb\x0f4\xff\x96\xc1\xceqR\xd5b\xe2\xbd\
-\xc9\xf1\xce\x87\x80`R$8we\x8e\xc7\x8at\x9c\
-\xce\xfd\xe8>\xe7\xe3k?Nd9==\xde\x8e\x9e\
-\x98z7\xa5`zl\x19\xc4\xb0 %\xc62\xccq\
-\xf3\x86j1/V\xc5\xe2\xd0\x98\x89\xab\x81\xf6\xed\x96\
-\xd5\x8bk\xb6ow\xec\xaf\x07\xb6{e5\x0aWI\
-X\x99\xb07\xa1GI6\x16\xbd\xe9\xe4\x94#x\xbc\
-\xd4\x88\xafA\x1a\xcc\x07T>2\x8e2\x8a<b\x8a\
-{QK\x98E\x84H\xb2D>\xca\xbf5\xe1b$\
-\x1c\x0e\x04\xb1bE>\x9b\xe1q\xd3\x99.\x17\xe2Y\
-\xd1 e\x22Z\x84\x8dvk\x9dr\xdb\xb6Up\xb2\
-\xef-\x136\xac\xc1l&\xe4\x80d\x11\xe9\x92p\xd5\
-9\x9e\xdf\x10\xbf~\x91\xda?<\xb7\xfd7\xcfs\xff\
-\xe25\xed\xe5e\x19\x18|\xb2m\xdb]|\xb2\x04\x02\
-\xe8 \xbf\x81no\xfan\x97\x87\x94\xcd\xc6\x01\x1d\xa3\
-kF\xcc'I\xf6\x15\xfdxnb\xa1r\xea\x82\x98\
-8?\xa9X\x03\x82w\xe5\xdd z;u+\xed]\
-\xb15\xfb\xa9s\x0f\xdc\x99\xc8}D\x16\x8eO\xedN\
-\xeb2}_\x8eK/R\xae\x08\x9d\x87\xaaB\xe6\x0d\
-n>\xc7\xcdg\xe0\x02\xdag\x86\x9b-\x877W\xec\
-^\x5c\xd2\xbf\xdd\xb2Y\x8dl\xf6\xc2\xaa\x17\xde\x8f\xc2\
-U66\x96\xe9\xf1d2\xc7\xc5=\x91@p3\xbc\
-\x9b\x11\xa4\xc6I\x8dH\x83JEv\x1eu\x1e\x5c!\
-\x11\xc8\x94I4\xad\x10i\x19\x9d[\x1e\x10\xeb\x11\x1d\
-H:P*\x86#YfH\x89\xb6\xeb\x98W\x81\xda\
-9*\x17PU\x92f\xa2F\xc6<2\xe6\x91d\xf1\
-\x14^r\xebAgS\xbb('\x02\xcd\xc0\xca\x97\xd9\
-\x0c\xf2\x0c\x19\x9c\xf86;\xf7~\x8f~{i\xe3\xef\
-\x9f\xdb\xe1\x0f\x7fJ\xfbo\xde\xd0\xfepM^O\xaa\
-\xd2O\xbam\xbb\x8bO\x9a@\x00-\xe4\x96\xdc\x0f\xe4\
-K\xd31\xc5\x94\xc6At\x1b\xab\xd9\xfa7Rm\xcf\
-T\xbfZ\x0c\xf1\xf1\xdclQg\x0d^\x93\x13\xb21\
--\xae\x88c\xb2\x01>\xddx\x1c/@\xa4\xc4(\xfe\
-\xc48\xfbxq\xfaq\xf3p\xda{\xb93\xc2\x9e\x16\
-\xebN\xc2\xfd\x10\x90\xaaB\xea\x00\xb3\x06\xea\x1a\x9cC\
-\xc7\xc4\xf0n\xc5\xe1\xf5\x0d\x87W\xd7\x1c~Xq\xb8\
-:p\xd8en\x06x\x97\x1c\xef\xa2\xe3:;\x0e6\
-\x99{\x88'\xb8@\x90\x0a'\x01\x13\x8fL\xa9\xd7\x22\
-\xa51R\x02\xc7L\xa1S,\xbd\x14S)uw\xf6\
-\xd9\xac\x5c\xdeZ\x1ap\xb9\xc1R;\xa9d3\x894\
-\xc5\xa7(1\xc2\xd0\xf7\xc4*\xe0C \x991\xc4H\
-;\xf6\xb4\xb1\xa3\xd7\x81h\x89D>\xeaH\x91[\xf2\
-H\x85\xd84ec\x8e\xd8\x1cI\x0d\x0c\xb5H\xeb\xc4\
-\xad{goWb\xdf\xbc\xd3\xf1\x0f\xcf\xf3\xe1\xebo\
-m\xf7\xfdK\x86\xebk\xd8\xf37\xde\xac\xfeK\xf0\xc9\
-\x13h\x82\xae`\xfc\x16]\x89\x0e\xa9\x8f\xb2m\x85\xab\
-Umo\xbe\xa0\xfa\x9fO3\xfft\xd1\xa7/\x97Y\
-/\xea\x1c\xe7!\xa7\xe0\xc6\xe4$6H\xae\x04\xf3\x88\
-z\xccn\xd7x\x8a\x08rz\x5cH$\xc7-m\xdc\
-\x9d%\x14\xf9\xf8\xc2\xf4\x8epy\xfa\xab\xea\x8a;*\
-!\x94\xb8\xf7\xba\x01_aj\xa4m\xcf\xb8\xda\xd2_\
-\xad9\xbc\xb9a\xf7\xc3\x86\xc3\xaa\xe3\xb0\x8fl;\xe5\
-z4\xdeG\xe52\xc1\xda<\x03\x0d\xce\x05*\xa9\x08\
-\x94\xcd\x81\xe2\x9c[\x84\xcf6\xe5\x1b\xa9D\xd4j2\
-5&5\xe6\xaar\x16\x02\xbc\xf3eU\xc7\x85\x22\xf5\
-\x98\xb6\xca\xc5\x14\xf1uyK\x8b/\xcf\xf31\xcf\x0e\
-\x8c\x8cj\x22\xc7\x12\x84\x1c\xf1\x0cY\xd9\x0f#\xbb\xa1\
-\xb7}\x1a\xe841\x9c\xe2S\x8e\x06\x8ee\x0d\xa7\xc6\
-1\x07[\x22\xb6Dr#2\xd4\xb8\x83\x13\xb7\x8a\xc2\
-\xfb\xad\xcb\xaf\xafH\xdf\xbe\xc9\xe3\xbf\xbf\xb4\xf6\x9b\x97\
-\xd6\xbf\xb9b\xdc\x5c\x17'\x9d\xa3\x17\xc9g\x85\xcf\x85\
-@\x00z\x09\xa3\x90\xd7\xa2\xc3\xd0E\xdb]\xca\xf8\xfe\
-\xbf\xd9\xfc\xd5\xdf\xbb\xd9\xab/\xc4\xff\x8f\xc7\xc6W\xe7\
-f\xcf\xea\xdc_\xf8!\xce\xab!\x06?\xd6\xde\x0d\xb5\
-\xb8E\x05\x8b \xc5_\xeeN\xa918Z\xbe\xd8$\
-?=\x91\xe7Nz\xdc\xede\xaa\x9e\xd4\xb0G\xb2\x95\
-\xcdQ_\xc4wj\xa4mKjG\xc6]\xc7p\xb5\
-\xa5{\xbf\xa6\xbd\xdeq\xd8vl\x0f\x89Mo\xac\xc6\
-\xcc\xd5\x90\xb9L\xcaV\x8d\xd6<I\x02\x22\x10\x9c\x81\
-%\x92)\xd18iv\x0c&\x19\xf6$\xc9\xa6\xc1h\
-J5rMi\x94\xac\xb8\xf0\x04\xef\x11\x09\x85\xd8.\
-\xe0\x10\xbcY\xa9\x11\x12\xcax;\x0f\x04\xed\xf0vJ\
-\x1aB\xa4\xf8e\x9b*\xed(\xecc\xb4\xd50\xb0\x1e\
-G\xf6\x9a\xe9&;\x13\x9b|x\xca\xfd\x8eP\x95j\
-\xa3K\x5c^\xe2\xc6\x19\xee\x80\xb8u\x14.[\xe1\xf5\
-^\xec\xbb\xf7\x1a\x9f\xbf\xb7\xfe\xfbw:\xbez\xc7\xf0\
-\xfe%i\x7f(\xec\xfd\xe4\x87\x05\x7f\x0e\x9f\x13\x81\x00\
-\xf4=hK\xcaos\x1a^\x0e~\xf7.\xe5\xeb\x9b\
-\x90~\xf8\xca\xcd^|\x19\xea\x7f\xfa\x95\xb8\x7f<W\
-\xfb]\x93\xe3\xaf\x9a\x94\xcf\xeb1\xce|;\xd6a\xd9\
-8\xb7\xac\x9c[\x06q\x0b/\x92\x5c1\xaa\x0f\x94\x16\
-\xcfO;tv\xea\xca\xcac\x98\xfe\x98$\x11\x13\xa9\
-\xca\xf2\xa8\x15\x15v\xcc\xe88\x92\x87L<\x0c\x0c\xeb\
-=\xdd\xd5\x86n\xd3\xd1\xed\x06\xfaC\xe2\xd0%6C\
-\xe6zP\xaecf\x9d\xd56\x19\xf6f\x0cE!*\
-\x98\xe1\xc9\xc4<\xdc\x0e\x0c8\xd6\xbcrT/\xb7/\
-\x15F=m\xa0\x95)\x9b\x08\x90\x1dN\x02H@\xa5\
-\xd8Z\x15\xaeK\xf1\x870\xca\xc5.\x01\x11o\xae\xec\
-\x16\x120\x09d\x82$j\x17q\xce\xac\x8f#\xbb\xac\
-l\xc6\xc4&\x8e\xec\xb4\x84\x18\xa7iX\x7f\xdc*\xa8\
-q\xd6\x806H\x9e\x89\x1bgX[\xc1\xc6\x90\xcb\xd1\
-\xe9\xeb\x1d\xf6rE\xfc\xee2\xc7\xef^\xe8\xf0\xfa\x86\
-\xf1z\xc3\xb8k\xa1\xff\xaf\xf2\xaf\xfe\xcf\xc4\xe7F \
-\x00\xf6\xa0{\x18\xbe\xd3\x1c_\xea\xbe{\x97\x86\xcdW\
-!\xbe\xfb\x9d\xd6\xaf\xbe\xcc\xd5\xf7_V\xe1\x1f\x1e\xe1\
-\xfe~\x99\xed7\xcb1>m\x0e\xe3\x83\xb0\x1bf\xd5\
-\x22\xd4\xcdY]Ug\xb5\x0b\xcb\xca\xb9\x99G\xeai\
-\xbf\xe5\xb8\xbd\xe0\xe4V\xa0rt\xf59\xb6A\x00\xc8\
-\xe4\x93mX\xcah\x97\x18\xb6=\xc3\xe6@\xb790\
-\xec:\xc6}g\xfd\xa1\xa7\x1d2\xbb\x11\xd6\xa3\xb1\x8a\
-\xc6*\x19[U\xf6j\xf4f\x8c\x88\xc5\x93B\x14@\
-\xc9\x16\xa7\xebI\x88 \xe9\xb4\xedp\x94\xad\x85\xa3\xd4\
-\xdaJ\xf3\x94\x10\x1c\xceJ\x940\xd3\xbfM]9\x97\
-L\x12DL\xc5\x8e\xdb\xe1\xa2\x09\xa7\x11o\x03\xde:\
-j:\x9b\xc9\xc0\xdc%\x82OD\x12\xbb~d\x95\xf2\
-\x14`\x9c\xadC\x19\xcb\x0b`\x9eb\xf0\xd1\xe0l\x86\
-\xd79\xd2\xd7\xe2\xdb \xb2\x05\xb9l\xb1\xd7\x1d\xf1\xf9\
-\xc6\xf4\xbbk\xf4\xe5\xa5\xe57\xafu\xbc\xfc\x9eq;\
-\x05\xfe\xde.s\x7f\xe6\xf8,\x09t\x07\xfa\x0a\xfa\xbd\
-\xc5\xf8<n\xda/\xa2\xbf\xf9\x9d\x9f\xbd\xfcJ\x9b?\
-~\x19\xab\xaf\x9ex\xff\xbb'\xd1\xff\xdd\x83\xe0\x7f;\
-\x1b\xf2\xe3y\x97\x1e-v\xf1\xc1\xac\x19\xe6\xf5\xcc\xd7\
-~\xe6*\xd78\xf1\xb57\xa9M\xa4\x16\x93 \x22\xd3\
-B\xaa\x9db\xe7\xa7\x08C5,B\xea\x13\xb1\x1b\x18\
-\xf7=\xf102\xeeG\x86\xc3\xc0\xd0\x8d\x8cCb\x88\
-\x89\xad*\xebl\xac\xb2\xb0Rc\x97\xa1\xb7\xdb\x04\xed\
-<\xb5\x90\xa7\xa4\x020P\xb9+\xf8\x06g\x022\xa9\
-\x85\xf80\xe3\xa7\xe0(\xc3\xb8\xeb\x94s\x8c\x10\x9el\
-\x85\x8dl\x82\xe8$H\x8c\xf8\xdc\x12\xd2\x86:\xafY\
-\xb0\xe5\xdc\x1fX\x84\x88s\x91\xce\x06\xf6CY\x09\xda\
-\xaaN\xa9A'!\x9d\x05\xd0\x1a\x97\x1a\x5c\x9c\x0b\xb1\
-\xc1\xc6 \xb2\xc9\x22?\xf4\xf0\xba\xd3\xfc|\x8b>\xbf\
-&>\xbf\xd4\xf8\xe6\x8at\xb3\x86\xfdkN?\xea\xb3\
-\xae8\x1f\xe3\xcf\x0dr?G\xc8\x19\xf8G\xd0<F\
-\x96\xff \xf5\xa3\xaf\xfc\xfc\xc9\x97u\xfd\xeb\x87u\xf8\
-\xed\xb9\x0f\xbf~ \xfe\xd7\x17\xde?;\xf3\xf2t\x16\
-\xe4q\x15\xb8p\xc1f\xbe\x92\xe0\x83\xf8I/\xe1\xc5\
-\x17s\x05\x13\x93\xe2G7e\x94\xaa\x91\x06%\xf6\x89\
-\xd8\x8d\xc46\x92\x86LL\xc6\x98\xb1a\xaa,\x9d\xc2\
-\xc6\x8c\xad\x9am\xcd\xe8(u\xe2h\xd4\x91?X\x81\
-9J\xca\xcah\xb0\x08\xd7d\xca\x01\xf2$\xbc\x1cI\
-w\x1c\x1a\x1b\x15Fc\xc2\x1ca\x8e\xc8\x0cG\x83\xf3\
-\x0b|XJ\xf0s\xaa0G|\x19H\x04\x11*3\
-*\xcd\x84\xd82K7\xcc\xf25\x0b[s\xe6\xb6\xcc\
-\x5cGf\xa0\xd5\x81M\x1a\xd9\xe4\xd1Z8V\x1c\xf5\
-\xa0\x01r\x85\xc4\x067\xd4\xce\xb7\x95\xb8\xbd\xc7m\x81\
-m4~\xe8p\xcfw\xf0\xa7\x95\xc6\x97W\xe4\x1f\xde\
-\x93n.a\xbf)?\xe6gG\x9c#>\xf7\x0at\
-\x17\xb6\x87\xbc\x87\xae\xc5\x06\xb5\xb4_\xa5\xee\xea\xb5\x0e\
-\xaf.\x92\xff\xe6\x81T\x8f\x9f\xb8\xfa\xe9\xaf\xaa\xfa\xd9\
-C\xe7\x9e\x9dy\xf9\xa2q\xf6,\x88=\x0a^\xce*\
-d\xe9\x91%b\x0b\x93<\x133\x87\xa9\xc7\xd4\xa9\xa9\
-WU\xc9\x06}RII\xa7XEA\xb5fT\xa3\
-7\xe8)1\xf3\xe5\xb1c\xa4\xec\x88U\xd3a\xfb(\
-\x90>f%\xdc\xa6\x148\xb48\xc6\x9d\xe2\xe9o\x83\
-z?\xa8H\x94\x9b\x96\x92a}\xca?\xb0\x80\xc8$\
-C31)\xaeD\x124\x13L\xa9%Sk\xa4\xca\
-=ujY\xda\x9a\x99\xdfR\xd3\x9aw=\xad\xb6l\
-S\xcf6G\xf6\xaa\xda\x17\xa5R\x06r%\x92\x1ad\
-\x98!m\x8d\xdb{q\x1b\xc4\xdd$q\x97=\xf6~\
-\xd0|\xb51}\xb76{\xbd\xc6~X\x91V\x1d\xb4\
-\x1b\x186\xb7\x93\xb5\x9f%y\xe0\xe7U\x81>\x86\xcc\
-\xc0=\x85\xf0\x14W-\xa9\xe6\x8f]X\xfc*\xd4\x0f\
-\xce\xe1\xe1\x85\x97\x87\xe7><Z\x88{\xd2\xf8\xf0x\
-f\xeeqe\xf2H\xc4\x1e\x8a\xe9\x03o\xcc\xbd\xd9\x5c\
-\x8c\x99\xa8\xcdQ\xe6fV\x8d\x8a\xcff\xaeH}\x9c\
-\x14\xa3v$R>j\x8b;uy\xe7$\xc4\x12&\
-\xc5\x12\xe5vo\xec\x98\x9b\x90\xa7\xe5\x1a\x9b\x22|\x8b\
-\x93W\x89\xb1\xef(=O\xd9\x1b\x98\x12\xe1N\x9bm\
-\xb5A\x83c&\xc2\x1c\xc7\x0c'\x8dyW\x8bw\x0d\
-\x8doh\x5c#\xb5\x13\x1a\xc9\xcc$2\xb3\x8e:\xb7\
-\xd4\xd6R\xcb\x16ao\xd1\x0e\xda\xe7\xbd\xed\xb5\xb7\xbd\
-&=\xa8\xe9\x00Q\x91N\xa0\x0b\x22m-\xd26\xe2\
-\xf7\x0dn\xe5qW\x09y?\xa2\x97\xad\xe9\xbb\xd6\xf4\
-}g\xba^\xa1\xdb5\xba[C;\xa9E\x7f\xf6\xc4\
-9\xe2\xe7L\xa0#\x8e\xffG\xf7\x00\xfc3\xa8\x16\xd0\
-<\x14\xdf<\xf0\xb3\xf9\x99\xf3\xe73\x17.\x16&\x0f\
-\x1a8\xab\x90\xb3\xdaxP\x8b\xbbh$\x5cT\xe6\x1e\
-5\xe6\x9eT\xf8\xc7\xce\xe4BL\x16\x183C*3\
-\xa9\x14\x09Y\xf1\x86\xb92\x13+N\xde&\xc7\x88^\
-D\xedt\x8b3}\xbf\x90\xa8ZD\x97\x16\x00\x00\x03\
-\xd8IDAT\x98\xf4\xe6\x89l%H\xbe\x10(\xd3\
-c\x0ce\xb0L\xc2O\xa2g\x07TS\xf5i\xcc\xd1\
-\xc8\x94sM\x90\xda*W\xd1L_3q\xd4b\xd2\
-H\xb4\xb9\x0c\xcc]g\x95\xb5\x88\xee\xad\xcf[m\xf5\
-\x90\x0f\xda\xc7V\xc7qo\x9az!\x8e0(\xae\x05\
-\xd6\x0en\xbc\x93\x95\x13Y\x89\xb1\xc2\xec:\xe3\xde\x8f\
-p\xd5\xa3\x9b\xad\xe6\xed\x0d\xf9\xb0)\xd3\xb4\xb8/\x9f\
-\x1b\x9f\xed8\xfa/\xc5/\x81@\x1f\xe3\xa4\xf5\x0a\xe0\
-\xce ,\xa0\x9eC5\x83\xb0\xc0U\x0b\xa9\x9a\xb9\x0b\
-\xcb\x85T\x0f\xe6\xf8\x87\x0b\xc2\xc3\xb9\x84\x8b\x19\xd5\xd3\
-\x05\xe1Y-\xe1i\xc0=\xf4\xe2\x1ez\x95\x0bQ\x96\
-\xce\xa8\xa7\xc0u\xb1S\xb0\x91y\x9b\x06\xe4\x19\x93\xe3\
-\xd9'M\x8f\x8b\x1d|&\x9d<\x07\x8c\x11\xb3\x11\x9b\
-\x0e\x0e\xa7D\x1fL\x8e\xc9\x09\x959\x0bx*\xf3T\
-\x04\xa9\x09x\xab%0\xf7\xde\xce|\xd0y\xf0y\xe6\
-\xb1JT\xc9\x9d\xaa\x1e,\xebNcnu\xb0Vw\
-\xb9\x8d\x07\x1b\xfb\x1e\xdb\x0e\xd8f@\xb6\x83\xc8>!\
-\xbb\x0c[5\xbd1\x91\xab\xecX\x99q\x13-oG\
-\xcd\xfb\x16\xf6{h\x07H#\xa4\xed\x87\xd3\xb4_\x14\
-q\x8e\xf8%\x12\xe8\xa7pw\x99\xc7Q\x96b\xc2\x1c\
-\xea3\xa4Y\x12\x9a\x05\xbey,\xf3\xb3g~\xf9d\
-)\xd5\xd3F\xdc\xd3\x99\x84\xa7ssO*\xdc\xe3\x1a\
-w^\x994\x0e\x82\x08\xb5\x98\xce\x05[\x88\xb1\x04i\
-\xcc\xecH\x22\x9fQ\x97Te\xa4\x04\xcc\x17R!\xe9\
-\xce\x94.!d)\xfb\xceV\x9cu\xd4I0O\xd0\
- \x95\xd5R[\xe3+k\x5c\xb0\x0a_<\x05\xd0<\
-C\xa3\x17m\x85\xd4\xa9\xc4n\xc8\xed\xb0O\xfba\x9f\
-\xf7\xf1\x90\xbb\xdc\x11S\x87v\x03\xb6\x8b\x22\xeb\x08\xeb\
-(\xb2N\x22\x9bh\xb2\x1f\xd1\xfd\x98\xd3n\x80\xdd\x06\
-\xedz\xe8\xdac7\xf9\xa1\xf3\xd5/\x920\x1f\xe3\x9e\
-@?\xc6\x07d\xaa@\x1e\x80\xab\xc1\xd7\x84p\xc6\xbc\
-\xa9p\x8bZd\xb9\x94\xfa\xec\xa1\xd4g\x0bW]\xcc\
-%\x9c7\xf8\x85\xc7\xcd\x9cc)\x96\xcf\x03\x9cy\xe4\
-\xcc#K1\xa9\x05+\xfe\x19XP\xccg3\x9f\xc5\
-\x9c\x0a>\x8b8\x95\xe2\x0cw\xac<&bVBq\
-\x0cDE\x5c\x16\x5cv\xf8\x5cI\xc8\x95\xf3\xa9rn\
-\xac\xc4\xc7\x80f\x97c$\x0e}\xd6\xb1ms\xbf\xef\
-\xb4o\x0f\xf4\xed\xde\x86\xae\xb5\xa1\x1f$\xc7\x88\xc5\xd1\
-\xe8\xa2\xd8!A\x1b\xb1n\x14\xe93t&2\xf40\
-\xe6\x94F\x85x}[a\xee\xb6f\xf7\xc4\xb9\x83{\
-\x02\xfd\x9f!\x1f=\xbe\xd3\xfay\x7fA\x13\x1eQ\x85\
-F\xaa\xa6qnV\xe3\x1a\x87\x9f!\xba\xc0t\xd1\xe0\
-\xeb\x99sM\xe3|S\x99o\x02\xd2T\xe2\xea\x80T\
-\xae\xac\x0cT8\xa9\xccIe\xceys\xe2L\x1c\x8a\
-L\xc1\x0e\xbe\x90G\x8e\xb9\x5c\x96\xb3jR\xb5\xacf\
-)g\x1d\xd5\xb4\xf5h\x87\xe6Q5F\xcd\xe3\x98,\
-\x0d\xad\xc6\xd4Z\x1f[\xf2\xd8\xa3\xc3H\x1eM\x88\xea\
-HCf4\xf2\x98 %\xd0H\xc9\xf5\x02t{K\
-\x96\xfbJ\xf3\xff\x80{\x02\xfde\xf8\x98X.\x80[\
-\xe2}C\xed+r%P5\x04\xb7\x10\xeff>\xf8\
-\xa5\x85P\x89\xf3\xb5\xf3\xbe\xc69\xe7\xc4\xab\xb8`X\
-p\x9e\x0aq\xceD\xdci\xa1\x15gB@D\xac\x8c\
-\xbe\xd5\x14U\xcb\x9a\xb3i\x1es\xd2.\xe5<\xe44\
-\xc08ZNi$\xa7DV\x90<\xa2\xd6\x91l\x22\
-\x88F\xc8\x93\xb3\xb8\xee\x7f\x5cU\xe0\x1725\xfbk\
-\xe3\x9e@\x7f=\xfcT\xb5\x12&I\xf3\xd9\xadHB\
-\xa6\x8fw\xd1i/\xbc\x9eZ\xc5\x0f\xdf\xbd\x0e\xa6\xed\
-j\xc5\x88\x8c\xc7\xddU=Z\xe9\xb7`\xdd\x87d\xf8\
-)\x12\xfc\x14)\xee\x89\xf2W\xc2=\x81\xfek\xf0\x7f\
-{\x9d\xff\x7f\x7f\x0f\x1fW\x8e{\xdc\xe3\x1e\xf7\xb8\xc7\
-=\xeeq\x8f{\xdc\xe3\x1e\xf7\xb8\xc7=\xeeq\x8f{\
-\xdc\xe3\x1e\xf7\xf8\x99\xe2?\x00\xa6\xda\x9871\xfa\x9f\
-\x01\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x16\x1a\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22?>\x0d\x0a<svg vers\
-ion=\x221.1\x22 xmlns=\
-\x22http://www.w3.o\
-rg/2000/svg\x22 wid\
-th=\x22200\x22 height=\
-\x22200\x22>\x0d\x0a<path d=\
-\x22M0 0 C17.583811\
-59 14.90379235 2\
-8.55807281 36.56\
-265642 30.8125 5\
-9.46875 C32.3322\
-2454 85.03744876\
- 23.36345815 105\
-.29537789 9.8125\
- 126.46875 C13.2\
-775 125.47875 13\
-.2775 125.47875 \
-16.8125 124.4687\
-5 C22.25998395 1\
-29.78977502 27.6\
-8801844 135.1300\
-5908 33.1027832 \
-140.484375 C34.9\
-4826038 142.3046\
-6072 36.79819356\
- 144.12043998 38\
-.65258789 145.93\
-164062 C41.31271\
-384 148.53132533\
- 43.95655133 151\
-.1466362 46.5976\
-5625 153.765625 \
-C47.43402115 154\
-.57618347 48.270\
-38605 155.386741\
-94 49.13209534 1\
-56.22186279 C49.\
-89295944 156.982\
-34924 50.6538235\
-5 157.74283569 5\
-1.43774414 158.5\
-2636719 C52.1150\
-3067 159.1925506\
-6 52.7923172 159\
-.85873413 53.490\
-12756 160.545104\
-98 C54.8125 162.\
-46875 54.8125 16\
-2.46875 54.60113\
-525 164.6111908 \
-C53.08981595 168\
-.17096708 50.204\
-03378 170.588960\
-12 47.5 173.2812\
-5 C46.91798828 1\
-73.89162109 46.3\
-3597656 174.5019\
-9219 45.73632812\
- 175.13085938 C4\
-5.16720703 175.7\
-0255859 44.59808\
-594 176.27425781\
- 44.01171875 176\
-.86328125 C43.49\
-440186 177.38768\
-799 42.97708496 \
-177.91209473 42.\
-4440918 178.4523\
-9258 C40.8125 17\
-9.46875 40.8125 \
-179.46875 38.946\
-44165 179.237976\
-07 C36.35931592 \
-178.30538986 35.\
-01239756 177.088\
-21652 33.0378418\
- 175.17749023 C3\
-2.31416916 174.4\
-8264023 31.59049\
-652 173.78779022\
- 30.84489441 173\
-.07188416 C30.07\
-494644 172.31468\
-582 29.30499847 \
-171.55748749 28.\
-51171875 170.777\
-34375 C27.715949\
-25 169.99867447 \
-26.92017975 169.\
-22000519 26.1002\
-9602 168.4177398\
-7 C24.42096208 1\
-66.76674181 22.7\
-4594885 165.1113\
-3909 21.07495117\
- 163.4519043 C18\
-.5128378 160.918\
-94174 15.9205672\
-3 158.41975171 1\
-3.32617188 155.9\
-1992188 C11.6985\
-502 154.31188802\
- 10.07283331 152\
-.70192344 8.4492\
-1875 151.0898437\
-5 C7.66914963 15\
-0.34681503 6.889\
-08051 149.603786\
-32 6.08537292 14\
-8.83824158 C0.93\
-463245 143.62199\
-345 0.93463245 1\
-43.62199345 0.56\
-729126 140.15335\
-083 C0.83520508 \
-137.92993164 0.8\
-3520508 137.9299\
-3164 1.8125 134.\
-46875 C-2.334973\
-86 136.77290214 \
--6.30266133 139.\
-21024446 -10.25 \
-141.84375 C-30.4\
-2228538 154.7208\
-5272 -53.6230374\
-6 158.27970538 -\
-76.88671875 153.\
-5 C-99.91653925 \
-148.25625501 -11\
-9.42894156 134.2\
-55866 -132.25 11\
-4.40625 C-144.44\
-2667 93.91973393\
- -148.64310046 7\
-0.50327977 -143.\
-21875 47.1484375\
- C-136.42471306 \
-22.90607841 -122\
-.63643106 3.4234\
-3388 -100.738281\
-25 -9.609375 C-6\
-8.17337032 -27.7\
-220815 -28.69043\
-687 -23.22221004\
- 0 0 Z M-111.798\
-82812 15.9819335\
-9 C-118.62727076\
- 23.29297713 -12\
-3.60187483 31.15\
-746251 -127.1875\
- 40.46875 C-127.\
-48269531 41.1816\
-0156 -127.777890\
-62 41.89445312 -\
-128.08203125 42.\
-62890625 C-134.7\
-758923 60.270362\
-72 -133.0651573 \
-80.20709333 -126\
-.1875 97.46875 C\
--116.95510848 11\
-6.94437882 -101.\
-8102517 130.3109\
-8971 -82.03125 1\
-38.171875 C-64.6\
-2216776 144.3381\
-5568 -43.6541601\
-8 143.51495343 -\
-27.00537109 135.\
-70068359 C-20.58\
-232417 132.55172\
-706 -14.64659211\
- 129.12579541 -9\
-.1875 124.46875 \
-C-8.62289062 124\
-.0459375 -8.0582\
-8125 123.623125 \
--7.4765625 123.1\
-875 C7.07720064 \
-111.86058932 14.\
-46109496 93.8861\
-2399 17.34765625\
- 76.1875 C19.511\
-1045 56.09478518\
- 13.49309358 36.\
-21971603 1.00512\
-695 20.38696289 \
-C-12.17100576 4.\
-46046106 -30.425\
-94089 -5.2315803\
-8 -51.01049805 -\
-7.1875 C-74.2340\
-3767 -8.95585995\
- -95.54389669 -0\
-.62037256 -111.7\
-9882812 15.98193\
-359 Z \x22 fill=\x22#2\
-B2B2B\x22 transform\
-=\x22translate(145.\
-1875,20.53125)\x22/\
->\x0d\x0a<path d=\x22M0 0\
- C9.2118124 7.29\
-897704 17.429478\
-89 15.81201438 2\
-1.8515625 26.910\
-15625 C22.444317\
-69 32.9206939 15\
-.77702858 39.391\
-44444 12.1960449\
-2 43.88110352 C2\
-.53392137 55.600\
-07416 -10.693418\
-79 64.54852133 -\
-25.953125 66.890\
-625 C-42.7247143\
-1 68.34234489 -5\
-8.06753156 65.47\
-598887 -71.57812\
-5 54.8203125 C-7\
-9.52937143 47.86\
-297188 -89.33448\
-218 39.10399072 \
--92.953125 28.89\
-0625 C-89.057533\
-06 14.44731922 -\
-75.62553069 2.75\
-185441 -63.23828\
-125 -4.453125 C-\
-42.52607792 -14.\
-8954249 -18.9475\
-682 -13.53397729\
- 0 0 Z M-72.9531\
-25 16.890625 C-7\
-7.04741619 21.50\
-992166 -77.04741\
-619 21.50992166 \
--79.953125 26.89\
-0625 C-77.869339\
-27 35.98221069 -\
-67.23925891 44.5\
-1798419 -59.5898\
-4375 49.3984375 \
-C-56.35020077 51\
-.30334987 -56.35\
-020077 51.303349\
-87 -52.953125 52\
-.890625 C-51.963\
-125 52.395625 -5\
-1.963125 52.3956\
-25 -50.953125 51\
-.890625 C-51.819\
-375 51.313125 -5\
-2.685625 50.7356\
-25 -53.578125 50\
-.140625 C-59.231\
-04539 45.3356426\
-7 -62.37676237 3\
-8.59814912 -63.5\
-0390625 31.34765\
-625 C-63.8662561\
- 21.85409012 -61\
-.65089789 15.028\
-60894 -55.328125\
- 7.953125 C-54.5\
-44375 7.2725 -53\
-.760625 6.591875\
- -52.953125 5.89\
-0625 C-52.355 5.\
-2925 -51.756875 \
-4.694375 -51.140\
-625 4.078125 C-5\
-0.74875 3.68625 \
--50.356875 3.294\
-375 -49.953125 2\
-.890625 C-58.537\
-43634 2.890625 -\
-67.08695454 11.3\
-2347972 -72.9531\
-25 16.890625 Z M\
--17.953125 3.890\
-625 C-17.5664062\
-5 4.3753125 -17.\
-1796875 4.86 -16\
-.78125 5.359375 \
-C-11.17029446 12\
-.58139698 -6.596\
-82587 19.4338523\
-7 -6.953125 28.8\
-90625 C-8.075157\
-06 37.05772371 -\
-10.60168783 42.7\
-0442325 -15.9531\
-25 48.890625 C-1\
-6.613125 49.8806\
-25 -17.273125 50\
-.870625 -17.9531\
-25 51.890625 C-7\
-.40307897 50.505\
-45709 0.70704014\
- 40.73529979 7.0\
-46875 32.890625 \
-C9.29881333 30.1\
-6343367 9.298813\
-33 30.16343367 8\
-.9140625 27.5351\
-5625 C5.83664352\
- 18.15041458 -3.\
-70027725 10.6977\
-5821 -11.953125 \
-5.890625 C-13.93\
-377263 5.1684897\
- -15.93069927 4.\
-48580446 -17.953\
-125 3.890625 Z M\
--47.578125 14.28\
-515625 C-51.7477\
-0825 19.18689847\
- -53.43901624 23\
-.17463239 -53.26\
-171875 29.515625\
- C-52.6380278 34\
-.31567686 -50.81\
-940472 38.181282\
-44 -47.234375 41\
-.46484375 C-42.0\
-5031181 45.29797\
-522 -37.45436577\
- 46.54694073 -30\
-.953125 45.89062\
-5 C-25.51432634 \
-44.04143345 -22.\
-17950775 40.5147\
-5662 -18.953125 \
-35.890625 C-17.0\
-1517341 30.07677\
-024 -16.93256808\
- 23.96953724 -19\
-.640625 18.45312\
-5 C-23.66528052 \
-13.99337159 -27.\
-07349228 11.3918\
-0782 -32.953125 \
-9.890625 C-38.21\
-12595 9.890625 -\
-43.46477469 10.7\
-5518976 -47.5781\
-25 14.28515625 Z\
- \x22 fill=\x22#2B2B2B\
-\x22 transform=\x22tra\
-nslate(121.95312\
-5,61.109375)\x22/>\x0d\
-\x0a</svg>\x0d\x0a\
-\x00\x00\x01\x0f\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M4.5 3C\
-3.67157 3 3 3.67\
-157 3 4.5V15.5C3\
- 16.3284 3.67157\
- 17 4.5 17H15.5C\
-16.3284 17 17 16\
-.3284 17 15.5V4.\
-5C17 3.67157 16.\
-3284 3 15.5 3H4.\
-5Z\x22 fill=\x22#f1404\
-0\x22/>\x0d\x0a</svg>\x0d\x0a\
-\x00\x00\x01\xbf\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 width=\x2224\
-\x22 height=\x2224\x22 vi\
-ewBox=\x220 0 24 24\
-\x22 fill=\x22none\x22 st\
-roke=\x22currentCol\
-or\x22 stroke-width\
-=\x222\x22 stroke-line\
-cap=\x22round\x22 stro\
-ke-linejoin=\x22rou\
-nd\x22 class=\x22icon \
-icon-tabler icon\
-s-tabler-outline\
- icon-tabler-squ\
-are-dot\x22><path s\
-troke=\x22none\x22 d=\x22\
-M0 0h24v24H0z\x22 f\
-ill=\x22none\x22 /><pa\
-th d=\x22M3 5a2 2 0\
- 0 1 2 -2h14a2 2\
- 0 0 1 2 2v14a2 \
-2 0 0 1 -2 2h-14\
-a2 2 0 0 1 -2 -2\
-v-14\x22 /><path d=\
-\x22M11 12a1 1 0 1 \
-0 2 0a1 1 0 1 0 \
--2 0\x22 /></svg>\
-\x00\x00\xcc\x03\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02O\x00\x00\x02O\x08\x06\x00\x00\x00e\xc70n\
-\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
-\x00\x00\x0aIiCCPsRGB IEC\
-61966-2.1\x00\x00H\x89\x9dSw\
-X\x93\xf7\x16>\xdf\xf7e\x0fVB\xd8\xf0\xb1\x97l\
-\x81\x00\x22#\xac\x08\xc8\x10Y\xa2\x10\x92\x00a\x84\x10\
-\x12@\xc5\x85\x88\x0aV\x14\x15\x11\x9cHU\xc4\x82\xd5\
-\x0aH\x9d\x88\xe2\xa0(\xb8gA\x8a\x88Z\x8bU\x5c\
-8\xee\x1f\xdc\xa7\xb5}z\xef\xed\xed\xfb\xd7\xfb\xbc\xe7\
-\x9c\xe7\xfc\xcey\xcf\x0f\x80\x11\x12&\x91\xe6\xa2j\x00\
-9R\x85<:\xd8\x1f\x8fOH\xc4\xc9\xbd\x80\x02\x15\
-H\xe0\x04 \x10\xe6\xcb\xc2g\x05\xc5\x00\x00\xf0\x03y\
-x~t\xb0?\xfc\x01\xafo\x00\x02\x00p\xd5.$\
-\x12\xc7\xe1\xff\x83\xbaP&W\x00 \x91\x00\xe0\x22\x12\
-\xe7\x0b\x01\x90R\x00\xc8.T\xc8\x14\x00\xc8\x18\x00\xb0\
-S\xb3d\x0a\x00\x94\x00\x00ly|B\x22\x00\xaa\x0d\
-\x00\xec\xf4I>\x05\x00\xd8\xa9\x93\xdc\x17\x00\xd8\xa2\x1c\
-\xa9\x08\x00\x8d\x01\x00\x99(G$\x02@\xbb\x00`U\
-\x81R,\x02\xc0\xc2\x00\xa0\xac@\x22.\x04\xc0\xae\x01\
-\x80Y\xb62G\x02\x80\xbd\x05\x00v\x8eX\x90\x0f@\
-`\x00\x80\x99B,\xcc\x00 8\x02\x00C\x1e\x13\xcd\
-\x03 L\x03\xa00\xd2\xbf\xe0\xa9_p\x85\xb8H\x01\
-\x00\xc0\xcb\x95\xcd\x97K\xd23\x14\xb8\x95\xd0\x1aw\xf2\
-\xf0\xe0\xe2!\xe2\xc2l\xb1Ba\x17)\x10f\x09\xe4\
-\x22\x9c\x97\x9b#\x13H\xe7\x03L\xce\x0c\x00\x00\x1a\xf9\
-\xd1\xc1\xfe8?\x90\xe7\xe6\xe4\xe1\xe6f\xe7l\xef\xf4\
-\xc5\xa2\xfek\xf0o\x22>!\xf1\xdf\xfe\xbc\x8c\x02\x04\
-\x00\x10N\xcf\xef\xda_\xe5\xe5\xd6\x03p\xc7\x01\xb0u\
-\xbfk\xa9[\x00\xdaV\x00h\xdf\xf9]3\xdb\x09\xa0\
-Z\x0a\xd0z\xf9\x8by8\xfc@\x1e\x9e\xa1P\xc8<\
-\x1d\x1c\x0a\x0b\x0b\xed%b\xa1\xbd0\xe3\x8b>\xff3\
-\xe1o\xe0\x8b~\xf6\xfc@\x1e\xfe\xdbz\xf0\x00q\x9a\
-@\x99\xad\xc0\xa3\x83\xfdqanv\xaeR\x8e\xe7\xcb\
-\x04B1n\xf7\xe7#\xfe\xc7\x85\x7f\xfd\x8e)\xd1\xe2\
-4\xb1\x5c,\x15\x8a\xf1X\x89\xb8P\x22M\xc7y\xb9\
-R\x91D!\xc9\x95\xe2\x12\xe9\x7f2\xf1\x1f\x96\xfd\x09\
-\x93w\x0d\x00\xac\x86O\xc0N\xb6\x07\xb5\xcbl\xc0~\
-\xee\x01\x02\x8b\x0eX\xd2v\x00@~\xf3-\x8c\x1a\x0b\
-\x91\x00\x10g42y\xf7\x00\x00\x93\xbf\xf9\x8f@+\
-\x01\x00\xcd\x97\xa4\xe3\x00\x00\xbc\xe8\x18\x5c\xa8\x94\x17L\
-\xc6\x08\x00\x00D\xa0\x81*\xb0A\x07\x0c\xc1\x14\xac\xc0\
-\x0e\x9c\xc1\x1d\xbc\xc0\x17\x02a\x06D@\x0c$\xc0<\
-\x10B\x06\xe4\x80\x1c\x0a\xa1\x18\x96A\x19T\xc0:\xd8\
-\x04\xb5\xb0\x03\x1a\xa0\x11\x9a\xe1\x10\xb4\xc118\x0d\xe7\
-\xe0\x12\x5c\x81\xebp\x17\x06`\x18\x9e\xc2\x18\xbc\x86\x09\
-\x04A\xc8\x08\x13a!:\x88\x11b\x8e\xd8\x22\xce\x08\
-\x17\x99\x8e\x04\x22aH4\x92\x80\xa4 \xe9\x88\x14Q\
-\x22\xc5\xc8r\xa4\x02\xa9Bj\x91]H#\xf2-r\
-\x149\x8d\x5c@\xfa\x90\xdb\xc8 2\x8a\xfc\x8a\xbcG\
-1\x94\x81\xb2Q\x03\xd4\x02u@\xb9\xa8\x1f\x1a\x8a\xc6\
-\xa0s\xd1t4\x0f]\x80\x96\xa2k\xd1\x1a\xb4\x1e=\
-\x80\xb6\xa2\xa7\xd1K\xe8ut\x00}\x8a\x8ec\x80\xd1\
-1\x0ef\x8c\xd9a\x5c\x8c\x87E`\x89X\x1a&\xc7\
-\x16c\xe5X5V\x8f5c\x1dX7v\x15\x1b\xc0\
-\x9ea\xef\x08$\x02\x8b\x80\x13\xec\x08^\x84\x10\xc2l\
-\x82\x90\x90GXLXC\xa8%\xec#\xb4\x12\xba\x08\
-W\x09\x83\x841\xc2'\x22\x93\xa8O\xb4%z\x12\xf9\
-\xc4xb:\xb1\x90XF\xac&\xee!\x1e!\x9e%\
-^'\x0e\x13_\x93H$\x0e\xc9\x92\xe4N\x0a!%\
-\x902I\x0bIkH\xdbH-\xa4S\xa4>\xd2\x10\
-i\x9cL&\xeb\x90m\xc9\xde\xe4\x08\xb2\x80\xac \x97\
-\x91\xb7\x90\x0f\x90O\x92\xfb\xc9\xc3\xe4\xb7\x14:\xc5\x88\
-\xe2L\x09\xa2$R\xa4\x94\x12J5e?\xe5\x04\xa5\
-\x9f2B\x99\xa0\xaaQ\xcd\xa9\x9e\xd4\x08\xaa\x88:\x9f\
-ZIm\xa0vP/S\x87\xa9\x134u\x9a%\xcd\
-\x9b\x16C\xcb\xa4-\xa3\xd5\xd0\x9aigi\xf7h/\
-\xe9t\xba\x09\xdd\x83\x1eE\x97\xd0\x97\xd2k\xe8\x07\xe9\
-\xe7\xe9\x83\xf4w\x0c\x0d\x86\x0d\x83\xc7Hb(\x19k\
-\x19{\x19\xa7\x18\xb7\x19/\x99L\xa6\x05\xd3\x97\x99\xc8\
-T0\xd72\x1b\x99g\x98\x0f\x98oUX*\xf6*\
-|\x15\x91\xca\x12\x95:\x95V\x95~\x95\xe7\xaaTU\
-sU?\xd5y\xaa\x0bT\xabU\x0f\xab^V}\xa6\
-FU\xb3P\xe3\xa9\x09\xd4\x16\xab\xd5\xa9\x1dU\xbb\xa9\
-6\xae\xceRwR\x8fP\xcfQ_\xa3\xbe_\xfd\x82\
-\xfac\x0d\xb2\x86\x85F\xa0\x86H\xa3Tc\xb7\xc6\x19\
-\x8d!\x16\xc62e\xf1XB\xd6rV\x03\xeb,k\
-\x98Mb[\xb2\xf9\xecLv\x05\xfb\x1bv/{L\
-SCs\xaaf\xacf\x91f\x9d\xe6q\xcd\x01\x0e\xc6\
-\xb1\xe0\xf09\xd9\x9cJ\xce!\xce\x0d\xce{-\x03-\
-?-\xb1\xd6j\xadf\xad~\xad7\xdaz\xda\xbe\xda\
-b\xedr\xed\x16\xed\xeb\xda\xefup\x9d@\x9d,\x9d\
-\xf5:m:\xf7u\x09\xba6\xbaQ\xba\x85\xba\xdbu\
-\xcf\xea>\xd3c\xeby\xe9\x09\xf5\xca\xf5\x0e\xe9\xdd\xd1\
-G\xf5m\xf4\xa3\xf5\x17\xea\xef\xd6\xef\xd1\x1f704\
-\x086\x90\x19l18c\xf0\xcc\x90c\xe8k\x98i\
-\xb8\xd1\xf0\x84\xe1\xa8\x11\xcbh\xba\x91\xc4h\xa3\xd1I\
-\xa3'\xb8&\xee\x87g\xe35x\x17>f\xaco\x1c\
-b\xac4\xdee\xdck<abi2\xdb\xa4\xc4\xa4\
-\xc5\xe4\xbe)\xcd\x94k\x9af\xba\xd1\xb4\xd3t\xcc\xcc\
-\xc8,\xdc\xac\xd8\xac\xc9\xec\x8e9\xd5\x9ck\x9ea\xbe\
-\xd9\xbc\xdb\xfc\x8d\x85\xa5E\x9c\xc5J\x8b6\x8b\xc7\x96\
-\xda\x96|\xcb\x05\x96M\x96\xf7\xac\x98V>VyV\
-\xf5V\xd7\xacI\xd6\x5c\xeb,\xebm\xd6WlP\x1b\
-W\x9b\x0c\x9b:\x9b\xcb\xb6\xa8\xad\x9b\xad\xc4v\x9bm\
-\xdf\x14\xe2\x14\x8f)\xd2)\xf5Sn\xda1\xec\xfc\xec\
-\x0a\xec\x9a\xec\x06\xed9\xf6a\xf6%\xf6m\xf6\xcf\x1d\
-\xcc\x1c\x12\x1d\xd6;t;|rtu\xccvlp\
-\xbc\xeb\xa4\xe14\xc3\xa9\xc4\xa9\xc3\xe9Wg\x1bg\xa1\
-s\x9d\xf35\x17\xa6K\x90\xcb\x12\x97v\x97\x17Sm\
-\xa7\x8a\xa7n\x9fz\xcb\x95\xe5\x1a\xee\xba\xd2\xb5\xd3\xf5\
-\xa3\x9b\xbb\x9b\xdc\xad\xd9m\xd4\xdd\xcc=\xc5}\xab\xfb\
-M.\x9b\x1b\xc9]\xc3=\xefA\xf4\xf0\xf7X\xe2q\
-\xcc\xe3\x9d\xa7\x9b\xa7\xc2\xf3\x90\xe7/^v^Y^\
-\xfb\xbd\x1eO\xb3\x9c&\x9e\xd60m\xc8\xdb\xc4[\xe0\
-\xbd\xcb{`:>=e\xfa\xce\xe9\x03>\xc6>\x02\
-\x9fz\x9f\x87\xbe\xa6\xbe\x22\xdf=\xbe#~\xd6~\x99\
-~\x07\xfc\x9e\xfb;\xfa\xcb\xfd\x8f\xf8\xbf\xe1y\xf2\x16\
-\xf1N\x05`\x01\xc1\x01\xe5\x01\xbd\x81\x1a\x81\xb3\x03k\
-\x03\x1f\x04\x99\x04\xa5\x075\x05\x8d\x05\xbb\x06/\x0c>\
-\x15B\x0c\x09\x0dY\x1fr\x93o\xc0\x17\xf2\x1b\xf9c\
-3\xdcg,\x9a\xd1\x15\xca\x08\x9d\x15Z\x1b\xfa0\xcc\
-&L\x1e\xd6\x11\x8e\x86\xcf\x08\xdf\x10~o\xa6\xf9L\
-\xe9\xcc\xb6\x08\x88\xe0Gl\x88\xb8\x1fi\x19\x99\x17\xf9\
-}\x14)*2\xaa.\xeaQ\xb4Stqt\xf7,\
-\xd6\xac\xe4Y\xfbg\xbd\x8e\xf1\x8f\xa9\x8c\xb9;\xdbj\
-\xb6rvg\xacjlRlc\xec\x9b\xb8\x80\xb8\xaa\
-\xb8\x81x\x87\xf8E\xf1\x97\x12t\x13$\x09\xed\x89\xe4\
-\xc4\xd8\xc4=\x89\xe3s\x02\xe7l\x9a3\x9c\xe4\x9aT\
-\x96tc\xae\xe5\xdc\xa2\xb9\x17\xe6\xe9\xce\xcb\x9ew<\
-Y5Y\x90|8\x85\x98\x12\x97\xb2?\xe5\x83 B\
-P/\x18O\xe5\xa7nM\x1d\x13\xf2\x84\x9b\x85OE\
-\xbe\xa2\x8d\xa2Q\xb1\xb7\xb8J<\x92\xe6\x9dV\x95\xf6\
-8\xdd;}C\xfah\x86OFu\xc63\x09OR\
-+y\x91\x19\x92\xb9#\xf3MVD\xd6\xde\xac\xcf\xd9\
-q\xd9-9\x94\x9c\x94\x9c\xa3R\x0di\x96\xb4+\xd7\
-0\xb7(\xb7Of++\x93\x0d\xe4y\xe6m\xca\x1b\
-\x93\x87\xca\xf7\xe4#\xf9s\xf3\xdb\x15l\x85L\xd1\xa3\
-\xb4R\xaeP\x0e\x16L/\xa8+x[\x18[x\xb8\
-H\xbdHZ\xd43\xdff\xfe\xea\xf9#\x0b\x82\x16|\
-\xbd\x90\xb0P\xb8\xb0\xb3\xd8\xb8xY\xf1\xe0\x22\xbfE\
-\xbb\x16#\x8bS\x17w.1]R\xbadxi\xf0\
-\xd2}\xcbh\xcb\xb2\x96\xfdP\xe2XRU\xf2jy\
-\xdc\xf2\x8eR\x83\xd2\xa5\xa5C+\x82W4\x95\xa9\x94\
-\xc9\xcbn\xae\xf4Z\xb9c\x15a\x95dU\xefj\x97\
-\xd5[V\x7f*\x17\x95_\xacp\xac\xa8\xae\xf8\xb0F\
-\xb8\xe6\xe2WN_\xd5|\xf5ym\xda\xda\xdeJ\xb7\
-\xca\xed\xebH\xeb\xa4\xebn\xac\xf7Y\xbf\xafJ\xbdj\
-A\xd5\xd0\x86\xf0\x0d\xad\x1b\xf1\x8d\xe5\x1b_mJ\xde\
-t\xa1zj\xf5\x8e\xcd\xb4\xcd\xca\xcd\x035a5\xed\
-[\xcc\xb6\xac\xdb\xf2\xa16\xa3\xf6z\x9d\x7f]\xcbV\
-\xfd\xad\xab\xb7\xbe\xd9&\xda\xd6\xbf\xddw{\xf3\x0e\x83\
-\x1d\x15;\xde\xef\x94\xec\xbc\xb5+xWk\xbdE}\
-\xf5n\xd2\xee\x82\xdd\x8f\x1ab\x1b\xba\xbf\xe6~\xdd\xb8\
-GwO\xc5\x9e\x8f{\xa5{\x07\xf6E\xef\xebjt\
-ol\xdc\xaf\xbf\xbf\xb2\x09mR6\x8d\x1eH:p\
-\xe5\x9b\x80o\xda\x9b\xed\x9aw\xb5pZ*\x0e\xc2A\
-\xe5\xc1'\xdf\xa6|{\xe3P\xe8\xa1\xce\xc3\xdc\xc3\xcd\
-\xdf\x99\x7f\xb7\xf5\x08\xebHy+\xd2:\xbfu\xac-\
-\xa3m\xa0=\xa1\xbd\xef\xe8\x8c\xa3\x9d\x1d^\x1dG\xbe\
-\xb7\xff~\xef1\xe3cu\xc75\x8fW\x9e\xa0\x9d(\
-=\xf1\xf9\xe4\x82\x93\xe3\xa7d\xa7\x9e\x9dN?=\xd4\
-\x99\xdcy\xf7L\xfc\x99k]Q]\xbdgC\xcf\x9e\
-?\x17t\xeeL\xb7_\xf7\xc9\xf3\xde\xe7\x8f]\xf0\xbc\
-p\xf4\x22\xf7b\xdb%\xb7K\xad=\xae=G~p\
-\xfd\xe1H\xaf[o\xebe\xf7\xcb\xedW<\xaet\xf4\
-M\xeb;\xd1\xef\xd3\x7f\xfaj\xc0\xd5s\xd7\xf8\xd7.\
-]\x9fy\xbd\xef\xc6\xec\x1b\xb7n&\xdd\x1c\xb8%\xba\
-\xf5\xf8v\xf6\xed\x17w\x0a\xeeL\xdc]z\x8fx\xaf\
-\xfc\xbe\xda\xfd\xea\x07\xfa\x0f\xea\x7f\xb4\xfe\xb1e\xc0m\
-\xe0\xf8`\xc0`\xcf\xc3Y\x0f\xef\x0e\x09\x87\x9e\xfe\x94\
-\xff\xd3\x87\xe1\xd2G\xccG\xd5#F#\x8d\x8f\x9d\x1f\
-\x1f\x1b\x0d\x1a\xbd\xf2d\xce\x93\xe1\xa7\xb2\xa7\x13\xcf\xca\
-~V\xffy\xebs\xab\xe7\xdf\xfd\xe2\xfbK\xcfX\xfc\
-\xd8\xf0\x0b\xf9\x8b\xcf\xbf\xaey\xa9\xf3r\xef\xab\xa9\xaf\
-:\xc7#\xc7\x1f\xbc\xcey=\xf1\xa6\xfc\xad\xce\xdb}\
-\xef\xb8\xef\xba\xdf\xc7\xbd\x1f\x99(\xfc@\xfeP\xf3\xd1\
-\xfac\xc7\xa7\xd0O\xf7>\xe7|\xfe\xfc/\xf7\x84\xf3\
-\xfb-G8\xcf\x00\x00\x00 cHRM\x00\x00z\
-&\x00\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u\
-0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ\
-<\x00\x00\x00\x09pHYs\x00\x00.#\x00\x00.\
-#\x01x\xa5?v\x00\x00\xc1$IDATx\x9c\
-\xec\xfdgw#K\x96\xa6\x0b>\xa0\xd6\x9a\x0c\xad\xce\
-\x89\x88#RVvuUuO\xdf;s\xbf\xcd\xcf\
-\x9e;\xf7Nu\x97\xca\xaa\xcc<2\x8f\x0a-HF\
-Pk\x81\xf9\xf0\xfa.3x\x00\x0c\x12p\xc0\xdd\xe1\
-\xfbY\xcb\x16@'H:\x01w\xb3\xd7\xb6\xac\xd5\xeb\
-u\x1c\xc7q\x1c\xc7q\x9c\xcb1\x90\xf7\x098\x8e\xe3\
-8\x8e\xe3\x94\x09\x17O\x8e\xe38\x8e\xe38W\xc0\xc5\
-\x93\xe38\x8e\xe38\xce\x15p\xf1\xe48\x8e\xe38\x8e\
-s\x05\x5c<9\x8e\xe38\x8e\xe3\x5c\x01\x17O\x8e\xe3\
-8\x8e\xe38W\xc0\xc5\x93\xe38\x8e\xe38\xce\x15p\
-\xf1\xe48\x8e\xe38\x8es\x05\x5c<9\x8e\xe38\x8e\
-\xe3\x5c\x01\x17O\x8e\xe38\x8e\xe38W\xc0\xc5\x93\xe3\
-8\x8e\xe38\xce\x15p\xf1\xe48\x8e\xe38\x8es\x05\
-\x5c<9\x8e\xe38\x8e\xe3\x5c\x81\xa1^\xff\xc1Z\xad\
-\xd6\xeb?\xe98\x8e\xe38N>\x0c\x00\x93\xc9\x18\x01\
-\xf6\x92q\xd8\xcb\x93\xa8\xd7\xeb\x99\xfe\xbe\x9e\x8b'\xc7\
-q\x1c\xc7q\xfa\x9e\xc1d\x0c\x03\xb3\xc0\x1c\x12P\xdb\
-\xc9\xd8\x05N\x80c\xe04\x9fSl\x1f\x17O\x8e\xe3\
-8\x8e\xe3dI\x0d\x18Cbi\x1a\xb8\x97\x8c%`\
--\x1a\xeb\xc9\xd8\xce\xe74\xdb\xc7\xc5\x93\xe38\x8e\xe3\
-8YR\x03\xc6\x91\xc5i\x05\xf8\x0c\xf8\x0dp\x17x\
-\x0e\xbc\x00\x9e!\xab\xd4>.\x9e\x1c\xc7q\x1c\xc7\xa9\
-(\x03H8\x0d\x03\x0bH,\xdd\x07\xbe\x00\xbeL\xbe\
-\x9eA\xa2j\x0a\xa8#\xf1t\x84\xdcwG\x94\xc4\x85\
-\xe7\xe2\xc9q\x1c\xc7q\x9c,\x18B\xc2i\x02\xb9\xe9\
-~\x0f\xfc\x1a\xb8\x0d\xdc@.\xbc\xeb\xc0(\x12O \
-\x015\x82\xdcw\xab\xc0NO\xcf\xb8M\x5c<9\x8e\
-\xe38\x8e\xd3)5\xa4)F\x91H\xba\x0f\xfc\x0d\xf0\
-\x0fHLM \x914\x8a\xacRK\xc9\xcf\xd5Q`\
-\xf9\x10\x0a\x22w\xf1\xe48\x8e\xe38N_c\xae\xba\
-A\xe4\x92\x9bG\xd6\xa5\xfb\xc0\x83d\xc4\x8c&\x8f\x13\
-H,\x1d'_\x9f\xa1\x12\x06'\xc8}Wh\x17\x9e\
-\x8b'\xc7q\x1c\xc7q\xda\xc5\x5cu\xa3\xc0-$\x9a\
->A\xa2i\xee#?\xb7\x88D\xd3\x08\x12`\xa0,\
-\xbd5\x0a\xee\xc2s\xf1\xe48\x8e\xe38N\xbb\x0c\x12\
-b\x98n\xa2\xe0\xf0_\xa3\x98\xa7\xd9\x8f\xfc\xdc\x02*\
-g`\xaf3\x17\xde\x00\x12N.\x9e\x1c\xc7q\x1c\xc7\
-\xe9;\xa6P\xfc\xd2\x0a\xf0)\xf00\x19\x0b\xc85\xd7\
-\x8a\x01T\xce`\x1cY\xae\xcc\x857\x90|=\x88\x84\
-\x95\x89\xa8\xa3\xee\x9c~{\xb8xr\x1c\xc7q\x1c\xa7\
-\x1dj\xc8\xf5\xf6\x08\xd5rz\x84,N\xcb\x84v,\
-\x97a8\xf9=\xe7H\x8c\xad \xf7\xdfS\xe0\xfbd\
-\xacfx\xde\x1d\xe3\xe2\xc9q\x1c\xc7q\x9cv1\xf1\
-\xf4\xb7(\xe6\xe9&\x12O\xd6\x9e\xe52X\xfc\xd3\x14\
-\x0a6\xbf\x07l\x02?#\x81\xf6\x1a\x17O\x8e\xe38\
-\x8e\xe3\x94\x98\xa9dL\x13\xdct\x9f\x22W\xdd\x02r\
-\xc5]\x85\x01\x14(>\x16\xfd\xeeEd\x91z\x93\x0c\
-\x90ko\x17\xb9\xf0\xce\x93\x91m\xc7\xdfK\xe2\xe2\xc9\
-q\x1c\xc7q\x9c\xab\xb0\x822\xea>\x01~\x85\x84\xd3\
-\x0a\xa1\x96S'X\x85rP,\xd5\x97\xc9\xf3\x9b\xc8\
-\x12\xf5\x13*\xa8iM\x85\xcf:\xfc{m\xe1\xe2\xc9\
-q\x1c\xc7q\x9c\xab\xb0\x82D\xd3\xdf\xa3\xea\xe1\xb7\x08\
-\xae\xba\x81\x0e\x7f\xb7\x05\x8c\x9b+\xef\x8b\xe4w\xdfF\
-\xe2l\x07\xd5\x83\x02\x09\xa8\x5cp\xf1\xe48\x8e\xe38\
-\xce\xc707\xdd4\xf0\x18\x05\x88?Fn\xbay\xe4\
-r\xcb\x0a\x13`\xe3H@M$\xc76\x81-\xa4]\
-\xac\x16\xd4.9\xb8\xf0\x5c<9\x8e\xe38\x8e\xf31\
-\x96\x09\xb1M_$\xcf\xcdU7z\xc1\xcfuB\xec\
-\xc2\xb3\xc0t\xcb\xf0\xfb\x0e\xb9\xec\xce\x90\xfb\xee\x84\x1e\
-\xba\xf0\x5c<9\x8e\xe38\x8e\xf31\x96Q\xfc\xd1?\
-\x10\x5cu+\xc8\x22t\xd9\xac\xba\xab\x92v\xe1\x0d$\
-\x8f\x0bH(\xc5U\xc8{\xda\xca\xc5\xc5\x93\xe38\x8e\
-\xe38\xcd\x98L\xc6\x14\xb28}\x8a\xac?\xe6\xaa\xeb\
-\x96\xc5)\xc6\x5cx\xa3\xa8\xdd\xcb(\xb22\xad#7\
-\xde8\xb0\x01\xbc'd\xe2\x1d\xd1e+\x94\x8b'\xc7\
-q\x1c\xc7q\x9a1\x07\xdcEu\x97~\x83\xb2\xeb\xba\
-\xed\xaak\x85Y\xa1@Yx\x8f\x91\xc5\xeb&\xf0\x1c\
-x\x81J\x1a\xbcO\x86\x8b'\xc7q\x1c\xc7qz\xce\
-<\xb26\xfd\x0d\x8aq\xba\x8f\xc4S\x16YuW%\
-v\xe1-%\x8f\x96\x85\xf7\x1d\xb2@\x0d \xd1\xb4M\
-\x97\xdb\xb9\xb8xr\x1c\xc7q\x1c\xc7\x18M\xc6\x18\x8a\
-k\xba\x8f\xac<7\x91\xbbn\x04\x05m\xe7A\xec\xc2\
-\x9b\x8d\xce\xc5\x8af\x0e&\xc7\x06\x91[o?\x19\x99\
-[\xa1\x5c<9\x8e\xe38\x8ecXy\x80E\xe0A\
-4fQ\xfcS^\xc2)\xc6\xacP5d\x1d\xbb\x8d\
-\xf4\xcc\x04!N\xeb\x05j\xeb\xf2\x068\xc8\xfa\x04\x5c\
-<9\x8e\xe38\x8ec\x8c#\xb7\xd8]duz\x90\
-<\x0e\xd3\xbd\xac\xba\xab2\x80,L&\xa0\x06\x81\x19\
-T\x83\xca\x04\xd4\x08\x0a,\x7f\x87\x8b'\xc7q\x1c\xc7\
-q2f\x88 Fn\xa2\xf8\xa6\xb8\x96\x93\xc5\x13\x15\
-\x89Z2F\x90X\x1a$\x14\xc9\xb4\x82\x9d{\xc8}\
-g\x0563\xc3\xc5\x93\xe38\x8e\xe3T\x9b\x11B\xf5\
-\xf0\xbbH8\xfd-p\x03\xb9\xef\x8a\xe0\xaakE\xda\
-\x857\x84\xacP\xe7\xa8\x84\xc1\x9b\xe4\xfb\x9bY\xfeQ\
-\x17O\x8e\xe38\x8eSmL<-#\x17\xdd\xaf\x80\
-\xbfC\x16\xa7!\x8a/\x9e\xccjf\x81\xe4\xe7\xc9\xf7\
-\xde\x02O\x91U\xea\xafY\xfeQ\x17O\x8e\xe38\x8e\
-S=\xccU7\x82\x02\xae-0\xfcK\x94e7M\
-y4\x82\xb9\xf0\xce\x80\xc3dl\xa2\x92\x05;\x84*\
-\xe4\x99Q\x967\xc6q\x1c\xc7q\x9c\xec\x88]u\x0f\
-\x80\xdf\x01\xbf\x07\xee\x00\xd7)^\x8c\xd3e8F\xae\
-\xbaw\xc03\xe0%j\xe1\xb2\x9e\xf5\x1fr\xf1\xe48\
-\x8e\xe38\xd5#v\xd5}\x82\x0aa\xfe?Q+\x96\
-<\x8a`f\xc1\x11\x12O\xcf\x91\xbb\xee%\xa1\xeax\
-\xa6\xb8xr\x1c\xc7q\x9cj`M|\x07\x91hz\
-\x94\x8c_#\xd7\xdd4\x12Ue\xe2\x0cY\x9c\x8e\x91\
-P\xfa\x09\xf8\x16U\x1d\xb7\x1aO\x997\x0dv\xf1\xe4\
-8\x8e\xe38\xd5\xc0*p\x8f\xa2L\xba/\x81\x7f@\
-\x19v\xd7)N\x1d\xa7\xabp\x8aJ\x12l\xa3\xc2\x98\
-\xdf\x03\x7f\x04~A\xee\xba\xe3n\xfcQ\x17O\x8e\xe3\
-8\x8eS\x0d\x06\x90p\x9a@\xe2\xe9W\xc0\xff\x8e\x1a\
-\x00\x9bU\xaal\x9c\x02\xbb\xc85\x17\x8b\xa7W(\xeb\
-\xee\xbc\xf5\x8f\xb6\x8f\x8b'\xc7q\x1c\xc7\xe9_L\x14\
-\x0d\xa1\x82\x97w\x93\xf1{T\x96`\x12\xa5\xf9\x97\x09\
-s\xd5\x1d\x01k\xc0\xcf\x04w\xddS\x94]w\xd2\xcd\
-\x13p\xf1\xe48\x8e\xe38\xfdK\xec\xaa\xbb\x89D\xd3\
-\xdf\xa2\x0c\xbb\xdb\x94O8A\xa3\xab\xee9\xf0\x15\xf0\
-\x1f\xc0\x8f\xa8\xb6S\xe6\xedX\xd2\xb8xr\x1c\xc7q\
-\x9c\xfe%v\xd5\xddBYu\xffo`!\xf9^\x19\
-\xb3\xea\xce\x90x\xb2\x92\x04_\x01\xff7r\xdb\x9d\x13\
-\xda\xb4t\x0d\x17O\x8e\xe38\x8e\xd3\xbfL!\xd1t\
-\x1b\xf8\x1c\x05\x86\x8fQ\xbe\xf5\xbf\x8e,NgH4\
-\xfd\x88\xe2\x9b\xbe\x05\x9e W]\xe6Yu\xad(\xdb\
-\x9b\xe78\x8e\xe38\xce\xe5\x99B1N\xbfE\xe2i\
-\x85r\xba\xea\xceQ\x1c\xd3\x11\x12O?\x00\xff\x0b\xb5\
-]Y\xa5\x07\xae\xba\x18\x17O\x8e\xe38\x8e\xd3\xbfL\
-\x01\xf7\x80?\xa0b\x98\xcb\x94s\xed7\xf1t\x80J\
-\x10|\x0f\xfcO\x14(\x0e=p\xd5\xc5\x94\xf1\x0dt\
-\x9c\xcbb\xc5\xe0\xac\x87\xd3(2W\x1f\x00\xfb\xc8g\
-\xde\xd3\x1b\xceq\x1c\xa7\x07X\xe5\xf0\x15\xe0\x0bdq\
-\xba\x89J\x12LP\x9e8's\xd5\x9d\x12\xea8=\
-'\xb8\xear\x9b\xc3]<9\xfd\x8c\x05J\x8e\xa2\xc9\
-d\x06u\xdc\xde@\xe9\xad\xfb\xb8xr\x1c\xa7\xff\x98\
-\x01>E\x95\xc3\x1f\x03\x0f\x91x\x9aE\xf3a-\xbf\
-S\xbb\x12\xcd\x5cu\x7fB\xd5\xc3\x9f\xa09<\x17\x5c\
-<9e\xa6\xd9\x04\x10\x1f\x1bF\x96\xa6I\x94Y\xb2\
-\x82vc\xa3\xc8\xfa\xb4\xd6\xed\x13t\x1c\xc7\xe9!6\
-\xff\xcd\x22\xc1\xf4\xdf\x91\x882+T\xd9Z\xaf\xd4Q\
-=\xa7}\x1a\xe3\x9c~@V'\x17O\x8es\x09\x06\
-\xd05;D\x10E\x93\xc08\xc1%\x17?\xc6c\x22\
-y\xed\x04\x12U\x1b\x94g\xf7\xe58\x8e\xf31\xa6\x91\
-@ZAn\xba/\x90\xb5i\x9er\xb9\xeab\x0e\x81\
-\xd7\xc8U\xf7=j\xb9\xf2\x1em~O\xe8R\xf5\xf0\
-\xcb\xe0\xe2\xc9)\x13\x03\x84\xd8\xa59\xe0\x1a\xdaQ\xcd\
-\xa3\x9d\xd6,\xc157\x9b\xbc\xd6b\x9e\x8c:\xba!\
-\x9fR\xce\xc9\xc4q\x1c\xa7\x19S4\xba\xea>%\xc4\
-9\x8dR\xce\xf9\xee\x08\x89\xa7\xaf\x80oh\x14O\xa7\
-\xe4\x18v\xe1\xe2\xc9\xc9\x93\x8f\xb9\xddj\xa9\xc7\x11d\
-e\x9a\x04\x96\x80;\xa8\xbd\xc0u\x82Kn9z\x1e\
-\xa7\xe3\xc6A\xe2o\x09\xbd\x9cjx\xdc\x93\xe38\xe5\
-\xa5\x96\x0c\x8bs\xfa;\xe0\x11a.\x1c\xcd\xef\xd4\xda\
-\xa6\x9e\x8c\x03\xd4\xa3\xeek$\xa0V\x91\xd7\xa0\xa7e\
-\x09\x9a\xe1\xe2\xc9\xe955\x82\xeb-\x1eq6\xdcX\
-\xeay3w\xdc,\x9a\x1c\x96\x90\x10\x9a\x89\xc68\x1f\
-\xee\xb2\xacEA=y\x8d\xc5@m#K\xd4a\xf6\
-\xff\xaa\xe38NW\x99@s\xe0\x22\xf0\x19\x12M7\
-\xd1\xfc6A9\x1b\xfd\x1e\xa2\x0d\xee\x1bdi\xfa\x0b\
-\xaa\x22\xfe\x0em~{V\x08\xf3\x22\x5c<9\xbdf\
-\x80\x10\xc8\x1d\x0b\xa2I\x82\xbb\xad\xd5\xb0\xaa\xb8\x83\x84\
-8\xa6\x09\x1ac\x9bL\x84\xa5\xadZ\xf63C\x04\xf1\
-\xb4\x1c\xbd\xee\x08\xb7@9\x8eS.&P\xe5\xf0G\
-(\xce\xc9\xb2\xea\xe6\xd1\x5cXFW\xdd!\x8aq\xfa\
-3\xca\xaa\xfb)\xf9\xfa=\x9a\xa7]<9}E\xec\
-bk\xe5z3\xab\xd3djL \xeb\xd1\x12\xc1\xf5\
-\x16?\xb71\xde\xc1\xf9Y\xcd'\x90x\x9aG\x96\xa7\
-StCnu\xf0\xbb\x1d\xa7l4\xbbG/z\x9e\
->\x96\xfe^\xab\xe3\xd0zSr\x95\xe3\xf5\xe8x\xbd\
-\xc5\xf1\xaaP\x8b\xc6\x14\x0a_\xf8\x0d\x12O\xf7Q,\
-\xe8T^'\xd7&u\x14\xfc}\x0e\xec\xa2\x98\xd4\x7f\
-G\x02j-\x19\xbb\xb9\x9d]\x13\x5c<9\x9d\x12\xbb\
-\xe1\xcc\xa2d\xd6\xa4f\xc7c\x0b\xd3$\x8d\xd9p\xd3\
-\x84zL\xf1\xe3$\xd9\x9a\x9f\xc7\x91\x18\xbbG\xe8\xce\
-\xbdJ\xf5&a\xa7\x9aX\x12Ez\x0c796H\
-\xa3 \x8a]\xe91\xe3\x84\xfb\xde\x88\x0b\x1c\x9e\xa5\x8e\
-\x9f$\xc7\xe3l\xa9\xf3\xe8\xf5\xf1\xf1S\x82k\xfd8\
-z\xcd1\x8a}9L\xfd\xfe~\xc7\x12f\xe6P\xc5\
-\xf0\xc7\xc9\xe3-4\xaf\x96\xb1\xf5\xca1r\xd3\xbdF\
-\xf5\x9b\xfe\x8c\x04\xd4;$\x9a\x0aam\x8aq\xf1\xe4\
-d\x81\x95\x0e\x18G7\xf4,\x12=6\x99ND\xc7\
-\xe7\x91\xcbl!y\x8dY\x84\x86\x91\x999\x1e\xa3\xd1\
-\xf3\xac\xc5\xd3\x12\x12O;H89NU0\x17v\
-\xdau\xde*\xc60f\x8e\xb0\xf91j4\xde\xf7\x86\
-e\xb6\x1e\x22\xb1d\x9c!ko\xb3\xe3\xf6\xfax\xb1\
-4\xcb\xf0\x16ZH\xedgw\x91[\xea\x84\xea\x89\xa7\
-\x15\xd4\xaf\xce\xe2\x9c>\x01n\xa0\xb9\xad\x8c\xeb\xfa\x11\
-\xaa\x1e\xfe'BV\x9d\xc59\x1d\xd3x\x9d\x14\x822\
-\xbe\xc9N\xf7I\xbb\xda\x06\xf8\xd0\x1c?@\xa8\xbbd\
-5\x94\xa6\x08.7\x0bX\x9c@\x16\xa4f.\xb9\xbc\
-L\xcb\xe3(\xc0\xf2.\x12N\x93x\xcd'\xa7\xdc\xc4\
-\xf7\xac\xdd\x9b\xf1\xf1\x81\xe8{c4\xd6=\xbb\xe8\xf9\
-D\xea\xef\xd8\xfd\xbb\x14\x1d\x1b\xa0\xf1\xbe7\xce\x09\x19\
-\xaeG\xd1\xf13B\x81\xc3\xf8\xf8i\xf4\xfax\xb1\xdc\
-G\xbd\xcc\xd6\x81\xcd\xe4\xeb}\x94u5\x98\xfc>\xcb\
-\xbeJ\xbb\xf6\xea\xd18\x8f\x1e\xcb\x88\xcd\xc7\xe3\xc85\
-gqN\x9f\xa2\xb9l>\xbfSk\x0b\xfb,\xce\x90\
-\x10~\x86\xc4\xd3\x7fPPW]\x8c\x8b'\xa7\x19f\
-\xd6\x1fF;\xc9)\x1a\x85\xce\x00\xbaQ\xad\xbeR\x9c\
-)7\x1d\xfdL\xb3\xe33\xc9\xf7\xf2\xbc\xf6F\x92\xf3\
-X&\x04\xa2;NY\x89\xddp\x13\xe8\xfe\x9a\xa6\xd1\
-u\x1e\xbb\xc5\xc7\x08\xf7f\x9cd\x91>f_\xc7\xc4\
-\xf7\xb0ai\xf2\xe9\xd7\x9aK?m\x0d9Gs\xcb\
-8\x8d\x16\xa6s$\xa6\x8eh\xb4$\x1d\xa3r$;\
-\x04\xc1u\x9c|\xbdAc\xd1\xc4\xd3hX[\x0f\xb3\
-f\xed&c\x87\xf2Y\xaab\xeb\xfeM\xe0\x01!@\
-|\x99\xf2U\x0e\x07}Fkh\x03\xfb\x0c\x05\x87?\
-G\x22\xb9\x90\xae\xba\x18\x17ON3\xecF\x1dC\xe6\
-a+Fi\x0c#\x97\xd7}t#\x0fF\xc3&\xdd\
-a>l\xcc\x1b\x8f<\xaf=\xebuw\x8a\x8b'\xa7\
-\xfcX\xf1\xd81\xb4\xa1\xb9\x8e\xeeY\x13Jc\xc8\xd2\
-z-\xf9\xde\x18\xe1\xde\x1c\xa0\xf1\xfem6b\xe2{\
-\xb8\xd9\xf14\xc3\x84\x0c[\xa3\x9e\x9c\xc3\x19\x8dq\x86\
-f\x85H\x1f?Cb\xc9\xe2\x9d\xec5\x07\xa8\xd4\xc8\
-\x0e\xb2V\x1d\xd2(\x96\x0e\x93\xefm\x22\x97\xdf*J\
-\x81\xdf\xa3|\xe2i\x10Y\x04\xe7\x90{\xce\xc4\xd3\x03\
-\xc2F\xb5l\x9c\xa0\xcf\xe3{$\x9cL<\xbd#\x08\
-\xe1\xc2\xe2\xe2\xa9\x1a43\xe9\xc7f\xfc\xb4{.6\
-\xdf\xdfAB\xe9V\xf4\xfbF\x08\xe5\xff\x1ft\xff\xf4\
-3g\x18M8\x03H<\xc5;c3\xed;NQ\
-\x88\xb3\xab\xd2\xf7o\x8d\x90\x881\x85\x04\xd2]t\xcf\
-\xce\x11\xee\xe5\x9b\xd1\xf1^-\xb45\x9a\x0b\xb0\xac\xb0\
-\x9eg\xe9\xb1G\xa3k\xcf\x5c~\x96\xadk\xc2*\xce\
-\xf0\xb2\x11\xbb\xf7\xf2&\xfe\xdc\xc7\x08\xc2\xe9.\xda\xb8\
-~\x82\xca\x14\x94\x0d{\xaf\xf7Q\x90\xf8w(@\xfc\
-Y\xf2u)2\x9f]<U\x83\xd8\xaco&\xfdi\
-4\xa9\x9a)8\x1e\xb1\x19\x7f\x11\xc52\xc4\xfe\xf4!\
-t\x13\x97-\x1d\xd6\x18\x22\xd4\x82\x8a\x0bf\xee\xa1\xdd\
-l\xee\xd5k\x1d'\xc1\xac6\xe6\xfe\x8a\xef\xdd\xf1\xe8\
-\x98\x05q/\xa0{v\x91P\x03m\x04-\xbc\xd3\x94\
-\xb3\xeeO+\xcc\xe2\x06\x8d\xb5\xdff\x08\xae\xbde$\
-\x1cw\x90\xe0x\x84\x16\xe8]\xc2\xbdn\xae<s\x0b\
-\x1e&\xc7\xf3\x16P\x03\x84\xcf\xd8\xfa\xd5}\x86\xb2\xeb\
-\xee\xf3a<Z\x198#\xbc\xd7V\x043\x0e\x0e/\
-M\xb1b\x17O\xd5 \xce\xaeY&\x98\xef\xe7\x09)\
-\xaf\xf1\x88M\xf6&\xae\xe2x\x86\x01B\x8d\xa62\xd2\
-\xac`\xe6\x0a\xbay\xcfq\xf1\xe4\x14\x87\xb8\xa8\xec\x1c\
-\xbao\xaf#q4\x97\x8cX0M\x11\xeeY+5\
-`\xee\xf4f\x95\xf7\xcb\x8c\x89'\xfb\xff\xceht\xfd\
-\x9d!\xf7\x8f\x8dm\xe4\xc2\xdbH\x1em\xac\xa2\x14\xf9\
-\xb7\xc9\xf7\x0a\xd1\xfe\x83FW\xddm\xe0K\xd4z\xe5\
-SB\xb3\xdf\xb2q\x8e>\x87\xb7\xa8$\x81\x8d\xe7\x04\
-\xb7k)p\xf1T~,\xe3\xcd\xe2\x17\xd2.\xb98\
-\xbbf\x02\xb9\xdf\xee\x22w\x5c\x9c9\x13\x8f~\xc7\xde\
-\x17s\xdf\xcd\xa3\xf7\xc2\xea\xc98N\xaf\xb1\xe0j\x13\
-;v\xff\x8e\x10\x126\xac\xbc\xc6\x1d$\xa0\x9a\xdd\xbb\
-e\xecc\xd6.q\xc6\xefe8\x22\xb8\xf3\xde\x13\xdc\
-y/\x91Un\x1c\xcd\x91V\x99\xdb\xeaM\x99\x10K\
-\xd7\xab\xea\x06\xb1{v\x1c\xcdM7\x90\x8b\xee\x0b\xe0\
-\xb7h\xfe.\x1b\xe6\xaa;B\xef\xfd3\xe0G$\x9c\
-^P\xc2r1.\x9e\xca\xcf$\xa1n\xd2$\xc1\xcc\
-\x1b\x9b\xf5\xe3\xec\x99y\xb4C] d\xcd\x98+\xaf\
-\x8a\x81\xd3\xa3\x84\xcc\xbb}\xb4\x13u\x9c^3B\xb8\
-\x8fg\x08\xf7\xef\x14r\xc7\xcd\x11j\xa4-&\xc7\xd2\
-.\xf82\xf61\xeb%\xb1\x9b\xafN\x08c\x98A\xd6\
-\xf8O\x09\x96\xa7\x0dd!\xb1\xf1>\x1a\xdd>G\x9b\
-\xbf\x97\x91\xab\xees\xe4\xaa{@9\xad\xfd\xd6\xe0\xf7\
-\x00\xbd\xaf?\xa1\x18\xa7oP!\xcc\xc2\x96#\xb8\x08\
-\x17O\xe5g\x02\xedB\xef\xa3\x9b\xcd\x5cq\xb1K.\
-\xce|\x8b\x8b\xdfYV\x9c\x8d2flt\xca\x08Z\
-|\x96\xd1\x8d]\xa5\x9d\xbbS\x1c\x86\x91\xe5\xe8>\xa1\
-7\xd9\x1c\x8d.\xb98{.\xbew\xedy?\xb9\xe4\
-\xba\x81\xb9\xf7\xac\x0c\xcb$r\xe7]#d\xe9Y<\
-\x8e\xb9\x96^\x13\xaa^\x9f\xd2}\xf14\x88\xe6\xf4y\
-\xe4%0W\xdd#t=\x94Q<\x9d\xa3\xf7v\x13\
-\xbd\xa7?\xa1f\xbf\x7f&\xbc\xdf\xa5\xc3\xc5S\xf9\xb1\
-`P\xcb\xc2\xb0x\xa6\xb8 \xa5\x7f\xce\xad\x89-O\
-o\xa8\xa6\xf5\xcd\xe9\x1d\xb1;\xdd*\xeb\x0f#\x91t\
-\x0f\x05\x04\xdf#\xb8\xe1\x16\xa3\xc72\xc6\xb8\x14\x89\xb8\
-xh\xabM\xd2!\xc1\xb5\xf7\x02\xc5\xe2,\xa09\xd4\
-Z9\xc51Uq]\xa9N0w\x9dy\x07n!\
-K\xd8g\xc0\xaf\x91\xa8.\x1b\xe6\xaa;F\x1b\xd3W\
-H\x84\xfe\x08\xfc\x15\x89\xa8\xd2\xe2\x8bj\xf9\xb1\x8b\xf3\
- y4\xb3\xef\x18\xfa|\xbdr\xf6\xc5\x98xZA\
-\xae\x10\xb7<9\xdd$v\xcb\xcc\x10j2\xd9\xe6\xe7\
-6\xba\x16\xcd%7\x85\xac\x0d>W\xf7\x06\xb3\xce\xd7\
-\xd0\xe70\x88>\xa79\xf4\x19=B\xa9\xf4\xe6\xce{\
-\x97\x8c\x8d\x0e\xfe\xa6\xc5m\x99\x88~\x84\x04\xd3\x97H\
-@\x951\xab9v\xd5m\x11\xea8}\x0f\xfc@\x1f\
-\x84G\xf8\x0dY~\xac\x80\xdc>2A\xbbx\xba\x1a\
-^m\xdc\xe9%\x03\x84^\x8f7\xd0\x02\xf9%\xb2,\
-X,\xe2\x14\x8d\xeet+U\xe0t\x9f\xd8\xb57\x88\
-\x04\xecuB\xd0\xf6{d\xa1~\x85\xdcy\xbf\xa0y\
-\xb7\x13\xf1T#dT\xce#\xc1\xf4w\xc0\xaf\x08\xb1\
-me\xc3\xfa\x1an\xa2`\xf0\xbf\x02\xff\x82\x5cu&\
->K\x8d\xdf\x90\xe5\xc7\xfaAm\x12*\xe9n\xd3X\
-\xd1\xd7b\x22\x5cL}\xc8\x08\xda\xd9\xcfS\xdeJ\xbd\
-N1\x89]t\x96\xb01\x81,\x1a\xcb\xc8\xd2\xf4k\
-\xe0\xf7(\x18\xd8\x82\xc4\xfd\x1a\xcc\x8fV\xae\xbd%\xe4\
-J;@\xae<\xab}g\xbd\xf5\xac\xae\x945\xb1\xb5\
-\xb2\x09\x17\xf5\xd1\xb3\xach\x8b\xbb\x9c%\xb4^\xb1z\
-Ne\xc3\xfe\xef\x13$4_\xa1\xa0\xf0\xef\x81o\x91\
-\xf5\xa9/p\xf1T~\x0e\x91\xd9\xb8\x8e\x84\x94\x15\x1f\
-\xbb\xc6\x87i\xcc\x8bxFN\x1a3\xd3O\x12\xacu\
-\x8e\xd3)fM\x18&$u\xd80\xf1t\x1d\x09\xa8\
-\x15B\x8a\xbc\xdf\x9f\xc5\xc4\xe6\x89\x01\xf4y\x0d\x11\x12\
-rn!\xa1\xf3\x06Y\xa3V\x09qS\xadJ\x9fX\
-i\x0a\xeb\x1fz7\x19\x8f\x93\xc72\x06\x86\x9b\xb5\xc9\
-\xda\xe6\xc4mW~\xa43\xeb\x5c\xe1\xf0\x85\xa2\xfcX\
-\xdd\x8c]B\xff\xa6\x9f\xd1\x0e\xe6\x16\x8a\xa1x\x80n\
-~\xdb)9\x81X<\x8d\xe2\xef\x8f\x93\x0d\xb68\x8e\
-!\x8b\xc2\x03\xe4\x9e{D\x10O\xe6\xa23\xe1\x1e[\
-=\x9cb1D\xa8\x0dgqP7\xd0<\xfb\x08\xd5\
-\x8b\xfa&\x19\xe7H(\x5cT7.v\xd5\xcd!\xc1\
-\xf4\x1bT\x96\xe06\xe5\x14O\x10\x5cuk(\xb6\xe9\
-_\x80\xff \xf4 \xec\x1b\x5c<\x95\x1f\xab\x9e\x0b\xca\
-\x04\xd9@\xbb\xd8\xf7\x047\xde\x09\xc1<<AHo\
-\x1e\x8aFU1\xf1tFp\x9bX\xd3R+\x90\xe7\
-8\x17\x11\x17\xa5\xb5{\xcb\x9aO[2\xc2\x17hq\
-\xfc\x0cY\x81\x17\x92\xef;\xe5 .\xc8\x19\xbb\xf3\x16\
-\x08\xed_\x86\x90\xf5\xe5\x0cY\xa0\x86\xd1uqBh\
-jlX\xf5\xf0\x05\xc2\x06\xf71\x12b\x8b\x84>|\
-e\xc0\xfa\x01\x9e\xa15\xe7%\xc1U\xf7=\x8aw\xea\
-;\xaa\xbch\xf6#\x16<\x0e\xa1\xd5\x88\xd5,y\x83\
-RCW\x08\xe9\xcfshr\x9f\xa5\xba\xb1P\xad\xfa\
-\xdc\xc5\x8dF\x1d\xa7\x15fa2+\x93\xb9\xc7\xadL\
-\x88\xb5C\xba\x93\x8c%B@\xb8S~l\xfe\xa8#\
-\xebQ\x0d}\xfeO\x90\x80x\x86\xacR\xefh\xcc0\
-\x1bF\xd7\xc5C$\x98>C\x22j\x91\xf2eW\x9e\
-\x22\x81x\x88\xfe\xdf?\xa3:N?\xd1\xfd\xbaX\xb9\
-Q\xa6\x0f\xc8\xf98V\xb6\xc0.f\x13M\xaf\x90\xcf\
-y\x1e\xedp>A\x19\x1d\xb7\xd0\x0eh6\x8f\x93-\
-\x08fy\x1a&4V]A7\xfd\x19.\x9e\x9c\x8f\
-c\xc2i\x1a-\x80\x9f\x10:\xde\xdfF\xb1M\x93\x04\
-\xcbf\xd5\xad\xbd\xfdD\xec\xce\xbb\x87\xc4\xf2\xa7\xc8\xe2\
-bB\xe8'\x82;\xcb\x18F\xd7\xc5\x17\xc0\xef\xd0u\
-r+\xf9\x99\xb2]\x1f\xe6\x9e\xdcE\x82\xf1\x8f\xc0?\
-R\xe2\x02\x98\x97\xa1L\x1f\x90\xf3q\xe2\xec\x8ec\xe4\
-\xc6\x83\x90.:\x8e.\xe6\x03BE\xdd3\x82\x80\xb0\
-\xaa\xe3\xe6\x82\xa8\x825*\x8e3\x99B\x93\xd7\x0dB\
-\x9d\x12\xc7i\x86e\xcfYL\xd3,\xbav\x1e%\xe3\
-S\x82xZ\xce\xe9\x1c\x9d\xee\x93v\xe7- \x8bR\
-\x8d\xd0\xd5\xc1\xb2\x9c\xe3\xf5v\x0e]#\xe6\xaa\xb3J\
-\xf2e\x89u:'\xb8\xebvP\xb8\xc8:\xb2\xb8\xfd\
-\x8c6\xeb}\x8d\x8b\xa7j`\xa9\xb4ud\x89\xaa#\
-A\xb5\x8eD\xd5\x1a\x8dn\x86\xb8\xbeL\x95\xb0~R\
-\xf7\xd1nj+\xd7\xb3q\x8aJ\x0d-~K\xc8J\
-y3\x1a+h\xf1\xb4VI^7\xacz\x0c\xa0\xeb\
-\xe3\x1e\x12T\xf3HD\xc7\xcdo'\x91\xab\xee\x13\x82\
-h*\xd3|{F\x88\xe5\xb2r\x04O\x90p\xda\xcc\
-\xed\xacz\x88\x8b\xa7jp\x86\x04\x93\xd5\x1f\xd9D\x17\
-\xfbj4>E\xfews-\x98)\xbaJL\xa2\xc5\
-\xef\x01\x12N\xaf\xf2=\x1d\xa7\xa0\xd4\x90\xa5\xe9.\xc1\
-\xd2\xf4\x08]7\xd6{.n\xc6\xedT\x8b\x01$\x98\
-\xc6\xd1|r\x07\xcd\xb9\xb1\x0bk\x84PBf\x8eP\
-\x94\xb3,\x98\xab\xee\x00\xcd\x93\xdf\xa28\xa7\xa7\xf4Y\
-I\x82V\xb8x\xaa\x06\xb1;\xef\x84p\x13[\x80\xf9\
-^\xf2h\x22\xcb\x82\xc8\xa7it\xe7\xf5;c\xc8|\
-~\x0b\x05>\xba\xd5\xc0\x893\xe9,\x13s\x92\xd0w\
-\xecs$\x9c\x1e\x22K\x83\xe3\xd4\xd0\xb52Np\xe9\
-Z\xa8\x841\x18\xbd\xa6\x8cs\xeb>\x0a\x82_'\xb8\
-\xe9~H\x8e\xed]\xf0s}\x83\x8b\xa7j\xb3\x8f\x5c\
-vf~5k\xcb2\xa1\x16\x8d=_\xcc\xe9\x1c{\
-I\xba\xcf\x9d\x8b'\xc7\x9a\xf7\x8e Qm\xf5\xd3\x1e\
- \xf7\xee}t\x8f\x94\xb1\x85\x86\xd3}\xac\x9eS\x9d\
-\xc6\xf5\xd6J\xc7\x94\xb5\xae\xd7{\x82`\xfa\x1eY\x9c\
-\xd6\x08\x1b\xf1\xbe\xc7\xc5S\xb5\xb1~x\x9b\xc8\xd4\xfa\
-\x12\x99\x90\xefD\xe3!\x12\x11U\x12O$\x8f\xde$\
-\xd8\xb1L\xba\x09t?\xfc\x06\xb5T\xb9\x91\x8c\xeb\x04\
-\xeb\xac\xe3\xa4\xb1@\xf1\x01$\xa0b\xca\x5c\x14\xf5=\
-\x12N\xff\x84\xd6\x8d\x97(\xfc\xe3\x8c\xc6zV}\x8b\
-\x8b\xa7jc\x056\xad\x8d\xc0\x0e2\xc3\xee\xa3\xb4\xd3\
-m\x82;\xef\x84\xd0#\xcf\x8a\x00\x8eQN\x93s+\
-\xac\xcf\xdd\x00\x12OV\xfd\xf94\x19^0\xb3\x1a\xd8\
-\xa2V#\x94\xaeXA\xa2\xe9W\xa8R\xf8B2\xe6\
-\xf29E\xa7D\x94Y$\xc5\xecE\xe3\xa7d\xfc\x88\
-\x5cu\x1bT\xac\xac\x8b\x8b'\xc78C\x02\xea\x1c\xed\
- b\x8b\xd4+\xd4\x9fh\x0e\x05B\xce\x13\x16\x94\x85\
-\xde\x9fj\xd7\xb0\x92\x0d\x16\x10\xbc\x80\x5c26aT\
-jr\xa80\x83\x84\x8d\xc2}$\x98~M\xc8\xa8[\
-F\xa2\xba\x9f6\x0e\x8e\xf31\xd6\x81_PV\xdd\xd7\
-H8\xad\xa2\xb9\xf1\xa8\xf5\x8f\xf5'.\x9e\x1c#\xee\
-\x86}\x84D\xd3\x08\xea \xfe=\x12L\xd6+\xefv\
-\xf2\xba\x09\xfaO<Y\x96\xe1\x0crU\xae\xa0\x9d\xd5\
-).\x9e\xaa\x82\xd5\xec\x19G\xe2\xe9\xef\x81\xff\x83\x90\
-I7F\xa8\xe1\xe38Ua\x0d\x89\xa6\x7fF\xeb\xc2\
-\x0b\x82\xab\xaerVy\x17O\x8ea\xd9x\xe6\xa2\xb3\
-\x02\x91\xd6/\xef-r\xe3m\xa3\xc0\xf2c\x82\xcbo\
-\x0ae\xe6Y\x89\x83A\xcaY`\xd3L\xeb\xd6wj\
-\x0eY\x19N\xa8H\x06I\x85\x89\xfb<Z{\x95e\
-B3\xdf\x07\xf9\x9d\x9a\xe3\xe4\xc6\x1e\x0a\xe1\xd8%\x04\
-\x87\x7f\x8bb\x9e\xdeS\xe1B\xc2.\x9e\x9c\x8fqJ\
-(\xb0\xb9J\xb0J\xbdG;\x0fkji\xed(\xe2\
-\xa6\xc3e\xc6\x82\xc7\x97\xd0\xc4\xf1.\xdf\xd3q\xba\x8c\
-\xc5\xbbM!\xb1\xf4\x18\x95!x\x88\x02\xc3\x1d\xa7\x8a\
-\xbcC\xa5\x08~\x06\xbe\xa1\xe2\xae\xba\x98\xb2/pN\
-\xf79%\xf4\xcc;D7\xd3\x08\xaa\x834\x8b\xaa)\
-\xff\x03\xa1\x92\xee\x04\xa1%A\x99\x89\xcb\x16\xbc\xc7\xb3\
-\xa9\xfa\x9d\x11B\x9c\xdbg\xc0\x7f\x03\xfe;\xa1'\x9d\
-\xe3T\x91u$\x9a\xfe'r\xd5\xc5Yu\x95s\xd5\
-\xc5\x94}\x81s\xbaO\x9dp\xa3\x9c$\xc7j\xc8\x5c\
-\xbb\x85\xdcx\xf3h\xe1\xb1&\xc3V`\xb3\xccE\xe0\
-F\xd1\xff\xb1\x8c\x02\xe6]<\xf5\x1f\x16\xd74\x8eJ\
-\x0eX@\xf8\x17\xa8\x08\xe6]\xca\xe9~v\x9cN8\
-$T\x0f\x7f\x86\xacN\x7f%d\xd5U\xd6U\x17\xe3\
-\xe2\xc9i\x17+\xcf\xbf\x8d\xb2/\x86\x90\x85\xc6z{\
-\xad\xa0\x05\xe9\x1a\xe5\x14Oc\xc8\xf2\xb4\x9c<\x96\xf1\
-\x7fp.f\x8ap\x8d\xdeG\xae\xe7\x07\xa8\x9e\xd3\xb5\
-\xfcN\xcbqre\x17\xc5\xb8\xbeAqN\xcf\x91\xb5\
-i\x17\xcd\xf9\x0e.\x9e\x9c\xf6\x88\xfb\xe4\x9d\xa2\xf4\xd5\
-M$\xa2\xee\xa2\xc5\xe7A\xf2\xbai\xcaY\x0b\xc7,\
-O+x\xc1\xcc~e\x1ae\x90Z|\xd3\x17\xc9\x98\
- \x94\xacp\x9c\xaa\xb1\x83\xe2Y\xff\x8a\xc4\xd33B\
-\xf9\x9a\xf3\x0b~\xaeR\xb8xr\xda\xc5\xdcyud\
-}\xb2\xcc;{\xdcC\xbb\x14k\x01cU\x98\xc7)\
-\x87;o\x18-\xa23\xe8\x5c\xab\xd6$\xb9_\x99D\
-\x9f\xe9\x0c\xa1?\xddcdu\xba\x8b,N\xfdP\xd0\
-0K\xce\x09\xa5Lb\xec\xd8\xf9\x05\xcf\xad\xfcG\xfc\
-\x9e\xd6\xa2c\xcd\x8e\xc7?S\xd6\xcc\xdd\xb2q\x8c\x02\
-\xc0\x8fP\x5c\xd3\xcf\xa8,\xc1\x13\x14\xf7d5\x00\x9d\
-\x04\x17ON\xa7\xd4\x09.\xbc:\x9a\xe8\xf6\x91o|\
-\x1d\xf5<\xba\x86\x02q\xe7\x91\x1b\xecz2\x8a,\x9e\
-\xac`\xa6Y!\xbc\xa6O\x7f0\x8f\xb2\xe9>E\xae\
-\xba{\xc9XF\x16R_\xa8?\xe4\x14-\xae\xe9\x9e\
-e\xc7\x1f\x19\xa7\xe8\x1e\xb7\x82\xa3F\xad\xc5\xf1\x81\xe8\
-\xb8\x8d\x1a~\xef\xf5\x82\x034g\xbfC\x95\xc3\xbfG\
-\x81\xe2\xab\xc8\xab\x90n-Sy\x5c<9\x9d\x12\xbb\
-\xf0\x8e\x08\x96\xa6\x17h\xd7b\xe9\xfeV\x5c\xf3\x01\xa1\
-\x82\xf7\xcc\x87\xbf\xae0X\xa1\xc4\xc9\xe4\xd1\xef\x95\xfe\
-`\x9e\x90Mw\x87 \xe4G\xd1B\xee\xe2\xe9C\xec\
-\xde\x8e\x03\x85\xeb\xe8^?H\x1e\xe3\xe7\xf6x\x8c\xac\
-\xb6\x1346\xd9\x1eH\x8eM\xd0\xb8\x81\x1a\x8a^?\
-\x11\x1ds\xf1\xd4}\x0e\xd1f\xf79\x8d\xe2\xe9\x00\xcd\
-\xef.\x9eR\xf8\x82\xe0d\x81\xb9\xf0 4\x85<@\
-\x13\xee\x0er\xeb\x1d$\xcfw\xa3\xe7\xb7h,\xb09\
-\x9c\x8c\x22L\x96\xd6\x10\xf6\x14\x9d\xdf4\x12|V\x1c\
-\xb4\x12\xcd/\xfb\x04+x:\x8bZ\xad|\x86\xea7\
-]#d\x8a\xf6\xbb\xab.v\xa9Y\xd9\x91C\x82\x8b\
-\xcd\x04\xd2!\xa1\xae\x9bq\x18\x0d\xa3NcV\xd6a\
-\x93\xafO\x08\x15\xd9\xe3\x98\xc1\x81\xe4X\xda\x1d>\x98\
-\x1c\xb3\xefM&c\x8c07\xc4\xc3\x1a\xeeZi\x14\
-;\xde\xef\x9feV\x9c\x12\xfa\x9b\xbeA\xa2\xe9[\x14\
-\xeb\xf4\x0aeS\xfb<\xd7\x02\x17ON\xb70\x8b\x94\
-=\x87P\xad|\x15\x05\x99\xdfFq&\x16kbB\
-\xaa\x08\xe2\xc9\xdcvud![ \x14\xcc\xdc\xc5'\
-\x9521\x87\xe2\x9a\x1e\x12b\x9c\xae\xa3\xcfu\x8cj\
-X\x9bL4\x1d#7\xcc{\xe4\xa29\x8c\x8eoD\
-\xc7c\xf1d\x0bl\xfa\x9a\x8f\x8f7{~F\xf3\x0d\
-\xd1\x00A\xec\xb4:nV_+\x5c\x1a\x8f\xe9\xe4\xd1\
-\xe2&G\x90\xa5\xca\xbe\xef\xe2\xe9r\x9c\x106\xb4O\
-\x91p\xfaW$\x9c\xd6\xf1\x18\xa7\x0bq\xf1\xe4t\x0b\
-\x13OV\xa1|\x0f\x89\xa6Q$\x9cf\x90x\xfa\x9b\
-\xe4\xb5\xb6c,J \xb9\xb9\x0b\xacv\x95\xb5\xec\x18\
-@\x0b\x8d\xb7k)\x0fsH0\xfdw\x14\xe7t\x93\
-\x10s7@5\xc4\x93\x15\xba\xddG\xe2\xe89\xca\xa2\
-\xda!\xb8\xd9^&\xc7\x9f\xd3X\x00\xb1\x1e\x0dZ\x1c\
-o5j\xd1\x88\xf9\xd8\xf1a\x82x\xb2\xfbo)\x19\
-\x8b\xc9\x98!\xb8\xf8\xe6\x08\xee@\xe7r\x1c#\xe1\xb4\
-\x8e\xae\x05\x13O\xbbxf\xddGq\xf1\xe4t\x13\x9b\
-@\xcf\x09\xbb\xd6#\xc2M{\x86v\x8a\xc3h\x07|\
-\x03-j\x0bh\x12\x9c$\xbf,7\x9b\xc4\x07\x93s\
-\x5cF12\x10,hNq\x89-\x17\x0f\x08-\x84\
-n\xa0\x85\xb6\x9f\x92\x00\x9a\xb9\xe4\x0e\x08.\xe6\x13t\
-\xbf\x99\x0b}\x15\xb9i^#\xd1d\xee\xb6\xd5\xe4\xd8\
-\x1b\xf2_8\x07\x09\xee;+\xc6\xbb\x81\xe2)\xe7\x92\
-1Ep\x0bZu\xf8E\xc2\xbc1\x82>g{\xcd\
-Ht\xbc\x0a\x82\xb9\x19f\x19<F\x16\xa6'h3\
-\xfb5\x12P\x9bT\xbc\xed\xcaeq\xf1\xe4\xf4\x9a\xd8\
-\x9d\xb7\x81\xcc\xc5g\xe8\xa6\xbd\x85\xacQ\xb7\xd0\x22g\
-&\xfc<\xa9\xa1\xc9x\x05ee\x1d\xa0\x9d\x9aSl\
-&\xd05t\x03e\xd7\x99kx\x8e\xd0\xc0\xba_0\
-\xab\xd2\x11\x12\x19\xef\x92\xb1E\x10M\x9b\xe8~\xdb \
-4\xf8\xde!d\xc5\x99\xc0\xda\xa3\x18\xc1\xc1\xf1<a\
-\xa2p\x07\xdd{q\xa9\x13\x8b}2\x0b\xd5\x1c\xb2H\
-\x99{o\x1e\x09\xaa\x85\xe4\xfbST;\x08\xdd\x5cu\
-;H8\xfd)\x19O\x91p\xaet\xcb\x95\xab\xe0\xe2\
-\xc9\xe95\xe7\x04w\x9e\xb5}\xd9@\x15m\xd7\x08\xe5\
-\xff\xad\xbb}\x11\x98\x22\x88'\x9b\xbc\x9dbc\xe2\xe9\
-3\x1a\xc5\xd3\x04\xfd\xe7\xaa3\xf1t\x80b\x96\xcc%\
-\xf7\x16\x89\xa8\xf5d\xac%\xe3\x88`\xa9\x8a\xddq\x16\
-<^\x04\xf1\x14\xcf\x13\x87H\xd8\xd9\xe76\x10=\xb7\
-1\x8a\xee\xd3I$\x98\xcc\xc5w\x0bY\x8c\xef\xa2\xff\
-\xcb\x84V\x95\xc5\x935:\xff\x05\x09\xa7\xff/\x12\xda\
-\x16\xa7\xe6\x5c\x02\x17ON\x1e\xd8\x84}\x82v\xba&\
-\xa2\xea\x84\xf8\x8b]$\xa4\x96\x08\x198q\x00i\xaf\
-\xae\xddZ\xf2\xb7\xe7\x91Kq\x16\xaf6^T\x86\x08\
-\xd6\x88\xeb(\xbe\xe9KT\xd3i\x99\xf2\x97\x9c\x88\xfb\
-L\x1e\xa2{g\x97\xe0\xd2\xdaD\xae\xb7\xb7\xc8\x8a\xf0\
-\x1e-\x8a\x9b\xa9Q\x96\x052-\xec.b\x98\x90\xc5\
-k\xef\xcb\x06\xfa\xff\xdf!W\xa4\xc5K-\x10\x82\xce\
-'i,\xdc\xdbO\xa2\xda0\xa1|\x86D\xf4\x8f\xc9\
-\xf8\x0b\xb28y\xbf\xba6(\xf3D\xe2\x94\x1f\x13P\
-\xf1\x04\xb9\x8d&\xfd\xd7(uv\x990\xe9]C;\
-\xc9\x11z{\xedZ\x9f\xbb%\xbcUK\x91\x19\x22\xb8\
-kn\xa2\x18\xa7/\xd053O\xf9\xad\x0dfa:\
-&\xdc#/\x910\xb0\xb1A\x10T\x07\x84\xb2\x01\xf6\
-X\x04\xabR7\xb0\xf7&.\xbb\xb0\x85\xde\xa7\x97\xe8\
-\x9a\x98!4.\xb7F\xd07\x08sL?\xc5\xc1\xc5\
-\xc4\xd7\xcd\x1bT\xbf\xe9\x9f\x91\xe5\xe95\x9e9\xdc\x16\
-.\x9e\x9c<\x89M\xf3\x16\xaf1\x80\x5c\x0eV[\xc9\
-\xdcewP\xaa\xf9(\x9a\xe8z\x89\xf5\xb9;\xc3\x9b\
-\x04\x17\x99a$\x9e\x16\x91`2\xf1\xb4@h\xf9Q\
-f\xec~\xd9G\xa2\xe0\x17\x94!\xf5\x13\xb2 <E\
-\xc2\xe9<\x1a\xf5\xe8\xd1\x9e\xf7#\xe6r<!4,\
-O\xbb\xf9\xc6\x09\xd6&\xbb6\x0e\x92\x9f\x1bC\xd7I\
-?b1c\xfbH<}\x0b\xfc\xdf\xc8\x0au\x8a\x8b\
-\xa7\xb6p\xf1\xe4\xe4M3\xd3\xbcM\x84Vh\xef\x0c\
-\x99\xe2\xcd\x1c\xbf\x8eD\x95\xed\x22\xe3z/Y/\x90\
-\x966=N\xd8\xbd\xce'\xc3vs'-\x7f\xda\xe9\
-6\xe6\xaa\x1bA\xd6\x84O\x92\xf1%\x12\xdcS\x94O\
-\xec\xc6\xee9\x8be\xdaG\x82\xc0\xe2\x97^\xa1M\xc6\
-\x93\xe4\xf9[du\xaar\xd7\xfbf\xe5\x14bN\x08\
-eS\x86\xd0\xbd}\x80\x5c\x9d\xd6\x11!v\xe3\xc5\xb5\
-\xa5\xca\xec\xce\xb3\xda^\xebH<\xbd#X&\x9d6\
-q\xf1\xe4\x14\x91\xd8\x04\x0f\xda\x19m\xa1\x9b\xff5\xea\
-\xf4}\x07-\x92\x0f\x085_\xac\xe2p\xd6X\xb5\xf1\
-3BJ\xf42!c\xc9\xc5S~\xc4\xae\xba{\xc0\
-o\x81\xdf\xa1x\xa7\x1b\x94O8A\xa3\x9b\xc52\xcc\
-L0=%\x04\x83o\x12\xb2\xe7\xbcp\xeb\xc711\
-z\x8e\x04\xd31z_\x7f\xa1\xb1~\x94\x05\x9b\xdf$\
-tA(3\x87\xc8R\xf9\x0c\xcd\x9f\xdb\xf4\xaf\x05\xb2\
-g\xb8xr\x8a\x88\x99\xdf\xcd\x04\xbfE\x08\xdc\xb6@\
-\xcf\x87h\x07iU\x8a\xad\xa8^7\xb0b\x99\x10\xc4\
-\x93\xb9\x0em'\xeb\xe4\x83}\xee\x8b(\xa3\xea7\xc0\
-\xff@\xe26\xfe\xdc\xca\x84\xc5\x02\x1e \x81\xf4\x12\x89\
-\xa6\x1fQ\xbc\xca\xb7\x84\x0a\xd0i\xd7\x9c\xd3\x1a\xb3h\
-[-\xacuBaM\xb30\xddF\x22\xfc.\x12\xa3\
-SHD\x95\xd9\xf2tD\xc8\xc2|\x83\xc4SY\x92\
-\x06\x0a\x8b\x8b'\xa7\xa8\xd4\xa3\xc7\xf3\xe8y\x1dM~\
-/\xd0\xa2i}\x99\xac\xf1\xf0,\x9a\x0c\xado\x96-\
-\xa0\x9dL~\xf6\xb3\xd6{k\x0e-\xce\x16\x94\xea\xf4\
-\x16\xebg6\x88D\xec#TA\xfcK\xb4\xf0\x951\
-\xa8?\xae\xbf\xb3\x85J\x0a\xac\x13\xb2\xe7\xde\x22\xcb\xd3\
-K$\xa8\xdc\xe5\xd2\x1eq\x88\xc0Yt\xcc2\x18k\
-H4\xed W\xe9&\xb2\xd6\x98ej\x89p\xed\x95\
-E\x98\x0f\x13\xe2G\xd7\x92\xc7%\xf4\xbfY}0\x17\
-\xdeW\xc4\xc5\x93S&bw\xdej\xf2\xb8\x86\x84\xd4\
-\xa7\xc8\x85\x11g\xcfL\x90}\x06\x8dU3^B\x8b\
-\x5c\x19\xddBeg\x80P=z\x05\xf8\x1c\xf8\x07\xe4\
-\xc6\xbdN\xf9\x84\x13H<\xad\x13Z\xa4<A\xd6\xa6\
-UB?E+vy\x9c\xcb\x19\xf6/\x96\x9dg\xa9\
-\xfc\x87\x84\xfaX\xd6\xb6\xe4s\x14`>\x8e\xae\xaf2\
-e\xe6Y0\xbc\x09\xf4wH\x10\x82\xacP^\xdf\xa9\
-\x0d\x5c<9e\x22\xed\xce[G;\xc5gH8\xed\
-'\xe3\x14Mnf\xa1\xc8\xaa\x1d\x83\x15\xe33\xf1\xb4\
-\x8a\x8b\xa7<\x18 \x04\xf1\x9bx\xfao(>\xc52\
-\xab\xca\x86\x89'\xebl\xff5r\xd1\xd9&!\xdd3\
-\xce\xc9\x8e\xd8\x9dw\x80\xc4\x85u\x16\xb0\xec\xbc-t\
-\xbdY\xb1M\x9bW\xca\xc0(\x12O#H\x84\xbfE\
-\x02\xdd\x92]v\xf3;\xb5\xf2\xe2\xe2\xc9)\x1b\xcd\xdc\
-y\xdbh\xc7>\x80vV\x96=\xb3\x84\xb2\xe2\x16\x90\
-+g\x06\x99\xaf\xdb]\x5c-\xeej\x16Y\xb7\xbcl\
-A>L\x10Z\xf9|\x81bR\xacGb\xd11\x17\
-\x91\x95\xe7x\x8f\xacIoP\x22\xc4\x0f(\x80\xf9\x15\
-\xba\x96\xcb\xd4g\xac\xd6\xe2y+\xb1W$\x11XO\
-=B\xa8\x8bu\x82\xac\x80\x7fF\xff\xd7\x02a^\xb1\
-\x0c\xdc\x22\x07\x95[\x9f@\xd0f\xe3S$\x9c\xac\x89\
-\xf2{<\xd9\xe0\xca\xb8xr\xfa\x81}B\x93\xd35\
-\xb4\xabZ@E5\xad\xd9\xb0\xc5DM\xd2\x99e\x22\
-\x16O\xd3\xb8x\xca\x83\x09\x94m\xf9\x1b\x14\xe7T\xa6\
-\xac:[\x8c\x8f\x90h\xfa\x19Y\x9b~A\xd7\xad\x05\
-\xf5nQ\xae\xb2\x03\xb5\xe81~^\x06\xe1\xd4\x0a\x13\
-\x14gh36H\x08\x0dH\xcf+E\x16O\xe6\xe6\
-\x1e@\xf3\xd6\x09\xa1\x9a\xfa&JDp\xae\x88\x8b'\
-\xa7\x1f\xd8G\xe6\xf6\xb74\xb6q\xb9\x85J\x19\xdc\xa3\
-1s\xa6]b\xcb\xd3\x12.\x9e\xf2b\x12-X\xbf\
-E.\xbb\x15\xca\xf39\x98x:D\x0b\xf1O\xc0\xbf\
- W\xddj2v(\xa7{\xae\xd6d|\xcc\xd5X\
-\xe4\xff\xd1\x82\xca\x8f\x08\x81\xfa?\xa12\x186@\xf3\
-A\x91\xb1\xe0\xf6\x11$\x9e&\x90\xf0;@\xe2\xddu\
-@\x1b\xf8\x9b\xe6\xf4\x0bq\xbf<3\xb7\xaf\xa1\xdd\x96\
-\xc5Bm\xa0\x1d\xe4\x22\xc1\xec>F\x08\x00\xbd\x0cV\
-\xf3i\x92\xf2\xf7J+\x13\x93\x84D\x80\xcf\x90\xbb\xee\
-\x0e\xfa\x0c'(v\xf0\xee9Z\x80\x8fP|\xc9s\
-t\x1d>Cn\xba\x9f\xd1\xb5\xbaMh\xda\x9b\x07i\
-\xe1C\x93\xe7\xf1c\xfag\xd3\xbf\x03\x9a\xbb\xc3\xec\xeb\
-z\x93\xe7\xcd^\x93\x16`y\x08.+\x1dQG\x96\
-\xc1:*Q\xb2\x8fb\xd5\x9e\xa2\xebs\x19]\x93C\
-\x143#o\x880\xd7-\xa1{\xe83\xb4\xf1\xdc\xc6\
-k@]\x1a\x9f\xf8\x9d~\xc3\x16*k4l\x81\xe5\
-\xabh\x82\xfb\x06Y\xa3\x1e&c\x0e\xed\x1c/\x13T\
-^#\x88\xa7nd\xf29\xad\x99B\x9f\xdb\xaf\x90\xb5\
-\xe9!\xa1g\x9d%\x07\x14\x95s\xb4\xf0n\xa3E\xea\
-\xcf\xc9\xf8\x01\xc5\x9b\xbcO\xbewH\xbe\xb1'q+\
-\x93\xb8\xb5I-z\x0e\x8d\xe2\xa8\xd9\xef\x88\x9f\x7f\xcc\
-\xe2\xd4\xaam\x8c\x1dK\xb7\x9a\xc9K@\xc5.<\x13\
-NVF\xe2gd\xc9\xf9\x12]\x9f\xf1\x86\xach\xf3\
-\xc3\x00\xe1\xbc\xac6\xda\x17\xe8\x9c_\x10\xda\xfb8\x1f\
-\xc1\xc5\x93\xd3o\xc4m-\xf6Q\xe6\x0c\xc8\xc7o\xee\
-\xbc\xdf%\xdf\xb7\xe0\xf1Q\x14\xf4y\x19\xd2\x96\xa7\xa2\
-M\x8e\xfd\xca$\x12O\x7f\x8f&\xfbe\xe4\xae\x1b\xbb\
-\xe8\x87\x0aB\x9d\xc6\x82\x97\x7f\x01\xfeO\x94QW$\
-L Y\xa5\xfef#mY\xea\x94X$\xd5S\xc7\
-\xcf\xa2Q#\x08\x97<\x88]x{\xc8RXC\x9b\
-\xa8I\xb4\x09;@s\xca\x9d\xe4g\x8a\xb8\xbe\xc6.\
-<\x13Ofm\xdaC\xd7\xa7s\x09\x8a\xf8\xe1:N\
-7\xb0\x89\x0f\x94\xc9\xf4U\xf2\xb5uV\xbfA\xe8\x95\
-g\xad^\x06\xf9\xf0\x1e1\xb3\xf7d\xf2:\xab6n\
-n\x19\xaf\xc1\x93\x1d\xf6^[=\xa7\x15$\x9a\xe6\xd1\
-\xa2Utk\x93\xf5c\xdcD\x01\xe1OP\xcc\xcc\x8f\
-h\xc1\xea\x05\xcd\xdci\xcd\xdcs\x10J{\xb4\xb2:\
-e)\x9a\xe2\xf3\xb3\xdf\x9f\x16O\xa4\xbe\xd7\xac\xd1q\
-+\x0bV/DV\x9d\x905\xb9\x8b\xdc\xb0\xff\x91\x1c\
-\xbb\x81\xe6\x96\x15\xc25\x5c\xb4\xb8\xbc1\x82\x80\xdaA\
-a\x0d\x16sg\xf3Y\x91c\xd2r\xc5\xc5\x93S\x15\
-\xe2Bx/\x91U\xea%r\xfd\xdcA\x13\xc8\x9dd\
-Xjo:\xa6\xc9\xdcvV\x03f\x0eM>\xcb(\
-;\xca\xaa\x9f;\xd90H\x10\xa9+\xd1\xb0\x9a5E\
-\xb6\xfa\x9d!\x81dE\x5c\xbfF\x82\xfd\x87\xe4X/\
-+\xd3\xa7\xddqi\x91d\xaf\xe9$\xe6\xa9\xd3\xf3k\
-\xf6{M4\xa5GZD\xc5\xae=\xe8\xadk\xcf*\
-\x93\x9f\xa3\xb0\x803d\xed\xfe\x0cY\xa2jhCV\
-\xa3x\xe2i\x1cm\xfc\xce\x09=\x14_\xa3kc\x8b\
-r\x95\xc9\xe89.\x9e\x9c\xaa\x90v\xe7Y\x85\xdd;\
-(k\xe6-\xb2\x12\x0c Qt\x8e&\xbca\x1a'\
-\xf7\xa1d\x9c\xa3E\xdd\xc4\x93\xc5\xb58\xd91D\xe8\
-[gV\xa7e\xf4\xf9\x14\x15[\xe0O\x91xz\x85\
-,M\x7f\x06\xfe\x15\xf8k\x0f\xcf%\x16BqK\x9b\
-8\x989k7\x5c;\x5c\xe5\xef7\x8b\x85:\xa7\xb1\
-\xdd\xcay\xea\xf5\xdd\xe44\x19\xc7(\x11\xe0\x1d\xb2@\
-\x1d!\xb1d\xc2\xa9\x88\xeee\xab<>\x8a\xc4\xd2\x1b\
-\x14\xbbe\xf3\xe46nyj\x89\x8b'\xa7\xeaXm\
-(\x08\x81\xa0khRY@\x0bw\xec\xce3\x06P\
-|\xc35d\xb5:#\x98\xbe\x9dl\x18Eb\xe9!\
-*\xec\xb7L\xf1v\xef1fux\x87\xdc\x1fO\x92\
-\xf13ZPwzp\x0e\xcd\xacL\xb1xj\x16\xbf\
-T6\xd2\xc1\xeb\xb15\xadY\x90y3\xabT70\
-\x17\xde\x0e\xb2jO&\x7f\xf7a\xf2\xfd1\x1a\xc5k\
-\xde\x0c\x122\xefVP\x8f\xc83\xc2y\xaf\xe1\xc1\xe3\
--q\xf1\xe4T\x1d\x13O{\x84\xd6\x05?\x13b\xa1\
-n\x22qT\xa3Q<\xd5P\x06\xd85TGj\x1b\
-\xed\xdc\x9c\xec\xb0X'\xcb\x8c\x5c\xa6\xd8}\xeb\xce\xd0\
-\xb5\x14W\x0a\x7f\x82,\x12\x9b\xf4N<\xc5\x0b\xb4\x89\
-\x8a\x8b\xe2\x9d\xca$\xa0\xe2s\x1d\xe4\xc3\x98'\x13K\
-g|h\x91\xea\xa6;\xcf\xac\x8d\xf6\xf7_\x10\x1a\x0c\
-\xd7\x09V\xea1\xc2g\x947V<s\x10\xcdcu\
-\xb4!\xac\x13Z_9-p\xf1\xe4T\x9d\x03B?\
-\xabwh\xa1\x9bD\x82\xe8\x1eZ\xf4@Bi\x99\xc6\
-\x00\xd6\x09\xb4\xb8\xef \xf7L\x11M\xf3e\xc4\x16v\
-\xeb]\xf7)\xca\xb4[\xa2\x98\x96'[0\x8f\x90\xf8\
-\xfe\x1e\xf8#\x8a\x81yJoD\xb5-t&\x96\x86\
-\x09\xae\xb9A\xfak!\xfc\x98\xc5,\x16Mq\xbd\xa9\
-n\xbb\xf3b\x17\xdek\xe4\x0a{\x8f\xac\xd6\xd6N\xa8\
-Nq\xd6\xdd\xb8\x0e\x95\x15\xcf\xbc\x86\xac\xe7?\xa0\x8d\
-Jl\xbds\x22\x8a\xf2!:N\x110\xb3;\xc8\xed\
-bn\xbc\xd8\x225\x8bbn\xa6\x92\xe3V\xb5w\x9a\
-r\xf4V+:\xc3\xe8\xbd\x9dB\xe2\xf5\x16\x9a\xd0\x8b\
-Z\x0c\xf3\x1c\x09\xec-t\xcd|\x8f2\xea\x9e!1\
-\xde\xad\x16+q,\xd3@\xeay\x1c\xd3\x14\x07\x85W\
-\x85\xd8\xad\x07AP\xc6\xd6\xa8n\x17\xde\xb4\xb9d\x1b\
-Y\x1f\xa7\x93\xaf?I\xc6x\xc6\x7f\xafS\xacd\x0b\
-\xe8~{\x8c\xe6\xbc\xb7\xc8\x0a\xb5\x8e\xc7?5\xe0\xe2\
-\xc9q\x02\x96\x91w\x8a&Y\x13Mo\xd0\x82\xb8\x8c\
-\x16\xf4\xbbh\x179\x82&\x1co\xd5\x92\x1d\xc3H\x9c\
-\x9a;\xf4\x16\x0ab-j\x86\x9d\x89\xa7\xa7\xc8M\xf7\
-=\x0a\x10\x7fFh\x1b\xd4\x0d\xcc\xf5\x93\x1e\xcd\xca\x0c\
-T\x91\xf8}8Gk\x9d5d\xae\xf1a\x86\x1ed\
-'\x0eb\x17^\x1d]\x17\xc7\x84\x06\xbc\x0bt\xd6&\
-\xaa\x1bX\xed's\xe1=F\xc2\xdf\x12\x1c\xde\xe1\xe2\
-\xa9\x01\x17O\x8e\x13\x88\xe3#\x0e\xd0d\x07\x0a\xfe\x9c\
-@\x02\xe9\x0b\xb4\x9b<!\xa4\xceO!\x97]\x9c\x99\
-\xe7\x13M{\x98x\xba\x8d\xc4\xd3M$Z\x8b\xd6?\
-,\xce\xaa{\x8f\xc4\xd3\xd7\xc8\xdd\xf1\x04\xb9q\xbbA\
-\x1c\xa7d\xb1M\xf1\xa8\xaaX\x8aI\xc7r\x99\xe0>\
-\x8d\x8e\xa5]z\xf1c\x16\x98\x0b\xef\x04\xc5?\xbdG\
-\xd6\x9b%\x14\xbfwDc\x00\x7f\xde\xa4]x\x9f\xa0\
-\xf3:%\x14\x04u\x22\x5c<9\xce\xc71\x13|\x8d\
-\xb0(n\x13\x02\xca\xa7\xd1\x04s\x8aD\x96M\x9cg\
-\x1f\xfc&\xe7c\x98\x1b\xf4S\xb4\xc8X\x91\xc1\x22a\
-m\x7f\x0eQ\xbc\x9b\xf5\xa8\xfb\x0e]\x1f\xbb\x19\xff\xbd\
-X\x0c\xc4\x99ei\xf7\x9cs1\xf6\xbe\xd5\xf9\xd0\x22\
-\x15\x07\x95g)\xa2\xe2B\x9a\xdbHH}C\xb0X\
-/s\xf9\xee\x06\xbdb\x04\xcdi\xb6i\xf1X\xce&\
-\xb8xr\x9c\x8fc&\xf8SBw\xf5\x97\xa8F\xd4\
-\x1a\xca\xa2Y%\xa4\xf9Zcb\x17OW\xc7\xca\x13\
-\x14Y<\x81>\xe3-\xf4\xf9\x9bx\xfa\x16\x09\xa7\xac\
-\xc5\x134\xb6N\x89ESQj5\x95\x01\xb3\xd6Y\
-\xcf=\x0b\x86\xb6\xbeu\xdd\x0a(?I~\xf76J\
-H\xf9*\xf9\xfd\x9f!aR4\xf1d\xed\xaa\xcep\
-\xf1\xd4\x12\x17O\x8e\xf3q\xd2\x056A\xf7\xce6Z\
-(W\xd0\x22z\x8cvm\xa7\xb8%\xe0*\xc4\x16\x95\
-I$\x9e\xee#\xb7\xdd\x04\xc5\x89%\xb3\x05\xf5\x0c}\
-\xee&\x9c,\xde\xe9\x97.\xfc\xcdt\x91\xcb!B&\
-]\x1c,\xee|\x9ct+\x98\xd8\xca\x14\x9770\xb2\
-\x10Pq\x8f\xbe]d\x99\x1cN\xfe\x8em\x14\x96(\
-\x96\x0b\xcf\x926\x06\x90x\x9aD\xf7\xa0\x89@\xcf\xbc\
-\xc3\xc5\x93\xe3\xb4K\x9d\x10P~\x80\x84\xd4\x0e\x12W\
-\xd6\x06\xc6\xb9\x1cC\xc8M`MUW\xd0\xcew\x1c\
-M\xe4EXP@\x9f\xe9\x09\xfa|\x9f!\xf7\xcbW\
-(\xa8\xf6\xdd\x05?\xd7\x0e\xcd*\x83\xa7\xeb7\xb9\xb5\
-\xa9}\xd2\xf5\xa2,^1nF\x9c\x16X\x9dbm\
-P\xac\x05\xca\x1c\xba\xe6A\xfd\x1a\xe7\x91P\xc9\x9b\xb8\
-x\xe6\x02J\xd8\xb8\x8f,\xad;\xf4\xa6^Y\xe1q\
-\xf1\xe48\xeda\x13\xa1\x05\x0c\x1f\xa3\x85\xf5\x84\xc6\x18\
-\x0a\xe7\xe3\x0c\xa1\x1d\xeeu\x82x\x9aE\xe2\xa9H\xf1\
-<\xe9&\xb0\xff\x0e\xfc#r\xe3fYY>-\x9c\
-\x86\x09\xd6\xa68\x93\xce\xe9\x8c8\xa0\xdcZ/\xd9=\
-\xdc\x8d&\xc3\xd6\xef\xf0\x04\xcd\x17S\x04\x91r\x9f\xd0\
-p<o,\xf1`\x08\x09\xba\x1b\xa8\xce\xda+B\x16\
-r\xe5\x13b\x5c<9N{\xd4\x09\x056\x9d\xce\x18\
-F;\xdc\xbbh\x92\xbe\x86,OE\x8bu\xb2\xa0\xdf\
-w\xc8U\xf7-\xf0\xa7\x8c\xffF\xba~S\xdaU\xe7\
-dK\xfc~\x1b&\x9c\xcc\x12\x95U\x06\xed9\xb2L\
-\xef\xa3\x989\xb3\xae\x8e\xa0\xb8\xa2E$V\xf2\x16\xc8\
-v\xed\x0d\x13\xc4\xd3'4\x96o\xa9<.\x9e\x1c\xc7\
-\xc9\x9bQ4A\xff\x0a\xf8-*SP\xb4\x22\x82u\
-$\x9a\x9e\xa0:N?\x13\xaa\xcfgA\xbc`\xc6m\
-U\xccM\xe7\x96\xa6\xde`A\xf9 \xe1dYy\xcd\
-\xeaBu\x82\xf5\xc2|\x8d\xacMs(\xf6i\x12]\
-\xfb\xe6\xb2\xce\x9bit?\x1e\xa0\xcd\xc3\xda\xc5/\xaf\
-\x0e.\x9e\x1c\xc7\xc9\x9b1\x82x\xfa\x0d\xda\x91O\xe4\
-zF\xcdy\x8f\xb2\xea\xfe\x0d\x15M\xdd\xcc\xf8\xf7\xc7\
-\xf1MU\xaf\x12\x9e\x17&\x9e\x06\x08E5\xe3\x18\xa8\
-\xac0\x17\xde\x1b$\x92\x96\x90\xdb\xda:\x18\x98\xb51\
-o\xa6Q\xa1\xdaaT\xa7\xea\xa7|O\xa78\xb8x\
-r\x1c'\x0f,\xa6\xc2\xe2\x9dn\xa0\xf2\x04\x9f\xe4y\
-RM8N\xc6\x11*O\xf1\x03\x0a\x12_G\x8b_\
-\xa7\xc4=\xe9\xd2\xa5\x08l\x11wzG\x5c\xb9=\x1d\
-\x94\x9fe\x1c\x94\xb9\xc0\xce\x93\xbfs\x9d\xe0\xae\xaeQ\
-\x8c\xd8'\x08\xfd;\xa7\x90\xc5\xd5\xda$U>\xb6\xd3\
-\xc5\x93\xe38y0\x8cb<\x16\x80Gh\xe1(b\
-=\x995$\x9a\x9e\x03\x7fF;\xef5\xe4r9\xba\
-\xe0\xe7.C\xdaU\x17\x0b'\xb76\xe5\x8f}.i\
-\xb2p\xe1Y}\xa9C$\xc2_\xa3k\xcb>\xffy\
-\x8aQU\xdf2\xefj4f\xdem\xa2{ \x8b\x0d\
-D)q\xf1\xe48N\x1e\x98xz\x80\xc4\xd3\x0a\xc5\
-\x15O_\x03\x7fDA\xe2O\x92c\x96\x95\xd5)\xb1\
-\xabn\x18\x8fq*\x12\xad\x02\xb7\xb3p\xe1\xd5i,\
-\x9e\xf9\x9a`i\x5c@5\xce\x8a\x80e\xdeYR\xc7\
-\x0d$\x9e^\x11\x5c\x8f\x95\xc4\xc5\x93\xe38y`\x93\
-\xf1=\xe4\xae+\x92x\x8a\x0b&\xae\x12\xe2\x9c\xd6Q\
-\xd0\xf8V\x06\x7f\xa3Y9\x02o\xb5R,.\xaa\xa3\
-\x15[\x9e\xda\x11Rq\xf1L\x90 \xaf\xa35\xf9>\
-\xb2\xea\x1c\x13\xae\x8f\xbc3\xef@\xd6\xb0[\xa8\xf2\xbf\
-\x95j\xa9,.\x9e\x1c\xc7\xc9\x03\x8bu\xba\x89\xb2y\
-\xe6)N%\xf1#\x94]\xb4\x8f\x16\xb55$\xa2v\
-\xe9\xdcU\x07\xcd\xab\x86\xbb\xab\xae\xd8\xa4]xq\x01\
-Mk\xf3\xd2.\xe7\xe8z\xdb \x5cok\xa8\xfa\xf8\
-D2\x8a\x12<~\x1b\xdd\x03\xfbT\xbcd\x81\x8b'\
-\xc7q\xf2 \x0e\x147\xf1T\x94\xbaNV\xcf\xe9=\
-\x12M\xabd\xeb\xaaKW\x0e\xb7X'\x17N\xc5%\
-v\xe1\xc5\x82)\xaeD\xde.V\xff\xe9\x04Y_\xed\
-\x9a\xbb\x9e\xfc\xde\x11\x8a!\x9ef\xd0\xbd:\x86\x84\xd3\
-\x0f\xf9\x9eN\xbe\xb8xr\x1c\xa7W\xc4\x19v\xd3H\
-0]C.\xbb\xa2\xd4\xb5\x01Y\x01\xd6Q\xa0\xf8\x1b\
-\xe4\xaa\xcb*\xb6\xa3Y\xcb\x95\xa2\xf44sZ\x93\xce\
-\xba\x8b\xc5R\x9c\x85\xd7\x0e\xe7\x84\xacNk6\xfd\x0a\
-\x95/\xb0\xcc\xbb\x22\xd4=\x9b@\xd6\xb0It\xdf\xce\
-!!e.\xeeJe\xde\xb9xr\x1c\xa7W\x0c\xa2\
-\xdd\xeb\x1c\xaa&~\x8d\xd0\x86e\x84\xe2\x08\x88\x1d$\
-\x9c\xbeFYvY\xc58Ac\x8cS\xec\xaes\xca\
-\x83m\x02b+TVU\xc8O\x90p\xff\x99\xb0\xa1\
-X\xa4x\x99w\xb3(fq\x99P5\xbdR\xdd\x16\
-\x5c<9\x8e\xd3+\x86\x90x\xba\x81\xc4SQ{\xd8\
-m\x03/P\xe3\xdf\xe7dku\xb2\x85\xd7\xfa\xd5y\
-s\xdf\xf2a\xee\xbb\xb8\xfa\xf8i\xf4\xfdN\x04T,\
-\x9eF\x90\xf5\xe9A\x07\xbf/K,\x1bp\x18\xdd\xc7\
-\x0b\xe8\x1e~\x8f\xacN.\x9e\x1c\xc7q\xba\xc0 r\
-\xd7\xad \x01\xb5\x88\x5c\x00E\x08\x14?\x8b\xc6\x06r\
-\x9b\xfc\x84\x5cv\xbb\x1d\xfe\xeet\xaf\xba8H\xdc)\
-\x1f\xb1\xe0\x8d?O\x13R\x9d\x8a\xa7\xcd\xe4w\x8e\xa1\
-\xa2\xb1\xdb\xa8\x1eT\xde\xd9\x98\xb1{y\x16Y\x8e\xef\
-&\xc7\x8e\xc8\xbe\xe2~\xa1q\xf1\xe48N\xaf\x18@\
-V\xa69\x82p*J\x9c\xd31\xb0Gc\x86\xdd\x1a\
-\x9de\xd8\xd5\xa2\xc7\xa1\xd4pkS\x7f\x10\xf7\xc2\xb3\
-V.&\x9e\xda\x11Q\x16<>@\xe3uh\xf7\xcb\
-\x04\xc5\xb0\xd0Z\xf0\xf8\xaf\x92\xaf+W\xef\xc9\xc5\x93\
-\xe38\xbd\xc2\xc4\xd3<Z\x0c\xa6(\xce\x1ct\x8cb\
-\x9d\xe2\x0c\xbbUd\x098\xbd\xe0\xe7>F\xba\x96\xd3\
-0^\x92\xa0\x9f0\xeba\x9c\x89\x17\x7f\xb6W\x15P\
-\xe6\xfe:AB\xc9\xae\xc3\x95\xe4\xfbE\xc9\xbc\x9b\x05\
-\xee\xa0\xffo\x13\xb9\xb7+EQ&.\xc7q\xfa\x9f\
-\x01\xb4 \xc4\xe2\xa9\x08\x0b\x01\x04\x8b\xd3\x0bT\xed\xd9\
-\xdcu\x9d\xb8`\x9a\xd5s\xf29\xb7\xbf\xb0\xfaO\x16\
-\xff4Hg\xe5\x0b\xea4f\xde\xbdAU\xed\xa7\x92\
-\xef\x15%\xf3n\x1c\xdd\xc3\xe7\xc9c\x11\xce\xa9\xa7\xf8\
-\x8d\xec8N\xaf(\xb2\xe5\xc92\xec\xbe\x01\x9e\xd1y\
-\x86\x9d\x09\xa7t\x93Y\xa7\xffHgR\x0e\x91M\xfd\
-\xa7#$\xe4\xbf&T\x1f_\xa6\x18\x99wC(&\
-k\x12e\xe0\x15\xe5>\xee\x19\x95\xfb\x87\x1d\xc7\xc9\x8d\
-A\x1a-OE\x8ay\xdaE\xe2\xe9[\xb2+O\x10\
-\x07\x89\xbbx\xeaO\xe2\xcf4\xfe\xbc;\xad\xfd\x04\x12\
-O\xaf\x90\x15\xea\x14\xb9\xee\x1ew\xf8;\xb3\xc2\xca\x16\
-\x98x\xaa\x5c\xf2\x83\x8b'\xc7q\xbaI\x0d\xc5i\x8c\
-\xa0@q\x1bq\x89\x82\xbc\xb0\x8a\xe1\xc7(\xae\xe4%\
-\xf0\x0br\xdf\xed\x91\x8d\xcb\xce,\x11.\x9e\xfa\x9b\xf8\
-\xf36\xe14@g\x85#O\x91\x88?F\x22e\x15\
-\x05f\x1f\x90\x7f\x8d\xb0!\x82x\x8a\xc7)!p\xbe\
-\xafq\xf1\xe48N7iV\x18s\x8eP\x000O\
-\xf1t\x80\x82]7\x90\xb5\xe9\x15\x12N\x96\x1a\xde\x0e\
-q\x86]\x1c\xe7\xe4\xe2\xa9\xff\x89\x85\x8cU\xdc\xee\xa4\
-x\xe69\xa1\x1d\xd0\x0e\xbaV\xd7\x09U\xbe'\xc9_\
-<\xa5\x0bf\xee\x11\xb2V\xfb\x1a\x17O\x8e\xe3t\x13\
-\xab\xedd\x851\xad\xaa\xf8\x04!\x98:/\x0e\x90X\
-z\x89\xc4\xd3k\xb4\xbb?\xa2\xb3\x9ds:P|\x90\
-\xc6\xda@N\x7fb\x82\xb9\x86\xae\x9f\xb4`\xbe\xaa\x80\
-\xb2\xe0\xf1S\xe4V\xde@\xe2\xe9}\xf2\xfd1\xf2s\
-{[\x1d*+|k\xe2i\x00\x09>\x17O\x8e\xe3\
-8\x1d0\x80v\xc8K\xa8\xd1\xe9<\x12NE\x98{\
-\xac\xb0\xdfk$\xa26\xd1\xae\xb9S\xe1\x14\xc79y\
-\xdf\xba\xea\x10\x07\x8e\xc7\xc2\xb9\xdd\xc2\x99\x16p~\x8e\
-,\xa1[\xa8!\xef\x12\xa1\xca\xf7Xg\xa7\xdc6\x03\
-\xd1\xe3$\xb2&/#\xe1\xd4iQ\xd9R\xe07\xb5\
-\xe38\xdd$\xce\xb0[\xa2X\x19v\xc7\xc8E\xb7\x86\
-\x16\xa6v]uF\xba,\x81Y!\x9c\xea\x91\xbe\x0e\
-:]k\xad\xf2\xf8\xcbdl\x12\x5czy3\x8a\xac\
-\xc9\xcb\xc8\xca<\x9a\xef\xe9\xf4\x86\xa2Lb\x8e\xe3\xf4\
-'\xe9\xaa\xe2E\xaa\xedd\x851\xd7\x91x:\xa2\xf3\
-\xc6\xae.\x9e\x1ch\xcc\xba\x83\xce3\xefL<\xbdB\
-\xf7\xd25\x8a#\x9e\xc6\x90xZB\xf7R\x11\xda-\
-u\x1d\xb7<9\x8e\xd3M\xca \x9e\xb2\xb4<ym\
-'\xa7U\xa6e'\xd7\xc2)\xbaVW\x09m\x83:\
-\xa9|\x9f%i\xcbS%\xc4\x93[\x9e\x1c\xc7\xe9&\
-qUqs\xdb\x15I<\x99\xdbn\x13\x89\xa7v,\
-Oq\x86]\x1c\xeb\xe2\xe2\xa9\xba\xc4\xc9\x10q\xdc\x9b\
-\xb5p\xb9*g(\x1e\xef=\xaa~\xdfil^\x96\
-\x98\xe5i\x05\xc5a\xb9\xdb\xceq\x1c\xa7Cj4V\
-\x15\x9f\xa68\xf3N\x96\x96\xa78\xc3\xce\x04\x94\x1dw\
-\xaa\xc7\x00\xa1\xcf]3\xcbS;=\xef\xf6\x91xz\
-\x8f\xc4SQ,O&\x9e\x96\x91xr\xcb\x93\xe38\
-N\x9b\x98\xe5e\x0cY\x9e\xa6\x90p\x1a#\xff\xc2\x98\
-G\xc9x\x87\xd2\xbf\xb7\xd0\xc2\xd4n\x0cI\xb3\x0c;\
-\x17MN\xbamK'\x99w\x96qWC\xd6\xd2m\
-$\xfc\xf7\x90%\xd7\xdc\x83\xbd\xa6\x96\xfc\xfd\x09$\x9c\
-\xac~[\xdf\xe3\xe2\xc9q\x9c\xac\xa9\xa1\xb9e\x84\xc6\
-\xea\xc3\x13\x14\xa30\xa6\xed\xde_\x12\x5c \x87h'\
-\xdf\xce\xc2\xe6A\xe2\xceE\xa4{\xde\xc1\xd5]n\xe9\
-\x82\x99\x1b\xc8b\xba\x806&S\xe4_0\xb3R\xad\
-Z\x5c<9\x8e\x935\xb6\x1b\xb5\xc6\xa1\xb1x\xca\xbb\
-X\xe4\x01\xca\x08\xb2\x8a\xe2\xefP\xf0m'\xf1Nq\
-p\xb0\x8b''M\x16\x99wu$\x9e,p|\x13\
-]\xbb\xef\x09I\x19yY|\xacI\xf0\x04\x15\x12O\
-\x9em\xe78N\xd6\xd4\xd0$jmY\xe2\x1di\xde\
-.\xadcB\xb1A\x13N\xa7\xb4\xefN\x01\x0f\x12w\
-Z\x93U\xe6\x9d\x15\xcb<C\xd7\xf0.\xc1\xed\xbcO\
-\xbe\xc1\xe3q\x93\xe0)t\xdf\x9b\x0b\xafo\x0d4.\
-\x9e\x1c\xc7\xc9\x9a\xb8<\x81\xa5/\x17%\x0e\x22\x0e\x12\
-\xdf\xa4}\x8bSL:\xe6\xc9\xc5\x93\x13\xd3*&\xae\
-\xdd\xeb\xc4\xda\xb5\x98\xe5)\xef\xcc;\xb3<M\xd2\xd8\
-\xe7\xae\xaf\x83\xc7\xfbV\x15:\x8e\x93\x1b\xcd2\xec\x8a\
-&\x9e\xac0f\xd6\xe2\xc9\xbev\x1c\xc32\xef\xecy\
-\x5c\xda\x02:\xcf\xbc\xbbN\xfe\xe2\xc9\xdc\xd5\xb3\xe8\x9e\
-_N\xbe>\xa2O\xfb\xdc\xb9\xe5\xc9q\x9c\xac\x893\
-p\xac]CQ\xe2 N\xc8F<\xd5.\x18\x8e\x93\
-&]\xca\xa2\x13\x0b\xe5\x09\xbav\xdf$c\x9b|\xcb\
-\x16\xd8\xff5\x846MVm\xbc\xaf\x0bf\xbaxr\
-\x1c'k,\xdbn\x0cM\xa6E\x12OY\x15\xc6\x84\
-\xc6\xc5\xd0E\x93\xf31\xd2\x02\xaa]\xb1}\x82b\x9d\
-^P\xbc>wc4\xba\xeb\xfbV<\xb9\xdb\xceq\
-\x9c\xac1\xcb\xd3(\xb2>\x8dP\x9c\x8dZVn;\
-\x17NN;\xc4\x01\xe4\xed\x8a\xf6c$\x98\xceP|\
-\xd1\x16\xc5(\x98Y\xa3\xb1\xcf\xdd*.\x9e\x9c\x821\
-\x84\x16\xa7\x11\x94\x81q\x8cv\x1e\x9d6\x9ft\x9c,\
-\x88-O&\x9e\x8aby:C\x82i\x87\xce\x0bc\
-\xb6\xaa\x1e\xed8\x17a\xd7\xcc\x00\xed\xcd\xd9V0\x13\
-dE\xddE\xd7\xf2\x11!\xeb3\xaf\xebq\x18Y\x9b\
-\xad n\xdfj\x8c\xbe\xfd\xc7\xfa\x9c!B\xc5\xe6\x13\
-t\xf3\xec\xe0\xe2\xc9)\x0e\x16\xffPD\xf1dA\xac\
-\x9d\x14\xc6\xf4\x0c;\xa7\x1db\xd1\xdd\xee|m\x1b\xe6\
-:\xca\xb4\xb3qH\xb0\xf2\xe6u=\xc6\x99wEr\
-\xd7g\x8e\x8b\xa7r2\x8c\xc4\xd3\x22Z\x08\xaci\xa4\
-\xe3\x14\x81\xb8H\xe68\xc5r\xdbY\x9d\x1c\x13O\xed\
-\xe2n;\xa7\x1d\xb2\x88y\xb2j\xe3\xa7h\xde\xdfO\
-\xc6\x01\xe1\xde\xcb\xabU\x8bU\x1b\xef\xfb\x82\x99.\x9e\
-\xcaC\xec\xaa\xbb\x0e<H\xc69\xa1\xd3\xf66\xba\x99\
-\xcc\x8c{\x80\x16\x08\xb7H9\xbd\xa6Ypl^\x9c\
-\x22\xc1d\xc1\xe2\x87HDuR\xa2 \xce0\xf2\xaa\
-\xe2\xcee\x89-\x96\x9d\x94\x17\xa8'\xe3\x94`I=\
-@kD\xa7\xa57:\xa12\xd5\xc6]<\x95\x07s\
-\xd5\xcd\x00\xf7\x81\xdf\x02\xbfGbj\x8b\x90\xba\xfa\x0a\
-e`\xac\xa1\xa0\xd8c\x5c<9\xd5\xc6\x82\xc4\xb7Q\
-\xa0\xed\x01\xd9\xd4v\xb2\xaa\xd1\xb6 :\xceE\xa4\xaf\
-\x93,b\xe5\xea\xe8\xfa>H\xc68\xf9\x8b'\xab6\
-^$w}\xe6\xb8x*\x0f&\x9e\x16\x81\xbbH<\
-\xfd\x8f\xe4\x98\xf9\xbc\x7f\x06\xbeC7\xd0\x00\xdaa\xbf\
-\xcf\xe3d\x1d\xa7@\xc4\xb5\x9d6\xe9\xbc0fl=\
-p\xab\x93s\x15LtC6\x16Ys\xe1\x99\x1b:\
-\xef\xc4!\xb7<9\x85c\x0c\xd5\xce\xf8\x14\xb9\xebV\
-\x08\xdd\xb4M\xed\x1f#S\xf0(J\x17\x9dG57\
-6\xd1\xe2a}\xbcN\xc9\xb7\x22\xad\xd3\xdf\xc4\xbd\xed\
-\xe6\xd1D\x9a\xe7\x5ccA\xe2{hw~Bg\xb5\
-\x9d\xec\xd1\xb3\xec\x9cvI\x17Vm\xf7z\xac\xa7F\
-\x9e\xc4\xffO\xdfg\xa1\xbax*\x0f\xe3\xc05\xe01\
-\xf0\x09\xb2@Y`\xa0\x05\xe4.'\xc7\x96\x92\xe7+\
-\xc9\xa3\x15S{E(\x95\xdfI#T\xc7\xb9\x88\xb8\
-\xb7\x9dU\x1a\xce\xb3=K\x9cawDg\x19v\xf1\
-\xa3\xe3dA\xbbmZ\x9c\x1cq\xf1T\x1e\xc6Q\xa0\
-\xb8\x89\xa7%\xb4 Y\xaa\xf4H\xf2\x9ae$\x8cn\
-\x22\xf1\xb4\x82,\x005B9\x03\xcb8r\x9cn`\
-\xe2i\x1e]\xa7\x93\xe4/\x9e\xe2\x0c\xbbN\x0a\x0a\xba\
-\xc5\xc9\xc9\x8af\xd7\x92\x0b\xa8\x92\xe0\xe2\xa9\xd8\x8c\xa2\
-]\xfb\x0c\xf0\x10\xc5:\xdd@Ue'\x08\xc1\x87\xe9\
-\x1d\xf1 r\xe7]\x8b\x8e\xdbb\xb6\x8eJ\xfb\xbfG\
-b\xca\x86\xdf\xb4N\x96\x14)\xdb\x0e\xb2uo\xe4\xfd\
-\xbf8\x8eQGn\xe8CB\xccS\x9es\xf9 Z\
-\xb7\x8aV\xa2$s\x5c<\x15\x9b1$\x80n#\x8b\
-\xd3}d}\x9aO\xbew\xd1\x859\x8e\x5c{\x16\xbc\
-\xb7\x08\xdcA\x19y\xaf\x93Gs\xe7\xedt\xe5\xec\x1d\
-\xc7q\x9cnb\x053-\xdb\xae\x08\x01\xe3^\xe7\xc9\
-\xc9\x9d1\xe4v{\x04|\x86\xc4\xd3\x0d\x14\x0c\xfe\xb1\
-\xdd\xefx\xf2\xf3\x16\xfft\x0f\x05\xcc>\x03\x9e$c\
-\x00\x05\x91\xbf\xc4-O\x8e\xe38e\xc3\xc4\x93\xd5y\
-\xca\xdb\xf2\x14W\x18\x1f\xa1\x8f5F\xdf\xfec%f\
-\x08]t\xa3H(=\x00>GYvK\xc9\xf7.\
-\xeb6\xb0\xd7Y\xbf\xa1\x1a\x12c\xa0\x9dAl\x91\xda\
-Bupvh\xacZ\xeb8\xed`\x93\xe88\xf9U\
-<6\x9a\xc5<e\x95m\xe78\x9d\xd0i\xb6\x9d\x95\
-*\xb0\x82\xc8y\x8b'\xa8Hb\x85\x8b\xa7\xe21\x88\
-T\xfb,\x0a\xfa\xbe\x0f|\x81,G\xb3\xb4\x17x;\
-Hc\xc1\xb2q\x1a-R\xab\xc8\xfa\xf4\x1c\xb9\xf2\xd6\
-\x92c.\x9e\x9cvH7\x06\x1e\x22_\xf1\x14\xef\xce\
-;\x09\x18\xaf\xc4\xa2\xe0\xf4\x94\xf8\x9ajG\xf4\x14\xcd\
-mW\x19\x5c<\x15\x8f\xb8\x18\xe6M\x94Y\xf7\x05\xb2\
-B\xb5\x8b\x15\xf3\x03-f\xcb\xc9\xf3}\x82\x95\xe9\x1b\
-\xe0k$\xcej\xc9\xf1\xf5\x0e\xfe\xa6S]\xe2\xdev\
-\x139\x9f\x0bd\xd7\x0c\x18<\xdb\xce\xc9\x8eN\x85\x13\
-\x14\xcfmW\x19\x5c<\x15\x8fQ$n\x1e\xd2X\x92\
-\xa0\x1bXf\x04H\x9c\x9d\x12\xc4\xd5\x12r\xf1\x99;\
-o\x1b-B^`\xd3iF\xdc\xaed\x82b\xb5f\
-\x88\xddv\x9d\xd6y\xaaD\x01@\xa7g\xd8\xf5T\xa7\
-=\x11U$\xb7]\xdc\x18\xd8\xdb\xb38=\xc7\x82\xc4\
-\x1f\xa28\xa7et\x11v\x83\xa1\xe8\xf1:Z\xf4n\
-\x10\x8akZ\x81\xcdg\x84\xdd{\x1d\x17ONsb\
-W]\x91&\xce\xd8\xb5a\x0bL\xbb\xb8\xe5\xc9\xc9\x8a\
-,\x84x,\x9e\x8a\xe0\xb6\xb3^\x8f'x\xb6\x9d\xd3\
-#\xec\x06\x1a'd\xd8\xc5A\xe2\xdd \xed\xce\xbb\x9e\
-<_\x22\xc4DM\xa2\x9d\xfa\x0e\xba\xd1\xcfi\xdc\xb9\
-\xbb\x89\xd8\x81\x0f]u\xa3\x14\xa7\xc6K7\xdcv\x8e\
-\xd3\x09\xe9\xf6,\x9d\x88\xa7\xf4\xc6 \xefl\xbb!B\
-\x9b0\x17ONW\xb1^t\xb3H4\xdd'\xd4s\
-\x8a\x8ba\xf6\x8aIBV^\x0d\xc5`]G\x855\
-\xdf\xa1\x22\x9b[\xa8g\xden\x8f\xcf\xcd).E\xb5\
-<eUa<\xab\x05\xcfq\xb2\x22\x1d0\xde\xc9\xc6\
- k\xe2\xb2\x05}\xd7S\xd5\xc5S1\xb08\xa7\xbb\
-4\xd6sZ \x9fEh\x12-\x0c\x93H8\xad\xa0\
-\x92\x09\xaf\xa2\xf1\x1c\xdd\x0c.\x9e\x1c\xf80\xc3\xaeH\
-\xbb\xcef\xd9v\x9d,0.\x9c\x9c\xa2P4\xb7\x9d\
-\x91\x9e\x0f\x0e\xe9\xb3\x90\x0f\x17O\xf9b\x93p\xb3b\
-\x98\xd7Qc\xd5<\xb0\x1aP\xe6\xbe\xbb\x8bD\xd2S\
-T\x5cs\x8e\xd0+o\x83\xd0d\xb8H\x1d\xbe\x9d\xde\
-c5\xca\x8aP\xdb)\xa6Y\xc0x\xbb\xb8pr\x8a\
-D\xdc\x9e\xe5\x88\xfc\xddv1q\xb5\xf1:\x9d\xddw\
-\x85\xc3\xc5S~\x0c\x22\xd14F(\x86\xf9\x19\x0a\x14\
-\xeff\x90\xf8U\xb1\xdd\x03H\xe0\x0d k\xd4\x0cj\
-\x1d\xf3\x18\xb9\xef6\x91+o\x0f\x09\xad\x83\x1e\x9f\xa7\
-\x93?6\x89\xef#\xb1\xd27\xbb\xcc\x08\xdf\x188Y\
-\xd3\x89\x18\x8f\x9b\xc2\x17i\xd3\x92\xb6<\xd9\xdc\xd07\
-\xb8x\xca\x8fAtQ\xcd!\xf1t\x9fPI|\x8a\
-b\x89'{\x1c@\x8d\x8aW\x90e\xec\x13TL\xf3\
-Y2\x9e'_\x9f\xe2\xe2\xa9j\xd8\xce\xd2\xc4\xd3\x11\
-\xc5p\x1fd\x8d[V\x9d,\xe94\x86n\x80\xd0A\
-b\x8cP\xa7\xaf\x08\xc41O\x87\x14C\xd4e\x86\x8b\
-\xa7\xfc\xb0b\x98K\xc0-T\xe9\xfb!r\x91\x15\x89\
-tF\x1eh\xe1\xb0\xe2\x9a\x9b\xc0\xb7\xc8\x12e\xbb\x9e\
-\x83\xe4{\xe7\xd1\xb0\x9fs\xfa\x17s\x8fY\xecEQ\
-,O\xb60\x0d\x12R\xc3\xdb!\xce0u\x01\xe5t\
-J\x16.`\xcbr-\xa2x\xb2\xce\x16\xa3\xe8\xbc\x8a\
-\x12\x03\x99\x09.\x9e\xf2c\x04\xb9\xe7>E\xa2i\x85\
-P\xb0\xb2\x0c\xd8\xaeb\x1a\xb8\x8dn\xd8\x19B}\xa8\
-\xe7\x04w\xde\x0e}\x98m\xe1\x94\x86at\x9d.!\
-\xd7\xf2\x16\x9d\x09(\x17NN\x16\xf4\xfbu\x94\xb6D\
-\xf7\xd5\xdc\xef\xe2)?F\xd0dn\xe2i\x99\xf2\x88\
-'\xdb\xed\xc4\xbby\xeb\xc5\x17\x17\xd8|\x9a\x8cS\x82\
-\x1b\xa7\xafn \xa7\x14\x8c\x10\xac\xbc\xeb\x84&\xd9W\
-\xc5\x85\x93\x935\xfd\x9cd\x13\x8b\xa7\xbe\x8b\x81t\xf1\
-\xd4[\xac\xa2\xac5\xff]AqC\x0f\xe8n1\xcc\
-n`\xee<+\xc5\x7f\x0d\x09\xa4\x19\x14\xc75\x8b\xfe\
-\x9fS\xe4\xc2\xd9%\xb8\xf4LD\xf5\xdbdQu\xea\
-\x047m\x91>\xdb!t\x8d\xce!\x0b\xd4(\x9dY\
-\x9e\xe2\xecR\xc7i\x97,\x84SQ\xeb\x8eYY\x02\
-s\xe3\x1f\xd3g1\x90.\x9ez\xcb0*|\xb9\x80\
-\x04\xd3'\xc8Z\xb3\x88&\xf7\xb2\x7f\x1e\x03H<\xdd\
- d\x81\xcc\xa3x\xaeuT`\xd3\x8aln\xa0\x1d\
-\x89\xd3\x1f4\x0b\x18\xef\xab\x9d\xa6\xe3dH\x1c?\xd7\
-\x89\xa8\xa8Q\xccl\xbb\xbe\xa7\xec\x8bu\xd90W\xdd\
-}>,\x86\xd9\x0f\x01u\x83hg?\x8c\xdc$s\
-(\x18~\x15xI(\xae\xf9\x84\xb0\xc8:\xfd\x81\xd5\
-\x9b9\xa7O\xcd\xf4\x8e\x931YX\x9e\x8a\x9cm\xd7\
-\xd7\xb8x\xea\x0d\x03\xc9\xb0\xbeu\x9f\x22\xf1t/\xf9\
-z&\xbfS\xcb\x94\x01dA3\x17\xc9\x02\x12O\x1b\
-\xe8\xff\x5c$\x14L\xdb'dd\x9d\x11\x5cyEs\
-\xf98\x97\xc7>\xcbC\x82x:'L\xe6yM\xea\
-\xe6\xd2\xb0\xfb\xd0q\x8aB\xa7\x02\xaaY\x9d\xa7\xa2\x88\
-\xa7\xb4\x1b\xbf\xaf\xe6u\x17O\xddg\x90pa\xc7\xf5\
-\x9c\x1e\xa38\xa1\xb1\x96?Yn\xe2\x14Zk&<\
-\x82,S\x8b\xc0\x1d\xe05\xea\x97\xb7\x81\xb2\xf2\xb6Q\
-f\xdeQ\xefO\xd7\xc9\x10\xb3BY\xc9\x8a!\xf2\xb5\
-\xac\x0e\x10*\x1dw\xb2;\x8f],.\xf2\x9dN\xc9\
-\xa2\xb9\xbaY\x9e&(\x9e\xdb\xae\xaf\xdd\xf8.\x9e\xba\
-\xcf\x00\xa1\x18\xe6u\x82\xcb\xee\x11\xa1\x07X?b\xe2\
-\xc9\x02\xe4-\xfe\xe9:*m\xf0\x19\x12OO\x92\xf1\
-<y\x9d\xb5\x19p\xcaK:\xfei\x8cp\x1d\xe4\x81\
-]\x7f&\x9e:\x99\xf7\xe2\x80q\xc7\xe9\x94,\xdcv\
-fy*\x92\xdb.n\x1b\xb3O\xb0J\xf7\x0d.\x9e\
-\xba\xcf \x8a\xffYF.\xac;\xc8]w+\xcf\x93\
-\xea\x01V\xc6\xc0\x16\xae\xc9\xe4\xf8)\x0a\x92\xdf\x07\xde\
-\x22Q\x19\x9b\x9b\x8f\xa2\xd7\x9d\xd2\xa7&\xdf>'=\
-q\xda\x04\x9f\x17\x96\x15\x1a\x8b\xa7v-O\xf1s\xbf\
-&\x9dN\xc8\xa2D\xc1\x00\xa1\x87\xdc(\xed_\xdbY\
-a\xff\xcf\x19\x9a\xbf\x8f\xe9\xb3\xb6,\x86\x8b\xa7\xee3\
-L\xa8\xe7\xf4\x19\xfd\xed\xaa\xbb\x0cff\x1eC1Q\
-\xf7\xa3\xe7+\xe8\xfdy\x85\xdcy\xefP%s+w\
-\xd0W\xa9\xae}Nly\x1a!\xdf]\xa7\x89\xb7I\
-:\xb7<\xc5\xc4\x0b_\x11v\xfbN\xf9HW\xad/\
-;6W\xf7\xa5\xab.\xc6\xc5S\xf7\x19F1>\x0f\
-\x90\xab\xee\x1a\xb2\xb4T\x95f\xee\xbce\x14\x0ff\xc5\
-5\x7fI\x86\xb9H\x0e\xe9\xb3\x8e\xdc}N\xdamg\
-qoy\x91\xb6<e\xe1\xda\x88\x17\xbdZ\xf4\xe88\
-W\xa1\x9f\x0ad\xda}\x7f\x846\xbd.\x9e\x9c+c\
-\x02a\x08\x15\x8b\xb4X\xa7\xfbHH\xf5k\x9c\xd3e\
-H\xbb\xf3\xa6\x92\xe3\x96\x897C\xa8yu\x9e<\xee\
-$\xc3D\x94\xb9\xf3\x9cb\x12\xbb\xed\xac@^\x9e\x93\
-h\xb3\x98\xa7,\x84\x8e[\x9e\x9cv\x89\xaf\x9dN\x84\
-S\x8d\x90\x90aI\x19y^\x8b}]U<\xc6\xc5\
-Sw\x18Bb`\x115\xfa}@(\x869\x85\xbf\
-\xef\xcd\x18F\xf1O\xe7h\x02\x98@V\xa87\xc0\x1a\
-\xa1\xc8\xa6=zPyq\x89-O{\xe4_]8\
-\xcb\x80q\x08\x0b\x9f\xa5a[\x19\x04\x17P\xce\xc7\xc8\
-\xdaMg\xd5\xf3\x17Q\xe8\xc3\x04\xf9\xd6\x0b\xec\xeb\x0c\
-\xbb\x18_\xc4\xbb\xc3\x10\xa1\x8a\xf8c\x1a\xc5\xd3\x10\xfe\
-\xbe7\xc3\xc4\xd38\xb2>-!\xe1\xf9\x16x\x81\x8a\
-l>M^\xbb\x8d\x8b\xa7\xa2S$\xcbS\xbaTA\
-\x16\x96\xa7X@\x15%5\xdc)\x07\xe9\xc4\x83N\x88\
-\xc5\xd3<\xba\xc6\xf3\xbc\x1e\xddm\xe7\x5c\x99t\xdf\xba\
-k\x84 \xf1\xbbH\x0cL\xb5\xfci\xc7\xacM\x13\x84\
-\xea\xe4\xd7\xd1\xfb8\x97\x0c\x0b\xb4?A\x01\xe5'\xc9\
-8\x8dF?\xc4\x0e\x94\x1d\xb3<Y\x9d'k\x0a\x9d\
-\x17\x96\x914Bv\xf5\xa6b\xf1d1O\x8e\xf31\
-\xe2\xeb&\x8bk\xc6\xe6\xcdY\xb4\xe9\xb4\xb2 y\x90\
-\x8eu\xcc{\xd3\xd4U\x5c<eG\x0dYM&P\
-\xd6\xd8}$\x9c>\xc7\x83\xc4\xafJ\xdcr`\x0e\xdd\
-\x94V\xb5|\x05Y\xf2\xde\x12\x5cx\x1b\xc0V2<\
-\xb0<\x7f\xaa2\x89\x9a\xdb\xce-O\xcee\x88\x85S\
-V\xdd\x14\xe2\xb9\xb2\x08E2\xdd\xf2\xe4\x5c\x19+\x86\
-i\x85 \xef!\x97\xddc\xc2\x85\xed\x5c\x0eK-\xb7\
-@H\x8b\x7f\xba\x89\xde\xd7\x0d\xe4\xca\xfb9\x19\xcf\xd1\
-$\xb4\x8b\x8b\xa7\x22\x90\xae\xf3\x94w\xccS7H\xc7\
-=\xb9\xe5\xc9\xb9\x0cV\x03)K\xf1d\xf1|\xe3\xe4\
-\x1f{\xe71O\xce\x95\x19@\xee\xa6\x15T\x08\xf36\
-*\x84y-\xcf\x93*)qF\x9e\x89'P\x1c\xd9\
-2r\x07-\x11*\xb4\x8f&\xaf=CYy\xc7\x84\
-\xbey\x9dv-w\xda\xe3\x1c}\x06\xc7\xe4\x9f\x1di\
-\xd7\x93\x89\xf1Q\xe4\xde0\x8bX;\x13|lA\x18\
-\xc4\xc5\x93s9\xce\xe9\x5cp\x9b\x1bz\x18Y\xe4m\
-\x1e\x1c\xce\xe2\x04;\xc4,O\xfdlq\x06\x5c<e\
-\x89e\xd8=@\xae\xba\x1b\xb8\xb5)k\xe2J\xd5K\
-\xe8\xc6\x9cF\x82\xca\x0al\xc6\xd9y\x07\x84\xb8(_\
-\xdc\xaa\x8be\xdb\x81\xe2B\xac \xeb\x00r/\xecs\
-\xf5\xeb#\x16\xe5i\x01\xe5YwN+\xe2\xea\xdb\xed\
-\x0a\xa8\x11\x14\xe34\x876\xe8\xb3\x14C8\xa5\xb3l\
-\x8f\xe8cO\x80\x8b\xa7\xec\x18\xa41\xc3\xee:\xc1b\
-\xe2dC\xec\xce\x1bB\x96\xbe[\xe8\xbd^B\x22\xea\
-g\xe0'\xb4\xeb1\xd7\x8a\x07\x92W\x1b\x13OCH\
-<\xcd\xa3k\xc5\xaa\xd6\x1f\xd0\x9ex\x8a-\x9bv\xad\
-y\xc1L\xa7\x15\xe9\x98\xa7v\xcb\x15\x0c\xa3k\xf8&\
-\x9a\xff\xe6(\xceZ\xeen;\xe7R\xd4\x90\xb9t\x04\
-Y\x9d\xae\xa3\xcc\xba{HHU\xb9\x0dK7H\xbb\
-\xf3\xac_\xdeX\xf4\xf5\x18!\x9b\xea\x1d\x0a\x22\xb7\xd2\
-\x06G\x04Q\xe5t\x8f\xb8\xd2\xb0Y\xff\xf2v\xdb\xd9\
-\x5c7\x89\xee\xcd\x1b\xe8\xfc\x0e\xe9\xac\xcf\xddyj\xe4\
-\x1ds\xe2\x14\x9b,\xdcvC\xc8\xe2~\x0dYP\xa7\
-)\xceZ\xeen;\xe7R\x0c\x12v\xb1\xb7\x81O\x08\
-\xf5\x9c&)\x86)\xb5\x0a\x8c\xa1\xf7\xdc2O\xa6\x90\
-\x90}\x8b\x5cx\xab\xc8\x8d\xb7\x96\x8c\xbe\xbd\xa1\x0bB\
-\x1d\x89\xa6M$`w\x90\x80*\x02c\x84\x1ab\x07\
-H\x5cgY\xf3\x09\x5c@9\x8d\xa4\x0bcvZ]\
-\xdcj;-P\x8c\xc2\x981nyr.\x85\xb9\xea\
-\xee#W\xdd\xa7\xc8\x8c\xba\x84\x17\xc3\xec%\xa3H<\
-M\x13\xb2\x1d\x1f\xa2\x06\xc3\xcf\x93\xf13Z\xc0\xdf\xd1\
-\xc77tA0W\xd8&\x12\xad\xbb\x14G<\x8d\xa3\
-\xfb\xf3\x1e\x12N\xaf\xe9<\xb5;]m\xdcq\xd2\xa4\
-\x85S'\xd6o\xab%\xb8@(\x8cY\x04\xf1d\xae\
-l+U\xe0\x96'\xe7\x03L\x18\xc5\xc50?GY\
-v\xd6\xa3\xcd\xe9\x1d\xf6yXI\x88)\xb4@\xce$\
-\xcf\xadx\xdc !H\xd8\x5c6\x16P~\xdc\xf3\xb3\
-\xee_\xea\xe8\xfd\xdcE.\xd3\x03\x8a\x138:\x8ab\
-Dn\xa0\xaa\xf5\x13dcy\x8a\xddv\xee\x16vb\
-\xd2\x851\xb3\xaa*^T\xcb\x93\xb9\xed\xf2.\x8e\xdb\
-U\x5c<]\x9d\x01B1\xccE\xb4\x83}\x84\xc4\xd3\
-\x0a!\x0e\xc7\xc9\x07k\xc5Q#\xb8\xf2f\x08\x15\xcb\
-\x1f\x227\x9e\xb9\xf36\x90\x85\xc43\xf2\xb2#]$\
-\xb3H\xe6\xfb\x11B\x86\xe6,\x9d\xc7%\xa6\x83\x80\xad\
-\xd3\x80\xe3\x18Y\xd7v\x8a-O\x0b\xc9\xf3\x22\x89\xa7\
-\x22\xde\xf7\x99\xe3\xe2\xe9\xea\xd4\xd0\x84;\x87\xacNV\
-\x0c\xf3\x0b41\x8f\xe6vf\x0e\x84\xae\xe2\xd6\x8ec\
-\x06\xc5\xa1\xddF\x22w\x13\xf8\x05\xf8\x11\xf8\x01\x15\xdb\
-<M\x8e;\xd9Q\xd4\x22\x99&\x9e\xea\x84\x96?Y\
-X\x9eb\xe1\xe4\x22\xdc1\x9aU\x15\xef\x94\xa25\x03\
-\x8eI7\x04/\x8a\xc59s\x5c<]\x9d\x1a\x9a|\
-\xaf\xa3X'K\x95_\xc8\xf1\x9c\x9c@:#\xcfj\
-mM\xa1\xf8\x80\x83\xe4\x98\x15\xd7\x9c$X\xaa\x0e\x08\
-\xee\xbc8+\xc6\xb9\x1a\xe9z/6\xf6\xd1\x9cc\x9f\
-O\x1e\x0c\x11\x5cu\xb3\xe8^\xb6\x9e\x93\xd6\x1f\xf1\xaa\
-\xc4\x8b\xe3\x10\x8de\x0b\x1c\xc7\xae\x8dN,O6\x9f\
-\x8d\xa0yl\x1e\x89\xff)4\x7f\x15\xc1\xdai\xee\xfa\
-=\xb4\x19\xdd\xc3\xc5\x93\x131\x80.\xdc{\x84b\x98\
-\xee\xaa+>V\xeb\xa7\x86,\x86\x03h\xf2YN\xc6\
-\x12r\xe3\xd98\xa6X\x16\x932a\xedYj(\xee\
-i\x0b\x05\xea\xaf\xa3{e\x8a\xfc\xc4\xd3 A,[\
-\x82\xc1rr\xdcD^;5\x9f\xe0\xc3\x14t\x17P\
-\xd5%}MtZ\x18s\x08\xcdW\xf3(\xb6v\x19\
-Y\xd5\xc7\xd1\xbcV\x04\xf1\x04\xda0m\xa1{\xdd\xac\
-O}\x89\x8b\xa7\xabc\xe2\xe9>r\xd5\xdd\xc4\xc5S\
-\x19\xb0Es\x84Pd\xee>\xa1V\xca\x0ar\xe5\x0d\
-\xa1\x9b\xbeFh1\xe2\x5c\x0d\xb3<\x9d!\xf1\xb4I\
-h\xe2\x5c'X\xfd\xf2\xc0\xdc\xba\xc3\xc8\xf2d\xd5\xc6\
-m\x81\xdbk\xe3w6\x13O\xf1\x02\xe9\x02\xaa\x9a\xd8\
-u`\xc2\xe9\x94\x0f\xaf\x8d\xcbbs\xd6-$\x9eV\
-\x08\xe2\xa9(\xa51\xeaH<m\x12J\xc2x\xccS\
-\xc5\xb18\xa7q4\xe1\xda\x05|\x07]\xd0^\x0c\xb3\
-\xf8\x98;\x0f\x82\xeb\x06\xb4\xd8\x0d\x12\x0am\x0e'\xdf\
-\xdf\x8a\xc6a4\x9c\xcba\x16\xbb#\x14\x94\xff\x12\xed\
-\x96\xeb\xc8\xf24\xd5\xe2\xe7\xbaM|\x1d\xd8\xfd\xbc\x84\
-\x5c\xb6\xbb\x84\x0a\xe1W%\x16P\xa7hA\xb3a\x7f\
-\xd7\xa9\x0e\xe9\xc6\xd1\x9d\x86\x00XG\x05\xdb\xe8Y\xb2\
-C\x11\xd6p+>\xbc\x87\xe6\xcb]t?\xf55E\
-x\xe3\xcb@\x8d\x10 ~\x0b\x15\xc3\xb4zN\x13x\
-1\xcc23\x81>\xc78\x9e\xe0&\xc1}\xf76z\
-t\xf1tu\xce\x80\xf7\xc0\x13\xf4^\x8f \x11\xb5\x98\
-\xe39\x19\x96P\xb0\x8cJ*\xbc\xcb\xe0w\x9ax\x82\
-\x10\xdfeqP.\xa0\xaaC:\xc3\xaeS,\xc3n\
-\x9e\xe2\x05\x89\xef\xa1\x0d\x92\x15!\xee{\xe1\x04.\x9e\
-.K\x8d\x10\xe7d\xc50o\xa3Iw\x80\xe2\x5c\xc4\
-\xce\xd5\xb1\x05\xdd&\xa5;h\xf7\xf4\x1cx\x06<M\
-\xbe\x7f\x80&\x06\xe7j\x9c\x22\xf1\xf43\xbaO\x16Q\
-\xb9\x88\x22`\x99wK\xc8\xad\xd8i\xe6]\xb3~w\
-iK\x96\x0b\xa8\xfe\xa7Y\x86]\x16\xe5\x09&h,\
-OP\x84\xf5\xbb\x8e,Mo\xd1|\xb9\x86\x12C\xfa\
-\x9e\x22\xbc\xf9e\xa0FHC\xae!\xa5\xfd\x16\xb78\
-\xf5\x1b\x87H$\x1d\x10z\xe0\x99\xe5`\x18\xc5\xe9\xd8\
-d\xe8\x81\xe4\x97\xe3\x1cM\xa6\xb63-R\xb5\xf11\
-\xb4\x10\xddB\xe2)\x8b\xe2\xb6q\x9b\x96A\x1a+\x8f\
-\xbbp\xaa\x0eYd\xd8\xc5\x14\xb90\xe6\x1e\xb2\xce?\
-E\xf7\x91\x8b'\xe7?\xb1@\xb8-$\x9a\xcc\x15\xf1\
-c\x9e'\xe5d\xceI4\xac\xa1\xf0&\x9a\x0cjh\
-\xc2\xf2,\xbc\xab\x11\x97-0QZ\x94 Rk\xd5\
-r\x8c\xda\xb4L\x91\x8d\xc0\x89c]\xce\x08\xb1O.\
-\xa0\xfa\x9b8\xcb2\x8b\x0c\xbb\x98f\x96\xa7\xa2\x8a'\
-w\xdb9\xffI\x9cE0\x82b#~\xc6\xdf\xbf~\
-#mn\xb7\x0c\x19\x13O\x93\xc9\xe3\x19\xc5\xb1\x9e\x14\
-\x1d+[p@\xf1\x0af\x9ax\x1aA\x85S\xed\xf3\
-\xed\x84x\x91\x8c\xc5S\xbb\x81\xe8N\xb9H\xcf\x1f'\
-\xd1\xf1NhVU\xbc(\xeb\x8f\x89\xa7'\xb8\xdb\xce\
-i\x82Y\x9e\x9cja\xc2\xd9\xfa\xb3e\xb1\x8b\xac\x12\
-&\x9e\xac`\xe6\x0e\xb2\xe8\xed\x10\xb2\x1b\xf3\xdaA\x0f\
-\x13jN-\xa3\x9am\xb7\x93s\xdb\xa7\xf3E n\
-\xd9\x12W\x1fw\xebS\x7fb1oY\xc5:YV\
-\xf08r-\xaf\xa0\xd8\xcc\xa2\x15\xc6<@n\xf9\xd7\
-\xc8\xc0p\x94\xe7\x09\xf5\x0a\x17O\x97#v\xdbU\xe2\
-\xc2p\x1a0W\x9e\xed$\x8b\xe2v*\x03\xb1\xdb.\
-.\x98\xf9\x8eP\xb2 \xcf\x82\x99V`p\x19%\x84\
-|\x09\xbc\x02\xde\xa0E\xa1\xdd\xc5/\x8e}\x82\x90X\
-\xe2\xa5\x0b\xfa\x17\x13M6Gt\xba\xc9\x1aF\x96\xd1\
-\xeb(Q\xe9\x16\xca\xfa\x1eO\xbeW\x04\xf1\x04am\
-\xb4L\xbbJ\xac\x91.\x9e.\x87\xa9\xeb#\x8as\xc1\
-:\xbd\xa3\xded8\x97\xc3,O\xa7\x84\x82\x99&\x9e\
- \xdf\x1ai&fF\xd0\x22u\x1fY\xc5\x86\xd0\xfd\
-\xfe\xa6\xc3\xdf\x1f\x17\xcc\xb4\xe0q\x08\xd7\x8f\x0b\xa8\xfe\
-\xc1\xc4\xb2m\xb0\xb2H*\xb1\xb2\x1e\x0f\xf9P<\x15\
-\xa50&4\x8a\xa7\xca$\xd3\xb8x\xba<\x95\xb9(\
-\x1c'cL@\x1c\xa3I\xf6\x0d\xb2\xee\x0c\xa2:K\
-y\x11\x07p[\xbfJ+\xf4\xf7*\xa3\xbf\xd1,\x8e\
-\xce\x8bg\xf6\x0fqq\xd4\xb3hd\xb1\xc92Q\xff\
-\x09jj~\x9d\xe2d\xd9Y\xd1`s\xd9\xed\xd2\xc7\
-\xadX\x9a\xe1\xe2\xc9q\x9c^q\x86\xe2\x89^\xa3z\
-OS\xa8\xf0l\x11\x18G\xbb\xfcS\xe0\x05\xd9\xb6\x5c\
-\x8a[t@(\x7f\xe1\x02\xaa\xfc\xa43+\xb3\xdcd\
-\x9b\xe5\xe9S$\x9e\x16)N7\x8b=\x94q\xbeN\
-\x85\x82\xc4c\x5c<9\x8e\xd3+\xce\x90[\xec5\xa1\
-b\x7fQ\xe2#\xac\xd2\xfc(*Ab\x99wY\xb9\
-h\xcd\xa5c\xbf/\xb6>y\x10yyI\x17\xc3\xcc\
-\xaa\xa28\x84\x98'\x13O&\xba\x8b\xc0>\xca\xb0\xab\
-Ta\xcc\x98\xa2|\x10\x8e\xe3\xf4?\xd6x\xf7\x1d\x9a\
-x\xb7)N\xc9\x87aB\xed\x9c\xeb\xc0\x03\xe0st\
-\x8e6\xda%n\x10\x0b\x8du\x9fb\x11\xe5\x94\x83\xb8\
-\x9e\x93Y\x14cw]'\x0c#W\xf6\x0c\x8au\xba\
-\x852\xec\xc6;\xfc\xbdYs\x80\xe2\x17\xdfP\xd1D\
-*\x17O\x8e\xe3\xf4\x8a\xb8\xda\xf8;\x8aUm|\x90\
-\x90\xfem\xd9M\xbb\xa8\xfe\xd3S:\x13O\xd0\x18\x1b\
-\x13\xd7\x7f\x02/\x9eYF\x9a\xd5s\xca*H\xfc\x06\
-\xca\xfc\xfc\x02\x95\xce\xc8\xa2\xf2}\xd6\x1c\x11\x82\xc4\xb7\
-q\xf1\xe48\x8e\xd35\xce\x09;\xd6w\xc8\x0auz\
-\xd1\x0f\xf4\x90AB\xe9\x82\xeb\xc0g\xd1\xb1\x1dT\x00\
-\xb0\x13\xe2\x00b\x13NV\x03\xca)\x17\xe98\xa7,\
-\x8ba\xda\xf5\xf7+\xe0\xd7\x14[<m\xe3\xe2\xc9q\
-\x1c\xa7\xeb\x9c\xa3\x8c\x9c=B\xeb\x9b\x0d\xb4\x83\x1dI\
-F^\x99D\xb5\xe8q\x02\x05\xe7\x1e\xa2\xe0\xf1Y\xe4\
-6\x89\xb3\xa9\xda%Ni\x8f\x19$X\xa0\x5cP\x15\
-\x93\xd8zh\xae:{\xecD4\xd5\x08B}\x0a\x15\
-\xc3\xbc\x87\x5c\xc7\x8b\xc8\x22Z4\xf6Q\xb0x\xa5Z\
-\xb2\xc4\xb8xr\x1c\xa7WX\xcd'\xf8\xb0`\xe6t\
-2\x8a\x90\x86=\x8abN\x8eQ+\x8c\x19B_\xc3\
-#\xb2\x11O\xf6<\xc6\x0ai:\xc5#\x1d\xe7d\x85\
-s\xb3p\xd5\xd5P\xac\xd3\x08\xba\xd6\x96\x91\xc5\xe9\x16\
-\xba'F:\xfc\xfd\xdd n\xc9b\x15\xf9+\x85\x8b\
-'\xc7qz\x85U\x1bO\x17\xcc|\x8f\x84CQ\x82\
-bM<\x0d \xf14Kc_\xc3N\xeb\xd9X\xf1\
-\xccs\x1a\xadLV\xbe\xc0-O\xc5$\x0e\xfc?%\
-\x5c\x07\x9d\xba\xeaj\xe8\xb3\x1fGbi\x09\x89\xa7\xdb\
-\x147\xa1 \x16O\x95lY\xe5\xe2\xc9q\x9c^b\
-\x93\xec1\x12NO\x90P9'\xb4k\xc9\x9b!B\
-=\x9d\x15\xe0.\x0a \x7f\x9b\x8c,v\xd9q\xfcS\
-\x1aw\xe1\x15\x87f\x81\xfeY\xf4\xad\x8b\x19A\xd7\xd9\
-Mt\x9d\xddA\xf7\xc4pF\xbf?+\x0e\x08\x0d\xbe\
-\xd7)V\xc2G\xcfq\xf1\xe48N\x1e\x9c \xf1\xf4\
-3\xdaqO\xa2\xc5\xa3\x08X\xe6\x9d5\x0c\xbeOh\
-d|\x80v\xdcY\xe1.\xbc\xe2\x12\xbb\xea,\xce\xc9\
-F\x96\xdd&\x86Q\x90\xf8\x97(P\xfc6\xd9\x16i\
-\xcd\x0a\x13Mk\xe8\x1e\xd8\xcb\xf7t\xf2\xc5\xc5\x93\xe3\
-8yp\x82&b\xcbp\xbb\x81\x02\xb4\x8b\xc0\x10A\
-@\x99x:C\x8bG\xa7\xfd\xeeb\xe2\xd6-iw\
-\x9d\xbb\xf0\x8aA\xdaUgM\x7f\xb3\x14O#\xa8`\
-\xec\x17\xc0\xef\x90\x90*\xa2x2W\xddS$\xa0\x5c\
-<9\x8e\xe3\xf4\x98\xb8`\xe6\x1b4)\xaf\x11\xb2\x8b\
-F\xc8w~2\xd1b-d\xea(Fk\x1b\x9d\xf7\
-N2v3\xfa{q\x11\xcd\xf49\xb8\xfb\xaew\xa4\
-\xadMq\x86e\x9cY\xd7\xa9\xcbn\x88\x90$q\x0b\
-e\xd6\xddA\xd7Z\x11]v\xa0\xeb\xffg\xe0?\x80\
-\x9fP\xa6leq\xf1\xe48N\x1eX\xc1\xccs\x82\
-pZC\xb1\x1f3\x14\xa7\x15\xc5$\xb2>\x8d\x11\x84\
-\xd3!\xf02\x19Y\x89'h\xb4fX\xf5qh\xac\
-H\xeet\x9f\xb4\x9b.\xce\xaa\xcb*\xd6i\x08%#\
-\xdcB\x95\xc4\x1f \xb7\xb5\xf5\xaf+\xc2\xb5\x9ff\x03\
-\x89\xa6\x7fA\xf7\xaa\x8b'\xc7q\x9c\x1esF\x08@\
-\x1dG\x02j\x15\xb9\xef\x06Qi\x80\x22\xd4\xb7\x99 \
-\xf4\xbd\xdbG\xc2\xc9\x82d\xadO_\x16\xc4.<\xeb\
-u\xe7A\xe3\xbd'.\x80i\x19u\xc7d\x9fMf\
-\xe2\xc9\xda\x00}B\x10OP\xcc\xcf<\x16Oq\x9f\
-\xc6J\xe2\xe2\xc9q\x9c\xbc\xb0\xc9\xf7\x10\x89\x90o\x90\
-\x85\xe53d\xf1)B\xdc\x87-b\x03\xa8\x99\xf1\xbd\
-\xe4k+\xf8y\x88\xacQ\xfbdW(\xd0\x5cx\xd6\
-\x98x(\xf9{q\x16^|nNg\xa4k8\x99\
-\x8b\xce\x02\xc3\xb3\x12\x09\x03\xc8\x1d=\x8aD\xd2=\x94\
-]\xf79\xda4X9\x8c\x22\xb1\x89D\xd3\x06j\x98\
-\xbdN\xf6\x01\xf3\xa5\xc4\xc5\x93\xe38ys\x84\xc4\xd3\
-\x10Z\xa8&Q\xfcG\x91\xa8\xa1zO\xa08\xa8#\
-$\x9av\x09n\xc7,\xc5\x93Y>l\xf1\xb6\x91v\
-\xe1\x15m\xb1-+q\x8cS\x5c\x00\xb3\x93\x82\xa8i\
-j\xc8\xca:\x8b\x82\xc2M<=&T\xb1/\x1a\x9b\
-(\xce\xe9G\xe0\x07T\x93\xad\xd2\x16'\xc3\xc5\x93\xe3\
-8yc\x96\xa7m$\x18\xeeP\xcc\x8a\xc5\xb3(\x1e\
-\xeb\x06\x8d-f\xea\xc9\xd7\xef3\xfa;\xb1\x05\xa4Y\
-\x81Dw\xe5eK\xbaW\xdd\x09\xddq\xd5Y!\xd8\
-9\x14\x18n\xf5\xc3\x1e'\xdf/\xe2g\xba\x89\xc4\xd3\
-\xbf&\x8f\xefr=\x9b\x02\xe1\xe2\xc9q\x9c\xbc\xa9\xa3\
-\xc5\xaa\x86Z\xb6\xac\xa2\x9er\xd3\x04\xf7]Q\xb2\x8f\
-,\x90{\x0e-~\xfb\xc8\x9dv\x82D\xe0Q2:\
-\xadBn\xc4Yx\xb1ud\x90P\x0b\xca\xc5\xd4\xd5\
-9o1\xb2v\xd5Y\xdf\xba!d\xb1\xb4\x18\xa7/\
-\x90h\x9a\xa3x\x9f\x9d\xb5!\xb2M\xcds$\x9c\xde\
-\xa2M\x82[\x9ep\xf1\xe48N\xfe\x9c\x13\xdc$\xd6\
-\xa9\xfd9\xb2\xf2\xac \xe1T\x14\xf1\x04Z\xec\xe6\x90\
-x\x1a@\xe7\xbe\x8b\xce}\x8b \x06\xb3\xe2<z\xb4\
-\x9aP\xe7h\xfe\x8e\xb3\xf2\x8a\xb6\x08\x17\x99\xb8UP\
-,\x9e\xb2\xae\xe1\x04\xbavG\x91\xe5\xf2\x01\xf0_\x80\
-\xdf\xa3,\xce\xd9\xd6?\x96\x1b\xc7\x84k\xd9\xc4\xd3\x13\
-*\xda\xc3\xae\x15.\x9e\x1c\xc7\xc9\x1bk\x18|B\x10\
-O/\x90@\x19I\x1e\x8b\x84\xc5?Y\xad\x9e]\xe4\
-\xb2[C\xffK\x96\xc5>\xe3,\xbc\x1aA<YF\
-\xde`\xf4\xdc\xb9<q6\x9d\x09\xa6n\x04A\xc7}\
-\xeb\xe6\x90x\xfa\x03\xf0\xf7]\xf8[YqD\xb8\x0f\
-_\xa3{\xf1)\xd9\xc6\x7f\x95\x1e\x17O\x8e\xe3\x14\x89\
-c\xe4\xb6\xfb\x11\xed\xd6'Q\x8cQ\x91\xb0\x05q\x8c\
-P\xe4p\x0f\x09\x99\x1f\x92\xef\x1f\xd2XX1+b\
-\xd7\x9d\x09&s\xe1Y \xb9g\xe4\x05\xd2% \xec\
-1\x9dM\x97\xa5+*v\xd5\x8d\xa3\x18\xbe\xbb\xc0\xa7\
-(\x93t.\xc3\xbf\xd5\x0dvQ\x0d\xb3\x1f\x80g\x04\
-k\xaa\x13\xe1\xe2\xc9q\x9c\x22q\x8c\xd2\xa1M\x9c\xdc\
-D;\xe1\xa2a\xed[jH<\x0d\x12\x9a\x1a\xdb\xae\
-\xfd\x88\xe6\x95\xc3\xdb%^\xc0\xecwZ\x09\x03[\xac\
-M@\xc5\x81\xe6U\x16P\xf6\xfe\xa7\xab\x85\xc7\xd6\xa6\
-n\x08\x03\xbb~gP{\x9f\xdf\x03\xbfF\x19vs\
-]\xf8{Y\xb2\x83\xc4\xd37H<m\xe6z6\x05\
-\xc5\xc5\x93\xe38E\xc2\xc4\xd3\x01Z|>Cq\x16\
-fi)Jp\xf4P2\xac/\xdf,*\xa4\xb9\x0d\
-\xbcBq\x22\xbb\x84\xec\xad\xac\x16h\xb3\x92\xd4\xa2\xc7\
-X\x00\x98\x15\x0a\xdc\xfa\x04\xcd\xab\x85w\xb3\xc0\xa3]\
-\x9f#\xa8\xb8\xea\x1cr\xd5\xfd\x1e\xf8[dI\x9d\xe8\
-\xd2\xdf\xee\x14{Ov\xd05\xfc\x1dr\xdb\xb9\xe5\xa9\
-\x09.\x9e\x1c\xc7)\x12\x16<~\x80\x0a\xf3=\x01\xfe\
-\x8c\xac8\x8bH\xa0\x8c\xe5ur-\x18BV\xa8i\
-dY\xf8\x1b\xb4x>K\xc6[\xc2\xe2\xdd\x0d+\x94\
-\x89\x03\xb3\xb2\x0c4\x19\xfd\xee\xce\xab\xa7\x86\x09\xcaf\
-\xd6\xa6na\x82z\x14YLo\xa2\xeb\xe1!J|\
-\x98@\xd7\xc5`\x17\xcf\xa1]\xac\xe0\xeb!\xa1U\xd2\
-\x1a\xda\x0c\x14\xd1\xf2\x9b;.\x9e\x1c\xc7)\x12q\xe6\
-\xdd;\xe0\x17\xe4\x0e;F\xa9\xdd\x93\x14K<Y\xfc\
-\x93\x09\x93\x07h\x81\x5cD\x0dTO\xd1N\xfe\x90\xec\
-\x8b.\x9a\x80\x8a\xe3yb\xa1T5w^+\x17]\
-\xec\x9e\xcb:\xbe\xc9\x88\xe3\xe0\xa6\x80\xdb\xa8\x1c\x81\xb5\
-^1\xf1d\x9fI\xd18F\xd7\xe9&\xa1U\xd2*\
-\xb2\x9ev\xa3\xe6U\xe9q\xf1\xe4\x94\x99f\x93\x7f\xad\
-\xc9\xf3f\xc7b\x9aM\x0c\x17\x1d\xeb\xd6\x04\xec4f\
-\xdem\x22\xf7\x97-\xfc\xd3(\xf8\xd6\xde\xfb\xa2,\xfe\
-fq\x18F\x8b\xe6\x02*\x82x\x84v\xefo\x08s\
-m\xda2\xd2)\xe9k1\xb60}\xcc\x9dG\x8b\xaf\
-\xcb@\xfa\xbdK\x0b&s\xcfu# <\xc6\xdek\
-+\x809\x85\x84\xf3]$\x9e~\x8bJ\x12,S\xcc\
-\x0a\xe2\xc6\x11r\xcf\xbdM\xc6\x1a\xda\xbcdYr\xa3\
-\xafp\xf1\xe4\x94\x15\xdbQ\xdb\xae\xbf\xd9\xf1V#~\
-\xfdi4\xf8\xc8qKC\xb7b\x88Nw9#T\
-\xee~\x87\xc4\xd4.r\xe9\xd9g\xd9\xac\x02w^\x98\
-\xf5!\xae\xe9\xb3\x8b\x16\xd4w\xc9x\x8f\xfe\x8fM\xf4\
-\xbfeM\xda\x9dwFc\xaf<[\xe8\xd3\x8f\xcd,\
-RE\x11Ui\x97\x5c\xbc\x89Ig\xd1\xc5\x22\xaa\x17\
-\x9b\x9cQ$\x8a&\x90\x8b\xee.\x0a\x10\xff\x04}\xfe\
-\xcbH\xf4\x17\xa9NY3vQ\x9c\xd3_\x09A\xe2\
-\x95\xef_w\x11.\x9e\x9c\xb2\x127\xd9\x8c\xcd\xe0v\
-l,5F\xa3\xc7xQ\xb0\x8a\xd0\xe9\xda<\x87M\
-\x8e\xd7\x09\xed8\x5c<u\x9fS\x82xZG\xef\xfd\
-\x0e!\x98\xbch\xee\x8ff.<\x8b\x7fy\x89\x16\xa7\
-\x97(\x8e\xeb\x98\xee\x88'\xf8\xd0\x9d\x97\x8eu\x8aE\
-\xd3`4\xd2\xaf+R\xfd\xa8\xb8\x85JZ(\xa5]\
-ri\xcb^7\xadNcH(/\x02_\xa2x\xb7\
-\xdf$\xc7\xac\x9d\xcfH2\x8a\xcc\x1e!\xc3\xee)\x8a\
-7t\xeb\xfa\x05\xb8xr\xf2 =\x91\xc7q\x1a4\
-y\xde\xec\xd8\x08!s%^D\xc7\x92c6&S\
-_O\xd0\xb8 \x1c\xa0l\xaet\xe5\xdc}4\xa1\xc4\
-\xc7\xeb4\x8a\xb5\xb4\x1b\xaf\xd9\xee\xb8\xd9\xc4\xee\x93\xd2\
-\xe58#\xbc\xff\xeb\x04\xcb\xcd|r\xac\x88\xc1\xb7\xcd\
-\x5cx\xb7\xd1\x82\xb4\x88\xae\xc7c$\x04\xb7h\xb4\x0e\
-e\xc9E\xd7Y,\x9e\x86\xa2\xd7\xa5\x03\xcb\xaf*\x9c\
-.\xfb\xfa\xab\xfe\xaf\xb1H\x8ac\x98\xec\xebnf\xcf\
-5#\x0e\xc4\x9fA\xd6\xa5[\xc8M\xf7\xb7\xc0\xdf\xf5\
-\xf0\x5c:!~\x0f7\x09\x96\xa7W(P\xdc\xe7\xa9\
-\x0bp\xf1\xe4\xf4\x1a\x9b\xb0\xe3\xe0\xcaid\xfaN\xbb\
-\xd7\x86/\xf8\xdavs\xa34\xba\x1c\xac\x15\xc2\xc8\x05\
-\x8f\xf1$\x7fL\xe8\xe5D\xeax\xbaG\xd99\xb2|\
-\xec 3w\x9c\xfe|@p\xe9\xd9\xf18\x83\xe5 \
-z<\xb9\xdc[Uy\xe2\xcc\xbb\xf7(x|\x16\xbd\
-\x8f\xf7\xd1\xe7YTwH:\x80x\x89\xb0\xc8[\xfd\
-\xa7q\xb4\xc3\xdf\xa0\xb7m/ba\x1f\xd7\x8b\x8a\x05\
-S:\xc0\xfcc\xae\xbcV\x82\xab\x95\xf5\xe7\xa2\xe3i\
-\xd7\x5clM:o\xf2u\xaf\x99D\x9f\xe9\x0cr\xcf\
-}B(\x80\xb9\x98\xc3\xf9\xb4\xcb\x1e\xe1\xfa\xb3\x82\x98\
-\xabH\xd4\x1f\xe2\xe2\xe9B\x5c<9\xbd\xa6\x86\x16<\
-+ w\x1d\x05\xd7\xce\xf3\xa1\xab\xcd\xdcl\xe3|\xe8\
-\x8a\x1b\xa6\xd1\xdd`\xc4\xae\x88\xb4[\xa2Y\xa6K\xbc\
-\xa3M\x1f?kr\xfc8\x1a\xb10\xdaL\xc6vt\
-|\x9f`a\xb0\xef\x9b\xd8r>\xce9\xa1}\x86e\
-\xde\x81\xde\xbf\x11t\xedL5\xff\xd1B0L\x10!\
-\xd6\xccw\x84P\xd8r\x14\xb9\xf0\x8e\xc8G<A\xb8\
-\xfe\x9bYz\x9b\x959h%\xa2\x9ae\xf3]\x94`\
-\xd1,\x90;\xedrk\x15\xe7\xd4LX\xf5\x92I4\
-g\xdd@.\xba_'c\x9e`\x15-\x03{\xc8\xca\
-\xf4\x04Y\x9c\x9e\xa2`q\xcb\xb0s.\xc0\xc5\x93\x93\
-5\xf1$\xdb\xac\xd6\x8c\xb9\xdb\xe2\xac\x94;\x84T\xde\
-\xcb\x8e\xbc\xaf\xdd:\xc1\xdd\xb7\x8b\xdcJ\xeb\xc8B\xb2\
-\xd7\xe4\xf8:!Ng\x98\x8b\x83]\xbbU\xf5\xb8l\
-\xd4\x09V\xbc-\xd4c\xeb\x10}\xf6\xd7Q\xfd\x9ci\
-\x9a\x8b\xe8\xbc\x89K\x05\x98`\x1fA\xd7\x805\xf5\x1d\
-FBp\x8bPP\xb3\xdb\xb5\x88\x8c\x8f\x89\x8e\xf8\x9e\
-m&\xa0\x9a\x89'\xeb\xb9\x17\xff\x8df\x7f+}\xcd\
-\xa7\x8f\xa7+\x7f\xe7u/\xc4B1\xfe,\x17\x91+\
-\xf6\x01r\xd5\xfd\x0ee\xd5\x95\x81\xf8\xbd\xdfBqN\
-\xdf\xa2vH/\xd1\xfc\xe5\xc2\xe9\x12\xe4\xbd\x009\xfd\
-\x85\xb9*\xccu6\x9d\x8cId=\x1aO\x9e[0\
-\xe5B2\x16\x09\x81\x95i\x17[\xfa\x98\xed\xe6\x8b\x80\
-eV\x81&\xa3\x11\xf4\x7f\x99\xbb\xef\x90\xe0\xe6\xdb&\
-\x98\xc8\xb7\x91\xb5*\x1e\x87Ht\xd9\xeb= \xbd\x11\
-\x0b\x1e\xaf\xa1\xdd\xf2/Hp\x1f\xa1\xdd\xfe\x02\xc5\x0d\
-\xca5k\xeb8\xbaNn\xa0s\xb5\xafI\x9e\xbf\xa7\
-\xf7.\xbcV\xd8\x22;@\xf3\xea\xee\xcd\xca\x1d\xb4\x8a\
-\x93\xba\xc85\xd7\xcc\xf2\xd4L\x80\xe5\x81e\xee\x0e\x13\
-\xacJ\x0b\xc8e\xfc y\xbcO\xf1\xdb\xad\xc4\x98\x1b\
-\xfc\x00\x89\xa5\x9f\x91xz\x86\xae=\xcf\xb0\xbb$.\
-\x9e\x9c,\x89]r\xd3\xc8:p\x1d-rs\xc9\x98\
-Gbi\x11\x09\x8dfn\xb8\x8b\x5co\xb6\x0b\xce\x9b\
-8\xb3\xca\xc4\xe2\x0c\xa1\xc0\xa3Y\x11\x8e\x93c\x87H\
-4\xc5Bj35\xd6QM /\x85\xf0!\xa7\x04\
-w\xc2+4\xe9\xcf\xa0\xf7\xfa\x01\xba\xde\x8a.\x9e,\
-\xdeo\x84F\x17\x8f}\xff\x09\xc1\xdd\x9b7&Z\xe2\
-\x06\xc4\x17\xddw\xad^\xd3J\xfc4;\x9e\xb64\xe5\
-m}\x1d$\xccO7\x08b\xe9A2\xee\xa1\xebn\
-&\x9f\xd3k\x8b\xb8\x18\xe6K\xe0'\x94a\xb7\x8e6\
-'Y\x16q\xedk\x5c<9W!\xde]6\x137\
-\xc3\x84\x0c\xb79B7\xf1\x9b(`\xd6\x86\xb5\xd9(\
-r\xbc\xcae\x88]2\x1f+\x80g\x99c\xfbh\xf2\
-2W\xde\xbb\xe8\xf9,z\x0f\xcf\x09\xb11u\x1a\xdd\
-9\x96\x99U5\xd7\x9e\xbd\x07\xd6>\xe2\x19z\xcf-\
-vh\x9e\xc6d\x84\x22\x08l#\xbe_\xac\xe7\x19h\
-\xd1=\x22\xc4\x1c\xd5\x91E \xfe\xcc-\x9b\xacW\xee\
-\xbc\x98\xa2\x88\x98^\x12\xd7\x89\xb3\xa0\xf0\x19$\x96>\
-GA\xe1w\x93q;\xa7s\xbc*\xb1;t\x17\xdd\
-?\x16\xebd\xa3[e3\xfa\x16\x17O\xceU0\x13\
-\xf60aR\x99N=7\xf14\x8dD\xd2\x02Z\xd8\
-,\xabn:y^\xb5k/v\xdd\x18cHd\xae\
-\xa0Im\x03e\xee\xbcA;C+\xa3\xb0G\xb0Z\
-\xedE\xc7\xab\xbaK<@\x81\xad\xe9\x18\x9b[\x047\
-pQ\xb3\xf0b\x86\xd1\xb9~B\x10\x80w\xd0\xfff\
-\x9f\xf7&r\xe7\xbdG\xff\xb7\xd3],\x16s\x01Y\
-\xcdoD\x8f6\x16(ns\xdff\xc4\xae\xba\xa7\xa8\
-\xe1\xefw\x84\xb2\x04\xe9\x02\xc1\xce%\xa8\xda\x02\xe6\xb4\
-\x8f\xb9\xa9Fi\xcc6\x89\xc7r\xf2=\xab\xad\x14\x17\
-\xa6\x1cn2\xaaD\xec\xba1\x115\x8f&\xb6c4\
-\x81Yv\x9e\x0d\x8b\x91ZG\xdd\xcd_'\xcfk\xc8\
-bQU\xf1t\x88\x04\x86\xc5\x86Y\x9c\x8c\xa5W\xcf\
-P\x8e\xebk\x18Y`'\xd0\xbds\x17Y\x22\xd7\x08\
-\x9f\xf7\x0b\x14\xdfe\xa2\xd9\xe9.\xd3\xc8\xa2t\x1f\x95\
-\x1fx\x94<6\x9b\xd7\xca\xc2\x09A\x88\xff\x02\xfc\x09\
-\xf8_h\x93\xb6\x85\x8b\xa7\xb6p\xf1\xe44#\xce\x96\
-3\xa1c\xa2i\x0a\xb9\x97n\x13L\xd7\xe6\x9e\xbbN\
-\xc8\x86\x1b\xfd\xe0\xb7V\x9b\xd8u\x03\xcd\xdd|&\xa0\
-\xf6\x91\xe5\xc1\x5cz\xaf\x91\x85\xca,zk\xe8\xfd\xdd\
-#\x88\xaft\x03\xd4~\xc6JEl\x12\x0a\x97Z\x0d\
-\xb0i$\xecM\xa8\x16%F\xae\x19\x83\x04\xab\xed\x12\
-\xba\x7f\xf6\x91\x95\xe9\x19\xc1\xb5m\xb5\xa1\x86\x09n\xbc\
-xx\x90\xef\xd5\x89\xe3(\xe3\x1arw\x085\x9b>\
-C\xae\xba\xc7\x14'I\xe5\xb2\xc4\xc1\xf7\xfbh\x1ey\
-\x81\xea9}\x0b|\x85\x04\x95\xd3&.\x9e\x9cf\xc4\
-\xee\xb9k\x84ZL\xb3\x84\xc0\xef\x05\x1a\xb3\xe5\xcc\x94\
-]\xc4\xaa\xcfe!\xed\xda\xb3f\xa3\xd3h!\xbdK\
-\xb0Fm \x11\xf5\x16\xed \xb7\xd1$y@\xb5,\
-RG\xe8\xbdxNp\xb9\xac\x10\x8aP\xa6+\xca\x17\
-\x95\xd8\x229\x8b\x5c\x90\xf6|\x01\x05'\xaf\xa2\xcf\xd9\
-\x12\x0e\xac_\x9e'\x17\x5c\x1d\xab37C\x98\xc3\x16\
-\xd1\xfbn\x9b\xc2\x1b\xe8\xfd/\xc3\xf5\x93\xc6\x0a\xcc\x9e\
-\xa29\xe2[\xe0\xcf\xc0\xf7(P\xdck\xcdu\x88\x8b\
-'\xa7\x19\x16\x84k\xcd.\xbfD;0\x0b\xf4\x9eO\
-\xbe\x1f\x8f1$\x9c\xd2MF\x9d\xcbc\xfd\xfa\xe2\xc0\
-\xe2y$\x5c\xad\x07\x9f\x05\x9co\xa3\xf8\x85o\xd0}\
-\xfc:\xf9\x1dUs\xe7\x1d!K\x0d\xc82\xb7\x82\x16\
-=\x9b\xdb\xc6(\xc7\xf5\x98\xce\xc8\x1bG\xf7\xdaMt\
-\x0f\xbeG\xe2\xe95\x8aSy\x9e\xbc\xd6\xcbZ\xb4\xc7\
-\x18z\x7f-\x8b\xce*\x85\x9b\x88\x9a'\x94X)\xab\
-x\xb2r)o\xd0<\xf1\x7f!\xe1\xb4\x8d\x8b\xa7\x8e\
-q\xf1Tm\x9a\xb9\xe7\x86\x09\x81\xdd\xb3\xc8dmU\
-tM<\xcd\xe5p\xaeU\xe02\xae\xbdcB\xc0\xf8\
-\x02\xfa\xecN\x09\x95\xd8\x07\x93\xef\xc7.\x9d~.\xbc\
-y\x82\x16\x83St\xcd>G\xd7\xa8]\xdb\x134^\
-\xe7E\xa5UF\xde)\x12\x84\xfb\xc8\xca\xf4\x1c\xdd\x87\
-\xf6\xfd\x93\xe4\xf8\x09\xc1\xd2`\xa3\x1f?\xef\xcb\x90\xce\
-\x0a\x8e[<\xd9\xd7\xd7\x09Ys\x0f\x91\x8b\xee\x11\xb2\
-DMP^\xd1d\x1c\x13,\x94\xcfQI\x82\xef\xd0\
-\xb5\xe2d\x80\x8b\xa7j\x13\xf7\x8c3a\xb4\x88\x82W\
-\x97\x09\xae\xa2\xbb\xc9\xd7S\x14\xb7\x96NU\xb0\xc5\x15\
-\xb4\xa8~N\xb0\x10\xbeL\xc6\x06\x0a\x04\xdd&T;\
-\xdf\xa7?\x17SsOX\x5c\xc7\xcf\xc9\xf1\xbd\xe4{\
-V\x0e\xc36\x06e[\x10cW\xee\x1c\xfa\x9f&\x08\
-\x0di\xef!\xb7\x8c\xc5\xc7m\xa2\xcf\xbe\xca\x81\xc0\xf1\
-f\xd0\xca\x0d\xccF\x8f\xb3hn\xbb\x16\x8d\xebH|\
-\x8f\xd1\x1f\xeb\xe2\x1e\x12M?\x22\x97\xdd[\xdc\xda\x94\
-)\xfdp\x918\xedc\xee\xb9q4y|\x8a\xea\x99\
-X\x10\xf8M4\xf9X\xa6\x89\x09-'?la\x18\
-D\xe2i\x12}^o\xd0d\xf9\x14\x09\xa88;\xcf\
-2\xd1\xfa1\xb0\xd8\x0a\x91\x9e\xa2\xff\x15$\x1cN\xd0\
-bx\x8b\xd0\x0c\xbah\xf5\x9f.C\xec\xca\xb5:j\
-\xcb\x04w\xd3{B\xa5\xe8\x9fPP0h\xf1\xac\xaa\
-x\xb2\x0d\xc6\x18\xb2\xceZ6\xf0\xcddX\xb9\x01\x8b\
-\xe14K\x93Yn\x8b\xd6\xea\xa7\x1dL<\xfd\x09Y\
-\x9c\x5c<e\x8c\x8b\xa7j\x10\xf7\xa7\x8aM\xd8\xb3\xd1\
-x\x88\x5ct\x8f\xd0b|\x1b-<N\xb1\xb0\xcf\x10\
-\xb4@Xu\xe3\x05\xc2\xce\xdajkY@\xec\xeb\xe4\
-\xe7\xf6\x09\xd9y\xfdb\x85\xb2\xfew\x10\xdcw[h\
-\xe1\x5cAV\x85Sdi\xb0\x98\xbc2\xd1\xca\x9dg\
-\x81\xf1\x07\xc9\xe3\x14\xfa\x9f-\x9d~\x18}\xde\xe6\xae\
-Mg\xe7\xa5\x0b\xb0\x96%N.v\xc1\xa6]rv\
-l\x9cPW\xee\x1aa.\xbbC\x98\xdb\xac&\xdd8\
-\xe5\xbb&Za\xf5\x9c\x0eit\xd5=A\x96\xc9\xaa\
-\x8a\xe9\xae\xe0\xe2\xa9\x1a\xd8\xae\xd5\x8a[\x9a`\xb2]\
-\xd8M\x1aM\xd8\x16,\xe9\x94\x87Q$\x9ajh\xe1\
-\xb8\x86\x02`\xcd\x1a\xf5\x04\xed>\xad\x9ayY\x16\xcb\
-\xab`A\xb2uB\x90\xec\x19j\xde\xfa%\xba\xf6\xfb\
-e\xce3\x8b\x14HH\x9d!1p\x13\x05\x96\xbf%\
-\x88e\xab\xf3c\xee\xbc\xa3\xe8\xf8\x01\xc1\xb5[\x06A\
-\x1d\xbb\xe4&\x08s\x99\x89!si\xce%\xc7\xe7i\
-\xecK7O\xa3{\xae\xec\x16\xa6\x98]t\xaf?C\
-Yu\xdf\x11\xdc\xf8\x07\xf4\xa7\xe597\xfae\x22q\
-.&v\xcfY\x06\xcfMdmz\x94\x0c3[[\
-QK\x8fm*\x17\xe6\xa20\xe1t\x8c\x16\xc9\xa7\x84\
-zAch\x91\xdd\xa0?\xc5S\xec\xc2{\x8b\xc4\xc0\
-:z\x1f\xe6\xd0\xf5\xde/\x98x2\xab\xcb$\xda\x08\
-\xc5\x22i\x0fY!\x0e\x08-9^%\xaf\xb1\xe3\x9b\
-hQ\xb5\xb60E'\x8e\x01\x9b'l\x00W\x08\x22\
-)\x8e\xdf\x9c\xe4\xc3\x06\xe3\xe6\x06\xed\x07\xf7\x5c\xcc\x0e\
-\xb26\xfd\x1b\xaa\x1e\xfe\x0c}\xde\xbb\x84\x9e\x9bNF\
-\xb8x\xea_\x86\x09\x13\x86Y\x9b\xe6\xd0ds+\x19\
-&\x9c\x1e\xd2?\xa6\xeb\xaa\x12/\xa21\x96\xaao\xbb\
-\xf5AB\xe1<\xb3>X\xd1\xc9\xb2\xa7\xbc\xc7.<\
-\x8b{z\x8f\xae\xff\xfb\xe8Z?%4{-\xf3\xc2\
-\x19\xbb\xf3\x86\x09\x9f\xbbecZF\xa6=\x7f\x8b\xc4\
-\xf5\x1cZd\xed\xf8{\x825\xd2\x8a\xad\xc6\xd9\x99\xe7\
-\xa9\xe7\xcd\xfa*\xd6\x9b|\xdf\x9e\xb7*Tj\xc7\x06\
-R\xcfkM^\x1f_\xbfc\x84\x16PKh\x1e\xbb\
-\x8d\xc4S\x5cs\xce\x1e\xfb}\x13x\x8a\x84\xf0!\x8a\
-w\xfb\x11\x15\xc0\xfc\x19}\xb6\x9b\xe8su2\xc6\xc5\
-S\xff2I\xc8\x9a\xbb\x19\x8dEB\xa1K+|Y\
-\xe6E\xc4\xb9\x98I\xf4\xb9[\xf5\xed\x1b(1`\x83\
-\xd0\x06f\x1dY&\xd6(\x87\xf5\xe12\xc4.\xbc5\
-\xb4\xa8,\xa2\xec\xb4[\x84\xf7\xa4\xdf\x88\xddyC\x84\
-8\xa8QB\x0c\xd0\x11A0o\x13Z\x01\xed\x11\x5c\
-x\xc7\x04q\x1d\x8f\xf8xL\xfa\xf5&\xc4\x86\x08\x16\
-2\xc3\xacG\xb6\xc1K\xb7mJ\x17\xda\x1d%l\xfe\
-\xac\x94\xc0d\xf2|>:>\x19\x8d~\x8ae\xba\x88\
-}\x82E\xf1{t\x9d\xbfB\x9f\xa7\xc5\xbc9]\xa0\
-\x1f'\x0fGL\xa1\x05\xc2\xfa3Y0\xb8U\x01\xb7\
-]\x5c\xd9w\xe0\xce\xc5\x98;\xc7\xb2\x8e>E\x8b\xa5\
-M\xb8/\x91\xa9\xff\x98\x90\x99\xd7\x0f\x9c\x11b{V\
-\xd1\xa22\x84v\xe8#HD\xf4\xe3\xfcg\xae\xa8!\
-\x82\x05\xe8\x9c\xb0Y:\xa1\xb1\x95\xcf\x1e\xb2D\xed\x22\
-K\xc5F\xf2hV+s\xef5{n\xd4\xa3\xe36\
-\xecoX?\xcc\xb8]\x93\x05u[\x98\xc0x\x93\xaf\
-\xe3\xac\xde)\x82\xe05W\xdc$\xa10o\xec\xbeL\
-\xd7t\xeaw\x0e\x90\xc5\xe9+T\x92\xe0G\x94 \xb2\
-\x81\xacR\xfd\xe8\x9e/\x04\xfd8yT\x8d\xd8\xf4\x1d\
-g\xdb\xdc'\x08&s\xcd=\xc4K\x0dT\x0d[\x5c\
- \xf4P; \xb85\xe6\xd1\xb5cA\xc5\xfb\x84j\
-\xe6e&\xce$\xdbB\x0bL\x9d`\xf5\x18%\xf4\x0b\
-\x9c$\xdcCe\xb7V\xa4\x0b\xad~\x0c\x13D\x87H\
-4\xd9\x88]~i\xe1d#&\xfd\xfa\x03tM\x99\
-\x9b-\x16O\xd6v\xe8\xa2\x11\xcfS\xd3\x84p\x83\xc5\
-\xe85U]\xbfN\x08\x16\xc2\xa7(\xbe\xe9k\xb4\x09\
-z\x896G\xdeD\xba\xcbT\xf5\xe2\xeb',\xe6a\
-\x84P\xfb\xe5>\xa1N\xd3-B\x06]\xd9\x17\x06\xa7\
-3,\xdd\xbd\x86D\x94\x95\xab0\xcbc\x1d\xc5\xc6\xac\
-!kM\xbfp\x88R\xb5\xcd\x1a\xb2\x87\xacn\xf7Q\
-]\xb3\xfb\x84\x05\xbb\xdfcd\xd2\x98e\xc8\xe6\x06\x8b\
-\x9147\x5c3w\x5c\xdamWO}\xcf\x1e\xcfh\
-t\xc7\x19&`G\xf8\xd0ug\xcfc\xf17F\x08\
-5\xb0\xcf\xa9\xcas\xd9\x1e\xca\x9e\xfd\x05\x09\xa6\xbf\x12\
-,NU.\x8e\xdaS\x5c<\x95\x1f\x8bq\x18GB\
-\xe9\xf7\xc0\xdf!!5G\x98p\xe2\x09\xd2\xa9&\x96\
-ui\x0b\x95\x95\xab\x88\xaf\x8b\x11du\xea\xa7\xf8\xa7\
-C\xe4\x92\xdcF\x8b\xcbk\x94\xc6\xfd;$\xa6\x16\x09\
-\xf5\x83\xcaX\x85\xbc\x13\xe2k\xc2\xe2\xa2b\xb7^:\
-`<\xfe:\xa6\xd5\xeb\x9b\x05\x8c\xa7\x83\xc3\x07h\x1e\
-8n\xd8\x1c7L(/P\xa5\xcf(\xcd>\x12N\
-\xffLh\xf4k=\xeb,\xdb\xd4\xe92.\x9e\xca\x89\
-\x99\xe5\x87\x908ZJ\xc6\xaf\x93\xf1+\x82y\xbb,\
-\x8dQ\x9d\xee\x93\xce\xd02n\x13\xdct\xe6\xe6\x1bF\
-q0\xbb\x84V'6\xca\x86\x15\x874\xf7\xd36\xb2\
-\xb0\x8d\x10\xdav\xdc@\xf7\xd02z\x7f\xfa\xc1\x85w\
-\x19Z]\x13N\xfe\xc4\x82\xd5Z\x10\x1d \xe1\xf4=\
-!\xc6\xc9\x5c\xadew\xb5\x97\x0a\x17O\xe5\xc4R\xd2\
-'Q\xf6\xd0\xe3d|\x92|=K\x7f\x16\x81s\xba\
-C\xdc\xc6d.y\xfe\x18\xa5;\xff\x92\x0cs\xc7\x94\
-Q<\xc5X y\x1d\xb9\xee\xbeB\x82\xea1\xea\x13\
-h\x1b\x8e*\xba\xf0\x9cba\xee\xd0\x13\x14\xc7\xf4\x82\
-\x90\xe0\xf1M\xf2\xb5\xc5\xa7y`x\x8fq\xf1TN\
-\xac\xe1\xe5\x22\x12L\x7f\x0b\xfc\x03\x8am\xb2\x96\x03n\
-\xdev.\xcb4r\xd9,#\xe1\xb4\x85&\xeb\x7fB\
-\x13\xf8*\xa1Bq\xd9\xfbc\x9d\x11\x16\xa5WH\x10\
-\xbeB\x0b\x90U\xe8\x06\xdd7.\x9e\x9c<\xb1\xfb\xcd\
-\xeaq\xfd\x00\xfc%y|\x8e\xc4\xd36\xe5j\xaf\xd3\
-7\xb8x*\x0fVZ\xc0\xaa\x84[[\x95_\x01\x9f\
-\xa1\x14\xf4\x99\x96?\xed8\xad1W\x9d5\x81\x9eG\
-\x13\xf66!\x8d}\x15\xc5A\xa5\xe3a\xca\x86e\xe1\
-\x81\xfe7\xeb\x85g=\x01g\xa2\xc79\xc2=7\xd6\
-\xeb\x13u*\x89\x09\xfbS\xe4.\xb7\xfb\xee)\xb2\x92\
-~\x8d*\x87\xbfG\xf7\xe7a\xf3_\xe3t\x1b\x17O\
-\xe5a\x1cU\xd1\xbd\x8e2\xe9\x1e$\xe3\x1e\x8aY\xf1\
-]\xb2\x93\x05\x16@<\x80\xae\xabC$\xa8\xbeK\xc6\
-\x01\xa1\xc0b\x19\xc5S\x8c\xb9\xf0\xce\x91\xf5\xe9/\xe8\
-\xff\xbb\x86\xee5k,|\x0d\x17ONo8CV\
-P\x13N\xdf\xa2\xf8\xa6_P\xa2\xc3k\xdcUW\x08\
-\x5c<\x95\x8714\x89?B\x96\xa6\xcfQ\xc3\xd3E\
-B\xb18\xc7\xe9\x14\xebN?\x82D\xfa$\x12Q\x16\
-@\xfe\x0a\xb9\xb4\xce\xe8/\x17\xdeK$\x9c^\xa2\xff\
-\xf7.\xfa\xff\x8f\xd1\xc6\xe5ZN\xe7\xe8T\x0b\x13O\
-\x1b\xc85\xf7g\xe0\x1fQ\x9c\x93\xd5_\xb32\x10.\
-\x9er\xc4\xc5S\xb1\x89])w\x90h\xfa\x12\x15\xbb\
-\xfc\x04\xc5\xa7\xa4{\x999N'X\xf6\x15\xc8u5\
-\x9c<\xae\x12Z>XL\xd46\xcd+N\x97\x85f\
-.\xbc\x1d\xb4@\xed\xa3\xff\xaf\x8e\xde\x03\x8b%\xb4\xe1\
-8YqN\x10F\xdb\x84x\xa6\x1f\x90\xb5\xf7\x17\xb4\
-iq\x0a\x84\x8b\xa7b3\x81v\xc1w\x90X\xb26\
-+\xd6\xa6\xc0S\x8b\x9dn\x12\xbb\xf0\xee\xa2\x1d\xef\x0c\
-J\xf3\x7f\x8b\x04\xd5\x9b\xe4y\x19\xc5SL\xec\xc2[\
-K\x9eo\x10\xea\x19\xd5\x90\xf5\xe9:.\x9e\x9cl9\
-E\xa2\xe9=\xa1\x06\xd9\xf7\xc8\xda\xf4\x0cY|\x9d\x82\
-\xe1\xe2\xa9\xd8L \xeb\xd2\xef\x90\xd5\xe9\x01\x12Q\xb3\
-\x84\x82q\x8e\xd3-\xd2.\xbc)$\xa2\x9e\xa1\x00\xd6\
-gH`\xed\xa1\x22\x94e\xc6\x02\xe1O\x08\xc2)\xdd\
-\xcc\xf6\x04\xdd\x93+=?;\xa7\x9f\xb1\x16B\xafQ\
-\xdd\xa6?\x01\x7fD\x16\xa7#\xca\xbf1\xe9K|\xf1\
--\x06VU\xd7v\xfaS\xc9\xb8\x87\xe2\x9a>G\xc2\
-\xc9\x1a\xbc\xfa\xce\xd7\xe9\x05\xb1\x0bo\x9aP\x22\xc3\xae\
-\xd5a$(\x0eQl\xd0\x01\xa17^\xd9\xa8\x13\x8a\
-\x12\x9e\x12\xfe\x877\xe8~\xab\x11\x02\xe4\x07\x08\xeet\
-w\x9b;\xedpF(B\xfb\x1e\x09\xa5'\xc8\xdad\
-=\xea\xde\xe5ur\xce\xc7q\xf1T\x0clw?\x82\
-\xc4\xd1]$\x9c\x1e\x10\x1a\xfa^C.\x13\xff\xcc\x9c\
-<\x88{\xa0- !1L\x08\xba\x1eAB\xe35\
-\xe5\x14O\xad\xd8B1(&\x0a\xf7P\x5c\xd4\xddd\
-\xb8xr\xda\xe1\x04\xb9\xbb\x9f!\xd1d\xe3\x19\xba\x8f\
-\xf6r:/\xe7\x92\xf8B\x5c\x0c\xac\xa7\x96\xd5pz\
-\x0c\xfc\x0d\xaa\xddt#\x19S\xe8\xf3\xbal\xb7t\xc7\
-\xc9\x12\xbb\xf6F\x90p\x1aA.\xac:A\xfc\x0f\xa0\
-\xd8\x8d~\xda1[P\xfc\xdb\xe4q\x07\x09\xaa\x13B\
-ev\xc7\xb9*&\x9e\xbeE\xf5\x9b\xcc\xf2\xf4\x96P\
-\xcd\xdf)0.\x9e\xf2\xc3\x5c\x22\x03h\x12\xbe\x89&\
-\xe2\x07\xc8U\xf78\xf9z\x9eP\x01\xdaq\xf2\xa2\x16\
-\x0d\xaby4\x80\x04\xc5)!&\xe8\x10\x89+\xabU\
-Sv+\x94\xf5\xc5;D\x01\xf2\x83\xc8\xdaf\xc9\x1a\
-G\xe8\xde\x1cK\xc6D2\xbc.\x94\x03\x8d-V\x8e\
-\x90\x9bn\x07%%|\x85\xda\xac\xfc\x80\xacMkH\
-\xac;%\xc0\xc5S~\x0c\x10\xfag\xad\xa0\x86\xbe\x7f\
-\x83\x02\xc2\xad0\xdf,\xb2F\xb9\xb5\xc9)\x0a54\
-o\x8c%\xcf\x17\x09\xe9\xfci\x17\xde+\xca/\x9e\x8c\
-:\xa1p\xe1\x11\xb2\x0c\xac\xa3\xf8\x94E\xe4\xca\xb4\xca\
-\xff7p\xf1\xe4\x88:\xda`\xec\xa2$\x84\xa7\xd1\xb0\
-\x92\x04\xaf\x91h\xea\x97{\xa5\x12\xb8x\xca\x8f\xd8U\
-\xb7\x8c\xea7\xfd\xbfP|\x93e\xd2Y\x7f\xba*t\
-ww\xca\x83\xb9\xf0\x86\x09b)\xed\xc2\xab!\xf7\xd6\
-\xfb\x9c\xce\xb1\x1b\xec!\x0b\xd4\xbbd\xfc\x82,\xc3w\
-\x92q\x0f\xbd\x07\xd3HH9\xce9\xbaf6\x09\x8d\
-\xa8\xff\x1d\x95#\xd8F\xf7\xc8^\xf2:/zY\x22\
-\x5c<\xe5\xc7\x08a\xa7\xfa\x18M\xbc\xd7\xd0d\x5cu\
-\xacx\xa1\xa5\x8f\x9f\xb5\xf8\xda\x9e\xd7\xa3\x9f=o\xf1\
-:s\x93\xa6\xadx\xc3\x04\x0b`\x8c\xb9T\xe3\xd7\xd7\
-\xa2\xd7W\xb9\xc6\xd6\xc7\x5cx\xa0\x9d\xf6;\xb4@\x1c\
-\x13\xfau\x95\x19\xbb\x9e\xac\xd9\xb6\x05\x90\x9f\x12\xac\x0b\
-\x87\x04\xb7\xcc4J\xf2\x98D\xd7\x97\x97\x17\xe9o\xec\
-\xfa\xb0b\xab&\x8e\xd6\x90\xc5\xf2\x15\xa1\xe8\xe5kt\
-\xadX\xa6\xaaS2\xfcF\xce\x8f1\x14\xe7\xf4kd\
-u\xba\x8d\x97 0\xce\x09\xfd\xd3\x8e\x09n\x92V\x8f\
-q\x8f\xb5\xd3\xe8x\xfc\x9a!\xb4\x80\x8d\x12\x16?\xd0\
-\xc26\x8d\x02\xf2\xe3\xe3\xf6\xdaXT\xd5\x92\xd7Z\xda\
-\xbe\xd3\xdc\x857\x80\x5c\x14kh\xf1\xd8!T\xf0\xee\
-\x07\xea\x848\xa8sBv\xd4:Z$\x7fA\xf7\xf6\
-\xfdd\xdc\x22\x5c7>\xe7\xf6'vM\x1c\xa3x\xbf\
-'\x84\xec9k\xee\xbb\x1a\x8d}B\x9b\x15\xa7\x84\xf8\
-\x8d\x9c\x1f\xa3\x04\xf1\xf4kd\x81r\xf1$\xacX\xa1\
-\xd5\x0d\x8a\xc7^\x93c\xf1\x04t\x14\x1d?\x88^?\
-J\x08\xe6\x8dE\x92\xc5\xaa,\xa5\x8eOD\xc3\xa8\x11\
-\xdcT\x9e\xa2\x1e\xe2\x9fb\x17\x9e\x09\xce5\xb4\xd3^\
-K\x8e\x1f\xa2\xcf\xa3_8E\xd7\x9d-\x96\xeb\xe8\xbd\
-x\x8aD\xd22\xf0\x87\xe4u&.\xc7\xf0{\xbc\x9f\
-1A\xbd\x8d\xae\x83\x7fG\xbd\xe9L8m\x10\x12\x10\
-\xd2\x16s\xa7d\xb8x\xea-#\xc8-\xb7\x80v\xa4\
-\x9f'\x8f\xfd^\xc3)v\xc3\xc5.5\xdb\xa9\x1d\xa3\
-Ig\x97 v\xcc\xa4}\x84\x16\xdd\xa3\xe8Xz\xc4\
-\xe2\xe9\xa4\xc5k,\xbe\xccj\x15\x193(0\x7f\x8e\
-F\xf1d\xd9Sq\x96\xe3\x00!8x\x81\xe0\xee\x1b\
-I=\xb7\xfegUh\xd6\xdc\xcc\x85w\x86,\xa9[\
-\xe8\xb3\xff\x85 4\xe2k\xa0\xccXQM\x08\xd7\x9f\
-YA\xady\xeb4\xbafvi\xbcnf\x921\x85\
-\xbb\xf3\xcaH<\x97\xed\x11\x8a]n\x22\x81\xb4\x8e\xda\
-\xab|\x8f\x82\xc27\x93\xe1mV\xfa\x08\xbfa{\xcb\
-8\x8am\xfa\x1c\xc59}\x86\x0a\xed-\xa2\x85\xa7_\
-?\x0fK\xd7M\xbb\xdc\x0e\xd0.m\x07\xc5\xc7\xbcJ\
-\xc6&a\x87f\xe3\xe4\x82\xaf\xe3\x1d\xdcY\x8b\xd7[\
-v\xa3\x05\xe1\x1b\x96f\x9e\xb6\x08\x0c\xf1\xe1\xa2VC\
-B\xcb\xc6t\x931\x8b\xacX\x8bTC<\xc5\x98\x0b\
-\xaf\x8e\xc4\x13\xc8B7HH\xd1\xb6\x06\xa8e\x17O\
-\xad0\xeb\x03H4\xee\x22\xf7\x8d]3K\xa8\x1c\xc9\
-\x03dy\x9e\xc1\xddye\xc36}\x87\x849\xeb\x15\
-r\xdf\xdaXK\xc6\xbb\xe4u'\xb9\x9c\xa9\xd35\xfc\
-\x86\xed-c(+\xe7\xbf\x00\xbfE\x16\xa7\x1bh\xf2\
-\xb4\xdd{?b\xf1\x00i7\xdc\x16\xda\xa5\xad\xa1\xd8\
-\x80\xef\x92a\xae\x9ez\xf4\xf3\xe9\xc7\xf4\xb1\xf4\xdfk\
-\xf6\xfdf\xef\xaf\xbd\xef\xcd2\x1a\xd3\xaf\x1f \xb4\xe4\
-\xb0\x8c\xaae\x82\xdbo\x09}\xa6\xb5\xe45\xb3M~\
-g\xbfb.<\x13\x9d\xb7\xd1\xff?\x8f\x04\xc4\x0b\xb4\
-\xc0\xd8\xb5\xd0/\xf1O1\xf1\xfff5}\x9e\x11\xda\
-\xdaL\xa2\xb2$\x7fKpq\x0e\x10\xac\x9cN98\
-C\x82h\x8f\xd0\xc8\xf7;B\x09\x82\x174Z\xa7\xe2\
-\xf9\xc8\xe9\x13\x5c<u\x9f!B\xaf\xba;h\xc7y\
-\x17ug\x9fC\x93f\xbf\xd4q\x8a\xfb5\xed\xd1\xe8\
-\x92\xdbN\xc6.\xc1\x05\xb7\x87\xacL[\xa8\xb2\xees\
-B\x86V\x11\xa9\x11\x16\xc6\x03\xf4\xbf\xed\x11\x82\xa3g\
-\x91[\xe6\x0d\xfa_\x96\x08\x19~\xe66\x8c\xc7\x04\xfd\
-\x15xnbs\x80\xd0\x0f\xee\x04]\xf3\x1b\xe8\x7f\xb5\
-]\xfa{\xfa\xc7\x85\x17\x13\x8bv\x8b\xdd3w\xe5!\
-\xc1\x8d9\x86\xae\xa3\x95d,\x10\xe6\x09\x9b\x13,\xe3\
-\xd3\xc9\x87X\x00\x1dDc=\x1a\xd6 \xfb)\x9a\xc3\
-\xd6q\xf7\x5c%p\xf1\xd4}\x86\xd1\x22z\x0b\xb5[\
-1s}?\xba\xea\xce\xd0\xa2\xf8\x12\x09\x08\xcb\xb2\xb2\
-z?\x1b\x84\xac\xab\xd8\xf4m\xf1N\x9b\x14\xbb\x83x\
-\x9cee\xeeAK\xc97\xeb\xc1$\xfal\x17\x91\x98\
-\x1aM\xc6$\x8d\x16\xaae\x82\xa8\xea7\xe2B\x9as\
-\xa8\xf0\xeb \x12\x08_\x11\x84D\xbf\xbb\xf0\x0cs[\
-\xd7\xd15\xfe\x0c\xbd\x07\xef\x90pZF\x9b\xa9[\x84\
-\xb9\xc1\xb2B]<\xe5\xc7\x19\xe1\x1a}\x876H&\
-\x98L4m\xd2\x18\xd3\xd4OI\x11\xce\x05\xf4\xd3\xc2\
-]T\x86\xd0d\xf8\x00\xc5:\xc5\xe2\xa9\xdf\x5cu\xa7\
-H$=A-\x07lwf\xfe\xffU$\x9e\xd2\xee\
-\xb7x\x14}!\xb5L\x19\xab\xf1SK\x8dA$\x94\
-\xccM3\x89,L\xf3(\xde\xed\x1e\x12\x0e\x83\x84\x12\
-\x09\xfdF\xec\xc2\x1bB\xe2i\x09\x09\x843\xb4C_\
-%\x88\x8a~'v\xe7\x9d\xa2Ew\x03Y'\xcd\xf2\
-t\x9b\xd0\xea\xc52B}~\xce\x17\xbb\xcf\xf7\xd1\xfc\
-\xf5\x04\x89\xa6o\x81\xafQ@\xf8y2\xea\xd1\xa3S\
-\x01\xfc\xe6\xec\x0eVey\x14-\x1awQ\x80\xf8c\
-\xb4\x80LP\xee\x1d\xe59\xc1\xaa\xb4\x1b=\xdf@\x0b\
-\xc33d}\xdaJ\x8d~\xd9\x99]\x14oe\x9fk\
-\x1c\x171\x86\xfe\xf7c\xf4>\xac\xa2\xf7\xe7\x09\xba>\
-\xcc\x85g\xa2\xab\x1fz\x19\xda\xa6`\x90\x10\xcfs\x84\
-\xee\x85/\xd1{\xf7\x12\xb9\xf0\xaaP$0\xce\xcc;\
-\x8a\x9e\x9f\x13\xdcA\xe6\xf6~N\xa3\xf0\xb6\xebc\x8c\
-0\xafX\x89\x88t\x02\x84s9\xce\x09\x1b\xa1CB\
-\x1cf\x9c\xd4bV\xf3mt\xcf\xbeM\xc63d\x89\
-\xea\x87\xb9\xcci\x13\x17O\xdda\x00Mv3H,\
-\xddGV\xa7\xcf\x08\xfd\xea\xca\xcc92S?G\x0b\
-\xe0KB\x8f\xa6\xad\xe4{;4\x96\x0a\xb0\xf4\xed~\
-'v\xedY\xd9\x84!B\xcc\xd7k\x14\xf3\xb2@p\
-\xef-'\xe3\x1a\xb2@\xd8\x02\xd9\x0f\xc4.\xbcYd\
-y;B\xee\xcaAt\xbdl\xe4vv\xbd'v\xe1\
-\x9d%\xcf\xe3E\xfa\x15\xb2R\x9ax\x9a%\x5c\x1f\xf3\
-\x84\xec\xbc\x09B\xc0y\xbf\xc4L\xf6\x12+\x9dq\x84\
-\xac\xe5f\x1d\xb7\xcf\xc16\x83\xef\x93\x11\xc7rnR\
-\xdc\xb8L\xa7G\xb8x\xea\x0e\x160;\x87\xc4\xd3=\
-duzD\x7f\xb8\xea\xce\x09M.\xbf!\x98\xb1\x9f\
-\xf0\xa1\x1b\x8e&\x8f\xfd\x8c-\x8e\xe9l\xb2Z\xf48\
-LX\x1c\x97\xd0\xf5q\x1f\xf55\x1cA\x0be\xbf`\
-\xff\xafYH\xee\x10\xc4\xe1&\x12\x92U\x22\xbe>\xac\
-\x95\x8b\xbdG\xafit\xf7\xda\xf5q\x1f]#7\xd1\
-\xb5aU\xdc\xcd\xc2\xed\x5c\x9d\xd8%gqLO\x08\
-\xd5\xc0\xe3P\x838\xfb7=\xb79\x15\xc5\xc5Sv\
-\xc4\xae\xbaY\x14\x1c\xfe)\x12M\x9f&\xc7\xca\xb8C\
-\xb4\x80Ikn\xb9Ah\x8a\xfa3\x9ap^\xa0\x1d\
-[\x15\xdc/\x97%=\xb9\xa6\xbf>H\x8eY\x9c\x94\
-e\xeem#\xd7\xc0u\x1a{\xa3\x99[\xaf\xac\xf7\xac\
-Y\xa0,\xa0~\x0f\x09\x82\x87\x04\x17\x89Y+\xab@\
-=\xf5<\xae\x0fe\x16Kss\x1f\x13,\xbdV/\
-*\x1dSg\xd7\xc7hj\xd8\x9cT\xe60\x81\xab\xd2\
-\xca%g\x16p\xbb\xde\xcc\x1al\x22\xe9-\x8da\x06\
-\x96\x1dl\x96B\xc7\xf9O\xca:\x11\x17\x91\x1a\x9a\xc0\
-\xa6\xd1\xc2\xf7\x05\xf07\xc8]g\x15\xc4\xcb\x86\xb5\xd5\
-\xd8F\x93\xf7\xcf\xc0\x8fH8Y\x8f&3u\xef\xe5\
-s\x8a\xa5\xc4R\xd8-\xc8\xf4\x94\xd0@\xf4\x15z\x8f\
-o \x17\xdemt=-\xa3\x85\xb0\xcc\xf7l\x5c\xc2\
-\xe0\x18\x89\xa7w\xe8\xbdxI\x10\x0dU$\xbe&\xec\
-}\xb0\xe2\xa2[\xe8\xfd\xb1\xb8\xa7Q\xf4>\x9ax\x9a\
-'\xb8\xf6\xe6\x08\x15\xccm\x0cS-\xf1d.\xb9c\
-B\x19\x915\x82\xbb\xcd\xe6\xb3w\x84\x0c`\xab\x14n\
-\x02+\xce\x06u\xe1\xe4|@\x99'\xe2\xa2a\x0b\xc3\
-<2\xaf\x7f\x01\xfc=\xea[\x07\xe5u\xd5\x1d\x11\xea\
-0}\x03\xfc\x13\xf0'4\xd9\xec\x11\x82&}\x82\xb9\
-<\xb6@Z\xff\xbe\xad\xe4x\xec\xce\xbb\x09\xfc\x0aM\
-\xe8g\xc9\xf7\xe6{~\xa6\xd9b\xb1\x80\x960q\x1f\
-]C\xe6\xc6z\x87\x16\xb5*\x12_\x131\xe9y\xc3\
-\xbe\x1e!X\x9b,\xae\xf2>\x12\xdd\xcb(\x83\xcf\xae\
-\x9b\xe9n\x9cp\x81\xb1\xc6\xe2\xfb\xe8\x9az\x86,\xe4\
-\xafi\xee\x92Kw)0|NsZ\xe2\xe2\xa93\
-\xcc\xe5b\x850\x1f\xa0\xa0\xf0\xcf\x91;b\x8e\xf2\x88\
-&\xab[d\xb5\x9al\xc4&\xed\x1f\xd1\x0e\xd8\x0a]\
-\xb6\x9at\x9c\xab\x91\xce\xc4\xaa\x11\x5c\xa3\xa7\x84\x98\x8c\
-\xbf\x22+\xa6-\x8e\x13\x947\xe3j\x18\xb9\x9fn\x12\
-\x02\xa6\xdf\x11v\xfbv}U\x9dV\xee_+\xd6j\
-\xd7\xca`\xf2\xf5*\xa1_\xa3\xf5\xd1\x5c \x04\x99O\
-\x12\x82\xf5\xe3\x8c\xbd\xa1&\xc7\xec1\x0f\xe2\xf2\x0eg\
-\x1fy\xb4\xf7\xc2\xfab\xeeE\xe3=\xc1J\xbe\x89\xac\
-N\xe6\x92\xb3\xa6\xe2E/\x8f\xe2\x14\x10\x17O\x9d3\
-\x8c\xcc\xe83H<\xfd\x17\xe0whq+\x93\xab\xce\
-&\xa0#\x14[\xf1#\xf0\x13A<YW\xf0w\x84\
-I\xe7\xac\xe9or\xda%\xce\xc4\x02\xbd\xbfV\xfe\xc1\
-\x16\xc1\x07(\xd5\x7f\x10-\x9c\xa3\xd1\xf321\x88\x16\
-\xf8\x1b\xc8E\xf2\x0e\x09\xf4]\xb4\xb0\xd9\xc2\xe84\xc7\
-\xdc|Vg\xc8\x5cTqC\xeb)\xf4\x1e\xcf\x10\x0a\
-\xb3\x9a\xe8N\xc7F\x8d\xb58\x96\xd7\x1aa\xff_\xda\
-\x85\x16\x8f\xf8\xf8&\x8d\x19s\xb1\x802Au\xd0\xe4\
-w\xb8pr\xda\xc2\xc5SgX\x96\x8c\xb9\xeb>A\
-\xe2\xe9\xef\xf2<\xa96\xb1\xdes{h\xb1\xfe\x0f\xe0\
-\xdf\x08\xc2\xe9]ngV\x1dl!4w\xde\xfb\xe4\
-x\xec\xa2\xf9\x12]wV/\xcc\xae\xc1\xb2eq\x0e\
-\xa1\x85}\x08\xfd\xcf\xab\x84R\x17\xe7h\xc1sZc\
-\x82\x09t\xad4+\xf7`\x95\xed\xcd\x0d|?\x19\xb3\
-4f\xf4M4\xf9\xfa\x9c\xd0L\xfbctr\xdd\xb5\
-\xb2\x5c\xc7\x85h\x9bY\x94\xd2_\xbf%\x14\xb1|\x17\
-\x1d\xf7\x0d\x9e\xd3\x15\x5c<u\xc6 \xda\xcd\xddAn\
-\xba{\x94+\xbe \xde\xc1\xbd@\xa2\xe99\xb28\xfd\
-\x88\x16\xb4m\x8a\x9bE\x17\x0b\x86VM\x7f\xd3\xa4\xb3\
-\x9c\xae\xfa\xfd<\x88\x05\xd5\x1ajB:\x8a>+\xb3\
-H\xcd\x112\xb1\xcap_\x0f\x10\xea?Y\xf5\xf5C\
-\xb4X\x7fG(\xc0\xea\xb4\x8f\x09\xac\x1a\x12\xe2\x83\xe8\
-=nfyje}\xb2\x82\x9c\xe6\xc63\xe2\x90\x85\
-\x8b\xdc\x7f\xf1\xb9\xd8|s\xdc\xe4\xb8\xd5E3\xe2\xd6\
-(\xadFly\xb2\x84\x8b-t\x9fx\x86\x9c\xd3U\
-\xca0\xc9\x16\x99!d\x06\xff\x1c\xf8\x0d\xe5\x14O\x16\
-\x03\xf0W\xe0\xdfQ0\xf8F4lr*\x1a&\x9c\
-\x06\xa2\xe7\xad\x04T\x8d\xd6-ab\xea\xd1k\xeb\xa9\
-\x9f\xcb\x13[\x04\xcdB\xf3=\xday?En\xaf\x9b\
-(+\xef\x0e\xe5)g`\x16\xb3\x01$\xfc\xee!\x0b\
-\xdb\x08\x12M\xcfr;\xb3\xfe\xc1\xb2\xce\xce\xd0u|\
-\x80\xac2\x1f\x8bqJ?\xc6B\xca0\x97q,\xb8\
-\xd2\xe2+\xaeAuF\x885\x8a3sO\x08sP\
-\x5c\xb1\xfb\x9c\x8bc\x9d\xd2\xc7\xd2U\xc2\xed\x7fv\x9c\
-\xaeP\x86I\xb6\x88\xd8\x22m\xe2\xe93\xe0\xf7\xc9\xf3\
-\xa2\x8b\xa7X8\x98\xb9\x7f\x15\xed\xf6\xff\x09\xf8?\xf3\
-;\xb5\x0bi\x96ud\x85\x02c\x11\x95~M,\x9e\
-Z\x8d\x98V\xdf\xcbs\x22\x8e\xddy\xd6\xe1\xfd%\xa1\
-\x00\xeb}$p\xc7P@\xf9\x08\xc5w\xe3\x99x\xb2\
-\x02\x9a\xc3\xa8\xfe\xd30\x12NS\xe83\xf5\x82\x84\xed\
-\x93v\xed\xbd\xbf\xe0\xb5\x17an\xbd\x89\xe8X-u\
-\xbcY\xcd\xa9\xb1\xe8\xf5'(\xf1\xc1\xac\xd9\xc6\x11\x8d\
-}/\x1d\xa7\x14\xb8x\xba:5BP\xe6\x02\xa1\xb1\
-\xe7\x12\x9a\xf0/\x13#\x90'\x96\xd9\xb4\x89\x5cu\xcf\
-\x93\xf1-\x9a\xc0\xf2\x22\xdd`\xb7\x96:\x9e\xaeS\xd3\
-\xec\xf5\xad\xc4\x93\x91\xaez\xde*\x93\xa9\xd5\xeb\xac.\
-\x93=\xc6?\x93~\xde-\x9a\xb9b\xe2\xcc\xb4\x1a\x12\
-Ps\x94\xc7\x85\x17\xc7\x0eZ\x06\xde#\xb4\xe0\xda\xb5\
-ZD\xebgU\x88\xfb\xf1\xc5\xc4Yn\xdb4\x16\xe5\
-\x1c\xa5q.<#\x14\xa6\xdcO\xfd\x8e]<9\xc0\
-)\x19e\x98X\x8b\x86\x89\xa7\xb8\xe7\xd42\x12O\xe9\
-\x09\xa3\x88\xec\x22\xab\xc53\xe0\x07\x14\xdb\xf4#\xda\x15\
-\xae\xe7x^\x10\xe2(bW\x9cY\x97\xd2\xd5\xd9\xd3\
-\xb1NY\xc5<5{\x8d\x0ds%\x9cE\xdf\xeb\xb5\
-\x9b/v\xe1Y\xbc\xc8{\xc2\xe2VCV\x862\xb9\
-\xf0,0\xd9\x5cx&\x9e\x8e\xd1ujYRN>\
-XI\x92\xb4\xc0\xb1\xbe\x8d\x83\xd1H\x7fm\xd8u\x9b\
-.Aa\xae\xc5*\xf4\xbdt\xfa\x882L\xacE\xc3\
-\xcc\xd5\x0b(\xde\xc4\xea\xee,\xe4yR\x1f\xc1\x16\xfd\
-s\x14\xf3`=\xe9\xac/\xdd\xb7\xf46e\xb7\x95\xd0\
-\x89'\xdd\x81&\xc7\xf2rC\x9dG#\x9e\xf8/r\
-\x01vKD\xa53\xf26\x93\xe3\x874\xba(G\xd1\
-ui\xefe\x91[\x03\xc5.<\xb3<=$\x04\x05\
-\xc7.\x1dw\xe1\xf5\x1e\xdb0\x145q\xc4qz\x8e\
-\x8b\xa7\xab3@\xc8\x0e\xfa\x1c\x09\xa8\xc9\x5c\xcf\xe8\xe3\
-\xbc\x07\xde$\xe3g\x94M\xf7\x13\xa1']/\x16\xa4\
-t`w\xb3a\x8b\xfce\x02\xc1{I\xb3\xf3\x8b\x03\
-Rc\xcbT\xdaR\xd5*\xb6*k\xf6\xd1\xe7;H\
-p\xa7\xec#!\xb2\x94\x8c2\xdc\xefV\xc2\xe0\x16\xba\
-6W\x93\xaf\xcd\xb5s\x8a\xd7\xe6q\x1c'g\xca0\
-\x99\x16\x8d8;\xa8L\xe2\xe9;\xe0/\xc8\xea\xf4\x22\
-\x19\xd6\xf8\xb2\xdb\x98\xf80+Hz\x5c\x14\xbfT\x14\
-\x01e\xc1\xcbf\xd9\x89-9\xb1X\x8a\xc7Y\xf4\xbc\
-W\xe2i7y~\x80\xac5\x8f\x931G9\xee\xf7\
-at\xae\xa7\xe8\xfc\x9f\xa3\x22\x8f\xef\x91\x15\xca\xeb\xf6\
-8\x8e\x93;e\x98L\x8b\x82-\xf4\xa3(+\xe8\x1e\
-\x8a\xcbX\xa61\x0b\xa5(\xc4\xe9\xbco\x90x\xfa\x9f\
-\xa8\xf1\xec\x1a\x8ao\xea\xf6\x0e>\x16@f\xb5I\xbb\
-\xe6b\x01UT.\x8a\xab2\xd2\xa2\xe9\x8cF\x0b\x95\
-\xfdl\xb7D\xd4a2\xd6\x08E\x04\xb7\x92\xbf?\x81\
-\xdc\xcbuB\x9azQ\xdf\xefa$\x96\x86\x90\x10\xbc\
-\x86\x5c\xe2V\xa4\xd52\x0e\x1d\xc7qr\xc3\xc5\xd3\xe5\
-\xa8\xa1L\xbai$\x9c\xac\xd3\xfdRrl\xa4\xf5\x8f\
-\xe6\xc6\x06\xaa\xd8\xfc\x1a\xf8\x0a\xd5qz\x8bbd\x0e\
-\xe9\xde\x22\x9ev\xc35\x13N\xe92\x03\xfd@:+\
-0\xfe\x1f\x07h\x14W\xddv\xe5\x1d\x22KM\x0d\xdd\
-\xe3\x96\x0e~\x1f\x05\x92\xdf\xa1\xb8\x89\x0d5t?\xd5\
-\x91\x05\xea\x16\xb2\x9c\x9d\xa3D\x87t\x91E\xc7q\x9c\
-\x9e\xe3\xe2\xe9r\x98x\xba\x86\x84\xd3mB\xf7\xf2\x11\
-\x8a\xb9\x10m \xc1\xf4'\x94U\xf7\x0b\xb2@Y\x11\
-\xb9n\x91\x8e\x0f\xb2\xec\x9bVn:\xe8\x1f\x01\x15\xbb\
-\xf6\x06\xd1\x82?Hp\xdf\x99%\xd0D\x14tG@\
-Y\xaf8+\x1a\xb8\x86b\xdc\xfe&\xf9\xfe\x0d\x8ay\
-\xcdB\xeb\xcc;\xebs\x96g9\x0d\xc7q\x1c\xc0\xc5\
-\xd3e\xa9!\x0b\xd3\x0d\xd4\xbf\xee\x0e\xaa\xed4\x97\xe3\
-95\xe3\x0c-2\xa7\xc8\xe2\xf4\x1d\xf0\xcf(\xbei\
-\x1d-\xa8\xddpy\xa4\xdds6\xac\x00b,\x9e\xfa\
-E(\xa5i&\x04\xd3\x02\xca\xbeg\xcf\xbb%\xa2\x8e\
-\x93a5\x92^\x13\x5c\xcb\xd7P\xac\x9eY\xa5\x8a6\
-\x07\xc4\xe75\x83,\xbc\xc7(\x86k\x1d\xf5/\xdb\xa6\
-\xd1\x82\xe78\x8e\xd3S\x8a6q\x16\x15\xdb\x05\xdf\x05\
-\xbe@\xbb\xe1\xa9<O\xa8\x05\x9b(\xa6\xe9%\xf05\
-\xb2<\xbd\xa1;\xae\xbaV\xee\xb9x\xa4\xcb\x0eT\x15\
-\xb3D\xc5\xcf\x9b\x05\x97\xc7\xd9{Y\x11\x178\x5cE\
-V\xc8ed=]!\x943(\x22C(\x19c\x9e\
-POm\x05\xfd?\x07\xc9\xf0\xf8'\xc7qz\x8e\x8b\
-\xa7\xcbQ#\x88\xa7\xcf\xd1\xee\xbd\x88\x19v\x9bH0\
-\xfd\x07*|i\xae\xba=\xb4{\xef\x86xj\xe5\x9e\
-K\x97\x1b\x80j\x0a\xa8\xb8\xf6R+\xe1dML\xbb\
-\x91\x95\x17\xf77{\x8b\xae\x8bQ\xe4\xce\x1b@1|\
-E\x15O\x83\xe8>\x8b+\xf9/\xa3@\xf2\x1a\xe1\xff\
-r\x1c\xc7\xe9).\x9e.\xc6\xdc\x07\x13(8\xfc\x0e\
-r\xdbY\xff\xa6\x22\x10g\xd5\x99e\xe1\xdfPef\
-s\xd5e\xdd\xfa ]z`(\x1a\xfd\xee\x9e\xbb*\
-\xcd\x84c,\x94\xe2\xc5\xdf*9g\x19P\x1e\x0b\xb4\
-w\xa8\xce\xd7)\xfa\xecfP@\xf68\xc5t\xe1\x0d\
-\xa2s\x03\xdd\x7f+\xc8\x8d\xb7Ch\xeb\xe1\xc1\xe3\x8e\
-\xe3\xf4\x9c\xa2M\x96E\xa2\x86\x8a\xf3\xd9\xae\xf7\x1e\x9a\
-\xc0'\xd0\xce\xbd(\xbb\xf5}\x94Y\xf5\x1eY\x9d\x9e\
-\xd1\x98U\x97e9\x82\xd8U\x17wfw\xf7\xdc\xd5\
-\x88\xadq&>M\x8c\xc6\xb5\xa1\xb2\x8e\xeb9@\x02\
-\xaa\x8e\xae\xedit=\xaf \x0b\xd4\x02\xc5\xfa\xfc\x06\
-\x08\x99\xac\xd6\x0e\xe9\x0e\xb2\xa4Z\x0c\x94\xe38N\xcf\
-q\xf1\xd4\x9a\xd8U\xf7\x09A<MR\xacv\x17V\
-\x1c\xf1\x17>\x14O\xe6\x0e\xca\x8a\xd8U7Dh\xa9\
-\xd1\xaf\xd9s\xdd\xa4Yeuk\xffb\x03\xb2uK\
-\x99\xe0\xd8E\xa2i\x1cm\x04\x8e\x92\xbf?O\xb1>\
-;K:0+\xd9\x0a\x12O[\xe8\xff\xf0\xf9\xcbq\
-\x9c\x5c\xf0\xc9\xe7bf\x91x\xfa2y\x9cG\x8bM\
-\xde\xc4\xd5\xac\xb7Q\x80\xf8\xf7(\x9e\xe5%\xb2B\x1d\
-d\xf8\xf7b+I\x1c\x08^DWOYH\x0bM\
-\x13O1\xe6\xc6\xcb*#\xcf\xb2\xf0\xb6\xd1&`\x82\
-\xe0j\x9dD\xb1|#|\xd8\xd45/\xcc\xc2\x09J\
-\xd0XD\xc2o\x1dm\x12F\x09\xe5!<\xeb\xceq\
-\x9c\x9e\xe1\x0b_kb\xcb\xd3\x97\xa8L\xc1t\x9e'\
-\x14qBh\xc1\xf1\x12\xd5\xf0\xf9\x06\xa5q\xbf'[\
-kE\xb3\xec\xb9\xd8M\xe7dG:+\xcfF\xda\x8d\
-\x97\x05\xbb\xe8\xda9C\xf3\xc0(\x12Psh\xd30\
-\x93\xd1\xdf\xc9\x0a\xcb\xbc[D\x16\xe09$\xa8\xb6\x09\
-\xe59\xbc\xe7\x9d\xe38=\xc1\xc5Sk,\xe6\xc9\xc4\
-S\x91\x82\xc4OP\xdc\xc7\x06Z\x00\x7f\x01\xbeE\xee\
-\xba}\xb2\x0d\x10ofi\x8a\xab\x84;\xd9\xd2,S\
-\xd1>\xcf,\xc5\xc1\x0e\x12N\x1b\xc8\xda4\x89\xae\xf7\
-\xdb\xe8\xf3\x9d\xa6X.<\x13O\x0b4\x8a'\x0b(\
-\xf7\xac;\xc7qz\x86\x8b\xa7\x0f\x19I\xc68\x8a\xb1\
-\xb8\x89\x16\x94\xbc\x893\xb0\xf6Qf\xddK\x94=\xf5\
-\x045P\xdd\xcc\xe8o\xa5\x8b^\xc6\xa2\xc9\x1e\x9d\xec\
-\xf9X\xdcX:;\xaf\x13+\x94\xf5\xc2{\x8f\x84\xc8\
-B\xf2X\x03\xc6\x92\xaf\x8bda\x8c3\xefL@-\
-#\x11\xe8e\x0b\x1c\xc7\xe9).\x9e\x1a\xa9!\xb7\xc0\
-u$\x9a>\xa58U\xc4-\xdd\xfc\x04Y\x98\xbe\x05\
-\xfe\x8cb\x9d^\x90m\xcav3\x17\x9d\xc5\xc6\x14\xc9\
-\x1a\xd1\xcf\xc4\x81\xe4\xf6\xb5\x1d\x8b+\x93C\xe7\xae\xbc\
-\x1dt\x0dYO\xb9ad\xd5\x99D\x82\xa5\x08\x16\xd7\
-8\xf3n\x01mh>C\xef\xc93d\x89=\xc9\xe7\
-\xd4\x1c\xc7\xa9\x1a.\x9e>d\x01x\x88\x5cu\x9f\xa0\
- \xf1\x22p\x8e\x04\xd2!\x12O\xdf\x01\xff\x88\x16\x8e\
-m\xb2\x17O\x96Mg\x96\x87x\x11w\xbaO\xbar\
-{,\x9eb7^\x161P;\xc8\x8ay\x88\x04\xca\
-4\xb2\xec,$\x7f\xafH\xe2\xc9\xb2\x02o\x13\x04\xd3\
-\x1e\xaa\xac\xef8\x8e\xd3\x13\x5c<}\xc8\x0cJ\x87\xfe\
-\x02\x15\x10,J\x1b\x16\xcb\x92z\x8f\x5ct?!\xab\
-SV\x8dRc\x97\x91Y\x9a\xacA\xab\xc77\xe5C\
-\xb3\x12\x10V\xad<\xce0\xebT@Y\x09\x83=$\
-L\xe6\x91\xc5\xf5\x14\x09\x96\x22l ,\x98~\x10\xdd\
-\x93\xcbH\xecm\x22\xabYQ\x1b\x1d;N\xafH\x97\
->\x19\xe4\xc3\x0d\xb0\xb9\xfe\xcd\x93qL\xf6%m*\
-\x81\x8b\xa7\x0f\x19#\xd4\x94\x99\xa1\x18\xa5\x09@\x0b\xdb\
-sTA\xfckT\xdb\xa9[\xae\xba\xb8Zx\xbcx\
-;\xf9\x11\x8b\xd7X8Y\x93\xe1N&\xbfST\xeb\
-\xa9\x8e\x9a\x08\x8f\xa1k\xeb\x08\xb9\xee\x8a\x10\xf3\x173\
-D(]0\x8f,c.\xee\x9d\xaacu\xd1\x86\x09\
-\x09 s\x84\xb2$\x93\x84Lm+\xae\xbc\x9e\x8c\xac\
-\xbbP\xf4=.\x9e\x1a\xa9!\xb1d\xd5\x8c\xa7\x09q\
-\x16y\xb3\x8f\xc4\xd3\x9f\x90\xcb\xae\x1b\xe2)v\xd5\xc5\
-\x81\xc2.\x9e\xf2%\xae\xb3\x05\x1fZ\x9d:\xcd\xc2\xb3\
-\xe6\xc1'H<Y+\x97)d\x85-\x1aq\xe6\xdd\
-<\x8a\xcb\xf2$\x06\xa7\xea\x98k{\x1c\xdd\x1b7\x93\
-\xb1\x84\xee\x93\x05d\xad\xdd@\xc2\xe9\x19\x9a;\xde\xe7\
-q\xb2e\xc7\xc5\x93\x88M\x9d\xe3H4\xd9\xa4\x9c\xa7\
-x\xb2\x9eu\xb6\x98\xbd@\x96\xa7\xa7\xe8\x82\xeft\xb7\
-\x10\xbb\x83\x9a\xb9\xea\x5c4\x15\x87\xb4[5v\xdd\xc5\
-\x01\xe4\xedX\xa0\xe2\x9f\xdfB\xa2|\x03xL(\xb8\
-\x1a'\x0f\xe4\xcd\x10!\xf3.n33J\xe8\xf5\xe8\
-n\x08\xa7\x9fh\xd6\x88}8\xf58N\xb02\xad\xa0\
-\xb0\x93\xdb\xc8\x10\xb0\x98\x8c\x1d\xb4\xf1\x1eG\xb5\xde\xde\
-\xe0V\xdb\xb6p\xf1$\xec\x02\xb4B\x816\xcc\x0a\x93\
-\x17\xc7h1\xdbD\x82\xe9%\x0a\x16\xdf@\x0bZ\xa7\
-\x16\x07\xbb\x19c\x97\x9d\x0b\xa7b\x13\x97\x8f\x88\x89{\
-\xe2e\xe1\xc2;G\xd7\xde{\x14Wg\x93r\x91\x82\
-\xc7k\xc8\xb5>\x8fv\xd7{\xc8B\xbb\x87\x97-p\
-\xfa\x8b\x1a\xba\xe6\x87\xd1=8Gp\xcb\xd9\xf3i\xc2\
-\xdae\xf7\xc5<\xb2 [\xf6\xec\x10\xba\xaf}~\xef\
-\x10\x17O\x22\xae\xb0l\xc3\xe2(\xf2T\xe5f\x01x\
-\x89L\xac\xb1x:\xa5\xf3\x05\x22\x0e\xc2\xb5\x18'w\
-\xd5\x15\x9b8\xfb\xae\x19Y\xba\xf0,Aa\x8dP\x89\
-\xbcH\xe2i\x88`%^F\xe7[G\x1b\x0b\x17O\
-N?a\xf1L\xe3H,\xdd\x22\xb8\xe5n%c\x9e\
-\xb0~\x8d%\xaf7\xc1es\xfci\xf2;\xdc\xda\xd4\
-!.\x9e\x84\x05\xd8\xcd\x11\xaa\x16\x17!\xd6\xe9\x08\x05\
-\xf3=I\xc6[\xb4k\xe8\xb4o]\x1cC\x13gd\
-\x0c\xe2\xa2\xa9\x0c\xc4\x96\xc1\xb4\x95\xc9,O\xed\xf6{\
-\x8b]x\x9b\xa8\x04\xc0\x8f\xa8\xd2\xfe\x08\xc5\xa8{\x16\
-\x8b~k\xd9r\x9bP]\xdfZ\xb68N\x91I\xb7\
-\xbeJwo\x18B\xf7\xdc(\x12C\xe3\x84x\xa6\xdb\
-\x84\x02\xce\xe6\x9e\x9b#4\xfcn\xe51\x19'4s\
-w:\xc0\xc5\x93\x88\x83\xc4g)N\x86\xdd!r\x99\
-\xfc\x15\x95&X\xa7\xf3E!N\x7f\xf7\x02\x98\xe5\xc6\
->\xc3\xf4\xe7\x96\x95\x0b\xef\x1d\x8a\xb1\xab\xa1\xebn\x9a\
-\xe2e\xde\x8d\xa3\xa2\xb6\x8f\x91p\xdaGq\x1c\x8eS\
-d\xe2\xcc\xb81B6\xdcxt|\x0a\xc5.Y\xe6\
-\xb7Y\x92&\x08\xe5Dl\xcc\xe2\xc2\xa8\xa7\xb8x\x12\
-\xa3\x14\xb3<\x81\x15\xc4\xfc\x01\xb5ayO6;\xea\
-t\xe0\xe1\x10~\xc3\x95\x91n\xbb\xf06\x90\xd5i\x0b\
-\xdd\x17\xf7:\xfc}\xdd\xc0\xc4\xd3\x09\xb2\xc8\xbe\xc2\xe7\
-5\xa7\xf8\xd4\xd0u:\x866%\x0b\xc9\x98!X\x98\
-\x16\x81G\xa8h\xf32\x8dV\xaa\xd8%g\xcf\xe3\x98\
-U\xa7\xcb\xf8$#&\xd1\xc5y?y\xcc3\xae\xe3\
-\x8cP\xbc\xcc\xe2M^'\x8fY\xc4r\xa4[\xaf\xe4\
-\x1d\xd7\xe5tF+\x17^\x9d\xce\xeb?\xed!\x01f\
-\x15\xbc\xd7\x90+/\x9e\xb8\xf3f\x04-8\xd7\xd0\xbd\
-;E12\x02\x9dj\x93\x16:\xb1\xc01w\xdct\
-2f\xb8X<}\x8a\x12\x22\x9c\x02\xe1\xe2IXU\
-\xf1_%\x8f39\x9e\xcb1Z\xa06P]\xa7U\
-\x14\xc3q@g\x95`\xe34wKm\xf5&\xbf\xfd\
-C\xec\xc2\xb3*\xc2\x17\xc5F]\x86Sd\xfd\xac#\
-\x17\xde+\x14{7\x87\xdc\x06\xb3\x9d\x9cpFX\xf0\
-\xf8\x04!H\xd6w\xdeN\x9e\x98Ui\x04]\x93s\
-\xd1\xb0\x80\xeei\xc2}4CHR\x8a\xddv\x93\xc8\
-\x1b2\xd6\xbbSw.\x8b\x8b'\x11\x8b'\xbb\x98\xf3\
-\xe2\x04\x09\xa7\x17\xc9XC\xe2\xe9\x90\xf6cX\xe2E\
-\xd4\x02\x11GS\xc7\x9dr\x13\xbb\xf0\xcei,9\xd1\
-\xae\xe0\xb6\xd8\xa9Sd\x05}\x8d\xc4\xd3m4\xa1\x17\
-M<\x8d\xe3.h\xa7\x18\x98Kn\x0aYEo\x03\
-7\x905i!y\x5cJ\xc6,\x1fz\x03b\x01V\
-\x84\xe4%'\x85\x8b'a\xbb\x83\xebh\x02\xceS\xe9\
-\x1f\xa1]\xfe\x93d\x98\xbb\xae\x93\x82\x98q='\xb3\
-6\xb9o\xbc\xffhVH\xef\x94\xf6E\xf7y\xf4\xb8\
-\x89\xc4\xfc|\xf2\xbb\xe7:;\xd5\xcc\x18$TU\x9e\
-$\xd4\xb4\xd9A\xff\xfb)^0\xd3\xc9\x968Kn\
-\xa4\xc9\x88\xcb\xde\xcc\xa0\xac\xb8\x1b\xc9\xb0\xaa\xf8\xf1c\
-Q\xfa\xa7:W\xc0\xc5\x93\x88\xeb<\xe5]\x18\xf3\x08\
-\xb9\xea~$d\xd8u\xda\x86%\xae \xee\xc2\xa9\xff\
-\x89c- T\xdc\xeeDDl!7\xf2 r9\
-\x14\xa5mK\x5c0\xd3j>-!K\xed.^0\
-\xd3\xc9\x9e\xb8\xa8\xf2\x1c\xa1\x18e\xdcT\xdb\xc4\xd3\x14\
-\xb2,\xcd\xd2\xe8\x9e\xb3\xec\xba\x22\xc4\x0d:m\xe0\xe2\
-I\x0c\x22k\xd3$a\xe7\x9e\x17&\x9e\xac<\xc1\x06\
-\x9d\x8b\xa7t='\x0f\x10\xefo\xd2%\x0c:\xb5\xbc\
-\xd4\x91\xe5\xa9\x86J\x01\xdcB\x96\x9d\x22\xd0\xaa`\xe6\
-.\x12M^0\xd3\xc9\x1a[/&\x90K\xee\x16\xda\
-L\xdc&\xd4_\x8aER\xdcB\xc5\xe6\xdf\x22\xb5;\
-r\xda\xa0\xca\xe2\xc9\xcc\xab#\x84\x1a\x19y\xbd\x1fV\
-\xd5\xf9\x18\xb9\xe9\xd6\x90\x80zGg\x93\x7f\xba\x18\xa6\
-\x17\xc2\xac\x06q\xfc\xd3\x19\xc1\xc5\xd0I\xdd\xa7C$\
-\xa0N\xd1\xb5\xb9\x86\xae\xcf\xd1d\xe4\xb5\x83\x8e]\x95\
-\xe3H<\xddD\x16\xa7#t\xce\x8es\x11i7\x9c\
-\xad\x0b\xf1<\x19\x17\xa9\x8c\x9f\x9bK\xeef4\xaeG\
-\xaf)J\xd9\x1b'c\xaa,\x9e&\x08~\xe7e\xb4\
-S\xc8\x8b\x13B\x1f\xb18H\xbc\x93\x0c\xbb\xb8\x18f\
-<9x\x90x5\x88\x85\xb3\x0d\xbb\x8e:\xc9\xbc\xab\
-\x112\xef\x9e\x12\xee\xa1\x22\x04\x8f\x8f\x12\xaa/\xef\xa0\
-{\xcaw\xf6\xce\xc7\xb0\xb8\xb9a\xe4r\xb3k:\x9e\
-'\xafE#.=`\xee\xb8\xd9hL\x90\x7f\xf8\x87\
-\xd3e\xaa.\x9e\x96\x91\xb9\xf5\x1a\xf9\x8b'\xcb\xb0\xb3\
-\xf2\x04\xd6\x86\xa5N\xfb\xc5\x0e\xd3\xc2\xc9k:U\x83\
-8\xcb.-\x9e\xda\xb5>Y\xe0\xf99\x12\xf9&\x9e\
-\xce(N\xe6\xdd\x18\xcab\xbaKh-\xe3\x0b\x98\xf3\
-1L<M\xa0x9s\xc1\xc5\xd7\xceC\xe03T\
-\xc9>\xb6\xec\xc6%_\xe2\xe7\x1eW\xda\xe7\xb8x\x0a\
-\x851\xf3\x14O\xa7(F\xc3\xdcu[\xc8\x85\xd7I\
-\xacF\xb3b\x98~3W\x8bX<\x0f\xd2Y\xd0\xb8\
-\xd5\x8e\x02YE\xdf \xf14Fq\x0a\xf8\x0d\x13:\
-\x05,\xa2{\xda7\x0b\xd5\xa6\x99K\xce\xdc\xccq=\
-\xa5\x19\x143w\x8d\xe0\x8a\x8b\xaf\x9d\xfb\xc0'H\x98\
-;N\xe5\xc5\xd3\x12\xba)V\xc8\xbf\xaa\xf8>\xb2>\
-m\x10\x1a\x9cv\x82\x05\x0d[\xa0\xa2\x8b\xa7jb\xd7\
-A\xec\xb2\xeb$\xf6\xa9\x8e\x84\xfe*\x12O\x8bt\xde\
-\xa8:+\xac\x1f\xd8\x12r\xbbx\xf7x'.'0\
-Kp\xc9\xcd\x10\xcaZ\xcc\x11\xb2\xe4b7\x5c<_\
-.P\x0c\xeb\xaaS\x10\xaa,\x9e\xacz\xeb\xfd\xe41\
-o\xcb\xd3\x1e\x8a%yO6\xe9\xd5\xb1x\xf2 \xf1\
-\xeab\xd7\x014Z\x8f:a\x17\xf5\x5c\x1cA;\xf1\
-\xa2\x89\xa7:.\x9e\x1c\x11\xbb\xe4\x16\x09.\xb9\x15$\
-\xb2\xadX\xe5r2l\xbeL\xaf\x8d\x961\xe78@\
-\xb5\xc5\x93\xd5\xe8\xb8\x9e<\x8e\xe7x.\xa7\x04W\xc8\
-\x9b\xe4y;\x96\xa78H<\xed\xaes\xf1TM\xe2\
-\xeb!\xce\xbc\xab\xd3\x9e\x1b\xaf\x8e\x5c\xca\xbb\xc8J\xba\
-G6\xcd\xaa\xb3\xc0R\xc8A\x22j2\xf9z\x84P\
--\xdd\x0bf\xf6\x0fq\xdf\xb8xX\x19\x01\x1bc\x04\
-\xf7\xf2\x0d4\xe7/\xd2hq\xb2\x1aM.\xb6\x9dK\
-Qu\xf1d\xf1\x11\x93\xe4\x9bRz\x82\x02\x5c_&\
-c\x9b\xf6\x16\xa4tui\xcf\xb0s\xe0CA=D\
-gb\xc22\xef\xf6Q9\x80\xa2\xd4Q2\x17\xcd\x00\
-\x8duv\xc6\x08\xa5@\x9c\xfea\x88P\x88r\x9a\xe0\
-\x86\x8bE\xd2\x14\xc1jd\xb1M3\x84k#.?\
-\xe0s\xa4si\x5c<I<\xe5]8\xd2\x9a\x01\x9b\
-x:\xa3\xbd\x05)]I\xdc\xdcu>)T\x97t\
-_\xc3A\x82hj\xd7\x0ac\xe2\xc9j)\x15M<\
-\x8d\x10*<\x9b\xf5\xe9\x9c\xce\x1ak;\xc5c\x08\x89\
-\xa3\xb8O\xdc\x22\xf0\x00e\xc6}\x86\xe6\xf8t\xdb\xa2\
-f\x19\xc8\x1e\x13\xea\x5c\x89\xaa\x89\xa7\xb8>\xc74\xa1\
-\x83u\x1e\xc2\xe9\x0c-@\x07(\xcb\xce\x5c G\x1d\
-\xfc\xcet]'\x9f\x0c\x9c\x98f\x99w\xed\x08\x1f+\
-\xea\xba\x87\xdcw\xdb(C\xd4\xee\xad\xbc\xe6\x95X(\
-\xc6\xee\x9b1\xb4A\xf1\xfb\xa1\xd8\xd8\xe6o\x80\xf0\xf9\
-\x8d\x11\x8aV\x0eG\x8f\x16\xdf6\xd7d\xdc\x02\xee!\
-\xebS\x9e\x89@N\x1fS5\xf1d\xa2i\x1a\xedH\
-\xf2l\x00l\xae\xbaw\xc8\xda\xb4I6\xb1#\xbe\x93\
-r.\x22\xb6>\xc5\xf5\xa0.K\x9d`y\x1aB\xa2\
-\xe9\x1d\xea\xc1h\xee\x93\x22\xcc+f\x852\xf1t\x80\
-\xdf\x0fE\xa7F\x10HS(\xc3\xcdb\x93\xcc-7\
-\x1d\x8d\xd8\xed\x16\x8fY\x14\xbfT\x84\xeb\xd0\xe9S\xaa\
-vq\x99\xabn\x09\xdd\x90E\x89szA6=\xec\
-b\xcbS-:\xe68\xd0\xd8\xb7\xf1\x8c\xf6\xaf\x8d\xd3\
-\xe8\xe7M<\xad!a5J1v\xfbq\x96\xd5\x18\
-\xd5\x9b\xeb\xca\x88Y\x9cL\x00\xddB\xd9\x9c7\x08n\
-\xb9\xe5\xe8\xf9\x04\x8d\xf3\x9d=z\xdf8\xa7\xebTm\
-B\x19B\x13i\xec\xb2\xcbK\x5c\x9c\x11\xca\x13\xac#\
-\xf7G'\xb5\x9d\x9a\xb5cq\xe1\xe4\xc44\xbb>\xda\
-i\x1el.\xbfS\xb4\x01x\x01\xfc\x98|=\x816\
-&yc\xc1\xc4\x0bhc\xb2\x83gR\xe5I3\x97\
-\x5c\xb3^q\x16\xa76\x87\x0aV^'lv\xd3\xc3\
-\xfb\xc69\xb9Q5\xf14H\xd8\x19\x8f\x92\xef\xffo\
-\x851\xdf\xd3ym\xa7V\xc2\xc9\xc5\x93\x93\xc6\xca\x14\
-\xc4\xd7I\x9d\xab\xbb\xef@\xae\xbfMT,s\x1cY\
-z\xaeeu\xa2\x1db11\x8bhs\xb2\x8e\xdf\x0f\
-yb\xadLl\xfe]$\x04z\xdb\xe3\x1c\x8d\x81\xfe\
-\xe6\x9e\x9b\xa4Qd\x8d\xe1V%'g\xaa*\x9e\xac\
-4A\x9e7`3\xf1\xd4im\xa7t/;\xc7\x89\
-\x89]\xb9\xe9\xd1N\x16Z\x9d \x9e\xea\xc8\xa5\xf2\xa8\
-\xe3\xb3\xcc\x86a\xb4\xf0.\xa1j\xe8^03\x7f\xcc\
-\xe24\x83\x5cq\xf7\x90[\xee.*Vl=Fm\
-~n\xb6\x19\x8c\x87\xe3\xe4F\xd5\xc4S\x91\xdcZq\
-K\x96\xf7\xc9\xf3N,O\x16\x08\xec\x13\x8bs\x19\xe2\
-{!n\xddr\x15\xac`\xe6\x1e\x8a}\xca\xa2\xadP\
-V\xc4\x96\xa79$\x9e\xfc\xbe\xe8-q\xfc\x91\x89\xd9\
-\x19\xf4\x99\xac \xb1d\xf5\x98\xac\xe2\xb7e\xd8Um\
-mrJ\x86_\xa0\xf9a1OYX\x9e\xe2\xfa%\
-\xbe@8\x97!\xdeDX\xbf\xbbv\x88\x0bfv\xda\
-\xcc:Kb\xcb\xd3\x1cny\xca\x0bs\xd5Y\x10\xf8\
-\x02\xa1\x15\x8a\x09\xa69B\x1c\xaa\x15\xf7u\x9cB\xe3\
-\xe2)?\xd2\x96\xa7vc\x9eb\xf1\x94w\xb1O\xa7\
-<\xa4-O\xed\x88\xa7\xb8lA\xd1\xaa\x8d\xc7M\x82\
-\xe7\xf0\x0a\xd2y`qNc\xc8\x157K\xb0:\xad\
-\x102\xe7\xe6\x09\xa5\x07\xec\xe7\x1c\xa7\xd0TM<Y\
-\xed\x17\x0bn\xedu\xcc\x93\x15%<E\x8b\x8d\x15\x19\
-\xb4\xe2\x98\xed\xee\xfe\xd3\xe5\x09\x1c\xe72\x98\xe5\xc9j\
->\xb5\xc3\x09\x12OV,\xd36\x03qa\xc3<h\
-VQ\xda\xe9-6\xdf\x1d\xa3:[[\xe8s9M\
-\x8em\x01\xaf\x90\xa0Z@\xe2\xcaj7\xc5\xedS,\
->\xd57\x87Na\xa8\x9ax\x8ak\xbf\xe4\x91mg\
--\x22\xac:\xb3\x8d\x034\xa1\xb4+\x9e\xc0\xeb:9\
-W#\x8b\xf8\xbf\xd8\xf2dqO\xefQf\x9b\xf5\x10\
-\xf3N\xf4\xd5\xc6\xae\x8f34\xf7Y\xa8\xc2\x1bB\xd1\
-\xcb\xd9d\xcc\x11\xacQ\xf1\xe3\x0c\x9a\xaf]89\x85\
-\xa1\x8a\xe2)\xcfR\x05u4\x81\x1c \xcb\x93Y\x9f\
-\x0e\xa2\xef_\x958@\xdc\x85\x93s\x15b\x8be\xa7\
-\x053M<Y\xdd\xb2\x1a\xb2\x1a8\xd5\xc5\xe6;\x13\
-P\xbb|\x98\xf1i\x0d{\xad&\xd7=\x94yw\x8f\
-P\xc5~8z\xad\x97(p\x0aA\xd5\xc4\x93\x05/\
-Z\xb3\xd0\xbc\xc5\x93\xc5\x88t\xda\xac4\x1d0\xee\x22\
-\xca\xf9\x18YU\x1b\x87\x103\x15?v\xd2x8\x0b\
-b\x17\xbd\xdd\xeb~_\xe4\xc3E\xd9\x9c\x16#g\x96\
-\xf7\x01\x82Ko\x1dx\x8d,Pf\xc9\x9c\xa2\xd1\xa5\
-7B\xfeeg\x9c\x0aR5\xf1\x94v\xdb\xf5\xfa\x86\
-3\xb7\x9d5\x04>\xa13W\x1d\x04\xb1d1\x01\xbe\
-@8\x97\xa1Y[\x8bv\xeb=\x15\x11\xbb\xd7]<\
-\x15\x1b\xdbP\x9a\xf0>C\xb1soQ\xeb\xaa\x85\xd4\
-X$d\xeb\xcd#A5\x84\x8b'\xa7\xc7TQ<\
-\x15\xc5\xf2t\x80vXY\x88\xa7\xd8\xf2\xe48\x97!\
-\xb6P\xf6c\xb2A\xba1\xb0\x8b\xa7bbs\xa2m\
-*\xb7\xf9\xd0\x9d7G(mp\x0b\xb9\xf4\xac\x0f\xa8\
-\xb5\xe1q\x9c\x9eR5\xf1\x04\xf9N\xa0i\xb7]'\
-\xe2)\x1d;\xe08\xed\x92\xae\xda\xdc\xae\xf5\xe9\x14\xb9\
-\xa2\x8bP\xf3\xc96Ju$\x9e<p\xbd\xf8\xc4\xee\
-=\x8b\x93\xb2\xaf\xcf\xd1\xbc\xb9\x83\x02\xce_ w\x9e\
-Y\xa4f\x90\x88\x9a \x14\xe3\xf4\x84\x05\xa7kTQ\
-<\xe5\x89\xb9\xed\xcc\xf2d\xe6\xeavq\xd1\xe4dI\
-'}\xeelc\x10\xd7|\xea\xd4\xaa\xda\x09fy\x1a\
-\xc0-Oe$v\xe7\x99(\xdfF\x09\x09/\x09\xbd\
-\xeff\x09U\xcb\xcd\x9dw\x0b\xb8\x8d\x84\x94\x8b'\xa7\
-+\xb8x\xea-\xf1\x02\xd3\x89\xdb\xce\xfb<9Y\xd3\
-i\x9f;(V\xb5q\x8b\x01\x1c!X\x9e\xfc>)\
-\x0f\xe74n6\x9b1Bp\xed]CYz\xf7\x91\
-\xd0\x1aGm_<\xe3\xd3\xe9\x0aU\x13O\xa3h\x97\
-\xb2\x82v,c\xf9\x9e\x8e\xe3\xf4\x0dE\xae6\x1e'\
-\x8aX\xff\xbd,\xb2\x5c\x9d|9G\x22\xbd\x86\x8a\xb3\
-\x0e\x11j\xe8\xbd\x03\x9e\xa1x\xa9QB\xac\xebD\xf2\
-h\xc57\xbd\xf2\xbc\xd3\x16U\x13O#\xc8\xd4\xbbL\
-\x10O~\xe38N6\xa4-Oy\xba\xedb\xe2\xfa\
-nc\x84\xa2\x8dN\xb91\xf1dV\xaa#\x14\x0f\xb5\
-\x0a<\x07\xbe'd\xe4\xcd\xa2\x18)k\x0b3\x9f\x1c\
-\xcb\xa3\xd3\x84\xd3\x07TU<Y\xdd\x90\xd1\x1c\xce!\
-]\x03\xc7w\xbfN?\x90\xb6<\xe5\xed\xb6\x8bIg\
-\xdeY\xcb\x10\xbf\xf7\xcaM\xda\xb5\xb7\x99\x1c7\xa1l\
-\x857-S\xef\x0e\xca\xd4\xb3\x9aR\x83\x84~z\xe0\
-\x05\x87\x9d+P5\xf1\x947q3\xe0w\xa8\xe2n\
-'\x0b\x8c\xc7;9Y\x90\x8e\x9fsQ\xe1\x94\x19\x13\
-\xc7V\xc6\xc52\xf5v\x815\xe0)\x8d\xb5\xa3\xa6\x92\
-a\xcd\x8b\xe7\x92\xe1s\xab\xd3\x12\x17O\xbd\xc5nb\
-k\x9e\xba\x87vA\xed\xe0\xc1\xe2N\xd6\xc4\xbbn\x17\
-PNY\x89\xddy\xa7\x849w\x95P\x9d<.g\
-\xb0\x8c\x02\xce\xcd:Er\xdc\xddyNK\xaa&\x9e\
-\xf2\xceP;#\x98\x977\x09\xc1\xab\x9d\xe0\x02\xca\xc9\
-\x82,,O\xe6\x8e\xb6\x16-E\xc1]1\xd5\xe22\
-\x99zc\x84\x00\xf2[\x84~z\xa7\xc9\xb1\x15B\x99\
-\x83V\xd9\xcd~=U\x98\xaa\x89\xa7\xbc\x1b\x03g\x85\
-\xdd\xc0\xfdX\x19\xda\xe9=Y\x94\xbe\xa8\x136\x06\xeb\
-\xa8\x98\xe1\xf1E?\xd0C\x06h\x0c\x18?\xca\xf7t\
-\x9c\x02pF\xb8\x0e\xac\x91\xf5\x1e\xban\xd7\x80_\x08\
-\xd7\xcb\x18\xc1\xb57\x15\x1d\xf3l\xed\x0aSV\xf1\xd0\
-.\xe9\xf6,e6\xcb\xe6mEs\xfa\x8bN\xaf\xa5\
-s\x14,\xbeI\x10O'\x99\x9cY\xe7\xc4\xa5\x0a\xc6\
-\xd0\x22\xe9\xf7L\xb5\xb1\xb8\xa83t\xed\xee#\xb7\xde\
-[\x14\x13\xb5D\x88\x7f\x9aEn=\x1b\xb3\xe8\xfaq\
-\xf1Ta\xaa&\x9e\x06\xd0\xff\x9cg\xbb\x86\xac\x5c\x1b\
-^(\xd3\xc9\x9aN\xaf\xa3#$\x9a6\xd0bT\x14\
-\xf1d\xd9vc\x04\x8b\xb3\xdf/\xd5\xc6\xe2\xa2 \xc4\
-D\x01\xbc\x22d\xea\xc5U\xcb\xef\xa2\x80\xf3\x13\x82\xc5\
-j\x18][6\xdc\x1bP!\xaa&\x9el\xb7\xb1\x87\
-\x84\xcb\x10\xbd}\x0f\xd2\x8d\x81O\xe8\xac\x16\x8e\xdf\xa4\
-N\x16\xb8\x10w\x1c\x11\xbb\xf3\x06P\x0c\x94\xb9\xf3\xde\
-\x02?\xa3\x1aQ\x0b\xc9\xe3<!;o\x9a\x90\xb5\xe7\
-\xf49U\x14OV\x816\xeey\xd5+\xd2\xbd\xed\xb2\
-j\xcf\xe28\x9d\xe2\xd7\x92\xe3\x84\x0d\xf6)\x9a\xabw\
-QY\x997\xa8*\xf9\x18!Ko\x06\x05\x99\xdb\xb8\
-\x8e\xd6\x15\x17O\x15\xa0\xaa\xe2i\x1f\x99\xf1{\xfd\xff\
-\xd7\x93s8!\xf8\xdb;\xcdJ\xf2E\xcf\xc9\x8aN\
-\xaf\xa5t\x22C\x91\xaeKs\x93\xa7\x8b\xd4:N\xcc\
-\x19\xa1\xf6\xdea\x8b\xd7X\xb9\x83)\xe0sd\x95:\
-M\x86\xc5\xd5\x0e\xb4\x18E\xbb/\x9c6\xa9\x9ax\xb2\
-\xee\xdc{\x84\xf8\x87^2\x80\xfc\xe4\xe3\xc90\x9fy\
-'\xf8B\xe0\x14\x05\x8b'\x9c@\x9b\x93N\xaf\xed\xac\
-0k\xc2>Z\x10;-\x0f\xe2T\x1b[G@1\
-R\x00\xdb\xa8\x97\xde_QP\xb9\xb9\xf0\xa6\xa31\x89\
-\xe6\xfc!\xca\x9d\xac\xe4P=\xf1\x14[\x9e\xa6\xe8\xfd\
-$ZC7\xcf\x18\x12O\xed.0\xbe\x83v\x8aF\
-\x8d \x9e&\xd1\xc6\xa4(\x0bD\xec\xae7\xf1\xe4\xf7\
-\x8d\xd3.v=\x9d\x22\xf1\xb4\x85z\xe9\xcd%c\x01\
-\x09\xa8\xeb\xa9a\x19z5\x8aso8mR5\xf1\
-d1G\x87\xe4\xd3\xb8\xd4\xc4\xd38\x9d\xef\xce]@\
-9\xdd\xa0\x93ki\x88\xd0\xc1>\x0b\xabjVXf\
-\x95[\x9e\x9c,\x88]{\x07\x84:Qq\xf5\xf2;\
-\x84^z\xbb\x848*\x0b(\x9f@\xf7\xc7`\xea\xb1\
-(\xf7\x8c\xf3\x11\xaa&\x9e\xf2\xc6\xdcvfy\xeat\
-\x81\x89\xcb\x1d\xd4q_\xba\xd3\x1eV:\xc3b\xf0\xfa\
-M\x8c\xa7\xddv'\xf4\xdf\xff\xe8\xe4\x8f5\xc6\x06e\
-\xe6\x9d\x22w\xde+\xe0Gd\x91\x8akG\x99;o\
-&z>\xde\xd33v\xda\xc6\xc5So\x89-O\xe6\
-\xb6kW\xf0\xb8\xe5\xc9\xc9\x12\x13P\xbd\xb6\xc6\xf6\x82\
-\xd8]\x7fH6\x89\x1a\x8e\x13SGb\xc9\xfa\xe9\x9d\
-\xa2\x82\xb1/\x09\xd5\xc8'P\xed(\xab\x1fe\xee\xbc\
-\x1b\xc9\x18\xc1\xc5Si\xa8\x9ax\x8aw\xd8\xb6P\xf4\
-\xd2bc\xbe\xee\x91d\x98\xa9\xf6\xaa\xb8pr\xb2$\
-]\xb8\xb5\x9dk\xca\xb2\xec\x86\xe8\xec\xda\xee\x06\xb6\xa0\
-\x1dQ\x9c\x961N\xffa\xee\xbcV=\xf5\x86\x91p\
-Z\x224!\xde@\xb1x\xc7\x04\x016\xd8d\xc4\x99\
-z\xeea(\x00U\x13Oq\xe0\xe8\x11\xc1o]V\
-\x5c@9E\xc1\x82ag\xd1\x021M~U\xfc\x1d\
-\xa7\x88\x9c\x13\xaa\x99[\x1c\xde\x06r\xeb\xfd\x82\x82\xcc\
-\x97\x085\xa4\xa6\xd1\xfd4C\x08\xf3\x18\xc6\xc5S!\
-\xa8\x9ax\x8aK\x15\x94=p\xd4\x05\x93S$jh\
-\x82\x9fC\x0b\x80\x8b'\xc7i\xc4\xc4\xd3)r!\xbf\
-'4\xac\x9e#l<n4\x19\x0bh\xce/\x92E\
-\xb7\xd2TM<\xc5\xb1\x0f\x96j\xdaK\xd2n\xbbN\
-zl\xc5\x81\xe2.\xa4\x9cN\xc9\xa2X\xeb0\xca$\
-\x9a\xa1\xf7\xd5\xfb\xd3\xc4V\xd9~\x8d\xe5r\xcaE\x1d\
-Y\x9b\xacE\x981\x88\x04\x94m>\xee\xa0\x0c\xbeM\
-\xb4V\x1d#\xd1e\xb5\xa3\xac?c3\xb7\x9e\xd3#\
-\xaa(\x9e\xec\xc2\xcd\xc3\xf2d7\xc9<\xdaaL\xd2\
-\xdeg`qZ.\x9c\x9c,H\x8b\x8c~\xb8\xa6\xac\
-,\x89\x95&\xf1\xdaNNQ\xb1\x9e\xa75\x94\x9d\xf7\
-\x1am\xee7\x80U\xe0)\xb2\xe6\xce!\xeb\x94\x8d\x19\
-$\xa6\xac\xf4M\xd5\xd6\xf3\x5c\xa9\xda\x9b\x9d\xb7\xe5i\
-\x00]\xe4\x0bH<M\xd1\xfeg\x10\x0b(\xc7\xe9\x94\
-N\x03\xc6\x8b\x86\xdd\xeb\x87\x84&\xdc\xfd\xf0\x7f9\xfd\
-\x87\x89'\x0b6?D\xfd\xf4^\x22\xe14G\xd8p\
-[\xb0\xf9M\xe4\xce[N\xbeg\xd6(\xa7GT\xed\
-\xcd\xb6\xdd\xe8Q\xf2\xd8kS\xfe\x00\xba\xc8'\x09U\
-\x98;\xf1_\xbb\xeb\xce\xc9\x82\xac\xb27\xad\xd8_\x11\
-\xdc\x08gh\x11\xda\xa61\x9b\xc9q\x8a\x86\xf5<M\
-g\xea\x0d!\xf7\x9d\x15\xde\x5cB\x1b\xef\xeb\xc8\xa5\xb7\
-\x8d\xaa\x9b/\xa3B\x9c\x13\x84\xf6/\xf1\xb0{\xd1c\
-\xa52\xa4j\xe2\xa9_I/|\xee\xfbv.C\x96\
-\xe2;n\xcf2A\xfe\xedYNP\xc3\xd6wh\xa1\
-9\xc4\xc5\x93S.l\xb3\x7f@\xb0\x0c\xef#\xd1\xb4\
-\x8e\xacR\xf3\xc9\x98\xa3\xd1\xad7\x13=\x8f3\xf5\x9c\
-\x8cp\xf1T~\xd2\x0b\xa0\x0b'\xe72t\xc3Z\x19\
-\xf7\xb6\xcb\xbb1\xf01\xda\x8d[\xe0\xed\x01\x1e4\xee\
-\x94\x8b\xd8\x9dg\x15\xf27\x90\x08\xb2\xa4#\xb3J\x99\
-e\xea\x16r\xe7\xddLF\xbc\x1e\xf8z\x9f!U{\
-3- \xf6\x94P(\xb3\x97\x98\xe9t\x90Fsj\
-\xa7\xb8\xe5\xc9i\x97\xacDT\xd1,O\xe7\xc8=\xbf\
-\x8b\x16\x1d\x8fyr\xcaF\xda\x9d\xd7\x8c\xb8W\xea\x22\
-*\x7f\xf0\x1e\xb9\xf3\xac\x9e\xe1<!S\xef=\xa1\xd7\
-^\x1ek`\xdfP5\xf1\x94\x0e\x18\xefu\x91\xccf\
-\xedY:\xdd\x9d\xc7\x99Ry\xc7\x998\xe5\x22\x1d\xeb\
-\xd4\xa9\xb8\x18&\xd4\xad\xb1*\xe3\x8e\xe3t\x0fs\xed\
-\xed\x13\xe6\xff]\xe4\xae~\x0d<AqRs\xc9\xd8\
-E}\xf7\xb6\xf1,\xd4\x8e\xa8\xaax2E\x9eG\x9d\
-\xa7x\xa7\x90\x95k#N3\xb7\x0c<\x17Q\xceE\
-\xd4S\x8f\x9db\x96'\xbb\xb6\xf3\xb6<9N\x15\xb0\
-J\xe5\xa7HD\xed!q\xf4\x82\x10\xf3d\xd9\xddK\
-\xc9\xcf\x1cF\xc3-\xb2mRE\xf1\x14wW\xcf\xa3\
-T\xc10\xc1\xb51F(\x96\x19\xa7\x8a_\x85X8\
-\x99\xf5\xc9q.C\xd6\xe5\x09\x86h\xb4<\xe5y-\
-Z\x0f\xcb\xbc\x5c\xf4\x8e\xd3\x0bZe\xeam\xa1\xf8\xa8\
-q\x1a\x05T\x1c4\xbe\x85'R\xb4M\x15\xc5S\x9e\
-\xbd\xed\xd2\x96\xa7\x09\x14\x5c;N(\xe8\xd7\xce9\xd9\
-B1\x90<\xf7\x1d\xbf\xf31\xd2\xa2\xbbS\xd21O\
-\xc3\x14#\xe6i\x1f\xaf\xf3\xe4T\x0f3\x14\xd85\x7f\
-\x8a\xd6\xbd\xf8\x9e\xdcI\x86o,\xda\xa0\xaa\xe2)/\
-\xcb\x93-0\x83\x84ZO&\x9eh\xf3|l\x114\
-\xf1\xe4\xc2\xc9\xb9,YZ\x9e\xd2\xe2i\x80|-O\
-\xcd\xac\xcc.\x9e\x9c\xaa\x10\xbb\xf3,\xf34\xdd\x17\xcf\
-6\xec.\x9e\xda\xa0j\xe2)n\x0cl1O\xbd\x8c\
-\x0f\xb2\xdev\x10\x8aeZ\x07m\x08\x17\xfbUH\xb7\
-\xd6\xb0\xc5\xd0c\x9e\x9c\x8b\x88E\xf7\x19\xed\x09\x0b\xb3\
-\xa4\x8e\xa0`\xd4iBM\x99\xbc\xb1\xc5\xc3\xc4S\xab\
-l%\xc7\xe9G.\x93\xa9\xe7t@\xd5\xc4S\xde\xed\
-Yb\xac\xcf\xddB2\xce\x08\xa2\xee\xaa\xa4\xfb\x92y\
-\xd9\x02\xe7c\xd8\xe4\xdaILP\x0d\xa5?\xcf\xa3\xda\
-2\x8b\xc8\xf2T\x04\xcc\xf2t\x80[\x9e\x1c\xc7\xc9\x98\
-\xaa\x8a\xa7\xbc\x1a\x03\xc7\xa4\x9b\x04\xef\xd3\x9e\xcb-\xce\
-\x9aJ\x8b'\x17NN+\xe2\x9ag\xed\x9a\xedM<\
-]\x03\xee\xa1l\x9e\xf1\x0b\x7f\xa2w\xc4\x96\xa7\xd8\xca\
-\xec8\x8e\xd31U\x15O\x03H@\xed!_\xb0e\
-\xbc\xf5\xf2\xfd\x18B\xee\xbak\xa8\x0a\xf2\x16\xed\xbb;\
-\xd2\x02\xcaJ\x16\x80\x0b(\xe7C\xd2\xae\xdevEE\
-\x8dP\x9c\xef\x06r\xdd\x8dfp~Y\xe01O\x8e\
-\xe3t\x8d*\x8a'\xcb@\xd8F\xd5V\xd7\xd0\xeey\
-\x8a\xde\xbe\x1f\xc3(\x85\xf4&j\x1f\xb1J\xe7\xb1\x22\
-q\x1c\x0bx\xf0\xb8\xf3!Y\x0a\x88\x1ar\xd3\xcd!\
-\xab\xd34\xda\x88\x14\x81f\xd9v\x8e\xe38\x99P5\
-\xf1d.\x8ac\x82xZM\x8e\x0d\xa3\x00\xee^1\
-\x84\xc4\xd3-du\xfa\x85l\x02mM<Y+\x18\
-w\xdf9F\x1c\x0b\x97U\x86\xdd\x18\xba\x8eM<\x15\
-!X\x1c<\xe6\xc9q\x9c.R5\xf1dA\xb2\xa0\
-\x1d\xe9&\xb2<\xf5Z8A\x88y\x9aCqO\x13\
-tn)J\x97-\xf0\x9aON\x9a\xd8]\xd7)5\
-t\xdfXC\xd2y\x8a\x130~J\xb8\xc7w\x90\x15\
-\xca\xc5\x93\xe38\x99P\xe5j\xd4G\xc8\xfa\xb4\x9a<\
-\xb6\x93\xe5\xd6\x09\xdd\xeas\x17\xa7\x9f\xa73\xf0\x9cj\
-\x93.i\xd1\xa9\x80\x8a\x03\xc6\xef\x22\x11U\x14\xf1t\
-\x82\xe2\x19\xd7\x91\x80:\xc0\xeb\xd98\x8e\x93\x11U\xb3\
-<\xc5\x1c\xa1\x1d\xe9\x1a\x0ax\xed\xb5x\x8a[\xb5X\
-m\x9c\xac\xc4\x93\xfd\xfeA<\xf3\xce\x09\xc4\xe2\xba\x93\
-@q\xc3\xc4\xd3u\x94m\xd7\xeb\xa4\x8b\x8b8A\xf7\
-\xb7\x89\xa7vkY9\x8e\xe3|@Q&\xba<8\
-B\xb1F\xab(h\xfb\xb0\xc7\x7f?\xb6<M\xa2x\
-\x91i\xb4\x18uR\xf9\xb5\x95u\xc1:n;\xd5$\
-\xbe.\xac\xb6S\xbb\x16\xc91\x94Ug=\xb3f\xe8\
-\xbd\xdb\xbb\x19'\xe8\xbe>B\xf1\x8c;\xc8\xe2t\x9c\
-\xe7I9\x8e\xd3\x7fTY<\x1d\x13,Oy\xb8\xed\
-\xcc\xf2\x04\x12Ms\xc8\xed\xb1\x8e\xdc\x0d\xbb\x5c]<\
-\x99\x85)^(-\xc6\xcb\x85Su\x89k\x7feQ\
-\x18s\x12\x89\xa6\xeb\x14\xab\xb6\x93\x89\xa6\xf7\xc0kt\
-_\xf7\xba\x7f\xa5\xe38\x15\xa0\xca\xe2\xc9b\x9e\xd6\x90\
-\x05*/\xf14\x84\xacMsh!Z@\x8b\x5c\xbb\
-\xe9\xd5\xe9\x9aO\x9eyWmb\xeb\x92]\x0f\xfdZ\
-\x18\xd3\xc4\xd3s\xe0\x0d\xde\xf4\xd4q\x9c.Qe\xf1\
-t\x8a\x04\xca6\xf9\xd5\x81\xb1\x18\xa7q\xb4\x08\xddC\
-\x85;\xad\x0eU'\xae\xc48\xb3\xd0\xc4\x93g\xdeU\
-\x8ff\xee\xbaN\x0bc\x8e\x13,Os\x14\xa70\xe6\
-\x09\xbao\xde\x22\x0b\xee\x1enyr\x1c\xa7\x0bT]\
-<\xc5\xadZ\xf2\x9cdG\x80e\xe0atN\xaf:\
-\xfc\x9d\xb6\xe3\xae\x13\x84\xd39A\xb0\xb9\x05\xaa\x1a\xc4\
-\xae\xbaN,N1\x16\xef\xb4L\xb1\x0acZ\x86\xdd\
-;B\x86\x9d\x07\x89;\x8e\x939U\x16OEj\x12\
-<\x8a\x16\xa2\x13$\xe4^\xd3\xf9n>\xb68\x98x\
-\x1a\xc2]wU\xc3\x5cu'\x04\xf1\xd4\x89\xa0hV\
-\x18\xb3(\xe2\xe9\x94\x0f\xc5\x93\xbb\xed\x1c\xc7\xc9\x1c\x17\
-OZ\x0cv\x91\xb9\x7f\x13-\x04\xc3\xf4\xb6R\xf2 \
-r\x85\xcc\x91]\xc1Lh\xde\xf3\x0e<\xf3\xae*\xc4\
-=\xec\xb2*O\x00\x0a\x18_\x06\xee\xa02\x1fE\x8a\
-y\xda@V\xdb\xb7(\xe6\xa9\x0an\xbbA\xc2\xbcU\
-G\xc90\xedf\xeb:\x8es\x09\xaa,\x9e\xccmw\
-\x86\x02\xc6\xe3>w\xbdn31\x80&?+\x989\
-L\xb6\xe2&\xdd\xf3\xce\x85S\xff\x13g\xd8eY,\
-\xd5\xb2\xedVP\x8c\xde4\xc5\x12O\x160\xfe\x9a\xea\
-\x88'\xeb\x900M\xb0\xbey\xb0\xbc\xe3t\x91*\x8b\
-'\xdb\x89[\xd6]\xdc\xe7n\x04\x89\xa8^a\x99w\
-YV\x1b\x8fi\x96y\xe7\xf4/u\x9a\x8b\xa7\xacZ\
-\xb2\xc4\xd9vEJDHg\xdb\xb5[\x8e\xa1lX\
-\xc6\xee\x22\xb2:\x9d\xa1\xb8I\xc7q\xbaD\x95\xc5S\
-\xbc\x0b?@\xd6\xa75$\x5c\xa6{|.q\xc1\xcc\
-9T\xb4\xf3a\xf2\xbd\x9d\xe4\xdc:\xc9\x06\xb4\x05\xf4\
-4\xf9[&\xa0\xcc\x02\xe5\x96\xa8\xfe\xc2\x82\xc4\xed3\
-\xcf\xc2]7\x93\x8c\x05\xe4\xae\x9b\xa7\x18Yv'\x84\
-\xe6\xbfVvd\x9fj\x15\xc6\x1cB\x96\xa7\xc5\xe4\xf9\
-\x0az?\xb6\x91\x1bs\x83 \xaa\xb2r\xdd:N\xa5\
-\xa9\xb2x\x8a\x89\xab\x8dO\xa3@\xd8^bn\xbb\x1a\
-Z\x9c\x1e\x00\xbfGb\xeaIr~\x9d\x88\xa78\xf3\
-\xce\xc4\xd3 \x1e\xfb\xd4\xaf\x98x\xb2 \xf1N]W\
-5tO\xdcG\xd7\xe6\xa7H<\x15\x01\xb36\xbdC\
-\xb1N[T\xc3U\x173L\xb0<-\x22!5\x89\
-\xaco\x7f\x05\xbeC\xef\xcb1\xbd\xafg\xe78}\x89\
-\x8b'\x11\x17\xcc\x5c&\xdf\x82\x99\x0bh\x91:M\xbe\
->B\x8b\xc2N\x07\xbf?v\xdd\x98p\xf2\xe0\xf1\xfe\
-\xc5,Nfm\xc8\x22\xd6i\x01YC\xff\x00|\x82\
-,\xa4E\xc0\x82\xc4_P\xdd\xaa\xe2\xb1\xe5\xe9\x01\xb2\
-\x0c\xde\x01~I\xbe\xff\x06]\x0b\xe7\xc9\xa3[\x9e\x1c\
-\xa7C\x5c<\x89}TT\xef\x192y\x1f\xe4p\x0e\
-f\x11\xb2\x1a:\xd7\xd1nz\x01M\x8c\x16\xfc\xdan\
-\x83\xd3\xb8\xca\xb4\xb9\xef\xec\xf3w\xf7]\xf9\xb9\xa8\x18\
-f\xbb\x8b\xe5 \xa1\xc4\xc5\x22p\x1bY\x9d\xae\xa1\x8c\
-\xd0\x22`\x0d\x80\xd7\x90\x05j\x9f\xea\x89'\x0b\x12_\
-G\x9b\xbfA4o\x9c\x01_\xa0\xf7\xe4\x09\x12\x97\xaf\
-\x08u\xed\xaa\xf6>9Nf\xb8x\x12{\xc8e7\
-H\xa8\xf2\x9d\x17\x83\x84]\xe4\x12\xda\xe1O!\x17\xde\
-\x11\x9d\xc7,\xc4\x95\xc7\x0d\xb3>y\x0d\xa8\xf2b\xa2\
-)\x1e\x9d\x8a\xa7!\xe4N\x1eC\xd7\xe3Md\x15\x9d\
-\xa28\xe2)\xae\xed\xb4A5k;\x99\xf5\xed9\x12\
-M\x9f\xa2M\xd8u\xe0K\xf4Y-\x01_\xa3\xb9\xad\
-F6s\x89\xe3T\x16\x17Ob\x1f\xed\x5c\x8f\xd0d\
-\xb3\x9f\xe3\xb9\x98\x09\xbe\x8e\x16\xac9\x14\x875\x86&\
-\xbbN\xeb\xb7\xd8\x84\x19\xbb\xedl\x02u\xe1T^\xd2\
-qNY\x94&\x18D\x8b\xb05\x026\xf1T\xa4\x8c\
-\xcd\x13$\x08L<\xedS]\xf1t\x82\x04\xd3!\x12\
-\xbd\x8bH8\xddJ\x1e\xf7\x80\xa7\x84\x12-\xee\xc2s\
-\x9c6q\xf1$,c\x07T(s\x03\xb9\x00F\xa2\
-\xd1+,x<^\xb0>A\x93\xdc[4\xe1uZ\
-\x0d=v\xf1X \xba\xb9h\xbc}Ky\x88\xcb\x11\
-\x9cE#\xab\x9aNs\xe8\xfa\xbb\x85D\xd3\x02\xc5\x9b\
-3\x8e\xd1\xfd\xfa\x92\xd0\x0c\xb8j\xee\xa8sB\x1fL\
-+\xf6\xbb\x89\xe2(\x07\xd1\xe7x\x1b\xb9\xf0\x0e\xd0<\
-bs\xdc\x0e\xb2\xdc\xedR=\xd1\xe98mS\xb4\x89\
-0/\xac\xda\xf89\xa1`\xe6*!=;\x0f\xf14\
-\x802\x9an\x03\x9fG\xe7\xf9\x8e\xce\x1b\x06\x9b\x8b\xee\
-,:\x16\xc7?\xb9\x0b\xaf\x1c\xc4\xf5\xbb\xb2\x8as\x8a\
-Y\x04\x1e\x01\xbfA\xc1\xe2E\xc9\xb0\x8b\xa9ja\xcc\
-\x18\xb3\x22\x9d\x13\xca\x13X\xd9\x95\x89d\xdcH^3\
-\x85\xde'\x1b\xaf\x90\xf0\xac\xa2\xc5\xceq\xda\xc6\xc5\x93\
-\xb0\x85\xc7\xba\xb2[\xb5q\x90\xdb\x22\x8f\x82\x99\xc3h\
-\xc7x\x0b-\x10\xc7H8eQ\xf9\xdc\x16V[l\
-m\xb1\x89\x0b\x1e\xbap*\x07i\xf1\xd4nBA3\
-\xe6\x91h\xfa\xaf(H|.\xa3\xdf\x9b%&\x9e^\
- !\x90\x95p,\x13fA\xb6\xe0\xf9M\x14<>\
-\x8d\xe6\xaf1\xe4\xce\x9b\x04\xee\xa2\xf7\xeaI2\x86\x90\
-;\xefuoO\xd9q\xca\x8d\x8b\xa7\x80\xed\xe2\xb7\xd0\
-\xe4\xf2\x1d\x9a\x8c\xc6\xd1\x0e\xbc\x97\x98p\xb1\x82\x9d\xcb\
-(\x0bp\x05\x05~\xdaN\xd3\xace\x9d\x10\xbb\xf0l\
-\xf1\x1d\xa01\xa6\xc5\x85T\xb1\x88]u\x16\x1c\x9eU\
-5\xed\x11\xb4\xe0\x8e\xa0\xeb\xed\x1aZxg\xd1\x22\x5c\
-\x04\x8e\x91\xa5\xe4\x00\xb9\xea\xb6\xc8\xe6^(3&\x18\
-M@\xad#\xf1;E\xb0,O\xa0\xfb\xfa\x1a\xba\xa7\
-\xedk\x9b\x03\xcc\x8d\xb7C\xf5\x04\xa8\xe3\x5c\x09\x17O\
-\x1f\xb2\x85J\x16\x8c&c9\xc7s\x89\xeb\xb7\xacD\
-\xe3\x18Y\xc8,0\xb8]b\x17^,\xa0l\xe2\xf4\
-,\xbc\xe2\x91n\xbbb\x16\xd3\xb8\x7f]'\x8c\x12\xdc\
-\xd5\xf15g\xf7C\x11\xb08\xa75\xaa[\x18\xb3\x15\
-'\x84\xb2\x05Kh\xee\xb0\x96S#\xc8\xb2\x5c#d\
-P\x0e\x11\x5c\xf5\xcf\xd0\xc6q\x0f\x7f?\x1d\xe7B\x5c\
-<}\xc86\x8a\x9f8A;\xb4\x87\x17\xbf\xbc\xabX\
-\xcf*\xd0\x02f\x16\xa8=$\x9c\xb2(\xa9\x10\xd7\x7f\
-J7\x0f\xf6\xfaO\xc5$\x16Nf}\xca\xca\xeab\
-\xe2\xc9\xae7\x1bP\x9c\xeb\xc0\xc4S\x5c\x18\xb3\xd3$\
-\x8a~\xc1\xc4\xd3;\xe4\xbe\xb3X&K\x08\x81`M\
-\xaf\xf3a\x18\xc0.\x12\xa4\x8e\xe3\x5c\x80\x8b\xa7F\xea\
-(\x18{\x0b-\x14\xabhw\xbbN\xd8y\xe7\x11<\
->A\x08\x1e\xdfL\xbew\x8e\x16\x90\xac\xaa\xa1\xa7\x03\
-\xc8\xe3s\xf0*\xe4\xf9\x93\xb66\xc5\xee\xba,],\
-3\x84b\x98\xb7\x91\xbb\xaeh\x9f\xbde\x8c\xfd\x00\xfc\
-\x8c\x84B'\xed\x8b\xfa\x89\xb8\xe2\xfa\x22\xaa4\x9e\xb6\
-\x22\xc5\x9b\xa2\x19\x14WyN\xb0F\xddFs\xdf:\
-\x9a\xff\xe2k\xcdq\x1c\x5c<5\xc32\xd9\x8e\xd1\x04\
-b\x02j\x06-$\xbd\x16O\xc3\xc9\xa35d\xb5\x89\
-l\x13\xd5l\xc9\x8a\xf3\xe81\xbd\x18\x17m\xf1\xac\x1a\
-\xe9\x92\x04\x16\x1c\x9cU\x9cS\x8c\x89\xa7_\xa1\xebm\
-&\xe3\xdf\x9f\x05\x874\x8a\xa7u\x5c<\x19GHL\
-\x0e\x22\xeb\xe16\x17_#SH<Yl\xe5\x03\xf4\
-\xd9\x7f\x93\x8c\x03B\x19\x17\x17O\x8e\x93\xe0\xe2\xe9C\
-\x8e\x92\xb1\x8bD\x93\x8d\x1a2w\xf7\x12\xb3<\x81,\
-O\xa7\xc9\xd7V\xec.\x8b\xcc;#]y\xbc\x16\x8d\
-\xa2\x14D\xac2i\xab\x93\xa5\xa6g\xcd4A<]\
-\xa3\x98\xe2\xe9\x00mjL<\xed\xe3\xe2\xc90\xcb\xd3\
-1\x12E\x1f\xeb\xf57E\x10P\xf7\xd1\xdc\xb2\x87\xae\
-\x83\x034\xcf\xd8\xdc\xe0M\x85\x1d'\xc1\xc5Sk\xea\
-\xc8\xba\xf3\x0c\xf8\x96\x90y\xb7\x90\xd3\xf9X\xf0\xb8\x15\
-\xce|\x802\x8d\xa6\x90\x9b1\xcb\xb8\x8ff-\x5c\xa0\
-QP\x81[\xa4\xbaI\xda\xda\x94.I\x90%K\x84\
-x\xba\xbfA\xb5\x9d\x96\x91p*R\x90\xf8\x1e\x12J\
-/\xd0\x86f\x1bY\xa1:\xad\xba\xdfOX\xf3\xdf\x1a\
-\xca\x9a\xb3\xc0z\xab\x16?J\xeb\xcd\x90\xbd\xa6\x8e\x04\
-\xf4o\x93\xe7\xcfP\x1c\xe8\x0b\xdc\x85\xe78\x80\x8b\xa7\
-\x8fa\x99w#H8]\xcf\xf1\x5c\x86\x91P\x1aF\
-\xbb\xc4O\xd0\xf9\x0d\xa3\x89m\x9f\xec\xc4\xd3y\xea\xd1\
-\x18\xa01\x06\xca\xb3\xf0\xbaK:(<]A<+\
-\x96P[\xa2_\xa3\x04\x89\x87\xc8\xeaT\xc4\x0c\xbbU\
-\xb4\x88\xaf\x22\xf1t@\xf6q_e\xc6\xca\x98\x9c\xd1\
-X0\xd3\x1a\x8e_\x14v`\xe2i\x10\x89'\xd0f\
-\xedO\xe8>\xdf \x845\xb8xr*\x8d\x8b\xa7\xd6\
-\xd4\x918y\x8e\x16\xae\x9b\xc0c\xf2\xeb\x037D\xb0\
->\xed#\xcb\x93\x09\xa6}d\x85:\x22\x9bE\xa4\x95\
-\xe5)]@\xd3\x85S\xf7H\x97\x22\x88\x9b\xfdfA\
-\xfc\x19.\xa1\xd6\x1d\xff\x1b\xda \xc4\x19vE!\xce\
-\xb0{\x8e\x04\xc1\x0e\x9dU\xdb\xefG\xcc\xf2\x04\x0a=\
-\xd8@1aS\x84\xbaq\x83\xcd\x7f\xf4?3\xf2F\
-\xd0|7\x87\xe6\x99:\xaa\x01\xf53\xa1.\xd4\x09a\
-\xaeq\xe1\xeaT\x0e\x17O\x17c\x99w\x83\x84\xe0q\
-\xcb\xbc\x1b\xa3\xb7\xc1\xe31\xa3\x84\x00\xf2xw9\x84\
-\xce9\xcb\x82\x81\xb1\x90:\x8f\x86U#\xf7^x\xd9\
-\x11\x0b\xa6s\xbakm\x9aB\x96\x88Ydi\xba\x83\
-\xdcvE*\x86\x19s\x80\xda\x88\xfc\x05\xf8\x1a\x95(\
-\xf0\x18\x9c\x8b9&\xd4|\x9aC\xc2\xe9\xb2\xd7\xd0\x10\
-\xc1\xeax\x1b\xf8\x1d\xba\xc7\xdf!!\xf5\x1e\xcd\x8d\x16\
-2\xe08\x95\xc2\xc5Sk\xacl\x81\x89\x878x|\
-\x96\xc6`\xee^c\xe2\xe9\x8cPM\xf8\x0d\xa1B\xfa\
-q\xeb\x1f\xbd2\xb1\x0bo\x90 \x9e\xe2\xe2z\xee\xc2\
-\xcb\x868\x9b\xaeY\xa3\xdf,\xb1 \xe1;4\x8a\xa7\
-q\x8a\xe3\xaa\x8b\xb1X\xa7?\xa3\xea\xffY\x96\xe9\xe8\
-W\xd2\x053\x97\xb8\xfc\xa6*\xed\xc2\xab\xa19\xe7\x15\
-\xa1'\xde3B?=\xc7\xa9\x14.\x9e.\xc62\xef\
-\x0e\x91h2\xebS\x1e\x99w1\xa3(\xfbn\x04M\
-\x8e\xabH<\x1d#k\x85uH\xcf\xda\x85g\x16'\
-\x9b\x80\xe3L<\x17N\x9da\xc1\xe1\xa7\x047]V\
-U\xc3\x8dt}\x9f\xdb(\xd6\xe9Q\xf2|\x89\xd6.\
-\x9d<\x88\x83\xe6w\x91\xe5\xe9k\x94e\xe7|\x1ck\
-\xd5\xb2\x86b\xd8\x0e\xb8\xfc\xb5\x14\xbb\xf0n\x11\x5cx\
-OP\x06\xde|\xf2\xbbvP\xd9\x88,\x1bR;N\
-\xe1q\xf1t9l\xf2~\x8bv[C\xe4\x9b\xc2m\
-\x93Z\x1d-x\x9f\x22\x813\x99\x1c? T!?\
-%\xbb\x09-\xce\xfe\xaaE\xc7l\xa2u!uy\xea\
-\xa9\x91\xce\xa6\xeb\x86\xb5i\x18\xb9\xe4\xc6\x08\x850\xbf\
-D\xcdb\xe7(\xde\xe7v\x84,\xa9\x9b\xc0OH\x04\
-diU\xedw\xaci\xf2s4O\xdc\xa3=w\xfe\
- \xbafj\xc8:YCsM\xdc\xc6i3\x19;\
-\x9d\x9c\xb0\xe3\x94\x05\x17O\x97#\x16OO\x91p\xca\
-3\xf3\xce\x5c\x86\x83(\xb0\xf7\x1cMfC\x84f\xa9\
-g\xc8b\x96u\xdb\x8as4y\x9a(3\x17\x1e\xb8\
-\x0b\xef*\xc4\xa2)\x8em\x8a]u\xf6\xba\xac\xb0\x80\
-\xe19\x1a\xc5\xd3\x22r\xe3\x15\xed3;BV\xd5g\
-\xc0\x8fH<\xb9\xab\xee\xf2\x1c\xa2\x18\xa5\x01\xe0\x06\x1f\
-\xaf\xf9\xd4\x0as\xd1\xdb\xe3\x14\x12Q\xb1xzJ\x08\
-#p\x9c\xbe\xc7\xc5\xd3\xe50\xf1\xb4\x8a&\x8e\x1b(\
-\x06\xc3,0q\xed\xa3^`\xe5\x02\x86\xd1\xc27\x8e\
-D\xd4\x19\x8aoxJ\x107\x96\xb6\x9c\x05qvM\
-l-\x89\xcf)\xfd^\x14mA\xce\x93\xf8\xfd\x8b{\
-\x09\xc6\xb5s\xba\xe1\xaa\xb31\x81\xae\x97k\xc8\x0a\xf1\
-\x09\xca -Z\x8c\x93\xfd\xefq%q\x13Ony\
-\xba<q\xc1\xcc\xb7H<YM\xac\xab\xccY\xcd\xfa\
-\xe2\x99\xe8\x8f7J\xfb\xc8\xfa\x14o\x02\xc0]yN\
-\x1f\xe2\xe2\xe9r\xc4=\xef,h|\x15-Bch\
-B\xc9+x\xdc\xacPud\x0d\xfb\x12Ml\x7fE\
-\xae\x8e\x9f\xe8^M\x96t\xcb\x10\x9b\x94\x07\xa2G\x1b\
-PM!\x95v\xcd\xc5\xc2)\x16P\xddt\xd5\x8d\xa3\
-\xeb\xf4>\x12K\x8f\x81\xcf\xd1\xf5R\xb4\xea\xf1\xb6(\
-[\x0b\xa2W\x84k\xd9\xc5\xd3\xd5\x88\x0bfZV\xee\
-z\xf2\xb5\xcd[\xed\xde\x935d\xc1\xbc\x8b\x84\xd54\
-\xdaT>D\x01\xe5\xaf\xf1\xbexN\x1f\xe3\xe2\xe9\xf2\
-\x98x\x1a\xa1\xb1a\xf0\x1c!\x06)\x0f\xeco\x0f\xa2\
-\xc5\xf0<9\xa7q\xb4\x13|Jw\x5c\x1d\xb6\xe3\xb4\
-\xc5\xce\x82\xc9c\xd1d\xb5\xa9zm\x99+\x12\xcdb\
-\x9a\xd2\xe2)\x16V\x90\xbd\xabn\x8a\x10\xf0\xfb{\xe0\
-o\xd1\xb5\xb2@\xb1\x02\xc4!\xd4\x10:D\xe2\xe9%\
-\xb2<\xfd\x84\xac\xbf\xee\xb6\xbb<q\xc1\xcc\xb8\xda\xf8\
-0\xba\x1e,\x9b\xae]f\x93\x9f\x9fG\xd7\xd3\xa7\xc8\
-\xc2\xf5gTXs\x9f\xc6\x8ce\xc7\xe9\x1b\x5c<]\
-\x8e\xd8\xf2TC\x13\xc4+\x14\x84YG\xbb\xb8\xa9\x9c\
-\xce-v\xe1-#\xd7\xccM\xb4\xc8\xbc\x00\xbe\x22\xec\
-\xfc\xb2\x8e\x7f\xb2E>6\xd1\xdb\xf9\xc4\x055\xd3\x03\
-\xfaWL\xa5\x85O,\x92,\x8b\xae\x1b\xee\xb9\x98\xb8\
-'\xe1$\xbaN\xaf\xa3\xac\xba_#\xf14\xd1\x85\xbf\
-\x9b\x05\x16\xab\xb7\x8d6'\xaf\x80_P\xd0\xb3s5\
-\xe2\xebn\x17\x89\xd15\xf4\xd9\x8f\xd2Y\xd2K\x0dY\
-\x9b\xa6\xd1\xb5u\x0b\x89\xa5\x0dt\xddm\xa1\xcfo\x9b\
-\x90E\xea\xd9xN\xdf\xe0\xe2\xe9\xf2\x9c\x22A\xb2\x83\
-v\xc3\xe3\xc9\xb1_\xa1\x05j1\xbfS\xfbO\x06\x08\
-\xf1++\xc8\x84\xfe_\x08\xed,\xd6\xe8\xfe\x0e0\x1d\
-\x08\x1dg\xe7\xc5\x96\xa9A\xfaKH\xc5\xd6#[ \
-b\xb7\x5c\xb7\xdds1iW\xddg\x04W\xdd\x0d\x8a\
-}\xdf\x1f\xa3\xeb\xf4\x05\x8asZ\xc5\xadMYpL\
-\xa8\x097\x8b\x84S\x96\xd7\xa0\x15\xd5\x9cF\xf1t\x7f\
-@\xd7\xe0\x13$~_\xd3\xb8yp\x9cRS\xe4I\
-\xb4H\xc4;\xa7s4\xb1[\xf5\xde)T`\xb0\x08\
-\xc4.<\x13OGh\xa7YG\x997\xbd\x98\xb8b\
-WT,\x9cL4\x99U*\x16Pe\xa7\x99\x1b\xae\
-\x99`\xea\x96{.\xc6\xfa \xce!W\xddo\x81\xff\
-\x8a\x84\xd3<\xc5s\xd5\xc5\x1c!\xf1\xf4\x13\x9ea\x97\
-%V\xf3i\x1dm\xf4\xe2l\xb9N\x893\xf1\x06\x90\
-x\x1aA\x16\xcfI\x82\xd5\xde]xN\xdf\xe0\xe2\xe9\
-\xf2\xd8\x22x\x82v\xc3;\xc9\xb8\x8bv\xf4{\x84\x18\
-\x9f\xbc\x16\xa7t\x16\xde'\xc9\xf9X\x93\xd0\x17\x84,\
-\xc1\xac]xFZ\x18\xc4\x19\x89&\x9e\x86i\xee\xca\
-3\x8a\x9a\xad\xd7l\xb1\x89\xadLi\xa1\xd4\xac\xf4@\
-\xb7\xb0\x18\xb3A$\x9a\xae%\xe3!\xb2\x8e\xfe\x81\xfc\
-\x5c\xcb\x1f#\xb6V\xee\xa3\xfb\xeb\xe7dx\x90x6\
-\x1c\xa39\xe0-\x12N\xfbd+\xdemS4L\xe8\
-\x8b\xb7\x8cJ\xa7\xac\xa3zS\xbbh\xce\x8c\xe7\xa0n\
-\xdf\x17\x8e\xd3\x15\x5c<\xb5\xc7\x09Z\xacL\x90|\x8d\
-vZ\xd7\xd0\xc44\x97\xdb\x99\x05,\xa5\x18t\x9e;\
-H\xe0\xad\xa2\x89l\x83\xdeM\x5c\x16\x5c\x9ev\xe7\x9d\
-\xd2:\x1e*.}\x00\xf9\x0a\xaaf.\xb9t\x91\xcb\
-t\x1cS\x9d\xee\xc65\xa5\x99@\x01\xe0\x0b(\xfe\xe4\
-n2\x1e%_\x17\xf9^\xb78\xa7\x03\xb4\xb8\xbfD\
-\x89\x0e/Q\x9c\x8e\x8b\xa7\xce\xb1\x9aO\xcf\x91\xa8\xb9\
-O\xf7\xee\x7fs\xe1\xcd$\x7fg/y\xbe\x9e\x8c\xb8\
-?\xden\x97\xce\xc1q\xbaJ\x91'\xd4\xa2\x12\xbb\xf0\
-\x06\x90x\xfa&\xf9\xde\x17H\xb4\xcc\xe5rf\x8d\x8c\
-#\xb3\xf9\x14\xa1\xe2\xf8\x11\x8a\x839G\x8bR/i\
-VM\xbbU0ylE1\x01U\xa7\xb9\x95\xaa\x17\
-\xa4\x85P\xb3\x92\x03\x17\x09\xac^0\x81\x02w\xef#\
-k\x93\x95$01?\xdc\xa3\xf3h\x07\xb38m\x10\
-\xc4\xd3\xb3\xe4\xf1\x10mV\x9c\xce8Db\xa5\x86\xc4\
-\xb4\xb5p\xca\x9a\xb4\x0b\xef>\x9asn\xa2\xcf\xf3%\
-\x12pO\x92sr\xf1\xe4\x94\x12\x17O\xeda\xae\x98\
-:\x0a\x84\x1cN\xbe\xb6\x05\xcc\xea\xe7\xc4\x96\x93^3\
-\x92\x8c\x19$\x9c\xccT>\x90<\xee#QuB\xa8\
-\xd1d\xa3\x1b4s\xe7As\x015@\x10\x1e\x83-\
-^\xf31.\xfb\xbe_F\xdc\xc4\xee\xb7fu\x9ab\
-\xd1\xd4\xcbl\xa2!\xc2\xe7|\x0d-T_\xa2\x00q\
-\x1bE\xcd\xaa\x8b9E\xd6\xd1U\xb4\xb8Z\xf3\xd9\xf5\
-<O\xaa\xcf8\x22X\xf1VQ\x0c\xd2\x11\xb2\x10\xc5\
-\xb5\xd8\xb2\xc0\x5cxC(\xcen6y\x5cF\x96\xd1\
-)t\xcf\x985\xdckA9\xa5\xc3\xc5Sg\xd8\x04\
-\xf0\x86\xd0}\xfc\x0d\xb2\xf8L\x90o\xf1\xcc\x98)\xb4\
-\xdb\x1cH\x9e_C5Y^\xa3\x89\xf4-\x12S&\
-\xa8zM\xbd\xc9\xf3\xb4k\x0f._\xf2 \xfd=\xb3\
-\x5c\xb5\xfa\xdb\xcdDO\xba\x1ax\xda\xb2\xd4\xec\xeb^\
-\xa7aO\xa3k\xee6\x12N\x0f\xd0\xe7z\x0b-R\
-e\xb9\xbf\x8f\x91P\xfa\x19\xd5t\xf2\x0c\xbb\xec\xb1\x82\
-\x99\xd0X\xf3\xe9\x1c\xcdS\x13d\xbf\xd1\xab\x11\xfa)\
-Z\x11\xdfa\x82\xa0\xb72/\xe6\xc6s+\x94S\x1a\
-\xca2\xb9\x16\x15\x13O\x96\x82{\x1f\x89\xa7\x1bh\x17\
-e\x96\x81\xbc\x99F\xc2i\x8eP\xcc\xee\x1d\xf0=\xf0\
--\x9a\xc4\xde\xa3s\xee\xb5x\x8a\xe3\xa1\xd2\x82%n\
-@\x0c\x97\x13O\xcd\xacT\xe9\xdf\x1f\xd3\xca\xe2\xd6,\
-\xb6)}\xbc\xd9c/\x99A\x9f\xe5\x1fPr\xc0\xad\
-d\xcc\xa0\x05\xaa\xc8Yu1'H<Y\x86\xdd*\
-r\xe98\xd9q\x86\x04\xa9Y\xf9L<\x99\x8b\xad\x93\
-j\xe3\xad\x88]x\xc3h.\x9cC\xc2\x1et\xcf\x0c\
-\xa1R\x06\x07\xb8xrJ\x84\x8b\xa7\xce\xa8\xa3\x9b\xfe\
-\x00MN\x16\xaba\xbd\x9f&P\xaan\xde\x8c%c\
-\x11\x99\xce\xcd\xca4\x81D\xd5\x09\xc1\xfdhE\xf5L\
-\x10\xf6\x82VV\x9f4\x17Y\xa0H}\xafY\x9f\xbd\
-f\x02\xea\x22\xf1T\x94\xa2~\xf1\xff\x1a\xbb\xean\xa1\
-\xb8\xa6\xbfA\xc2}\x11Y=\x8b\x1c\xdfd\x9c\xa3\xc5\
-\xfc\x08Y>_\xa0E\xf4)\x12\xf6ny\xca\x16\xbb\
-\xc6O\x91\xabl\x13\x89'\xab\x07\xd6\xad\xeb<\xdd\x17\
-\x0f$\xee\x8f\x08a\x046\x07\xd5\x08\xd7\xc4\x09\xc5\xba\
-\x07\x1d\xa7\x01\x17O\xd9a%\x0c\xbe%\xb4-\x99%\
-\xec\xb2\x8a\xc2 \x8as\xa8!w\x8f\x9d\xe7\xd3h\xbc\
-#\xa4\x17\x17\x89\xd8J\x15\x1f\x8b1\x91\xd1\xac\xf9i\
-+\xcb\xd3En\xbb\x22`\x01\xf4\xd6V\xc3\xe2\xea\x1e\
-\xa1$\x85\x9b\xa8~\xd38\xc5\xebU\xd7\x8aC\x148\
-l\xc50\xbfB\x1b\x8fw\x848\x18\xa7;\xa4\x0bf\
-\xce\xd1\xfbX\xbd\x05\xe4f\x1eK\x9e\xdfF\xd7\xc2\xf3\
-d\xbc\xc3\x8bj:\x05\xc6\xc5Sv\x9c\xa2\x1d4h\
-\xe74\x87&\x87\xa2a\xe2i\x08Y.f\x91\xcb\xe7\
-\x07d\xb9\x98D\x16\x80c\x8a'\x9e\xa0\xb9\x9b/\xe6\
-\xa2\x9aQ\x17\xc5=]\xe6X^\xd4\x90\xa5i\x0cY\
-\x0e?C\xb5\x9b>E\xe5\x08n\x22\xd7\xec0\xe5\x11\
-OGh\x91\xfc#*\xf5\xf1\x14\x89\xa7\xf7h\xd1\xf4\
-\x05\xb3{\x98xZ#\xfb\x82\x99\x97a(\xf9\xbb\xe3\
-\xe8z\xbe\x8d\xae\xe9\xe7\xc0\xbf%\xe7\xb7\x8f\xae{\xbf\
-\x0e\x9cB\xe2\xe2);\xce\x90)\xdc\xcc\xd1\xd6$\xf3\
-&\x12+#\x14\xe3\xfd\x8e\x9b\xf6\x8e\x12,c\xc3\x84\
-\x0c\x19+\xacyLp\xe1\xd9.\xb0\x08;\xc1\x8b&\
-\xfa\x22\x89\x9e\xab\x12\xbb\xe7\xac\xe0\xa0\x05\xd8N#w\
-\xc7\x03\x94Q\xf7;T\xd9~\x11}\x86E\x88\xad\xfb\
-\x18\x16\xb4l\xae\xba'H8\xfd\x05Y\x1a\xcc\xea\xe4\
-t\x97c\x94mg\x053\x0f\xe8m\xb1\xcaA\x94\xb8\
-2E\x08%8@.\xe7\x03\x14\x8fu\x94<B(\
-\xe8\xe9.<\xa70\x14a1\xef\x17\xea\x04\xbf\xfd\x16\
-\xdaE\xff%\xf9\xfa\x06!e\xb7\xa8\xcc\xa0\xc5\xd8\x82\
-:o\xa2\xdd`\x5c\xd8n+\x19;\xf9\x9cb\xdfc\
-\x81\xb5\xd6^e)\x1a\xcb\xc9\xb8\x89v\xeaw\x90h\
-\xb2\xb8\xb52p\x82\x12*^\xa3\xcc\xba\xef\x90\xab\xe6\
-\x1d\x0a\x16vW]o\xb0\xaa\xdfO\x91x\xda!?\
-Qb\xd7|\x1d]\xcf\x0f\xd1u0Oc\x02\x81\xbb\
-\xf0\x9cB\xe1\xe2)[\xac\xdd\xc0\x162A[=\x93\
-Sd9(\xbax\x1aF\x0b\xf5M4\x89\xbdG\x8b\
-\xdcO\xc8\x95\xf7\x8a`\xf2w\xb2\xc7Z\xeb\x8c\xa3\x85\
-\xe4>\xb2`\xde#\x94$X@\xae\xd5I\x82\xfb\xb5\
-,Yu\xc7\xc8\xda\xf1\x0d\x8a\x0d\xfc\x9e\x10\xdfbV\
-M\xa7\xfbX\xb5\xf1s\xe4\xf6\xedV\xc1\xcc\xcb`\xe2\
-i\x10\x09\xa6\x87h.ZD\xd7\xf6fr~\x96\x94\
-\xe38\x85\xc0\xc5SvX\x8b\x0eK\xf7\x7f\x8f\xb2\xef\
-\xa6\x90\x18)z\xf6\x90e\xe4\xcd'\xe3:2\x97O\
-\xa3\xc5|\x94\xb0`\x8f\xa2\x85\xcev\x83\xc7\xc9\xf0\xc5\
-\xef\xf2X6\xa0\xb9JM4\xcd&\xe3&\x0a\x08\x7f\
-\x8cD\x94\x89\xa7\xa2\xf6\xa7k\x85\xd5\xea:A\x0b\xe1\
-K\xe0\xafH@\xbd\xc4]uyp\x84\xca\x15X\x89\
-\x88m4g\x99\x10\xef\xa5\x18\xb7{\xc0\x5cy\x03H\
-<\x8d\x102\x02\xad7\xa7\xf5\xc5\xb3p\x02\x17SN\
-n\xb8xr\x9a1\x88\x84T\x0d-\xe2\x83\x84F\xc3\
-o\xd1\x84\xb6\x85&\xb7\xcd\xe4\xebuz\xdf\xf2\xa5\xac\
-\x98\x85\xc9\x04\xd3\x1c\x12Lf\xf5\xbb\x85\xc4\xab\xf5J\
-\x5c\xa2\xf8-VZa\x0b\xdf&\x12K\xbf$\xe39\
-!\xb6\xc5\xe9-V\xf3\xa9\x8e>\x9b\xf7\x84\x82\x99\x13\
-t\xa7`\xe6e0+\x14h\xbey\x94\x9c\xd3\x8d\xe4\
-\xfcl\xac'\x8fy\x14\xf4u\x1c\xc0\xc5\x93\xd3\x9c!\
-\xc2\x02?\x84,Q\xf7\x091O\x9b\x846\x1a/\x92\
-\xd7\x1d\xe0\xe2\xe9\xb2\xd8\x22a\x96\xa6\x9b\xc9\xb8G\xe8\
-Kw\x8d`\x0d,R\xc2\xc1U1\xf1\xf4\x1a\x05\x88\
-\xff\x92<\xbe X,\x9d\xdeb\x81\xfb\xe9\x82\x99\xd6\
-K\xb2\x1b\x053/C\xec\xc2[@\xe2i\x16\xb9\x16\
-_\x10j\x81\xd5\x08\xd62\xc7\xc9\x852N\xc6E%\
-6?O\x22K\x81\x05\xf9Z\x1ayY\x88{]Y\
-\x7f\xbc\xb8 \xe8.\x9a\xdc\xe6\x93\xef\xd9u4Lc\
-f^\xfc<ngR\x15\xe2k\xc2\xdcsV*b\
-.\x19K\xc8\x1dw\x0b\x89\xa7G\xc9X\xec\xf9\xd9f\
-G\xec\xc2\xdeE\xd6\xca\x9fQ\x8c\xd3\xd3\xe4\xeb\xcd\xbc\
-N\xcei(\x0a\xbbOc\xc1\xcc<{!\xa6\xe7\xd0\
-\x014w\xda<c\xee\xbcSt]\xd5\x09\x02\xdc]\
-xNOq\xf1\x94\x1d\xd6\xe2`\x12\x09\xa6\x87(\x9d\
-\xfc\x0b\xca\x19\xab\xd2\x0c+o\x00r+\x8d\xa2\x89m\
-\x11e\x7f\xbd!\xb8\xf2lXv\xde\x09\xd5\x9b\xe4\x06\
-\x08n\x90\xc9\xe8q\x8e\xd0Je\x05\xbd\x87s\x84\xb4\
-\xed\xb1\xde\x9fj\xa6\x98\xd0\xdeC.\x96\x1f\x81?\xa1\
- \xf1\x17x\x1b\x8e\x22q\x8c\xac8k\xc8\xca3O\
-168f\xf9\x06\xdd\x1b\xa0\xfb\xc7\xc2\x09jhN\
-5W\x9e[\xa1\x9c\x9e\xe2\xe2);\xcc\xdc=G\xe8\
-\x1f\xf7[T\xccp\x9c\xd0\x9a\xa0\xacXk\x90\x01\xb4\
-\xfb\xb3\x1aQ\xb7\x90p\xda@\xc1\xbf\xaf\x90K\xcf\xc6\
- !\x88\xde\xac\x11U\xc1\xae\x09\x0b\xc2_H\xc6u\
-T\x06\xe2\x11\x8a\xe7\xb0\xbe_V\x08s\xb4\xd9/+\
-\x11\xe7\x047\xee\x1b\x94\xad\xf9gT\xd3)\xaf\xe6\xd3\
-Ns\xe2j\xe3\xcb(\x13\xaf\x08\xe2)v\xe1Y\xad\
-3\xb3\xe2\x1b\x83\xe8\x5c\xb7\xf0k\xca\xe91.\x9e:\
-#\xce\x96\x1aG\x8b\xe2\x1d$\x9c\x1e\x227\xcc\xf5\xdc\
-\xce.{\xd2\xee<\xd0B9\x83&\xb6\x1d\x82\x15%\
-\x1e\xab\xc8\x0aa\x0b\xe7\x19\xa1f\x8b=\xc6\xc58\x8b\
-,\xb0\x06\xa21\x1c\x8d\xf8\xf8\x08\xa1\x9b\xbc\x15\xb1\xb4\
-1\x8f\x04\xd3\xc3d\xac\xf4\xf6\xf4\xbb\x8a\xb9\x83\x0e\x09\
-u\x84~L\xc6S\x14\xf7\xe4\x14\x8bC$r_\xa1\
-kq?\xd7\xb3\x09\xc4.<\xbb\x97\xec\xf8>\xa1/\
-\x9e\xdd{\xab\xc9\xf1=4\x87\xb4j\xbb\xe48\x99\xe0\
-\xe2\xa93bW\xdd\x22r\xd1\xfd\x0a\xf8\x1c\x05X\x17\
-\xb9\xaeSV\xc4E\xee\xac\xa7\xdc8\x8a\xe5\xb9\x87&\
-\xe6m4\xa9\xb5\x1a\xfb\x84\x8c\xac\x0d\x8a+\x9e\xcc\xfa\
-f\x93\xf9\x5c2,\x16\xc3\x8e\x9b\x80\x9c%\xd4d\x8a\
-]w3h\xa1*\xbb52\xc6J\x12\x98\x1b\xe8\x17\
-\xd4z\xe5+\x14 \xbe\x95\xdb\x999\x17a\x053G\
-\x90\xa8\xcf\xb3\xe6\xd3e\x18E\xf7\x8e\xb9\xed\xae\xa3,\
-\xe0g\x84L\xce-B9\x03\x17ONWp\xf1\xd4\
-\x19&\x9e\xe6\x08\xae\x98\xbf\x03~M\x88u\xe9w\xd2\
-\xee<\xb3\xb6\xc4\x96\xa4#\x82P\xb2\xd4\xe8\xf4\xb0\xbe\
-\x80{h7\x5cT\x86\xd0\xff8\x852\xe2\xac\xac\x80\
-\xb9f\xa7\x09\x01\xe0\xcb4\x06\x8a\xc7\x8fV/\xab\x9f\
-8A\x9f\xdd\x16Z\xc4\xfe\x0d\xf8W$\x8e\x8bb\xd1\
-p\x1a1\xf1t\x8aD\xc8\x1e\xc5\x16\x1ccH<\xcd\
-\xa2\xfb\xee\x01\xba\xde\xbeC\xf7\xd36\xa1\x0c\x83\xd7\x9d\
-s\xba\x86\x8b\xa7\xab\x93v\xd5\xdd \xb8\xea\x1e\xa3\x9b\
-\xf9Vng\x97\x0f\xcd\xdcy1\x16\xf3d\x99z\x1b\
-\x04\xd1d\xcf\x97\x09\xae\xadm\x82\x0b\xc8\x5c{\x96\xb1\
-g\x9cG\xa3\x9ezn\xc4\xc7k4\xba\xd6\xe2sN\
-\xff\x1f6\xd2?cY@\x93H$Y\x89\x81k4\
-\x8a\xa7[\xc9\xf1\xa5VoX\x1fa\xef\xaf\x15\xc1|\
-\x87\x82\xc2\x9f k\xc0\xcb\xbcN\xcc\xb9\x14\x16\xf3t\
-\x8a\xee\xc3-\x82\x80\xb2>\x97Eb\x90\xb01\x9dB\
-\x22\xea\x80P\xbe`\x1b\xcdAV\x0b\xea\x10w\xe19\
-]\xa0h7F\x19\x88]u\x0b\xc8E\xf7+\xe4\xb2\
-\xbbG\xc8\x0cq\x02q\xf1;kJ<\x81\xde?\xb3\
-J\xec\x10jHY\x15\xe1c4\xf9\xed\x12b\x19\x8c\
-\xb3\xe85'\xd1c\xecr8\x8d\x8e\x0f\x12\x5ck\xf1\
-cL|\xbc\xd9\xf3Q\x82\xfb\xcd&\xeeYBk\x1b\
-{\xcd\x1c\xfd\xe5\x92kE\xec\xaa\xdbG\xa2\xe9g\x14\
-\xe3\xf4\x04-dN\xb1\x89\x0bfn!\x01\xb5\x8a\x5c\
-\xcf\xb6Q\xc8\xa3\xe6\xd3e0kw\x0dY\xa3\xbe@\
-s\xcb\x12*\x8bq\x8a\xe6\x13w\xe19\x99\xe3\xe2\xe9\
-\xea\xd4\x08\xf1.\xd7\x91\xb5\xe9\xefPf]?d\xd5\
-u\x03\x0b\xec4\x013\x81&\xe7\xb3\xd4\x88\xdd|f\
-\xa9\xdaF\xd6\x8cw4V\xa3\xb6\x05\xfb 5b\xf1\
-t\x18\x1d\x1f!|>\xf1\x88\x17\x06;6q\xc1\xf3\
-8v\xc9\x8a\x88\x9a\xdb\xd2,U&\xa4\xaa\xc0)z\
-\x9fw\x90x\xfa\x06\xc59=\xc7{ \x96\x813B\
-S\xf3\x1dB\xb5q\xdb\xe4L\xe6wj\x1f\xc5\xc4\xd3\
-\x10\xc1E\xbe\x8c63\xa7H\x04Z\xf6\xa0\xbb\xf0\x9c\
-Lq\xf1ty\xccuc\x01\x8b\xf7Q\xb6\xd4g\xc8\
-\xe2t#\xb73+\x07\xcd\xdcd\xad8%\x88\x1e\x9b\
-\xd0\xd3\xad<\x8e\x93\xef\x1f\xa6\x1ec\xf1t\x14\x1d\xb7\
-\x8a\xde\xe3H\xfc\xdac,\x9e\xc6\x9a\xbc\xa6\xd9\xd7V\
-\xf9\xbb\xaaX\x01\xd4c\xb4\xd0\xae\xa2L\xba\xaf\xd1\x8e\
-\xff\x09\xfa\xbc<}\xbc\xf8XAS\xd0fd\x0b}\
-\xa6c\x14[8A\xa8\xf74@(\xaa9I\xe8-\
-\xba\x89\xdc\xe8\xd6\x19\xc16[\xe6\xcas\x9c\xb6q\xf1\
-t9,(z\x04\xb9k\x1e\x00\x7f@\xd6\xa6{\xc8\
-\x8a\xe2dG\x8d`\x8e7K\xce4\x8d\xbb\xc7ty\
-\x03\x1b\xb1i>\xaern)\xcf\xe9\x11\xd3\xec\xfb\xcd\
-F\x95\xef\x9b:\xc1\x95j\x81\xba\xdf\x01? \x01\xf5\
-\x9aP\xb4\xd0[\xaf\x94\x0bk\x18\xbc\x86\xac7\x0b\x84\
-,\xda\xa2\x13\xbb\xf0\xae!\x17\xde0\x8a\xb9[M\xc6\
-\x1b\x94\x98\xf2\x16\x17ON\x87Ty\x11\xb8*\x96\x86\
->\x83\x04\xd3\x1f\x80\xff\x86[!\xbaA\xdcWo\x14\
-\x09Vs/\x18\x16\x00z\x9ezN\x8b\xd7\x98\x10\xab\
-\xa5\x9e\xc7\xb4zM\xb3\xe7U\xc62\xea\xde\xa0\xaa\xe1\
-\xff?\xe0\xdf\xd1\xe2{\x84D\x93\x05\xfb;\xe5!\xae\
-6\xbeL\xb9\x9a6\xc7\xf5\xd5\xaeE\x8f\xafP\xe2\xc2\
-34O\x9f\xa0\x10\x80\x93\xe6\xbf\xc6q.\x87\x8b\xa7\
-\x8b\xb1\x0c\xab!\xb4\x0b[B\xee9\xcb\xa8\xeb\xa7\x02\
-\x87E\xc2D\x0a\x04\x8b\x91\x93/&\x8c\x0eQl\xd3\
-sT\xf8\xf2[\x14$\xeeYu\xe5\xe7\x10\xb9[_\
-R\xac\x82\x99\x97!\x9e3\xc6Q\xb9\x94I\xb4\xf9\xb2\
-\xd2\x22\x83\x84\x90\x00s+\xa7]\xfd\x8es)\x5c<\
-]\x8c\xb9\xea\xc6\x91X\xfa\x04\x95$\xb8O5\x0a`\
-:\x8e\xb1\x87\xe2H\xde\xa1\xb8\xa6\xef\x80\xbf\x22\x11\xf5\
->\xc7\xf3r\xb2c\x1fY\x9d\x86\xd1|W\xf4\x9aO\
-\xad\xb0\xc4\x94\x1a\xda\xf4\x0e\xd1\xd8\xc0\x1c$\x10\xdf\xa0\
-\x0d\x81\x8b'\xe7\xca\xb8x\xba\x98\xb8 \xe2-\xe0K\
-\xe07\xa8\x08\xa2\x8b'\xa7*\xd4Q\x8c\xd3[\xe4\xfe\
-\xf8\x0b*\x80\xf9\x17\x82E\xca)?V0\xf3\x18%\
-\xc3\x94\xb5\x81s\xec\xc2\xb3\xd2!\xa746\x15\x1eF\
-\xd7\xed\x1a\x9e\x89\xe7\xb4\x81\x8b\xa7\xd6\xd4\xd0n\xe5\x1a\
-r\xd5=B\x96'\x0b\x10\xf78'\xa7\xdf\xd9M\xc6\
-\x0e\xaa\x18\xfe$y\xfc\x01\xb9\xee\xd6s;3\xa7\x1b\
-\x1c#k\xd3\x19rkY\x96\xda\x18\xe5*\xbf\x91v\
-\xfb\x1b\xcbh\xfe>'x\x14\xa6\x08\xc5A\xb7\x90\x90\
-\xf2x=\xe7\xa3\xb8xjM\x0d\xc58=B\x99\x1b\
-\x0f\x81\xbb\xc9\xb1\x09\x9aW\xd2v\x9c~\xe2=!\xd8\
-\xd6\xc4\xd3\x13d\x81\xda\xcc\xeb\xa4\x9c\xaea\x053\xcf\
-\x09m\x94\xd6\x90\x95}\x8a\xf2\x88\xa7VL\xa2\x8d\xf0\
-\x08\xb2F\xddD\xf3\xfb\xcfhC\xf0#\xa1@o\xba\
-[\x81\xe34\xe0\xe2\xa955\x14t\xf8\x18\xf8\xaf\xe8\
-\xa6\xbb\x81v/W\xa9Y\xe48e\xe5=ZT\xfe\
-\x83 \x9e\x9e\x11j<9\xfd\xc5\x19\x12\x0d\x96ug\
-\xd5\xc6A\xc2i*\xa7\xf3\xca\x0a\x0b _A-\xb5\
-\xb6\x91U\xf5\x8fH(\xad\x12\xda\x0d\xf9\xf5\xed\x5c\x88\
-\x8b\xa7\x0f\x99C;\xad\x05\x1a-N\xf3\xa8\xd6\x90[\
-\x9c\x9c~\xc3\xdc\x14g\x047\xdd\x0e\xaa\x14\xfe-\x0a\
-\x0c\x7f\x8d\x16\x97\xad\x9c\xce\xd1\xe9>q\xff\xb7\x03\x1a\
-\x0bf\x96]8\x81\x5cx\x83H@\xc5\xa5g6\x91\
-P\xdc'\x04\x92\xbf!\xb4{r\x17\x9e\xf3\x01.\x9e\
-\x1a\xb1\x1eI\x8f\x08\xee\xbaO\x90\xb5i\x1c\x17NN\
-\x7fb\xfd\xe9\x8eQ,\xd3\xd3d\xfc\x94\x8c'h\x97\
-^\xa6\xd4u\xa73\xd2\x053\x17\xf3=\x9d\xcc1\x11\
-5\x80<\x0a\xbfB\xe1\x18\xdf\xa1J\xf9\xbb\x84B\xaf\
-.\x9e\x9c\x0fp\xf1\xf4!\xd7PF\xdd\x7fC>\xf1\
-\xeb\xb8\xab\xce\xe9o,\xd6\xc5\x9a\xfb\xfe\x09\x15\xbd|\
-M\xd8\x85\xfb\x0e\xbcZ\x98xZEq\x9e\xfd\x96Q\
-i\x19y#h\x9e\x9fD\x1e\x86q$\x9c\x9e\xd3\xd8\
-\xba\xc6q\x1ap\xf1$\xe6\x90[n\x1e\xed@\x1e\x11\
-\xb2\xeaf(v\xa0\xa4-jVE{\x90\xe6\xd5\xb3\
-\x1d'&v\xd5\xad\x11Z\xab|\x83\xdctO\x90;\
-c\x8b\xfe[8\x9d\x8fce\x0b\x9e\xa3\x0de\xbfY\
-\x1d\xd3E5A\x96\xa8\xfb\xe8\xff\xb6\xff\x7f3\x19\xbb\
-(\x13q\xaf\x87\xe7\xe8\x14\x18\x17Ob\x19\x05\x86\x7f\
-\x96\x8cO)\x8f\xab\xce\x82\x1b\x8f\x09\xc5\xe1Fs=\
-#\xa7\x0c\x98\xb5\xc9\x5cu\xdf$\xe3Y\xf2\xf5\x1aZ\
-0]8U\x93}$\x1e\x06\x91E\xa6\x9fE\x835\
-|\x1fDV\xa8\xdf\xa0\x18/\xb3\xba\xbeEm^^\
-\xd1\xdf\xef\x83s\x05\x5c<\x89\x15\xe0\xd7\xc0\xff\x86\xdc\
-t\xd7\x93ce\xe8cv\x86\x16\xc0}d!\x8b\x1b\
-d:N+N\x09\xae\xba\x97\xc0\x9f\x81\xff\x0b\xd5\xf7\
-\xd9A.\x9bf\xfd\x02\x9dj`\xd5\xc6\x0f\x80\xcf\xe9\
-o\xd1`\x81\xe4#\xa8\x18\xf2\x14\xf2<<'d\x98\
-\x0e\xa1\xf7\xe0u>\xa7\xe8\x14\x8d*\x8b\xa7It\x93\
-L\xa2^u\xf7P\xfa\xaa\xd54)\xf2{\x13\xbb\x5c\
-6\xd1\xceh5\xf9\xda\x8a\xd9\xcd\x22\xb7\xe3\x02\x9a\x14\
-l\x82p\xaaE|\xad\x1c\x12\xfayY\xab\x95u\x94\
-U\xf7#Z,\xf7\x92\xd7y\xd5\xe5js\x82\x04\xd4\
-9r\xddn\x22am\x95\xbb\x8bn\x91\xbf\x0a\xb5\xe8\
-q\x14\x85j\x8c\xa0\xff}\x88\x90ix\x8a\xde\x17+\
-\x1e\xdb\xcf\x82\xd2\xf9\x08E\x16\x08\xddf\x1a\x99ho\
-!7\xdd\x1d\x82\xab\xae\xe8n\xaf\xd8U\xb7\x862\xa2\
-~@7\xb4\xd5)\xb9KpCN\x132K\xdc\x22\
-U-b\xf7\xdc\x06\x12K\x16\xcbb\x050_\xa2\x1d\
-\xf5N\xf2:\x17N\x8e]7gH<Y\xcd\xa7i\
-\x82\xb8\xe8G,\x0bo\x10\xad\x07c(\xd3\xb0F(\
-\xe3\xe0.<\xa7\xd2\xe2i\x06\xf5\xa8\xfb\x12\x05\x88\xdf\
-!\xb8\xea\x8a.0bW\xdd\x1a\xb2\x1a\xfc\x11Mn\
-\xfb\xc8\xb2\xf0[$\x96\xae\xd3\xe8\xces\xaaE\xfaZ\
-y\x86\xca\x10|\x87b\x9c\xbe%,\x92gxUe\
-G\x9c\x12\x04\xd46\xb2R\xae\xa2\xebc\x84\xfe\xa8\xfb\
-\xd4\x8c!\x82\x80\x1aG\x99\x86\xe7\x84\xf0\x0dK\xca\xd9\
-\xc5]x\x95\xa6j\xe2i\x0c\xd5\xf2\x18GY\x15\x8f\
-Qv\xdd]\x94qW\x16\xb7\xd6>a\xf7\xf3\x1d\xb2\
-<\xbd@\xbb\xc3C4\xe1=C\x8b\xe3(\xca\x96\xb1\
-l\xc2i4\xf1MS|\x91\xe8\x5c\x9ef\xee\xb9}\
-\x1a\xadMo\xa3\xf1\x0c-\x86{\xb8\xa5\xc9i\x8e\x09\
-\xe9CB\xcd'sk\xf53\xcd\xfa\xe2\x8dDc\x88\
-\xe2\xc7\xc2:]\xa6j\xe2i\x02\xed$\x96Q\xe5\xf0\
-\xcf\x90x\x9aG1Bea\x17-~_\xa1\xb4\xf2\
-_\xd0.h\x17-\x84\xa7\xc9\xd7#\xc91\xabWu\
-\x1d\xb9)-(\xd2\xc5S\xff`\x16\xa6#\x9a\xbb\xe7\
-\x9e\x12R\xaew\x09)\xd8\x1e\x10\xee|\x8c#\xe4\xba\
-[E\xc2\xc930\x9d\xcaSE\xf1\xb4\x8c\xacN\x0f\
-Q\x16\xc9\xaf)_\x01L\x13O\xff\x8e\x5cv\xab\xc8\
-\x9apL\xd8-\x9e\xa3\x18\x96\xa7\xc8=y\x0f\xfd\xdf\
-\xa7\xe8}\xb8A\xb9\xfeg\xe7b,\x0en\x1f\xb9X\
-\x9a\xb9\xe7\xf6\x09-8,\x93\xce\xddt\xce\xc70\xcb\
-\xd3*\x9a?]<9\x95\xa7\x0a\xe2i\x18\x99\x9aG\
-Q\x5c\xd3\xe7\x84B\x98\xcb\xe8=(\x83\x05f\x97\x90\
-\x1d\xf5-Z\x14_$\xc7\xcc\xe2\x14[\x11\xe2l\x99\
-a\xb4HZ<\xd4\x06\xb2L-\x10\x0a\x84\x8e\xe25\
-\xa2\xca\xc6!\xa1\xac\xc0{tm\xac\x11\xc4\xf4*\x8d\
-5\x9b\xbc\xd9\xa9\xd3\x0e\x16/\xf7\x94\xfe,\x98\x19s\
-Fc&\xb3\x8d\x1fQR\xce\x0f\x84\xe4\x0a\xa7\xc2T\
-A<\x8d\x122D\xee\xa1~u\x7f\x8b\x82\xc3-\x8b\
-\xa2\x0c\xec\xa0\xd8&\xab\x00\xfd\x03\x8ay\xdaD\x8bh\
-\xda\xfdbn\x9cs\xb4\xa8\x1e\x12\xc4\xd73$\xc0>\
-\x89\xc6,z\x8f\x5c<\x95\x87\x03T\xc4\xef\x05\xc1\xd2\
-\xf4\x04\x89cK\xa5\xdeJ\x86\xb7\x99p\xda\xc5\xc4S\
-\x0d\x95u\xe9w\xf1t\x94\x8c\x97h\xce\xfd\x99\xe0\xfe\
-~\x8e\xe6\x5c\x17O\x15\xa7\x0a\xe2i\x04\x89\x82\x15$\
-\x9e~\x05\xfc\x1d\xb2\xc6\x94E8A\x10O\xff\x88v\
-AfY8\xa2\xb9\xeb\xc5vOV\x08q\x1d\xfd\xbf\
-\x13\xa8\xb6\xd5$\xf0\x87\xe4\xfb\x969\xe3\xc2\xa9\x5c\xec\
-#\xf1\xf4=\x12\xd5_\x13\x9a\x9aBp\xcf\x81\xbb\xe7\
-\x9c\xf6\xd9#$\x17\xfc\x9a\xfeN\xd1\xb79s\x8fP\
-<\xf6_\x08\xf3\xade\x1c:\x15\xa7_\xc5S\xec\xaa\
-\xbb\x87\xea8=D\xc2\xe9:\xe5\xc9\x96\xd8C;\xbe\
-5\xb4@~Kp\xd5\xedq\xf9\xd4\xf2x\x01=F\
-\xff\xfby\xf2\xbb\xc6\x90\x05c%\x1a&\xb0&\xa2\xe7\
-\xe38ya\xb1L\xfbHD\x9b\xab\xee\x15J\x16\xf8\
-\x05\xed\x8a\xd7\x09e\x07\x1c'+N\x91\xe5\x1aB\xcd\
-\xa7u\xc2\x1c[\xf6\x12({\xe8~\xdaF\xff\xd7j\
-\xf2\xf8\x13\xb2\xf2\xbfA\xff\xf7\x01}\x96`Q\xaf\xbb\
-\x0el\x97~\x15O#\xc8U7\x8b\xcc\xcc\xbf\x07\xfe\
-\x0b\x0a\x92\xb6ZNe`\x07\x99\x8c\xbfF7\xf1\x8f\
-h\xc1\xdc\xa0\xfdE2.~\xf7\x82\xd0\x9ec\x99 \
-\x9e\x96S\xa3\x86\x8b\xa7<9A\xae\x82U\x14o\xf1\
-\x02\xb9\x0f\xde\x10v\xc3\x1bh\x82\xf7\xb2\x03N\xd64\
-+\x98\xb9\x86,\xfa\xfdP0s\x17\xcd\x81/\x90\xeb\
-\xfb\x97\xe4q\x1dmT\xad\x04\xcca\xab_\xe0T\x8f\
-~\x17OK(\x9e\xe7\xf7\xc0\xff\x8e\xac,P\x1e\xf1\
-\xb4\x8bn\xe4\x7fB\x96'[(;\xb9\x89\xd3\xee\xbc\
-\x97\xc9q\x13O\x96\x8dh-k@n\xbd\xc5\x0e\xfe\
-\xa6\xd3\x19V\x1d\xfc\x05\x12\xd1\xdf\xa02\x15\xe6J\xb1\
-ZM\xbe\x8dt\xba\x81\x95?\xb1\x82\x99Vm\x1c\xc2\
-\x9cZfv\xd1\xa6\xf4[\xc2\xbd\xf5\x0d\xda\xb4\x18~\
-o9\x0d\xf4\x93x\xb2\xdemC\xc8\xc2\xf4\x19\x0a\x0e\
-\xff2\xf9\xba,YuVSe\x8bP\xc3\xe9\x15\x9a\
-\xb0\xf6\xc9\xd6%\x13O\x08\x87\xc8\xbaaq2\xbb\xc8\
-\xcf\xff\x1cY\xbc\xae\x13b\xa5\xcc\xa5g\x8fV\x95\xb7\
-,EF\xf3\xa6NX\x90\x8e\x09\x02(\xce\x86\xb3\x85\
-*n\x8d\xb1\x86\xae\x85\x17HLY\x06\x9dW\x06w\
-z\xc5!\xba&\xd7\x90p*S}<\xdb8\x9e\x12\
-\xee\xab\xf7(\xc9\xe2\x074\xcf=G\xf7\x96\xdfS\xce\
-\x85\xf4\x93x\x1a \xf8\xe0o\xa0\xf8\xa6\xff\x07*\x08\
-\xb9Ly\x16\xf6C\xb4P>G\xd6\xa6\xa7\xc8=\xd3\
-\x89\xab\xee2\xd8b}\x84\x84\xd3*\x9aT\x16\xa2\x11\
-\xbb\xf5\xec9\x84\xf7\xbd,\xefq\xde\x9c\xa3]\xed\x11\
-r\xcd\x9aEq7z\xcd6\xba\x06\x9e\x13b\xdc,\
-\xe6\xc9\xe23\x0e\xf1I\xde\xe9-6O\xac!\xe1T\
-\xa6\x9aO\xe7\x84L\xba7\x04\xc1dYt/\xd0\x06\
-r\x8b>\x8bmr\xb2\xa7\x9f\xc4\xd3\x10Z\xc0'\x09\
-\xe2\xe9\x7fP\xae\x1eLu\x82x\xfa\x01\x89\xa7'\x04\
-\xf1\xd4MlRIc\x96\xa6i\xe4\xc63w\xde\x01\
-\xb2\xe4\x8d%\xe7=\x88\x02\xf5\x9bQ\x06\x8b_\xb7h\
-&l\xe2\x82\x96\x9b\xc8u\xfa\x04\xed\x82\x8d5B\x06\
-\xddzW\xcf\xd0q.\x8fY\x9eVQ\xcd\xa72\xd4\
-\x0e\xb3{\xd0\x5c\x8f{(v\xf0k\x94I\xf7\x92`\
-\xd9\xf5d\x0b\xe7R\x94]<\x99\x9bn\x10\xdd\xc8w\
-\x93\xf1{\xd4\x92\xa4,\x96\x90\x13B]\x9eg\x84\xb8\
-\x96\x9f\xd0\x0d\x9d\xe7\x04e\x9965\xe4\xc6\xab#\xeb\
-\xc7:\x9at\xae\xa1\xa0\xd1Y$\xb0F\x91\xa0\xb2\x1e\
-PCHT\x8d%\xdfk%\xb0\xfa\x05s\xc9Y\x9d\
--\xfb\x5c\xf7\x09}\x07\xf7\x09\xae\xd9\x0dBFel\
-y2\x8bT\x99v\xf6N\xffce\x0b&\x90+\xbf\
-\xe85\x9f\xe2Zg\x96IgV\xf5\x9f\x90\x88\xdaD\
-\xf7\xa6[p\x9dKSv\xf14@\xa8\x8a}\x1d\xc5\
-7\xfd\x1e\x95&\xb08\xa72p\x82n\xee\xb7(\xbb\
-\xee\xaf(x\xf1\x19ZD\xf3\x14Oq\xa6\xcd9!\
-\x16\xca\xd2\xe4\xcd\xa5\xb7H\xe8\x118C\xa3\x90\x9aH\
-\x8e\x0fP\x1d\xf1\x14\xbb?\xdf\x22\xd7\x9bM\xe2\x9b\x84\
-x\x8b-\x82\xb8\x8a\x03T\xcd\xa5\xe7\xe2\xc9)\x12&\
-\x9ejh\x9e-\xbax\xb2Zh\xcf\x90`\xb2\xd2\x1e\
-\xebh\xe3\xb2A\xd8\xd4\xb8xr.MY\xc4E+\
-\x06\xd1\xe2<\x85,M_\x00\xff\x1d\xc5\xe4LR|\
-\xcb\x93\xdd\xacGh!}\x8e\xc4\x93\xb9\xec\xde\xe6t\
-^1q\xa6\x8d\x15\xc7\xab\x11\xdcyS4f\xeaY\
-\xe3\xe5\x05B@\xf9\x0c\xfa_\x87i.\x9ej4\xba\
-\xf6Z=o\xf6uV\xb4\x9a8\xd3\xc7?\xf6\xba3\
-\xe4\xd2\xdcC\x22\xc9\xd2\x9f\xadMJzx\xa5b\xa7\
-LX\xb5\xf1#$@\xac_\x22\x14\xc3=_O\x8d\
-\x1dd!\xff\x1e\xb9\xe9\xe2>\x8f\x8e\xd36e\x17O\
-\x16\x87c\x95\xc3\xef\xa0\x85z\x8c\xe2g\xd7\x9d\x11j\
-\x87\xbcF\xd6\xa6\xbf\xa0\x9b\xfc\x15\xc5\xaf)\x12\x17\xce\
-\xab!\xeb\x985\x0f\x9dA\xa2\xca\xac\x82\x93\xc8*e\
-\x82\xca0\xf1\x9b\x1e\xb1\xcb\xaf\xd5\xc8\xea\xb3=\x8dF\
-\xab\xe3\xcdF\x1c\x1ba\xb1j\x87H8\xc5\x16\xa65\
-B\xbd\x18\x0b\xf6\xdeAV\xa9\xd8\xd2\xe48e \xde\
-Hm\xa1\xebz\x95p\xef\xe6\xd5\xa5\xe0\x9cpo\xda\
-y\xad\xa3\x8d\xcbO\xc9x\x866\xa9^\x0b\xcd\xe9\x98\
-~\x11O\xbf\x07\x1e\x03\xb7\x93cc\x14\xdf\xeatF\
-\x08\x18~\x85\xacM\xff\x81n\xf2M\x8a-\x9e\xcc5\
-e\x8f\x16\xdb\xb3N\x10L\xc3\x84\xf2\x05\xa3\x84\x82z\
-q\xb1\xcdQ\xe4\xceK\x8fI\xc2D<\xd6\xe4\xf9\x00\
-\xd9}\xbe\x16\x9b\x94~\xbfM\x0c\x1d\xa5\x1e\xedy\xec\
-N;'d\xe9\xd8\xc4\xfd>9f\x95\xc1\xed\xe7\x8e\
-\x93q\x84O\xe2N\xf9\xb0\xfb\xbeN\xa8\xf9\xb4\x86\x1a\
-\x8c[\xc6s\x1e\xc4\xf7\xf1*\xa1\xff\xe7\x13d\xf5\xb5\
-\xf2\x1e\xbbxP\xb8\x93\x01e\x14O\x03\x84\xc5s\x1e\
-\x15t\xfc\x1d\x12Q\xcbH<\x15\xf9\xff\xb2\x89'\xb6\
-\xd4<C7\xfaW\xc9\xf32\xd0\xcc\x9d\xd7\x8aA\x82\
-\x0b/\x9e\x5c\xc7h\xacd\xbe\x94\x8c9\x1a\xebH\xa5\
-[\xc5Xm\xa9\x8fY\x9f\x9a}\xbf\x9ezn.\xb6\
-\xfd\xd4\xf7L\xf4\xec\xb5x<\x88^{F\xb00\xc5\
-.\xb9\xad\x8f\x9c\x9f\xe3\x94\x8d\xb3h\x98xZGs\
-r\xaf\xbb\x10\xd4\xd1\xc6\xa5N\x881\xb4j\xe1\xdf\x01\
-\xff\x8a,Ovo\x96!3\xd0)\x09E\x16\x19\xad\
-\x98A\xc1\xe07\x80\xcf\x93q\x03-\xb8\xe3\x94\xc3U\
-w\x80n\xe6\xbf\x227\xdd\xf7(\x88\xb1_\x1bn\xd6\
-\x91\x8b\xea\x80Fk\x8bMfV\xa0\xf3\x0d\x12\xbf\x93\
-\x04\x0b\x96=\xa6\x9f\x0f\x13\x5cx\xad\xfa\x14\x0eF\xaf\
-\xb1\xdaJi\xf7\x9bY\x83\xd2\x81\xd9G\xa9\xef5{\
-n\x9c\x13z\xce\xd9p\x97\x9c\xd3\xef\xc4e\x0b\xc6\xd1\
-\x1c\xdc\xeb\xbf\xbfAp\x8f\xbfM\xc634\x9f\x9a\xb5\
-\xa9\xefz\xd29\xf9SV\xf1\xf4\x10\xf8-r\xd5}\
-\x82\xc4\x93\xf5X*r\xc3\xdf\xd8U\xf7\x02\x05/\xfe\
-\x0b\xb2:Y\x05\xf1~\xc4\xc4\x93\xd572\x06\x09\x15\
-\xd5G\xa2\x11W,O\x0f\xfb\x9e\x09\xa9\x8b\x5c\xb4#\
-\x04\x97\x9f\x15\xa5<L\x8dx'\x1ds\xd6d\x9cF\
-\xcf\xe3\xc9\xd8,\x89\xf1p\xf1\xe4\xf43\x16\xe7g\xd5\
-\xc6\xe7\xe9\xbde\xc7\x5ct\xd6\x8f\xee\xe7d\xac\x12\x5c\
-\xe8\x07\xc9y\xb9xr2\xa5,\xe2i\x80\xb0h.\
-\x03\x8f\x80\xff\x8a\x0a6ZvW\x91S\xe0\xcd\x1dt\
-\x82L\xddo\x91/\xfe;\xe0\x8f\xc9\xf3~&nG\
-\x92\x15#\x04\x17^+\xf1de\x12&\x09\xf5\x95\xd2\
-\xee8OOv\x9c\xf60\x8b\xf1**\x15\xd3\xcd\xb2\
-\x1av\x9f\x9e\x1360\xe9~\x8f\xdf\xa29\xd5\xdd\xe5\
-N\xd7)\x8bx\x9aFmV\xccU\xf7\x05*M0\
-\x8f\x16\xc7\x22[\x9b\xcc\xear\x8a\xacK?\xa2\xd8\xa6\
-oQpx\xbf\xba\xea\xbaMl\xc5j\xf5\xf9\x9b\x9b\
-\xcd\x1a\xe7\xda\xd7\xc7x\xb0\xb6\xe3tB\xdc\xffr\x1c\
-\xcd\xcd\x07\x17\xfeD\xfbX&\xdd\x09r\x89[L\xe1\
-s4\x87\xfe\x8c\x5cu\xeb\xb8\xc5\xd7\xe9\x11e\x12O\
-\x9f\xa2\xc0\xf0\xc7\xc8\xe2t\x93r\xb8\xea,\xd6\xc6\xfc\
-\xf3?\x02\xff\x8cvJ\x96\xfd\xe1\x5c\x1d\x13Og\xb4\
-\x8es\x1b@\xd6\xa5\x014\xd9\xa7\xddpnur\x9c\
-\xf6\x89\x0bf>\xa2\xbb\xe2\xc96>q\xac\xa8\xc55\
-\xbdD\x1b\xd3tsm\xc7\xe9\x1aE\x16O\xe6\xaa\x1b\
-Bn\xb9O\x81?$\x8f\x96\x955\x92\xdb\xd9}\x1c\
-\xcb\xaa;E7\xf56*I\xf0\x13\xaa\xe7\xf4m~\
-\xa7\xd6\x17\x9c\x13\x84\xa9\xe38\xbd\xa5N\x88\xd1<#\
-\x88\x97S$\xa6\x06\xe8,y'\xde\xec\x1c\x12\x121\
-\x9e#\xd7\xdc\xbf\xa3\xb9t=\x19E.\xed\xe2\xf4!\
-E\x16O\x13\xa8o\xda\x0ar\xd5=\xa2\x9c\xae\xbam\
-dV~\x82vK?\xe1U\xa5\x1d\xc7)?V(\
-w\x17\xc5>\xbdC\xee\xb4\xf1dtR\xf3\xe9\x98\xd0\
-\xc2h\x0de\xe2\xbeA\x96\xa6'(H\xdc\x92l\xbc\
-n\x93\xd3s\x8a.\x9en\x13b\x9c\x1e\x22\xbf\xfa<\
-\x0a\x0e/\xbax:Ef\xec\x0d$\x98\xfe\x88\x5cu\
-/qW\x9d\xe38\xe5\xc7\x0af\xd6\xd0&\xd1\xc4\xd3\
-\x1c\xa18n\xbb\x1c'\xbf\xcbz\xd1Y\x95\xf07\x84\
-J\xfd\x07h\x93\xea\xe2\xc9\xe99E\x13O5BJ\
-\xfa\x1cp\x17\xb5]\xf9,y\xbe\x84DU\xd19G\
-;\xa2-t\xb3\xffLp\xd5Y\xb6\x97\xe38N\x99\
-\x89K|\xec\xa0\x8d\xe2:\xa1(\xeee\xb1\x10\x07s\
-\xc3\x9f$\xbf\xe79\x8ao\xfa\x8eP\x0fo=\x8b\x13\
-w\x9cN)\x9ax\x1aAA\xe0\xd3\xa8r\xb8\x8d\x9b\
-\xa8mG\xd1[\xae\x18'(\x0b\xc5\x9a\xfc\xfeLh\
-\xa2\xe95G\x1c\xc7\xe9'\xd25\x9f&P\x1f\xcb\xcb\
-\xfe\xac\x09&\x0b@\x7f\x8b\xdcsV\xb7\xe9Yr\xbc\
-\x9b\xa5\x10\x1c\xe7J\x14Q<\xcd#\xf7\xdc\x83h\xdc\
-$4\xfb-\x03'\xc8\xe2\xf4\x0d\xb28=A\xe2\xe9\
-\x80\xe6\x05\x19\x1d\xc7q\xca\x8a\xb59\xda\xe4\xea\x053\
-\xe3l\xe4\xf7h\xb3ie\x5c^&\xe3\x1d\xa1?\xa4\
-\xe3\x14\x82\x22\x88\x11\xcb\xcc\x18\x00\xa6P\x90\xf8\x03\x14\
-\xe3t\x17\x09\xa9\xcb\xeeb\xf2$N\xa7]C\xbb%\
-39\xaf\xa3]\x99\xef\x9c\x1c\xc7\xe9G\x0e\x90\xf8y\
-\x8b\xe6\xf0\x8b\xe6\xba8\xa1\xe6\x10\xc5/m#\xa1\xf4\
-=j\x90\xfe#\x12Mf\xb1w\x9cBQ\x04\xf14\
-\x88\xcc\xbc\xe3\xa8\x10\xe6c\xd4z\xe5\x11\x12Nyu\
-\xe9\xbe*'\xe8\xe6\x7f\x81\x02\x1c\xff\x8c2B\xde\x11\
-Rx\x1d\xc7q\xfa\x0d+\x98\xb9\x8a\xe6\xf2\x9b\x5cl\
-%\xb2\x82\xc1\x16`\xfe:\x19/\xd1\xa6\xd32\xe9|\
-\xdet\x0aK\x11\xc4\xd3\x10\x0a.\x9cG\xe2\xe93T\
-\xcf\xe9>\xb2D\x95I<\xbd@Yu\x7fA\x13\xc0\
-S\xb4s\xb2\xea\xb8\x8e\xe38\xfdF\x5cm\xfc2\x05\
-3O\x91p\xfa\x99\x90E\xf7\x03\x12O{\xc9\xef\xf2\
-L:\xa7\xd0\xe4%\x9e,\xab\xce\x5cu+h\xb7\xf2\
-\x10\x15\xc1\xfc\x14Y\x9d\x8a\x8e\x05J\x1e\x12&\x83\xaf\
-\x91\xd5\xe9]2\xbc,\x81\xe38\xfd\x8c\xc5<\xbdG\
-s\xfb{4\xef\x1d%_[\xb1L\x0bk\xd8D\x1b\
-K\xcb\xa0\xfbk2\xde\xf4\xf2\xa4\x1d\xa7\x13\xf2\x12O\
-\xe6\xaa\x9b@\x0d%\xbfD\xb5\x9c\x1e\x01\xf7\x90\x0b\xaf\
-\x0c\x9c\xa2\xaa\xe1\xcf\x09\xae\xba'\x04\xd1\xe4\xd6&\xc7\
-q\xaa@\x5c0s\x8b\xe0\x92\x1bN\xc69\x12G\xe6\
-\x9e\xfb\x85\x90I\xf7\x96\xee\xb5vq\x9c\xae\x90\x97x\
-\x8a]uw\x80_\x03\x7f\x0f|\x82\xca\x14\x94\xa1\x96\
-\x13\x848\xa7\x7f'\xc48\xc5\x0d*\xdd_\xef8N\
-\xbfc\x01\xe0\xe7\xc8\xed\x16\x8b\xa71\xb4\x19>Cb\
-\xe9+\xe4\xa2{\x85\xe6N\xcbBv\xf1\xe4\x94\x8a<\
-\xc4\xd38!\xab\xce\x02\xc4\x1f\xa3X\xa7[9\x9c\xcf\
-U\xa9#\xd3\xf3\x11*\x0a\xf7\x04\xa5\xd6\xfe\x05w\xd5\
-9\x8eSM\xac\xd7\xa4\xd5{z\x8b6\x93\xa3\xa8\x04\
-\xcd\x09\x9a'\xbfB\xae:\x0b\x18\xf7VUN)\xc9\
-C<-\xa3\xd2\x03\xe6\xaa{\x8c\x82\xc3\xcbbm:\
-'d\x88<C\xa5\x08\x9e\xa3\x1d\xd4\x1e\xee\xaas\x1c\
-\xa7\xba\x9c\xa3M\xe5S\xb4\xbe\x98\x05~\x1f\xcd\x93\xcf\
-\xf1\xb0\x06\xa7\x0f\xc8C<\xad\xa0`\xf0_\x01\xff\x80\
-\x82\xc4\xa7\xb8Z9\xff<9C\xe2\xe9;T\x04\xf3\
-{\x1a\xb3\xea\xdcU\xe78NU9G\x01\xe1O\xd0\
-fr\x13Y\xa2\xb6\x08\xad\xa9\x0e\xf1\xb9\xd2)9y\
-\x88\xa7\xcfQ\x90\xf8c\x14 ~'\x87sh\x07k\
-!\xb0\x8b\xfc\xf5?\x22\xf1\xf4\x82`ur\x1c\xc7\xa9\
-2u\xe4\x8a\xb3\x06\xbe\xe6\x9e\xdb\xce\xf3\xa4\x1c'k\
-\xf2\x10O\xff\x07\xea_\xf7\x80\xf2X\x9b\xac\x8e\xc9&\
-\xa1\xd3\xf7\x13dq\xda\xc0\xdb\x068\x8e\xe3@(\xdf\
-\xb2\x89\x82\xc0=\x94\xc1\xe9K\xf2\x12O\xc3H8\x95\
-I<\xd9n\xea\x19\x12O\xbf \xf1t\xc2\xe5\xfb8\
-9\x8e\xe3\xf43V\xf3\xe9\x04\xd5\xf1;\xc3\xddsN\
-\x1f\x92\x87x\x9aBu\x9eF\xd0\xcdUdN\xd1\xcd\
-\x7f\x84Z\x0f\xfc\x82\x8a\xb9=ABj+\xb73s\
-\x1c\xc7)\x1eu<\x9e\xc9\xa9\x00y\x88\xa7\xafQf\
-\xdd2\x0a\x1e/B\x8b\x98V\x1c!\xb3\xf36\xa1F\
-\xc9_P\x9c\x93\xfb\xf0\x1d\xc7q\x1c\xa7\x82\xe4!\x5c\
-\xbe\x02\xe6PV\xc6\x0c\xc5u\xdd\xc5\xbe\xfbU$\x9e\
-\xfe\x02\xfc+2K{\x9c\x93\xe38\x8e\xe3T\x90\xbc\
-,O\x8b\x84\x16-\xa0*\xb4\xa39\x9dO\x1a39\
-\x9f \xd7\xdcs\x14\xdb\xf4C\xf2\xe8\xfd\x97\x1c\xc7q\
-\x1c\xa7\xc2\xe4!V\xbeAE2\x8d}Tm\xbc(\
-.<s\xd5\xed \xc1\xf45:\xe7'(\xed\xd6q\
-\x1c\xc7q\x9c\x0a\x93\xa7\xe5\xc98C\x81\xe3\xb3\x14\xc3\
-\x85g\xed\x05\xd6Q-\xa7\x7f\x03\xfe\x19\xb9\xea\xf6s\
-</\xc7q\x1c\xc7q\x0a@\x1e\xe2\xe9\x1dr\x8bM\
-%\x7f\xbf\x8e\x5cxcHH\x8d'\xcf{yni\
-W\xdd3\xe4\xa2\xfb\x16\xc5:\xbd\xec\xe1\xb98\x8e\xe3\
-8\x8eS`\xf2r\x93\x1d\xa3b\x93\xd6\x8d\xbb\x96\x1c\
-7\x17\xde5z{nG\xa8\x08\xe6.\xb26}\x95\
-\x0ck\xbb\xe28\x8e\xe38\x8e\x03\xe4/\x9e\xb6\x90`\
-1\xf1d.\xbcyz\xdb(\xf8\x08\x95\x1e\x88]u\
-\xff\x0b\xcf\xaas\x1c\xc7q\x1c'E^\xe2\xe9,\x19\
-\x87H,=\xe3C\x17\xde1r\xe1\x8d\xd3\x9d\xf3<\
-O\x865\xfa\xb5\xaa\xe1\xdf&\x8f\xaf\xbb\xf07\x1d\xc7\
-q\x1c\xc7)9E\xc9n[CB&v\xe1\xed\xa1\
-\x06\xc2\xd7\xe9\xcey\x9e!\x81v\x8c\x8a^\xfe\x19Y\
-\x9c\x9e\xe3\xae:\xc7q\x1c\xc7qZP\x14\xf1\xb4\x8a\
-\x1a\xec\xee\xd1\xe8\xc2\x1bBe\x0d\xc6\xbb\xf0wO\x93\
-\xbf\xbdO\x10O\xff\x9f\xe4\x98\xbb\xea\x1c\xc7q\x1c\xc7\
-iJ\x11\xc4\xd39\x12,G\xc8\xe2\xf3\x9cF\x17\xde\
-(\x0a \x9fH\xc6`\x87\x7f\xeb,y\xdc@\x16\xaf\
-5\x94Q\xf7\x02\x898\xc7q\x1c\xc7q\x9c\x96\x14A\
-<\xfd\xff\xdb\xbb\x97\x9e\xa6\xc2(\x0a\xa0\x1b\xf0\x1d'\
-&\x18\xa2\x13\xff\xff\xef`\xea\xd4D\xf0\x11%\x1a\x8b\
-\xc1J\x04y\x0a88\xbd\xe9\x15\x04\xf9\xc0`\xafY\
-+\xe9\xa8\xa5t\xc6\xce\xd9\x87\xd3\xben\x0a\xd5\x9d\x0d\
-8]\xe1=\xc9\xf5\xc2SW\xd5\xed\xa7N\x12\xbcI\
--\x88\xbf\x8e\x03\x98\x00\xc0%\xccZx\xdaK\x85\xa7\
-q\xaaN\xebWx\xb7\x93,\xa6\x96\xc9\xaf\xaa_\xd5\
-\x8d\x92\xac\xa6\xf6\x9c>Fx\x02\x00.a\xd6\xc2S\
-\xbf\xc2\xfb\x92\xaa\xf0\x162\xad\xf0\xee\xa4\xbe\xc6\xe5A\
-\xea\x1ay\xeb\x14j;\x15\x9aFIVR\x13\xa7\xf7\
-\x99\xee[\x01\x00\x5ch\xd6\xc2S\xdf^\x92\xf5T}\
-\xf7#\xd3)\xd4v\x92\xa7\xa9 \xd5\x1a\x9e6Sg\
-\x08^\xa4*\xbbw\xa9I\xd7N*\xb0\x01\x00\x5ch\
-\xd6\xc3\xd3\xe7\xd4\x04j7\xd3\xf0t\x9cZ\x22_\xbc\
-\xc2{n\xa6\x96\xc3\x9f\xa7\xaa\xba\xd1\xe4wt7\x9f\
-\x00\x00.4\xcb\xe1\xe98\xb5\xdc\x9d\xd4>\xd2\x87L\
-+\xbc\xf9\xd4\x0e\xd4\xe3T}wQ\x85\xf7-\x15\x9a\
-\xbe\xa6&N\xafRU\xddx\xf2\xdc\xc19?\x07\x00\
-p\xc6,\x87\xa7\xbe\xdd\xd4\x94\xe8 \xbfVx\xcfR\
-\x15\xde\xdd\x9c\x1f\x9e\xc6\xa9\xc5\xf0\x95\xc9c55m\
-\xfa\x1e\xf7\x9c\x00\x80FC\x09O\xdd\xfe\xd3F\xceV\
-x\xf7RK\xe4\xe7\x19'y\x99d95\xbd\xfa4\
-y\xaf\xa3\xd4\x14\x0b\x00\xe0\xd2\x86\x12\x9e\xba\x9d\xa4\xc3\
-T\xfdv\xba\xc2\xbb\x95\xda\x81z8ylO^7\
-N]\x0e_IUu\x1b\xa9\xaa\xee0\x82\x13\x00p\
-\x05C\x09O}]\x85\xb7\x9f\xdfWx\xf7S\xc1i\
-%5qZ\x9d<FQ\xd5\x01\x00\xd74\xd4\xf0\xd4\
-]\x22\xdf\xcb\xd9\x0ao)\xd3\xf0\xb4\x9cd-U\xd3\
-\xad\xa7\xc2\xd6IL\x9d\x00\x80+\x1abx\xea\x9f\x15\
-\xd8L\x9d\x1cXH\x05\xa3\xbd\xd4t\xe9mj\xda\xb4\
-\x96\xfa\xee\xba\xad\xc9\xf3\xce\x11\x00\x00\xd72\xc4\xf0\xd4\
-\xb7\x93Z\x00\xdfM\x05\xa4\x8dT\x98Z\xcf\xb4\xaa\xdb\
-J\x85*\xd3&\x00\xe0\xda\xe6NNn6S\xcc\xcd\
-\xcd\xfd\xf9E\x0do\x97Z\x18\x9fO\xf2(\xf5_w\
-K\xa9\xa5\xf0\xf5TxR\xd5\x01\xc0)7\xfd\xf7\xff\
-\x7f2\xf4\xc9\xd3I\xea\xe4\xc0Q\xea\x06\xd4Aj\x1f\
-\xaa\xbb\x07\xe5r8\x00\xf0W\xdd\xf8\xe4\x09\x00`\xc8\
-\xe6\xff\xf5\x07\x00\x00\x18\x12\xe1\x09\x00\xa0\x81\xf0\x04\x00\
-\xd0@x\x02\x00h <\x01\x004\x10\x9e\x00\x00\x1a\
-\x08O\x00\x00\x0d\x84'\x00\x80\x06\xc2\x13\x00@\x03\xe1\
-\x09\x00\xa0\x81\xf0\x04\x00\xd0@x\x02\x00h <\x01\
-\x004\x10\x9e\x00\x00\x1a\x08O\x00\x00\x0d~\x02\xe6\xa9\
-\xe6\xc9\x90\x19\xbeL\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x01t\
-<\
-svg width=\x2220\x22 h\
-eight=\x2220\x22 viewB\
-ox=\x220 0 20 20\x22 f\
-ill=\x22none\x22 xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22>\x0d\x0a\
-<path d=\x22M3 6C3 \
-4.34315 4.34315 \
-3 6 3H14C15.6569\
- 3 17 4.34315 17\
- 6V14C17 15.6569\
- 15.6569 17 14 1\
-7H6C4.34315 17 3\
- 15.6569 3 14V6Z\
-M6 4C4.89543 4 4\
- 4.89543 4 6V14C\
-4 15.1046 4.8954\
-3 16 6 16H14C15.\
-1046 16 16 15.10\
-46 16 14V6C16 4.\
-89543 15.1046 4 \
-14 4H6Z\x22 fill=\x22#\
-212121\x22/>\x0d\x0a</svg\
->\x0d\x0a\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x0d\
-\x01\xb5\xc9\xe7\
-\x00r\
-\x00e\x00c\x00u\x00r\x00s\x00i\x00v\x00e\x00.\x00s\x00v\x00g\
-\x00\x11\
-\x09\xefx\xa7\
-\x00c\
-\x00a\x00m\x00e\x00r\x00a\x00_\x00r\x00o\x00t\x00a\x00t\x00e\x00.\x00s\x00v\x00g\
-\
-\x00\x14\
-\x00\xa6\xc7\xe7\
-\x00c\
-\x00a\x00m\x00e\x00r\x00a\x00_\x00t\x00r\x00a\x00n\x00s\x00l\x00a\x00t\x00e\x00.\
-\x00s\x00v\x00g\
-\x00\x0c\
-\x08\xf0m\xc7\
-\x00s\
-\x00u\x00b\x00t\x00r\x00a\x00c\x00t\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x0b^R\x07\
-\x00e\
-\x00y\x00e\x00-\x00o\x00p\x00e\x00n\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x0d\xac*g\
-\x00l\
-\x00o\x00c\x00k\x00-\x00c\x00l\x00o\x00s\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x02\x8cT'\
-\x00p\
-\x00l\x00a\x00y\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0e(\x8aG\
-\x00a\
-\x00n\x00g\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x0a\xea\x1fG\
-\x00a\
-\x00c\x00t\x00i\x00v\x00e\x00_\x00a\x00c\x00t\x00o\x00r\x00.\x00s\x00v\x00g\
-\x00\x19\
-\x08\x17\x04\xa7\
-\x00t\
-\x00e\x00x\x00t\x00_\x00b\x00u\x00l\x00l\x00e\x00t\x00_\x00l\x00i\x00s\x00t\x00_\
-\x00t\x00r\x00e\x00e\x00.\x00s\x00v\x00g\
-\x00\x15\
-\x07>\xd5\xc7\
-\x00l\
-\x00o\x00c\x00k\x00-\x00c\x00l\x00o\x00s\x00e\x00-\x00f\x00i\x00l\x00l\x00e\x00d\
-\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0c\x98\xb7\xc7\
-\x00p\
-\x00a\x00u\x00s\x00e\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x00\xe1-\xa7\
-\x00c\
-\x00h\x00e\x00v\x00r\x00o\x00n\x00_\x00l\x00e\x00f\x00t\x00.\x00s\x00v\x00g\
-\x00\x0f\
-\x0aC\x99\x87\
-\x00c\
-\x00i\x00r\x00c\x00l\x00e\x00_\x00e\x00d\x00i\x00t\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x09\xf9\x0f\xc7\
-\x00d\
-\x00i\x00s\x00t\x00a\x00n\x00c\x00e\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x06\xea\xf1\xc7\
-\x00c\
-\x00h\x00a\x00t\x00_\x00s\x00p\x00a\x00r\x00k\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x14\
-\x07\xec\xdcG\
-\x00c\
-\x00h\x00e\x00c\x00k\x00b\x00o\x00x\x00_\x00c\x00h\x00e\x00c\x00k\x00e\x00d\x00.\
-\x00s\x00v\x00g\
-\x00\x15\
-\x0e\xbe\x06\xe7\
-\x00i\
-\x00n\x00d\x00i\x00v\x00i\x00d\x00u\x00a\x00l\x00_\x00c\x00e\x00n\x00t\x00e\x00r\
-\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x0bXl\xa7\
-\x00c\
-\x00h\x00e\x00v\x00r\x00o\x00n\x00_\x00u\x00p\x00.\x00s\x00v\x00g\
-\x00\x15\
-\x05\xfcz\x87\
-\x00c\
-\x00o\x00o\x00r\x00d\x00i\x00n\x00a\x00t\x00e\x00_\x00s\x00y\x00s\x00t\x00e\x00m\
-\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x08(\xa9\xe7\
-\x00s\
-\x00c\x00a\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x08uZ\x87\
-\x00g\
-\x00r\x00a\x00b\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x0e\x17*\x87\
-\x00c\
-\x00h\x00e\x00v\x00r\x00o\x00n\x00_\x00d\x00o\x00w\x00n\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x06\xc8TG\
-\x00m\
-\x00o\x00v\x00e\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x08\xabw\x87\
-\x00r\
-\x00o\x00t\x00a\x00t\x00e\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0c\x91j\xa7\
-\x00c\
-\x00a\x00m\x00e\x00r\x00a\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x07\xa7Z\x07\
-\x00a\
-\x00d\x00d\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x09kZ\x07\
-\x00b\
-\x00o\x00x\x00.\x00s\x00v\x00g\
-\x00\x12\
-\x03\x15\xbc\x07\
-\x00w\
-\x00i\x00n\x00d\x00o\x00w\x00_\x00c\x00o\x00n\x00s\x00o\x00l\x00e\x00.\x00s\x00v\
-\x00g\
-\x00\x10\
-\x03Kz\xc7\
-\x00m\
-\x00e\x00d\x00i\x00a\x00n\x00_\x00p\x00o\x00i\x00n\x00t\x00.\x00s\x00v\x00g\
-\x00\x11\
-\x0e\x908G\
-\x00c\
-\x00h\x00e\x00v\x00r\x00o\x00n\x00_\x00r\x00i\x00g\x00h\x00t\x00.\x00s\x00v\x00g\
-\
-\x00\x0d\
-\x0fh/\x07\
-\x00e\
-\x00y\x00e\x00-\x00c\x00l\x00o\x00s\x00e\x00.\x00s\x00v\x00g\
-\x00\x0d\
-\x002\x93\xc7\
-\x00l\
-\x00o\x00c\x00k\x00-\x00o\x00p\x00e\x00n\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x05\xb5\xf9G\
-\x00o\
-\x00r\x00c\x00a\x00l\x00a\x00b\x00_\x00l\x00o\x00g\x00o\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x014\xe9'\
-\x00c\
-\x00a\x00m\x00e\x00r\x00a\x00_\x00s\x00c\x00a\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0bcU\x87\
-\x00s\
-\x00t\x00o\x00p\x00.\x00s\x00v\x00g\
-\x00\x16\
-\x05\x9b\xe2\x07\
-\x00b\
-\x00o\x00u\x00n\x00d\x00i\x00n\x00g\x00b\x00o\x00x\x00_\x00c\x00e\x00n\x00t\x00e\
-\x00r\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x0fLVg\
-\x00p\
-\x00h\x00y\x00s\x00i\x00c\x00s\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x01u\xc1\x07\
-\x00c\
-\x00h\x00e\x00c\x00k\x00b\x00o\x00x\x00_\x00u\x00n\x00c\x00h\x00e\x00c\x00k\x00e\
-\x00d\x00.\x00s\x00v\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00'\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x04T\x00\x00\x00\x00\x00\x01\x00\x02F\x80\
-\x00\x00\x01\x99]\xd7\xbd\x00\
-\x00\x00\x00X\x00\x00\x00\x00\x00\x01\x00\x00\xa0\xcb\
-\x00\x00\x01\x9d\x19<\xdb\xc9\
-\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x01u\x0e\
-\x00\x00\x01\x9a\xb3\xa1\xd3\x0c\
-\x00\x00\x04\x9a\x00\x00\x00\x00\x00\x01\x00\x03\x0d\x8d\
-\x00\x00\x01\x9d\x19<\xdb\xc9\
-\x00\x00\x05$\x00\x00\x00\x00\x00\x01\x00\x03\xf2\x88\
-\x00\x00\x01\x9a\xa2\x95\x8eN\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9eq\xc0p\xcf\
-\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x01f1\
-\x00\x00\x01\x99]\xd7\xbd\x00\
-\x00\x00\x03\xbc\x00\x00\x00\x00\x00\x01\x00\x029x\
-\x00\x00\x01\x9a0\xf9\xabP\
-\x00\x00\x03\xe6\x00\x00\x00\x00\x00\x01\x00\x02=\x93\
-\x00\x00\x01\x9d\xfbj\xa3\xe0\
-\x00\x00\x04\xd6\x00\x00\x00\x00\x00\x01\x00\x03$\xbe\
-\x00\x00\x01\x9d\xfbj\xa3\xdf\
-\x00\x00\x04t\x00\x00\x00\x00\x00\x01\x00\x02I\x1b\
-\x00\x00\x01\x9c\xf2\x9c\x1bB\
-\x00\x00\x02\xc6\x00\x00\x00\x00\x00\x01\x00\x01\x91\xcf\
-\x00\x00\x01\x9eq\xc0p\xcc\
-\x00\x00\x03J\x00\x00\x00\x00\x00\x01\x00\x02\x1d\xd5\
-\x00\x00\x01\x9a\xbe\xd1W\x04\
-\x00\x00\x02 \x00\x00\x00\x00\x00\x01\x00\x01}\x0f\
-\x00\x00\x01\x9a0\xf9\xabP\
-\x00\x00\x01p\x00\x00\x00\x00\x00\x01\x00\x01qx\
-\x00\x00\x01\x9d\x1a(\x09t\
-\x00\x00\x03\x94\x00\x00\x00\x00\x00\x01\x00\x023\xc9\
-\x00\x00\x01\x99]\xd7\xbc\xff\
-\x00\x00\x02F\x00\x00\x00\x00\x00\x01\x00\x01\x8b\x80\
-\x00\x00\x01\x9a\xa2\x95\x8eJ\
-\x00\x00\x018\x00\x00\x00\x00\x00\x01\x00\x01m\xf6\
-\x00\x00\x01\x9a0\xf9\xabP\
-\x00\x00\x02\xf6\x00\x00\x00\x00\x00\x01\x00\x01\x93s\
-\x00\x00\x01\x9a\xbe\xd1W\x04\
-\x00\x00\x03\x0e\x00\x00\x00\x00\x00\x01\x00\x01\x9b|\
-\x00\x00\x01\x9c\xf2\x9c\x1b>\
-\x00\x00\x03`\x00\x00\x00\x00\x00\x01\x00\x02$\x91\
-\x00\x00\x01\x9a\xbe\xd1W\x04\
-\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x01_\xd9\
-\x00\x00\x01\x9a0\xf9\xabP\
-\x00\x00\x03\xa8\x00\x00\x00\x00\x00\x01\x00\x025\x96\
-\x00\x00\x01\x9a0\xf9\xabP\
-\x00\x00\x000\x00\x00\x00\x00\x00\x01\x00\x00\x02z\
-\x00\x00\x01\x9d\x19<\xdb\xc9\
-\x00\x00\x02\x02\x00\x00\x00\x00\x00\x01\x00\x01y\xd4\
-\x00\x00\x01\x9d\xb9\xa2\xcb\xbe\
-\x00\x00\x01\xde\x00\x00\x00\x00\x00\x01\x00\x01v\xd4\
-\x00\x00\x01\x9a0\xf9\xabP\
-\x00\x00\x01\x12\x00\x00\x00\x00\x00\x01\x00\x01kv\
-\x00\x00\x01\x9d\xfbj\xa3\xdf\
-\x00\x00\x02\xa4\x00\x00\x00\x00\x00\x01\x00\x01\x90\x07\
-\x00\x00\x01\x9a\xb3\xa1\xd3\x0c\
-\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x01`\xeb\
-\x00\x00\x01\x99]\xd7\xbc\xff\
-\x00\x00\x04\xc0\x00\x00\x00\x00\x00\x01\x00\x03#\xab\
-\x00\x00\x01\x99]\xd7\xbd\x00\
-\x00\x00\x03z\x00\x00\x00\x00\x00\x01\x00\x02.\xdb\
-\x00\x00\x01\x9c\xf2\x9c\x1b=\
-\x00\x00\x01\xa0\x00\x00\x00\x00\x00\x01\x00\x01s\x95\
-\x00\x00\x01\x99]\xd7\xbd\x00\
-\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x01c\xcc\
-\x00\x00\x01\x99]\xd7\xbc\xff\
-\x00\x00\x03$\x00\x00\x00\x00\x00\x01\x00\x02\x1c\x0c\
-\x00\x00\x01\x9a\xb3\xa1\xd3\x0c\
-\x00\x00\x00\xfa\x00\x00\x00\x00\x00\x01\x00\x01gq\
-\x00\x00\x01\x9d\xb9\xa2\xcb\xbd\
-\x00\x00\x04\x0c\x00\x00\x00\x00\x00\x01\x00\x02@\x10\
-\x00\x00\x01\x9a\xb3\xa1\xd3\x0c\
-\x00\x00\x02t\x00\x00\x00\x00\x00\x01\x00\x01\x8e5\
-\x00\x00\x01\x9d\xfbj\xa3\xe0\
-\x00\x00\x05\x08\x00\x00\x00\x00\x00\x01\x00\x03&\x81\
-\x00\x00\x01\x9c\xf2\x9c\x1bB\
-\x00\x00\x044\x00\x00\x00\x00\x00\x01\x00\x02A\xda\
-\x00\x00\x01\x99]\xd7\xbc\xff\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
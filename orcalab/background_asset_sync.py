@@ -0,0 +1,175 @@
+"""
+后台资产同步
+
+启动时不再等待订阅资产包全部校验、下载完成：主窗口先用本地已有的 pak 打开，
+同步在工作线程中进行。每个资产包写入缓存目录后立即通过 RemoteScene.load_package
+热挂载，并通知资产浏览器刷新。
+
+引擎启动时已挂载的 pak 在同步中不会被覆盖或删除，新版本与删除操作推迟到下次启动。
+同步结束后重新扫描场景并合并到配置；本次启动的场景选择已经完成，新包中的场景在下次
+启动的场景列表中出现。
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from orcalab.asset_sync_service import AssetSyncCallbacks, sync_assets
+from orcalab.config_service import ConfigService
+from orcalab.level_discovery import discover_levels_from_cache
+
+logger = logging.getLogger(__name__)
+
+MountPackage = Callable[[str], Awaitable[None]]
+PackagesMounted = Callable[[List[str]], Awaitable[None]]
+SyncFinished = Callable[[bool, str], Awaitable[None]]
+
+
+def can_sync_in_background(config_service: ConfigService) -> bool:
+    """
+    是否可以跳过启动时的同步窗口。
+
+    需要交互的情况（未登录）仍然走启动时的同步流程；token 失效会在后台同步结束时提示。
+    """
+    if not config_service.datalink_enable_sync():
+        return False
+    return bool(config_service.datalink_username() and config_service.datalink_token())
+
+
+class _BackgroundSyncCallbacks(AssetSyncCallbacks):
+    """同步线程中的回调，转发到事件循环"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, ready_queue: "asyncio.Queue[Optional[str]]"):
+        self._loop = loop
+        self._ready_queue = ready_queue
+        self.success = False
+        self.message = ""
+
+    def on_package_ready(self, file_name: str, file_path: str):
+        self._loop.call_soon_threadsafe(self._ready_queue.put_nowait, file_path)
+
+    def on_download_complete(self, asset_id: str, success: bool, error: str = ""):
+        if not success:
+            logger.warning("后台同步: 资产包 %s 下载失败: %s", asset_id, error)
+
+    def on_complete(self, success: bool, message: str = ""):
+        self.success = success
+        self.message = message
+
+
+class BackgroundAssetSync:
+    def __init__(
+        self,
+        config_service: ConfigService,
+        mount_package: MountPackage,
+        on_packages_mounted: PackagesMounted,
+        on_finished: Optional[SyncFinished] = None,
+        sync_func: Callable[..., bool] = sync_assets,
+        discover_levels: Callable[[], List[Dict[str, str]]] = discover_levels_from_cache,
+    ):
+        self._config_service = config_service
+        self._mount_package = mount_package
+        self._on_packages_mounted = on_packages_mounted
+        self._on_finished = on_finished
+        self._sync_func = sync_func
+        self._discover_levels = discover_levels
+        self._cancel_event = threading.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.mounted: List[str] = []
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def wait(self) -> None:
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """请求同步线程尽快退出，最多等待 timeout 秒"""
+        self._cancel_event.set()
+        if self._task is None or self._task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("后台同步未在 %.1f 秒内退出", timeout)
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        _start = time.monotonic()
+        ready_queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        callbacks = _BackgroundSyncCallbacks(asyncio.get_running_loop(), ready_queue)
+        mount_task = asyncio.create_task(self._mount_loop(ready_queue))
+
+        logger.info("后台资产同步开始")
+        try:
+            result = await asyncio.to_thread(
+                self._sync_func,
+                self._config_service,
+                callbacks=callbacks,
+                verbose=False,
+                cancel_event=self._cancel_event,
+                defer_mounted_paks=True,
+            )
+        except Exception as e:
+            logger.exception("后台资产同步失败: %s", e)
+            result = False
+            callbacks.message = str(e)
+        finally:
+            ready_queue.put_nowait(None)
+            await mount_task
+
+        success = result is True and callbacks.success
+        logger.info(
+            "后台资产同步结束: %s, 热加载 %d 个资产包, 耗时 %.2f 秒",
+            callbacks.message or ("成功" if success else "失败"),
+            len(self.mounted),
+            time.monotonic() - _start,
+        )
+        if self.mounted and not self._cancel_event.is_set():
+            try:
+                self._config_service.merge_levels(await asyncio.to_thread(self._discover_levels))
+            except Exception as e:
+                logger.exception("后台同步后场景扫描失败: %s", e)
+        if self._on_finished is not None and not self._cancel_event.is_set():
+            try:
+                await self._on_finished(success, callbacks.message)
+            except Exception as e:
+                logger.exception("后台同步完成回调失败: %s", e)
+
+    async def _mount_loop(self, ready_queue: "asyncio.Queue[Optional[str]]") -> None:
+        """按到达顺序挂载资产包（全量包先于增量包），同一批到达的包只通知一次"""
+        finished = False
+        while not finished:
+            batch = [await ready_queue.get()]
+            while not ready_queue.empty():
+                batch.append(ready_queue.get_nowait())
+            if None in batch:
+                finished = True
+                batch = [path for path in batch if path is not None]
+
+            mounted = []
+            for path in batch:
+                if self._cancel_event.is_set():
+                    break
+                try:
+                    await self._mount_package(path)
+                    mounted.append(path)
+                    logger.info("已热加载资产包: %s", path)
+                except Exception as e:
+                    logger.exception("热加载资产包失败 %s: %s", path, e)
+
+            if mounted:
+                self.mounted.extend(mounted)
+                try:
+                    await self._on_packages_mounted(mounted)
+                except Exception as e:
+                    logger.exception("资产包挂载通知失败: %s", e)
@@ -47,6 +47,11 @@ def create_argparser():
         不指定会弹出配置选择界面。这个参数只有在'--full-screen'模式下才会生效。",
     )
     parser.add_argument("--full-screen", action="store_true", help="以全屏模式启动应用")
+    parser.add_argument(
+        "--background-sync",
+        action="store_true",
+        help="先用本地已有的资产包打开编辑器，订阅资产在后台同步并在下载完成后自动加载（全屏模式下无效）",
+    )
     parser.add_argument(
         "--port",
         type=int,
@@ -420,10 +420,50 @@ class ConfigService:
         """是否启用 DataLink 资产同步"""
         return self.config.get("datalink", {}).get("enable_sync", True)
 
+    def datalink_background_sync(self) -> bool:
+        """是否在主窗口打开后于后台同步资产（启动时只使用本地已有的资产包）"""
+        return bool(self.config.get("datalink", {}).get("background_sync", False))
+
     def datalink_timeout(self) -> int:
         """获取 DataLink 请求超时时间"""
         return self.config.get("datalink", {}).get("timeout", 10)
 
+    def datalink_hash_concurrency(self) -> int:
+        """获取本地资产包并发校验的文件数上限"""
+        return max(1, int(self.config.get("datalink", {}).get("hash_concurrency", 4)))
+
+    def datalink_download_segments(self) -> int:
+        """获取大文件分段并发下载的段数，1 表示不分段"""
+        return max(1, int(self.config.get("datalink", {}).get("download_segments", 1)))
+
+    def datalink_max_concurrent_downloads(self) -> int:
+        """获取资产同步的全局并发请求数上限"""
+        return max(1, int(self.config.get("datalink", {}).get("max_concurrent_downloads", 8)))
+
+    def datalink_max_connections_per_host(self) -> int:
+        """获取资产同步对单个主机的并发请求数上限"""
+        return max(1, int(self.config.get("datalink", {}).get("max_connections_per_host", 4)))
+
+    def datalink_http_max_concurrency(self) -> int:
+        """获取 DataLink 接口（元数据、资产详情、缩略图）的并发请求数上限"""
+        return max(1, int(self.config.get("datalink", {}).get("http_max_concurrency", 8)))
+
+    def datalink_response_cache_ttl(self) -> int:
+        """获取资产详情响应磁盘缓存的有效期（秒）"""
+        return max(0, int(self.config.get("datalink", {}).get("response_cache_ttl", 86400)))
+
+    def datalink_response_cache_max_entries(self) -> int:
+        """获取资产详情响应磁盘缓存的最大条目数"""
+        return max(1, int(self.config.get("datalink", {}).get("response_cache_max_entries", 5000)))
+
+    def datalink_upload_concurrency(self) -> int:
+        """获取缩略图上传队列的并发上传数"""
+        return max(1, int(self.config.get("datalink", {}).get("upload_concurrency", 4)))
+
+    def datalink_upload_max_attempts(self) -> int:
+        """获取缩略图上传失败后的最多尝试次数（含第一次）"""
+        return max(1, int(self.config.get("datalink", {}).get("upload_max_attempts", 6)))
+
     def datalink_auth_server_url(self) -> str:
         """获取 DataLink 认证服务器地址"""
         return self.config.get("datalink", {}).get(
@@ -465,6 +505,17 @@ class ConfigService:
     def enable_debug_tool(self) -> bool:
         return self.config.get("orcalab", {}).get("debug_tool", False)
 
+    def profiler_sample_rate_hz(self) -> int:
+        return int(self.config.get("orcalab", {}).get("profiler_sample_rate_hz", 100))
+
+    def thumbnail_cache_budget_mb(self) -> int:
+        """资产浏览器缩略图帧缓存的内存预算（MB）"""
+        return int(self.config.get("orcalab", {}).get("thumbnail_cache_budget_mb", 64))
+
+    def terminal_max_lines(self) -> int:
+        """终端面板保留的最大行数"""
+        return max(1, int(self.config.get("orcalab", {}).get("terminal_max_lines", 10000)))
+
     def force_adapter(self) -> str:
         return self.config.get("orcalab", {}).get("force_adapter", "")
 
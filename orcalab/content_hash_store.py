@@ -0,0 +1,243 @@
+"""
+持久化内容哈希缓存
+
+以 (路径, size, mtime_ns, inode) 作为文件指纹缓存 SHA-256，
+文件未变化时直接复用，避免每次启动重新读取全部 pak。
+
+- 写入采用临时文件 + os.replace，进程中断不会留下半截文件
+- 缓存文件损坏或格式不符时视为空缓存，不影响启动
+- sha256_many 在线程池中并发校验多个文件（hashlib 计算时释放 GIL），
+  支持逐文件进度回调与取消
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+CONTENT_HASH_STORE_VERSION = 1
+CONTENT_HASH_STORE_FILE_NAME = ".content_hash_store.json"
+HASH_READ_CHUNK_SIZE = 1024 * 1024
+PARALLEL_HASH_READ_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_HASH_CONCURRENCY = 4
+
+# on_progress(file_path, bytes_done, total_bytes)
+HashProgressCallback = Callable[[pathlib.Path, int, int], None]
+
+_content_hash_store_instance: "ContentHashStore | None" = None
+
+
+def get_content_hash_store() -> "ContentHashStore":
+    global _content_hash_store_instance
+    if _content_hash_store_instance is None:
+        from orcalab.project_util import get_cache_folder
+
+        _content_hash_store_instance = ContentHashStore(get_cache_folder() / CONTENT_HASH_STORE_FILE_NAME)
+    return _content_hash_store_instance
+
+
+def file_fingerprint(file_path: pathlib.Path) -> Optional[Dict[str, int]]:
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "inode": stat.st_ino}
+
+
+def hash_file_sha256(
+    file_path: pathlib.Path,
+    chunk_size: int = HASH_READ_CHUNK_SIZE,
+    on_progress: Optional[HashProgressCallback] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> Optional[str]:
+    """
+    计算文件 SHA-256。
+
+    复用同一块缓冲区 readinto，避免大文件逐块分配内存。
+    cancelled() 返回 True 时中止并返回 None。
+    """
+    hash_sha256 = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    total = os.path.getsize(file_path)
+    done = 0
+    with open(file_path, "rb", buffering=0) as f:
+        while True:
+            if cancelled is not None and cancelled():
+                return None
+            n = f.readinto(buffer)
+            if not n:
+                break
+            hash_sha256.update(view[:n])
+            done += n
+            if on_progress is not None:
+                on_progress(file_path, done, total)
+    return hash_sha256.hexdigest()
+
+
+class ContentHashStore:
+    def __init__(self, store_file: pathlib.Path):
+        self._store_file = pathlib.Path(store_file)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        self._loaded = False
+        self._dirty = False
+
+    @property
+    def store_file(self) -> pathlib.Path:
+        return self._store_file
+
+    @staticmethod
+    def _key(file_path: pathlib.Path) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._store_file.exists():
+            return
+        try:
+            data = json.loads(self._store_file.read_text(encoding="utf-8"))
+            if not isinstance(data, dict):
+                raise ValueError(f"unsupported store content: {data!r}")
+            if data.get("version") != CONTENT_HASH_STORE_VERSION:
+                raise ValueError(f"unsupported store version: {data.get('version')}")
+            entries = data.get("entries", {})
+            if not isinstance(entries, dict):
+                raise ValueError("entries is not a dict")
+            self._entries = {
+                k: v for k, v in entries.items() if isinstance(v, dict) and isinstance(v.get("sha256"), str)
+            }
+        except Exception as e:
+            logger.warning("内容哈希缓存损坏，已忽略并重建: %s (%s)", self._store_file, e)
+            self._entries = {}
+            self._dirty = True
+
+    def get(self, file_path: pathlib.Path) -> Optional[str]:
+        """文件指纹与缓存一致时返回缓存的 SHA-256，否则返回 None"""
+        fingerprint = file_fingerprint(file_path)
+        if fingerprint is None:
+            return None
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(self._key(file_path))
+        if entry is None:
+            return None
+        for name, value in fingerprint.items():
+            if entry.get(name) != value:
+                return None
+        return entry["sha256"]
+
+    def put(self, file_path: pathlib.Path, sha256: str) -> None:
+        """记录文件当前指纹对应的 SHA-256（文件不存在时忽略）"""
+        fingerprint = file_fingerprint(file_path)
+        if fingerprint is None:
+            return
+        entry = dict(fingerprint)
+        entry["sha256"] = sha256.lower()
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[self._key(file_path)] = entry
+            self._dirty = True
+
+    def invalidate(self, file_path: pathlib.Path) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            if self._entries.pop(self._key(file_path), None) is not None:
+                self._dirty = True
+
+    def sha256(self, file_path: pathlib.Path) -> str:
+        """读取缓存，未命中则计算并记录"""
+        cached = self.get(file_path)
+        if cached is not None:
+            return cached
+        return self._compute(file_path)
+
+    def _compute(
+        self,
+        file_path: pathlib.Path,
+        chunk_size: int = HASH_READ_CHUNK_SIZE,
+        on_progress: Optional[HashProgressCallback] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Optional[str]:
+        fingerprint_before = file_fingerprint(file_path)
+        digest = hash_file_sha256(file_path, chunk_size, on_progress, cancelled)
+        # 计算期间文件被改写则不缓存，避免记录错误的哈希
+        if digest is not None and fingerprint_before == file_fingerprint(file_path):
+            self.put(file_path, digest)
+        return digest
+
+    def sha256_many(
+        self,
+        file_paths: Iterable[pathlib.Path],
+        max_workers: int = DEFAULT_HASH_CONCURRENCY,
+        on_progress: Optional[HashProgressCallback] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Dict[pathlib.Path, str]:
+        """
+        并发计算多个文件的 SHA-256。
+
+        缓存命中的文件直接返回；未命中的按文件大小从大到小提交到线程池，
+        max_workers 即同时读盘的文件数上限。
+        取消后尚未完成的文件不会出现在结果中；读取失败的文件同样被跳过并记录日志。
+        """
+        results: Dict[pathlib.Path, str] = {}
+        pending = []
+        for file_path in dict.fromkeys(pathlib.Path(p) for p in file_paths):
+            cached = self.get(file_path)
+            if cached is not None:
+                results[file_path] = cached
+                if on_progress is not None:
+                    size = os.path.getsize(file_path)
+                    on_progress(file_path, size, size)
+            elif os.path.exists(file_path):
+                pending.append(file_path)
+
+        if not pending or (cancelled is not None and cancelled()):
+            return results
+
+        pending.sort(key=lambda p: os.path.getsize(p), reverse=True)
+        workers = max(1, min(int(max_workers), len(pending)))
+
+        def _hash(file_path: pathlib.Path) -> Optional[str]:
+            try:
+                return self._compute(file_path, PARALLEL_HASH_READ_CHUNK_SIZE, on_progress, cancelled)
+            except OSError as e:
+                logger.warning("计算文件哈希失败: %s (%s)", file_path, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orcalab-hash") as executor:
+            for file_path, digest in zip(pending, executor.map(_hash, pending)):
+                if digest is not None:
+                    results[file_path] = digest
+        return results
+
+    def save(self) -> None:
+        """原子写回磁盘，并移除已不存在文件的条目"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._entries = {k: v for k, v in self._entries.items() if os.path.exists(k)}
+            data = {"version": CONTENT_HASH_STORE_VERSION, "entries": self._entries}
+            temp_file = self._store_file.with_name(f"{self._store_file.name}.{os.getpid()}.tmp")
+            try:
+                self._store_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self._store_file)
+                self._dirty = False
+            except OSError as e:
+                logger.warning("保存内容哈希缓存失败: %s", e)
+                try:
+                    temp_file.unlink()
+                except OSError:
+                    pass
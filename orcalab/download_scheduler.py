@@ -0,0 +1,131 @@
+"""
+同步期间共享的 HTTP 连接池与下载调度
+
+- 每次同步只创建一个 aiohttp.ClientSession，TCPConnector 开启 keep-alive 与 DNS 缓存，
+  同一主机的请求复用连接，避免每个请求都重新握手 TCP/TLS
+- DownloadScheduler 限制全局与单主机并发数；等待中的任务按优先级（通常为文件大小）
+  出队，大文件先开始，保证带宽尽量一直被占满
+- ConnectionStats 通过 aiohttp TraceConfig 统计新建与复用的连接数
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_SCHEDULER_CONFIG = {
+    "max_concurrent": 8,
+    "max_per_host": 4,
+    "keepalive_timeout": 60,
+    "dns_cache_ttl": 300,
+}
+
+
+@dataclass
+class ConnectionStats:
+    created: int = 0
+    reused: int = 0
+
+    def to_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_create(session, context, params):
+            self.created += 1
+
+        async def on_reuse(session, context, params):
+            self.reused += 1
+
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        return trace_config
+
+
+def create_pooled_session(
+    timeout: aiohttp.ClientTimeout,
+    max_concurrent: int = DOWNLOAD_SCHEDULER_CONFIG["max_concurrent"],
+    max_per_host: int = DOWNLOAD_SCHEDULER_CONFIG["max_per_host"],
+) -> Tuple[aiohttp.ClientSession, ConnectionStats]:
+    """创建同步期间复用的 ClientSession，连接池上限与调度器并发数一致"""
+    stats = ConnectionStats()
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrent,
+        limit_per_host=max_per_host,
+        keepalive_timeout=DOWNLOAD_SCHEDULER_CONFIG["keepalive_timeout"],
+        ttl_dns_cache=DOWNLOAD_SCHEDULER_CONFIG["dns_cache_ttl"],
+    )
+    session = aiohttp.ClientSession(connector=connector, timeout=timeout, trace_configs=[stats.to_trace_config()])
+    return session, stats
+
+
+class _PriorityLimiter:
+    """容量有限的信号量，等待者按 (priority 降序, 到达顺序) 获得许可"""
+
+    def __init__(self, capacity: int):
+        self._available = max(1, capacity)
+        self._waiters: List[Tuple[float, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: float) -> None:
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 已分配到许可但被取消，交还给下一个等待者
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._available += 1
+
+
+class DownloadScheduler:
+    """全局 + 单主机并发限制的请求调度器"""
+
+    def __init__(
+        self,
+        max_concurrent: int = DOWNLOAD_SCHEDULER_CONFIG["max_concurrent"],
+        max_per_host: int = DOWNLOAD_SCHEDULER_CONFIG["max_per_host"],
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_per_host = max(1, max_per_host)
+        self._global = _PriorityLimiter(self.max_concurrent)
+        self._hosts: Dict[str, _PriorityLimiter] = {}
+
+    def _host_limiter(self, url: str) -> _PriorityLimiter:
+        host = urlsplit(url).netloc
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            limiter = self._hosts[host] = _PriorityLimiter(self.max_per_host)
+        return limiter
+
+    @asynccontextmanager
+    async def slot(self, url: str, priority: float = 0):
+        """占用一个请求名额；priority 越大越先获得名额（下载时传入文件大小）"""
+        host_limiter = self._host_limiter(url)
+        await host_limiter.acquire(priority)
+        try:
+            await self._global.acquire(priority)
+            try:
+                yield
+            finally:
+                self._global.release()
+        finally:
+            host_limiter.release()
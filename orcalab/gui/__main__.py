@@ -0,0 +1,10 @@
+"""
+界面进程入口，launcher 以 python -m orcalab.gui 启动。
+
+与直接 python -m orcalab.main 等价；区别在于 multiprocessing 以 spawn 方式启动子进程时
+不会把 orcalab.main 作为 __mp_main__ 重新执行。
+"""
+
+from orcalab.main import main
+
+main()
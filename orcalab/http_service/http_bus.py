@@ -2,6 +2,12 @@ from orcalab.event_bus import create_event_bus
 from typing import List, Dict
 
 class HttpServiceRequest:
+    async def fetch_all_metadata(self, output: List[list] = None) -> list:
+        pass
+
+    async def fetch_subscription_metadata(self, output: List[dict] = None) -> dict:
+        pass
+
     async def get_all_metadata(self, output: List[str] = None) -> str:
         pass
 
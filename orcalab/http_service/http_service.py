@@ -2,12 +2,23 @@ import os
 import logging
 import time
 from orcalab.http_service.http_bus import HttpServiceRequest, HttpServiceRequestBus
-from typing import List, Dict, Optional, Callable, Any
+from orcalab.http_service.json_stream import SubscriptionMetadataCollector, aiter_json_array
+from orcalab.http_service.response_cache import RESPONSE_CACHE_FILE_NAME, ResponseCache
+from orcalab.http_service.upload_queue import (
+    UPLOAD_QUEUE_FILE_NAME,
+    ProgressCallback,
+    UploadError,
+    UploadProgress,
+    UploadQueue,
+    is_retryable_status,
+)
+from orcalab.download_scheduler import ConnectionStats, create_pooled_session
+from contextlib import asynccontextmanager
+from typing import List, Dict, Optional, Callable, Any, Awaitable, Tuple
 from typing_extensions import override
 from orcalab.token_storage import TokenStorage
 from orcalab.project_util import get_cache_folder
 from orcalab.config_service import ConfigService
-from concurrent.futures import ThreadPoolExecutor
 import aiohttp
 import asyncio
 import functools
@@ -18,6 +29,9 @@ import sys
 
 logger = logging.getLogger(__name__)
 
+# 与 aiohttp 默认的整体超时一致（上传接口可能耗时较长）
+HTTP_SERVICE_REQUEST_TIMEOUT = 5 * 60
+
 
 def _log_request_time(method: str, url: str, start: float, status: int = None):
     elapsed = time.monotonic() - start
@@ -50,116 +64,217 @@ class HttpService(HttpServiceRequest):
         self.cache_folder = get_cache_folder()
         self.base_url = ConfigService().datalink_base_url()
         self.version = ConfigService()._get_package_version()
-        self._executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="http_service")
-        self._upload_futures = []
         self.platform = "linux" if sys.platform == "linux" else "pc"
 
+        # 所有请求共享一个连接池；并发数受信号量限制
+        self._max_concurrent = ConfigService().datalink_http_max_concurrency()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_stats: Optional[ConnectionStats] = None
+        self._request_slots = asyncio.Semaphore(self._max_concurrent)
+        # 相同请求在途时共享同一个 Task
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._response_cache = ResponseCache(
+            self.cache_folder / RESPONSE_CACHE_FILE_NAME,
+            ttl=ConfigService().datalink_response_cache_ttl(),
+            max_entries=ConfigService().datalink_response_cache_max_entries(),
+        )
+        # 缩略图上传队列；上传占用上面的请求名额
+        self._upload_queue = UploadQueue(
+            self.cache_folder / UPLOAD_QUEUE_FILE_NAME,
+            lambda asset_id, files: self._post_asset_thumbnail(asset_id, files),
+            max_concurrency=ConfigService().datalink_upload_concurrency(),
+            max_attempts=ConfigService().datalink_upload_max_attempts(),
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session, self._session_stats = create_pooled_session(
+                aiohttp.ClientTimeout(total=HTTP_SERVICE_REQUEST_TIMEOUT),
+                max_concurrent=self._max_concurrent,
+                max_per_host=self._max_concurrent,
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def _session_scope(self):
+        """占用一个请求名额并返回共享的 ClientSession（不在这里关闭）"""
+        async with self._request_slots:
+            yield self._get_session()
+
+    async def _shared(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """相同 key 的请求在途时直接等待已有的 Task，不重复发起"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield：某个等待者被取消时不影响其他共享同一结果的调用
+        return await asyncio.shield(task)
+
+    def _asset_cache_key(self, asset_id: str) -> str:
+        # 未发布资产只对作者可见，缓存按用户区分
+        return f"{self.username}|{self.base_url}/asset/{asset_id}/"
+
+    async def close(self) -> None:
+        """关闭连接池与响应缓存；未完成的上传留在队列中，下次启动时继续"""
+        await self._upload_queue.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            stats = self._session_stats
+            if stats is not None:
+                logger.debug("HttpService 连接: 新建 %d, 复用 %d", stats.created, stats.reused)
+        self._session = None
+        self._response_cache.close()
+
+    async def _stream_metadata_listing(
+        self, session: aiohttp.ClientSession, is_published: bool, on_item: Callable[[Any], None]
+    ) -> bool:
+        """流式读取一个元数据列表，每解析出一个元素调用一次 on_item；失败返回 False"""
+        metadata_url = f"{self.base_url}/meta/?isPublished={'true' if is_published else 'false'}"
+        _start = time.monotonic()
+        async with session.get(metadata_url, headers=self._get_headers()) as response:
+            if response.status != 200:
+                _log_request_time("GET", metadata_url, _start, response.status)
+                logger.debug(f"get all metadata failed. Status: {response.status}. MetadataUrl: {metadata_url}")
+                return False
+            async for item in aiter_json_array(response):
+                on_item(item)
+            _log_request_time("GET", metadata_url, _start, response.status)
+        return True
+
     @require_online
     @override
-    async def get_all_metadata(self, output: List[str] = None) -> str:
-        metadata_url = f"{self.base_url}/meta/?isPublished=true"
-        metadata_url_unpublished = f"{self.base_url}/meta/?isPublished=false"
-        async with aiohttp.ClientSession() as session:
-            _start = time.monotonic()
-            async with session.get(metadata_url, headers=self._get_headers()) as response:
-                _log_request_time("GET", metadata_url, _start, response.status)
-                if response.status != 200:
-                    logger.debug(f"get all metadata failed. Status: {response.status}. MetadataUrl: {metadata_url}")
+    async def fetch_all_metadata(self, output: List[list] = None) -> Optional[list]:
+        metadata = []
+        async with self._session_scope() as session:
+            for is_published in (True, False):
+                if not await self._stream_metadata_listing(session, is_published, metadata.append):
                     return None
-                metadata_published = await response.json()
-                _start = time.monotonic()
-                async with session.get(metadata_url_unpublished, headers=self._get_headers()) as response:
-                    _log_request_time("GET", metadata_url_unpublished, _start, response.status)
-                    if response.status != 200:
-                        logger.debug(f"get all metadata failed. Status: {response.status} MetadataUrl: {metadata_url_unpublished}")
-                        return None
-                    metadata_unpublished = await response.json()
-                metadata = metadata_published + metadata_unpublished
-                metadata = json.dumps(metadata, ensure_ascii=False, indent=2)
-                if output is not None:
-                    output.append(metadata)
-                return metadata
+        if output is not None:
+            output.append(metadata)
+        return metadata
 
     @require_online
     @override
-    async def get_subscription_metadata(self, output: List[str] = None) -> str:
-        all_metadata = await self.get_all_metadata()
-        if all_metadata is None:
+    async def get_all_metadata(self, output: List[str] = None) -> str:
+        metadata = await self.fetch_all_metadata()
+        if metadata is None:
             return None
-        subscriptions = await self.get_subscriptions()
+        metadata = json.dumps(metadata, ensure_ascii=False, indent=2)
+        if output is not None:
+            output.append(metadata)
+        return metadata
+
+    @require_online
+    @override
+    async def fetch_subscription_metadata(self, output: List[dict] = None) -> Optional[dict]:
+        subscriptions = await self._fetch_subscriptions()
         if subscriptions is None:
             return None
-        metadata = json.loads(all_metadata)
-        subscriptions = json.loads(subscriptions)
         subscriptions_id = [subscription['assetPackageId'] for subscription in subscriptions['subscriptions']]
-        output_json = {}
-        for sub_metadata in metadata:
-            # pak资产包信息
-            if sub_metadata['id'] in subscriptions_id:
-                for key, value in sub_metadata.items():
-                    if sub_metadata['id'] not in output_json.keys():
-                        output_json[sub_metadata['id']] = {}
-                        output_json[sub_metadata['id']]['children'] = []
-                    output_json[sub_metadata['id']][key] = value
-            # pak包含的资产
-            if 'parentPackageId' in sub_metadata and sub_metadata['parentPackageId'] in subscriptions_id:
-                if sub_metadata['parentPackageId'] not in output_json.keys():
-                    output_json[sub_metadata['parentPackageId']] = {}
-                    output_json[sub_metadata['parentPackageId']]['children'] = []
-                output_json[sub_metadata['parentPackageId']]['children'].append(sub_metadata)
-        
-        # 图片url信息 - 并行执行
-        tasks = []
-        asset_metadata_list = []
-        for sub_metadata in output_json.values():
-            for asset_metadata in sub_metadata['children']:
-                asset_id = asset_metadata['id']
-                tasks.append(self.get_image_url(asset_id))
-                asset_metadata_list.append(asset_metadata)
-        
+
+        # 边解析边过滤，未订阅的条目不会留在内存中
+        collector = SubscriptionMetadataCollector(subscriptions_id)
+        async with self._session_scope() as session:
+            for is_published in (True, False):
+                if not await self._stream_metadata_listing(session, is_published, collector.add):
+                    return None
+
+        # 图片url信息 - 并行执行；并发受连接池限制，updatedAt 未变化的资产直接使用缓存
+        asset_metadata_list = list(collector.assets())
+        tasks = [
+            self._get_asset_metadata(asset_metadata['id'], asset_metadata.get('updatedAt'))
+            for asset_metadata in asset_metadata_list
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         for asset_metadata, asset_url in zip(asset_metadata_list, results):
             if asset_url is not None and not isinstance(asset_url, Exception):
-                asset_url = json.loads(asset_url)
                 asset_metadata['pictures'] = asset_url['pictures']
+        logger.debug("订阅元数据: 扫描 %d 条, 保留 %d 个资产包", collector.scanned, len(collector.packages))
 
-        output_json = json.dumps(output_json, ensure_ascii=False, indent=2)
         if output is not None:
-            output.extend(output_json)
-        
-        return output_json
+            output.append(collector.packages)
+        return collector.packages
 
     @require_online
     @override
-    async def get_subscriptions(self, output: List[str] = None) -> str:
+    async def get_subscription_metadata(self, output: List[str] = None) -> str:
+        metadata = await self.fetch_subscription_metadata()
+        if metadata is None:
+            return None
+        metadata = json.dumps(metadata, ensure_ascii=False, indent=2)
+        if output is not None:
+            output.append(metadata)
+        return metadata
+
+    async def _fetch_subscriptions(self) -> Optional[dict]:
         subscriptions_url = f"{self.base_url}/subscriptions/?version={self.version}&platform={self.platform}"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.get(subscriptions_url, headers=self._get_headers()) as response:
                 _log_request_time("GET", subscriptions_url, _start, response.status)
                 if response.status != 200:
                     logger.debug(f"get subscriptions failed. Status: {response.status}")
                     return None
-                subscriptions = await response.json()
-                subscriptions = json.dumps(subscriptions, ensure_ascii=False, indent=2)
-                if output is not None:
-                    output.extend(subscriptions)
-                return subscriptions
+                return await response.json()
+
+    @require_online
+    @override
+    async def get_subscriptions(self, output: List[str] = None) -> str:
+        subscriptions = await self._fetch_subscriptions()
+        if subscriptions is None:
+            return None
+        subscriptions = json.dumps(subscriptions, ensure_ascii=False, indent=2)
+        if output is not None:
+            output.extend(subscriptions)
+        return subscriptions
 
     @require_online
     @override
     async def post_asset_thumbnail(self, asset_id: str, thumbnail_path: List[str]) -> None:
-        future = self._executor.submit(self._post_asset_thumbnail, asset_id, thumbnail_path)
-        self._upload_futures.append(future)
+        # 上传后图片地址会变化
+        self._response_cache.invalidate(self._asset_cache_key(asset_id))
+        self._upload_queue.enqueue(asset_id, thumbnail_path)
 
-    async def wait_for_upload_finished(self) -> None:
-        wrapped_futures = [asyncio.wrap_future(f) for f in self._upload_futures]
-        await asyncio.gather(*wrapped_futures)
-        self._upload_futures.clear()
+    def resume_uploads(self) -> int:
+        """继续上传上次运行未完成的缩略图（需要在事件循环中调用）；返回排队的任务数"""
+        if not self.check_online():
+            return 0
+        return self._upload_queue.resume()
 
-    def _post_asset_thumbnail(self, asset_id: str, thumbnail_path: List[str]) -> None:
+    def upload_progress(self) -> UploadProgress:
+        return self._upload_queue.progress()
+
+    async def wait_for_upload_finished(self, on_progress: Optional[ProgressCallback] = None) -> UploadProgress:
+        """等待队列中的缩略图全部上传完成或最终失败；on_progress 在每个任务结束时调用"""
+        if not self.check_online():
+            return self._upload_queue.progress()
+        return await self._upload_queue.join(on_progress)
+
+    async def _post_asset_thumbnail(self, asset_id: str, thumbnail_path: List[str]) -> None:
+        """上传一次；失败时抛出 UploadError（网络错误原样抛出），由上传队列决定是否重试"""
         post_asset_thumbnail_url = f"{self.base_url}/assets/{asset_id}/render/"
-        
+        files = await asyncio.get_running_loop().run_in_executor(None, self._read_thumbnail_files, thumbnail_path)
+        if not files:
+            raise UploadError(f"No valid thumbnail files to upload for asset {asset_id}", retryable=False)
+
+        form = aiohttp.FormData()
+        for filename, data, content_type in files:
+            form.add_field("files", data, filename=filename, content_type=content_type)
+        async with self._session_scope() as session:
+            _start = time.monotonic()
+            headers = self._get_headers(include_content_type=False)
+            async with session.post(post_asset_thumbnail_url, data=form, headers=headers) as response:
+                _log_request_time("POST", post_asset_thumbnail_url, _start, response.status)
+                if response.status in (200, 201, 204):
+                    logger.info("Upload thumbnail success: %s, files: %s", response.status, thumbnail_path)
+                    return
+                detail = (await response.text())[:200]
+        raise UploadError(
+            f"Upload thumbnail failed: {response.status} {detail}", retryable=is_retryable_status(response.status)
+        )
+
+    def _read_thumbnail_files(self, thumbnail_path: List[str]) -> List[Tuple[str, bytes, str]]:
         files = []
         for file_path in thumbnail_path:
             try:
@@ -169,31 +284,20 @@ class HttpService(HttpServiceRequest):
                 filename = os.path.basename(file_path)
                 content_type = self._get_image_content_type(file_path)
                 with open(file_path, 'rb') as f:
-                    files.append(('files', (filename, f.read(), content_type)))
+                    files.append((filename, f.read(), content_type))
             except Exception as e:
                 logger.exception("Error reading thumbnail file %s: %s", file_path, e)
                 continue
-        
-        if not files:
-            logger.error("No valid thumbnail files to upload for asset %s", asset_id)
-            return
-        
-        try:
-            headers = self._get_headers(include_content_type=False)
-            _start = time.monotonic()
-            response = requests.post(post_asset_thumbnail_url, files=files, headers=headers)
-            _log_request_time("POST", post_asset_thumbnail_url, _start, response.status_code)
-            if response.status_code in [200, 201, 204]:
-                logger.info("Upload thumbnail success: %s, files: %s", response.status_code, thumbnail_path)
-            else:
-                logger.error("Upload thumbnail failed: %s, files: %s", response.status_code, thumbnail_path)
-        except Exception as e:
-            logger.exception("Error uploading thumbnail for asset %s: %s", asset_id, e)
+        return files
 
     @require_online
     @override
     async def get_asset_thumbnail2cache(self, asset_url: str, asset_save_path: str) -> None:
-        async with aiohttp.ClientSession() as session:
+        # 同一缩略图并发请求时只下载一次
+        await self._shared(f"thumbnail|{asset_save_path}", lambda: self._download_thumbnail(asset_url, asset_save_path))
+
+    async def _download_thumbnail(self, asset_url: str, asset_save_path: str) -> None:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.get(asset_url) as response:
                 _log_request_time("GET", asset_url, _start, response.status)
@@ -201,30 +305,57 @@ class HttpService(HttpServiceRequest):
                     logger.debug(f"get asset thumbnail to cache failed. Status: {response.status}")
                     return None
                 data = await response.read()
-                if not os.path.exists(os.path.dirname(asset_save_path)):
-                    os.makedirs(os.path.dirname(asset_save_path), exist_ok=True)
-                with open(asset_save_path, 'wb') as f:
-                    f.write(data) 
+        if not os.path.exists(os.path.dirname(asset_save_path)):
+            os.makedirs(os.path.dirname(asset_save_path), exist_ok=True)
+        with open(asset_save_path, 'wb') as f:
+            f.write(data)
 
     @require_online
     @override
     async def get_image_url(self, asset_id: str) -> str:
-        get_asset_metadata_url = f"{self.base_url}/asset/{asset_id}/"
-        async with aiohttp.ClientSession() as session:
+        asset_metadata = await self._get_asset_metadata(asset_id)
+        if asset_metadata is None:
+            return None
+        return json.dumps(asset_metadata, ensure_ascii=False, indent=2)
+
+    async def _get_asset_metadata(self, asset_id: str, updated_at: Optional[str] = None) -> Optional[dict]:
+        """
+        获取资产详情（含图片地址），优先使用磁盘缓存。
+
+        updated_at 不为空时，缓存中的 updatedAt 必须与之一致才会被使用。
+        """
+        status, asset_metadata = await self._get_asset_detail_json(asset_id, updated_at)
+        if status != 200:
+            logger.debug(f"get image url failed. Status: {status}")
+            return None
+        return asset_metadata
+
+    async def _get_asset_detail_json(
+        self, asset_id: str, updated_at: Optional[str] = None
+    ) -> Tuple[int, Optional[dict]]:
+        key = self._asset_cache_key(asset_id)
+        cached = self._response_cache.get(key)
+        if cached is not None and (updated_at is None or cached.get('updatedAt') == updated_at):
+            return 200, cached
+        return await self._shared(key, lambda: self._fetch_asset_detail_json(key, asset_id))
+
+    async def _fetch_asset_detail_json(self, key: str, asset_id: str) -> Tuple[int, Optional[dict]]:
+        asset_url = f"{self.base_url}/asset/{asset_id}/"
+        async with self._session_scope() as session:
             _start = time.monotonic()
-            async with session.get(get_asset_metadata_url, headers=self._get_headers()) as response:
-                _log_request_time("GET", get_asset_metadata_url, _start, response.status)
+            async with session.get(asset_url, headers=self._get_headers()) as response:
+                _log_request_time("GET", asset_url, _start, response.status)
                 if response.status != 200:
-                    logger.debug(f"get image url failed. Status: {response.status}")
-                    return None
-                asset_metadata = await response.json()
-                return json.dumps(asset_metadata, ensure_ascii=False, indent=2)
+                    return response.status, None
+                asset_detail = await response.json()
+        self._response_cache.put(key, asset_detail)
+        return 200, asset_detail
 
     @require_online
     @override
     async def get_my_metadata(self, output: List[str] = None) -> str:
         mymeta_url = f"{self.base_url}/mymeta/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.get(mymeta_url, headers=self._get_headers()) as response:
                 _log_request_time("GET", mymeta_url, _start, response.status)
@@ -247,21 +378,16 @@ class HttpService(HttpServiceRequest):
                 output.append(msg)
             return msg
 
-        asset_url = f"{self.base_url}/asset/{asset_id}/"
-        async with aiohttp.ClientSession() as session:
-            _start = time.monotonic()
-            async with session.get(asset_url, headers=self._get_headers()) as response:
-                _log_request_time("GET", asset_url, _start, response.status)
-                if response.status != 200:
-                    msg = json.dumps({"code": response.status, "message": f"获取资产详情失败"}, ensure_ascii=False)
-                    if output is not None:
-                        output.append(msg)
-                    return msg
-                asset_detail = await response.json()
-                asset_detail = json.dumps(asset_detail, ensure_ascii=False, indent=2)
-                if output is not None:
-                    output.append(asset_detail)
-                return asset_detail
+        status, asset_detail = await self._get_asset_detail_json(asset_id)
+        if status != 200:
+            msg = json.dumps({"code": status, "message": f"获取资产详情失败"}, ensure_ascii=False)
+            if output is not None:
+                output.append(msg)
+            return msg
+        asset_detail = json.dumps(asset_detail, ensure_ascii=False, indent=2)
+        if output is not None:
+            output.append(asset_detail)
+        return asset_detail
 
     @require_online
     @override
@@ -274,7 +400,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/asset/{asset_package_id}/subscribe/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.post(url, headers=self._get_headers(), json={}) as response:
                 _log_request_time("POST", url, _start, response.status)
@@ -309,7 +435,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/asset/{asset_package_id}/unsubscribe/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             async with session.post(url, headers=self._get_headers(), json={}) as response:
                 body = await response.text()
                 try:
@@ -341,7 +467,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/asset/{asset_package_id}/subscription_status/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             async with session.get(url, headers=self._get_headers()) as response:
                 body = await response.text()
                 try:
@@ -372,7 +498,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/generate/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             image_path = task_data.pop("image_path", None)
             data = aiohttp.FormData()
             for key, value in task_data.items():
@@ -420,7 +546,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/generate/status/{task_id}/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.get(url, headers=self._get_headers()) as response:
                 _log_request_time("GET", url, _start, response.status)
@@ -447,7 +573,7 @@ class HttpService(HttpServiceRequest):
     @override
     async def get_user_generate_tasks(self, output: List[str] = None) -> str:
         url = f"{self.base_url}/generate/user_tasks/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.get(url, headers=self._get_headers()) as response:
                 _log_request_time("GET", url, _start, response.status)
@@ -480,7 +606,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/upload/generate_usdz/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             data = aiohttp.FormData()
             for key, value in task_data.items():
                 if value is not None:
@@ -519,7 +645,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/cancel_asset_zip/{task_id}/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.post(url, headers=self._get_headers(), json={}) as response:
                 _log_request_time("POST", url, _start, response.status)
@@ -552,7 +678,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/check-asset-version/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.post(url, headers=self._get_headers(), json=version_data) as response:
                 _log_request_time("POST", url, _start, response.status)
@@ -585,7 +711,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/upload/asset_zip/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             data = aiohttp.FormData()
             for key, value in upload_data.items():
                 if value is not None:
@@ -623,7 +749,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/upload/usdz/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             data = aiohttp.FormData()
             for key, value in upload_data.items():
                 if value is not None:
@@ -661,7 +787,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/upload/xml/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             data = aiohttp.FormData()
             for key, value in upload_data.items():
                 if value is not None:
@@ -700,7 +826,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/task_chain_progress/{task_chain_id}/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.get(url, headers=self._get_headers()) as response:
                 _log_request_time("GET", url, _start, response.status)
@@ -734,7 +860,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/save_asset_draft/{task_id}/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             data = aiohttp.FormData()
             for key, value in draft_data.items():
                 if value is not None:
@@ -803,7 +929,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/delete/{asset_id}/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             _start = time.monotonic()
             async with session.delete(url, headers=self._get_headers()) as response:
                 _log_request_time("DELETE", url, _start, response.status)
@@ -814,6 +940,8 @@ class HttpService(HttpServiceRequest):
                     logger.exception("delete_asset: 请求异常")
                     body_json = {"raw": body}
                 ok = response.status == 200
+                if ok:
+                    self._response_cache.invalidate(self._asset_cache_key(asset_id))
                 msg = json.dumps(
                     {
                         "success": ok,
@@ -857,7 +985,7 @@ class HttpService(HttpServiceRequest):
             return msg
 
         url = f"{self.base_url}/search/"
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             image_path = search_data.pop("image_path", None)
             data = aiohttp.FormData()
             for key, value in search_data.items():
@@ -0,0 +1,184 @@
+"""
+大体积 JSON 列表的流式解析。
+
+元数据列表接口返回一个顶层 JSON 数组，整体 ``response.json()`` 需要同时持有
+原始响应、解码后的字符串和完整对象。这里按块喂入字节，每解析出一个数组元素就
+立即交给调用方并丢弃对应的文本，峰值内存只与单个元素的大小相关。
+"""
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+import aiohttp
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\r\n"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+class JsonArrayStreamParser:
+    """
+    顶层 JSON 数组的增量解析器。
+
+    用法::
+
+        parser = JsonArrayStreamParser()
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                ...
+        parser.close()
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._finished = False
+        self._expect_value = True
+        # 上一次解析失败时的缓冲区长度，数据没有增加就不重复尝试
+        self._stalled_at = -1
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def feed(self, chunk: bytes) -> Iterator[Any]:
+        """喂入一块字节，依次产出其中已经完整的数组元素"""
+        self._buffer += self._utf8.decode(chunk)
+        yield from self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """结束输入，返回剩余的元素；数组不完整时抛出 ValueError"""
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = list(self._drain(final=True))
+        if not self._finished:
+            raise ValueError("JSON 数组不完整")
+        return items
+
+    def _skip_whitespace(self) -> None:
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+
+    def _compact(self) -> None:
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+            self._stalled_at = -1
+
+    def _drain(self, final: bool) -> Iterator[Any]:
+        if self._finished:
+            self._skip_whitespace()
+            if self._pos < len(self._buffer):
+                raise ValueError("JSON 数组之后存在多余内容")
+        while not self._finished:
+            self._skip_whitespace()
+            if self._pos >= len(self._buffer):
+                break
+
+            char = self._buffer[self._pos]
+            if not self._started:
+                if char != "[":
+                    raise ValueError(f"期望 JSON 数组，实际为 {char!r}")
+                self._started = True
+                self._pos += 1
+                continue
+
+            if char == "]":
+                self._finished = True
+                self._pos += 1
+                self._skip_whitespace()
+                if self._pos < len(self._buffer):
+                    raise ValueError("JSON 数组之后存在多余内容")
+                break
+
+            if not self._expect_value:
+                if char != ",":
+                    raise ValueError(f"期望 ',' 或 ']'，实际为 {char!r}")
+                self._expect_value = True
+                self._pos += 1
+                continue
+
+            if not final and self._stalled_at == len(self._buffer):
+                break
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                # 元素还没有接收完整，等待下一块数据
+                self._compact()
+                self._stalled_at = len(self._buffer)
+                break
+            if not final and (end >= len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+                # 数字等标量可能被截断在块边界上，等后续的分隔符确认
+                self._compact()
+                self._stalled_at = len(self._buffer)
+                break
+
+            self._pos = end
+            self._expect_value = False
+            yield item
+
+        self._compact()
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """同步版本：从字节块序列中逐个产出数组元素"""
+    parser = JsonArrayStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_json_array(response: aiohttp.ClientResponse, chunk_size: int = STREAM_CHUNK_SIZE):
+    """从 aiohttp 响应体中逐个产出顶层数组元素"""
+    parser = JsonArrayStreamParser()
+    async for chunk in response.content.iter_chunked(chunk_size):
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+class SubscriptionMetadataCollector:
+    """
+    边解析边按订阅过滤元数据列表。
+
+    列表中资产包和资产混排：``id`` 命中订阅的是资产包本身，``parentPackageId``
+    命中订阅的是包内资产。未订阅的元素在解析后立即丢弃。
+    结果格式与 metadata.json 一致：``{package_id: {...package, "children": [...]}}``。
+    """
+
+    def __init__(self, subscribed_ids: Iterable[str]):
+        self._subscribed: Set[str] = set(subscribed_ids)
+        self.packages: Dict[str, Dict[str, Any]] = {}
+        self.scanned = 0
+
+    def _package(self, package_id: str) -> Dict[str, Any]:
+        package = self.packages.get(package_id)
+        if package is None:
+            package = {"children": []}
+            self.packages[package_id] = package
+        return package
+
+    def add(self, item: Any) -> None:
+        self.scanned += 1
+        if not isinstance(item, dict):
+            return
+        item_id = item.get("id")
+        if item_id in self._subscribed:
+            self._package(item_id).update(item)
+        parent_id: Optional[str] = item.get("parentPackageId")
+        if parent_id in self._subscribed:
+            self._package(parent_id)["children"].append(item)
+
+    def assets(self) -> Iterator[Dict[str, Any]]:
+        for package in self.packages.values():
+            yield from package["children"]
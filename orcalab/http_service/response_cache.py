@@ -0,0 +1,180 @@
+"""
+HTTP 响应的磁盘缓存（SQLite，TTL + LRU）
+
+用于缓存资产详情 / 图片地址这类读多写少的 JSON 响应：
+- 条目超过 ttl 秒视为过期，读取时不返回
+- 条目数超过 max_entries 时按最近访问时间淘汰；命中时只在内存中记录访问时间，
+  在 put / close 或积累到 ACCESS_FLUSH_BATCH 条时批量写回，读缓存不产生磁盘写入
+- 进程重启后缓存仍然有效，资产浏览器与 MCP 工具重复查询时不再访问网络
+
+表结构：entries(key, value, stored_at, accessed_at)
+"""
+
+import json
+import logging
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_SCHEMA_VERSION = 1
+RESPONSE_CACHE_FILE_NAME = "http_cache.sqlite3"
+
+RESPONSE_CACHE_CONFIG = {
+    "ttl": 24 * 3600,
+    "max_entries": 5000,
+}
+
+# 内存中积累的访问时间达到这个数量时写回数据库
+ACCESS_FLUSH_BATCH = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at);
+"""
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        db_path: pathlib.Path,
+        ttl: float = RESPONSE_CACHE_CONFIG["ttl"],
+        max_entries: int = RESPONSE_CACHE_CONFIG["max_entries"],
+        clock=time.time,
+    ):
+        self._db_path = pathlib.Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = self._connect()
+        # 尚未写回的访问时间：key -> accessed_at
+        self._touched: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def db_path(self) -> pathlib.Path:
+        return self._db_path
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        try:
+            return self._open()
+        except sqlite3.DatabaseError as e:
+            # 缓存文件损坏时直接重建
+            logger.warning("HTTP 缓存损坏，已重建: %s (%s)", self._db_path, e)
+            for suffix in ("", "-wal", "-shm"):
+                pathlib.Path(f"{self._db_path}{suffix}").unlink(missing_ok=True)
+            try:
+                return self._open()
+            except sqlite3.Error as e:
+                logger.warning("HTTP 缓存不可用: %s", e)
+                return None
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, RESPONSE_CACHE_SCHEMA_VERSION):
+            conn.execute("DROP TABLE IF EXISTS entries")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version={RESPONSE_CACHE_SCHEMA_VERSION}")
+        conn.commit()
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """返回未过期的缓存值，并刷新其访问时间；不存在或已过期返回 None"""
+        if self._conn is None:
+            return None
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self._ttl:
+                self.misses += 1
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= ACCESS_FLUSH_BATCH:
+                self._flush_access_times()
+                self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        if self._conn is None:
+            return
+        now = self._clock()
+        data = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries(key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, data, now, now),
+            )
+            self._touched.pop(key, None)
+            # 淘汰按访问时间排序，先写回内存中的访问记录
+            self._flush_access_times()
+            self._evict(now)
+            self._conn.commit()
+
+    def invalidate(self, key: str) -> None:
+        if self._conn is None:
+            return
+        with self._lock:
+            self._touched.pop(key, None)
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        if self._conn is None:
+            return
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        if self._conn is None:
+            return 0
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _flush_access_times(self) -> None:
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE entries SET accessed_at = ? WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM entries WHERE stored_at < ?", (now - self._ttl,))
+        count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        if count > self._max_entries:
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY accessed_at ASC LIMIT ?)",
+                (count - self._max_entries,),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._flush_access_times()
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning("HTTP 缓存访问时间写回失败: %s", e)
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,393 @@
+"""
+持久化上传队列（SQLite）
+
+缩略图上传先写入队列再由若干并发 worker 按入队顺序发送：
+- 同时进行的上传数不超过 max_concurrency
+- 可重试的失败（网络错误、超时、408 / 429 / 5xx）按指数退避重试，最多 max_attempts 次
+- 服务器明确拒绝（其余 4xx、文件不存在）不再重试，记为 rejected
+- 队列保存在磁盘上，程序退出或崩溃后，下次启动调用 resume 继续上传；
+  重试次数用尽（exhausted）的任务在 resume 时重新排队，rejected 只在 retry_failed 或
+  同一资产重新入队时才会再次上传
+- 同一资产重新入队时替换旧任务（缩略图重新渲染过）
+- 入队时把文件硬链接（跨文件系统时复制）到队列自己的 spool 目录，调用方随后可以删除原文件；
+  任务从表中移除后删除对应的 spool 目录
+
+表结构：jobs(asset_id, files, seq, attempts, next_attempt_at, state, last_error)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import pathlib
+import shutil
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_QUEUE_SCHEMA_VERSION = 1
+UPLOAD_QUEUE_FILE_NAME = "thumbnail_uploads.sqlite3"
+UPLOAD_SPOOL_DIR_NAME = "thumbnail_uploads"
+
+UPLOAD_QUEUE_CONFIG = {
+    "max_concurrency": 4,
+    "max_attempts": 6,
+    "initial_delay": 1.0,
+    "max_delay": 60.0,
+    "backoff_multiplier": 2,
+}
+
+STATE_PENDING = "pending"
+STATE_EXHAUSTED = "exhausted"
+STATE_REJECTED = "rejected"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    asset_id TEXT PRIMARY KEY,
+    files TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    state TEXT NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_seq ON jobs(state, seq);
+"""
+
+
+class UploadError(Exception):
+    """上传失败；retryable 为 False 时不再重试"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def is_retryable_status(status: int) -> bool:
+    return status in (408, 425, 429) or status >= 500
+
+
+@dataclass
+class UploadJob:
+    asset_id: str
+    files: List[str]
+    seq: int
+    attempts: int
+
+
+@dataclass
+class UploadProgress:
+    """本次运行的上传进度；pending 包含正在上传和等待重试的任务"""
+
+    uploaded: int = 0
+    failed: int = 0
+    pending: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.uploaded + self.failed + self.pending
+
+
+ProgressCallback = Callable[[UploadProgress], None]
+
+
+class UploadQueue:
+    def __init__(
+        self,
+        db_path: pathlib.Path,
+        uploader: Callable[[str, List[str]], Awaitable[None]],
+        max_concurrency: int = UPLOAD_QUEUE_CONFIG["max_concurrency"],
+        max_attempts: int = UPLOAD_QUEUE_CONFIG["max_attempts"],
+        initial_delay: float = UPLOAD_QUEUE_CONFIG["initial_delay"],
+        max_delay: float = UPLOAD_QUEUE_CONFIG["max_delay"],
+        backoff_multiplier: float = UPLOAD_QUEUE_CONFIG["backoff_multiplier"],
+        clock=time.time,
+        spool_dir: Optional[pathlib.Path] = None,
+    ):
+        self._db_path = pathlib.Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        if spool_dir is None:
+            spool_dir = self._db_path.parent / UPLOAD_SPOOL_DIR_NAME
+        self._spool_dir = pathlib.Path(spool_dir)
+        self._uploader = uploader
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._max_attempts = max(1, int(max_attempts))
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._backoff_multiplier = backoff_multiplier
+        self._clock = clock
+        self._conn: Optional[sqlite3.Connection] = self._connect()
+        # 正在上传的任务：asset_id -> seq
+        self._in_flight: Dict[str, int] = {}
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._changed = asyncio.Condition()
+        self._listeners: List[ProgressCallback] = []
+        self._progress = UploadProgress()
+
+    @property
+    def db_path(self) -> pathlib.Path:
+        return self._db_path
+
+    @property
+    def spool_dir(self) -> pathlib.Path:
+        return self._spool_dir
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        try:
+            return self._open()
+        except sqlite3.DatabaseError as e:
+            # 队列文件损坏时重建，未完成的任务会丢失
+            logger.warning("上传队列损坏，已重建: %s (%s)", self._db_path, e)
+            for suffix in ("", "-wal", "-shm"):
+                pathlib.Path(f"{self._db_path}{suffix}").unlink(missing_ok=True)
+            try:
+                return self._open()
+            except sqlite3.Error as e:
+                logger.warning("上传队列不可用: %s", e)
+                return None
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, UPLOAD_QUEUE_SCHEMA_VERSION):
+            conn.execute("DROP TABLE IF EXISTS jobs")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version={UPLOAD_QUEUE_SCHEMA_VERSION}")
+        conn.commit()
+        return conn
+
+    def enqueue(self, asset_id: str, files: List[str]) -> None:
+        """加入队列并开始上传（需要在事件循环中调用）"""
+        if self._conn is None:
+            logger.error("上传队列不可用，丢弃 %s 的缩略图上传", asset_id)
+            return
+        seq = self._conn.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM jobs").fetchone()[0]
+        old = self._conn.execute("SELECT seq FROM jobs WHERE asset_id = ?", (asset_id,)).fetchone()
+        spooled = self._spool(seq, files)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO jobs(asset_id, files, seq, attempts, next_attempt_at, state, last_error) "
+            "VALUES (?, ?, ?, 0, 0, ?, NULL)",
+            (asset_id, json.dumps(spooled, ensure_ascii=False), seq, STATE_PENDING),
+        )
+        self._conn.commit()
+        # 正在上传的旧任务结束后再删除它的文件
+        if old is not None and self._in_flight.get(asset_id) != old[0]:
+            self._discard_spool(old[0])
+        self._progress.pending = self.pending_count()
+        self._start_workers()
+
+    def resume(self) -> int:
+        """程序启动后继续上传磁盘上未完成的任务，重试次数用尽的任务重新排队；返回排队的任务数"""
+        if self._conn is None:
+            return 0
+        self._conn.execute(
+            "UPDATE jobs SET state = ?, attempts = 0, next_attempt_at = 0 WHERE state = ?",
+            (STATE_PENDING, STATE_EXHAUSTED),
+        )
+        self._conn.commit()
+        self._prune_spool()
+        pending = self.pending_count()
+        self._progress.pending = pending
+        if pending:
+            logger.info("继续上传 %d 个未完成的缩略图", pending)
+            self._start_workers()
+        return pending
+
+    def retry_failed(self) -> int:
+        """把所有失败的任务重新排队；返回排队的任务数"""
+        if self._conn is None:
+            return 0
+        count = self._conn.execute(
+            "UPDATE jobs SET state = ?, attempts = 0, next_attempt_at = 0 WHERE state != ?",
+            (STATE_PENDING, STATE_PENDING),
+        ).rowcount
+        self._conn.commit()
+        self._progress.pending = self.pending_count()
+        self._start_workers()
+        return count
+
+    def pending_count(self) -> int:
+        if self._conn is None:
+            return 0
+        return self._conn.execute("SELECT COUNT(*) FROM jobs WHERE state = ?", (STATE_PENDING,)).fetchone()[0]
+
+    def failed_jobs(self) -> List[tuple]:
+        """返回 (asset_id, state, last_error) 列表"""
+        if self._conn is None:
+            return []
+        return self._conn.execute(
+            "SELECT asset_id, state, last_error FROM jobs WHERE state != ? ORDER BY seq", (STATE_PENDING,)
+        ).fetchall()
+
+    def progress(self) -> UploadProgress:
+        return UploadProgress(**vars(self._progress))
+
+    def add_progress_listener(self, callback: ProgressCallback) -> None:
+        self._listeners.append(callback)
+
+    def remove_progress_listener(self, callback: ProgressCallback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    async def join(self, on_progress: Optional[ProgressCallback] = None) -> UploadProgress:
+        """等待队列中所有待上传任务完成（成功或最终失败）"""
+        if on_progress is not None:
+            self.add_progress_listener(on_progress)
+            on_progress(self.progress())
+        try:
+            self._start_workers()
+            async with self._changed:
+                await self._changed.wait_for(lambda: self.pending_count() == 0)
+        finally:
+            if on_progress is not None:
+                self.remove_progress_listener(on_progress)
+        return self.progress()
+
+    async def close(self) -> None:
+        """停止上传；未完成的任务留在磁盘上，下次 resume 时继续"""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _spool(self, seq: int, files: List[str]) -> List[str]:
+        """把文件放入 spool/<seq>/ 下，返回队列保存的路径；缺失的文件跳过"""
+        folder = self._spool_dir / str(seq)
+        # 上次运行删除任务后来不及清理的同名目录
+        shutil.rmtree(folder, ignore_errors=True)
+        folder.mkdir(parents=True, exist_ok=True)
+        spooled = []
+        for file_path in files:
+            target = folder / os.path.basename(file_path)
+            try:
+                try:
+                    os.link(file_path, target)
+                except OSError:
+                    shutil.copyfile(file_path, target)
+            except OSError as e:
+                logger.warning("无法加入上传队列 %s: %s", file_path, e)
+                continue
+            spooled.append(str(target))
+        return spooled
+
+    def _discard_spool(self, seq: int) -> None:
+        shutil.rmtree(self._spool_dir / str(seq), ignore_errors=True)
+
+    def _prune_spool(self) -> None:
+        """删除不再被任何任务引用的 spool 目录（例如上次运行在删除前退出）"""
+        if not self._spool_dir.is_dir():
+            return
+        live = {str(seq) for (seq,) in self._conn.execute("SELECT seq FROM jobs")}
+        live.update(str(seq) for seq in self._in_flight.values())
+        for folder in self._spool_dir.iterdir():
+            if folder.name not in live:
+                shutil.rmtree(folder, ignore_errors=True)
+
+    def _start_workers(self) -> None:
+        self._workers = [w for w in self._workers if not w.done()]
+        if self._conn is None:
+            return
+        wanted = min(self._max_concurrency, self.pending_count())
+        for _ in range(wanted - len(self._workers)):
+            self._workers.append(asyncio.ensure_future(self._worker()))
+        # 新任务可能已经可以上传，唤醒正在等待退避的 worker
+        self._wakeup.set()
+
+    def _claim(self) -> tuple:
+        """取出一个可以上传的任务；没有时返回 (None, 距离最近一个任务可上传的秒数或 None)"""
+        now = self._clock()
+        rows = self._conn.execute(
+            "SELECT asset_id, files, seq, attempts, next_attempt_at FROM jobs WHERE state = ? ORDER BY seq",
+            (STATE_PENDING,),
+        ).fetchall()
+        wait = None
+        for asset_id, files, seq, attempts, next_attempt_at in rows:
+            if asset_id in self._in_flight:
+                continue
+            if next_attempt_at <= now:
+                self._in_flight[asset_id] = seq
+                return UploadJob(asset_id, json.loads(files), seq, attempts), None
+            delay = next_attempt_at - now
+            wait = delay if wait is None else min(wait, delay)
+        return None, wait
+
+    async def _worker(self) -> None:
+        while self._conn is not None:
+            job, wait = self._claim()
+            if job is None:
+                if wait is None:
+                    return
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self._run(job)
+            finally:
+                self._in_flight.pop(job.asset_id, None)
+            if self._conn is not None and not self._conn.execute(
+                "SELECT 1 FROM jobs WHERE asset_id = ? AND seq = ?", (job.asset_id, job.seq)
+            ).fetchone():
+                # 上传成功，或上传期间被重新入队的任务替换
+                self._discard_spool(job.seq)
+            async with self._changed:
+                self._changed.notify_all()
+
+    async def _run(self, job: UploadJob) -> None:
+        try:
+            await self._uploader(job.asset_id, job.files)
+        except asyncio.CancelledError:
+            raise
+        except UploadError as e:
+            self._record_failure(job, str(e), e.retryable)
+        except Exception as e:
+            # 网络错误、超时等
+            self._record_failure(job, f"{type(e).__name__}: {e}", True)
+        else:
+            self._progress.uploaded += 1
+            self._progress.bytes_sent += sum(os.path.getsize(f) for f in job.files if os.path.isfile(f))
+            self._conn.execute("DELETE FROM jobs WHERE asset_id = ? AND seq = ?", (job.asset_id, job.seq))
+            self._conn.commit()
+        self._progress.pending = self.pending_count()
+        self._notify()
+
+    def _record_failure(self, job: UploadJob, error: str, retryable: bool) -> None:
+        attempts = job.attempts + 1
+        if retryable and attempts < self._max_attempts:
+            delay = min(self._max_delay, self._initial_delay * self._backoff_multiplier ** (attempts - 1))
+            logger.warning("缩略图上传失败 %s（第 %d 次），%.1f 秒后重试: %s", job.asset_id, attempts, delay, error)
+            state, next_attempt_at = STATE_PENDING, self._clock() + delay
+            self._progress.retries += 1
+        else:
+            state = STATE_EXHAUSTED if retryable else STATE_REJECTED
+            next_attempt_at = 0
+            logger.error("缩略图上传失败 %s（共 %d 次），不再重试: %s", job.asset_id, attempts, error)
+            self._progress.failed += 1
+        # 上传期间同一资产重新入队时 seq 已变化，不覆盖新任务
+        self._conn.execute(
+            "UPDATE jobs SET attempts = ?, next_attempt_at = ?, state = ?, last_error = ? "
+            "WHERE asset_id = ? AND seq = ?",
+            (attempts, next_attempt_at, state, error, job.asset_id, job.seq),
+        )
+        self._conn.commit()
+
+    def _notify(self) -> None:
+        progress = self.progress()
+        for callback in list(self._listeners):
+            try:
+                callback(progress)
+            except Exception:
+                logger.exception("上传进度回调异常")
@@ -66,7 +66,8 @@ def launch_orcalab_gui(verbose: bool = False):
         if "LD_LIBRARY_PATH" in envs:
             del envs["LD_LIBRARY_PATH"]
 
-        args = [sys.executable, "-m", "orcalab.main"] + sys.argv[1:]
+        # 经由 orcalab.gui 启动，spawn 的子进程不会重新导入 orcalab.main（见 image_process_pool）
+        args = [sys.executable, "-m", "orcalab.gui"] + sys.argv[1:]
 
         if verbose:
             log_file_path = _build_verbose_log_file_path()
@@ -1,9 +1,12 @@
 import json
 import logging
+import os
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import TextIOWrapper
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from orcalab.project_util import (
     get_cache_folder,
@@ -12,18 +15,24 @@ from orcalab.project_util import (
 
 logger = logging.getLogger(__name__)
 
+# 扫描结果索引：按 pak 相对路径记录 size / mtime_ns 与扫描出的场景，未变化的 pak 不再打开
+LEVEL_DISCOVERY_INDEX_FILE_NAME = ".level_discovery_index.json"
+LEVEL_DISCOVERY_INDEX_VERSION = 1
+LEVEL_DISCOVERY_MAX_WORKERS = 4
+
 
 def _read_scene_layouts(pak_path: Path) -> List[Dict[str, str]]:
     try:
         with zipfile.ZipFile(pak_path, "r") as pak:
-            if "scene_layouts.json" not in pak.namelist():
+            names = pak.namelist()
+            if "scene_layouts.json" not in names:
                 return []
 
             with pak.open("scene_layouts.json") as file:
                 text_file = TextIOWrapper(file, encoding="utf-8")
                 data = json.load(text_file)
 
-            pak_file_set = {n.lower() for n in pak.namelist()}
+            pak_file_set = {n.lower() for n in names}
     except zipfile.BadZipFile:
         logger.warning("无效的pak文件: %s", pak_path)
         return []
@@ -86,24 +95,99 @@ def _to_spawnable_path(path: str | None) -> str | None:
     return path
 
 
+def _load_index(index_path: Path) -> Dict[str, Dict]:
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != LEVEL_DISCOVERY_INDEX_VERSION:
+        return {}
+    paks = data.get("paks")
+    return paks if isinstance(paks, dict) else {}
+
+
+def _save_index(index_path: Path, paks: Dict[str, Dict]) -> None:
+    temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        with temp_path.open("w", encoding="utf-8") as fp:
+            data = {"version": LEVEL_DISCOVERY_INDEX_VERSION, "paks": paks}
+            json.dump(data, fp, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, index_path)
+    except OSError as exc:
+        logger.warning("写入场景扫描索引失败 %s: %s", index_path, exc)
+        temp_path.unlink(missing_ok=True)
+
+
+def _is_entry_valid(entry: Optional[Dict], size: int, mtime_ns: int) -> bool:
+    if not isinstance(entry, dict):
+        return False
+    if entry.get("size") != size or entry.get("mtime_ns") != mtime_ns:
+        return False
+    scenes = entry.get("scenes")
+    if not isinstance(scenes, list):
+        return False
+    # 场景布局缓存文件被删除时需要重新解压
+    for scene in scenes:
+        layout_file = scene.get("scene_layout_file") if isinstance(scene, dict) else None
+        if layout_file and not os.path.exists(layout_file):
+            return False
+    return True
+
+
 def discover_levels_from_cache() -> List[Dict[str, str]]:
-    """扫描缓存目录下的pak文件，收集场景信息。增量包的布局优先于全量包。"""
+    """
+    扫描缓存目录下的pak文件，收集场景信息。增量包的布局优先于全量包。
+
+    扫描结果按 pak 的 size / mtime_ns 保存在缓存目录的索引中，未变化的 pak 直接使用索引；
+    新增或变化的 pak 在线程池中并行读取。
+    """
     cache_folder = get_cache_folder()
     if not cache_folder.exists():
         logger.info("缓存目录不存在，跳过场景扫描: %s", cache_folder)
         return []
 
+    _start = time.monotonic()
+    index_path = cache_folder / LEVEL_DISCOVERY_INDEX_FILE_NAME
+    old_index = _load_index(index_path)
+    new_index: Dict[str, Dict] = {}
+    to_scan: List[Path] = []
+
+    pak_paths = sorted(cache_folder.rglob("*.pak"))
+    for pak_path in pak_paths:
+        key = pak_path.relative_to(cache_folder).as_posix()
+        try:
+            stat = pak_path.stat()
+        except OSError:
+            continue
+        entry = old_index.get(key)
+        if _is_entry_valid(entry, stat.st_size, stat.st_mtime_ns):
+            new_index[key] = entry
+        else:
+            new_index[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "scenes": []}
+            to_scan.append(pak_path)
+
+    if to_scan:
+        workers = min(LEVEL_DISCOVERY_MAX_WORKERS, len(to_scan))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orcalab-level-scan") as executor:
+            for pak_path, scenes in zip(to_scan, executor.map(_read_scene_layouts, to_scan)):
+                new_index[pak_path.relative_to(cache_folder).as_posix()]["scenes"] = scenes
+
+    if to_scan or new_index.keys() != old_index.keys():
+        _save_index(index_path, new_index)
+
     discovered_levels: List[Dict[str, str]] = []
     seen_paths: Dict[str, int] = {}
 
-    for pak_path in sorted(cache_folder.rglob("*.pak")):
-        scenes = _read_scene_layouts(pak_path)
+    for pak_path in pak_paths:
+        entry = new_index.get(pak_path.relative_to(cache_folder).as_posix())
+        scenes = entry["scenes"] if entry else []
         if not scenes:
             continue
 
         is_patch = "_patch_" in pak_path.stem
 
         for scene in scenes:
+            scene = dict(scene)
             path = scene["path"]
             if path in seen_paths:
                 idx = seen_paths[path]
@@ -113,5 +197,8 @@ def discover_levels_from_cache() -> List[Dict[str, str]]:
             seen_paths[path] = len(discovered_levels)
             discovered_levels.append(scene)
 
+    logger.info(
+        "场景扫描完成: %d 个pak, 重新读取 %d 个, 耗时 %.3f 秒",
+        len(pak_paths), len(to_scan), time.monotonic() - _start,
+    )
     return discovered_levels
-
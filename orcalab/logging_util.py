@@ -1,15 +1,160 @@
+import atexit
+import gzip
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 from orcalab.project_util import get_user_log_folder
 
 _logger: Optional[logging.Logger] = None
 _log_file_path: Optional[str] = None
+_listener: Optional[logging.handlers.QueueListener] = None
 
 DEFAULT_FILE_LEVEL = logging.INFO
 DEFAULT_CONSOLE_LEVEL = logging.WARNING
 
+LOG_MAX_BYTES = 50 * 1024 * 1024
+LOG_ROTATE_INTERVAL_SECONDS = 24 * 3600
+LOG_BACKUP_COUNT = 5
+
+
+@dataclass
+class LogRateLimit:
+    """Per-logger budget: keep 1 of every ``sample`` records, then at most
+    ``per_second`` records per second with bursts of up to ``burst``.
+    WARNING and above always pass."""
+
+    per_second: float
+    burst: int
+    sample: int = 1
+
+
+DEFAULT_RATE_LIMITS: Dict[str, LogRateLimit] = {
+    # [GRPC TRAFFIC] tracing in the edit service wrapper
+    "orcalab.protos.edit_service_wrapper": LogRateLimit(per_second=20, burst=100),
+    # Child process output mirrored from the simulation terminal
+    "orcalab.simulation.simulation_service.terminal": LogRateLimit(per_second=50, burst=200),
+}
+
+
+class _RateLimitState:
+    __slots__ = ("limit", "tokens", "updated", "seen", "suppressed", "lock")
+
+    def __init__(self, limit: LogRateLimit):
+        self.limit = limit
+        self.tokens = float(limit.burst)
+        self.updated = time.monotonic()
+        self.seen = 0
+        self.suppressed = 0
+        self.lock = threading.Lock()
+
+
+class RateLimitFilter(logging.Filter):
+    """Sample and rate-limit records from noisy loggers before they are queued.
+
+    Rules match a logger and its children. When records have been dropped, the
+    next record that passes carries a note with the number suppressed."""
+
+    def __init__(self, limits: Optional[Dict[str, LogRateLimit]] = None):
+        super().__init__()
+        self._limits = dict(limits or {})
+        self._states: Dict[str, Optional[_RateLimitState]] = {}
+        self._rule_states: Dict[str, _RateLimitState] = {}
+        self.suppressed_total = 0
+
+    def _state_for(self, name: str) -> Optional[_RateLimitState]:
+        try:
+            return self._states[name]
+        except KeyError:
+            pass
+        rule = name
+        while rule and rule not in self._limits:
+            rule = rule.rpartition(".")[0]
+        state = None
+        if rule:
+            state = self._rule_states.get(rule)
+            if state is None:
+                state = self._rule_states.setdefault(rule, _RateLimitState(self._limits[rule]))
+        self._states[name] = state
+        return state
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        state = self._state_for(record.name)
+        if state is None:
+            return True
+        limit = state.limit
+        with state.lock:
+            state.seen += 1
+            keep = limit.sample <= 1 or state.seen % limit.sample == 1
+            if keep:
+                now = time.monotonic()
+                state.tokens = min(float(limit.burst), state.tokens + (now - state.updated) * limit.per_second)
+                state.updated = now
+                keep = state.tokens >= 1.0
+                if keep:
+                    state.tokens -= 1.0
+            if not keep:
+                state.suppressed += 1
+                self.suppressed_total += 1
+                return False
+            suppressed, state.suppressed = state.suppressed, 0
+        if suppressed and isinstance(record.msg, str):
+            record.msg = f"{record.msg} [{suppressed} similar records suppressed]"
+        return True
+
+
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    """Merge the message arguments on the calling thread and leave everything
+    else (timestamps, tracebacks, formatting) to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+class SizeAndTimeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Roll over when the file exceeds ``maxBytes`` or is older than
+    ``interval`` seconds. Rotated segments are gzip-compressed as
+    ``<name>.1.gz`` ... ``<name>.<backupCount>.gz``."""
+
+    def __init__(self, filename: str, maxBytes: int, interval: float, backupCount: int, encoding: str = "utf-8"):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding, delay=True)
+        self.interval = interval
+        self.rollover_at = time.time() + interval if interval > 0 else float("inf")
+        self.namer = _gzip_namer
+        self.rotator = _gzip_rotator
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if time.time() >= self.rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        if self.interval > 0:
+            self.rollover_at = time.time() + self.interval
+
 
 def _ensure_log_directory() -> str:
     log_dir = get_user_log_folder()
@@ -17,8 +162,11 @@ def _ensure_log_directory() -> str:
     return str(log_dir)
 
 
-def _build_log_file_path() -> str:
-    log_dir = _ensure_log_directory()
+def _build_log_file_path(log_dir: Optional[str] = None) -> str:
+    if log_dir is None:
+        log_dir = _ensure_log_directory()
+    else:
+        os.makedirs(log_dir, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     return f"{log_dir}/orcalab_{timestamp}.log"
 
@@ -41,9 +189,17 @@ def resolve_log_level(level: Optional[Union[str, int]]) -> Optional[int]:
 def setup_logging(
     file_level: Optional[int] = None,
     console_level: Optional[int] = None,
+    log_dir: Optional[str] = None,
+    max_bytes: int = LOG_MAX_BYTES,
+    rotate_interval: float = LOG_ROTATE_INTERVAL_SECONDS,
+    backup_count: int = LOG_BACKUP_COUNT,
+    rate_limits: Optional[Dict[str, LogRateLimit]] = None,
 ) -> logging.Logger:
-    """Initialize or update OrcaLab logging configuration."""
-    global _logger, _log_file_path
+    """Initialize or update OrcaLab logging configuration.
+
+    Callers only enqueue records; a listener thread writes them to the rotating
+    log file and the console. Call ``shutdown_logging`` before exiting to flush."""
+    global _logger, _log_file_path, _listener
 
     resolved_file_level = file_level if file_level is not None else DEFAULT_FILE_LEVEL
     resolved_console_level = (
@@ -59,23 +215,35 @@ def setup_logging(
 
     logger.setLevel(min(resolved_file_level, resolved_console_level))
 
+    shutdown_logging()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+        handler.close()
 
-    log_file_path = _build_log_file_path()
+    log_file_path = _build_log_file_path(log_dir)
     _log_file_path = log_file_path
 
     formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s - %(message)s")
 
-    file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
+    file_handler = SizeAndTimeRotatingFileHandler(
+        log_file_path, maxBytes=max_bytes, interval=rotate_interval, backupCount=backup_count
+    )
     file_handler.setLevel(resolved_file_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(resolved_console_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _LogQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits))
+    logger.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     logger.info(
         "Logging initialized. File level=%s, console level=%s, log file=%s",
@@ -87,6 +255,20 @@ def setup_logging(
     return logger
 
 
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger() -> logging.Logger:
     """Get the shared OrcaLab logger instance."""
     if _logger is None:
@@ -98,3 +280,9 @@ def get_log_file_path() -> Optional[str]:
     """Return the log file path if logging has been initialized."""
     return _log_file_path
 
+
+def get_log_file_handler() -> Optional[logging.Handler]:
+    """Return the file handler run by the listener thread, if logging is active."""
+    if _listener is None:
+        return None
+    return next((h for h in _listener.handlers if isinstance(h, SizeAndTimeRotatingFileHandler)), None)
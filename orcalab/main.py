@@ -18,19 +18,17 @@ sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="repla
 
 from orcalab.cli_options import create_argparser, resolve_and_validate_workspace
 from orcalab.config_service import ConfigService
-from orcalab.project_util import check_project_folder, copy_packages, sync_pak_urls
+from orcalab.project_util import PakIntegrityError, check_project_folder, copy_packages, sync_pak_urls
 from orcalab.asset_sync_ui import run_asset_sync_ui
-from orcalab.ui.main_window import MainWindow
-from orcalab.logging_util import setup_logging, resolve_log_level
+from orcalab.logging_util import setup_logging, resolve_log_level, shutdown_logging
 from orcalab.default_layout import prepare_default_layout
 from orcalab.process_guard import ensure_single_instance_by_file_lock
-from orcalab.ui.main_window_full_screen import MainWindowFullScreen
 from orcalab.report.abnormal_exit_report import schedule_abnormal_exit_report
+from orcalab.startup_orchestrator import STARTUP_TIMELINE_FILE_NAME, StartupOrchestrator, StartupTimeline
 import os
 
 # import PySide6.QtAsyncio as QtAsyncio
 from PySide6 import QtWidgets
-import orcalab.assets.rc_assets
 
 from qasync import QEventLoop
 from orcalab.python_project_installer import ensure_python_project_installed
@@ -73,6 +71,7 @@ def signal_handler(signum, frame):
         ConfigService().clear_mcp_status()
     except Exception:
         pass
+    shutdown_logging()
     os._exit(0)
 
 
@@ -84,9 +83,15 @@ def register_signal_handlers():
         signal.signal(signal.SIGHUP, signal_handler)  # Hangup signal
 
 
-async def main_async(q_app, fullscreen: bool):
+async def main_async(q_app, fullscreen: bool, background_sync: bool = False,
+                     startup_timeline: StartupTimeline | None = None,
+                     startup_timeline_path: pathlib.Path | None = None):
     global _main_window
 
+    # 主窗口依赖链（各面板、MCP、渲染相关模块）较重，放到启动对话框之后再导入
+    from orcalab.ui.main_window import MainWindow
+    from orcalab.ui.main_window_full_screen import MainWindowFullScreen
+
     app_close_event = asyncio.Event()
     q_app.aboutToQuit.connect(app_close_event.set)
     if fullscreen:
@@ -94,7 +99,16 @@ async def main_async(q_app, fullscreen: bool):
     else:
         main_window = MainWindow()
     _main_window = main_window  # Store reference for signal handlers
-    await main_window.init()
+    if startup_timeline is not None:
+        with startup_timeline.measure("main_window_init", depends_on=["scene_select"]):
+            await main_window.init()
+        logger.info("%s", startup_timeline.format_report())
+        if startup_timeline_path is not None:
+            startup_timeline.write(startup_timeline_path)
+    else:
+        await main_window.init()
+    if background_sync:
+        main_window.start_background_asset_sync()
     await app_close_event.wait()
 
     # Clean up resources before exiting
@@ -107,40 +121,121 @@ async def main_async(q_app, fullscreen: bool):
 _ADMIN_ONLY_LEVELS = {"previewthumbnail_orcalab"}
 
 
+def check_is_admin(config_service: ConfigService) -> bool:
+    from orcalab.token_storage import TokenStorage
+    import requests as _requests
+
+    token = TokenStorage.load_token()
+    if not token:
+        return False
+    base_url = config_service.datalink_base_url()
+    headers = {
+        "Authorization": f"Bearer {token['access_token']}",
+        "username": token["username"],
+        "Content-Type": "application/json",
+    }
+    try:
+        _start = time.monotonic()
+        resp = _requests.get(f"{base_url}/is_admin/", headers=headers, timeout=10)
+        elapsed = time.monotonic() - _start
+        logger.debug("HTTP GET %s/is_admin/ 耗时: %.3f 秒 (状态码: %s)", base_url, elapsed, resp.status_code)
+        if resp.status_code != 200:
+            return False
+        return resp.json().get("isAdmin", False)
+    except Exception:
+        return False
+
+
+def _confirm_gpu_drivers(gpu_check_result) -> None:
+    """GPU 驱动缺失或异常时弹窗提示用户，用户选择退出则直接结束进程"""
+    from orcalab.gpu_driver_check import show_gpu_driver_warning
+
+    if not gpu_check_result.has_working_driver:
+        logger.warning(
+            "GPU 驱动异常: has_gpu=%s, has_driver=%s, devices=%s",
+            gpu_check_result.has_gpu_hardware,
+            gpu_check_result.has_working_driver,
+            [(d.vendor.value, d.name, d.driver_status.value) for d in gpu_check_result.devices],
+        )
+        if not show_gpu_driver_warning(gpu_check_result):
+            logger.info("用户因 GPU 驱动问题选择退出")
+            shutdown_logging()
+            os._exit(0)
+    else:
+        logger.info(
+            "GPU 驱动检测通过: %s",
+            [(d.vendor.value, d.name, d.driver_version) for d in gpu_check_result.devices_with_driver_ok()],
+        )
+
+
+def _install_python_project(config_service: ConfigService) -> None:
+    # Ensure the external Python project (orcalab-pyside) is present and installed
+    try:
+        ensure_python_project_installed(config_service)
+    except Exception as e:
+        logger.exception("安装 orcalab-pyside 失败: %s", e)
+        # Continue startup but warn; some features may not work without it
+
+
+def _prepare_packages(config_service: ConfigService) -> None:
+    logger.info("正在准备资产包...")
+    _pak_start = time.monotonic()
+    # 上次后台同步时引擎占用的 pak，在本次挂载之前替换或删除
+    from orcalab.asset_sync_service import apply_pending_pak_changes
+    from orcalab.project_util import get_cache_folder, get_downloaded_packages_folder
+
+    apply_pending_pak_changes(get_cache_folder(), get_downloaded_packages_folder())
+    if config_service.connect_builder_hub():
+        logger.info("Builder 模式，跳过 pak 包处理")
+    else:
+        if config_service.init_paks():
+            paks = config_service.paks()
+            if paks:
+                # 如果paks有内容，则复制本地文件
+                logger.info("使用本地pak文件...")
+                copy_packages(paks)
+
+        # 处理pak_urls（独立于paks和订阅列表，下载到orcalab子目录）
+        pak_urls = config_service.pak_urls()
+        pak_urls_sha256 = config_service.pak_urls_sha256()
+        if pak_urls:
+            logger.info("正在同步pak_urls列表...")
+            sync_pak_urls(pak_urls, pak_urls_sha256)
+    logger.info("pak包处理完成, 耗时: %.2f 秒", time.monotonic() - _pak_start)
+
+
+def _sync_assets_on_startup(config_service: ConfigService, args) -> bool:
+    """同步订阅的资产包（带UI）；返回 True 表示改为在主窗口打开后后台同步"""
+    _sync_start = time.monotonic()
+    background_sync = False
+    if config_service.connect_builder_hub():
+        logger.info("Builder 模式，跳过资产同步")
+    else:
+        from orcalab.background_asset_sync import can_sync_in_background
+
+        wants_background_sync = getattr(args, "background_sync", False) or config_service.datalink_background_sync()
+        if wants_background_sync and not args.full_screen and can_sync_in_background(config_service):
+            background_sync = True
+            logger.info("后台同步模式：使用本地资产包启动，订阅资产将在主窗口打开后同步")
+        else:
+            run_asset_sync_ui(config_service)
+    logger.info("资产同步完成, 耗时: %.2f 秒", time.monotonic() - _sync_start)
+    return background_sync
+
+
 def select_scene_and_layout(
     config_service: ConfigService,
     levels: List[dict],
     level: str,
     level_cli: str | None,
     layout_cli: str | None,
+    is_admin: bool | None = None,
 ):
     layout_mode = "unset"
 
-    from orcalab.token_storage import TokenStorage
-    import requests as _requests
-
-    def _check_is_admin() -> bool:
-        token = TokenStorage.load_token()
-        if not token:
-            return False
-        base_url = config_service.datalink_base_url()
-        headers = {
-            "Authorization": f"Bearer {token['access_token']}",
-            "username": token["username"],
-            "Content-Type": "application/json",
-        }
-        try:
-            _start = time.monotonic()
-            resp = _requests.get(f"{base_url}/is_admin/", headers=headers, timeout=10)
-            elapsed = time.monotonic() - _start
-            logger.debug("HTTP GET %s/is_admin/ 耗时: %.3f 秒 (状态码: %s)", base_url, elapsed, resp.status_code)
-            if resp.status_code != 200:
-                return False
-            return resp.json().get("isAdmin", False)
-        except Exception:
-            return False
-
-    if not _check_is_admin():
+    if is_admin is None:
+        is_admin = check_is_admin(config_service)
+    if not is_admin:
         levels = [l for l in levels if l.get("name") not in _ADMIN_ONLY_LEVELS
                   and l.get("path") not in _ADMIN_ONLY_LEVELS]
 
@@ -255,6 +350,7 @@ def main():
     _ensure_xcb_platform()
 
     _main_start = time.monotonic()
+    startup_timeline = StartupTimeline()
     parser = create_argparser()
     args, unknown = parser.parse_known_args()
 
@@ -316,85 +412,66 @@ def main():
     q_app = QtWidgets.QApplication(sys.argv)
     q_app.setWindowIcon(app_window_icon())
 
-    # 检测 GPU 驱动状态，驱动缺失或异常时弹窗提示用户
-    from orcalab.gpu_driver_check import check_gpu_drivers, show_gpu_driver_warning
+    # 启动阶段按依赖关系编排：互不依赖的阻塞阶段在线程池中并发执行，弹窗阶段在主线程执行
+    from orcalab.gpu_driver_check import check_gpu_drivers
+    from orcalab.level_discovery import discover_levels_from_cache
 
-    _gpu_check_result = check_gpu_drivers()
-    if not _gpu_check_result.has_working_driver:
-        logger.warning(
-            "GPU 驱动异常: has_gpu=%s, has_driver=%s, devices=%s",
-            _gpu_check_result.has_gpu_hardware,
-            _gpu_check_result.has_working_driver,
-            [(d.vendor.value, d.name, d.driver_status.value) for d in _gpu_check_result.devices],
-        )
-        _should_continue = show_gpu_driver_warning(_gpu_check_result)
-        if not _should_continue:
-            logger.info("用户因 GPU 驱动问题选择退出")
-            os._exit(0)
-    else:
-        logger.info(
-            "GPU 驱动检测通过: %s",
-            [(d.vendor.value, d.name, d.driver_version) for d in _gpu_check_result.devices_with_driver_ok()],
+    orchestrator = StartupOrchestrator(startup_timeline)
+    results = orchestrator.results
+
+    def select_scene():
+        discovered_levels = results["level_discovery"]
+        if discovered_levels:
+            config_service.merge_levels(discovered_levels)
+
+        select_scene_and_layout(
+            config_service=config_service,
+            levels=config_service.levels(),
+            level=config_service.level(),
+            level_cli=getattr(args, "scene", None),
+            layout_cli=getattr(args, "layout", None),
+            is_admin=results["admin_check"],
         )
 
-    # 确保不会同时运行多个 OrcaLab 实例
-    ensure_single_instance_by_file_lock(config_service)
-
-    # Ensure the external Python project (orcalab-pyside) is present and installed
+    orchestrator.add("single_instance", lambda: ensure_single_instance_by_file_lock(config_service), main_thread=True)
+    orchestrator.add("gpu_probe", check_gpu_drivers)
+    orchestrator.add(
+        "gpu_check",
+        lambda: _confirm_gpu_drivers(results["gpu_probe"]),
+        depends_on=["gpu_probe"],
+        main_thread=True,
+    )
+    orchestrator.add(
+        "python_project",
+        lambda: _install_python_project(config_service),
+        depends_on=["single_instance"],
+        main_thread=True,
+    )
+    # 安装 python 项目时也会下载 pak_urls 到同一缓存文件，两者不能并发写
+    orchestrator.add("pak_processing", lambda: _prepare_packages(config_service), depends_on=["python_project"])
+    orchestrator.add(
+        "asset_sync",
+        lambda: _sync_assets_on_startup(config_service, args),
+        depends_on=["pak_processing", "gpu_check"],
+        main_thread=True,
+    )
+    orchestrator.add("level_discovery", discover_levels_from_cache, depends_on=["asset_sync"])
+    # 令牌可能在资产同步时重新登录后更新，因此在同步之后查询
+    orchestrator.add("admin_check", lambda: check_is_admin(config_service), depends_on=["asset_sync"])
+    orchestrator.add(
+        "scene_select",
+        select_scene,
+        depends_on=["level_discovery", "admin_check", "python_project"],
+        main_thread=True,
+    )
     try:
-        ensure_python_project_installed(config_service)
-    except Exception as e:
-        logger.exception("安装 orcalab-pyside 失败: %s", e)
-        # Continue startup but warn; some features may not work without it
-
-    # 处理pak包
-    logger.info("正在准备资产包...")
-    _pak_start = time.monotonic()
-    if config_service.connect_builder_hub():
-        logger.info("Builder 模式，跳过 pak 包处理")
-    else:
-        if config_service.init_paks():
-            paks = config_service.paks()
-            if paks:
-                # 如果paks有内容，则复制本地文件
-                logger.info("使用本地pak文件...")
-                copy_packages(paks)
-
-        # 处理pak_urls（独立于paks和订阅列表，下载到orcalab子目录）
-        pak_urls = config_service.pak_urls()
-        pak_urls_sha256 = config_service.pak_urls_sha256()
-        if pak_urls:
-            logger.info("正在同步pak_urls列表...")
-            sync_pak_urls(pak_urls, pak_urls_sha256)
-    logger.info("pak包处理完成, 耗时: %.2f 秒", time.monotonic() - _pak_start)
-
-    # 同步订阅的资产包（带UI）
-    _sync_start = time.monotonic()
-    if config_service.connect_builder_hub():
-        logger.info("Builder 模式，跳过资产同步")
-    else:
-        run_asset_sync_ui(config_service)
-    logger.info("资产同步完成, 耗时: %.2f 秒", time.monotonic() - _sync_start)
+        orchestrator.run()
+    except PakIntegrityError as e:
+        QtWidgets.QMessageBox.information(None, "pak 下载不完整, 请重新启动 orcalab", e.message)
+        sys.exit(1)
+    background_sync = results["asset_sync"]
+    startup_timeline_path = get_user_log_folder() / STARTUP_TIMELINE_FILE_NAME
 
-    from orcalab.level_discovery import discover_levels_from_cache
-
-    discovered_levels = discover_levels_from_cache()
-    if discovered_levels:
-        config_service.merge_levels(discovered_levels)
-
-    levels = config_service.levels()
-    current = config_service.level()
-
-    level_cli = getattr(args, "scene", None)
-    layout_cli = getattr(args, "layout", None)
-
-    select_scene_and_layout(
-        config_service=config_service,
-        levels=levels,
-        level=current,
-        level_cli=level_cli,
-        layout_cli=layout_cli,
-    )
     logger.info("场景选择完成, 总耗时: %.2f 秒", time.monotonic() - _main_start)
 
     event_loop = QEventLoop(q_app)
@@ -403,7 +480,9 @@ def main():
     try:
         fullscreen = args.full_screen
         
-        event_loop.run_until_complete(main_async(q_app, fullscreen))
+        event_loop.run_until_complete(
+            main_async(q_app, fullscreen, background_sync, startup_timeline, startup_timeline_path)
+        )
     except KeyboardInterrupt:
         logger.info("Received KeyboardInterrupt, cleaning up...")
     except Exception as e:
@@ -417,6 +496,9 @@ def main():
     except Exception:
         pass
 
+    # os._exit 不会执行 atexit，先写完日志队列中的记录
+    shutdown_logging()
+
     # 直接终止进程，跳过 Python atexit 和 C++ 静态析构。
     # 引擎资源已在 main_async → cleanup 中清理完毕，
     # 此处若走 exit(0) 会触发 .so 卸载时的静态析构器访问已销毁子系统导致 SIGSEGV。
@@ -8,8 +8,6 @@ import pathlib
 import sys
 from typing import Any
 
-from fastmcp import Client
-
 from orcalab.config_service import ConfigService
 
 
@@ -146,6 +144,9 @@ def _tools_list_as_json_list(tools: list) -> list[dict[str, str]]:
 
 
 async def _async_main(url: str, tool: str, json_arg: str | None) -> int:
+    # fastmcp 依赖链很长，只在真正连接 MCP 服务时导入（--help / wait_for_mcp_ready 无需加载）
+    from fastmcp import Client
+
     if tool == "list":
         client = Client(url)
         async with client:
@@ -32,6 +32,7 @@ from orcalab.copilot.service import CopilotService
 from orcalab.scene_layout.scene_layout_helper import SceneLayoutHelper
 from orcalab.entity_path import EntityPath, NameWithIndex
 from orcalab.actor_property import ActorEntities, ActorPropertyKey
+from orcalab.sampling_profiler import get_sampling_profiler
 
 class OrcaLabMCPServer:
     def __init__(self, port):
@@ -175,8 +176,8 @@ class OrcaLabMCPServer:
                     ensure_ascii=False,
                 )
 
-            meta_out: list[str] = []
-            await self.http_service_bus.get_all_metadata(meta_out)
+            meta_out: list[list] = []
+            await self.http_service_bus.fetch_all_metadata(meta_out)
             if not meta_out:
                 return json.dumps(
                     {
@@ -186,7 +187,7 @@ class OrcaLabMCPServer:
                     ensure_ascii=False,
                 )
 
-            metadata_list = json.loads(meta_out[0])
+            metadata_list = meta_out[0]
             if not isinstance(metadata_list, list):
                 return json.dumps(
                     {"success": False, "message": "元数据格式异常：非列表"},
@@ -265,8 +266,8 @@ class OrcaLabMCPServer:
                     ensure_ascii=False,
                 )
 
-            meta_out: list[str] = []
-            await self.http_service_bus.get_all_metadata(meta_out)
+            meta_out: list[list] = []
+            await self.http_service_bus.fetch_all_metadata(meta_out)
             if not meta_out:
                 return json.dumps(
                     {
@@ -276,7 +277,7 @@ class OrcaLabMCPServer:
                     ensure_ascii=False,
                 )
 
-            metadata_list = json.loads(meta_out[0])
+            metadata_list = meta_out[0]
             if not isinstance(metadata_list, list):
                 return json.dumps(
                     {"success": False, "message": "元数据格式异常：非列表"},
@@ -355,8 +356,8 @@ class OrcaLabMCPServer:
                     ensure_ascii=False,
                 )
 
-            meta_out: list[str] = []
-            await self.http_service_bus.get_all_metadata(meta_out)
+            meta_out: list[list] = []
+            await self.http_service_bus.fetch_all_metadata(meta_out)
             if not meta_out:
                 return json.dumps(
                     {
@@ -366,7 +367,7 @@ class OrcaLabMCPServer:
                     ensure_ascii=False,
                 )
 
-            metadata_list = json.loads(meta_out[0])
+            metadata_list = meta_out[0]
             if not isinstance(metadata_list, list):
                 return json.dumps(
                     {"success": False, "message": "元数据格式异常：非列表"},
@@ -2464,6 +2465,46 @@ class OrcaLabMCPServer:
         except Exception as e:
             return json.dumps({"error": str(e)}, ensure_ascii=False)
 
+    def start_profiler(self, sample_rate_hz: int = 0) -> str:
+        '''
+        启动进程内统计采样分析器，采样所有 Python 线程的调用栈
+        Args:
+            sample_rate_hz: 采样频率（Hz），传 0 使用配置中的默认值
+        Returns:
+            操作结果的json字符串格式，包含 success 和当前采样状态
+        '''
+        profiler = get_sampling_profiler()
+        rate = sample_rate_hz or self.config_service.profiler_sample_rate_hz()
+        if not profiler.start(rate):
+            return json.dumps(
+                {"success": False, "message": "采样分析器已在运行", "status": profiler.status()},
+                ensure_ascii=False,
+            )
+        return json.dumps({"success": True, "status": profiler.status()}, ensure_ascii=False)
+
+    def stop_profiler(self, top: int = 20) -> str:
+        '''
+        停止采样分析器并保存 collapsed-stack（火焰图）文件
+        Args:
+            top: 返回的自身耗时最高的函数数量
+        Returns:
+            采样结果的json字符串格式，包含采样次数、耗时、输出文件路径和热点函数列表
+        '''
+        result = get_sampling_profiler().stop()
+        if result is None:
+            return json.dumps({"success": False, "message": "采样分析器未运行"}, ensure_ascii=False)
+        return json.dumps({"success": True, **result.to_dict(top)}, ensure_ascii=False)
+
+    def get_profiler_status(self) -> str:
+        '''
+        获取采样分析器状态
+        Args:
+            无需传递参数
+        Returns:
+            采样状态的json字符串格式，包含 running、sample_rate_hz、sample_count、elapsed
+        '''
+        return json.dumps(get_sampling_profiler().status(), ensure_ascii=False)
+
     def add_tools(self):
         # 资产元数据类
         self.mcp.tool(self.get_asset_map)
@@ -2536,6 +2577,11 @@ class OrcaLabMCPServer:
         # 系统信息类
         self.mcp.tool(self.get_engine_info)
 
+        # 调试类
+        self.mcp.tool(self.start_profiler)
+        self.mcp.tool(self.stop_profiler)
+        self.mcp.tool(self.get_profiler_status)
+
         # 布局类
         self.mcp.tool(self.save_layout)
         self.mcp.tool(self.load_layout)
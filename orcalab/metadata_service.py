@@ -1,8 +1,8 @@
-import json
 from orcalab.metadata_service_bus import MetadataServiceRequest, MetadataServiceRequestBus
 from typing import List
 from typing_extensions import override
 from orcalab.metadata_service_bus import AssetMetadata, AssetMap
+from orcalab.metadata_store import METADATA_STORE_FILE_NAME, LazyAssetMap, MetadataStore
 from orcalab.project_util import get_cache_folder
 
 class MetadataService(MetadataServiceRequest):
@@ -10,37 +10,27 @@ class MetadataService(MetadataServiceRequest):
     def __init__(self):
         super().__init__()
         MetadataServiceRequestBus.connect(self)
-        self._metadata: AssetMap = {}
-        self._asset_map: AssetMap = {}
         cache_folder = get_cache_folder()
         self._metadata_path = cache_folder / "metadata.json"
+        self._store = MetadataStore(cache_folder / METADATA_STORE_FILE_NAME)
+        self._asset_map = LazyAssetMap(self._store)
         self.reload_metadata()
 
     def destroy(self):
         MetadataServiceRequestBus.disconnect(self)
-        self._save_metadata()
+        self._store.close()
 
     @override
     def reload_metadata(self) -> None:
-
-        if not self._metadata_path.exists():
-            return
-        raw = self._metadata_path.read_bytes()
-        for enc in ('utf-8-sig', 'utf-8', 'gbk', 'latin-1'):
-            try:
-                self._metadata = json.loads(raw.decode(enc))
-                break
-            except (UnicodeDecodeError, json.JSONDecodeError):
-                continue
-        else:
-            self._metadata = {}
-        self._build_asset_map()
+        # metadata.json 未变化时不解析；变化时只增量更新有变化的包
+        self._store.sync_from_json(self._metadata_path)
 
     @override
     def get_asset_info(self, asset_path: str, output: list[AssetMetadata] = None) -> AssetMetadata:
+        asset_info = self._store.get_asset(asset_path)
         if output is not None:
-            output.append(self._asset_map.get(asset_path, None))
-        return self._asset_map.get(asset_path, None)
+            output.append(asset_info)
+        return asset_info
 
     @override
     def get_asset_map(self, output: List[AssetMap] = None) -> AssetMap:
@@ -50,34 +40,4 @@ class MetadataService(MetadataServiceRequest):
 
     @override
     def update_asset_info(self, asset_path: str, asset_info: AssetMetadata) -> None:
-        self._asset_map[asset_path] = asset_info
-
-    def _build_asset_map(self) -> AssetMap:
-        for pak_metadata in self._metadata.values():
-            children = pak_metadata.get('children') if isinstance(pak_metadata, dict) else None
-            if not children:
-                continue
-            for asset_metadata in children:
-                asset_path = asset_metadata.get('assetPath', '')
-                if not asset_path:
-                    continue
-                asset_path = asset_path.removesuffix('.spawnable').lower()
-                self._asset_map[asset_path] = asset_metadata
-
-    def _save_metadata(self) -> None:
-        new_metadata = {}
-        for pak_id, pak_metadata in self._metadata.items():
-            new_metadata[pak_id] = {}
-            new_metadata[pak_id] = pak_metadata
-            new_metadata[pak_id]['children'] = []
-
-        for asset_path, asset_info in self._asset_map.items():
-            pkg_id = asset_info.get('parentPackageId', '') if isinstance(asset_info, dict) else ''
-            if pkg_id in new_metadata.keys():
-                new_metadata[pkg_id]['children'].append(asset_info)
-            else:
-                new_metadata[pkg_id] = {}
-                new_metadata[pkg_id]['children'] = [asset_info]
-        self._metadata = new_metadata
-        with open(self._metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(self._metadata, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+        self._store.upsert_asset(asset_path, asset_info)
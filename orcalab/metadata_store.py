@@ -0,0 +1,348 @@
+"""
+资产元数据索引存储（SQLite）
+
+metadata.json 仍是资产同步的输出，但运行时不再整体解析：
+- 启动时只比较 metadata.json 的 size / mtime_ns，未变化则不读取
+- 变化时按包计算内容摘要，只在事务中重写内容变化的包
+- 资产记录按需从库中读取并缓存，路径（小写、去掉 .spawnable）、分类、所属包均有索引
+
+表结构：
+- packages(id, digest, data)            包元数据（不含 children）
+- assets(path, id, package_id, category, name, data)
+- pictures(asset_path, position, data)  资产图片信息，读取资产时拼回 pictures 字段
+- store_meta(key, value)                schema 版本与 metadata.json 指纹
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METADATA_STORE_SCHEMA_VERSION = 1
+METADATA_STORE_FILE_NAME = "metadata.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS packages (
+    id TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS assets (
+    path TEXT PRIMARY KEY,
+    id TEXT,
+    package_id TEXT NOT NULL,
+    category TEXT,
+    name TEXT,
+    has_pictures INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_assets_package ON assets(package_id);
+CREATE INDEX IF NOT EXISTS idx_assets_category ON assets(category);
+CREATE TABLE IF NOT EXISTS pictures (
+    asset_path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (asset_path, position)
+);
+"""
+
+
+def normalize_asset_path(asset_path: str) -> str:
+    return asset_path.removesuffix('.spawnable').lower()
+
+
+def _category_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "/".join(str(x) for x in value)
+    return str(value)
+
+
+def _decode_metadata_json(raw: bytes) -> Dict:
+    for enc in ('utf-8-sig', 'utf-8', 'gbk', 'latin-1'):
+        try:
+            data = json.loads(raw.decode(enc))
+            return data if isinstance(data, dict) else {}
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            continue
+    return {}
+
+
+class MetadataStore:
+    def __init__(self, db_path: pathlib.Path):
+        self._db_path = pathlib.Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._records: Dict[str, Optional[Dict]] = {}
+        self._conn = self._connect()
+
+    @property
+    def db_path(self) -> pathlib.Path:
+        return self._db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            conn = self._open()
+        except sqlite3.DatabaseError as e:
+            # 库文件损坏时重建，数据可从 metadata.json 重新导入
+            logger.warning("元数据索引损坏，已重建: %s (%s)", self._db_path, e)
+            for suffix in ("", "-wal", "-shm"):
+                pathlib.Path(f"{self._db_path}{suffix}").unlink(missing_ok=True)
+            conn = self._open()
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, METADATA_STORE_SCHEMA_VERSION):
+            conn.executescript(
+                "DROP TABLE IF EXISTS store_meta; DROP TABLE IF EXISTS packages;"
+                "DROP TABLE IF EXISTS assets; DROP TABLE IF EXISTS pictures;"
+            )
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version={METADATA_STORE_SCHEMA_VERSION}")
+        conn.commit()
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ---- 导入 ----
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO store_meta(key, value) VALUES (?, ?)", (key, value))
+
+    def sync_from_json(self, json_path: pathlib.Path) -> bool:
+        """
+        metadata.json 变化时增量导入（首次调用即为从 JSON 的迁移）。
+
+        Returns:
+            是否发生了导入
+        """
+        try:
+            stat = os.stat(json_path)
+        except OSError:
+            # metadata.json 被删除时与之保持一致
+            with self._lock:
+                if self._get_meta("source_signature") is None:
+                    return False
+            self.import_document({})
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM store_meta WHERE key = 'source_signature'")
+            return True
+        signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+        with self._lock:
+            if self._get_meta("source_signature") == signature:
+                return False
+        document = _decode_metadata_json(pathlib.Path(json_path).read_bytes())
+        changed = self.import_document(document)
+        with self._lock, self._conn:
+            self._set_meta("source_signature", signature)
+        logger.info("元数据索引已从 %s 导入: %d 个包有变化", json_path, changed)
+        return True
+
+    def import_document(self, document: Dict[str, Any]) -> int:
+        """以 metadata.json 的结构整体同步，只重写内容变化的包；返回变化的包数量"""
+        packages: Dict[str, Tuple[str, Dict]] = {}
+        for pkg_id, pkg_metadata in document.items():
+            if not isinstance(pkg_metadata, dict):
+                continue
+            encoded = json.dumps(pkg_metadata, ensure_ascii=False, sort_keys=True)
+            packages[pkg_id] = (hashlib.sha1(encoded.encode("utf-8")).hexdigest(), pkg_metadata)
+
+        with self._lock, self._conn:
+            existing = dict(self._conn.execute("SELECT id, digest FROM packages"))
+            removed = [pkg_id for pkg_id in existing if pkg_id not in packages]
+            for pkg_id in removed:
+                self._delete_package(pkg_id)
+            changed = len(removed)
+            for pkg_id, (digest, pkg_metadata) in packages.items():
+                if existing.get(pkg_id) == digest:
+                    continue
+                self._write_package(pkg_id, digest, pkg_metadata)
+                changed += 1
+            if changed:
+                self._records.clear()
+        return changed
+
+    def replace_package(self, pkg_id: str, pkg_metadata: Dict[str, Any]) -> None:
+        """事务内整体替换一个包及其资产"""
+        encoded = json.dumps(pkg_metadata, ensure_ascii=False, sort_keys=True)
+        with self._lock, self._conn:
+            self._write_package(pkg_id, hashlib.sha1(encoded.encode("utf-8")).hexdigest(), pkg_metadata)
+            self._records.clear()
+
+    def delete_package(self, pkg_id: str) -> None:
+        with self._lock, self._conn:
+            self._delete_package(pkg_id)
+            self._records.clear()
+
+    def _delete_package(self, pkg_id: str) -> None:
+        self._conn.execute(
+            "DELETE FROM pictures WHERE asset_path IN (SELECT path FROM assets WHERE package_id = ?)", (pkg_id,)
+        )
+        self._conn.execute("DELETE FROM assets WHERE package_id = ?", (pkg_id,))
+        self._conn.execute("DELETE FROM packages WHERE id = ?", (pkg_id,))
+
+    def _write_package(self, pkg_id: str, digest: str, pkg_metadata: Dict[str, Any]) -> None:
+        self._delete_package(pkg_id)
+        package_data = {k: v for k, v in pkg_metadata.items() if k != 'children'}
+        self._conn.execute(
+            "INSERT INTO packages(id, digest, data) VALUES (?, ?, ?)",
+            (pkg_id, digest, json.dumps(package_data, ensure_ascii=False)),
+        )
+        for asset_metadata in pkg_metadata.get('children') or []:
+            if not isinstance(asset_metadata, dict):
+                continue
+            asset_path = asset_metadata.get('assetPath', '')
+            if not asset_path:
+                continue
+            self._write_asset(normalize_asset_path(asset_path), pkg_id, asset_metadata)
+
+    def _write_asset(self, path: str, pkg_id: str, asset_metadata: Dict[str, Any]) -> None:
+        pictures = asset_metadata.get('pictures')
+        has_pictures = isinstance(pictures, list)
+        data = {k: v for k, v in asset_metadata.items() if not (has_pictures and k == 'pictures')}
+        self._conn.execute("DELETE FROM pictures WHERE asset_path = ?", (path,))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO assets(path, id, package_id, category, name, has_pictures, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                asset_metadata.get('id'),
+                pkg_id,
+                _category_text(asset_metadata.get('category')),
+                asset_metadata.get('name'),
+                int(has_pictures),
+                json.dumps(data, ensure_ascii=False),
+            ),
+        )
+        if has_pictures:
+            self._conn.executemany(
+                "INSERT INTO pictures(asset_path, position, data) VALUES (?, ?, ?)",
+                [(path, i, json.dumps(p, ensure_ascii=False)) for i, p in enumerate(pictures)],
+            )
+
+    def upsert_asset(self, asset_path: str, asset_metadata: Dict[str, Any]) -> None:
+        pkg_id = asset_metadata.get('parentPackageId', '') if isinstance(asset_metadata, dict) else ''
+        with self._lock, self._conn:
+            self._write_asset(asset_path, pkg_id, dict(asset_metadata))
+            self._records.pop(asset_path, None)
+
+    # ---- 查询 ----
+
+    def _load_asset(self, path: str) -> Optional[Dict]:
+        row = self._conn.execute("SELECT has_pictures, data FROM assets WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row[1])
+        if row[0]:
+            record['pictures'] = [
+                json.loads(data)
+                for (data,) in self._conn.execute(
+                    "SELECT data FROM pictures WHERE asset_path = ? ORDER BY position", (path,)
+                )
+            ]
+        return record
+
+    def get_asset(self, asset_path: str) -> Optional[Dict]:
+        with self._lock:
+            if asset_path in self._records:
+                return self._records[asset_path]
+            record = self._load_asset(asset_path)
+            if record is not None:
+                self._records[asset_path] = record
+            return record
+
+    def get_package(self, pkg_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM packages WHERE id = ?", (pkg_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def asset_paths(self) -> List[str]:
+        with self._lock:
+            return [path for (path,) in self._conn.execute("SELECT path FROM assets ORDER BY rowid")]
+
+    def asset_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+    def has_asset(self, asset_path: str) -> bool:
+        with self._lock:
+            if self._records.get(asset_path) is not None:
+                return True
+            return self._conn.execute("SELECT 1 FROM assets WHERE path = ?", (asset_path,)).fetchone() is not None
+
+    def assets_by_package(self, pkg_id: str) -> List[str]:
+        with self._lock:
+            return [p for (p,) in self._conn.execute("SELECT path FROM assets WHERE package_id = ?", (pkg_id,))]
+
+    def assets_by_category(self, category: str) -> List[str]:
+        with self._lock:
+            return [p for (p,) in self._conn.execute("SELECT path FROM assets WHERE category = ?", (category,))]
+
+    def load_all(self) -> Dict[str, Dict]:
+        """一次性读取全部资产（批量查询，供遍历整个资产表的调用方使用）"""
+        with self._lock:
+            pictures: Dict[str, List] = {}
+            for path, data in self._conn.execute("SELECT asset_path, data FROM pictures ORDER BY asset_path, position"):
+                pictures.setdefault(path, []).append(json.loads(data))
+            result: Dict[str, Dict] = {}
+            for path, has_pictures, data in self._conn.execute(
+                "SELECT path, has_pictures, data FROM assets ORDER BY rowid"
+            ):
+                record = self._records.get(path)
+                if record is None:
+                    record = json.loads(data)
+                    if has_pictures:
+                        record['pictures'] = pictures.get(path, [])
+                    self._records[path] = record
+                result[path] = record
+            return result
+
+
+class LazyAssetMap(Mapping):
+    """按需从 MetadataStore 读取记录的只读资产映射，兼容原 AssetMap 的用法"""
+
+    def __init__(self, store: MetadataStore):
+        self._store = store
+
+    def __getitem__(self, asset_path: str) -> Dict:
+        record = self._store.get_asset(asset_path)
+        if record is None:
+            raise KeyError(asset_path)
+        return record
+
+    def __contains__(self, asset_path: object) -> bool:
+        return isinstance(asset_path, str) and self._store.has_asset(asset_path)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.asset_paths())
+
+    def __len__(self) -> int:
+        return self._store.asset_count()
+
+    def items(self):
+        return self._store.load_all().items()
+
+    def values(self):
+        return self._store.load_all().values()
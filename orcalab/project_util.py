@@ -1,17 +1,14 @@
 import os
 import json
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import pathlib
 import sys
 import shutil
 import hashlib
 import pickle
 import time
-import aiohttp
-import aiofiles
 import asyncio
 import logging
-from PySide6 import QtWidgets
 
 
 project_id = "{3DB8A56E-2458-4543-93A1-1A41756B97DA}"
@@ -19,6 +16,18 @@ project_id = "{3DB8A56E-2458-4543-93A1-1A41756B97DA}"
 logger = logging.getLogger(__name__)
 
 
+class PakIntegrityError(Exception):
+    """
+    pak_urls 下载后 sha256 不一致，启动无法继续。
+
+    下载在工作线程中执行，提示框由主线程捕获后弹出。
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
 def get_project_dir():
     project_dir = pathlib.Path.home() / "Orca" / "OrcaLab" / "DefaultProject"
     return project_dir
@@ -165,6 +174,9 @@ def calculate_file_md5(file_path: pathlib.Path) -> str:
         logger.error("Error calculating MD5 for %s: %s", file_path, e)
         return ""
     
+# 下载时每次读取/写入的块大小
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 def calculate_file_sha256(file_path: pathlib.Path) -> str:
     """计算文件的SHA256值"""
     hash_sha256 = hashlib.sha256()
@@ -177,6 +189,39 @@ def calculate_file_sha256(file_path: pathlib.Path) -> str:
         logger.error("Error calculating SHA256 for %s: %s", file_path, e)
         return ""
 
+def calculate_file_sha256_cached(file_path: pathlib.Path) -> str:
+    """计算文件的SHA256值，文件未变化时复用持久化哈希缓存"""
+    from orcalab.content_hash_store import get_content_hash_store
+
+    try:
+        return get_content_hash_store().sha256(file_path)
+    except Exception as e:
+        logger.error("Error calculating SHA256 for %s: %s", file_path, e)
+        return ""
+
+def calculate_files_sha256_parallel(
+    file_paths: List[pathlib.Path],
+    max_workers: int,
+    on_progress: Optional[Callable[[pathlib.Path, int, int], None]] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> Dict[pathlib.Path, str]:
+    """并发计算多个文件的SHA256值（复用持久化哈希缓存），取消或失败的文件不在结果中"""
+    from orcalab.content_hash_store import get_content_hash_store
+
+    return get_content_hash_store().sha256_many(file_paths, max_workers, on_progress, cancelled)
+
+def record_file_sha256(file_path: pathlib.Path, sha256: str):
+    """将已校验文件的SHA256写入持久化哈希缓存"""
+    from orcalab.content_hash_store import get_content_hash_store
+
+    get_content_hash_store().put(file_path, sha256)
+
+def save_content_hash_store():
+    """持久化哈希缓存"""
+    from orcalab.content_hash_store import get_content_hash_store
+
+    get_content_hash_store().save()
+
 def get_cached_md5(file_path: pathlib.Path, cache: Dict[str, Dict]) -> Optional[str]:
     """从缓存中获取MD5值"""
     file_key = str(file_path)
@@ -303,6 +348,9 @@ async def download_pak_from_url(url: str, target_path: pathlib.Path, cloud_file_
     Returns:
         bool: 下载是否成功
     """
+    import aiofiles
+    import aiohttp
+
     try:
         async with aiohttp.ClientSession() as session:
             _start = time.monotonic()
@@ -316,28 +364,31 @@ async def download_pak_from_url(url: str, target_path: pathlib.Path, cloud_file_
                 # 确保目标目录存在
                 target_path.parent.mkdir(parents=True, exist_ok=True)
                 
-                # 下载文件
+                # 边下载边计算哈希，校验时无需再次读取整个文件
                 temp_path = target_path.with_suffix(target_path.suffix + ".tmp")
+                hash_sha256 = hashlib.sha256()
                 async with aiofiles.open(temp_path, "wb") as f:
-                    async for chunk in response.content.iter_chunked(8192):
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        hash_sha256.update(chunk)
                         await f.write(chunk)
+                    await f.flush()
+                    await asyncio.to_thread(os.fsync, f.fileno())
                 
                 # 验证文件完整性
-                local_file_sha256 = calculate_file_sha256(temp_path)
-                if local_file_sha256.lower() != cloud_file_sha256:
+                local_file_sha256 = hash_sha256.hexdigest()
+                if local_file_sha256 != cloud_file_sha256.lower():
+                    temp_path.unlink(missing_ok=True)
                     logger.error("文件下载不完整，源文件sha256: %s, 下载文件sha256: %s", cloud_file_sha256, local_file_sha256)
-                    msg = f"源文件sha256: {cloud_file_sha256}\n下载文件sha256: {local_file_sha256}"
-                    QtWidgets.QMessageBox.information(None, "pak 下载不完整, 请重新启动 orcalab", msg)
-                    sys.exit(1)
-                    return False
+                    raise PakIntegrityError(f"源文件sha256: {cloud_file_sha256}\n下载文件sha256: {local_file_sha256}")
 
-                # 重命名
-                if target_path.exists():
-                    target_path.unlink()
-                temp_path.rename(target_path)
+                # 原子替换
+                os.replace(temp_path, target_path)
+                record_file_sha256(target_path, local_file_sha256)
                 logger.info("Downloaded %s to %s", url, target_path)
                 return True
                 
+    except PakIntegrityError:
+        raise
     except Exception as e:
         logger.error("Error downloading %s: %s", url, e)
         return False
@@ -382,30 +433,24 @@ def sync_pak_urls(pak_urls: List[str], pak_urls_sha256: List[str]) -> List[str]:
         clound_file_sha256 = pak_urls_sha256[i]
         # 如果文件已存在，检查是否需要更新（跳过下载，避免重复下载）
         if target_path.exists():
-            local_file_sha256 = calculate_file_sha256(target_path)
+            local_file_sha256 = calculate_file_sha256_cached(target_path)
             if local_file_sha256 == clound_file_sha256:
                 logger.info("File %s already exists in cache, skipping download", filename)
                 downloaded_files.append(str(target_path))
                 continue
             logger.info("File %s already exists in cache, but the file is incomplete", filename)
         
-        # 同步下载
+        # 同步下载（启动时在工作线程中调用，使用独立的事件循环）
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # 如果事件循环正在运行，创建新任务
-                task = asyncio.create_task(download_pak_from_url(url, target_path, clound_file_sha256))
-                success = loop.run_until_complete(task)
-            else:
-                # 如果事件循环未运行，直接运行
-                success = loop.run_until_complete(download_pak_from_url(url, target_path, clound_file_sha256))
-            
+            success = asyncio.run(download_pak_from_url(url, target_path, clound_file_sha256))
+
             if success:
                 downloaded_files.append(str(target_path))
                 logger.info("Downloaded %s to cache", filename)
         except Exception as e:
             logger.error("Error downloading %s: %s", url, e)
-    
+
+    save_content_hash_store()
     return downloaded_files
 
 
@@ -16,7 +16,14 @@ import importlib.metadata
 
 from orcalab.config_service import ConfigService
 from orcalab.ui.fonts.font_service import FontService
-from orcalab.project_util import project_id, calculate_file_sha256, get_cache_folder
+from orcalab.project_util import (
+    project_id,
+    calculate_file_sha256,
+    calculate_file_sha256_cached,
+    get_cache_folder,
+    record_file_sha256,
+    save_content_hash_store,
+)
 from orcalab.ui.viewport import Viewport
 
 logger = logging.getLogger(__name__)
@@ -393,6 +400,7 @@ def _download_pak_file(url: str, target_path: Path, cloud_file_sha256: str, prog
         if local_file_sha256.lower() != cloud_file_sha256.lower():
             logger.error("下载出错，文件不完整，源文件sha256: %s, 下载文件sha256: %s", cloud_file_sha256, local_file_sha256)
             return False
+        record_file_sha256(target_path, local_file_sha256)
         return True
     except Exception as e:
         logger.error("Failed to download pak file from %s: %s", url, e)
@@ -541,7 +549,7 @@ def ensure_python_project_installed(config: Optional[ConfigService] = None) -> N
 
             expected_sha256 = orcalab_cfg.get("python_project_sha256", "")
             
-            if archive_path.exists() and expected_sha256 == calculate_file_sha256(archive_path):
+            if archive_path.exists() and expected_sha256 == calculate_file_sha256_cached(archive_path):
                 progress_dialog.log(f"下载完成: {archive_path.name}")
             else:
                 progress_dialog.log(f"开始下载: {download_url}")
@@ -562,6 +570,7 @@ def ensure_python_project_installed(config: Optional[ConfigService] = None) -> N
                             f"expected: {expected_sha256}\n"
                             f"actual:   {actual_sha256}"
                         )
+                    record_file_sha256(archive_path, actual_sha256)
 
                 progress_dialog.set_progress(50)
                 progress_dialog.log("SHA256 校验通过")
@@ -603,7 +612,7 @@ def ensure_python_project_installed(config: Optional[ConfigService] = None) -> N
                 clound_file_sha256 = pak_urls_sha256[i]
                 # 如果文件已存在，跳过
                 if target_path.exists():
-                    local_file_sha256 = calculate_file_sha256(target_path)
+                    local_file_sha256 = calculate_file_sha256_cached(target_path)
                     if local_file_sha256 == clound_file_sha256:
                         logger.info("File %s already exists in cache, skipping download", filename)
                         progress_dialog.log(f"pak 文件已存在，跳过: {filename}")
@@ -621,7 +630,9 @@ def ensure_python_project_installed(config: Optional[ConfigService] = None) -> N
                     progress_dialog.log(f"pak 文件下载完成: {filename}")
                 else:
                     progress_dialog.log(f"pak 文件下载失败: {filename}")
-        
+
+        save_content_hash_store()
+
         # 保存安装状态
         state_update["installed_at"] = str(Path.cwd())
         _save_install_state(state_update)
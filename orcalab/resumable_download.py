@@ -0,0 +1,402 @@
+"""
+可续传的 pak 下载
+
+- 使用 HTTP Range 续传：已下载的字节与分段进度持久化到 "<临时文件>.state.json"，
+  网络中断、取消或重启后从断点继续，而不是从零开始
+- 通过 If-Range 携带 ETag / Last-Modified，服务器文件已变化时自动整文件重下
+- 大文件可选多段并发下载，各段按偏移直接写入预分配的临时文件
+- 单段下载边下载边计算 SHA-256；续传时只需补读已下载的前缀，
+  多段下载在组装完成后统一计算
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Callable, List, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+RESUMABLE_DOWNLOAD_CONFIG = {
+    "chunk_size": 1024 * 1024,
+    # 每写入多少字节持久化一次分段进度
+    "state_save_interval": 8 * 1024 * 1024,
+    # 启用多段下载的最小文件大小
+    "segment_min_size": 64 * 1024 * 1024,
+    "max_segments": 16,
+}
+
+DOWNLOAD_STATE_VERSION = 1
+
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class DownloadCancelled(Exception):
+    """下载被取消，已下载部分保留以便续传"""
+
+
+class RangeNotSatisfiable(Exception):
+    """服务器返回的 Range 响应与请求不符"""
+
+
+@dataclass
+class DownloadSegment:
+    start: int
+    # 闭区间结束位置；总大小未知时为 -1
+    end: int
+    downloaded: int = 0
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1 if self.end >= 0 else -1
+
+    @property
+    def done(self) -> bool:
+        return self.end >= 0 and self.downloaded >= self.length
+
+
+@dataclass
+class DownloadState:
+    url: str
+    total_size: int = -1
+    etag: str = ""
+    last_modified: str = ""
+    segments: List[DownloadSegment] = field(default_factory=list)
+
+    @property
+    def downloaded(self) -> int:
+        return sum(s.downloaded for s in self.segments)
+
+    def validator(self) -> str:
+        return self.etag or self.last_modified
+
+    def to_json(self) -> dict:
+        data = asdict(self)
+        data["version"] = DOWNLOAD_STATE_VERSION
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict) -> "DownloadState":
+        if data.get("version") != DOWNLOAD_STATE_VERSION:
+            raise ValueError(f"unsupported download state version: {data.get('version')!r}")
+        return cls(
+            url=data["url"],
+            total_size=int(data.get("total_size", -1)),
+            etag=data.get("etag", ""),
+            last_modified=data.get("last_modified", ""),
+            segments=[DownloadSegment(**s) for s in data.get("segments", [])],
+        )
+
+
+def state_file_for(temp_path: pathlib.Path) -> pathlib.Path:
+    return temp_path.with_name(temp_path.name + ".state.json")
+
+
+def load_download_state(temp_path: pathlib.Path, url: str) -> Optional[DownloadState]:
+    """读取续传状态；状态缺失、损坏、URL 不符或临时文件丢失时返回 None"""
+    state_file = state_file_for(temp_path)
+    if not state_file.exists() or not temp_path.exists():
+        return None
+    try:
+        state = DownloadState.from_json(json.loads(state_file.read_text(encoding="utf-8")))
+    except Exception as e:
+        logger.debug("续传状态无效，将重新下载: %s (%s)", state_file, e)
+        return None
+    if state.url != url or not state.segments:
+        return None
+    # 状态中记录的进度不能超过临时文件实际写入的内容
+    file_size = temp_path.stat().st_size
+    for segment in state.segments:
+        if segment.start + segment.downloaded > file_size:
+            segment.downloaded = max(0, file_size - segment.start)
+    return state
+
+
+def save_download_state(temp_path: pathlib.Path, state: DownloadState) -> None:
+    state_file = state_file_for(temp_path)
+    tmp_file = state_file.with_name(state_file.name + ".tmp")
+    tmp_file.write_text(json.dumps(state.to_json()), encoding="utf-8")
+    os.replace(tmp_file, state_file)
+
+
+def discard_partial_download(temp_path: pathlib.Path) -> None:
+    temp_path.unlink(missing_ok=True)
+    state_file_for(temp_path).unlink(missing_ok=True)
+
+
+def split_segments(total_size: int, segment_count: int) -> List[DownloadSegment]:
+    segment_count = max(1, min(segment_count, total_size))
+    base = total_size // segment_count
+    segments = []
+    start = 0
+    for i in range(segment_count):
+        end = total_size - 1 if i == segment_count - 1 else start + base - 1
+        segments.append(DownloadSegment(start, end))
+        start = end + 1
+    return segments
+
+
+def _parse_content_range(value: str) -> Optional[tuple]:
+    match = _CONTENT_RANGE_PATTERN.fullmatch(value.strip()) if value else None
+    if not match:
+        return None
+    total = -1 if match.group(3) == "*" else int(match.group(3))
+    return int(match.group(1)), int(match.group(2)), total
+
+
+class ResumableDownloader:
+    """
+    单个文件的可续传下载。
+
+    download() 成功时返回文件的 SHA-256（临时文件保持完整，由调用方校验并重命名）；
+    取消时抛出 DownloadCancelled，网络异常原样抛出，两种情况下都保留临时文件和续传状态。
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        temp_path: pathlib.Path,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        segments: int = 1,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ):
+        self.session = session
+        self.url = url
+        self.temp_path = pathlib.Path(temp_path)
+        self.timeout = timeout
+        self.segments = max(1, min(int(segments), RESUMABLE_DOWNLOAD_CONFIG["max_segments"]))
+        self.on_progress = on_progress
+        self.cancelled = cancelled or (lambda: False)
+        self.state: Optional[DownloadState] = None
+        self._resumed_bytes = 0
+        self._unsaved_bytes = 0
+
+    @property
+    def resumed_bytes(self) -> int:
+        return self._resumed_bytes
+
+    async def download(self) -> str:
+        self.temp_path.parent.mkdir(parents=True, exist_ok=True)
+        self.state = load_download_state(self.temp_path, self.url)
+        self._resumed_bytes = self.state.downloaded if self.state else 0
+
+        if self.state is None and self.segments > 1:
+            self.state = await self._probe_segmented()
+        if self.state is None:
+            self.state = DownloadState(url=self.url, segments=[DownloadSegment(0, -1)])
+            self.temp_path.unlink(missing_ok=True)
+        elif self._resumed_bytes:
+            logger.debug("续传 %s: 已有 %d 字节", self.temp_path.name, self._resumed_bytes)
+
+        try:
+            if self._finished():
+                # 上次已下载完整但未来得及重命名
+                digest = await asyncio.to_thread(self._hash_temp_file)
+            elif len(self.state.segments) == 1:
+                digest = await self._download_single()
+            else:
+                await self._download_segments()
+                digest = await asyncio.to_thread(self._hash_temp_file)
+        finally:
+            if not self._finished() and self.temp_path.exists():
+                save_download_state(self.temp_path, self.state)
+
+        state_file_for(self.temp_path).unlink(missing_ok=True)
+        return digest
+
+    def _finished(self) -> bool:
+        segments = self.state.segments
+        if len(segments) == 1 and segments[0].end < 0:
+            return False
+        return all(s.done for s in segments)
+
+    def _report_progress(self, n: int) -> None:
+        self._unsaved_bytes += n
+        if self._unsaved_bytes >= RESUMABLE_DOWNLOAD_CONFIG["state_save_interval"]:
+            self._unsaved_bytes = 0
+            save_download_state(self.temp_path, self.state)
+        if self.on_progress is not None:
+            self.on_progress(self.state.downloaded, self.state.total_size)
+
+    def _remember_validator(self, response: aiohttp.ClientResponse) -> None:
+        self.state.etag = response.headers.get("ETag", "")
+        self.state.last_modified = response.headers.get("Last-Modified", "")
+
+    async def _probe_segmented(self) -> Optional[DownloadState]:
+        """探测文件大小与 Range 支持，满足条件时返回多段下载状态"""
+        headers = {"Range": "bytes=0-0"}
+        async with self.session.get(self.url, headers=headers, timeout=self.timeout) as response:
+            if response.status != 206:
+                return None
+            content_range = _parse_content_range(response.headers.get("Content-Range", ""))
+            if content_range is None or content_range[2] < RESUMABLE_DOWNLOAD_CONFIG["segment_min_size"]:
+                return None
+            total_size = content_range[2]
+            state = DownloadState(url=self.url, total_size=total_size)
+            self.state = state
+            self._remember_validator(response)
+
+        segment_count = min(self.segments, total_size // RESUMABLE_DOWNLOAD_CONFIG["segment_min_size"] or 1)
+        state.segments = split_segments(total_size, max(segment_count, 1))
+        # 预分配完整大小，各段按偏移写入
+        with open(self.temp_path, "wb") as f:
+            f.truncate(total_size)
+        save_download_state(self.temp_path, state)
+        logger.debug("多段下载 %s: %d 字节, %d 段", self.temp_path.name, total_size, len(state.segments))
+        return state
+
+    async def _download_segments(self) -> None:
+        # 任一段失败时取消其余段，避免保存状态时仍有段在写入
+        try:
+            async with asyncio.TaskGroup() as group:
+                for segment in self.state.segments:
+                    if not segment.done:
+                        group.create_task(self._download_segment(segment))
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from None
+
+    def _hash_temp_file(self) -> str:
+        from orcalab.content_hash_store import PARALLEL_HASH_READ_CHUNK_SIZE, hash_file_sha256
+
+        return hash_file_sha256(self.temp_path, PARALLEL_HASH_READ_CHUNK_SIZE)
+
+    async def _download_single(self) -> str:
+        segment = self.state.segments[0]
+        offset = segment.downloaded
+        headers = {}
+        if offset > 0:
+            headers["Range"] = f"bytes={offset}-"
+            validator = self.state.validator()
+            if validator:
+                headers["If-Range"] = validator
+
+        async with self.session.get(self.url, headers=headers, timeout=self.timeout) as response:
+            if response.status == 200:
+                if offset > 0:
+                    logger.debug("服务器未接受续传请求，从头下载: %s", self.temp_path.name)
+                offset = 0
+            elif response.status == 206 and offset > 0:
+                content_range = _parse_content_range(response.headers.get("Content-Range", ""))
+                if content_range is None or content_range[0] != offset:
+                    raise RangeNotSatisfiable(f"Content-Range 不符: {response.headers.get('Content-Range')}")
+                if self.state.total_size < 0:
+                    self.state.total_size = content_range[2]
+            elif response.status == 416 and offset > 0:
+                # 状态记录的断点越界，丢弃后交给上层重试
+                discard_partial_download(self.temp_path)
+                self.state.segments = [DownloadSegment(0, -1)]
+                raise RangeNotSatisfiable("HTTP 416")
+            else:
+                raise aiohttp.ClientResponseError(
+                    response.request_info, response.history, status=response.status, message=response.reason or ""
+                )
+
+            if offset == 0:
+                self._remember_validator(response)
+                length = response.content_length
+                if response.headers.get("Content-Encoding", "identity") != "identity":
+                    length = None
+                self.state.total_size = length if length is not None else -1
+                segment.downloaded = 0
+
+            hash_sha256 = hashlib.sha256()
+            if offset > 0:
+                await asyncio.to_thread(self._hash_prefix, hash_sha256, offset)
+
+            chunk_size = RESUMABLE_DOWNLOAD_CONFIG["chunk_size"]
+            with open(self.temp_path, "r+b" if offset > 0 else "wb", buffering=chunk_size) as f:
+                f.seek(offset)
+                f.truncate()
+                try:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        if self.cancelled():
+                            raise DownloadCancelled(self.url)
+                        hash_sha256.update(chunk)
+                        f.write(chunk)
+                        segment.downloaded += len(chunk)
+                        self._report_progress(len(chunk))
+                finally:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+        if self.state.total_size < 0:
+            self.state.total_size = segment.downloaded
+        segment.end = self.state.total_size - 1
+        if segment.downloaded != self.state.total_size:
+            raise aiohttp.ClientPayloadError(
+                f"下载不完整: {segment.downloaded}/{self.state.total_size} 字节"
+            )
+        return hash_sha256.hexdigest()
+
+    def _hash_prefix(self, hash_sha256, length: int) -> None:
+        chunk_size = RESUMABLE_DOWNLOAD_CONFIG["chunk_size"]
+        with open(self.temp_path, "rb") as f:
+            remaining = length
+            while remaining > 0:
+                data = f.read(min(chunk_size, remaining))
+                if not data:
+                    break
+                hash_sha256.update(data)
+                remaining -= len(data)
+
+    async def _download_segment(self, segment: DownloadSegment) -> None:
+        start = segment.start + segment.downloaded
+        headers = {"Range": f"bytes={start}-{segment.end}"}
+        validator = self.state.validator()
+        if validator:
+            headers["If-Range"] = validator
+
+        async with self.session.get(self.url, headers=headers, timeout=self.timeout) as response:
+            if response.status != 206:
+                # 文件已在服务器端变化（If-Range 不满足）或不支持 Range，放弃分段进度
+                discard_partial_download(self.temp_path)
+                raise RangeNotSatisfiable(f"分段下载返回 HTTP {response.status}")
+            content_range = _parse_content_range(response.headers.get("Content-Range", ""))
+            if content_range is None or content_range[0] != start:
+                raise RangeNotSatisfiable(f"Content-Range 不符: {response.headers.get('Content-Range')}")
+
+            fd = os.open(self.temp_path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+            try:
+                position = start
+                async for chunk in response.content.iter_chunked(RESUMABLE_DOWNLOAD_CONFIG["chunk_size"]):
+                    if self.cancelled():
+                        raise DownloadCancelled(self.url)
+                    chunk = chunk[: segment.length - segment.downloaded]
+                    if not chunk:
+                        break
+                    _pwrite_all(fd, chunk, position)
+                    position += len(chunk)
+                    segment.downloaded += len(chunk)
+                    self._report_progress(len(chunk))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+        if not segment.done:
+            raise aiohttp.ClientPayloadError(
+                f"分段下载不完整: {segment.start}-{segment.end} 已下载 {segment.downloaded} 字节"
+            )
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    if hasattr(os, "pwrite"):
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+    else:
+        # Windows 没有 os.pwrite
+        os.lseek(fd, offset, os.SEEK_SET)
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
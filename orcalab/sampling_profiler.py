@@ -0,0 +1,203 @@
+"""
+进程内统计采样分析器
+
+后台守护线程按固定频率对所有 Python 线程调用 sys._current_frames() 采样调用栈，
+聚合为 collapsed-stack 格式（每行 "线程;帧;帧;... 次数"），
+可直接导入 speedscope 或交给 flamegraph.pl 生成火焰图。
+
+运行中可随时 start / stop，用于捕捉布局加载慢、拖拽卡顿等现场。
+"""
+
+import logging
+import pathlib
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SAMPLING_PROFILER_CONFIG = {
+    "sample_rate_hz": 100,
+    "max_sample_rate_hz": 1000,
+    "max_stack_depth": 128,
+}
+
+_sampling_profiler_instance: "SamplingProfiler | None" = None
+
+
+def get_sampling_profiler() -> "SamplingProfiler":
+    global _sampling_profiler_instance
+    if _sampling_profiler_instance is None:
+        _sampling_profiler_instance = SamplingProfiler()
+    return _sampling_profiler_instance
+
+
+def get_profile_output_folder() -> pathlib.Path:
+    """采样结果默认输出目录（日志目录下的 profiles）"""
+    from orcalab.project_util import get_user_log_folder
+
+    folder = get_user_log_folder() / "profiles"
+    folder.mkdir(parents=True, exist_ok=True)
+    return folder
+
+
+@dataclass
+class ProfileResult:
+    sample_count: int
+    duration: float
+    sample_rate_hz: int
+    stacks: Dict[str, int] = field(default_factory=dict)
+    output_path: Optional[pathlib.Path] = None
+
+    def collapsed_lines(self) -> List[str]:
+        return [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+
+    def top_functions(self, limit: int = 20) -> List[Tuple[str, int]]:
+        """按自身耗时（栈顶出现次数）排序的函数列表"""
+        self_counts: Counter = Counter()
+        for stack, count in self.stacks.items():
+            self_counts[stack.rsplit(";", 1)[-1]] += count
+        return self_counts.most_common(limit)
+
+    def to_dict(self, top: int = 20) -> dict:
+        return {
+            "sample_count": self.sample_count,
+            "duration": round(self.duration, 3),
+            "sample_rate_hz": self.sample_rate_hz,
+            "unique_stacks": len(self.stacks),
+            "output_path": str(self.output_path) if self.output_path else None,
+            "top_functions": [
+                {"frame": frame, "samples": count} for frame, count in self.top_functions(top)
+            ],
+        }
+
+
+class SamplingProfiler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._stacks: Counter = Counter()
+        self._sample_count = 0
+        self._sample_rate_hz = SAMPLING_PROFILER_CONFIG["sample_rate_hz"]
+        self._start_time = 0.0
+        self._code_labels: Dict[object, str] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, sample_rate_hz: Optional[int] = None) -> bool:
+        """开始采样。已在运行时返回 False。"""
+        with self._lock:
+            if self.is_running:
+                return False
+
+            rate = sample_rate_hz or SAMPLING_PROFILER_CONFIG["sample_rate_hz"]
+            rate = max(1, min(int(rate), SAMPLING_PROFILER_CONFIG["max_sample_rate_hz"]))
+
+            self._stacks = Counter()
+            self._sample_count = 0
+            self._sample_rate_hz = rate
+            self._start_time = time.perf_counter()
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="orcalab-sampling-profiler"
+            )
+            self._thread.start()
+
+        logger.info("采样分析器已启动: %d Hz", rate)
+        return True
+
+    def stop(self, output_path: Optional[pathlib.Path] = None, write: bool = True) -> Optional[ProfileResult]:
+        """停止采样并返回结果；write 为 True 时写出 collapsed-stack 文件。未运行时返回 None。"""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return None
+            self._stop_event.set()
+            thread.join()
+            self._thread = None
+
+            result = ProfileResult(
+                sample_count=self._sample_count,
+                duration=time.perf_counter() - self._start_time,
+                sample_rate_hz=self._sample_rate_hz,
+                stacks=dict(self._stacks),
+            )
+            self._code_labels.clear()
+
+        if write:
+            if output_path is None:
+                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+                output_path = get_profile_output_folder() / f"orcalab_profile_{timestamp}.folded"
+            output_path = pathlib.Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text("\n".join(result.collapsed_lines()) + "\n", encoding="utf-8")
+            result.output_path = output_path
+
+        logger.info(
+            "采样分析器已停止: %d 次采样, %.2f 秒, 输出: %s",
+            result.sample_count,
+            result.duration,
+            result.output_path,
+        )
+        return result
+
+    def status(self) -> dict:
+        running = self.is_running
+        return {
+            "running": running,
+            "sample_rate_hz": self._sample_rate_hz,
+            "sample_count": self._sample_count,
+            "elapsed": round(time.perf_counter() - self._start_time, 3) if running else 0.0,
+        }
+
+    def _run(self) -> None:
+        interval = 1.0 / self._sample_rate_hz
+        own_ident = threading.get_ident()
+        next_time = time.perf_counter()
+        while not self._stop_event.is_set():
+            try:
+                self._sample_once(own_ident)
+            except Exception:
+                logger.exception("采样失败")
+
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay < 0:
+                # 采样落后时不补采，避免雪崩
+                next_time = time.perf_counter()
+                delay = 0
+            self._stop_event.wait(delay)
+
+    def _sample_once(self, own_ident: int) -> None:
+        frames = sys._current_frames()  # noqa: SLF001
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        max_depth = SAMPLING_PROFILER_CONFIG["max_stack_depth"]
+
+        for ident, frame in frames.items():
+            if ident == own_ident:
+                continue
+
+            labels: List[str] = []
+            while frame is not None and len(labels) < max_depth:
+                labels.append(self._frame_label(frame.f_code))
+                frame = frame.f_back
+            labels.append(thread_names.get(ident, f"thread-{ident}"))
+            labels.reverse()
+            self._stacks[";".join(labels)] += 1
+
+        self._sample_count += 1
+
+    def _frame_label(self, code) -> str:
+        label = self._code_labels.get(code)
+        if label is None:
+            file_name = pathlib.PurePath(code.co_filename).name
+            label = f"{code.co_qualname} ({file_name}:{code.co_firstlineno})"
+            self._code_labels[code] = label
+        return label
@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Sequence
 
 import numpy as np
-from scipy.spatial.transform import Rotation
 
 
 logger = logging.getLogger(__name__)
@@ -268,6 +267,9 @@ class SceneLayoutConverter:
 
     @staticmethod
     def _euler_to_quaternion(euler: Sequence[float]) -> np.ndarray:
+        # default_layout 在启动时导入本模块，scipy 仅在实际转换时加载
+        from scipy.spatial.transform import Rotation
+
         try:
             rotation = Rotation.from_euler("xyz", euler, degrees=True)
         except Exception:  # noqa: BLE001
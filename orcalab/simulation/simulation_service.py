@@ -36,6 +36,8 @@ from orcalab.config_service import ConfigService
 from qasync import asyncWrap
 
 logger = logging.getLogger(__name__)
+# 子进程输出单独使用一个 logger，由 logging_util 中的限流规则控制写入量
+terminal_logger = logging.getLogger(f"{__name__}.terminal")
 
 
 class SimulationService(SimulationRequest):
@@ -269,8 +271,8 @@ class SimulationService(SimulationRequest):
     def _append_terminal(self, line: str):
         terminal = self.terminal
         if terminal:
-            terminal._append_output(line)
-        logger.info(line)
+            terminal.append_output(line)
+        terminal_logger.info("%s", line.rstrip("\n"))
 
     def _start_pty_output_thread(self):
         """启动PTY输出读取线程"""
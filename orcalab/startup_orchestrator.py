@@ -0,0 +1,218 @@
+"""
+启动阶段编排
+
+启动流程拆成若干阶段并声明依赖关系：
+- 依赖全部完成的阶段立即开始；互不依赖的阻塞阶段放到线程池并发执行
+- 需要弹出 Qt 对话框的阶段（main_thread=True）在调用 run() 的主线程中按声明顺序执行
+- 每个阶段的开始 / 结束时间记录在 StartupTimeline 中，启动完成后输出关键路径报告
+"""
+
+import json
+import logging
+import pathlib
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+STARTUP_TIMELINE_FILE_NAME = "startup_timeline.json"
+STARTUP_MAX_WORKERS = 4
+
+MAIN_THREAD = "main"
+
+
+@dataclass
+class PhaseRecord:
+    name: str
+    start: float
+    end: float
+    depends_on: List[str] = field(default_factory=list)
+    thread: str = MAIN_THREAD
+    error: str = ""
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class StartupTimeline:
+    """记录各启动阶段的时间（相对于创建时刻，单位秒）并计算关键路径"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self.records: List[PhaseRecord] = []
+
+    def now(self) -> float:
+        return self._clock() - self._origin
+
+    def record(self, record: PhaseRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    @contextmanager
+    def measure(self, name: str, depends_on: Sequence[str] = (), thread: str = MAIN_THREAD) -> Iterator[None]:
+        """记录一段在当前线程中执行的阶段（例如事件循环中的 MainWindow.init）"""
+        start = self.now()
+        error = ""
+        try:
+            yield
+        except BaseException as e:
+            error = repr(e)
+            raise
+        finally:
+            self.record(PhaseRecord(name, start, self.now(), list(depends_on), thread, error))
+
+    def critical_path(self) -> List[PhaseRecord]:
+        """
+        从最后结束的阶段向前回溯：每一步取「依赖阶段与同线程前一个阶段」中最晚结束的那个，
+        即真正推迟了当前阶段开始的前驱。
+        """
+        if not self.records:
+            return []
+        by_name = {record.name: record for record in self.records}
+        path = [max(self.records, key=lambda r: r.end)]
+        while True:
+            current = path[-1]
+            candidates = [by_name[name] for name in current.depends_on if name in by_name]
+            if current.thread == MAIN_THREAD:
+                candidates.extend(
+                    r for r in self.records
+                    if r.thread == MAIN_THREAD and r is not current and r.end <= current.start + 1e-6
+                )
+            candidates = [r for r in candidates if r.end <= current.start + 1e-6 and r not in path]
+            if not candidates:
+                break
+            path.append(max(candidates, key=lambda r: r.end))
+        path.reverse()
+        return path
+
+    def format_report(self, width: int = 40) -> str:
+        if not self.records:
+            return "启动时间线: 无记录"
+        total = max(record.end for record in self.records) or 1e-9
+        critical = {record.name for record in self.critical_path()}
+        name_width = max(len(record.name) for record in self.records)
+        lines = [f"启动时间线 (总耗时 {total:.2f} 秒, * 为关键路径):"]
+        for record in sorted(self.records, key=lambda r: (r.start, r.end)):
+            begin = int(record.start / total * width)
+            length = max(1, int(round(record.duration / total * width)))
+            bar = " " * begin + "#" * min(length, width - begin)
+            mark = "*" if record.name in critical else " "
+            lines.append(
+                f"{mark} {record.name:<{name_width}} |{bar:<{width}}| "
+                f"{record.start:7.2f} +{record.duration:6.2f}s [{record.thread}]"
+                + (f" 失败: {record.error}" if record.error else "")
+            )
+        serial = sum(record.duration for record in self.records)
+        lines.append(f"各阶段耗时合计 {serial:.2f} 秒, 实际 {total:.2f} 秒")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "phases": [asdict(record) for record in self.records],
+            "critical_path": [record.name for record in self.critical_path()],
+            "total": max((record.end for record in self.records), default=0.0),
+        }
+
+    def write(self, path: pathlib.Path) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning("写入启动时间线失败 %s: %s", path, e)
+
+
+@dataclass
+class _Phase:
+    name: str
+    func: Callable[[], Any]
+    depends_on: List[str]
+    main_thread: bool
+
+
+class StartupOrchestrator:
+    """
+    按依赖关系执行启动阶段。
+
+    用法::
+
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("gpu_probe", check_gpu_drivers)
+        orchestrator.add("gpu_dialog", lambda: ..., depends_on=["gpu_probe"], main_thread=True)
+        orchestrator.run()
+        orchestrator.results["gpu_probe"]
+    """
+
+    def __init__(self, timeline: Optional[StartupTimeline] = None, max_workers: int = STARTUP_MAX_WORKERS):
+        self.timeline = timeline or StartupTimeline()
+        self._max_workers = max(1, max_workers)
+        self._phases: Dict[str, _Phase] = {}
+        self.results: Dict[str, Any] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        depends_on: Sequence[str] = (),
+        main_thread: bool = False,
+    ) -> None:
+        if name in self._phases:
+            raise ValueError(f"启动阶段重复: {name}")
+        for dependency in depends_on:
+            if dependency not in self._phases:
+                raise ValueError(f"启动阶段 {name} 依赖未声明的阶段: {dependency}")
+        self._phases[name] = _Phase(name, func, list(depends_on), main_thread)
+
+    def _execute(self, phase: _Phase) -> Any:
+        thread = MAIN_THREAD if phase.main_thread else threading.current_thread().name
+        with self.timeline.measure(phase.name, phase.depends_on, thread):
+            return phase.func()
+
+    def run(self) -> Dict[str, Any]:
+        """执行全部阶段；任一阶段抛出异常时不再启动新阶段，等待已开始的阶段结束后重新抛出"""
+        pending = dict(self._phases)
+        done: set = set()
+        running: Dict[Future, _Phase] = {}
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="orcalab-startup") as executor:
+            try:
+                while pending or running:
+                    ready = [p for p in pending.values() if all(d in done for d in p.depends_on)]
+                    for phase in ready:
+                        if not phase.main_thread:
+                            del pending[phase.name]
+                            running[executor.submit(self._execute, phase)] = phase
+
+                    main_ready = [p for p in ready if p.main_thread]
+                    if main_ready:
+                        # 主线程阶段按声明顺序逐个执行，期间工作线程继续运行
+                        phase = main_ready[0]
+                        del pending[phase.name]
+                        self.results[phase.name] = self._execute(phase)
+                        done.add(phase.name)
+                        self._collect(running, done, block=False)
+                        continue
+
+                    if not running:
+                        raise RuntimeError(f"启动阶段存在循环依赖: {sorted(pending)}")
+                    self._collect(running, done, block=True)
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+        return self.results
+
+    def _collect(self, running: Dict[Future, _Phase], done: set, block: bool) -> None:
+        if not running:
+            return
+        finished, _ = wait(list(running), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for future in finished:
+            phase = running.pop(future)
+            self.results[phase.name] = future.result()
+            done.add(phase.name)
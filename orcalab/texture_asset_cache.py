@@ -1,6 +1,13 @@
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, Tuple
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from orcalab.project_util import get_cache_folder
 
 logger = logging.getLogger(__name__)
 
@@ -12,23 +19,39 @@ TEXTURE_ASSET_FETCH_CONFIG = {
     "backoff_multiplier": 2,
     "page_size": 2000,
     "min_asset_count": 1,
+    # 需要刷新时同时请求的页数（RemoteScene 的 gRPC 锁仍会让请求依次发出）
+    "max_concurrent_pages": 4,
 }
 
+# 纹理目录的本地缓存：启动时先加载，再只请求第一页比对校验值，变化时才拉取全部页
+TEXTURE_CATALOGUE_FILE_NAME = ".texture_catalogue.json"
+TEXTURE_CATALOGUE_VERSION = 1
+# 校验值只覆盖总数和第一页，超过这个时间的本地目录无条件刷新
+TEXTURE_CATALOGUE_MAX_AGE_SECONDS = 24 * 3600
+
 _texture_asset_cache_instance: "TextureAssetCache | None" = None
 
 
 def get_texture_asset_cache() -> "TextureAssetCache":
     global _texture_asset_cache_instance
     if _texture_asset_cache_instance is None:
-        _texture_asset_cache_instance = TextureAssetCache()
+        _texture_asset_cache_instance = TextureAssetCache(get_cache_folder() / TEXTURE_CATALOGUE_FILE_NAME)
     return _texture_asset_cache_instance
 
 
 class TextureAssetCache:
-    def __init__(self):
+    def __init__(self, catalogue_path: Path | None = None):
         self._uuid_to_path: Dict[str, str] = {}
         self._path_to_uuid: Dict[str, str] = {}
         self._ready = False
+        self._catalogue_path = catalogue_path
+        self._token: str | None = None
+        self._saved_at = 0.0
+        # 三元组索引在后台线程构建，对应构建时的 _uuid_to_path；未就绪或已过期时线性扫描
+        self._search_index = None
+        self._search_source: Dict[str, str] | None = None
+        self._search_items: List[Tuple[str, str]] = []
+        self._index_task: asyncio.Task | None = None
 
     @property
     def is_ready(self) -> bool:
@@ -43,6 +66,15 @@ class TextureAssetCache:
     def get_all_items(self) -> list[Tuple[str, str]]:
         return list(self._uuid_to_path.items())
 
+    @property
+    def count(self) -> int:
+        return len(self._uuid_to_path)
+
+    async def wait_search_index(self) -> None:
+        """等待后台搜索索引构建结束；构建期间目录被替换时等待新的构建"""
+        while self._index_task is not None and not self._index_task.done():
+            await asyncio.wait({self._index_task})
+
     async def initialize(self, remote_scene) -> None:
         config = TEXTURE_ASSET_FETCH_CONFIG
         max_retries = config["max_retries"]
@@ -51,6 +83,12 @@ class TextureAssetCache:
         page_size = config["page_size"]
         min_asset_count = config["min_asset_count"]
 
+        cached = await self._load_catalogue()
+        if cached:
+            self._ready = True
+            self._schedule_search_index()
+            logger.info("纹理资产缓存: 从本地目录加载 %d 条", len(self._uuid_to_path))
+
         delay = base_delay
         for attempt in range(1, max_retries + 1):
             try:
@@ -60,12 +98,22 @@ class TextureAssetCache:
                     max_retries,
                 )
 
-                await self._fetch_all_pages(remote_scene, page_size)
+                first_page = await remote_scene.get_assets_by_type_page(
+                    STREAMING_IMAGE_ASSET_UUID, 0, page_size
+                )
+                token = self._validation_token(first_page, page_size)
+                if cached and token == self._token and time.time() - self._saved_at < TEXTURE_CATALOGUE_MAX_AGE_SECONDS:
+                    logger.info("纹理资产缓存: 目录未变化，沿用本地目录 (%d 条)", len(self._uuid_to_path))
+                    return
+
+                uuid_to_path = await self._fetch_all_pages(remote_scene, first_page, page_size)
 
-                total = len(self._uuid_to_path)
+                total = len(uuid_to_path)
                 if total >= min_asset_count:
+                    self._set_catalogue(uuid_to_path, token)
                     self._ready = True
                     logger.info("纹理资产缓存就绪: %d 条", total)
+                    await self._save_catalogue()
                     return
                 else:
                     logger.warning(
@@ -73,8 +121,6 @@ class TextureAssetCache:
                         total,
                         min_asset_count,
                     )
-                    self._uuid_to_path.clear()
-                    self._path_to_uuid.clear()
 
             except Exception as e:
                 logger.warning(
@@ -87,6 +133,12 @@ class TextureAssetCache:
                 logger.info("纹理资产缓存: 等待 %.1f 秒后重试...", delay)
                 await asyncio.sleep(delay)
                 delay *= multiplier
+            elif cached:
+                logger.error(
+                    "纹理资产缓存: 已达最大重试次数 (%d)，继续使用本地目录 (%d 条)",
+                    max_retries,
+                    len(self._uuid_to_path),
+                )
             else:
                 logger.error(
                     "纹理资产缓存: 已达最大重试次数 (%d)，纹理选择功能暂不可用",
@@ -94,34 +146,122 @@ class TextureAssetCache:
                 )
                 self._ready = False
 
-    async def _fetch_all_pages(self, remote_scene, page_size: int) -> None:
-        page_index = 0
-        while True:
-            response = await remote_scene.get_assets_by_type_page(
-                STREAMING_IMAGE_ASSET_UUID, page_index, page_size
-            )
+    async def _fetch_all_pages(self, remote_scene, first_page, page_size: int) -> Dict[str, str]:
+        """第一页已取到，其余页并发请求，按页序合并"""
+        total_pages = first_page.total_pages
+        semaphore = asyncio.Semaphore(TEXTURE_ASSET_FETCH_CONFIG.get("max_concurrent_pages", 1))
 
-            for asset in response.assets:
-                self._uuid_to_path[asset.asset_id] = asset.relative_path
-                self._path_to_uuid[asset.relative_path] = asset.asset_id
+        async def fetch(page_index: int):
+            async with semaphore:
+                return await remote_scene.get_assets_by_type_page(
+                    STREAMING_IMAGE_ASSET_UUID, page_index, page_size
+                )
 
-            total_pages = response.total_pages
+        pages = [first_page] + list(await asyncio.gather(*(fetch(i) for i in range(1, total_pages))))
+
+        uuid_to_path: Dict[str, str] = {}
+        for page_index, response in enumerate(pages):
+            for asset in response.assets:
+                uuid_to_path[asset.asset_id] = asset.relative_path
             logger.info(
                 "纹理资产缓存: page=%d/%d, 本页 %d 条, 累计 %d 条",
                 page_index + 1,
                 total_pages,
                 len(response.assets),
-                len(self._uuid_to_path),
+                len(uuid_to_path),
             )
+        return uuid_to_path
+
+    @staticmethod
+    def _validation_token(first_page, page_size: int) -> str:
+        digest = hashlib.sha1(f"{page_size}|{first_page.total_pages}|{first_page.total_count}".encode("utf-8"))
+        for asset in first_page.assets:
+            digest.update(f"\n{asset.asset_id}\t{asset.relative_path}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _set_catalogue(self, uuid_to_path: Dict[str, str], token: str | None) -> None:
+        self._uuid_to_path = uuid_to_path
+        self._path_to_uuid = {path: uuid for uuid, path in uuid_to_path.items()}
+        self._token = token
+        self._schedule_search_index()
+
+    async def _load_catalogue(self) -> bool:
+        if self._catalogue_path is None:
+            return False
+        data = await asyncio.get_running_loop().run_in_executor(None, self._read_catalogue_file)
+        if data is None:
+            return False
+        self._saved_at = data["saved_at"]
+        self._set_catalogue(dict(data["items"]), data["token"])
+        return bool(self._uuid_to_path)
 
-            page_index += 1
-            if page_index >= total_pages:
-                break
+    def _read_catalogue_file(self) -> Optional[Dict]:
+        try:
+            data = json.loads(self._catalogue_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != TEXTURE_CATALOGUE_VERSION:
+            return None
+        if not isinstance(data.get("items"), list) or not isinstance(data.get("token"), str):
+            return None
+        data.setdefault("saved_at", 0.0)
+        return data
+
+    async def _save_catalogue(self) -> None:
+        if self._catalogue_path is None:
+            return
+        self._saved_at = time.time()
+        data = {
+            "version": TEXTURE_CATALOGUE_VERSION,
+            "token": self._token,
+            "saved_at": self._saved_at,
+            "items": list(self._uuid_to_path.items()),
+        }
+        await asyncio.get_running_loop().run_in_executor(None, self._write_catalogue_file, data)
+
+    def _write_catalogue_file(self, data: Dict) -> None:
+        path = self._catalogue_path
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with temp_path.open("w", encoding="utf-8") as fp:
+                json.dump(data, fp, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logger.warning("写入纹理目录缓存失败 %s: %s", path, exc)
+            temp_path.unlink(missing_ok=True)
+
+    def _schedule_search_index(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._index_task is not None:
+            self._index_task.cancel()
+        self._index_task = loop.create_task(self._build_search_index(self._uuid_to_path))
+
+    async def _build_search_index(self, source: Dict[str, str]) -> None:
+        from orcalab.trigram_index import TrigramIndex
+
+        items = list(source.items())
+        index = await asyncio.get_running_loop().run_in_executor(
+            None, TrigramIndex, [path for _, path in items]
+        )
+        if self._uuid_to_path is source:
+            self._search_index, self._search_source, self._search_items = index, source, items
 
     def search(self, keyword: str) -> list[Tuple[str, str]]:
         if not keyword:
             return self.get_all_items()
 
+        if (
+            self._search_index is not None
+            and self._search_source is self._uuid_to_path
+            and len(self._search_items) == len(self._uuid_to_path)
+        ):
+            items = self._search_items
+            return [items[i] for i in self._search_index.search(keyword)]
+
         keyword_lower = keyword.lower()
         results: list[Tuple[str, str]] = []
         for uuid_str, path in self._uuid_to_path.items():
@@ -1,9 +1,15 @@
 import re
 import numpy as np
-from scipy.spatial.transform import Rotation
 import math
 
 
+def _rotation_from_quat(quat):
+    # scipy 导入较慢，首次用到旋转时再加载
+    from scipy.spatial.transform import Rotation
+
+    return Rotation.from_quat(quat, scalar_first=True)
+
+
 class Transform:
     """
     Represents a 3D transformation including position, rotation (as a quaternion), and uniform scale.
@@ -106,7 +112,7 @@ class Transform:
         scaled_point = point * self.scale
 
         # Rotate
-        r = Rotation.from_quat(self.rotation, scalar_first=True)
+        r = _rotation_from_quat(self.rotation)
         rotated_point = r.apply(scaled_point)
 
         # Translate
@@ -124,7 +130,7 @@ class Transform:
         scaled_vector = vector * self.scale
 
         # Rotate
-        r = Rotation.from_quat(self.rotation, scalar_first=True)
+        r = _rotation_from_quat(self.rotation)
         rotated_vector = r.apply(scaled_vector)
 
         return rotated_vector
@@ -136,7 +142,7 @@ class Transform:
             raise TypeError("direction must be a numpy array of shape (3,).")
 
         # Rotate
-        r = Rotation.from_quat(self.rotation, scalar_first=True)
+        r = _rotation_from_quat(self.rotation)
         rotated_direction = r.apply(direction)
 
         return rotated_direction
@@ -151,8 +157,8 @@ class Transform:
         combined_scale = self.scale * other.scale
 
         # Combined rotation
-        r1 = Rotation.from_quat(self.rotation, scalar_first=True)
-        r2 = Rotation.from_quat(other.rotation, scalar_first=True)
+        r1 = _rotation_from_quat(self.rotation)
+        r2 = _rotation_from_quat(other.rotation)
         combined_rotation = (r1 * r2).as_quat(scalar_first=True)
 
         # Combined position
@@ -173,7 +179,7 @@ class Transform:
             [self.rotation[0], -self.rotation[1], -self.rotation[2], -self.rotation[3]]
         )
 
-        inv_r = Rotation.from_quat(inv_rotation, scalar_first=True)
+        inv_r = _rotation_from_quat(inv_rotation)
         inv_position = -inv_scale * inv_r.apply(self.position)
 
         return Transform(position=inv_position, rotation=inv_rotation, scale=inv_scale)
@@ -334,6 +340,8 @@ def as_euler(quat, seq, degrees=False, scalar_first=True) -> np.ndarray:
 
 
 if __name__ == "__main__":
+    from scipy.spatial.transform import Rotation
+
     q = np.array([1, 0, 0, 0], dtype=np.float64)
     r = Rotation.from_quat(q, scalar_first=True)
     angles = r.as_euler("xyz", degrees=True)
@@ -0,0 +1,78 @@
+"""
+三元组子串索引
+
+对一组字符串（小写化、UTF-8 编码后）的每个三字节片段建立倒排表。查询时取关键字
+各三元组倒排表的交集作为候选，再逐个做子串校验，结果与线性扫描 ``keyword in text``
+完全一致。不足三字节的关键字退化为对预先小写化的文本做线性扫描。
+
+构建使用 numpy 向量化（排序期间释放 GIL），可以放到工作线程中执行。
+"""
+
+from typing import List, Sequence
+
+
+class TrigramIndex:
+    def __init__(self, texts: Sequence[str]):
+        import numpy as np
+
+        self._texts: List[str] = [text.lower() for text in texts]
+        encoded = [text.encode("utf-8") for text in self._texts]
+        if not encoded:
+            self._keys = np.zeros(0, dtype=np.uint32)
+            self._starts = np.zeros(1, dtype=np.int64)
+            self._postings = np.zeros(0, dtype=np.uint32)
+            return
+
+        # 以 \n 分隔拼接；跨越分隔符的三元组不会被任何关键字用到
+        lengths = np.fromiter((len(b) + 1 for b in encoded), dtype=np.int64, count=len(encoded))
+        buf = np.frombuffer(b"\n".join(encoded) + b"\n", dtype=np.uint8).astype(np.uint32)
+        rows = np.repeat(np.arange(len(encoded), dtype=np.uint32), lengths)
+        if len(buf) < 3:
+            codes = np.zeros(0, dtype=np.uint32)
+            rows = rows[:0]
+        else:
+            codes = (buf[:-2] << 16) | (buf[1:-1] << 8) | buf[2:]
+            rows = rows[:-2]
+
+        # 稳定排序后同一三元组内的行号保持升序，再去掉行内重复
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        rows = rows[order]
+        keep = np.ones(len(codes), dtype=bool)
+        keep[1:] = (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])
+        codes = codes[keep]
+        self._postings = rows[keep]
+
+        bounds = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.zeros(0, dtype=np.int64)
+        self._keys = codes[bounds]
+        self._starts = np.append(bounds, len(codes))
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def search(self, keyword: str) -> List[int]:
+        """返回包含 keyword（不区分大小写）的文本下标，升序"""
+        import numpy as np
+
+        keyword = keyword.lower()
+        texts = self._texts
+        data = keyword.encode("utf-8")
+        if len(data) < 3:
+            return [i for i, text in enumerate(texts) if keyword in text]
+
+        key_bytes = np.frombuffer(data, dtype=np.uint8).astype(np.uint32)
+        grams = set(((key_bytes[:-2] << 16) | (key_bytes[1:-1] << 8) | key_bytes[2:]).tolist())
+        postings = []
+        for gram in grams:
+            k = int(np.searchsorted(self._keys, gram))
+            if k >= len(self._keys) or self._keys[k] != gram:
+                return []
+            postings.append(self._postings[self._starts[k]:self._starts[k + 1]])
+
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if len(candidates) == 0:
+                return []
+        return [i for i in candidates.tolist() if keyword in texts[i]]
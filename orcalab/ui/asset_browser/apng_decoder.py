@@ -0,0 +1,123 @@
+"""
+APNG 缩略图后台解码
+
+资产浏览器中的缩略图只以 96x96 显示，但 APNG 原图是渲染输出的大尺寸帧。
+解码放到线程池中进行（Pillow 解码与缩放期间会释放 GIL），每帧解码后立即缩放到
+显示尺寸，只有缩放后的 QImage 回到 UI 线程；列表中默认只解码第一帧，悬停 / 选中
+播放时再解码全部帧。
+
+解码结果同时写入按显示尺寸预缩放的精灵磁盘缓存（见 thumbnail_sprite_cache），
+再次打开浏览器时直接映射，不再解码原图。
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from PySide6 import QtGui
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DECODE_MAX_WORKERS = 4
+THUMBNAIL_SPRITE_FOLDER = "thumbnail_sprites"
+DEFAULT_FRAME_DELAY_MS = 100
+
+
+@dataclass
+class DecodedApng:
+    frames: List[QtGui.QImage] = field(default_factory=list)
+    delays: List[int] = field(default_factory=list)
+    # 文件中的总帧数；只解码第一帧时 frames 少于 frame_count
+    frame_count: int = 0
+
+    @property
+    def complete(self) -> bool:
+        return len(self.frames) >= self.frame_count
+
+
+def _to_qimage(frame, size: int) -> QtGui.QImage:
+    frame = frame.convert("RGBA")
+    if size > 0 and (frame.width > size or frame.height > size):
+        # reducing_gap 先做整数倍 box 缩小再精细缩放，比直接从原图重采样快得多
+        frame.thumbnail((size, size), reducing_gap=2.0)
+    data = frame.tobytes("raw", "RGBA")
+    image = QtGui.QImage(data, frame.width, frame.height, QtGui.QImage.Format.Format_RGBA8888)
+    # QImage 不持有 data，复制一份后 bytes 可以释放
+    return image.copy()
+
+
+def decode_apng(file_path: str, size: int, first_frame_only: bool = False) -> DecodedApng:
+    """解码 APNG（或普通 PNG）并缩放到不超过 size x size（保持宽高比）；可在任意线程调用"""
+    from PIL import Image
+
+    result = DecodedApng()
+    with Image.open(file_path) as pil_img:
+        result.frame_count = getattr(pil_img, "n_frames", 1)
+        count = 1 if first_frame_only else result.frame_count
+        for i in range(count):
+            pil_img.seek(i)
+            result.frames.append(_to_qimage(pil_img, size))
+            result.delays.append(pil_img.info.get("duration", DEFAULT_FRAME_DELAY_MS))
+    return result
+
+
+class ThumbnailDecodePool:
+    """缩略图解码线程池；相同文件、尺寸的请求在途时共享结果"""
+
+    def __init__(self, max_workers: int = THUMBNAIL_DECODE_MAX_WORKERS, sprite_cache=None):
+        workers = max(1, min(max_workers, os.cpu_count() or 1))
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orcalab-thumbnail")
+        self._inflight: Dict[Tuple[str, int, bool], asyncio.Future] = {}
+        # ThumbnailSpriteCache 或 None
+        self._sprite_cache = sprite_cache
+
+    @property
+    def sprite_cache(self):
+        return self._sprite_cache
+
+    def _decode(self, file_path: str, size: int, first_frame_only: bool) -> DecodedApng:
+        """工作线程中执行：先查精灵缓存，未命中时解码原图并写回"""
+        if self._sprite_cache is not None:
+            cached = self._sprite_cache.load(file_path, size, first_frame_only)
+            if cached is not None:
+                return cached
+        decoded = decode_apng(file_path, size, first_frame_only)
+        if self._sprite_cache is not None:
+            self._sprite_cache.store(file_path, size, decoded)
+        return decoded
+
+    async def decode(self, file_path: str, size: int, first_frame_only: bool = False) -> Optional[DecodedApng]:
+        """在线程池中解码；在事件循环（UI 线程）中 await，失败时返回 None"""
+        key = (file_path, size, first_frame_only)
+        future = self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, self._decode, file_path, size, first_frame_only)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("解码缩略图失败 %s: %s", file_path, e)
+            return None
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: Optional[ThumbnailDecodePool] = None
+
+
+def get_thumbnail_decode_pool() -> ThumbnailDecodePool:
+    global _pool
+    if _pool is None:
+        from orcalab.project_util import get_cache_folder
+        from orcalab.ui.asset_browser.thumbnail_sprite_cache import ThumbnailSpriteCache
+
+        _pool = ThumbnailDecodePool(sprite_cache=ThumbnailSpriteCache(get_cache_folder() / THUMBNAIL_SPRITE_FOLDER))
+    return _pool
@@ -1,7 +1,9 @@
 """
 APNG 播放器 - 用于在 Qt 中播放 APNG 动画
 
-由于 Qt 默认不支持 APNG，这个类使用 Python 的 apng 库手动解码帧
+由于 Qt 默认不支持 APNG，这个类使用 Python 的 apng 库手动解码帧。
+资产浏览器通过 from_decoded 用后台解码的结果创建播放器（见 apng_decoder），
+初始只有第一帧；开始播放时发出 frames_requested，由调用方补齐全部帧。
 """
 
 from typing import List
@@ -9,13 +11,17 @@ from PySide6 import QtCore, QtGui
 from pathlib import Path
 import io
 
+from orcalab.ui.asset_browser.apng_decoder import DecodedApng
+
 
 class ApngPlayer(QtCore.QObject):
     """APNG 动画播放器"""
     
     frame_changed = QtCore.Signal()
+    # 只加载了部分帧时，开始播放会请求加载全部帧
+    frames_requested = QtCore.Signal()
     
-    def __init__(self, file_path: str, parent=None):
+    def __init__(self, file_path: str, parent=None, load: bool = True):
         super().__init__(parent)
         
         self.file_path = file_path
@@ -23,11 +29,29 @@ class ApngPlayer(QtCore.QObject):
         self.delays: List[int] = []  # 毫秒
         self.current_frame = 0
         self.is_playing = False
+        self.is_complete = True
         
         self._timer = QtCore.QTimer(self)
         self._timer.timeout.connect(self._next_frame)
         
-        self._load_apng()
+        if load:
+            self._load_apng()
+
+    @classmethod
+    def from_decoded(cls, file_path: str, decoded: DecodedApng, parent=None) -> "ApngPlayer":
+        player = cls(file_path, parent, load=False)
+        player.set_frames(decoded)
+        return player
+
+    def set_frames(self, decoded: DecodedApng):
+        """替换帧数据（例如补齐全部帧）；正在播放时从当前帧继续"""
+        self.frames = list(decoded.frames)
+        self.delays = list(decoded.delays)
+        self.is_complete = decoded.complete
+        if self.current_frame >= len(self.frames):
+            self.current_frame = 0
+        if self.is_playing and self.is_complete:
+            self._schedule_next_frame()
     
     def _load_apng(self):
         """加载 APNG 文件（使用 Pillow）"""
@@ -72,6 +96,19 @@ class ApngPlayer(QtCore.QObject):
     
     def frame_count(self) -> int:
         return len(self.frames)
+
+    def frame_bytes(self) -> int:
+        return sum(frame.sizeInBytes() for frame in self.frames)
+
+    def release_animation_frames(self) -> bool:
+        """只保留第一帧以释放内存，下次播放时重新请求全部帧；返回是否释放了帧"""
+        if self.is_playing or len(self.frames) <= 1:
+            return False
+        self.frames = self.frames[:1]
+        self.delays = self.delays[:1]
+        self.current_frame = 0
+        self.is_complete = False
+        return True
     
     def is_valid(self) -> bool:
         return len(self.frames) > 0
@@ -90,6 +127,9 @@ class ApngPlayer(QtCore.QObject):
         
         self.is_playing = True
         self.current_frame = 0
+        if not self.is_complete:
+            self.frames_requested.emit()
+            return
         self._schedule_next_frame()
     
     def stop(self):
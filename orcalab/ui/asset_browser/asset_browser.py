@@ -4,7 +4,7 @@ import os
 import shutil
 import time
 import webbrowser
-from typing import List, Tuple
+from typing import Dict, List
 from typing_extensions import override
 from PySide6 import QtCore, QtWidgets, QtGui
 from PySide6.QtCore import Qt
@@ -18,9 +18,12 @@ from orcalab.ui.asset_browser.asset_model import AssetModel
 from orcalab.ui.asset_browser.asset_info_view import AssetInfoView
 from orcalab.ui.asset_browser.asset_tree_view import AssetTreeView
 from orcalab.ui.asset_browser.apng_player import ApngPlayer
+from orcalab.ui.asset_browser.apng_decoder import get_thumbnail_decode_pool
+from orcalab.ui.asset_browser.thumbnail_cache import ThumbnailCacheStats, ThumbnailFrameCache
 from orcalab.metadata_service import MetadataService
 from orcalab.ui.asset_browser.thumbnail_render_bus import ThumbnailRenderRequestBus
 from orcalab.ui.asset_browser.thumbnail_render_service import ThumbnailRenderService
+from orcalab.ui.image_process_pool import get_image_process_pool
 from orcalab.http_service.http_service import HttpService
 from orcalab.project_util import get_cache_folder
 from orcalab.config_service import ConfigService
@@ -41,12 +44,26 @@ class AssetBrowser(QtWidgets.QWidget):
         self._http_service = HttpService()
         self._config_service = ConfigService()
         self._loading_thumbnails = set()
+        self._decode_pool = get_thumbnail_decode_pool()
+        self._thumbnail_cache = ThumbnailFrameCache(self._config_service.thumbnail_cache_budget_mb() * 1024 * 1024)
+        # 缩略图文件路径 -> 持有该播放器的资产，淘汰时据此丢弃播放器
+        self._infos_by_thumbnail: Dict[str, AssetInfo] = {}
         self._model_connected = False
+        self._asset_count = 0
+        self._sync_message = ""
+        self._uploads_resumed = False
         self.is_admin = self._http_service.is_admin()
         self._can_render_thumbnail = self._check_can_render_thumbnail()
         self._setup_ui()
         self._setup_connections()
 
+    async def shutdown(self):
+        """关闭 HTTP 连接池与响应缓存，停止缩略图解码和图片处理子进程"""
+        self._decode_pool.shutdown()
+        # 程序最后以 os._exit 退出，进程池的 atexit 不会执行，这里等待子进程退出
+        await asyncio.to_thread(get_image_process_pool().shutdown, True)
+        await self._http_service.close()
+
     def _check_can_render_thumbnail(self) -> bool:
         if not self.is_admin:
             return False
@@ -178,6 +195,7 @@ class AssetBrowser(QtWidgets.QWidget):
 
         self._view = AssetView()
         self._model = AssetModel()
+        self._model.thumbnail_cache = self._thumbnail_cache
         self._view.set_model(self._model)
         self._view.set_loading_text("正在加载资产缩略图...")
 
@@ -258,13 +276,21 @@ class AssetBrowser(QtWidgets.QWidget):
         self._view._scroll_bar.setValue(0)
 
     async def set_assets(self, assets: List[str]):
+        if not self._uploads_resumed:
+            # 上次运行未上传完的缩略图在后台继续上传
+            self._uploads_resumed = True
+            self._http_service.resume_uploads()
         if self._can_render_thumbnail:
             self.create_panorama_apng_button.setDisabled(True)
         infos = []
-        thumbnail_cache_path = get_cache_folder() / "thumbnail"
+        # 保留仍在列表中的资产已加载的缩略图
+        previous_players = {
+            info.path: info.apng_player for info in self._model.get_all_assets() if info.apng_player is not None
+        }
+        reused = set()
         exclude_assets = ['prefabs/mujococamera1080', 'prefabs/mujococamera256', 'prefabs/mujococamera512', 'prefabs/agentcamera']
         
-        # 只检查本地缓存，不从服务器下载
+        # 缩略图不在这里解码：可见项通过 request_load_thumbnail 按需在后台解码
         for asset in assets:
             info = AssetInfo()
             info.name = asset.split("/")[-1]
@@ -272,17 +298,16 @@ class AssetBrowser(QtWidgets.QWidget):
             if info.path in exclude_assets:
                 continue
             info.metadata = self._metadata_service.get_asset_info(asset)
-
-            # 检查本地缓存，如果已下载则直接加载
-            thumbnail_path = thumbnail_cache_path / (asset + "_panorama.apng")
-            if thumbnail_path.exists():
-                player = ApngPlayer(str(thumbnail_path))
-                if player.is_valid():
-                    player.set_scaled_size(QtCore.QSize(96, 96))
-                    info.apng_player = player
-
+            info.apng_player = previous_players.get(asset)
+            if info.apng_player is not None:
+                self._infos_by_thumbnail[info.apng_player.file_path] = info
+                reused.add(info.apng_player.file_path)
             infos.append(info)
 
+        for key in [k for k in self._infos_by_thumbnail if k not in reused]:
+            del self._infos_by_thumbnail[key]
+            self._thumbnail_cache.remove(key)
+
         self._view.set_loading_text(None)
         self._model.set_assets(infos)
 
@@ -295,12 +320,31 @@ class AssetBrowser(QtWidgets.QWidget):
         if self._can_render_thumbnail:
             self.create_panorama_apng_button.setText("渲染缩略图")
             self.create_panorama_apng_button.setDisabled(False)
-        self.status_label.setText(f"{len(infos)} assets")
+        self._asset_count = len(infos)
+        self._update_status_label()
 
         # 主动触发一次可见项更新，加载初始可见的缩略图
         await asyncio.sleep(0.05)
         self._trigger_initial_thumbnail_load()
 
+    async def on_packages_mounted(self, assets: List[str], package_paths: List[str]):
+        """后台同步热加载了新的资产包：重新读取元数据并刷新资产列表"""
+        self._metadata_service.reload_metadata()
+        await self.set_assets(assets)
+        if package_paths:
+            self.status_label.setToolTip("\n".join(os.path.basename(path) for path in package_paths))
+            self.show_sync_message(f"已加载 {len(package_paths)} 个新资产包")
+
+    def show_sync_message(self, message: str):
+        self._sync_message = message
+        self._update_status_label()
+
+    def _update_status_label(self):
+        text = f"{self._asset_count} assets"
+        if self._sync_message:
+            text = f"{text} · {self._sync_message}"
+        self.status_label.setText(text)
+
     def _on_include_filter_changed(self, text: str):
         self._model.include_filter = text
         self._model.apply_filters()
@@ -321,39 +365,81 @@ class AssetBrowser(QtWidgets.QWidget):
         """触发初始可见项的缩略图加载"""
         for item in self._view.visible_items:
             info = self._model.info_at(item.index)
-            if info.apng_player is None and info.metadata is not None:
+            if info.apng_player is None:
                 if info.path not in self._loading_thumbnails:
                     self.request_load_thumbnail.emit(item.index)
 
+    async def _create_player(self, info: AssetInfo, thumbnail_path) -> ApngPlayer | None:
+        """在后台线程解码第一帧（缩放到显示尺寸）并创建播放器；播放时再补齐全部帧"""
+        self._thumbnail_cache.record_miss()
+        key = str(thumbnail_path)
+        decoded = await self._decode_pool.decode(key, self._view.cell_image_size, first_frame_only=True)
+        if decoded is None or not decoded.frames:
+            return None
+        player = ApngPlayer.from_decoded(key, decoded)
+        player.frames_requested.connect(lambda: asyncio.create_task(self._load_all_frames(player)))
+        self._infos_by_thumbnail[key] = info
+        self._thumbnail_cache.add(key, player, lambda: self._on_thumbnail_evicted(key))
+        return player
+
+    async def _load_all_frames(self, player: ApngPlayer):
+        if player.is_complete:
+            return
+        decoded = await self._decode_pool.decode(player.file_path, self._view.cell_image_size)
+        if decoded is not None and decoded.frames:
+            player.set_frames(decoded)
+            self._thumbnail_cache.update(player.file_path)
+
+    def _on_thumbnail_evicted(self, key: str):
+        """缓存淘汰：丢弃播放器，再次可见时 movie_at 会重新请求加载"""
+        info = self._infos_by_thumbnail.pop(key, None)
+        if info is not None and info.apng_player is not None:
+            info.apng_player.stop()
+            info.apng_player = None
+
+    def _drop_player(self, info: AssetInfo):
+        player = info.apng_player
+        if player is None:
+            return
+        info.apng_player = None
+        player.stop()
+        self._thumbnail_cache.remove(player.file_path)
+        self._infos_by_thumbnail.pop(player.file_path, None)
+
+    def thumbnail_cache_stats(self) -> ThumbnailCacheStats:
+        return self._thumbnail_cache.stats()
+
+    def clear_thumbnail_cache(self):
+        self._thumbnail_cache.clear()
+        self._view.update()
+
     async def _load_thumbnail_for_index(self, index: int):
-        """按需加载指定索引的缩略图"""
+        """按需加载指定索引的缩略图：优先解码本地缓存，没有时再下载"""
         try:
             info = self._model.info_at(index)
             if info.apng_player is not None:
                 return
 
-            if info.metadata is None:
-                return
-
-            # 避免重复下载
+            # 避免重复解码 / 下载
             if info.path in self._loading_thumbnails:
                 return
 
             thumbnail_cache_path = get_cache_folder() / "thumbnail"
             thumbnail_path = thumbnail_cache_path / (info.path + "_panorama.apng")
 
-            if thumbnail_path.exists():
-                player = ApngPlayer(str(thumbnail_path))
-                if player.is_valid():
-                    player.set_scaled_size(QtCore.QSize(96, 96))
-                    info.apng_player = player
-                    self._model.notify_item_updated(index)
+            if not thumbnail_path.exists() and info.metadata is None:
                 return
 
             # 标记为正在加载
             self._loading_thumbnails.add(info.path)
 
             try:
+                if thumbnail_path.exists():
+                    info.apng_player = await self._create_player(info, thumbnail_path)
+                    if info.apng_player is not None:
+                        self._model.notify_item_updated(index)
+                    return
+
                 asset_id = info.metadata.get('id') if info.metadata else None
                 if not asset_id:
                     return
@@ -368,10 +454,8 @@ class AssetBrowser(QtWidgets.QWidget):
                         await self._http_service.get_asset_thumbnail2cache(picture_url['imgUrl'], thumbnail_path)
 
                         if thumbnail_path.exists():
-                            player = ApngPlayer(str(thumbnail_path))
-                            if player.is_valid():
-                                player.set_scaled_size(QtCore.QSize(96, 96))
-                                info.apng_player = player
+                            info.apng_player = await self._create_player(info, thumbnail_path)
+                            if info.apng_player is not None:
                                 self._model.notify_item_updated(index)
                                 load_result = True
                         break
@@ -379,14 +463,12 @@ class AssetBrowser(QtWidgets.QWidget):
                     if image_url.get('imgUrl', None) is not None:
                         await self._http_service.get_asset_thumbnail2cache(image_url['imgUrl'], thumbnail_path)
                         if thumbnail_path.exists():
-                            player = ApngPlayer(str(thumbnail_path))
-                            if player.is_valid():
-                                player.set_scaled_size(QtCore.QSize(96, 96))
-                                info.apng_player = player
+                            info.apng_player = await self._create_player(info, thumbnail_path)
+                            if info.apng_player is not None:
                                 self._model.notify_item_updated(index)
                                 load_result = True
             finally:
-                # 下载完成，移除标记
+                # 加载完成，移除标记
                 self._loading_thumbnails.discard(info.path)
 
         except Exception as e:
@@ -461,17 +543,23 @@ class AssetBrowser(QtWidgets.QWidget):
             return
         self.create_panorama_apng_button.setText("加载中...")
         self.create_panorama_apng_button.setDisabled(True)
-        await self._http_service.wait_for_upload_finished()
+
+        def on_progress(progress):
+            self.create_panorama_apng_button.setText(f"上传中 {progress.uploaded + progress.failed}/{progress.total}")
+
+        progress = await self._http_service.wait_for_upload_finished(on_progress)
+        if progress.failed:
+            logger.warning("%d 个缩略图上传失败", progress.failed)
+        self.create_panorama_apng_button.setText("加载中...")
         await self._on_upload_thumbnail_finished(asset_paths)
 
     async def _on_upload_thumbnail_finished(self, asset_paths: List[str]):
         tmp_path = os.path.join(os.path.expanduser("~"), ".orcalab", "tmp")
-        subscription_metadata = await self._http_service.get_subscription_metadata()
+        subscription_metadata = await self._http_service.fetch_subscription_metadata()
         if subscription_metadata is None:
             self.create_panorama_apng_button.setText("渲染缩略图")
             self.create_panorama_apng_button.setDisabled(False)
             return
-        subscription_metadata = json.loads(subscription_metadata)
         with open(os.path.join(get_cache_folder(), "metadata.json"), "w", encoding="utf-8") as f:
             json.dump(subscription_metadata, f, ensure_ascii=False, indent=2)
 
@@ -481,7 +569,6 @@ class AssetBrowser(QtWidgets.QWidget):
         # 预处理：拷贝本地缩略图，收集需要下载的任务
         new_assets : List[AssetInfo] = []
         download_tasks = []
-        download_info : List[Tuple[int, str]] = []  # (asset_index, cache_path)
 
         for asset in all_assets:
             new_assets.append(asset)
@@ -498,10 +585,8 @@ class AssetBrowser(QtWidgets.QWidget):
                     except Exception as e:
                         logger.error(f"failed to copy {tmp_thumbnail_path} to {cache_thumbnail_path}: {e}")
                         continue
-                    player = ApngPlayer(str(cache_thumbnail_path))
-                    if player.is_valid():
-                        player.set_scaled_size(QtCore.QSize(96, 96))
-                        asset.apng_player = player
+                    # 丢弃旧的播放器，可见时按需重新解码
+                    self._drop_player(asset)
 
             elif (asset.metadata is not None) and (not os.path.exists(cache_thumbnail_path)):
                 # 更新不再本次渲染中，并且之前不存在的资产
@@ -515,7 +600,6 @@ class AssetBrowser(QtWidgets.QWidget):
                         download_tasks.append(
                             self._http_service.get_asset_thumbnail2cache(picture_url['imgUrl'], cache_thumbnail_path)
                         )
-                        download_info.append((len(new_assets) - 1, cache_thumbnail_path))
                         break
 
         # 并行下载所有缩略图
@@ -524,16 +608,6 @@ class AssetBrowser(QtWidgets.QWidget):
             await asyncio.gather(*download_tasks, return_exceptions=True)
             logger.info(f"Downloaded {len(download_tasks)} thumbnails in {time.monotonic() - start_time:.2f} seconds")
 
-            # 为下载成功的资产创建播放器
-            start_time = time.monotonic()
-            for asset_idx, cache_path in download_info:
-                if os.path.exists(cache_path):
-                    player = ApngPlayer(str(cache_path))
-                    if player.is_valid():
-                        player.set_scaled_size(QtCore.QSize(96, 96))
-                        new_assets[asset_idx].apng_player = player
-            logger.info(f"Created players for {len(download_info)} assets in {time.monotonic() - start_time:.2f} seconds")
-
         self._model.set_assets(new_assets)
         self._tree_view.set_assets(new_assets)
 
@@ -1,14 +1,19 @@
-from typing import List
+from typing import Dict, List, Set
 from typing_extensions import override
 from PySide6 import QtCore, QtWidgets, QtGui
 import logging
 
 from orcalab.ui.asset_browser.asset_info import AssetInfo
+from orcalab.ui.asset_browser.asset_search_index import AssetSearchIndex
 from orcalab.ui.asset_browser.thumbnail_model import ThumbnailModel
 from orcalab.ui.asset_browser.apng_player import ApngPlayer
+from orcalab.ui.asset_browser.thumbnail_cache import ThumbnailFrameCache
 
 logger = logging.getLogger(__name__)
 
+# 每个分类下保留的 include 关键字结果数，用于退格时直接复用
+MAX_CACHED_SEARCHES = 32
+
 
 class AssetModel(ThumbnailModel):
     
@@ -22,6 +27,16 @@ class AssetModel(ThumbnailModel):
         self.include_filter = ""
         self.exclude_filter = ""
         self.category_filter : str = ""
+        self.thumbnail_cache: ThumbnailFrameCache | None = None
+
+        # 过滤均在下标上进行，结果按关键字缓存，输入更多字符时在上次结果中继续过滤
+        self._index = AssetSearchIndex([])
+        self._category_key: str | None = None
+        self._category_result: List[int] = []
+        self._include_results: Dict[str, List[int]] = {}
+        self._exclude_base: List[int] | None = None
+        self._exclude_key = ""
+        self._exclude_matched: List[int] = []
 
     @override
     def size(self) -> int:
@@ -42,11 +57,19 @@ class AssetModel(ThumbnailModel):
             return None
         
         info = self._filtered_assets[index]
-        if info.apng_player is None and info.metadata is not None:
+        if info.apng_player is None:
+            # 本地缓存的缩略图也按需加载，没有元数据的资产同样可能有缓存
             self.request_load_thumbnail.emit(index)
+        elif self.thumbnail_cache is not None:
+            self.thumbnail_cache.record_hit(info.apng_player.file_path)
         
         return info.apng_player
 
+    @override
+    def set_movie_visible(self, movie, visible: bool) -> None:
+        if self.thumbnail_cache is not None and isinstance(movie, ApngPlayer):
+            self.thumbnail_cache.set_visible(movie.file_path, visible)
+
 
     @override
     def text_at(self, index: int) -> str:
@@ -61,14 +84,19 @@ class AssetModel(ThumbnailModel):
 
     def set_assets(self, asset_list: List[AssetInfo]) -> None:
         self._all_assets = asset_list
+        self._index = AssetSearchIndex(asset_list)
+        self._category_key = None
         self.apply_filters()
 
     def apply_filters(self):
         try:
-            list1 = self._apply_category_filter(self._all_assets)
-            list2 = self._apply_include_filter(list1)
-            list3 = self._apply_exclude_filter(list2)
-            self._filtered_assets = list3
+            if self.category_filter != self._category_key:
+                self._category_key = self.category_filter
+                self._category_result = self._index.category(self.category_filter)
+                self._include_results = {}
+            included = self._apply_include_filter(self.include_filter.lower())
+            result = self._apply_exclude_filter(included, self.exclude_filter.lower())
+            self._filtered_assets = [self._all_assets[i] for i in result]
             self.data_updated.emit()
         except Exception as e:
             logger.error("[搜索诊断] apply_filters 异常: %s, include=%r, exclude=%r, category=%r",
@@ -81,43 +109,36 @@ class AssetModel(ThumbnailModel):
     
     def notify_item_updated(self, index: int) -> None:
         self.item_updated.emit(index)
-    
-    def _apply_category_filter(self, input: List[AssetInfo]):
-        if self.category_filter == "":
-            return input
-
-        result: List[AssetInfo] = []
-        for asset in input:
-            if asset.metadata is not None:
-                category_path = asset.metadata.get('categoryPath', '')
-                if isinstance(category_path, str) and category_path.startswith(self.category_filter):
-                    result.append(asset)
-            else:
-                if self.category_filter == "/other":
-                    result.append(asset)
+
+    def _apply_include_filter(self, keyword: str) -> List[int]:
+        if not keyword:
+            return self._category_result
+        cached = self._include_results.get(keyword)
+        if cached is not None:
+            return cached
+
+        # 包含已搜索过的关键字时，结果必然是其子集，从最小的那个开始过滤
+        base = self._category_result
+        for key, previous in self._include_results.items():
+            if key in keyword and len(previous) < len(base):
+                base = previous
+        result = self._index.search(base, keyword)
+
+        if len(self._include_results) >= MAX_CACHED_SEARCHES:
+            self._include_results.pop(next(iter(self._include_results)))
+        self._include_results[keyword] = result
         return result
 
-    def _matches_filter(self, asset: AssetInfo, keyword: str) -> bool:
-        if keyword in asset.name.lower():
-            return True
-        if asset.metadata is None:
-            return False
-        english_name = asset.metadata.get('englishName', '')
-        name = asset.metadata.get('name', '')
-        if isinstance(english_name, str) and keyword in english_name.lower():
-            return True
-        if isinstance(name, str) and keyword in name:
-            return True
-        return False
-
-    def _apply_include_filter(self, input: List[AssetInfo]):
-        if not self.include_filter:
-            return input
-        keyword = self.include_filter.lower()
-        return [a for a in input if self._matches_filter(a, keyword)]
-
-    def _apply_exclude_filter(self, input: List[AssetInfo]):
-        if not self.exclude_filter:
-            return input
-        keyword = self.exclude_filter.lower()
-        return [a for a in input if not self._matches_filter(a, keyword)]
+    def _apply_exclude_filter(self, included: List[int], keyword: str) -> List[int]:
+        if not keyword:
+            return included
+        if included is self._exclude_base and self._exclude_key and self._exclude_key in keyword:
+            # 关键字变长，命中（被排除）的资产只会减少
+            matched = self._index.search(self._exclude_matched, keyword)
+        else:
+            matched = self._index.search(included, keyword)
+        self._exclude_base, self._exclude_key, self._exclude_matched = included, keyword, matched
+        if not matched:
+            return included
+        excluded: Set[int] = set(matched)
+        return [i for i in included if i not in excluded]
@@ -0,0 +1,77 @@
+"""
+资产搜索索引
+
+AssetModel 每次输入都要过滤全部资产。这里在 set_assets 时预先计算一次：
+
+- 每个资产的搜索文本：小写的文件名、小写的 englishName 和原样的 name，用 \\0 分隔，
+  一次子串查找即可覆盖三个字段（关键字不会跨字段匹配）
+- 分类前缀桶：按 categoryPath 排序的去重路径，前缀查询用二分定位，不必扫描全部资产
+
+搜索结果都是资产下标列表（保持原顺序），调用方可以在上一次结果上继续缩小范围。
+"""
+
+import bisect
+from typing import Dict, List, Sequence
+
+from orcalab.ui.asset_browser.asset_info import AssetInfo
+
+# 没有元数据的资产只出现在这个分类下
+OTHER_CATEGORY = "/other"
+_FIELD_SEPARATOR = "\0"
+
+
+def _search_text(asset: AssetInfo) -> str:
+    fields = [asset.name.lower()]
+    if asset.metadata is not None:
+        english_name = asset.metadata.get('englishName', '')
+        name = asset.metadata.get('name', '')
+        if isinstance(english_name, str):
+            fields.append(english_name.lower())
+        # name 多为中文，保持与原过滤逻辑一致，不做小写转换
+        if isinstance(name, str):
+            fields.append(name)
+    return _FIELD_SEPARATOR.join(fields)
+
+
+class AssetSearchIndex:
+    def __init__(self, assets: Sequence[AssetInfo]):
+        self._texts: List[str] = [_search_text(asset) for asset in assets]
+        self._all: List[int] = list(range(len(assets)))
+
+        buckets: Dict[str, List[int]] = {}
+        self._no_metadata: List[int] = []
+        for i, asset in enumerate(assets):
+            if asset.metadata is None:
+                self._no_metadata.append(i)
+                continue
+            category_path = asset.metadata.get('categoryPath', '')
+            if isinstance(category_path, str):
+                buckets.setdefault(category_path, []).append(i)
+        self._category_paths: List[str] = sorted(buckets)
+        self._category_buckets: List[List[int]] = [buckets[path] for path in self._category_paths]
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def all(self) -> List[int]:
+        return self._all
+
+    def category(self, prefix: str) -> List[int]:
+        """categoryPath 以 prefix 开头的资产；没有元数据的资产归入 /other"""
+        if prefix == "":
+            return self._all
+        start = bisect.bisect_left(self._category_paths, prefix)
+        result: List[int] = []
+        for i in range(start, len(self._category_paths)):
+            if not self._category_paths[i].startswith(prefix):
+                break
+            result.extend(self._category_buckets[i])
+        if prefix == OTHER_CATEGORY:
+            result.extend(self._no_metadata)
+        result.sort()
+        return result
+
+    def search(self, candidates: Sequence[int], keyword: str) -> List[int]:
+        """candidates 中匹配关键字的资产；keyword 需已转为小写"""
+        texts = self._texts
+        return [i for i in candidates if keyword in texts[i]]
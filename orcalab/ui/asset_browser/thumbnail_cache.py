@@ -0,0 +1,218 @@
+"""
+缩略图帧缓存
+
+按字节预算管理已解码的缩略图帧。条目按可见性分三档：
+
+- 可见（VISIBLE）：正在显示，不淘汰
+- 最近可见（RECENT）：离开视口不超过 recent_seconds 秒
+- 视口外（OFFSCREEN）：更早离开视口或从未显示
+
+超出预算时先按（档位, 最近使用）从低到高裁掉未在播放的动画帧，只保留第一帧；仍超出时
+整条淘汰并通过 on_evict 通知持有者丢弃播放器，之后再次可见时会重新加载。
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THUMBNAIL_CACHE_BUDGET_MB = 64
+RECENTLY_VISIBLE_SECONDS = 30.0
+
+
+class Visibility(IntEnum):
+    OFFSCREEN = 0
+    RECENT = 1
+    VISIBLE = 2
+
+
+class CachedPlayer(Protocol):
+    is_playing: bool
+
+    def frame_bytes(self) -> int: ...
+
+    def release_animation_frames(self) -> bool: ...
+
+
+@dataclass
+class ThumbnailCacheStats:
+    entries: int
+    resident_bytes: int
+    budget_bytes: int
+    hits: int
+    misses: int
+    trims: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    player: CachedPlayer
+    on_evict: Callable[[], None]
+    size: int
+    visible: bool = False
+    hidden_at: float = float("-inf")
+    last_used: int = 0
+
+
+class ThumbnailFrameCache:
+    def __init__(
+        self,
+        budget_bytes: int,
+        recent_seconds: float = RECENTLY_VISIBLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.budget_bytes = budget_bytes
+        self._recent_seconds = recent_seconds
+        self._clock = clock
+        self._entries: Dict[str, _Entry] = {}
+        self._resident = 0
+        self._tick = 0
+        self._hits = 0
+        self._misses = 0
+        self._trims = 0
+        self._evictions = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def resident_bytes(self) -> int:
+        return self._resident
+
+    def add(self, key: str, player: CachedPlayer, on_evict: Callable[[], None]) -> None:
+        """登记新加载的播放器；同一 key 已存在时替换（不触发旧条目的 on_evict）"""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._resident -= old.size
+        # 新条目通常是刚变为可见而加载的，按最近可见对待，本次也不会被淘汰
+        entry = _Entry(player, on_evict, player.frame_bytes(), hidden_at=self._clock())
+        if old is not None:
+            entry.visible, entry.hidden_at = old.visible, old.hidden_at
+        self._entries[key] = entry
+        self._resident += entry.size
+        self._touch(entry)
+        self._enforce_budget(protect=key)
+
+    def update(self, key: str) -> None:
+        """播放器的帧发生变化（例如补齐了动画帧）后重新计算占用"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        size = entry.player.frame_bytes()
+        self._resident += size - entry.size
+        entry.size = size
+        self._touch(entry)
+        self._enforce_budget(protect=key)
+
+    def remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._resident -= entry.size
+
+    def set_visible(self, key: str, visible: bool) -> None:
+        entry = self._entries.get(key)
+        if entry is None or entry.visible == visible:
+            return
+        entry.visible = visible
+        if visible:
+            self._touch(entry)
+        else:
+            entry.hidden_at = self._clock()
+
+    def record_hit(self, key: str) -> None:
+        self._hits += 1
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._touch(entry)
+
+    def record_miss(self) -> None:
+        self._misses += 1
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget_bytes = budget_bytes
+        self._enforce_budget()
+
+    def clear(self) -> None:
+        """淘汰全部条目（通知持有者）"""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        self._resident = 0
+        for entry in entries:
+            self._notify_evicted(entry)
+
+    def stats(self) -> ThumbnailCacheStats:
+        return ThumbnailCacheStats(
+            entries=len(self._entries),
+            resident_bytes=self._resident,
+            budget_bytes=self.budget_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            trims=self._trims,
+            evictions=self._evictions,
+        )
+
+    def visibility(self, key: str) -> Optional[Visibility]:
+        entry = self._entries.get(key)
+        return None if entry is None else self._visibility(entry, self._clock())
+
+    def _visibility(self, entry: _Entry, now: float) -> Visibility:
+        if entry.visible:
+            return Visibility.VISIBLE
+        if now - entry.hidden_at <= self._recent_seconds:
+            return Visibility.RECENT
+        return Visibility.OFFSCREEN
+
+    def _touch(self, entry: _Entry) -> None:
+        self._tick += 1
+        entry.last_used = self._tick
+
+    def _eviction_order(self) -> List[str]:
+        now = self._clock()
+        return sorted(
+            self._entries,
+            key=lambda k: (self._visibility(self._entries[k], now), self._entries[k].last_used),
+        )
+
+    def _enforce_budget(self, protect: Optional[str] = None) -> None:
+        if self._resident <= self.budget_bytes:
+            return
+        order = self._eviction_order()
+
+        # 第一轮：只裁掉动画帧（包括可见但未播放的条目），第一帧保留
+        for key in order:
+            if self._resident <= self.budget_bytes:
+                return
+            entry = self._entries[key]
+            if entry.player.is_playing or not entry.player.release_animation_frames():
+                continue
+            size = entry.player.frame_bytes()
+            self._resident += size - entry.size
+            entry.size = size
+            self._trims += 1
+
+        # 第二轮：整条淘汰不可见的条目
+        for key in [k for k in order if not self._entries[k].visible and k != protect]:
+            if self._resident <= self.budget_bytes:
+                return
+            entry = self._entries.pop(key)
+            self._resident -= entry.size
+            self._evictions += 1
+            self._notify_evicted(entry)
+
+    def _notify_evicted(self, entry: _Entry) -> None:
+        try:
+            entry.on_evict()
+        except Exception as e:
+            logger.exception("缩略图缓存淘汰回调失败: %s", e)
@@ -20,3 +20,7 @@ class ThumbnailModel(QtCore.QObject):
     def movie_at(self, index: int):
         """返回动画播放器对象（ApngPlayer 或其他）"""
         return None
+
+    def set_movie_visible(self, movie, visible: bool) -> None:
+        """视图加载 / 卸载可见项的动画时调用，供模型管理帧缓存"""
+        pass
@@ -1,9 +1,27 @@
+"""
+缩略图批量渲染
+
+流水线分三段并行推进：
+
+- 布置：最多 THUMBNAIL_RENDER_BAYS 个资产同时加入场景，各自放在沿 x 轴相隔
+  THUMBNAIL_BAY_SPACING 的展位上；引擎异步加载资产期间轮询 AABB，不再固定等待
+- 拍摄：相机组依次移动到已就绪的展位，拍 1080 图和 15 个角度的 256 / 512 图，
+  拍完立即删除资产、释放展位
+- 合成：等待 PNG 落盘、加 AABB 标注、合成 APNG 提交到图片处理进程池，与后续资产
+  的拍摄重叠；合成完成后上传。未完成的合成数达到 THUMBNAIL_MAX_PENDING_ASSEMBLIES
+  时暂停拍摄
+
+批次结束时记录每分钟渲染的资产数（last_stats）。
+"""
+
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 from math import sqrt, cos, sin, tan, pi
-from PIL import Image
-from scipy.spatial.transform import Rotation
+from typing import List, Optional
 from orcalab.actor import AssetActor
+from orcalab.ui.image_process_pool import ImageProcessPool, get_image_process_pool
 
 logger = logging.getLogger(__name__)
 from orcalab.http_service.http_bus import HttpServiceRequestBus
@@ -16,19 +34,74 @@ from typing_extensions import override
 import numpy as np
 from orcalab.transform import Transform
 import os
-from orcalab.ui.image_utils import ImageProcessor
+
+THUMBNAIL_RENDER_BAYS = 3
+# 资产缩放到单位尺寸，展位间距远大于相机视野，拍摄时看不到相邻展位；原点不作展位
+THUMBNAIL_BAY_SPACING = 100.0
+THUMBNAIL_MAX_PENDING_ASSEMBLIES = 4
+# 引擎加载资产后才能取到 AABB：按退避间隔轮询，超时视为失败
+AABB_POLL_INITIAL_DELAY = 0.01
+AABB_POLL_MAX_DELAY = 0.2
+AABB_POLL_TIMEOUT = 10.0
+# 相机 PNG 由引擎异步写出，合成前在工作进程中等待文件可读
+PNG_WAIT_TIMEOUT = 5.0
+PANORAMA_FRAME_DURATION_MS = 200
+
+
+@dataclass
+class ThumbnailAssemblyJob:
+    apng_path: str
+    png_files: List[str]
+    png_512_files: List[str]
+    aabb_text: str
+    duration: int = PANORAMA_FRAME_DURATION_MS
+
+
+@dataclass
+class ThumbnailRenderStats:
+    requested: int = 0
+    rendered: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def assets_per_minute(self) -> float:
+        return self.rendered * 60.0 / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class _StagedAsset:
+    asset_path: str
+    actor: AssetActor
+    bay_x: float
+    aabb: List[float]
+    new_aabb: List[float] = field(default_factory=list)
+    scale: float = 1.0
+
 
 class ThumbnailRenderService(ThumbnailRenderRequest):
-    def __init__(self):
+    def __init__(self, bays: int = THUMBNAIL_RENDER_BAYS, image_pool: Optional[ImageProcessPool] = None):
         super().__init__()
         ThumbnailRenderRequestBus.connect(self)
         self.tan_33_5 = tan(33.5 * pi/180)
         self.cos_15 = cos(15 * pi/180)
         self.sin_15 = sin(15 * pi/180)
-        self.quat = Rotation.from_euler("xyz", [-15, 0, 0], degrees=True).as_quat()[[3, 0, 1, 2]]
+        # 绕 x 轴 -15°，(w, x, y, z)；单轴旋转直接构造四元数，避免启动时导入 scipy
+        self.quat = np.array([cos(-7.5 * pi/180), sin(-7.5 * pi/180), 0.0, 0.0])
+        self._bays = max(1, bays)
+        self._image_pool = image_pool
+        self.last_stats: ThumbnailRenderStats | None = None
+
+    def _get_image_pool(self) -> ImageProcessPool:
+        if self._image_pool is None:
+            self._image_pool = get_image_process_pool()
+        return self._image_pool
 
     @override
     async def render_thumbnail(self, asset_paths: list[str]) -> None:
+        asset_paths = list(dict.fromkeys(asset_paths))
+        stats = ThumbnailRenderStats(requested=len(asset_paths))
+        start = time.monotonic()
 
         actor_camera1080 = await self._add_camera("mujococamera1080")
         actor_camera256 = await self._add_camera("mujococamera256")
@@ -37,127 +110,201 @@ class ThumbnailRenderService(ThumbnailRenderRequest):
         if actor_camera1080 is None or actor_camera256 is None or actor_camera512 is None:
             print("failed to add cameras to scene")
             return None
-        for asset_path in asset_paths:   
-            await self._create_panorama_apng(asset_path, actor_camera1080, actor_camera256, actor_camera512)
-
-        await SceneEditRequestBus().delete_actor(actor_camera512, undo=False, source="create_panorama_apng")
-        await SceneEditRequestBus().delete_actor(actor_camera256, undo=False, source="create_panorama_apng")
-        await SceneEditRequestBus().delete_actor(actor_camera1080, undo=False, source="create_panorama_apng")
-    
-    async def _create_panorama_apng(self, asset_path: str, actor_camera1080: AssetActor, actor_camera256: AssetActor, actor_camera512: AssetActor) -> None:
+        cameras = (actor_camera1080, actor_camera256, actor_camera512)
+
+        free_bays: asyncio.Queue[float] = asyncio.Queue()
+        for i in range(self._bays):
+            free_bays.put_nowait((i + 1) * THUMBNAIL_BAY_SPACING)
+        staged: asyncio.Queue = asyncio.Queue()
+
+        async def stage_all():
+            for asset_path in asset_paths:
+                bay_x = await free_bays.get()
+                staged.put_nowait((bay_x, asyncio.create_task(self._stage_asset(asset_path, bay_x))))
+            staged.put_nowait(None)
+
+        stager = asyncio.create_task(stage_all())
+        finishing: List[asyncio.Task] = []
+        try:
+            while (item := await staged.get()) is not None:
+                bay_x, stage_task = item
+                try:
+                    asset = await stage_task
+                except Exception as e:
+                    logger.exception("布置资产失败: %s", e)
+                    asset = None
+                if asset is None:
+                    stats.failed += 1
+                    free_bays.put_nowait(bay_x)
+                    continue
+                pending = [task for task in finishing if not task.done()]
+                if len(pending) >= THUMBNAIL_MAX_PENDING_ASSEMBLIES:
+                    await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                try:
+                    job = await self._capture(asset, cameras)
+                except Exception as e:
+                    logger.exception("拍摄缩略图失败 %s: %s", asset.asset_path, e)
+                    stats.failed += 1
+                    continue
+                finally:
+                    await SceneEditRequestBus().delete_actor(asset.actor, undo=False, source="create_panorama_apng")
+                    free_bays.put_nowait(bay_x)
+                finishing.append(asyncio.create_task(self._finish(asset.asset_path, job)))
+
+            for ok in await asyncio.gather(*finishing, return_exceptions=True):
+                if ok is True:
+                    stats.rendered += 1
+                else:
+                    if isinstance(ok, BaseException):
+                        logger.error("缩略图合成或上传失败: %r", ok)
+                    stats.failed += 1
+        finally:
+            stager.cancel()
+            # 中途退出时清理已布置但还没拍摄的资产
+            while not staged.empty():
+                item = staged.get_nowait()
+                if item is None:
+                    continue
+                asset = await asyncio.gather(item[1], return_exceptions=True)
+                if isinstance(asset[0], _StagedAsset):
+                    await SceneEditRequestBus().delete_actor(asset[0].actor, undo=False, source="create_panorama_apng")
+            await SceneEditRequestBus().delete_actor(actor_camera512, undo=False, source="create_panorama_apng")
+            await SceneEditRequestBus().delete_actor(actor_camera256, undo=False, source="create_panorama_apng")
+            await SceneEditRequestBus().delete_actor(actor_camera1080, undo=False, source="create_panorama_apng")
+
+        stats.seconds = time.monotonic() - start
+        self.last_stats = stats
+        logger.info(
+            "缩略图批量渲染完成: %d/%d 个资产, 失败 %d, 耗时 %.1f 秒, %.1f 个/分钟",
+            stats.rendered, stats.requested, stats.failed, stats.seconds, stats.assets_per_minute,
+        )
+
+    async def _stage_asset(self, asset_path: str, bay_x: float) -> Optional[_StagedAsset]:
+        """把资产放到展位上并等待 AABB 就绪、完成缩放；失败时返回 None"""
         actor_out = []
-        await ApplicationRequestBus().add_item_to_scene(asset_path, output=actor_out)
+        await ApplicationRequestBus().add_item_to_scene_with_transform(
+            asset_path, asset_path, parent_path=Path.root_path(),
+            transform=Transform(position=np.array([bay_x, 0, 0]), rotation=self.quat, scale=1.0), output=actor_out,
+        )
         if not actor_out:
             logger.error(f"failed to add {asset_path} to scene")
-            return
+            return None
         actor = actor_out[0]
 
-        aabb = []
-        await asyncio.sleep(0.1)
         try:
-            await SceneEditNotificationBus().get_actor_asset_aabb(Path(f"/{actor.name}"), output=aabb)
+            aabb = await self._wait_for_aabb(actor)
+            if not aabb:
+                logger.error(f"failed to get {asset_path} aabb: actor asset bounds not ready")
+                await SceneEditRequestBus().delete_actor(actor, undo=False, source="create_panorama_apng")
+                return None
+
+            # AABB 是资产自身的包围盒（不含 actor 变换），展位平移不影响计算
+            new_aabb, scale = self._get_actor_position_scale(aabb)
+            await SceneEditRequestBus().set_transform(
+                actor,
+                Transform(position=np.array([bay_x, 0, -aabb[2] * scale]), rotation=self.quat, scale=scale),
+                local=True, undo=False, source="create_panorama_apng",
+            )
         except Exception:
-            logger.error(f"failed to get {asset_path} aabb: actor asset bounds not ready")
+            # 布置失败的资产不会进入拍摄，也不会被批次结束时的清理看到
             await SceneEditRequestBus().delete_actor(actor, undo=False, source="create_panorama_apng")
-            return
-        if not aabb:
-            logger.error(f"failed to get {asset_path} aabb")
-            return 
-        new_aabb, scale = self._get_actor_position_scale(aabb)
-        await SceneEditRequestBus().set_transform(actor, Transform(position=np.array([0, 0, -aabb[2] * scale]), rotation=self.quat, scale=scale), local=True, undo=False, source="create_panorama_apng")
-        transform = self._get_camera_position(new_aabb)
+            raise
+        return _StagedAsset(asset_path, actor, bay_x, aabb, new_aabb, scale)
+
+    async def _wait_for_aabb(self, actor: AssetActor) -> List[float]:
+        delay = AABB_POLL_INITIAL_DELAY
+        deadline = time.monotonic() + AABB_POLL_TIMEOUT
+        while True:
+            aabb = []
+            try:
+                await SceneEditNotificationBus().get_actor_asset_aabb(Path(f"/{actor.name}"), output=aabb)
+            except Exception:
+                aabb = []
+            if aabb or time.monotonic() >= deadline:
+                return aabb
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, AABB_POLL_MAX_DELAY)
+
+    async def _capture(self, asset: _StagedAsset, cameras) -> ThumbnailAssemblyJob:
+        actor_camera1080, actor_camera256, actor_camera512 = cameras
+        actor, aabb, scale = asset.actor, asset.aabb, asset.scale
+        transform = self._get_camera_position(asset.new_aabb, offset_x=asset.bay_x)
 
         await SceneEditRequestBus().set_transform(actor_camera1080, transform, local=True, undo=False, source="create_panorama_apng")
         await SceneEditRequestBus().set_transform(actor_camera256, transform, local=True, undo=False, source="create_panorama_apng")
         await SceneEditRequestBus().set_transform(actor_camera512, transform, local=True, undo=False, source="create_panorama_apng")
 
-        tmp_path = os.path.join(os.path.expanduser("~"), ".orcalab", "tmp", asset_path)
+        tmp_path = os.path.join(os.path.expanduser("~"), ".orcalab", "tmp", asset.asset_path)
         dir_path = os.path.dirname(tmp_path)
         await SceneEditNotificationBus().get_camera_png("mujococamera1080", dir_path, f"{os.path.basename(tmp_path)}_1080.png")
 
         png_files, png_512_files = [], []
         for rotation_z in range(0, 360, 24):
-            quat = Rotation.from_euler("xyz", [0, 0, rotation_z], degrees=True).as_quat()[[3, 0, 1, 2]]
-            await SceneEditRequestBus().set_transform(actor, Transform(position=np.array([0, 0, -aabb[2] * scale]), rotation=quat, scale=scale), local=True, undo=False, source="create_panorama_apng")
+            quat = np.array([cos(rotation_z * pi/360), 0.0, 0.0, sin(rotation_z * pi/360)])
+            await SceneEditRequestBus().set_transform(
+                actor,
+                Transform(position=np.array([asset.bay_x, 0, -aabb[2] * scale]), rotation=quat, scale=scale),
+                local=True, undo=False, source="create_panorama_apng",
+            )
             png_filename = f"{os.path.basename(tmp_path)}_256_{rotation_z}.png"
             if rotation_z % 72 == 0:
                 png_512_filename = f"{os.path.basename(tmp_path)}_{rotation_z}_512.png"
                 await SceneEditNotificationBus().get_camera_png("mujococamera512", dir_path, png_512_filename)
-                png_512_path = os.path.join(dir_path, png_512_filename)
-                png_512_files.append(png_512_path)
+                png_512_files.append(os.path.join(dir_path, png_512_filename))
             await SceneEditNotificationBus().get_camera_png("mujococamera256", dir_path, png_filename)
             png_files.append(os.path.join(dir_path, png_filename))
 
-        await asyncio.sleep(0.02)
-        apng_path = os.path.join(dir_path, f"{os.path.basename(tmp_path)}_panorama.apng")
-
-
-        for png_512_file in png_512_files:
-            retry = 0
-            aabb_text = f"AABB: [{aabb[0]:.2f}, {aabb[1]:.2f}, {aabb[2]:.2f}]\n      [{aabb[3]:.2f}, {aabb[4]:.2f}, {aabb[5]:.2f}]"
-            while retry < 10:
-                if ImageProcessor.add_text_to_image(png_512_file, aabb_text, position="bottom_right", font_size=10):
-                    break
-                retry += 1
-                await asyncio.sleep(0.02)
-
-        images = []
-        for png_file in png_files:
-            retry = 0
-            while retry < 10:
-                if os.path.exists(png_file):
-                    try:
-                        img = Image.open(png_file)
-                        images.append(img)
-                        break
-                    except Exception as e:
-                        retry += 1
-                        await asyncio.sleep(0.02)
-                else:
-                    await asyncio.sleep(0.02)
-                    retry += 1
+        aabb_text = (
+            f"AABB: [{aabb[0]:.2f}, {aabb[1]:.2f}, {aabb[2]:.2f}]\n"
+            f"      [{aabb[3]:.2f}, {aabb[4]:.2f}, {aabb[5]:.2f}]"
+        )
+        return ThumbnailAssemblyJob(
+            apng_path=os.path.join(dir_path, f"{os.path.basename(tmp_path)}_panorama.apng"),
+            png_files=png_files,
+            png_512_files=png_512_files,
+            aabb_text=aabb_text,
+        )
 
-        if images:
-            apng_path = os.path.join(dir_path, f"{os.path.basename(tmp_path)}_panorama.apng")
-            try:
-                success = ImageProcessor.create_apng_panorama(images, apng_path, duration=200)
-                if success:
-                    print(f"actor {asset_path} panorama APNG created")
-                else:
-                    print(f"actor {asset_path} panorama APNG creation failed")
-            finally:
-                for img in images:
-                    try:
-                        img.close()
-                    except Exception:
-                        pass
-
-            for png_file in png_files:
-                if os.path.exists(png_file):
-                    try:
-                        os.remove(png_file)
-                    except OSError as e:
-                        continue
-        
-        await asyncio.sleep(0.02)
-        await SceneEditRequestBus().delete_actor(actor, undo=False, source="create_panorama_apng")
-        await asyncio.sleep(0.02)
+    async def _finish(self, asset_path: str, job: ThumbnailAssemblyJob) -> bool:
+        """在进程池中标注 512 图、合成 APNG，完成后上传；返回是否生成了缩略图"""
+        pool = self._get_image_pool()
+        annotated = [
+            pool.add_text_to_image(
+                png_512_file, job.aabb_text, wait_timeout=PNG_WAIT_TIMEOUT, position="bottom_right", font_size=10
+            )
+            for png_512_file in job.png_512_files
+        ]
+        success, *annotated = await asyncio.gather(
+            pool.create_apng_panorama(
+                job.png_files, job.apng_path, duration=job.duration, wait_timeout=PNG_WAIT_TIMEOUT, remove_sources=True
+            ),
+            *annotated,
+        )
+        for png_512_file, ok in zip(job.png_512_files, annotated):
+            if not ok:
+                logger.warning("缩略图标注失败: %s", png_512_file)
+        if success:
+            print(f"actor {asset_path} panorama APNG created")
+        else:
+            print(f"actor {asset_path} panorama APNG creation failed")
+            return False
 
         logger.info(f"uploading {asset_path} thumbnail to server")
         asset_metadata = []
         MetadataServiceRequestBus().get_asset_info(asset_path, output=asset_metadata)
         if not asset_metadata or asset_metadata[0] is None:
             logger.info(f"{asset_path} not in metadata")
-            return 
+            return True
         asset_info = asset_metadata[0]
-        
-        png_1080_path = os.path.join(dir_path, f"{os.path.basename(tmp_path)}_1080.png")
-        files = [png_1080_path, apng_path] + png_512_files
+
+        png_1080_path = job.apng_path[:-len("_panorama.apng")] + "_1080.png"
+        files = [png_1080_path, job.apng_path] + job.png_512_files
         await HttpServiceRequestBus().post_asset_thumbnail(asset_info['id'], files)
-            
+        return True
+
     # 相机位置计算公式
-    def _get_camera_position(self, aabb: list[float]) -> Transform:
-        x = (aabb[0]+aabb[3])/2
+    def _get_camera_position(self, aabb: list[float], offset_x: float = 0.0) -> Transform:
+        x = (aabb[0]+aabb[3])/2 + offset_x
         r = sqrt((aabb[3]-aabb[0])**2 + (aabb[4]-aabb[1])**2 + (aabb[5]-aabb[2])**2) / 2 * 1.1
         y0 = r / self.tan_33_5
         y = -y0 * self.cos_15
@@ -0,0 +1,188 @@
+"""
+缩略图精灵磁盘缓存
+
+cache/thumbnail 中的 APNG 是渲染输出的大图，每次打开资产浏览器都要重新解码、缩放。
+这里把缩放到显示尺寸后的帧（第一帧，以及播放过的缩略图的全部动画帧）按 RGBA8888
+原样连续写成一个精灵文件，再次加载时用 mmap 映射，QImage 直接引用映射内存，不解码也
+不复制，只有真正绘制到的页才会从磁盘读入。
+
+文件以源文件路径和显示尺寸命名，头部记录源文件指纹（大小、修改时间）；源 APNG
+变化（例如重新渲染缩略图）后指纹不符，视为未命中并在解码后覆盖。
+
+文件格式::
+
+    MAGIC | 版本 (uint32) | 头部长度 (uint32) | 头部 JSON | 帧数据
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pathlib
+import struct
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from PySide6 import QtGui
+
+from orcalab.ui.asset_browser.apng_decoder import DecodedApng
+
+logger = logging.getLogger(__name__)
+
+SPRITE_MAGIC = b"OLSPRITE"
+SPRITE_VERSION = 1
+SPRITE_SUFFIX = ".sprite"
+_PREFIX = struct.Struct("<8sII")
+_FORMAT = QtGui.QImage.Format.Format_RGBA8888
+
+
+@dataclass(frozen=True)
+class SourceFingerprint:
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: str) -> Optional["SourceFingerprint"]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return cls(st.st_size, st.st_mtime_ns)
+
+
+class ThumbnailSpriteCache:
+    """按显示尺寸预缩放的缩略图帧缓存；可在任意线程调用"""
+
+    def __init__(self, folder: pathlib.Path):
+        self._folder = pathlib.Path(folder)
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def folder(self) -> pathlib.Path:
+        return self._folder
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def sprite_path(self, source_path: str, size: int) -> pathlib.Path:
+        digest = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()
+        return self._folder / f"{digest}_{size}{SPRITE_SUFFIX}"
+
+    def load(self, source_path: str, size: int, first_frame_only: bool = False) -> Optional[DecodedApng]:
+        """映射精灵文件；不存在、源文件已变化或缺少所需帧时返回 None"""
+        result = self._load(source_path, size, first_frame_only)
+        with self._lock:
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return result
+
+    def _load(self, source_path: str, size: int, first_frame_only: bool) -> Optional[DecodedApng]:
+        fingerprint = SourceFingerprint.of(source_path)
+        if fingerprint is None:
+            return None
+        path = self.sprite_path(source_path, size)
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            layout = self._read_layout(mapped, fingerprint, first_frame_only)
+        except (struct.error, ValueError, KeyError, TypeError) as e:
+            logger.debug("缩略图精灵文件无效 %s: %s", path, e)
+            layout = None
+        if layout is None:
+            # 此时还没有任何 QImage 引用映射内存，可以立即关闭；否则文件句柄会一直占用到 GC，
+            # Windows 上还会阻止 store 替换这个文件
+            mapped.close()
+            return None
+
+        frame_count, frames = layout
+        result = DecodedApng(frame_count=frame_count)
+        view = memoryview(mapped)
+        for offset, end, width, height, bytes_per_line, delay in frames:
+            # QImage 持有对映射内存的引用，最后一帧释放后 mmap 才会关闭
+            result.frames.append(QtGui.QImage(view[offset:end], width, height, bytes_per_line, _FORMAT))
+            result.delays.append(delay)
+        return result
+
+    @staticmethod
+    def _read_layout(mapped: mmap.mmap, fingerprint: SourceFingerprint, first_frame_only: bool) -> Optional[tuple]:
+        """校验头部并计算各帧在文件中的位置；不可用时返回 None，不创建任何对映射内存的引用"""
+        magic, version, header_len = _PREFIX.unpack_from(mapped, 0)
+        if magic != SPRITE_MAGIC or version != SPRITE_VERSION:
+            return None
+        header = json.loads(mapped[_PREFIX.size:_PREFIX.size + header_len])
+        if SourceFingerprint(header["source_size"], header["source_mtime_ns"]) != fingerprint:
+            return None
+        frames = header["frames"]
+        if not frames or (not first_frame_only and len(frames) < header["frame_count"]):
+            return None
+        if first_frame_only:
+            frames = frames[:1]
+
+        layout = []
+        offset = _PREFIX.size + header_len
+        for width, height, bytes_per_line, delay in frames:
+            width, height, bytes_per_line, delay = int(width), int(height), int(bytes_per_line), int(delay)
+            end = offset + bytes_per_line * height
+            if end > len(mapped):
+                return None
+            layout.append((offset, end, width, height, bytes_per_line, delay))
+            offset = end
+        return header["frame_count"], layout
+
+    def store(self, source_path: str, size: int, decoded: DecodedApng) -> bool:
+        """写入精灵文件（先写临时文件再替换）；失败只记录日志"""
+        fingerprint = SourceFingerprint.of(source_path)
+        if fingerprint is None or not decoded.frames:
+            return False
+        path = self.sprite_path(source_path, size)
+        frames = [frame.convertToFormat(_FORMAT) for frame in decoded.frames]
+        header = json.dumps({
+            "source_size": fingerprint.size,
+            "source_mtime_ns": fingerprint.mtime_ns,
+            "frame_count": decoded.frame_count,
+            "frames": [
+                [frame.width(), frame.height(), frame.bytesPerLine(), delay]
+                for frame, delay in zip(frames, decoded.delays)
+            ],
+        }).encode("utf-8")
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self._folder.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_PREFIX.pack(SPRITE_MAGIC, SPRITE_VERSION, len(header)))
+                f.write(header)
+                for frame in frames:
+                    f.write(frame.constBits())
+            # Windows 上被映射的文件不能替换，此时保留旧文件，指纹不符会继续走解码
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            logger.debug("写入缩略图精灵文件失败 %s: %s", path, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    def clear(self) -> None:
+        for path in self._folder.glob(f"*{SPRITE_SUFFIX}"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
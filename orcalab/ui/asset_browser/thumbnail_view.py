@@ -418,6 +418,8 @@ class ThumbnailView(QtWidgets.QWidget):
         """加载动画但不启动播放"""
         self._movies[index] = player
         player.frame_changed.connect(lambda: self._on_movie_frame_changed(index))
+        if self._model:
+            self._model.set_movie_visible(player, True)
     
     def _unload_movie(self, index: int):
         """卸载动画"""
@@ -429,6 +431,8 @@ class ThumbnailView(QtWidgets.QWidget):
             except:
                 pass
             del self._movies[index]
+            if self._model:
+                self._model.set_movie_visible(player, False)
     
     def _update_playing_state(self):
         """更新动画播放状态：只播放选中或悬停的"""
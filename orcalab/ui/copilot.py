@@ -2,18 +2,24 @@ import asyncio
 from typing import List
 import uuid
 import numpy as np
-from scipy.spatial.transform import Rotation
 from PySide6 import QtCore, QtWidgets, QtGui
 from PySide6.QtCore import Qt
 from orcalab.actor import BaseActor, AssetActor, GroupActor
 from orcalab.path import Path
 from orcalab.copilot import CopilotService
 from orcalab.transform import Transform
-import orca_gym.utils.rotations as rotations
 from orcalab.metadata_service_bus import MetadataServiceRequestBus, MetadataServiceRequest
 from orcalab.scene_edit_bus import SceneEditRequestBus
 from orcalab.ui.fonts.font_service import FontService
 
+
+def _euler_to_quat(rotation) -> np.ndarray:
+    # scipy 导入较慢，生成场景时才加载
+    from scipy.spatial.transform import Rotation
+
+    return np.array(Rotation.from_euler('xyz', rotation, degrees=True).as_quat(scalar_first=True))
+
+
 class CopilotPanel(QtWidgets.QWidget):
     """Copilot panel for asset search and actor creation"""
     
@@ -319,7 +325,7 @@ class CopilotPanel(QtWidgets.QWidget):
                     rotation = np.array(asset['xformOp:rotateXYZ'])[[0, 2, 1]]
                     rotation[1] = -rotation[1]
                     rotation[2] = rotation[2] + 180
-                    quaternion = np.array(Rotation.from_euler('xyz', rotation, degrees=True).as_quat(scalar_first=True))
+                    quaternion = _euler_to_quat(rotation)
                     transform = Transform(position=translate, rotation=quaternion, scale=asset['xformOp:scale'][0])
                     
                     self.add_item_with_transform.emit(filename, asset_path, group_path, transform)
@@ -337,7 +343,7 @@ class CopilotPanel(QtWidgets.QWidget):
                     position = np.array(wall['position'])
                     rotation = np.array(wall['rotation'])
                     scale = wall['scale']
-                    quaternion = np.array(Rotation.from_euler('xyz', rotation, degrees=True).as_quat(scalar_first=True))
+                    quaternion = _euler_to_quat(rotation)
                     transform = Transform(position=position, rotation=quaternion, scale=scale)
                     self.add_item_with_transform.emit(actor_name, actor_path, group_path, transform)
                     self.log_message (f"actor_name: {actor_name}, actor_path: {actor_path}, position: {position}, rotation: {rotation}, scale: {scale}")
@@ -355,7 +361,7 @@ class CopilotPanel(QtWidgets.QWidget):
                     position = np.array(light['position'])
                     rotation = np.array(light['rotation'])
                     scale = light['scale']
-                    quaternion = np.array(Rotation.from_euler('xyz', rotation, degrees=True).as_quat(scalar_first=True))
+                    quaternion = _euler_to_quat(rotation)
                     transform = Transform(position=position, rotation=quaternion, scale=scale)
                     self.add_item_with_transform.emit(actor_name, actor_path, group_path, transform)
             else:
@@ -541,6 +547,8 @@ class CopilotPanel(QtWidgets.QWidget):
             np.radians(rotation_orcalab.get('y', 0.0)),
             np.radians(rotation_orcalab.get('z', 0.0))
         ])
+        import orca_gym.utils.rotations as rotations
+
         rotation_quat = rotations.euler2quat(rotation_euler)
         
         # Extract scale data (unitless scaling factors)
@@ -7,7 +7,6 @@ from orcalab.ui.multi_select_combo import MultiSelectCombo
 from orcalab.ui.button import Button
 from orcalab.ui.icon_util import make_icon
 from orcalab.ui.theme_service import ThemeService
-import orcalab.assets.rc_assets
 
 
 class FilterBar(QtWidgets.QWidget):
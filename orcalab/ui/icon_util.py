@@ -1,13 +1,32 @@
 import os
+from typing import Dict, Optional, Tuple
 
 from PySide6 import QtCore, QtWidgets, QtGui, QtSvg
 
-import orcalab.assets.rc_assets
+from orcalab.ui.qt_resources import register_resources
 
 APP_WINDOW_ICON_QRC = ":/icons/orcalab_logo.png"
 ORCALAB_APP_USER_MODEL_ID = "OrcaLab.Songying.OrcaLab"
 
+DEFAULT_ICON_SIZE = 64
+
+# 着色后的图标按 (文件, 颜色, 尺寸) 缓存；同一图标在各面板、属性编辑器的每个复选框中
+# 反复创建，缓存后只渲染一次 SVG。QPixmap / QIcon 为隐式共享，返回副本开销很小。
+_pixmap_cache: Dict[Tuple[str, Optional[int], int], QtGui.QPixmap] = {}
+_icon_cache: Dict[Tuple[str, Optional[int], int], QtGui.QIcon] = {}
+
+
+def clear_icon_cache() -> None:
+    _pixmap_cache.clear()
+    _icon_cache.clear()
+
+
+def icon_cache_size() -> int:
+    return len(_pixmap_cache) + len(_icon_cache)
+
+
 def app_window_icon() -> QtGui.QIcon:
+    register_resources()
     return QtGui.QIcon(APP_WINDOW_ICON_QRC)
 
 def schedule_windows_taskbar_icon_refresh(window: QtWidgets.QWidget) -> None:
@@ -31,12 +50,22 @@ def set_windows_app_user_model_id() -> None:
     except Exception:
         pass
 
-def make_color_svg(svg_file: str, color: QtGui.QColor) -> QtGui.QPixmap:
+def make_color_svg(svg_file: str, color: QtGui.QColor, size: int = DEFAULT_ICON_SIZE) -> QtGui.QPixmap:
+    key = (svg_file, color.rgba(), size)
+    cached = _pixmap_cache.get(key)
+    if cached is None:
+        cached = _pixmap_cache[key] = _render_color_svg(svg_file, color, size)
+    return QtGui.QPixmap(cached)
+
+
+def _render_color_svg(svg_file: str, color: QtGui.QColor, size: int) -> QtGui.QPixmap:
+    register_resources()
+
     # Load the SVG file
     svg_renderer = QtSvg.QSvgRenderer(svg_file)
 
     # Create a QPixmap to render the SVG onto
-    pixmap = QtGui.QPixmap(64, 64)
+    pixmap = QtGui.QPixmap(size, size)
     pixmap.fill(QtCore.Qt.GlobalColor.transparent)
 
     # Render the SVG onto the QPixmap
@@ -54,6 +83,7 @@ def make_color_svg(svg_file: str, color: QtGui.QColor) -> QtGui.QPixmap:
 
 
 def make_color_image(file: str, color: QtGui.QColor) -> QtGui.QPixmap:
+    register_resources()
     pixmap = QtGui.QPixmap(file)
     painter = QtGui.QPainter(pixmap)
     painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_SourceIn)
@@ -62,13 +92,16 @@ def make_color_image(file: str, color: QtGui.QColor) -> QtGui.QPixmap:
     return pixmap
 
 
-def make_icon(file: str, color: QtGui.QColor) -> QtGui.QIcon:
-    if file.endswith(".svg"):
-        pixmap = make_color_svg(file, color)
-    else:
-        pixmap = make_color_image(file, color)
-    icon = QtGui.QIcon(pixmap)
-    return icon
+def make_icon(file: str, color: QtGui.QColor, size: int = DEFAULT_ICON_SIZE) -> QtGui.QIcon:
+    key = (file, color.rgba(), size)
+    icon = _icon_cache.get(key)
+    if icon is None:
+        if file.endswith(".svg"):
+            pixmap = make_color_svg(file, color, size)
+        else:
+            pixmap = make_color_image(file, color)
+        icon = _icon_cache[key] = QtGui.QIcon(pixmap)
+    return QtGui.QIcon(icon)
 
 
 def make_text_icon(
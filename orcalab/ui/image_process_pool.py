@@ -0,0 +1,117 @@
+"""
+图片后处理进程池
+
+APNG 编码和图片标注是纯 CPU 工作，放在事件循环（UI 线程）或线程池中都会与界面争抢
+GIL。这里把 ImageProcessor 的文件级操作提交到独立进程执行：
+
+- 任务参数只有路径和文本，结果只有成功与否，进程间不传图片数据
+- 同时提交（排队 + 执行中）的任务数不超过 max_pending，超出时 submit 方 await，
+  上游（相机拍摄）随之放慢，内存和临时文件不会无限堆积
+- 进程池首次使用时才启动，使用 spawn 方式，避免 fork 带有 Qt 线程的主进程。spawn 的子进程
+  会重新执行主模块（以 __mp_main__ 名义），因此 launcher 通过 python -m orcalab.gui 启动
+  界面：模块名以 .__main__ 结尾时 multiprocessing 跳过这一步，子进程只导入 image_utils。
+  直接 python -m orcalab.main 启动时，每个子进程都会重新导入 orcalab.main 及其依赖
+- 退出前由 AssetBrowser.shutdown 调用 shutdown(wait=True) 等待子进程结束
+- 子进程意外退出导致进程池损坏时，本次任务返回失败，下次提交时重建进程池
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from orcalab.ui.image_utils import ImageProcessor
+
+logger = logging.getLogger(__name__)
+
+IMAGE_PROCESS_MAX_WORKERS = 4
+# 每个工作进程对应的排队任务数
+IMAGE_PROCESS_PENDING_PER_WORKER = 4
+
+
+def default_image_process_workers() -> int:
+    # 留一个核给 UI 和引擎
+    return max(1, min(IMAGE_PROCESS_MAX_WORKERS, (os.cpu_count() or 2) - 1))
+
+
+class ImageProcessPool:
+    """图片后处理进程池；在事件循环中 await 各方法"""
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self._max_workers = max_workers or default_image_process_workers()
+        self._max_pending = max_pending or self._max_workers * IMAGE_PROCESS_PENDING_PER_WORKER
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def max_pending(self) -> int:
+        return self._max_pending
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # 信号量绑定事件循环；测试和脚本中每次 asyncio.run 都是新的循环
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self._max_pending)
+            self._slots_loop = loop
+        return self._slots
+
+    async def _submit(self, fn, *args, **kwargs) -> bool:
+        async with self._get_slots():
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+            except BrokenProcessPool as e:
+                logger.error("图片处理进程池异常退出，将重新创建: %s", e)
+                if self._executor is executor:
+                    self._executor = None
+                    executor.shutdown(wait=False, cancel_futures=True)
+                return False
+            except Exception as e:
+                logger.warning("图片处理任务失败 %s: %s", getattr(fn, "__name__", fn), e)
+                return False
+
+    async def create_apng_panorama(self, png_files: List[str], apng_path: str, duration: int = 200,
+                                   wait_timeout: float = 0.0, remove_sources: bool = False) -> bool:
+        """见 ImageProcessor.create_apng_panorama_from_files"""
+        return await self._submit(
+            ImageProcessor.create_apng_panorama_from_files, png_files, apng_path,
+            duration=duration, wait_timeout=wait_timeout, remove_sources=remove_sources,
+        )
+
+    async def add_text_to_image(self, image_path: str, text: str, wait_timeout: float = 0.0, **kwargs) -> bool:
+        """见 ImageProcessor.add_text_to_image"""
+        return await self._submit(
+            ImageProcessor.add_text_to_image_file, image_path, text, wait_timeout=wait_timeout, **kwargs
+        )
+
+    def shutdown(self, wait: bool = False) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+_pool: Optional[ImageProcessPool] = None
+
+
+def get_image_process_pool() -> ImageProcessPool:
+    global _pool
+    if _pool is None:
+        _pool = ImageProcessPool()
+    return _pool
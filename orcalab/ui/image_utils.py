@@ -4,15 +4,26 @@
 """
 
 import os
-from typing import List
-from PIL import Image, ImageDraw, ImageFont
+import time
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# PNG 编码参数（zlib 压缩级别 0-9）。15 帧 256px 全景图实测：optimize=True 约 1.1 秒，
+# 级别 6 约 0.2 秒且体积只大 2-3%，级别 3 约 0.07 秒但体积大约 10%。
+# 缩略图会被所有客户端下载，取级别 6；见 scripts/bench/bench_image_encode.py
+APNG_COMPRESS_LEVEL = 6
+ANNOTATED_IMAGE_COMPRESS_LEVEL = 6
+IMAGE_WAIT_POLL_INTERVAL = 0.01
 
 
 class ImageProcessor:
     """图片处理工具类"""
     
     @staticmethod
-    def create_apng_panorama(images: List[Image.Image], apng_path: str, duration: int = 200) -> bool:
+    def create_apng_panorama(images: List["Image.Image"], apng_path: str, duration: int = 200,
+                             compress_level: int = APNG_COMPRESS_LEVEL) -> bool:
         """
         创建APNG格式的全景图
         
@@ -20,6 +31,7 @@ class ImageProcessor:
             images: PIL Image对象列表
             apng_path: 输出APNG文件路径
             duration: 每帧持续时间(毫秒)
+            compress_level: zlib 压缩级别
             
         Returns:
             bool: 是否创建成功
@@ -43,7 +55,7 @@ class ImageProcessor:
                 append_images=processed_images[1:],
                 duration=duration,
                 loop=0,  # 无限循环
-                optimize=True,  # 优化文件大小
+                compress_level=compress_level,
                 format='PNG'  # 明确指定PNG格式
             )
             
@@ -56,7 +68,8 @@ class ImageProcessor:
     @staticmethod
     def add_text_to_image(image_path: str, text: str, position: str = "bottom_right", 
                          font_size: int = 12, text_color: tuple = (255, 255, 255), 
-                         bg_color: tuple = (0, 0, 0, 180)) -> bool:
+                         bg_color: tuple = (0, 0, 0, 180),
+                         compress_level: int = ANNOTATED_IMAGE_COMPRESS_LEVEL) -> bool:
         """
         在图片上添加文字
         
@@ -67,10 +80,13 @@ class ImageProcessor:
             font_size: 字体大小
             text_color: 文字颜色 (R, G, B)
             bg_color: 背景颜色 (R, G, B, A)
+            compress_level: zlib 压缩级别
             
         Returns:
             bool: 是否添加成功
         """
+        from PIL import Image, ImageDraw, ImageFont
+
         try:
             img = Image.open(image_path)
             if img.mode != 'RGBA':
@@ -109,7 +125,7 @@ class ImageProcessor:
             draw.text((x, y), text, font=font, fill=text_color)
             
             result = Image.alpha_composite(img, overlay)
-            result.convert('RGB').save(image_path)
+            result.convert('RGB').save(image_path, compress_level=compress_level)
             
             return True
             
@@ -117,3 +133,70 @@ class ImageProcessor:
             print(f"Error adding text to image: {e}")
             return False
 
+    @staticmethod
+    def wait_for_image(image_path: str, timeout: float) -> bool:
+        """
+        等待图片文件写完并可以完整读取（相机图片由引擎异步写出）
+
+        Returns:
+            bool: 超时前是否可读
+        """
+        from PIL import Image
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with Image.open(image_path) as img:
+                    img.verify()
+                return True
+            except Exception:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(IMAGE_WAIT_POLL_INTERVAL)
+
+    @staticmethod
+    def create_apng_panorama_from_files(png_files: List[str], apng_path: str, duration: int = 200,
+                                        wait_timeout: float = 0.0, remove_sources: bool = False) -> bool:
+        """
+        由 PNG 文件创建 APNG 全景图；参数只有路径，可以提交到进程池执行
+
+        Args:
+            png_files: 按帧顺序排列的 PNG 路径，超时仍不可读的帧会被跳过
+            apng_path: 输出APNG文件路径
+            duration: 每帧持续时间(毫秒)
+            wait_timeout: 每帧等待文件可读的秒数
+            remove_sources: 完成后删除 png_files
+
+        Returns:
+            bool: 是否创建成功
+        """
+        from PIL import Image
+
+        images = []
+        try:
+            for png_file in png_files:
+                if ImageProcessor.wait_for_image(png_file, wait_timeout):
+                    images.append(Image.open(png_file))
+                else:
+                    print(f"Timed out waiting for image: {png_file}")
+            return ImageProcessor.create_apng_panorama(images, apng_path, duration=duration)
+        finally:
+            for img in images:
+                img.close()
+            if remove_sources:
+                for png_file in png_files:
+                    try:
+                        os.remove(png_file)
+                    except OSError:
+                        pass
+
+    @staticmethod
+    def add_text_to_image_file(image_path: str, text: str, wait_timeout: float = 0.0, **kwargs) -> bool:
+        """
+        等待图片可读后调用 add_text_to_image；可以提交到进程池执行
+        """
+        if not ImageProcessor.wait_for_image(image_path, wait_timeout):
+            print(f"Timed out waiting for image: {image_path}")
+            return False
+        return ImageProcessor.add_text_to_image(image_path, text, **kwargs)
+
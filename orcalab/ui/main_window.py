@@ -60,10 +60,10 @@ from orcalab.scene_edit_service import SceneEditService
 from orcalab.scene_edit_bus import SceneEditRequestBus
 from orcalab.undo_service.undo_service_bus import can_redo, can_undo
 from orcalab.texture_asset_cache import get_texture_asset_cache
+from orcalab.sampling_profiler import get_sampling_profiler
 
 from orcalab.application_bus import ApplicationRequest, ApplicationRequestBus
 from orcalab.token_storage import TokenStorage
-from orcalab.mcp_service.mcp_service import OrcaLabMCPServer
 from orcalab.ui.user_event_bus import UserEventRequest, UserEventRequestBus
 from orcalab.report.abnormal_exit_report import take_pending_abnormal_exit_report, send_abnormal_exit_report
 
@@ -262,6 +262,8 @@ class MainWindow(
         logger.info("get_cameras 完成, 耗时: %.2f 秒", time.monotonic() - _cam_start)
 
         _mcp_start = time.monotonic()
+        from orcalab.mcp_service.mcp_service import OrcaLabMCPServer
+
         self.mcp_service = OrcaLabMCPServer(port=self.config_service.mcp_port())
         self.mcp_service.add_tools()
         self.mcp_service._task = asyncio.create_task(self.mcp_service.run())
@@ -412,6 +414,29 @@ class MainWindow(
             logger.exception("资产加载失败: %s", e)
             await self.asset_browser_widget.set_assets([])
 
+    def start_background_asset_sync(self):
+        """主窗口就绪后在后台同步订阅资产，新资产包下载完成后热加载"""
+        from orcalab.background_asset_sync import BackgroundAssetSync
+
+        self._background_asset_sync = BackgroundAssetSync(
+            self.config_service,
+            mount_package=self.remote_scene.load_package,
+            on_packages_mounted=self._on_background_packages_mounted,
+            on_finished=self._on_background_sync_finished,
+        )
+        self.asset_browser_widget.show_sync_message("后台同步中...")
+        self._background_asset_sync.start()
+
+    async def _on_background_packages_mounted(self, package_paths: List[str]):
+        assets = await self.remote_scene.get_actor_assets()
+        await self.asset_browser_widget.on_packages_mounted(assets, package_paths)
+
+    async def _on_background_sync_finished(self, success: bool, message: str):
+        # 元数据在同步最后一步写入，重新加载一次
+        assets = await self.remote_scene.get_actor_assets()
+        await self.asset_browser_widget.on_packages_mounted(assets, [])
+        self.asset_browser_widget.show_sync_message("同步完成" if success else f"同步失败: {message}")
+
     def _build_global_stylesheet(self) -> str:
         from orcalab.ui.theme_service import ThemeService
         theme = ThemeService()
@@ -656,7 +681,7 @@ class MainWindow(
 
         logger.info("创建终端组件…")
         # 添加终端组件
-        self.terminal_widget = TerminalWidget()
+        self.terminal_widget = TerminalWidget(max_lines=self.config_service.terminal_max_lines())
         panel = Panel("终端", self.terminal_widget)
         panel.panel_icon = make_icon(":/icons/window_console.svg", panel_icon_color)
         self.add_panel(panel, "bottom")
@@ -683,6 +708,10 @@ class MainWindow(
         connect(self.menu_plugins.aboutToShow, self.prepare_plugins_menu)
         connect(self.menu_user.aboutToShow, self.prepare_user_menu)
 
+        if self.config_service.enable_debug_tool():
+            self.menu_debug = self.menu_bar.addMenu("调试")
+            connect(self.menu_debug.aboutToShow, self.prepare_debug_menu)
+
         self.action_create_layout = QtGui.QAction("新建布局…", self)
         self.action_create_layout.setShortcut(QtGui.QKeySequence(QtGui.QKeySequence.StandardKey.New))
         self.action_create_layout.setShortcutContext(QtCore.Qt.ShortcutContext.ApplicationShortcut)
@@ -892,6 +921,44 @@ class MainWindow(
                         act = self.menu_plugins.addAction(item_text)
                     connect(act.triggered, callback)
 
+    def prepare_debug_menu(self):
+        self.menu_debug.clear()
+        profiler = get_sampling_profiler()
+
+        action_start_profiler = self.menu_debug.addAction("开始性能采样")
+        action_start_profiler.setEnabled(not profiler.is_running)
+        connect(action_start_profiler.triggered, self.start_profiler)
+
+        action_stop_profiler = self.menu_debug.addAction("停止性能采样并保存")
+        action_stop_profiler.setEnabled(profiler.is_running)
+        connect(action_stop_profiler.triggered, self.stop_profiler)
+
+        self.menu_debug.addSeparator()
+        stats = self.asset_browser_widget.thumbnail_cache_stats()
+        action_cache_stats = self.menu_debug.addAction(
+            f"缩略图缓存: {stats.entries} 项, "
+            f"{stats.resident_bytes / 2**20:.1f} / {stats.budget_bytes / 2**20:.0f} MB, "
+            f"命中率 {stats.hit_rate:.0%}, 裁剪 {stats.trims}, 淘汰 {stats.evictions}"
+        )
+        action_cache_stats.setEnabled(False)
+
+        action_clear_cache = self.menu_debug.addAction("清空缩略图缓存")
+        connect(action_clear_cache.triggered, self.asset_browser_widget.clear_thumbnail_cache)
+
+    def start_profiler(self):
+        get_sampling_profiler().start(self.config_service.profiler_sample_rate_hz())
+
+    def stop_profiler(self):
+        result = get_sampling_profiler().stop()
+        if result is None:
+            return
+        QtWidgets.QMessageBox.information(
+            self,
+            "性能采样",
+            f"共采样 {result.sample_count} 次，耗时 {result.duration:.2f} 秒。\n"
+            f"火焰图数据（collapsed-stack）已保存到:\n{result.output_path}",
+        )
+
     def prepare_user_menu(self):
         self.menu_user.clear()
         token_data = TokenStorage.load_token()
@@ -1082,6 +1149,10 @@ class MainWindow(
         logger.info("cleanup: 清理主窗口资源开始")
         logger.debug("cleanup: 当前连接状态 - actor_outline_widget=%s", getattr(self, 'actor_outline_widget', None) is not None)
         try:
+            # 0. 停止后台资产同步，避免清理过程中继续热加载资产包
+            if hasattr(self, '_background_asset_sync'):
+                await self._background_asset_sync.stop()
+
             # 1. 首先停止viewport主循环，避免事件循环问题
             await self.cleanup_viewport_resources()
 
@@ -1110,7 +1181,11 @@ class MainWindow(
                 self.config_service.clear_mcp_status()
                 logger.info("cleanup: MCP服务已停止")
 
-            # 8. 强制垃圾回收
+            # 8. 关闭资产浏览器的 HTTP 连接池
+            if hasattr(self, 'asset_browser_widget'):
+                await self.asset_browser_widget.shutdown()
+
+            # 9. 强制垃圾回收
             import gc
             gc.collect()
 
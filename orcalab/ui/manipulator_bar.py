@@ -13,7 +13,6 @@ from orcalab.state_sync_bus import (
 from orcalab.ui.icon_util import make_icon
 from orcalab.ui.button import Button
 from orcalab.pyside_util import connect
-import orcalab.assets.rc_assets
 from orcalab.ui.line import make_vertical_line
 from orcalab.ui.theme_service import ThemeService
 
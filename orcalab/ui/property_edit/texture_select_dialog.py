@@ -6,6 +6,9 @@ from orcalab.texture_asset_cache import TextureAssetCache
 from orcalab.ui.fonts.font_service import FontService
 from orcalab.ui.theme_service import ThemeService
 
+# 列表分批创建条目，滚动到底部时再追加，大目录下打开和搜索都不会卡顿
+TEXTURE_LIST_BATCH_SIZE = 500
+
 
 def _extract_texture_display_name(path: str) -> str:
     filename = path.replace("\\", "/").split("/")[-1]
@@ -30,6 +33,7 @@ class TextureSelectDialog(QtWidgets.QDialog):
         self._cache = cache
         self._selected_uuid: str | None = None
         self._all_items: List[Tuple[str, str]] = []
+        self._shown_items: List[Tuple[str, str]] = []
 
         self.setWindowTitle("选择纹理")
         self.setMinimumSize(500, 400)
@@ -57,7 +61,9 @@ class TextureSelectDialog(QtWidgets.QDialog):
         self._list_widget.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
         )
+        self._list_widget.setUniformItemSizes(True)
         self._list_widget.currentItemChanged.connect(self._on_selection_changed)
+        self._list_widget.verticalScrollBar().valueChanged.connect(self._on_list_scrolled)
         fs.bind_widget_font(self._list_widget, "property_edit")
         layout.addWidget(self._list_widget)
 
@@ -137,15 +143,24 @@ class TextureSelectDialog(QtWidgets.QDialog):
         self._populate_list(self._all_items)
 
     def _populate_list(self, items: List[Tuple[str, str]]):
+        self._shown_items = items
         self._list_widget.clear()
-        for uuid_str, path in items:
+        self._append_batch()
+        self._update_status(len(items))
+
+    def _append_batch(self):
+        start = self._list_widget.count()
+        for uuid_str, path in self._shown_items[start:start + TEXTURE_LIST_BATCH_SIZE]:
             display = _extract_texture_display_name(path)
             item = QtWidgets.QListWidgetItem(display)
             item.setData(QtCore.Qt.ItemDataRole.UserRole, uuid_str)
             item.setToolTip(path)
             self._list_widget.addItem(item)
 
-        self._update_status(len(items))
+    def _on_list_scrolled(self, value: int):
+        scroll_bar = self._list_widget.verticalScrollBar()
+        if value >= scroll_bar.maximum() - scroll_bar.pageStep() and self._list_widget.count() < len(self._shown_items):
+            self._append_batch()
 
     def _update_status(self, count: int):
         total = len(self._cache._uuid_to_path)
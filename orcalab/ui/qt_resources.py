@@ -0,0 +1,30 @@
+"""
+Qt 资源（图标等）
+
+assets.qrc 编译为二进制 assets.rcc（python orcalab/assets/gen.py），运行时通过
+QResource.registerResource 注册。Qt 直接映射该文件，各资源在首次访问时才读取；
+不再像 rc_assets.py 那样在导入时把全部图标作为 bytes 常量解析进内存。
+"""
+
+import logging
+import pathlib
+
+from PySide6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_FILE = pathlib.Path(__file__).resolve().parent.parent / "assets" / "assets.rcc"
+
+_registered = False
+
+
+def register_resources() -> bool:
+    """注册 assets.rcc，重复调用直接返回；使用 ":/icons/..." 路径之前调用"""
+    global _registered
+    if _registered:
+        return True
+    if not QtCore.QResource.registerResource(str(RESOURCE_FILE)):
+        logger.error("注册 Qt 资源失败: %s（可运行 python orcalab/assets/gen.py 重新生成）", RESOURCE_FILE)
+        return False
+    _registered = True
+    return True
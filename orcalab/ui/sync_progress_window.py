@@ -26,7 +26,7 @@ class AssetItemWidget(QtWidgets.QWidget):
         self.asset_name = asset_name
         self.file_name = file_name
         self._size = size
-        self.status = status  # 'download', 'delete', 'ok', 'downloading', 'cloud_deleted'
+        self.status = status  # 'download', 'delete', 'ok', 'downloading', 'verifying', 'cloud_deleted'
         self._has_local = has_local
         self.setup_ui()
     
@@ -83,7 +83,7 @@ class AssetItemWidget(QtWidgets.QWidget):
         # 进度条（仅下载时显示）
         self.progress_bar = QtWidgets.QProgressBar()
         self.progress_bar.setMaximumWidth(150)
-        self.progress_bar.setVisible(self.status in ['download', 'downloading'])
+        self.progress_bar.setVisible(self.status in ['download', 'downloading', 'verifying'])
         layout.addWidget(self.progress_bar)
         
         # 速度和状态文本
@@ -103,6 +103,9 @@ class AssetItemWidget(QtWidgets.QWidget):
         elif self.status in ['download', 'downloading']:
             self._status_icon_color = "blue"
             self._status_icon_char = "⬇"
+        elif self.status == 'verifying':
+            self._status_icon_color = "blue"
+            self._status_icon_char = "⟳"
         elif self.status == 'completed':
             self._status_icon_color = "green"
             self._status_icon_char = "✓"
@@ -142,6 +145,9 @@ class AssetItemWidget(QtWidgets.QWidget):
         elif self.status == 'downloading':
             self.status_text.setText("下载中...")
             self.status_text.setStyleSheet("color: blue;")
+        elif self.status == 'verifying':
+            self.status_text.setText("校验中...")
+            self.status_text.setStyleSheet("color: blue;")
         elif self.status == 'completed':
             self.status_text.setText("下载完成")
             self.status_text.setStyleSheet("color: green;")
@@ -163,15 +169,17 @@ class AssetItemWidget(QtWidgets.QWidget):
     
     def set_progress(self, progress: int64, speed: float = 0):
         """
-        设置下载进度
+        设置下载或校验进度
         
         Args:
             progress: 进度百分比 (0-100)
-            speed: 下载速度 (MB/s)
+            speed: 下载或校验速度 (MB/s)
         """
         self.progress_bar.setValue(progress)
         if speed > 0:
             self.status_text.setText(f"{speed:.2f} MB/s")
+        elif self.status == 'verifying':
+            self.status_text.setText("校验中...")
         else:
             self.status_text.setText("下载中...")
     
@@ -180,7 +188,7 @@ class AssetItemWidget(QtWidgets.QWidget):
         self.status = status
         self.update_status_icon()
         self.update_status_text()
-        self.progress_bar.setVisible(status in ['download', 'downloading'])
+        self.progress_bar.setVisible(status in ['download', 'downloading', 'verifying'])
         self.delete_local_button.setVisible(status == 'cloud_deleted' and self._has_local)
         if status == 'cloud_deleted':
             self.setVisible(not self._has_local)
@@ -0,0 +1,91 @@
+"""
+终端输出缓冲
+
+读取线程调用 append 写入，UI 线程每帧调用 take 一次取走积累的输出。两次 take 之间
+只保留最后 max_lines 行：输出速度超过界面刷新时，被挤掉的行不会再插入文档。被丢弃
+部分中的 ANSI 颜色码随 take 一并返回，界面据此更新当前格式，保证后续文字颜色正确。
+"""
+
+import re
+import threading
+from collections import deque
+from typing import Deque, List, Tuple
+
+ANSI_SGR_PATTERN = re.compile(r"\x1b\[([0-9;]*)m")
+# 丢弃部分中最多保留的颜色码数；遇到复位码时之前的都不再需要
+MAX_DROPPED_CODES = 64
+
+
+def _is_reset(codes: str) -> bool:
+    return codes == "" or "0" in codes.split(";")
+
+
+class TerminalOutputBuffer:
+    def __init__(self, max_lines: int):
+        self._max_lines = max(1, int(max_lines))
+        self._lock = threading.Lock()
+        # (文本, 其中的换行数)
+        self._chunks: Deque[Tuple[str, int]] = deque()
+        self._lines = 0
+        self._dropped_codes: List[str] = []
+        self.appended_chars = 0
+        self.dropped_lines = 0
+
+    @property
+    def max_lines(self) -> int:
+        return self._max_lines
+
+    @property
+    def pending(self) -> bool:
+        """是否有尚未 take 的输出"""
+        return bool(self._chunks)
+
+    def append(self, text: str) -> bool:
+        """可在任意线程调用；返回缓冲区此前是否为空，调用方据此安排一次刷新"""
+        if not text:
+            return False
+        lines = text.count("\n")
+        with self._lock:
+            was_empty = not self._chunks
+            self._chunks.append((text, lines))
+            self._lines += lines
+            self.appended_chars += len(text)
+            # 最前面的整块都落在最后 max_lines 行之外时直接丢弃
+            while len(self._chunks) > 1 and self._lines - self._chunks[0][1] >= self._max_lines:
+                dropped, dropped_lines = self._chunks.popleft()
+                self._lines -= dropped_lines
+                self.dropped_lines += dropped_lines
+                self._drop_codes(dropped)
+            return was_empty
+
+    def take(self) -> Tuple[List[str], str]:
+        """取走缓冲的输出；返回 (被丢弃部分的 ANSI 颜色码, 要显示的文本)"""
+        with self._lock:
+            text = "".join(chunk for chunk, _ in self._chunks)
+            excess = self._lines - self._max_lines
+            self._chunks.clear()
+            self._lines = 0
+            if excess > 0:
+                cut = -1
+                for _ in range(excess):
+                    cut = text.index("\n", cut + 1)
+                self.dropped_lines += excess
+                self._drop_codes(text[:cut + 1])
+                text = text[cut + 1:]
+            codes, self._dropped_codes = self._dropped_codes, []
+        return codes, text
+
+    def clear(self) -> None:
+        with self._lock:
+            self._chunks.clear()
+            self._lines = 0
+            self._dropped_codes = []
+
+    def _drop_codes(self, text: str) -> None:
+        if "\x1b" not in text:
+            return
+        for codes in ANSI_SGR_PATTERN.findall(text):
+            if _is_reset(codes):
+                self._dropped_codes.clear()
+            self._dropped_codes.append(codes)
+        del self._dropped_codes[:-MAX_DROPPED_CODES]
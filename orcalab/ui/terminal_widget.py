@@ -1,12 +1,19 @@
 from PySide6 import QtCore, QtWidgets, QtGui
 import subprocess
 import threading
-import queue
 import os
 import sys
 import re
 
 from orcalab.ui.fonts.font_service import FontService
+from orcalab.ui.terminal_buffer import ANSI_SGR_PATTERN, TerminalOutputBuffer
+
+# 终端保留的最大行数，超出时从顶部删除
+TERMINAL_MAX_LINES = 10000
+# 输出合并后最多每帧刷新一次界面
+TERMINAL_FLUSH_INTERVAL_MS = 16
+# 块末尾未写完的 ANSI 转义码，留到下一次追加时拼接
+_INCOMPLETE_SGR_PATTERN = re.compile(r"\x1b(\[[0-9;]*)?\Z")
 
 
 class TerminalTextEdit(QtWidgets.QTextEdit):
@@ -38,12 +45,19 @@ class TerminalTextEdit(QtWidgets.QTextEdit):
         super().__init__(parent)
         self._input_buffer = ""
         self._pty_mode = False
+        self._partial_escape = ""
         # 禁用默认的undo/redo
         self.setUndoRedoEnabled(False)
         
         # 当前文本格式
         self._current_format = QtGui.QTextCharFormat()
         self._reset_format()
+
+    def set_max_lines(self, max_lines: int):
+        """限制文档保留的完整行数，超出时从顶部删除"""
+        # 最后一个段落是正在输出的行
+        self.document().setMaximumBlockCount(max(1, max_lines) + 1)
+
     def _reset_format(self):
         """重置文本格式为默认"""
         self._current_format = QtGui.QTextCharFormat()
@@ -76,16 +90,36 @@ class TerminalTextEdit(QtWidgets.QTextEdit):
             elif code.startswith('9') and len(code) == 2:  # 高亮前景色
                 pass  # 已在ANSI_COLORS中处理
     
+    def skip_ansi_text(self, codes):
+        """应用未显示部分中的 ANSI 颜色码，使后续文本格式与完整输出一致"""
+        # 上次留下的半截转义码属于被丢弃的输出
+        self._partial_escape = ""
+        for code_str in codes:
+            self._parse_ansi_codes(code_str)
+
     def append_ansi_text(self, text):
         """追加带ANSI转义码的文本"""
-        # ANSI转义码正则表达式
-        ansi_pattern = re.compile(r'\x1b\[([0-9;]*)m')
-        
+        if self._partial_escape:
+            text = self._partial_escape + text
+            self._partial_escape = ""
+        tail = text.rfind("\x1b", max(0, len(text) - 32))
+        if tail != -1 and _INCOMPLETE_SGR_PATTERN.match(text, tail):
+            self._partial_escape = text[tail:]
+            text = text[:tail]
+        if not text:
+            return
+
         cursor = self.textCursor()
         cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
-        
+
+        # 纯文本直接插入
+        if "\x1b" not in text:
+            cursor.insertText(text, self._current_format)
+            self._scroll_to_end(cursor)
+            return
+
         last_pos = 0
-        for match in ansi_pattern.finditer(text):
+        for match in ANSI_SGR_PATTERN.finditer(text):
             # 插入转义码之前的文本
             if match.start() > last_pos:
                 plain_text = text[last_pos:match.start()]
@@ -101,7 +135,10 @@ class TerminalTextEdit(QtWidgets.QTextEdit):
         if last_pos < len(text):
             plain_text = text[last_pos:]
             cursor.insertText(plain_text, self._current_format)
-        
+
+        self._scroll_to_end(cursor)
+
+    def _scroll_to_end(self, cursor):
         self.setTextCursor(cursor)
         
         # 自动滚动到底部
@@ -186,23 +223,25 @@ class TerminalWidget(QtWidgets.QWidget):
     # 进程被中断信号（Ctrl+C）
     process_interrupted = QtCore.Signal()
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_lines: int = TERMINAL_MAX_LINES):
         super().__init__(parent)
         
         self.process = None
         self._pty_master_fd = None
         self._win_pty = None
-        self.output_queue = queue.Queue()
         self.output_thread = None
         self.is_running = False
         
         self._fs = FontService()
         self._setup_ui()
-        
-        # 创建定时器来更新UI
-        self.update_timer = QtCore.QTimer()
-        self.update_timer.timeout.connect(self._update_output)
-        self.update_timer.start(50)  # 每50ms更新一次
+
+        # 各线程的输出先写入缓冲，由定时器合并后每帧最多刷新一次
+        self._output_buffer = TerminalOutputBuffer(max_lines)
+        self.output_text.set_max_lines(max_lines)
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(TERMINAL_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_output)
         
         self._fs.bind_widget_stylesheet(self, self._build_stylesheet)
     
@@ -432,45 +471,57 @@ class TerminalWidget(QtWidgets.QWidget):
                 chunk = stdout.read(4096)
                 if not chunk:
                     break
-                self.output_queue.put(chunk.decode("utf-8", errors="replace"))
+                self._append_output(chunk.decode("utf-8", errors="replace"))
             
             return_code = self.process.wait()
-            self.output_queue.put(f"\n进程退出，返回码: {return_code}\n")
+            self._append_output(f"\n进程退出，返回码: {return_code}\n")
                 
         except Exception as e:
-            self.output_queue.put(f"读取输出时出错: {str(e)}\n")
-    
-    def _update_output(self):
-        """更新UI显示输出"""
-        try:
-            while True:
-                try:
-                    if self.output_queue.empty():
-                        break
-                    line = self.output_queue.get_nowait()
-                    self._append_output(line)
-                except queue.Empty:
-                    break
-        except Exception as e:
-            print(f"更新输出时出错: {e}")
+            self._append_output(f"读取输出时出错: {str(e)}\n")
     
+    def append_output(self, text):
+        """追加输出（可在任意线程调用），下一帧显示"""
+        self._append_output(text)
+
+    def has_pending_output(self) -> bool:
+        """是否还有已追加但尚未显示的输出"""
+        return self._flush_timer.isActive() or self._output_buffer.pending
+
+    def flush_pending(self):
+        """立即显示缓冲的输出（在主线程中调用）"""
+        self._flush_timer.stop()
+        self._flush_output()
+
     def _append_output(self, text):
-        """追加输出到文本区域"""
-        # 使用信号槽机制确保在主线程中更新UI
-        QtCore.QMetaObject.invokeMethod(
-            self, "_append_output_safe",
-            QtCore.Qt.ConnectionType.QueuedConnection,
-            QtCore.Q_ARG(str, text)
-        )
+        """追加输出到文本区域（可在任意线程调用）"""
+        if self._output_buffer.append(text):
+            # 缓冲区由空变为非空时安排一次刷新；使用信号槽机制确保在主线程中启动定时器
+            QtCore.QMetaObject.invokeMethod(
+                self, "_schedule_flush",
+                QtCore.Qt.ConnectionType.QueuedConnection,
+            )
+
+    @QtCore.Slot()
+    def _schedule_flush(self):
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_output(self):
+        """把缓冲的输出一次性写入文本区域（在主线程中调用）"""
+        dropped_codes, text = self._output_buffer.take()
+        if dropped_codes:
+            self.output_text.skip_ansi_text(dropped_codes)
+        self.output_text.append_ansi_text(text)
     
     @QtCore.Slot(str)
     def _append_output_safe(self, text):
         """安全地追加输出（在主线程中调用）"""
-        # 使用新的ANSI支持方法
-        self.output_text.append_ansi_text(text)
+        # 经过缓冲区，保持与进程输出的先后顺序
+        self._append_output(text)
     
     def clear_output(self):
         """清空输出"""
+        self._output_buffer.clear()
         self.output_text.clear()
         self._append_output("输出已清空\n")
     
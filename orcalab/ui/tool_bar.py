@@ -1,5 +1,5 @@
 from PySide6 import QtCore, QtWidgets, QtGui
-import orcalab.assets.rc_assets
+from orcalab.ui.qt_resources import register_resources
 
 
 class ToolBar(QtWidgets.QWidget):
@@ -11,6 +11,8 @@ class ToolBar(QtWidgets.QWidget):
         self._layout.setSpacing(8)
         self.setLayout(self._layout)
 
+        register_resources()
+
         self.action_start = QtGui.QAction("开始", self)
         self.action_start.setIcon(QtGui.QIcon(":/icons/play"))
 
@@ -0,0 +1,106 @@
+"""
+资产浏览器过滤基准：逐字输入搜索关键字时每次 apply_filters 的耗时。
+
+- legacy：每次对全部资产重新做分类过滤并逐个小写化文件名 / englishName 再匹配
+- index：AssetModel 使用 set_assets 时建立的搜索索引，输入更多字符时在上次结果中过滤
+
+用法：
+    python scripts/bench/bench_asset_filter.py --assets 100000 --keyword chair
+"""
+
+import argparse
+import os
+import pathlib
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from orcalab.ui.asset_browser.asset_info import AssetInfo  # noqa: E402
+from orcalab.ui.asset_browser.asset_model import AssetModel  # noqa: E402
+
+WORDS = ["chair", "table", "lamp", "cabinet", "sofa", "robot", "shelf", "box", "bottle", "cup", "door", "kitchen"]
+CATEGORIES = ["/furniture/chair", "/furniture/table", "/lighting", "/kitchen", "/robot/arm", "/props"]
+
+
+def make_assets(count: int):
+    rng = random.Random(0)
+    assets = []
+    for i in range(count):
+        info = AssetInfo()
+        info.name = f"{rng.choice(WORDS)}_{rng.choice(WORDS)}_{i:06d}"
+        info.path = f"prefabs/{info.name}"
+        info.metadata = {
+            "englishName": f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} {i}",
+            "name": f"资产{i}",
+            "categoryPath": rng.choice(CATEGORIES),
+        }
+        assets.append(info)
+    return assets
+
+
+def legacy_filter(assets, category: str, include: str, exclude: str):
+    def matches(asset, keyword):
+        if keyword in asset.name.lower():
+            return True
+        english_name = asset.metadata.get('englishName', '')
+        name = asset.metadata.get('name', '')
+        return keyword in english_name.lower() or keyword in name
+
+    result = assets
+    if category:
+        result = [a for a in result if a.metadata.get('categoryPath', '').startswith(category)]
+    if include:
+        result = [a for a in result if matches(a, include.lower())]
+    if exclude:
+        result = [a for a in result if not matches(a, exclude.lower())]
+    return result
+
+
+def typing_sequence(keyword: str):
+    # 逐字输入，再逐字删除
+    prefixes = [keyword[:i] for i in range(1, len(keyword) + 1)]
+    return prefixes + prefixes[-2::-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=100000)
+    parser.add_argument("--keyword", default="chair")
+    parser.add_argument("--category", default="")
+    args = parser.parse_args()
+
+    assets = make_assets(args.assets)
+    sequence = typing_sequence(args.keyword)
+
+    legacy_times = []
+    for text in sequence:
+        start = time.perf_counter()
+        legacy_filter(assets, args.category, text, "")
+        legacy_times.append(time.perf_counter() - start)
+
+    model = AssetModel()
+    model.category_filter = args.category
+    start = time.perf_counter()
+    model.set_assets(assets)
+    build = time.perf_counter() - start
+    index_times = []
+    for text in sequence:
+        model.include_filter = text
+        start = time.perf_counter()
+        model.apply_filters()
+        index_times.append(time.perf_counter() - start)
+
+    print(f"{args.assets} assets, typing {args.keyword!r} then deleting it ({len(sequence)} keystrokes)")
+    print(f"legacy: median {statistics.median(legacy_times) * 1000:7.1f} ms, "
+          f"max {max(legacy_times) * 1000:7.1f} ms per keystroke")
+    print(f"index:  median {statistics.median(index_times) * 1000:7.1f} ms, "
+          f"max {max(index_times) * 1000:7.1f} ms per keystroke "
+          f"(set_assets incl. index build {build * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+pak 校验启动耗时基准：冷启动（无哈希缓存，串行 / 并发）与热启动（命中哈希缓存）。
+
+用法：
+    python scripts/bench/bench_content_hash_store.py --count 200 --size-mb 32 --workers 8
+
+注意：冷启动结果受操作系统页缓存影响，测量真实磁盘读取前请先清空页缓存
+（Linux: sync; echo 3 | sudo tee /proc/sys/vm/drop_caches）。
+"""
+
+import argparse
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from orcalab.content_hash_store import ContentHashStore  # noqa: E402
+
+
+def _make_paks(folder: pathlib.Path, count: int, size_mb: int) -> list[pathlib.Path]:
+    block = os.urandom(1024 * 1024)
+    paks = []
+    for i in range(count):
+        pak = folder / f"{i:05d}.pak"
+        with open(pak, "wb") as f:
+            for _ in range(size_mb):
+                f.write(block)
+        paks.append(pak)
+    return paks
+
+
+def _verify_parallel(store_file: pathlib.Path, paks: list[pathlib.Path], workers: int) -> float:
+    start = time.perf_counter()
+    store = ContentHashStore(store_file)
+    store.sha256_many(paks, max_workers=workers)
+    store.save()
+    return time.perf_counter() - start
+
+
+def _verify_all(store_file: pathlib.Path, paks: list[pathlib.Path]) -> float:
+    start = time.perf_counter()
+    store = ContentHashStore(store_file)
+    for pak in paks:
+        store.sha256(pak)
+    store.save()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100, help="订阅 pak 数量")
+    parser.add_argument("--size-mb", type=int, default=16, help="每个 pak 大小（MB）")
+    parser.add_argument("--workers", type=int, default=4, help="并发校验文件数")
+    parser.add_argument("--dir", default=None, help="测试目录（默认系统临时目录）")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        folder = pathlib.Path(tmp)
+        paks = _make_paks(folder, args.count, args.size_mb)
+        store_file = folder / ".content_hash_store.json"
+        total_mb = args.count * args.size_mb
+
+        cold = _verify_all(store_file, paks)
+        store_file.unlink()
+        parallel = _verify_parallel(store_file, paks, args.workers)
+        warm = _verify_all(store_file, paks)
+
+        print(f"paks: {args.count} x {args.size_mb} MB = {total_mb} MB")
+        print(f"cold: {cold:8.3f} s  ({total_mb / cold:8.1f} MB/s)")
+        print(f"cold x{args.workers}: {parallel:8.3f} s  ({total_mb / parallel:8.1f} MB/s)")
+        print(f"warm: {warm:8.3f} s  (store {store_file.stat().st_size / 1024:.1f} KB)")
+        print(f"speedup: {cold / warm:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+缩略图图片后处理基准。
+
+- 编码参数：15 帧 256px APNG 全景图与 512px 标注图在不同 zlib 压缩级别下的耗时和体积
+- 执行位置：--assets 个资产的合成按原实现在事件循环中执行（APNG 压缩级别 9）与按
+  默认参数提交到 ImageProcessPool，比较总耗时和事件循环的最长卡顿
+
+帧图用渐变背景上带纹理、随角度变化的物体近似渲染结果。
+
+用法：
+    python scripts/bench/bench_image_encode.py --assets 8
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from PIL import Image, ImageDraw, ImageFilter  # noqa: E402
+
+from orcalab.ui.image_process_pool import ImageProcessPool  # noqa: E402
+from orcalab.ui.image_utils import ImageProcessor  # noqa: E402
+
+ENCODER_SETTINGS = [
+    ("optimize", dict(optimize=True)),
+    ("level 9", dict(compress_level=9)),
+    ("level 6", dict(compress_level=6)),
+    ("level 3", dict(compress_level=3)),
+    ("level 1", dict(compress_level=1)),
+]
+AABB_TEXT = "AABB: [-0.40, -0.30, 0.00]\n      [0.40, 0.30, 1.20]"
+
+
+def render_frame(size: int, angle: int) -> Image.Image:
+    img = Image.linear_gradient("L").resize((size, size)).point(lambda v: 60 + v // 3).convert("RGBA")
+    obj = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(obj)
+    w = int(size * (0.25 + 0.15 * abs((angle % 180) - 90) / 90))
+    c = size // 2
+    draw.rectangle([c - w, c - size // 4, c + w, c + size // 3], fill=(150, 90, 40, 255))
+    draw.ellipse([c - w // 2, c - size // 3, c + w // 2, c], fill=(200, 200, 210, 255))
+    obj = obj.filter(ImageFilter.SMOOTH)
+    noise = Image.effect_noise((size, size), 12).convert("L")
+    r, g, b, a = obj.split()
+    obj = Image.merge("RGBA", [Image.blend(ch, noise, 0.15) for ch in (r, g, b)] + [a])
+    img.alpha_composite(obj)
+    return img
+
+
+def encode(save, repeat: int = 3) -> tuple:
+    """返回 (最短耗时, 编码后字节数)"""
+    times = []
+    for _ in range(repeat):
+        buf = io.BytesIO()
+        start = time.perf_counter()
+        save(buf)
+        times.append(time.perf_counter() - start)
+    return min(times), len(buf.getvalue())
+
+
+def bench_encoders(frames, frame_512) -> None:
+    print("encoder settings (15 x 256px APNG / 512px annotated PNG):")
+    for name, kwargs in ENCODER_SETTINGS:
+        apng_time, apng_size = encode(lambda buf: frames[0].save(
+            buf, format="PNG", save_all=True, append_images=frames[1:], duration=200, loop=0, **kwargs))
+        annotated_time, annotated_size = encode(lambda buf: frame_512.save(buf, format="PNG", **kwargs))
+        print(f"  {name:9s} apng {apng_time * 1000:6.0f} ms {apng_size / 1024:6.0f} KB | "
+              f"512 {annotated_time * 1000:5.0f} ms {annotated_size / 1024:5.0f} KB")
+
+
+def write_job(folder: str, n: int, frames, frame_512):
+    png_files, png_512_files = [], []
+    for i, frame in enumerate(frames):
+        path = os.path.join(folder, f"asset{n}_256_{i}.png")
+        frame.save(path, compress_level=1)
+        png_files.append(path)
+    for i in range(3):
+        path = os.path.join(folder, f"asset{n}_{i}_512.png")
+        frame_512.save(path, compress_level=1)
+        png_512_files.append(path)
+    return png_files, png_512_files, os.path.join(folder, f"asset{n}_panorama.apng")
+
+
+async def measure_stall(work) -> tuple:
+    """运行 work 的同时每 5ms 调度一次心跳，返回 (总耗时, 最长卡顿)"""
+    stall = 0.0
+    done = False
+
+    async def heartbeat():
+        nonlocal stall
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            stall = max(stall, now - last - 0.005)
+            last = now
+
+    ticker = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker
+    return elapsed, stall
+
+
+def bench_execution(assets: int, frames, frame_512) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = [write_job(tmp, n, frames, frame_512) for n in range(assets)]
+
+        async def inline():
+            for png_files, png_512_files, apng_path in jobs:
+                for path in png_512_files:
+                    ImageProcessor.add_text_to_image(path, AABB_TEXT, font_size=10)
+                images = [Image.open(p) for p in png_files]
+                # 原实现使用 optimize=True，即压缩级别 9
+                ImageProcessor.create_apng_panorama(images, apng_path, compress_level=9)
+                for img in images:
+                    img.close()
+                await asyncio.sleep(0)
+
+        pool = ImageProcessPool()
+
+        async def pooled():
+            tasks = []
+            for png_files, png_512_files, apng_path in jobs:
+                tasks.append(pool.create_apng_panorama(png_files, apng_path))
+                tasks.extend(pool.add_text_to_image(path, AABB_TEXT, font_size=10) for path in png_512_files)
+            assert all(await asyncio.gather(*tasks))
+
+        # 先启动进程池，避免把 spawn 子进程的时间算进去
+        asyncio.run(pool.add_text_to_image(jobs[0][1][0], AABB_TEXT))
+        try:
+            inline_time, inline_stall = asyncio.run(measure_stall(inline))
+            pool_time, pool_stall = asyncio.run(measure_stall(pooled))
+        finally:
+            pool.shutdown(wait=True)
+
+    print(f"{assets} assets, {pool.max_workers} worker processes, cpu count {os.cpu_count()}:")
+    print(f"  event loop, level 9:   {inline_time:6.2f} s, longest stall {inline_stall * 1000:6.0f} ms")
+    print(f"  process pool, level 6: {pool_time:6.2f} s, longest stall {pool_stall * 1000:6.0f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=8)
+    args = parser.parse_args()
+
+    frames = [render_frame(256, angle) for angle in range(0, 360, 24)]
+    frame_512 = render_frame(512, 0).convert("RGB")
+    bench_encoders(frames, frame_512)
+    bench_execution(args.assets, frames, frame_512)
+
+
+if __name__ == "__main__":
+    main()
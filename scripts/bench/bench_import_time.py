@@ -0,0 +1,144 @@
+"""
+导入耗时基准：在独立子进程中以 -X importtime 导入各入口模块，解析输出并与预算比较。
+
+每个模块测量 --runs 次取最小值（排除磁盘缓存等抖动），报告：
+- 模块累计导入耗时与预算
+- 自身耗时最多的依赖模块
+- 预算中列为禁止提前加载的重量级模块（scipy、PIL、fastmcp 等）是否被导入
+
+超出预算或加载了禁止的模块时以返回码 1 退出，可用于回归检查。
+
+用法：
+    python scripts/bench/bench_import_time.py
+    python scripts/bench/bench_import_time.py --runs 5 --top 15 orcalab.launcher
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+BUDGET_FILE = pathlib.Path(__file__).with_name("import_time_budget.json")
+
+
+@dataclass
+class ImportEntry:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    module: str
+    entries: List[ImportEntry] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def cumulative_ms(self) -> Optional[float]:
+        for entry in self.entries:
+            if entry.name == self.module and entry.depth == 0:
+                return entry.cumulative_us / 1000
+        return None
+
+    def loaded(self, package: str) -> bool:
+        return any(e.name == package or e.name.startswith(package + ".") for e in self.entries)
+
+
+def parse_importtime(stderr: str) -> List[ImportEntry]:
+    """解析 `import time: self [us] | cumulative | imported package` 行；缩进两个空格为一层"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        raw_name = parts[2].rstrip()
+        name = raw_name.lstrip()
+        depth = (len(raw_name) - len(name) - 1) // 2
+        entries.append(ImportEntry(name, int(parts[0]), int(parts[1]), depth))
+    return entries
+
+
+def profile_import(module: str) -> ImportProfile:
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    profile = ImportProfile(module, parse_importtime(proc.stderr))
+    if proc.returncode != 0:
+        lines = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        profile.error = lines[-1] if lines else f"exit code {proc.returncode}"
+    return profile
+
+
+def best_profile(module: str, runs: int) -> ImportProfile:
+    profiles = [profile_import(module) for _ in range(max(1, runs))]
+    return min(profiles, key=lambda p: p.cumulative_ms if p.cumulative_ms is not None else float("inf"))
+
+
+def report(profile: ImportProfile, budget: Dict, top: int) -> List[str]:
+    violations = []
+    total = profile.cumulative_ms
+    budget_ms = budget.get("budget_ms")
+    print(f"\n== {profile.module}")
+    if profile.error:
+        print(f"   导入失败: {profile.error}")
+        violations.append(f"{profile.module}: 导入失败")
+    if total is not None:
+        status = ""
+        if budget_ms is not None:
+            status = " OK" if total <= budget_ms else " 超出预算"
+            if total > budget_ms:
+                violations.append(f"{profile.module}: {total:.1f} ms > {budget_ms} ms")
+        print(f"   累计 {total:8.1f} ms  预算 {budget_ms if budget_ms is not None else '-'} ms{status}")
+
+    for package in budget.get("forbidden", []):
+        if profile.loaded(package):
+            print(f"   禁止提前加载的模块已被导入: {package}")
+            violations.append(f"{profile.module}: 导入了 {package}")
+
+    heaviest = sorted(profile.entries, key=lambda e: e.self_us, reverse=True)[:top]
+    for entry in heaviest:
+        print(f"   {entry.self_us / 1000:8.1f} ms  {entry.name}")
+    return violations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", help="要测量的模块；默认为预算文件中的全部模块")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10, help="列出自身耗时最多的模块数")
+    parser.add_argument("--budget", type=pathlib.Path, default=BUDGET_FILE)
+    args = parser.parse_args()
+
+    budgets = json.loads(args.budget.read_text(encoding="utf-8"))
+    modules = args.modules or list(budgets)
+
+    violations = []
+    for module in modules:
+        violations += report(best_profile(module, args.runs), budgets.get(module, {}), args.top)
+
+    print()
+    if violations:
+        print("导入耗时预算检查未通过:")
+        for violation in violations:
+            print(f"  - {violation}")
+        return 1
+    print("导入耗时预算检查通过")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+场景扫描基准：首次扫描（逐个打开 pak）与索引命中（pak 未变化）的耗时对比。
+
+用法：
+    python scripts/bench/bench_level_discovery.py --paks 200 --files 2000
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import tempfile
+import time
+import zipfile
+from unittest.mock import patch
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from orcalab.level_discovery import discover_levels_from_cache  # noqa: E402
+
+
+def _make_paks(cache_folder: pathlib.Path, paks: int, files: int) -> None:
+    for p in range(paks):
+        pak_path = cache_folder / f"pak_{p:04d}.pak"
+        with zipfile.ZipFile(pak_path, "w") as pak:
+            scene = f"levels/scene_{p}.spawnable"
+            pak.writestr("scene_layouts.json", json.dumps({"scenes": [{"name": f"Scene {p}", "path": scene}]}))
+            pak.writestr(scene, b"")
+            for i in range(files):
+                pak.writestr(f"assets/{p}/file_{i}.bin", b"")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paks", type=int, default=200)
+    parser.add_argument("--files", type=int, default=2000, help="每个 pak 中的文件数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        cache_folder = root / "cache"
+        layout_folder = root / "layouts"
+        cache_folder.mkdir()
+        layout_folder.mkdir()
+        _make_paks(cache_folder, args.paks, args.files)
+
+        with patch("orcalab.level_discovery.get_cache_folder", return_value=cache_folder), \
+                patch("orcalab.level_discovery.get_user_scene_layout_folder", return_value=layout_folder):
+            start = time.perf_counter()
+            levels = discover_levels_from_cache()
+            cold = time.perf_counter() - start
+
+            start = time.perf_counter()
+            discover_levels_from_cache()
+            warm = time.perf_counter() - start
+
+            (cache_folder / "pak_0001.pak").touch()
+            start = time.perf_counter()
+            discover_levels_from_cache()
+            one_changed = time.perf_counter() - start
+
+        print(f"{args.paks} paks x {args.files} files, {len(levels)} levels")
+        print(f"full scan:        {cold:8.3f} s")
+        print(f"index, unchanged: {warm:8.3f} s")
+        print(f"index, 1 changed: {one_changed:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+日志调用开销基准：调用线程上每条日志的耗时。
+
+对比旧配置（同步 FileHandler + StreamHandler）、标准库 QueueHandler，以及 setup_logging
+当前的队列管线（只在调用线程合并参数，格式化与写盘在监听线程）。另外测量被限流规则
+丢弃的记录（模拟终端子进程输出）和被级别过滤掉的调用。每种情况报告 p50 / p99 / 最大值。
+文件处理器每写 --stall-every 条记录等待 --disk-stall-ms 毫秒，模拟磁盘回写造成的卡顿。
+
+用法：
+    python scripts/bench/bench_logging.py --calls 50000
+"""
+
+import argparse
+import logging
+import logging.handlers
+import pathlib
+import queue
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from orcalab import logging_util  # noqa: E402
+from orcalab.logging_util import LogRateLimit  # noqa: E402
+
+FORMAT = "[%(asctime)s] %(levelname)s %(name)s - %(message)s"
+
+
+def measure(log, calls: int) -> list:
+    timings = []
+    payload = {"actor": "/root/robot_0/link_3", "pos": [0.1, 0.2, 0.3]}
+    for i in range(calls):
+        start = time.perf_counter()
+        log("[GRPC TRAFFIC] set_property() called step=%d value=%s", i, payload)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name: str, timings: list) -> None:
+    timings.sort()
+    p99 = timings[int(len(timings) * 0.99)]
+    print(f"{name:34s} p50 {statistics.median(timings) * 1e6:7.2f} us  p99 {p99 * 1e6:7.2f} us  "
+          f"max {timings[-1] * 1e3:7.2f} ms  mean {statistics.fmean(timings) * 1e6:7.2f} us")
+
+
+def add_disk_stalls(handler: logging.Handler, stall: float, every: int) -> None:
+    emit = handler.emit
+    count = 0
+
+    def stalled_emit(record):
+        nonlocal count
+        count += 1
+        if every and count % every == 0:
+            time.sleep(stall)
+        emit(record)
+
+    handler.emit = stalled_emit
+
+
+def isolated_logger(name: str, *handlers: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    for handler in handlers:
+        logger.addHandler(handler)
+    return logger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--disk-stall-ms", type=float, default=5.0)
+    parser.add_argument("--stall-every", type=int, default=500)
+    args = parser.parse_args()
+
+    stall = args.disk_stall_ms / 1000
+    print(f"{args.calls} calls, disk stall {args.disk_stall_ms:.1f} ms every {args.stall_every} records")
+    with tempfile.TemporaryDirectory() as tmp:
+        formatter = logging.Formatter(FORMAT)
+
+        file_handler = logging.FileHandler(f"{tmp}/legacy.log", encoding="utf-8")
+        file_handler.setFormatter(formatter)
+        add_disk_stalls(file_handler, stall, args.stall_every)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.WARNING)
+        logger = isolated_logger("bench.legacy", file_handler, console_handler)
+        report("sync FileHandler", measure(logger.info, args.calls))
+        file_handler.close()
+
+        stdlib_queue = queue.SimpleQueue()
+        stdlib_file = logging.FileHandler(f"{tmp}/stdlib.log", encoding="utf-8")
+        stdlib_file.setFormatter(formatter)
+        add_disk_stalls(stdlib_file, stall, args.stall_every)
+        listener = logging.handlers.QueueListener(stdlib_queue, stdlib_file)
+        listener.start()
+        logger = isolated_logger("bench.stdlib", logging.handlers.QueueHandler(stdlib_queue))
+        report("stdlib QueueHandler", measure(logger.info, args.calls))
+        listener.stop()
+        stdlib_file.close()
+
+        logger = logging_util.setup_logging(
+            file_level=logging.DEBUG,
+            console_level=logging.WARNING,
+            log_dir=tmp,
+            rate_limits={"orcalab.bench.terminal": LogRateLimit(per_second=50, burst=200)},
+        )
+        add_disk_stalls(logging_util.get_log_file_handler(), stall, args.stall_every)
+        report("setup_logging queue", measure(logging.getLogger("orcalab.bench.grpc").info, args.calls))
+        report("setup_logging rate-limited", measure(logging.getLogger("orcalab.bench.terminal").info, args.calls))
+        disabled = logging.getLogger("bench.disabled")
+        disabled.setLevel(logging.INFO)
+        report("level-filtered (debug at INFO)", measure(disabled.debug, args.calls))
+        start = time.perf_counter()
+        logging_util.shutdown_logging()
+        print(f"listener drain on shutdown: {(time.perf_counter() - start) * 1e3:.1f} ms")
+        sizes = {p.name: p.stat().st_size for p in pathlib.Path(tmp).iterdir()}
+        print("log files:", ", ".join(f"{name} {size // 1024} KB" for name, size in sorted(sizes.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+元数据加载基准：整体解析 metadata.json 并构建资产表 与 SQLite 索引存储（metadata.json 未变化）。
+
+用法：
+    python scripts/bench/bench_metadata_store.py --packages 500 --assets 40
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from orcalab.metadata_store import MetadataStore, normalize_asset_path  # noqa: E402
+
+
+def _make_document(packages: int, assets: int) -> dict:
+    document = {}
+    for p in range(packages):
+        pkg_id = f"pkg-{p:05d}"
+        document[pkg_id] = {
+            "id": pkg_id,
+            "name": f"Package {p}",
+            "description": "x" * 200,
+            "children": [
+                {
+                    "id": f"{pkg_id}-{a}",
+                    "assetPath": f"Project{p}/Assets/Item_{a}.spawnable",
+                    "parentPackageId": pkg_id,
+                    "category": "props",
+                    "description": "y" * 300,
+                    "pictures": [{"url": f"https://example.com/{pkg_id}/{a}/{i}.png"} for i in range(4)],
+                }
+                for a in range(assets)
+            ],
+        }
+    return document
+
+
+def _load_json(json_path: pathlib.Path) -> dict:
+    metadata = json.loads(json_path.read_bytes().decode("utf-8"))
+    asset_map = {}
+    for pak_metadata in metadata.values():
+        for asset_metadata in pak_metadata.get("children") or []:
+            asset_map[normalize_asset_path(asset_metadata["assetPath"])] = asset_metadata
+    return asset_map
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", type=int, default=500)
+    parser.add_argument("--assets", type=int, default=40, help="每个包的资产数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = pathlib.Path(tmp)
+        json_path = folder / "metadata.json"
+        json_path.write_text(json.dumps(_make_document(args.packages, args.assets), indent=2), encoding="utf-8")
+        probe = f"project{args.packages // 2}/assets/item_0"
+
+        start = time.perf_counter()
+        asset_map = _load_json(json_path)
+        asset_map.get(probe)
+        json_time = time.perf_counter() - start
+
+        store = MetadataStore(folder / "metadata.sqlite3")
+        start = time.perf_counter()
+        store.sync_from_json(json_path)
+        migrate_time = time.perf_counter() - start
+        store.close()
+
+        start = time.perf_counter()
+        store = MetadataStore(folder / "metadata.sqlite3")
+        store.sync_from_json(json_path)
+        store.get_asset(probe)
+        warm_time = time.perf_counter() - start
+        store.close()
+
+        print(f"metadata.json: {json_path.stat().st_size / (1024 * 1024):.1f} MB, {len(asset_map)} assets")
+        print(f"json load + map:      {json_time:8.3f} s")
+        print(f"store migrate:        {migrate_time:8.3f} s (one-off)")
+        print(f"store open + lookup:  {warm_time:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+订阅元数据获取基准：整体 response.json() + dumps/loads 往返 与 流式解析边解析边过滤。
+
+本地 HTTP 服务器提供两份元数据列表（published / unpublished），每种方式在独立子进程中
+运行，统计耗时与子进程峰值 RSS（ru_maxrss）。
+
+用法：
+    python scripts/bench/bench_metadata_streaming.py --packages 400 --assets 40 --subscribed 20
+"""
+
+import argparse
+import asyncio
+import http.server
+import json
+import pathlib
+import resource
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+import aiohttp  # noqa: E402
+
+from orcalab.http_service.json_stream import SubscriptionMetadataCollector, aiter_json_array  # noqa: E402
+
+
+def _make_listing(packages: int, assets: int, offset: int) -> list:
+    listing = []
+    for p in range(offset, offset + packages):
+        pkg_id = f"pkg-{p:05d}"
+        listing.append({"id": pkg_id, "name": f"Package {p}", "description": "x" * 200})
+        for a in range(assets):
+            listing.append({
+                "id": f"{pkg_id}-{a}",
+                "assetPath": f"Project{p}/Assets/Item_{a}.spawnable",
+                "parentPackageId": pkg_id,
+                "category": "props",
+                "description": "y" * 300,
+                "tags": ["tag"] * 8,
+            })
+    return listing
+
+
+def _subscribed_ids(packages: int, subscribed: int) -> list:
+    step = max(1, (packages * 2) // max(1, subscribed))
+    return [f"pkg-{p:05d}" for p in range(0, packages * 2, step)][:subscribed]
+
+
+async def _legacy(base_url: str, subscribed: list) -> int:
+    # 与改造前的 get_all_metadata / get_subscription_metadata 相同的数据流
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{base_url}/meta/?isPublished=true") as response:
+            published = await response.json()
+        async with session.get(f"{base_url}/meta/?isPublished=false") as response:
+            unpublished = await response.json()
+    all_metadata = json.dumps(published + unpublished, ensure_ascii=False, indent=2)
+    metadata = json.loads(all_metadata)
+    output = {}
+    for item in metadata:
+        if item["id"] in subscribed:
+            output.setdefault(item["id"], {"children": []}).update(item)
+        if item.get("parentPackageId") in subscribed:
+            output.setdefault(item["parentPackageId"], {"children": []})["children"].append(item)
+    return sum(len(p["children"]) for p in output.values())
+
+
+async def _stream(base_url: str, subscribed: list) -> int:
+    collector = SubscriptionMetadataCollector(subscribed)
+    async with aiohttp.ClientSession() as session:
+        for flag in ("true", "false"):
+            async with session.get(f"{base_url}/meta/?isPublished={flag}") as response:
+                async for item in aiter_json_array(response):
+                    collector.add(item)
+    return sum(1 for _ in collector.assets())
+
+
+def _run_child(mode: str, base_url: str, subscribed: list) -> None:
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    kept = asyncio.run((_legacy if mode == "legacy" else _stream)(base_url, subscribed))
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"elapsed": elapsed, "peak_kb": peak, "delta_kb": peak - baseline, "kept": kept}))
+
+
+def _serve(bodies: dict):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = bodies["false" if "isPublished=false" in self.path else "true"]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", type=int, default=400, help="每份列表的资产包数")
+    parser.add_argument("--assets", type=int, default=40, help="每个包的资产数")
+    parser.add_argument("--subscribed", type=int, default=20, help="订阅的资产包数")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", choices=("legacy", "stream"), help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    subscribed = _subscribed_ids(args.packages, args.subscribed)
+    if args.child:
+        _run_child(args.child, args.url, subscribed)
+        return
+
+    bodies = {
+        "true": _make_listing(args.packages, args.assets, 0),
+        "false": _make_listing(args.packages, args.assets, args.packages),
+    }
+    bodies = {key: json.dumps(listing, ensure_ascii=False).encode("utf-8") for key, listing in bodies.items()}
+    server = _serve(bodies)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    total_mb = sum(len(body) for body in bodies.values()) / (1024 * 1024)
+    print(f"listings: {total_mb:.1f} MB, subscribed {len(subscribed)} packages")
+
+    try:
+        for mode in ("legacy", "stream"):
+            runs = []
+            for _ in range(args.repeat):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", mode, "--url", base_url,
+                     "--packages", str(args.packages), "--subscribed", str(args.subscribed)],
+                    check=True, capture_output=True, text=True,
+                ).stdout
+                runs.append(json.loads(out))
+            best = min(runs, key=lambda r: r["elapsed"])
+            print(f"{mode:7s} {best['elapsed']:7.3f} s  peak RSS {best['peak_kb'] / 1024:7.1f} MB "
+                  f"(+{best['delta_kb'] / 1024:.1f} MB)  kept {best['kept']} assets")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
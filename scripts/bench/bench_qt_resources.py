@@ -0,0 +1,88 @@
+"""
+Qt 资源加载基准：导入 pyside6-rcc 生成的 Python 模块（原 rc_assets.py）与注册二进制 assets.rcc 的对比。
+
+两种方式各在独立子进程中运行，统计：
+- 加载耗时（导入模块 / registerResource）
+- 加载前后的常驻内存（/proc/self/statm，非 Linux 退化为 ru_maxrss）
+- 首次读取一个图标的耗时
+
+Python 模块由 assets.qrc 临时生成，不依赖仓库中是否保留 rc_assets.py。
+
+用法：
+    python scripts/bench/bench_qt_resources.py --runs 5
+"""
+
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+ASSETS_FOLDER = ROOT / "orcalab" / "assets"
+
+_CHILD = r"""
+import json, os, sys, time
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+mode, target = sys.argv[1], sys.argv[2]
+from PySide6 import QtCore
+
+before = rss_kb()
+start = time.perf_counter()
+if mode == "module":
+    sys.path.insert(0, os.path.dirname(target))
+    __import__(os.path.splitext(os.path.basename(target))[0])
+else:
+    assert QtCore.QResource.registerResource(target)
+load = time.perf_counter() - start
+after = rss_kb()
+
+start = time.perf_counter()
+f = QtCore.QFile(":/icons/orcalab_logo.png")
+f.open(QtCore.QIODevice.OpenModeFlag.ReadOnly)
+size = len(bytes(f.readAll()))
+first = time.perf_counter() - start
+print(json.dumps({"load": load, "rss_kb": after - before, "first_read": first, "icon_bytes": size}))
+"""
+
+
+def _run(mode: str, target: pathlib.Path) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode, str(target)], capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        module = pathlib.Path(tmp) / "rc_assets_bench.py"
+        rcc = pathlib.Path(tmp) / "assets.rcc"
+        qrc = ASSETS_FOLDER / "assets.qrc"
+        subprocess.run(["pyside6-rcc", str(qrc), "-o", str(module)], cwd=ASSETS_FOLDER, check=True)
+        subprocess.run(["pyside6-rcc", "--binary", str(qrc), "-o", str(rcc)], cwd=ASSETS_FOLDER, check=True)
+
+        print(f"python module {module.stat().st_size / 1024:8.1f} KB, rcc {rcc.stat().st_size / 1024:8.1f} KB")
+        for label, mode, target in (("python module", "module", module), ("binary rcc", "rcc", rcc)):
+            results = [_run(mode, target) for _ in range(max(1, args.runs))]
+            load = min(r["load"] for r in results)
+            first = min(r["first_read"] for r in results)
+            rss = min(r["rss_kb"] for r in results)
+            print(f"{label:<14} load {load * 1000:7.2f} ms  RSS +{rss / 1024:6.2f} MB  "
+                  f"first icon {first * 1000:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
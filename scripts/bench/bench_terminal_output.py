@@ -0,0 +1,180 @@
+"""
+终端输出基准：训练脚本高速刷日志时界面的卡顿与积压。
+
+生产线程以 --rate-mb MB/s 按 4 KB 块写入类似训练日志的输出（部分行带 ANSI 颜色），
+持续 --seconds 秒。对比旧实现（队列 + 50 ms 定时器逐块插入、每次重新编译正则、文档
+不限行数）与当前的 TerminalWidget（环形缓冲、每帧合并刷新一次、文档限制行数）。
+主线程每 5 ms 的心跳记录最长卡顿；生产结束后统计把积压输出全部显示完所需的时间。
+
+用法：
+    QT_QPA_PLATFORM=offscreen python scripts/bench/bench_terminal_output.py --rate-mb 10 --seconds 3
+"""
+
+import argparse
+import os
+import pathlib
+import queue
+import re
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from orcalab.ui.terminal_widget import TERMINAL_MAX_LINES, TerminalTextEdit, TerminalWidget  # noqa: E402
+
+CHUNK_SIZE = 4096
+
+
+class LegacyTextEdit(TerminalTextEdit):
+    """旧版 append_ansi_text：每次调用编译正则，逐段插入"""
+
+    def append_ansi_text(self, text):
+        cursor = self.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        ansi_pattern = re.compile(r'\x1b\[([0-9;]*)m')
+        last_pos = 0
+        for match in ansi_pattern.finditer(text):
+            if match.start() > last_pos:
+                cursor.insertText(text[last_pos:match.start()], self._current_format)
+            self._parse_ansi_codes(match.group(1))
+            last_pos = match.end()
+        if last_pos < len(text):
+            cursor.insertText(text[last_pos:], self._current_format)
+        self.setTextCursor(cursor)
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+
+class LegacyTerminal(QtCore.QObject):
+    """旧版输出路径：读取线程入队，50 ms 定时器逐块通过排队调用追加到文档"""
+
+    def __init__(self):
+        super().__init__()
+        self.output_text = LegacyTextEdit()
+        self.output_queue = queue.Queue()
+        self.written = 0
+        self.appended = 0
+        self.update_timer = QtCore.QTimer()
+        self.update_timer.timeout.connect(self._update_output)
+        self.update_timer.start(50)
+
+    def write(self, text):
+        self.written += 1
+        self.output_queue.put(text)
+
+    def pending(self) -> bool:
+        return self.appended < self.written
+
+    def _update_output(self):
+        while not self.output_queue.empty():
+            QtCore.QMetaObject.invokeMethod(
+                self, "_append_output_safe",
+                QtCore.Qt.ConnectionType.QueuedConnection,
+                QtCore.Q_ARG(str, self.output_queue.get_nowait()),
+            )
+
+    @QtCore.Slot(str)
+    def _append_output_safe(self, text):
+        self.output_text.append_ansi_text(text)
+        self.appended += 1
+
+
+class CurrentTerminal:
+    def __init__(self):
+        self.widget = TerminalWidget(max_lines=TERMINAL_MAX_LINES)
+        self.output_text = self.widget.output_text
+
+    def write(self, text):
+        self.widget.append_output(text)
+
+    def pending(self) -> bool:
+        return self.widget.has_pending_output()
+
+
+def make_chunks(total_bytes: int):
+    lines = []
+    step = 0
+    size = 0
+    while size < total_bytes:
+        if step % 10 == 0:
+            line = (f"\x1b[32m[epoch {step // 1000:3d}]\x1b[0m step {step:8d} "
+                    f"loss=\x1b[33m{1 / (step + 1):.6f}\x1b[0m lr=3.0e-04\n")
+        else:
+            line = (f"[train] step {step:8d} reward={step % 97 * 0.173:9.4f} "
+                    f"fps={1800 + step % 40:5d} env_steps={step * 64}\n")
+        lines.append(line)
+        size += len(line)
+        step += 1
+    data = "".join(lines)
+    return [data[i:i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE)]
+
+
+def run(app: QtWidgets.QApplication, terminal, chunks, rate: float, drain_timeout: float) -> dict:
+    stall = 0.0
+    last = time.perf_counter()
+
+    def heartbeat():
+        nonlocal stall, last
+        now = time.perf_counter()
+        stall = max(stall, now - last)
+        last = now
+
+    ticker = QtCore.QTimer()
+    ticker.timeout.connect(heartbeat)
+    ticker.start(5)
+
+    interval = CHUNK_SIZE / rate
+
+    def produce():
+        start = time.perf_counter()
+        for i, chunk in enumerate(chunks):
+            delay = start + i * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            terminal.write(chunk)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    start = time.perf_counter()
+    producer.start()
+    while producer.is_alive():
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 5)
+    produced = time.perf_counter()
+    while terminal.pending() and time.perf_counter() - produced < drain_timeout:
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 5)
+    finished = time.perf_counter()
+    heartbeat()
+    ticker.stop()
+    return {
+        "produce": produced - start,
+        "drain": finished - produced,
+        "drained": not terminal.pending(),
+        "stall": stall - 0.005,
+        "blocks": terminal.output_text.document().blockCount(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate-mb", type=float, default=10.0)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--drain-timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    rate = args.rate_mb * 1e6
+    chunks = make_chunks(int(rate * args.seconds))
+    print(f"{len(chunks)} chunks x {CHUNK_SIZE} B at {args.rate_mb:.1f} MB/s")
+
+    for name, terminal in (("legacy", LegacyTerminal()), ("current", CurrentTerminal())):
+        result = run(app, terminal, chunks, rate, args.drain_timeout)
+        drain = f"{result['drain']:6.2f} s" if result["drained"] else f">{args.drain_timeout:.0f} s"
+        print(f"{name:8s} produce {result['produce']:5.2f} s, backlog drain {drain}, "
+              f"longest stall {result['stall'] * 1000:6.0f} ms, document blocks {result['blocks']}")
+
+
+if __name__ == "__main__":
+    main()
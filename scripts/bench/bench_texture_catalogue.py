@@ -0,0 +1,131 @@
+"""
+纹理资产目录基准：启动加载、搜索与纹理选择对话框打开耗时。
+
+- 启动：无本地目录（逐页拉取）与有本地目录（只请求第一页校验）的 initialize 耗时，
+  远端每页请求用 --page-latency 模拟
+- 搜索：原线性扫描（每次 path.lower()）与三元组索引
+- 对话框：一次创建全部列表项与分批创建
+
+用法：
+    python scripts/bench/bench_texture_catalogue.py --textures 100000 --page-latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import pathlib
+import random
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from orcalab.texture_asset_cache import TEXTURE_ASSET_FETCH_CONFIG, TextureAssetCache  # noqa: E402
+
+WORDS = ["rock", "wood", "metal", "brick", "grass", "concrete", "fabric", "leather", "tile", "plastic",
+         "albedo", "normal", "roughness", "ao", "height"]
+KEYWORDS = ["r", "ro", "rock", "rock_t", "rock_tile", "normal_4", "_12345", "missing"]
+
+
+class FakeRemoteScene:
+    def __init__(self, textures, latency: float):
+        self._textures = textures
+        self._latency = latency
+        self._lock = asyncio.Lock()
+
+    async def get_assets_by_type_page(self, asset_type_uuid, page_index, page_size):
+        # 与 RemoteScene 一样，请求在 gRPC 锁内依次发出
+        async with self._lock:
+            await asyncio.sleep(self._latency)
+        chunk = self._textures[page_index * page_size:(page_index + 1) * page_size]
+        return SimpleNamespace(
+            assets=[SimpleNamespace(asset_id=u, relative_path=p) for u, p in chunk],
+            page_index=page_index,
+            total_pages=max(1, -(-len(self._textures) // page_size)),
+            total_count=len(self._textures),
+        )
+
+
+def make_textures(count: int):
+    rng = random.Random(0)
+    return [
+        (f"{{{i:08X}-0000-0000-0000-000000000000}}:0",
+         f"textures/{rng.choice(WORDS)}_{rng.choice(WORDS)}/{rng.choice(WORDS)}_{i}_{rng.choice(WORDS)}.png.streamingimage")
+        for i in range(count)
+    ]
+
+
+async def initialize(catalogue_path, scene) -> tuple:
+    cache = TextureAssetCache(catalogue_path)
+    start = time.perf_counter()
+    await cache.initialize(scene)
+    ready = time.perf_counter() - start
+    await cache.wait_search_index()
+    return cache, ready, time.perf_counter() - start
+
+
+def legacy_search(items, keyword):
+    keyword_lower = keyword.lower()
+    return [(u, p) for u, p in items if keyword_lower in p.lower()]
+
+
+def time_dialog(cache, batched: bool) -> float:
+    from orcalab.ui.property_edit import texture_select_dialog
+
+    saved = texture_select_dialog.TEXTURE_LIST_BATCH_SIZE
+    if not batched:
+        texture_select_dialog.TEXTURE_LIST_BATCH_SIZE = cache.count
+    try:
+        start = time.perf_counter()
+        dialog = texture_select_dialog.TextureSelectDialog(cache)
+        elapsed = time.perf_counter() - start
+        dialog.deleteLater()
+        return elapsed
+    finally:
+        texture_select_dialog.TEXTURE_LIST_BATCH_SIZE = saved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--textures", type=int, default=100000)
+    parser.add_argument("--page-latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    from PySide6 import QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv)  # noqa: F841
+    textures = make_textures(args.textures)
+    scene = FakeRemoteScene(textures, args.page_latency)
+    pages = -(-args.textures // TEXTURE_ASSET_FETCH_CONFIG["page_size"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalogue_path = pathlib.Path(tmp) / "texture_catalogue.json"
+        _, cold, _ = asyncio.run(initialize(catalogue_path, scene))
+        cache, warm, indexed = asyncio.run(initialize(catalogue_path, scene))
+
+    items = cache.get_all_items()
+    legacy_times, index_times = [], []
+    for keyword in KEYWORDS:
+        start = time.perf_counter()
+        expected = legacy_search(items, keyword)
+        legacy_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        assert cache.search(keyword) == expected
+        index_times.append(time.perf_counter() - start)
+
+    print(f"{args.textures} textures, {pages} pages, {args.page_latency * 1000:.0f} ms per page")
+    print(f"initialize: no catalogue {cold:6.2f} s, cached catalogue {warm:6.2f} s "
+          f"(search index ready after {indexed:.2f} s)")
+    print(f"search:     legacy median {statistics.median(legacy_times) * 1000:6.1f} ms, "
+          f"max {max(legacy_times) * 1000:6.1f} ms; "
+          f"index median {statistics.median(index_times) * 1000:6.1f} ms, "
+          f"max {max(index_times) * 1000:6.1f} ms")
+    print(f"dialog:     all items {time_dialog(cache, False):6.2f} s, batched {time_dialog(cache, True):6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+资产浏览器缩略图加载基准：打开浏览器时 UI 线程被阻塞的时间。
+
+- legacy：set_assets 中逐个 ApngPlayer(path) 全尺寸解码全部帧，再 set_scaled_size(96)
+- pool：set_assets 不解码；可见项在线程池中只解码第一帧并在解码时缩放到 96
+
+pool 方式同时给出首屏（--visible 个可见项）出图时间和后台解码全部第一帧的时间，
+以及常驻帧数据量。
+
+- sprite：pool 加精灵磁盘缓存，第一次打开（解码并写缓存）与第二次打开（mmap 映射）
+
+用法：
+    python scripts/bench/bench_thumbnail_decode.py --assets 300 --frames 15 --size 512
+"""
+
+import argparse
+import asyncio
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from PIL import Image, ImageDraw  # noqa: E402
+from PySide6 import QtCore, QtGui  # noqa: E402
+
+from orcalab.ui.asset_browser.apng_decoder import ThumbnailDecodePool  # noqa: E402
+from orcalab.ui.asset_browser.apng_player import ApngPlayer  # noqa: E402
+from orcalab.ui.asset_browser.thumbnail_sprite_cache import ThumbnailSpriteCache  # noqa: E402
+
+THUMBNAIL_SIZE = 96
+
+
+def _make_apngs(folder: pathlib.Path, assets: int, frames: int, size: int) -> list:
+    template = []
+    for f in range(frames):
+        img = Image.new("RGBA", (size, size), (30, 30, 30, 0))
+        draw = ImageDraw.Draw(img)
+        draw.ellipse((f * 4, f * 4, size - f * 4, size - f * 4), fill=(200, 80 + f * 8, 40, 255))
+        template.append(img)
+    paths = []
+    for i in range(assets):
+        path = folder / f"asset_{i:05d}_panorama.apng"
+        template[0].save(path, save_all=True, append_images=template[1:], duration=100, loop=0, format="PNG")
+        paths.append(path)
+    return paths
+
+
+def _frame_bytes(images) -> int:
+    return sum(image.sizeInBytes() for image in images)
+
+
+def bench_legacy(paths) -> tuple:
+    start = time.perf_counter()
+    resident = 0
+    for path in paths:
+        player = ApngPlayer(str(path))
+        player.set_scaled_size(QtCore.QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        resident += _frame_bytes(player.frames)
+    return time.perf_counter() - start, resident
+
+
+async def bench_pool(paths, visible: int, sprite_cache=None) -> tuple:
+    pool = ThumbnailDecodePool(sprite_cache=sprite_cache)
+    start = time.perf_counter()
+    first_screen = await asyncio.gather(
+        *(pool.decode(str(p), THUMBNAIL_SIZE, first_frame_only=True) for p in paths[:visible])
+    )
+    first_screen_time = time.perf_counter() - start
+    rest = await asyncio.gather(*(pool.decode(str(p), THUMBNAIL_SIZE, first_frame_only=True) for p in paths[visible:]))
+    total = time.perf_counter() - start
+    pool.shutdown()
+    resident = sum(_frame_bytes(d.frames) for d in first_screen + rest if d is not None)
+    return first_screen_time, total, resident
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=300)
+    parser.add_argument("--frames", type=int, default=15)
+    parser.add_argument("--size", type=int, default=512, help="APNG 原始边长")
+    parser.add_argument("--visible", type=int, default=48, help="首屏可见项数")
+    args = parser.parse_args()
+
+    app = QtGui.QGuiApplication(sys.argv)  # noqa: F841
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _make_apngs(pathlib.Path(tmp), args.assets, args.frames, args.size)
+
+        legacy, legacy_bytes = bench_legacy(paths)
+        first_screen, background, pool_bytes = asyncio.run(bench_pool(paths, args.visible))
+
+        sprite_cache = ThumbnailSpriteCache(pathlib.Path(tmp) / "sprites")
+        _, cold, _ = asyncio.run(bench_pool(paths, args.visible, sprite_cache))
+        warm_first_screen, warm, _ = asyncio.run(bench_pool(paths, args.visible, sprite_cache))
+
+    print(f"{args.assets} assets x {args.frames} frames, {args.size}px -> {THUMBNAIL_SIZE}px")
+    print(f"legacy: UI thread blocked {legacy:8.2f} s, frames resident {legacy_bytes / 2**20:7.1f} MB")
+    print(f"pool:   first {args.visible} thumbnails {first_screen:6.2f} s, all first frames {background:6.2f} s "
+          f"(decoded off the UI thread), frames resident {pool_bytes / 2**20:7.1f} MB")
+    print(f"sprite: first open {cold:6.2f} s (decode + write), second open: first {args.visible} thumbnails "
+          f"{warm_first_screen:6.3f} s, all first frames {warm:6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+缩略图批量渲染基准：不同展位数下每分钟渲染的资产数。
+
+场景用假实现代替：加入资产后 --load-latency 秒 AABB 才就绪，每次相机拍摄耗时
+--capture-latency 秒并写出预先编码好的 PNG。APNG 合成使用真实的 ImageProcessor。
+展位数为 1 时资产加载、拍摄、合成依次进行，相当于原先逐个资产处理（不含固定等待）。
+
+用法：
+    python scripts/bench/bench_thumbnail_render.py --assets 12 --load-latency 0.5 --capture-latency 0.03
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import pathlib
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from PIL import Image  # noqa: E402
+
+from orcalab.actor import AssetActor  # noqa: E402
+from orcalab.application_bus import ApplicationRequest, ApplicationRequestBus  # noqa: E402
+from orcalab.http_service.http_bus import HttpServiceRequest, HttpServiceRequestBus  # noqa: E402
+from orcalab.metadata_service_bus import MetadataServiceRequest, MetadataServiceRequestBus  # noqa: E402
+from orcalab.scene_edit_bus import (  # noqa: E402
+    SceneEditNotification,
+    SceneEditNotificationBus,
+    SceneEditRequest,
+    SceneEditRequestBus,
+)
+from orcalab.ui.asset_browser.thumbnail_render_bus import ThumbnailRenderRequestBus  # noqa: E402
+from orcalab.ui.asset_browser.thumbnail_render_service import ThumbnailRenderService  # noqa: E402
+
+CAMERA_SIZES = {"mujococamera1080": 1080, "mujococamera512": 512, "mujococamera256": 256}
+
+
+def make_pngs(size: int, count: int):
+    # 近似渲染结果：渐变背景上一块带纹理的物体
+    rng = random.Random(size)
+    result = []
+    for _ in range(count):
+        img = Image.linear_gradient("L").resize((size, size)).convert("RGB")
+        box = (size // 4, size // 4, size * 3 // 4, size * 3 // 4)
+        patch = Image.effect_noise((box[2] - box[0], box[3] - box[1]), 20).convert("RGB")
+        tint = Image.new("RGB", patch.size, tuple(rng.randrange(256) for _ in range(3)))
+        img.paste(Image.blend(patch, tint, 0.7), box)
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+        result.append(buf.getvalue())
+    return result
+
+
+class FakeEngine(
+    ApplicationRequest, SceneEditRequest, SceneEditNotification, MetadataServiceRequest, HttpServiceRequest
+):
+    def __init__(self, load_latency: float, capture_latency: float):
+        self._load_latency = load_latency
+        self._capture_latency = capture_latency
+        self._added = {}
+        self._captures = 0
+        self._pngs = {camera: make_pngs(size, 15 if size == 256 else 3) for camera, size in CAMERA_SIZES.items()}
+
+    async def add_item_to_scene_with_transform(
+        self, item_name, item_asset_path, parent_path=None, transform=None, output=None
+    ):
+        name = item_name.replace("/", "_")
+        self._added[name] = time.monotonic()
+        output.append(AssetActor(name=name, asset_path=item_asset_path))
+
+    async def delete_actor(self, actor, undo=True, source=""):
+        self._added.pop(actor.name, None)
+
+    async def set_transform(self, actor, transform, local, undo=True, source=""):
+        pass
+
+    async def get_actor_asset_aabb(self, actor_path, output):
+        if time.monotonic() - self._added[actor_path.string()[1:]] >= self._load_latency:
+            output.extend([-0.4, -0.3, 0.0, 0.4, 0.3, 1.2])
+
+    async def get_camera_png(self, camera_name, png_path, png_name):
+        await asyncio.sleep(self._capture_latency)
+        os.makedirs(png_path, exist_ok=True)
+        pngs = self._pngs[camera_name]
+        self._captures += 1
+        with open(os.path.join(png_path, png_name), "wb") as f:
+            f.write(pngs[self._captures % len(pngs)])
+
+    def get_asset_info(self, asset_path, output):
+        output.append(None)
+
+    async def post_asset_thumbnail(self, asset_id, files):
+        pass
+
+
+def run(bays: int, assets, engine) -> float:
+    buses = [
+        ApplicationRequestBus,
+        SceneEditRequestBus,
+        SceneEditNotificationBus,
+        MetadataServiceRequestBus,
+        HttpServiceRequestBus,
+    ]
+    for bus in buses:
+        bus.connect(engine)
+    service = ThumbnailRenderService(bays=bays)
+    try:
+        asyncio.run(service.render_thumbnail(assets))
+    finally:
+        ThumbnailRenderRequestBus.disconnect(service)
+        for bus in buses:
+            bus.disconnect(engine)
+    stats = service.last_stats
+    assert stats.rendered == len(assets), stats
+    return stats.assets_per_minute
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=12)
+    parser.add_argument("--load-latency", type=float, default=0.5)
+    parser.add_argument("--capture-latency", type=float, default=0.03)
+    parser.add_argument("--bays", type=int, nargs="+", default=[1, 3])
+    args = parser.parse_args()
+
+    engine = FakeEngine(args.load_latency, args.capture_latency)
+    assets = [f"prefabs/bench_{i}" for i in range(args.assets)]
+    print(f"{args.assets} assets, load {args.load_latency * 1000:.0f} ms, "
+          f"capture {args.capture_latency * 1000:.0f} ms per image")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["HOME"] = tmp
+        for bays in args.bays:
+            print(f"bays={bays}: {run(bays, assets, engine):6.1f} assets/min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+缩略图上传队列基准：不同并发数下的上传吞吐量。
+
+本地 DataLink 替身服务器接收 multipart 上传，每个请求额外等待 --server-latency 秒
+模拟服务端处理与网络往返；每个资产上传 1080 图、APNG 与三张 512 图（共 --asset-kb KB）。
+另外记录上传期间事件循环的最长卡顿。
+
+用法：
+    python scripts/bench/bench_thumbnail_upload.py --assets 40 --server-latency 0.1
+"""
+
+import argparse
+import asyncio
+import os
+import pathlib
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+import aiohttp  # noqa: E402
+
+from orcalab.http_service.upload_queue import UploadError, UploadQueue, is_retryable_status  # noqa: E402
+from test.http_server.serve import DataLinkStubHandler  # noqa: E402
+
+
+class _QuietStub(DataLinkStubHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def make_files(folder: pathlib.Path, asset_kb: int):
+    sizes = {"1080.png": 0.4, "panorama.apng": 0.3, "0_512.png": 0.1, "72_512.png": 0.1, "144_512.png": 0.1}
+    files = []
+    for name, share in sizes.items():
+        path = folder / f"bench_{name}"
+        path.write_bytes(os.urandom(int(asset_kb * 1024 * share)))
+        files.append(str(path))
+    return files
+
+
+async def run_queue(base_url: str, db_path: pathlib.Path, files, assets: int, concurrency: int) -> tuple:
+    session = aiohttp.ClientSession()
+
+    async def upload(asset_id, paths):
+        form = aiohttp.FormData()
+        for path in paths:
+            data = pathlib.Path(path).read_bytes()
+            form.add_field("files", data, filename=os.path.basename(path), content_type="image/png")
+        async with session.post(f"{base_url}/assets/{asset_id}/render/", data=form) as response:
+            if response.status >= 300:
+                raise UploadError(str(response.status), retryable=is_retryable_status(response.status))
+
+    stall = 0.0
+    done = False
+
+    async def heartbeat():
+        nonlocal stall
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            stall = max(stall, now - last - 0.005)
+            last = now
+
+    queue = UploadQueue(db_path, upload, max_concurrency=concurrency)
+    ticker = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    for i in range(assets):
+        queue.enqueue(f"bench{i}", files)
+    progress = await queue.join()
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker
+    await queue.close()
+    await session.close()
+    assert progress.uploaded == assets, progress
+    return elapsed, progress.bytes_sent, stall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=40)
+    parser.add_argument("--asset-kb", type=int, default=800)
+    parser.add_argument("--server-latency", type=float, default=0.1)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    stub = _QuietStub.stub_class()
+    stub.render_delay = args.server_latency
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), stub)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api"
+
+    print(f"{args.assets} assets x {args.asset_kb} KB, server latency {args.server_latency * 1000:.0f} ms")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = pathlib.Path(tmp)
+            files = make_files(folder, args.asset_kb)
+            for concurrency in args.concurrency:
+                elapsed, sent, stall = asyncio.run(
+                    run_queue(base_url, folder / f"queue{concurrency}.sqlite3", files, args.assets, concurrency))
+                print(f"concurrency {concurrency}: {elapsed:6.2f} s, {args.assets / elapsed:6.1f} assets/s, "
+                      f"{sent / elapsed / 1e6:6.1f} MB/s, longest event loop stall {stall * 1000:5.0f} ms")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,212 @@
+import hashlib
 import http.server
+import json
+import os
+import re
 import socketserver
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import parse_qs, urlsplit
 
 PORT = 8000
 
 
-Handler = http.server.SimpleHTTPRequestHandler
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    在 SimpleHTTPRequestHandler 基础上支持单区间 Range / If-Range，
+    用于离线测试可续传与多段下载。
+    """
 
-with socketserver.TCPServer(("", PORT), Handler) as httpd:
-    print(f"serving at http://localhost:{PORT}")
-    httpd.serve_forever()
\ No newline at end of file
+    def send_head(self):
+        path = self.translate_path(self.path)
+        range_header = self.headers.get("Range")
+        if not range_header or not os.path.isfile(path):
+            return super().send_head()
+
+        f = open(path, "rb")
+        try:
+            stat = os.fstat(f.fileno())
+            size = stat.st_size
+            etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+            last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+            if_range = self.headers.get("If-Range")
+            if if_range and if_range not in (etag, last_modified):
+                f.close()
+                return super().send_head()
+
+            byte_range = self._parse_range(range_header, size)
+            if byte_range is None:
+                f.close()
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+
+            start, end = byte_range
+            self.send_response(206)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            f.seek(start)
+            self._range_remaining = end - start + 1
+            return f
+        except Exception:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        remaining = getattr(self, "_range_remaining", None)
+        if remaining is None:
+            return super().copyfile(source, outputfile)
+        self._range_remaining = None
+        while remaining > 0:
+            data = source.read(min(64 * 1024, remaining))
+            if not data:
+                break
+            outputfile.write(data)
+            remaining -= len(data)
+
+    def end_headers(self):
+        self.send_header("Accept-Ranges", "bytes")
+        super().end_headers()
+
+    @staticmethod
+    def _parse_range(value: str, size: int):
+        if not value.startswith("bytes=") or "," in value:
+            return None
+        start_text, _, end_text = value[len("bytes="):].strip().partition("-")
+        if start_text == "":
+            if not end_text:
+                return None
+            length = int(end_text)
+            if length <= 0:
+                return None
+            return max(0, size - length), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+        if start >= size or end < start:
+            return None
+        return start, min(end, size - 1)
+
+
+class DataLinkStubHandler(RangeRequestHandler):
+    """
+    DataLink 元数据接口的本地替身，用于离线测试增量元数据同步：
+
+    - GET /api/meta/?isPublished=true|false 返回 listings 中的列表，
+      支持 ETag / If-None-Match 与 Last-Modified / If-Modified-Since，未变化时返回 304
+    - GET /api/asset/<id>/picture 返回 pictures 中的图片信息
+    - GET /api/asset/<id>/ 返回 pictures 中的资产详情（HttpService 使用）
+    - POST /api/assets/<id>/render/ 接收缩略图上传；render_statuses 非空时依次弹出作为
+      状态码（用于模拟失败），否则返回 201；render_delay 秒后才响应
+    - 其余路径按静态文件处理（支持 Range）
+
+    数据与请求记录保存在类属性上，测试中通过 stub_class() 为每个服务器生成独立子类。
+    """
+
+    listings = {"true": [], "false": []}
+    listing_mtime = 0.0
+    pictures = {}
+    requests_log = []
+    render_statuses = []
+    render_delay = 0.0
+
+    _picture_pattern = re.compile(r"^/api/asset/([^/]+)/picture/?$")
+    _asset_pattern = re.compile(r"^/api/asset/([^/]+)/?$")
+    _render_pattern = re.compile(r"^/api/assets/([^/]+)/render/?$")
+
+    @classmethod
+    def stub_class(cls):
+        return type("DataLinkStub", (cls,), {
+            "listings": {"true": [], "false": []},
+            "listing_mtime": time.time(),
+            "pictures": {},
+            "requests_log": [],
+            "render_statuses": [],
+            "render_delay": 0.0,
+        })
+
+    @classmethod
+    def set_listing(cls, is_published: bool, items: list):
+        cls.listings["true" if is_published else "false"] = items
+        # Last-Modified 精度为秒，保证修改后时间戳一定变化
+        cls.listing_mtime = max(time.time(), cls.listing_mtime + 1)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path.rstrip("/") == "/api/meta":
+            is_published = parse_qs(url.query).get("isPublished", ["true"])[0]
+            return self._send_listing(is_published)
+        match = self._picture_pattern.match(url.path)
+        if match:
+            self.requests_log.append(("picture", match.group(1)))
+            picture = self.pictures.get(match.group(1))
+            if picture is None:
+                return self._send_json(404, {"detail": "not found"})
+            return self._send_json(200, picture)
+        match = self._asset_pattern.match(url.path)
+        if match:
+            self.requests_log.append(("asset", match.group(1)))
+            detail = self.pictures.get(match.group(1))
+            if detail is None:
+                return self._send_json(404, {"detail": "not found"})
+            return self._send_json(200, detail)
+        return super().do_GET()
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        match = self._render_pattern.match(url.path)
+        if match is None:
+            return self._send_json(404, {"detail": "not found"})
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.render_delay:
+            time.sleep(self.render_delay)
+        status = self.render_statuses.pop(0) if self.render_statuses else 201
+        self.requests_log.append(("render", match.group(1), status, body.count(b'name="files"')))
+        self._send_json(status, {"detail": "ok" if status < 400 else "error"})
+
+    def _send_listing(self, is_published: str):
+        body = json.dumps(self.listings.get(is_published, []), ensure_ascii=False).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        last_modified = formatdate(self.listing_mtime, usegmt=True)
+
+        not_modified = False
+        if_none_match = self.headers.get("If-None-Match")
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_none_match is not None:
+            not_modified = etag in [tag.strip() for tag in if_none_match.split(",")]
+        elif if_modified_since is not None:
+            try:
+                not_modified = int(self.listing_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                not_modified = False
+
+        self.requests_log.append(("meta", is_published, 304 if not_modified else 200))
+        if not_modified:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            return
+        self._send_json(200, body, {"ETag": etag, "Last-Modified": last_modified})
+
+    def _send_json(self, status: int, data, headers: dict | None = None):
+        body = data if isinstance(data, bytes) else json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+if __name__ == "__main__":
+    with socketserver.TCPServer(("", PORT), DataLinkStubHandler) as httpd:
+        print(f"serving at http://localhost:{PORT}")
+        httpd.serve_forever()
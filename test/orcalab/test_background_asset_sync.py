@@ -0,0 +1,208 @@
+import asyncio
+import functools
+import hashlib
+import json
+import pathlib
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from orcalab.asset_sync_service import (
+    PENDING_PAK_DELETIONS_FILE_NAME,
+    AssetSyncService,
+    apply_pending_pak_changes,
+)
+from orcalab.background_asset_sync import BackgroundAssetSync, can_sync_in_background
+from orcalab.content_hash_store import ContentHashStore
+from test.http_server.serve import RangeRequestHandler
+
+
+class _QuietRangeRequestHandler(RangeRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class TestBackgroundAssetSync(unittest.TestCase):
+    def _run(self, sync_func, config_service=None):
+        mounted, notified, finished = [], [], []
+
+        async def mount(path):
+            await asyncio.sleep(0)
+            mounted.append(path)
+
+        async def on_mounted(paths):
+            notified.append(list(paths))
+
+        async def on_finished(success, message):
+            finished.append((success, message))
+
+        async def main():
+            job = BackgroundAssetSync(
+                config_service or MagicMock(),
+                mount,
+                on_mounted,
+                on_finished,
+                sync_func=sync_func,
+                discover_levels=lambda: [{"name": "Room", "path": "levels/room.spawnable"}],
+            )
+            job.start()
+            await job.wait()
+            return job
+
+        job = asyncio.run(main())
+        return job, mounted, notified, finished
+
+    def test_packages_are_mounted_in_order_while_sync_runs(self):
+        sync_threads = []
+        config_service = MagicMock()
+
+        def sync(config_service, callbacks, verbose, cancel_event, defer_mounted_paks):
+            self.assertTrue(defer_mounted_paks)
+            sync_threads.append(threading.current_thread())
+            callbacks.on_package_ready("base.pak", "/cache/base.pak")
+            callbacks.on_package_ready("base_patch_1.pak", "/cache/base_patch_1.pak")
+            callbacks.on_download_complete("other", False, "incomplete")
+            callbacks.on_complete(True, "下载: 2 成功")
+            return True
+
+        job, mounted, notified, finished = self._run(sync, config_service)
+
+        self.assertIsNot(sync_threads[0], threading.main_thread())
+        self.assertEqual(mounted, ["/cache/base.pak", "/cache/base_patch_1.pak"])
+        self.assertEqual(sum(notified, []), mounted)
+        self.assertEqual(job.mounted, mounted)
+        self.assertEqual(finished, [(True, "下载: 2 成功")])
+        config_service.merge_levels.assert_called_once_with([{"name": "Room", "path": "levels/room.spawnable"}])
+
+    def test_failed_sync_still_reports_finish(self):
+        def sync(config_service, callbacks, verbose, cancel_event, defer_mounted_paks):
+            callbacks.on_complete(False, "Token 已过期")
+            return False
+
+        _, mounted, notified, finished = self._run(sync)
+
+        self.assertEqual((mounted, notified), ([], []))
+        self.assertEqual(finished, [(False, "Token 已过期")])
+
+    def test_stop_sets_cancel_event(self):
+        started = threading.Event()
+
+        def sync(config_service, callbacks, verbose, cancel_event, defer_mounted_paks):
+            started.set()
+            cancel_event.wait(5)
+            callbacks.on_complete(False, "用户已取消")
+            return False
+
+        finished = []
+
+        async def main():
+            async def noop(*args):
+                finished.append(args)
+
+            job = BackgroundAssetSync(MagicMock(), noop, noop, noop, sync_func=sync)
+            job.start()
+            await asyncio.to_thread(started.wait, 5)
+            await job.stop(timeout=5)
+            return job
+
+        job = asyncio.run(main())
+        self.assertFalse(job.running)
+        self.assertEqual(finished, [])
+
+    def test_can_sync_in_background_requires_credentials(self):
+        config = MagicMock()
+        config.datalink_enable_sync.return_value = True
+        config.datalink_username.return_value = "user"
+        config.datalink_token.return_value = "token"
+        self.assertTrue(can_sync_in_background(config))
+
+        config.datalink_token.return_value = None
+        self.assertFalse(can_sync_in_background(config))
+
+        config.datalink_token.return_value = "token"
+        config.datalink_enable_sync.return_value = False
+        self.assertFalse(can_sync_in_background(config))
+
+
+class TestMountedPaksAreDeferred(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = pathlib.Path(self._tmp.name)
+        self.cache_folder = root / "cache"
+        self.cache_folder.mkdir()
+        self.downloaded_folder = root / "downloaded"
+        self.downloaded_folder.mkdir()
+        self.serve_dir = root / "serve"
+        self.serve_dir.mkdir()
+        store = ContentHashStore(self.cache_folder / "hashes.json")
+        self._store_patch = patch("orcalab.content_hash_store._content_hash_store_instance", store)
+        self._store_patch.start()
+        self.store = store
+
+    def tearDown(self):
+        self._store_patch.stop()
+        self._tmp.cleanup()
+
+    def _service(self, mounted):
+        return AssetSyncService(
+            username="tester",
+            access_token="token",
+            base_url="http://127.0.0.1:1/api",
+            cache_folder=self.cache_folder,
+            downloaded_packages_folder=self.downloaded_folder,
+            config_paks=[],
+            callbacks=MagicMock(),
+            mounted_pak_names=mounted,
+        )
+
+    def test_replacing_a_mounted_pak_waits_for_next_start(self):
+        (self.cache_folder / "a.pak").write_bytes(b"old")
+        payload = b"new" * 1000
+        (self.serve_dir / "a.pak").write_bytes(payload)
+        digest = hashlib.sha256(payload).hexdigest()
+
+        handler = functools.partial(_QuietRangeRequestHandler, directory=str(self.serve_dir))
+        server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            service = self._service({"a.pak"})
+            url = f"http://127.0.0.1:{server.server_address[1]}/a.pak"
+            ok = asyncio.run(
+                service._download_package_with_group_progress("g", "a.pak", url, digest, 0, 0, time.time())
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertTrue(ok)
+        self.assertEqual((self.cache_folder / "a.pak").read_bytes(), b"old")
+        service.callbacks.on_package_ready.assert_not_called()
+
+        apply_pending_pak_changes(self.cache_folder, self.downloaded_folder)
+        self.assertEqual((self.cache_folder / "a.pak").read_bytes(), payload)
+        self.assertEqual(list(self.cache_folder.glob("*.pending")), [])
+        self.assertEqual(self.store.get(self.cache_folder / "a.pak"), digest)
+
+    def test_deleting_a_mounted_pak_waits_for_next_start(self):
+        for name in ("mounted.pak", "new.pak"):
+            (self.cache_folder / name).write_bytes(name.encode())
+
+        self._service({"mounted.pak"}).clean_unsubscribed_packages(["mounted.pak", "new.pak"])
+
+        self.assertTrue((self.cache_folder / "mounted.pak").exists())
+        self.assertFalse((self.cache_folder / "new.pak").exists())
+        pending = json.loads((self.cache_folder / PENDING_PAK_DELETIONS_FILE_NAME).read_text(encoding="utf-8"))
+        self.assertEqual(pending, ["mounted.pak"])
+
+        apply_pending_pak_changes(self.cache_folder, self.downloaded_folder)
+        self.assertEqual(list(self.cache_folder.glob("*.pak")), [])
+        self.assertFalse((self.cache_folder / PENDING_PAK_DELETIONS_FILE_NAME).exists())
+        self.assertEqual(sorted(p.name for p in self.downloaded_folder.iterdir()), ["mounted.pak", "new.pak"])
+
+
+if __name__ == "__main__":
+    unittest.main()
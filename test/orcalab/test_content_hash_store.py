@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from orcalab.content_hash_store import ContentHashStore
+
+
+class TestContentHashStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self._tmp.name)
+        self.store_file = self.root / "store.json"
+        self.pak = self.root / "a.pak"
+        self.pak.write_bytes(b"orca" * 1000)
+        self.expected = hashlib.sha256(self.pak.read_bytes()).hexdigest()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_sha256_computes_and_caches(self):
+        store = ContentHashStore(self.store_file)
+        self.assertIsNone(store.get(self.pak))
+        self.assertEqual(store.sha256(self.pak), self.expected)
+        self.assertEqual(store.get(self.pak), self.expected)
+
+    def test_persisted_across_instances_without_rehash(self):
+        store = ContentHashStore(self.store_file)
+        store.sha256(self.pak)
+        store.save()
+
+        reloaded = ContentHashStore(self.store_file)
+        with patch("orcalab.content_hash_store.hash_file_sha256") as hasher:
+            self.assertEqual(reloaded.sha256(self.pak), self.expected)
+            hasher.assert_not_called()
+
+    def test_modified_file_is_rehashed(self):
+        store = ContentHashStore(self.store_file)
+        store.sha256(self.pak)
+
+        self.pak.write_bytes(b"changed")
+        stat = self.pak.stat()
+        os.utime(self.pak, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertIsNone(store.get(self.pak))
+        self.assertEqual(store.sha256(self.pak), hashlib.sha256(b"changed").hexdigest())
+
+    def test_corrupted_store_is_ignored(self):
+        self.store_file.write_text("{not json", encoding="utf-8")
+        store = ContentHashStore(self.store_file)
+        self.assertIsNone(store.get(self.pak))
+        self.assertEqual(store.sha256(self.pak), self.expected)
+
+        store.save()
+        data = json.loads(self.store_file.read_text(encoding="utf-8"))
+        self.assertEqual(len(data["entries"]), 1)
+
+    def test_save_drops_missing_files_and_leaves_no_temp(self):
+        store = ContentHashStore(self.store_file)
+        store.sha256(self.pak)
+        self.pak.unlink()
+        store.save()
+
+        data = json.loads(self.store_file.read_text(encoding="utf-8"))
+        self.assertEqual(data["entries"], {})
+        self.assertEqual([p.name for p in self.root.iterdir()], ["store.json"])
+
+    def test_put_records_verified_digest(self):
+        store = ContentHashStore(self.store_file)
+        store.put(self.pak, self.expected.upper())
+        self.assertEqual(store.get(self.pak), self.expected)
+
+
+    def test_sha256_many_hashes_in_parallel_and_reports_progress(self):
+        paks = [self.pak]
+        for i in range(4):
+            pak = self.root / f"p{i}.pak"
+            pak.write_bytes(os.urandom(4096 + i))
+            paks.append(pak)
+        store = ContentHashStore(self.store_file)
+        store.sha256(self.pak)
+
+        progress = {}
+        lock = threading.Lock()
+
+        def on_progress(path, done, total):
+            with lock:
+                progress[path] = (done, total)
+
+        results = store.sha256_many(paks, max_workers=3, on_progress=on_progress)
+
+        for pak in paks:
+            self.assertEqual(results[pak], hashlib.sha256(pak.read_bytes()).hexdigest())
+            self.assertEqual(progress[pak], (pak.stat().st_size, pak.stat().st_size))
+            self.assertEqual(store.get(pak), results[pak])
+
+    def test_sha256_many_cancelled_skips_uncached(self):
+        store = ContentHashStore(self.store_file)
+        store.sha256(self.pak)
+        other = self.root / "b.pak"
+        other.write_bytes(b"other")
+
+        results = store.sha256_many([self.pak, other], cancelled=lambda: True)
+
+        self.assertEqual(results, {self.pak: self.expected})
+        self.assertIsNone(store.get(other))
+
+
+if __name__ == "__main__":
+    unittest.main()
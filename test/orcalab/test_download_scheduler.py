@@ -0,0 +1,73 @@
+import asyncio
+import unittest
+
+from orcalab.download_scheduler import DownloadScheduler
+
+
+class TestDownloadScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_global_and_per_host_limits(self):
+        scheduler = DownloadScheduler(max_concurrent=3, max_per_host=2)
+        active = {"total": 0, "a": 0, "b": 0}
+        peak = {"total": 0, "a": 0, "b": 0}
+
+        async def job(host: str):
+            async with scheduler.slot(f"https://{host}/file.pak"):
+                active["total"] += 1
+                active[host] += 1
+                for key in ("total", host):
+                    peak[key] = max(peak[key], active[key])
+                await asyncio.sleep(0.01)
+                active["total"] -= 1
+                active[host] -= 1
+
+        await asyncio.gather(*(job(host) for host in ["a", "b"] * 5))
+
+        self.assertEqual(peak["total"], 3)
+        self.assertEqual(peak["a"], 2)
+        self.assertEqual(peak["b"], 2)
+
+    async def test_larger_priority_starts_first(self):
+        scheduler = DownloadScheduler(max_concurrent=1, max_per_host=1)
+        order = []
+        release = asyncio.Event()
+
+        async def blocker():
+            async with scheduler.slot("https://cdn/blocker"):
+                await release.wait()
+
+        async def job(size: int):
+            async with scheduler.slot("https://cdn/file", priority=size):
+                order.append(size)
+
+        blocker_task = asyncio.create_task(blocker())
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(job(size)) for size in (10, 300, 20, 5000)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(blocker_task, *tasks)
+
+        self.assertEqual(order, [5000, 300, 20, 10])
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        scheduler = DownloadScheduler(max_concurrent=1, max_per_host=1)
+        release = asyncio.Event()
+
+        async def holder():
+            async with scheduler.slot("https://cdn/a"):
+                await release.wait()
+
+        holder_task = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(scheduler.slot("https://cdn/b").__aenter__())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await holder_task
+
+        async with asyncio.timeout(1):
+            async with scheduler.slot("https://cdn/c"):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import asyncio
+import pathlib
+import socketserver
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from orcalab.http_service.http_service import HttpService
+from orcalab.http_service.response_cache import ResponseCache
+from test.http_server.serve import DataLinkStubHandler
+
+
+class _QuietStub(DataLinkStubHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self._tmp.name) / "cache.sqlite3"
+        self.now = 1000.0
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _cache(self, **kwargs) -> ResponseCache:
+        return ResponseCache(self.path, clock=lambda: self.now, **kwargs)
+
+    def test_ttl_and_persistence(self):
+        cache = self._cache(ttl=60)
+        cache.put("a", {"pictures": ["a.png"]})
+        cache.close()
+
+        cache = self._cache(ttl=60)
+        self.assertEqual(cache.get("a"), {"pictures": ["a.png"]})
+        self.now += 61
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.close()
+
+    def test_lru_eviction_and_invalidate(self):
+        cache = self._cache(max_entries=2)
+        cache.put("a", 1)
+        self.now += 1
+        cache.put("b", 2)
+        self.now += 1
+        cache.get("a")
+        self.now += 1
+        cache.put("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        cache.invalidate("a")
+        self.assertIsNone(cache.get("a"))
+        cache.close()
+
+    def test_hits_do_not_write_until_flush(self):
+        cache = self._cache()
+        cache.put("a", 1)
+        changes = cache._conn.total_changes
+        for _ in range(3):
+            self.now += 1
+            self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache._conn.total_changes, changes)
+        cache.close()
+
+        with sqlite3.connect(self.path) as conn:
+            accessed_at = conn.execute("SELECT accessed_at FROM entries WHERE key = 'a'").fetchone()[0]
+        self.assertEqual(accessed_at, self.now)
+
+
+class TestHttpServiceCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_folder = pathlib.Path(self._tmp.name)
+
+        self.stub = _QuietStub.stub_class()
+        self.stub.pictures = {"a1": {"id": "a1", "updatedAt": "t1", "pictures": ["a1.png"]}}
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), self.stub)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        config = MagicMock()
+        config.datalink_base_url.return_value = f"http://127.0.0.1:{self.server.server_address[1]}/api"
+        config.datalink_http_max_concurrency.return_value = 4
+        config.datalink_response_cache_ttl.return_value = 3600
+        config.datalink_response_cache_max_entries.return_value = 100
+        config.datalink_upload_concurrency.return_value = 2
+        config.datalink_upload_max_attempts.return_value = 3
+        token = {"access_token": "token", "refresh_token": "refresh", "username": "tester"}
+        self._patches = [
+            patch("orcalab.http_service.http_service.ConfigService", return_value=config),
+            patch("orcalab.http_service.http_service.TokenStorage.load_token", return_value=token),
+            patch("orcalab.http_service.http_service.get_cache_folder", return_value=self.cache_folder),
+            patch("orcalab.http_service.http_service.HttpServiceRequestBus"),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self._tmp.cleanup()
+
+    def _asset_requests(self):
+        return [r for r in self.stub.requests_log if r[0] == "asset"]
+
+    def test_concurrent_lookups_share_one_request_and_persist(self):
+        async def run():
+            service = HttpService()
+            try:
+                results = await asyncio.gather(*(service.get_image_url("a1") for _ in range(5)))
+                detail = await service.get_asset_detail("a1")
+            finally:
+                await service.close()
+            return results, detail
+
+        results, detail = asyncio.run(run())
+        self.assertEqual(len(set(results)), 1)
+        self.assertIn("a1.png", detail)
+        self.assertEqual(self._asset_requests(), [("asset", "a1")])
+
+        async def reopen():
+            service = HttpService()
+            try:
+                return await service.get_image_url("a1")
+            finally:
+                await service.close()
+
+        self.assertIn("a1.png", asyncio.run(reopen()))
+        self.assertEqual(len(self._asset_requests()), 1)
+
+    def test_stale_updated_at_and_upload_invalidate(self):
+        async def run():
+            service = HttpService()
+            try:
+                await service.get_image_url("a1")
+                await service._get_asset_metadata("a1", "t1")
+                self.stub.pictures["a1"] = {"id": "a1", "updatedAt": "t2", "pictures": ["a1-new.png"]}
+                changed = await service._get_asset_metadata("a1", "t2")
+                with patch.object(service, "_post_asset_thumbnail"):
+                    await service.post_asset_thumbnail("a1", [])
+                    await service.wait_for_upload_finished()
+                await service.get_image_url("a1")
+            finally:
+                await service.close()
+            return changed
+
+        changed = asyncio.run(run())
+        self.assertEqual(changed["pictures"], ["a1-new.png"])
+        self.assertEqual(len(self._asset_requests()), 3)
+
+
+    def test_thumbnail_upload_retries_through_queue(self):
+        files = []
+        for name in ("a1_1080.png", "a1_panorama.apng"):
+            path = self.cache_folder / name
+            path.write_bytes(b"png" * 100)
+            files.append(str(path))
+        self.stub.render_statuses = [503]
+
+        async def run():
+            service = HttpService()
+            service._upload_queue._initial_delay = 0.01
+            try:
+                await service.post_asset_thumbnail("a1", files)
+                await service.post_asset_thumbnail("a2", [str(self.cache_folder / "missing.png")])
+                progress = await service.wait_for_upload_finished()
+            finally:
+                await service.close()
+            return progress
+
+        progress = asyncio.run(run())
+        renders = [r for r in self.stub.requests_log if r[0] == "render"]
+        self.assertEqual(renders, [("render", "a1", 503, 2), ("render", "a1", 201, 2)])
+        self.assertEqual((progress.uploaded, progress.failed, progress.retries), (1, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
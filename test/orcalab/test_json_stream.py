@@ -0,0 +1,67 @@
+import json
+import unittest
+
+from orcalab.http_service.json_stream import (
+    JsonArrayStreamParser,
+    SubscriptionMetadataCollector,
+    iter_json_array,
+)
+
+
+def _listing():
+    return [
+        {"id": "p1", "name": "pkg1"},
+        {"id": "a1", "parentPackageId": "p1", "name": "椅子"},
+        {"id": "p2", "name": "pkg2"},
+        {"id": "b1", "parentPackageId": "p2"},
+        {"id": "a2", "parentPackageId": "p1", "size": 12345, "tags": ["x", {"y": [1, 2.5, None, True]}]},
+    ]
+
+
+class TestJsonArrayStreamParser(unittest.TestCase):
+    def test_every_chunk_boundary(self):
+        data = json.dumps(_listing(), ensure_ascii=False, indent=2).encode("utf-8")
+        for split in range(1, len(data)):
+            with self.subTest(split=split):
+                items = list(iter_json_array([data[:split], data[split:]]))
+                self.assertEqual(items, _listing())
+
+    def test_single_bytes_and_scalars(self):
+        data = "\ufeff[ 1, 23 ,\"多字节\" ,[], {} ,-4.5e3 ]\n".encode("utf-8")
+        items = list(iter_json_array(data[i:i + 1] for i in range(len(data))))
+        self.assertEqual(items, [1, 23, "多字节", [], {}, -4500.0])
+
+    def test_empty_array(self):
+        self.assertEqual(list(iter_json_array([b" [ ] "])), [])
+
+    def test_items_are_yielded_before_array_ends(self):
+        parser = JsonArrayStreamParser()
+        self.assertEqual(list(parser.feed(b'[{"id": "p1"}, {"id"')), [{"id": "p1"}])
+        self.assertEqual(list(parser.feed(b': "p2"}]')), [{"id": "p2"}])
+        self.assertTrue(parser.finished)
+        self.assertEqual(parser.close(), [])
+
+    def test_malformed_input_raises(self):
+        for data in (b'{"id": 1}', b'[1 2]', b'[1, 2', b'[{"id": }]', b'[1] 2'):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    list(iter_json_array([data]))
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b"[1]", b" 2"]))
+
+
+class TestSubscriptionMetadataCollector(unittest.TestCase):
+    def test_filters_to_subscribed_packages(self):
+        collector = SubscriptionMetadataCollector(["p1"])
+        for item in _listing():
+            collector.add(item)
+
+        self.assertEqual(list(collector.packages), ["p1"])
+        self.assertEqual(collector.packages["p1"]["name"], "pkg1")
+        self.assertEqual([a["id"] for a in collector.packages["p1"]["children"]], ["a1", "a2"])
+        self.assertEqual([a["id"] for a in collector.assets()], ["a1", "a2"])
+        self.assertEqual(collector.scanned, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
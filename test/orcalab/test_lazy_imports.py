@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import unittest
+
+# 入口模块导入时不应加载的重量级依赖；这些依赖只在实际用到时导入
+LAZY_MODULES = {
+    "orcalab.launcher": ["PySide6", "aiohttp", "fastmcp", "scipy"],
+    "orcalab.mcp_service.mcp_client": ["PySide6", "aiohttp", "fastmcp", "scipy"],
+    "orcalab.transform": ["scipy"],
+    "orcalab.scene_layout_converter": ["scipy"],
+    "orcalab.ui.image_utils": ["PIL"],
+}
+
+
+def _loaded_after_import(module: str, packages: list) -> list:
+    code = (
+        "import sys\n"
+        f"import {module}\n"
+        f"print(','.join(p for p in {packages!r} if p in sys.modules))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120)
+    if proc.returncode != 0:
+        raise AssertionError(f"import {module} failed:\n{proc.stderr}")
+    return [p for p in proc.stdout.strip().split(",") if p]
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_heavy_dependencies_are_not_imported_eagerly(self):
+        for module, packages in LAZY_MODULES.items():
+            with self.subTest(module=module):
+                self.assertEqual(_loaded_after_import(module, packages), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
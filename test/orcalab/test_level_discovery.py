@@ -0,0 +1,108 @@
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+from orcalab import level_discovery
+from orcalab.level_discovery import LEVEL_DISCOVERY_INDEX_FILE_NAME, discover_levels_from_cache
+
+
+def _write_pak(path: pathlib.Path, scenes, extra_files=()):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w") as pak:
+        pak.writestr("scene_layouts.json", json.dumps({"scenes": scenes}))
+        for name in extra_files:
+            pak.writestr(name, b"")
+
+
+def _bump_mtime(path: pathlib.Path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestLevelDiscovery(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = pathlib.Path(self._tmp.name)
+        self.cache_folder = root / "cache"
+        self.layout_folder = root / "layouts"
+        self.layout_folder.mkdir()
+        self._patches = [
+            patch("orcalab.level_discovery.get_cache_folder", return_value=self.cache_folder),
+            patch("orcalab.level_discovery.get_user_scene_layout_folder", return_value=self.layout_folder),
+        ]
+        for p in self._patches:
+            p.start()
+
+        _write_pak(
+            self.cache_folder / "a.pak",
+            [{"name": "Room", "path": "levels/room.prefab"}],
+            ["levels/room.spawnable"],
+        )
+        _write_pak(
+            self.cache_folder / "sub" / "b.pak",
+            [{"name": "Hall", "path": "levels/hall.spawnable"}],
+            ["levels/hall.spawnable"],
+        )
+        _write_pak(self.cache_folder / "c.pak", [{"name": "Missing", "path": "levels/missing.spawnable"}])
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self._tmp.cleanup()
+
+    def _discover(self):
+        with patch("orcalab.level_discovery._read_scene_layouts", wraps=level_discovery._read_scene_layouts) as read:
+            levels = discover_levels_from_cache()
+        return levels, sorted(call.args[0].name for call in read.call_args_list)
+
+    def test_first_scan_builds_index(self):
+        levels, scanned = self._discover()
+
+        self.assertEqual(scanned, ["a.pak", "b.pak", "c.pak"])
+        self.assertEqual([level["path"] for level in levels], ["levels/room.spawnable", "levels/hall.spawnable"])
+        self.assertTrue((self.layout_folder / "a.json").exists())
+        index = json.loads((self.cache_folder / LEVEL_DISCOVERY_INDEX_FILE_NAME).read_text(encoding="utf-8"))
+        self.assertEqual(sorted(index["paks"]), ["a.pak", "c.pak", "sub/b.pak"])
+
+    def test_unchanged_paks_are_not_opened(self):
+        first, _ = self._discover()
+        levels, scanned = self._discover()
+
+        self.assertEqual(scanned, [])
+        self.assertEqual(levels, first)
+
+    def test_changed_added_and_removed_paks(self):
+        self._discover()
+        _write_pak(
+            self.cache_folder / "a.pak",
+            [{"name": "Room2", "path": "levels/room.spawnable"}],
+            ["levels/room.spawnable"],
+        )
+        _bump_mtime(self.cache_folder / "a.pak")
+        _write_pak(self.cache_folder / "a_patch_1.pak", [{"name": "Patched", "path": "levels/hall.spawnable"}])
+        (self.cache_folder / "c.pak").unlink()
+
+        levels, scanned = self._discover()
+
+        self.assertEqual(scanned, ["a.pak", "a_patch_1.pak"])
+        self.assertEqual({level["path"]: level["name"] for level in levels},
+                         {"levels/room.spawnable": "Room2", "levels/hall.spawnable": "Patched"})
+        index = json.loads((self.cache_folder / LEVEL_DISCOVERY_INDEX_FILE_NAME).read_text(encoding="utf-8"))
+        self.assertNotIn("c.pak", index["paks"])
+
+    def test_missing_layout_file_triggers_rescan(self):
+        self._discover()
+        (self.layout_folder / "b.json").unlink()
+
+        _, scanned = self._discover()
+
+        self.assertEqual(scanned, ["b.pak"])
+        self.assertTrue((self.layout_folder / "b.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
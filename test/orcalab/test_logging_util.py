@@ -0,0 +1,119 @@
+import gzip
+import logging
+import pathlib
+import tempfile
+import time
+import unittest
+
+import orcalab.logging_util as logging_util
+from orcalab.logging_util import LogRateLimit, RateLimitFilter, SizeAndTimeRotatingFileHandler
+
+
+def _record(name: str, msg: str = "msg", level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+
+class TestRateLimitFilter(unittest.TestCase):
+    def test_burst_then_suppress_and_report(self):
+        limiter = RateLimitFilter({"orcalab.grpc": LogRateLimit(per_second=1, burst=3)})
+        kept = [limiter.filter(_record("orcalab.grpc.wrapper")) for _ in range(10)]
+        self.assertEqual(kept, [True] * 3 + [False] * 7)
+        self.assertEqual(limiter.suppressed_total, 7)
+
+        # 警告及以上、不相关的 logger 不受限
+        self.assertTrue(limiter.filter(_record("orcalab.grpc", level=logging.WARNING)))
+        self.assertTrue(limiter.filter(_record("orcalab.grpcx")))
+        self.assertTrue(limiter.filter(_record("orcalab.other")))
+
+        state = limiter._state_for("orcalab.grpc")
+        state.updated -= 1.0
+        record = _record("orcalab.grpc", "call %s")
+        self.assertTrue(limiter.filter(record))
+        self.assertEqual(record.msg, "call %s [7 similar records suppressed]")
+
+    def test_sampling(self):
+        limiter = RateLimitFilter({"noisy": LogRateLimit(per_second=1000, burst=1000, sample=3)})
+        kept = [limiter.filter(_record("noisy")) for _ in range(9)]
+        self.assertEqual(kept, [True, False, False] * 3)
+
+
+class TestSizeAndTimeRotatingFileHandler(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self._tmp.name) / "orcalab_test.log"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, handler: logging.Handler, count: int, size: int = 100):
+        for i in range(count):
+            handler.handle(_record("orcalab", f"{i:04d}" + "x" * size))
+
+    def test_size_rotation_compresses_and_keeps_backups(self):
+        handler = SizeAndTimeRotatingFileHandler(str(self.path), maxBytes=1000, interval=0, backupCount=2)
+        self._write(handler, 50)
+        handler.close()
+
+        names = sorted(p.name for p in pathlib.Path(self._tmp.name).iterdir())
+        self.assertEqual(names, ["orcalab_test.log", "orcalab_test.log.1.gz", "orcalab_test.log.2.gz"])
+        newest_backup = gzip.decompress((self.path.parent / "orcalab_test.log.1.gz").read_bytes()).decode()
+        current = self.path.read_text(encoding="utf-8")
+        self.assertTrue(newest_backup.endswith("\n"))
+        self.assertLess(int(newest_backup.splitlines()[-1][:4]), int(current.splitlines()[0][:4]))
+        self.assertTrue(current.splitlines()[-1].startswith("0049"))
+
+    def test_time_rotation(self):
+        handler = SizeAndTimeRotatingFileHandler(str(self.path), maxBytes=0, interval=0.05, backupCount=3)
+        self._write(handler, 1)
+        time.sleep(0.1)
+        self._write(handler, 1)
+        handler.close()
+        self.assertTrue((self.path.parent / "orcalab_test.log.1.gz").exists())
+        self.assertEqual(len(self.path.read_text(encoding="utf-8").splitlines()), 1)
+
+
+class TestSetupLogging(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._saved = (logging_util._logger, logging_util._log_file_path)
+
+    def tearDown(self):
+        logging_util.shutdown_logging()
+        logger = logging.getLogger("orcalab")
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        logger.propagate = True
+        logger.setLevel(logging.NOTSET)
+        logging_util._logger, logging_util._log_file_path = self._saved
+        self._tmp.cleanup()
+
+    def test_records_are_written_by_listener(self):
+        logger = logging_util.setup_logging(
+            file_level=logging.DEBUG,
+            console_level=logging.CRITICAL,
+            log_dir=self._tmp.name,
+            rate_limits={"orcalab.noisy": LogRateLimit(per_second=0, burst=2)},
+        )
+        self.assertIsInstance(logging_util.get_log_file_handler(), SizeAndTimeRotatingFileHandler)
+        items = [1, 2]
+        logging.getLogger("orcalab.test").debug("items=%s", items)
+        items.append(3)
+        for i in range(5):
+            logging.getLogger("orcalab.noisy").info("chunk %d", i)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed")
+        logging_util.shutdown_logging()
+        self.assertIsNone(logging_util.get_log_file_handler())
+
+        text = pathlib.Path(logging_util.get_log_file_path()).read_text(encoding="utf-8")
+        self.assertIn("DEBUG orcalab.test - items=[1, 2]\n", text)
+        self.assertIn("chunk 1", text)
+        self.assertNotIn("chunk 2", text)
+        self.assertIn("ERROR orcalab - failed\nTraceback", text)
+        self.assertIn("RuntimeError: boom", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import pathlib
+import socketserver
+import tempfile
+import threading
+import unittest
+
+from orcalab.asset_sync_service import METADATA_SYNC_STATE_FILE_NAME, AssetSyncService
+from test.http_server.serve import DataLinkStubHandler
+
+
+class _QuietStub(DataLinkStubHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class TestMetadataIncrementalSync(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_folder = pathlib.Path(self._tmp.name)
+
+        self.stub = _QuietStub.stub_class()
+        self.stub.set_listing(True, [
+            {"id": "p1", "name": "pkg1"},
+            {"id": "a1", "parentPackageId": "p1", "updatedAt": "t1"},
+            {"id": "a2", "parentPackageId": "p1", "updatedAt": "t1"},
+        ])
+        self.stub.set_listing(False, [])
+        self.stub.pictures = {
+            "a1": {"pictures": ["a1.png"]},
+            "a2": {"pictures": ["a2.png"]},
+        }
+
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), self.stub)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.service = AssetSyncService(
+            username="tester",
+            access_token="token",
+            base_url=f"http://127.0.0.1:{self.server.server_address[1]}/api",
+            cache_folder=self.cache_folder,
+            downloaded_packages_folder=self.cache_folder / "downloaded",
+            config_paks=[],
+        )
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self._tmp.cleanup()
+
+    def _metadata(self) -> dict:
+        return json.loads((self.cache_folder / "metadata.json").read_text(encoding="utf-8"))
+
+    def _sync(self, version: str):
+        self.stub.requests_log.clear()
+        self.service.check_metadata([{"id": "p1", "name": "pkg1", "size": 1, "sha256": version}], [], [])
+        return list(self.stub.requests_log)
+
+    def test_first_sync_fetches_listing_and_pictures(self):
+        log = self._sync("v1")
+
+        self.assertIn(("meta", "true", 200), log)
+        self.assertEqual(sorted(r for r in log if r[0] == "picture"), [("picture", "a1"), ("picture", "a2")])
+        children = {c["id"]: c for c in self._metadata()["p1"]["children"]}
+        self.assertEqual(children["a1"]["pictures"], ["a1.png"])
+        state = json.loads((self.cache_folder / METADATA_SYNC_STATE_FILE_NAME).read_text(encoding="utf-8"))
+        self.assertEqual(state["packages"], {"p1": "v1"})
+
+    def test_unchanged_packages_make_no_requests(self):
+        self._sync("v1")
+        self.assertEqual(self._sync("v1"), [])
+
+    def test_version_change_refetches_only_changed_children(self):
+        self._sync("v1")
+        self.stub.set_listing(True, [
+            {"id": "p1", "name": "pkg1"},
+            {"id": "a1", "parentPackageId": "p1", "updatedAt": "t1"},
+            {"id": "a2", "parentPackageId": "p1", "updatedAt": "t2"},
+        ])
+        self.stub.pictures["a2"] = {"pictures": ["a2-new.png"]}
+
+        log = self._sync("v2")
+
+        self.assertIn(("meta", "true", 200), log)
+        self.assertIn(("meta", "false", 304), log)
+        self.assertEqual([r for r in log if r[0] == "picture"], [("picture", "a2")])
+        children = {c["id"]: c for c in self._metadata()["p1"]["children"]}
+        self.assertEqual(children["a1"]["pictures"], ["a1.png"])
+        self.assertEqual(children["a2"]["pictures"], ["a2-new.png"])
+
+    def test_unchanged_listing_uses_cached_copy(self):
+        self._sync("v1")
+
+        log = self._sync("v2")
+
+        self.assertEqual(sorted(log), [("meta", "false", 304), ("meta", "true", 304)])
+        self.assertEqual(len(self._metadata()["p1"]["children"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
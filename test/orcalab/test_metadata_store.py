@@ -0,0 +1,113 @@
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from orcalab.metadata_store import LazyAssetMap, MetadataStore
+
+
+def _document():
+    return {
+        "p1": {
+            "name": "pkg1",
+            "children": [
+                {
+                    "id": "a1",
+                    "assetPath": "Props/Box.spawnable",
+                    "parentPackageId": "p1",
+                    "category": "props",
+                    "pictures": [{"url": "a1.png"}],
+                },
+                {"id": "a2", "assetPath": "props/chair", "parentPackageId": "p1", "category": "furniture"},
+            ],
+        },
+        "p2": {
+            "name": "pkg2",
+            "children": [
+                {"id": "b1", "assetPath": "scenes/room", "parentPackageId": "p2", "category": ["scene", "indoor"]},
+            ],
+        },
+    }
+
+
+class TestMetadataStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self._tmp.name)
+        self.json_path = self.root / "metadata.json"
+        self.json_path.write_text(json.dumps(_document()), encoding="utf-8")
+        self.store = MetadataStore(self.root / "metadata.sqlite3")
+
+    def tearDown(self):
+        self.store.close()
+        self._tmp.cleanup()
+
+    def _rewrite_json(self, document):
+        self.json_path.write_text(json.dumps(document), encoding="utf-8")
+        stat = self.json_path.stat()
+        os.utime(self.json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_migrates_json_with_normalized_paths(self):
+        self.assertTrue(self.store.sync_from_json(self.json_path))
+
+        box = self.store.get_asset("props/box")
+        self.assertEqual(box["id"], "a1")
+        self.assertEqual(box["pictures"], [{"url": "a1.png"}])
+        self.assertNotIn("pictures", self.store.get_asset("props/chair"))
+        self.assertIsNone(self.store.get_asset("Props/Box.spawnable"))
+        self.assertEqual(sorted(self.store.assets_by_package("p1")), ["props/box", "props/chair"])
+        self.assertEqual(self.store.assets_by_category("scene/indoor"), ["scenes/room"])
+        self.assertEqual(self.store.get_package("p2"), {"name": "pkg2"})
+
+    def test_unchanged_json_is_not_parsed_again(self):
+        self.store.sync_from_json(self.json_path)
+        self.store.close()
+
+        reopened = MetadataStore(self.root / "metadata.sqlite3")
+        try:
+            with patch("orcalab.metadata_store._decode_metadata_json") as decode:
+                self.assertFalse(reopened.sync_from_json(self.json_path))
+                decode.assert_not_called()
+            self.assertEqual(reopened.get_asset("scenes/room")["id"], "b1")
+        finally:
+            reopened.close()
+        self.store = MetadataStore(self.root / "metadata.sqlite3")
+
+    def test_reimport_only_rewrites_changed_packages(self):
+        self.store.sync_from_json(self.json_path)
+        document = _document()
+        document["p1"]["children"][1]["name"] = "Chair"
+        del document["p2"]
+        self._rewrite_json(document)
+
+        with patch.object(self.store, "_write_package", wraps=self.store._write_package) as write_package:
+            self.assertTrue(self.store.sync_from_json(self.json_path))
+        self.assertEqual([call.args[0] for call in write_package.call_args_list], ["p1"])
+        self.assertEqual(self.store.get_asset("props/chair")["name"], "Chair")
+        self.assertIsNone(self.store.get_asset("scenes/room"))
+
+    def test_lazy_asset_map_and_upsert(self):
+        self.store.sync_from_json(self.json_path)
+        asset_map = LazyAssetMap(self.store)
+
+        self.assertEqual(len(asset_map), 3)
+        self.assertIn("props/box", asset_map)
+        self.assertIsNone(asset_map.get("missing"))
+        self.assertEqual({path: info["id"] for path, info in asset_map.items()},
+                         {"props/box": "a1", "props/chair": "a2", "scenes/room": "b1"})
+
+        self.store.upsert_asset("props/box", {"id": "a1", "parentPackageId": "p1", "pictures": []})
+        self.assertEqual(asset_map["props/box"]["pictures"], [])
+
+    def test_deleted_json_clears_store(self):
+        self.store.sync_from_json(self.json_path)
+        self.json_path.unlink()
+
+        self.assertTrue(self.store.sync_from_json(self.json_path))
+        self.assertEqual(self.store.asset_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
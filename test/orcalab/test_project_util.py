@@ -0,0 +1,48 @@
+import functools
+import hashlib
+import pathlib
+import socketserver
+import tempfile
+import threading
+import unittest
+
+from orcalab.project_util import PakIntegrityError, download_pak_from_url
+from test.http_server.serve import RangeRequestHandler
+
+
+class _QuietRangeRequestHandler(RangeRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDownloadPakFromUrl(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = pathlib.Path(self._tmp.name)
+        serve_dir = root / "serve"
+        serve_dir.mkdir()
+        self.payload = b"pak" * 1000
+        (serve_dir / "a.pak").write_bytes(self.payload)
+        self.target = root / "cache" / "a.pak"
+
+        handler = functools.partial(_QuietRangeRequestHandler, directory=str(serve_dir))
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/a.pak"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self._tmp.cleanup()
+
+    async def test_checksum_mismatch_raises_integrity_error(self):
+        with self.assertRaises(PakIntegrityError) as ctx:
+            await download_pak_from_url(self.url, self.target, "0" * 64)
+        self.assertNotIsInstance(ctx.exception, SystemExit)
+        self.assertIn(hashlib.sha256(self.payload).hexdigest(), ctx.exception.message)
+        self.assertEqual(list(self.target.parent.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
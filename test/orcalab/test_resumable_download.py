@@ -0,0 +1,161 @@
+import functools
+import hashlib
+import os
+import pathlib
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+
+from orcalab.asset_sync_service import AssetSyncService
+from orcalab.content_hash_store import ContentHashStore
+from orcalab.resumable_download import (
+    RESUMABLE_DOWNLOAD_CONFIG,
+    DownloadCancelled,
+    ResumableDownloader,
+    load_download_state,
+    state_file_for,
+)
+from test.http_server.serve import RangeRequestHandler
+
+
+class _QuietRangeRequestHandler(RangeRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class TestResumableDownload(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = pathlib.Path(self._tmp.name)
+        self.serve_dir = root / "serve"
+        self.serve_dir.mkdir()
+        self.payload = os.urandom(3 * 1024 * 1024 + 123)
+        (self.serve_dir / "a.pak").write_bytes(self.payload)
+        self.expected = hashlib.sha256(self.payload).hexdigest()
+        self.temp_path = root / "cache" / "a.pak.tmp"
+
+        handler = functools.partial(_QuietRangeRequestHandler, directory=str(self.serve_dir))
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/a.pak"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self._tmp.cleanup()
+
+    async def _download(self, **kwargs) -> ResumableDownloader:
+        async with aiohttp.ClientSession() as session:
+            downloader = ResumableDownloader(session, self.url, self.temp_path, **kwargs)
+            downloader.digest = await downloader.download()
+        return downloader
+
+    async def test_single_stream_download(self):
+        downloader = await self._download()
+        self.assertEqual(downloader.digest, self.expected)
+        self.assertEqual(self.temp_path.read_bytes(), self.payload)
+        self.assertFalse(state_file_for(self.temp_path).exists())
+
+    async def test_cancelled_download_resumes_from_partial(self):
+        calls = []
+
+        def cancel_after_first_chunk():
+            calls.append(1)
+            return len(calls) > 1
+
+        with self.assertRaises(DownloadCancelled):
+            await self._download(cancelled=cancel_after_first_chunk)
+
+        state = load_download_state(self.temp_path, self.url)
+        self.assertIsNotNone(state)
+        partial = state.downloaded
+        self.assertGreater(partial, 0)
+        self.assertLess(partial, len(self.payload))
+
+        downloader = await self._download()
+        self.assertEqual(downloader.resumed_bytes, partial)
+        self.assertEqual(downloader.digest, self.expected)
+        self.assertEqual(self.temp_path.read_bytes(), self.payload)
+
+    async def test_changed_file_restarts_download(self):
+        calls = []
+        with self.assertRaises(DownloadCancelled):
+            await self._download(cancelled=lambda: calls.append(1) or len(calls) > 1)
+        self.assertGreater(load_download_state(self.temp_path, self.url).downloaded, 0)
+
+        self.payload = os.urandom(len(self.payload))
+        (self.serve_dir / "a.pak").write_bytes(self.payload)
+        st = (self.serve_dir / "a.pak").stat()
+        os.utime(self.serve_dir / "a.pak", ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        downloader = await self._download()
+        self.assertEqual(downloader.digest, hashlib.sha256(self.payload).hexdigest())
+        self.assertEqual(self.temp_path.read_bytes(), self.payload)
+
+    async def test_segmented_download(self):
+        progress = []
+        with patch.dict(RESUMABLE_DOWNLOAD_CONFIG, {"segment_min_size": 1024 * 1024}):
+            downloader = await self._download(segments=3, on_progress=lambda done, total: progress.append(total))
+        self.assertEqual(len(downloader.state.segments), 3)
+        self.assertEqual(downloader.digest, self.expected)
+        self.assertEqual(self.temp_path.read_bytes(), self.payload)
+        self.assertTrue(progress and all(total == len(self.payload) for total in progress))
+
+    async def test_segmented_download_resumes_each_segment(self):
+        calls = []
+
+        def cancel_after_few_chunks():
+            calls.append(1)
+            return len(calls) > 2
+
+        with patch.dict(RESUMABLE_DOWNLOAD_CONFIG, {"segment_min_size": 1024 * 1024, "chunk_size": 64 * 1024}):
+            with self.assertRaises(DownloadCancelled):
+                await self._download(segments=3, cancelled=cancel_after_few_chunks)
+            state = load_download_state(self.temp_path, self.url)
+            self.assertEqual(len(state.segments), 3)
+            self.assertGreater(state.downloaded, 0)
+
+            downloader = await self._download(segments=3)
+        self.assertEqual(downloader.resumed_bytes, state.downloaded)
+        self.assertEqual(downloader.digest, self.expected)
+
+    async def test_group_speed_excludes_resumed_bytes(self):
+        calls = []
+        with patch.dict(RESUMABLE_DOWNLOAD_CONFIG, {"chunk_size": 64 * 1024}):
+            with self.assertRaises(DownloadCancelled):
+                await self._download(cancelled=lambda: calls.append(1) or len(calls) > 30)
+        partial = load_download_state(self.temp_path, self.url).downloaded
+        self.assertGreater(partial, len(self.payload) // 2)
+
+        callbacks = MagicMock()
+        service = AssetSyncService(
+            username="tester",
+            access_token="token",
+            base_url="http://127.0.0.1:1/api",
+            cache_folder=self.temp_path.parent,
+            downloaded_packages_folder=self.temp_path.parent / "downloaded",
+            config_paks=[],
+            callbacks=callbacks,
+        )
+        store = ContentHashStore(self.temp_path.parent / "hashes.json")
+        elapsed = 1000.0
+        with patch("orcalab.content_hash_store._content_hash_store_instance", store):
+            ok = await service._download_package_with_group_progress(
+                "g", "a.pak", self.url, self.expected, len(self.payload), 0, time.time() - elapsed
+            )
+        self.assertTrue(ok)
+
+        speeds = [c.args[2] for c in callbacks.on_download_progress.call_args_list if c.args[2] > 0]
+        self.assertTrue(speeds)
+        for speed in speeds:
+            self.assertLessEqual(speed * elapsed * 1024 * 1024, len(self.payload) - partial + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import pathlib
+import tempfile
+import threading
+import time
+import unittest
+
+from orcalab.sampling_profiler import SamplingProfiler, get_sampling_profiler
+
+
+def _busy_worker(stop_event: threading.Event):
+    while not stop_event.is_set():
+        sum(i * i for i in range(1000))
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def test_singleton_returns_same_instance(self):
+        self.assertIs(get_sampling_profiler(), get_sampling_profiler())
+
+    def test_stop_without_start_returns_none(self):
+        profiler = SamplingProfiler()
+        self.assertFalse(profiler.is_running)
+        self.assertIsNone(profiler.stop(write=False))
+
+    def test_start_twice_returns_false(self):
+        profiler = SamplingProfiler()
+        self.assertTrue(profiler.start(200))
+        try:
+            self.assertFalse(profiler.start(200))
+            self.assertTrue(profiler.status()["running"])
+        finally:
+            profiler.stop(write=False)
+        self.assertFalse(profiler.is_running)
+
+    def test_samples_other_threads(self):
+        stop_event = threading.Event()
+        worker = threading.Thread(target=_busy_worker, args=(stop_event,), name="busy-worker")
+        worker.start()
+
+        profiler = SamplingProfiler()
+        profiler.start(500)
+        time.sleep(0.2)
+        result = profiler.stop(write=False)
+
+        stop_event.set()
+        worker.join()
+
+        self.assertIsNotNone(result)
+        self.assertGreater(result.sample_count, 0)
+        worker_stacks = [s for s in result.stacks if s.startswith("busy-worker;")]
+        self.assertTrue(worker_stacks)
+        self.assertTrue(any("_busy_worker" in s for s in worker_stacks))
+        self.assertFalse(any(s.startswith("orcalab-sampling-profiler;") for s in result.stacks))
+
+    def test_write_collapsed_output(self):
+        profiler = SamplingProfiler()
+        profiler.start(500)
+        time.sleep(0.05)
+        with tempfile.TemporaryDirectory() as tmp:
+            output = pathlib.Path(tmp) / "profile.folded"
+            result = profiler.stop(output_path=output)
+
+            self.assertEqual(result.output_path, output)
+            lines = output.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(lines), len(result.stacks))
+            for line in lines:
+                stack, count = line.rsplit(" ", 1)
+                self.assertIn(stack, result.stacks)
+                self.assertEqual(int(count), result.stacks[stack])
+
+    def test_top_functions_counts_leaf_frames(self):
+        profiler = SamplingProfiler()
+        profiler.start(100)
+        result = profiler.stop(write=False)
+        result.stacks = {"main;a;b": 3, "main;a;c": 1, "worker;x;b": 2}
+
+        self.assertEqual(result.top_functions(2), [("b", 5), ("c", 1)])
+        self.assertEqual(result.to_dict()["unique_stacks"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
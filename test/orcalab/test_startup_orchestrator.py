@@ -0,0 +1,86 @@
+import threading
+import time
+import unittest
+
+from orcalab.startup_orchestrator import MAIN_THREAD, PhaseRecord, StartupOrchestrator, StartupTimeline
+
+
+class TestStartupOrchestrator(unittest.TestCase):
+    def test_independent_phases_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        orchestrator = StartupOrchestrator(max_workers=2)
+        orchestrator.add("a", lambda: barrier.wait() is not None)
+        orchestrator.add("b", lambda: barrier.wait() is not None)
+
+        results = orchestrator.run()
+
+        self.assertEqual(results, {"a": True, "b": True})
+
+    def test_dependencies_and_main_thread_phases(self):
+        order = []
+        threads = {}
+
+        def phase(name):
+            def run():
+                order.append(name)
+                threads[name] = threading.current_thread()
+                return name.upper()
+            return run
+
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("probe", phase("probe"))
+        orchestrator.add("dialog", phase("dialog"), depends_on=["probe"], main_thread=True)
+        orchestrator.add("scan", phase("scan"), depends_on=["dialog"])
+        orchestrator.add("select", phase("select"), depends_on=["scan"], main_thread=True)
+
+        results = orchestrator.run()
+
+        self.assertEqual(order, ["probe", "dialog", "scan", "select"])
+        self.assertEqual(results["select"], "SELECT")
+        self.assertIs(threads["dialog"], threading.main_thread())
+        self.assertIs(threads["select"], threading.main_thread())
+        self.assertIsNot(threads["probe"], threading.main_thread())
+        self.assertEqual([r.name for r in orchestrator.timeline.critical_path()], ["probe", "dialog", "scan", "select"])
+
+    def test_failure_stops_remaining_phases(self):
+        ran = []
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("broken", lambda: 1 / 0)
+        orchestrator.add("after", lambda: ran.append("after"), depends_on=["broken"], main_thread=True)
+
+        with self.assertRaises(ZeroDivisionError):
+            orchestrator.run()
+
+        self.assertEqual(ran, [])
+        self.assertIn("ZeroDivisionError", orchestrator.timeline.records[0].error)
+
+    def test_add_validates_names_and_dependencies(self):
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("a", lambda: None)
+        with self.assertRaises(ValueError):
+            orchestrator.add("a", lambda: None)
+        with self.assertRaises(ValueError):
+            orchestrator.add("b", lambda: None, depends_on=["missing"])
+
+
+class TestStartupTimeline(unittest.TestCase):
+    def test_critical_path_follows_latest_predecessor(self):
+        timeline = StartupTimeline(clock=time.monotonic)
+        timeline.record(PhaseRecord("gpu_probe", 0.0, 3.0, thread="worker-1"))
+        timeline.record(PhaseRecord("pak_processing", 0.0, 1.0, thread="worker-2"))
+        timeline.record(PhaseRecord("python_project", 0.0, 0.5))
+        timeline.record(PhaseRecord("asset_sync", 3.0, 4.0, ["pak_processing", "gpu_probe"]))
+        timeline.record(PhaseRecord("scene_select", 4.0, 4.5, ["asset_sync"]))
+
+        self.assertEqual([r.name for r in timeline.critical_path()], ["gpu_probe", "asset_sync", "scene_select"])
+        data = timeline.to_dict()
+        self.assertEqual(data["total"], 4.5)
+        self.assertEqual(data["phases"][0]["thread"], "worker-1")
+        report = timeline.format_report()
+        self.assertIn("* gpu_probe", report)
+        self.assertIn("  pak_processing", report)
+        self.assertEqual(timeline.records[2].thread, MAIN_THREAD)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 import asyncio
+import pathlib
+import tempfile
 from unittest.mock import AsyncMock
 
 from orcalab.texture_asset_cache import (
@@ -236,5 +238,90 @@ class TestTextureAssetCache(unittest.TestCase):
         )
 
 
+
+class TestTextureCatalogue(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.catalogue_path = pathlib.Path(self._tmp.name) / "texture_catalogue.json"
+        self.assets = {
+            0: [("{UUID-1}:0", "textures/Rock.jpg.streamingimage"), ("{UUID-2}:0", "textures/wood.png.streamingimage")],
+            1: [("{UUID-3}:0", "materials/rock_moss.png.streamingimage")],
+        }
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _counting_scene(self, assets):
+        scene = _make_mock_remote_scene(assets)
+        inner = scene.get_assets_by_type_page
+        calls = []
+
+        async def get_assets_by_type_page(asset_type_uuid, page_index, page_size):
+            calls.append(page_index)
+            return await inner(asset_type_uuid, page_index, page_size)
+
+        scene.get_assets_by_type_page = get_assets_by_type_page
+        return scene, calls
+
+    def _initialize(self, scene) -> TextureAssetCache:
+        cache = TextureAssetCache(self.catalogue_path)
+
+        async def run():
+            await cache.initialize(scene)
+            await cache.wait_search_index()
+
+        asyncio.run(run())
+        return cache
+
+    def test_unchanged_catalogue_only_fetches_first_page(self):
+        scene, calls = self._counting_scene(self.assets)
+        self._initialize(scene)
+        self.assertEqual(sorted(calls), [0, 1])
+        self.assertTrue(self.catalogue_path.exists())
+
+        scene, calls = self._counting_scene(self.assets)
+        cache = self._initialize(scene)
+        self.assertEqual(calls, [0])
+        self.assertTrue(cache.is_ready)
+        self.assertEqual(cache.count, 3)
+        self.assertEqual(cache.get_uuid("materials/rock_moss.png.streamingimage"), "{UUID-3}:0")
+        self.assertEqual(
+            [p for _, p in cache.search("ROCK")],
+            ["textures/Rock.jpg.streamingimage", "materials/rock_moss.png.streamingimage"],
+        )
+        self.assertIsNotNone(cache._search_index)
+
+    def test_changed_catalogue_is_refreshed(self):
+        scene, _ = self._counting_scene(self.assets)
+        self._initialize(scene)
+
+        self.assets[1].append(("{UUID-4}:0", "textures/metal.png.streamingimage"))
+        scene, calls = self._counting_scene(self.assets)
+        cache = self._initialize(scene)
+        self.assertEqual(sorted(calls), [0, 1])
+        self.assertEqual(cache.get_path("{UUID-4}:0"), "textures/metal.png.streamingimage")
+
+    def test_cached_catalogue_survives_failed_refresh(self):
+        scene, _ = self._counting_scene(self.assets)
+        self._initialize(scene)
+
+        async def always_fail(asset_type_uuid, page_index, page_size):
+            raise RuntimeError("gRPC not ready")
+
+        mock_scene = AsyncMock()
+        mock_scene.get_assets_by_type_page = always_fail
+        config_backup = dict(TEXTURE_ASSET_FETCH_CONFIG)
+        TEXTURE_ASSET_FETCH_CONFIG["max_retries"] = 2
+        TEXTURE_ASSET_FETCH_CONFIG["base_delay_seconds"] = 0.01
+        try:
+            cache = self._initialize(mock_scene)
+        finally:
+            TEXTURE_ASSET_FETCH_CONFIG.clear()
+            TEXTURE_ASSET_FETCH_CONFIG.update(config_backup)
+
+        self.assertTrue(cache.is_ready)
+        self.assertEqual(len(cache.get_all_items()), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
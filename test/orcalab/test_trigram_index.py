@@ -0,0 +1,30 @@
+import random
+import unittest
+
+from orcalab.trigram_index import TrigramIndex
+
+
+class TestTrigramIndex(unittest.TestCase):
+    def test_matches_linear_scan(self):
+        rng = random.Random(3)
+        words = ["Rock", "wood", "metal", "草地", "brick", "ao", "normal"]
+        texts = [
+            f"textures/{rng.choice(words)}_{rng.choice(words)}/{rng.choice(words)}_{i}.png.streamingimage"
+            for i in range(2000)
+        ]
+        index = TrigramIndex(texts)
+        self.assertEqual(len(index), 2000)
+
+        for keyword in ["rock", "ROCK_wood", "草地_", "_12", "a", "ao_", "png.s", "missing", "k_w", "/"]:
+            expected = [i for i, text in enumerate(texts) if keyword.lower() in text.lower()]
+            self.assertEqual(index.search(keyword), expected, keyword)
+
+    def test_empty_and_short_texts(self):
+        self.assertEqual(TrigramIndex([]).search("rock"), [])
+        index = TrigramIndex(["a", "", "ab", "abc"])
+        self.assertEqual(index.search("abc"), [3])
+        self.assertEqual(index.search("b"), [2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
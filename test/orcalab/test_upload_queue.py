@@ -0,0 +1,179 @@
+import asyncio
+import pathlib
+import tempfile
+import unittest
+
+from orcalab.http_service.upload_queue import STATE_EXHAUSTED, STATE_REJECTED, UploadError, UploadQueue
+
+
+class FakeUploader:
+    """按资产预设的结果依次返回；记录调用顺序与最大并发数"""
+
+    def __init__(self, results=None, delay: float = 0.0):
+        self.results = results or {}
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, asset_id, files):
+        self.calls.append(asset_id)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            outcomes = self.results.get(asset_id)
+            outcome = outcomes.pop(0) if outcomes else None
+            if outcome is not None:
+                raise outcome
+        finally:
+            self.active -= 1
+
+
+class TestUploadQueue(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self._tmp.name) / "uploads.sqlite3"
+        self.file = pathlib.Path(self._tmp.name) / "a.apng"
+        self.file.write_bytes(b"x" * 100)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _queue(self, uploader, **kwargs) -> UploadQueue:
+        kwargs.setdefault("initial_delay", 0.01)
+        return UploadQueue(self.path, uploader, **kwargs)
+
+    def test_bounded_concurrency_in_order(self):
+        uploader = FakeUploader(delay=0.01)
+
+        async def run():
+            queue = self._queue(uploader, max_concurrency=3)
+            for i in range(10):
+                queue.enqueue(f"a{i}", [str(self.file)])
+            progress = await queue.join()
+            await queue.close()
+            return progress
+
+        progress = asyncio.run(run())
+        self.assertEqual(uploader.calls, [f"a{i}" for i in range(10)])
+        self.assertEqual(uploader.max_active, 3)
+        self.assertEqual((progress.uploaded, progress.failed, progress.pending, progress.bytes_sent), (10, 0, 0, 1000))
+
+    def test_retry_with_backoff_and_final_failures(self):
+        uploader = FakeUploader({
+            "flaky": [ConnectionError("reset"), UploadError("503")],
+            "down": [UploadError("503")] * 5,
+            "gone": [UploadError("404", retryable=False)],
+        })
+        seen = []
+
+        async def run():
+            queue = self._queue(uploader, max_attempts=3)
+            for asset_id in ("flaky", "down", "gone", "ok"):
+                queue.enqueue(asset_id, [str(self.file)])
+            progress = await queue.join(seen.append)
+            failed = queue.failed_jobs()
+            await queue.close()
+            return progress, failed
+
+        progress, failed = asyncio.run(run())
+        self.assertEqual(uploader.calls.count("flaky"), 3)
+        self.assertEqual(uploader.calls.count("down"), 3)
+        self.assertEqual(uploader.calls.count("gone"), 1)
+        self.assertEqual((progress.uploaded, progress.failed, progress.retries), (2, 2, 4))
+        self.assertEqual([(a, s) for a, s, _ in failed], [("down", STATE_EXHAUSTED), ("gone", STATE_REJECTED)])
+        self.assertEqual(seen[-1].total, 4)
+
+    def test_pending_jobs_resume_after_restart(self):
+        async def interrupted():
+            queue = self._queue(FakeUploader(delay=10), max_concurrency=1)
+            queue.enqueue("a", [str(self.file)])
+            queue.enqueue("b", [str(self.file)])
+            await asyncio.sleep(0.05)
+            await queue.close()
+
+        asyncio.run(interrupted())
+
+        uploader = FakeUploader()
+
+        async def restarted():
+            queue = self._queue(uploader)
+            resumed = queue.resume()
+            await queue.join()
+            await queue.close()
+            return resumed
+
+        self.assertEqual(asyncio.run(restarted()), 2)
+        self.assertEqual(uploader.calls, ["a", "b"])
+
+    def test_exhausted_jobs_requeue_on_resume_rejected_do_not(self):
+        async def first():
+            failing = FakeUploader({"a": [UploadError("503")], "b": [UploadError("400", retryable=False)]})
+            queue = self._queue(failing, max_attempts=1)
+            queue.enqueue("a", [str(self.file)])
+            queue.enqueue("b", [str(self.file)])
+            await queue.join()
+            await queue.close()
+
+        asyncio.run(first())
+        uploader = FakeUploader()
+
+        async def second():
+            queue = self._queue(uploader)
+            queue.resume()
+            await queue.join()
+            retried = queue.retry_failed()
+            await queue.join()
+            await queue.close()
+            return retried
+
+        self.assertEqual(asyncio.run(second()), 1)
+        self.assertEqual(uploader.calls, ["a", "b"])
+
+    def test_spooled_files_outlive_source_until_uploaded(self):
+        contents = []
+
+        async def read_files(asset_id, files):
+            contents.append([pathlib.Path(f).read_bytes() for f in files])
+
+        async def first():
+            queue = self._queue(FakeUploader({"a": [UploadError("503")]}), max_attempts=1)
+            queue.enqueue("a", [str(self.file)])
+            await queue.join()
+            await queue.close()
+            return queue.spool_dir
+
+        spool_dir = asyncio.run(first())
+        # 调用方上传结束后会删除临时目录
+        self.file.unlink()
+
+        async def second():
+            queue = self._queue(read_files)
+            self.assertEqual(queue.resume(), 1)
+            await queue.join()
+            await queue.close()
+
+        asyncio.run(second())
+        self.assertEqual(contents, [[b"x" * 100]])
+        self.assertEqual(list(spool_dir.iterdir()), [])
+
+    def test_reenqueue_during_upload_keeps_new_job(self):
+        uploader = FakeUploader(delay=0.05)
+
+        async def run():
+            queue = self._queue(uploader)
+            queue.enqueue("a", [str(self.file)])
+            await asyncio.sleep(0.01)
+            queue.enqueue("a", [str(self.file)])
+            await queue.join()
+            await queue.close()
+            return queue.spool_dir
+
+        spool_dir = asyncio.run(run())
+        self.assertEqual(uploader.calls, ["a", "a"])
+        self.assertEqual(list(spool_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
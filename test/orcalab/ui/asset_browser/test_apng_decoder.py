@@ -0,0 +1,69 @@
+import asyncio
+import os
+import pathlib
+import sys
+import tempfile
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PIL import Image
+from PySide6.QtWidgets import QApplication
+
+from orcalab.ui.asset_browser.apng_decoder import ThumbnailDecodePool, decode_apng
+from orcalab.ui.asset_browser.apng_player import ApngPlayer
+
+
+@pytest.fixture
+def q_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+@pytest.fixture
+def apng_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "chair_panorama.apng"
+        frames = [Image.new("RGBA", (400, 200), (i * 40, 0, 0, 255)) for i in range(5)]
+        frames[0].save(path, save_all=True, append_images=frames[1:], duration=80, loop=0, format="PNG")
+        yield str(path)
+
+
+def test_decode_scales_to_target_size(q_app, apng_path):
+    first = decode_apng(apng_path, 96, first_frame_only=True)
+    assert (len(first.frames), first.frame_count, first.complete) == (1, 5, False)
+    assert (first.frames[0].width(), first.frames[0].height()) == (96, 48)
+
+    full = decode_apng(apng_path, 96)
+    assert full.complete
+    assert full.delays == [80] * 5
+    assert full.frames[3].pixelColor(10, 10).red() == 120
+
+
+def test_player_requests_remaining_frames_when_started(q_app, apng_path):
+    async def run():
+        pool = ThumbnailDecodePool(max_workers=2)
+        first, again = await asyncio.gather(
+            pool.decode(apng_path, 96, first_frame_only=True),
+            pool.decode(apng_path, 96, first_frame_only=True),
+        )
+        assert first is again
+
+        player = ApngPlayer.from_decoded(apng_path, first)
+        requested = []
+        player.frames_requested.connect(lambda: requested.append(True))
+        player.start()
+        assert requested == [True]
+        assert player.is_playing and not player.is_complete
+
+        player.set_frames(await pool.decode(apng_path, 96))
+        assert player.is_complete and player.frame_count() == 5
+        player.stop()
+
+        assert await pool.decode(apng_path + ".missing", 96) is None
+        pool.shutdown()
+
+    asyncio.run(run())
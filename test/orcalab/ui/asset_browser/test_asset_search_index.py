@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from orcalab.ui.asset_browser.asset_info import AssetInfo
+from orcalab.ui.asset_browser.asset_model import AssetModel
+from orcalab.ui.asset_browser.asset_search_index import AssetSearchIndex
+
+WORDS = ["chair", "table", "Chart", "lamp", "cabinet", "char"]
+CATEGORIES = ["/furniture/chair", "/furniture/table", "/furnace", "/lighting", "/other/misc"]
+
+
+def _make_assets(count: int):
+    rng = random.Random(7)
+    assets = []
+    for i in range(count):
+        info = AssetInfo()
+        info.name = f"{rng.choice(WORDS)}_{i}"
+        info.path = f"prefabs/{info.name}"
+        if i % 5 != 0:
+            info.metadata = {
+                "englishName": f"{rng.choice(WORDS).upper()} {i}",
+                "name": rng.choice(["椅子", "桌子", "灯", "Chair"]),
+                "categoryPath": rng.choice(CATEGORIES),
+            }
+        assets.append(info)
+    return assets
+
+
+def _matches(asset: AssetInfo, keyword: str) -> bool:
+    if keyword in asset.name.lower():
+        return True
+    if asset.metadata is None:
+        return False
+    return keyword in asset.metadata["englishName"].lower() or keyword in asset.metadata["name"]
+
+
+def _reference(assets, category: str, include: str, exclude: str):
+    result = []
+    for asset in assets:
+        if category:
+            if asset.metadata is None:
+                if category != "/other":
+                    continue
+            elif not asset.metadata["categoryPath"].startswith(category):
+                continue
+        if include and not _matches(asset, include.lower()):
+            continue
+        if exclude and _matches(asset, exclude.lower()):
+            continue
+        result.append(asset)
+    return result
+
+
+@pytest.fixture
+def assets():
+    return _make_assets(500)
+
+
+def test_category_prefix_buckets(assets):
+    index = AssetSearchIndex(assets)
+    furniture = index.category("/furn")
+    assert furniture == sorted(furniture)
+    categories = {assets[i].metadata["categoryPath"] for i in furniture}
+    assert categories == {"/furniture/chair", "/furniture/table", "/furnace"}
+    other = index.category("/other")
+    assert sum(1 for i in other if assets[i].metadata is None) == 100
+    assert index.category("/zzz") == []
+
+
+def test_incremental_filtering_matches_full_scan(assets):
+    model = AssetModel()
+    model.set_assets(assets)
+
+    steps = [
+        ("", "c", ""), ("", "ch", ""), ("", "cha", ""), ("", "chai", ""), ("", "cha", ""),
+        ("", "cha", "t"), ("", "cha", "ta"), ("", "cha", "tab"), ("", "cha", "ta"),
+        ("/furniture", "cha", "ta"), ("/furniture", "char", ""), ("/other", "c", ""),
+        ("/other", "椅", ""), ("", "CHA", "LAMP"), ("", "", ""),
+    ]
+    for category, include, exclude in steps:
+        model.category_filter, model.include_filter, model.exclude_filter = category, include, exclude
+        model.apply_filters()
+        expected = _reference(assets, category, include, exclude)
+        assert [model.info_at(i) for i in range(model.size())] == expected, (category, include, exclude)
+
+    model.set_assets(assets[:50])
+    model.include_filter = "chair"
+    model.apply_filters()
+    assert model.size() == len(_reference(assets[:50], "", "chair", ""))
@@ -0,0 +1,111 @@
+import pytest
+
+from orcalab.ui.asset_browser.thumbnail_cache import ThumbnailFrameCache, Visibility
+
+FRAME = 100
+
+
+class FakePlayer:
+    def __init__(self, frames: int, is_playing: bool = False):
+        self.frames = frames
+        self.is_playing = is_playing
+
+    def frame_bytes(self) -> int:
+        return self.frames * FRAME
+
+    def release_animation_frames(self) -> bool:
+        if self.is_playing or self.frames <= 1:
+            return False
+        self.frames = 1
+        return True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def evicted():
+    return []
+
+
+def _add(cache, evicted, key, frames, **kwargs):
+    player = FakePlayer(frames, **kwargs)
+    cache.add(key, player, lambda: evicted.append(key))
+    return player
+
+
+def test_trims_animation_frames_before_evicting(clock, evicted):
+    cache = ThumbnailFrameCache(budget_bytes=10 * FRAME, recent_seconds=30, clock=clock)
+    a = _add(cache, evicted, "a", 5)
+    b = _add(cache, evicted, "b", 5)
+    clock.now += 60
+    _add(cache, evicted, "c", 3)
+
+    assert evicted == []
+    assert (a.frames, b.frames) == (1, 5)
+    assert cache.resident_bytes == 9 * FRAME
+    assert cache.stats().trims == 1
+
+
+def test_visible_entries_are_never_evicted(clock, evicted):
+    cache = ThumbnailFrameCache(budget_bytes=2 * FRAME, recent_seconds=30, clock=clock)
+    _add(cache, evicted, "a", 1)
+    cache.set_visible("a", True)
+    _add(cache, evicted, "b", 1)
+    clock.now += 60
+    _add(cache, evicted, "c", 1)
+
+    assert evicted == ["b"]
+    assert "a" in cache and "c" in cache
+    assert cache.visibility("a") == Visibility.VISIBLE
+
+
+def test_offscreen_entries_go_before_recently_visible(clock, evicted):
+    cache = ThumbnailFrameCache(budget_bytes=3 * FRAME, recent_seconds=30, clock=clock)
+    for key in ("a", "b", "c"):
+        _add(cache, evicted, key, 1)
+        cache.set_visible(key, True)
+    cache.set_visible("b", False)
+    clock.now += 60
+    cache.set_visible("a", False)
+    cache.set_visible("c", False)
+
+    assert cache.visibility("a") == Visibility.RECENT
+    assert cache.visibility("b") == Visibility.OFFSCREEN
+    _add(cache, evicted, "d", 1)
+    assert evicted == ["b"]
+
+    cache.record_hit("a")
+    _add(cache, evicted, "e", 1)
+    assert evicted == ["b", "c"]
+
+
+def test_update_stats_and_clear(clock, evicted):
+    cache = ThumbnailFrameCache(budget_bytes=100 * FRAME, clock=clock)
+    cache.record_miss()
+    player = _add(cache, evicted, "a", 1)
+    player.frames = 8
+    cache.update("a")
+    cache.record_hit("a")
+    cache.record_hit("a")
+    cache.record_hit("a")
+
+    stats = cache.stats()
+    assert (stats.entries, stats.resident_bytes, stats.hits, stats.misses) == (1, 8 * FRAME, 3, 1)
+    assert stats.hit_rate == pytest.approx(0.75)
+
+    cache.remove("a")
+    _add(cache, evicted, "b", 1)
+    cache.clear()
+    assert evicted == ["b"]
+    assert len(cache) == 0 and cache.resident_bytes == 0
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import pathlib
+import tempfile
+
+import pytest
+from PIL import Image
+
+from orcalab.actor import AssetActor
+from orcalab.application_bus import ApplicationRequest, ApplicationRequestBus
+from orcalab.http_service.http_bus import HttpServiceRequest, HttpServiceRequestBus
+from orcalab.metadata_service_bus import MetadataServiceRequest, MetadataServiceRequestBus
+from orcalab.scene_edit_bus import (
+    SceneEditNotification,
+    SceneEditNotificationBus,
+    SceneEditRequest,
+    SceneEditRequestBus,
+)
+from orcalab.ui.asset_browser import thumbnail_render_service
+from orcalab.ui.asset_browser.thumbnail_render_bus import ThumbnailRenderRequestBus
+from orcalab.ui.asset_browser.thumbnail_render_service import ThumbnailRenderService
+from orcalab.ui.image_process_pool import ImageProcessPool
+
+
+class FakeScene(
+    ApplicationRequest, SceneEditRequest, SceneEditNotification, MetadataServiceRequest, HttpServiceRequest
+):
+    """同时充当几条总线的处理者：记录场景中的资产、相机拍摄和上传"""
+
+    def __init__(self, never_ready=(), failing=()):
+        self.actors = {}
+        self.max_staged = 0
+        self.aabb_queries = 0
+        self.uploads = []
+        self.captures = 0
+        self._never_ready = set(never_ready)
+        self._failing = set(failing)
+        self._ready_after = {}
+
+    async def add_item_to_scene_with_transform(
+        self, item_name, item_asset_path, parent_path=None, transform=None, output=None
+    ):
+        if f"add:{item_asset_path}" in self._failing:
+            raise RuntimeError("add failed")
+        name = item_name.replace("/", "_")
+        actor = AssetActor(name=name, asset_path=item_asset_path)
+        self.actors[name] = actor
+        self._ready_after[name] = 2
+        staged = sum(1 for n in self.actors if not n.startswith("mujococamera"))
+        self.max_staged = max(self.max_staged, staged)
+        output.append(actor)
+
+    async def delete_actor(self, actor, undo=True, source=""):
+        self.actors.pop(actor.name, None)
+
+    async def set_transform(self, actor, transform, local, undo=True, source=""):
+        if f"transform:{getattr(actor, 'asset_path', None)}" in self._failing:
+            raise RuntimeError("set_transform failed")
+
+    async def get_actor_asset_aabb(self, actor_path, output):
+        self.aabb_queries += 1
+        name = actor_path.string()[1:]
+        if self.actors[name].asset_path in self._never_ready:
+            raise RuntimeError("bounds not ready")
+        self._ready_after[name] -= 1
+        if self._ready_after[name] <= 0:
+            output.extend([-0.5, -0.5, 0.0, 0.5, 0.5, 2.0])
+
+    async def get_camera_png(self, camera_name, png_path, png_name):
+        os.makedirs(png_path, exist_ok=True)
+        # 每次拍摄颜色不同，避免 APNG 合并相同的相邻帧
+        self.captures += 1
+        size = {"mujococamera1080": 64, "mujococamera512": 48}.get(camera_name, 32)
+        Image.new("RGB", (size, size), (self.captures % 256, 0, 0)).save(os.path.join(png_path, png_name))
+
+    def get_asset_info(self, asset_path, output):
+        output.append({"id": asset_path} if asset_path != "prefabs/no_meta" else None)
+
+    async def post_asset_thumbnail(self, asset_id, files):
+        if f"upload:{asset_id}" in self._failing:
+            raise RuntimeError("upload failed")
+        self.uploads.append((asset_id, files))
+
+
+@pytest.fixture
+def home(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        monkeypatch.setenv("HOME", tmp)
+        monkeypatch.setattr(thumbnail_render_service, "AABB_POLL_TIMEOUT", 0.1)
+        monkeypatch.setattr(thumbnail_render_service, "PNG_WAIT_TIMEOUT", 0.5)
+        yield pathlib.Path(tmp)
+
+
+BUSES = [
+    ApplicationRequestBus,
+    SceneEditRequestBus,
+    SceneEditNotificationBus,
+    MetadataServiceRequestBus,
+    HttpServiceRequestBus,
+]
+
+
+@pytest.fixture
+def scene():
+    scene = FakeScene(
+        never_ready={"prefabs/broken"},
+        failing={"add:prefabs/bad_add", "transform:prefabs/bad_transform", "upload:prefabs/bad_upload"},
+    )
+    for bus in BUSES:
+        bus.connect(scene)
+    yield scene
+    for bus in BUSES:
+        bus.disconnect(scene)
+
+
+@pytest.fixture
+def service():
+    pool = ImageProcessPool(max_workers=2)
+    service = ThumbnailRenderService(bays=2, image_pool=pool)
+    yield service
+    ThumbnailRenderRequestBus.disconnect(service)
+    pool.shutdown(wait=True)
+
+
+def test_batch_is_pipelined_across_bays(home, scene, service):
+    assets = ["prefabs/chair", "prefabs/broken", "prefabs/table", "prefabs/no_meta", "prefabs/lamp"]
+
+    asyncio.run(service.render_thumbnail(assets))
+
+    stats = service.last_stats
+    assert (stats.requested, stats.rendered, stats.failed) == (5, 4, 1)
+    assert stats.assets_per_minute > 0
+    assert scene.actors == {}
+    assert scene.max_staged == 2
+    assert scene.aabb_queries > len(assets)
+
+    for name in ("chair", "table", "no_meta", "lamp"):
+        apng = home / ".orcalab" / "tmp" / "prefabs" / f"{name}_panorama.apng"
+        with Image.open(apng) as img:
+            assert img.n_frames == 15
+        assert not list(apng.parent.glob(f"{name}_256_*.png"))
+    assert sorted(asset_id for asset_id, _ in scene.uploads) == ["prefabs/chair", "prefabs/lamp", "prefabs/table"]
+    assert all(len(files) == 7 for _, files in scene.uploads)
+
+
+def test_failures_are_counted_per_asset(home, scene, service):
+    assets = ["prefabs/chair", "prefabs/bad_add", "prefabs/bad_transform", "prefabs/bad_upload", "prefabs/lamp"]
+
+    asyncio.run(service.render_thumbnail(assets))
+
+    stats = service.last_stats
+    assert (stats.requested, stats.rendered, stats.failed) == (5, 2, 3)
+    assert scene.actors == {}
+    assert sorted(asset_id for asset_id, _ in scene.uploads) == ["prefabs/chair", "prefabs/lamp"]
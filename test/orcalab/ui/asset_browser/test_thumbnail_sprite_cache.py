@@ -0,0 +1,125 @@
+import asyncio
+import mmap
+import os
+import pathlib
+import sys
+import tempfile
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PIL import Image
+from PySide6.QtWidgets import QApplication
+
+from orcalab.ui.asset_browser.apng_decoder import ThumbnailDecodePool, decode_apng
+from orcalab.ui.asset_browser.thumbnail_sprite_cache import ThumbnailSpriteCache
+
+
+@pytest.fixture
+def q_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+@pytest.fixture
+def folder():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield pathlib.Path(tmp)
+
+
+def _write_apng(path: pathlib.Path, red: int):
+    frames = [Image.new("RGBA", (400, 200), (red, i * 40, 0, 255)) for i in range(4)]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=60, loop=0, format="PNG")
+
+
+def test_sprite_round_trip(q_app, folder):
+    source = folder / "chair_panorama.apng"
+    _write_apng(source, 200)
+    cache = ThumbnailSpriteCache(folder / "sprites")
+
+    assert cache.load(str(source), 96) is None
+    assert cache.store(str(source), 96, decode_apng(str(source), 96, first_frame_only=True))
+
+    first = cache.load(str(source), 96, first_frame_only=True)
+    assert (len(first.frames), first.frame_count) == (1, 4)
+    assert (first.frames[0].width(), first.frames[0].height()) == (96, 48)
+    assert first.frames[0].pixelColor(5, 5).red() == 200
+    # 只缓存了第一帧时，完整请求仍需解码
+    assert cache.load(str(source), 96) is None
+
+    cache.store(str(source), 96, decode_apng(str(source), 96))
+    full = cache.load(str(source), 96)
+    assert full.complete and full.delays == [60] * 4
+    assert full.frames[2].pixelColor(5, 5).green() == 80
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_sprite_is_invalidated_when_source_changes(q_app, folder):
+    source = folder / "chair_panorama.apng"
+    _write_apng(source, 200)
+    cache = ThumbnailSpriteCache(folder / "sprites")
+    cache.store(str(source), 96, decode_apng(str(source), 96))
+
+    _write_apng(source, 100)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.load(str(source), 96) is None
+    assert cache.load(str(source), 64) is None
+
+
+def test_rejected_sprites_close_their_mapping(q_app, folder, monkeypatch):
+    source = folder / "chair_panorama.apng"
+    _write_apng(source, 200)
+    cache = ThumbnailSpriteCache(folder / "sprites")
+    cache.store(str(source), 96, decode_apng(str(source), 96, first_frame_only=True))
+
+    mappings = []
+    real_mmap = mmap.mmap
+
+    def recording_mmap(*args, **kwargs):
+        mapped = real_mmap(*args, **kwargs)
+        mappings.append(mapped)
+        return mapped
+
+    monkeypatch.setattr(mmap, "mmap", recording_mmap)
+
+    # 缺少动画帧
+    assert cache.load(str(source), 96) is None
+    # 文件被截断
+    sprite = cache.sprite_path(str(source), 96)
+    sprite.write_bytes(sprite.read_bytes()[:-10])
+    assert cache.load(str(source), 96, first_frame_only=True) is None
+    assert len(mappings) == 2 and all(m.closed for m in mappings)
+
+    cache.store(str(source), 96, decode_apng(str(source), 96))
+    full = cache.load(str(source), 96)
+    assert full.complete and not mappings[-1].closed
+
+    # 源文件变化
+    _write_apng(source, 100)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.load(str(source), 96) is None
+    assert mappings[-1].closed
+
+
+def test_pool_fills_and_reuses_sprite_cache(q_app, folder):
+    source = folder / "chair_panorama.apng"
+    _write_apng(source, 150)
+    cache = ThumbnailSpriteCache(folder / "sprites")
+
+    async def run():
+        pool = ThumbnailDecodePool(max_workers=1, sprite_cache=cache)
+        decoded = await pool.decode(str(source), 96, first_frame_only=True)
+        pool.shutdown()
+        return decoded
+
+    asyncio.run(run())
+    assert cache.sprite_path(str(source), 96).exists()
+
+    again = asyncio.run(run())
+    assert again.frames[0].pixelColor(5, 5).red() == 150
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QFile
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from orcalab.ui import icon_util
+from orcalab.ui.qt_resources import register_resources
+
+
+@pytest.fixture
+def q_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    icon_util.clear_icon_cache()
+    yield
+    icon_util.clear_icon_cache()
+
+
+def test_resources_are_registered_on_demand(q_app):
+    assert register_resources()
+    assert QFile.exists(":/icons/orcalab_logo.png")
+    assert QFile.exists(":/icons/eye-open.svg")
+    assert not icon_util.app_window_icon().isNull()
+
+
+def test_icons_are_cached_by_name_color_and_size(q_app):
+    red = QColor("red")
+
+    first = icon_util.make_icon(":/icons/eye-open.svg", red)
+    cached = icon_util.icon_cache_size()
+    second = icon_util.make_icon(":/icons/eye-open.svg", QColor("red"))
+
+    assert icon_util.icon_cache_size() == cached
+    assert first.cacheKey() == second.cacheKey()
+    assert not first.isNull()
+
+    icon_util.make_icon(":/icons/eye-open.svg", QColor("blue"))
+    icon_util.make_icon(":/icons/eye-open.svg", red, size=32)
+    assert icon_util.icon_cache_size() == cached + 4
+
+    pixmap = icon_util.make_color_svg(":/icons/checkbox_checked.svg", red, size=20)
+    assert (pixmap.width(), pixmap.height()) == (20, 20)
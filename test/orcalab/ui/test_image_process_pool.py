@@ -0,0 +1,67 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from PIL import Image
+
+from orcalab.ui.image_process_pool import ImageProcessPool
+
+
+class TestImageProcessPool(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pool = ImageProcessPool(max_workers=2, max_pending=2)
+
+    def tearDown(self):
+        self.pool.shutdown(wait=True)
+        self.tmp.cleanup()
+
+    def _write_frames(self, prefix: str, count: int, size: int = 32):
+        paths = []
+        for i in range(count):
+            path = os.path.join(self.tmp.name, f"{prefix}_{i}.png")
+            Image.new("RGB", (size, size), (i * 20, 0, 0)).save(path)
+            paths.append(path)
+        return paths
+
+    def test_builds_apngs_and_annotations_concurrently(self):
+        async def run():
+            jobs = []
+            for n in range(3):
+                frames = self._write_frames(f"a{n}", 5)
+                jobs.append(self.pool.create_apng_panorama(
+                    frames, os.path.join(self.tmp.name, f"a{n}.apng"), duration=100, remove_sources=True))
+            annotated = os.path.join(self.tmp.name, "b.png")
+            Image.new("RGB", (64, 64), (255, 255, 255)).save(annotated)
+            jobs.append(self.pool.add_text_to_image(annotated, "AABB", font_size=10))
+            return await asyncio.gather(*jobs), annotated
+
+        results, annotated = asyncio.run(run())
+
+        self.assertEqual(results, [True, True, True, True])
+        for n in range(3):
+            with Image.open(os.path.join(self.tmp.name, f"a{n}.apng")) as img:
+                self.assertEqual((img.n_frames, img.info["duration"]), (5, 100))
+        self.assertEqual(sorted(f for f in os.listdir(self.tmp.name) if f.startswith("a")),
+                         ["a0.apng", "a1.apng", "a2.apng"])
+        with Image.open(annotated) as img:
+            self.assertNotEqual(img.getpixel((55, 55)), (255, 255, 255))
+            self.assertEqual(img.getpixel((0, 0)), (255, 255, 255))
+
+    def test_missing_frames_are_skipped_after_timeout(self):
+        frames = self._write_frames("c", 2)
+        missing = os.path.join(self.tmp.name, "missing.png")
+        apng = os.path.join(self.tmp.name, "c.apng")
+
+        ok = asyncio.run(self.pool.create_apng_panorama([frames[0], missing, frames[1]], apng, wait_timeout=0.05))
+        failed = asyncio.run(self.pool.add_text_to_image(missing, "AABB", wait_timeout=0.05))
+
+        self.assertTrue(ok)
+        self.assertFalse(failed)
+        with Image.open(apng) as img:
+            self.assertEqual(img.n_frames, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import sys
+import threading
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from orcalab.ui.terminal_buffer import TerminalOutputBuffer
+from orcalab.ui.terminal_widget import TerminalWidget
+
+RED = "\x1b[31m"
+RESET = "\x1b[0m"
+
+
+@pytest.fixture
+def q_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _color_at_end(widget: TerminalWidget) -> QColor:
+    block = widget.output_text.document().lastBlock().previous()
+    it = block.begin()
+    fragment = None
+    while not it.atEnd():
+        fragment = it.fragment()
+        it += 1
+    return fragment.charFormat().foreground().color()
+
+
+def test_buffer_keeps_last_lines_and_dropped_colors():
+    buffer = TerminalOutputBuffer(max_lines=3)
+    assert buffer.append(f"{RED}a\nb\n") is True
+    assert buffer.append(f"c\n{RESET}d\n") is False
+    buffer.append("e\nf")
+
+    # 保留最后 3 个完整行和未结束的一行
+    codes, text = buffer.take()
+    assert text == f"c\n{RESET}d\ne\nf"
+    assert codes == ["31"]
+    assert buffer.dropped_lines == 2
+    assert buffer.take() == ([], "")
+    assert buffer.append("g") is True
+
+
+def test_appends_from_threads_are_coalesced_into_one_flush(q_app):
+    widget = TerminalWidget(max_lines=100)
+    flushes = []
+    widget.output_text.append_ansi_text = lambda text, original=widget.output_text.append_ansi_text: (
+        flushes.append(text), original(text))
+
+    threads = [threading.Thread(target=lambda n=n: [widget.append_output(f"t{n} line {i}\n") for i in range(50)])
+               for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    q_app.processEvents()
+    assert widget.has_pending_output()
+    widget.flush_pending()
+    assert not widget.has_pending_output()
+
+    assert len([f for f in flushes if f]) == 1
+    text = widget.output_text.toPlainText()
+    assert len(text.splitlines()) == 100
+    assert text.endswith(" line 49\n")
+
+
+def test_document_is_capped_and_colors_survive_dropped_output(q_app):
+    widget = TerminalWidget(max_lines=50)
+    widget.append_output(f"{RED}start\n")
+    widget.append_output("".join(f"noise {i}\n" for i in range(500)))
+    widget.flush_pending()
+    # 最后 50 个完整行加上末尾正在输出的空行
+    assert widget.output_text.document().blockCount() == 51
+    assert _color_at_end(widget) == QColor("#cd3131")
+
+    for i in range(200):
+        widget.append_output(f"more {i}\n")
+        widget.flush_pending()
+    assert widget.output_text.document().blockCount() == 51
+    assert widget.output_text.toPlainText().splitlines()[-1] == "more 199"
+
+
+def test_escape_split_across_chunks(q_app):
+    widget = TerminalWidget(max_lines=50)
+    widget.output_text.append_ansi_text("plain \x1b[3")
+    widget.output_text.append_ansi_text("1mred\n")
+    assert widget.output_text.toPlainText() == "plain red\n"
+    assert _color_at_end(widget) == QColor("#cd3131")